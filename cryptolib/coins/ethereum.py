@@ -15,23 +15,90 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
 
-def rlp_encode(input_data):
+RLP_BYTES_TYPES = (bytearray, bytes, memoryview)
+# Marks the end of the items of a list in rlp_plan
+RLP_LIST_END = object()
+
+
+def rlp_leaf(input_data):
+    """Encoded data of an int or bytes item, without its header."""
     if isinstance(input_data, int):
         if input_data < 0:
             raise ValueError("RLP encoding error : integer must be positive or null")
-        return rlp_encode(to_binary(input_data))
-    if isinstance(input_data, bytearray):
-        if len(input_data) == 1 and input_data[0] == 0:
-            return bytearray(b"\x80")
-        if len(input_data) == 1 and input_data[0] < 0x80:
-            return input_data
-        return encode_length(len(input_data), 0x80) + input_data
-    if isinstance(input_data, list):
-        output = bytearray([])
-        for item in input_data:
-            output += rlp_encode(item)
-        return encode_length(len(output), 0xC0) + output
-    raise ValueError("Bad input_data type : int, list or bytearray required")
+        return to_binary(input_data)
+    if isinstance(input_data, bytearray) and len(input_data) == 1 and input_data[0] == 0:
+        # bytearray from int2bytearray : single null byte is the integer 0
+        return b""
+    return input_data
+
+
+def rlp_plan(input_data):
+    """Flatten the items to encode in depth-first order, with the encoded size.
+    Lists are given by their payload size (int), and strings by their data.
+    No recursion, so any nesting depth is fine.
+    """
+    plan = []
+    # Frames : [items iterator, index of the list in plan, payload size]
+    stack = []
+    item = input_data
+    while True:
+        if item is RLP_LIST_END:
+            _, plan_idx, payload_size = stack.pop()
+            plan[plan_idx] = payload_size
+            size = header_size(payload_size) + payload_size
+        elif isinstance(item, list):
+            plan.append(0)
+            stack.append([iter(item), len(plan) - 1, 0])
+            item = next(stack[-1][0], RLP_LIST_END)
+            continue
+        elif isinstance(item, (int, *RLP_BYTES_TYPES)):
+            data = rlp_leaf(item)
+            plan.append(data)
+            if len(data) == 1 and data[0] < 0x80:
+                size = 1
+            else:
+                size = header_size(len(data)) + len(data)
+        else:
+            raise ValueError("Bad input_data type : int, list or bytearray required")
+        if not stack:
+            return plan, size
+        stack[-1][2] += size
+        item = next(stack[-1][0], RLP_LIST_END)
+
+
+def header_size(length):
+    if length < 56:
+        return 1
+    return 1 + (length.bit_length() + 7) // 8
+
+
+def rlp_encode(input_data):
+    """RLP encoding of an int, a bytes like or a list of them (nested).
+    Written in one preallocated buffer : the lists sizes are known before
+    writing, so each header is written directly at its final place.
+    A bytearray of a single null byte is encoded as 0x80, the integer 0, as the
+    int2bytearray(0) output. A bytes of a single null byte is encoded as 0x00,
+    the RLP of this byte string.
+    """
+    plan, total = rlp_plan(input_data)
+    output = bytearray(total)
+    pos = 0
+    for step in plan:
+        if isinstance(step, int):
+            # List header
+            header = encode_length(step, 0xC0)
+        elif len(step) == 1 and step[0] < 0x80:
+            output[pos] = step[0]
+            pos += 1
+            continue
+        else:
+            header = encode_length(len(step), 0x80)
+        output[pos : pos + len(header)] = header
+        pos += len(header)
+        if not isinstance(step, int):
+            output[pos : pos + len(step)] = step
+            pos += len(step)
+    return output
 
 
 def encode_length(Lon, offset):
@@ -42,9 +109,90 @@ def encode_length(Lon, offset):
 
 
 def to_binary(x):
-    if x == 0:
-        return bytearray([])
-    return to_binary(int(x // 256)) + bytearray([x % 256])
+    return bytearray(x.to_bytes((x.bit_length() + 7) // 8, "big"))
+
+
+def rlp_read_length(view, pos, len_size):
+    """Read a long form length, must be canonical."""
+    if pos + len_size > len(view):
+        raise ValueError("RLP data truncated")
+    if view[pos] == 0:
+        raise ValueError("RLP length with leading zero")
+    length = int.from_bytes(view[pos : pos + len_size], "big")
+    if length < 56:
+        raise ValueError("RLP long length used for a short item")
+    return length
+
+
+def rlp_decode(data):
+    """Decode RLP data into nested lists of memoryview slices of data.
+    No copy of the strings data, use bytes(item) or int.from_bytes(item, "big").
+    Raises ValueError when the encoding is invalid or not canonical.
+    """
+    view = memoryview(data)
+    root = []
+    # Frames : (items list, end offset)
+    stack = [(root, len(view))]
+    pos = 0
+    while True:
+        items, end = stack[-1]
+        if pos == end:
+            if len(stack) == 1:
+                break
+            stack.pop()
+            continue
+        prefix = view[pos]
+        if prefix < 0x80:
+            items.append(view[pos : pos + 1])
+            pos += 1
+            continue
+        if prefix < 0xB8:
+            header_len = 1
+            length = prefix - 0x80
+        elif prefix < 0xC0:
+            header_len = prefix - 0xB6
+            length = rlp_read_length(view, pos + 1, header_len - 1)
+        elif prefix < 0xF8:
+            header_len = 1
+            length = prefix - 0xC0
+        else:
+            header_len = prefix - 0xF6
+            length = rlp_read_length(view, pos + 1, header_len - 1)
+        start = pos + header_len
+        pos = start + length
+        if pos > end:
+            raise ValueError("RLP data truncated")
+        if prefix < 0xC0:
+            if length == 1 and view[start] < 0x80:
+                raise ValueError("RLP single byte must be encoded as itself")
+            items.append(view[start:pos])
+        else:
+            sub_list = []
+            items.append(sub_list)
+            stack.append((sub_list, pos))
+            pos = start
+    if len(root) != 1:
+        raise ValueError("RLP data must be a single item")
+    return root[0]
+
+
+def decode_tx(tx_bin):
+    """Read a signed transaction : (type, fields list).
+    Legacy transactions are type 0, EIP2718 typed envelope is type || rlp.
+    """
+    if len(tx_bin) == 0:
+        raise ValueError("Empty transaction data")
+    if tx_bin[0] >= 0xC0:
+        tx_type = 0
+        fields = rlp_decode(tx_bin)
+    elif tx_bin[0] <= 0x7F:
+        tx_type = tx_bin[0]
+        fields = rlp_decode(memoryview(tx_bin)[1:])
+    else:
+        raise ValueError("Invalid transaction data")
+    if not isinstance(fields, list):
+        raise ValueError("Transaction data must be a list")
+    return tx_type, fields
 
 
 def int2bytearray(i):
@@ -64,9 +212,16 @@ def read_uint256(data, offset):
     return int.from_bytes(data[offset : offset + 32], "big")
 
 
+def abi_bytes(data):
+    """Returned data as bytes, from the 0x hex of eth_call or the bytes of an aggregate call"""
+    if isinstance(data, bytes):
+        return data
+    return bytes.fromhex(data[2:])
+
+
 def read_string(data_ans):
     """ABI String decoding"""
-    data_bin = bytes.fromhex(data_ans[2:])
+    data_bin = abi_bytes(data_ans)
     str_offset = read_uint256(data_bin, 0)
     str_len = read_uint256(data_bin, str_offset)
     str_offset += 32
@@ -75,7 +230,7 @@ def read_string(data_ans):
 
 def read_int_array(data_hex):
     """Decode an int (uint256) array from ABI."""
-    data_bin = bytes.fromhex(data_hex[2:])
+    data_bin = abi_bytes(data_hex)
     idx = 32
     datasz = 32
     if read_uint256(data_bin, 0) != datasz:
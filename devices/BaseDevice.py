@@ -15,6 +15,11 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from os import cpu_count
+
+
+SIGN_WORKERS = cpu_count() or 1
 
 
 class BaseDevice(ABC):
@@ -45,6 +50,8 @@ class BaseDevice(ABC):
     account = "0"
     aindex = "0"
     legacy_derive = False
+    # Keys in software : signatures can be computed concurrently, see get_signer
+    parallel_sign = False
 
     @abstractmethod
     def open_account(self):
@@ -78,6 +85,13 @@ class BaseDevice(ABC):
         """Setup the device to use the key at the given SLIP10/BIP39 path, in case is_HD."""
         pass
 
+    def get_account_node(self, path, key_type):
+        """Provide the BIP32 node at the given account path, in case is_HD.
+        Only for software keys, used to derive the account addresses in the host.
+        Returns None when the device can't provide it.
+        """
+        return None
+
     @abstractmethod
     def get_public_key(self, cb=None):
         """Provide the public key in bytes X962 format.
@@ -99,3 +113,45 @@ class BaseDevice(ABC):
         For EdDSA it always returns the "raw" 64 bytes RS signature.
         """
         pass
+
+    def get_signer(self, path, key_type):
+        """Provide a sign function for the key at the given path, in case parallel_sign.
+        path is None for the current key. Must not change the device current key,
+        as the signer is called from worker threads.
+        Returns None when not available, then the messages are signed one at a time.
+        """
+        return None
+
+    def sign_stream(self, hashed_msgs, key_paths=None, key_type="K1"):
+        """Generator of the signatures of a list of messages, in the same order.
+        Same messages and signatures formats as sign.
+        key_paths : optional list of key path per message, in case is_HD.
+            None in the list means the current key.
+            The device current key may be changed, caller has to set it back.
+        The signatures are computed in a thread pool in case parallel_sign and the
+        device provides the signers, else one at a time on the device.
+        """
+        if key_paths is None:
+            key_paths = [None] * len(hashed_msgs)
+        # Signers are built here, so errors are raised in the caller thread
+        signers = {}
+        if self.parallel_sign:
+            for key_path in key_paths:
+                if key_path not in signers:
+                    signers[key_path] = self.get_signer(key_path, key_type)
+        if not signers or None in signers.values():
+            for msg, key_path in zip(hashed_msgs, key_paths):
+                if key_path is not None:
+                    self.derive_key(key_path, key_type)
+                yield self.sign(msg)
+            return
+
+        def sign_with(key_path, msg):
+            return signers[key_path](msg)
+
+        with ThreadPoolExecutor(max_workers=SIGN_WORKERS) as pool:
+            yield from pool.map(sign_with, key_paths, hashed_msgs)
+
+    def sign_many(self, hashed_msgs, key_paths=None, key_type="K1"):
+        """Sign a list of messages, returns the list of signatures. See sign_stream."""
+        return list(self.sign_stream(hashed_msgs, key_paths, key_type))
@@ -161,12 +161,9 @@ class Ledger(BaseDevice):
             offset = offset + 1 + response[offset]
             return result["publicKey"]
 
-    def register_token(
-        self, token_name, token_addr, token_decimals, chain_id, ledger_signature_hex
-    ):
+    def register_token(self, token_name, token_addr, token_decimals, chain_id, ledger_signature):
         """Send the trusted token information in to the Ledger."""
         # used when ledger_tokens_compat
-        ledger_signature = bytes.fromhex(ledger_signature_hex)
         token_name_bin = token_name.encode("utf8")
         token_name_len = len(token_name_bin)
         apdu = [
@@ -48,6 +48,7 @@ class LocalFile(BaseDevice):
     has_password = True
     password_retries_inf = True
     is_HD = True
+    parallel_sign = True
 
     def open_account(self, password):
         wallet_file = WalletFile(FILE_NAME)
@@ -135,6 +136,9 @@ class LocalFile(BaseDevice):
         return self.account
 
     def derive_key(self, path, key_type):
+        self.pvkey = self.derive_pvkey(path, key_type)
+
+    def derive_pvkey(self, path, key_type):
         pathc = path
         if key_type == "K1":
             mnode = self.master_node_k1
@@ -146,7 +150,13 @@ class LocalFile(BaseDevice):
             mnode = self.master_node_ed
         else:
             raise Exception("LocalFile supports only K1 and Ed derivations.")
-        self.pvkey = mnode.derive_key(pathc)
+        return mnode.derive_key(pathc)
+
+    def get_account_node(self, path, key_type):
+        if key_type != "K1":
+            # Ed25519 has only hardened children
+            return None
+        return self.master_node_k1.master_node.derive_path_private(path)
 
     def get_public_key(self):
         return self.pvkey.get_public_key()
@@ -154,3 +164,8 @@ class LocalFile(BaseDevice):
     def sign(self, hashed_msg):
         # Actually when key is EdDSA, the full msg is provided
         return self.pvkey.sign(hashed_msg)
+
+    def get_signer(self, path, key_type):
+        if path is None:
+            return self.pvkey.sign
+        return self.derive_pvkey(path, key_type).sign
@@ -52,52 +52,35 @@ from cryptolib.HDwallet import (
 from cryptolib.slip39 import slip39_is_checksum_valid
 
 
-from wallets.BTCwallet import BTC_wallet
-from wallets.ETHwallet import ETH_wallet
-from wallets.BSCwallet import BSC_wallet
-from wallets.MATICwallet import MATIC_wallet
-from wallets.TRXwallet import TRX_wallet
-from wallets.FTMwallet import FTM_wallet
-from wallets.OPwallet import OP_wallet
-from wallets.BASEwallet import BASE_wallet
-from wallets.METISwallet import METIS_wallet
-from wallets.CELOwallet import CELO_wallet
-from wallets.GLMRwallet import GLMR_wallet
-from wallets.AVAXwallet import AVAX_wallet
-from wallets.ARBwallet import ARB_wallet
-from wallets.LTCwallet import LTC_wallet
-from wallets.DOGEwallet import DOGE_wallet
-from wallets.EOSwallet import EOS_wallet
-from wallets.XTZwallet import XTZ_wallet
-from wallets.SOLwallet import SOL_wallet
+from wallets.registry import get_coin_class
 
 coins_list = [
-    {"name": "Bitcoin Legacy", "path": "m/44'/0'/{}'/{}/{}", "wallet_lib": BTC_wallet, "type": 0},
-    {"name": "Bitcoin P2WSH", "path": "m/49'/ 0'/{}'/{}/{}", "wallet_lib": BTC_wallet, "type": 1},
-    {"name": "Bitcoin SegWit", "path": "m/84'/ 0'/{}'/{}/{}", "wallet_lib": BTC_wallet, "type": 2},
-    {"name": "Ethereum", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": ETH_wallet},
-    {"name": "Eth (alt. deriv1)", "path": "m/44'/60'/{0}'/{2}", "wallet_lib": ETH_wallet},
-    {"name": "Eth (alt. deriv2)", "path": "m/44'/60'/{0}/{2}", "wallet_lib": ETH_wallet},
-    {"name": "BSC", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": BSC_wallet},
-    {"name": "MATIC", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": MATIC_wallet},
-    {"name": "TRON", "path": "m/44'/195'/{}'/{}/{}", "wallet_lib": TRX_wallet},
-    {"name": "TRON (alt. deriv)", "path": "m/44'/195'/{2}'", "wallet_lib": TRX_wallet},
-    {"name": "FTM", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": FTM_wallet},
-    {"name": "OP", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": OP_wallet},
-    {"name": "BASE", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": BASE_wallet},
-    {"name": "METIS", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": METIS_wallet},
-    {"name": "CELO", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": CELO_wallet},
-    {"name": "GLMR", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": GLMR_wallet, "network": 0},
-    {"name": "MOVR", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": GLMR_wallet, "network": 1},
-    {"name": "ARB", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": ARB_wallet},
-    {"name": "AVAX", "path": "m/44'/60'/{}'/{}/{}", "wallet_lib": AVAX_wallet},
-    {"name": "Litecoin", "path": "m/44'/2'/{}'/{}/{}", "wallet_lib": LTC_wallet},
-    {"name": "Dogecoin", "path": "m/44'/3'/{}'/{}/{}", "wallet_lib": DOGE_wallet},
-    {"name": "EOSio", "path": "m/44'/194'/{}'/{}/{}", "wallet_lib": EOS_wallet},
-    {"name": "Tezos tz1", "path": "m/44'/1729'/{0}'/{2}", "wallet_lib": XTZ_wallet, "type": 1},
-    {"name": "Tezos tz2", "path": "m/44'/1729'/{}'/{}/{}", "wallet_lib": XTZ_wallet, "type": 0},
-    {"name": "Solana", "path": "m/44'/501'/{0}'/{2}", "wallet_lib": SOL_wallet},
-    {"name": "Solana (alt. deriv)", "path": "m/44'/501'/{2}", "wallet_lib": SOL_wallet},
+    {"name": "Bitcoin Legacy", "path": "m/44'/0'/{}'/{}/{}", "coin": "BTC", "type": 0},
+    {"name": "Bitcoin P2WSH", "path": "m/49'/ 0'/{}'/{}/{}", "coin": "BTC", "type": 1},
+    {"name": "Bitcoin SegWit", "path": "m/84'/ 0'/{}'/{}/{}", "coin": "BTC", "type": 2},
+    {"name": "Ethereum", "path": "m/44'/60'/{}'/{}/{}", "coin": "ETH"},
+    {"name": "Eth (alt. deriv1)", "path": "m/44'/60'/{0}'/{2}", "coin": "ETH"},
+    {"name": "Eth (alt. deriv2)", "path": "m/44'/60'/{0}/{2}", "coin": "ETH"},
+    {"name": "BSC", "path": "m/44'/60'/{}'/{}/{}", "coin": "BSC"},
+    {"name": "MATIC", "path": "m/44'/60'/{}'/{}/{}", "coin": "MATIC"},
+    {"name": "TRON", "path": "m/44'/195'/{}'/{}/{}", "coin": "TRX"},
+    {"name": "TRON (alt. deriv)", "path": "m/44'/195'/{2}'", "coin": "TRX"},
+    {"name": "FTM", "path": "m/44'/60'/{}'/{}/{}", "coin": "FTM"},
+    {"name": "OP", "path": "m/44'/60'/{}'/{}/{}", "coin": "OP"},
+    {"name": "BASE", "path": "m/44'/60'/{}'/{}/{}", "coin": "BASE"},
+    {"name": "METIS", "path": "m/44'/60'/{}'/{}/{}", "coin": "METIS"},
+    {"name": "CELO", "path": "m/44'/60'/{}'/{}/{}", "coin": "CELO"},
+    {"name": "GLMR", "path": "m/44'/60'/{}'/{}/{}", "coin": "GLMR", "network": 0},
+    {"name": "MOVR", "path": "m/44'/60'/{}'/{}/{}", "coin": "GLMR", "network": 1},
+    {"name": "ARB", "path": "m/44'/60'/{}'/{}/{}", "coin": "ARB"},
+    {"name": "AVAX", "path": "m/44'/60'/{}'/{}/{}", "coin": "AVAX"},
+    {"name": "Litecoin", "path": "m/44'/2'/{}'/{}/{}", "coin": "LTC"},
+    {"name": "Dogecoin", "path": "m/44'/3'/{}'/{}/{}", "coin": "DOGE"},
+    {"name": "EOSio", "path": "m/44'/194'/{}'/{}/{}", "coin": "EOS"},
+    {"name": "Tezos tz1", "path": "m/44'/1729'/{0}'/{2}", "coin": "XTZ", "type": 1},
+    {"name": "Tezos tz2", "path": "m/44'/1729'/{}'/{}/{}", "coin": "XTZ", "type": 0},
+    {"name": "Solana", "path": "m/44'/501'/{0}'/{2}", "coin": "SOL"},
+    {"name": "Solana (alt. deriv)", "path": "m/44'/501'/{2}", "coin": "SOL"},
 ]
 
 WORDSLEN_LIST = ["12 words", "15 words", "18 words", "21 words", "24 words"]
@@ -123,11 +106,12 @@ class blockchainWallet:
         self.name = coin_data["name"]
         wallet_netw = coin_data.get("network", 0)
         wallet_type = coin_data.get("type", 0)
+        wallet_class = get_coin_class(coin_data["coin"])
         if self.name == "Bitcoin Legacy" and deriv_type == 2:
             # This is Electrum Old derivation wallet, set public key as uncompressed
-            self.wallet = coin_data["wallet_lib"](wallet_netw, wallet_type, device, False)
+            self.wallet = wallet_class(wallet_netw, wallet_type, device, False)
         else:
-            self.wallet = coin_data["wallet_lib"](wallet_netw, wallet_type, device)
+            self.wallet = wallet_class(wallet_netw, wallet_type, device)
 
 
 class ContextOptionsMenu(Menu):
@@ -259,7 +243,7 @@ class SeedWatcherPanel(gui.swgui.MainPanel):
         if is_change:
             change_idx = 1
         path = cpath.format(account_idx, change_idx, address_idx)
-        key_type = coin["wallet_lib"].get_key_type(coin.get("type", 0))
+        key_type = get_coin_class(coin["coin"]).get_key_type(coin.get("type", 0))
         if key_type == "ED":
             # Only for last, means all the index down to m shall be hardened
             path += "'"
@@ -413,7 +397,7 @@ class SeedWatcherPanel(gui.swgui.MainPanel):
         if sel_wallet is None:
             return
         wallet_type = coins_list[sel_wallet].get("type", 0)
-        wallet_open = partial(coins_list[sel_wallet]["wallet_lib"], 0, wallet_type)
+        wallet_open = partial(get_coin_class(coins_list[sel_wallet]["coin"]), 0, wallet_type)
         key = self.coins[sel_wallet].wallet.current_device.ecpair
         pkcpr = True
         if wallet_type == 0 and self.m_typechoice.GetSelection() == 3:
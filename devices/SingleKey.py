@@ -28,6 +28,7 @@ EC_BYTES_SIZE = 32
 
 class SKdevice(BaseDevice):
     has_password = True
+    parallel_sign = True
 
     def __init__(self):
         self.ktype = None
@@ -87,3 +88,7 @@ class SKdevice(BaseDevice):
     def sign(self, hashed_msg):
         # If Ed, hashed_msg is the full message
         return self.eckey.sign(hashed_msg)
+
+    def get_signer(self, path, key_type):
+        # Single key, no path
+        return self.eckey.sign
@@ -0,0 +1,41 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Devices registry
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Devices supported, a device module devices.DEVICE is imported only when the
+device is selected, with its libraries (HID, smartcard, NaCl...).
+"""
+
+
+from importlib import import_module
+
+
+DEVICES_LIST = [
+    "SeedWatcher",
+    "LocalFile",
+    "Ledger",
+    "Cryptnox",
+    "OpenPGP",
+    "Satochip",
+]
+
+
+def get_device_module(device_name):
+    """Module of a device, imported at the first call"""
+    if device_name not in DEVICES_LIST:
+        raise ValueError(f"Unknown device {device_name}")
+    return import_module(f"devices.{device_name}")
@@ -20,6 +20,7 @@ from logging import getLogger
 import sys
 import os.path
 from os import environ
+from threading import Thread
 
 import wx
 
@@ -29,9 +30,11 @@ from gui.utils import file_path, show_history, icon_file
 from gui.send_frame import SendModal
 from gui.qrframe import QRFrame
 from gui.fiat_price import PriceAPI
+from gui.preset_index import PresetIndex
 from version import VERSION
 
 from cryptolib.HDwallet import bip39_is_checksum_valid
+from wallets.wallets_utils import balance_string
 
 
 logger = getLogger(__name__)
@@ -43,6 +46,8 @@ BAD_ADDRESS = (
     "Check the destination input."
 )
 BLANK_ADDR = " " * 65
+# Milliseconds after the last key typed to search in the presets
+SEARCH_DELAY = 200
 
 
 def attach_tt(elt, txt):
@@ -203,6 +208,8 @@ class app_option_panel(gui.maingui.OptionPanel):
         )
         self.m_but_ok.SetCursor(HAND_CURSOR)
         self.m_but_cancel.SetCursor(HAND_CURSOR)
+        self.full_options = None
+        self.search_timer = None
 
     def valid_custom(self, event):
         self.okOption(event)
@@ -220,22 +227,32 @@ class app_option_panel(gui.maingui.OptionPanel):
 
     def onSearch(self, event):
         event.Skip()
+        if event.GetEventType() == wx.EVT_TEXT.typeId:
+            # Wait for the end of the typing
+            if self.search_timer is not None and self.search_timer.IsRunning():
+                self.search_timer.Restart(SEARCH_DELAY)
+            else:
+                self.search_timer = wx.CallLater(SEARCH_DELAY, self.apply_search)
+        else:
+            if self.search_timer is not None:
+                self.search_timer.Stop()
+            self.apply_search()
+
+    def apply_search(self):
+        if not self:
+            # Dialog closed
+            return
         search = str(self.search_preset.GetValue())
         if search:
             self.search_preset.ShowCancelButton(True)
-            filt_values = dict(
-                filter(lambda val: search.lower() in val[0].lower(), self.full_options.items())
-            )
-            self.known_choice.Clear()
-            self.known_choice.Append(f"> Select preset filtered with {search}")
+            filt_names = self.preset_index.search(search)
+            filt_values = {name: self.full_options[name] for name in filt_names}
             self.preset_values = filt_values
-            for preset_txt in filt_values.keys():
-                self.known_choice.Append(preset_txt)
+            self.known_choice.Set([f"> Select preset filtered with {search}"] + filt_names)
             if len(filt_values) == 1:
                 self.known_choice.SetSelection(1)
             elif len(filt_values) == 0:
-                self.known_choice.Clear()
-                self.known_choice.Append(f"No preset found for {search}")
+                self.known_choice.Set([f"No preset found for {search}"])
                 self.known_choice.SetSelection(0)
             else:
                 self.known_choice.SetSelection(0)
@@ -272,14 +289,37 @@ class app_option_panel(gui.maingui.OptionPanel):
         self.preset_text.SetLabelText(self.preset_label)
 
     def SetPresetValues(self, values):
-        self.full_options = values
-        self.known_choice.Clear()
-        self.known_choice.Append(f"Select a {self.preset_label}")
+        if self.full_options is not values:
+            self.full_options = values
+            self.preset_index = PresetIndex(values)
         self.preset_values = values
-        for preset_txt in values.keys():
-            self.known_choice.Append(preset_txt)
+        self.known_choice.Set([f"Select a {self.preset_label}"] + list(values))
         self.known_choice.SetSelection(0)
 
+    def SetOwnedPresets(self, owned):
+        """List first the presets owned, with their balance.
+        owned is a list of dict : name, contract, balance and decimals.
+        """
+        if not self or not owned:
+            # Dialog closed, or nothing owned
+            return
+        owned_names = {token["name"] for token in owned}
+        values = {
+            f"{token['name']} : {balance_string(token['balance'], token['decimals'])}": token[
+                "contract"
+            ]
+            for token in owned
+        }
+        for name, value in self.full_options.items():
+            if name not in owned_names:
+                values[name] = value
+        selection = self.known_choice.GetStringSelection()
+        self.full_options = values
+        self.preset_index = PresetIndex(values)
+        self.apply_search()
+        if selection in values:
+            self.known_choice.SetStringSelection(selection)
+
     def SetCustomLabel(self, text):
         self.custom_text.SetLabelText(text)
 
@@ -475,6 +515,8 @@ class UniblowApp(wx.App):
         self.gui_panel.but_opt_wc.SetBitmap(
             wx.Bitmap(file_path("gui/images/btns/wc.png"), wx.BITMAP_TYPE_PNG)
         )
+        self.gui_panel.but_opt_nft.SetToolTip("NFT")
+        self.gui_panel.but_opt_wc.SetToolTip("WalletConnect")
         self.gui_panel.but_opt_nft.Show()
         self.gui_panel.but_opt_wc.Show()
         self.gui_panel.but_opt_tok.SetCursor(self.HAND_CURSOR)
@@ -523,10 +565,9 @@ class UniblowApp(wx.App):
     def erase_info(self, reset=False, first_time=False):
         if hasattr(self, "balance_timer"):
             self.balance_timer.Stop()
-        if hasattr(self, "wallet") and hasattr(self.wallet, "wc_timer"):
-            self.wallet.wc_client.close()
-            self.wallet.wc_timer.Stop()
-            delattr(self.wallet, "wc_timer")
+        if hasattr(self, "wallet") and hasattr(self.wallet, "wc_sessions"):
+            self.wallet.wc_sessions.close()
+            delattr(self.wallet, "wc_sessions")
         self.gui_panel.hist_button.Disable()
         self.gui_panel.copy_button.Disable()
         self.disable_send()
@@ -710,7 +751,20 @@ class UniblowApp(wx.App):
             passval = pwd_dialog.GetValue()
             return passval
 
-    def get_option(self, network_id, input_value, preset_values):
+    @staticmethod
+    def scan_owned_presets(option_panel, scan_owned):
+        """Read the owned presets in a thread, then list them first in the panel."""
+        try:
+            owned = scan_owned()
+        except Exception as exc:
+            logger.debug("Can't scan the owned presets : %s", str(exc))
+            return
+        wx.CallAfter(option_panel.SetOwnedPresets, owned)
+
+    def get_option(self, network_id, input_value, preset_values, scan_owned=None):
+        """Ask the user an option value, from the presets or custom.
+        scan_owned returns the owned presets, they are listed first when read.
+        """
         option_dialog = gui.maingui.OptionDialog(self.gui_frame)
         resize(option_dialog, (455, 400))
         option_panel = app_option_panel(option_dialog)
@@ -720,6 +774,12 @@ class UniblowApp(wx.App):
         option_panel.SetCustomLabel(f"Input {inp_txt}")
         if preset_values and len(preset_values[network_id]) > 0:
             option_panel.SetPresetValues(preset_values[network_id])
+            if scan_owned is not None:
+                Thread(
+                    target=self.scan_owned_presets,
+                    args=(option_panel, scan_owned),
+                    daemon=True,
+                ).start()
         else:
             option_panel.HidePreset()
         if option_dialog.ShowModal() == wx.ID_OK:
@@ -831,10 +891,9 @@ class UniblowApp(wx.App):
         except Exception as exc:
             if hasattr(self, "balance_timer"):
                 self.balance_timer.Stop()
-            if hasattr(self, "wallet") and hasattr(self.wallet, "wc_timer"):
-                self.wallet.wc_client.close()
-                self.wallet.wc_timer.Stop()
-                delattr(self.wallet, "wc_timer")
+            if hasattr(self, "wallet") and hasattr(self.wallet, "wc_sessions"):
+                self.wallet.wc_sessions.close()
+                delattr(self.wallet, "wc_sessions")
             self.gui_panel.hist_button.Disable()
             self.disable_send()
             self.deactivate_option_buttons()
@@ -879,7 +938,7 @@ class UniblowApp(wx.App):
             # EOS when register pubkey mode : disable sending
             and not balance_num.startswith("No pubkey")
             # WalletConnect : disable sending
-            and not hasattr(self.wallet, "wc_timer")
+            and not hasattr(self.wallet, "wc_sessions")
         ):
             self.enable_send()
             cb_fiat = partial(self.display_fiat, coinw, wall_net, float(balance_num))
@@ -898,7 +957,7 @@ class UniblowApp(wx.App):
         else:
             self.gui_panel.fiat_panel.Hide()
             self.disable_send()
-        if hasattr(self, "wallet") and hasattr(self.wallet, "wc_timer"):
+        if hasattr(self, "wallet") and hasattr(self.wallet, "wc_sessions"):
             # WalletConnect active
             self.disable_send("Use the connected dapp to transact")
         self.gui_panel.Refresh()
@@ -955,7 +1014,12 @@ class UniblowApp(wx.App):
         self.gui_panel.but_opt_wc.SetBitmap(
             wx.Bitmap(file_path("gui/images/btns/endwc.png"), wx.BITMAP_TYPE_PNG)
         )
+        self.gui_panel.but_opt_wc.SetToolTip("Disconnect the dapps")
         self.gui_panel.but_opt_tok.Disable()
-        self.gui_panel.but_opt_nft.Disable()
-        self.gui_panel.but_opt_nft.Hide()
-        return self.gui_panel.but_opt_wc
+        # The NFT button pairs more dapps
+        self.gui_panel.but_opt_nft.SetBitmap(
+            wx.Bitmap(file_path("gui/images/btns/wc.png"), wx.BITMAP_TYPE_PNG)
+        )
+        self.gui_panel.but_opt_nft.SetToolTip("Connect one more dapp")
+        self.gui_panel.but_opt_nft.Show()
+        return self.gui_panel.but_opt_wc, self.gui_panel.but_opt_nft
@@ -1,8 +1,9 @@
-from json import load
-from urllib.request import urlopen
+from json import loads
 
 from wx import CallAfter
 
+from wallets.http_transport import request as http_request
+
 
 chain_names = {
     "GLMR": "moonbeam",
@@ -80,8 +81,7 @@ class PriceAPI:
             call_url = f"{PriceAPI.BASE_URL}simple/price?ids={token_id}&vs_currencies=usd"
 
         try:
-            rsp = urlopen(call_url)
-            value_json = load(rsp)
+            value_json = loads(http_request(call_url, timeout=8))
         except Exception:
             return
         try:
@@ -14,13 +14,14 @@
 # along with this program.  If not, see <http://www.gnu.org/licenses/>
 
 
+from io import BytesIO
 from logging import getLogger
 from threading import Thread
 import webbrowser
 import wx
 
 from wallets.ETHwallet import testaddr, ETH_wallet
-from wallets.NFTwallet import get_image_file
+from wallets.nft_images import NFTImagesLoader, image_cache, read_image
 from wallets.name_service import resolve
 from gui.utils import icon_file, file_path
 from gui.gallerygui import GalleryFrame, GalleryPanel
@@ -46,8 +47,30 @@ def opensea_url(chain_id, contract, id):
     return f"https://opensea.io/assets/{chaincode}/{contract}/{id}"
 
 
+def fit_image(img, size):
+    """Rescale a wx.Image to fit in size x size"""
+    imgw = img.GetWidth()
+    imgh = img.GetHeight()
+    scale = min(size / imgw, size / imgh)
+    img.Rescale(max(1, int(scale * imgw)), max(1, int(scale * imgh)), wx.IMAGE_QUALITY_HIGH)
+
+
+def make_thumbnail(image_data, size):
+    """Decode an image and make its PNG thumbnail, in a loader worker."""
+    img = wx.Image(BytesIO(image_data), type=wx.BITMAP_TYPE_ANY, index=-1)
+    if not img.IsOk():
+        return None
+    fit_image(img, size)
+    thumbnail = BytesIO()
+    if not img.SaveFile(thumbnail, wx.BITMAP_TYPE_PNG):
+        return None
+    return thumbnail.getvalue()
+
+
 class Gallery:
     img_width = 178
+    # Size of the image in the detail view
+    view_size = 640
     img_border = 20
     n_cols = 4
     min_height = 310
@@ -59,6 +82,7 @@ class Gallery:
         self.frame.SetIcons(wicon)
         self.panel = GalleryPanel(self.frame)
         self.cb_end = cb_end
+        self.loader = None
         self.img_sizer = wx.FlexGridSizer(0, Gallery.n_cols, Gallery.img_border, Gallery.img_border)
         self.img_sizer.SetFlexibleDirection(wx.BOTH)
         self.img_sizer.SetNonFlexibleGrowMode(wx.FLEX_GROWMODE_SPECIFIED)
@@ -71,7 +95,7 @@ class Gallery:
             wx.CallAfter(self.panel.collection_name.SetLabel, f"{self.symb} NFT")
             self.nwallet = wallet
             self.panel.wait_text.SetLabel("Loading data... Please wait... ")
-            wx.CallLater(500, Thread(target=self.read_balance).run)
+            wx.CallLater(500, Thread(target=self.read_balance, daemon=True).start)
         self.frame.Bind(wx.EVT_CLOSE, self.on_close)
         self.frame.Show()
 
@@ -81,6 +105,8 @@ class Gallery:
         self.frame.Close()
 
     def on_close(self, evt):
+        if self.loader is not None:
+            self.loader.stop()
         self.frame.GetParent().Show()
         self.cb_end(None)
         if evt is not None:
@@ -105,68 +131,73 @@ class Gallery:
         close_btn.Bind(wx.EVT_BUTTON, self.close_frombtn)
         self.panel.Layout()
 
+    def read_error(self, err):
+        self.show_message(err)
+        self.close_frombtn()
+
     def read_balance(self):
-        """Start filling the Gallery content."""
+        """Start filling the Gallery content, in a thread."""
         try:
             self.bal = self.nwallet.get_balance()
         except Exception:
-            self.show_message(
+            wx.CallAfter(
+                self.read_error,
                 "Error when reading the NFT balance.\n"
-                "Internet connectivity issue, or incompatible contract type."
+                "Internet connectivity issue, or incompatible contract type.",
             )
-            self.close_frombtn()
             return
-        self.update_balance()
-        self.panel.Layout()
-        self.panel.Refresh()
-        wx.CallLater(100, self.load_nft_list)
+        wx.CallAfter(self.update_balance)
+        self.load_nft_list()
 
     def load_nft_list(self):
         if self.bal > 0:
             try:
                 id_list = self.nwallet.get_tokens_list(self.bal)
             except Exception:
-                self.show_message(
+                wx.CallAfter(
+                    self.read_error,
                     "Error when reading the NFT list.\n"
-                    "Internet connectivity issue, or incompatible contract type."
+                    "Internet connectivity issue, or incompatible contract type.",
                 )
-                self.close_frombtn()
                 return
             wx.CallAfter(self.load_nft, id_list)
         else:
-            self.panel.wait_text.SetLabel(
-                "No such NFT in this wallet.\nReceive NFT using the\nwallet address."
-            )
-            self.add_close_btn()
+            wx.CallAfter(self.no_nft)
 
-    def load_image(self, nft_info, id_list):
-        """Get image of a NFT."""
-        try:
-            nft_info["image_data"] = get_image_file(nft_info["url"])
-        except Exception:
-            nft_info["image_data"] = None
-        if self.panel:
-            self.add_image(nft_info)
-            wx.CallLater(80, self.load_nft, id_list)
+    def no_nft(self):
+        self.panel.wait_text.SetLabel(
+            "No such NFT in this wallet.\nReceive NFT using the\nwallet address."
+        )
+        self.add_close_btn()
 
     def load_nft(self, id_list):
-        """Load the NFT list info."""
-        if len(id_list) > 0:
-            id = id_list.pop()
-            try:
-                img_url = self.get_nft_image(id)
-            except Exception:
-                img_url = None
-            nft_info = {
-                "id": id,
-                "url": img_url,
-                "chain": self.nwallet.wallet.chainID,
-                "contract": self.nwallet.wallet.eth.contract,
-            }
-            self.panel.wait_text.SetLabel(
-                f"Loading data... {self.bal-len(id_list)}/{self.bal} Please wait..."
-            )
-            Thread(target=self.load_image, args=(nft_info, id_list)).run()
+        """Load the NFT images, in parallel. They are added as they arrive."""
+        self.loaded = 0
+        self.show_progress()
+        self.loader = NFTImagesLoader(
+            self.nwallet,
+            lambda info: wx.CallAfter(self.image_ready, info),
+            make_thumbnail,
+            Gallery.img_width,
+        )
+        self.loader.load(id_list)
+
+    def show_progress(self):
+        self.panel.wait_text.SetLabel(f"Loading data... {self.loaded}/{self.bal} Please wait...")
+
+    def image_ready(self, nft_info):
+        """Add a NFT read by the loader."""
+        if not self.panel:
+            # Gallery closed
+            return
+        nft_info["chain"] = self.nwallet.wallet.chainID
+        nft_info["contract"] = self.nwallet.wallet.eth.contract
+        self.add_image(nft_info)
+        self.loaded += 1
+        self.panel.scrwin.FitInside()
+        self.panel.scrwin.Layout()
+        if self.loaded < self.bal:
+            self.show_progress()
         else:
             self.panel.wait_text.SetLabel("")
             wx.CallLater(500, self.resize_window)
@@ -174,14 +205,8 @@ class Gallery:
     def update_balance(self):
         """Display the balance in UI."""
         self.panel.balance_text.SetLabel(f"You have {self.bal} item{'s' if self.bal >= 2 else ''}")
-
-    def get_nft_image(self, id):
-        """Get metadata and the image URL of a NFT."""
-        metadata = self.nwallet.get_metadata(id)
-        image_url = ""
-        if metadata is not None:
-            image_url = metadata.get("image")
-        return image_url
+        self.panel.Layout()
+        self.panel.Refresh()
 
     def resize_window(self):
         wn = self.bal
@@ -258,25 +283,47 @@ class Gallery:
             return
         self.show_message(f"Transaction performed :\n{txid}")
 
+    def read_full_image(self, nft_data):
+        """Read and decode the full image of a NFT, in a thread."""
+        try:
+            img = wx.Image(
+                BytesIO(read_image(nft_data["url"], image_cache)),
+                type=wx.BITMAP_TYPE_ANY,
+                index=-1,
+            )
+            if not img.IsOk():
+                raise ValueError("Can't decode the image")
+            fit_image(img, Gallery.view_size)
+        except Exception as exc:
+            logger.debug("Can't read the NFT #%s image : %s", nft_data["id"], str(exc))
+            wx.CallAfter(self.show_message, "Error when reading the NFT image.")
+            return
+        wx.CallAfter(self.show_full_image, nft_data, img)
+
+    def show_image(self, nft_data):
+        """Open the detail view of a NFT, the full image is decoded only then."""
+        Thread(target=self.read_full_image, args=(nft_data,), daemon=True).start()
+
+    def show_full_image(self, nft_data, img):
+        if not self.panel:
+            return
+        view = wx.Dialog(self.frame, title=f"{self.symb} #{nft_data['id']}")
+        szr = wx.BoxSizer(wx.VERTICAL)
+        szr.Add(wx.StaticBitmap(view, wx.ID_ANY, img.ConvertToBitmap()), 0, wx.ALL, 10)
+        view.SetSizerAndFit(szr)
+        view.CentreOnParent()
+        view.ShowModal()
+        view.Destroy()
+
     def add_image(self, nft_data):
-        """Add a NFT in the gallery UI."""
+        """Add a NFT in the gallery UI, with its thumbnail."""
         szr = wx.BoxSizer(wx.VERTICAL)
-        if nft_data["image_data"] is not None:
-            try:
-                img = wx.Image(nft_data["image_data"], type=wx.BITMAP_TYPE_ANY, index=-1)
-                imgh = img.GetHeight()
-                imgw = img.GetWidth()
-                scale_h = Gallery.img_width / imgh
-                scale_w = Gallery.img_width / imgw
-                scale = min(scale_h, scale_w)
-                if img.IsOk():
-                    img.Rescale(int(scale * imgw), int(scale * imgh), wx.IMAGE_QUALITY_HIGH)
-                else:
-                    img = wx.Image(file_path("gui/images/nonft.png"))
-            except Exception:
-                img = wx.Image(file_path("gui/images/nonft.png"))
-        else:
+        img = None
+        if nft_data["thumbnail"] is not None:
+            img = wx.Image(BytesIO(nft_data["thumbnail"]), type=wx.BITMAP_TYPE_PNG)
+        if img is None or not img.IsOk():
             img = wx.Image(file_path("gui/images/nonft.png"))
+            nft_data["thumbnail"] = None
         bmp = wx.StaticBitmap(
             self.panel.scrwin,
             wx.ID_ANY,
@@ -285,6 +332,9 @@ class Gallery:
             wx.DefaultSize,
             0,
         )
+        if nft_data["thumbnail"] is not None:
+            bmp.SetCursor(wx.Cursor(wx.CURSOR_HAND))
+            bmp.Bind(wx.EVT_LEFT_UP, lambda _: self.show_image(nft_data))
         szr.Add(bmp, 0, wx.ALL | wx.ALIGN_CENTER_HORIZONTAL, 5)
         szr_btn = wx.BoxSizer(wx.HORIZONTAL)
         img = wx.Image(file_path("gui/images/btns/nftinfo.png"), wx.BITMAP_TYPE_PNG)
@@ -0,0 +1,97 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Presets search index
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Search in the presets {"Name (SYMBOL)": contract} of the option dialog.
+The names n-grams postings are built once per presets table, a search reads
+the postings of the query n-grams instead of scanning all the names.
+"""
+
+
+from bisect import bisect_left
+
+from wallets.token_scanner import preset_symbol
+
+
+# Longest n-grams in the postings
+NGRAM_SIZE = 3
+
+
+def ngrams(text, size):
+    return {text[idx : idx + size] for idx in range(len(text) - size + 1)}
+
+
+class PresetIndex:
+    """Index of a presets dict, search returns the matching names in the presets order"""
+
+    def __init__(self, presets):
+        self.presets = presets
+        self.names = list(presets)
+        self.lower_names = [name.lower() for name in self.names]
+        # n-gram : names indexes
+        self.postings = {}
+        for idx, name in enumerate(self.lower_names):
+            for size in range(1, NGRAM_SIZE + 1):
+                for gram in ngrams(name, size):
+                    self.postings.setdefault(gram, []).append(idx)
+        # Exact ticker : names indexes
+        self.tickers = {}
+        for idx, name in enumerate(self.names):
+            self.tickers.setdefault(preset_symbol(name).lower(), []).append(idx)
+        # Sorted (contract, index) for the prefix search
+        self.contracts = sorted(
+            (str(contract).lower(), idx) for idx, contract in enumerate(presets.values())
+        )
+        self.last_query = None
+        self.last_matches = None
+
+    def find_contracts(self, prefix):
+        matches = []
+        pos = bisect_left(self.contracts, (prefix,))
+        while pos < len(self.contracts) and self.contracts[pos][0].startswith(prefix):
+            matches.append(self.contracts[pos][1])
+            pos += 1
+        return sorted(matches)
+
+    def find_names(self, query):
+        if self.last_query and query.startswith(self.last_query):
+            # Refine the previous matches while typing
+            candidates = self.last_matches
+        elif len(query) <= NGRAM_SIZE:
+            return self.postings.get(query, [])
+        else:
+            grams_postings = sorted(
+                (self.postings.get(gram, []) for gram in ngrams(query, NGRAM_SIZE)), key=len
+            )
+            candidates = grams_postings[0]
+        return [idx for idx in candidates if query in self.lower_names[idx]]
+
+    def search(self, query):
+        """Presets names containing the query, or with a contract starting with it.
+        An exact ticker match comes first.
+        """
+        query = query.strip().lower()
+        if not query:
+            return list(self.names)
+        matches = self.find_names(query)
+        self.last_query = query
+        self.last_matches = matches
+        if query.startswith("0x"):
+            matches = sorted(set(matches).union(self.find_contracts(query)))
+        ticker_matches = self.tickers.get(query, [])
+        matches = ticker_matches + [idx for idx in matches if idx not in ticker_matches]
+        return [self.names[idx] for idx in matches]
@@ -5,7 +5,8 @@ import sys
 import platform
 from package.build_win_verinfo import fill_version_info
 
-from uniblow import SUPPORTED_COINS, DEVICES_LIST
+from devices.registry import DEVICES_LIST
+from wallets.registry import SUPPORTED_COINS
 from version import VERSION
 
 
@@ -88,6 +89,10 @@ datai = [
 datai += [
     (f"../gui/images/icons/{coin.lower()}.png", "gui/images/icons/") for coin in SUPPORTED_COINS
 ]
+datai += [
+    (f"../wallets/tokens/{tokens_file}", "wallets/tokens/")
+    for tokens_file in os.listdir("../wallets/tokens")
+]
 
 a = Analysis(
     ["../uniblow.py"],
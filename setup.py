@@ -47,5 +47,6 @@ setup(
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],
     packages=find_packages(),
+    package_data={"wallets": ["tokens/*.dat"]},
     zip_safe=False,
 )
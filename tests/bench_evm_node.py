@@ -0,0 +1,109 @@
+"""
+Benchmarks of the EVM wallet against the local stand-in node, offline.
+
+    python -m tests.bench_evm_node [--transfers 1000] [--wallets 4] [--reads 2000]
+
+Sends the native and the ERC20 transfers through ETH_wallet, from several
+wallets in parallel threads, then reads the balances. Reports the throughput,
+the latency percentiles and the RPC requests per operation.
+The signatures are computed and recovered in Python, on the wallet side and on
+the node side, this is most of a transfer time.
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from time import perf_counter
+
+from devices.SingleKey import SKdevice
+from wallets import rpc_pool
+from wallets.ETHwallet import ETH_wallet
+from tests.evm_node import EVMNode
+
+CHAIN_ID = 1
+TOKEN = "0x" + "7e" * 20
+
+
+def device(key_int):
+    sk_device = SKdevice()
+    sk_device.open_account_fromint(key_int)
+    sk_device.set_key_type("K1")
+    return sk_device
+
+
+def percentile(durations, part):
+    durations = sorted(durations)
+    return durations[min(len(durations) - 1, int(part * len(durations)))]
+
+
+def run(node, name, thread_operations):
+    """Run the lists of operations, one thread per list, and print the results"""
+    requests_start = node.state.requests
+
+    def run_thread(operations):
+        durations = []
+        for operation in operations:
+            start = perf_counter()
+            operation()
+            durations.append(perf_counter() - start)
+        return durations
+
+    start = perf_counter()
+    with ThreadPoolExecutor(len(thread_operations)) as executor:
+        durations = sum(executor.map(run_thread, thread_operations), [])
+    elapsed = perf_counter() - start
+    requests = node.state.requests - requests_start
+    print(
+        f"{name:<16} {len(durations):>6} ops  {len(durations) / elapsed:>8.1f} ops/s  "
+        f"p50 {1000 * percentile(durations, 0.5):>7.1f} ms  "
+        f"p95 {1000 * percentile(durations, 0.95):>7.1f} ms  "
+        f"{requests / len(durations):>5.2f} RPC/op"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--transfers", type=int, default=1000, help="transfers of each kind")
+    parser.add_argument("--wallets", type=int, default=4, help="wallets sending in parallel")
+    parser.add_argument("--reads", type=int, default=2000, help="balance reads")
+    args = parser.parse_args()
+
+    with EVMNode(CHAIN_ID) as node:
+        rpc_pool.set_chain_endpoints(CHAIN_ID, [node.url])
+        devices = [device(0x1000 + idx) for idx in range(args.wallets)]
+        wallets = [ETH_wallet(0, 0, wallet_device) for wallet_device in devices]
+        senders = [f"0x{wallet.eth.address}" for wallet in wallets]
+        for sender in senders:
+            node.state.fund(sender, 10**24)
+        node.state.add_erc20(TOKEN, "BENCH", 18, {sender: 10**30 for sender in senders})
+        token_wallets = [
+            ETH_wallet(0, 1, wallet_device, contract_addr=TOKEN[2:]) for wallet_device in devices
+        ]
+        recipients = [f"0x{idx + 1:040x}" for idx in range(args.transfers)]
+        print(f"Stand-in node {node.url}, {args.wallets} wallets")
+        for name, wallet_list in (("ETH transfers", wallets), ("ERC20 transfers", token_wallets)):
+            # Each wallet sends its transfers in a row, from its own thread
+            run(
+                node,
+                name,
+                [
+                    [
+                        partial(wallet.transfer, "0.001", recipient, 1)
+                        for recipient in recipients[idx :: args.wallets]
+                    ]
+                    for idx, wallet in enumerate(wallet_list)
+                ],
+            )
+        run(
+            node,
+            "Balance reads",
+            [
+                [wallet.get_balance] * (args.reads // args.wallets)
+                for wallet in wallets + token_wallets
+            ],
+        )
+        print(f"Head block {node.state.block}, {node.state.requests} RPC requests")
+
+
+if __name__ == "__main__":
+    main()
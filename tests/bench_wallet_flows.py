@@ -0,0 +1,142 @@
+"""
+Benchmarks of the wallets flows of every coin, replayed offline from HTTP cassettes.
+
+Record the cassette of a coin on the network, in tests/cassettes :
+    python -m tests.bench_wallet_flows record COIN [--network 1]
+Replay all the recorded cassettes :
+    python -m tests.bench_wallet_flows replay [--latency 0] [--latency-factor 1] [--runs 3]
+
+A flow opens the wallet, reads its balance, then sends a small amount to its own
+account : prepare, sign and send. The wallets use the BENCH_KEY throwaway key, its
+testnet accounts must be funded to record a send. A step failing on record, as for
+a wallet without funds, fails the same on replay.
+Each replay runs in a new interpreter, so the wallets caches start empty as on record.
+"""
+
+import argparse
+import json
+from os import listdir, makedirs, path
+import subprocess
+import sys
+from time import perf_counter
+
+from devices.SingleKey import SKdevice
+from wallets import http_transport
+from wallets.http_cassette import Cassette, RECORD, REPLAY
+from wallets.registry import get_coin_class, SUPPORTED_COINS
+
+CASSETTES_DIR = path.join(path.dirname(path.abspath(__file__)), "cassettes")
+BENCH_KEY = 0xB3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4B3C4
+SEND_AMOUNT = "0.0001"
+STEPS = ["open", "balance", "send"]
+
+
+def cassette_path(coin, network):
+    return path.join(CASSETTES_DIR, f"{coin}-{network}.cassette")
+
+
+def wallet_flow(coin, network):
+    """Run the flow of a coin, returns the steps durations and the error of the failed step"""
+    coin_class = get_coin_class(coin)
+    device = SKdevice()
+    device.open_account_fromint(BENCH_KEY)
+    device.set_key_type(coin_class.get_key_type(0))
+    durations = {}
+    wallet = None
+
+    def step(name, function):
+        start = perf_counter()
+        result = function()
+        durations[name] = perf_counter() - start
+        return result
+
+    try:
+        wallet = step("open", lambda: coin_class(network, 0, device))
+        step("balance", wallet.get_balance)
+        step("send", lambda: wallet.transfer(SEND_AMOUNT, wallet.get_account(), 1))
+    except Exception as exc:
+        return durations, f"{type(exc).__name__} : {exc}"
+    return durations, None
+
+
+def run_flow(coin, network, mode, latency=0, latency_factor=0):
+    cassette = Cassette(
+        cassette_path(coin, network), mode, latency, latency_factor, overwrite=True
+    )
+    http_transport.set_transport_hook(cassette)
+    try:
+        return wallet_flow(coin, network)
+    finally:
+        http_transport.set_transport_hook(None)
+        cassette.close()
+
+
+def replay_all(args):
+    cassettes = []
+    if path.isdir(CASSETTES_DIR):
+        cassettes = sorted(name for name in listdir(CASSETTES_DIR) if name.endswith(".cassette"))
+    if not cassettes:
+        print(f"No cassette in {CASSETTES_DIR}, record some first.")
+        return
+    print(f"{'flow':<12}" + "".join(f"{step:>12}" for step in STEPS) + "  error")
+    for cassette_name in cassettes:
+        coin, network = cassette_name[: -len(".cassette")].rsplit("-", 1)
+        for _ in range(args.runs):
+            # A new interpreter for each run
+            result = subprocess.run(
+                [
+                    sys.executable,
+                    "-m",
+                    "tests.bench_wallet_flows",
+                    "run",
+                    coin,
+                    "--network",
+                    network,
+                    "--latency",
+                    str(args.latency),
+                    "--latency-factor",
+                    str(args.latency_factor),
+                ],
+                capture_output=True,
+                check=True,
+                text=True,
+            )
+            durations, error = json.loads(result.stdout.splitlines()[-1])
+            print(
+                f"{coin + '-' + network:<12}"
+                + "".join(
+                    f"{1000 * durations[step]:>9.1f} ms" if step in durations else f"{'-':>12}"
+                    for step in STEPS
+                )
+                + (f"  {error}" if error else "")
+            )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("action", choices=["record", "replay", "run"])
+    parser.add_argument("coin", nargs="?", choices=SUPPORTED_COINS)
+    parser.add_argument("--network", type=int, default=1, help="network index of the coin")
+    parser.add_argument("--latency", type=float, default=0, help="seconds added per response")
+    parser.add_argument(
+        "--latency-factor", type=float, default=0, help="part of the recorded duration added"
+    )
+    parser.add_argument("--runs", type=int, default=3, help="replays of each cassette")
+    args = parser.parse_args()
+    if args.action == "replay":
+        replay_all(args)
+        return
+    if args.coin is None:
+        parser.error(f"{args.action} requires a coin")
+    if args.action == "record":
+        makedirs(CASSETTES_DIR, exist_ok=True)
+        durations, error = run_flow(args.coin, args.network, RECORD)
+        print(f"Recorded {cassette_path(args.coin, args.network)}")
+        print({step: round(1000 * duration, 1) for step, duration in durations.items()}, error)
+        return
+    # run : a replay, output for replay_all
+    print(json.dumps(run_flow(args.coin, args.network, REPLAY, args.latency, args.latency_factor)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,410 @@
+"""
+Local stand-in of an EVM node, for the end-to-end tests and the benchmarks.
+
+A stateful JSON-RPC server on HTTP, with the subset of methods used by the wallets :
+native balances, nonces, gas price, eth_call to ERC20, ERC721 and Multicall3
+aggregate3, eth_estimateGas and eth_sendRawTransaction. The signed legacy
+transactions are RLP decoded, their sender is recovered from the signature, then
+they are checked and applied at once, one block per transaction.
+"""
+
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from json import dumps, loads
+from threading import Lock, Thread
+
+from cryptolib.coins.ethereum import decode_tx, read_uint256, rlp_encode, uint256
+from cryptolib.cryptography import public_key_recover, sha3
+from wallets.token_scanner import MULTICALL3_ADDRESS
+
+GAS_PRICE = 12 * 10**9
+SIMPLE_TX_GAS = 21000
+TOKEN_TRANSFER_GAS = 51000
+NFT_TRANSFER_GAS = 84000
+CONTRACT_CODE = "0x608060405234801561001057600080fd5b50"
+
+#   transfer(address,uint256)
+TRANSFER_FUNCTION = "a9059cbb"
+#   safeTransferFrom(address,address,uint256)
+SAFETRANSFER_FUNCTION = "42842e0e"
+#   balanceOf(address)
+BALANCEOF_FUNCTION = "70a08231"
+#   decimals()
+DECIMALS_FUNCTION = "313ce567"
+#   symbol()
+SYMBOL_FUNCTION = "95d89b41"
+#   name()
+NAME_FUNCTION = "06fdde03"
+#   ownerOf(uint256)
+OWNEROF_FUNCTION = "6352211e"
+#   tokenURI(uint256)
+TOKENURI_FUNCTION = "c87b56dd"
+#   tokenOfOwnerByIndex(address,uint256)
+TOKENOFOWNER_FUNCTION = "2f745c59"
+#   aggregate3((address,bool,bytes)[])
+AGGREGATE3_FUNCTION = "82ad56cb"
+
+
+class RPCError(Exception):
+    """Error answered to a JSON-RPC request"""
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+        self.message = message
+
+
+def reverted():
+    return RPCError(3, "execution reverted")
+
+
+def address_arg(data, offset):
+    return "0x" + bytes(data[offset + 12 : offset + 32]).hex()
+
+
+def abi_string(text):
+    text_bin = text.encode("utf8")
+    return (
+        uint256(32)
+        + uint256(len(text_bin))
+        + text_bin.ljust((len(text_bin) + 31) // 32 * 32, b"\x00")
+    )
+
+
+def decode_aggregate3_calls(args):
+    """(target, allow failure, calldata) of the aggregate3 arguments"""
+    array_offset = read_uint256(args, 0)
+    n_calls = read_uint256(args, array_offset)
+    content_offset = array_offset + 32
+    calls = []
+    for idx in range(n_calls):
+        tuple_offset = content_offset + read_uint256(args, content_offset + 32 * idx)
+        data_offset = tuple_offset + read_uint256(args, tuple_offset + 64)
+        data_len = read_uint256(args, data_offset)
+        calls.append(
+            (
+                address_arg(args, tuple_offset),
+                read_uint256(args, tuple_offset + 32) != 0,
+                bytes(args[data_offset + 32 : data_offset + 32 + data_len]),
+            )
+        )
+    return calls
+
+
+def encode_aggregate3_results(results):
+    """ABI of the aggregate3 (success, return data)[] results"""
+    offsets = []
+    tuples_data = []
+    offset = 32 * len(results)
+    for success, return_data in results:
+        offsets.append(uint256(offset))
+        tuple_data = (
+            uint256(int(success))
+            + uint256(64)
+            + uint256(len(return_data))
+            + return_data.ljust((len(return_data) + 31) // 32 * 32, b"\x00")
+        )
+        tuples_data.append(tuple_data)
+        offset += len(tuple_data)
+    return uint256(32) + uint256(len(results)) + b"".join(offsets) + b"".join(tuples_data)
+
+
+def quantity(raw_hex):
+    return int(raw_hex, 16) if raw_hex not in (None, "", "0x") else 0
+
+
+class EVMState:
+    """The chain state : accounts, tokens and transactions, thread safe"""
+
+    def __init__(self, chain_id=1, gas_price=GAS_PRICE):
+        self.chain_id = chain_id
+        self.gas_price = gas_price
+        self.block = 1
+        self.balances = {}
+        self.nonces = {}
+        # contract : {"symbol", "decimals", "balances"}
+        self.erc20 = {}
+        # contract : {"symbol", "owners" {id: owner}, "uri"}
+        self.erc721 = {}
+        self.receipts = {}
+        self.requests = 0
+        self.lock = Lock()
+
+    def fund(self, address, amount):
+        with self.lock:
+            address = address.lower()
+            self.balances[address] = self.balances.get(address, 0) + amount
+
+    def add_erc20(self, contract, symbol, decimals, balances=None):
+        with self.lock:
+            self.erc20[contract.lower()] = {
+                "symbol": symbol,
+                "decimals": decimals,
+                "balances": {addr.lower(): amount for addr, amount in (balances or {}).items()},
+            }
+
+    def add_erc721(self, contract, symbol, owners=None, uri="ipfs://bafybeicollection/{}.json"):
+        with self.lock:
+            self.erc721[contract.lower()] = {
+                "symbol": symbol,
+                "owners": {nft_id: owner.lower() for nft_id, owner in (owners or {}).items()},
+                "uri": uri,
+            }
+
+    def token_balance(self, contract, address):
+        with self.lock:
+            return self.erc20[contract.lower()]["balances"].get(address.lower(), 0)
+
+    def is_contract(self, address):
+        return (
+            address in self.erc20 or address in self.erc721 or address == MULTICALL3_ADDRESS.lower()
+        )
+
+    def call(self, to_addr, data):
+        """eth_call : returns the result data bytes"""
+        selector = data[:4].hex()
+        args = data[4:]
+        if to_addr == MULTICALL3_ADDRESS.lower() and selector == AGGREGATE3_FUNCTION:
+            results = []
+            for target, allow_failure, calldata in decode_aggregate3_calls(args):
+                try:
+                    results.append((True, self.call(target, calldata)))
+                except RPCError:
+                    if not allow_failure:
+                        raise
+                    results.append((False, b""))
+            return encode_aggregate3_results(results)
+        if to_addr in self.erc20:
+            token = self.erc20[to_addr]
+            if selector == BALANCEOF_FUNCTION:
+                return uint256(token["balances"].get(address_arg(args, 0), 0))
+            if selector == DECIMALS_FUNCTION:
+                return uint256(token["decimals"])
+            if selector in (SYMBOL_FUNCTION, NAME_FUNCTION):
+                return abi_string(token["symbol"])
+        if to_addr in self.erc721:
+            collection = self.erc721[to_addr]
+            if selector == BALANCEOF_FUNCTION:
+                owner = address_arg(args, 0)
+                return uint256(list(collection["owners"].values()).count(owner))
+            if selector in (SYMBOL_FUNCTION, NAME_FUNCTION):
+                return abi_string(collection["symbol"])
+            if selector in (OWNEROF_FUNCTION, TOKENURI_FUNCTION):
+                nft_id = read_uint256(args, 0)
+                if nft_id not in collection["owners"]:
+                    raise reverted()
+                if selector == OWNEROF_FUNCTION:
+                    return bytes(12) + bytes.fromhex(collection["owners"][nft_id][2:])
+                return abi_string(collection["uri"].format(nft_id))
+            if selector == TOKENOFOWNER_FUNCTION:
+                owner = address_arg(args, 0)
+                owned = sorted(
+                    nft_id
+                    for nft_id, nft_owner in collection["owners"].items()
+                    if nft_owner == owner
+                )
+                index = read_uint256(args, 32)
+                if index >= len(owned):
+                    raise reverted()
+                return uint256(owned[index])
+        raise reverted()
+
+    def transition(self, sender, to_addr, value, data, apply):
+        """Check a tx call, and apply it to the state when apply. Returns the gas used."""
+        if value > self.balances.get(sender, 0):
+            raise RPCError(-32000, "insufficient funds for transfer")
+        if not data:
+            if self.is_contract(to_addr):
+                raise reverted()
+            if apply:
+                self.balances[sender] -= value
+                self.balances[to_addr] = self.balances.get(to_addr, 0) + value
+            return SIMPLE_TX_GAS
+        if value:
+            raise reverted()
+        selector = data[:4].hex()
+        args = data[4:]
+        if to_addr in self.erc20 and selector == TRANSFER_FUNCTION:
+            balances = self.erc20[to_addr]["balances"]
+            recipient = address_arg(args, 0)
+            amount = read_uint256(args, 32)
+            if amount > balances.get(sender, 0):
+                raise reverted()
+            if apply:
+                balances[sender] -= amount
+                balances[recipient] = balances.get(recipient, 0) + amount
+            return TOKEN_TRANSFER_GAS
+        if to_addr in self.erc721 and selector == SAFETRANSFER_FUNCTION:
+            owners = self.erc721[to_addr]["owners"]
+            nft_id = read_uint256(args, 64)
+            if address_arg(args, 0) != sender or owners.get(nft_id) != sender:
+                raise reverted()
+            if apply:
+                owners[nft_id] = address_arg(args, 32)
+            return NFT_TRANSFER_GAS
+        raise reverted()
+
+    def estimate_gas(self, tx_call):
+        with self.lock:
+            return self.transition(
+                tx_call.get("from", "0x" + "00" * 20).lower(),
+                tx_call.get("to", "").lower(),
+                quantity(tx_call.get("value")),
+                bytes.fromhex(tx_call.get("data", "0x")[2:]),
+                False,
+            )
+
+    def send_raw(self, tx_hex):
+        """Decode, check and apply a signed transaction. Returns its hash."""
+        tx_bin = bytes.fromhex(tx_hex[2:])
+        tx_type, fields = decode_tx(tx_bin)
+        if tx_type != 0 or len(fields) != 9:
+            raise RPCError(-32000, "only the legacy transactions are supported")
+        fields = [bytes(field) for field in fields]
+        nonce, gas_price, gas_limit, to_bin, value, data, v, r, s = fields
+        v = int.from_bytes(v, "big")
+        if v >= 35:
+            # EIP-155
+            tx_chain = (v - 35) // 2
+            parity = v - 2 * tx_chain
+            signing_fields = fields[:6] + [tx_chain, 0, 0]
+        else:
+            tx_chain = self.chain_id
+            parity = v
+            signing_fields = fields[:6]
+        if tx_chain != self.chain_id:
+            raise RPCError(-32000, "invalid chain id for signer")
+        tx_hash = int.from_bytes(sha3(rlp_encode(signing_fields)), "big")
+        try:
+            pubkey = public_key_recover(
+                tx_hash, int.from_bytes(r, "big"), int.from_bytes(s, "big"), parity
+            )
+        except Exception:
+            raise RPCError(-32000, "invalid signature") from None
+        sender = "0x" + sha3(pubkey[1:])[-20:].hex()
+        nonce = int.from_bytes(nonce, "big")
+        gas_price = int.from_bytes(gas_price, "big")
+        gas_limit = int.from_bytes(gas_limit, "big")
+        value = int.from_bytes(value, "big")
+        to_addr = "0x" + to_bin.hex()
+        with self.lock:
+            account_nonce = self.nonces.get(sender, 0)
+            if nonce < account_nonce:
+                raise RPCError(-32000, "nonce too low")
+            if nonce > account_nonce:
+                raise RPCError(-32000, "nonce too high")
+            if gas_price * gas_limit + value > self.balances.get(sender, 0):
+                raise RPCError(-32000, "insufficient funds for gas * price + value")
+            gas_used = self.transition(sender, to_addr, value, data, False)
+            if gas_used > gas_limit:
+                raise RPCError(-32000, "intrinsic gas too low")
+            self.transition(sender, to_addr, value, data, True)
+            self.balances[sender] -= gas_used * gas_price
+            self.nonces[sender] = nonce + 1
+            self.block += 1
+            tx_id = "0x" + sha3(tx_bin).hex()
+            self.receipts[tx_id] = {
+                "transactionHash": tx_id,
+                "blockNumber": hex(self.block),
+                "from": sender,
+                "to": to_addr,
+                "gasUsed": hex(gas_used),
+                "status": "0x1",
+            }
+        return tx_id
+
+    def rpc(self, method, params):
+        """Result of a JSON-RPC request, raises RPCError"""
+        with self.lock:
+            self.requests += 1
+        if method == "eth_chainId":
+            return hex(self.chain_id)
+        if method == "net_version":
+            return str(self.chain_id)
+        if method == "eth_blockNumber":
+            return hex(self.block)
+        if method == "eth_gasPrice":
+            return hex(self.gas_price)
+        if method == "eth_getBalance":
+            return hex(self.balances.get(params[0].lower(), 0))
+        if method == "eth_getTransactionCount":
+            return hex(self.nonces.get(params[0].lower(), 0))
+        if method == "eth_getCode":
+            return CONTRACT_CODE if self.is_contract(params[0].lower()) else "0x"
+        if method == "eth_call":
+            data = bytes.fromhex(params[0].get("data", "0x")[2:])
+            with self.lock:
+                return "0x" + self.call(params[0]["to"].lower(), data).hex()
+        if method == "eth_estimateGas":
+            return hex(self.estimate_gas(params[0]))
+        if method == "eth_sendRawTransaction":
+            return self.send_raw(params[0])
+        if method == "eth_getTransactionReceipt":
+            return self.receipts.get(params[0])
+        raise RPCError(-32601, f"the method {method} does not exist/is not available")
+
+    def answer(self, request):
+        """JSON-RPC response object of a request object"""
+        try:
+            result = self.rpc(request["method"], request.get("params", []))
+        except RPCError as exc:
+            error = {"code": exc.code, "message": exc.message}
+            return {"jsonrpc": "2.0", "id": request.get("id"), "error": error}
+        return {"jsonrpc": "2.0", "id": request.get("id"), "result": result}
+
+
+class NodeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # The headers and the body are written apart
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        state = self.server.state
+        try:
+            request = loads(self.rfile.read(int(self.headers["Content-Length"])))
+        except ValueError:
+            response = {
+                "jsonrpc": "2.0",
+                "id": None,
+                "error": {"code": -32700, "message": "parse error"},
+            }
+        else:
+            if isinstance(request, list):
+                response = [state.answer(req) for req in request]
+            else:
+                response = state.answer(request)
+        body = dumps(response).encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+class EVMNode:
+    """The stand-in node served on a local port, from a background thread.
+    To use as a context manager, or with start and stop.
+    """
+
+    def __init__(self, chain_id=1, gas_price=GAS_PRICE, port=0):
+        self.state = EVMState(chain_id, gas_price)
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", port), NodeHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.state = self.state
+        self.url = f"http://127.0.0.1:{self.httpd.server_address[1]}"
+
+    def start(self):
+        Thread(target=self.httpd.serve_forever, daemon=True).start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *args):
+        self.stop()
@@ -1,5 +1,16 @@
+import pytest
+
+from cryptolib.coins.ethereum import uint256
 from cryptolib.cryptography import sha3
-from wallets.typed_data_hash import encode_data, type_hash, hash_struct, typed_sign_hash
+from wallets.typed_data_hash import (
+    TypedDataSchema,
+    collect_sub_types,
+    encode_data,
+    encode_types,
+    hash_struct,
+    type_hash,
+    typed_sign_hash,
+)
 
 
 # Tests for EIP712 typed structured data hashing
@@ -327,3 +338,65 @@ def test_real_dapp():
         },
     }
     typed_sign_hash(data)
+
+
+ORDER_TYPES = {
+    "Order": [
+        {"name": "maker", "type": "address"},
+        {"name": "items", "type": "Item[]"},
+        {"name": "parent", "type": "Order[]"},
+        {"name": "salt", "type": "uint256"},
+    ],
+    "Item": [
+        {"name": "token", "type": "address"},
+        {"name": "amount", "type": "uint256"},
+        {"name": "fee", "type": "Fee"},
+    ],
+    "Fee": [{"name": "recipient", "type": "address"}, {"name": "bps", "type": "uint16"}],
+}
+
+
+def item(idx):
+    return {
+        "token": "0x" + f"{idx:040x}",
+        "amount": str(idx * 1000),
+        "fee": {"recipient": "0x" + "ab" * 20, "bps": idx % 500},
+    }
+
+
+def test_eip712_schema():
+    schema = TypedDataSchema(ORDER_TYPES)
+    # Same encodeType as the sub types collection, recursive type included
+    for name in ORDER_TYPES:
+        types_list = [name, *sorted(collect_sub_types(name, ORDER_TYPES))]
+        assert schema.type_hash(name) == sha3(encode_types(types_list, ORDER_TYPES).encode("utf8"))
+    assert schema.type_hash("Order") == sha3(
+        b"Order(address maker,Item[] items,Order[] parent,uint256 salt)"
+        b"Fee(address recipient,uint16 bps)"
+        b"Item(address token,uint256 amount,Fee fee)"
+    )
+    order = {"maker": "0x" + "11" * 20, "items": [item(1), item(2)], "parent": [], "salt": 7}
+    fee_hash = sha3(schema.type_hash("Fee") + uint256(int("ab" * 20, 16)) + uint256(1))
+    item_hash = sha3(schema.type_hash("Item") + uint256(1) + uint256(1000) + fee_hash)
+    assert schema.encode_value("Item[]", [item(1)]) == sha3(item_hash)
+    assert schema.hash_struct("Order", order) == hash_struct("Order", ORDER_TYPES, order)
+    with pytest.raises(ValueError):
+        schema.hash_struct("Unknown", {})
+    with pytest.raises(ValueError):
+        schema.encode_value("Item[]", item(1))
+
+
+def test_eip712_large_array(monkeypatch):
+    encoded_types = []
+
+    def count_encode_types(types_list, types_dict):
+        encoded_types.append(types_list[0])
+        return encode_types(types_list, types_dict)
+
+    monkeypatch.setattr("wallets.typed_data_hash.encode_types", count_encode_types)
+    schema = TypedDataSchema(ORDER_TYPES)
+    order = {"maker": "0x" + "11" * 20, "items": [item(idx) for idx in range(2000)], "salt": 1}
+    order["parent"] = [dict(order, parent=[])]
+    schema.hash_struct("Order", order)
+    # Each type hashed once
+    assert sorted(encoded_types) == ["Fee", "Item", "Order"]
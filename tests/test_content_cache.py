@@ -0,0 +1,57 @@
+import os
+
+from wallets.content_cache import RAW_CODEC, ContentCache, cache_key, decode_cid, ipfs_path
+
+
+def test_cache_keys():
+    cid = "QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbdG"
+    assert cache_key(f"ipfs://{cid}/1.png") == f"ipfs/{cid}/1.png"
+    assert cache_key(f"ipfs://ipfs/{cid}") == f"ipfs/{cid}"
+    assert cache_key(f"https://ipfs.io/ipfs/{cid}/1.png") == f"ipfs/{cid}/1.png"
+    assert cache_key("https://example.com/1.png") == "https://example.com/1.png"
+
+
+def test_ipfs_paths():
+    cid_v1 = "bafkreidgvpkjawlxz6sffxzwgooowe5yt7i6wsyg236mfoks77nywkptdq"
+    assert ipfs_path(f"ipfs://{cid_v1}") == cid_v1
+    assert decode_cid(cid_v1)[0] == RAW_CODEC
+    assert ipfs_path(f"https://dweb.link/ipfs/{cid_v1}?filename=a.png") == (
+        f"{cid_v1}?filename=a.png"
+    )
+    # Not a CID : an URL of its own site
+    assert ipfs_path("https://example.com/ipfs/collection/1.json") is None
+    assert ipfs_path("https://example.com/ipfs/QmYwAPJzv5CZsnA625s3Xf2nemtYgPpHdWEz79ojWnPbd0") is None
+    assert ipfs_path("ipfs://bafybeicollection/1.json") is None
+
+
+def test_cache_prune(tmp_path):
+    cache = ContentCache(str(tmp_path), max_size=1300)
+    for idx in range(3):
+        cache.put(f"key{idx}", bytes(400))
+        os.utime(cache.file_path(f"key{idx}"), (idx, idx))
+    # Used, the most recent
+    assert cache.get("key0") == bytes(400)
+    # Above the max size : the least recently used are removed
+    cache.put("key3", bytes(400))
+    assert cache.get("key1") is None
+    assert cache.get("key2") is None
+    assert cache.get("key0") == bytes(400)
+    assert cache.get("key3") == bytes(400)
+
+
+def test_cache_clear(tmp_path):
+    cache = ContentCache(str(tmp_path / "cache"))
+    # Nothing cached yet
+    cache.clear()
+    cache.put("key", b"data")
+    cache.clear()
+    assert cache.get("key") is None
+
+
+def test_cache_for_good(tmp_path):
+    cache = ContentCache(str(tmp_path))
+    for idx in range(3):
+        cache.put(f"ipfs/cid{idx}", bytes(400))
+    assert cache.get("ipfs/cid0") == bytes(400)
+    # Other instance, as a new session
+    assert ContentCache(str(tmp_path)).get("ipfs/cid2") == bytes(400)
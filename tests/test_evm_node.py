@@ -0,0 +1,97 @@
+import pytest
+
+from devices.SingleKey import SKdevice
+from wallets import fee_oracle, http_transport, nonce_manager, rpc_pool
+from wallets.ETHwallet import ETH_wallet
+from wallets.NFTwallet import NFTWallet
+from wallets.token_scanner import TokenScanner
+from tests.evm_node import EVMNode, GAS_PRICE, SIMPLE_TX_GAS, TOKEN_TRANSFER_GAS
+
+TOKEN = "0x" + "7e" * 20
+NFT = "0x" + "7f" * 20
+RECIPIENT = "0x" + "35" * 20
+
+
+def device(key_int):
+    sk_device = SKdevice()
+    sk_device.open_account_fromint(key_int)
+    sk_device.set_key_type("K1")
+    return sk_device
+
+
+@pytest.fixture
+def node(monkeypatch):
+    # Wallets registries of this test only
+    monkeypatch.setattr(rpc_pool, "chain_endpoints", {})
+    monkeypatch.setattr(rpc_pool, "endpoint_pools", {})
+    monkeypatch.setattr(nonce_manager, "nonce_managers", {})
+    monkeypatch.setattr(fee_oracle, "fee_oracles", {})
+    with EVMNode(chain_id=1) as evm_node:
+        rpc_pool.set_chain_endpoints(1, [evm_node.url])
+        yield evm_node
+    http_transport.close_all()
+
+
+def test_native_transfers(node):
+    wallet = ETH_wallet(0, 0, device(0x1234))
+    sender = f"0x{wallet.eth.address}"
+    node.state.fund(sender, 10**18)
+    assert wallet.get_balance() == "1 ETH"
+    for _ in range(5):
+        assert "DONE, txID : 0x" in wallet.transfer("0.01", RECIPIENT, 1)
+    assert node.state.nonces[sender.lower()] == 5
+    assert node.state.balances[RECIPIENT] == 5 * 10**16
+    fees = 5 * SIMPLE_TX_GAS * int(GAS_PRICE * fee_oracle.GASPRICE_FACTORS[1])
+    assert node.state.balances[sender.lower()] == 10**18 - 5 * 10**16 - fees
+    # Not enough funds
+    with pytest.raises(Exception):
+        wallet.transfer("2", RECIPIENT, 1)
+    # The nonce released is used by the next tx
+    wallet.transfer("0.01", RECIPIENT, 1)
+    assert node.state.nonces[sender.lower()] == 6
+
+
+def test_token_transfers(node):
+    sender = f"0x{ETH_wallet(0, 0, device(0x5678)).eth.address}"
+    node.state.add_erc20(TOKEN, "TST", 6, {sender: 10**9})
+    wallet = ETH_wallet(0, 1, device(0x5678), contract_addr=TOKEN[2:])
+    node.state.fund(sender, 10**17)
+    assert wallet.coin == "TST"
+    assert wallet.get_balance() == "1000 TST"
+    wallet.transfer("2.5", RECIPIENT, 0)
+    assert node.state.token_balance(TOKEN, RECIPIENT) == 2500000
+    receipt = node.state.rpc("eth_getTransactionReceipt", [next(iter(node.state.receipts))])
+    assert int(receipt["gasUsed"], 16) == TOKEN_TRANSFER_GAS
+    # The tokens scan through Multicall3
+    owned = TokenScanner(lambda: wallet.eth.api).scan(wallet.eth.address, {"TST": TOKEN})
+    assert owned[0]["balance"] == 10**9 - 2500000
+
+
+def test_nft_and_dapp_tx(node):
+    wallet = ETH_wallet(0, 0, device(0x9ABC), confirm_callback=lambda _: True)
+    sender = f"0x{wallet.eth.address}"
+    node.state.fund(sender, 10**17)
+    node.state.add_erc721(NFT, "NFTST", {7: sender})
+    nft_wallet = ETH_wallet(0, 3, device(0x9ABC), contract_addr=NFT[2:])
+    nft_wallet.transfer_nft(7, RECIPIENT)
+    assert node.state.erc721[NFT]["owners"][7] == RECIPIENT
+    # Transaction requested by a dapp, as with WalletConnect
+    tx_signed = wallet.process_signtransaction({"to": RECIPIENT, "value": hex(10**15)})
+    wallet.broadcast_tx(tx_signed)
+    assert node.state.balances[RECIPIENT] == 10**15
+    assert node.state.nonces[sender.lower()] == 2
+
+
+def test_nft_aggregated_reads(node):
+    sender = f"0x{ETH_wallet(0, 0, device(0x9ABC)).eth.address}"
+    node.state.add_erc721(NFT, "NFTST", {nft_id: sender for nft_id in range(100, 400)})
+    nft_wallet = NFTWallet(ETH_wallet(0, 3, device(0x9ABC), contract_addr=NFT[2:]))
+    requests_start = node.state.requests
+    ids = nft_wallet.get_tokens_list(nft_wallet.get_balance())
+    assert ids == list(range(100, 400))
+    uris = nft_wallet.get_tokens_uri(ids + [1])
+    assert uris[:2] == ["ipfs://bafybeicollection/100.json", "ipfs://bafybeicollection/101.json"]
+    # Not owned
+    assert uris[-1] is None
+    # Balance, walletOfOwner, then a few aggregate3 : instead of 2 calls per NFT
+    assert node.state.requests - requests_start <= 10
@@ -0,0 +1,139 @@
+from time import monotonic
+
+import pytest
+from pyweb3.json_rpc import JSONRPCexception
+
+from cryptolib.coins.ethereum import rlp_decode
+from wallets.ETHwallet import ETHwalletCore
+from wallets.evm_rpc import batch_results
+from wallets.rpc_pool import EndpointPool, PooledEVMclient, RPCEndpoint
+
+TST_PUBKEY = bytes.fromhex(
+    "04"
+    "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
+)
+TST_CONTRACT = "0xdac17f958d2ee523a2206206994597c13d831ec7"
+
+# symbol() = "TST"
+SYMBOL_RESULT = (
+    "0x0000000000000000000000000000000000000000000000000000000000000020"
+    "0000000000000000000000000000000000000000000000000000000000000003"
+    "5453540000000000000000000000000000000000000000000000000000000000"
+)
+
+
+def rpc_node(request):
+    """Answers a JSON-RPC request object"""
+    method = request["method"]
+    if method == "eth_getBalance":
+        result = hex(10**18)
+    elif method == "eth_getTransactionCount":
+        result = "0x2a"
+    elif method == "eth_gasPrice":
+        result = hex(20 * 10**9)
+    elif method == "eth_call":
+        function = request["params"][0]["data"][2:10]
+        result = {
+            "313ce567": "0x" + f"{6:064x}",
+            "95d89b41": SYMBOL_RESULT,
+            "70a08231": "0x" + f"{5 * 10**6:064x}",
+        }.get(function)
+        if result is None:
+            return {
+                "jsonrpc": "2.0",
+                "id": request["id"],
+                "error": {"code": 3, "message": "revert"},
+            }
+    return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+
+class FakeEndpoint(RPCEndpoint):
+    """RPC endpoint answering with rpc_node, the payloads sent are recorded"""
+
+    def __init__(self, batch_support=True):
+        super().__init__("https://rpc.localhost")
+        self.batch_support = batch_support
+        self.sent = []
+
+    def post(self, payload, timeout):
+        self.sent.append(payload)
+        if isinstance(payload, list):
+            if self.batch_support:
+                # Any order is allowed
+                return [rpc_node(req) for req in reversed(payload)]
+            return {"jsonrpc": "2.0", "id": None, "error": {"code": -32600}}
+        return rpc_node(payload)
+
+
+def fake_client(batch_support=True):
+    endpoint = FakeEndpoint(batch_support)
+    pool = EndpointPool([])
+    pool.endpoints = [endpoint]
+    # Not probed
+    pool.probe_time = monotonic() + 3600
+    return PooledEVMclient(pool), endpoint
+
+
+def test_batch_results():
+    requests = [{"id": 1}, {"id": 2}]
+    assert batch_results(requests, [{"id": 2, "result": "b"}, {"id": 1, "result": "a"}]) == [
+        "a",
+        "b",
+    ]
+    with pytest.raises(Exception, match="mismatch"):
+        batch_results(requests, [{"id": 1, "result": "a"}])
+    with pytest.raises(JSONRPCexception):
+        batch_results(requests, [{"id": 1, "result": "a"}, {"id": 2, "error": {"code": 3}}])
+
+
+def test_batch_results_order():
+    client, endpoint = fake_client()
+    batch = client.batch()
+    assert batch.get_gasprice() == 0
+    assert batch.get_tx_num("00" * 20, "pending") == 1
+    assert batch.get_balance("0x" + "00" * 20) == 2
+    assert batch.execute() == [20 * 10**9, 42, 10**18]
+    assert len(endpoint.sent) == 1
+
+
+def test_batch_not_supported():
+    client, endpoint = fake_client(batch_support=False)
+    batch = client.batch()
+    batch.get_gasprice()
+    batch.get_balance("0x" + "00" * 20)
+    assert batch.execute() == [20 * 10**9, 10**18]
+    # Batch, then one by one
+    assert len(endpoint.sent) == 3
+
+
+def test_batch_error():
+    client, _ = fake_client()
+    batch = client.batch()
+    batch.get_gasprice()
+    batch.call(TST_CONTRACT, "12345678")
+    with pytest.raises(JSONRPCexception):
+        batch.execute()
+
+
+def test_token_core_batches():
+    client, endpoint = fake_client()
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", client, 1, TST_CONTRACT)
+    assert core.decimals == 6
+    assert core.token_symbol == "TST"
+    assert len(endpoint.sent) == 1
+    tx_state = core.read_tx_state(True)
+    assert tx_state == {
+        "balance": 10**18,
+        "nonce": 42,
+        "token_balance": 5 * 10**6,
+        "gasprice": 20 * 10**9,
+    }
+    signing_tx, _ = core.prepare("11" * 20, 10**6, 20 * 10**9, 180000, tx_state=tx_state)
+    assert len(endpoint.sent) == 2
+    tx_fields = rlp_decode(signing_tx)
+    assert int.from_bytes(tx_fields[0], "big") == 42
+    assert bytes(tx_fields[3]).hex() == TST_CONTRACT[2:]
+    # Without tx_state : one batch
+    core.prepare("11" * 20, 10**6, 20 * 10**9, 180000)
+    assert len(endpoint.sent) == 3
@@ -0,0 +1,115 @@
+from time import sleep
+
+import pytest
+from pyweb3.json_rpc import JSONRPCexception
+
+from wallets.evm_rpc import RPCBatch
+from wallets.fee_oracle import FEE_HISTORY_RECHECK, FeeOracle, compute_fees
+
+
+GWEI = 10**9
+
+FEE_HISTORY = {
+    "oldestBlock": "0x10",
+    "baseFeePerGas": [hex(9 * GWEI), hex(10 * GWEI), hex(12 * GWEI), hex(16 * GWEI)],
+    "gasUsedRatio": [0.9, 0.95, 0.99],
+    "reward": [
+        [hex(1 * GWEI), hex(2 * GWEI), hex(5 * GWEI)],
+        [hex(1 * GWEI), hex(3 * GWEI), hex(4 * GWEI)],
+        [hex(2 * GWEI), hex(2 * GWEI), hex(6 * GWEI)],
+    ],
+}
+
+
+class FakeClient:
+    """EVMclient answering the gas price and the fee history, counts the requests"""
+
+    requests = 0
+
+    def __init__(self, fee_history=FEE_HISTORY, error=None):
+        self.fee_history = fee_history
+        self.error = error
+
+    def batch(self):
+        return RPCBatch(self)
+
+    def request_batch(self, calls):
+        FakeClient.requests += 1
+        if self.error is not None:
+            raise JSONRPCexception(self.error)
+        return [hex(20 * GWEI), self.fee_history]
+
+    def get_gasprice(self):
+        FakeClient.requests += 1
+        return 20 * GWEI
+
+
+def test_compute_fees():
+    assert compute_fees(20 * GWEI, FEE_HISTORY) == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    # No base fee
+    assert compute_fees(20 * GWEI, {"baseFeePerGas": ["0x0", "0x0"], "reward": [["0x1"] * 3]}) == [
+        18 * GWEI,
+        22 * GWEI,
+        32 * GWEI,
+    ]
+    assert compute_fees(20 * GWEI) == [18 * GWEI, 22 * GWEI, 32 * GWEI]
+    # Fast never below normal
+    history = {"baseFeePerGas": [hex(GWEI)], "reward": [[hex(GWEI), hex(8 * GWEI), "0x0"]]}
+    fees = compute_fees(GWEI, history)
+    assert fees[2] == fees[1]
+
+
+def test_cached_fees():
+    FakeClient.requests = 0
+    oracle = FeeOracle(FakeClient, ttl=60)
+    assert [oracle.get_gasprice(prio) for prio in range(3)] == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    assert FakeClient.requests == 1
+    with pytest.raises(Exception):
+        oracle.get_gasprice(3)
+    # Expired
+    oracle.read_time -= 61
+    oracle.get_fees()
+    assert FakeClient.requests == 2
+
+
+def test_refresh_ahead():
+    FakeClient.requests = 0
+    oracle = FeeOracle(FakeClient, ttl=60)
+    oracle.get_fees()
+    oracle.read_time -= 45
+    # Previous fees, refreshed in the background
+    assert oracle.get_fees() == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    for _ in range(100):
+        if not oracle.refreshing:
+            break
+        sleep(0.01)
+    assert FakeClient.requests == 2
+    assert oracle.get_fees() == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    assert FakeClient.requests == 2
+
+
+def test_no_fee_history():
+    FakeClient.requests = 0
+    client = FakeClient(error={"code": -32601, "message": "Method not found"})
+    oracle = FeeOracle(lambda: client, ttl=0)
+    assert oracle.get_fees() == [18 * GWEI, 22 * GWEI, 32 * GWEI]
+    assert FakeClient.requests == 2
+    # Not requested anymore
+    oracle.get_fees()
+    assert FakeClient.requests == 3
+    # Until checked again
+    client.error = None
+    oracle.no_fee_history_time -= FEE_HISTORY_RECHECK + 1
+    assert oracle.get_fees() == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    assert oracle.no_fee_history_time is None
+
+
+def test_fee_history_error():
+    FakeClient.requests = 0
+    client = FakeClient(error={"code": -32005, "message": "Rate limit exceeded"})
+    oracle = FeeOracle(lambda: client, ttl=0)
+    # Gas price for this reading only
+    assert oracle.get_fees() == [18 * GWEI, 22 * GWEI, 32 * GWEI]
+    client.error = None
+    assert oracle.get_fees() == [17 * GWEI, 20 * GWEI, 25 * GWEI]
+    assert FakeClient.requests == 3
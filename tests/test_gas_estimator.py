@@ -0,0 +1,116 @@
+from pyweb3.json_rpc import JSONRPCexception
+
+from wallets.ETHwallet import ETHwalletCore
+from wallets.evm_rpc import RPCBatch
+from wallets.gas_estimator import GasEstimator, gas_limit, GAS_MARGIN, STORAGE_GAS
+
+
+TST_PUBKEY = bytes.fromhex(
+    "04"
+    "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
+)
+TOKEN = "0x" + "cc" * 20
+ACCOUNTS = ["aa" * 20, "ab" * 20]
+CONTRACT = "dd" * 20
+
+
+class FakeAPI:
+    """Batches answering the tx state and the gas estimation, the requests are recorded"""
+
+    def __init__(self, estimate=52000, revert=False):
+        self.estimate = estimate
+        self.revert = revert
+        self.requests = []
+
+    def batch(self):
+        return RPCBatch(self)
+
+    def request_batch(self, calls):
+        self.requests.append([method for method, _ in calls])
+        results = []
+        for method, params in calls:
+            if method == "eth_estimateGas":
+                if self.revert:
+                    raise JSONRPCexception({"code": 3, "message": "execution reverted"})
+                results.append(hex(self.estimate))
+            elif method == "eth_getCode":
+                results.append("0x6080" if params[0] == f"0x{CONTRACT}" else "0x")
+            elif method == "eth_call":
+                results.append("0x" + f"{10**20:064x}")
+            else:
+                results.append(
+                    {"eth_getBalance": hex(10**18), "eth_getTransactionCount": "0x5"}[method]
+                )
+        return results
+
+
+def test_gas_limit():
+    assert gas_limit(21000, False) == 21000
+    assert gas_limit(400000, False) == int(400000 * GAS_MARGIN)
+    assert gas_limit(52000, True) == int(52000 * GAS_MARGIN) + STORAGE_GAS
+
+
+def test_shape_cache():
+    estimator = GasEstimator()
+    shape = estimator.shape(TOKEN, bytes.fromhex("a9059cbb" + "00" * 64), False)
+    assert shape == (TOKEN, "a9059cbb", False)
+    # Native transfers to accounts have the same shape
+    assert estimator.shape("0x" + ACCOUNTS[0], b"", False) == ("", "", False)
+    assert estimator.get(shape) is None
+    estimator.update(shape, 40000)
+    estimator.update(shape, 35000)
+    assert estimator.get(shape) == 40000
+    estimator.ttl = -1
+    assert estimator.get(shape) is None
+
+
+def test_core_estimation():
+    api = FakeAPI()
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 1, contract=TOKEN, metadata=None)
+    core.gas_estimator = GasEstimator()
+    api.requests.clear()
+    tx_state = core.read_tx_state(gas_for=(ACCOUNTS[0], 1000, b""))
+    # Read in the same batch as the balances and the nonce
+    assert api.requests == [
+        [
+            "eth_getBalance",
+            "eth_getTransactionCount",
+            "eth_call",
+            "eth_getCode",
+            "eth_estimateGas",
+        ]
+    ]
+    assert tx_state["gas_limit"] == gas_limit(52000, True)
+    assert tx_state["token_balance"] == 10**20
+    # Same shape for another account : not estimated again
+    tx_state = core.read_tx_state(gas_for=(ACCOUNTS[1], 1000, b""))
+    assert api.requests[1] == [
+        "eth_getBalance",
+        "eth_getTransactionCount",
+        "eth_call",
+        "eth_getCode",
+    ]
+    tx_state = core.read_tx_state(gas_for=(ACCOUNTS[1], 1000, b""))
+    assert api.requests[2] == ["eth_getBalance", "eth_getTransactionCount", "eth_call"]
+    assert tx_state["gas_limit"] == gas_limit(52000, True)
+    # A contract recipient is another shape
+    api.estimate = 90000
+    tx_state = core.read_tx_state(gas_for=(CONTRACT, 1000, b""))
+    # Estimated after reading the recipient code
+    assert api.requests[3][-1] == "eth_getCode"
+    assert api.requests[4] == ["eth_estimateGas"]
+    assert tx_state["gas_limit"] == gas_limit(90000, True)
+    # The tx fits with the estimated limit
+    core.prepare(ACCOUNTS[0], 1000, 10**9, tx_state["gas_limit"], tx_state=tx_state)
+
+
+def test_estimation_failure():
+    api = FakeAPI(revert=True)
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 1)
+    core.gas_estimator = GasEstimator()
+    tx_state = core.read_tx_state(gas_for=(ACCOUNTS[0], 10, b""))
+    # Read again without the estimation, the wallet uses its default limit
+    assert api.requests[-1] == ["eth_getBalance", "eth_getTransactionCount"]
+    assert "gas_limit" not in tx_state
+    assert tx_state["balance"] == 10**18
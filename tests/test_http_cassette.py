@@ -0,0 +1,149 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+from time import perf_counter
+
+import pytest
+
+from devices.SingleKey import SKdevice
+from wallets import fee_oracle, gas_estimator, http_transport, nonce_manager, rpc_pool
+from wallets.ETHwallet import ETH_wallet
+from wallets.http_cassette import Cassette, CassetteMiss, RECORD, REPLAY
+from wallets.http_transport import HTTPError, request
+from tests.evm_node import EVMNode
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Answers a new count at each request"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def reply(self, status, body):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.count += 1
+        if self.path == "/missing":
+            return self.reply(404, b"Not found")
+        if self.path == "/image":
+            return self.reply(200, bytes(range(256)))
+        return self.reply(200, f"count {self.server.count}".encode("utf8"))
+
+    def do_POST(self):
+        rpc_request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.count += 1
+        result = {"jsonrpc": "2.0", "id": rpc_request["id"], "result": hex(self.server.count)}
+        self.reply(200, json.dumps(result).encode("utf8"))
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.count = 0
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    http_transport.close_all()
+
+
+@pytest.fixture
+def use_cassette():
+    def set_cassette(*args, **kwargs):
+        cassette = Cassette(*args, **kwargs)
+        http_transport.set_transport_hook(cassette)
+        return cassette
+
+    yield set_cassette
+    http_transport.set_transport_hook(None)
+
+
+def rpc(url, req_id):
+    data = json.dumps({"jsonrpc": "2.0", "id": req_id, "method": "eth_blockNumber", "params": []})
+    return json.loads(request(url, data.encode("utf8")))
+
+
+def test_record_replay(server, use_cassette, tmp_path):
+    cassette_path = str(tmp_path / "test.cassette")
+    cassette = use_cassette(cassette_path, RECORD)
+    assert request(f"{server}/data") == b"count 1"
+    assert request(f"{server}/data") == b"count 2"
+    assert request(f"{server}/image") == bytes(range(256))
+    with pytest.raises(HTTPError):
+        request(f"{server}/missing")
+    assert rpc(server, 1) == {"jsonrpc": "2.0", "id": 1, "result": "0x5"}
+    cassette.close()
+
+    use_cassette(cassette_path, REPLAY)
+    # Same responses, in the same order, then the last one
+    assert request(f"{server}/data") == b"count 1"
+    assert request(f"{server}/data") == b"count 2"
+    assert request(f"{server}/data") == b"count 2"
+    assert request(f"{server}/image") == bytes(range(256))
+    with pytest.raises(HTTPError) as exc_info:
+        request(f"{server}/missing")
+    assert exc_info.value.code == 404
+    # The JSON-RPC id of the request
+    assert rpc(server, 42) == {"jsonrpc": "2.0", "id": 42, "result": "0x5"}
+    with pytest.raises(CassetteMiss):
+        request(f"{server}/other")
+
+
+def test_replay_latency(server, use_cassette, tmp_path):
+    cassette_path = str(tmp_path / "test.cassette")
+    use_cassette(cassette_path, RECORD)
+    request(f"{server}/data")
+    # Not closed : the recording is flushed
+    use_cassette(cassette_path, REPLAY, latency=0.1)
+    start = perf_counter()
+    assert request(f"{server}/data") == b"count 1"
+    assert perf_counter() - start >= 0.1
+
+
+def test_record_again(server, use_cassette, tmp_path):
+    cassette_path = str(tmp_path / "test.cassette")
+    use_cassette(cassette_path, RECORD).close()
+    with pytest.raises(FileExistsError):
+        Cassette(cassette_path, RECORD)
+    # The new recording replaces the previous one
+    cassette = use_cassette(cassette_path, RECORD, overwrite=True)
+    request(f"{server}/data")
+    cassette.close()
+    use_cassette(cassette_path, REPLAY)
+    assert request(f"{server}/data") == b"count 1"
+    use_cassette(cassette_path, RECORD, overwrite=True).close()
+    use_cassette(cassette_path, REPLAY)
+    with pytest.raises(CassetteMiss):
+        request(f"{server}/data")
+
+
+def test_wallet_flow(use_cassette, tmp_path, monkeypatch):
+    cassette_path = str(tmp_path / "eth.cassette")
+    device = SKdevice()
+    device.open_account_fromint(0x1234)
+    device.set_key_type("K1")
+
+    def wallet_flow():
+        # Registries of this flow only
+        monkeypatch.setattr(rpc_pool, "endpoint_pools", {})
+        monkeypatch.setattr(nonce_manager, "nonce_managers", {})
+        monkeypatch.setattr(fee_oracle, "fee_oracles", {})
+        monkeypatch.setattr(gas_estimator, "gas_estimators", {})
+        wallet = ETH_wallet(0, 0, device)
+        return wallet.get_balance(), wallet.transfer("0.1", "0x" + "35" * 20, 1)
+
+    with EVMNode(1) as node:
+        monkeypatch.setattr(rpc_pool, "chain_endpoints", {1: [node.url]})
+        node.state.fund(f"0x{ETH_wallet(0, 0, device).eth.address}", 10**18)
+        cassette = use_cassette(cassette_path, RECORD)
+        recorded = wallet_flow()
+        cassette.close()
+    http_transport.close_all()
+    # The node is stopped, the tx signature is new
+    use_cassette(cassette_path, REPLAY)
+    assert wallet_flow() == recorded
@@ -0,0 +1,109 @@
+import gzip
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from wallets import http_transport
+from wallets.http_transport import ConnectError, HTTPError, request
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Test server, keep-alive, counts the connections and the requests"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def reply(self, status, body, headers=None):
+        self.send_response(status)
+        for header, value in (headers or {}).items():
+            self.send_header(header, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path == "/gzip":
+            if "gzip" not in self.headers.get("Accept-Encoding", ""):
+                return self.reply(406, b"")
+            return self.reply(200, gzip.compress(b'{"gz": 1}'), {"Content-Encoding": "gzip"})
+        if self.path == "/busy":
+            if self.server.requests.count("/busy") < 3:
+                return self.reply(503, b"Busy")
+            return self.reply(200, b"ok")
+        if self.path == "/moved":
+            return self.reply(302, b"", {"Location": "/data"})
+        if self.path == "/missing":
+            return self.reply(404, b"Not found")
+        if self.path == "/drop":
+            self.close_connection = True
+        return self.reply(200, b'{"data": 1}')
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append(self.path)
+        if self.path == "/busy":
+            return self.reply(503, b"Busy")
+        return self.reply(200, body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.connections = 0
+    httpd.requests = []
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd, f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    http_transport.close_all()
+
+
+def test_keep_alive(server):
+    httpd, url = server
+    for _ in range(10):
+        assert request(f"{url}/data") == b'{"data": 1}'
+    assert request(f"{url}/post", data=b"payload") == b"payload"
+    # One connection for all the requests
+    assert httpd.connections == 1
+    assert len(httpd.requests) == 11
+
+
+def test_gzip_redirect(server):
+    _, url = server
+    assert request(f"{url}/gzip") == b'{"gz": 1}'
+    assert request(f"{url}/moved") == b'{"data": 1}'
+
+
+def test_errors(server, monkeypatch):
+    httpd, url = server
+    monkeypatch.setattr(http_transport, "RETRY_DELAY", 0.01)
+    # GET retried
+    assert request(f"{url}/busy") == b"ok"
+    with pytest.raises(HTTPError) as exc_info:
+        request(f"{url}/missing")
+    assert exc_info.value.code == 404
+    assert str(exc_info.value) == "404  :  Not found"
+    # POST not retried
+    httpd.requests.clear()
+    with pytest.raises(HTTPError):
+        request(f"{url}/busy", data=b"tx")
+    assert httpd.requests == ["/busy"]
+    # Host not reached : the request was not sent
+    with pytest.raises(ConnectError):
+        request("http://127.0.0.1:1/data", data=b"tx")
+
+
+def test_server_closed(server):
+    httpd, url = server
+    # The server closes the connection after its response, as an idle timeout
+    request(f"{url}/drop")
+    assert request(f"{url}/post", data=b"again") == b"again"
+    assert httpd.connections == 2
+    assert httpd.requests == ["/drop", "/post"]
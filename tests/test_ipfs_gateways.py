@@ -0,0 +1,141 @@
+from base64 import b32encode
+from hashlib import sha256
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+from threading import Thread
+from time import perf_counter, sleep
+
+import pytest
+
+from wallets import http_transport, ipfs_gateways
+from wallets.content_cache import ContentCache
+from wallets.ipfs_gateways import GatewayPool
+from wallets.NFTwallet import get_data
+
+CID = "bafybeigdyrzt5sfp7udm7hu76uh7y26nf3efuylqabf3oclgtqy55fbzdi"
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Gateway answering after its delay, or 404 when it doesn't have the content.
+    Its body replaces the content when set, as an error page.
+    """
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        sleep(self.server.delay)
+        status, body = 200, f"{self.server.name} {self.path}".encode("utf8")
+        body = self.server.contents.get(self.path, self.server.body or body)
+        if self.server.missing:
+            status, body = 404, b"Not found"
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def gateways():
+    servers = {}
+    for name, delay, missing, body in (
+        ("slow", 1.5, False, None),
+        ("fast", 0, False, None),
+        ("empty", 0, True, None),
+        ("html", 0, False, b"<!DOCTYPE html><html><body>Rate limited</body></html>"),
+    ):
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        httpd.name = name
+        httpd.delay = delay
+        httpd.missing = missing
+        httpd.body = body
+        httpd.contents = {}
+        httpd.requests = []
+        httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}/ipfs/"
+        Thread(target=httpd.serve_forever, daemon=True).start()
+        servers[name] = httpd
+    yield servers
+    for httpd in servers.values():
+        httpd.shutdown()
+    http_transport.close_all()
+
+
+def closed_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}/ipfs/"
+
+
+def test_hedged_read(gateways, monkeypatch):
+    monkeypatch.setattr(ipfs_gateways, "HEDGE_DEFAULT_DELAY", 0.2)
+    pool = GatewayPool([gateways["slow"].url, gateways["fast"].url])
+    start = perf_counter()
+    # The slow gateway is hedged
+    assert pool.read(f"{CID}/1.json") == f"fast /ipfs/{CID}/1.json".encode("utf8")
+    assert perf_counter() - start < 1
+    assert gateways["slow"].requests == [f"/ipfs/{CID}/1.json"]
+    # Now measured, the fast gateway is asked first
+    sleep(1.5)
+    assert [gateway.url for gateway in pool.ranked()] == [
+        gateways["fast"].url,
+        gateways["slow"].url,
+    ]
+    pool.read(f"{CID}/2.json")
+    assert len(gateways["slow"].requests) == 1
+
+
+def test_failing_gateways(gateways, monkeypatch):
+    monkeypatch.setattr(ipfs_gateways, "HEDGE_DEFAULT_DELAY", 5)
+    down_url = closed_url()
+    pool = GatewayPool([down_url, gateways["empty"].url, gateways["fast"].url])
+    # Failures go to the next gateway at once
+    start = perf_counter()
+    assert pool.read(CID) == f"fast /ipfs/{CID}".encode("utf8")
+    assert perf_counter() - start < 1
+    # The unreachable gateway is set aside, not the one without the content
+    assert pool.ranked()[-1].url == down_url
+    assert pool.ranked()[0].url != down_url
+    pool = GatewayPool([down_url, gateways["empty"].url])
+    with pytest.raises(IOError, match="not available"):
+        pool.read(CID)
+
+
+def test_content_check(gateways, monkeypatch):
+    monkeypatch.setattr(ipfs_gateways, "HEDGE_DEFAULT_DELAY", 5)
+    pool = GatewayPool([gateways["html"].url, gateways["fast"].url])
+    # An error page is not the content
+    assert pool.read(f"{CID}/1.json") == f"fast /ipfs/{CID}/1.json".encode("utf8")
+    assert pool.ranked()[-1].url == gateways["html"].url
+    # A raw CID is read as its block, and checked with its digest
+    content = b"<html>raw content</html>"
+    cid_bin = bytes([1, 0x55, 0x12, 32]) + sha256(content).digest()
+    raw_cid = "b" + b32encode(cid_bin).decode().lower().rstrip("=")
+    gateways["fast"].contents[f"/ipfs/{raw_cid}?format=raw"] = content
+    gateways["html"].body = b"<html>other content</html>"
+    pool = GatewayPool([gateways["html"].url, gateways["fast"].url])
+    assert pool.read(raw_cid) == content
+    assert gateways["html"].requests[-1] == f"/ipfs/{raw_cid}?format=raw"
+
+
+def test_ipfs_cache(gateways, monkeypatch, tmp_path):
+    monkeypatch.setattr(ipfs_gateways, "gateway_pool", GatewayPool([gateways["fast"].url]))
+    monkeypatch.setattr(ipfs_gateways, "ipfs_cache", ContentCache(str(tmp_path)))
+    # Any form of IPFS URL, the same content
+    assert get_data(f"ipfs://{CID}/1.json").read() == f"fast /ipfs/{CID}/1.json".encode("utf8")
+    assert get_data(f"https://ipfs.io/ipfs/{CID}/1.json").read().startswith(b"fast")
+    assert get_data(f"ipfs://ipfs/{CID}/1.json").read().startswith(b"fast")
+    assert len(gateways["fast"].requests) == 1
+
+
+def test_url_fallback(gateways, monkeypatch, tmp_path):
+    monkeypatch.setattr(ipfs_gateways, "gateway_pool", GatewayPool([gateways["empty"].url]))
+    monkeypatch.setattr(ipfs_gateways, "ipfs_cache", ContentCache(str(tmp_path)))
+    # The gateways don't have the content : read from the URL gateway
+    url = f"{gateways['fast'].url}{CID}/1.json"
+    assert get_data(url).read() == f"fast /ipfs/{CID}/1.json".encode("utf8")
+    with pytest.raises(IOError):
+        get_data(f"ipfs://{CID}/1.json")
@@ -0,0 +1,92 @@
+from time import sleep, perf_counter
+
+import pytest
+
+from wallets import name_service
+from wallets.name_service import ResolutionCache, race, resolve, resolveENS
+
+
+# Resolutions without the network
+
+
+class FakeWeb3Client:
+    """ENS registry and resolver, the calls are recorded"""
+
+    calls = []
+
+    def __init__(self, url, user_agent):
+        self.url = url
+
+    def call(self, contract, method, data):
+        FakeWeb3Client.calls.append(method)
+        if method == "0178b8bf":
+            # resolver(bytes32)
+            return "0x" + "00" * 12 + "11" * 20
+        # addr(bytes32)
+        return "0x" + "00" * 12 + "22" * 20
+
+
+def test_resolution_cache():
+    cache = ResolutionCache(ttl=60, negative_ttl=0.1)
+    assert cache.lookup("a.eth") == (False, None)
+    cache.set("a.eth", "0x1234")
+    cache.set("b.eth", None)
+    assert cache.lookup("a.eth") == (True, "0x1234")
+    assert cache.lookup("b.eth") == (True, None)
+    sleep(0.15)
+    assert cache.lookup("a.eth") == (True, "0x1234")
+    assert cache.lookup("b.eth") == (False, None)
+
+
+def test_resolve_cached(monkeypatch):
+    monkeypatch.setattr(name_service, "resolutions", ResolutionCache())
+    resolved = []
+
+    def resolve_name(domain, crypto, is_token=False, chain="XXX"):
+        resolved.append(domain)
+        return "0x" + "33" * 20 if domain == "known.crypto" else None
+
+    monkeypatch.setattr(name_service, "resolve_name", resolve_name)
+    for _ in range(3):
+        assert resolve("known.crypto", "ETH") == "0x" + "33" * 20
+        assert resolve("unknown.crypto", "ETH") is None
+    # Not a domain of a service
+    assert resolve("example.com", "ETH") is None
+    assert resolved == ["known.crypto", "unknown.crypto"]
+    start = perf_counter()
+    resolve("known.crypto", "ETH")
+    assert perf_counter() - start < 0.001
+
+
+def test_race():
+    def answer(value, delay=0):
+        def resolver():
+            sleep(delay)
+            return value
+
+        return resolver
+
+    def fail():
+        raise IOError("No connection")
+
+    # The first resolver has the priority
+    assert race(answer("first", 0.1), answer("second")) == "first"
+    assert race(answer(None), answer("second")) == "second"
+    assert race(fail, answer("second")) == "second"
+    assert race(answer(None), answer(None)) is None
+    with pytest.raises(IOError):
+        race(fail, answer(None))
+    # In parallel
+    start = perf_counter()
+    race(answer(None, 0.2), answer("second", 0.2))
+    assert perf_counter() - start < 0.35
+
+
+def test_ens_resolver_memo(monkeypatch):
+    monkeypatch.setattr(name_service, "Web3Client", FakeWeb3Client)
+    monkeypatch.setattr(name_service, "ens_resolvers", ResolutionCache())
+    FakeWeb3Client.calls = []
+    assert resolveENS("test.eth") == "0x" + "22" * 20
+    assert resolveENS("test.eth") == "0x" + "22" * 20
+    # The resolver is read once
+    assert FakeWeb3Client.calls == ["0178b8bf", "3b3b57de", "3b3b57de"]
@@ -0,0 +1,112 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+from threading import Event, Thread
+
+import pytest
+
+from wallets import http_transport
+from wallets.content_cache import ContentCache
+from wallets.nft_images import NFTImagesLoader
+
+
+class Handler(BaseHTTPRequestHandler):
+    """Metadata /meta/<id> and images /img/<id>, the images wait for the server release"""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        self.server.requests.append(self.path)
+        if self.path.startswith("/meta/"):
+            image_url = f"http://127.0.0.1:{self.server.server_address[1]}/img/{self.path[6:]}"
+            body = json.dumps({"image": image_url}).encode("utf8")
+        else:
+            self.server.release.wait(5)
+            body = f"image {self.path}".encode("utf8")
+        self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    httpd.requests = []
+    httpd.release = Event()
+    Thread(target=httpd.serve_forever, daemon=True).start()
+    yield httpd
+    httpd.release.set()
+    httpd.shutdown()
+    http_transport.close_all()
+
+
+class FakeNFTWallet:
+    def __init__(self, url, aggregated=True):
+        self.url = url
+        self.aggregated = aggregated
+        self.uri_batches = []
+
+    def get_tokens_uri(self, ids):
+        if not self.aggregated:
+            raise IOError("No Multicall3")
+        self.uri_batches.append(ids)
+        return [f"{self.url}/meta/{nft_id}" if nft_id else None for nft_id in ids]
+
+    def get_metadata(self, nft_id):
+        if nft_id == 0:
+            raise IOError("No metadata")
+        return {"image": f"{self.url}/img/{nft_id}"}
+
+
+def test_loader(server, tmp_path):
+    url = f"http://127.0.0.1:{server.server_address[1]}"
+    cache = ContentCache(str(tmp_path))
+    images = []
+    done = Event()
+
+    def on_image(nft_info):
+        images.append(nft_info)
+        if len(images) == 9:
+            done.set()
+
+    thumbnails = []
+
+    def make_thumbnail(image_data, size):
+        thumbnails.append(image_data)
+        return b"thumbnail " + image_data[:size]
+
+    nft_wallet = FakeNFTWallet(url)
+    loader = NFTImagesLoader(nft_wallet, on_image, make_thumbnail, 10, cache, 8)
+    loader.load(range(9))
+    # All the images are read in parallel, after their metadata
+    for _ in range(50):
+        if len([path for path in server.requests if path.startswith("/img/")]) == 8:
+            break
+        done.wait(0.1)
+    assert sorted(server.requests) == [f"/img/{idx}" for idx in range(1, 9)] + [
+        f"/meta/{idx}" for idx in range(1, 9)
+    ]
+    assert nft_wallet.uri_batches == [list(range(9))]
+    server.release.set()
+    assert done.wait(5)
+    by_id = {info["id"]: info for info in images}
+    assert by_id[0]["thumbnail"] is None
+    assert by_id[5]["thumbnail"] == b"thumbnail image /img"
+    assert len(thumbnails) == 8
+
+    # Opened again : from the cache
+    server.requests.clear()
+    images.clear()
+    done.clear()
+    # Without aggregated reads
+    loader = NFTImagesLoader(FakeNFTWallet(url, False), on_image, make_thumbnail, 10, cache)
+    loader.load(range(9))
+    assert done.wait(5)
+    assert server.requests == []
+    assert len(thumbnails) == 8
+    assert {info["id"]: info for info in images}[5]["thumbnail"] == b"thumbnail image /img"
+    loader.stop()
@@ -0,0 +1,134 @@
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from pyweb3.json_rpc import JSONRPCexception
+
+from wallets.ETHwallet import ETHwalletCore
+from wallets.http_transport import ConnectError
+from wallets.evm_rpc import RPCBatch
+from wallets.nonce_manager import NonceManager
+
+
+TST_PUBKEY = bytes.fromhex(
+    "04"
+    "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
+)
+
+
+class ChainNonce:
+    """Chain pending transactions count, counts the readings"""
+
+    def __init__(self, value):
+        self.value = value
+        self.reads = 0
+
+    def __call__(self):
+        self.reads += 1
+        return self.value
+
+
+def test_reserve_once():
+    chain = ChainNonce(7)
+    nonces = NonceManager(chain, reconcile_period=3600)
+    assert [nonces.reserve() for _ in range(10)] == list(range(7, 17))
+    assert chain.reads == 1
+
+
+def test_reserve_threads():
+    chain = ChainNonce(0)
+    nonces = NonceManager(chain, reconcile_period=3600)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        reserved = list(pool.map(lambda _: nonces.reserve(), range(200)))
+    assert sorted(reserved) == list(range(200))
+    assert chain.reads == 1
+
+
+def test_release():
+    nonces = NonceManager(ChainNonce(3), reconcile_period=3600)
+    assert [nonces.reserve() for _ in range(4)] == [3, 4, 5, 6]
+    # A hole is filled first
+    nonces.release(4)
+    assert nonces.reserve() == 4
+    # Top nonces are given back
+    nonces.release(5)
+    nonces.release(6)
+    assert nonces.next_nonce == 5
+    assert nonces.reserve() == 5
+
+
+def test_reconcile():
+    chain = ChainNonce(0)
+    nonces = NonceManager(chain, reconcile_period=3600)
+    for _ in range(3):
+        nonces.mark_sent(nonces.reserve())
+    # Node lagging behind : local nonces kept
+    chain.value = 2
+    nonces.reconcile()
+    assert nonces.reserve() == 3
+    nonces.mark_sent(3)
+    # Transactions sent from another wallet
+    chain.value = 10
+    nonces.reconcile()
+    assert nonces.reserve() == 10
+    # Sent transactions dropped, back to the chain nonce
+    nonces.mark_sent(10)
+    nonces.stale_delay = 0
+    nonces.reconcile()
+    assert nonces.reserve() == 10
+
+
+class FakeAPI:
+    """Batches answering a balance and a nonce, the requests methods are recorded"""
+
+    def __init__(self, push_error=None):
+        self.push_error = push_error
+        self.requests = []
+
+    def batch(self):
+        return RPCBatch(self)
+
+    def request_batch(self, calls):
+        self.requests.append([method for method, _ in calls])
+        answers = {"eth_getBalance": hex(10**18), "eth_getTransactionCount": "0x5"}
+        return [answers[method] for method, _ in calls]
+
+    def pushtx(self, txhex):
+        if self.push_error:
+            raise self.push_error
+        return "0x" + "ab" * 32
+
+
+def test_core_nonces():
+    api = FakeAPI()
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 1)
+    core.nonces = NonceManager(lambda: 0, reconcile_period=3600)
+    for nonce in range(5, 8):
+        core.prepare("11" * 20, 1000, 10**9, 21000)
+        assert core.nonce == bytearray([nonce])
+        core.send("00")
+    # One nonce query
+    assert api.requests[0] == ["eth_getBalance", "eth_getTransactionCount"]
+    assert api.requests[1:] == [["eth_getBalance"]] * 2
+    # Tx rejected by the node gives the nonce back
+    api.push_error = JSONRPCexception("Error -32000 : insufficient funds")
+    core.prepare("11" * 20, 1000, 10**9, 21000)
+    with pytest.raises(JSONRPCexception):
+        core.send("00")
+    api.push_error = None
+    core.prepare("11" * 20, 1000, 10**9, 21000)
+    assert core.nonce == bytearray([8])
+    # Node not reached
+    api.push_error = ConnectError("Connection refused")
+    with pytest.raises(ConnectError):
+        core.send("00")
+    api.push_error = None
+    core.prepare("11" * 20, 1000, 10**9, 21000)
+    assert core.nonce == bytearray([8])
+    # Broadcast outcome unknown : the tx may be in the mempool, its nonce is kept
+    api.push_error = IOError("Read timeout")
+    with pytest.raises(IOError):
+        core.send("00")
+    api.push_error = None
+    core.prepare("11" * 20, 1000, 10**9, 21000)
+    assert core.nonce == bytearray([9])
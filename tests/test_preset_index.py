@@ -0,0 +1,47 @@
+from gui.preset_index import PresetIndex
+from wallets.token_registry import TokenRegistry
+
+
+PRESETS = {
+    "Tether USD (USDT)": "0xdAC17F958D2ee523a2206206994597C13D831ec7",
+    "USD Coin (USDC)": "0xA0b86991c6218b36c1d19D4a2e9Eb0cE3606eB48",
+    "Dai Stablecoin (DAI)": "0x6B175474E89094C44Da98b954EedeAC495271d0F",
+    "Wrapped BTC (WBTC)": "0x2260FAC5E5542a773Aa44fBCfeDf7C193bc2C599",
+    "USDT Bridged (USDT.e)": "0x" + "11" * 20,
+    "Dai Clone (DAI2)": "0x" + "12" * 20,
+}
+
+
+def scan_search(presets, query):
+    return [name for name in presets if query.lower() in name.lower()]
+
+
+def test_search():
+    index = PresetIndex(PRESETS)
+    assert index.search("") == list(PRESETS)
+    # Exact ticker first
+    assert index.search("dai") == ["Dai Stablecoin (DAI)", "Dai Clone (DAI2)"]
+    assert index.search("usdt") == ["Tether USD (USDT)", "USDT Bridged (USDT.e)"]
+    assert index.search("  Coin ") == ["USD Coin (USDC)", "Dai Stablecoin (DAI)"]
+    assert index.search("xyz") == []
+    # Contract prefix
+    assert index.search("0x12") == ["Dai Clone (DAI2)"]
+    assert index.search("0xdac17f") == ["Tether USD (USDT)"]
+
+
+def test_typing():
+    index = PresetIndex(PRESETS)
+    typed = ""
+    for char in "stablecoin":
+        typed += char
+        assert index.search(typed) == scan_search(PRESETS, typed)
+    while typed:
+        typed = typed[:-1]
+        assert index.search(typed) == scan_search(PRESETS, typed)
+
+
+def test_chain_presets():
+    presets = TokenRegistry("ETH").tokens_values[0]
+    index = PresetIndex(presets)
+    for query in ["a", "us", "eth", "wrapped", "token (", "zz"]:
+        assert sorted(index.search(query)) == sorted(scan_search(presets, query))
@@ -1,6 +1,8 @@
+import random
+
 import pytest
 
-from cryptolib.coins.ethereum import rlp_encode, read_int_array
+from cryptolib.coins.ethereum import rlp_encode, rlp_decode, decode_tx, read_int_array
 
 
 # Testing RLP encoding
@@ -111,6 +113,71 @@ def test_rlp_invalid():
         check_rlp({})
     with pytest.raises(ValueError):
         check_rlp(2.35)
+    with pytest.raises(ValueError):
+        check_rlp([1, None, 2])
+    with pytest.raises(ValueError):
+        check_rlp([[1, [None]]])
+
+
+def test_rlp_single_null_byte():
+    # bytearray from int2bytearray(0) : the integer 0
+    assert check_rlp(bytearray(b"\x00")) == "80"
+    # bytes : the byte string 0x00
+    assert rlp_encode(b"\x00").hex() == "00"
+
+
+def reference_rlp_encode(input_data):
+    """The former recursive encoder, as reference"""
+    if isinstance(input_data, int):
+        if input_data < 0:
+            raise ValueError("RLP encoding error : integer must be positive or null")
+        return reference_rlp_encode(reference_to_binary(input_data))
+    if isinstance(input_data, bytearray):
+        if len(input_data) == 1 and input_data[0] == 0:
+            return bytearray(b"\x80")
+        if len(input_data) == 1 and input_data[0] < 0x80:
+            return input_data
+        return reference_encode_length(len(input_data), 0x80) + input_data
+    if isinstance(input_data, list):
+        output = bytearray([])
+        for item in input_data:
+            output += reference_rlp_encode(item)
+        return reference_encode_length(len(output), 0xC0) + output
+    raise ValueError("Bad input_data type : int, list or bytearray required")
+
+
+def reference_encode_length(Lon, offset):
+    if Lon < 56:
+        return bytearray([Lon + offset])
+    BLon = reference_to_binary(Lon)
+    return bytearray([len(BLon) + offset + 55]) + BLon
+
+
+def reference_to_binary(x):
+    if x == 0:
+        return bytearray([])
+    return reference_to_binary(int(x // 256)) + bytearray([x % 256])
+
+
+def random_item(rng, depth):
+    kind = rng.random()
+    if depth > 0 and kind < 0.3:
+        return [random_item(rng, depth - 1) for _ in range(rng.randrange(6))]
+    if kind < 0.6:
+        return rng.choice([0, 1, 127, 128, 255, 256, 2**64, rng.getrandbits(rng.randrange(1, 300))])
+    length = rng.choice([0, 1, 1, 2, 55, 56, rng.randrange(300)])
+    return bytearray(rng.getrandbits(8) for _ in range(length))
+
+
+def test_rlp_differential():
+    rng = random.Random(28)
+    for _ in range(2000):
+        item = random_item(rng, rng.randrange(8))
+        assert rlp_encode(item) == reference_rlp_encode(item)
+    deep = bytearray(b"\x00")
+    for idx in range(200):
+        deep = [deep, idx, bytearray(b"\x81")] if idx % 2 else [deep]
+    assert rlp_encode(deep) == reference_rlp_encode(deep)
 
 
 def test_abi_intarray():
@@ -129,3 +196,92 @@ def test_abi_intarray():
         "0000000000000000000000000000000000000000000000000000000000000030"
     )
     assert read_int_array(data_in) == [13030, 2, 0x30]
+
+
+# Testing RLP decoding
+
+
+def to_bytes(decoded):
+    if isinstance(decoded, list):
+        return [to_bytes(item) for item in decoded]
+    return bytes(decoded)
+
+
+def test_rlp_roundtrip():
+    samples = [
+        bytearray(),
+        bytearray(b"dog"),
+        bytearray(b"\x7f"),
+        bytearray(b"\x80"),
+        bytearray(55 * b"a"),
+        bytearray(56 * b"a"),
+        bytearray(1024 * b"z"),
+        [],
+        [[], [[]], [[], [[]]]],
+        [bytearray(b"cat"), [bytearray(b"dog"), [bytearray(60 * b"x")]], bytearray()],
+        [bytearray(b"\x01")] * 1024,
+    ]
+    for sample in samples:
+        encoded = rlp_encode(sample)
+        decoded = rlp_decode(encoded)
+        assert to_bytes(decoded) == to_bytes(sample)
+        assert rlp_encode(decoded) == encoded
+    deep = []
+    for _ in range(5000):
+        deep = [deep]
+    assert rlp_encode(rlp_decode(rlp_encode(deep))) == rlp_encode(deep)
+
+
+def test_rlp_decode_ints():
+    decoded = rlp_decode(rlp_encode([0, 127, 128, 0xFFFFFF, 2**255]))
+    assert [int.from_bytes(item, "big") for item in decoded] == [0, 127, 128, 0xFFFFFF, 2**255]
+
+
+def test_decode_tx():
+    legacy_tx = bytes.fromhex(
+        "f86c098504a817c800825208943535353535353535353535353535353535353535880de0b6b3a76400008025a028ef61340bd939bc2195fe537567866003e1a15d3c71ff63e1590620aa636276a067cbe9d8997f761aecb703304b3800ccf555c9f3dc64214b297fb1966a3b6d83"
+    )
+    tx_type, fields = decode_tx(legacy_tx)
+    assert tx_type == 0
+    assert len(fields) == 9
+    assert int.from_bytes(fields[0], "big") == 9
+    assert bytes(fields[3]).hex() == "35" * 20
+    assert int.from_bytes(fields[6], "big") == 37
+    typed_tx = b"\x02" + rlp_encode([1, 9, bytearray(b"\x35" * 20)])
+    tx_type, fields = decode_tx(typed_tx)
+    assert tx_type == 2
+    assert int.from_bytes(fields[1], "big") == 9
+    with pytest.raises(ValueError):
+        decode_tx(b"")
+    with pytest.raises(ValueError):
+        decode_tx(bytes.fromhex("83646f67"))
+    with pytest.raises(ValueError):
+        decode_tx(bytes.fromhex("0283646f67"))
+
+
+def test_rlp_decode_invalid():
+    malformed = [
+        # Empty
+        "",
+        # Truncated string and list
+        "83646f",
+        "c30102",
+        "b90400",
+        "f90400" + 100 * "80",
+        # Two items at top level
+        "8080",
+        "c0c0",
+        # Single byte not encoded as itself
+        "8100",
+        "817f",
+        # Long length for a short item
+        "b80161",
+        "f80180",
+        # Length with leading zero
+        "b9003861",
+        # Item overflowing its list
+        "c283646f67",
+    ]
+    for data_hex in malformed:
+        with pytest.raises(ValueError):
+            rlp_decode(bytes.fromhex(data_hex))
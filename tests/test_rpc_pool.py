@@ -0,0 +1,175 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import socket
+from threading import Thread
+from time import monotonic, perf_counter, sleep
+
+import pytest
+from pyweb3.json_rpc import JSONRPCexception
+
+from wallets import http_transport, rpc_pool
+from wallets.http_transport import ConnectError
+from wallets.rpc_pool import BroadcastUnknown, EndpointPool, PooledEVMclient
+
+
+class NodeHandler(BaseHTTPRequestHandler):
+    """JSON-RPC node, with the delay, head and state of its server"""
+
+    protocol_version = "HTTP/1.1"
+
+    def log_message(self, *args):
+        pass
+
+    def answer(self, request):
+        self.server.methods.append(request["method"])
+        if request["method"] == "eth_blockNumber":
+            result = hex(self.server.head)
+        elif request["method"] == "eth_call":
+            return {"jsonrpc": "2.0", "id": request["id"], "error": {"code": 3}}
+        else:
+            result = hex(self.server.balance)
+        return {"jsonrpc": "2.0", "id": request["id"], "result": result}
+
+    def do_POST(self):
+        request = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.received.append(request)
+        sleep(self.server.delay)
+        if self.server.down:
+            body = b"Unavailable"
+            self.send_response(503)
+        else:
+            if isinstance(request, list):
+                response = [self.answer(req) for req in request]
+            else:
+                response = self.answer(request)
+            body = json.dumps(response).encode("utf8")
+            self.send_response(200)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def nodes():
+    servers = []
+
+    def start(delay=0, head=1000, balance=1, down=False):
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), NodeHandler)
+        httpd.delay = delay
+        httpd.head = head
+        httpd.balance = balance
+        httpd.down = down
+        httpd.methods = []
+        httpd.received = []
+        httpd.url = f"http://127.0.0.1:{httpd.server_address[1]}"
+        Thread(target=httpd.serve_forever, daemon=True).start()
+        servers.append(httpd)
+        return httpd
+
+    yield start
+    for httpd in servers:
+        httpd.shutdown()
+    http_transport.close_all()
+
+
+def closed_url():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return f"http://127.0.0.1:{sock.getsockname()[1]}"
+
+
+def test_ranked_by_latency(nodes):
+    slow = nodes(delay=0.1, balance=1)
+    fast = nodes(balance=2)
+    pool = EndpointPool([slow.url, fast.url])
+    pool.probe()
+    assert [endpoint.url for endpoint in pool.ranked()] == [fast.url, slow.url]
+    client = PooledEVMclient(pool)
+    assert client.get_balance("0x" + "00" * 20) == 2
+    batch = client.batch()
+    batch.get_balance("0x" + "00" * 20)
+    batch.get_tx_num("00" * 20)
+    assert batch.execute() == [2, 2]
+    assert fast.methods[-2:] == ["eth_getBalance", "eth_getTransactionCount"]
+
+
+def test_lagging_set_aside(nodes):
+    lagging = nodes(head=990, balance=1)
+    synced = nodes(delay=0.05, head=1000, balance=2)
+    pool = EndpointPool([lagging.url, synced.url])
+    pool.probe()
+    assert [endpoint.url for endpoint in pool.ranked()] == [synced.url, lagging.url]
+    assert PooledEVMclient(pool).get_balance("0x" + "00" * 20) == 2
+
+
+def test_failover(nodes):
+    down = nodes(down=True)
+    backup = nodes(balance=3)
+    pool = EndpointPool([down.url, backup.url])
+    client = PooledEVMclient(pool)
+    assert client.get_balance("0x" + "00" * 20) == 3
+    # The failed endpoint is set aside
+    assert pool.ranked()[0].url == backup.url
+    backup.down = True
+    with pytest.raises(IOError):
+        client.get_balance("0x" + "00" * 20)
+
+
+def test_tx_failover(nodes):
+    down = nodes(down=True)
+    backup = nodes(balance=3)
+    pool = EndpointPool([closed_url(), backup.url])
+    pool.probe_time = monotonic() + 3600
+    client = PooledEVMclient(pool)
+    # Not sent to the unreachable node, the next one gets the tx
+    assert client.pushtx("00") == "0x3"
+    assert backup.methods == ["eth_sendRawTransaction"]
+    # A node error status : the tx may have been processed, not sent again
+    pool = EndpointPool([down.url, backup.url])
+    pool.probe_time = monotonic() + 3600
+    backup.methods.clear()
+    with pytest.raises(BroadcastUnknown):
+        PooledEVMclient(pool).pushtx("00")
+    assert backup.methods == []
+    # No node reached
+    pool = EndpointPool([closed_url()])
+    pool.probe_time = monotonic() + 3600
+    with pytest.raises(ConnectError):
+        PooledEVMclient(pool).pushtx("00")
+
+
+def test_tx_accepted_then_timeout(nodes, monkeypatch):
+    monkeypatch.setattr(rpc_pool, "REQUEST_TIMEOUT", 0.3)
+    # The node receives the tx, but its answer comes too late
+    accepting = nodes(delay=1)
+    backup = nodes()
+    pool = EndpointPool([accepting.url, backup.url])
+    pool.probe_time = monotonic() + 3600
+    with pytest.raises(BroadcastUnknown, match="status unknown"):
+        PooledEVMclient(pool).pushtx("00")
+    assert [request["method"] for request in accepting.received] == ["eth_sendRawTransaction"]
+    assert backup.received == []
+
+
+def test_hedged_read(nodes, monkeypatch):
+    monkeypatch.setattr(rpc_pool, "HEDGE_DEFAULT_DELAY", 0.1)
+    stuck = nodes(delay=1, balance=1)
+    other = nodes(balance=2)
+    pool = EndpointPool([stuck.url, other.url])
+    # Not probed : in the configuration order
+    pool.probe_time = monotonic() + 3600
+    start = perf_counter()
+    assert PooledEVMclient(pool).get_balance("0x" + "00" * 20) == 2
+    assert perf_counter() - start < 0.5
+
+
+def test_node_error_not_retried(nodes):
+    first = nodes()
+    second = nodes()
+    pool = EndpointPool([first.url, second.url])
+    pool.probe()
+    first.methods.clear()
+    second.methods.clear()
+    with pytest.raises(JSONRPCexception):
+        PooledEVMclient(pool).call("0x" + "00" * 20, "12345678")
+    assert len(first.methods + second.methods) == 1
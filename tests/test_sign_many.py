@@ -0,0 +1,60 @@
+from cryptography.hazmat.primitives import hashes
+from cryptography.hazmat.primitives.asymmetric import ec, utils
+
+from cryptolib.cryptography import sha2
+from cryptolib.ECKeyPair import K1_CURVE
+from cryptolib.HDwallet import HD_Wallet
+from devices.BaseDevice import BaseDevice
+from devices.LocalFile import LocalFile
+from devices.SingleKey import SKdevice
+
+
+TST_MNEMONIC = "estate camera orbit figure ready submit pet jungle emotion cruise fade cousin"
+TST_PATH = "m/44'/0'/0'/0/{}"
+
+
+def check_sig(pubkey, hashed_msg, signature):
+    pubkey_obj = ec.EllipticCurvePublicKey.from_encoded_point(K1_CURVE, pubkey)
+    # Raises InvalidSignature if invalid
+    pubkey_obj.verify(signature, hashed_msg, ec.ECDSA(utils.Prehashed(hashes.SHA256())))
+
+
+def test_singlekey_sign_many():
+    device = SKdevice()
+    device.open_account_fromint(0x1234567890ABCDEF)
+    device.set_key_type("K1")
+    msgs = [sha2(bytes([idx])) for idx in range(40)]
+    signatures = device.sign_many(msgs)
+    assert len(signatures) == len(msgs)
+    for msg, sig in zip(msgs, signatures):
+        check_sig(device.get_public_key(), msg, sig)
+
+
+def test_localfile_sign_stream_paths():
+    device = LocalFile()
+    device.compute_masterkeys(HD_Wallet.seed_from_mnemonic(TST_MNEMONIC))
+    device.derive_key(TST_PATH.format(0), "K1")
+    current_pubkey = device.get_public_key()
+    msgs = [sha2(bytes([idx])) for idx in range(12)]
+    paths = [None if idx % 3 == 0 else TST_PATH.format(idx) for idx in range(12)]
+    for idx, sig in enumerate(device.sign_stream(msgs, paths)):
+        if paths[idx] is None:
+            pubkey = current_pubkey
+        else:
+            pubkey = device.derive_pvkey(paths[idx], "K1").get_public_key()
+        check_sig(pubkey, msgs[idx], sig)
+    # Signers don't change the device current key
+    assert device.get_public_key() == current_pubkey
+
+
+def test_parallel_sign_without_signer():
+    class NoSignerDevice(SKdevice):
+        get_signer = BaseDevice.get_signer
+
+    device = NoSignerDevice()
+    device.open_account_fromint(0x1234567890ABCDEF)
+    device.set_key_type("K1")
+    # Signed one at a time with the device key
+    msgs = [sha2(bytes([idx])) for idx in range(3)]
+    for msg, sig in zip(msgs, device.sign_many(msgs)):
+        check_sig(device.get_public_key(), msg, sig)
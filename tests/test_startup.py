@@ -0,0 +1,55 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+from devices.registry import DEVICES_LIST, get_device_module
+from wallets.registry import SUPPORTED_COINS, get_coin_class
+
+
+# Imported only when a coin or a device is selected
+LAZY_MODULES = ["pyweb3", "pywalletconnect", "nacl", "hid", "smartcard", "OpenPGPpy"]
+LAZY_MODULES += [f"wallets.{coin}wallet" for coin in SUPPORTED_COINS]
+LAZY_MODULES += [f"devices.{device}" for device in DEVICES_LIST if device != "SeedWatcher"]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+duration = time.perf_counter() - start
+print(json.dumps({{"duration": duration, "modules": list(sys.modules)}}))
+"""
+
+
+def cold_import(module):
+    """Import a module in a new interpreter, returns the duration and the modules loaded"""
+    result = subprocess.run(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)],
+        capture_output=True,
+        check=True,
+        text=True,
+    )
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def test_registries_import():
+    imported = cold_import("wallets.registry, devices.registry")
+    assert not [module for module in LAZY_MODULES if module in imported["modules"]]
+    assert imported["duration"] < 0.5
+
+
+def test_app_import():
+    pytest.importorskip("wx")
+    imported = cold_import("uniblow")
+    assert not [module for module in LAZY_MODULES if module in imported["modules"]]
+    assert imported["duration"] < 3
+
+
+def test_coin_class():
+    assert get_coin_class("ARB/ETH").__name__ == "ARB_wallet"
+    assert get_coin_class("TRX").__name__ == "TRX_wallet"
+    with pytest.raises(ValueError):
+        get_coin_class("XYZ")
+    with pytest.raises(ValueError):
+        get_device_module("XYZ")
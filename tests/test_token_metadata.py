@@ -0,0 +1,83 @@
+from devices.file_path import WalletFile
+from wallets.ETHwallet import ETHwalletCore
+from wallets.evm_rpc import RPCBatch
+from wallets.token_metadata import TokenMetadataCache
+
+
+TST_PUBKEY = bytes.fromhex(
+    "04"
+    "79be667ef9dcbbac55a06295ce870b07029bfcdb2dce28d959f2815b16f81798"
+    "483ada7726a3c4655da4fbfc0e1108a8fd17b448a68554199c47d08ffb10d4b8"
+)
+TST_CONTRACT = "0xdAC17F958D2ee523a2206206994597C13D831ec7"
+
+# symbol() = "USDT"
+SYMBOL_RESULT = (
+    "0x0000000000000000000000000000000000000000000000000000000000000020"
+    "0000000000000000000000000000000000000000000000000000000000000004"
+    "5553445400000000000000000000000000000000000000000000000000000000"
+)
+
+
+def tmp_file(tmp_path):
+    data_file = WalletFile("tokens_metadata.json")
+    data_file.dir_path = str(tmp_path)
+    data_file.file_path = str(tmp_path / "tokens_metadata.json")
+    return data_file
+
+
+class FakeAPI:
+    """EVMclient batches, records the methods of each request"""
+
+    def __init__(self):
+        self.requests = []
+
+    def batch(self):
+        return RPCBatch(self)
+
+    def request_batch(self, calls):
+        self.requests.append([params[0]["data"][2:10] for _, params in calls])
+        answers = {"313ce567": "0x" + f"{6:064x}", "95d89b41": SYMBOL_RESULT}
+        return [answers[params[0]["data"][2:10]] for _, params in calls]
+
+
+def test_lru_and_file(tmp_path):
+    cache = TokenMetadataCache(tmp_file(tmp_path), lru_size=2)
+    assert cache.get(1, TST_CONTRACT) is None
+    cache.set(1, TST_CONTRACT, 6, "USDT")
+    cache.set(56, TST_CONTRACT, 18, "BUSDT")
+    cache.set(1, "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t", 6, "USDT")
+    assert len(cache.lru) == 2
+    # EVM addresses are not case sensitive
+    assert cache.get(1, TST_CONTRACT.lower()) == {"decimals": 6, "symbol": "USDT"}
+    assert cache.get(1, "tr7nhqjekqxgtci8q8zy4pl8otszgjlj6t") is None
+    # New instance reads the file
+    new_cache = TokenMetadataCache(tmp_file(tmp_path))
+    assert new_cache.get(56, TST_CONTRACT) == {"decimals": 18, "symbol": "BUSDT"}
+
+
+def test_preset_symbols(tmp_path):
+    cache = TokenMetadataCache(tmp_file(tmp_path))
+    cache.seed_presets(1, {"Tether USD (USDT)": TST_CONTRACT, "No symbol": "0x" + "11" * 20})
+    assert cache.get_preset_symbol(1, TST_CONTRACT.lower()) == "USDT"
+    assert cache.get_preset_symbol(1, "0x" + "11" * 20) is None
+    assert cache.get_preset_symbol(56, TST_CONTRACT) is None
+    # Not a full metadata
+    assert cache.get(1, TST_CONTRACT) is None
+
+
+def test_core_metadata(tmp_path):
+    cache = TokenMetadataCache(tmp_file(tmp_path))
+    api = FakeAPI()
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 1, TST_CONTRACT.lower(), metadata=cache)
+    assert (core.decimals, core.token_symbol) == (6, "USDT")
+    assert api.requests == [["313ce567", "95d89b41"]]
+    # Second time : no RPC
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 1, TST_CONTRACT.lower(), metadata=cache)
+    assert (core.decimals, core.token_symbol) == (6, "USDT")
+    assert len(api.requests) == 1
+    # Preset symbol known : only the decimals are read
+    cache.seed_presets(10, {"Tether USD (USDT)": TST_CONTRACT})
+    core = ETHwalletCore(TST_PUBKEY, "mainnet", api, 10, TST_CONTRACT.lower(), metadata=cache)
+    assert (core.decimals, core.token_symbol) == (6, "USDT")
+    assert api.requests[1] == ["313ce567"]
@@ -0,0 +1,99 @@
+from copy import deepcopy
+
+import pytest
+
+from wallets.token_registry import (
+    TokenRegistry,
+    build_registry,
+    registry_path,
+    source_chains,
+    write_registry,
+)
+
+
+TOKENS = [
+    {"Tether USD (USDT)": "0xdAC17F958D2ee523a2206206994597C13D831ec7"},
+    {"Test token (TST)": "0x" + "22" * 20},
+]
+LEDGER_TOKENS = {
+    "0x" + f"{idx * 7919:040x}": {"ticker": f"TK{idx}", "signature": "3044" + f"{idx:02x}" * 68}
+    for idx in range(200)
+}
+
+
+def test_registry_file(tmp_path):
+    file_path = tmp_path / "TST.dat"
+    write_registry(file_path, TOKENS, ledger_tokens=LEDGER_TOKENS, info=["Test list"])
+    registry = TokenRegistry("TST", file_path)
+    # Read at the first use
+    assert registry.data is None
+    assert registry.ledger_tokens.get("0x" + "00" * 20) == (
+        "TK0",
+        bytes.fromhex("3044" + "00" * 68),
+    )
+    # Presets decoded only when used
+    assert registry.presets is None
+    assert registry.tokens_values[1] == TOKENS[1]
+    assert len(registry.tokens_values) == 2
+    assert list(registry.nfts_values) == []
+    assert registry.presets["info"] == ["Test list"]
+    for address, token in LEDGER_TOKENS.items():
+        assert registry.ledger_tokens.get(address) == (
+            token["ticker"],
+            bytes.fromhex(token["signature"]),
+        )
+    assert registry.ledger_tokens.get("0x" + "ff" * 20) is None
+    assert registry.ledger_tokens.get("0x" + "00" * 19 + "01") is None
+
+
+def test_empty_registry(tmp_path):
+    file_path = tmp_path / "TST.dat"
+    write_registry(file_path, [{}])
+    registry = TokenRegistry("TST", file_path)
+    assert registry.ledger_tokens.get("0x" + "11" * 20) is None
+    assert registry.tokens_values[0] == {}
+
+
+def test_chains_registries():
+    registry = TokenRegistry("ETH")
+    assert registry.tokens_values[0]["Tether USD (USDT)"] == (
+        "0xdac17f958d2ee523a2206206994597c13d831ec7"
+    )
+    assert registry.ledger_tokens.get("0x41efc0253ee7ea44400abb5f907fdbfdebc82bec") == (
+        "$AAPL",
+        bytes.fromhex(
+            "3045022100a1e0859e2ad886121b0c5bb374622dcee83b6b0b26a5552559b56a328e4d50ad"
+            "02202efc09d46a0770a40c6a650a9eec00ba9d8a6727a369398a5f8e3f1d698ccc71"
+        ),
+    )
+    # Wallets classes copy the options with the presets
+    options = deepcopy([{"preset": registry.tokens_values}])
+    assert options[0]["preset"] is registry.tokens_values
+
+
+def test_invalid_registry(tmp_path):
+    file_path = tmp_path / "TST.dat"
+    with pytest.raises(ValueError):
+        write_registry(
+            file_path,
+            [{}],
+            ledger_tokens={"0x" + "11" * 20: {"ticker": "T", "signature": "30" * 73}},
+        )
+    write_registry(file_path, [{}], ledger_tokens=LEDGER_TOKENS)
+    data = file_path.read_bytes()
+    file_path.write_bytes(data[:-10])
+    with pytest.raises(ValueError):
+        TokenRegistry("TST", file_path).ledger_tokens.get("0x" + "11" * 20)
+    file_path.write_bytes(b"UBTR\x01" + data[5:])
+    with pytest.raises(ValueError):
+        TokenRegistry("TST", file_path).tokens_values[0]
+
+
+def test_registries_sources(tmp_path):
+    # The registry files are built from the lists sources
+    assert len(source_chains()) == 12
+    for chain in source_chains():
+        file_path = tmp_path / f"{chain}.dat"
+        build_registry(chain, file_path)
+        with open(registry_path(chain), "rb") as registry_file:
+            assert file_path.read_bytes() == registry_file.read(), chain
@@ -0,0 +1,138 @@
+from threading import Lock
+
+from cryptolib.coins.ethereum import read_uint256, uint256
+from wallets.token_scanner import (
+    AGGREGATE3_FUNCTION,
+    MULTICALL3_ADDRESS,
+    TokenScanner,
+    chunk_calls,
+    decode_aggregate3,
+    encode_aggregate3,
+)
+
+
+OWNER = "1dee31d1363de1bb7a9938ee6a953232e18b11f7"
+
+
+def abi_string(text):
+    data = text.encode("utf8")
+    return uint256(32) + uint256(len(data)) + data.ljust(32, b"\x00")
+
+
+def decode_calls(data_hex):
+    """aggregate3 calldata to the list of (target, calldata)"""
+    data_bin = bytes.fromhex(data_hex)
+    n_calls = read_uint256(data_bin, 32)
+    calls = []
+    for idx in range(n_calls):
+        tuple_offset = 64 + read_uint256(data_bin, 64 + 32 * idx)
+        target = "0x" + data_bin[tuple_offset + 12 : tuple_offset + 32].hex()
+        assert read_uint256(data_bin, tuple_offset + 32) == 1
+        bytes_offset = tuple_offset + read_uint256(data_bin, tuple_offset + 64)
+        length = read_uint256(data_bin, bytes_offset)
+        calls.append((target, data_bin[bytes_offset + 32 : bytes_offset + 32 + length]))
+    return calls
+
+
+def encode_results(results):
+    heads = []
+    tails = []
+    offset = 32 * len(results)
+    for success, data in results:
+        heads.append(uint256(offset))
+        tail = uint256(int(success)) + uint256(64) + uint256(len(data))
+        tail += data.ljust((len(data) + 31) // 32 * 32, b"\x00")
+        tails.append(tail)
+        offset += len(tail)
+    return "0x" + (uint256(32) + uint256(len(results)) + b"".join(heads + tails)).hex()
+
+
+class FakeMulticall:
+    """EVMclient call to Multicall3, with tokens {contract: (balance, decimals, symbol)}"""
+
+    calls_count = 0
+    lock = Lock()
+
+    def __init__(self, tokens):
+        self.tokens = tokens
+
+    def token_call(self, target, calldata):
+        if target not in self.tokens:
+            return False, b""
+        balance, decimals, symbol = self.tokens[target]
+        function = calldata[:4].hex()
+        if function == "70a08231":
+            assert calldata[4:].hex() == OWNER.rjust(64, "0")
+            return True, uint256(balance)
+        if function == "313ce567":
+            return True, uint256(decimals)
+        if function == "95d89b41":
+            if isinstance(symbol, bytes):
+                return True, symbol
+            return True, abi_string(symbol)
+        return False, b""
+
+    def call(self, contract, command_code, data="", state="latest"):
+        assert contract == MULTICALL3_ADDRESS
+        assert command_code == AGGREGATE3_FUNCTION
+        with FakeMulticall.lock:
+            FakeMulticall.calls_count += 1
+        return encode_results([self.token_call(*call) for call in decode_calls(data)])
+
+
+def token_address(idx):
+    return "0x" + f"{idx + 1:040x}"
+
+
+def test_aggregate3_encoding():
+    calls = [(token_address(0), b"\x01\x02\x03\x04"), (token_address(1), bytes(68))]
+    assert decode_calls(encode_aggregate3(calls)) == calls
+    results = [(True, uint256(5)), (False, b""), (True, b"\xaa" * 40)]
+    assert decode_aggregate3(encode_results(results)) == results
+
+
+def test_chunks():
+    calls = [(token_address(idx), bytes(36)) for idx in range(250)]
+    chunks = chunk_calls(calls, 4096)
+    assert sum(chunks, []) == calls
+    assert all(len(encode_aggregate3(chunk)) // 2 + 4 <= 4096 for chunk in chunks)
+    assert len(chunks) == 15
+
+
+def test_scan_presets():
+    tokens = {token_address(idx): (0, 18, "NUL") for idx in range(300)}
+    tokens[token_address(3)] = (5 * 10**6, 6, "USDT")
+    tokens[token_address(120)] = (10**18, 18, "DAI")
+    # bytes32 symbol
+    tokens[token_address(299)] = (7, 0, b"MKR".ljust(32, b"\x00"))
+    presets = {f"Token {idx} (TK{idx})": token_address(idx) for idx in range(301)}
+    # Not a contract
+    presets["Broken (BRK)"] = "0x" + "ff" * 20
+    FakeMulticall.calls_count = 0
+    scanner = TokenScanner(lambda: FakeMulticall(tokens), max_calldata=8192)
+    owned = scanner.scan(OWNER, presets)
+    assert owned == [
+        {
+            "name": "Token 3 (TK3)",
+            "contract": token_address(3),
+            "balance": 5 * 10**6,
+            "decimals": 6,
+            "symbol": "USDT",
+        },
+        {
+            "name": "Token 120 (TK120)",
+            "contract": token_address(120),
+            "balance": 10**18,
+            "decimals": 18,
+            "symbol": "DAI",
+        },
+        {
+            "name": "Token 299 (TK299)",
+            "contract": token_address(299),
+            "balance": 7,
+            "decimals": 0,
+            "symbol": "MKR",
+        },
+    ]
+    # 302 balanceOf in 9 chunks, then 1 call for the decimals and symbols
+    assert FakeMulticall.calls_count == 10
@@ -10,14 +10,12 @@ def dummy_balance(self=None, erc20=None):
     return 2000000000000000000
 
 
-def test_eth_tx():
+def test_eth_tx(monkeypatch):
     # Test building an ETH transaction
     # 1 ETH to 0x3535, gas price = 20 GWei, nonce = 9
-    ETHwalletCore.get_decimals = lambda _: 18
-    ETHwalletCore.get_symbol = lambda _: "ETH"
+    monkeypatch.setattr(ETHwalletCore, "read_token_info", lambda _: (18, "ETH"))
     wl = ETHwalletCore(dummy_pubkey, "mainnet", fake_api, 1)
-    wl.getbalance = dummy_balance
-    wl.getnonce = lambda: 9
+    wl.read_tx_state = lambda: {"balance": dummy_balance(), "nonce": 9}
     to_addr = "3535353535353535353535353535353535353535"
     amount_value = 1000000000000000000
     gas_price = 20000000000
@@ -26,14 +24,16 @@ def test_eth_tx():
     assert wl.datahash.hex() == "daf5a779ae972f972197303d7b574746c7ef83eadac0f2791ad23db92e4c8e53"
 
 
-def test_erc20_tx():
+def test_erc20_tx(monkeypatch):
     # Test building an ERC20 transaction, on the CSC network id = 52
     # 2 DAI to 0x5322, gas price = 42 GWei, gas limit = 78009
-    ETHwalletCore.get_decimals = lambda _: 18
-    ETHwalletCore.get_symbol = lambda _: "DAI"
+    monkeypatch.setattr(ETHwalletCore, "read_token_info", lambda _: (18, "DAI"))
     wl = ETHwalletCore(dummy_pubkey, "other network", fake_api, 52, ERC20_contract)
-    wl.getbalance = dummy_balance
-    wl.getnonce = lambda: 0
+    wl.read_tx_state = lambda: {
+        "balance": dummy_balance(),
+        "token_balance": dummy_balance(),
+        "nonce": 0,
+    }
     to_addr = "5322b34c88ed0691971bf52a7047448f0f4efc84"
     amount_value = 2 * 1000000000000000000
     gas_price = 42000000000
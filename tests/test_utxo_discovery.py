@@ -0,0 +1,248 @@
+import time
+
+import pytest
+
+import cryptolib.coins
+from cryptolib.HDwallet import HD_Wallet
+from devices.LocalFile import LocalFile
+from wallets import BTCwallet, DOGEwallet, LTCwallet
+from wallets.BTCwallet import BTC_wallet, blkhub_api
+from wallets.DOGEwallet import DOGE_wallet
+from wallets.LTCwallet import LTC_wallet, blockcypher_api
+from wallets.utxo_discovery import AccountDiscovery, account_path
+
+
+TST_MNEMONIC = "estate camera orbit figure ready submit pet jungle emotion cruise fade cousin"
+
+
+def hd_device():
+    """LocalFile device, without file"""
+    device = LocalFile()
+    device.compute_masterkeys(HD_Wallet.seed_from_mnemonic(TST_MNEMONIC))
+    return device
+
+
+class FakeAPI:
+    """Serves history for some addresses, given as {address: [utxo values]}"""
+
+    pushed = []
+
+    def __init__(self, funded):
+        self.funded = funded
+        self.queried = []
+        self.utxos_queried = []
+
+    def get_txcount(self, addr):
+        self.queried.append(addr)
+        return 1 if addr in self.funded else 0
+
+    def getutxos(self, addr, nconf):
+        self.utxos_queried.append((addr, nconf))
+        return [
+            {"value": value, "output": f"{idx:064x}:{num}"}
+            for num, (idx, value) in enumerate(self.funded[addr])
+        ]
+
+    def pushtx(self, txhex):
+        FakeAPI.pushed.append(txhex)
+        return "txid"
+
+
+def path_pubkey(path):
+    wallet = HD_Wallet.from_seed(HD_Wallet.seed_from_mnemonic(TST_MNEMONIC), "K1")
+    return wallet.derive_key(path).get_public_key(True).hex()
+
+
+def seg_address(path):
+    return cryptolib.coins.bitcoin.Bitcoin().pubtosegwit(path_pubkey(path))
+
+
+def btc_discovery(api, gap_limit=5):
+    device = hd_device()
+    return AccountDiscovery(
+        "m/84'/0'/0'",
+        device.get_account_node("m/84'/0'/0'", "K1"),
+        lambda pubk: cryptolib.coins.bitcoin.Bitcoin().pubtosegwit(pubk),
+        lambda: api,
+        gap_limit=gap_limit,
+        max_workers=4,
+    )
+
+
+def test_account_path():
+    assert account_path("m/84'/0'/3'/0/5") == "m/84'/0'/3'"
+    with pytest.raises(ValueError):
+        account_path("m/84'/0'/3'")
+
+
+def test_gap_limit_scan():
+    funded = {
+        seg_address("m/84'/0'/0'/0/0"): [(1, 1000)],
+        seg_address("m/84'/0'/0'/0/4"): [(2, 2000), (3, 500)],
+        seg_address("m/84'/0'/0'/1/1"): [(4, 700)],
+        # Beyond the gap limit, not found
+        seg_address("m/84'/0'/0'/0/10"): [(5, 9999)],
+    }
+    api = FakeAPI(funded)
+    discovery = btc_discovery(api)
+    state = discovery.scan()
+    assert state.balance == 4200
+    assert [(kinfo["chain"], kinfo["index"]) for kinfo in state.used] == [(0, 0), (0, 4), (1, 1)]
+    assert state.next_index == {0: 5, 1: 2}
+    assert discovery.change_key(state)["path"] == "m/84'/0'/0'/1/2"
+    # External chain up to index 9, change chain up to 6
+    assert len(api.queried) == 10 + 7
+    assert {utxo["path"] for utxo in state.utxos} == {
+        "m/84'/0'/0'/0/0",
+        "m/84'/0'/0'/0/4",
+        "m/84'/0'/0'/1/1",
+    }
+
+
+def test_cached_state():
+    funded = {
+        seg_address("m/84'/0'/0'/0/1"): [(1, 1000)],
+        seg_address("m/84'/0'/0'/1/0"): [(2, 2000)],
+    }
+    api = FakeAPI(funded)
+    discovery = btc_discovery(api, gap_limit=3)
+    assert discovery.get_state().balance == 3000
+    assert len(api.queried) == 5 + 4
+    # Served from the last scan
+    assert discovery.get_state() is discovery.state
+    assert len(api.queried) == 5 + 4
+    # New payments received, one on the last checked address
+    funded[seg_address("m/84'/0'/0'/0/4")] = [(3, 500)]
+    funded[seg_address("m/84'/0'/0'/0/1")].append((4, 100))
+    api.queried.clear()
+    api.utxos_queried.clear()
+    state = discovery.get_state(refresh=True)
+    assert state.balance == 3600
+    assert state.next_index == {0: 5, 1: 1}
+    # Resumed after the last used addresses : 2 to 7 on external, 1 to 3 on change
+    assert len(api.queried) == 6 + 3
+    assert seg_address("m/84'/0'/0'/0/0") not in api.queried
+    assert len(api.utxos_queried) == 3
+    # Required confirmations are given to the API
+    discovery.get_state(nconf=1)
+    assert {nconf for _, nconf in api.utxos_queried[3:]} == {1}
+
+
+def test_request_interval():
+    api = FakeAPI({seg_address("m/84'/0'/0'/0/0"): [(1, 1000)]})
+    discovery = btc_discovery(api, gap_limit=2)
+    discovery.request_interval = 0.02
+    start = time.monotonic()
+    discovery.scan()
+    # 5 tx counts and 1 UTXOs requests
+    assert time.monotonic() - start >= 5 * 0.02
+
+
+def test_invalid_txcount(monkeypatch):
+    def set_response(jsres):
+        def get_data(self, *args, **kwargs):
+            self.jsres = jsres
+
+        return get_data
+
+    monkeypatch.setattr(blkhub_api, "getData", set_response({"chain_stats": {"tx_count": 2}}))
+    with pytest.raises(IOError):
+        blkhub_api("mainnet").get_txcount("addr")
+    monkeypatch.setattr(
+        blkhub_api,
+        "getData",
+        set_response({"chain_stats": {"tx_count": 2}, "mempool_stats": {"tx_count": 1}}),
+    )
+    assert blkhub_api("mainnet").get_txcount("addr") == 3
+    monkeypatch.setattr(blockcypher_api, "getData", set_response({"balance": 0}))
+    with pytest.raises(IOError):
+        blockcypher_api("mainnet").get_txcount("addr")
+    monkeypatch.setattr(blockcypher_api, "getData", set_response({"final_n_tx": 0}))
+    assert blockcypher_api("mainnet").get_txcount("addr") == 0
+
+
+def test_spend_from_account(monkeypatch):
+    funded = {
+        seg_address("m/84'/0'/0'/0/2"): [(1, 30000)],
+        seg_address("m/84'/0'/0'/1/0"): [(2, 25000)],
+    }
+    monkeypatch.setattr(BTCwallet, "blkhub_api", lambda network: FakeAPI(funded))
+    device = hd_device()
+    device.derive_key("m/84'/0'/0'/0/0", "K1")
+    wallet = BTC_wallet(0, 2, device, gap_limit=3)
+    assert wallet.get_account() == seg_address("m/84'/0'/0'/0/0")
+    assert wallet.btc.getbalance() == 55000
+    wallet.raw_tx(50000, 1000, seg_address("m/84'/0'/0'/0/9"))
+    tx = cryptolib.coins.deserialize(FakeAPI.pushed[-1])
+    assert len(tx["ins"]) == 2
+    witness_pubkeys = [
+        cryptolib.coins.deserialize_script(wit["scriptCode"])[1] for wit in tx["witness"]
+    ]
+    assert witness_pubkeys == wallet.btc.inputs_pubkeys
+    assert len(set(witness_pubkeys)) == 2
+    # Change to the first unused change address
+    change_script = cryptolib.coins.bitcoin.Bitcoin().addrtoscript(seg_address("m/84'/0'/0'/1/1"))
+    assert tx["outs"][1]["script"] == change_script
+    # Device is back on the wallet key
+    assert device.pvkey.get_public_key(True).hex() == wallet.btc.pubkey
+
+
+def test_spend_ltc_account(monkeypatch):
+    def ltc_address(path):
+        return cryptolib.coins.litecoin.Litecoin().pubtop2w(path_pubkey(path))
+
+    funded = {
+        ltc_address("m/49'/2'/0'/0/0"): [(1, 40000)],
+        ltc_address("m/49'/2'/0'/0/3"): [(2, 30000)],
+    }
+    monkeypatch.setattr(LTCwallet, "blockcypher_api", lambda network: FakeAPI(funded))
+    device = hd_device()
+    device.derive_key("m/49'/2'/0'/0/0", "K1")
+    wallet = LTC_wallet(0, 1, device, gap_limit=4)
+    wallet.ltc.discovery.request_interval = 0
+    assert wallet.ltc.getbalance() == 70000
+    wallet.raw_tx(60000, 2000, ltc_address("m/49'/2'/0'/0/9"))
+    tx = cryptolib.coins.deserialize(FakeAPI.pushed[-1])
+    assert len(tx["ins"]) == 2
+    witness_pubkeys = [
+        cryptolib.coins.deserialize_script(wit["scriptCode"])[1] for wit in tx["witness"]
+    ]
+    assert witness_pubkeys == wallet.ltc.inputs_pubkeys
+    assert sorted(witness_pubkeys) == sorted(
+        [path_pubkey("m/49'/2'/0'/0/0"), path_pubkey("m/49'/2'/0'/0/3")]
+    )
+    change_script = cryptolib.coins.litecoin.Litecoin().addrtoscript(
+        ltc_address("m/49'/2'/0'/1/0")
+    )
+    assert tx["outs"][1]["script"] == change_script
+    assert device.pvkey.get_public_key(True).hex() == wallet.ltc.pubkey
+
+
+def test_spend_doge_account(monkeypatch):
+    def doge_address(path):
+        return cryptolib.coins.dogecoin.Doge().pubtoaddr(path_pubkey(path))
+
+    funded = {
+        doge_address("m/44'/3'/0'/0/1"): [(1, 5 * 10**8)],
+        doge_address("m/44'/3'/0'/1/0"): [(2, 3 * 10**8)],
+    }
+    monkeypatch.setattr(DOGEwallet, "blockcypher_api", lambda network: FakeAPI(funded))
+    device = hd_device()
+    device.derive_key("m/44'/3'/0'/0/0", "K1")
+    wallet = DOGE_wallet(0, 0, device, gap_limit=3)
+    wallet.doge.discovery.request_interval = 0
+    assert wallet.doge.getbalance() == 8 * 10**8
+    wallet.raw_tx(7 * 10**8, 10**7, doge_address("m/44'/3'/0'/0/9"))
+    tx = cryptolib.coins.deserialize(FakeAPI.pushed[-1])
+    assert len(tx["ins"]) == 2
+    # scriptSig : signature, public key
+    script_pubkeys = [
+        cryptolib.coins.deserialize_script(txin["script"])[1] for txin in tx["ins"]
+    ]
+    assert script_pubkeys == wallet.doge.inputs_pubkeys
+    assert sorted(script_pubkeys) == sorted(
+        [path_pubkey("m/44'/3'/0'/0/1"), path_pubkey("m/44'/3'/0'/1/0")]
+    )
+    change_script = cryptolib.coins.mk_pubkey_script(doge_address("m/44'/3'/0'/1/1"))
+    assert tx["outs"][1]["script"] == change_script
+    assert device.pvkey.get_public_key(True).hex() == wallet.doge.pubkey
@@ -0,0 +1,158 @@
+from queue import Queue
+from threading import Event
+from time import perf_counter
+
+import pytest
+
+from wallets.ETHwallet import ETH_wallet
+from wallets.wc_reader import WCReader
+from wallets.wc_sessions import WCSessions, WCSessionError
+
+
+class FakeWCClient:
+    """WalletConnect client with a transport queue of (id, method, params)"""
+
+    def __init__(self):
+        self.data_queue = Queue()
+        self.closed = False
+        self.replies = []
+
+    def get_message(self):
+        if self.data_queue.empty():
+            return (None, "", [])
+        wc_message = self.data_queue.get()
+        if isinstance(wc_message, Exception):
+            raise wc_message
+        return wc_message
+
+    def close(self):
+        self.closed = True
+
+    def reply(self, req_id, result):
+        self.replies.append((req_id, result))
+
+    def reject(self, req_id):
+        self.replies.append((req_id, "rejected"))
+
+
+class Notifier:
+    def __init__(self):
+        self.event = Event()
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        self.event.set()
+
+    def wait(self):
+        assert self.event.wait(5)
+        self.event.clear()
+
+
+def test_reader_dispatch():
+    client = FakeWCClient()
+    reader = WCReader(client, wait_timeout=30)
+    notify = Notifier()
+    reader.start(notify)
+    start = perf_counter()
+    client.data_queue.put((1, "personal_sign", ["0x00", "0x11"]))
+    notify.wait()
+    # Not waiting for the timeout nor a timer period
+    assert perf_counter() - start < 1
+    assert reader.get_message() == (1, "personal_sign", ["0x00", "0x11"])
+    assert reader.get_message() == (None, "", [])
+    # Pings are not dispatched
+    client.data_queue.put((2, "", []))
+    client.data_queue.put((3, "eth_sign", []))
+    notify.wait()
+    assert reader.get_message() == (3, "eth_sign", [])
+    assert reader.get_message() == (None, "", [])
+    reader.close()
+    assert client.closed
+
+
+def test_reader_client_lock():
+    client = FakeWCClient()
+    reader = WCReader(client, wait_timeout=0.05)
+    notify = Notifier()
+    with reader.client_lock:
+        reader.start(notify)
+        client.data_queue.put((1, "eth_sign", []))
+        # The client is used by the wallet, it is not read
+        assert not notify.event.wait(0.3)
+    notify.wait()
+    assert reader.get_message() == (1, "eth_sign", [])
+    reader.stop()
+
+
+def test_reader_error():
+    client = FakeWCClient()
+    reader = WCReader(client, wait_timeout=0.05)
+    notify = Notifier()
+    reader.start(notify)
+    client.data_queue.put(IOError("Connection lost"))
+    notify.wait()
+    with pytest.raises(IOError, match="Connection lost"):
+        reader.get_message()
+    reader.thread.join(5)
+    assert not reader.thread.is_alive()
+
+
+def test_sessions_dispatch():
+    clients = [FakeWCClient() for _ in range(3)]
+    sessions = WCSessions()
+    notify = Notifier()
+    sessions.add(clients[0], "dapp0")
+    sessions.start(notify)
+    # Added after the start, without stopping the others
+    for idx in (1, 2):
+        sessions.add(clients[idx], f"dapp{idx}")
+    for idx, client in enumerate(clients):
+        for req_id in range(2):
+            client.data_queue.put((10 * idx + req_id, "eth_sign", []))
+    while sum(session.reader.messages.qsize() for session in sessions.list_sessions()) < 6:
+        notify.wait()
+    received = []
+    session, wc_message = sessions.get_message()
+    while session is not None:
+        received.append((session.dapp_name, wc_message[0]))
+        session, wc_message = sessions.get_message()
+    # The sessions are served in turn
+    assert [dapp for dapp, _ in received[:3]] == ["dapp0", "dapp1", "dapp2"]
+    assert sorted(received) == [
+        (f"dapp{idx}", 10 * idx + req_id) for idx in range(3) for req_id in range(2)
+    ]
+    sessions.close()
+    assert len(sessions) == 0
+    assert all(client.closed for client in clients)
+
+
+def test_sessions_wallet():
+    wallet = ETH_wallet.__new__(ETH_wallet)
+    wallet.chainID = 1
+    wallet.wc_sessions = WCSessions()
+    wallet.wc_processing = False
+    clients = [FakeWCClient() for _ in range(2)]
+    for idx, client in enumerate(clients):
+        wallet.wc_sessions.add(client, f"dapp{idx}")
+    notify = Notifier()
+    wallet.wc_sessions.start(notify)
+    clients[0].data_queue.put((1, "wallet_switchEthereumChain", [{"chainId": "0x1"}]))
+    clients[1].data_queue.put((2, "wallet_switchEthereumChain", [{"chainId": "0x5"}]))
+    while (
+        sum(session.reader.messages.qsize() for session in wallet.wc_sessions.list_sessions()) < 2
+    ):
+        notify.wait()
+    wallet.get_messages()
+    # Replied to each dapp on its own session
+    assert clients[0].replies == [(1, None)]
+    assert clients[1].replies == [(2, "rejected")]
+    # A dapp disconnecting closes only its session
+    clients[1].data_queue.put((3, "wc_sessionDelete", {"message": "Bye"}))
+    notify.wait()
+    with pytest.raises(WCSessionError, match="Bye") as exc_info:
+        wallet.get_messages()
+    assert exc_info.value.session.dapp_name == "dapp1"
+    assert clients[1].closed
+    assert [session.dapp_name for session in wallet.wc_sessions.list_sessions()] == ["dapp0"]
+    wallet.wc_sessions.close()
@@ -25,72 +25,22 @@ except ImportError:
 
 
 from copy import copy as ccopy
-from importlib import import_module
+from functools import partial
 from logging import basicConfig, DEBUG, getLogger
 from sys import argv
 
 import wx
+from pywalletconnect import WCClientException
 import gui.app
 from gui.utils import file_path
-from gui.galleryapp import Gallery
 from devices.SeedWatcher import start_seedwatcher
 from devices.SingleKey import SKdevice
+from devices.registry import DEVICES_LIST, get_device_module
+from wallets import http_transport
+from wallets.http_cassette import Cassette, RECORD
+from wallets.registry import SUPPORTED_COINS, LEDGER_EVM_LIST, NFT_LIST, get_coin_class
 from wallets.wallets_utils import InvalidOption, NotEnoughTokens
-from wallets.NFTwallet import NFTWallet
-
-SUPPORTED_COINS = [
-    "BTC",
-    "ETH",
-    "BSC",
-    "MATIC",
-    "TRX",
-    "FTM",
-    "OP",
-    "BASE",
-    "METIS",
-    "CELO",
-    "GLMR",
-    "ARB",
-    "AVAX",
-    "LTC",
-    "DOGE",
-    "EOS",
-    "XTZ",
-    "SOL",
-]
-
-LEDGER_EVM_LIST = [
-    "ETH",
-    "BSC",
-    "MATIC",
-    "FTM",
-    "OP",
-    "BASE",
-    "METIS",
-    "CELO",
-    "GLMR",
-    "ARB",
-    "AVAX",
-]
-
-NFT_LIST = [
-    "ETH",
-    "MATIC",
-    "BSC",
-    "OP",
-    "BASE",
-    "ARB",
-    "AVAX",
-]
-
-DEVICES_LIST = [
-    "SeedWatcher",
-    "LocalFile",
-    "Ledger",
-    "Cryptnox",
-    "OpenPGP",
-    "Satochip",
-]
+from wallets.wc_sessions import WCSessionError
 
 DEFAULT_PASSWORD = "NoPasswd"
 
@@ -98,34 +48,14 @@ DEFAULT_PASSWORD = "NoPasswd"
 logger = getLogger(__name__)
 
 
-wallets = {}
-for coin_lib in SUPPORTED_COINS:
-    wallets[f"{coin_lib}wallet"] = import_module(f"wallets.{coin_lib}wallet")
-
-
-def get_coin_class(coin_name):
-    cname = coin_name
-    if coin_name == "ARB/ETH":
-        cname = "ARB"
-    if coin_name == "OP/ETH":
-        cname = "OP"
-    if coin_name == "BASE/ETH":
-        cname = "BASE"
-    return getattr(wallets[f"{cname}wallet"], f"{cname}_wallet")
-
-
-devices = {}
-for device_name in DEVICES_LIST:
-    devices[device_name] = import_module(f"devices.{device_name}")
-
-
 def get_device_class(device_str):
     global pwdException, NotinitException
-    device_class = getattr(devices[device_str], device_str)
+    device_module = get_device_module(device_str)
+    device_class = getattr(device_module, device_str)
     pwdException = ValueError  # Fake value to filter out
     if device_class.has_password:
-        pwdException = getattr(devices[device_str], "pwdException")
-    NotinitException = getattr(devices[device_str], "NotinitException")
+        pwdException = getattr(device_module, "pwdException")
+    NotinitException = getattr(device_module, "NotinitException")
     return device_class
 
 
@@ -158,13 +88,22 @@ def tx_success(message):
 
 
 def watch_messages():
-    """Watch for messages received.
-    For some wallet types such as WalletConnect.
+    """Process the messages received.
+    For some wallet types such as WalletConnect, called by the reader.
     """
+    if not hasattr(app, "wallet") or not hasattr(app.wallet, "wc_sessions"):
+        # Wallet closed since the messages were read
+        return
     try:
         app.wallet.get_messages()
     except NotEnoughTokens as exc:
         app.warn_modal(str(exc))
+    except WCSessionError as exc:
+        if len(app.wallet.wc_sessions) > 0:
+            # Other dapps are still connected
+            app.warn_modal(f"{exc.session.dapp_name} :\n{exc}")
+            return
+        wallet_error(exc, "fromwatch")
     except Exception as exc:
         if str(exc).startswith("You rejected the"):
             app.warn_modal(str(exc))
@@ -172,6 +111,19 @@ def watch_messages():
         wallet_error(exc, "fromwatch")
 
 
+def pair_dapp(network):
+    """Connect one more dapp to the WalletConnect wallet, with the same key"""
+    wc_option = app.wallet.options_data[app.wallet.user_options.index(2)]
+    wc_uri = app.get_option(network, wc_option["prompt"], None)
+    if wc_uri is None:
+        return
+    try:
+        app.wallet.connect_dapp(wc_uri)
+    except (InvalidOption, WCClientException, IOError) as exc:
+        # The dapps already connected are kept
+        app.warn_modal(f"Dapp pairing error :\n{exc}")
+
+
 def close_device():
     if hasattr(app, "device"):
         del app.device
@@ -516,6 +468,18 @@ def wallet_error(exc, level="hard"):
     app.warn_modal(str(exc))
 
 
+def owned_tokens_scanner(coin_class, network):
+    """Preset tokens scan of the displayed wallet, when it is the native wallet of the chain"""
+    wallet = getattr(app, "wallet", None)
+    if (
+        type(wallet) is coin_class
+        and wallet.network == coin_class.networks[network].lower()
+        and not wallet.eth.contract
+    ):
+        return wallet.scan_tokens
+    return None
+
+
 def set_coin(coin, network, wallet_type):
     try:
         option_info = None
@@ -528,7 +492,13 @@ def set_coin(coin, network, wallet_type):
                 opt_idx = coin_class.user_options.index(wallet_type)
                 option_info = coin_class.options_data[opt_idx]
                 option_preset = option_info.get("preset")
-                option_value = app.get_option(network, option_info["prompt"], option_preset)
+                scan_owned = None
+                if "ERC20" in coin_class.wtypes and wallet_type == 1:
+                    # The tokens owned are listed first
+                    scan_owned = owned_tokens_scanner(coin_class, network)
+                option_value = app.get_option(
+                    network, option_info["prompt"], option_preset, scan_owned
+                )
                 if option_value is None:
                     wx.CallAfter(wallet_fallback)
                     return
@@ -556,9 +526,6 @@ def set_coin(coin, network, wallet_type):
         if not app.check_coin_consistency(network_num=network):
             return
         app.gui_panel.btn_chkaddr.Enable()
-        if option_info is not None and option_info.get("use_get_messages", False):
-            app.wallet.wc_timer = wx.Timer()
-            app.wallet.wc_timer.Notify = watch_messages
     except InvalidOption as exc:
         app.warn_modal(str(exc))
         wx.CallAfter(wallet_fallback)
@@ -593,13 +560,18 @@ def set_coin(coin, network, wallet_type):
             btn = app.token_started()
             btn.Bind(wx.EVT_BUTTON, call_return)
         if wallet_type == 2:
-            btn = app.wc_started()
+            btn, btn_pair = app.wc_started()
             btn.Bind(wx.EVT_BUTTON, call_return)
+            btn_pair.Bind(wx.EVT_BUTTON, lambda evt: pair_dapp(network))
         if wallet_type == 3:
             # NFT
             app.gui_panel.fiat_panel.Hide()
             if hasattr(app.gui_panel, "fiat_price"):
                 del app.gui_panel.fiat_price
+            # Imported when used, with the gallery GUI
+            from gui.galleryapp import Gallery
+            from wallets.NFTwallet import NFTWallet
+
             nft_wallet = NFTWallet(app.wallet)
             app.gui_frame.Hide()
             Gallery(app.gui_frame, nft_wallet, call_return)
@@ -621,8 +593,9 @@ def display_coin(account_addr):
     app.gui_panel.account_addr.Layout()
     app.balance_timer = DisplayTimer()
     app.balance_timer.Start(12000)
-    if hasattr(app.wallet, "wc_timer"):
-        app.wallet.wc_timer.Start(1200, oneShot=wx.TIMER_CONTINUOUS)
+    if hasattr(app.wallet, "wc_sessions"):
+        # Messages processed in the GUI thread as soon as read
+        app.wallet.wc_sessions.start(partial(wx.CallAfter, watch_messages))
     app.gui_frame.Refresh()
     app.gui_frame.Update()
     app.gui_frame.Layout()
@@ -749,4 +722,20 @@ if __name__ == "__main__":
     if "-v" in argv[1:]:
         basicConfig(level=DEBUG)
 
+    if "--clear-cache" in argv[1:]:
+        from wallets.nft_images import clear_caches
+
+        clear_caches()
+
+    cassette = None
+    if "--record" in argv[1:-1]:
+        # Record the HTTP requests into a cassette file, to replay them in the benchmarks.
+        # An existing file is replaced only with --overwrite.
+        cassette = Cassette(
+            argv[argv.index("--record") + 1], RECORD, overwrite="--overwrite" in argv[1:]
+        )
+        http_transport.set_transport_hook(cassette)
+
     app.MainLoop()
+    if cassette is not None:
+        cassette.close()
@@ -1,3031 +0,0 @@
-# Uniblow ERC20 list for Arbitrum generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "Tether USD (USDT)": "0xFd086bC7CD5C481DCC9C85ebE478A1C0b69FCbb9",
-        "USD Coin (USDC)": "0xFF970A61A04b1cA14834A43f5dE4533eBDDB5CC8",
-        "Uniswap (UNI)": "0xFa7F8980b0f1E64A2062791cc3b0871572f1F7f0",
-        "Dai Stablecoin (DAI)": "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
-        "Wrapped BTC (WBTC)": "0x2f2a2543B76A4166549F7aaB2e75Bef0aefC5B0f",
-        "ChainLink Token (LINK)": "0xf97f4df75117a78c1A5a0DBb814Af92458539FB4",
-        "Lido DAO Token (LDO)": "0x13Ad51ed4F1B7e9Dc168d8a00cB3f4dDD85EfA60",
-        "Graph Token (GRT)": "0x9623063377AD1B27544C965cCd7342f7EA7e88C7",
-        "TrueUSD (TUSD)": "0x4D15a3A2286D883AF0AA1B3f21367843FAc63E07",
-        "Frax (FRAX)": "0x17FC002b466eEc40DaE837Fc4bE5c67993ddBd6F",
-        "LUNC (LUNC)": "0x1A4dA80967373fd929961e976b4b53ceeC063a15",
-        "Frax Share (FXS)": "0x9d2F299715D94d8A7E6F5eaa8E654E8c74a988A7",
-        "Curve DAO Token (CRV)": "0x11cDb42B0EB46D95f990BeDD4695A6e3fA034978",
-        "Decentralized USD (USDD)": "0x680447595e8b7b3Aa1B43beB9f6098C79ac2Ab3f",
-        "GMX (GMX)": "0xfc5A1A6EB076a2C7aD06eD22C90d7E710E35ad0a",
-        "LoopringCoin V2 (LRC)": "0x46d0cE7de6247b0A95f67b43B589b4041BaE7fbE",
-        "Compound (COMP)": "0x354A6dA3fcde098F8389cad84b0182725c6C91dE",
-        "yearn.finance (YFI)": "0x82e3A8F066a6989666b031d916c43672085b1582",
-        "Balancer (BAL)": "0x040d1EdC9569d4Bab2D15287Dc5A4F10F56a56B8",
-        "Gnosis Token (GNO)": "0xa0b862F60edEf4452F25B4160F177db44DeB6Cf1",
-        "TerraUSD (USTC)": "0x13780E6d5696DD91454F6d3BbC2616687fEa43d0",
-        "SushiToken (SUSHI)": "0xd4d42F0b6DEF4CE0383636770eF773390d85c61A",
-        "Synapse (SYN)": "0x080F6AEd32Fc474DD5717105Dba5ea57268F46eb",
-        "Gains Network (GNS)": "0x18c11FD286C5EC11c3b683Caa813B77f5163A122",
-        "Multichain (MULTI)": "0x9Fb9a33956351cf4fa040f65A13b835A3C8764E3",
-        "Livepeer Token (LPT)": "0x289ba1701C2F088cf0faf8B3705246331cB8A839",
-        "Frax Ether (frxETH)": "0x178412e79c25968a32e89b11f63B33F733770c2A",
-        "StargateToken (STG)": "0x6694340fc020c5E6B96567843da2df01b2CE1eb6",
-        "UMA Voting Token v1 (UMA)": "0xd693Ec944A85eeca4247eC1c3b130DCa9B0C3b22",
-        "Kyber Network Crystal v2 (KNC)": "0xe4DDDfe67E7164b0FE14E218d80dC4C08eDC01cB",
-        "CelerToken (CELR)": "0x3a8B787f78D775AECFEEa15706D4221B40F345AB",
-        "Magic Internet Money (MIM)": "0xFEa7a6a0B346362BF88A9e4A88416B77a57D6c2A",
-        "Cartesi Token (CTSI)": "0x319f865b287fCC10b30d8cE6144e8b6D1b476999",
-        "COTI Token (COTI)": "0x6FE14d3CC2f7bDdffBa5CdB3BBE7467dd81ea101",
-        "DODO bird (DODO)": "0x69Eb4FA4a2fbd498C257C57Ea8b7655a2559A581",
-        "Marlin POND (POND)": "0xdA0a57B710768ae17941a9Fa33f8B720c8bD9ddD",
-        "JoeToken (JOE)": "0x371c7ec6D8039ff7933a2AA28EB827Ffe1F52f07",
-        "Spell Token (SPELL)": "0x3E6648C5a70A150A88bCE65F4aD4d506Fe15d2AF",
-        "Badger (BADGER)": "0xBfa641051Ba0a0Ad1b0AcF549a89536A0D76472E",
-        "Perpetual (PERP)": "0x753D224bCf9AAFaCD81558c32341416df61D3DAC",
-        "Radiant (RDNT)": "0x0C4681e6C0235179ec3D4F4fc4DF3d14FDD96017",
-        "Automata (ATA)": "0xAC9Ac2C17cdFED4AbC80A53c5553388575714d03",
-        "Synth sUSD (sUSD)": "0xA970AF1a584579B618be4d69aD6F73459D112F95",
-        "Lyra Token (LYRA)": "0x079504b86d38119F859c4194765029F692b7B7aa",
-        "VelaToken (VELA)": "0x088cd8f5eF3652623c22D48b1605DCfE860Cd704",
-        "Mai Stablecoin (MAI)": "0x3F56e0c36d275367b8C502090EDF38289b3dEa0d",
-        "BarnBridge Governance Token (BOND)": "0x0D81E50bC677fa67341c44D7eaA9228DEE64A4e1",
-        "DIAToken (DIA)": "0x39f91452a6E9994762876e1EDd87Be28a46d5c99",
-        "agEUR (agEUR)": "0xFA5Ed56A203466CbBC2430a43c66b9D8723528E7",
-        "Route (ROUTE)": "0x5298060A95205BE6Dd4aBc21910A4bB23D6DCD8b",
-        "MATH Token (MATH)": "0x99F40b01BA9C469193B360f72740E416B17Ac332",
-        "dForce (DF)": "0xaE6aab43C4f3E0cea4Ab83752C278f8dEbabA689",
-        "MCDEX Token (MCB)": "0x4e352cF164E64ADCBad318C3a1e222E9EBa4Ce42",
-        "UniBright (UBT)": "0x2aD62674A64E698C24831Faf824973C360430140",
-        "Camelot token (GRAIL)": "0x3d9907F9a368ad0a51Be60f7Da3b97cf940982D8",
-        "Cap (CAP)": "0x031d35296154279DC1984dCD93E392b1f946737b",
-        "Pendle (PENDLE)": "0x0c880f6761F1af8d9Aa9C466984b80DAb9a8c9e8",
-        "Strips Token (STRP)": "0x326c33FD1113c1F29B35B4407F3d6312a8518431",
-        "Stake DAO Token (SDT)": "0x7bA4a00d54A07461D9DB2aEF539e91409943AdC9",
-        "Fuse Token (FUSE)": "0xBDeF0E9ef12E689F366fe494A7A7D0dad25D9286",
-        "Tokenlon (LON)": "0x55678cd083fcDC2947a0Df635c93C838C89454A3",
-        "DeversiFi Token (DVF)": "0xA7Aa2921618e3D63dA433829d448b58C9445A4c3",
-        "OpenOcean (OOE)": "0x30424981429C8B944e9D44D5BD992EE874F1B188",
-        "Jones DAO (JONES)": "0x10393c20975cF177a3513071bC110f7962CD67da",
-        "Buffer Token (BFR)": "0x1A5B0aaF478bf1FDA7b934c76E7692D722982a6D",
-        "Hop (HOP)": "0xc5102fE9359FD9a28f877a67E36B0F050d81a3CC",
-        "DFYN Token (DFYN)": "0x1D54Aa7E322e02A0453c0F2fA21505cE7F2E9E93",
-        "Cream (CREAM)": "0xf4D48Ce3ee1Ac3651998971541bAdbb9A14D7234",
-        "GOVI (GOVI)": "0x07E49d5dE43DDA6162Fa28D24d5935C151875283",
-        "OVR (OVR)": "0x55704A0e9E2eb59E176C5b69655DbD3DCDCFc0F0",
-        "handleFOREX (FOREX)": "0xDb298285FE4C5410B05390cA80e8Fbe9DE1F259B",
-        "Hamachi (HAMI)": "0x02150e97271fDC0D6E3A16d9094A0948266F07dD",
-        "Plutus (PLS)": "0x51318B7D00db7ACc4026C88c3952B66278B6A67F",
-        "Popcorn (POP)": "0x68eAd55C258d6fa5e46D67fc90f53211Eab885BE",
-        "Deri (DERI)": "0x21E60EE73F17AC0A411ae5D690f908c3ED66Fe12",
-        "Rari Governance Token (RGT)": "0xef888bcA6AB6B1d26dbeC977C455388ecd794794",
-        "Antimatter.Finance Governance Token (MATTER)": "0xaaA62D9584Cbe8e4D68A43ec91BfF4fF1fAdB202",
-        "Zyber Token (ZYB)": "0x3B475F6f2f41853706afc9Fa6a6b8C5dF1a2724c",
-        "Vesta (VSTA)": "0xa684cd057951541187f288294a1e1C2646aA2d24",
-        "Flashstake (FLASH)": "0xc628534100180582E43271448098cb2c185795BD",
-        "PickleToken (PICKLE)": "0x965772e0E9c84b6f359c8597C891108DcF1c5B1A",
-        "TND (TND)": "0xC47D9753F3b32aA9548a7C3F30b6aEc3B2d2798C",
-        "DigitalDollar (DUSD)": "0xF0B5cEeFc89684889e5F7e0A7775Bd100FcD3709",
-        "O3 Swap Token (O3)": "0xEe9801669C6138E84bD50dEB500827b776777d28",
-        "Connect Financial (CNFI)": "0x6F5401c53e2769c858665621d22DDBF53D8d27c5",
-        "Rigo Token (GRG)": "0x7F4638A58C0615037deCc86f1daE60E55fE92874",
-        "0xBitcoin Token (0xBTC)": "0x7cb16cb78ea464aD35c8a50ABF95dff3c9e09d5d",
-        "GoBlank Token (BLANK)": "0xA5eC9d64b64b8B9E94FEaA7538c084b38117E7Ba",
-        "Meta (MTA)": "0x5298Ee77A8f9E226898403eBAC33e68a62F770A0",
-        "BetSwirl Token (BETS)": "0xe26Ae3d881f3d5dEF58D795f611753804E7A6B26",
-        "ROOBEE (ROOBEE)": "0x3BD2dFd03BC7c3011ed7fb8c4d0949B382726cee",
-        "Doubloon Token (DBL)": "0xd3f1Da62CAFB7E7BC6531FF1ceF6F414291F03D3",
-        "Hundred Finance (HND)": "0x10010078a54396F62c96dF8532dc2B4847d47ED3",
-        "Agave (AGVE)": "0x848e0BA28B637e8490D88BaE51fA99C87116409B",
-        "Alchemy (ALCH)": "0x0e15258734300290a651FdBAe8dEb039a8E7a2FA",
-        "YIN Finance (YIN)": "0x794Baab6b878467F93EF17e2f2851ce04E3E34C8",
-        "Aluna (ALN)": "0x9b3fa2A7C3EB36d048A5d38d81E7fAFC6bc47B25",
-        "BAC (BAC)": "0x6F67043201C903bbCBC129750CB3b328Dd56a0a5",
-        "Auctus Token (AUC)": "0xea986d33eF8a20A96120ecc44dBdD49830192043",
-        "Flux (FLUX)": "0xF80D589b3Dbe130c270a69F1a69D050f268786Df",
-    }
-]
-
-
-nfts_values = [
-    # Mainnet
-    {},
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/42161/erc20.json
-ledger_tokens = {
-    "0x7cb16cb78ea464ad35c8a50abf95dff3c9e09d5d": {
-        "ticker": "0XBTC",
-        "signature": "3045022100d890d94d333e953fd31badd5992226928ee7ff2a05173d934d90bbbd9894e69c022079173f6cebf39828708d4a3ed066e4084c70d2d3114b320211469599ce5240f7",
-    },
-    "0xc8a1c0d8255bc2eb5f6236e119e3428fd0c33a74": {
-        "ticker": "10SHARE",
-        "signature": "304402201d8bedba53c1acd91cf1f7dd7922e8519eb83be83d3577a5ee113e0a4280b9490220272b28d60c4433b30c7f1919542fcf31ee936661a5688e3b4943a04b9b37dea3",
-    },
-    "0xab9ec601b82a22fbf2b030ac0dd7c1c34f52fa04": {
-        "ticker": "1MB",
-        "signature": "304402202821fd1b8a367d127342dcf8ff72ed6cc12b2061470a6183eb7ba019fdc20f91022034b9cc87c26c9f0c4d7ccd630e67e2fab198dbb79dacb2378a18f46b16a2a196",
-    },
-    "0xd2568accd10a4c98e87c44e9920360031ad89fcb": {
-        "ticker": "XCAL",
-        "signature": "304402206397a4c69ff67a5acf616a6cf990c810596ae3474fb2422cde13a877799d885802201d31dbd165257a241bccb781a32187ca52148063b4521bf3c09e25b56e4fca03",
-    },
-    "0xf329e36c7bf6e5e86ce2150875a84ce77f477375": {
-        "ticker": "AARBAAVE",
-        "signature": "3045022100c7bd912f15f7588a3d8b3d847d18ce9a2d86353ab89cb9f602934587bed7d1c902206f90bdfb374eea9d3ca8dc9667b54229e776711a3cc59573b80bcc6f5987ede0",
-    },
-    "0x6533afac2e7bccb20dca161449a13a32d391fb00": {
-        "ticker": "AARBARB",
-        "signature": "3044022021020936a45c59962f9b725a3771a9f0c609bcc3767e124931b7f979b24c81a302202e03a6ad8257387e76e2c350502edbbe0fe0c6c47483de4e61ab3167d73b2ada",
-    },
-    "0x82e64f49ed5ec1bc6e43dad4fc8af9bb3a2312ee": {
-        "ticker": "AARBDAI",
-        "signature": "304402207c1355119018cd86e0c22db32355f49875f6711cf366da49ea2186c1a89ff01702207ce1c415450ca045292d77b2f74ae427738213d733c9cfb0eceea616decc1485",
-    },
-    "0x6d80113e533a2c0fe82eabd35f1875dcea89ea97": {
-        "ticker": "AARBEURS",
-        "signature": "30450221008e362dbeae80bb6552ae7596c065dc2a8885a37379a08097306adfdadd4b24ba022054336694dee7d7bbb236c6703f2d0ba0dbf078aa98cd942b495576601f63e679",
-    },
-    "0x38d693ce1df5aadf7bc62595a37d667ad57922e5": {
-        "ticker": "AARBFRAX",
-        "signature": "3044022063fab44900477fd9298ec0faebc27da7ff55270409d3ed1a0b9f70699c105edb022040d7d64d0965ec9a0cb38ff3f3699d295be26383ade328b87c7e827c8d4fcacd",
-    },
-    "0x191c10aa4af7c30e871e70c95db0e4eb77237530": {
-        "ticker": "AARBLINK",
-        "signature": "3045022100f0eb497820729d644b95e895c17ff027341ee47fd0879791efad817de7c0ee080220455204303b7e59a0003d10ee69df86b1c0c0a0a04bd7d3d807c7ba388594bbc9",
-    },
-    "0x8ffdf2de812095b1d19cb146e4c004587c0a0692": {
-        "ticker": "AARBLUSD",
-        "signature": "304402204899d7ae67894e6fad3b2d6e9d284c9372a4fa377036e2163e0853de7996ba3a0220616731e072e000dc1a1d370e7cf89cf2afcb9ed981700029ce1f993c2bc6cef2",
-    },
-    "0x8eb270e296023e9d92081fdf967ddd7878724424": {
-        "ticker": "AARBRETH",
-        "signature": "304402201c5ac26aa895b551b13140573af98cb6071b41866d2c027ee4144c797e0a33630220230bf257f37e2ffd54ec789b7a189f38bb85b341d7699eb04baf8ee8380078ba",
-    },
-    "0x625e7708f30ca75bfd92586e17077590c60eb4cd": {
-        "ticker": "AARBUSDC",
-        "signature": "304402207342353490b871d177de5bdf10a8df5561e19b01461ed9dfd1897540e978eea2022045f847f01112188e2bb4b4c9342997641366606267fef823851704b102e0be1b",
-    },
-    "0x724dc807b04555b71ed48a6896b6f41593b8c637": {
-        "ticker": "AARBUSDCN",
-        "signature": "3045022100c746cd8105ae85edfbb73672ad0eb2adf76f299cba5816093d2ef0693fd0b2ef02205d08e1beed0b81a7d1cc05043c367f067bbf0f9331366bb69a9f2cb4b2f6e8c6",
-    },
-    "0x6ab707aca953edaefbc4fd23ba73294241490620": {
-        "ticker": "AARBUSDT",
-        "signature": "304502210090947fc63f4e8a08bd0b2aaad6931c40cc9695e93e2d55ea1ce1205a27be20910220032e0c0d6bc7cd390b7801364fb551bc4f71f3dbb907317170f6ba0211d66b03",
-    },
-    "0x078f358208685046a11c85e8ad32895ded33a249": {
-        "ticker": "AARBWBTC",
-        "signature": "3045022100d45d74b0d947bd806ccdd51a6ea623306ec15aeaa38e0dc87e29213a8195d9d5022047bb55ec345f7da2afcf8719e8b2bbc3db94f3e7d543e083a7d5e603ba2d3463",
-    },
-    "0xe50fa9b3c56ffb159cb0fca61f5c9d750e8128c8": {
-        "ticker": "AARBWETH",
-        "signature": "3044022025fe238d31beca9e02d2a4622efa2b1b2884e8584827518ad0db9b1d1415beba02206e5e8edd661bf18672848a2df858bec2c2343261785252799ae58eec88644b60",
-    },
-    "0x513c7e3a9c69ca3e22550ef58ac1c0088e918fff": {
-        "ticker": "AARBWSTETH",
-        "signature": "3045022100a423bf6ed0e3370c424b0981e74ff529e2a281f984eaf6decd940fe4e0c24c89022044af7a13a4bef9864336be49cba6772d3843525eb31d0601967b7c2e7c9ecbd8",
-    },
-    "0xb827710314a05bcbee9180e11c2abe5823289422": {
-        "ticker": "ABI",
-        "signature": "3045022100bc4a4c44ff2e49c18a4f81121a5da9f0ffc361ff046d22a02c99343a8ab9e4bb02205a963c90adf4de703f51cc04543a132e347a246f5f71f51a86fd6f01016218c2",
-    },
-    "0xb0ecc6ac0073c063dcfc026ccdc9039cae2998e1": {
-        "ticker": "AA",
-        "signature": "3045022100c60ca0b33ac82d131e1973a9c3be6551d2039880f78c73f4d53fc4f2e0c17abb0220764f305f0d435ee47dd6ed4bf4f1584f9e83454046371a0b4c42e75bf31d3373",
-    },
-    "0x29c1ea5ed7af53094b1a79ef60d20641987c867e": {
-        "ticker": "ACID",
-        "signature": "3045022100897b54a1c18e5fdf1b6a5a920e5e0d16c1d7bc18fd8800596bae168e1922f4340220174595d70f0f6678bb582a8983146a7e55fc1678b421231ab9cec7ea96dc9ecf",
-    },
-    "0x53691596d1bce8cea565b84d4915e69e03d9c99d": {
-        "ticker": "ACX",
-        "signature": "3045022100b885cfd4435bda0a2cbd5781e033cfa5bac79a37d1fce4a622b365b42caf09540220593597fe71dae462b4b71231364821385b6088e8234d720457f2fca445bcfe20",
-    },
-    "0x8888888888f004100c0353d657be6300587a6ccd": {
-        "ticker": "ACS",
-        "signature": "304402202289a921f05a41844350a9dc4562f31a4942b3d398cce73b55bb18c7180c2a4e0220458714a38148f1298b198c9a3292257e301cd81009407daebe252e76fc04fafe",
-    },
-    "0xd8f728adb72a46ae2c92234ae8870d04907786c5": {
-        "ticker": "AMD.D",
-        "signature": "3045022100ae3ba74bc540ac643dcdcb661dad0ea94d42e80afba5a989cd9667eeb9d9f02702200b1a34ea24b3f03f8c9ab1b24432e9d9c3e34b5b4aff76422336ca3cc93b5e72",
-    },
-    "0x848e0ba28b637e8490d88bae51fa99c87116409b": {
-        "ticker": "AGVE",
-        "signature": "3044022070dd24f4cfcfc233141d3d399da41d9b82efb64411a7238c4b694eb46b29575502201fa8e29d41e33946ba76a2b73af207f97752a911c6e15855217df33d55dd7d3f",
-    },
-    "0xfa5ed56a203466cbbc2430a43c66b9d8723528e7": {
-        "ticker": "AGEUR",
-        "signature": "304402205375af7e27e7517c96375be197f3ca01db3912862793e83a407f1b0049ff1f960220203bf949a5e504a2e560f74afda1c8e87ebe5ebc24f97a66a8c327561e719052",
-    },
-    "0x0d8f04522c5792c7378e39c92ab348f315f4fc4f": {
-        "ticker": "AIEN",
-        "signature": "30450221008445152dcdaec1003173f099ae3d0ccda4dd09826e22eef2bfb803ddb944000d02200a926601cfdcc02f9560020e63dde1d5cab3603e9465e8a837874b9461567fce",
-    },
-    "0x299142a6370e1912156e53fbd4f25d7ba49ddcc5": {
-        "ticker": "AMC",
-        "signature": "30450221008d70a5e43fb54dd7f941f5e671bedb9be2c21396ad077ceffdafc9baba062fdd0220326d8c3a58ffaedf640d58954757c2f353218a97add9bbcdd8889e95046bd0bb",
-    },
-    "0x7c8a1a80fdd00c9cccd6ebd573e9ecb49bfa2a59": {
-        "ticker": "AICODE",
-        "signature": "3043021f2ed99d953388ed608e16e09c9ac4f78dd532c04185b065d1a5b255b60a29e3022028fef4b7b11841c129fc5f710bc8b78ac79dfc1f62934084c096376fb752c79d",
-    },
-    "0x1aae7de64d9ae1487e95858bbf98185f21e926fd": {
-        "ticker": "AICORE",
-        "signature": "3045022100811f4d3d87a0eb44cd348df97dc7f730e04085f026efc74d10c003aeeddcf16302200de9bb06fcf75a506afa762bb68b569648a1b8024bc77dd68cc224a46b434ca2",
-    },
-    "0x09e18590e8f76b6cf471b3cd75fe1a1a9d2b2c2b": {
-        "ticker": "AIDOGE",
-        "signature": "30450221008088229e8d70e48aa217fc70669d87680a71856d4831b20f6c7e33a0fbd778ae022019a6631412fa317884c85e9d01f4be85cb2b5abfe21055c6fe438e0ad7ce8386",
-    },
-    "0x72bd2bc9ad82c010434a5c4b5322ae18ac4f0087": {
-        "ticker": "AIPEOPLE",
-        "signature": "3045022100d92f22f98a9d5bb636a3a813df05a32a85fa00e70f17e7c78733d436975e4e3702204696e8a3763e6076bef61863fdbe51f4966e9a9aa66e9789e26e65f85b81fc66",
-    },
-    "0x284592a004d945f98de5b040808578c61a4bb39a": {
-        "ticker": "AIR",
-        "signature": "3045022100c815aee8ad02b46d98084774cb7eedd1f59481da308961f791df0deb8821898c0220569c35811ccb0a2fa5acc1a7709b8b60bcb5109b53782cb5d706b998487fbd1a",
-    },
-    "0xf1a82bfa7fceb8b8741e7e04a6b8efd348ca6393": {
-        "ticker": "AISHIB",
-        "signature": "304402201d87704bb6f4f9d8dfe03c30708ab313837ec79bc722a523e1c6f9748a0cd84002200350f5afae3e5356902976049132491b45d0e3b55c6bd5258f68789c3efdb248",
-    },
-    "0x493070ef5280e7a275a106a30b0414dbdb21febd": {
-        "ticker": "AISP",
-        "signature": "304402203313a29457703f4ff4b418dce2deb48794ba87296f2aa484222421237bd367600220261160e8683588d8b50fa4ee84a047fb655a263f71e2b296b7a21df53b89dc60",
-    },
-    "0x9578a9937dff45b4e29e49120ab83cb806f1aa4f": {
-        "ticker": "AITOM",
-        "signature": "3045022100fe932f7d74eb1bebb8259ba0c0fc600633e04224999173149580d82d53a8a4a6022013032aa3c1fce0e91d458fe0d17f4a7bf8b0e897392a1595fd493ad8fd28092a",
-    },
-    "0x0e15258734300290a651fdbae8deb039a8e7a2fa": {
-        "ticker": "ALCH",
-        "signature": "3045022100a9e0db24d04c2a07aece29855e044ed497893ea52adaca5a95e1428cd46db1d102207f6876900c31c27c69e974c9c6757a81b4d271ed0a841f71011d8f9e379535da",
-    },
-    "0x6740acb82ac5c63a7ad2397ee1faed7c788f5f8c": {
-        "ticker": "ALIEN",
-        "signature": "3044022060e8c02e160c34f3231daac74cbd458faf2e612c9a7c0e5a389111ab41dbda7602202b212fe4f9b1ab546dccba8db62e075883cb7090c62f41eb5b7c9f3c0178736c",
-    },
-    "0x498c620c7c91c6eba2e3cd5485383f41613b7eb6": {
-        "ticker": "AMKT",
-        "signature": "30440220320d2a6ab4f5475aac0b4a631a3d3f218010467a55ec234f8e683e541be6a02e022033b873141c2c02e96342dcba42ad6839d778d425373ff30aef9045544507e3e9",
-    },
-    "0xb49b6a3fd1f4bb510ef776de7a88a9e65904478a": {
-        "ticker": "ALP",
-        "signature": "30450221009b04edb8b021b584483a922e71ad9c2cca93a6f32dc715c0050f269da41a3602022069ea5ba4cc1ba6955c38e0e3fd7589f4df2c89e042b158d82f8e8398d8e2422f",
-    },
-    "0x8e50d11a54cff859b202b7fe5225353be0646410": {
-        "ticker": "GOOGL.D",
-        "signature": "304402202cc7f55d03347ff07ae71374a5815ea55ed0b63ceedc742b524cb8857f24db1e022004375657928b6e85a738cf08007dfa1c17133c32408659c8c8d1e9b9ad3e657e",
-    },
-    "0x1b8d516e2146d7a32aca0fcbf9482db85fd42c3a": {
-        "ticker": "ASCN",
-        "signature": "30450221008385db7465f17750f79edc4f9f5594e39c3cb1bf594df1d9bfcf61e8df286eb502207f0629ea34098fb1df177d15e7ef07cb79c829fa641fb7154ca3bca88eedf573",
-    },
-    "0xb2d948be3a74ecce80378d4093e6cd7f4dc1cf9c": {
-        "ticker": "AMX",
-        "signature": "3045022100807d264b7eea7fdef394f052433e88de08725433538bfd703eb30d17105e96ef02204b08b23ca4f97ef602876836e2f74d76e069ba9edea6f2669d6a402b784eb4df",
-    },
-    "0x8929e9dbd2785e3ba16175e596cdd61520fee0d1": {
-        "ticker": "ALTD",
-        "signature": "3044022007d57a87965cb4522596934c8f69e4143f5e7ebc3510776564c83e9b31c83572022079bd603c1a225996089a305bc0a5d185700018b43a585e1565824f524247ca06",
-    },
-    "0x9b3fa2a7c3eb36d048a5d38d81e7fafc6bc47b25": {
-        "ticker": "ALN",
-        "signature": "3045022100bf2d5f6af51be4730a99dc88a81c2202550ce83f9fe41a7c2f75f374c8755f89022079b2e51774ae7e4609c8c8c788f96921964b61c8129cc1c9148ee090aa589f31",
-    },
-    "0x8240affe697cde618ad05c3c8963f5bfe152650b": {
-        "ticker": "AMZN.D",
-        "signature": "3045022100ac7cdf24a9f491031847a4cbbe1b49a06b5e785f021391187c81d7911d9e0ee40220316b4323c8d941962894b8b1ac468d599b5b2eb29ae1d4b577273d77780edd08",
-    },
-    "0x10663b695b8f75647bd3ff0ff609e16d35bbd1ec": {
-        "ticker": "$AGG",
-        "signature": "304402200a8cc2efdd35156a7466309bd2607d4d5f1b917a62eec08d9e487e42ed460e000220365c7a4468092eabc91257a1431ab8a675eb16cc4724f3dc7ea388e033b40f10",
-    },
-    "0x0000206329b97db379d5e1bf586bbdb969c63274": {
-        "ticker": "AGUSD",
-        "signature": "304402204eb2a226151499e29527cbaeb147aa0aacccc85e7f7eb6ec98ec44cebbc0d85102202a61188d0245c662571f1ee7df81f2e792c4e96fbe4d08a9f4b08ef7a244fd52",
-    },
-    "0xccd05a0fcfc1380e9da27862adb2198e58e0d66f": {
-        "ticker": "ANIMA",
-        "signature": "304502210082f5eec330891913ad27ff3e47a1b74c2164f160b0d318803ba14080b9edeaaa02202d0e58a28eda9da826d27d5b9ff47ae4fb2763b72cc237e221875985805cca5a",
-    },
-    "0xc559afe7449a778a130fcf8193c7111625481bfe": {
-        "ticker": "ANKAA",
-        "signature": "304402204c0057735c3fddc5730c75aa854c19856761d1d8a4e1f8fc3d017f68c32168e5022062004166e18ff9f5ed644c41f031b50b685973151ad5a13767477c0bfc6c63f4",
-    },
-    "0xaeaeed23478c3a4b798e4ed40d8b7f41366ae861": {
-        "ticker": "ANKR",
-        "signature": "3045022100c16cda1a8347a479e0467503866816a66cf91752a33f398736647b6a3b3047190220065e2f974d384fb5fb37b6ea9fc455d64cd46b69a42b86eb477d53dab0ddb7c4",
-    },
-    "0xe05a08226c49b636acf99c40da8dc6af83ce5bb3": {
-        "ticker": "ANKRETH",
-        "signature": "3045022100b63379280a059d1b471cad4fbbc6d5c827a67b3353644731136d497f9bc4857a02206f140f0ede952bb5ca8ca903c6cc14bf54b8a97d7177afe710a9318b56abfd06",
-    },
-    "0xfb9fbcb328317123f5275cda30b6589d5841216b": {
-        "ticker": "ATF",
-        "signature": "3045022100a7d72da7f2b386c37ec6eb8a5c1733fd91c0baedd4f89cf4d7b5bf5e8a276a81022064bd5f0550a3e822d9a16b01c0ec749ec94849ce5b8f3aa9c82360604cd8c505",
-    },
-    "0xaaa62d9584cbe8e4d68a43ec91bff4ff1fadb202": {
-        "ticker": "MATTER",
-        "signature": "3045022100c68c3ed3dce66f0765baefebcfffe6bc18b724e2642f39912d3a496373e4e4ee02203c43b08cbc7dc8b832e3403ba506fc86577a50b8f36f8a5c506bd34fe2271321",
-    },
-    "0x4406509b532b111bd39b5b579561001cbf0d7acf": {
-        "ticker": "ANT",
-        "signature": "30450221009b34c36f54be58f0a5fd58a14c150054877c0a5b19227b9c7bdac0e0892962b202200b58acb9b8bc12b1b38831d90a807edcd400f65b901ec6433b05136a4d420d0f",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "30440220440b49dac0e83833224b41c94dbc9122df12d826e898f002d61d6df36bf34a6302200ef1c36022832143c5ea648492e6eb37910412fc2abc8e3fdd72686183dd88a0",
-    },
-    "0xd978f8489e1245568704407a479a71fcce2afe8f": {
-        "ticker": "BANANA",
-        "signature": "304402204983c54fd28df957bcb22488b0b027ad305f6408bc3f76df3dea5eb00420fca60220355f7247ddf3abc7c3be161b0659d9973e49dca1446900cb46d80e3d3b0e41c2",
-    },
-    "0x61a1ff55c5216b636a294a07d77c6f4df10d3b56": {
-        "ticker": "APEX",
-        "signature": "304402205501acb40b577147fc7005294f8d80d1a569de563ef5a2164fa1b95663a5a4d50220566c5bd8a76859671aa5cf7d5ce0b5a66c8c96f8afadde9535af377f38a3d927",
-    },
-    "0xce38e140fc3982a6bcebc37b040913ef2cd6c5a7": {
-        "ticker": "AAPL.D",
-        "signature": "3045022100cd43ce7b2f8156d7d1dd879e7d582224d2ffb92634ddfc38263a5ab6892353fc022046f11e6f0051b958fe3be74371a4cc734417a12a5522f46607eced7b95e86b0f",
-    },
-    "0x5f006745a9a192a7cd1236089f704f9b35d3b9cd": {
-        "ticker": "ACRE",
-        "signature": "3045022100c982f53d9f3d86eeb4da3a4f9350e4bf6a79aa28744605c7470312f8bfa1bff902207817d4eb726fd5ebdeffea2515be532de7a270cbab9f68892adee63bd96591b1",
-    },
-    "0xd5954c3084a1ccd70b4da011e67760b8e78aee84": {
-        "ticker": "ARX",
-        "signature": "304402206c92b807a3460747bf7ec548f35100f6815f0494965fbc337f9e29fd2f72913c02202943149434d3af24b02a8adf1d7d7ee76a49c737ad6e984f75f66d1aabc48e06",
-    },
-    "0x155f0dd04424939368972f4e1838687d6a831151": {
-        "ticker": "ADOGE",
-        "signature": "304402205144d350bce063cf93593139cf12cf94c19dce78a792a12ffb78c9e38fd9cd9a0220071318103d90a26a44e3af8e9921d416aa769ca491de01e48612169537ed4ae0",
-    },
-    "0xdd8e557c8804d326c72074e987de02a23ae6ef84": {
-        "ticker": "ARBINU",
-        "signature": "3045022100dfc752282b3f1193feef3f468e0af6e2097898023116282b7989edfc0d1544f90220348eb7fed2a6be305a523c6dd40f683a4a14943175ac9a33a664d7714959fa51",
-    },
-    "0xed3fb761414da74b74f33e5c5a1f78104b188dfc": {
-        "ticker": "NYAN",
-        "signature": "304402202331ae58fba10b3bbc38e404cd8bfba9ba5e01802b4f1783ed083a4eea289f39022063e3d5c33266f824e7733e4ee79564fced6493cb253922ce80d758f13715424d",
-    },
-    "0x07dd5beaffb65b8ff2e575d500bdf324a05295dc": {
-        "ticker": "ARBI",
-        "signature": "30440220334b429ebdb02bb81aff7574903c5ebaa3993b90758a1c1c5dd7b5d9c6bfdaeb02204d8ecf0928da06c2e635d8d51f1ef0de7137cd8635f594cf7aada813ee90caa1",
-    },
-    "0x3e6b3021dab44debf93091030dbfcbdf52464afe": {
-        "ticker": "ARBITEN",
-        "signature": "3045022100db168a51600670c76f19b4b0f4f132e115cd58e0d8aee3bf9ec943cf7682c2430220150014e996d5a32051bdf01be53e5b731d1f0078c85cb808d2e88ae67e2278d7",
-    },
-    "0x982239d38af50b0168da33346d85fb12929c4c07": {
-        "ticker": "TROVE",
-        "signature": "304402206877d643c31164ec46b5b41f27531419e1d1fbe970c937da843e5b8e43fa19de022068dba1807efcdce0541c2d6b887e87ace1f41ce1029464550b4adb9821df0dd5",
-    },
-    "0x912ce59144191c1204e64559fe8253a0e49e6548": {
-        "ticker": "ARB",
-        "signature": "3045022100917f9626bf5dbbcd14310cb04a9ea66a85804ae73adf7913d195ef73d51ad000022075a3b2e440d4590606505524218465c193e9124dfec0d9c0b0cc72f37a45bf0c",
-    },
-    "0x2e516ba5bf3b7ee47fb99b09eadb60bde80a82e0": {
-        "ticker": "AEGGS",
-        "signature": "30440220515f2b3260568c6da805175ff768ccaa51f8345fccfd7c8c7e40702a2cf5de9f022012af1e3e242133454feff68870843bb41ad1b363bb204b8b27e906be7a8849ae",
-    },
-    "0x2a35c341f4dcf2d18e0fb38e0df50e8a47af1368": {
-        "ticker": "ARBPAD",
-        "signature": "304402207f1b41d966324982216cabf27d1ecff1fa00e78f75f43badd16a9ea55452fe4502200e9ef5fdc2cb4bd21f21f720abed616d9beea341de22808823055700f2e9b14d",
-    },
-    "0x6c84a8f1c29108f47a79964b5fe888d4f4d0de40": {
-        "ticker": "TBTC",
-        "signature": "30440220074fdef4ce896ec898b5382fd6af2df9a73eb55f23472f37ba253e89c9f7574a022040416ac069ebbcf91e3afcdb6875bf570773475d85c20c1a284010bbd9a154dd",
-    },
-    "0xf50874f8246776ca4b89eef471e718f70f38458f": {
-        "ticker": "ARBS",
-        "signature": "304502210094a6bd76adad5804097674e56e7b05edd9d5de8761a6b151aa04b197e95d9ea702202305d7f3eb66578eb7a45bec0892fcb32bedc949e60dac7642474b9be7842154",
-    },
-    "0x7f465507f058e17ad21623927a120ac05ca32741": {
-        "ticker": "ARC",
-        "signature": "304402200d4a690d9f4f7a3a5481eb5730fcfa4ac0c0f04ed40ef83e415041680b6baf2b02205a772565c937ce919b535d3297dac613466bb0cd2a0a41af4f8add149926275c",
-    },
-    "0x93d504070ab0eede5449c89c5ea0f5e34d8103f8": {
-        "ticker": "ARCHI",
-        "signature": "304402204a76d3ad17b9725078b02efb5a259aabd4a8b67e2d145dbea47137c88c7f57d2022028ad48eeff0919b509a953e681b1dfa45692ac7b7f600a21a68afdf89c4858a3",
-    },
-    "0xaf5db6e1cc585ca312e8c8f7c499033590cf5c98": {
-        "ticker": "ARKEN",
-        "signature": "3045022100b7dd06b97fd54e288d18877309e89213ea3dced39299c8001dad38bf0dca817002200fc27f8814b34774422c2ada408cd30c2631916b3ca0617db91784d8300a4d98",
-    },
-    "0x67bad479f77488f0f427584e267e66086a7da43a": {
-        "ticker": "ARM.D",
-        "signature": "30440220469f243480a3e8796281c90ee199f76c8c478c19b98fa22d231e5f18b0af6c83022067a0e044b9e0e016e2a5a7f6abc5e86fda800f44dbd6c22c18bf07fda66b3aa9",
-    },
-    "0x4568ca00299819998501914690d6010ae48a59ba": {
-        "ticker": "AFC",
-        "signature": "3045022100de868748d13423c2d697be921df1db8c9b8fd7d0dde60e4b7d34c40808ff7088022045a9e13936835aae5dc032d8b37f95062583d61e38a09871066df99d43ae4f07",
-    },
-    "0x619c82392cb6e41778b7d088860fea8447941f4c": {
-        "ticker": "AFG",
-        "signature": "3045022100cf27aec5e79be41727fc402c878a9417c11acfbe07b04f49637052c88e57e77202203d77702c072662074ee1fd270b3cd21ef89ba70a8f74c84da25c0f74427ad0cf",
-    },
-    "0xd2f8b81cfff297c70e5d58ac58762dd5d213ea20": {
-        "ticker": "AGPT",
-        "signature": "3045022100cbd06793e72ca8fc4ad87fd5f5390f00d4d7a8b2865a5ae8c377657d73706f88022056a26ca00caa0fcd3f91b857a0cb91b1a87d1bd522dbde2500c59c6f9a8b3051",
-    },
-    "0x5441695f4445e40900b4c4b0fb3ed2b9e51601a6": {
-        "ticker": "ARTH",
-        "signature": "304402201e542bd8176921446c0a30a3f48e927365468628bc6322d53a87c3c28645f6110220422cc36fdd3c61b70e20322f1ab640afe1b4a13fc9c6fbabee084c00b3c25af6",
-    },
-    "0x9e724698051da34994f281bd81c3e7372d1960ae": {
-        "ticker": "ASCEND",
-        "signature": "304402203132d202e119a9a91b8f8f14325eacaa5bc13de7abab5c56e8a06c917697a48c022075e441c6a7abd938a31cfdf00ad6534beda70b2598f217e3f02b6f122f6286ca",
-    },
-    "0xee9857de0e55d4a54d36a5a5a73a15e57435fdca": {
-        "ticker": "ODIN",
-        "signature": "3045022100ad98c68ac0ba722c1b084dca8a23293634b4c1fad7275f4a226c7f08e8ca019b022010410de86f4c65a9ce09fd7945412a2c60d2a03516fadc22f7a69a6093fa2ae9",
-    },
-    "0xd3188e0df68559c0b63361f6160c57ad88b239d8": {
-        "ticker": "ASTRADAO",
-        "signature": "3044022054fe9de095b338310c144ae04e5ee70214b5278e1d60644116e28fe790572ceb0220687e6c03e5575d69296a32900be728e3b7ddda5a897bd7f439698aedde2df054",
-    },
-    "0xea986d33ef8a20a96120ecc44dbdd49830192043": {
-        "ticker": "AUC",
-        "signature": "3045022100b61429b246f26574d4f3162d05d63d45f78ab24f3b61a80b9b91abf60a0a98a90220149057d9913f297d5fdd0e9f6c2bad51b0d4c1baeff38964cafd0f443ed658b8",
-    },
-    "0x1772d876f9df830693b8004322cb8885b77e47e5": {
-        "ticker": "DALLE2",
-        "signature": "30440220585f1fd61d17ca4836329fead06804f83b55dfe8878f0683a3e572b5e7de74a902200b052ef86a7b83a5b1f4168185d56308963ccbf893c8f0e74daf822d103a56ac",
-    },
-    "0x11bf4f05eb28b802ed3ab672594decb20ffe2313": {
-        "ticker": "AURY",
-        "signature": "30440220364d25618e689fb5573423a526ef3f3aba2da54e7a9ea83480684512f68161b4022072cddea20ba469a40800b447d42ef40714231c782370ac426a47944631469d08",
-    },
-    "0x965f298e4ade51c0b0bb24e3369deb6c7d5b3951": {
-        "ticker": "DCA",
-        "signature": "304402202a71757b736850058a59933d3ec988e48b4f42591b058d31772ac9e8ffef463c02206368ae87f51522f2b10a16181b9733b7512401ac3deee8f684df87351702c49c",
-    },
-    "0xd5da32ad4c7510457c0e46fa4332f75f6c4c4dc0": {
-        "ticker": "ATE",
-        "signature": "3045022100fe1dc3763c82ffadd0a146b93b97c22df87cde613a25565ed05bf7c17189f9d1022011f662991e0a494a3b142fb30c336ff8862391acaab17d2f6f1be92902280b7a",
-    },
-    "0xac9ac2c17cdfed4abc80a53c5553388575714d03": {
-        "ticker": "ATA",
-        "signature": "3044022017173d4e2e2747c7216ec77666017f2031dcb2819072825085834f98839a1d660220554c5a750e769b9f0d89cbbca448dec590b1a879ade92b439c674efe638ed673",
-    },
-    "0x5117f4ad0bc70dbb3b05bf39a1ec1ee40dd67654": {
-        "ticker": "AVIVE",
-        "signature": "304502210090e805edc6298198627605e4738585b2b25cc2aa0d5db9e03d141fa61c3d16b6022009476c58b571eae11c6d3bb63f427b96fa2a6356ca7de6c8b91589656e677d33",
-    },
-    "0xb829b68f57cc546da7e5806a929e53be32a4625d": {
-        "ticker": "AXLETH",
-        "signature": "30440220634f8ba37d1de098c79992d3438254ae2b82c3d8e06fb8faa2f8641befab5bd102204d9f5f8b8f57953907e601962accc08b8939943404db5664544c18f3f7f1a815",
-    },
-    "0x4e914bbdcde0f455a8ac9d59d3bf739c46287ed2": {
-        "ticker": "AXLSOMM",
-        "signature": "3045022100b622190207359e064f1f766ce1f2b08b7239b7248e61d805ec93bf92beffa679022003d867f1c077b03933136e675c2680a832f9d66dd797618ca4b863500814b6d2",
-    },
-    "0xeb466342c4d449bc9f53a865d5cb90586f405215": {
-        "ticker": "AXLUSDC",
-        "signature": "3045022100b763e42ab3ee3e5c70a914e4b61d1d1a71765f0739861bf414918d453d24ed5d022010ceeafb0b7c77ec9647b4385f83bda6ce8e3cea60f0ad5cf73fa2be09be4ceb",
-    },
-    "0x7f5373ae26c3e8ffc4c77b7255df7ec1a9af52a6": {
-        "ticker": "AXLUSDT",
-        "signature": "304402203f7b33fa8e607348c0a2ef39e8c0aa8c8b910d854d9c460e0975d5275c3dad9302202026d8a6b59b566182daf4bfa091f91b91cbc598f30799eb7dbc1328c2821beb",
-    },
-    "0x9cfb13e6c11054ac9fcb92ba89644f30775436e4": {
-        "ticker": "AXL-WSTETH",
-        "signature": "3045022100e4dd9218739af155d26654aee75548a510095e1f8ab93ae38a89ad534a93f3d4022062ed024e5413bed7d38a579c812f5f2ad15dd6509cb3b45ede6adfdc2b84bf68",
-    },
-    "0xb98058640970d8aa7bbce3b067b2d63c14143786": {
-        "ticker": "BARB",
-        "signature": "304502210097557d3af2a0e0d438e5ebb2238e0e695069fa6532f7b3c3610aa5dbd390d81b022001ceaf4755cba879ec9001376c4eb3c42075f1ca32f0b3c8dcfeddd4f68301fd",
-    },
-    "0x6f67043201c903bbcbc129750cb3b328dd56a0a5": {
-        "ticker": "BAC",
-        "signature": "3045022100b0f3f1de1f00a913bc115df9ac66504dd7e24a67a824c3c516fef516bf57a46402201134efd450a7ecb502e19d7506bef78072baae1502d4f4366bc7fc3a099dd76b",
-    },
-    "0xbfa641051ba0a0ad1b0acf549a89536a0d76472e": {
-        "ticker": "BADGER",
-        "signature": "3045022100fa9d3949f075b217de5a0b454fe358e04faff405b609533787f7d4294d967cbe02207bf603c2309c2b0e53e5d6081d8016e8c16de45a4a7f69cab91aa3ab56a59404",
-    },
-    "0x040d1edc9569d4bab2d15287dc5a4f10f56a56b8": {
-        "ticker": "BAL",
-        "signature": "304402201710c13f11e099e071b7a2e03e322f45420ffc2987b222dc74e876bed6fe557b02201cce25671ab7a3e1765e7f670e71e2e031bddbc3e7e829dec74378b64c1563f3",
-    },
-    "0x375da692c2743e3aa18c51fdce139d08490bfa42": {
-        "ticker": "BAMA",
-        "signature": "30450221009cedfd773755cd311bf86b3e8ac67ae8abc6adef7c63a77d5208b54e60cb2c8802207b52b63060f4a8ef6d14880fef0724ffb3d5e9c7247d22ebb837d5cf0d087266",
-    },
-    "0x86efb351b092a32d833a1ad7374d9bf0fc164aab": {
-        "ticker": "BBO",
-        "signature": "30450221008e1a12313ce1c708413ed5439faa4a8a6a742103f2689f8f574e3df4f40153ce02203207d59d7f4f39aab99787b9e911b9a53c5308a66f7c32e27ccce4a5181a2527",
-    },
-    "0x70ba1a777b3f639c58fd5bc6a5c8780ddcef533b": {
-        "ticker": "BARK",
-        "signature": "304402203500170bd40a96114dbd7f07fc7880caf978a7d14349d99cc213b8de80bf7585022050d1d024f59e72102165c0cb4d68a3831ccd99e1e72012a05bb73838a17358f7",
-    },
-    "0x0d81e50bc677fa67341c44d7eaa9228dee64a4e1": {
-        "ticker": "BOND",
-        "signature": "304402206ca3488c9158fb38f75983aa759d06cb48927c1011f518660ecbbb5615d8b646022059541493bb605c9f88aedd1a7fa9df07d25d98e751147616591dbb39c2c6a106",
-    },
-    "0x09090e22118b375f2c7b95420c04414e4bf68e1a": {
-        "ticker": "BELA",
-        "signature": "3045022100da2875c0d46a9ae4787c6a52cd39d9be481709b1f167385ed7fdd489218d0b8602205477d576f1d4a344df833a053d4077f69644fa55fc4a04d223d9b9f439ed79fc",
-    },
-    "0x94025780a1ab58868d9b2dbbb775f44b32e8e6e5": {
-        "ticker": "BETS",
-        "signature": "3044022023cfc7989e067d737f98847fec4d1142c0647f4e7eac12d354f7e798bd50437002207603289d6db58eb9c7ce9fc8c7e1a1962bf7c4f4e46d6c3f4cfe4f8c5fcdc97e",
-    },
-    "0xa68ec98d7ca870cf1dd0b00ebbb7c4bf60a8e74d": {
-        "ticker": "BICO",
-        "signature": "304402204a6e966c811bc0f2a2ca0c4a201444a6b145381a49114048ba65b98724eb326e02202cd519452d6c35852dbe07f038fbbc5ef83b0039770d0fef8e2a6116e999de09",
-    },
-    "0xc4a0e0915d538b5ec2e6895261d34f70c64fb13d": {
-        "ticker": "XBIT",
-        "signature": "304402201a27597bb5d9c6c5d1014b77c3a06aea81b04ecbaa06357d14987fd93cac37da02201876b678c7e97890bf740902f51dcd9a4fe7a56c530667254b19a956adaedece",
-    },
-    "0x2297aebd383787a160dd0d9f71508148769342e3": {
-        "ticker": "BTC.B",
-        "signature": "304402207f1bcc2d79a2d89a8a254c25dcf163040b1e21f66f67782ad3d8cf41a6e6d89902204815ea7ab354b6d644fd12e8d3e8ef48b3b044efbf922fa9f76573b8e2f36221",
-    },
-    "0x847db21ef9de627c23d3dff470af6599b1a30d3f": {
-        "ticker": "BRAIN",
-        "signature": "304402205c8537cabc2a25580924cce7494966348bae7375edd4beae9c72ac48db8cc94602202e18e6c78eae13d667e91de6ff28827b252839bd99441d6b5ed77cd57b936268",
-    },
-    "0x21ccbc5e7f353ec43b2f5b1fb12c3e9d89d30dca": {
-        "ticker": "BDT",
-        "signature": "3045022100dc4e4a900f12d78827eae9b387da5aad144fc551fe0fdf2b116d34e850a3289602205b357ec58b67dd7d9e6de5b88f51231d2611894178b1317554b628bc138903e6",
-    },
-    "0x8626264b6a1b4e920905efd381002aba52ea0eea": {
-        "ticker": "BLKC",
-        "signature": "304402206115c20b3f777c3af68972666965b8b2bc754155695565a9229ee908ea0cbdf0022063f98878931887803b230c9d76de55a9cc4645221a73fac14f2037cf3d8da78b",
-    },
-    "0x91c0ab2e50db1afe9e673bbb1fd5a3e0e4adf1f9": {
-        "ticker": "BLOB",
-        "signature": "304402206d97c421e8a16b2e822adb39f148f37930b3cc186c8ba017b77cfd644b669d7a0220679fe2ad92410b40286caa8ed1844282628f2c06ed259bb84cae226a2ff440da",
-    },
-    "0x9dce8e754913d928eb39bc4fc3cf047e364f7f2c": {
-        "ticker": "BLOK",
-        "signature": "304402204c4edd30d889e2c1780854280be207677a5e7d4b01bbeaa7c1793ed09d9e8df102203d17449afa12837afe7bef9f4124e9f605a8e36603aae168c9abbe17b8aa5357",
-    },
-    "0x8a66794e1aaebc7018a7b75f61f384e30ae3b159": {
-        "ticker": "BLS",
-        "signature": "3045022100d39af96029bd708ae7408bc3667e1d497d657a3e85d9c925fc6646f4f4cc06cd02207eb85f6654d88063912d1dee1c9d7b863cc406b18dd79c28a6c788373dd1858e",
-    },
-    "0xb0b195aefa3650a6908f15cdac7d92f8a5791b0b": {
-        "ticker": "BOB",
-        "signature": "304502210098e50cb0c0e05fb18b447ed3e9d0313df47cc148e4538c7cf2b25d23ca90511902206446b72fe03ce526ef330318154cffc52a401d79ffe9e5939cff7427036bcdb1",
-    },
-    "0x81de4945807bb31425362f8f7109c18e3dc4f8f0": {
-        "ticker": "BLID",
-        "signature": "304402200bf20065f2ab919b6ba29c2e70979d1f72894bd77766c51f5e01d0fe22a1bcf502203e58e8ef9ca41cdbf4b1110c556e9cfbf131ced60560c6bbbc8a627ef4175d46",
-    },
-    "0xf9ca0ec182a94f6231df9b14bd147ef7fb9fa17c": {
-        "ticker": "BONER",
-        "signature": "3045022100a7f4276452b06c7375875a99466f1752f4d91f4abf698e924e7895ec758bac4402206c30b53a9a03d08469b425cc639630f69a26f6c19e79c9ad20b56ad158ef5e0d",
-    },
-    "0x09199d9a5f4448d0848e4395d065e1ad9c4a1f74": {
-        "ticker": "BONK",
-        "signature": "304402202ffe4a856f0b68d6e72639bc6a51e2a75aaa48182fa9b872dca0af0c4a30369a02207498427bd26ebeef2c92d4b3c5ac8e9591d49af9074459defa593293316042cc",
-    },
-    "0x7f7d7806f4eb90d63b0b278daf32a2db2c2001bd": {
-        "ticker": "BONUS",
-        "signature": "304402201b89115b76e2f09c032dfbf47f2df4dfb3c617b44a209149448fd5ce11a67bd102207be571ee462b325aa56409e61ccaa591e8f44b7646de05afea357abfa0788f91",
-    },
-    "0x0a84edf70f30325151631ce7a61307d1f4d619a3": {
-        "ticker": "BONZAI",
-        "signature": "3045022100917f6a00d05fc5eb980904a2f17924789f23e1052c7beaa9b7610932e02edb4702207a671e9d66c6399bf4065e9524dcc6a7d9245f0be3584f665b72f71b3434390d",
-    },
-    "0x28514bd097d5f9ecea778cc7a4ca4bac5fedb0b6": {
-        "ticker": "BOO",
-        "signature": "3045022100f902ac1c44b303c3e0b9b0d34f014f5e501720461393ba80f7febc9c9283a143022006e04a5ae147da356acbbda757a0617c20c380b90a0ebd2d1468ebaf8a32f7a3",
-    },
-    "0x13a7dedb7169a17be92b0e3c7c2315b46f4772b3": {
-        "ticker": "BOOP",
-        "signature": "304402202e98a3922591465bf3567dd77b022eafc2fb1f5f3caecaf06b4b312fed5bd78902202bf10bdd2552bfe3bbed00b4a29a18ae99e8f7e1ef5cde29dffc0770ec7f771f",
-    },
-    "0x6daf586b7370b14163171544fca24abcc0862ac5": {
-        "ticker": "BPET",
-        "signature": "30440220487eda156c5edaf84c5085a59ecf624154ed985d5a8da6be6067adc26b4c96e302207f44e3e5f912fbb8278f0bf0c9f7b91085533601567472d415217a5b5381ae4b",
-    },
-    "0xc9c4fd7579133701fa2769b6955e7e56bb386db1": {
-        "ticker": "BRG",
-        "signature": "30440220636c3d1f5b171fe5c2aad4a675ef1d291dd3e2ea3b10a1d2a49f58c61621bf6d02204ed3111178d267f7a0dbfd87301109413dc3903a3771f17fc7c1f8a09d9c438a",
-    },
-    "0x51f6ee60108cbcb3b613093bd3f224cb49aa1610": {
-        "ticker": "BRI",
-        "signature": "3044022059a812a92ad096ccdcd4f5a1cbdbafd04136626b7ece1cab9b3658fe4a8fa1e6022074b63d366b3091d4d5afe8c0b6ef68bcf366b30e6e2f5f2ee8e572b51d50ae16",
-    },
-    "0x2b45e21c35a33c58e4c5ce82a82466b0754fd154": {
-        "ticker": "BRO",
-        "signature": "304402206ff2f1cfadf6498367789c6c6ada0b50669bd4867711f1932886f0edb0b9677e02200208e9ca4b831547321065221143ac912076cd809d5a2cfeef60808e632ae678",
-    },
-    "0xd6e7c8af05d2d06a76811d44917613bdd258b995": {
-        "ticker": "BRR",
-        "signature": "30440220417237265c95007e0c7ed681e955186d2c37b8a77792c937f8779f7072c78d1602200dcfbf3543e8896a8e058a381a8e4783c55410524d6afec108df4db8c6e4e500",
-    },
-    "0xb5b5b428e4de365f809ced8271d202449e5c2f72": {
-        "ticker": "BRUH",
-        "signature": "3045022100fb20e3ca67864267ddb015c619139afb1beacd5e674af4ad0abac0c5660b4e5f02205d87579122d39a46776c4c7d3f5b93c1fd4bcf4a6e0de507cec045a82e2e8a47",
-    },
-    "0xa3210cd727fe6daf8386af5623ba51a367e46263": {
-        "ticker": "BSKT",
-        "signature": "3045022100db26d66902749ad5ceb62322d4daebedd0dc4534ca172d6baa89e303b9fe065b022049ae83359a7be534d0f9b122e44904797675033edafd7f82b2cd7a0e65b5299a",
-    },
-    "0x1a5b0aaf478bf1fda7b934c76e7692d722982a6d": {
-        "ticker": "BFR",
-        "signature": "304402204e69812bbff37accb0a3fabb362e13613717410ca707c0566201f0eaa060e10a0220554e1a907c26cb9dd55c741643f550fec361932af029c482560d90b1ad3ad34c",
-    },
-    "0xb9af4762c039d63e30039f1712dfab77026408c7": {
-        "ticker": "AIBB",
-        "signature": "304402205f0be5072720b1183fcac3a24b2882ffad783e6bfb9aae837b3ac9b3b25b1b370220195b7ba82b16a6121c02ec35c30b9303ce196bd0604779649cd6ab3fa9aac4d9",
-    },
-    "0xfb930d1a28990820c98144201637c99bea8cb91c": {
-        "ticker": "BUMP",
-        "signature": "3045022100c3b2ec459b3abbbc044266a5321b31cd8f616b6ad5408197f34f19f3224085a902205d2a42748bb178fd5179a697f3bbe74b8ae0543149778fbde7b849b1f0f2d51e",
-    },
-    "0x847503fbf003ce8b005546aa3c03b80b7c2f9771": {
-        "ticker": "BYTE",
-        "signature": "3045022100ccea2a4ebc70ac8c1b3a05fb68d1fde13fc27232840e9965af1a63f2677b175202204c0d5089f98937143da986849a7ab708f0684e0ac48051c3cd36186d1d930b2d",
-    },
-    "0x3d9907f9a368ad0a51be60f7da3b97cf940982d8": {
-        "ticker": "GRAIL",
-        "signature": "30450221008de46ef305b793e88c6d29a6264d62152631af9b3dfbc943c5e5b54b7b52b3e5022047e0e73972132425cb5a94a9ea29b0efb38bfb741971e5a145290898083ff011",
-    },
-    "0x031d35296154279dc1984dcd93e392b1f946737b": {
-        "ticker": "CAP",
-        "signature": "304402201e761c87e92703cdae696f625b92f74c48802c8efcc0feb4309484417df99eb6022022d7585df2e1db1ad64198ad5bf3f4fb05e5313e6e0cb227890f8bd5eb93ecc6",
-    },
-    "0xf763fa322dc58dee588252fafee5f448e863b633": {
-        "ticker": "SWTH",
-        "signature": "3045022100f59f6ce0759cd74c0000a0fd767dff79ce4e73bcc6cabb49486ce8ae66fafe68022013c86edba476b44c85738d1bb6212d3e64d46df739b07e5c6b0e88d60e205520",
-    },
-    "0x319f865b287fcc10b30d8ce6144e8b6d1b476999": {
-        "ticker": "CTSI",
-        "signature": "304402204850e5fff676403e2611ef9037b74c0013bb40311347fb87c5e0ebd649c72f9f022031594053e787c7082d54eb3758bf5e2adcd355ded840dcb33ee64b26e9f3bdcc",
-    },
-    "0xf0a479c9c3378638ec603b8b6b0d75903902550b": {
-        "ticker": "CATCH",
-        "signature": "3045022100b804b52fc9d5af5e26bcdb3dc316655085a4175d664583d8ad2b52c1fd73c317022005bb7ed4facce464d017d5549abbbf2a0e16329e928011644b388c5015bf5ad6",
-    },
-    "0x986a3db4317177b4f84b05127e9e39a7abd7187a": {
-        "ticker": "CKING",
-        "signature": "304402200146b7ca52c2e629e143812c317c4bbeae39f736808c15002cb67626409dbb8f022056d09324259fa308fb86a777ef9cae0f606cf6f636235bf6c3930559d156d9f7",
-    },
-    "0x3a8b787f78d775aecfeea15706d4221b40f345ab": {
-        "ticker": "CELR",
-        "signature": "30450221009d932fc160883e2240967e3b65b821bc20120407bab5617123fa6758f45f80670220169e61d74e4efe10bc334730d82fbf766f33411035a9827e7fe6f06d5eb4d3a3",
-    },
-    "0x4e51ac49bc5e2d87e0ef713e9e5ab2d71ef4f336": {
-        "ticker": "CELO",
-        "signature": "3045022100ff89d06a1b278ae6155f8e3f9aba09bba28ee9e6d48b0030fc802066f3c7f62a02203ca2d53dd0a518510b2ecf947de5049392dcf355ec18617f955a7f4346716195",
-    },
-    "0xe8e87b8f47bda705ce1a5286fbddd26e93d8dffe": {
-        "ticker": "CERT",
-        "signature": "30450221008bac18aa0a185f95ec42491aa8688414c243961c25b9046a43b9876b9b3773b202207748d4b0941e95059783f39e86e9cddf21c81620be4f39aee9c3739e2a78e4d2",
-    },
-    "0x306634bd3a7982afdb42dec1c6b15176cd9e02e0": {
-        "ticker": "CEX",
-        "signature": "304402202ef44a3d1f6a2f8d4cdc614f7e57faaf5be2bc7387eb7b644c5a5f14f0381d03022019416198bd900ea71b18791250cdb3cfa2f4b6c5baad610c4e704e556fb5e539",
-    },
-    "0x3a74a9032f731d504f10e02d7247d23b939ea4f6": {
-        "ticker": "CEX-AI",
-        "signature": "304402202e60fec1da578510e3cad101f535bb17188ed41fa8297b0737aa9dd7e07780a30220650efe80505651c02c48dc5a7cb17260e35c54bc770e43b5f7b86bf96dd19cef",
-    },
-    "0x743b077b103d91109082a7a48e19ffc1093137a5": {
-        "ticker": "CHAI",
-        "signature": "304402204a095ce166ac56fde913dea661b9b741afd8792f96e4311033e1b75f9441688d02207ae2fd9b63fc846d26360c5669bb25d9a4281ce6bf1b61552e2a4e7825b0fae6",
-    },
-    "0x51c601dc278eb2cfea8e52c4caa35b3d6a9a2c26": {
-        "ticker": "XCHNG",
-        "signature": "3044022023b95f7d1381f4644d0a8cb4214f054fcb9b68254ee7563883bdcc175a73cc9f022002f0370610883e8e996df576dc0223f8509c50f0a4ebda8c54791d97a0dbf506",
-    },
-    "0xf97f4df75117a78c1a5a0dbb814af92458539fb4": {
-        "ticker": "LINK",
-        "signature": "304402203281b0e971bee77e0e6ce0f8a03ffb9453b2bc793c3d13e7e713328e1a50f1fa02203e128f1ff4dbff6941ef1a78d06cd6e821f7610bef619835c21b71893e1dc0c7",
-    },
-    "0x0cbd6fadcf8096cc9a43d90b45f65826102e3ece": {
-        "ticker": "CDT",
-        "signature": "30440220042bfe767c7765bbb08e069a7e86d919dc567d20747f51250533c99f8f2b14eb02206d7103bef6e4938184c591444ef63863769795e0dfdac65d999824360d625475",
-    },
-    "0xc218a06a17feb66b1a730889fb9624326fabff4b": {
-        "ticker": "CFSH",
-        "signature": "3044022022aad00a454eeb4a46a367732c7674805431d1eb01729f1c3fd05b6e49541812022057bf399971b493b263e7cc9f7ba9cb8298e80906f0ca36bcd1b5b2c7dfdb07cd",
-    },
-    "0xb3180df05e46f9fcdd589a2023470a9007df01ca": {
-        "ticker": "CHIBI",
-        "signature": "3045022100e356f550776229a7d68e88436725227c56ae61ea4967bd93858f55e0fd2622c9022023748a2523fd07d16581f2416c8aa079852b93ebe736d57790dca04435425a9a",
-    },
-    "0x6fc2680d8ad8e8312191441b4eca9eff8d06b45a": {
-        "ticker": "CHOKE",
-        "signature": "304402201d3b03064787da5d1f2661bc4e64ce63f75d01397184cf59aa89ff2fb59c091902201367bea1d1e97a506fe8805aaabcd1dc6e607317d43120127a34002d63f4e133",
-    },
-    "0xe018c227bc84e44c96391d3067fab5a9a46b7e62": {
-        "ticker": "CR",
-        "signature": "304502210098c11e335c9a950dfc1bc668afefe99648de7583b546a10b6b8494dd9bfdd90e02206944fdab84107e10a14de44e5efb3ac3cf1debdd429c6edd3fcaeea970f39f79",
-    },
-    "0x15b2fb8f08e4ac1ce019eadae02ee92aedf06851": {
-        "ticker": "CHR",
-        "signature": "3045022100caefa7e72489623d1cad4601c53f7d3ad300b18fa69eb3ce4549fdf7b6a4f24c022034397678f2bcf3eb7b8db781304cb1e6870054ff1cd70032528e58b09c1a9876",
-    },
-    "0x894a3abb764a0ef5da69c62336ac3c15b88bf106": {
-        "ticker": "CHUNKS",
-        "signature": "30450221009ab5b930b8e69647eaa0fbe2e477d852644f25ae35443759d9061a4dd581332f022078487a7d4fffc771d161a55d1f785afd5d1087585071281e80776c69fc989b08",
-    },
-    "0x46b979440ac257151ee5a5bc9597b76386907fa1": {
-        "ticker": "COIN.D",
-        "signature": "3045022100a8f82327b616fc68879186de01dbe2a98d9afcf4e9b2db05dc95d9021cd5813502202ccc3a559419c2baee568d3ff63aae43b642cdced5d04d53fc4f5ff44047a62c",
-    },
-    "0x1debd73e752beaf79865fd6446b0c970eae7732f": {
-        "ticker": "CBETH",
-        "signature": "3045022100bd32674561579d28de468b039080db344a9004419f55367c0b35199fcc39aece022002ba9524b098171b8163270c1a07f74f97398b4231fcada980ab061a0fd487ad",
-    },
-    "0xf18c263ec50cc211ef3f172228549b6618f10613": {
-        "ticker": "COLLAB",
-        "signature": "304402203e36ec8414f5b399f8b667664ab75c302a4dd9e5e1b98929cee8cf0f466f7454022033a732ac9c0bacaf4bc4d1d644989e16c144dddb39e64fc6f5c764704d6f1ede",
-    },
-    "0x354a6da3fcde098f8389cad84b0182725c6c91de": {
-        "ticker": "COMP",
-        "signature": "304402204902db631f8bb7a4e570eeb33536aa7a7e86b1fbd2ab6b1cd9931dfbe39cd4bd022035220220331337bae50f14e997a8918fd8b95600d0102d736ea189f002e4ba69",
-    },
-    "0x1922c36f3bc762ca300b4a46bb2102f84b1684ab": {
-        "ticker": "CMUMAMI",
-        "signature": "3045022100d629283104ff5c333e0304108fea61b9159477ad545965065649d52f88ddec4a0220058bfd05f45d78e287d3c9774c77494393079ae78f9f4ca0f0af383905f9db1a",
-    },
-    "0xd3934a2e428e31ffc14b1f69b0bec79db3e0c614": {
-        "ticker": "CONE",
-        "signature": "3045022100af71d77b230eeba89dafe571cbc00c5bd0a4ed3eae35ae575e8cedf3c537d9ee02202426fbe6267e764d4d010a3bcd6dc3cf5fcfbc1f9b571b2683133cc6444f9e22",
-    },
-    "0x6f5401c53e2769c858665621d22ddbf53d8d27c5": {
-        "ticker": "CNFI",
-        "signature": "304402204fcd873c4debd4fb87afcf46b28917f906a83e4964a4d8183bbe80bea181c4630220014a5303ce3c7f27b7395c803351a48cabd4552085b0a597a75abf7379d6b6a4",
-    },
-    "0x58b9cb810a68a7f3e1e4f8cb45d1b9b3c79705e8": {
-        "ticker": "NEXT",
-        "signature": "3045022100fe1fa0a8e3f06bfb07f6e794cad7f6c10fbe80f9b7eb5d584d2b1465d69cf22602203b8ac7fe634edafe7a9198f3a435cd0491bff4cb2149398653cd7a58ccacc7b6",
-    },
-    "0xb21be1caf592a5dc1e75e418704d1b6d50b0d083": {
-        "ticker": "CRX",
-        "signature": "304402201e0ca09cfb82b42b2bfdcb0ff8f3750f1feef710a2c0f0814be4590446d8341202201d077bf78ce3cb612f95b48d29456fa3da5723a9dae64a00feebc543d2f139d8",
-    },
-    "0x6fe14d3cc2f7bddffba5cdb3bbe7467dd81ea101": {
-        "ticker": "COTI",
-        "signature": "3045022100cf55c40b3bd462fdfb4e873bf56a6e64256750c54d5a070d9fde3104638fc29e02204cdc402dcb2e323e390f104b2c2fd9b619e6c13a5cce6fc01d35f40051580284",
-    },
-    "0x13461c85887e85fdc942ac94c4d2699995ad1960": {
-        "ticker": "CRDS",
-        "signature": "30450221008de20e404d9b03c2c2d7bf840ec34fe5f8957de48d796ac549d8d236468d6ecc0220029ecf3f32e933998911c88ac46745305d99ebcb210485a33e1d1d6395ae4f67",
-    },
-    "0xe4177c1400a8eee1799835dcde2489c6f0d5d616": {
-        "ticker": "CRAZYRABBIT",
-        "signature": "30440220657189ae6d6c33a8e9de11707ab9db10b587cf9a30ba2761b6f2b150305af902022002e8fdfff1f2124a4cd99afc9390b2cdee0068e0e211b6a72b04b97c9eefa24b",
-    },
-    "0xf4d48ce3ee1ac3651998971541badbb9a14d7234": {
-        "ticker": "CREAM",
-        "signature": "304402205b117709ccaef0aaf958d6d20d2a1e7bb2175574444b26c9140f7aa1aa9a996f0220275ea0162f757098a625239bd8c7ab7690c61f75a3faa51da6a7f527e80bd7bc",
-    },
-    "0xc136e6b376a9946b156db1ed3a34b08afdaed76d": {
-        "ticker": "CREDA",
-        "signature": "30450221008a2fed9367a0bc10f5955991ed00f0c95f55f85adadb20056689a90d501b5c08022071f34f29963d3c06f1d05b78d311f9a648940533ab9b9577e233679f0c6225c5",
-    },
-    "0x16f1967565aad72dd77588a332ce445e7cef752b": {
-        "ticker": "CAW",
-        "signature": "304502210080318011ea7a85d8aeedbae8421e9c2d21cc6e3d82251eba272d63c2873ba8080220198d06f7320d1e6e8b80d9f3018b2de3224b65b3dbcc616a9285a919951668ee",
-    },
-    "0xd7a892f28dedc74e6b7b33f93be08abfc394a360": {
-        "ticker": "CIP",
-        "signature": "30440220623bfd26716960f132974d922aa2e19deb6d4e4288c01e18ab63689387a09ce502204625c49940341a1af1d8d5a0da294185437cf69e78aa3d355f864ef22ab59da2",
-    },
-    "0x11cdb42b0eb46d95f990bedd4695a6e3fa034978": {
-        "ticker": "CRV",
-        "signature": "304402200c9a085e6df1e8daf16cd5a95501ba8d53f0e3db818420e07e0b1c49846d851d022069ebaa1c324454f80adfa3312abf399bc8f482d512e240e0f6a87a573a6385e0",
-    },
-    "0x498bf2b1e120fed3ad3d42ea2165e9b73f99c1e5": {
-        "ticker": "CRVUSD",
-        "signature": "3044022031afd15aaebf51eeb53e291c0bd0e449be18a4b1a3e43a0d638907df9f02157102204582fb3cee5359613ee2d5468b21663fc705203075949ef2b88889599e68e2c5",
-    },
-    "0x7f90122bf0700f9e7e1f688fe926940e8839f353": {
-        "ticker": "2CRV",
-        "signature": "304402202f0876929f57eaf4b2451a48b7e5f615f28e5f18e25137d9b0b9d300d47bbec902200ebc0bca6a297b7bd343226be86ab93a06771e6128268ecd18f28db0126ee414",
-    },
-    "0x05eaea39f69b24f8f2da13af2d8ee0853889f2a8": {
-        "ticker": "CYG",
-        "signature": "3045022100c3db8f1d4a1cdf01944df8993b3dda0a177399a62de765a62a70cff6a24706a202201347651850865479674fb1acddefc863e510d021d70866febd1b930416d87c77",
-    },
-    "0xed7f000ee335b8199b004cca1c6f36d188cf6cb8": {
-        "ticker": "D2",
-        "signature": "3044022049cbbbe323e898461ca5088dff70850bb9b95a2e3f438335b6868115f7337fc0022057248cf1f89125274647a77a8067e2d45309b262195ec367054c01f94c9bc0bd",
-    },
-    "0x47c337bd5b9344a6f3d6f58c474d9d8cd419d8ca": {
-        "ticker": "DACKIE",
-        "signature": "3044022010d7a0a99a382632f8b7b0564e7df350143bc9cf9fa0228c82f59ec1146f130f0220297607fab15b208dcd9c698d570a68f8616c56f064646b7f79416d26ea0d7732",
-    },
-    "0xeb8e93a0c7504bffd8a8ffa56cd754c63aaebfe8": {
-        "ticker": "DAI+",
-        "signature": "304402201b71abec65d27ad6fa0f356df7cf2492bcc1951c5c0455476a005fcf1b4c45b702206f7b43160c4859ae52aed19f5d29b48eb9977b4e9b51128d1a36ca151791b50b",
-    },
-    "0xda10009cbd5d07dd0cecc66161fc93d7c9000da1": {
-        "ticker": "DAI",
-        "signature": "3045022100b1df298841ea77641c6e42b96cd5545c41b8a2ea4f0ec1c14b1faedfbb30dae702204659aa24f4471f48801afd0a74d60c25361f4c4e348c2e78c6aae6871e3f18bb",
-    },
-    "0xcaa38bcc8fb3077975bbe217acfaa449e6596a84": {
-        "ticker": "DAO",
-        "signature": "3045022100dfc2aee0975a65d8a48695cdc76fddd6e006a49e5b7867c1f59bcbea8c6e0fc50220309802b9f4af61c1dda152597c61ee1df363c5636ad3ffeb74c4310fe5e0664f",
-    },
-    "0x9e92b9ef3c3cc4053591002f4f04d2aef87bf2d2": {
-        "ticker": "DMT",
-        "signature": "30440220619fb3ba5c3c9be0a080ab850448e3dfa72c293ceddf07aea043e2c1608b91a00220135377277b61cede6507718c4596fd2b41ce6fecfee0124f2c1ebc666f6414e6",
-    },
-    "0x9e523234d36973f9e38642886197d023c88e307e": {
-        "ticker": "RING",
-        "signature": "3044022001487495969202039d2bfb88835e56ddf3cca15b197e8b17b3696e3a8318cf8f0220778692533c9384dbf133322cb06852b3d112afd4757ab869763c775c3b897950",
-    },
-    "0x8a823dfdb9bf6e109f97fa77d790a138010fa434": {
-        "ticker": "DAU",
-        "signature": "304402202fdf84a0d2a4e2002d9a68ba024ad0efb2b145f3df02100cefa99b8db798c88002206c1b712518e75b418326d14b9f531fb7c61a1fd41d6fa4969f8e67ee78bc0189",
-    },
-    "0x680447595e8b7b3aa1b43beb9f6098c79ac2ab3f": {
-        "ticker": "USDD",
-        "signature": "3045022100e8fd9195606c989f9470e6209a5380c62b786c6444d6eb787d841ccc3ea7408e02206e94568f19b1d729a5a2bbbee3f86af8bfeb34421b318bf3cea334cc35929c9d",
-    },
-    "0xcb6460d56825ddc12229c7a7d94b6b26a9f9c867": {
-        "ticker": "DFTL",
-        "signature": "3045022100f56ae192fd52dba21cb5354aa3e8d885a145870811232ec22a7ccf56fb9f53df02204c327995da01c58e32658235e26f5e975fb6aa26dfb021dbe530b3d7c16c6b6b",
-    },
-    "0x21e60ee73f17ac0a411ae5d690f908c3ed66fe12": {
-        "ticker": "DERI",
-        "signature": "30450221009d93401d1f88b8d1520ce8db96a4b9d371da0b87a4a2452c4185eb7efbd620a702207b8b3a236fbaedaf09ac82e2042aca560934976e313faf08b1be966bef0c6c99",
-    },
-    "0xa7aa2921618e3d63da433829d448b58c9445a4c3": {
-        "ticker": "DVF",
-        "signature": "30440220673b1aa9c9b16b9f93da89925b64eecc6bfe5b895fca3ec18a34bf84ae42aed2022007167ad941acb99cbe2bb3e55d1b35b6d37dd2d712a7e1b9e4db1c5c69f49c8d",
-    },
-    "0xda064d44871ba31dae33a65b3e23b37e44e9168a": {
-        "ticker": "GDEX",
-        "signature": "3045022100ce77a1559b6fcb762537a47ab882f85f9b4033b990e3df40ffd3c1bb29469719022079502861c256d2fb0305a96b8781d142855aafed6d238bd2f45a727ebad72299",
-    },
-    "0xae6aab43c4f3e0cea4ab83752c278f8debaba689": {
-        "ticker": "DF",
-        "signature": "304402203331ffe2c02a881a1fe1fb151ee3b911526687a676cc63cf65a3dea78df5f29202205082e09d0548cb1c7117b8bdfe0c8eb725a9ed07aa58bb3c9c11c45bb5cbf51c",
-    },
-    "0x641441c631e2f909700d2f41fd87f0aa6a6b4edb": {
-        "ticker": "USX",
-        "signature": "304402207547832d957c22298da4119a424c8d24f1e1a16d94f552571f1f1b3d11be7f2a02206ab8289db070655aad62b0c4b8e12adcbe68248a3c19be1477cd4d1c7280c02e",
-    },
-    "0x27f485b62c4a7e635f561a87560adf5090239e93": {
-        "ticker": "DFX",
-        "signature": "3044022014cf7879509bcf755e68baf6ad6e0444b764eb88ca2ade96fae0965fdcc6ff7d02207b837d97cf363deade857e8786cba3e1c2368dc2d23a713d5d90ce976a51f9c6",
-    },
-    "0x1d54aa7e322e02a0453c0f2fa21505ce7f2e9e93": {
-        "ticker": "DFYN",
-        "signature": "3044022048de9a04d2295cb4ba05e5bd0d90be3f6573c6ec7880aff36234d490f36a76f402204fa8c26a48076667f4b2f32494253ed3525081662504d890f78b65b0ed67f1fb",
-    },
-    "0x1bebd15adbc64f2f1eea7c3604d7a4b13a28c89c": {
-        "ticker": "DGS",
-        "signature": "304402205ad01f37fddbc95d3aa12a9569763757a46762ed43ae9a66e105233e4bd11d36022064aebad2171da41b8cb398020dad49bfea1bf6748acb368be47916a8242ea111",
-    },
-    "0x8038f3c971414fd1fc220ba727f2d4a0fc98cb65": {
-        "ticker": "DHT",
-        "signature": "30450221009414301204bdd1fe6be695b7c926374df6ce80fd919252fa23c0deb9c06894cf02200e67253e5889f09f0e361812cd6e5e822fed5107c49be827d39a6d50f6367683",
-    },
-    "0x39f91452a6e9994762876e1edd87be28a46d5c99": {
-        "ticker": "DIA",
-        "signature": "3045022100f00e5323e68a319af5ceda62a35163662c8e314849166062ba54f767637489d802207d291aa9dc02397ee252d6005b2e317f67fcb33c4bcf268b48a9be3c8dd4082e",
-    },
-    "0x2b089381f53525451fe5115f23e9d2cc92d7ff1d": {
-        "ticker": "DRC",
-        "signature": "3045022100cfc6e2d8990855c910a8ed5fc84283e49f8cc9a0d40638ff38389f4f45ba72a3022023a1f8ddf8884ee39a8dc20d91b5c1defec886e7207554bb4068dd8b1791a0ce",
-    },
-    "0xf0b5ceefc89684889e5f7e0a7775bd100fcd3709": {
-        "ticker": "DUSD",
-        "signature": "3045022100f405fe9896683e8943b290ea7fc844f5fe7bf640b7594a8033de4fb595145820022075112a128c7227fa971d271df4e7a9b0cafc7169edd444029290f13cc03c220f",
-    },
-    "0x3419875b4d3bca7f3fdda2db7a476a79fd31b4fe": {
-        "ticker": "DZHV",
-        "signature": "3044022065482732adcbc7a785ae0264e85938616307d50dfc85b4380deee4718603f3e302202190fedb473d5c15d995b2b0b8c9ae9bad6c2781363f5bbbfe248b0c3a95cec5",
-    },
-    "0x69eb4fa4a2fbd498c257c57ea8b7655a2559a581": {
-        "ticker": "DODO",
-        "signature": "3045022100fc4d6bfe36015f05188f4e3967d04c066ac81488b3d489bbdf55d95c2da183ea022064474eb80a3902d548a3551ff53ab4ce8e40a7bc4e1fbecfbe0b614aa21d66e7",
-    },
-    "0x6a7661795c374c0bfc635934efaddff3a7ee23b6": {
-        "ticker": "DOLA",
-        "signature": "304502210098301eb82a28ea5f9435550949f33903693f92a6954160e15cab32b20465dd1f02207b5fba90a8f2bce5c50464e3713c168e45d328b22266ef4d348dff46ce60dedb",
-    },
-    "0x635d0e13f98e107cf6c5cdfbf52c19843f87e76a": {
-        "ticker": "DOMDOM",
-        "signature": "3045022100a1f0ff028c92d3a9834a37c1f004cfdf83986d6b223d3fd813ba296ee6aaed8402205c8ada05c47dc6df7119d578944e68144768fd941610dfcd212097495fbc20f4",
-    },
-    "0xf42e2b8bc2af8b110b65be98db1321b1ab8d44f5": {
-        "ticker": "DONUT",
-        "signature": "30440220009543a802c5a118ffa17a22f7642fd38fd484e816e60c6bc009cb0b995f37bd02201d760c074ff7a898bbd9395321fdcf5961ccc985fa9879c910cabba3f43048e2",
-    },
-    "0xeb3c4d71c31d291e47641cd09ea8e8f5696b6b4c": {
-        "ticker": "DWZ",
-        "signature": "304402202d738044ac261140a166b49c8cffdaeb01c9a50bdd58dad836ad7ece1cc7d6850220660f784e70c514c88418af1b470ad2d173f4265a9c29f6d5af5bc0bf4f6e4972",
-    },
-    "0x6c2c06790b3e3e3c38e12ee22f8183b37a13ee55": {
-        "ticker": "DPX",
-        "signature": "3045022100ca87173cb092feec5564834fd368fdaeab3720ca415cb3fad85bdc93dcd46e2b02202a41a19239c03eddb0a88f976b22c5afd3545098b363f1e713180cf0fd220db2",
-    },
-    "0x32eb7902d4134bf98a28b963d26de779af92a212": {
-        "ticker": "RDPX",
-        "signature": "304402207c7304cc0751acbb83bf687642a4c2235832772267b62ccafa9ff41a9d68abf9022011d9b2e8fcc2893640aa4481aab274c5bcefa756c5162788ed2cae27ffa0b08c",
-    },
-    "0x12f7cf4f2e3f87678ec5207fc920c815e31524df": {
-        "ticker": "DTL",
-        "signature": "304402204a10e75d07c58317858489d7e282899bd1023d6030c6de30fb2107eea2e2a28b02204fa36eab9855dc331982a55619e02737eb3ecd76172d8475ddb2ee69ebd68876",
-    },
-    "0xd3f1da62cafb7e7bc6531ff1cef6f414291f03d3": {
-        "ticker": "DBL",
-        "signature": "3045022100eda19bbd7dfcc477cd3151b5e0ba75561dee7aeb6501dbf90b05cb42b62f4447022007373eff12f7995d3fed298a2bd0366e51b345bf6b3d356d112b3b434792fde6",
-    },
-    "0x93c157932e5649e794df8999714af8690226a1c9": {
-        "ticker": "DRA",
-        "signature": "3045022100e7ba6bd9c4cfd5d118abadb5a054962629500c77704011fa5b4b1c0dc6f8685802207946691ff22256c5c71eda8ccb8ef332307f283acf9b1e63be5003b65b4102ce",
-    },
-    "0x09fd3d6e6889940ca1158b9221309bd69fafa32b": {
-        "ticker": "DROP",
-        "signature": "3045022100edb11737415e037ca4ebecd3fa0c676eb0f0540c4f6984bf406d3c1a9ad597a302200e0944485371ffefc6a56b6906f26159be2862bedb02db66f8313ad937459df4",
-    },
-    "0x7ce746b45eabd0c4321538dec1b849c79a9a8476": {
-        "ticker": "DSLA",
-        "signature": "3045022100cc6ad5af0bf6b6c211258cc21f2fa4f7c6979ebe47e8092f36c9e6a0b55b85b102207fe088cd8f305626825482eddf883d1dfe2773e0b6648f11abba69f05110c00e",
-    },
-    "0xdb0c6fc9e01cd95eb1d3bbae6689962de489cd7b": {
-        "ticker": "DSQ",
-        "signature": "30440220042b0e75bd89f980a3ed2d67ee9f5abf9e3f5ed19b564a0db2c9549271c4054202203bdbd363809d2e5fda843bb10b8bfc5bd59b5726c12b2d01ebee69b7d2ae37cc",
-    },
-    "0x322f15d4bedaa20c178fb75b2628663d2da19736": {
-        "ticker": "DUO",
-        "signature": "30440220446040f1c4706daa85b5df27d0aef383cf031c3101ad5f1a3e52dc5abe04401102202b618ba0a1cd0abf4ab8fff3410b2392e893ea1e7fd3c77e743ede757e05b1a8",
-    },
-    "0xc3ae0333f0f34aa734d5493276223d95b8f9cb37": {
-        "ticker": "DXD",
-        "signature": "3045022100d99a754e7b5bb2b5b09261ccd5a9f53c081a15d92056af96fdbd3941c3c8583a02205b3c094b308ceb229d6d104ecdb73fa262868bdb22b36c7b79099ed1e3b0d770",
-    },
-    "0x93ca0d85837ff83158cd14d65b169cdb223b1921": {
-        "ticker": "ECLIP",
-        "signature": "304502210082561e3142ccefa171786d2b540173cc05ace0a6d6875127ae0c6288977496100220291ae95c7142e1827acb068205b98b2aeda00983cb953d3a811577c68d9ae2b5",
-    },
-    "0xccd3891c1452b7cb0e4632774b9365dc4ee24f20": {
-        "ticker": "EDE",
-        "signature": "30440220254d68d4a91b767d8ee68b94690f6b85b6d9571fb3709e125c1964000f2e0958022027f975546d92cbb688e4faf92eaa51ac62ce07f9023389c6a5648c18e17c5da9",
-    },
-    "0xdfb8be6f8c87f74295a87de951974362cedcfa30": {
-        "ticker": "EMC",
-        "signature": "3044022038766583a18a6195cacefda48963d95cfab59c71bc3fc10c0cdc0b5ac97e4d490220757b19bdbd407409f84182ff91996ac24da0754ec728686ad613557d953e7049",
-    },
-    "0xeeac5e75216571773c0064b3b591a86253791db6": {
-        "ticker": "ELM",
-        "signature": "3045022100d78a3189398798a7b2be7b66216c6c7d4160d144c1f2089b72f75b8a0fb4087d02200edd3366476aa9fb9b17a325c0cb94072294b163e3a5e466bb068dc86e85a024",
-    },
-    "0x22ab6bc52cad84aae84bd5781258677a6e0cfab0": {
-        "ticker": "ELSD",
-        "signature": "3045022100efb2d940d9c1e005233211ace095f954a2b3d22ee431cfbd5e4db786cc8de00c0220326c9bcfd79b6b87535159d9350b8b62924f531b59b5371a47093d2c0a59fb0b",
-    },
-    "0x772598e9e62155d7fdfe65fdf01eb5a53a8465be": {
-        "ticker": "EMP",
-        "signature": "3045022100b6ae7e20b63318f1f1b286ae727786cb27582674213cc6f32e8cbc4bb4eaa4b302204efb9cb90365564ae4439a87fe360669044eef0392d4900e9e0b199ec5e0eb95",
-    },
-    "0x2b41806cbf1ffb3d9e31a9ece6b738bf9d6f645f": {
-        "ticker": "ENO",
-        "signature": "304402207ede1b8dc84c32bb4a91127078cf62e38680c33b190d33b27524e6c6b1f7084f02207422a65b3dbe21ec5c18022f2815ed329b03bcfc63d73957814e6c497e93fe3d",
-    },
-    "0x4939ac5c1855302891c5888634b2f65cc30b9155": {
-        "ticker": "EPOCH",
-        "signature": "3045022100dbe9bb1382b61ac66f295ad6c37fd4cb1cba7b6f071fa5b89de5383e9fff168002204f806b1100cbfb436f412a3eeab35edc2e5ece0987f926b5e974f98510a73e07",
-    },
-    "0x87aaffdf26c6885f6010219208d5b161ec7609c0": {
-        "ticker": "EQU",
-        "signature": "30440220058d395f536a4536f3394007ad69b918adcbc1c3912c7dc585c75de9ca5c95a4022005534fe69de89d5785e3b3cff416c0e6ced6bf540c06e92a82ea2ed02c56b6f6",
-    },
-    "0xd4848211b699503c772aa1bc7d33b433c4242ac3": {
-        "ticker": "EPENDLE",
-        "signature": "3045022100a19d01ba3560ef886e784a8e9539ff171ce731c4d900a1e99311f8cbc1e3c54e02200787eac2aac630c996808e81126d63bfa1f28540f57f5aee9cbc3c7f2022699e",
-    },
-    "0xbfbcfe8873fe28dfa25f1099282b088d52bbad9c": {
-        "ticker": "EQB",
-        "signature": "3045022100b7464ef520e1b6f359f7e90b3cff7756bb65b15c75edc118ba61fcab293b4f9002200c8db27cb4a8507dd0fd2a51a9af218022a24defdac1f534b4b9492789c382d5",
-    },
-    "0xfc675adfdd721064ba923d07a8a238a9e52d8ace": {
-        "ticker": "ESPRF",
-        "signature": "304402205a5a30163c8279a8d5d5a515d4070cf84d9003df5962bc5fd6be41fb60af0dcd022040c9e80b0ccbc6195271a2ea8892bf5216bd8ccb313e45a71c569682a442e231",
-    },
-    "0xd4939d69b31fbe981ed6904a3af43ee1dc777aab": {
-        "ticker": "ETH+",
-        "signature": "3044022025290764e5ab3a8d6d06670c12a48c0f849a95e101fcb3220ebbf482556bb8d40220016eb58eb78997acb102ca24d8b923c556646df04fa44ce2f37943f464993a0f",
-    },
-    "0x123389c2f0e9194d9ba98c21e63c375b67614108": {
-        "ticker": "EMAX",
-        "signature": "304402204f65c80bb0a8f70a294c271b5b32cc06836cdbfff4ac52df53d0101940c922db02202ffa33eefb8a986bc7a94c6865c08ee62498341802e0ce0670f45d3d821d1f38",
-    },
-    "0x67c31056358b8977ea95a3a899dd380d4bced706": {
-        "ticker": "ETHFAI",
-        "signature": "3044022025eb008bc9c96219408b537f8c5c9f0056d3fc1dd194377a8bfcfae09572152e02203360724eac031139b8a18c9e0bd99b61e4f516316e62f84161f1a875ead0f5ee",
-    },
-    "0xa334884bf6b0a066d553d19e507315e839409e62": {
-        "ticker": "ERN",
-        "signature": "30440220360dd5b84671ac8357c792f6b420921696ecc440292020d7f3385bfb02632ff80220113455cc952e8a01e8d2e4a4073a354b475cf6ce43ba3ed0093eef607c0c8481",
-    },
-    "0xcf985aba4647a432e60efceeb8054bbd64244305": {
-        "ticker": "EUROE",
-        "signature": "3044022002fbde49f50beeeb3241a5e0898a68bd888d89582547869b55ce7ca8e15b7f8402205dba25015291c80e91bd619c0ce3db98a416029126da626f0d63240af98180a2",
-    },
-    "0xcb24b141ecaaad0d2c255d6f99d6f4790546a75c": {
-        "ticker": "EXPO",
-        "signature": "3045022100ca93c4ffa9318bbeb691131944be3d24c84785edba89998f37ef75564d326e3502200a53f1e0b6de171efdee971264c8c2fbe19ba1c9b134589fc6ed1d89c126e41e",
-    },
-    "0x6dd963c510c2d2f09d5eddb48ede45fed063eb36": {
-        "ticker": "FCTR",
-        "signature": "3044022079dc0ae16a2d7447d4798e637056b41ec786298c4791576a84945a6ebae1bc1802201844d7296115f19f6d20400d99ad79f5e42204b33ec3f54d3804ed1295a93f84",
-    },
-    "0x74ccbe53f77b08632ce0cb91d3a545bf6b8e0979": {
-        "ticker": "FBOMB",
-        "signature": "30440220396cb4b24d34e14f050f07449d193b91c6a9536203eb941a422a7b1ac8f00f2d0220356a8b3a1a9ac61d3984c91400db8c7024493f1f19b5615e5869ffdb33bec482",
-    },
-    "0xb1070c40d5b3d10e1f1c8876c3d2ff5ffed4b3ac": {
-        "ticker": "FENGLVZIV2",
-        "signature": "3045022100e1210b479997e6dc14adcee9ef780ec4b5ba5083fae267236426cacb11da51fa02204952b33f49ab77aff8419e12188026bce9d6c5b9f3b43f49be22fe6240fc290b",
-    },
-    "0x9f6abbf0ba6b5bfa27f4deb6597cc6ec20573fda": {
-        "ticker": "FRM",
-        "signature": "304502210098cec8559292c4594588b3bfbea82a792a4735110bb1d0ed89a657cc18e6b9bb022037bf04ac724e6ba2586f57d064633e839e3fcdbd51e524a69c17042391005e85",
-    },
-    "0xd41f1f0cf89fd239ca4c1f8e8ada46345c86b0a4": {
-        "ticker": "CHF24",
-        "signature": "3044022050465e4875781a1fd23d82fc3224c70476205f0378d419422e04bdaf66f1519c02205059b721fb6cae85e5b91eea00d7780e64e6e9b9f4d525c4f01823a5d7b6306a",
-    },
-    "0x2c5d06f591d0d8cd43ac232c2b654475a142c7da": {
-        "ticker": "EUR24",
-        "signature": "304402206cbdde8f10dfef0f9b34e68720c6d23a2b74bb092aae98e9fff6ce6ed238fb0b0220489fd92c90919aba24f8be7e1ef662ea878e0852651453e883b4a82ef13676f2",
-    },
-    "0xbe00f3db78688d9704bcb4e0a827aea3a9cc0d62": {
-        "ticker": "USD24",
-        "signature": "304402202c494654cbc9f391ec2077b9693b86693d7668af1713b40b512fb249c3743bf3022075804d8fa6f5a449c591d685bf69120164e404571bd4847f82d8a2ed16d2638f",
-    },
-    "0xe2105bea3819d3131b5b2306d44eb3271bfcfe0e": {
-        "ticker": "FIEF",
-        "signature": "30440220383eee09c9173b6256034e886ae112e18e2fb57fcf370614047c1c561fe41f520220727492593b68110be0f982acd01793b936ba91452ed79cf6ad54a2770a76599f",
-    },
-    "0x14e8687af6c94c7c68590bacf0f1d1e338f2862b": {
-        "ticker": "HOTT",
-        "signature": "3045022100f572b8ec047be4d24cc6438a4c50f887c06f797b67d043ef555dc874c637d1d2022030d8f2a875beadcb961fb5922d4f89baebcc49ca516ff3adee78b09c6a8d587f",
-    },
-    "0x4a7779abed707a9c7deadbbef5c15f3e52370a99": {
-        "ticker": "FLAME",
-        "signature": "304502210091c6a6ecf8ddd45e3d5b0357563a5c6ece97afb2ed0fd04bf48aa4405c9bdf2502207551358dc4d56ad1e42ee540364319244d6978d116bf1fcca572ff33b0f99d16",
-    },
-    "0xc628534100180582e43271448098cb2c185795bd": {
-        "ticker": "FLASH",
-        "signature": "3044022062b525c4c7b4de1cd70ca0ed52f22c5e8da0db2eebb5daf3035b0fdf92aafaee022046dd21af35183afe40da1c04d60033cd3602a1393c44168c46053eb8dc46eeb5",
-    },
-    "0x3269a3c00ab86c753856fd135d97b87facb0d848": {
-        "ticker": "FFM",
-        "signature": "304402204ff030c4e3160392af7b264b096f4a2af9216c044cbce2dadf396767ed8e2ff4022066baf0642bb53f3e7dec94aabcd05c71b9474fd2844b0767cc028caed3692218",
-    },
-    "0x4e47951508fd4a4126f8ff9cf5e6fa3b7cc8e073": {
-        "ticker": "FLUID",
-        "signature": "30440220497ffd8bfdd95e8dbd9624d5091dcfdefd6a9af323c0bc21948525f207e0529b022013652e7b7db56f927536f8f05053a0255aaf0c91e1e1f60490404f5dd42459c0",
-    },
-    "0x4cfa50b7ce747e2d61724fcac57f24b748ff2b2a": {
-        "ticker": "FUSDC",
-        "signature": "3045022100c26f03d88c7da5f9e6126d3818708f6cd4f4348636047113e68ad91968a0b3fc02205d1b0ac5c1760aa245fd5af5fefd6e46be692739188c4f747aed0e95b1a1b149",
-    },
-    "0x000f1720a263f96532d1ac2bb9cdc12b72c6f386": {
-        "ticker": "FLY",
-        "signature": "30440220477046ddf14e8492d172f64db38adb1fc24e1aecc639930b220ad7f5ca1c22220220453a391afb9a611e70d71f88b964afcba6c09a2443a23c76409666e668753682",
-    },
-    "0xf80d589b3dbe130c270a69f1a69d050f268786df": {
-        "ticker": "FLUX",
-        "signature": "3045022100c241ea2c23d3f029a1e8ff3f6bd3c526ed73ee084868acb80a93f5d5099dc259022071b27e08d29c39e3656e678d9973909fc6c7aae11af4a985699e0852205b3eb5",
-    },
-    "0xcbe94d75ec713b7ead84f55620dc3174beeb1cfe": {
-        "ticker": "FORE",
-        "signature": "3045022100e1f72a40cf1e48e42aa8ddc5f301aae9ad88d6e20094d433045195ea686cc5f502206beb865b612b9ba0ed0b2983b745139ef7869d4609a3e773dbe8c4452c070ed5",
-    },
-    "0xab10645297d5b2b124523b5181df2e8815190aeb": {
-        "ticker": "FORGE",
-        "signature": "304402202fcc8600efa3d20dd5b8fa348e6f4fd7ddd0c8f8fbb8b0d7c40f1b8a9834688b02206fefd1fc3f2ad91f5ba1d214bcc71c2bdb0c89af1d98ce4a51a1a7f6da08a481",
-    },
-    "0x6bcc14b02cd624ebe1a8a665cb6d4067aa097230": {
-        "ticker": "FOX",
-        "signature": "3044022053caffbcfb106a9be7c0ad19f146d26e20e92e1fad1c13a887a338ecbccdb01e02202b03a93a67419e28a2f1fb689f32cf935deab7badea80e1883ab5157f3a81695",
-    },
-    "0xae48b7c8e096896e32d53f10d0bf89f82ec7b987": {
-        "ticker": "USDF",
-        "signature": "304402202a4ae0ba7f081e68d285290303a08664b142f0b1a0db9ec6a9c81ecf24db833d022052bf9422336a8fb503491ba59f386159c173f9bc6662ff9686369cbb2c0b97c7",
-    },
-    "0x17fc002b466eec40dae837fc4be5c67993ddbd6f": {
-        "ticker": "FRAX",
-        "signature": "304402206186b9d44bff1aa192f71f9215471cf746f4125bcc8814762b6ad93791bb223602207041932e31838b03a60548a69b6055564265f3007062aecab82b5768b20e21c3",
-    },
-    "0x178412e79c25968a32e89b11f63b33f733770c2a": {
-        "ticker": "FRXETH",
-        "signature": "3045022100b07e4d337a37411b2104fbca4ef1093064ff9bb036a3adac1da138c9f33c67c50220061822b8d80b129e03785b0e33e969d98d394862d57d95f5e1f8165c78aa9028",
-    },
-    "0x1b01514a2b3cdef16fd3c680a818a0ab97da8a09": {
-        "ticker": "FPI",
-        "signature": "3044022015f3258ddb36ca6f5448c206490c7abff0d7fc723f3b44ff28796db99257ca9c0220763af121b79cab7612c93fe7378f595141c7b82b0e5c9244522329728c776132",
-    },
-    "0x3405e88af759992937b84e58f2fe691ef0eea320": {
-        "ticker": "FPIS",
-        "signature": "304402203de5b3668fcc27a573073e3c3e9768866e75b3c596efeace0833f9224da88ada02205cdcea6687b8ba7043df6de8a1f01f031e9d90b6bd15fee7e833fe934f2caedc",
-    },
-    "0x9d2f299715d94d8a7e6f5eaa8e654e8c74a988a7": {
-        "ticker": "FXS",
-        "signature": "304402201bee9606fa632b34f5272021a86d7e818b017efdd25cee3aea0353a018489e44022077f013b0165cb9c3987258e197c074930fbc529ddf22483f22f37178e369df5d",
-    },
-    "0x1f52145666c862ed3e2f1da213d479e61b2892af": {
-        "ticker": "FUC",
-        "signature": "3044022060366a75c73793a0253aa0b9d268072c82900d03b2840136eade3ec02ca85e12022031da167b374d6f3399acb1152bc6d6b5417dc8c6943af6d86fa4326d52941d92",
-    },
-    "0xbdef0e9ef12e689f366fe494a7a7d0dad25d9286": {
-        "ticker": "FUSE",
-        "signature": "3045022100c4b0bb53bc8e9d4ca34cf17ac2c113c6eeadc7a9859993912595e6dd351ca6f7022022f94c3005825cf43ff8057835f98c6ac0a806a10dab2d26c48ef3265e1da60e",
-    },
-    "0x488cc08935458403a0458e45e20c0159c8ab2c92": {
-        "ticker": "FST",
-        "signature": "304402207721ff61ef6d854c2b20d54ccc7d6a669fc4bdf7df19e8368a7b0fcf166994f30220579a13fbff98a1af5b06c5f163391445aaec77c11b7b0cfdb6431d1def2db749",
-    },
-    "0x58e50e24d5160def294b6b6410d12c597054b79e": {
-        "ticker": "FUZZ",
-        "signature": "30440220694e6e6ed7a38ce5b8f6937cb31298e4fc718b0230752ac2e0939f74267c2ec50220397ff876782be8fd1579ae5ea2eb3202bd65f6bb1b63243079c7f914a6d88de4",
-    },
-    "0x18c11fd286c5ec11c3b683caa813b77f5163a122": {
-        "ticker": "GNS",
-        "signature": "3045022100a55b04d8c66c82f59f6b319c27f35d3943b5418ba17dbca617c08ac8e43782510220020f6cd5eeda7754e8d5b3fb1468ca943eb1a53ad535f109e30d83d3887a7bc5",
-    },
-    "0xc24a365a870821eb83fd216c9596edd89479d8d7": {
-        "ticker": "G3",
-        "signature": "3045022100eff391af932642119ea6b43f030799133434ce42ded300aa65c2618d37b3cbe6022020b5241c2e9b4c23162b5b99bac85f659caa56ca2d06b3dc44651232a041a1f4",
-    },
-    "0x580e933d90091b9ce380740e3a4a39c67eb85b4c": {
-        "ticker": "GSWIFT",
-        "signature": "3045022100ef5b2c5825970a7fc3db91721a31a0cb1907e580dc124bb9709b9d574bf8c84d0220574423495827419aab20767e88786ab0dbdbe604ab6d07557a2ad41774563792",
-    },
-    "0x5fd71280b6385157b291b9962f22153fc9e79000": {
-        "ticker": "GRB",
-        "signature": "3045022100d39363bf35d90c65dd99a531bce4a0f975c1b45b05ed2e86f24d75be8324dff00220609408a713edbb0bd505265cd26ae1c879c677b5190f5b323e2818af4100fb08",
-    },
-    "0x6f9590958ce2beaf9c92a3a8fca6d1ddf310e052": {
-        "ticker": "GAST",
-        "signature": "3044022058521f4bf80139d63d86cdfeff96cef808e20f20840d1bedf304cfdd83fd89be0220318550179f069de7cd273e02e191e3da1a07572beaae8967b017c8a53ee0f4e1",
-    },
-    "0x32e4d98d3010ac12d75019c484caa78665b03986": {
-        "ticker": "GBOT",
-        "signature": "304402206b5e9a16c4a73201a1362833b10d064bf5c392fd13ed2dc8f27ced46550586de0220010fb4aa7d303d272c147a9bfc1da477f46caedf99b14c16eaead6f1696fcb1a",
-    },
-    "0xdc8b6b6beab4d5034ae91b7a1cf7d05a41f0d239": {
-        "ticker": "GMAC",
-        "signature": "30440220350049ec011e49e5f8ce0f1feca8719449320a5ba97217bb0729582c4e94a499022023532746587d855f2b992170efc2c343b1b2c6e281678135ed3edc80e1b2e858",
-    },
-    "0x458a2df1a5c74c5dc9ed6e01dd1178e6d353243b": {
-        "ticker": "GEM",
-        "signature": "3045022100db74b518c8a2f0acf8f6b1186c76909b0edafa76e9c4937820b154561c4be28602202252a49589aaaf5a78747e00aa461b0dadbd13d53f1139f76234867c8b11906b",
-    },
-    "0x59a729658e9245b0cf1f8cb9fb37945d2b06ea27": {
-        "ticker": "GENE",
-        "signature": "304402202e67870b2f0dfb3ec13cb3c3809a499f6b59c09d5b0d3eadcaa0eb706e27ba30022052405919f824c96dddb2e729235c890c83232fa63fffab45b9ac96b6eeb280ed",
-    },
-    "0x7698ac5d15bb3ba7185adcbff32a80ebd9d0709b": {
-        "ticker": "GNOME",
-        "signature": "30450221008240446700eed782686a42e18d672f95e86a8cfbc7e346f9cfafcb1c03e561b50220037177dba3b3bccc36e42e958b6ed45099c82d61d717c67d1853c97b7c0f25f6",
-    },
-    "0xf29fdf6b7bdffb025d7e6dfdf344992d2d16e249": {
-        "ticker": "GENSX",
-        "signature": "3044022005a8e68f85182625d6600af12d14ea2eb9422291f63d138384af558ca5947e9402207038ff03f6208c2a0d68dd35d06c7cffb147cb6a759e32a84b0c57b1537a8ed9",
-    },
-    "0x872bad41cfc8ba731f811fea8b2d0b9fd6369585": {
-        "ticker": "GFLY",
-        "signature": "3045022100caa5426cb611c573139ef274ce86eeb18688d7511a6be4043759536e5d485e0402202bb094b77e7f42c0d8c4923812050156d29ff6f08ce9ab451f3da37fed46f41c",
-    },
-    "0x000000000026839b3f4181f2cf69336af6153b99": {
-        "ticker": "GG",
-        "signature": "3045022100a04d6dfdcb7e941f19fbe3f079847475385a810a85fe477e5cf5772b3d78066402206484b7fa175d7607f0943417163e0eabbe05bbd844cd4aac8c77af9de322263e",
-    },
-    "0xeca66820ed807c096e1bd7a1a091cd3d3152cc79": {
-        "ticker": "GHA",
-        "signature": "30450221009b0f006c338ddd9d05bb8d3da094144229fb5338fdde06e14715129c469656bf02205f224f2dc2ad341ed22a73735ee8d9f18031b2fa34e9b7ab4b46b898a256bcac",
-    },
-    "0x43df266501dff4773f8f33179e3b96ab94dbc28d": {
-        "ticker": "GLEND",
-        "signature": "3044022039d80ef5e3b46b7034bda063f5350fa4978a05aed9febc610b55344db05ec05c02205792099fa78325c7a46b8793b9f72f914ca26c39e412a5d6a3ce3eab2cd7b158",
-    },
-    "0x4f604735c1cf31399c6e711d5962b2b3e0225ad3": {
-        "ticker": "USDGLO",
-        "signature": "304502210097cf839a377612e19e555a5ed816b0a1c508abfaa9d5a1336f9dfd1d5e88dc9e0220438f819ccccd398c638744b17f444d18fbc1d57b595444d5c89dbe214497db99",
-    },
-    "0xc14a7747cfec02cfea62e72bb93538de6b2078e6": {
-        "ticker": "GBL",
-        "signature": "3045022100dcfd67529161285e956776e155d254e7c65d76871b2fafeed14eeb5f6f8b433d022000e3914841c87cba6200ec92a7e2abe8b500ee36404d488b8db39f82a4364414",
-    },
-    "0xe9a5af50874c0ef2748b5db70104b5ccb5557f6d": {
-        "ticker": "GMBL",
-        "signature": "3045022100ae7b744f563915e6bbee4ae29f368708a3028d4df97c611abbaa8591b377e390022058f7cd997018fe2661d1de99cb337b563a8a53604e8242dee935ca5851f4efc8",
-    },
-    "0x654c908305021b2eaf881cee774ece1d2bcac5fc": {
-        "ticker": "GMC",
-        "signature": "3044022013e80b53482b00f68a962c87a930ed86faee111196557d96fda65949a9b9aa1c02204d93d488de9b165dc2a49a65a23fd9bfdc2196f5a0ff9582b8e792de97a4f23f",
-    },
-    "0x0f96d8c1277bd75a251238af952a7a99db1320e3": {
-        "ticker": "GSHARE",
-        "signature": "304402201cf9e42be1fa2ae9d928893e1f9c5d8f85c7e1951aaaef4dab82d3ab6be410e202202a9a66aecf46e9ccb76c8a619f764292362c7919a7803ca4ad1eb417e9124f16",
-    },
-    "0x4945970efeec98d393b4b979b9be265a3ae28a8b": {
-        "ticker": "GMD",
-        "signature": "3044022039231eb87efbfe5c01451517091038614d4ff74511cbbc285be9c7cbe2df3c4b022050ce048c2c816b73de2247330186c513c2a220d2fe91b2276d3ebd655fb3cfe8",
-    },
-    "0xc16ce97d04de6c5e0391e308dbc17a397183067b": {
-        "ticker": "GMLP",
-        "signature": "3045022100cb9e3bca12c3536fb3078adb5929ef4a45c3c6421f243e0cd76f0ec6a85a8ec402202952cee70a5588dd3958e3ab446c64b56db71c006c53a09ea6673d097dafc079",
-    },
-    "0x589d35656641d6ab57a545f08cf473ecd9b6d5f7": {
-        "ticker": "GYEN",
-        "signature": "3045022100dc114933dda74603f27edfb2af307ef1167fd7778e7e44ad6bf9cf317220a44002206642d02cc7776ef878c8880cbbafc574f6a9ae809c1f7ed6fb21b435313205ce",
-    },
-    "0xec13336bbd50790a00cdc0feddf11287eaf92529": {
-        "ticker": "GMUSD",
-        "signature": "304402205fd73bcf6e088148189d327688c17a359f8a8c09e8ce971ac4e0b5c84693a3ce022058222a7de67659ebbff8ce92a28cef1854e1ea7a74541b8656c61c8f21ceb849",
-    },
-    "0xfc5a1a6eb076a2c7ad06ed22c90d7e710e35ad0a": {
-        "ticker": "GMX",
-        "signature": "3045022100da3e49d3b3ba279d6770887945b07164384b3fb4cb202f3ba6659a37b23eba8602200ee70de31f76a99b55ad61c2ef21d51ba5298dda28a2cfd0958363f647ba8c90",
-    },
-    "0xd67a097dce9d4474737e6871684ae3c05460f571": {
-        "ticker": "GND",
-        "signature": "30450221008be3bc76fd786cc1682869cab71fb51e0072fffde77efd9effd567f8994231280220655aa192907451ac3e1470b25eed67587bcea67330e439a115d22e607230f60c",
-    },
-    "0xa0b862f60edef4452f25b4160f177db44deb6cf1": {
-        "ticker": "GNO",
-        "signature": "3045022100a91c8a0e187285542269308ef917f02a3966fcafc4956412557887221c3d491b022022955fdd9854b80ed1688268cfb776f5dbc937337f52be8c81a825e12bbfd64e",
-    },
-    "0x739e93844adabfd58b00b2bed540d1661d9af682": {
-        "ticker": "GO!",
-        "signature": "3044022038066a880a10dc02e7d83000273dd830eccc33252770e17cee85c41c84168d7602200f326756ae9d7cdcb583d9046b596b4613eae88a74ce19ac90017664d38858fe",
-    },
-    "0x8c6bd546fb8b53fe371654a0e54d7a5bd484b319": {
-        "ticker": "GOA",
-        "signature": "30440220078c9bb85f5dc06479db8ea95bd5c9c2d9e25b6130a2dda0a46e6b14cc15424c0220096b5df3116d91d16a45e7ca189147188f8d640ce1603f143d794ac06d3eff5e",
-    },
-    "0xa5ec9d64b64b8b9e94feaa7538c084b38117e7ba": {
-        "ticker": "BLANK",
-        "signature": "3045022100eb8990e8a3083e537cf8ce35068c3c42f1039d9518dabd815f62bd9dad9df01f02201224d30574ec2ee6c3194fb1873afa7da6401d08a51310f695085e32b0afb1c0",
-    },
-    "0xf16585365bfe050eff7c926f22df87f46da2cafe": {
-        "ticker": "GOLD",
-        "signature": "3045022100f96ac552b1028fd19f6a23b655ec00269ca07cf4b043e64c09e25e29d66cbc56022023113901d719ba9a182de4334a392e8fd7d81a1d83c7efb19268985e2e4c27a4",
-    },
-    "0x17176a9868f321411b15ccb9b934cf95597e89c4": {
-        "ticker": "GOOD",
-        "signature": "3045022100e720edfc144ac0e8b643a2cd53b9008d38a4de67883e75a5a47d95a5c861edfe0220453203081ccdd50b779adddcdb2f9b35021fc82027caad7edab72e530da023d4",
-    },
-    "0xa2f9ecf83a48b86265ff5fd36cdbaaa1f349916c": {
-        "ticker": "GOB",
-        "signature": "3045022100884ecf12d2f31bba1f840ade686e51c7525fe2e0e7824fc80507d67c40b5a3e802206561453c1b0e91751a366bb700f80f341a1f57f6176035271f52082376a4228e",
-    },
-    "0x8d9ba570d6cb60c7e3e0f31343efe75ab8e65fb1": {
-        "ticker": "GOHM",
-        "signature": "3045022100bc9b0ab6e412a8d8c2cbe1ea861b886cf7b6a1e3281f1553a7aeb4786a9771d502202b11ee03e31c69a345ea725470a31580a2bceeba7c1b31c381611fc042228f7c",
-    },
-    "0x07e49d5de43dda6162fa28d24d5935c151875283": {
-        "ticker": "GOVI",
-        "signature": "304402204a89e7ca9990e762e2641f3d87aafdbe059b9eb89d57ed5a2e429f2bb14b2d60022073a09ec27db49990103360035ae4c8f7bae41754bd0dbdf162f3ba3fe8c2fe25",
-    },
-    "0x2ef354c71caab6dc7469bb3c99642878ccd1143f": {
-        "ticker": "IGRAIL",
-        "signature": "3045022100af1db8fae9f5aca60a8b6feba6a2ff8c537ae6c3912ccf75aa1cbe3c51b3ad6c02200e24a0c1710aed5a5ff0b2075fb4c87f198cf7af6facefcb07bc43e8971a97e3",
-    },
-    "0x80bb30d62a16e1f2084deae84dc293531c3ac3a1": {
-        "ticker": "GRAIN",
-        "signature": "30450221009525fef3fbe5137da0c6bc53b6388fbac9ccb758f955155bc62a8cec270d34fe02201aab9482b8b0d00dfc17e4def087129aa1cc8739d6eb9e270b87e82b3b0e6516",
-    },
-    "0x9623063377ad1b27544c965ccd7342f7ea7e88c7": {
-        "ticker": "GRT",
-        "signature": "3045022100aaf66467cc1b633f3acd3024b168af035c8994ad72176d82cf4b40244323221d02205824c1a947df290be529b0ac7d9c731bdc736defe6dca5c5fbfac3192aaf3ad4",
-    },
-    "0x23a941036ae778ac51ab04cea08ed6e2fe103614": {
-        "ticker": "GRT_",
-        "signature": "304402203fd127545f1c18ee1104d96fe0495983bcce772c843adf1c25b3fd9c5fd3349a02204522423b269688d7290067827c0ddfbd43d6e0b795f0809c84d78f137d3fd15d",
-    },
-    "0x894134a25a5fac1c2c26f1d8fbf05111a3cb9487": {
-        "ticker": "GRAI",
-        "signature": "3045022100b79ad011d5d16fc14fc3df82cd370e3dfae18fea41a1e304757fe6c749da83c9022025e7f6af43e177b6b48b39e3dc78e05e494afaf7a3537752b085937707b846d5",
-    },
-    "0x2f27118e3d2332afb7d165140cf1bb127ea6975d": {
-        "ticker": "GDX",
-        "signature": "3045022100bcf14e253c402b7952fec34fe8f6734b772793fd7c71f115073c5ae1fac86eba02204d1215822442d0503af63cd857365998123a1389647fcb130e37eb8f492c076d",
-    },
-    "0x764bfc309090e7f93edce53e5befa374cdcb7b8e": {
-        "ticker": "GRIMACE",
-        "signature": "30440220396c9db7da9a89e58650f84e36fd15ef3131d9e62b7672f1ac1709cb21bc9729022019d546cd84f28ee65a8cc9040b7d6c306757b69b5ee51ac889567ea044d76596",
-    },
-    "0x73db621cc8f0a767bed0e5c0a2920f480d77b765": {
-        "ticker": "GTA",
-        "signature": "3045022100cafb0c1b1c6457d313d6c00961cfc47e0bb7f4384f52f2f68ed1ff627f75502b02203bd9c84a22aace933ece2b8e4af54fc1a980abc5aae6299f21f8afbcd4b126b8",
-    },
-    "0xbcf339df10d78f2b44aa760ead0f715a7a7d7269": {
-        "ticker": "GUARD",
-        "signature": "3045022100b9cabd286d0ba0ba36dc3e4ed3ce2feb7c83d131760b1f52cc2e5ad8f73a1e6602202cd579a62e886fb384393f5a446bb7bee9cfc972838d87caadab47b1b73cf2e3",
-    },
-    "0x02150e97271fdc0d6e3a16d9094a0948266f07dd": {
-        "ticker": "HAMI",
-        "signature": "3045022100c05548d83b2de7d856e3308e4a417e9cdfc3841768265bff6a400ff17fef312102204ca29d28329145bc04f816f96ee95af9095795dafa06d4852e9eb82dbb8d7b10",
-    },
-    "0xdb298285fe4c5410b05390ca80e8fbe9de1f259b": {
-        "ticker": "FOREX",
-        "signature": "3044022006130f1aae85b27b53435d3107b99755ff008fdc2d41a27cd30b4176e8cd04f102207e8dee57d7fac97c8f4228b110d806a91a8e8ed025a678c86ef8a61b39d6d9bc",
-    },
-    "0x8616e8ea83f048ab9a5ec513c9412dd2993bce3f": {
-        "ticker": "FXUSD",
-        "signature": "3045022100eef49db311535d09838da4d0329236e128f6fe57ed62a3bab5d2ff8c461941aa022063e5e40550b95280864e5363d9755e97c1e6939b74d397202113be8f15802bb0",
-    },
-    "0x2e80259c9071b6176205ff5f5eb6f7ec8361b93f": {
-        "ticker": "HASH",
-        "signature": "3044022052854f61db0d4c1f19c9b1db84c5fdc62244563ce5fd5d17e19d3fecda81c64102202e4a5ba4e87cc3b9b560b9b261bb42dc531f67f70fab42eaf022f123b99cc848",
-    },
-    "0x431402e8b9de9aa016c743880e04e517074d8cec": {
-        "ticker": "HEGIC",
-        "signature": "30450221009768470abe58a8782ec74e8db057abbef147831e48e5e22a58ed40573af5f8a202201750e180993005f2a97b8d4534538d256bbb5350d3b106fc62ee703d516959d3",
-    },
-    "0x80dd74145b8bb10cef01bf914f796bd8b54d7809": {
-        "ticker": "HTE",
-        "signature": "3045022100f9cce035fe93c694c058d1a9139f16ecf15db6ac628ede34d629369ef5e1b198022031339b2f689acce46a08290585e4743e069b3e01cc3703169b8a081451c943f8",
-    },
-    "0x83d6c8c06ac276465e4c92e7ac8c23740f435140": {
-        "ticker": "HMX",
-        "signature": "3044022006ac6e9f0dff34e7f666b3bbf6db0e9be74efea6a24fbfb5b3ad45114441be9b0220231d33552c160856cfb3a7b18224173fb5060263fa4eb69a49f7449a4c14e1ab",
-    },
-    "0xb4bbfe92702730ef7f1d28e4b9e42381182f48a5": {
-        "ticker": "HOLD",
-        "signature": "3045022100be5857aee665f28ba7fb951e2c24ebc48c9400ae2af94186644ba0ab7870206402204a382c06f4f16737f86f49e1c7e4cd697e49e2a4e4e0584339b4b3dd6a6ad832",
-    },
-    "0xde31e75182276738b0c025daa8f80020a4f2fbfe": {
-        "ticker": "HONEY",
-        "signature": "3044022037f56dfcfa334b11a59ecbbaeaed75601ac926618b987cca3cbd220e2a8e6a3202207f282b75c2936bb497eefa139846d50ec95ee49cf058912e6662a4ecce72c185",
-    },
-    "0xbcc9c1763d54427bdf5efb6e9eb9494e5a1fbabf": {
-        "ticker": "HWT",
-        "signature": "3045022100d9abfdec133d3d17c8cbc7dd4ad9d38cb832ca1213f2eb42b1803065aacb84be02203d5bc537f3f2299dde9ddac1eb86b2d24677ee48109b4f9f5a47ac7ac3556b2a",
-    },
-    "0x1eb747cace61eab366c98a18617b7e210d03818e": {
-        "ticker": "HOOD",
-        "signature": "3045022100897a03413905ecc9bd78ea21b4fb36576d6382a25b9d03b87f293defbbb98bce0220495af79282ed1871c8b5192a38f3accfc6badc4321729da2851b9d009d7f2c5f",
-    },
-    "0xc5102fe9359fd9a28f877a67e36b0f050d81a3cc": {
-        "ticker": "HOP",
-        "signature": "304402201029d33108e95d9462ceb49825f67556be3edc418483b7618b50f1e7084943b102200faaa53d002f77ea4679be245d723cf5ea042bebbbbf24accf3a5c5af9342fa5",
-    },
-    "0xb1bc21f748ae2be95674876710bc6d78235480e0": {
-        "ticker": "HORD",
-        "signature": "304402205aac01db59d464462916c103598093bf7c8cdb60168251868c9e925ac81fb9750220263461644e4de61837625c85572a0eb87fd0d9372420735c6c824f581fc8887d",
-    },
-    "0x9925130735a30cae869230a9f19eedbaa71a2c02": {
-        "ticker": "HORNY",
-        "signature": "30440220089da1b50d926298d6e91b2d2757cf8ec6ab4f3d4baddb0e7bb7c4f9c625819702202c23a2c0dbcc04b05b32db34b7ca63a13d135f945631fbef25c8ed649fe743a7",
-    },
-    "0x10010078a54396f62c96df8532dc2b4847d47ed3": {
-        "ticker": "HND",
-        "signature": "304402203e36cd8ffde04b13f9d7ca36459d80f761af6d666350fbfd96e1d945f8bff5df0220546f0827628614529f7e1dd7e24d018b57738062371db947f598b882a5c7ea93",
-    },
-    "0x3404149e9ee6f17fb41db1ce593ee48fbdcd9506": {
-        "ticker": "HDN",
-        "signature": "3045022100bb18354a524f9fb85d7d7c8c9116bdf4c74219dfdd4d4d93573588be86544cec02202af4b47820e7c4b235c08a132dbd7fccfd3899c4ff3dfa3a01d179c01aaec503",
-    },
-    "0xe4421566a501045ae4285996577a36f6cf074190": {
-        "ticker": "ICE",
-        "signature": "30440220183f42d31f711785c0065446ce8e6a4b31f303e01382a2f9d7edbca7912f77fd02200974c6389ca9dae36f7a70cae9b26f66f5aaa937877549fa114719723b9467b4",
-    },
-    "0xadf5dd3e51bf28ab4f07e684ecf5d00691818790": {
-        "ticker": "ICHI",
-        "signature": "3045022100f3df4555795c047a3aa6341d7a2fc0d9bee70679080c2ed571a1226caa997f0d022019f8c5a5e0e194b2335f0eb87e4aa7f5c24305cc49b4acf1d4537c60519e0ebb",
-    },
-    "0x9dca587dc65ac0a043828b0acd946d71eb8d46c1": {
-        "ticker": "IFARM",
-        "signature": "3044022047acbf3103609c7f50af06ab9a5ef81903b98e7b546b00ebdc345beaf0f85e8402206bd6a41745641ec6aa81c655dfe3dc18b717fd02bc58172b67113c215db3da01",
-    },
-    "0x51f9f9ff6cb2266d68c04ec289c7aba81378a383": {
-        "ticker": "IGS",
-        "signature": "3045022100fdee51aedb24dc01d9e3de9bdf9e1422b1e8229e2a145444ceae71e6244dfa6b02205d6c74f85c4ebadd5cb88d44b1cc01c97cb0b70b98df6b265faede1401443838",
-    },
-    "0x4fb21b1dbd1da7616003ff3a8eb57aeab3d241f0": {
-        "ticker": "PACT",
-        "signature": "3045022100ec2a13a8f1cd932fe87c2f4b4f4f4b13b69e8170808dcc51fb0b98a872ebd7c902201059bc29d72a8fd2020d8e3441596abf7e41e3059c06dd7c1a7bfe4e69b1b306",
-    },
-    "0x56659245931cb6920e39c189d2a0e7dd0da2d57b": {
-        "ticker": "IBEX",
-        "signature": "3045022100a7e4da7525743806e161f6b3fd00547e61da53a4d66f314d42f4367c8d6c4cdb02200b6b7bd793f4515a7fd4cd1798e2c486636df030d2efcab8b4ce4a509736be99",
-    },
-    "0xe6045890b20945d00e6f3c01878265c03c5435d3": {
-        "ticker": "IDIA",
-        "signature": "3044022030de5b0d5bcd074b6b9866402c8ccba6c110552a843e0f0bfec28dd709c658e4022033b35178fb56513432e63cbf3d64edb58bfb9005122ab37557c0216b8bb04cea",
-    },
-    "0xb965029343d55189c25a7f3e0c9394dc0f5d41b1": {
-        "ticker": "NDX",
-        "signature": "3045022100cb2b2cf073758fbecdcbe517956c423a13c82cf5b3803a45ac4181615557c4b6022056dc07dba4fe2fc6965a7d6f2aa147006a9b812d077818e1e4f5ed8f4114452a",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "3045022100c2cfd5c6ca4dc40f016fe254eb8e61832619b99cc999a52d4ae27a5a94d963fd022021281c754d8085b7a4b9a1d9a1d8818066d1c5e94f0cfcf7827a8df7bf77d34f",
-    },
-    "0x34229b3f16fbcdfa8d8d9d17c0852f9496f4c7bb": {
-        "ticker": "IPOR",
-        "signature": "3045022100dfc373bcc1a00b1594e08c95a43761d7530a924d3abc16efae37b24e245d6307022059500373a83102f2ef42f4a0d5c41761fc9eed46ff74f73baf98accd72606b4d",
-    },
-    "0x6d30ab63fc4cddf268edd294a8d1b07bdb282976": {
-        "ticker": "ISS",
-        "signature": "3045022100f6d20d46618cdce5eea4b5a0dedfd8231e481959a94d8234387061d3f1471d9d022003baa72b931a6573809b7262604a7c947c53e8689bbbdf487af5eb180cc276ad",
-    },
-    "0x0a3bb08b3a15a19b4de82f8acfc862606fb69a2d": {
-        "ticker": "IUSD",
-        "signature": "3045022100decf776591f1f5594f5045349ef1129bbba7581df3882d51318750e5477eaa0802204ff3a87094202352dfb80b2621efddbe64d6050cc54fbddb0cf6cac8acb96b78",
-    },
-    "0x60d01ec2d5e98ac51c8b4cf84dfcce98d527c747": {
-        "ticker": "IZI",
-        "signature": "304402204ddaeaff0b1556408fb7665b59ceb462a375d52f5c1f695c2c9cdc1d4982eb7902203f8ea54860dd100c8a42689c46de74fdbb9422761baad8474ac9b83262796ca1",
-    },
-    "0x2c7941a0fe9c52223b229747322af16160161c98": {
-        "ticker": "JARVIS",
-        "signature": "30440220345687e2d05deaa8bb467aff8532694e64c903cfd5779afcd4e24aa3c5d93bdc02203e4eea2e68860a2757aee967e39c4f6013d63766724026d5ce27c9addbbddc43",
-    },
-    "0x6aa395f06986ea4efe0a4630c7865c1eb08d5e7e": {
-        "ticker": "JRT",
-        "signature": "304402205886d3dbd260be482210bc6b3cecb554d4b2470390f915ba995212e8c50ef817022071a31b6b7489ebeee22365d10eb81ff818be750e9e346da35a4c555fa7bd6fe2",
-    },
-    "0x371c7ec6d8039ff7933a2aa28eb827ffe1f52f07": {
-        "ticker": "JOE",
-        "signature": "30450221008c30ea73afb896dd72f690d343961e216b6692475c9ec7b2d8825842752b4e050220299ae6227475eedfbb522100c30a2ee96661385c3181141188e7f52a2e90a39c",
-    },
-    "0x10393c20975cf177a3513071bc110f7962cd67da": {
-        "ticker": "JONES",
-        "signature": "30440220543fc6fa0dfc2c59ea5edfb1fa3d68f1d39d13691eff3effa5b3ec756a68844e022073d04458510d92afa926e70cc6f9a38920ae7cd08913b44c3516e3030339e31e",
-    },
-    "0x7241bc8035b65865156ddb5edef3eb32874a3af6": {
-        "ticker": "JGLP",
-        "signature": "3044022057283b0d76f95813f2fd696113609d85700d85d323edab4cbe9136b79b0140780220097d764d527818c404f0904d7855c986bce023a0e5462c601be1d83858ad4b68",
-    },
-    "0xe66998533a1992ece9ea99cdf47686f4fc8458e0": {
-        "ticker": "JUSDC",
-        "signature": "3045022100baff79c63cb3cbaf6ea5d134d09217be0b872e427caaaf878549f439e878749702203716021ca4e03d2b716726f32adf91db15540e78c1e669e40cf8bb4e1e28dbcf",
-    },
-    "0xafdefd913286a1cec75aca503938c6bba01a5445": {
-        "ticker": "JPG",
-        "signature": "304402202323fe98870acf2e915fd700d2c64227d1f20aafd040fa6c2a92e2ce5a8360e9022002ae5a42519de3c609f2bc23c4618d98bdb0306f6bb544ae6d7163deed2213f7",
-    },
-    "0x53bcf6698c911b2a7409a740eacddb901fc2a2c6": {
-        "ticker": "KABOSU",
-        "signature": "304402207bed3a96905511f0985a9f5a6d4f6138db45275ebfe910cf13a548b7383a1286022017f04af751fef0e23ada3b2cc43331814b73f86d1f78de8228c914e81a2da6fa",
-    },
-    "0x965d00aa7abc62ca10132e641d08593435ac811d": {
-        "ticker": "KAP",
-        "signature": "3045022100f506db23ba30aeca9c9b943e1f92fcfb70ec5e4b31a72bb2fec44a9808f7b8e202201980c4c793af006c399b8bba6e0615949aec3452427f166b2e1b95774b34f8e3",
-    },
-    "0xa06d505ec28fd9756a200d2b503a66103db98d09": {
-        "ticker": "KEI",
-        "signature": "304502210090a826b4ff60a4c9c0887ded0a1732030f46148854ab15072c86f93fe446e071022005dcd6b01a32903ce1bfcc84ac110c55b2e83f007be69478a8c1ddeba10163fd",
-    },
-    "0xf1264873436a0771e440e2b28072fafcc5eebd01": {
-        "ticker": "KNS",
-        "signature": "30440220314ab6c8dc3bb21c992eac3f82fd7396b9b7055e15437fa8fd16d0374de56c11022075f65941e6074a30e596c95405661d518842fe9a592492094c876450ee00b13c",
-    },
-    "0x2389f6a46562ae5f1557db8562c39ef553f3832b": {
-        "ticker": "KERC",
-        "signature": "3045022100c17684e16bae4991ebce8c3a6f6a15241523f9a124bcbe18f35acd38251131670220762fcf24b3495c5f8dff560c41f53f11b1ba18c09cfdaf78770cba3174d420a8",
-    },
-    "0xed5740209fcf6974d6f3a5f11e295b5e468ac27c": {
-        "ticker": "KWL",
-        "signature": "3044022007b2a42774c6e160cc18708c831f911a0f16d50075f163449fbbbd682319f50c02204181adaa61bfa2b7e058ad05509c3935cde01301ff1db686e8f14992d4d7d841",
-    },
-    "0xa15907f3e7fdd0a83ec56f4ac543cb10f4d783eb": {
-        "ticker": "KEWL",
-        "signature": "304402204865aa9c511a036d46f5742f35ae909b21adcbbf0dc59a900de110fc1d990d3202203a4d4ff2a4a9989f86b1dc54b1c5e27159a7325f9523ae9674b484140fb4d6d0",
-    },
-    "0xf525e73bdeb4ac1b0e741af3ed8a8cbb43ab0756": {
-        "ticker": "KIBSHI",
-        "signature": "3045022100c14570d56de1517f40bc78350464311d8274a93b8062845959f76de4850c31c8022073cc2ae685f0dffe30c4cb4c61e440aadfeed3db2b7d2cedbf48abe7e174858c",
-    },
-    "0x6b5b5eac259e883b484ed879d43dd4d616a90e65": {
-        "ticker": "KNOW",
-        "signature": "304402202837e4ae11f9ca59f69398bd47b931c389e9005af1bc117e5e4c30e3308073920220434d44f6c21d46cd3d757217e643d5ec6ea0cb689ec916c8634e504196338f14",
-    },
-    "0x98c435070c24e5152fc14d130937a38810c104b9": {
-        "ticker": "BEEF",
-        "signature": "3045022100eda3da72d65b1286a4b8525d688e9bba3923ccf1648ff53838351a99643a7f00022030e0999e007023ef54c5820a20f111743cebc242e5640c2975109ce1a148f5db",
-    },
-    "0xa58663faef461761e44066ea26c1fcddf2927b80": {
-        "ticker": "KOM",
-        "signature": "3045022100a4c3497e5c76b8f990956d516923fc7aaaee5f0cc847ea599b112d81ddd7707a02202766d98d700c55e644ff1ba8cc2826b1bc273193e0a28354ce9f36d205cef5cf",
-    },
-    "0x50e401255275dc405a99d3281f396cca681eea9d": {
-        "ticker": "KORA",
-        "signature": "3044022025ad4cac2c55cf24620f99530b57e39d29d9b7d217450dac60a8611319b578aa02206777cf0c9d58dedb387a26fa9ee5d73583f420791a835412b94890fadc491d41",
-    },
-    "0x55ff62567f09906a85183b866df84bf599a4bf70": {
-        "ticker": "KROM",
-        "signature": "304402203de8b708f031b4a365d70a10da82b39eeff61efc2e88c6561d6b857c4add76d50220113481c4d1943a2a7a84d069dc0094bfa8947ca3f826a1e64eae6042b69491e7",
-    },
-    "0x3a18dcc9745edcd1ef33ecb93b0b6eba5671e7ca": {
-        "ticker": "KUJI",
-        "signature": "3045022100b256ac3aa19b0d3f430a1fd4eae8360917e16d85c47b7aca5a8cbb973911065a02207defcc85ac9e4e4454aa1a8d2da77d535c62bde56d891f86011db28b4f5c2dd7",
-    },
-    "0xfbbb21d8e7a461f06e5e27efd69703acb5c732a8": {
-        "ticker": "KNJ",
-        "signature": "304402203561d3398a6b76926961377cbaf2e82eaae990d40e74884243aad3d45000ab9502200c7409244bfef3729e0e8570c06e1fc052adcf8c25a61a231cff9bb52319c3fb",
-    },
-    "0xe4dddfe67e7164b0fe14e218d80dc4c08edc01cb": {
-        "ticker": "KNC",
-        "signature": "3045022100a3833dcb9cff6fa568dc5725b377181b8606769a81de68d1db93903f15fc55ed022070bb1c90991786620f556ffeb8413e860a8fe270c17946303b932699bb2669ea",
-    },
-    "0xdb13df2ea134e7df2208d74b96db063837db5b5c": {
-        "ticker": "LAMB",
-        "signature": "3045022100e6afdb4d70d76a8079108b7da0782bd308a23fc825d40ecfc2cab6fe0253811f022032defc87611768f0f8d2d3c00de58c1d579f5af48664c3edd6c0911139ffa8a2",
-    },
-    "0xe10d4a4255d2d35c9e23e2c4790e073046fbaf5c": {
-        "ticker": "LNDX",
-        "signature": "304402205ea91cb52cc26d0bb58e96531ab0a8b447c1e583d1b712eea926a1a1d83d9527022066dfe1453e13b1a2bb069425f657895359a7692388cc929a5d2f6a844e437acc",
-    },
-    "0x2cab3abfc1670d1a452df502e216a66883cdf079": {
-        "ticker": "L2DAO",
-        "signature": "3045022100aa30ef4e10e79fa106a25cf13cdaa901bf810eeb6b1524af2f657fd4def4eeb6022017b7f6efc6f35e1c5f723c0e070807b683fd765ee74d97f900219b35b1fca6ab",
-    },
-    "0x9c8ef67c9168587134e1f29a71405dc753500a45": {
-        "ticker": "LG",
-        "signature": "304502210093ed03dfbe5aa7846db9ef74d919a25b260d4ed73ed0e675d1f7c0f20d969300022003886283d02e00943ff5fa33484c0c1fcffd39c0970966db3140b91bdf4e2208",
-    },
-    "0xb64e280e9d1b5dbec4accedb2257a87b400db149": {
-        "ticker": "LVL",
-        "signature": "3044022005d3a8ff7ea3bb2b7c4987284e27c7b6de5b5f8ef2aa55f5354c5f058c016578022040e2f162c73f547f12a80d87c8b37384bfcbb85447e4eb4dace7b839687e5c7a",
-    },
-    "0x954ac1c73e16c77198e83c088ade88f6223f3d44": {
-        "ticker": "LEVI",
-        "signature": "304402202272757ce01664c57651c97ec61560d6b1dcac952d8d5a5dae45753dd0826eba02204fbfc5b51a3ccbbb12651d7280fa96058179e6bbda19147ea0ddcdc5592b75ad",
-    },
-    "0x6bb7a17acc227fd1f6781d1eedeae01b42047ee0": {
-        "ticker": "LEX",
-        "signature": "30440220122cd90ef4eda6347236c1420826d6719ed58cf5944848dabfd9be23e05ff4080220612d5ba624fbf839eae1fd209d5f2bebb4e93bc1f2442af2f527b83c17f2646f",
-    },
-    "0x13ad51ed4f1b7e9dc168d8a00cb3f4ddd85efa60": {
-        "ticker": "LDO",
-        "signature": "30440220049019c0ede4a37074adb2680c24a6204807f1e3e96a43a7f7871d7ad204db210220799afb5adabfbfb6ee9bd4ec2aeac04b0d03f29f99dedbd317b799da7bf97933",
-    },
-    "0x0c59fa9f3edd3390504aead12cc7f11383280941": {
-        "ticker": "LIARB",
-        "signature": "3045022100d175de3f746c5383238c8a405356030fe5ae04e9293f4e88603d9639e2259e2f02201bd62b581b07fc09252b51b6446291b0638d6033af9f0008a3b2446d6d43d4b1",
-    },
-    "0x94ce70997f99dafc87daab1fc1d7793398c00f21": {
-        "ticker": "LIETH",
-        "signature": "304402203e8cdc88f8b3d5ea880f34ff81139ddf3f3d4273ffdd965f86d7e5d071153f2e022019c63446e59efa91d35e950bf2cf952c9ba083f5e9f84308f67cbd3f5539a861",
-    },
-    "0xc7ca690f5f062de2f373a789379c14e2cfe685e1": {
-        "ticker": "LILDO",
-        "signature": "3044022027e1daf1e4d650b0971aaea9aeffbb0cc338afc2e77c112e9cf08e584ce132c702203891e3f9c131f3700981aa46e6a3796232b5745edd2390a1a666bbb952b63997",
-    },
-    "0x655a6beebf2361a19549a99486ff65f709bd2646": {
-        "ticker": "LILAI",
-        "signature": "3045022100aa61f188e7caecdb693c8abccdfafd0921407032fc20c96e17d84e00870c95580220470d5ebd196cb7e720a4ef33d5349f097a27bfb6f7434afc27172a4d1a549241",
-    },
-    "0x039d2e8f097331278bd6c1415d839310e0d5ece4": {
-        "ticker": "LINDA",
-        "signature": "3044022036034f41a89eff806f0aa8781a535d48c5339383efdeed17c68a8ebe800d89ba0220354b1cc23c0963ebb28966dddb6d507d8b3e50c67f42e0117bd654f8c2df20ad",
-    },
-    "0x8ebb85d53e6955e557b7c53acde1d42fd68561ec": {
-        "ticker": "LION",
-        "signature": "3045022100c6e8d551040292d5bf78ba25e7d8815f348652960453ee26ce4af4484045f23f022032e4358638759f26c76b69a372578d56ef3ac9a4c935f718d5013ee5175d39a0",
-    },
-    "0xfb1f65955e168e0ef500b170eed4a4efeb99ae32": {
-        "ticker": "MEOW",
-        "signature": "3045022100d496e90a86810334e7004326fc1b6d8c220b8bc0d52959577347627c635f1398022014fbee62e290c121c4f830be189e8fb246d224c06be28f8384d2f5f313389113",
-    },
-    "0x93c15cd7de26f07265f0272e0b831c5d7fab174f": {
-        "ticker": "LIQD",
-        "signature": "30450221008d8b93506ed14ce8c67be1a84b57d30924f85bbaddc3ada8b3669f1699472efa022008172787b13297daab9934b370a57b772e2661b4473e2970b53121f2df29fc3c",
-    },
-    "0x935a33e05ecbd424c1691623c99e501ae22400e6": {
-        "ticker": "LIQUID",
-        "signature": "3045022100f64989420ca74cd7ec0a4e97b14298f2a00bb91401643db742ea1dd3b9b96f8c022023ab4b6c17f753707082c148083395af9e101b164d3fa0331c5f03e703a6c2d0",
-    },
-    "0x289ba1701c2f088cf0faf8b3705246331cb8a839": {
-        "ticker": "LPT",
-        "signature": "3044022072e1dbbf5f43c199ce458338cd3d4068c04feac4e3c5c8a612b41e4b7d31b2ef02205dcdddee09dd84229684d54f3e1ee3e95b6564a8d4298c44570707caabb70381",
-    },
-    "0xe1d3495717f9534db67a6a8d4940dd17435b6a9e": {
-        "ticker": "LOCUS",
-        "signature": "3045022100b9c62fef7ccda488cb61dfe92e9e077537e66c26da7b520e0560d013505fcd63022051bca056077d89288146d2b7514948ac92552a5f16b5a21ab72d60ffc48359a9",
-    },
-    "0xf19547f9ed24aa66b03c3a552d181ae334fbb8db": {
-        "ticker": "LODE",
-        "signature": "3045022100bc49d0227fde0437bf78e5f40b59c971c9f3ccf9042d7038e1d92cf4cdbc34c00220261b5cfc3e414f334af65108f3d808cc60e143d20ac0e3a3abe85a525ec59649",
-    },
-    "0x46d0ce7de6247b0a95f67b43b589b4041bae7fbe": {
-        "ticker": "LRC",
-        "signature": "3045022100db687befd606c10cb26a55b522dcfd351e1e4fc821caf05f9508d5e9726d765202200c5c4954bdafceade1a4552f601e4229467bbf321eb3f0efc62f6d5a8219ed6a",
-    },
-    "0x700e4edb5c7d8f53ccb0cf212b81a121728e1d5b": {
-        "ticker": "LOPO",
-        "signature": "3044022073d00ca7bcdc204b5d116ec4b36c369c2ed5b72a7629a94e353f83021ab211cc022036bcafb114711ebb648c26ded050d0f92bb8623a8842c57ea33c6a2fbc745b3a",
-    },
-    "0x816e21c33fa5f8440ebcdf6e01d39314541bea72": {
-        "ticker": "LQDR",
-        "signature": "3044022018e90e3bc68ab260dad1b7dda6f31147bd0508edac363e3e0c88277431a3372902204dc88b304ebd7b814950fbe1dd200b969634db5827e7b7c05ec731cffc6dd317",
-    },
-    "0xfb9e5d956d889d91a82737b9bfcdac1dce3e1449": {
-        "ticker": "LQTY",
-        "signature": "304502210089ee4aff2ec6cf7104f5d7a25b799f0d0d08714832910f059014ef68911b4248022028bd6a2e945b98893f060bdbc9d598d24058c41bfbc2abce34921daa2cecb591",
-    },
-    "0x4c70d32295de15fdf302d3bcbb7fc2631ace1c91": {
-        "ticker": "LSDOGE",
-        "signature": "3045022100a321c926f9510fc372509666dd1d728cafb70ed13558dd9eb58ba8e7692a30280220458282424f9ccb20036f60cea85b23e97719c10cbae73757717e5a2a57da1c92",
-    },
-    "0xd4519f4a905c4b6794a146a3852e4f74ceb66f17": {
-        "ticker": "LUAB",
-        "signature": "3045022100e3015bfdbe28314285b24566e4ccb8c811550119b173cc5e46acae6e6aaebdcb022052bb399f7fd629db38bd4b32a2b15927214d4a4976c51c74659b4a1c36ad7ce6",
-    },
-    "0xcb55d61e6299597c39feec3d4036e727afbe11be": {
-        "ticker": "LUAG",
-        "signature": "3045022100cdf59c8e8ea38e7ab976c8d2c99e0ac926e9fe894841f0fe5259496fe672697b02205bdefc05bdd7ec6d4765fb418ab3ecc48f635bc373ec88eda31fc7af27680234",
-    },
-    "0xc3abc47863524ced8daf3ef98d74dd881e131c38": {
-        "ticker": "LUA",
-        "signature": "304402202ec31f5933b86bfaa5f2d0c10d5e8fa048f1a94d51f51938fd1b5c34c584d43002207d1d0d5b1f8cf52b17185892c722c3d79dfc8ed17165d256a4103f258762f344",
-    },
-    "0x15b6ec24f59fea164c6e235941aa00fb0d4a32f6": {
-        "ticker": "LUAOP",
-        "signature": "3044022048b94cced11436904705b8f529fa783d9f43988f536438e4b9795d311aefdb6002207e552ba85fcc4380c6b29207008aad8655aec6c78076546e148269fe0d1cb53b",
-    },
-    "0x1dd6b5f9281c6b4f043c02a83a46c2772024636c": {
-        "ticker": "LUAUSD",
-        "signature": "30440220142bb8ea5a85871ffdbefb3dd3f2b423b055a50d95f42a911d0167df769b324d02207b3dfaad5a3b982907ac5fca1cf2681b4f6205b0e16edd61c9a51e3789fa4e95",
-    },
-    "0x1fc01117e196800f416a577350cb1938d10501c2": {
-        "ticker": "LUMIN",
-        "signature": "3045022100b875c517c01e1ce47cfe41e68077e13d5beb99854b347803fd1867ad6c697f58022069b0c8ece42e82a21fa94e25af4a85a2fc7ad197d7f6a8b98f7403caf423cfea",
-    },
-    "0xa6ef0ad746d1c35d6ff4d66ceeae0e596d742924": {
-        "ticker": "LTM04",
-        "signature": "3045022100a8579b79355f46e8af3856e96b67f64cf5b9559a989569c563aa1bb62c45d84f02201b552a75054ef90a8ee5456ec4920d4d2e40a7bb32256ecdee7d3ac405df3be1",
-    },
-    "0x1a4da80967373fd929961e976b4b53ceec063a15": {
-        "ticker": "LUNC",
-        "signature": "3045022100db41b695c87d3299a7e5e794b70f11f7efaf7c0ccacc3efadbdd06d35705a87402201aab40cb9aab4f5941558c191ffbb66957adc87574e321fce531c5c0acfe36b8",
-    },
-    "0x93b346b6bc2548da6a1e7d98e9a421b42541425b": {
-        "ticker": "LUSD",
-        "signature": "3045022100fc235253decce42e7ff0fc18b9ca791c15bec0a3932655fb54a69be1468c9ea802204f27f3c82371117852b20a68756e991ecc9365c48af5bb360014fc09e2d479a5",
-    },
-    "0xa23e44aea714fbbc08ef28340d78067b9a8cad73": {
-        "ticker": "LBR",
-        "signature": "304402201e187bc0d0fa0e4b82b77f85dea8f2e25dfc171d394326ac8ae0742ad64f1045022040ed186d884756952ad89f9601dc10bef8fec8a951cd84052265b2ce21fa7d3a",
-    },
-    "0x079504b86d38119f859c4194765029f692b7b7aa": {
-        "ticker": "LYRA",
-        "signature": "3045022100d275ddd47a6a4f5c9cc93e1c7042b929f6dd1c19184fd3b240cb77e5d010389e02202fcf3a8be9240bc979fa7e980ebfd0c31f324d52beb0d79d7f04d3982d557a1d",
-    },
-    "0xa4f595ba35161c9ffe3db8c03991b9c2cbb26c6b": {
-        "ticker": "LYS",
-        "signature": "304402206554feca0ebdd804f85f6279a123d79cb428ac8f95d96bdf7819ffb02477250102200dde358a797d33b4d424f87e0d97f3a20105f32b28e2c02d0fa6f98030046cb4",
-    },
-    "0x56b251d4b493ee3956e3f899d36b7290902d2326": {
-        "ticker": "MMF",
-        "signature": "304502210083262dde1b92a303259b31fea5a7cdff161153aea213d74cdfc77e8d8ee5879402203248d486deae49335f7df361a58fc96d30856e5765a0566d994f4f3c711aa58a",
-    },
-    "0x539bde0d7dbd336b79148aa742883198bbf60342": {
-        "ticker": "MAGIC",
-        "signature": "3045022100a0c3e2d65b033461b8c387de2e4f091d5f0d7bfb2012ec406ad740a39e90a02302201045cdea62ed9d0ad91aa3ab7b5886b4636db1d8477d01855c7b49d2a0506819",
-    },
-    "0xfea7a6a0b346362bf88a9e4a88416b77a57d6c2a": {
-        "ticker": "MIM",
-        "signature": "3045022100e37377e1bd24a918a9d4d400f71a0858374bb349e15e07e4638ad0e1212905ec02204782a822958803cc93caa8ce8de2f8df7057e075bac34992a5f4662ba50f61ce",
-    },
-    "0x85667409a723684fe1e57dd1abde8d88c2f54214": {
-        "ticker": "MGLP",
-        "signature": "3045022100b43ef4bd7c1a0d3921027dc35cf10e5291d2ad2faf07de1e74146e48316d14b702206207a5d92c9e75af36c0afb48937d67b274910e614378ef024efbf7016f34a4e",
-    },
-    "0xa61f74247455a40b01b0559ff6274441fafa22a3": {
-        "ticker": "MGP",
-        "signature": "3044022076513e7b833da25a68ef5ddb6212e39ff7969abfb4a6e123c323c58bc01ec3f30220255f69326ab57415f7a4689733b624f7a23a8e4f052bb1fb1df85c7801e9b850",
-    },
-    "0x3f56e0c36d275367b8c502090edf38289b3dea0d": {
-        "ticker": "MAI",
-        "signature": "3044022001c1ee119f2239001db6cfbb62eecf20ebca8d26f647e84053bcf16f204e37b302204ea53396e1117fd0b87df16f168c9bd13ed2d62d7d3584f08c6d321183735d8f",
-    },
-    "0xda0a57b710768ae17941a9fa33f8b720c8bd9ddd": {
-        "ticker": "POND",
-        "signature": "3045022100a9f8a1e6d08899489212a3197b3c686323119adc61304090a62f57e2c7520f490220420ec06e71e8ba4ef6fcb1a4ac920068aace55f10a9d5f0181dd05080f4766a9",
-    },
-    "0x99f40b01ba9c469193b360f72740e416b17ac332": {
-        "ticker": "MATH",
-        "signature": "304402202c14d8dca6605139e6d892f358b5d408a405d9a9f6f515ff6520234946572da202205296ce4ee746e6890b1780e704476a38a3580ce0b772ae81d4ecaedc4a8906fc",
-    },
-    "0xb4e3eeec43ebc04f28d31f2c021d15e9f56f0e54": {
-        "ticker": "MAW",
-        "signature": "3043021f3ddaa95bc1e03272ed9b49a305459e3d3907ba158321d65df49b6ce44ec40b022020148da4f3c01c20c4d4d8f1cccb89b4d00fe420404eae20fb6f20a0ff2f3675",
-    },
-    "0xf9df075716b2d9b95616341dc6bc64c85e56645c": {
-        "ticker": "$MAY",
-        "signature": "304402205708cc6284e836a55ef3fd2449608ae28c2683ed715213506201d0560b9fdace0220307571e15a549c1eb34bc5c9996f264030c573dc5b17b18c800530c558f07d5a",
-    },
-    "0x4e352cf164e64adcbad318c3a1e222e9eba4ce42": {
-        "ticker": "MCB",
-        "signature": "3044022056aac8809e082bcbb3603443ef5c039e3aae4b949cfd11bc95453d57077064c00220035b3206384c725d8f43bc1e3f3ff095892e5dd48a505598bfd37483845dc20d",
-    },
-    "0x5298ee77a8f9e226898403ebac33e68a62f770a0": {
-        "ticker": "MTA",
-        "signature": "304402201188bae809382b6fcf751ab35e7a71c65eb99ead4eb087d28eaf6a91b7335559022032c240ee99eb331361243ec78a5312e53107cc84b7483d4b79d3359c9ab5089e",
-    },
-    "0x519062155b0591627c8a0c0958110a8c5639dca6": {
-        "ticker": "META.D",
-        "signature": "3045022100f97631d6ce0b3f212895a0343dfcdfa61b7af58cd320f452321ad25a399c3f27022058c2e1369fbde9174ff876ece14f6f7aeb27a7878ef12f8481a7b1a26470e491",
-    },
-    "0xd1c533a00548dd9c1e7b0f8ea834f65383b116de": {
-        "ticker": "MPCKT",
-        "signature": "304502210093f4fb01d28b3c05a67a22990b725c66894241ec36e372db35021e9a092a4a3302207f3e3cd27425a58d812c6663d619f22949e5dc884c388ffc55ccd09ad2794eb6",
-    },
-    "0x15a808ed3846d25e88ae868de79f1bcb1ac382b5": {
-        "ticker": "MVD",
-        "signature": "3045022100b1d02a7e1d033ace1729a4870943b28e568a845bf3a53e8d5b0382c59793bf7d02203558216c37d52966e811c53bd90069ecf8520e7bf2b35fb67632552c585dbd51",
-    },
-    "0x77308f8b63a99b24b262d930e0218ed2f49f8475": {
-        "ticker": "MSFT.D",
-        "signature": "30440220525d820d4a002c8ba12feb0258e13438f2c36b6df211fe0b7397691093c2d3ce02205fd6104e50693ce07f93d54031dd6644a05b34543ee0851f88370ab8021774f1",
-    },
-    "0x3b60ff35d3f7f62d636b067dd0dc0dfdad670e4e": {
-        "ticker": "LADYS",
-        "signature": "3045022100ff21fabb3c0df8e45f9441dab62697a7bd63c7dc49807b44f0d10a3dde845edd022054ed3b214dc5075d59ede12b41ebbc7c910c43d6307880364f36924606f38032",
-    },
-    "0xf0dfad1817b5ba73726b02ab34dd4b4b00bcd392": {
-        "ticker": "MNTO",
-        "signature": "3045022100d3f7cb2f63d3e463a46cc89d28e75c4d5ffbb3f0db15eab738436304c047b72302207b5587b8b0587813900e25de979dfdfe469b9e7b52cc7dccbf58fd443fb3143e",
-    },
-    "0x7d05d38e6109a3aeeebf0a570eb8f6856cb4b55e": {
-        "ticker": "MINTME",
-        "signature": "3045022100d67f43ea8beefc17e9cd76db43d9301ae2d1cd620deda3d53b079b6f3da03106022049be62f21086f81d0c1e4b2feb60fb4ae39225ae464ad95e6e6862031a926e4b",
-    },
-    "0x244ae62439c1ef3187f244d8604ac2c391ef2b53": {
-        "ticker": "MOD",
-        "signature": "3045022100f98231d7467aa20ff5cfc3ca077f6618b18fba7520311edee60a97c89a7fe40202204401991dc579b04841689dc78f3322467c408237444699a15c01566a63633191",
-    },
-    "0x66e535e8d2ebf13f49f3d49e5c50395a97c137b1": {
-        "ticker": "MOLTEN",
-        "signature": "304402204b122dbff61227e4fbbc2d113c424df34c1622258f2397b80217d02e5d5c1fd202203e746c09665b8c0b537243ac25f9d6c873ac91b64e6fa69782610968dfa736a1",
-    },
-    "0xfa58c669b855b29f99374d0f160db286849d139b": {
-        "ticker": "MKC",
-        "signature": "304402205a98b0bdd4fdc27844c1d0d46aea717b5b0207fed846202f9bb81409ee15c33e02203ab515f9204db6809f1eede5f9de8ab76d87a8fc86f71d4b0d5e6b9191d4205c",
-    },
-    "0x34772c4d12f288368aa35ae7bc527a6b2b3e8906": {
-        "ticker": "POLY",
-        "signature": "30450221008bd53ac2b0e41844a89934c1c8e817def7612b943c1aa28a21306b8b1e08401b022064094f509bf173f0049044d3263792b9feca09389f8a9bc56b7b173778177cc3",
-    },
-    "0xce0b3f1258189da17bbd8c7e0509f5f7e001a998": {
-        "ticker": "MPEPE",
-        "signature": "3045022100a4dfe5035f374dd9f205d9dc13b6e5528765045a41a8fab53314dcb8da5d879002202e94ef0d105aa520867547fc50d4bd0746e2a4c718b965606b622ef0727a89dc",
-    },
-    "0x0a1694716de67c98f61942b2cab7df7fe659c87a": {
-        "ticker": "MNLT",
-        "signature": "304402201976517728d2a86018df0d0e194fbba7aa78d0b0eda233761e8cc3a21108592c022017f6892f1f73a47742a2161614ca58fadbab423a801d7ee025cfa34d9c673ebf",
-    },
-    "0x24404dc041d74cd03cfe28855f555559390c931b": {
-        "ticker": "MOON",
-        "signature": "3045022100e421ba30ece73ea68fe88f872bb4b824986feb48ba43a82291ecb215e006fe980220136574d2d78f972819383bb3b0cd9634966e30e65806ab7c0c157c4f126a6cbb",
-    },
-    "0x59d9356e565ab3a36dd77763fc0d87feaf85508c": {
-        "ticker": "USDM",
-        "signature": "3045022100eed1583a982baaa6240a0097e69158c26e97d2c1d17f94e98d7422725ce96a3302207dd877c1f3f923af688821816f9dd6870597f03c3fd44878006a2575debfb751",
-    },
-    "0x20547341e58fb558637fa15379c92e11f7b7f710": {
-        "ticker": "MOZ",
-        "signature": "3045022100bf6e94b93a52bf255a0783f1763c71f19b688e7a16691269a430aeda17aefc4b022002b5ae3a74610e9b76962411d5b64c9c148f1d14ddb9540a1ca9ca53f5839625",
-    },
-    "0xb688ba096b7bb75d7841e47163cd12d18b36a5bf": {
-        "ticker": "MPENDLE",
-        "signature": "3044022028b0f33396b683cc42fe37ed824ca84130a4970e41157fd5a667f3ba298627f502202fc13c7b4077a9619eff1d2bde9134041b048d05c9abe43a0e5ba6f135c93d52",
-    },
-    "0xfc77b86f3ade71793e1eec1e7944db074922856e": {
-        "ticker": "MGN",
-        "signature": "3045022100d5f08201bf7e6d6e13d7cefcf43f14229c2b7de4cf18624b29bbe10ad0eb2f9a02206c3d9711f2372e7db7a010ad2a6322a54ea9896005ea6b0d239eefd11d64dfa1",
-    },
-    "0x9fb9a33956351cf4fa040f65a13b835a3c8764e3": {
-        "ticker": "MULTI",
-        "signature": "3044022032c0ec3cd65c246f48c0b6fc49c74f39a3705c485bf206923afaa9264eb6d1fb02206fa1bcb6da4a137b78c5c093a3ef784c7f727197047b0480054d88716f88be60",
-    },
-    "0x509fd25ee2ac7833a017f17ee8a6fb4aaf947876": {
-        "ticker": "MWOM",
-        "signature": "3045022100e53d11565c0e493a36761becfa68fd007df48ed77eb8181abb146f384ad4b24302202a372cc6b35497f5c9d6872ae7cd5cacd38d6d116d87f36c0bcea20355706ff2",
-    },
-    "0xc74fe4c715510ec2f8c61d70d397b32043f55abe": {
-        "ticker": "MYC",
-        "signature": "304402207796b6fe5966c639a0389b0d8ce19cf91229f6a8c4cc57634caa6d5f1499020802201ea8f3b638401b0d971b2e3ea45ed6b430529cf6dc9d482c91085bea06455332",
-    },
-    "0x27d8de4c30ffde34e982482ae504fc7f23061f61": {
-        "ticker": "MMT",
-        "signature": "304402205579d7a63047c4f7a1076ff9c97b20d1242ebfc0a0ae8698fe30ab5cf73cf64702203c055764761ef9d29967aa5b931109601ff830e89b1c947d0e4ba7ab1b6817f0",
-    },
-    "0xbbea044f9e7c0520195e49ad1e561572e7e1b948": {
-        "ticker": "MZR TOKEN",
-        "signature": "304502210093d00b0222c1543201dd1643e7d4ac313efc145ed94dcd4ac94a7aa0d71885cd02205905e84371d93bdd519906dc87aaccdd0f2cdc0e9f708591f2d38bfea388c0af",
-    },
-    "0x40301951af3f80b8c1744ca77e55111dd3c1dba1": {
-        "ticker": "NEADRAM",
-        "signature": "3044022013b88646b346a88633dd599d1512b2172ce6842423ea49cba31b1fb765c0c5f402207b86953a9bdd4a73947c626451d997c1b988b79666d9899151f6eb2c6699830c",
-    },
-    "0x57f12fe6a4e5fe819eec699fadf9db2d06606bb4": {
-        "ticker": "NPM",
-        "signature": "3044022071c50bf7917abed689139e611665b96e366f6150f4cb989c2970e5ae36fc8b7502200b58f2bad9070a670483baa85f77ec4f6d371f52d7580c68d947abbf4914234a",
-    },
-    "0x3ad63b3c0ea6d7a093ff98fde040baddc389ecdc": {
-        "ticker": "NFLX.D",
-        "signature": "3044022017d3328f4043252e2ab91a5aff877bc39563409737ba4fe923ca164ae6492df902201e45281bd6f47e8ef93be8a2f7284e83ec3be98553f030fbcdf9de287007351b",
-    },
-    "0x6609be1547166d1c4605f3a243fdcff467e600c3": {
-        "ticker": "NEU",
-        "signature": "3044022056c01c703dabd1bf63787e01bc50aa8b4365bae7264b26299f6f8a9deeb96d24022059c344f7a90c1d0d3715d77f175d6aea753bb8b5416b082762a5273ac9d45c05",
-    },
-    "0xa9011ee5796be43123651181dc75c0e72bb1191c": {
-        "ticker": "NPAI",
-        "signature": "3045022100c5a09226aba7c94a604d5bb258da5ab6050beeee3f80f904a935d7e78f5df85d022015b5f3fe8547fdd570ab71e557a367d02d98b99fd32087772ec034d23c6788e4",
-    },
-    "0x51b902f19a56f0c8e409a34a215ad2673edf3284": {
-        "ticker": "NFTE",
-        "signature": "3045022100fbc94bae0e9b794e972b65e7cbcad43c554ed35cd39acd1871add3908c86ff0e022044a2a39042b1acf21ab5ba1c2a6a988f5d930fbd2b4d1e032f1661afea59b593",
-    },
-    "0x640278bada847b7ce71bb22f20517a009a049640": {
-        "ticker": "NGT",
-        "signature": "30450221009f26a1abf34ede15f23b0d9834cf71a8dad73c4780bb9d6d0f9000b8b9796462022029a1f7949e6d32a1c015ea7e3326aefea2e0d6c98335999b3fae2faface02b90",
-    },
-    "0x88a269df8fe7f53e590c561954c52fccc8ec0cfb": {
-        "ticker": "NST",
-        "signature": "3045022100afd92deb7cc0a1e3e371f10236b416577de341c60efbec5974d319f01b3ae39702202635c9f7343cc2f3a3afe51c86a5b719b85f5eca8186f7b81df2a1d6560ece8e",
-    },
-    "0x910d3c72c5177c3f1bfb0863b793ec23fa7f6990": {
-        "ticker": "NISHIB",
-        "signature": "3045022100983a981ba6663b6cb31f2fe8d4fe86e2fbf119c7789a3b2b3bda02a58a57a45802206933e4a9d5e5d09b1b54006da483a7a31f0224d4f7564e5d2c33655a9ee6c64a",
-    },
-    "0xadd5620057336f868eae78a451c503ae7b576bad": {
-        "ticker": "NOISEGPT",
-        "signature": "3045022100b9b66f88c8cf541600816ed8197bb863872cf0b54b1194f579373ff59f6780ff02202154dc8104d91706d22303524ddc815739ff5c972bd1644d103073be20a9180d",
-    },
-    "0xf8388c2b6edf00e2e27eef5200b1befb24ce141d": {
-        "ticker": "NOLA",
-        "signature": "3045022100a623adb22760966d530f2a5cdf0de6b2d8ffe5ec2cf1e310f0b1c40f2e83fc9c022053d25229cbada22811820bfad8813c16378cf9759c80a0d925cf330892bd5e2f",
-    },
-    "0xf34450d1f23902657cffb2636153677be7d38750": {
-        "ticker": "$NOX",
-        "signature": "3044022015ae635d13bdbd67c54c867641fd31df6b78f3c1be4d548d87911b7469b38fe902204a3558f51320cbc83819f009eecf6ab4ad990c68a8251f7b1ec9d8f591897ecf",
-    },
-    "0x3006e4cc90440c7d011c20f36c841a269ae6601a": {
-        "ticker": "NCWW",
-        "signature": "304402203656d61ef8e3ba8b7298de3c9d897370f704f2b1e62ecdc6a173cd19cd0641f902205dde4068016d49c9e6f941550fb4287d5affd3804c157230567f8b500c59c39d",
-    },
-    "0xfdad8edc724277e975f4955d288c6eb5b20a3146": {
-        "ticker": "NSWAP",
-        "signature": "304402207118077b549617664cb86a99d9018372780b0f3db038111b00db9ff18978937a0220734fc409e375810abc640236d8ce7d113d5eb9f625d515b551a65e42fd2ac3aa",
-    },
-    "0x7fb7ede54259cb3d4e1eaf230c7e2b1ffc951e9a": {
-        "ticker": "NUMA",
-        "signature": "3044022035ce28bbcf3c735b3bb68d06701896dced01725db5208731031d295788dc085002201b11ecb52c36c8a14f1083b417be0b28106ad15ecb8344abcffef11b1f357cff",
-    },
-    "0xfb9fed8cb962548a11fe7f6f282949061395c7f5": {
-        "ticker": "NUON",
-        "signature": "3045022100ac1c1863021707761d1b582851ac9b04e370a2f85af4a3da9528ed7e3a7d215c0220235cdf4f050f78732844b59f8947ad172c7d6a89c4ab80b13cf889577890c4ff",
-    },
-    "0x4dafffddea93ddf1e0e7b61e844331455053ce5c": {
-        "ticker": "NVDA.D",
-        "signature": "30450221008874295ce44c2e424ff12d9c3849416f745021b6ee84aeae4295ed6c6d5a732202203a4f05c8b75cf57e8755d16df7c1715cdf85c420d02c5b9dd01851bca788bfbb",
-    },
-    "0xee9801669c6138e84bd50deb500827b776777d28": {
-        "ticker": "O3",
-        "signature": "3045022100e3546414e1a86d0fc275a86ee81c5d41b502aebc09b9745f7f97532bc77161cb022066770231e819af9b2256949f78238a2e526d52c5a62042202bc6bb9c67e8ef58",
-    },
-    "0x00e1724885473b63bce08a9f0a52f35b0979e35a": {
-        "ticker": "OATH",
-        "signature": "3045022100d7b4afc0df5147e37ef9d2f82efe208f6d08796c9900b9c49cee9b39cbec456302202621d10a2c8bbe1a74f4051ca07c92fbbbe926b99b52a43d8bd4e82d2a571e1f",
-    },
-    "0x500756c7d239aee30f52c7e52af4f4f008d1a98f": {
-        "ticker": "OIL",
-        "signature": "304402201d0a45e711b7d046d777b7c91339da3bf81274e933be66962e00711189940ea20220276f603c4416dfaaa09f2b9b51b7a1aee97e43c9e373f04fbb9d70e13abaa857",
-    },
-    "0x6cc5b1fb8c2fd7af1d2858f916f274b8faac82e1": {
-        "ticker": "OJA",
-        "signature": "30450221008896d15c1fd6e3893665f28c3c460aaa10174a48357f21bde9beb85fe457b0f4022040450fe0c2f4e240955a46f19239cba63452edfa297c57cf5b576fd2571c6d98",
-    },
-    "0xd3ac016b1b8c80eeadde4d186a9138c9324e4189": {
-        "ticker": "OK",
-        "signature": "3045022100cba1479f88a53a9f45b731f478ec9d1b1ba6274ea18dffb7433b4193e413d3da022001c9c882d0447b54a45b29346c7d295ab006705151110aa01e320061cb18ee43",
-    },
-    "0x6e6a3d8f1affac703b1aef1f43b8d2321be40043": {
-        "ticker": "OHM",
-        "signature": "304402202fd8edecb87a3e5bed696bcdecea8c162542dbf9657435d9d7b928ae30f4e5bb02204bdc4e8cd34ea64d415cbdbac760409d0143048fc28f266c6a831fe4c9d459fc",
-    },
-    "0x86b3353387f560295a8fa7902679735e5f076bd5": {
-        "ticker": "OMIC",
-        "signature": "304402203a957e99dbc7dd265bef91c15375d5cb7c6380ca4a313f904dca0bf729ae5b85022071d389aa3b25da552b5ac009865b07a15e8a20d84182210c012bdd0a78fabf9b",
-    },
-    "0x9e20461bc2c4c980f62f1b279d71734207a6a356": {
-        "ticker": "OMNI",
-        "signature": "304402202aacbf0f8c7503f0e530c0ee1c90255df228d250f153893e9a15cb498829f58f022042035479b32c64d04afb7296bd5120b9b5543115bf5fa543feb6e806f4b2c9bf",
-    },
-    "0xc72633f995e98ac3bb8a89e6a9c4af335c3d6e44": {
-        "ticker": "OSEA",
-        "signature": "304402202dbba18d1cc57a1d701336f29f0ff6cbe88f458f99ca5c97789aab9b1822d54c02201f491239a40149474af2927ba3aecc573d5f680dc79997af0c48501fb062f4b5",
-    },
-    "0xe2db86ce824cf3dcc0c31a073de294239fdde060": {
-        "ticker": "OMO",
-        "signature": "304402200710a4932ec5009b2385e86847af92eb97fc0fa28382da77488bb5e69226357702201b96041197db319250375331e4b2b725d7c92ff7cc17fcbfae053ac7cac9f8de",
-    },
-    "0x000d636bd52bfc1b3a699165ef5aa340bea8939c": {
-        "ticker": "ODG",
-        "signature": "30450221009ce92fd0e1b525e76eb27f552043cd2063eaedf0576242dc1d01a87a813bd811022057af42410a65fbec85897b4951550abf961f268f87ed3d19d9afa930f355fbc6",
-    },
-    "0x2c7513f299778a84797f293503db1a73a15fd48d": {
-        "ticker": "OPENBET",
-        "signature": "304402204742432761e52ba3f617fbe3ec980f84b47f62653eeee3bf0d799ab9902b203e02203f9f3f6cd776dc695c5deb71d44bc1e1d4198d426d448da01b345282e60a59ac",
-    },
-    "0x188fb5f5ae5bbe4154d5778f2bbb2fb985c94d25": {
-        "ticker": "OBX",
-        "signature": "304402206f4f5e0d54f244244acc0c3019dea1628b13aa58a0d543deef099b3f92a22353022070d2e84f0b323628e695d15697c40115eb7373a4b83a41648d7b3115a7ae393f",
-    },
-    "0x7be5dd337cc6ce3e474f64e2a92a566445290864": {
-        "ticker": "OLE",
-        "signature": "304402203215ad70d62add1944714fe28d11e4440f9bd8753d2922d5563492ba859b16d2022048ddd2492c058f9c56e66c3d831128f6235727290a04ddca5145d4b10f692a0e",
-    },
-    "0xdcbf4cb83d27c408b30dd7f39bfcabd7176b1ba3": {
-        "ticker": "OOE",
-        "signature": "304402200d21d8f87240e1be123b0e6ee44bac49b4a5ba1a63d7b9d6eb71ecdf965fdd9902204f0d23bc6f165ac9534093484b5fc7dbfc801deac714fa5491c20406f4920191",
-    },
-    "0x0c5fa0e07949f941a6c2c29a008252db1527d6ee": {
-        "ticker": "OPUL",
-        "signature": "30440220242fb384c65207af4faef094a9d793c1e7a33ec319d17e8bdd06e86ece3ca9d402201d01c084ffb3b8cae2b95352e1c1182037902c1f7374180641700d216a55f19c",
-    },
-    "0xf3c091ed43de9c270593445163a41a876a0bb3dd": {
-        "ticker": "ORBS",
-        "signature": "304502210095ee01b256c7b0f1db30876479f5cd739cdf2581f32be8ef7c165496d69762060220397410601ea2ea3f89b111488cd208e1196bf3587ede110802e6969d9abe8427",
-    },
-    "0x319e222de462ac959baf2aec848697aec2bbd770": {
-        "ticker": "OREO",
-        "signature": "30450221008030dfe64ae01adda86a4c757814914d838573cf01717732218059417017d3b1022024b052773bca75b12e94606a615f82379784392dd0b718bc22db8c86a5deceab",
-    },
-    "0xbfd5206962267c7b4b4a8b3d76ac2e1b2a5c4d5e": {
-        "ticker": "OSAK",
-        "signature": "3045022100fb915b9ad3993c1e4aaaf96793dc8d7c3392a71d492c8ffb029f368f826dfebe022070986bfb35d6705fbbef18f50898e2b1b3796c4191761797276b733a7b23aaaf",
-    },
-    "0xb4b07b60455a2f38cba98a8f3dd161f7ca396a9c": {
-        "ticker": "OT",
-        "signature": "3045022100910aaec964bed637ce0c25891a8c512ad89b02dec83310f45268e4686e1dab1302206f8c69e9fdb1842507a2d30e8537302981eaad9ec955781e8a7955a6f272cc8a",
-    },
-    "0x1bd013bd089c2b6b2d30a0e0b545810a5844e761": {
-        "ticker": "HOME",
-        "signature": "30450221008d463c8396a335a010134b66025ebd13eaa471c36b0b99bc580033923df7fba902203acff00e1fd766991a037389c381e7be963773db7df174582b7252a5e9290bf3",
-    },
-    "0xa3d1a8deb97b111454b294e2324efad13a9d8396": {
-        "ticker": "OVN",
-        "signature": "3044022045656630b0edbadaea7078cef0d6882371b18e7b4dedda946ae57a205e611cd402207699199c37c32b1cf68551812ebaac457f6194aface71f5811815c1f4bdbaef6",
-    },
-    "0x55704a0e9e2eb59e176c5b69655dbd3dcdcfc0f0": {
-        "ticker": "OVR",
-        "signature": "3045022100e99cfc8476a36df2d1e0686d296c2499f6d11d15f052cd40e8b277e22474d1a40220396b3cca789f72c1ba2548a2450b9458803f5de0ebe47a338fca065a58277ad5",
-    },
-    "0xba0dda8762c24da9487f5fa026a9b64b695a07ea": {
-        "ticker": "OX",
-        "signature": "3044022066984cbbda20464754dce981aafe39e6f800212b02a14df6b70da31085b996fc02205e281f00c231edeca01169bc6bbd2097cbb8deb272c01e314d71b8016638dda4",
-    },
-    "0x7e325091e5525d3ea4d54a1488ecca8d1df732f3": {
-        "ticker": "PAC",
-        "signature": "3044022046483cf0ab25e044faa912597dfa19a28d52a455c6e26c103e0908d65784a709022072c3863caba47d960c7b71afd1fee4f22947377a57313a4b4c17db6d737be130",
-    },
-    "0xc8ccbd97b96834b976c995a67bf46e5754e2c48e": {
-        "ticker": "PLX",
-        "signature": "3044022059c413ef5856b9a793943c4d0616ae9a6ceb09363a8b683b2833a40d2dbfd63a022068a3f21b09f6952f21a2ee362f17aefe559994b6cbec258b89ca867dda211548",
-    },
-    "0xbad58ed9b5f26a002ea250d7a60dc6729a4a2403": {
-        "ticker": "PBX",
-        "signature": "304402203c478087c6c1b31928f3e54fcd89c6520bf032393b3e74de1a90357a1bef605702204be03bbeda7db256793075008e78d2915412cdad298379ee154efac153c5b5e0",
-    },
-    "0x1310952bc5594852459ee45bfd0df70b34ac5509": {
-        "ticker": "PRF",
-        "signature": "3045022100c1f0d4d1a1b26394dbfae891419fa854bdda3278853d30145725b2e5cf3571800220030d80f9e09ed4dca906404a938981d0031fedbcedf135c8b79f5408ea972ae2",
-    },
-    "0xe11508d3e0cf09e6fd6e94fdf41e83836d83ce50": {
-        "ticker": "PFUSDC",
-        "signature": "304402207a95cee73f29e346ff7cec5382adc5ccc8bfd74b9d7950871f4dfc300e314cb00220573b355f470d4522516a2bb4630234f5f7bfe769e838bd6778f82543f47086cf",
-    },
-    "0x13a78809528b02ad5e7c42f39232d332761dfb1d": {
-        "ticker": "PFWETH",
-        "signature": "304402207d81d0b99b08273063ae9d4be5ac001c602dba7e6322a0dd8e0c69cd8c5f553502206b9a5f6f8b15e2c9677b71070be959a43293be91dab6af8f6af9d6c5349f3c85",
-    },
-    "0x5b6424769823e82a1829b0a8bcaf501bffd90d25": {
-        "ticker": "PYPL.D",
-        "signature": "3044022076bd9f58cded966ce273b2b0d764423e6a88b00b9acf7963fa9c941946ebf0d80220111cf2d5fb212b5e37d20885f2794cd8897159bfbfb6b1e65c5ec293b0147154",
-    },
-    "0xdce765f021410b3266aa0053c93cb4535f1e12e0": {
-        "ticker": "PEUSD",
-        "signature": "3044022016b1ad4a439f62525037a8619f9c26b9e7eddcdb4d332de2de5603c99ef67acb02200c906fbfdd9ec147fe40f53a730ab051244f95bb26ec61912d868b87e0513a7f",
-    },
-    "0x8933fedd98cbb482e27c41e1bd7216a4e42ebd39": {
-        "ticker": "PGS",
-        "signature": "304402204189049903c7d648a5452063242a37f05cbdc9bdc26d00a1ac114bd25b3c718e02202dd4e2e7b0ba39fd73b6e3edda9fefddc7f0c59f29a0511520e2ae4bfccae37c",
-    },
-    "0x0c880f6761f1af8d9aa9c466984b80dab9a8c9e8": {
-        "ticker": "PENDLE",
-        "signature": "304402203cbd5956e93f05002a5811d5ca2490dc8673cc4acaaa33fc1a86001101ab3bdf0220557418f58526c251cef37ca9a88c608dd99ea0ed0c436f7e49735e89384481fd",
-    },
-    "0x2ac2b254bc18cd4999f64773a966e4f4869c34ee": {
-        "ticker": "PNP",
-        "signature": "3045022100ae9e44f9ae6fd0ff04b9707068a1b3dfed76a4b854a1c59f5171d705b44d88010220127a22f61454daadf8637926c3645ba4f04adcdfb14feabe6956f607c8bb4b6a",
-    },
-    "0x25d887ce7a35172c62febfd67a1856f20faebb00": {
-        "ticker": "PEPE",
-        "signature": "3044022042f7c268fdc053a1fe2a32fa86a8d1ba5eece93e0f4a2e40900757f4b4c898b502200898bd39e663ded543b4bc031eeb3f28b164e7fb8eabb379eaf35c389bb13a32",
-    },
-    "0x7ddf25cb4861590578f1fb85fcf1c5afd00a01de": {
-        "ticker": "PEPER",
-        "signature": "3045022100b92f08b819dd469f63dc438cfdaffb190b913bfd25b7f47537bef7627835f4f3022072a09df88e3ef60bdd0616f0db557b9b62c4c961613a281bc7b85908decefd3b",
-    },
-    "0x5f320aae9b786a9f329a39e41a74e88e14783067": {
-        "ticker": "PEPEX",
-        "signature": "3045022100e682f73e3e18d47d99fd2277a150ffb56282dd374f88286f363c369567d6d7f70220721397e1bc57f9fee40c97e4b002df459a64ae1a3fce5256593e82f17ef59e0c",
-    },
-    "0x753d224bcf9aafacd81558c32341416df61d3dac": {
-        "ticker": "PERP",
-        "signature": "30440220615f185b947a877419fa9a4563a991358b405010636af79a51f12ef8d8f2dd890220748c8299ec6432ae9d2210d8c6c353c9ad453fedeb51c220222a0a5a45758e3c",
-    },
-    "0xd29f8a9e76ef42ba9f749583ed07cae7bfaec389": {
-        "ticker": "OPXVESLIZ",
-        "signature": "3044022028dd4abee97300efb1dd6b8c75b724a54176140a990d03b2b703d237468ebd8402201df8a1962f77957ab09c3d73a0939360cf396991758f1dbee3b49938c757428d",
-    },
-    "0x1824a51c106efc27d35a74efb56d9bf54ddb22d4": {
-        "ticker": "PRY",
-        "signature": "30450221009f0b2bd80c9a015f0f5d1620b68a98d012935715a1b4f40b1108d0632f7c43180220685db7633c65535a0640bb400970942b92190a03d31d13d03c5e0b0aca2b109d",
-    },
-    "0x43c25f828390de5a3648864eb485cc523e039e67": {
-        "ticker": "PET",
-        "signature": "3045022100dc5a005e9fac630615ba141c93222aa74c2754b918a927a795d03abe0bfa77aa02202f3a19f424a8eaaa5b20f9366c646920b5d919a00d3af48c4d1c8a54529ffb35",
-    },
-    "0xa0df47432d9d88bcc040e9ee66ddc7e17a882715": {
-        "ticker": "PETH",
-        "signature": "3045022100981879fe072b690e775a31889b85ce4f67bbdfd597b489d00f442b184a24d80402201e9796f921aa94fd0bc9b899ec712b8b1784207aad90ea24b8995514b30d9820",
-    },
-    "0xf1f18f765f118c3598cc54dcac1d0e12066263fe": {
-        "ticker": "PFE.D",
-        "signature": "30440220028841d64b906110c03c77ea5ca6449d7cac2ee2b00c0401c337d1f273aeb5540220364d6e6a99d2723af74cebf6f640db8341cb273fb1a1ed9438438941608fbebc",
-    },
-    "0x39a49bc5017fc668299cd32e734c9269acc35295": {
-        "ticker": "PHONON",
-        "signature": "304402206d73b4d2edb39686771c0fac20848ea4b57189d8df9e5256323294d2b308cf4e02200c52fdb849c5d82a4928df3622459b32a2524e8ff734555d1fa90d6cf4eee295",
-    },
-    "0x965772e0e9c84b6f359c8597c891108dcf1c5b1a": {
-        "ticker": "PICKLE",
-        "signature": "3045022100c5ff544f04715c3986d60fa2bf5a882edbb545695b0e1d52dce53e3e51ae997302205a23da4cafb79b0cceebb6c6ab4c48de28eb35450e0720457b300ba5cbb20021",
-    },
-    "0x4615fa30ffa5716984d4372030ce28d99fcb702f": {
-        "ticker": "PINGU",
-        "signature": "3045022100b973e29a623f13fd05524a7fc2233f78b363b58bae3f734c8891e8fde2706ee602200502abb5dae8b3fc7b17ff49535dd9c4a3e7442d8c6435c2abfdada43d503ad8",
-    },
-    "0xfb17d52f77db6e32b5a082ed4307fcfb0a86beee": {
-        "ticker": "PZT",
-        "signature": "304502210093d5d7a232d0312f03d3683c6ef62c0c2444852b651ad95f8909656481aeb12902200102abde1f9da7a14f012912f238730c8c03b0f99d33d0dd27e4311620788840",
-    },
-    "0x51318b7d00db7acc4026c88c3952b66278b6a67f": {
-        "ticker": "PLS",
-        "signature": "3045022100b2252e332a8c8acd3f0fcb85e8e507e03a5fc6aea001a2c1cb844e95273fde14022011592dc70ef2156c994921109dae3f6a090a82db5473c7d20914d5b5e4adfe94",
-    },
-    "0x7a5d193fe4ed9098f7eadc99797087c96b002907": {
-        "ticker": "PLSARB",
-        "signature": "30450221008eb679cf090e80b9dbd273c83352ec7f2f5a6db9ae7338fc7227294fb805803902206be13c5d30e2b23b87d317b38c100933b3fc421f7f6ffb06dc09ec2e7f2a16d4",
-    },
-    "0xf236ea74b515ef96a9898f5a4ed4aa591f253ce1": {
-        "ticker": "PLSDPX",
-        "signature": "304402206b0b37527b1ff3b4010b438556f61d188a5fa5752d42b0a1a50bf149d91aa63b022031f6c1bca179949166fb96090dd26461fd1bee24a90243719cc8870dbf658243",
-    },
-    "0xe7f6c3c1f0018e4c08acc52965e5cbff99e34a44": {
-        "ticker": "PLSJONES",
-        "signature": "3044022003e92cf7dcafe3af55bcc0b0481e060be7102325cdc50823168b123a6a7056120220590dd34553bde989cd6ee1b87cf6edf0a841bd2f7681922685c7232ebc9d8ed2",
-    },
-    "0x6dbf2155b0636cb3fd5359fccefb8a2c02b6cb51": {
-        "ticker": "PLSRDNT",
-        "signature": "30440220746204f19fa13af4dff593dd289b6023575e0a7e0df1be0110d93dff0236a7ee02204ed788c343fe5f2e64f75596b788bc422387809ae3dcd1cbcf921d1a290fa6d4",
-    },
-    "0x0d111e482146fe9ac9ca3a65d92e65610bbc1ba6": {
-        "ticker": "PLSSPA",
-        "signature": "3045022100ba310d230c31e9d6bb01d4e4dcba9ca844c236fcb8479f8568171f7f89d3792f02204fa198d4452c7e011fe7c81f8926db3d6f75224261a4a76da7df043c5efaed16",
-    },
-    "0x5326e71ff593ecc2cf7acae5fe57582d6e74cff1": {
-        "ticker": "PLVGLP",
-        "signature": "3045022100f0482b142eddfa2e1907baf67adec60df41e5d458dc5457039a6b040949818a5022018b7c38bd64103dea9b17c6f9830e5ce868f133c4b4a6ba0b6c36f2beb2c18a1",
-    },
-    "0x31c91d8fb96bff40955dd2dbc909b36e8b104dde": {
-        "ticker": "POI$ON",
-        "signature": "30450221008943e979c620e3a3abcc451acd48a722e63e2d2d882ee0bf7f61fc745c1f3ff602207ad5029c08f1771eff506f6abb5217f33f6ad450721380e4b8e9d5fd230aef5b",
-    },
-    "0xe22c452bd2ade15dfc8ad98286bc6bdf0c9219b7": {
-        "ticker": "TRADE",
-        "signature": "304402203d3dfc7d37a0b471bf9fea3e039d93ff0717f2b7cb5eb3353570bfee6dc17977022034c3e718b6b67398e443492b4505aeb1c5bfa6ae7703f76b490e6298adf893ac",
-    },
-    "0x903ca00944d0b51e50d9f4fc96167c89f211542a": {
-        "ticker": "FIN",
-        "signature": "304402202ef46ddcea54d262732b54f440533bf29583c9c5eaa77041e57c266fba505b9902205bd21f748cf2ad8c697fb5148b4016fc3915cf24fb369b46b79022fe26da9136",
-    },
-    "0x6fd58f5a2f3468e35feb098b5f59f04157002407": {
-        "ticker": "POGAI",
-        "signature": "3045022100e4899737de9e5282caa4794ee384f88dc1f8ed07e7cd55f45c9baefbb2da58a402203dc5d70413a8578a7518414ac852a667e62d3e5403ad4ccb15277eab7c86317b",
-    },
-    "0x68ead55c258d6fa5e46d67fc90f53211eab885be": {
-        "ticker": "POP",
-        "signature": "304502210098da921d78f40864c40f8a2b36e29b7f70fd6b2621d49de5d42da03e38d453c70220576ac86b26d6280eaac9555eff782fc711d5c6ce6d528752a1dd7cf5fe5c537d",
-    },
-    "0xb4357054c3da8d46ed642383f03139ac7f090343": {
-        "ticker": "PORT3",
-        "signature": "304402207e671d62c251231ae67fc98486f3a23e96d71f3baec55cf65336cc52effa515602203262d9972f948af8bb6877dda3fd14103f15bfbefe0440e8158731c15076c83d",
-    },
-    "0x17a8541b82bf67e10b0874284b4ae66858cb1fd5": {
-        "ticker": "PSM",
-        "signature": "304402204c9a55a85445a02f4bb032f5bf58a903abb12cbc92c1dfecc32aaf7891c17c8d0220042dad186451c84a8ce062391bcfa9f6382f44303a45436673ecab8d147c2b8d",
-    },
-    "0xc29b9c4f45fd4f07768cf913acde0c7772b47124": {
-        "ticker": "POST",
-        "signature": "3045022100b54ddcd9394bbe40b21cc2f7b05b7b5a11b5a08ff5115186eeae7009f38154d6022022656b9a21b080ee7fdcfd3e5cb67ae53d3fe4ef07fce3a128cf2386c2527314",
-    },
-    "0x76ce14237110c865f431e18f91fc1b225fb6fe99": {
-        "ticker": "POT",
-        "signature": "3044022015014a394d4d10079ad4b09c5a6de28e5fdf22361ba4f2e74e4519675052c3fe0220720f996cbd774d7de9721aa637ad8936594ce2a6065c2c3520e75b48f8d927bc",
-    },
-    "0x51fc0f6660482ea73330e414efd7808811a57fa2": {
-        "ticker": "PREMIA",
-        "signature": "304502210099e147964b5840fde524783c2626696b2c86bdfb6b1f1426df0004110802b05d02207bc5a7d612b9402e539ee932402d0ce19eb364c6ea7f53605b22ea443f467293",
-    },
-    "0x0b5c6ac0e1082f2d81e829b8c2957886e6bb3994": {
-        "ticker": "PRISM",
-        "signature": "3044022077e868047729f30c7cc66b56bf757f52ca1f93c36910515f48d1b7c03d1d2299022012b892bce4ea1177100a3396239870f7a9ce148ba6f49ba7e94d8ca6d203f90c",
-    },
-    "0x118346c2bb9d24412ed58c53bf9bb6f61a20d7ec": {
-        "ticker": "PLD.D",
-        "signature": "30440220471735eff2f0f28946d9ce5f167d50035fbf4e24da69da1e143e4d267b36a5da02202227506e802a51d398b210f17718378bd808571b9f72b63b95dd4781795bdf88",
-    },
-    "0xb25ea095997f5bbaa6cea962c4fbf3bfc3c09776": {
-        "ticker": "FIRE",
-        "signature": "3044022030312bf42ba83af95de351042d7d6c8142df37c85e748d78e071398470f8a0c9022059858d06b95f9818f553b793df99143667131bb5c4aa25f9b26c7911bbc78ccb",
-    },
-    "0x115d8bf0a53e751f8a472f88d587944ec1c8ca6d": {
-        "ticker": "PBTC",
-        "signature": "30450221009a53d8768fb6c81d4861e83ef72bb5742477974bc0d52b5520d38014096cea9602201af139e75f7c9962a16cee968b6cb1af36eadc698235596fe708bfee3afef4a3",
-    },
-    "0x59debed8d46a0cb823d8be8b957add987ead39aa": {
-        "ticker": "QUACK",
-        "signature": "30450221008b1ba99d9c5fd6655e9d3ce4796f7be579060633c6d7047b88ec3ddce37e2b5f022044709b6a2aa0e8e8342734b201eb5002a903586676d10c17e2fbf763a9bb2984",
-    },
-    "0x6d9d8b50a0cccdf510f681a85472626c26377876": {
-        "ticker": "CHAOS",
-        "signature": "3045022100f9cc1b5032d9bfa6b022e004748447058c7b63d8f08c8ced9ae53dafe158ac3202201d0aa3562193724e182f4b0fe69a93b994d3c1851ac108b3482bb9df73550443",
-    },
-    "0xbcd4d5ac29e06e4973a1ddcd782cd035d04bc0b7": {
-        "ticker": "QKNTL",
-        "signature": "3044022068d2ccc269ea3c58fed0fa2bda83afc7ffa7a3a39a3ddb9b9c850d6749a43fc102203654650b4ca458d96b3666facdd4627bf29707c8e705d26075113a1897ca1c82",
-    },
-    "0x24ef78c7092d255ed14a0281ac1800c359af3afe": {
-        "ticker": "RAB",
-        "signature": "304402203e98a5cf91f99c477693ddb9beea12920273ae704cff06acb74d19e3d95c17bd022057d61c44a65ee13b5dd985fe6ae40471ec6b499d161971fdf2b7c3e1713490ef",
-    },
-    "0x3082cc23568ea640225c2467653db90e9250aaa0": {
-        "ticker": "RDNT",
-        "signature": "3045022100be698340055d97ba6fe47edf7bbc3dec80c2265b4e8dcea37c93e22c06389e9d02203c692cf94d4c3619b840c576b66ec166e8bc2acac026c112265b05bbd0b40d94",
-    },
-    "0x0c4681e6c0235179ec3d4f4fc4df3d14fdd96017": {
-        "ticker": "RDNT_",
-        "signature": "304402205fc24d3869cca326682d9ded7539177d14b3c2622fbeb5e6ac5d5fccabd8d979022056e6898dbabf8fbb17805100a3ca11ed0eccb16b1297bf4c7f217a0811733f78",
-    },
-    "0x7ca0b5ca80291b1feb2d45702ffe56a7a53e7a97": {
-        "ticker": "RADT",
-        "signature": "30450221008ee7aba873f0279d8516c60a7e4580390ccd8877c58b919c876823c2bc3edc3302203bfb5d35512eebe21d90a10daf37f62e863c2e1b18cd124897b2289a20914395",
-    },
-    "0x54bdbf3ce36f451ec61493236b8e6213ac87c0f6": {
-        "ticker": "RDP",
-        "signature": "304402202f034beb7120416ddb8303fd0e34b1be2d8a2f181e1c540e9c661d09aab091e90220216ec07d9e235a20faed8dcfeced1edd3cb0a68a32a9811ba7c800c2b494e610",
-    },
-    "0xaaa6c1e32c55a7bfa8066a6fae9b42650f262418": {
-        "ticker": "RAM",
-        "signature": "3045022100f8b6896c1cecd4158c73763c772cafe5880ff424c330bbec47ea48180d20e92b022005bb0aeafad38db626f18fb6e964fcdee921420bb9334eccc3c0892b50b80650",
-    },
-    "0xef888bca6ab6b1d26dbec977c455388ecd794794": {
-        "ticker": "RGT",
-        "signature": "304402203ed2ff1c0fb5032b72f7f73508a9c763e752d52d1f1196003217bd13ba640691022075589a528d6ab817b5b44b30bb1a41426efbd717fcd17178dd5df9cb1994aa27",
-    },
-    "0xfc0c4114ccba4a91d05bdab4a8480cbec46654dd": {
-        "ticker": "RB",
-        "signature": "3045022100947379842dca07792645c2a1c845d9d1f6183258919fe2af630b038ca8d53f080220642d012538ad4185185d06a316664f24df94a176de765da8f478a1df931fc4f5",
-    },
-    "0x4c4b907bd5c38d14a084aac4f511a9b46f7ec429": {
-        "ticker": "RBX",
-        "signature": "3045022100b0d6d33c3a6d863dbfcc29a984f9d02a7d55facfea4e82fc2502ff225bdfc3e902202742c7acb52aa0eb803624f51d7027f9f4459ae39d6a078dc9fe4fc1f5e77447",
-    },
-    "0x32df62dc3aed2cd6224193052ce665dc18165841": {
-        "ticker": "RDNT-WETH",
-        "signature": "304402201b0d7bb244a4754c7280503fb379829004b9490540c477df4b3a747762df935002207a0dbf4916883eddd72da4e065348b0be0b4e751770ed77e70242ecca10c5a35",
-    },
-    "0x1f2b426417663ac76eb92149a037753a45969f31": {
-        "ticker": "RWAS",
-        "signature": "304402201f628b8d690225a023c72e83dd5c2d54058f8b208b26697f8c76030ae3d956c802202e41ded3c666c1865fe21e5b21cd566657d40431987d288a212e78b40c61b297",
-    },
-    "0xc15b9db0ee5b1b7fb8800a644457207f482e260d": {
-        "ticker": "RTETH",
-        "signature": "30440220044789a490ea6ee510e09e88de0003452a87608f079e20a89eb265d05c07c5a1022036b49f3d9f0ad909483b5f6db6acc9f113c3e59431b45464c6ae1601fbeaeae5",
-    },
-    "0x1d987200df3b744cfa9c14f713f5334cb4bc4d5d": {
-        "ticker": "REKT",
-        "signature": "3044022067504af5876d8cd6fa018215c1bb529a9394558a3f11913f244a8bd00b7b7594022002adf4e2dfeaf71c2d7fc6958d67b48cd9db3a0c32239ee6d837e2c2b1b473d8",
-    },
-    "0x1426cf37caa89628c4da2864e40cf75e6d66ac6b": {
-        "ticker": "RELAY",
-        "signature": "3045022100c06ed4953c459b65cea2145ffc07611b3652606e35d9b14493f8e8de4edb7fa4022076930de5c2694703c6e7d61341ab6c105d12109578fcab557b627389dbffe6e6",
-    },
-    "0x2416092f143378750bb29b79ed961ab195cceea5": {
-        "ticker": "EZETH",
-        "signature": "30440220713fe1d4da70551600f15dd41291576e6bed0cdf1ff6e9a544e986bd4f6199000220545896d66881b43bca26ffebe55d70d0ff9a92f55f674da4f69e8788834d1e9f",
-    },
-    "0x9ed7e4b1bff939ad473da5e7a218c771d1569456": {
-        "ticker": "REUNI",
-        "signature": "304402206c7360bed37bcd8aa2707be0117559c59069aad977d9607984594f1756722b1902205fb41972aee74ff3a4fdc0a1021faf5427c29ab0be793d3dd68a315779f3d4e9",
-    },
-    "0x7f4638a58c0615037decc86f1dae60e55fe92874": {
-        "ticker": "GRG",
-        "signature": "304402202a3ce77fc538b222f26afd8221df06932913c72edd3a7002805f58ee6f915b24022051c5baa0957d75568e91a78f6a91caad4e74d6575a770dcccdc7b52d742ea3c4",
-    },
-    "0x7d86f1eaff29f076576b2ff09ce3bcc7533fd2c5": {
-        "ticker": "RISITA",
-        "signature": "3044022045ab00bdeca706f052b1280b1e5d9bacf7236275b618b65391563e3ca9d97d5402204d3c5926fa1726ec26fbe9d980f9a7a31e014e83724d807af6624a37f43fbffa",
-    },
-    "0xec70dcb4a1efa46b8f2d97c310c9c4790ba5ffa8": {
-        "ticker": "RETH",
-        "signature": "3045022100d107189818dcc74c8aa9da16bf22d917584c8dec387a8536c20c4553a198d630022077132ec1314474f472c591e2af7dd976f85e4f5b48685ec6b5ca382c790b8e09",
-    },
-    "0xb766039cc6db368759c1e56b79affe831d0cc507": {
-        "ticker": "RPL",
-        "signature": "304402202ee07dbec8028b9fa214f2388603ba74628dc11f514969d0e86e38d0169f62fa02204bb46922ca608f53cc789ce0b099bdbac988d5c3c47995756ce8f6075ec6c422",
-    },
-    "0xea1e79d4a0d347edcadd78d98a7da65d15e8cba1": {
-        "ticker": "RKV",
-        "signature": "3045022100953b1b2e59d91d21c19e37434013e5901fbaf327f0985f90eec98aea3b15b863022058578a58d860a379e854b3ee4d19441b4f3fc0792ddd0d4a060b2e86cb1e0910",
-    },
-    "0x033f193b3fceb22a440e89a2867e8fee181594d9": {
-        "ticker": "RDO",
-        "signature": "3045022100d300943511adb2b6bd76074bd29d0c730fd27ebe37e21493de3274833a34a762022031683100aa6f236f559dd723699907e03895da3ac2839744f3d2ecebb21d1f7d",
-    },
-    "0x3bd2dfd03bc7c3011ed7fb8c4d0949b382726cee": {
-        "ticker": "ROOBEE",
-        "signature": "3045022100cd8b73a53cbeba9bcf6ca8ce66add8c26b2aa3b1c4ebcb2aea4bee2d5b1ccc7902207b3e8cc42a0ff4a90bc16c3012d6090bf7348e679b943191141c2d0c08ad682b",
-    },
-    "0xdc8184ba488e949815d4aafb35b3c56ad03b4179": {
-        "ticker": "ROSX",
-        "signature": "304402202e96c4bacb83c856ea8e0043d8578d1ecbaa9a1e13b543df9c3a78f1a1223e0c022073d7853d4c217f8cd2acd95eb5085c9598d51fe77e090cbfd8e5dbb7dea15c22",
-    },
-    "0xd79bb960dc8a206806c3a428b31bca49934d18d7": {
-        "ticker": "ROSNET",
-        "signature": "30450221009eabc02c8b9b091dcd04db7be40da848fc8c587459d5ba865c23785761681f7d02201c9733a813e0a0104ed2dc7c18ae4dc5c7a3860bd9beadabcd98d101ff6c016d",
-    },
-    "0x5298060a95205be6dd4abc21910a4bb23d6dcd8b": {
-        "ticker": "ROUTE",
-        "signature": "3044022026aa75b7b3e67ed05edfb42b8d1de9105e162af76a4ed827fab06b5fc7466c7602205991c1c78853f41ab8910f027f5c1e86b08ae1e210ea024de448ce271d774bc2",
-    },
-    "0x10aaed289a7b1b0155bf4b86c862f297e84465e0": {
-        "ticker": "RBC",
-        "signature": "3045022100dfdb94810d85951f47a821d3b3766e4d9680f50e727818bab96e795a7559f04c02200b00bf031d2217da5567e2691d59cd8baca9ae6ad7013bc85beee9b9fe051881",
-    },
-    "0xc701f86e6d242b97d3035f6c2cecaf8e7087e898": {
-        "ticker": "RUX",
-        "signature": "304402201318e0b0cc90cb9a6e1aa4eb7459f7694e8ea040deea3a5202576acc64629c5e02203131800bd9a316280e1083f257dff3bc134dab736d6e142c81e25c09a0989f4d",
-    },
-    "0x75c9bc761d88f70156daf83aa010e84680baf131": {
-        "ticker": "SDL",
-        "signature": "3045022100ffbc9a97b946d1ce944a060d08a03ce6aec6de4dd695ce2c09e963e237c79eb302203389c9e95490baa90d8de8fc3ec235bae8bea288b28c5fe16b7f85d86dcc884e",
-    },
-    "0x810cf1757b51963102e0b4fe9fdfcdf749dea98a": {
-        "ticker": "SANCTA",
-        "signature": "304402207f2c44379d687a68a0abc50f8a57035cf27bb12d3353ad4392565d0878c99dce022032efb3c9cef879cc8dcc6ebee883a831ed3e6e00d5c54bedf1c19ddab0cdadbd",
-    },
-    "0x17eb7c08c4057b6c270dc0549745adbc874eb15b": {
-        "ticker": "SAT",
-        "signature": "3045022100a3549cfce9c46c20df4eb0b43b75a2ff2579110b86e4a3dabd99144ca46123be02207ca950fdab5663b3fd932ead99f7a870cd014fa1c4248fbefb8182190fa2f7ee",
-    },
-    "0x43ab8f7d2a8dd4102ccea6b438f6d747b1b9f034": {
-        "ticker": "SVY",
-        "signature": "304402205683e4356a35429108e7550a446e6df6689c479a52afcda571fa0de110d4f77f02200186517b8e6fa55fb49b49be608ff05c28a2c7e37629842e0da0a3d68fa23846",
-    },
-    "0xeee18334c414a47fb886a7317e1885b2bfb8c2a6": {
-        "ticker": "SVBTC",
-        "signature": "304502210086b38fbd30cd209fab311cfc3d7e2a90a5f89e11e3e0fbe543a534e42de2c8180220568c06ac3bbd0c8dba12b43c650f07bf1a57cb2431ca87e2336096c5fb02576c",
-    },
-    "0xf7728582002ef82908c8242cf552e969ba863ffa": {
-        "ticker": "SVETH",
-        "signature": "30440220639583d767ef7c705f413c9b1b73ce0c4de1048848c296e30fe3cce7d8d7105f022000d2290849554c9d55c774ff20e0a4fa06ae963fbacb2db16d27fd049c00ce9f",
-    },
-    "0xf202ab403cd7e90197ec0f010ee897e283037706": {
-        "ticker": "SVUSD",
-        "signature": "304402201e1decb69f646f553cfc48637db92bada4207ed9b1fb42a99db1918430e1f31c0220461daf0a479cfd4deb99da50ff9bb14eb5fee42f2ee123fa4d3a3aabe10fbe25",
-    },
-    "0x35ca1e5a9b1c09fa542fa18d1ba4d61c8edff852": {
-        "ticker": "SCHRODI",
-        "signature": "3045022100aac0e417f6070b2c416993f98869cc9f4e6bff7b3e2746ee8db6d957c30c4027022067410b1b31dc9d22503b73d5d073e27ddf5b8b574f042478386effddae73bbc1",
-    },
-    "0x0b63c61bba4a876a6eb8b5e596800f7649a9b71e": {
-        "ticker": "SECT",
-        "signature": "3045022100a24e1be47ff16502f80e394158d4fc76595c0c4595d86479b69074034c7e177302200905425d4f787a5f582437e5a33013e01d6c9405dbc3b98282203802a1c08947",
-    },
-    "0x560363bda52bc6a44ca6c8c9b4a5fadbda32fa60": {
-        "ticker": "SFUND",
-        "signature": "30450221008e24d3cd5b2a9c3f7d6981d41fbfe00ca7d1cf33b32956ff1023f0305c490ce802202cab53de5079ba7b16f2187f4cadcd63b59a733ec81e706c895a62f7bb6c085d",
-    },
-    "0x154388a4650d63acc823e06ef9e47c1eddd3cbb2": {
-        "ticker": "SEN",
-        "signature": "3045022100eb9f65435922819f134422d7dcf8a0eef14b46f7c8f81ba43d5b5c922c61a9bc022028815522d69938ece96284380152e690471eddf6bdd028601077e1db255c26ca",
-    },
-    "0xf36a65fd3b7df848860d174115f1864e6aa2db5e": {
-        "ticker": "SENUSD",
-        "signature": "3045022100cd382cfb5fa6954a70de2b22502ee62791a0167b6f1c00d059dc06f6963d0283022033ed70259785f2fc0a3d1dc04fb5236e3d03e112ff0b16bad8dee07e7064154c",
-    },
-    "0xd26b0c6ef8581e921ae41c66e508c62a581b709d": {
-        "ticker": "SEX",
-        "signature": "304402202ce9030420373c60f091a072076c34b0d21bec0ad1b13d75c0626ef91a85d61302204ded8f16a54aa2201e858cae074ea7b9b21d0caf288549bc7d5b41499ac5f968",
-    },
-    "0xaa54e84a3e6e5a80288d2c2f8e36ea5ca3a3ca30": {
-        "ticker": "$SHARBI",
-        "signature": "3044022024cb24e6667a639b3c52bcd2d80da3c99637dc986d7e41440c16d20e09bdd14e02205500efa0e6680430079906e42c511d69b559459a821e47ae90951126825cdb7d",
-    },
-    "0x73ed68b834e44096eb4bea6edead038c945722f1": {
-        "ticker": "SHARKY",
-        "signature": "3044022011d99ca3232c658199c4a5ffc757ac78082af0bda09e7a338e4085ae63a17caa022030a81c18f90fb33680e317b747ff2cab9a12667eb82067ab5f957090cd093cca",
-    },
-    "0xbb5b3d9f6b57077b4545ea9879ee7fd0bdb08db0": {
-        "ticker": "SPI",
-        "signature": "30440220124855a5c443b34183dc0425c4efa901ec65e933ef678d6f20a999bcbc47b4f002201d527e576058992fa16817b6048fac97723047c1f5b483435fafba10cb4e9f21",
-    },
-    "0xe47ba52f326806559c1dec7ddd997f6957d0317d": {
-        "ticker": "SHELL",
-        "signature": "304402202b91d36b68d66a322ed4cda6dfccb721049d489088c75853aeed2073b1fa4d1a02202706938c9cedf50d2f5436177e7e0bcfcd499866579d5dfac2524088c0109932",
-    },
-    "0x17afc249db786fc300f2d26381fec5cf0c3913fb": {
-        "ticker": "PESOS",
-        "signature": "30440220237c621cab16ab622b9a57f6fc314690f6c11694a7c8ec617892886ac06177aa022054daf7c89c06c7020c99a1619654e9666976e9a159f889396f89b61dbaf1663c",
-    },
-    "0xfa296fca3c7dba4a92a42ec0b5e2138da3b29050": {
-        "ticker": "SHIBAI",
-        "signature": "30440220691f22696406bcc814b4dcd34b7725efa92095c22356810ec5eeea906e10d96102207cbbeffbb2879264ce02fa5e4c745eb9fd8128f38a30307d666174f354a8cc3d",
-    },
-    "0x0341c0c0ec423328621788d4854119b97f44e391": {
-        "ticker": "SILO",
-        "signature": "3045022100b6cd926f670b5f1d3f1f79e5557a3b529ad4a279adfa6cde254db3637288ae370220015c738763d8573718c3755648bab1e0b27d343d01b0e3000068be128fa68207",
-    },
-    "0x939727d85d99d0ac339bf1b76dfe30ca27c19067": {
-        "ticker": "SIZE",
-        "signature": "3045022100b9b32027b2041bf06f932e9473c67ee08bf35b125f666e11e446990c495a309002203640a0fc4e1ac52c448c8b42eb3fd00c7110f61edd35e4bc0f720f11d9aca815",
-    },
-    "0xabd587f2607542723b17f14d00d99b987c29b074": {
-        "ticker": "SDEX",
-        "signature": "304402207be454d41b96cb96f666432d207a945b9ab4cbbd055e987fce06507699a8d1fc022059c756ec397740375c85b3f4c41c71534969787d47048003ee23729dbdc029e3",
-    },
-    "0x4e05d153305bc472e220ec3f7a7894b38f74741f": {
-        "ticker": "SAS",
-        "signature": "304402207bc334c0d5ffd7bc605f675b00d7333a5e581d3fded73af3df87a53e9a350baa022010ff963c35323e14cf0bf9acee5e098ff5b74d82996fa7dcb066e792caba6536",
-    },
-    "0x9e64d3b9e8ec387a9a58ced80b71ed815f8d82b5": {
-        "ticker": "SMOL",
-        "signature": "3044022016a72c60d0421b750a3c2e11321f44dd2b9677aca41741b3f27c37d56a5d1975022017be155dd6755b0e9ec11bfea130414050e50981e32966bc5edfa2a745840f6e",
-    },
-    "0x463913d3a3d3d291667d53b8325c598eb88d3b0e": {
-        "ticker": "SLIZ",
-        "signature": "304402205d564916fdf6908214438f38125322871633f8eac3115340404b910375a0189d022016f11bbbef5436ee786d3a7f891ab5942a636a060847715bb599ac23ab8773e1",
-    },
-    "0x54355cc6913b26a15cca1f820cf17d362fa65db5": {
-        "ticker": "SLZUSDC",
-        "signature": "3045022100b233ef8d7fde3fba0aca186dc4866b584cb6e8e5ae0d6fbe3035920e6824d5a102203d7850fcc2e3da7789754532dd941ffe9576aa3a6dcabe436636776c978fad0a",
-    },
-    "0x358e5d2378f5fc3fa5504aebb728c4c568f973a4": {
-        "ticker": "SPAI",
-        "signature": "3045022100b44e7800405a049db45e8f0d4559736894f6fc7c7707195ceb33b6e7afe5f40002200b73c8ddbfc60acd16535d0fc827945551ca874b449505121a399dcf51fcd895",
-    },
-    "0x11f98c7e42a367dab4f200d2fdc460fb445ce9a8": {
-        "ticker": "SPARTA",
-        "signature": "3045022100dd2ab6fc44c00f68be09e7120498860314dc50b4d2da660c8b4aff9607ee15310220054566dbfaee97a3a614db68521a1ad93ff930290e82d93f2a4d235e73131e41",
-    },
-    "0xf4bd09b048248876e39fcf2e0cdf1aee1240a9d2": {
-        "ticker": "SPY.D",
-        "signature": "3045022100dcb8dc9743657e857b3f34d15e70230f6484fa3848161eeeb1786f84986839e102200ce02699f9c5f91be16cf9332a401af33d1b357244ab54d9a27f8fe699cf1501",
-    },
-    "0x54c1b12da9594c7cd8fc9a172bb2cc6f83ecf6d4": {
-        "ticker": "SPEC",
-        "signature": "3045022100a3297869f4c195cbf005559ecf07d23e63f3fe761489f3b432f9cb888486d41e02205dbff0c5a4a22620c197c2bae84691d025b3a39d24cde623baba8bd13620b45c",
-    },
-    "0x3e6648c5a70a150a88bce65f4ad4d506fe15d2af": {
-        "ticker": "SPELL",
-        "signature": "3044022027d61ea6a63c01256fe82b0e1653045f25321f756fe25ec9b492896f9620baab022002785e8e0ae247362ffac3a7e3a29a108dcae28c6a3cb8f2b08ff9b32b1ae488",
-    },
-    "0x5575552988a3a80504bbaeb1311674fcfd40ad4b": {
-        "ticker": "SPA",
-        "signature": "304402206aa61a55d137b546b5375b6021b7f4e62b6cd9b1084c59a07360e3f251531b1c02203ba6553918136c5df747054ffe36dd9662fd7c0452f9e9c875524e51a8cc2151",
-    },
-    "0xd74f5255d557944cf7dd0e45ff521520002d5748": {
-        "ticker": "USDS",
-        "signature": "304402200c177c3c390367c766edf2324d951230c17c3f2d791fa8f9c1e1bdaaf95c569002204611cc22c7ae02c7ee9fecd43dca9b3a580bcc8f81c57662f8ae98df43ba3b43",
-    },
-    "0x802124eb78e43fd8d3d4e6daaaa4be28dc7993dc": {
-        "ticker": "SPINAQ",
-        "signature": "3045022100c61c7129777eedcccf16bdd618d49c812000d6feeec2654368c9480afab5da5902207e6622370e5e1ad279da1b8c1167f2edbd61d5b84f3987de4a76238c1e6b3e1d",
-    },
-    "0xeca14f81085e5b8d1c9d32dcb596681574723561": {
-        "ticker": "SPOOL",
-        "signature": "30440220451378e4d0f4e61ce35a8de749f2d7f5fcbeb5055f4ff7f77b5e1a800e756189022043d35d1ec1b95a9bf0a2cb17dd2a742e48ea2bc6457de6a01493db886335239f",
-    },
-    "0xd45e486a90ebb84e9336d371a35dcb021424b96c": {
-        "ticker": "SQUAD",
-        "signature": "304402207b4dcfdec6ed8f660c7074158fb7f112b4b71ac5599aa52715e430c75d122b7c022051f3aa151a259f25e934caa50094b2464f7df7bd660f4a72cda7327911b137ba",
-    },
-    "0x2c110867ca90e43d372c1c2e92990b00ea32818b": {
-        "ticker": "STBZ",
-        "signature": "30440220300f6621a44cc9a772cafd8e2c12a958c3f8213d95a7b4c4db892c2fe83c55d802205b0cf68f7f91df99aec01900fb92ca58379ec572cf59d4c95bf1b5f4ffbc3658",
-    },
-    "0x7ba4a00d54a07461d9db2aef539e91409943adc9": {
-        "ticker": "SDT",
-        "signature": "3045022100c81ded49ae883ad076a3d7d770f6fd0091b081e04bf3e654fb2bd7ca0f59e01c02200b0edacd2adedef9dd13d968e7bc712913e3899c09804983d4b0dc9427a61d3e",
-    },
-    "0x004626a008b1acdc4c74ab51644093b155e59a23": {
-        "ticker": "STEUR",
-        "signature": "3045022100d97b28b461fbb2a81f8f9a371f44228b41eea1ea439b79ea02ec1bdf3e1894ff022011539ec0a9f84fb0706ed76458447c301710becf444e3a7c2e10bc7cac91b60f",
-    },
-    "0xf7a0dd3317535ec4f4d29adf9d620b3d8d5d5069": {
-        "ticker": "STERN",
-        "signature": "304502210081c7b4c0bca7893dd12f1fc48e72cb1869587aa2fb51b4b4bdf9aa4bfaad209f02202b5dc50ca72ee3fb190e797249a62c3c63767f85cfa9754ca6e48a264b31515a",
-    },
-    "0xe3b3fe7bca19ca77ad877a5bebab186becfad906": {
-        "ticker": "SFRAX",
-        "signature": "3044022034edc1d42869bd10151af09614eb2d70ae38477889b27708d9990604b359fdfc0220216d77f0156c1836539a840ffe52d59c0dfafef19ee4374587fc1a6bd6e69029",
-    },
-    "0x95ab45875cffdba1e5f451b950bc2e42c0053f39": {
-        "ticker": "SFRXETH",
-        "signature": "3045022100d73bff97de924f92d421ee2e20909696ab63cec65cdc9068164cb210ac6018b302202c535c7c302a02807441a6367c840464cf214cc1172cc966e34ad5ab7c92da4e",
-    },
-    "0xf5a27e55c748bcddbfea5477cb9ae924f0f7fd2e": {
-        "ticker": "TST",
-        "signature": "3045022100cb75e0cdf7e2968daa52cadf48810f94c048ecf7e0f35185af9b495289dd048102205dd9783f12942213280c0812ecb4e875d2383dca3bd9e7499268b46c3661d367",
-    },
-    "0xc19669a405067927865b40ea045a2baabbbe57f5": {
-        "ticker": "STAR",
-        "signature": "304402206bc46a6caa744ffa023013f8b3361bbf9075e496766fdfdb7a0ce86365235cf502203596dc62212bb4f57de2707daa4787f8b5598ee3f062c953fd36c46effb8dba6",
-    },
-    "0x37596f20adef5cc9618c8b6ddfa9dcb6329cb0fd": {
-        "ticker": "SEAN",
-        "signature": "3044022057c43b1fd780a72f171abe5ad598d836126573ef45bf4168ac8b9efa673a1cd702205f0ca68ff1f1f4952e20463c3fcf5e45b71846d35f5c4f969eedeed4a4c7f893",
-    },
-    "0x6694340fc020c5e6b96567843da2df01b2ce1eb6": {
-        "ticker": "STG",
-        "signature": "304402200a9fad9e077609de292580a191b8e2adfc85494231511e1d68ea34040ef4722f02203173b94d974093815c741b17daffbfc582732d459fbf47bd0e4e7aafce421489",
-    },
-    "0x5db7b150c5f38c5f5db11dcbdb885028fcc51d68": {
-        "ticker": "STR",
-        "signature": "3044022028e935c0cdacdf411e06889c7719b0df33a603213bf5c4dcae4db68091f7a2cb022044e965d89f0f4870eecfefb101c49fb196f213df05b60fda2b2a2c67a53a72d7",
-    },
-    "0x7dd747d63b094971e6638313a6a2685e80c7fb2e": {
-        "ticker": "STFX",
-        "signature": "3044022019d03ee5b3f1205982592e4abd6bebae31a0243347a306f95b8decde976ac9b90220195ad7ea6bf66d8ea5af6e1a1bf5ec125f0ca67c35b0ac15549d81d4b91fa326",
-    },
-    "0x326c33fd1113c1f29b35b4407f3d6312a8518431": {
-        "ticker": "STRP",
-        "signature": "3044022024d08368a08d75bf32fb46cf98adf82c3e53601d98ca44e5c8cb8a6de7542a5e02206e98a0cd85e0615f0754a9e8a70fda2f9d1463c7f3e067a35ba0391e3afeb29c",
-    },
-    "0xacc51ffdef63fb0c014c882267c3a17261a5ed50": {
-        "ticker": "SYK",
-        "signature": "3044022014bdf29138b9ecaf40931f542a023ebb571c29b9e11cf28a68ce6278c3044feb02201ff996aba4022b1f07a469cf3920721d077387dfc57345a4b3e0322b5b4c7a68",
-    },
-    "0xe85411c030fb32a9d8b14bbbc6cb19417391f711": {
-        "ticker": "SUBTC",
-        "signature": "304402204904e9f025abefd657854a526ad8d49c7ce3a3714d0c642d50bd9fe8980f946d02203ba973527ffd89a05dca6a21dc47f19e668cdcecca180363d91ddbc3432e74e8",
-    },
-    "0x1c22531aa9747d76fff8f0a43b37954ca67d28e0": {
-        "ticker": "SUETH",
-        "signature": "3045022100c4c5bb65c9a6b14a0f311af8cb5be32f9783683ea5bfb227ee835d50c136072802207592aba04b5d87739f9e7fc504bfc59031a6da0f317fc44365ab62c437351c49",
-    },
-    "0x8bf591eae535f93a242d5a954d3cde648b48a5a8": {
-        "ticker": "SUUSD",
-        "signature": "304502210094ce546e95eb6828b0825fe1a77b275e610a281e404734de9d8bec3810a6960c022054ee6ed5f02c89e63d4c5bfdb7f76f62fa1118925302c258e3f7932eb0837cf8",
-    },
-    "0x352f4bf396a7353a0877f99e99757e5d294df374": {
-        "ticker": "SUNDAE",
-        "signature": "30450221008100f961bd214cfc08889b892a2d74452afbeb32335a6feac239c8fcfcb2275102207587c06410b97b54b316e4775061f9d0e1a7d501b72fff7f12cbfebc57d3963c",
-    },
-    "0xd4d42f0b6def4ce0383636770ef773390d85c61a": {
-        "ticker": "SUSHI",
-        "signature": "3045022100f706ff2e0eb44ee304385306835b7805e4ed07e2a7d6ea9b91a14e9b8329f0d80220206ea2f1a76535fcb6101d4a21fb7926433beba61e9b93fe744b41b209875472",
-    },
-    "0xde903e2712288a1da82942dddf2c20529565ac30": {
-        "ticker": "SWPR",
-        "signature": "3045022100a1c89b3b46a0a66fba39416f4ace9b3e8943a9791f2fb5bee6759dc908fe77780220104a5345b67a0cf54857a3a6c3ef26e0ebd6824433e326f4010b1eef42e78901",
-    },
-    "0xbc011a12da28e8f0f528d9ee5e7039e22f91cf18": {
-        "ticker": "SWETH",
-        "signature": "3044022017d87dcc205f96d5c7e160823f14d8cb5f5b6440bfb3cd6ede8403083cee1a7702201ca938f9f2b85760b18a4d049824fbe941dfca9a45c3df8cbda68eb21287df8b",
-    },
-    "0x9e758b8a98a42d612b3d38b66a22074dc03d7370": {
-        "ticker": "SIS",
-        "signature": "3045022100c2a6512ad06f12190c00feb544664e0b2d906819aa0a43fac564b6178945a60b022038628086c43f6f7f996b28c6650f2641f1dc1eb83c899b658a7aecb01500b3cf",
-    },
-    "0x080f6aed32fc474dd5717105dba5ea57268f46eb": {
-        "ticker": "SYN",
-        "signature": "304402207f458b419f1f96da996206ad41ec11408c4db680ae61b685513635073fdae8ce022056e607dc078052568900c2134b36b927d8a80ad580e17b5074f1370d5df07fe6",
-    },
-    "0x577fd586c9e6ba7f2e85e025d5824dbe19896656": {
-        "ticker": "SYNO",
-        "signature": "304402201271b3e8467fc62ead24dec88f31a4b9453c08e8429fb1b449af81622dc4e644022026bfa66d6c966b917676e17773701df3ec16a1b8a92b1f4c8a0aee43366e0c44",
-    },
-    "0xa970af1a584579b618be4d69ad6f73459d112f95": {
-        "ticker": "SUSD",
-        "signature": "3045022100d1011131aa05c7187abc9f61537b8377ead95a0da4428a577b7d790ce8c939590220131311fdec582512a9f7e31b6d77f52cc438717087a73c7a47fa250b61e587f6",
-    },
-    "0xb2498cde54810424a24fdd23579164265a0c14c5": {
-        "ticker": "TAIKULA",
-        "signature": "3045022100ddeb4b2e3fa9e859ecc118c07bca1097d4ea5efd8820e6f2ad1885472614ebc902201410c3f36754e169a28862b1e6dd7432f45733b403cfa2d0f9da6f53e692e0a6",
-    },
-    "0x13278cd824d33a7adb9f0a9a84aca7c0d2deebf7": {
-        "ticker": "TAROT",
-        "signature": "3045022100a6d86178c47189ce233a0a748e979e9e3ee83593c67edf3dd4bc0eb7cbff0bb20220471ce361290336481e305950fb47274903dc723b25baa01171a6826b3ed33fab",
-    },
-    "0x0ae1bb2bc04308765a6b1215236cea8cfee8cab9": {
-        "ticker": "TT",
-        "signature": "304402200688e92e89c24ce6f1851e8ba1c17fdfd17d73c4d20b0370be4fc75f5ff93c64022051456b216add58ff601b9b1aaa98f5508d3dd4c182932a94b886e6be2e8e5439",
-    },
-    "0xd58d345fd9c82262e087d2d0607624b410d88242": {
-        "ticker": "TRB",
-        "signature": "3044022055632f3e3df879a282c5b0640c10e829c3942421236ed22a7ab68d2c4d195b6302201f720c474b64b453652d462ca2d15b27fea30b2f7ca89d065bbdef8899a4761f",
-    },
-    "0xfac38532829fdd744373fdcd4708ab90fa0c4078": {
-        "ticker": "TLPT",
-        "signature": "3045022100a4ae0429ade4c686408b4e1715c1f5e221918c5e68af07fb855bdde2898bba35022074a19ecc644313d00ff119a3ec588bf83a93b91a64c93121475aa16d8ae9503e",
-    },
-    "0x13780e6d5696dd91454f6d3bbc2616687fea43d0": {
-        "ticker": "USTC",
-        "signature": "3044022078608a986fdfc909a86c40fabf0f65b5b70e883c0607279bdf25618213674a500220199d85e872661a29bf7df891a187e01c7a45741150686c01f484ef4d00cdb629",
-    },
-    "0x36d37b6cbca364cf1d843eff8c2f6824491bcf81": {
-        "ticker": "TSLA.D",
-        "signature": "3044022045f3112d334634d7a392e163666633e1b832e871bf59df2808103ab0cac640bc02207e5ae3a2f5d4debe77ceb8b850bc7c58ea0c612b7f8870002b35f2d226ae3b1d",
-    },
-    "0xfd086bc7cd5c481dcc9c85ebe478a1c0b69fcbb9": {
-        "ticker": "USDT",
-        "signature": "3045022100d5638d26cd46b06a42ad3f80bae4108ea2a87fb254bcaef7b013701c95cd989a02202f0dd3ac4bc2b5a3500b559f75742e650961cb1fc47aea2b079ca6e62796c336",
-    },
-    "0xe85b662fe97e8562f4099d8a1d5a92d4b453bf30": {
-        "ticker": "THALES",
-        "signature": "30440220595d82c7205c4019029de720a137f7f1077be404b88f21433a0607f733236cb702200993542c12496b605e176c53476c34776dfa6a2769234793539cbfbfb998cd14",
-    },
-    "0x9eb6299e4bb6669e42cb295a254c8492f67ae2c6": {
-        "ticker": "BET",
-        "signature": "304402200feae3e17eff8ec717f7e2eb6da5c7621b67a6811ba2ac63b1f61385a35746e8022002b41ee6f9927f8368146bd22488a7cdb5aec5d44d60aa6d315c7b16ea79e962",
-    },
-    "0x4425742f1ec8d98779690b5a3a6276db85ddc01a": {
-        "ticker": "DOG",
-        "signature": "3045022100d21dddb900fb9a2bd825cba883edf9091d37ee68540578a996bc58a9ab1e204c0220616f24cb99b121a5ea754d7c804fcd99f05eeb6d55bdaafa4aa6275f50bafd20",
-    },
-    "0x643b34980e635719c15a2d4ce69571a258f940e9": {
-        "ticker": "EUROS",
-        "signature": "3045022100dd767885a313308872d8a165e32f1302d31bbe0368a972298b824205ce06e9ba02203177db5a26e69210e66d58d39ace55d379f60df89d003aa6996f16ac53be6f51",
-    },
-    "0x3c9f23db4ddc5655f7be636358d319a3de1ff0c4": {
-        "ticker": "DIS.D",
-        "signature": "304502210097174f8af32401e270e5006c26de84e0feab13e3588b716e448bbcb0c0508b7602201d9008315d3a6f6ad15c2552c171682956f3f85c22af59ab769d6668c2ca0bd5",
-    },
-    "0xd1179e3117edfdcb0f826d4287cc8444c5c8fb4d": {
-        "ticker": "THIX",
-        "signature": "304402201313e2a66932a067c761e265214470e863a4c7df44a60f3bde8cf6e5e297a19d02206db8b657f3fa1959afc84d7c9cf00894c3ead5589a26386954cffc168f40e4ee",
-    },
-    "0x429fed88f10285e61b12bdf00848315fbdfcc341": {
-        "ticker": "TGT",
-        "signature": "3045022100e578baf8a751ad4a17f56cca585ce2b755bddc828e594ab9fb6dd7efe422bf6802201b5063bf37ff317b0c22feba7e597ebe165aac070f04b63a629659903fe49cb1",
-    },
-    "0xd56734d7f9979dd94fae3d67c7e928234e71cd4c": {
-        "ticker": "TIA.N",
-        "signature": "304502210092f7fa9ab86e05b6adbbb707e83cdf121310606827dbc44b2a644c40c4e9fc08022070076325d828210b4ef0c804f35ad14a0564d3a3bd03384891ca64c222670bf9",
-    },
-    "0x3a33473d7990a605a88ac72a78ad4efc40a54adb": {
-        "ticker": "TIG",
-        "signature": "304402204ea7c194162cd48ded6b942b567be2fe5b46d7b861b404770a2bdbd49bbff86b022046bc7842c7e693593fccedbf2aa92674d7c3897a0039bad4070384b4bcaec943",
-    },
-    "0xc56dc613c8ef3c57314171d73eaefe87aa469186": {
-        "ticker": "TLSD",
-        "signature": "3045022100d1356164b8ca6a962c7efd902a7c33b86b48d88e8ebca00c0a3381044b681b65022078586540c786235550af7f5830e40e7e970ede29d8f6ed159b582322b5d0141f",
-    },
-    "0xc47d9753f3b32aa9548a7c3f30b6aec3b2d2798c": {
-        "ticker": "TND",
-        "signature": "30440220562d83450d200507745353c1bc9366524eec4aeb1561beddcc852d1c07a0c266022049f6f9d5dff54c5ba85c7a9f4ae5ab2df66d7056a1eae88e95c41030cbe397c7",
-    },
-    "0x55678cd083fcdc2947a0df635c93c838c89454a3": {
-        "ticker": "LON",
-        "signature": "3045022100cc3b5afe20bdf552a9b447ea7b12b8a6bc85e0f8343cec380fff1959372dc7df0220596f48ece9fc1cbddeb93567ad83fab4fcb6f4b6e56b0499785888c8685f92f3",
-    },
-    "0xb56c29413af8778977093b9b4947efeea7136c36": {
-        "ticker": "TORQ",
-        "signature": "304402202281726d643d751ae3582bea739567ed89d4c7ba4d0f4fbbb1efc560716e49a1022046a90089f1d14ae0c79f20e8132ee0cac21b84edc888e85424f86cf4e4668cd8",
-    },
-    "0xe6be2f5ab2ad4b8b146e3008f81832cf7b279f43": {
-        "ticker": "SEED",
-        "signature": "3045022100ad9f6c0cebaa5c8f46c8b476fb84d24d5d993676d4077bf6803a1530809be4fa022069d90e4ccd7a89939ed96374947fdd24cc5b659a58dac633f114961d3affca85",
-    },
-    "0xa72159fc390f0e3c6d415e658264c7c4051e9b87": {
-        "ticker": "TCR",
-        "signature": "304402201f3e38e35934e29893945400bb2c8d88bebdb9f4e2830c7b4571e10d60a601b1022052dec03bf840c6e973508f638f333f00f7146729917039c5ebac5176e1070cd2",
-    },
-    "0x602eb0d99a5e3e76d1510372c4d2020e12eaea8a": {
-        "ticker": "PSI",
-        "signature": "304402202e8bc5f1568182e8f374f5994e054030000dceb195e662bbb658f7a97ba1386c02205dfdb0c56b7fcd8189d5534a6252aca3e09e2cfa04c1f0e8205e704bdaacf0e6",
-    },
-    "0xd2eb76feff5fbd549ca078908fb5efce7533a09d": {
-        "ticker": "TAI",
-        "signature": "3045022100a58bf3f39d87b0c4a1249fdac6d1c39b9aac37840bc3927dee73b8a9ed889feb02200aaaf9c78d238acefc57e11ce1c0093572446b683c9b27c34a474ffad05b4364",
-    },
-    "0x4d15a3a2286d883af0aa1b3f21367843fac63e07": {
-        "ticker": "TUSD",
-        "signature": "304402204985ecf1083353e34ce179911351c6b226087c4660ff6c1c6c3aa5b88aece4020220345a42efeacdd57bbfa7efdbf615051a28dfddd142bd947ad41ce42733f43595",
-    },
-    "0xb59c8912c83157a955f9d715e556257f432c35d7": {
-        "ticker": "TRUF",
-        "signature": "304402206591f01a55f23ddd6cd05a9214f714a2dc9027322f659f6e6cd0d535c0242daf0220407627f75cfa4b0267e7922885e57832fe945992efd4b2f2cbab124fc5ec79ed",
-    },
-    "0xc4663f169aafb1d4506ce189d63810e24a8b63ea": {
-        "ticker": "TURAI",
-        "signature": "3045022100fd98ca195422581fcdf3580f4d756f7a786cd7f9e8cd1b78100a84ac76b7381302202e7320251a2116fa6539ed5e1337076edddbc3e422190aaaa871802c138d2649",
-    },
-    "0x62cffe9917790edd44fbc36a76cb8e4920bd1268": {
-        "ticker": "TWST",
-        "signature": "3045022100e56a0be8769d75aaa3849a22db41231528b5194d42f9e01523620d446bde05cd02201285316789336621a77d1ee0921ef01427b813933151cae2eefcc6d8337acdde",
-    },
-    "0xd693ec944a85eeca4247ec1c3b130dca9b0c3b22": {
-        "ticker": "UMA",
-        "signature": "30440220013fdcbd451bde26244004443d0fd7ee4c1538c3192902166629ee8695662e64022007f7e6d4d29b65af2f33203d91319797a634cf0f17b9cb2e04379926472b1721",
-    },
-    "0x1622bf67e6e5747b81866fe0b85178a93c7f86e3": {
-        "ticker": "UMAMI",
-        "signature": "3045022100fd24fce4c4253a120fbd8888afc8484dbcaf4f019789362ad46d19ac170329de02206e185202b5692a3a451a8b7e01ad495f9ca80b5e1646130af14e73c0aa87c6d5",
-    },
-    "0x76bc2e765414e6c8b596c0f52c4240f80268f41d": {
-        "ticker": "UIBT",
-        "signature": "304402201a5acc06a3e93b41b95c932eab6bcf346936efc30fe3c797279e6d1fe3ab3acd0220297f4c4125d5aba1294e742577fd86cfa7a49d55acd2ec4ea6c261f2c5857b12",
-    },
-    "0x2ad62674a64e698c24831faf824973c360430140": {
-        "ticker": "UBT",
-        "signature": "3045022100b284a89930d173f39f9d7c69cc4780050c40b3b2f9a584c66bc2c33c8869be83022077f82080e2a8a309b0767055a461f021278c27b3547309d96cfee8855c231d7a",
-    },
-    "0x5429706887fcb58a595677b73e9b0441c25d993d": {
-        "ticker": "UNIDX",
-        "signature": "304402204561a19a6f58226fc1cb0d61a32c90904c6a5872d62f21f6a57fabef5ff38c14022038880f663e16fdeec9f51b20b6a53f9f9784c3baa8ede453f24ee9e6d72c7fa3",
-    },
-    "0xfa7f8980b0f1e64a2062791cc3b0871572f1f7f0": {
-        "ticker": "UNI",
-        "signature": "304402201df92820021fbfb822a2f47816aa424d1e267c06952c5d5fab5d70bb9ba57b2902202345732f3fe479ed5d847a38fe20b9d431fc34b17e540cde2b1bb10691039bdc",
-    },
-    "0x0cdbbc7fe1c8da0cc41ba96d7edb4cce5982f23f": {
-        "ticker": "ULS",
-        "signature": "3045022100895114f630aaaa6a448f70b3b005c829dd6e836fcc0d542f4fdef593c46c1821022042159c1381070bfddf0448db4cf8dc5fb11237da3d9a948e9c9ba72bf760e051",
-    },
-    "0x3b6564b5da73a41d3a66e6558a98fd0e9e1e77ad": {
-        "ticker": "UTS",
-        "signature": "304402207933234a09644e16c4fff25372ff3267d4e21e99c23629b9ea0710b24cdc950b0220450d8df9905d381703d66dbbddab4cb5d3a23f656b9c5e880656e5322d000312",
-    },
-    "0x05d35769a222affd6185e20f3f3676abde56c25f": {
-        "ticker": "UWU",
-        "signature": "3045022100f931849754c100d4f42a1b84be98bce440bc5004e64078457f5c6f14d4d9c72f022010345797fafcae641647360378d568ec5cf8e3d2412e92a700e22635cbef289c",
-    },
-    "0x0ae38f7e10a43b5b2fb064b42a2f4514cba909ef": {
-        "ticker": "UNSHETH",
-        "signature": "3045022100cbc593c4a70397bd552474aae0b7349b3d8d3eeeecab3cd0a14a6078acb6c69e02202e952229aab2a3d8e3a4443b1b2857e0925c5a163851aa8621976ef00440f20b",
-    },
-    "0x51a80238b5738725128d3a3e06ab41c1d4c05c74": {
-        "ticker": "USH",
-        "signature": "304402202cecf1c6b01d37d5dc8f3612dd9a163fb713b116a67a0243441363223961173c02205c51b5fb095e6043d00ad4535f349d3935233e3ce9fe294f39061b27f7f3d179",
-    },
-    "0xb5a628803ee72d82098d4bcaf29a42e63531b441": {
-        "ticker": "UND",
-        "signature": "304402201c6392c2d8fc4818557e170e6c5058f1fe9e0bd8cb9ac1c9d0bd444e2222e5b802204be8b28cdc3103bdfbb1c31518524ad1498ba00af34ffc8f86c539c7bd229e6a",
-    },
-    "0xc7d91ec2b29cd22c45c15760abc189c4e78e8036": {
-        "ticker": "MAKI",
-        "signature": "304402203d1a81f874cc462d32252932b3534b635d575db8c6c4ca4cca93d9daf2ca7861022010d9f0f1eda553148855d61552e2084e628fd472c45c7919275226cf84a0e82a",
-    },
-    "0x6604b5da093f3f35066c6c79e51d581a44c35288": {
-        "ticker": "U",
-        "signature": "3045022100b3c08b00298e0c505083713f1dab371a9208d939e69dab9cda8266e9597d655e0220272ba986df2ffbbfcba3adda6f401c36c99335bfaea4cd6c4e7f0ac4b1b3ab01",
-    },
-    "0x842216e0aa2ae608699f7b1063f26ce6b30c5311": {
-        "ticker": "URD",
-        "signature": "3044022020de6f9b30147371848a805d9cc7081341a03f856b914852e532a5ebdaf1fb580220777b65bd510ed10b04b3ab46b3125d0a0fbaa4961d9be8c6afb276daa7dde3a8",
-    },
-    "0xe80772eaf6e2e18b651f160bc9158b2a5cafca65": {
-        "ticker": "USD+",
-        "signature": "3044022000b3cca91e8ed94a7c46b78cfa62e9ef343e77207202cc466129ce586d8f061802201f73e3be51c30d0a4a53f4876c6a9a755a85616941f2bdc6704a0566707c1911",
-    },
-    "0xaf88d065e77c8cc2239327c5edb3a432268e5831": {
-        "ticker": "USDC",
-        "signature": "3045022100d52c67f2505e5a6292c87f85be66b316251e74d3d0864f73952d1fe87d1e568802200285bf5e724bc6124b03578835e6bc450133810841e632706f480a213afa4c2e",
-    },
-    "0xff970a61a04b1ca14834a43f5de4533ebddb5cc8": {
-        "ticker": "USDC.E",
-        "signature": "3045022100fe82f15a878903237676d495c58b542a1e4afd24f5364ab9b38af1af43c47c27022037d999f4f14fe4c53814565ad064a203b3fe958bcacb51c117346636dc6b21de",
-    },
-    "0x2c093f7d7db41057a2ddd3cb1ad8b4e9c3dffbec": {
-        "ticker": "USDEX+",
-        "signature": "3045022100d7941e836c76ee6fb4347e02158d9f66a35e7655c31ddd4242d9d0d121d7f3270220429c869f2a6b4dbd25510b16eb339ec4f93874d2cf02142871f49df5042672b6",
-    },
-    "0x7e40b3e0fd0473e0240288d2b7618ac6f0c17e1b": {
-        "ticker": "USDLR",
-        "signature": "3044022066863c97ecbea9123d1c6fec441be017f844b2ddbea41fce27bb1de5902b436202201a9f6d62a5fbeb4f891dded2e09cff1d527bb66ae2c24a1213cfe3cb876b8b37",
-    },
-    "0xb1084db8d3c05cebd5fa9335df95ee4b8a0edc30": {
-        "ticker": "USDT+",
-        "signature": "30440220207a95b07eaec151e804b32eff4eca3df5c27f42ab0333901bb3f4a73d5795b70220505f356d07fe9889ec881226963fe09d384d79a00910eaebd444e79bd99f44dc",
-    },
-    "0x323665443cef804a3b5206103304bd4872ea4253": {
-        "ticker": "USDV",
-        "signature": "3045022100d94ffa9dc584c221242559c9dd78c965af22dedf86abd64aa78949b83cbdcb0602203a9e348a11c5ea622b8f892405dc5e2ed81a3ec1b8c273636d2843bda3a207b2",
-    },
-    "0x088cd8f5ef3652623c22d48b1605dcfe860cd704": {
-        "ticker": "VELA",
-        "signature": "30440220589321f69a68792fa4c0df306c05b40824214f22823f03cbed8fc610c601ef3902200dab343fc763b4f7c83de86d6a6519788506a6c27cff1905ec6cf09ec022c4d2",
-    },
-    "0x95146881b86b3ee99e63705ec87afe29fcc044d9": {
-        "ticker": "VRTX",
-        "signature": "3044022028b18959fa70d4fb3fbaca8b7d04ab6b9b7a835a11764a92b34752fe6cd7efba0220411862c100efeaae77a16b84de6677625780171d9e6512474712ba32aabb0aaa",
-    },
-    "0xa684cd057951541187f288294a1e1c2646aa2d24": {
-        "ticker": "VSTA",
-        "signature": "3044022036533ca1a423442eea4f457155ff01216224d7896838378bb783fdf2b4782ea702205946c33ee0eb249278ee21992edf7c5e4b560eb30f0c385f844c803bcc21a2b8",
-    },
-    "0x64343594ab9b56e99087bfa6f2335db24c2d1f17": {
-        "ticker": "VST",
-        "signature": "3045022100bb71fec1f938c6e35db6dfcf2265f8f87b3633f22d50666a398ef184c91478fd0220461af2bb3070b0ae80cffb7cec469df36cd3100a7195a19b2f21885775ca30f0",
-    },
-    "0xac6e188a5a1ba58c0b3e54767f407502366f5426": {
-        "ticker": "VIM",
-        "signature": "304402201aa8df3b99e40c38be662e2d2a178cfa976bf85654db193acc8a6eda7bb716330220466092030881bf168ae61b99fae99c9baa7baf6b241143689155609ccc8779bc",
-    },
-    "0xd1e094cabc5acb9d3b0599c3f76f2d01ff8d3563": {
-        "ticker": "VRSW",
-        "signature": "3044022019e5e5aa0a9043200430931e3c19ed38f6b27b73850005489a77a21aedfe015302206e1166ecf7bb94cb49cfbd43d46cda842df43b29b648d8fef12dd7ba2f3ef88f",
-    },
-    "0xafccb724e3aec1657fc9514e3e53a0e71e80622d": {
-        "ticker": "VKA",
-        "signature": "30440220176e4a467b7bc2bdd19e523e09cf090f2e499fdbc22e0975fa19032ed845da020220146fe29938e0594546bbf42493a0daa55ab0e6b71de763eda8fb421a2049b871",
-    },
-    "0x9b06f3c5de42d4623d7a2bd940ec735103c68a76": {
-        "ticker": "VOLTA",
-        "signature": "3045022100ab2230a8c8c899fb20031c4b4c149db2696d5dbf9c05277ddd3a29de73c966850220318895f9ea9bde36843e4079cdff422ae25fce79adcf5edfd419634a637e57fe",
-    },
-    "0x2ed14d1788dfb780fd216706096aed018514eccd": {
-        "ticker": "VOX",
-        "signature": "304402207c138865d12481eb64082f6146873d15454cf0890d05bd4ff44b96e353d5653e02200f7081d3a536a868a46aea0d43fb7e6356631a54bf0934559c97f8f7f35a4734",
-    },
-    "0xaf20f5f19698f1d19351028cd7103b63d30de7d7": {
-        "ticker": "WAGMI",
-        "signature": "3045022100c7f5939f7ccec65ef54555828d9bea4c5e4ee6b18feb75f541594627e84cbb690220159e5056f8be122c053a112775928337a1347afd9a464c5118a96b0959e9a03b",
-    },
-    "0xdc1bb8018e711f71293a6edfb5c148187008ebdc": {
-        "ticker": "WALC",
-        "signature": "304402200988d5a71e25a10a2fbdbbcec612a29e14153916d41c4a6dff8ec9f29bdf2ee90220584a44a4314d8144529b217e93668bda9eba8888d70c74bcc36e2be79976c570",
-    },
-    "0xef04804e1e474d3f9b73184d7ef5d786f3fce930": {
-        "ticker": "WSG",
-        "signature": "3044022054736fbb447ebe844b1657e289e734ea0d7710b3ced070314e000ecfaba3cfdb02202678c3777185b3ec910935737bd83d56a1d1c7276a424c01362208b29b3fb413",
-    },
-    "0x1f6e4b5ffc94cca08cf6bb1479148d6329d4baf5": {
-        "ticker": "WAR",
-        "signature": "3045022100fe79b19d1849c782cbb1a270e1fb0dcc5781ec035bdc31339cddefbae66e6d9c022038b8bfd885435d9a1eb1d30539861bdca12f888285d8dda678121fbe49452e9a",
-    },
-    "0xf7693c6fd9a7172d537fa75d133d309501cbd657": {
-        "ticker": "W3N",
-        "signature": "304402203b5f6b45d5a2b9d9a636c3aecc6f6d5a76a5194a515e8c81174b0a02dadc008302200aa39bf9ba810ed6457c2a78b561406e8dee45ac5933adc9e14f747dfbf73602",
-    },
-    "0xffa188493c15dfaf2c206c97d8633377847b6a52": {
-        "ticker": "WEFI",
-        "signature": "304402206319cd433275fc08bbe57c816d17656e4f0bba38a750cec79483817e69cadd02022011a9673ba5adbe785a83a6c2b2f2978bed16007cc045a275265143d44e063bcf",
-    },
-    "0x771146816a0c7d74daf652252d646ab0bff7c21a": {
-        "ticker": "WHEAT",
-        "signature": "304402206e18df2780787ea48780f0f3913265c9a0304ad7da0d1ee29ca80f006b5e69a002207fa94afaaeb9dd64ca7abf6ae7a12d830456dd5e822ee3625492ca46c4edc919",
-    },
-    "0xef261714f7e5ba6b86f4780eb6e3bf26b10729cf": {
-        "ticker": "LOTUS",
-        "signature": "304402203fc823b14be1fa40cbc52370743e8385f3ee956f31d055d5b0be363010c3f334022032970044d0cfcf136b39c6ee5d513874e5c22beed385e1cf4ad4ca2322e84b47",
-    },
-    "0xad4b9c1fbf4923061814dd9d5732eb703faa53d4": {
-        "ticker": "WNT",
-        "signature": "3045022100a1e84db7d4f97c7d6c56dbf18d7f3606df322e4020081df749b0cfe0915f5370022009d6eceeffc5af06000daf7e63745e6cb4e27c21185a4b4f4f9a557e616b8fe6",
-    },
-    "0xd77b108d4f6cefaa0cae9506a934e825becca46e": {
-        "ticker": "WINR",
-        "signature": "3045022100ee0cf325ebda93e00c00bddbc9162d6eb63ca9c589a63691e15353c33594a94d0220518111e71c06f591f1a0c98ba82bc68a0ad88f457ea01a4c671ac0f42e39cfac",
-    },
-    "0x9c46e1b70d447b770dbfc8d450543a431af6df3a": {
-        "ticker": "USFR.D",
-        "signature": "3044022003319bc4788379a78277854b7669d30ae3f77b95e178f5c456346a93e0bb4fa00220725feddd8b426e54757ac76e3e6be08d3c5b684ffa36eaaab11e45e23297f170",
-    },
-    "0x7b5eb3940021ec0e8e463d5dbb4b7b09a89ddf96": {
-        "ticker": "WOM",
-        "signature": "3045022100c0727c4de2023218017a24dc435cbd80f38279051cb8fdcc34c36b182c6c9fae02207317bfa4757ff4a4a035b906f3b39b01ec4d7a341223cd4cdfa37458b64511b1",
-    },
-    "0x5190f06eacefa2c552dc6bd5e763b81c73293293": {
-        "ticker": "WMX",
-        "signature": "3044022020484ab000d25707eea11a8d93f8038dc12fd69e4fac19b8e6ee28a41680522402200a203de6a3b0402eae6e8ce5188b70d7dc45dba2626a1ccc312f5cba04f74a87",
-    },
-    "0x42972edecd94bdd19a622a6a419bdded2de56e08": {
-        "ticker": "AFX",
-        "signature": "3045022100cd082ee46f9e810098ca630ca3c66d1cd51420532681503f393bef1c1e6cfa8b0220733edf0fcce43e139b966cef80614199fa5b4535ecd390b4491b6dda40ee0b7e",
-    },
-    "0xcafcd85d8ca7ad1e1c6f82f651fa15e33aefd07b": {
-        "ticker": "WOO",
-        "signature": "3045022100da21e8e235e5e603951e6c5a919eb90bbb22d7b9735ae67cd9c68d29e99e12c00220796c81f6ae9b438af74ed00103d1fde5bb3ef020a7f5a974f5303a744b066609",
-    },
-    "0xddd6ebd74684318fa912084a41a01f11b6c277f7": {
-        "ticker": "WRT",
-        "signature": "3044022004d15c20f52db296b7d8fea553789676189416d9b552814056cf9bff82da1cb5022029b8b200f7af7b938b6484e559ae85a4b7fc08a533d528677246dba6c7c20f7a",
-    },
-    "0xb0ffa8000886e57f86dd5264b9582b2ad87b2b91": {
-        "ticker": "W",
-        "signature": "3045022100ecd1dbb6c9cce3d4b66b74db10df94b418050f3e9f5fe9cbcb149d48ecad8c6402200f709e3f9ff358ee8c1334f0faccb4397e9a9833a8115aa9087b524a59119a1c",
-    },
-    "0xe20b9e246db5a0d21bf9209e4858bc9a3ff7a034": {
-        "ticker": "WBAN",
-        "signature": "3044022021358941f17cc57f233a3f9497efa7316d8f24f135c993b4a417d4b8f3733af902207446ad46b78633608942e0b1403a61b87dda589dfe60981a53169ab1969c9214",
-    },
-    "0x2f2a2543b76a4166549f7aab2e75bef0aefc5b0f": {
-        "ticker": "WBTC",
-        "signature": "3045022100849bfa49d4a67d85c36f9a628d0fb0a5faff869da00caa58f563d8859420850102201c27dbbbac2f602b6f9f9e34ec629823ed151cd26cee6ec26cdf05bfd09c146c",
-    },
-    "0x35751007a407ca6feffe80b3cb397736d2cf4dbe": {
-        "ticker": "WEETH",
-        "signature": "3044022076eb96bc073b613906302ad57723d658164f619d9f90df14e7099babed9b8e76022077f73123bef697cc78445443209c1e0d83665dce17db34cc6fb062b86e930738",
-    },
-    "0x82af49447d8a07e3bd95bd0d56f35241523fbab1": {
-        "ticker": "WETH",
-        "signature": "30450221008f9b6557d2c481eb97cf2e34779a3e0ba5cee142b92ce259e80709d7f2c3c59c022035573a9bb0a202d047dbe09b9816328f86b8d97dc319b3bc61f3470d6bf857a6",
-    },
-    "0xb5e0cfe1b4db501ac003b740665bf43192cc7853": {
-        "ticker": "WGHOST",
-        "signature": "3045022100bb0ac8bf49e860d90c90661aeed7f73fbce22ce0cd7232f8cf2d9d9282f1573e02203fbefafb4276270de01dc121bc026d4d5d9f577ad4ddfff42e6c42d38b958f1e",
-    },
-    "0x5979d7b546e38e414f7e9822514be443a4800529": {
-        "ticker": "WSTETH",
-        "signature": "304402202bcb8c785fc1a414e2936738dc12b04768621fb9c6a0023b0bd6a8da3bdd57bd02207baa09e2d61c3d57398c295115451e519ac179e1d769e4b8099f7ef83008295a",
-    },
-    "0xecf2adaff1de8a512f6e8bfe67a2c836edb25da3": {
-        "ticker": "WMEMO",
-        "signature": "30450221009f42daddd060020f5762b2cb8b60d4a441fec26a6e1149fc5ae42b04a4078ea702205edcbdcfffbab56654513164fa3c82c0e8b01ea7131e8ac4f222065a7ddc5e1c",
-    },
-    "0xd8724322f44e5c58d7a815f542036fb17dbbf839": {
-        "ticker": "WOETH",
-        "signature": "30450221009ba4cf78f53ecdc55e6f03757d0f4b67cbba757f5ceb7a63ab8839bb4c26b46d02202024506d952da8916bc5003aa08ba2b6cc6db4069a1d03548552789527391168",
-    },
-    "0x3106e2e148525b3db36795b04691d444c24972fb": {
-        "ticker": "WSTLINK",
-        "signature": "30440220697f14f2e244781aae0739e6ea43c3f546960c04fa7b166cbd092ce3cc11926e02206627f785e65ac733e7db6a6060d9d208672449ac9927813fe01a7d976eb3b4f6",
-    },
-    "0x9483ab65847a447e36d21af1cab8c87e9712ff93": {
-        "ticker": "WUSDR",
-        "signature": "30440220136ed9d6dfa80fcee9ce80834e513677ee4dff080697b2204de240d251407ad5022018d278223fac74885e4a74681e0dc40a5d45fa529e1dbfd91090ccc534134958",
-    },
-    "0x377c6e37633e390aef9afb4f5e0b16689351eed4": {
-        "ticker": "WZYX",
-        "signature": "3044022067f2ce1e6fc1653ec1b11bd802ff4b2bd5daa06c105d2a19b212b9eee90e8935022014a5f7ae49193eb7f7f9f2964814d8b69b129716976a20609815680223fd0823",
-    },
-    "0x50aa7a13b28eea97dc6c3f5e8aaa7fe512e7306d": {
-        "ticker": "XB",
-        "signature": "304402201d47b45550a40b25bfa45a22fb6b561d6f923694b4a424924f3320f28bf1b364022047cadc931e683d668202e7788cb9e4f8b4ff37fc3518ee21d3061bfaaf1da1b1",
-    },
-    "0x9c7049d2ddbda7df5da9a9069926f517d2d9e6ff": {
-        "ticker": "XTS",
-        "signature": "3045022100a7b12a0725cedacf423053a4351f7ba3eea2b9ca8b05f8544bd498d189d8b26a02203e274fa9053a2758895eeee9a1a6ffcea4215664c0f64bc8c6cd1f41538ebbc3",
-    },
-    "0x4cb9a7ae498cedcbb5eae9f25736ae7d428c9d66": {
-        "ticker": "XAI",
-        "signature": "3045022100b3fc7e1a69af554a8294db5b162290af1bb2732f14b9c83d04b64b6322206d2502207200319201caab2bef5bd08c48aa2dada5f5a0b4eb05153a7a2e34e04b4c78fd",
-    },
-    "0x71eeba415a523f5c952cc2f06361d5443545ad28": {
-        "ticker": "XDAO",
-        "signature": "3045022100df387d054c212b6bb2d0b6c736a390775f588bb116ae952bb29f13af44b6926b02202256a081a00c9a74d2d8042dda3d42e330542e31ee1b75a181d152c4f2740aab",
-    },
-    "0x180f7cf38805d1be95c7632f653e26b0838e2969": {
-        "ticker": "XDEFI",
-        "signature": "3044022016131dd5c447bc7ebb45f4e61a534af3bd755340f4c503589db9e5b8a42e78ff0220348fbfb5b998eacce357c52bf8e40ff29a410824e826994c7541c69fe147d922",
-    },
-    "0x3509f19581afedeff07c53592bc0ca84e4855475": {
-        "ticker": "XUSD",
-        "signature": "3045022100947c4e01830bce52cab0400f3e1f667cdd514c54689429c79335b84da1c646a402207c0276cff91b06a6cbb74714bd690492e7815d08562ad37aef557792f1f2dd8c",
-    },
-    "0x3096e7bfd0878cc65be71f8899bc4cfb57187ba3": {
-        "ticker": "RWA",
-        "signature": "304402204dc26b162edc708080b12892dfdd756b8a472cd299e0b86205ad1e44da4148db022074e9e8e821747c2bafd8e272424be5d9b2ed8cdc4b74e1a523c8291dc76ee66a",
-    },
-    "0x86d80fbb0701dd500767b7bc3af72d002eb5de77": {
-        "ticker": "XFISH",
-        "signature": "30440220528ed21d0b772d68c6a68497d55871a1c0a66c6577f3f2697cfb953de16b48f502204d4763dcaa6e8e61f0f080374b529a31e6be0c62a3087257664b91da54e25d21",
-    },
-    "0xce3a75572bc375476438206f6f29f46f8466ecc2": {
-        "ticker": "XLSD",
-        "signature": "304402203835e791fb49fd17a4d92df563d70c492f832eaeb4fa0e2c5ea78b745818268702207935172e5b0211dc2d39decaa91d41d55c8081960e23460eb16629edce7f8506",
-    },
-    "0xc84fae1141b92fa5bf847276828f69caf651cb7f": {
-        "ticker": "XNF",
-        "signature": "304402204765ee90a1fce12aeebc69274cffd34ff3f272eeab2917fa44e7c4d258c5766402204e8a68cd46bec3bab610953c230f87b3b7b6987b0a8aa5693b00d5a722467c0e",
-    },
-    "0x00cbcf7b3d37844e44b888bc747bdd75fcf4e555": {
-        "ticker": "XPET",
-        "signature": "304402202157e2c50d49cb6412818a88f7118bcb9ce5e7ac8566301302ac6018e08069b80220536ddccfd3ccedb33fe4efaa62a096b566d06685734068692b5a6b6043d93ff4",
-    },
-    "0x617b76412bd9f3f80fe87d1533dc7017defa8ad1": {
-        "ticker": "XRAI",
-        "signature": "304402202b10038e3fd6322f0b6bf377f94de20e2c88f3a13819dc47f574aae7057e1ec202205e90ee799481d4de7ddfe7b9467b58d84a2c5765b679c42d54be462fa8a8b50e",
-    },
-    "0x1e3c6c53f9f60bf8aae0d7774c21fa6b1afddc57": {
-        "ticker": "XSHRAP",
-        "signature": "3045022100d4418366b7037ef82989df850c94f12e5b733f4d226d21772bb6d6fa3c1ea016022058344a50aa13caa38d7cf33cfa47ba8fc852820aa69fd7b746ab2e1137bd10d3",
-    },
-    "0xf0a5717ec0883ee56438932b0fe4a20822735fba": {
-        "ticker": "XTK",
-        "signature": "30440220384dfbfe73cf5cd1f78fb7785d0a306dd6f03a6ab606e7f886da4bb0e0ca5769022013db2ebc6ad53dcbab9b7b8f51b9a3cd64f097de34171f645ac6da4dfe8c3297",
-    },
-    "0xeb4d25db65dcef52380c99ba7e1344c820ecb1fc": {
-        "ticker": "XWG",
-        "signature": "3045022100ccb500a631b7fa2eaeeb0c1f7c5936d9b197a1332e1c95729b229d8d06169526022062836e27939f881773d87842ec4cba1b3f874e8cd802841ad040c018d65a561a",
-    },
-    "0x65c936f008bc34fe819bce9fa5afd9dc2d49977f": {
-        "ticker": "Y2K",
-        "signature": "304402203c8d833d472d8c7b3441b685abe5845d07aad0e8b689a009589174ffc903071c0220576a9c0d8449a87162b38061d8ce6f3554624334200a989458f66003a25836cf",
-    },
-    "0xde70aed3d14d39b4955147efcf272334bdb75ab5": {
-        "ticker": "YACHT",
-        "signature": "3045022100e21d6ca9e1014aea45c2e0f7251f0d7dfadcc8f75bcf3a9c6d1165636638f289022052851b399786e3377841d1b4c826819c84d87d2c1e816b00306f0b1f47afca90",
-    },
-    "0xb50a8e92cb9782c9b8f3c88e4ee8a1d0aa2221d7": {
-        "ticker": "YAKS",
-        "signature": "30450221009173fa2c895d26c160a413f1f122b56d00f0a60e1ef1238647eddeb5477174ce022037b839d3e24651361588bb21d71606fc45b28c742b82d410f38307cf03835e3c",
-    },
-    "0x7f4db37d7beb31f445307782bc3da0f18df13696": {
-        "ticker": "YAK",
-        "signature": "304402206a6b60ea4cc50f0f7132ee5a0e11f4397857acc7b180f97320e246b25ed0cc24022003dc2d47b6515dcf2e3ecfb69de9cdd4e6fcc09445d6d16ca0057a373c8f3999",
-    },
-    "0x82e3a8f066a6989666b031d916c43672085b1582": {
-        "ticker": "YFI",
-        "signature": "304402205e5ad6b14059a9a238365631854e1f673cad4cc48d0c0b6448b7926185e538790220472ed7e2f861d4ef53c061079d93f03ba164d350c40b30b0ab9cd63f3725db02",
-    },
-    "0xf061956612b3dc79fd285d3d51bc128f2ea87740": {
-        "ticker": "YF-DAI",
-        "signature": "3044022062b407342115a6806cc6d42b131800b428ac07933f0e0f528651f9ec3865a61602202226eca4f51ff724ffae02b1b37fb34f7a5409d86e56b8238e6a378c81b7a754",
-    },
-    "0xaae0c3856e665ff9b3e2872b6d75939d810b7e40": {
-        "ticker": "YFX",
-        "signature": "304502210091063f5b39a67bbf5781cbe0363f54ccfc7a7f4dd6a4fe712b4497b8523470ee02207728b74d3da0c26bca418c4d01134a02183e968b39394804538d99c5d060ae82",
-    },
-    "0x30dcba0405004cf124045793e1933c798af9e66a": {
-        "ticker": "YDF",
-        "signature": "3045022100da998df345825797199f89ba113c1c28b30919c1861313843f65417fcd00311402206ac5affd950d739b4b1c06cfa19be782c6481c728515de3fc8d13b8fc9882997",
-    },
-    "0x2fac624899a844e0628bfdcc70efcd25f6e90b95": {
-        "ticker": "YOU",
-        "signature": "304402202f97367534e3cd26b58928823c04b6e0bc21e82f398416411ae1b7bdb8d5ad54022049a66cc341c184af80a8779ed6f9acf25bc0f15f2d4463ac3776180b4bb5553d",
-    },
-    "0xf5db7c04bcec3bea25bd4fdc501cff0864f726e7": {
-        "ticker": "YSL",
-        "signature": "3044022015230ffafd86dd506ac7282f745031cf9884d1014afba9ea1348f9dc836dcdd60220311178cb5a3865aae04ba2a897299058dc908556319a2dc3a59d4b7283a4022d",
-    },
-    "0x077bc655c8d81b7de71c79318d0eb8f987e12820": {
-        "ticker": "YURI",
-        "signature": "3044022068a1603b150275e81d90897675b968fb09e08892327ee45703925798da07bb5502202b8466a7c9c811aabf806b80fb530d624cf40fc3c72387b9c4f508a6c2ae0f49",
-    },
-    "0x6e4cc0ab2b4d2edafa6723cfa1582229f1dd1be1": {
-        "ticker": "ZUSD",
-        "signature": "304402207c3054579047bf18236eca90023213138ef6ffce05c6470e4b20d1765b1c20a0022021a11d8d5a041e2f62a1b0719c8f41d546d2072ae46aca6922aac9bea50e2d04",
-    },
-    "0xa6099b214e8d069911702bc92ef274f63c476c5a": {
-        "ticker": "ZENF",
-        "signature": "3044022001d2273b10fcf265e963fb1bd31fedcd1ae0b2c4df2c0c712df6a8e8dc21a5e4022052f4ab514df847d2fa46af32b4fc48b84f9aac3d9ed452ae089db1fc15b691ee",
-    },
-    "0xb2dcbd5258a22385240e4ac13fc6726b66f0de96": {
-        "ticker": "ZSP",
-        "signature": "3045022100bf6e848837b0b0d57ff4d4f6c53e604ee72dd6c2d45bc9e386bd3537944ebdd30220764fa7a274d6a76c34e98e2e2518a80354693ce3f70f00794d69a102f7f5eb14",
-    },
-    "0xee0b14e8fc86691cf6ee42b9954985b4cf968534": {
-        "ticker": "ZPC",
-        "signature": "304302201e5a6cca2b70237ddf8d285d972917534fbef3e2de4292f85e31a743f1f9d8d9021f037ee9bc3dfc7c4996ab7bf0461115979e16fefd2c25fa3fee58d1c90fe25d",
-    },
-    "0x45d780cfe839b8a8f292c9e26aa5d1805bc536dc": {
-        "ticker": "ZOCI",
-        "signature": "30450221008b55e82043f3e33bb2cc977471f401a05a8043e4fd3d95939c358b29fa4e7f7b0220740b321fa35474f34dce7527e48c245059cea29e94797aee43940b5b43577d19",
-    },
-    "0x1689a6e1f09658ff37d0bb131514e701045876da": {
-        "ticker": "ZOO",
-        "signature": "3044022032ef1fd8daa6a6a0a23e24151385021efa350afeefa770b11d7d8e22f9e0df79022001742f9e21563ecc22d9d10b5520357825dd25badba615679ebed2721880668e",
-    },
-    "0x1c43d05be7e5b54d506e3ddb6f0305e8a66cd04e": {
-        "ticker": "ZTX",
-        "signature": "3045022100a05a6b828fb3feb3a26902264e1e86027d086d8253adbe02fe88839de74d45530220408aad7bf622b1937808f8249107751c91bb4b0ff5266e5aa5d01285d14ba713",
-    },
-    "0x3b475f6f2f41853706afc9fa6a6b8c5df1a2724c": {
-        "ticker": "ZYB",
-        "signature": "3045022100ba85db0295ecbaace2deecd24462c7b323d3597723555dc49114a1cb594536d2022009945ce6004988ec90ffe6b9ebe6411f9848a5f39c3b1738d13e5ba8b0979ea7",
-    },
-    "0x7a2c1b8e26c48a5b73816b7ec826fd4053f5f34b": {
-        "ticker": "ZZZ",
-        "signature": "3045022100a16747e0951b4fa374100d827c882c1f73a209e52dac63bc1742340e4c948134022068988870165ceead3ddd88f6120fc1d97c5d9be3978e8d91de6d11073f5d7857",
-    },
-}
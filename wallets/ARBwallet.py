@@ -17,7 +17,10 @@
 
 from copy import deepcopy
 from wallets.ETHwallet import ETH_wallet
-from wallets.ARBtokens import tokens_values, nfts_values, ledger_tokens
+from wallets.token_registry import TokenRegistry
+
+
+tokens_registry = TokenRegistry("ARB")
 
 
 class ARB_wallet(ETH_wallet):
@@ -37,8 +40,8 @@ class ARB_wallet(ETH_wallet):
     ]
 
     options_data = deepcopy(ETH_wallet.options_data)
-    options_data[0]["preset"] = tokens_values
-    options_data[2]["preset"] = nfts_values
+    options_data[0]["preset"] = tokens_registry.tokens_values
+    options_data[2]["preset"] = tokens_registry.nfts_values
 
     def __init__(
         self, network, wtype, device, contract_addr=None, wc_uri=None, confirm_callback=None
@@ -48,4 +51,4 @@ class ARB_wallet(ETH_wallet):
         rpc_endpoint = "https://rpc.ankr.com/arbitrum/"
         self.explorer = "https://arbiscan.io/address/0x"
         self.load_base(rpc_endpoint, device, contract_addr, wc_uri, confirm_callback, wtype != 3)
-        self.ledger_tokens = ledger_tokens
+        self.ledger_tokens = tokens_registry.ledger_tokens
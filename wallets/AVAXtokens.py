@@ -1,2257 +0,0 @@
-# Uniblow ERC20 list for Avaxc generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "Tether USD (USDT.e)": "0xc7198437980c041c805A1EDcbA50c1Ce5db95118",
-        "TetherToken (USDt)": "0x9702230A8Ea53601f5cD2dc00fDBc13d4dF4A8c7",
-        "USD Coin (USDC)": "0xB97EF9Ef8734C71904D8002F8b6Bc66Dd9c48a6E",
-        "USD Coin (USDC.e)": "0xA7D7079b0FEaD91F3e65f86E8915Cb59c1a4C664",
-        "Binance USD (BUSD.e)": "0x19860CCB0A68fd4213aB9D8266F7bBf05A8dDe98",
-        "Binance-Peg BUSD Token (BUSD)": "0x9C9e5fD8bbc25984B178FdCE6117Defa39d2db39",
-        "Wrapped Ether (WETH.e)": "0x49D5c2BdFfac6CE2BFdB6640F4F80f226bc10bAB",
-        "SHIBA INU (SHIB.e)": "0x02D980A0D7AF3fb7Cf7Df8cB35d9eDBCF355f665",
-        "Wrapped AVAX (WAVAX)": "0xB31f66AA3C1e785363F0875A1B74E27b85FD66c7",
-        "Dai Stablecoin (DAI.e)": "0xd586E7F844cEa2F87f50152665BCbc2C279D8d70",
-        "Uniswap (UNI.e)": "0x8eBAf22B6F053dFFeaf46f4Dd9eFA95D89ba8580",
-        "Chainlink Token (LINK.e)": "0x5947BB275c521040051D82396192181b413227A3",
-        "Wrapped BTC (WBTC.e)": "0x50b7545627a5162F82A992c33b87aDc75187B218",
-        "Graph Token (GRT.e)": "0x8a0cAc13c7da965a312f08ea4229c37869e85cB9",
-        "TrueUSD (TUSD)": "0x1C20E891Bab6b1727d14Da358FAe2984Ed9B59EB",
-        "Aave Token (AAVE.e)": "0x63a72806098Bd3D9520cC43356dD78afe5D386D9",
-        "Frax (FRAX)": "0xD24C2Ad096400B6FBcd2ad8B24E7acBc21A1da64",
-        "Frax Share (FXS)": "0x214DB107654fF987AD859F34125307783fC8e387",
-        "Maker (MKR.e)": "0x88128fd4b259552A9A1D457f435a6527AAb72d42",
-        "Curve DAO Token (CRV.e)": "0x249848BeCA43aC405b8102Ec90Dd5F22CA513c06",
-        "Decentralized USD (USDD)": "0xcf799767d366d789e8B446981C2D578E241fa25c",
-        "Synthetix Network Token (SNX.e)": "0xBeC243C995409E6520D7C41E404da5dEba4b209B",
-        "1INCH Token (1INCH.e)": "0xd501281565bf7789224523144Fe5D98e8B28f267",
-        "Basic Attention Token (BAT.e)": "0x98443B96EA4b0858FDF3219Cd13e98C7A4690588",
-        "yearn.finance (YFI.e)": "0x9eAaC1B23d935365bD7b542Fe22cEEe2922f52dc",
-        "Compound (COMP.e)": "0xc3048E19E76CB9a3Aa9d77D8C03c29Fc906e2437",
-        "SushiToken (SUSHI.e)": "0x37B608519F91f70F2EeB0e5Ed9AF4061722e4F76",
-        "ZRX (ZRX.e)": "0x596fA47043f99A4e0F122243B841E55375cdE0d2",
-        "Anyswap (ANY)": "0xB44a9B6905aF7c801311e8F4E76932ee959c663C",
-        "Synapse (SYN)": "0x1f1E7c893855525b303f99bDF5c3c05Be09ca251",
-        "StargateToken (STG)": "0x2F6F07CDcf3588944Bf4C42aC74ff24bF56e7590",
-        "Bitcoin (BTC.b)": "0x152b9d0FdC40C096757F570A51E494bd4b943E50",
-        "UMA Voting Token v1 (UMA.e)": "0x3Bd2B1c7ED8D396dbb98DED3aEbb41350a5b2339",
-        "Kyber Network Crystal v2 (KNC)": "0x39fC9e94Caeacb435842FADeDeCB783589F50f5f",
-        "AlphaToken (ALPHA.e)": "0x2147EFFF675e4A4eE1C2f918d181cDBd7a8E208f",
-        "Orbs (ORBS)": "0x340fE1D898ECCAad394e2ba0fC1F93d27c7b717A",
-        "Spell Token (SPELL)": "0xCE1bFFBD5374Dac86a2893119683F4911a2F7814",
-        "JoeBar (xJOE)": "0x57319d41F71E81F3c65F2a47CA4e001EbAFd4F33",
-        "JoeToken (JOE)": "0x6e84a6216eA6dACC71eE8E6b0a5B7322EEbC0fDd",
-        "BOBA Token (BOBA)": "0x3cD790449CF7D187a143d4Bd7F4654d4f2403e02",
-        "inSure (SURE)": "0x5fC17416925789E0852FBFcd81c490ca4abc51F9",
-        "TrustSwap Token (SWAP.e)": "0xc7B5D72C836e718cDA8888eaf03707fAef675079",
-        "Pendle (PENDLE)": "0xfB98B335551a418cD0737375a2ea0ded62Ea213b",
-        "BENQI (QI)": "0x8729438EB15e2C8B576fCc6AeCdA6A148776C0F5",
-        "beefy.finance (BIFI)": "0xd6070ae98b8069de6B494332d1A1a81B6179D960",
-        "Ethereum Meta (ETHM)": "0x55b1a124c04A54eeFDEFE5FA2Ef5f852FB5f2f26",
-        "USD+ (USD+)": "0xe80772Eaf6e2E18B651F160Bc9158b2A5caFCA65",
-        "UniCrypt (UNCX)": "0x3b9e3b5c616A1A038fDc190758Bbe9BAB6C7A857",
-        "OpenOcean (OOE)": "0x0ebd9537A25f56713E34c45b38F421A1e7191469",
-        "EverRise (RISE)": "0xC17c30e98541188614dF99239cABD40280810cA3",
-        "Jade Protocol (JADE)": "0x80B010450fDAf6a3f8dF033Ee296E92751D603B3",
-        "sJADE (sJADE)": "0x3D9eAB723df76808bB84c05b20De27A2e69EF293",
-        "Wirex Token (WXT)": "0xfcDe4A87b8b6FA58326BB462882f1778158B02F1",
-        "Pangolin (PNG)": "0x60781C2586D68229fde47564546784ab3fACA982",
-        "Ferrum Network Token (FRM)": "0xE5CAeF4Af8780E59Df925470b050Fb23C43CA68C",
-        "Rai Reflex Index (RAI)": "0x97Cd1CFE2ed5712660bb6c14053C0EcB031Bff7d",
-        "DeFiYieldProtocol (DYP)": "0x961C8c0B1aaD0c0b10a51FeF6a867E3091BCef17",
-        "TOMB (TOMB)": "0xb84527D59b6Ecb96F433029ECc890D4492C5dCe1",
-        "Colony Token (CLY)": "0xec3492a2508DDf4FDc0cD76F31f340b30d1793e6",
-        "Avalanche INSUR Token (INSUR)": "0x544c42fBB96B39B21DF61cf322b5EDC285EE7429",
-        "TSHARE (TSHARE)": "0xda5B232FB6e3E897d2f84797D19c53Cf3f5ae938",
-        "ZooToken (ZOO)": "0x1B88D7aD51626044Ec62eF9803EA264DA4442F32",
-        "Parez (PRX)": "0x08287930ca952673B02D3B70eEc2893Dd7846743",
-        "ROCO (ROCO)": "0xb2a85C5ECea99187A977aC34303b80AcbDdFa208",
-        "OddzToken (ODDZ)": "0xB0a6e056B587D0a85640b39b1cB44086F7a26A1E",
-        "BetSwirl Token (BETS)": "0xc763f8570A48c4c00C80B76107cbE744dDa67b79",
-        "Elk (ELK)": "0xE1C110E1B1b4A1deD0cAf3E42BfBdbB7b5d7cE1C",
-        "NFTrade Token [via ChainPort.io] (NFTD)": "0x9E3Ca00f2d4A9E5d4f0add0900de5f15050812cF",
-        "UNCL (UNCL)": "0x7D86F1eafF29F076576b2Ff09CE3bcC7533fD2C5",
-        "ROOBEE (ROOBEE)": "0x4036f3d9c45a20f44f0b8B85dD6CA33005fF9654",
-        "Arable Protocol (ACRE)": "0x00EE200Df31b869a321B10400Da10b561F3ee60d",
-        "Kalao Token (KLO)": "0xb27c8941a7Df8958A1778c0259f76D1F8B711C35",
-        "SHIBAVAX (SHIBX)": "0x440aBbf18c54b2782A4917b80a1746d3A2c2Cce1",
-        "GhostMarket Token (GM)": "0x0B53b5dA7d0F275C31a6A182622bDF02474aF253",
-        "Spore (SPORE)": "0x6e7f5C0b9f4432716bDd0a77a3601291b9D9e985",
-        "VersoToken (VSO)": "0x846D50248BAf8b7ceAA9d9B53BFd12d7D7FBB25a",
-        "Imperium Empires Token (IME)": "0xF891214fdcF9cDaa5fdC42369eE4F27F226AdaD6",
-        "More Token (MORE)": "0xd9D90f882CDdD6063959A9d837B05Cb748718A05",
-        "DeFiato [via ChainPort.io] (DFIAT)": "0xAfE3d2A31231230875DEe1fa1eEF14a412443d22",
-        "Treasure Under Sea (TUS)": "0xf693248F96Fe03422FEa95aC0aFbBBc4a8FdD172",
-        "Wrapped AllianceBlock Token (WALBT)": "0x9E037dE681CaFA6E661e6108eD9c2bd1AA567Ecd",
-        "Atlantis Loans (ATL)": "0x90fBE9dfe76F6EF971c7A297641dfa397099a13e",
-        "iDeFiYieldProtocol (iDYP)": "0xBD100d061E120b2c67A24453CF6368E63f1Be056",
-        "NitroNetwork (ncash)": "0xc69Eba65e87889f0805dB717Af06797055A0BA07",
-        "WOWswap (WOW)": "0xA384Bc7Cdc0A93e686da9E7B8C0807cD040F4E0b",
-        "Chronicum (CHRO)": "0xbf1230bb63bfD7F5D628AB7B543Bcefa8a24B81B",
-        "Snowball (SNOB)": "0xC38f41A296A4493Ff429F1238e030924A1542e50",
-        "Defrost Finance Token (MELT)": "0x47EB6F7525C1aA999FBC9ee92715F5231eB1241D",
-        "Boo Finance Token (BOOFI)": "0xB00F1ad977a949a3CCc389Ca1D1282A2946963b0",
-        "LessToken (LESS)": "0x4a4f77d74cf5Fd4ea4AB71Ba79988c055A5C27b2",
-        "PolyGaj Token (GAJ)": "0x595c8481c48894771CE8FaDE54ac6Bf59093F9E8",
-        "HERMES (HERMES)": "0xB15f02F9Da8CD1f99E9dd375F21dc96D25ddd82C",
-        "Avaxtars Token (AVXT)": "0x397bBd6A0E41bdF4C3F971731E180Db8Ad06eBc1",
-        "Blizzard (BLIZZ)": "0xB147656604217a03Fe2c73c4838770DF8d9D21B8",
-        "Governance OHM (gOHM)": "0x321E7092a180BB43555132ec53AaA65a5bF84251",
-        "Yak Token (YAK)": "0x59414b3089ce2AF0010e7523Dea7E2b35d776ec7",
-        "YieldYak gAVAX (yyAVAX)": "0xF7D9281e8e363584973F946201b82ba72C965D27",
-        "Time (TIME)": "0xb54f16fB19478766A268F172C9480f8da1a7c9C3",
-        "Ankr Avalanche Reward Earning Bond (aAVAXb)": "0x6C6f910A79639dcC94b4feEF59Ff507c2E843929",
-    },
-    # Testnet
-    {
-        "USD Coin (USDC)": "0x5425890298aed601595a70ab815c96711a31bc65",
-        "EUR Coin (EURC)": "0x5e44db7996c682e92a960b65ac713a54ad815c6b",
-    },
-]
-
-
-nfts_values = [
-    # Mainnet
-    {},
-    # Testnet
-    {},
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/43114/erc20.json
-ledger_tokens = {
-    "0x596fa47043f99a4e0f122243b841e55375cde0d2": {
-        "ticker": "ZRX_E",
-        "signature": "304402205c1fcfbfe0a252dcd28dcb34cc3fce13d6487ab84993dfc6181b232423d1bc4e0220640026557ecdd385840bf19a75787796a16adc5d8f48ea2a95eec3ed76b1f553",
-    },
-    "0xe54eb2c3009fa411bf24fb017f9725b973ce36f0": {
-        "ticker": "1INCH",
-        "signature": "3045022100e18a36046b24ad526a3592f5aa1ce737d89f1bfcae76fc8bf56ec98f68da4b810220231077e50c47dbf163c00be0c0192b84560b73893e1747b5fad7d25fc4abe415",
-    },
-    "0xd501281565bf7789224523144fe5d98e8b28f267": {
-        "ticker": "1INCH_E",
-        "signature": "3044022009162ac131072ca2beb5dc936c99cfe919c29465458fe0cdd90838c151f16dc802200d8a4bee7c38e91216c8cd407e9a40059abb1f7b9f0bd83551686a814b070e93",
-    },
-    "0x9767203e89dcd34851240b3919d4900d3e5069f1": {
-        "ticker": "A4",
-        "signature": "30440220749a6c557cf95c6e3e054355ef889ed9b1e45e814322496aeb26982ca081255f022065e0579dad580a21df7eeac1fe9cec3e414cf7782020d464c8bb0cc4f4e0c3f3",
-    },
-    "0xf329e36c7bf6e5e86ce2150875a84ce77f477375": {
-        "ticker": "AAVAAAVE",
-        "signature": "3045022100868b45edf74100ed794120a8a3369e114b1c29e4e13941e1570fe6d539f8893d0220245033128c1c7fc69104da779ea126303b3e2232204202cc9a6e2979ea048cc6",
-    },
-    "0x8ffdf2de812095b1d19cb146e4c004587c0a0692": {
-        "ticker": "AAVABTC.B",
-        "signature": "3045022100e59bc16c8dd2b5d921ae4a7f14f474938d5f1225c415ad5e148d179dd16a3bfa022079d1a46d435e543887fd26f1485014d69d13cfc1549202b92aef3e7f32a1da93",
-    },
-    "0x82e64f49ed5ec1bc6e43dad4fc8af9bb3a2312ee": {
-        "ticker": "AAVADAI",
-        "signature": "3044022066e45dba5b524799f7ef87c13218e715415ab0ad7956450eb2ff2de783adf6b50220366f1906fb9aad0d48385c1a6f58127273f2cf3e5b661589fdc4f5aa433c6ddc",
-    },
-    "0xc45a479877e1e9dfe9fcd4056c699575a1045daa": {
-        "ticker": "AAVAFRAX",
-        "signature": "3045022100c5b6443c866154c4620103c54664a1d81201f5211895bc5e0d4544e82a798ffd02204c7437be955b6ee718c801177f2655ba6373861c52f8d84c4e31f8a37f4fba06",
-    },
-    "0x191c10aa4af7c30e871e70c95db0e4eb77237530": {
-        "ticker": "AAVALINK",
-        "signature": "304402201f7ad9d360beea264d0fac0913beb754522c74f6dbee6b3dc910cbb9a01e489902202e25a540229cfa4b4ed8aafb4bdb1b15ecb4964b52ed6b8e6ba528e4b26dd4fb",
-    },
-    "0x8eb270e296023e9d92081fdf967ddd7878724424": {
-        "ticker": "AAVAMAI",
-        "signature": "304402205663003542b05163e8a9d9da4ebcf32c232e3236d182a6cdfebee2f10594b2ef02202b6801d98d0cf6b7bddc8a35f4d87b642d0c84727f66720b07b4334ff2545ca5",
-    },
-    "0x513c7e3a9c69ca3e22550ef58ac1c0088e918fff": {
-        "ticker": "AAVASAVAX",
-        "signature": "30440220494863dc152355e0d91d57af7c79655c6a3f1ff5676f8e83b16210892558ead202200f2b802efdbb9ff573edfeee35f6c08b24949350d48c8a9085f2563f80d0b826",
-    },
-    "0x625e7708f30ca75bfd92586e17077590c60eb4cd": {
-        "ticker": "AAVAUSDC",
-        "signature": "3045022100d45791601900108671cfe00586a8984e451f61c41e46c0a3339f0655705794a402204468d43201d20caf6107da3073f3843d4965938691ea3c0b2f9d76926062b5a9",
-    },
-    "0x6ab707aca953edaefbc4fd23ba73294241490620": {
-        "ticker": "AAVAUSDT",
-        "signature": "3045022100892f3819b676aa344bb78d7062f50a71677cf4f2559eb37ecfa0465cf2108d9a0220084cd84eca50b2f6fe64c39da049ed018eb717694a4cc990c564768e54110cd4",
-    },
-    "0x6d80113e533a2c0fe82eabd35f1875dcea89ea97": {
-        "ticker": "AAVAWAVAX",
-        "signature": "3045022100efceb5531ce28c610bc4990ef71d53a9b2b1dc195c79c76dbeacf9d788d4f29c02207a87d35576c31233834ef43a00a204a3cfdd9c97c808c372ffed4a6fc06e4461",
-    },
-    "0x078f358208685046a11c85e8ad32895ded33a249": {
-        "ticker": "AAVAWBTC",
-        "signature": "3044022033103497579755804556f7b4b839eb778168033c12b0e12a5a6de94d8990de4e022016eb062f6c7bca8c2dfa9a38e4099951585e05d09f53afff0b06290952cc4d57",
-    },
-    "0xe50fa9b3c56ffb159cb0fca61f5c9d750e8128c8": {
-        "ticker": "AAVAWETH",
-        "signature": "3045022100c52707e56b3b4c7c7454ab9103942e4811a9a3081c4fb3e3fd3cf7b2a664d1880220093cae81288fe5b59e67fa3b956878ac96088f2f45c51a96e7b5002325094516",
-    },
-    "0x8ce2dee54bb9921a2ae0a63dbb2df8ed88b91dd9": {
-        "ticker": "AAVE",
-        "signature": "3045022100e244581ddf7c46c136a5d916aeaacc3d84e8420a88d862398aeda02395e563c802206c110495479dbb09d7e91d6d48ed775ad09ba90da0e7dceb36ad6fc136602119",
-    },
-    "0x63a72806098bd3d9520cc43356dd78afe5d386d9": {
-        "ticker": "AAVE_E",
-        "signature": "30440220746642014c946b988dd52f492db4123d54cb0558ff40f180010b53d150deaf1a022074cd085d2ea0c53f8c4726f36efd4670759418200415f5c8e3ebb84a94624711",
-    },
-    "0x8888888888f004100c0353d657be6300587a6ccd": {
-        "ticker": "ACS",
-        "signature": "304402201dd29ba71592a224ff20aeea01f276a8dca183fc14810dbb02e0f2cc890fc61602200680bfc671b83d9aa52be630358d7fdd10db15a9d697412fe6fa6a51e0490b45",
-    },
-    "0x6fefd97f328342a8a840546a55fdcfee7542f9a8": {
-        "ticker": "AGEUR",
-        "signature": "3045022100906b2b01f998c1fca820029ac188a9cc888189df2499581b5b84607fb793cf9402200a4a2dfe800cdce87a1f599e8e07f8ec42d02022f8ca297dcdc50f4404a67681",
-    },
-    "0xcaf5191fc480f43e4df80106c7695eca56e48b18": {
-        "ticker": "AKITA",
-        "signature": "3045022100bf0842da862f1d1ea9a7971b455c5350ede801b342cc5f634d3a2784d7932f1e02204df8b55c815f8a02541b4cabf72db6704725c7feeb16d40349a2d6d82329f7ff",
-    },
-    "0xe06fba763c2104db5027f57f6a5be0a0d86308af": {
-        "ticker": "AKITAX",
-        "signature": "3045022100e3588b7481d12e59cbb0c7430acb8012ffa1fd682b5e789c29f105bd729689ae02204884e4231f540a5f2f8bddfcf843f7c4b6cb097c804c2e37299521551723f656",
-    },
-    "0x431289cb3a2ec0875351e33767e175c816c73b3a": {
-        "ticker": "AFM",
-        "signature": "3045022100d436b6b86eeb6163836425816c54013fd460b481273dc25ec8d6682b2646468202204f37f5f0d471a860497c675309ff32c3e74cd98955d1916df226f221b79c1524",
-    },
-    "0xafc43610c7840b20b90caaf93759be5b54b291c9": {
-        "ticker": "ABR",
-        "signature": "3045022100a3f179448d2b332041945317542fd0012d85b414542a96c8343b20c53a795ccc0220744b5a5069b80941e393660733b79a2f994f3d7af87dc6d6e1b093652a570565",
-    },
-    "0x644192291cc835a93d6330b24ea5f5fedd0eef9e": {
-        "ticker": "NXRA",
-        "signature": "3045022100e09c3c42a721eea9509a933e061f85930b4373f5729d6331fb6f9eb61dd618aa02206cf545b7266887f381ab63206206a0b12cdf47143107dceff0dbb8b29cfb012f",
-    },
-    "0x9c3254bb4f7f6a05a4aaf2cadce592c848d043c1": {
-        "ticker": "ALPHA",
-        "signature": "304402205c49baff3f22b02a908e4694a26e24ba3ba3f15bb74d462249145458f1e4fe360220363d1617e023f7445e0e0bd59252f13df4612a2fe404d674a45d2d087f58cc98",
-    },
-    "0x2147efff675e4a4ee1c2f918d181cdbd7a8e208f": {
-        "ticker": "ALPHA_E",
-        "signature": "3045022100efa1ac908f97f0089af93730bd2193be45fd5e3f3e163e2ca3ee3938d339cfab02204b2a7d6dedff5bcfc836049d030e8efef61e9402c89bbb3fa4a6358c00b3a560",
-    },
-    "0xb648fa7a5f5ed3b3c743140346e3dc3fe94a9125": {
-        "ticker": "AFINS",
-        "signature": "30440220407df15a8f891246ae6a6e0aadb4eff93ae5ae9d48311e707721d51499819ce10220698574346bf3008bd262ad028c145816588d32360061bf9ccdb9129e201d01c0",
-    },
-    "0x8929e9dbd2785e3ba16175e596cdd61520fee0d1": {
-        "ticker": "ALTD",
-        "signature": "3045022100c1f399f93892e822b44ac86a971251a8918724dee2ed8aaf893f676e275b635a0220059d818615f59637e73b726c76fdaefc1e8fc646491d55abffa23a217502d638",
-    },
-    "0x027dbca046ca156de9622cd1e2d907d375e53aa7": {
-        "ticker": "AMPL",
-        "signature": "30440220164c371cff8e30efc76ef149a58471b7ea8747e5e8f3974319e6223ee9a97d98022076f5f7f573385bb6484f0e49fae32d449ee8378c254448ab7c6fa6b73390a8c9",
-    },
-    "0xe6b9d092223f39013656702a40dbe6b7decc5746": {
-        "ticker": "ANGLE",
-        "signature": "3045022100868f9a6698e42b16db8e7a616ce6d5df8b70b03e2f9593166ae9bfea7d2023210220539d1d01257c18d6c1926323831fe3f0ee048702f43ef33204a51faefba6aa0c",
-    },
-    "0x6c6f910a79639dcc94b4feef59ff507c2e843929": {
-        "ticker": "AAVAXB",
-        "signature": "3045022100d901920fde3282f6eb23da737c0a3218a3a7f28b423dce2251c65d1b3ede2e60022044fece0e7104914192336b37e9ea55b7981375587dd314a3352591c25e5f1e67",
-    },
-    "0x20cf1b6e9d856321ed4686877cf4538f2c84b4de": {
-        "ticker": "ANKR",
-        "signature": "3044022028e99e2b4a4d3a4aff5c418d683213406443ae1158e5140640e097d3722891ff02200b069407a28323633a76eeac734b649b85c3eec538f7579595312b5bb5d2b9d8",
-    },
-    "0x12d8ce035c5de3ce39b1fdd4c1d5a745eaba3b8c": {
-        "ticker": "ANKRETH",
-        "signature": "3044022006ea5833ff908c07d5a78f8e440cf20845d22c7539b265f03f0b675492877407022031c23c31ef91bade4f969960b5ca34d134cd3d254cd7c11f25c6a5f7ff7bd883",
-    },
-    "0x5377caf64cf02c1320c66030fbe3773431377dac": {
-        "ticker": "ANT",
-        "signature": "304402204a042abc5f47e0a9a0f2613801105cd0e01ec3f7e2af4081711871dfc4a2050402203536a4ddd495f3825e6e66fb88f9a02e1ab11b118ee122a6e621bd5ee23727a8",
-    },
-    "0x8af94528fbe3c4c148523e7aad48bcebcc0a71d7": {
-        "ticker": "ATF",
-        "signature": "3044022062fbaaa3dde101c8f85ccd0145527378d80cd3952aac9ed7fb51bb3d0152bf1a022012a2c3d823f1c5c0d5138fff66d1daea8d97092ff1a997fd2512fea0d7030861",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "304402201948e2d1a7aa54c3f3d11a7fdd65af294dc1ed25dafd1ceecd5288083db001590220362e092558084a3e8fcd100fa1c309b1fe77c878c404201c9fe4264dc62c1403",
-    },
-    "0xb44a9b6905af7c801311e8f4e76932ee959c663c": {
-        "ticker": "ANY",
-        "signature": "304402202071f1d5839700be3782f644c3b62dc6e662550c72427edbbfac71b76668a657022001c508db22dae4744130cac9097bf422c72a491557986b42c54dacf961b8926e",
-    },
-    "0x938fe3788222a74924e062120e7bfac829c719fb": {
-        "ticker": "APEIN",
-        "signature": "304402203676b219562218430a93101ffb10a9966d0396df6bedb266d354ff98653d8a7a02203f6ec6ab8a674224d162a9282d0d71b853f6774ff8b91cd14536e2371873563d",
-    },
-    "0x0802d66f029c46e042b74d543fc43b6705ccb4ba": {
-        "ticker": "APE",
-        "signature": "304402206a1cf2b6274161d419189b64e1bac3c684d2d359afe4a040832a03ad10fa68b8022060dcb8c7852d1cf3a9e2858a7ce2ece2bdf258601d86789725ae0d1db3f6cca4",
-    },
-    "0x7f9c841feadddb4bdbb2a161ca40bebc4f215a9a": {
-        "ticker": "APOW",
-        "signature": "304402207045a23d36ba66a12467117525f82eddbc04077ae3f4075be8e3f60c6c620fbc02200a653314c19836c3338cc997897f454b0a32eb13c2d03824488d19ffb249cc03",
-    },
-    "0x00ee200df31b869a321b10400da10b561f3ee60d": {
-        "ticker": "ACRE",
-        "signature": "3045022100c4c4ddef1d6fd8c4926c4deb7853cc44e21116ff4c90ff59ea47b60ccac3004d02200d3aa74de697c14d62726cb3ed85e2220825c753fc97299d70218e787e914d6d",
-    },
-    "0xe8876189a80b2079d8c0a7867e46c50361d972c1": {
-        "ticker": "ARC",
-        "signature": "30450221008cd9afc368082b116ddc576004e538272d83c1fc980941f652ce5215950adef7022071fd64d301e561ae732c0a5c3cb0a71edaa1b76a6c4173744cb5318a8e5de1f1",
-    },
-    "0x1fe4751d9bdabac8d90067056cb45ab6823d2c12": {
-        "ticker": "ARGON",
-        "signature": "3044022014f4557eb9cf48bbd998d9babca4040df3066928ea6541f2fb8fc9f7f2acc1f002204c8b169b6160fbbae7c592d9e889b800dec8e8fea0b1dc313d9080479a5c25ca",
-    },
-    "0xb67a9374da03d4114a6fb8f0e7f2b82b5cb34ee3": {
-        "ticker": "AGF",
-        "signature": "3045022100e67c22e472f434b497739f1b467fa93c187c996ce424db085859bff99233b63102205ef9997a3743592685ba736921b0658f30baced4b0b86eda9ca1135372be1ca1",
-    },
-    "0x68327a91e79f87f501bc8522fc333fb7a72393cb": {
-        "ticker": "AUX",
-        "signature": "30440220217b396c5e5fab7d50cd9c9022b7593dc94d942bb3a3cdd15c108b8ccfe2c071022057c45c2ceaf29dcbbffe2f22b7ddb4c5c44f60f5709285cc582f9faec3c213ff",
-    },
-    "0xb9fc547057b7623a86ccc112c675ddcc4d78de76": {
-        "ticker": "AVBOT",
-        "signature": "3044022078939546ebaa9a04449954f060d854f26c313a8053296deacf7ee9813038bbfa022061fc71e4b861209701155ad1818847be96bbdeb9b9526c86b56de24eb0fc4b26",
-    },
-    "0x9f71b3118d97a448b127bf7677a59ab7454d0a04": {
-        "ticker": "AVB",
-        "signature": "3045022100ddd1cc45e0fc75ab30c8926e16235f4c49233c109b1d02c0c767ccc76f003ffc02203c8acff3daad6d28cd86a67d2d581d86e536fc75405dc467ab70207d09ca5c18",
-    },
-    "0x37f44b98316ad2815357113aebe0459029543e1e": {
-        "ticker": "AVEX",
-        "signature": "3045022100ab818d3f997b952583621c2de22063887b53881bf153bf02a2300871e27c18be0220093e41b5827ca3f780a520b5cdada82e0506d1d961f952d4dd512df9b9fb6bfb",
-    },
-    "0x346a59146b9b4a77100d369a3d18e8007a9f46a6": {
-        "ticker": "AVAI",
-        "signature": "3044022011b16bea540eba253ec8207fbaa52d08282b5f49e1cac8010a879ef23b78c5fc02205aa2728ad6499ac2ae63664c8c0519a98950260a80a493087649f3b5039d4f29",
-    },
-    "0x617a4edfcec09864ca9d052ebcbab67da273f4d4": {
-        "ticker": "CHECK",
-        "signature": "3045022100ae6f94f3af1647a8a1288dc56d847bce7b698c4bbdc9501831f1b04225a6f78c022013d258da46d845c4bead9e8147d0f42e97dcc83201c78fcf45c725d536c983bc",
-    },
-    "0xd1c3f94de7e5b45fa4edbba472491a9f4b166fc4": {
-        "ticker": "XAVA",
-        "signature": "304502210085ef15081005ac45347f5907309525d091ff83a5cf484bb16315071df67b9ed502207134952c9fa7f01bc3976a45694badf395b1a1690afb39d54eb49419046b34b0",
-    },
-    "0x1209810df5370f68b28e6832dc4ac80072e2d0b8": {
-        "ticker": "AVALOX",
-        "signature": "3045022100b97ecafe36e200303139682cf55ca7ebe5e5dd086ef76a7203300e865f2decde02200f8e1916b956d8ba5ab3260e32e94a001cbf2f7fd457a356e21dd5a68a7da884",
-    },
-    "0x7086c48c997b8597a1692798155b4fcf2cee7f0f": {
-        "ticker": "AVAT",
-        "signature": "3045022100f32bae6cf223d3385b99d75312a00aa8721108d3c6d33b6cf1b29715e4b255310220509d30c4a7c864f4f8f373b144a01e7435cb21dfd2fa68d26043e755b3c07b14",
-    },
-    "0x78ea17559b3d2cf85a7f9c2c704eda119db5e6de": {
-        "ticker": "AVE",
-        "signature": "3045022100fa51a62fab727e0dd8c91247bc33f6326d9e8a5681908c87fcbc4aeff2ec5f8d02202ce0cf6c3c777640ffaf06dc779ba4fa36a0cb6acb96911283da339f598563dd",
-    },
-    "0x783c08b5f26e3daf8c4681f3bf49844e425b6393": {
-        "ticker": "AUSD",
-        "signature": "304402206281fee64d9c950ffe089882aea02bbb5e6c8cc7bf28f1d810aee887507417b402200992b87dca4f7a36a1f91bc3b0a9a8fc00cf97aa0b5bfb01dadac05b76107682",
-    },
-    "0xacfb898cff266e53278cc0124fc2c7c94c8cb9a5": {
-        "ticker": "NOCHILL",
-        "signature": "3045022100a4e14aa47f08e69c0f52018b5dd0a4025f14b27f228732d4cba226d7dbdd897b02201cd22c94f0e4b89172e238506027256d6e34b5f235264bad426382bacd1a2461",
-    },
-    "0x397bbd6a0e41bdf4c3f971731e180db8ad06ebc1": {
-        "ticker": "AVXT",
-        "signature": "3045022100e5bbc0e047c297488bf02e5960473a0d1d7e1a484cb3d0e906b2a67bd7d51a6802201fd77beb50eec673aca9b5b2188c47f1ffa6031e665535ff621a29383659ee8e",
-    },
-    "0x9988a27919e8872b24f2ccb1991bf0297b68a470": {
-        "ticker": "ATECH",
-        "signature": "3045022100b5be8d9d8c97a3fe305dba27d0b8a872fc87b2be01d25b11def3a7de325385d402201e9b8933c516872364e85e1ee5dc9f06bd4a66decb2250b90ac2a514b05e5bf8",
-    },
-    "0x1ecd47ff4d9598f89721a2866bfeb99505a413ed": {
-        "ticker": "AVME",
-        "signature": "3045022100fce0cc4573fc038ac1fa999ebb83084d9db3da4799e3dd30432510f6d61ad7b002207de3a3cc59c90a0167fbf7ba64831806e6926a7876b49296d8610aaa9468c7be",
-    },
-    "0x80d18b1c9ab0c9b5d6a6d5173575417457d00a12": {
-        "ticker": "AXLATOM",
-        "signature": "304402201984eae303c8585e63d4f580a67c28340109dc9398251e138a777b7b3f23511202203b28b14dcaad623bfe7761dc914cccb9b3aa74c7759cdfff7e3b56153db7e481",
-    },
-    "0x120ad3e5a7c796349e591f1570d9f7980f4ea9cb": {
-        "ticker": "LUNA",
-        "signature": "3044022061f97c96545ffac097d99cdeb179e13f64122826fd0198022e87ee2ac5c6b271022030a927021a589aca769779ea32dd40691ed038ede7e2fc186cad6fa05f882457",
-    },
-    "0xfab550568c688d5d8a52c7d794cb93edc26ec0ec": {
-        "ticker": "AXLUSDC",
-        "signature": "3045022100c29fddb4678188864a4d93d9c1009097fa9ced505f926a68f43c61a98ae84d3202203f5fcde1c3a3890fd3d05950c68cc025c040807edbe5d3ff4e9dbac66c8a7d0b",
-    },
-    "0x260bbf5698121eb85e7a74f2e45e16ce762ebe11": {
-        "ticker": "UST_AX",
-        "signature": "304402207d197738b03417f9339a86f8c83e9a98077892e5edc130346a7ca2236d303f6802205f567315e80c7e22b1cf9a6bb3afd0e80c33f84a5f5d469aa8490493d4b397d1",
-    },
-    "0xcf8419a615c57511807236751c0af38db4ba3351": {
-        "ticker": "AXIAL",
-        "signature": "304402204ab5255e4a5d2fd1b5fec7a6c592703fd35c28987b9f99a6d1b0b1f873de2776022015d01674a20f7f4915da8d95dce86b7ddecea6b2207f00dc94a428cef511e59a",
-    },
-    "0x22897cf0da31e1f118649d9f6ad1809cabd84948": {
-        "ticker": "BABYCOQ",
-        "signature": "304402203d92b1dbf99e6a6d4f40f0dd1b317e76555a5403a1fac66ce9c2591a5873f7a902205d2c0b85391ad44aa1d247ff510957ebdc5ad0b62e27906db72fe7696f82422c",
-    },
-    "0x1e2c4fb7ede391d116e6b41cd0608260e8801d59": {
-        "ticker": "BCSPX",
-        "signature": "3044022058fe25fc0716181b37ae69539a6fccc7f7b39913fc676e922bdb320d30ad1e2a02204b017933470980f1c3180a6a864916bd92373d16e1e9b0ea219b64eccd433148",
-    },
-    "0xe15bcb9e0ea69e6ab9fa080c4c4a5632896298c3": {
-        "ticker": "BAL",
-        "signature": "304402203251977af19d3eee70ab8d58007c4ae549b29e544f9c15ca814778ca44c0da79022023d6bb566401b431b325544da66ecbe1a63e0b674d345a332d2815aa383d7277",
-    },
-    "0x70ba1a777b3f639c58fd5bc6a5c8780ddcef533b": {
-        "ticker": "BARK",
-        "signature": "304402203a66184e33eea61b60e05c313e32f478d04cf45691c3eafcb901ede9565c17610220689cbe241b72bdd18127ccd81877fb3289e9647f73edd38be2d0e23d2d277727",
-    },
-    "0x6b329326e0f6b95b93b52229b213334278d6f277": {
-        "ticker": "BAT",
-        "signature": "304502210085283a71e6ef8aa03e6890a2e23bc546ca32acf1e627d94aee402fff49cdf70902201a942a125af6f0c6c4cbc2aefa85c3fe51c13c573a126e3fbf91d3fbbb56a7d8",
-    },
-    "0x98443b96ea4b0858fdf3219cd13e98c7a4690588": {
-        "ticker": "BAT_E",
-        "signature": "3045022100e86637c53c767f00b55dee628bca8594e6fd81880499b850bb89573f9d8fc5be02205db570743556d321ab90fd3237b37f5926a04a1b4de6a9f52c4817ca0a990c57",
-    },
-    "0xfd538ca3f58dc309da55b11f007ff53fb4602876": {
-        "ticker": "BFG",
-        "signature": "30450221008e19d196e334ece9a7168d2ec8b6bb19383d3e4db24962b653ef639f0fbeb40102206546bcce1417f778cabb87952bea761fa54b6a805c7b8e7fcfe301d91f218a2e",
-    },
-    "0xe19a1684873fab5fb694cfd06607100a632ff21c": {
-        "ticker": "BAVA",
-        "signature": "304402207946e03b51d6270dc8a9526fef7a9a28bad182b9fff9a8f851321ac5b52de374022047192d6e279458d1a308e7aeacdca27e9901c70d616e90c5b1fd9302e6af4fd9",
-    },
-    "0x2da8312e2c08b79104c6b18ba26bc7065abec704": {
-        "ticker": "BAWLS",
-        "signature": "3045022100926dcb6e83372431fd87700b9acd136757154ad76103a1caa654af975afbe5e20220028de7d2743c79d0c247ddfdd035ce9a474bf95e127ee39223acca84c7772c45",
-    },
-    "0x18706c65b12595edb43643214eacdb4f618dd166": {
-        "ticker": "BAY",
-        "signature": "304402204e901c66681ce70f3802ba4103ccffb37b34346fbf4b729e81713f5848c7965a02204f790108662d236057a61158801caad83f579c9db8153d9dd850fb8e890fb0f2",
-    },
-    "0x19c79f282d151995d91f6dbdda2739701f9c47aa": {
-        "ticker": "BEAR",
-        "signature": "30450221008ff29da52f0350525046bab5907da550415576189ca82d51616abca98f9efa26022009189558201d38f5a2dc34f5d0ec12ee7eba5400c2bf3bd2bf29cf7179e62108",
-    },
-    "0xd6070ae98b8069de6b494332d1a1a81b6179d960": {
-        "ticker": "BIFI",
-        "signature": "30440220657994e8ca106db19e98cae716fc1b13452c27595314c8258d429032c098ce03022046c687a3120dec96600142758aef89bc7f5d0752a55091f46318d7bb9b6e0cd2",
-    },
-    "0xde8232cf3cca014554e3b607e0fd554fbfdb20c6": {
-        "ticker": "BEES",
-        "signature": "3045022100990fb44ed50fec5889d70a7772cb7d423352c591b3252d398a43c8f154231dc702201ec49fd28b54c0262d0cd41969515bbe360895ad1d8d15a2887ac97d5abf3ba5",
-    },
-    "0x8729438eb15e2c8b576fcc6aecda6a148776c0f5": {
-        "ticker": "QI",
-        "signature": "3045022100dbe42489ce3662f5324d4fba76bc15145bb5f2bbc5f8542782c2fea4fd382d49022050d3a6b7cb16f115c6bcae7ef40ed73716831e528976803d733fe4b0944af2af",
-    },
-    "0x511d35c52a3c244e7b8bd92c0c297755fbd89212": {
-        "ticker": "BETA",
-        "signature": "30440220308fcea352dbb5e7dffdc80308da93f140e2a66fbecbe42c7f6df47e8b409bf20220051dafe679aff6e7ae2c3f0add4e6035f2b6ac8217209d9a85e60b226550c554",
-    },
-    "0x63682bdc5f875e9bf69e201550658492c9763f89": {
-        "ticker": "BSGG",
-        "signature": "30440220443b00cea6fb24ed6ccd3f44e5dcc8c6b55362cf81f6de8af594c67daaa6ee7e02201c5d87481522b174ffac355e36accb9f5a6652fb77d85b418608c6554eb0a0bb",
-    },
-    "0xc763f8570a48c4c00c80b76107cbe744dda67b79": {
-        "ticker": "BETS",
-        "signature": "3044022022735548b38f643a9dc2e01e362522afd29a48d9737819d6fcce811e8a68224302205342227b5369df2574b8cf35e6b589290fbeaebf105503eec91f06fb61f7b8ef",
-    },
-    "0xca220f1e486a8e35d6f1dcd62073ad8dd04659ed": {
-        "ticker": "GLDB",
-        "signature": "3045022100d83b23d8ff4243562d51570a6057ecdec5ccd83fce1fb301f779efc8c02e82b10220184088950077c523af147361ddb5f7596b79283ac6a81702b020c720925d484f",
-    },
-    "0x87bbfc9dcb66caa8ce7582a3f17b60a25cd8a248": {
-        "ticker": "$TD",
-        "signature": "3044022077e26a51c40693d22134f8ae08f0903002e3baca1f3547b2165abfe8534bd1da022054e000466a9d6559ba23f8fbef01dcf28442ba221cbbe13b5e869ca54a362144",
-    },
-    "0x564a341df6c126f90cf3ecb92120fd7190acb401": {
-        "ticker": "TRYB",
-        "signature": "3045022100b763296e1833342245b7f4002592d2360d5fd6e8083ea19cd9df1453daf4b2f80220105a59fb87b6f04c7d50797b1e645a38cebdbd7578d9e64d2d6fac1b9158f0cc",
-    },
-    "0x264c1383ea520f73dd837f915ef3a732e204a493": {
-        "ticker": "BNB",
-        "signature": "3045022100e857d9c1a906070a21327abc6851aeacddbffbe4c83f6abeff8fbb5062e764f102205a3816012bac746f2f515068c04cdcf5d83d7635f60791091a259353615844e5",
-    },
-    "0xaeb044650278731ef3dc244692ab9f64c78ffaea": {
-        "ticker": "BUSD",
-        "signature": "3045022100a0b18774abe066a97edf98f99fbe62516a0fb69f15de4e06d7ca112d151ece6a02203fbb059a9da1cb527f10211685558f70092341db11ca6e205bb6fc1f3d8b6978",
-    },
-    "0x19860ccb0a68fd4213ab9d8266f7bbf05a8dde98": {
-        "ticker": "BUSD_E",
-        "signature": "3045022100ea8ee0bcf29ad4e4d71e716b3cfb96e6be060e56014e269877603fbb1e0dde8202206843870fa950f6ee75b870b2354201a54e61e580f2f75feceb589d266eaae05e",
-    },
-    "0xb262a485d98d8e19175818d47453e7812ca255a8": {
-        "ticker": "BINGO",
-        "signature": "3045022100a21adcaac24a46409f244feece6633e78823008cee3f5c290c0960db94f9a7f102207bd962a9f5edb2edce2658df0b623cc218b20d03f28268f9fbc406908fb43c6d",
-    },
-    "0x9366d30feba284e62900f6295bc28c9906f33172": {
-        "ticker": "BIOFI",
-        "signature": "304402206435debc44806217b2195d24cf136ef4b694310666fa7d94645aaf197166d98602200e9c6567fc0f40ff08f17594e2c047c3f8d0bec45dea463c7caa02e701cc9172",
-    },
-    "0xd7783a275e53fc6746dedfbad4a06059937502a4": {
-        "ticker": "BIOS",
-        "signature": "3045022100a72ce70f8b0372992d55ac3912784ed283a32e34cefe01ca5496d4bd745229dd02203a34186eb73dea89890333afe5e72b0634fd28244a37921f5cac515f16602d29",
-    },
-    "0x152b9d0fdc40c096757f570a51e494bd4b943e50": {
-        "ticker": "BTC_B",
-        "signature": "3045022100fd3f3d1364cad27fa78503b8aeef15687f9739dbd4c7fdb5e3bda8b006397b4a02203a2cd48deaaff4515fcc00a0e32ab371819c404e1df24def776339b390c1289f",
-    },
-    "0xb355f4f4cc84a9429a59d5c2b98d77016f7ec482": {
-        "ticker": "BTCBR",
-        "signature": "304402206bd4fee42813e87c7d87307c6b9159e167b66c18373d611cdada4d62cc29d21a02203a5dad91a785557c5b625df8cf3c3753a5538368df777c57d90ebb0af3aa6763",
-    },
-    "0xa2776a53da0bf664ea34b8efa1c8ab4241a10968": {
-        "ticker": "BLIZZ",
-        "signature": "30450221008ddb03ca2ed16d72a0a20788d690a3c3308f76debac94aee2545ccd82f9d65ce022046f1602b95fb8dda0d798de9fd4115d8ef1a9b2cebbd41116e610297f2547873",
-    },
-    "0x334efd1aa0caf4b9b206dd8b9002b7172fc805e6": {
-        "ticker": "BLOB",
-        "signature": "3045022100cef8615c6a5d0c9eba267b39318f4b71cac80c00da04a4f54f328ea576ecd6ee02200af9c50c8da55a5b3e431fe3912230a35d71878c560eccc084082a6ae3199ef3",
-    },
-    "0xc931f61b1534eb21d8c11b24f3f5ab2471d4ab50": {
-        "ticker": "AABLOCK",
-        "signature": "304402203f54a8db4934f856adb0f1e28b6904eb8febfb383d664614c8fc3c83c82ecd2d022000bc755489b209715d9dd653e40e358262a506169d51bcf6fcb8a7ff5021111d",
-    },
-    "0xc12e249fabe1c5eb7c558e5f50d187687a244e31": {
-        "ticker": "BLUE",
-        "signature": "3045022100b2e9f52482acfe5b46dc2ac1dcbc127aaa2c9b3bec57e3ac10279b7143f286d702204c351ef2ffeefaa68cfb26ea88c193e924cd57c2707264cb6b63d6428b770a4f",
-    },
-    "0x590eb2920486486c2d9bb3eb651f73b81df87bcf": {
-        "ticker": "BOBC",
-        "signature": "3045022100ad667322a23c3e6efdf7949c05ecb679acba1eb51d7ebd77cc00c2315d7ca4740220255b97ff0ce834338092252d7b4246026f02a45822b0e0e730ba9c007b257ea8",
-    },
-    "0xf5f3216e9fed36f8ccf08d310fec6fbf7f06200f": {
-        "ticker": "BOBS",
-        "signature": "30450221009bbb0f8a23c6548f3ba7d60bf6b57e84e36d21f33852d1084030e13e0768ca7c0220593f017554674c7ab43c18642a1d0b5e2d297c403d6b675da2d3ae5b0eaeccfa",
-    },
-    "0xb09fe1613fe03e7361319d2a43edc17422f36b09": {
-        "ticker": "BOG",
-        "signature": "3045022100a5ea9ba7774149aab9808d41713e2e336ca87350801eb23af1d6b895f250b10802204aa8b305a27347b5d116323c60ed52ecba9227e1514f6c8233676c396cd9f462",
-    },
-    "0x1111111111182587795ef1098ac7da81a108c97a": {
-        "ticker": "BPT",
-        "signature": "30440220792e99e9b6060d8020176f2291b0512a7b507c9ec62f528bab9680a9452cbcca02206c4c40e9a64ac233a1fc571d4e7ad7d3849e985dda57cde7a765dd22aae5264a",
-    },
-    "0xb00f1ad977a949a3ccc389ca1d1282a2946963b0": {
-        "ticker": "BOOFI",
-        "signature": "3045022100d371c485ac0c68cc4a04252f62158fb887cfd8de6f3ce3e7f6199a7377d242d502202721c8843b7a1d2e6daca65dc969359355d055754f0f4ed71536a575741c929f",
-    },
-    "0xce2fbed816e320258161ced52c2d0cebcdfd8136": {
-        "ticker": "BRIBE",
-        "signature": "30440220580a128ffdcd69b4737caa622002f06da272dab6150ca8f48baeb53dff9f08d502204d0103a54987b41155df1255e835eda5848cdea562bca7e318416b337ed302fc",
-    },
-    "0x65031e28cb0e8cc21ae411f9dd22c9b1bd260ce4": {
-        "ticker": "BRO",
-        "signature": "3044022042fe23e81fbb50b890ee4cc4ae2135f7592e1ec336af40acd1d3abe869f47a4c02206376f3129ab2faaa8ca0bfcdf91ff537ee029730f6bf1622569dce760a31837e",
-    },
-    "0x491a4eb4f1fc3bff8e1d2fc856a6a46663ad556f": {
-        "ticker": "BRZ",
-        "signature": "30440220760a809256425114b58c3289444e2dd21c6fd1c238e5878646ce043db680477302204cb09fdf724bc2be18dd6b6a7e7229f0d440ddf94286b013df95d30869cc5c14",
-    },
-    "0xf44fb887334fa17d2c5c0f970b5d320ab53ed557": {
-        "ticker": "START",
-        "signature": "3045022100f17e45a9c7ff158f2373aabdcad70a5e5e90d277187afbf1b3bd52071cf4285e02206a31c7a10d68eca9e4d4c21ff2a4a7db1f6670e60d8e81170f2804fc37506615",
-    },
-    "0x6ac048ae05e7e015acca2aa7abd0ec013e8e3a59": {
-        "ticker": "BSKT",
-        "signature": "304402201ffe47737d98c5426d1a67d2113ec91029deda09b67c28b06534ce85b9aa41b9022064725bd94fc64cd4f2d5fd124e383d4641d0e20b104e4056f6a69126f226c444",
-    },
-    "0x5f018e73c185ab23647c82bd039e762813877f0e": {
-        "ticker": "BUILD",
-        "signature": "3044022059ace6c39a9114d6158e9a0fd35406518f6880029a58669669725f9aee03663b022067b2cd03658a64ebe0c612421a32a4272252f744822638cbaa0a519ad4ace3a2",
-    },
-    "0x9c9e5fd8bbc25984b178fdce6117defa39d2db39": {
-        "ticker": "BUSD",
-        "signature": "3045022100a759820c4d8f385cff02d545c4a4b35eda76aaab777b563040df096c37d91c6f0220691a533c2a8c94b79bee30ab877989aaa955b353542574914c5371b2c593c6c0",
-    },
-    "0x15c841043e13ffaa9a99fabea236d40f45615623": {
-        "ticker": "BUSINESSES",
-        "signature": "3044022056ee5bce55d12a1e0ece66fcb3b81c2a786e405aa6383605c4bd24230a08f32a0220519a00bd38ec1831bda0fedfb18ee348f3b8013ef53015f28e2621f133902799",
-    },
-    "0xa4fb4f0ff2431262d236778495145ecbc975c38b": {
-        "ticker": "INFRA.E",
-        "signature": "3045022100da1c3056a55af3c573f1575ee986531887d6fbf8c05cc736ef8e4c3d9dccccc602206477915a89bff0b5d4e7766399fd0ed425d3328b7241c6ed11e3c1235b24df25",
-    },
-    "0xdb333724fae72b4253fc3d44c8270cbbc86d147b": {
-        "ticker": "CABAG",
-        "signature": "3044022077ee979b3bca347752661e6b75496c1a6265402ea62c0b3be75d14737763eecd0220164e3b204b3f8b0a0b4bb619892cecfdf092511e87659b61baeb3df0ebe85ad1",
-    },
-    "0x8d88e48465f30acfb8dac0b3e35c9d6d7d36abaf": {
-        "ticker": "CNR",
-        "signature": "304402202bb8f69467f78b3835cffc2e9a82f257470d9d81a5490e904913a239b411a78002204a8289982897a78240d2f2a79aa67c24abf439d038562e7ae396b5f0c872a518",
-    },
-    "0x6b289cceaa8639e3831095d75a3e43520fabf552": {
-        "ticker": "CTSI",
-        "signature": "3044022049abf790ffde686ba5b58dc046c1335fd0cef71b479360c20d9242a0d02a49140220036ec64b04a6918c8aaa56464ac5f669348f1c6d3d6f843fe779353fd22c8d7f",
-    },
-    "0x3377aca4c0bfd021be6bd762b5f594975e77f9cf": {
-        "ticker": "CATWIF",
-        "signature": "3044022054f8cfa6cfbf5919a7b7a3a12f3a70fd0bc5b06622e56a12e548b783ad28297702202ce5832f3c697d5b0b510b25201c0f7913fec3f02aaecb6af3b5f1259abd955d",
-    },
-    "0x402fd175049e95cef2cc9ca1fecdb6d9736e690d": {
-        "ticker": "CATS",
-        "signature": "3045022100a6d4aab88cfe6d31c15e5a6c9466c827d344cbd8193996e72e41451eb3b520e302204b4a96729923a2a63d83e212524d85c83b8f09b0ecd49a624a8bcdf3e7097ad6",
-    },
-    "0x527856315a4bcd2f428ea7fa05ea251f7e96a50a": {
-        "ticker": "CDFI",
-        "signature": "304402206e15af8afc9dbd66c6bf465dc3bf0abe059087febcf7eeaf278b799019c2ad0902207119ccb89920c80344ee220e0b1ff20793853471c7fbfaa7a62cc1c0ee3f2b7c",
-    },
-    "0xb3fe5374f67d7a22886a0ee082b2e2f9d2651651": {
-        "ticker": "LINK",
-        "signature": "30450221008b586baab9f9127580c3a6dd88ea8543a39b8e926870b3b58164b7e66016966302202433ef02f5d2d92570b5d4be83158afc1b4500dfcc4121d16391b98a181cc700",
-    },
-    "0x5947bb275c521040051d82396192181b413227a3": {
-        "ticker": "LINK_E",
-        "signature": "3045022100e3b237319ddbc42d5368ae63e0bff6060637c9aa9432f9e5a5db534fef8a95890220652d3f651f019fd3a597d5f7b5788fdae904cfaab4e257ff8722e3ff5c3eafef",
-    },
-    "0x0cbd6fadcf8096cc9a43d90b45f65826102e3ece": {
-        "ticker": "CDT",
-        "signature": "3045022100bf49431f18f7bce96bc957744b4fa44a2ee9859c1606e7b1bc8bb4ceb5eada0c0220160384709bec1a9fd090428cd0b0cf7193eaddb78652108d3652151b9de2390c",
-    },
-    "0xc11bf915db4b43714bc8d32bf83bf5ea53d40981": {
-        "ticker": "CINU",
-        "signature": "3045022100a6ba33e06480c88919917c96e6167bfddba69b25d8321defe7607dc9dedd638b022032de68fc5ea8870d153c38afc58878c6e9f8a0fdaf45e12b830991c15e393043",
-    },
-    "0xfb4d81b440be87735caa0983bd9d2c0e65ab464d": {
-        "ticker": "CHEVLITEST",
-        "signature": "304402203ddca6fa3a97cce14b6b61da86f4796c48b0a1133259a27cf225845787a3173c022036b8701218a240d0089b9600bd985517b711f72194a495ac7e443b9d6815189f",
-    },
-    "0x7761e2338b35bceb6bda6ce477ef012bde7ae611": {
-        "ticker": "EGG",
-        "signature": "3044022061a6885ff0834029b2f1cc4dd51f5bf8c1f3f25aa56a657a440cbb6b7ee9b69302204c44b634cee49a8a5a76274a7cf53d8a0ae14d4c26bc563c05cfc3d9ef5cd24a",
-    },
-    "0xab592d197acc575d16c3346f4eb70c703f308d1e": {
-        "ticker": "FEED",
-        "signature": "3044022034b850d83b3224cbef406d3de0bb11eb888e11a0fd1a24b012ad49583be5123602206857819e77e7818dc62fa2f8c1ac67e261bce6c374b2b5b5adc4a5b9609aa156",
-    },
-    "0x9c846d808a41328a209e235b5e3c4e626dab169e": {
-        "ticker": "FERT",
-        "signature": "304402201ed3b0c4bef126e5b011b23fe251f757ceb9879c7c42a9525b9b7b6ac23b6ee302205596d3d6e020015497843212e810e216f1092de232c87be85d3d7d3c5d5eafff",
-    },
-    "0x79ba10485ae46a9436d560d9664369176ec2eb2b": {
-        "ticker": "WORM",
-        "signature": "3045022100b4150f359d1c44941db52d91095060e3b809e0ab0e2b22aeebd8dd8deeffa34a0220707589a9b1de3bb0b790136e0788e5ed7a1b0f30fb01bcb0d236af5ce5829a7d",
-    },
-    "0x59821011487236ade7f9823f028fc6d5f3758877": {
-        "ticker": "CULT",
-        "signature": "304402207f31c3a53ff95d619f2610b0f08d6f7347ad4f6d934c092abaa3b421f580e0dd0220189fd78bf299011f13090ea086d9828815296f5f22f90246b6cd76824d2d2188",
-    },
-    "0xb723783e0f9015c8e20b87f6cf7ae24df6479e62": {
-        "ticker": "CCY",
-        "signature": "3044022060de9d372ecdedabcbfde766515243c199cc6f0afc3f52ceadb31b91fc97e07a02200a492381f637168134679feafff1fd02613db4bbceb6ed32d89e501e09a2c180",
-    },
-    "0xbf1230bb63bfd7f5d628ab7b543bcefa8a24b81b": {
-        "ticker": "CHRO",
-        "signature": "304502210082d8be1dbffee43380b05e34d1255c767c8f3e7eee08e0ecdf680d6ad57e5edd022018dee50c5578c77ccf0011c841f65c563f47e4b6efaa2e75387d248c978b0aef",
-    },
-    "0x1785d6f5b076d93efae079744d0c86f2ac77621f": {
-        "ticker": "GRAB",
-        "signature": "30440220498310db1681ca652952a77590f3a954f082efdd3cd0e0073fcfbc7dd3121cc802201fae754efecfbb0642d245e8f1efc4c7319cd01cc74c88cc7155ea55060aaba0",
-    },
-    "0x48f88a3fe843ccb0b5003e70b4192c1d7448bef0": {
-        "ticker": "CAI",
-        "signature": "304402206fa12bcfc12910134a71121b16b46d7886b089a7d0142dbabd4a8bda87e3b2ab0220726598a2a81daaef566f2fef2c1edff0ff6adb911dd08e246f6056f39d7139e8",
-    },
-    "0xec3492a2508ddf4fdc0cd76f31f340b30d1793e6": {
-        "ticker": "CLY",
-        "signature": "304402203790f33c934e5e458076874193561a9f6e82ec0ec9d3fce5eded07ff8b8117d202205ac9658f25c8c6a0fb4504d7ac6a13ab1cbafd534a541e6b917c901f2d3ff7f9",
-    },
-    "0xc3048e19e76cb9a3aa9d77d8c03c29fc906e2437": {
-        "ticker": "COMP_E",
-        "signature": "30440220272125dbedcbc781e00f0ac12f533c03165335d79afc5a9d8b57a80228579a70022000ec5c8dc24f6cf3957de6092530b78944ec30a23451ccc7c5078feb576df50e",
-    },
-    "0x420fca0121dc28039145009570975747295f2329": {
-        "ticker": "COQ",
-        "signature": "304402207e9025b826ec416a484ebc5551baa8ee49288319d46e40a492961716a7aa963d02202dd6b0bc5d842a297eea31f7a4060e3f252805b8c883834e71a1695d00732df5",
-    },
-    "0xa32608e873f9ddef944b24798db69d80bbb4d1ed": {
-        "ticker": "CRA",
-        "signature": "304402201f68ec89bd548f0b3cd31680033bb1c50709f4918ed12d78aa9aa040299bd759022018d3f62531f2fee59be747e7101b8650a0501cd435a944b27af787e87f252847",
-    },
-    "0x8ae8be25c23833e0a01aa200403e826f611f9cd2": {
-        "ticker": "CRAFT",
-        "signature": "3044022019302e36887c91c8606a68045e198ad78cc358a3c9b6177f7b90109c44255e1f022053be8a8ff9e8ae2c6a6ed0b004e3e680ce23f81505143d53abb25683f8da8246",
-    },
-    "0xc0367f9b1f84ca8de127226ac2a994ea4bf1e41b": {
-        "ticker": "BRIDGE",
-        "signature": "304402207284a39217a4113b45243318053ac4809d3ade6d394144068453187b08e593ad02205dbc7f75fcd55c5ec958fd66baea003360bdef010daee7fcebf2af49ad71366d",
-    },
-    "0x95430905f4b0da123d41ba96600427d2c92b188a": {
-        "ticker": "DEGEN",
-        "signature": "30450221009216f522270f7b5843b491e84f265ba4bd01912a881202103699a125f23c9cc402204a6e791b39b4923befc80e6a02938e6a6a36a3e8e6da13f9006339405ee0a9b4",
-    },
-    "0xc99092c66d92dddaced9fcdd488b246923d098ef": {
-        "ticker": "CROW",
-        "signature": "30450221009b767b202152ca324be656cb49e9fb1a7fa144bcb852aa3ea3e3f58121f3dc9b0220324c464aa02a55cb8963df7fd531d7182efc2f2c9d6ba514b2b4f8042ebce4e7",
-    },
-    "0x23f07a1c03e7c6d0c88e0e05e79b6e3511073fd5": {
-        "ticker": "CDS",
-        "signature": "3045022100d02542ff1e0e47f79398d30304ec6ebbeaae8396d3afb70093ed260c1c4a360d0220036afb14cc08d4570ac274c11bfab4da796d90a37c2fd84088c6348dc3ac3cb2",
-    },
-    "0x249848beca43ac405b8102ec90dd5f22ca513c06": {
-        "ticker": "CRV_E",
-        "signature": "3045022100d59b421c9fca992e4895b4b50329fdfe37a4ef863600e0b60c56e7d3bcce28da022003f1bb17888ce2edac15b09fbed2706cb9ed1abad3387da9018f8108183f094e",
-    },
-    "0x1337bedc9d22ecbe766df105c9623922a27963ec": {
-        "ticker": "AV3CRV",
-        "signature": "304402201c4b727b0f9f7a5f70d3f9e4df746478b95cf6335c149638f450af9a3a67406502200a8ec21d8f10aab9b48dc51c73b48dc407d3eb84d188766537ebc29c6fb6f5e3",
-    },
-    "0x81440c939f2c1e34fc7048e518a637205a632a74": {
-        "ticker": "CYCLE",
-        "signature": "30450221009ead8e819a535a98aae2de5bb0442aff7f33a9f2fe3054884fb08ed31e52c03b02207899c5dfca21fba1d3dd11f17d0c7277e87eb0bfc61f96d84d68840d9e6ef837",
-    },
-    "0xba7deebbfc5fa1100fb055a87773e1e99cd3507a": {
-        "ticker": "DAI",
-        "signature": "304402200ee2df63876a9812edb1446d7db09d9c679a474f0b4b2ed129281730abb5f933022008764aad6362c4b90cee37a98bca2e5c72b88e7bc7bf6e4e17d631a420e114c6",
-    },
-    "0xd586e7f844cea2f87f50152665bcbc2c279d8d70": {
-        "ticker": "DAI_E",
-        "signature": "304402202c37699018984cc99cd9ed586be60202a32f7153096299f8278810c5aeff568f0220138744c8e004ba43f570533462177002faed34badd7cb086e026d84a3bbe3765",
-    },
-    "0x45506b5fbf81aa128bc5029fac6e30574656214a": {
-        "ticker": "TOOTHLESS",
-        "signature": "30450221008b47bbb5f7ec4681d5ebbf27a212b474ba8a1d24074b9978a772abe69719f441022074b9def013f177fc4623b19eb4082ac770dbe78cccec04da418cc5032196568a",
-    },
-    "0xd4d026322c88c2d49942a75dff920fcfbc5614c1": {
-        "ticker": "DEP",
-        "signature": "3044022100b182add94b7c2a3add64255adbd36ea2a953a07e8ae29c80b37c3803438d2e46021f08303966c4a30df1394f026f04f7885f6f585ba4e4cc501094a77575b003a5",
-    },
-    "0xd05b010eddb2dc65d5bd5a1389330d475049a4d5": {
-        "ticker": "WTR",
-        "signature": "3045022100d04bddc3cbbffbff9ebf0f9a18e0a40f9a4b34b46f8761a11334e0e87ed09b0702206a70a440fe04a4121428b6c5bcc71dd1562a25dc034f9c89caf84af98328aa58",
-    },
-    "0xafe3d2a31231230875dee1fa1eef14a412443d22": {
-        "ticker": "DFIAT",
-        "signature": "3045022100a5478e6eef5c2ec46c7d666423b2cd2427e6fa2ac130a2bf26765bfcd8c996c8022055f7d0142c3104c56db22b1a5b5758223bd73049b40d674f09f2bf836d37960d",
-    },
-    "0x0659133127749cc0616ed6632912ddf7cc8d7545": {
-        "ticker": "DLAUNCH",
-        "signature": "304402205636ace6e043f2c4faff23c8653551f53b06270ff79b65779506707d244d80a6022052ee7d11761ddfe9abe584145e85acb6e01a35a8050847ba78f61c4a11fc33a6",
-    },
-    "0x961c8c0b1aad0c0b10a51fef6a867e3091bcef17": {
-        "ticker": "DYP",
-        "signature": "30450221008a217bbc0089a1ec452b9f80ede9069e76920080f8d85b65da94c48f42a7c07002200768028946546643af42d000f9511f9468b29ecc9a630a47f83a78bf5e7bc876",
-    },
-    "0x026187bdbc6b751003517bcb30ac7817d5b766f8": {
-        "ticker": "H2O",
-        "signature": "3045022100b6ccdaeaa7166eec0de315cf4e4176e97b174abd9606f5bdcc1f0447bac4b2ca0220766bd140d2e6b66a38e336b11be006fd2f09e98f8df674e8fa639219132c344b",
-    },
-    "0x47eb6f7525c1aa999fbc9ee92715f5231eb1241d": {
-        "ticker": "MELT",
-        "signature": "3045022100c4d789963310ef2b2470c3d5865102d3ceb600aa3816b2ba5593a179eaea7c4402200794085cc093ce6a3648fe43fd3fb49ed673e0ef5e1d069598e539f1533f3ee4",
-    },
-    "0x51e48670098173025c477d9aa3f0eff7bf9f7812": {
-        "ticker": "DGNX",
-        "signature": "3045022100ff45df9f6be32ded4e5841886be58d29b3fca0708ed8db42df5c01acd62ddd6b0220127a2156049bc2f1ee56ee3fe45ad46fbf95453452fbd88a9a096898cb9a3d66",
-    },
-    "0x9f285507ea5b4f33822ca7abb5ec8953ce37a645": {
-        "ticker": "DEG",
-        "signature": "3045022100874255137da1ddbe766c81270c25276414b38a17dfbc49a2c472ce6aa8f11266022059ad9e95246c2af141363b819ba386818bd7a64a4398cd47ca038c9048f730ab",
-    },
-    "0x50c72103940d419fb64448f258f7eabba784f84b": {
-        "ticker": "DLQ",
-        "signature": "3045022100d5c56068e53d9e696545008cd4b4a86a7cce0b5f4f889170ddc7b53f3ed43423022008c852a598492864ecf70bb55cfa929eb0513b267ac1a16603122e0a857d0d89",
-    },
-    "0x093783055f9047c2bff99c4e414501f8a147bc69": {
-        "ticker": "ALOT",
-        "signature": "304402200de7ebf57dfe7344dbe5302991c088a67b9e640059b45e1c4d46a5d2b9807fe50220522ee991c307b3a5590bfdef8bb25003371c160ae1db4c64bb1f42ffde2ea609",
-    },
-    "0x03e8d118a1864c7dc53bf91e007ab7d91f5a06fa": {
-        "ticker": "DEXTF",
-        "signature": "304402206683921b1b04a3611e107119d822962695189eb9c7c79fc9c441193b7f430a31022007767b6d3364370ce4bc008901e719b0b059a9682721b48146d6defc359af827",
-    },
-    "0x7f29e7086453ed97283893e763ae0989f4b70f8d": {
-        "ticker": "DGC",
-        "signature": "3044022028687020741b9e3543ac64dfefa9eddfc00feef524a6bbd2e08302bc33a2743602200fc0af4fc8feb0c8b0fb8e09d8f44d8a2abba8b825c78b4ddac5e843d463dc38",
-    },
-    "0x1cd8a3d8b3cf9e334cc49073088cdf6435333559": {
-        "ticker": "DIQ",
-        "signature": "304402205e61605d3816640228bb4180d6cf1d7a9f874be9f77e2510db3c35ccdd600dec0220535944afb39b37b3caff9b219eeff7ff6f57115844b1fa6d7177827aec48f5b7",
-    },
-    "0x3419875b4d3bca7f3fdda2db7a476a79fd31b4fe": {
-        "ticker": "DZHV",
-        "signature": "3044022013291f2c22c4613126bc831ff04c4b3f45d46e64c22adc9fc16fda2dd38b30a502203122d0c1d033790c3bbae7f746b25067104030ce55f1caab0e1937d6de45bbb6",
-    },
-    "0x420420d590afc2873d80f1ad4d11b54b44803f69": {
-        "ticker": "DOGCOQ",
-        "signature": "304402205cd12782808018251cc2a21d4be6806ca221728e78462528c235d3609664911902202bf3e89528b2e7f342a40558f135e2384df5ee9c365ba9ceada037ea0dc6a7be",
-    },
-    "0x1db749847c4abb991d8b6032102383e6bfd9b1c7": {
-        "ticker": "DON",
-        "signature": "304402203fb5e593e9ebd720602bc40c09e1208f820c3e399c64e9471aef1a57835d817702202337500722caf85443110117510d2930db46c1d849eda66e3313e074067036dd",
-    },
-    "0xc06e17bdc3f008f4ce08d27d364416079289e729": {
-        "ticker": "DWC",
-        "signature": "3045022100ec4dc6a02d5387268b2bf47b2924b7d3064fdb7023081a3daa8ed260c685f2a0022064909b46f88e8577700e6b506502bca71333a14adb3b71102a7bddb465402b4d",
-    },
-    "0xfc6da929c031162841370af240dec19099861d3b": {
-        "ticker": "DOMI",
-        "signature": "3045022100fb2c79c6c23671d5cbae832690e09734bcde240a6e3fcf2796b493c54b4de1bd02202cd1fac7ee52172dfbdaa28e316a7db34c7ae46b1e454d209cd17aff907f34ae",
-    },
-    "0xa7e951c0ae1e93af39d73bf3d2f24f72cab73181": {
-        "ticker": "DONK",
-        "signature": "3045022100ccee66fe12d8b8e09c595a2f4b1afa8c0cf2def3ad32c6c7db14fe042a00380d02206001366c3ddbe7c2d1e257cc107ae666bd0f32c0d3f65b8ad1c5b38f71ed0560",
-    },
-    "0x250bdca7d1845cd543bb55e7d82dca24d48e9f0f": {
-        "ticker": "DCAR",
-        "signature": "3045022100d82d2c1d148ed794b57162636264141bde8f074905235d9ac13ca732326712db02203fb7f45c219a3370ec6ebe5211822c3a11de0ced9c2effbb8040c484011bcd44",
-    },
-    "0x100cc3a819dd3e8573fd2e46d1e66ee866068f30": {
-        "ticker": "DCAU",
-        "signature": "304402203e16e8a8aeb92ff46b88856c5f61bac649ec10b555e9ed2ad31d22b27686731b02207b8eb77f4f4870b8f2f07dfcb850e3bb395c8f04a2bc0270138f76ee56747df3",
-    },
-    "0xd7c295e399ca928a3a14b01d760e794f1adf8990": {
-        "ticker": "DSLA",
-        "signature": "3044022018197c433750a6f074a9c716acf5ce0346395e83c656c6f1fd76888d62749c0e02201c0532607f8bb94bbfa674b66dd8c8e7dde3270029a347f312aed2b54b1d5a72",
-    },
-    "0xb418417374fca27bb54169d3c777492e6fe17ee7": {
-        "ticker": "DUA",
-        "signature": "3044022002286cbd3c3b3cb1e3ab0b266a26b7ee573ad3bb85b3089ea4fdbb2dc9de94c80220238ae0e894b869e8e52ab89e40c22c2ae1a75da7519a3241a0df294c72a3c8bf",
-    },
-    "0xb2c5172e5c15af6add1ec92e518a5ea1c7ded2ad": {
-        "ticker": "ECDPTP",
-        "signature": "3045022100e088cde07fb5fffc4189e3a9ee50be5fc03b89ef075232afe940570c9b3fa9eb02204f3678f30f6b2676308f6b5b7fd545b5dfebf24839b3b2df07c2f59b5c87bc49",
-    },
-    "0xeb8343d5284caec921f035207ca94db6baaacbcd": {
-        "ticker": "ECD",
-        "signature": "3045022100957a4d6bfc585b98c1f20364515e90c6ca90f3a6095017fe68c95199c81a84270220245e3c7e59c5ba311755cc6a59f572efc9fcf27f1ea5b72697d430cb8ae54866",
-    },
-    "0xe1c110e1b1b4a1ded0caf3e42bfbdbb7b5d7ce1c": {
-        "ticker": "ELK",
-        "signature": "3045022100ebce07758c723ab02dcd9d9c0cff94859c59548c2cedcd48b138403b11c2f10502202154bd4c3b1f4cf5d651a0249b5ae78ec01bf7e4b2d38e1d1b8dc77df186e2c0",
-    },
-    "0xe533b81297b820d2eb2cd837263926596328e8d2": {
-        "ticker": "EMDX",
-        "signature": "30440220321b4ceaa457124d9bd5bf904784d6257dba3aa0268d4819befcb295387b50ec02201489a408fc9145ab62ddef0599395af56a65f30986de7c7001266a2e0514c72a",
-    },
-    "0x97e7044ab98b7891546485f5f66edcc2f58be106": {
-        "ticker": "EM",
-        "signature": "3045022100ca0f8587656884e2461b5c24a3a1e3ea0c4ff72eb72c93810bb835649ea4cbde0220490baabeb58f2fdef81d5620d488dc434b27240aedb0c9e4272d46a613df1c62",
-    },
-    "0xc92f165f5e20979576a7ba48f16eb45361c078a2": {
-        "ticker": "EGS",
-        "signature": "3044022072eb0d4b0644cbe18353c3215ae781bf9aa9e946b18212faf65175b63eca5cc402202ee1ac576166b8b5b29b7ed50c662d8fcdf959c6512baa5725079d500e2cc6d3",
-    },
-    "0x164334ed9e63fbedc8b52e6dbd408af4f051419f": {
-        "ticker": "ENXT",
-        "signature": "3045022100a1f87680f6b25d5903e257c00216f3501c929bae477dcd1a2323c7de4f86b1b302207f09775b64fa0dae5e85bed23f3f2a7cbb40dcd27449b5b797a3c318a9bb2c2d",
-    },
-    "0xf20d962a6c8f70c731bd838a3a388d7d48fa6e15": {
-        "ticker": "ETH",
-        "signature": "30440220383d2a25ad1e53d02968d0e992d1a1977fa8fdf5a2afc36f191ade3e1b7e0e60022016f025d5490b4832acdb994e34bb7438e8c4645be6fb96ce63711b329620e03e",
-    },
-    "0x08d58f06ddfa9b99ae651f68232014be3914c5cd": {
-        "ticker": "ERN",
-        "signature": "30450221008fd9829ee4127d55472a5ea0768ce00fb91f7ca1460b79eba2437fb03fb7be8e02206d479f6c259877295b5c0a51a1195789c13ef40d0dc15f436822cd95c073d846",
-    },
-    "0xc891eb4cbdeff6e073e859e987815ed1505c2acd": {
-        "ticker": "EURC",
-        "signature": "3045022100b6cbe7cae5bdfd96abdc35957ca62e52f5a7d37c01236e2a85b4397c299e465a02200910c126f18fde7d4df85241203d476861784ee9b1a7821cfa614184868dc107",
-    },
-    "0x14eb40fb7900185c01adc6a5b8ac506d8a600e3c": {
-        "ticker": "EUROT",
-        "signature": "3045022100aaec9c72ddfaaf0bc7804b667581dc11d6b33f18a87fdd260cc004c3241d912c02206f4967e10b3d003f89900732c5f75258c879013b74cce7bf83e298bf4caacedb",
-    },
-    "0x820802fa8a99901f52e39acd21177b0be6ee2974": {
-        "ticker": "EUROE",
-        "signature": "3044022054d38500e6e6b2b1571a450809877ca166af4288c58c2ce0bdceec64c04720630220567b24a855b557f490ce6ac36a7861c6aa3e9d3325caf8b5a8c74bfcfb673e6e",
-    },
-    "0xc17c30e98541188614df99239cabd40280810ca3": {
-        "ticker": "RISE",
-        "signature": "304402206e6ecb35d9e530487013b5e623f055a91429abeb35a1d1ea8e1076866b7c834f02201eaa62709b1aa43b93b9384bdab4b6d952274e1a14b79182407228cf118f8dbf",
-    },
-    "0x42006ab57701251b580bdfc24778c43c9ff589a1": {
-        "ticker": "EVO",
-        "signature": "30450221008494b4b599abe9c528c270150f0e5f8d4cf6a801980506537ddd5af56b2e789e02200b274babe75964d63ce4b2abd82a2eed648be081d213f384b7dd6b3b6e047d26",
-    },
-    "0xe5caef4af8780e59df925470b050fb23c43ca68c": {
-        "ticker": "FRM",
-        "signature": "30450221009aafb577c00f3a233e6377b9fa8c70416d94cfe221bbea87f64bb621b238e81f02202679b5e9789bbd3cb8a6ed14b56b796c2b5510faba97ef4d8f24258795a904a6",
-    },
-    "0x73178fceb736a9d6c1a9ef1fe413f09cba2d4a68": {
-        "ticker": "FEVR",
-        "signature": "3044022077c6eb5cd76a90afc0a897b2a8719dddc53f085faa7ef2b4fea6d98fc9da762d02204d74420535ec61cf4651a63cae8f9b21b0c0d359248958ab5f9506d02c3d0959",
-    },
-    "0xfcc6ce74f4cd7edef0c5429bb99d38a3608043a5": {
-        "ticker": "FIRE",
-        "signature": "3044022047dc1b49473b8491f9c7dfb5739dd8cd02a78760a23562bfc3fd1d43834c39bf0220662ff58981a38379b10632cdfb24cbb56a0838335995e0643d0746323056e297",
-    },
-    "0x107d2b7c619202d994a4d044c762dd6f8e0c5326": {
-        "ticker": "FLDX",
-        "signature": "3045022100942fb48da76a44c2053d2e6aecd3a877afb6d34eb591bc1fa655e56f43ec96f30220494ccdb3f79b93d8a44c352a7ffa1b3d2bec8e0988edd0c6d110db8e59494a47",
-    },
-    "0x78ea3fef1c1f07348199bf44f45b803b9b0dbe28": {
-        "ticker": "FLY",
-        "signature": "3044022009451b52271b3f14062b78dab8c2c23d8e9c1c07dade71568cfe164260a47e8902205b6fa9ec70ca2f07af08532ad4c5fbef513a8ef7b19bdf4f7d1e38ba0d89fdfb",
-    },
-    "0x88f89be3e9b1dc1c5f208696fb9cabfcc684bd5f": {
-        "ticker": "FLD",
-        "signature": "3045022100fcfcdce4b4939a8b1dd5209557f3b04a5519451fe7672f45b563d7c846a5544f022024c890ab41047da1fd2baebeadcd083e434b351888a7ef5e6cb83c95ac9d1a90",
-    },
-    "0x99083d1b9c6744c71d0cf70b8965faca37684527": {
-        "ticker": "FRF",
-        "signature": "30440220050874678c50839fb04bdb3b5f64eb5897eb9009b4af11596ba686e9a0286d6b022009f27b0b189c3bed34d1f79e3397bc4f6c71e696653fff1d75ab3f9a3cd3a2b1",
-    },
-    "0xd24c2ad096400b6fbcd2ad8b24e7acbc21a1da64": {
-        "ticker": "FRAX",
-        "signature": "30450221008888c0a0286c70424af5cc87626334986b209eabfa1e586a5743f70f519dbfdc02202338d926e5caa6080c3fe84f0ac43ae58f2d095eb4b0ca0e3e24e8e873db926c",
-    },
-    "0xdc42728b0ea910349ed3c6e1c9dc06b5fb591f98": {
-        "ticker": "FRAX_A",
-        "signature": "30450221009b9d364e1aaed7ff787db3fefaca10d125beffc3399355caeba4a483b35dfc72022071d56d29fca41105d6f3ba1b54b75ba4f8c27c9907a15212292b5fb75bed9a9e",
-    },
-    "0x214db107654ff987ad859f34125307783fc8e387": {
-        "ticker": "FXS",
-        "signature": "30440220513eee5516f47591a0ee37625d1cb96a47e3e0ea3338ccc15f253a71cfca307502201ccf205f45ae2101d7265b9db196d716ac79fe058c7e3f44acd8b24734060bf4",
-    },
-    "0xd67de0e0a0fd7b15dc8348bb9be742f3c5850454": {
-        "ticker": "FXS_A",
-        "signature": "3044022075635129f32211202cdd0c8ca0942eabd9e5e124d99563f2b2ae98fdad779b2c02202fad77f6e35ffe0563a21ec9ad370c5482eaf0c0334a11515aae88d3a8e5e0b8",
-    },
-    "0xe6d1afea0b76c8f51024683dd27fa446ddaf34b6": {
-        "ticker": "WSHARE",
-        "signature": "3045022100ae9529af01201693268fd5f296ac0cfb6f05a47ff44c83ca52b5c8812a4acfc80220675c41f6d2ca1eed610c4cb590dcb75941bed5af9493a55738254b784e2b0623",
-    },
-    "0x395908aeb53d33a9b8ac35e148e9805d34a555d3": {
-        "ticker": "WLRS",
-        "signature": "30440220425a2aca4e07b066fd9482fdea41e1f26f45df7f5103251b5211da9f00f7ca4b02201f2a8352e67ad9508b769b4e2b20718f0feabfdbfea116896fb137954087d2dd",
-    },
-    "0x595c8481c48894771ce8fade54ac6bf59093f9e8": {
-        "ticker": "GAJ",
-        "signature": "3044022068b9f5cb64b5aee9db74339e47d1e6df6cf8bedc537dac669c08e3b403f072de02207c4c7ae8a7e9233711a70e82a6f9be2ee4ee59c89b5f73c738eeff13d49f2f43",
-    },
-    "0xca8ebfb8e1460aaac7c272cb9053b3d42412aac2": {
-        "ticker": "GAU",
-        "signature": "3045022100f8389bfc6a6919c0ff6eee5ac2d00ae52de56ac12ef6b7d0e13d9d74cee7d3260220489d02cc20706223f5b34d77dbc88f884e6782b905188f98523132d84938080c",
-    },
-    "0xe8385cecb013561b69beb63ff59f4d10734881f3": {
-        "ticker": "GEC",
-        "signature": "30440220214a6af86bebefc502cf700d02f313700ea3475856664cafd18bd7065048ff3b02207a33cafc7a716d56f9284c18a1108366009e371501b35ce15dab82755eec70ac",
-    },
-    "0x444444444444c1a66f394025ac839a535246fcc8": {
-        "ticker": "GENI",
-        "signature": "304402201ac24e7cd7b95ef21b3318947a3fc5af3bbc37e7e274aa2c8ad504414c74d87702203ea5a56b584e8d0ace63d3b689dfe6864cbb81af927df0ac5e90041816627b57",
-    },
-    "0xa12dd2e5bcd0611a9245518902effa73e788b142": {
-        "ticker": "GTRYC",
-        "signature": "3044022006ad71c320bddff24ace8398894d41f086f5fea1ad0752c198ad296229227d4d0220047f8860e8886c0273ece2743563146277bc947df36f42524f07a030fc4ead30",
-    },
-    "0x3712871408a829c5cd4e86da1f4ce727efcd28f6": {
-        "ticker": "GLCR",
-        "signature": "3044022063762b634db1486e452d817b3af12387b6214185768c432a56fd25e40ad4bdcd02207da61a7924a8919d6f3962055f0ac1ea44fe31542c2618cac4b5c2fad46a938f",
-    },
-    "0x0c7d9adcd4bab7783a477c76f9492da0e1ce00ca": {
-        "ticker": "GLSHR",
-        "signature": "3045022100fbbe212422204b71f9f887222b64669b3a2ff8b3bab16f5872406f0e26e2e5da0220375d0c5d578e18129162ff2e186ef422e1bafffdabe782a70884d2e368b406fd",
-    },
-    "0x1fe70939c2cec8f31e8f7729442658586b469972": {
-        "ticker": "GMD",
-        "signature": "30440220485dfefae68c20e697f81129a72a6c24ebd921de07bbcda09e1983cd9ebcc1d302200926badfd320591466dbc1c91c3ac6c855b6f824f83c729d84d6f191648ed084",
-    },
-    "0x62edc0692bd897d2295872a9ffcac5425011c661": {
-        "ticker": "GMX",
-        "signature": "3045022100c05bcaf69da7dee49adb7077bbd8c68ed1d7c82f34ef5b1156feb83065343e850220754c310e5f578612c4b1f3e0f6740692eaf26142d2392b26e478d06982bb0a13",
-    },
-    "0xa25eaf2906fa1a3a13edac9b9657108af7b703e3": {
-        "ticker": "GGAVAX",
-        "signature": "3045022100a2f246aa1d9dbbe1e8479032d5f579faf08c7f68e3eed277e3eaf4be0ab190d802204c2a4d1782ca6f38b2155c1bd02ded034dc9b0e1126dfe02c453f99d554f06bc",
-    },
-    "0x69260b9483f9871ca57f81a90d91e2f96c2cd11d": {
-        "ticker": "GGP",
-        "signature": "3045022100c268e875dad89a23e65186125df13079cab1889520fa46a5a6b51a4d42c322ce02203533715450a9c0fac5566e7a1e27511b396fa183e81a871acae9c23276fdd244",
-    },
-    "0xd606199557c8ab6f4cc70bd03facc96ca576f142": {
-        "ticker": "GDL",
-        "signature": "304502210084f1ae6c51ae1116180db051ed55b4f5ab96e290253d9b526053b9aa8edaa07202201bc240015e8d72fe3f8c8c99cd961b734c236b2da60eefeff471c329a7213c7a",
-    },
-    "0x90842eb834cfd2a1db0b1512b254a18e4d396215": {
-        "ticker": "GB",
-        "signature": "304402205b4af109c52905f3e775f1240f7c1171781f6402323e613f4cc6ade23a537dd702205753f33c378652a09c0716d8a39d64d98b968da166f30eb3b62ee2fb14f3f2dc",
-    },
-    "0x321e7092a180bb43555132ec53aaa65a5bf84251": {
-        "ticker": "GOHM",
-        "signature": "3044022063ce7ffb5fc984d1d97b9efcdb56fffc85de2dc16d90b45d8865f3a7c132e52202202110109daa240eea4c69e0a1a52bc598dcaeaa1c436911f521dfcff31f2b896b",
-    },
-    "0xc3fb03e75cf916973d430d63635f3f6154d01dc9": {
-        "ticker": "XALGO",
-        "signature": "3045022100d995093475cd63b43863ef24f87b27d0c0ec1986920673ff0e38a9da04990eef02205d4638497908c140bd55445df58aeca270fe5e02a2e9405f7957f5b25e17e374",
-    },
-    "0xae55ab6a966863cb4c774ba8e6c0a37cfbea01f9": {
-        "ticker": "GRAMG",
-        "signature": "3045022100e090dc8c08d996116e25a90fe17bbbe811967514f4ed0a496eb94be45ffaa39402206f498ca6891fc6bfa3f7d4e748677bc461d6c95b9a555ae4e17c2563371ab9bb",
-    },
-    "0xe229b734251dd48dda27bb908d90329f229c3531": {
-        "ticker": "GRAMP",
-        "signature": "3044022048ab42fee7fc4a83a32333e34879fa5f7628793004903b098840df58764c41940220541b8c54d3149b51a9cd779be8ec986f96a557d61ca412eb57cc9315e9f15e45",
-    },
-    "0x9df4ac62f9e435dbcd85e06c990a7f0ea32739a9": {
-        "ticker": "GRAIN",
-        "signature": "3045022100d6122068f10b69b4171a1530afadc017de6e3f80f4665a49af10c658a72bd8f802200e1bb185852ea3d779486a36ec8599d51b4cc39d35ffbdcf84b692f2907a89d0",
-    },
-    "0x5541d83efad1f281571b343977648b75d95cdac2": {
-        "ticker": "GRAPE",
-        "signature": "3044022020b7668a13894f1c21ebb068246066e9fdb80fbc8762e8e04e4f40c1fb624f8902204ac3bca3398d4d1a56e0bb3e48abdda1dbd720a60bb0ba5fe3045b553bc89fad",
-    },
-    "0x95ced7c63ea990588f3fd01cdde25247d04b8d98": {
-        "ticker": "XGRAPE",
-        "signature": "3045022100d2c90f6746d2cae44e66b0c3a42aaec9f9e51afbc420eaf10821a085950fe21102203fc5edee25c21ccd471321a80acd24934f15b994f50df66c78bba6ad058ea6f7",
-    },
-    "0x46c54b16af7747067f412c78ebadae203a26ada0": {
-        "ticker": "GRT",
-        "signature": "30440220091c53cde6cabad42735d15a4957d4fabd4e09a0d882e7b3a74ba6c8a05f863402201aac1cd4c5045f25774db0b014e924678faaa8aeead60678b2d8c73d151f912e",
-    },
-    "0x8a0cac13c7da965a312f08ea4229c37869e85cb9": {
-        "ticker": "GRT_E",
-        "signature": "30440220575a180223255759dd9841513da9bf5877988ad5c03e2c1aa779be71a03cefe202204b58ac5634b3f93e3ec6e5ff869d37e1f17a439df065334eccc3488baf626eba",
-    },
-    "0x945ca41d03ec19b6a6ebf2ef0f4d0a50b23e4f2c": {
-        "ticker": "GRELF[AVA]",
-        "signature": "3045022100fd30b5f1785a87f6a6a123aeb1c290e179cfc0a052d879992a0f00ac3b7ab55102201bdaa0fe675daebe6e6124d5553f132be4d62c475e58333955ab00cd156e056e",
-    },
-    "0x223a368ad0e7396165fc629976d77596a51f155c": {
-        "ticker": "GURS",
-        "signature": "30450221009fc5a58d91255eb9fc60fba5be7aabaa5d8d5a4faa16777f9aed08088351434d022057e532261fd8f4903cafa84c76e6c3af9a742e3ab2c7d5b8087ca41d44d36f78",
-    },
-    "0x695fa794d59106cebd40ab5f5ca19f458c723829": {
-        "ticker": "HAKU",
-        "signature": "30450221008b0030b6993370bc83d0a3f38986753a6ae9fbf263e2974b99725bb4dcb9ec620220082da37e3ead2f2a8ba040b625564d2b9ec9ef0afb0885b01301bfb746cd09a1",
-    },
-    "0xad17cd0a550ef4ecbb73789626dec1326520b96d": {
-        "ticker": "NICK",
-        "signature": "3045022100a5f51c8c4d3dd4e61512ab3c1a79644fe695d2d8f106c3a4a1117f094d9b6cb9022045ab46238ef148a910c2cf5975acee688da1133fc1bf7f7bf9be6023c532f977",
-    },
-    "0x502580fc390606b47fc3b741d6d49909383c28a9": {
-        "ticker": "HATCHY",
-        "signature": "304402206aae9d31c048b1dbaebda96ccf53b0e94e758ce9f4e2b344fe61a54053a205bf02202d4515769ecfbd440846fa68d95d9e3699a32f9a98bf714a2696d43d2ac7324a",
-    },
-    "0xe7250b05bd8dee615ecc681eda1196add5156f2b": {
-        "ticker": "HJOE",
-        "signature": "3045022100c46a94438390495a5b2fbc0d148ede1a0d0edaddb3d74e60c1ec38a99d186c8c022003f4b3b922bf425195183c92b3e674ed523a88b2a2def091b883aa6d171bfc4a",
-    },
-    "0xb15f02f9da8cd1f99e9dd375f21dc96d25ddd82c": {
-        "ticker": "HERMES",
-        "signature": "304502210098a86ecc370ffb57361a62a6903dd715eca7847304e80d4ae174441c8eaaafac02203f261d4021f0bc36b849e0f3f0d831368046656afda8a5d663b6c8101b8c2c65",
-    },
-    "0xfa4b6db72a650601e7bd50a0a9f537c9e98311b2": {
-        "ticker": "HSHARES",
-        "signature": "30440220070c4df7777f59965bb37d0e0c0e44c647a02b5287e9ee9253eb707da47faec702202ddc5b529200c80d2460e6a04e2ffea9f2688e5f850721dac915108fc4a7db13",
-    },
-    "0xc7f4debc8072e23fe9259a5c0398326d8efb7f5c": {
-        "ticker": "HEC",
-        "signature": "3045022100ca261af796ce75555d5498ec1ac4bd5530ed14d58f5d46b1b7db4753d4750643022015fafebffd5a83febbe95f1f8074591d6f8127a45d9f751bfe74001ebddf4b03",
-    },
-    "0x9c8e99eb130aed653ef90fed709d9c3e9cc8b269": {
-        "ticker": "HTZ",
-        "signature": "304402207f65e1edaf4aadcde55e6bb1da24d18ab20dd889224f913f920e6409822b6a56022032da6a9917f0282ec42823d086f7954cca54da6cfc12dbc995479d210cb2c10c",
-    },
-    "0x806cc7a21bd85e960857ac1e097802fabad6f594": {
-        "ticker": "EARN",
-        "signature": "304402200e02d1dad2e8399a724356fc5025b9139a861d599eb4f17612a553c2c5e19c0a02202f965181e8be95b5b35bfcec720db5f1508f2bda8ab9ec0c729dc494b8bbc7a6",
-    },
-    "0xed2b42d3c9c6e97e11755bb37df29b6375ede3eb": {
-        "ticker": "HON",
-        "signature": "3044022046d2d38aba453386967b736b48cf8bfabf8212c72a3eb936d07c6e596b151f4702207d1f32fa6d5d64bdd5dce5e0533fad2e0f36decfa988ded8556a825eb99ffc84",
-    },
-    "0x0fec6d8a84a85b79a1ffe0e28c1902e08b653efe": {
-        "ticker": "HOOP",
-        "signature": "304402207328deaa074d2b785499b360fc14f46f52b947448d53d180924a3928ab94878002205e5d677eda68ac75d3a9350b1daa086dd208752a3197ec1d709cf952b0a8155d",
-    },
-    "0x2f86508f41310d8d974b76deb3d246c0caa71cf5": {
-        "ticker": "HOTCROSS",
-        "signature": "304402203ba11f6c83109a7933419dac94016610881b851b6dff386b228a9a4fadddeafe022057f092f1cc62a574827c679c9839a9c5312c429fd166b48233b8292ebc7683b8",
-    },
-    "0x38dcf0532699b880e6a125f7d918380524cd60a6": {
-        "ticker": "HBOT",
-        "signature": "3045022100fb1318137d48e7f470494932a5aab7d6eeb4b42e20265674c5cffbc9de6df9a302200a490486c9a9814b7a2cac18c58871f7b9b020312a12ea1b3be5dcb556a66ed2",
-    },
-    "0x3ce2fcec09879af073b53bef5f4d04327a1bc032": {
-        "ticker": "NHCT",
-        "signature": "3045022100eecb4c1161cc3b86ec929e2931da65c6ac3bf0c26947ef49e9c29c56aa59d77d022005875fc785323066ac10e3f995834f560be7750342d458a946968a6f34fd5e43",
-    },
-    "0x45c13620b55c35a5f539d26e88247011eb10fdbd": {
-        "ticker": "HCT",
-        "signature": "3045022100a985394baf69b5f872560d92b923d7c5daa9775b381e633b1d31288ed2c18c6a02205d7c727ee5f079c54b8cd7e392a3285e1485f47bfac45e77e1c3ee1f1ccf268a",
-    },
-    "0x65378b697853568da9ff8eab60c13e1ee9f4a654": {
-        "ticker": "HUSKY",
-        "signature": "3044022002b758926c39e08e77b828dc41abbfd27eb5af5f589bac43e471bb10356bb46702201078d68d005cb8a00ed5f952e7d48572d23b9bcce7072e624c056b985a600e6b",
-    },
-    "0xe0ce60af0850bf54072635e66e79df17082a1109": {
-        "ticker": "ICE",
-        "signature": "3045022100f57e000e8a9f9ee43b71c9f9254a0c10c074750968fc90b3a20afe7b4a794e47022066e9ededb83e459d3ffc8de0b6bb3933150faff51b692a9a20d489f6d9547bcc",
-    },
-    "0xbd100d061e120b2c67a24453cf6368e63f1be056": {
-        "ticker": "IDYP",
-        "signature": "304402205d1c47cbf56e18cd19155a4fdfdbe1c4f95963e0f35643854f3cc92ae86ce83a0220438007d71890c7d543b3a418fb9f3cb2f5e62ca4313a53227876e0f7faa2653c",
-    },
-    "0x38076962036d65a40dc6d0c9256d19bb020f8ddc": {
-        "ticker": "PACT",
-        "signature": "3045022100bb22c21a3c3f6edb7bfd8bf234c434232c833217113c65b08d893cd6497aacf702200c966ac710d2ad338b50c6dda6133694fc7eb8d4ab63dd1b77121e9e1e0c6276",
-    },
-    "0xf891214fdcf9cdaa5fdc42369ee4f27f226adad6": {
-        "ticker": "IME",
-        "signature": "30450221009bfe4596066057fa5d828f52c9ee4bcf41c890ed1d5be7834f09b03ff5b7caf40220038aab186723797a8a93ac5bb7aa1716c86e1ee834ce1efed88baee576858d3e",
-    },
-    "0x089d3daf549f99553c2182db24bc4336a4f0c824": {
-        "ticker": "IBEX",
-        "signature": "3044022069a7456987095e585d95f9a2fba6dd3a0a75e10731fcd44ca344f70c2316bf02022064c6fd75174f25a74835c4af118abe63fa0849a57ca04815798a045ca032fefd",
-    },
-    "0xfcaf13227dcbfa2dc2b1928acfca03b85e2d25dd": {
-        "ticker": "IDIA",
-        "signature": "304402201ea5f1a0a67fbdf0ef8b3dc5c7a5649a4cefc566fb4671dfad808e4e0169e85f022028413fd6dc3b5009a0cbdddb90aca3605496e6864818f81b305aff0bfa3dce0f",
-    },
-    "0xea6887e4a9cda1b77e70129e5fba830cdb5cddef": {
-        "ticker": "IMX_A",
-        "signature": "304402201ce8804c6e3741abad26e39fb1971685507464725f1f32f8d165129fd5879c7002206a56dab6632c8e4f23e67674990fe5ec08fd42d716ab6be7bdba674887174d20",
-    },
-    "0xa9ef87eb3fdc2f08ef5ee401326f7331d4d312cf": {
-        "ticker": "IXAD",
-        "signature": "3045022100f3c5f0cc82a712a535bc23d45af8c7a05a6ff359e8dbf9ad8ff0a19ca232843802201e908f859f0f3a2acffda2849b95b809e66df0e4867c9b23b198fd56d1993bfb",
-    },
-    "0x32975907733f93305be28e2bfd123666b7a9c863": {
-        "ticker": "INK",
-        "signature": "3044022073cc51df320d60fbd360dc50510d9755c4b18a01aec308f42373a1a58b2fea3f022043427c0eacdc814229ef2be6c6735f2618eae09d4a2fc9c5b622b327b69e6146",
-    },
-    "0x544c42fbb96b39b21df61cf322b5edc285ee7429": {
-        "ticker": "INSUR",
-        "signature": "30450221009baa498fc12f89fed8b2ffb78b40db6125df609d4538366f96bb43dd7debf428022020c96ef455af5b6530a68c41c6f40ad6cf2e243ec13498a4f4ef3efea63e1614",
-    },
-    "0x5fc17416925789e0852fbfcd81c490ca4abc51f9": {
-        "ticker": "SURE",
-        "signature": "304402201ce9aa20a60bd59a8579d05407a60a4d42d0a12db2a980f4302732e089ea8f6802204d594a060573824ee17d0bd86120ad5f9046de5ead0e7071e60ee92d5a3281d0",
-    },
-    "0x8bb93979901cd159bf6763b223fbb315c31ccf7b": {
-        "ticker": "INTD",
-        "signature": "3044022041d1d181ef082d54833a93cafbcf8d1202298ec00568e71d0f4bb245683b2b4902207acf332a781d47aecd3fc936b10853cc15dfd9ecaa1fbbad2dba9131498b03f3",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "30450221009d649afe0f68b0423618f7edbbc8c1352f0aca2db61c70bca01ea5d342ed75770220737dae94ca36d9de5a4f288a1b726b5a01201eeaf10e94688c050378e4df0caa",
-    },
-    "0xfc108f21931576a21d0b4b301935dac80d9e5086": {
-        "ticker": "IRONICE",
-        "signature": "304402201fabac413ac511a523cc5c1df9d27881c1642a32614efd9afba817ec79e77faf022073c7603fd0349647b9a2856c0308e7ee99e6e9c2021a26e322780ff0e5a514c9",
-    },
-    "0x3eefb18003d033661f84e48360ebecd181a84709": {
-        "ticker": "ISA",
-        "signature": "30440220363e35d5271f13e1c839ae9c819395f26b437a5a5ef7d0d3ee56d493c4be754402207a17740557d0231ab5dac0dd00fc7138b2484443c5d4efc47bb4a7133e2b2f83",
-    },
-    "0x7a023a408f51c23760eb31190fc731bc12b52954": {
-        "ticker": "JNS",
-        "signature": "30440220013c79edecf49fa32dec95cb54db9bdd670306d6a6c373a31c5900842321d9f102207b210414b276f005cba3923fc7f98b20dc8de112676126d75b30bf7369a493d0",
-    },
-    "0x4f60a160d8c2dddaafe16fcc57566db84d674bd6": {
-        "ticker": "JEWEL",
-        "signature": "304402207283e17baf15ccdefc1b83ac3939cdec04c2dac62497ccaa06c07780e55e80ac02207f72ea8987c5eaa0d1de95a3a5b0148574d685352418c3bc16df4ce520c70294",
-    },
-    "0x82fe038ea4b50f9c957da326c412ebd73462077c": {
-        "ticker": "HAT",
-        "signature": "3045022100f97966f21f00e7ae42a3b76430380da15079c9184fe9e4b31caa62e44cc3654d02206235daaac4580ee749f03e7319c32ec6d2de3971a2c26aa66bfd65aa300c4ea6",
-    },
-    "0x57319d41f71e81f3c65f2a47ca4e001ebafd4f33": {
-        "ticker": "XJOE",
-        "signature": "3045022100cfd2f2e1eb0221c5571b8b0abfd2963c03be5db6d5cdb9e0a6620ec33e057d0502206c6240dc4491bc996c633c8c67e3b2176814e38eda55b5b899c5d62d88674377",
-    },
-    "0x6e84a6216ea6dacc71ee8e6b0a5b7322eebc0fdd": {
-        "ticker": "JOE",
-        "signature": "3045022100d58b4dc12e752ddb88da671433580b3ed1a3781ae3221fc440e4d3b24cf689c1022008df4e4468fe39590656b6bd19fd906f4e54ee783397b23818641240dbb0bba6",
-    },
-    "0x431d5dff03120afa4bdf332c61a6e1766ef37bdb": {
-        "ticker": "JPYC",
-        "signature": "30440220725b6ce4338d18eb8d22d69e231f28b56594bb91f0d18d2afb2f37398fa5bc9c022071a1e53646cc38e7ad6b8945c3727ae728794be2d8eacd9d7e7d3518e773f842",
-    },
-    "0x4e3642603a75528489c2d94f86e9507260d3c5a1": {
-        "ticker": "JGN",
-        "signature": "3045022100ecb17cef145d1043ea4b14360d347b726858de4c97d0e1fb9d1a2df97d8a2e97022023731ed90ffd45511ae4e9561f464bc103870addb115a9f13ecb488580731b87",
-    },
-    "0xb27c8941a7df8958a1778c0259f76d1f8b711c35": {
-        "ticker": "KLO",
-        "signature": "3044022002c647868bc6ecb1b34589cb5dc696fc00a810535e1d04c74c3956eee6292f58022001ec8a446accbd93ad798d2abd9ca1be323b5dbcb6c93ed1386f6e962d02564a",
-    },
-    "0x62aceea3e666c5706ce1c61055fac1a669d31d93": {
-        "ticker": "KALM",
-        "signature": "3045022100ede3614d3a866c53df4a72ab3e7a72101d3ea6ebb1473da84130d9d6837ad82f022048ef0b5fe03d8f8074d2acb8cbdf43ba1c9f74ac2512ef4afd3269275951418b",
-    },
-    "0x33494c24d904b87b94a1cc9870d966780d56093c": {
-        "ticker": "KANA",
-        "signature": "3044022032e2a3eaca4a6ab280bb71732185540d86ddfb5edcc787a4a5a938f5055c44a002204b1ef0f673ccc6d77da1600f7a85847b26905b10ecbec060ca0587fb290bf3f5",
-    },
-    "0xf32398dae246c5f672b52a54e9b413dffcae1a44": {
-        "ticker": "KACY",
-        "signature": "304402203ba1404aed24747a7d9ca3f96ad4cd7f3e757893918828407b26ae9975864074022001e109717dbd0ebf4447deb211fffdf7adf74ba16fd81a9fb4fa96f3144d7e11",
-    },
-    "0x184ff13b3ebcb25be44e860163a5d8391dd568c1": {
-        "ticker": "KIMBO",
-        "signature": "3045022100945bcbb4a4a85d6d1e9fa51b25670398f527334b16b6dd5ae090cf2f9e191a66022032cce181a95438e01c7bf3ae6e83a3521b27615d7120e305d60028284dbf49be",
-    },
-    "0xf3ec49acb3084618121741e4bbb20996d383e9b2": {
-        "ticker": "KING",
-        "signature": "30440220179f4de495eaea163a534e8be0d849f52f5a1df21108244e3d90941dbc012f52022059bf8d6ee65be21e2865bd5f91e07929742803bbd17da6b9b03f796ac395bbc4",
-    },
-    "0x94d649e017625de1aa04733aa046de0161df18ef": {
-        "ticker": "KSHARE",
-        "signature": "304402202729e1d038f9563fe29a6aa1783623c6f78283612399135d235e5cca038a50ac022056eb0efc29b576e32aa2acf62207309aa14cde1089637f5ec135de1951edfc10",
-    },
-    "0x54a77f27d2346c3a8f5b43a501434f0f21f33e3c": {
-        "ticker": "KGC",
-        "signature": "3044022007dbf715a599f7a672493705afa9d9dfb6bb108dd19f0a3766202a7f679cf4cc0220593060df77a58d529177ae4bf4b752912462b57aa7edc3e780ce33a002eb8c9c",
-    },
-    "0xbca7f1998dc9ffb70b086543a808960a460abca7": {
-        "ticker": "KITTY",
-        "signature": "3045022100fa07a1fd50a3a760598bb78dc8be9364a33b4211c1166bd32b10e8f038e9df1f022068daf3db488dcc8b48ef0768e5589e49269494ffdcf38234a0f112d104d8e7db",
-    },
-    "0x788ae3b5d153d49f8db649aacba1857f744b739e": {
-        "ticker": "KITTY",
-        "signature": "3044022037c19acee2f93b21799d2cf13f1f13c3726fc958bf9a32de6c9026b357978c17022011b1f2ce4689e29e8f371224789309741e8dd855d14852445ea2df457680c772",
-    },
-    "0x2905106e44b72c1a0d29735fcaaa19280e59436d": {
-        "ticker": "KOAVA",
-        "signature": "30450221009e3fe03a4e78f22542c92acdd8541dee2830e7f991d744d43fe02545c28b99200220614d80fa9b1e585c6738706c5ea2d9835733edf9b37c81101cd19228d44e91c4",
-    },
-    "0xebb5d4959b2fba6318fbda7d03cd44ae771fc999": {
-        "ticker": "KONG",
-        "signature": "30440220780608b7a0dcd77e10a04f5d4de8b0fc1abb0e73242c9eea9147fe556379495a02200133ede0da0c8573ad98db0a135042a5a973d4e227ed2f92dca6b11c84dc6369",
-    },
-    "0x694200a68b18232916353250955be220e88c5cbb": {
-        "ticker": "KOVIN",
-        "signature": "3044022046aceabcb3851155f15de008f78ee3b218a9ac6143cab98ab80d5275760d2f580220580eabf55b69f90b5a88ac4bea8712552f071ad8897a287d12ce00426156ad08",
-    },
-    "0xa5acfeca5270bc9768633fbc86caa959b85ec8b7": {
-        "ticker": "KRW",
-        "signature": "3045022100a8922c20a09925abbc0bcbd781b63eb1e1dc24a558364b5ec450df911340f5cb0220269d48da9936f8642c6baeb1ae8136af3699aeb8b8684801cd76fecd583cab4f",
-    },
-    "0x39fc9e94caeacb435842fadedecb783589f50f5f": {
-        "ticker": "KNC",
-        "signature": "3044022025d8b849087f01ccbe85c40d6daa6fecb8de56e5fea58916e028808209b0a71c02201b02348bc50acc14869ce120803fb5d6e06d74beda832d53dcea11c522edf45d",
-    },
-    "0x056d114ff1e01de3bca30f0efa3655df42880e5b": {
-        "ticker": "KTE",
-        "signature": "304402204aa554c694ec51bd988b6e9a1ad8bc865ae7b9de91e01bd023861599e0eb2e34022036ee1c9f5e90081cc6d747248c2bfc1e444475fd9b2702a5fef17486a04cdc2b",
-    },
-    "0x89a8633bcad3af0951acc5137811ea21a17c37dc": {
-        "ticker": "LAMA",
-        "signature": "304402202bcac12c83e1d4ef60c6662fa019d4972f5f151be861a087233d147af4935f7c022029560308df200d748e11153a1a13e0e7241d57e4ac1b4932a5d0d90a18e48a19",
-    },
-    "0x4f94b8aef08c92fefe416af073f1df1e284438ec": {
-        "ticker": "WOLF",
-        "signature": "304502210089dde63d4187f376c2b7236da582bb2e1db1cafa6bd45e7da9020154c713410602204b442c6ed4a6ef2c2073dcbc6cd0c9f18875417a7179445be2925ec0a51635e4",
-    },
-    "0x04f388e30bfd03f357ae061ec5680c7e4ac4cf09": {
-        "ticker": "LEO",
-        "signature": "304502210094c976b67e6f961fa34bcf498b55c5cf654bbd69b996232ee68f79c9cf1803fe02203d80a758b9eaaca4225810dc55ca4789757c64a1a8ba11c84a5cad6d64a0855e",
-    },
-    "0x8908ea968d2f79d078d893c0bcecd63eacdd9322": {
-        "ticker": "LIBERA",
-        "signature": "3044022000e7da737a6033b1fd045dd5980562b6c7d5950d3b9ad887bde1aec755d1387202207ff28661527b7c381f6e24499200ed1e63084cbb0d86d69fbf71816b2f918db3",
-    },
-    "0x039d2e8f097331278bd6c1415d839310e0d5ece4": {
-        "ticker": "LINDA",
-        "signature": "3045022100f734e9f70a90426e1c83482e0684b4c1146436adff3fa45398cb207d8a8f25d2022059adc88739de4b2a9796f5a0e80869912c405421fbe7b7c269e40dc00e61450d",
-    },
-    "0x33333ee26a7d02e41c33828b42fb1e0889143477": {
-        "ticker": "LIQR",
-        "signature": "304402202fbc5f01ce082fbf84a4e1684ce66000992bf825d1dc75c7457bdd41e6d6bcd902205a1a6cc51200095a2d7c9d778cb3ba0ec1a85fcb3ba5d14517b0fb03e28d02a3",
-    },
-    "0x872952d3c1caf944852c5adda65633f1ef218a26": {
-        "ticker": "LQDX",
-        "signature": "3045022100ab4f93712cd5e5280cf827182ad2ee74c160264ee87e1c8465d809f8588d726e02204125c9ce9c91cec443b005a0b282b57d7b170cf01f7a5214e70a5c447b404e8e",
-    },
-    "0x95e376390f472fcaa21995169e11d523954b3bbb": {
-        "ticker": "TRYT",
-        "signature": "304402206f02b35f698f4a6abf8433e3796bd80d753f9e51e0ffc94a8e525a7fa17c061b02205f73842f6c0e51340b3eb670667cad85cb4ebd852d7e14fdd3ff44d5dcb9fb49",
-    },
-    "0xed0d09ee0f32f7b5afae6f2d728189c5e355b52a": {
-        "ticker": "LIZARD",
-        "signature": "304402206dcf3b2b790405536cdfdfce705648cc20c71484c6fbd9ba10a9000ef39f74f302207e4e5d9abd8013a047f2ff5ac550da40e50634d383359783b420a369bd639bf0",
-    },
-    "0xbbaaa0420d474b34be197f95a323c2ff3829e811": {
-        "ticker": "LODE",
-        "signature": "3044022003d674e46a04fead85b816ca0c9ea4291c457e2a7408eae621ec59737475328202202be12dff62fa2dd6dc61cccd4b9df5326df9152462310945ae3924f772377e91",
-    },
-    "0x5a2c298902f5ba4c3d8b88f9f7cf8f5be72303b9": {
-        "ticker": "LOONG",
-        "signature": "30440220692f60cc4d70372bdce249e3f0969b6a57b865183aae609324ede8fcf12afced02202c63fea4a40b13be76a709c736869ba1fe1b28dfcd9283f946bc88da7c5d07ec",
-    },
-    "0x7f041ce89a2079873693207653b24c15b5e6a293": {
-        "ticker": "LOOT",
-        "signature": "3045022100832f31d9bad02c1a6d31f8809cf94bc708624f5b2c63c78b5dcdedab3624fda0022054fbae86e762fd42f88fa69201611a272bc0ace4679e12a99052809cc5a14d43",
-    },
-    "0x449674b82f05d498e126dd6615a1057a9c088f2c": {
-        "ticker": "LOST",
-        "signature": "3045022100e592ba613e545fa652cd739ba45eecb9dc9aa81ddce747b7a1c6a596c4185ee502207f54551c3da32ec3703b0369de0cff345d83c4c04fe9b01b22414e3c247a3d76",
-    },
-    "0xb5cc2ce99b3f98a969dbe458b96a117680ae0fa1": {
-        "ticker": "LUCKY",
-        "signature": "3044022060da59b48d3d16c1b25cd86d2c4308d49707832e1070e93200970c322fcd306e02207308af06794a667e834adc8c1ed5e08125f6414d45b42948529b80ef88183213",
-    },
-    "0x4c9b4e1ac6f24cde3660d5e4ef1ebf77c710c084": {
-        "ticker": "LYD",
-        "signature": "30440220440cd2ee478fb2d4a622f42f8634e9d0931f8f1973dd81d4742368ac233a76470220683cdb375013c5afa610a9dc893475897ea2b5ba14c1a046f5e4573be2dff263",
-    },
-    "0xaadba29443178a5ba5c79492f6e0e13901fdb2a0": {
-        "ticker": "MAD",
-        "signature": "3045022100da2d73fd814f5a12c0bf33c9baca25e4b71a17b94eaf06402837d42af1f9a21a02204fbfef738a6dbd5c8248946a54e74f75aa7d64e74db855f8da791339c43054eb",
-    },
-    "0x53b22d356f34e977e48921e07381de0f8200b8e6": {
-        "ticker": "MAG",
-        "signature": "3045022100c17ff0385cf5e99510b2f53957aebfc867f72f8af1876ca88691a660a5d8de2b02206e65187ff16cb2d6013f1997727f87c112cefb8896cff346d641f03189e28a60",
-    },
-    "0x130966628846bfd36ff31a822705796e8cb8c18d": {
-        "ticker": "MIM",
-        "signature": "3045022100a2c133841f7b9d4ef7ff32557d1b17625a08db3456102219beeb6904d81bab5f02206e7768408e43f003f47198005da6249d0b37117bdf493c81d45492dcef520b31",
-    },
-    "0x9a8e0217cd870783c3f2317985c57bf570969153": {
-        "ticker": "MAGICK",
-        "signature": "304402203ced9d1c081e55bdf9ce397092e224a54ccfe9bcfda9b48962e5be4eb84bb7da022037675a98d82b010ad855beed20d9d013eecf904112a1a1e9a6e8ecc92a00e535",
-    },
-    "0x3b55e45fd6bd7d4724f5c47e0d1bcaedd059263e": {
-        "ticker": "MIMATIC",
-        "signature": "304402203c90711075ddcb5342b4b151268affc4ca361f2c1f36ea466f66bc9d7801ed2c022056532432f69d47b96cd423ebc73ca65a17e4bfa7ed24e482390e2e474f485489",
-    },
-    "0x73f49d00ac1b520f94d11248808c40774aeb0802": {
-        "ticker": "MAJIN",
-        "signature": "304402206b22fc5da93662fe0e63b027600a44462c7ed3f49b588303720c4f2d87a8399b02200e0e2d72fd57d1489eb9639b6db85f0a379a6ce5b803b4064baf878f5211d303",
-    },
-    "0x88128fd4b259552a9a1d457f435a6527aab72d42": {
-        "ticker": "MKR_E",
-        "signature": "3045022100828109f162eb4b7c8fe63d4d79c160a21f712911885ca2636092458aaea1235e022020277c074c6fd4ee41fe0ab0628d4cff01113ad2a365f7df4eee9005aafd694b",
-    },
-    "0xbed472c62a5aa4dd734b6bf5eba1413d86aaba6b": {
-        "ticker": "MAN",
-        "signature": "3045022100ceef440fa698a515d01b3f8aa38e55d72fa4abf8838a22e5345cfd42dacc35e902201dfe0b60a2cc5ab20546612f2b1b561e2aaba543dc01caa7f1bc4633fed6f445",
-    },
-    "0x9fda7ceec4c18008096c2fe2b85f05dc300f94d0": {
-        "ticker": "MFI",
-        "signature": "304402207842b788f7bb5de2f3b59abaec90ebb02b7ba083e9f37223ed8228251d3f11af02201f57367abc85e4391d3df924329617420381cb12a18d46375ee005a4ffb908b1",
-    },
-    "0x7c08413cbf02202a1c13643db173f2694e0f73f0": {
-        "ticker": "MAXI",
-        "signature": "3045022100edbc4927789e966b2a1bed3cf9acddb9925c442377d92e7f1f4a122f8fad7cf60220043e4da819369baf2c9a1dbad7b4a10d46d1b1b90e83bddc4ac162e708daac65",
-    },
-    "0x885d748c00a279b67a7749ec6b03301700dd0455": {
-        "ticker": "MAXI",
-        "signature": "30440220298b9e579c3f962907162755a85c7bdfe77ab0e8b9991eaedf1f5826cf9a1ea70220335a3b074f3b16ed30bdc659d3bb2c23189391661919950dcaf8cf32b4aba0b8",
-    },
-    "0x916aba115f5162960e48a2675ad4d8cbd09ce8e4": {
-        "ticker": "MCV",
-        "signature": "3045022100ababb9d4024828fc7339f5d15bcbb474f6cf55cecab05ed95947d03c23828029022006daf4561330ae3e76da83b7daef876ae5bd9a95896388479392f97a7d6bc6d0",
-    },
-    "0x47c3118ad183712acd42648e9e522e13690f29a0": {
-        "ticker": "MEAT",
-        "signature": "3045022100cbd4bd53fe3d8c94eead76d48a4c74c5b1fca6594fc3142ac2bfe5bff5e83822022046ce74acddb2ae59141c5c1261e199576530e7d165529cfbefb6613ba3d23054",
-    },
-    "0xe3b3f75f99da4ff26aa867ef70b48f8f6b2d4958": {
-        "ticker": "WEAPON",
-        "signature": "3044022050e1291b0ee9deffbbec4f1881ca1a2e37e790c685c49e263de428d5913500c602207343495e3839f2d772ba4e86429107f0a362452b543f9219854e205ec4635db3",
-    },
-    "0x333000333b26ee30214b4af6419d9ab07a450400": {
-        "ticker": "MELD",
-        "signature": "3044022030d38983b95ea4488d4f692005aa2518cde7eaca75284b2dadb0a0ee2ed72bea02206ba4292504b2e74fbfe53aa2bcb26d701eb7fdfb857a9a9d52b87149f383394f",
-    },
-    "0x136acd46c134e8269052c62a67042d6bdedde3c9": {
-        "ticker": "MEMO",
-        "signature": "304402206f91f6126937a68fc5e3aca3810bb5e11a3202f0002103eb29b35c2bf03f91ea02201b40d4dd8c4780e56b544577499d10a01fa7ece841baba2d747a67921ccf254a",
-    },
-    "0x8ad25b0083c9879942a64f00f20a70d3278f6187": {
-        "ticker": "MEOW",
-        "signature": "3044022065c803b3766e751d285e19bb9b2d60c6a6a7abe3119fea08d59fad0d40ac3240022003efe50c58c28993126758f79e86e297e407089ac233ac394eb5de0ac904d08f",
-    },
-    "0x921f99719eb6c01b4b8f0ba7973a7c24891e740a": {
-        "ticker": "MAGE",
-        "signature": "3045022100a0ba16f815985076d56f9bca36e62d4ee60e9bdc313cd58b61738329c4c55d78022030364695a122516c76e6215e8e2e631eb59258b8e8bab268dc074f9533d900e9",
-    },
-    "0xe0bb6fed446a2dbb27f84d3c27c4ed8ea7603366": {
-        "ticker": "HOOF",
-        "signature": "304402204a249427ff36b8691ecdb9ad600060710cb1586fc69dbccc22eacc4259f4bb1902203bdc74bdbcb2ded7cd61ef96c210cc85c70665f81dd774f79dc2f51f26545c21",
-    },
-    "0x5085434227ab73151fad2de546210cbc8663df96": {
-        "ticker": "DBY",
-        "signature": "3044022040af79d4382594b4c87bcaf1f6fcc6a7dbdb66e5812a06dee889737e72b69893022020a2da03eb255d488eb3d657a05128dbd55592d3f29de0b3dff6f154295e0a39",
-    },
-    "0xceee63ff114f8e8debf5e78a14e770e5b905ea91": {
-        "ticker": "AIM",
-        "signature": "304402204ec919f5cd8a904bfe0a297a29fe9be02ddf3b4a9c7b06ce491434029dc3020602206ad2183ccc064692c3acfddc256484dffaccb743d38c8c228e1af74f01b109e7",
-    },
-    "0xefd6aa06eb95e0ab23de9ac0977d870888b89a71": {
-        "ticker": "MICRO",
-        "signature": "3045022100cafd2512ac78e09b500bb0b901d0bfdecaf30f2ec908203222c5c7cdbe8ce9ec022060138b8b2618f4fb0e6dcbec7f212a5e8e726ce247feb62b6f07a130d3f5689e",
-    },
-    "0x56e361f23a37629908c409e6f062cecd7c184456": {
-        "ticker": "MIKEYS",
-        "signature": "30440220779d9098209456c8ecb6da64ad903918c622f9d333500fc62022d5b139a3087202202f421fe5d39757a668ec4892af320e5fa26c20d443e7d1174b1a189aea2a8a5f",
-    },
-    "0x721c299e6bf7d6a430d9bea3364ea197314bce09": {
-        "ticker": "MILK2",
-        "signature": "30450221009aafb45fdd28e724058c5b4943ca62fc5c94ed927eec1b4f22d4077f033f623f022007442bd5f8bdb9e625e3beb5001a6b70d5bc782b42a8ba6ac34d10353cf1b6d0",
-    },
-    "0x5c49b268c9841aff1cc3b0a418ff5c3442ee3f3b": {
-        "ticker": "MAI",
-        "signature": "30440220158faaedd463fce6477f290436ba5736e55c4c774c26f8de2a43201de006d86402200823aa44e6db2e0d92d93393c8c3637b11cd60472acbf250d9d705b08fe7e205",
-    },
-    "0x422812fc000e831b5ff13c181d85f34dd71380b3": {
-        "ticker": "MPT",
-        "signature": "3045022100c4bf1f216d3e71557a4bf4249c540d3c2968558ece33a57fa93f4a83221dc7cf02204789f0b008e85c2fcac14bbd5492114fe40945589cdca8aee62b0e545b17a41e",
-    },
-    "0xdd33ef5704ada19d254cb636b5a0a1bad3936050": {
-        "ticker": "MMAC",
-        "signature": "3044022002de73b2a276cb0e44b5b877e312f7a58b573de3cc55bcf3759f65324114654902204defb77172c56081db91aadf1944ea3ba0522ec7a4d0b12ece413a9c1024f85c",
-    },
-    "0xd9d90f882cddd6063959a9d837b05cb748718a05": {
-        "ticker": "MORE",
-        "signature": "3044022006fb948087f87495dbe5107ee249a426865fa0ecb82cdc2cbbb7b1460c00eeb702202559500124caf1ff04f4ac3b76a3793f685eef7d77d7e7f31b1387e4c21108fb",
-    },
-    "0x0f577433bf59560ef2a79c124e9ff99fca258948": {
-        "ticker": "MONEY",
-        "signature": "3045022100f0ffc21f42b0ba918985f6d3993bce727c54bf3e48f519ccf80091185c4ac45e02206274c513f0de1f5715e06429a6ecb0a168396b1625cba7e5d00e7f32481b769a",
-    },
-    "0xe397784960f814ba35c9ee0bc4c9dffdf86925f9": {
-        "ticker": "MSTR",
-        "signature": "3045022100e458212f168b3f974c9e5aa092e6f50d0157cb48b15e080114398fec201ac7340220733ab49ae9588e57baaf786cc49d8253207c45597c6778467c721a6a78bed3d7",
-    },
-    "0xd036414fa2bcbb802691491e323bff1348c5f4ba": {
-        "ticker": "MU",
-        "signature": "30440220286ecba6cfd0444f392e8a5591bab2dfb0d3b360c54ea4b728c0d2c2626a7a5302203fac4ceb0f320fb0c6b563249dd9108d6a303dc9512be2ef7f02449a78334f96",
-    },
-    "0xc1c57c2975622ebe97d5c0980cf231787324024c": {
-        "ticker": "MUME",
-        "signature": "3045022100e8a3415d7714222292951fdbcd5bb3241e40af750b2b27c7113b6a44f3f237060220451eaa1db595116976934b37a71eb60212ccc023b6f7e9003d11e8fed903adc9",
-    },
-    "0x9fb9a33956351cf4fa040f65a13b835a3c8764e3": {
-        "ticker": "MULTI",
-        "signature": "3045022100b28574ef53e9d138242407ce66d191bb62001e63ced56451066e57b776676d1102201e0f237a544cc5fdc576f13db56d7792256ec07b79a24df47998cef2aaa5cd64",
-    },
-    "0xf538030ba4b39e35a3576bd6698cfcc6ac34a81f": {
-        "ticker": "NEMO",
-        "signature": "304402201577add43b19a27435dc432b6789e8cd24e3d97d8943852df1aad0f49cece85802201783ec903903b2736f69514533bfcb7a9a547310802fd38303f05ee7868f017c",
-    },
-    "0x4bfc90322dd638f81f034517359bd447f8e0235a": {
-        "ticker": "NEWO",
-        "signature": "30440220080790ed4b74858210ebc653a3e217925ad127a24133db546b4cf28778eb8a950220623b3bdbfe1c60b8cf600c6719ed232d70592c8ada448bbf596083498fab577c",
-    },
-    "0xd47e4f1ef1aa4090bc27420bdd5cb379ced81440": {
-        "ticker": "NFTE",
-        "signature": "30450221009da21a5321e4865e4d0511ad464a5fb138e88377cd38b6b7f73c3547a298468f0220527016cb2a339eabbce0186442f7da4995cc2f12c60eea73a3b071f5d67f1c95",
-    },
-    "0xdebb1d6a2196f2335ad51fbde7ca587205889360": {
-        "ticker": "GEM",
-        "signature": "3044022004c59ed57a14f703b792ed8fc1076dd44671afde081c311eca18e520da710d5e02202b545f23a59ebbf784b11351f7e0f353d3e50ca13dcc15cc0bc4e5447902b155",
-    },
-    "0x9e3ca00f2d4a9e5d4f0add0900de5f15050812cf": {
-        "ticker": "NFTD",
-        "signature": "304402200c5e041b42c2508bd7fdf2b4ad4c793eea48c78ce88d3b959171cce286f76caf02207b507bd5ffecd6c623fb118f717050133daeb9ec2579846ad59802e824b0c024",
-    },
-    "0xf69c2fcd9128d49dfa22348c69177f9380438eb8": {
-        "ticker": "NFSG",
-        "signature": "3044022073b1f4d0323933c5b020336d56902fad3ea4b978d28036b5aa29cb2a3431409802207060943ba5002feefd705539cc4d26155f68ace0ecc512f31b36d92ce040a1fc",
-    },
-    "0xc69eba65e87889f0805db717af06797055a0ba07": {
-        "ticker": "NCASH",
-        "signature": "3044022041f9af012bea5e4ed72cbf0caa05250c4e09eb9a8718fa08d2d6534fd7a75c5702201db8736258379256cf6e6773d78188ddbb35c70de1f364468f59ceaf46f776a1",
-    },
-    "0x5ac34c53a04b9aaa0bf047e7291fb4e8a48f2a18": {
-        "ticker": "NAI",
-        "signature": "304302203a8bd6515fcac5e93a475d0faaf39fb503cc5ea3f8d90c0ae6f4b8c5c30b4036021f318961d005bbd37f3fa9d9bfe14e505cf4e48b2a396db35d57faefcf548f34",
-    },
-    "0x5ac04b69bde6f67c0bd5d6ba6fd5d816548b066a": {
-        "ticker": "TECH",
-        "signature": "30450221008fe705ee235656e3c65e7289c557ce2ae816a89e8f30a2d64a4d3470cc377e1702202ddff37cb6c167cb736c4e02ef2e41a5fc3799912b6ce807686a564b2b458db9",
-    },
-    "0x771c01e1917b5ab5b791f7b96f0cd69e22f6dbcf": {
-        "ticker": "NNT",
-        "signature": "3045022100e8159ca6c67278504ad4a30bf01b60e71e5f767e1eb0d4fba78a27f62a46cbbe02204e5eb6b59493d086b7e08859a1f1063d03370904acf458aabf6be8c52d1b303d",
-    },
-    "0xf14f4ce569cb3679e99d5059909e23b07bd2f387": {
-        "ticker": "NXUSD",
-        "signature": "3044022047740f6ef655431e23db857e4e6b718802e4c6d28d44ad11c45a3a4accf1cf8402207bc21cf9beaa2a3f233a2256d22b1b6784315237a746ad9b6721ebca4b322da2",
-    },
-    "0xee9801669c6138e84bd50deb500827b776777d28": {
-        "ticker": "O3",
-        "signature": "30450221009e69ea13a4c7b0d540b2d8e884cb57d441b8b3857f80323fef29d05618ef3454022000df75816eafcdd07c54d739eb7c987f4e1527de9f8f3699688f380a876d33fd",
-    },
-    "0xad090976ce846935dcff1ded852668beed912916": {
-        "ticker": "OATH",
-        "signature": "304302206e4e66f22ee9c8a484d2c159fafac1f3bfea33f19b03d7484573b121c89e8824021f4e4c6300da28056a0dc8528638d49421abf2ca6089cac2debf61896a5a8b0c",
-    },
-    "0xb0a6e056b587d0a85640b39b1cb44086f7a26a1e": {
-        "ticker": "ODDZ",
-        "signature": "304402204f11807d50a4c56eb603e692eb096183e31ede7c65a95d70789c08d3f7131b6502200ea2af4084cb270be771974a72543f06d4b8d5d39816e5a1032ebca025945bdc",
-    },
-    "0x937e077abaea52d3abf879c9b9d3f2ebd15baa21": {
-        "ticker": "OH",
-        "signature": "3045022100a781926be6273985b48dd20db57ff8411257ae2561529f5efaee3db0b823c24d022035c4fc9b0e28c0c6f33009ff8f413e58b927d06b0dc9c4fa9d19e4fe0a028ffa",
-    },
-    "0xd3ac016b1b8c80eeadde4d186a9138c9324e4189": {
-        "ticker": "OK",
-        "signature": "30450221008d27e15a01bd8e41f7ce4f3b6b9e1db8e12d7eabd8b145135d09402b0dd90f9302204a643bfb3bfc7a83969293b94f8592e663d2d68c0b285e68c7fcf5d9da16fe1c",
-    },
-    "0x617724974218a18769020a70162165a539c07e8a": {
-        "ticker": "OLIVE",
-        "signature": "3044022069e1928a2c59d488188366270058755296b2688c7ffd4941707f6e52363741f30220102121a8cb34716c9ea4927f893c2f63a0eb49bf9a069993497e66073ea9d9b2",
-    },
-    "0x979ffd8eed7a43629ea29581df4bfe2b3f224e47": {
-        "ticker": "OML",
-        "signature": "304402206ae4128bf8d20652f6af62acf21ea1a35ccaff13b548c59513f22afbedf7535802202d6c25bae9fc106d2a1609b8a3f3ff6daa06e2a120b652f711f30700b506740c",
-    },
-    "0x081dd0195830ed24be1d16f76561985f4cb24fb6": {
-        "ticker": "COX",
-        "signature": "3045022100973e8f60abf9ee9e924903c4a9f257f4768a286f50e13b8453894b907ce0e62602204d82ac20ac1d90b76156fba65f170a003f0c3dfa5389fc767ca81f2bdcd68407",
-    },
-    "0x72bc9d71dd9ad563f52270c6ce5fb30f617c7a1d": {
-        "ticker": "ONSTON",
-        "signature": "304502210097cef77b69a77663e0739da243b492872959c838c4fd659a93c6f0bb3c469dcd02202fe8f69507e6d5409b8567f29c7d4f741230feed7ae261521d71fa2a455c0cdd",
-    },
-    "0x3d8f74620857dd8ed6d0da02ceb13fd0ed8ba678": {
-        "ticker": "ONX",
-        "signature": "30440220490bd638795360155e871e7b12954b46caa7b83bf592f0adfbf0ba839c3aaad702203502a6311b4cb9a0e62dc1e46ad111df2b4396379852d0e9549f0ce2a248847f",
-    },
-    "0xccf719c44e2c36e919335692e89d22cf13d6aaeb": {
-        "ticker": "OBX",
-        "signature": "3044022029b3149da01fca23565fc56b133ad92d4fbd01399481e80ae75bdae1c231224b02204f778cae55868f15d54607eaf4303e23cd4d9751d03debaf87c4090778ebc423",
-    },
-    "0x0ebd9537a25f56713e34c45b38f421a1e7191469": {
-        "ticker": "OOE",
-        "signature": "30450221009a8ea16370a2ffbec928f1b911aa8a51fd59be3f73f4ff5960ac83b127feb005022047368c6be449b62a1c09c12c0d7fc32c71b1a66abde404718fe2b71de954e99c",
-    },
-    "0x340fe1d898eccaad394e2ba0fc1f93d27c7b717a": {
-        "ticker": "ORBS",
-        "signature": "3044022077efe52cec3aec7b4013fdec6b1a825ca7db64f5289d61cd382a9e57b96976fd02205a6552fcbd6973edd422b6871d8fe7d9e83b689b44b5f65a99e91731db39fd7f",
-    },
-    "0x8b1d98a91f853218ddbb066f20b8c63e782e2430": {
-        "ticker": "ORCA",
-        "signature": "304402200eb9317c5a5d35117f6577705a08721d3f918d4604cc87deedd84921e7499d3802202d70271d0e1115b75a68ab587f362cc9f50b98ec79594bc3d81d02771d5402c7",
-    },
-    "0x96e1056a8814de39c8c3cd0176042d6cecd807d7": {
-        "ticker": "OSAK",
-        "signature": "30440220550873af711340685d79cade1d821f1dfbaeadfa6e5e9fb63a3c13c1330ab69202206d558f79aac1d4dd71701b3b8a28c7a73eb2b060a3743f2185f3db07589eeb4c",
-    },
-    "0xab547a8dc764408ce9dea41bdf689aeeb349da12": {
-        "ticker": "OWL",
-        "signature": "304402205de0d37f83eed026c637326d9124a47cd546c99c2755cc48d7fbbbac0b01fba50220423d1d154e4d50f22cb20467354a79ba775e5380ff9351bb6f245239a1fa9f64",
-    },
-    "0xba0dda8762c24da9487f5fa026a9b64b695a07ea": {
-        "ticker": "OX",
-        "signature": "304402205eb1ff67760f4e4e0948107895958989152ab6a5f1793d07bcb71b4a72fe38c60220285fd4872c26f012c28cf39e768f24067bf9052175f85a0a038ba1b43dca9ddd",
-    },
-    "0xabeab64bcd203548d2dcbd1ed623398bf0b8055b": {
-        "ticker": "PANDA",
-        "signature": "30440220225358377f5fe81dffa1a2451267bb2b2d06662a906f31535615d181f91d950b0220796aa6759b6b33ef68cf6955f98aa3782c8e221d68fb756b25377d056825afb7",
-    },
-    "0x60781c2586d68229fde47564546784ab3faca982": {
-        "ticker": "PNG",
-        "signature": "30440220318ec991397f9e66e40c1094bda6d728c41d58a58eda52c92a28869b283712370220047a31938232e37b0affa6a7782c18863aaa1f0dca859588359b7ce82caed12f",
-    },
-    "0x1affbc17938a25d245e1b7ec6f2fc949df8e9760": {
-        "ticker": "PAPER",
-        "signature": "3045022100f4ce95285f2a37acf58628601d6e92c29841bca8fe78cbdad5785e2d435348a20220132bbd1a12da2dafca2dd867ed2cf32a8854af62730618e8a94578d471da0da2",
-    },
-    "0xcfccee441963aa4aeb39214f7071378a99f4e766": {
-        "ticker": "PAYDAY",
-        "signature": "3044022055982b8ed91531ebb37734e2b9891406ff4d8eb9c64d26b64ac9210822c091d70220182a9d8d288eb7695c26cc4fbb5d75edbf7a0b83026b0be2318104243488cec1",
-    },
-    "0x0ef27ddc8f89d4886e89d630de089962ffc12e43": {
-        "ticker": "PGX",
-        "signature": "3045022100c69119ef0dcb284659d18906b35c4a74147a13d2a974e7679288204dee40aebc02206133e057b944ae638fdce8bfa640165b1f20d1a814ba736f4b1db3a2492f9657",
-    },
-    "0xfb98b335551a418cd0737375a2ea0ded62ea213b": {
-        "ticker": "PENDLE",
-        "signature": "3045022100a12de443c113bf033492bd529635f0ead0a618603ad1ac837282c2c8b3d90e1e02207470d7a5bf6e09c916ce539203f442ee0a6435567a9b9036ab44175d42b3341a",
-    },
-    "0xe896cdeaac9615145c0ca09c8cd5c25bced6384c": {
-        "ticker": "PEFI",
-        "signature": "3044022011e6535c21f9baf80c4ecac7dd1b6343a086b952997cc4ea886bbd49438ce5220220533a728796c5a6bff257038e6975e8564cb7632e149931a6718f969eba709b02",
-    },
-    "0xfda866cfece71f4c17b4a5e5f9a00ac08c72eadc": {
-        "ticker": "PERA",
-        "signature": "3045022100fa8aca97ed13cfdefe024ecf60c2d5ef2dc9cedf299e944e3fdd9467438a29d202200a26d120575e2c234c35856c4a8b1b3798a1779129011aebf6b5f6125b669e31",
-    },
-    "0xaaab9d12a30504559b0c5a9a5977fee4a6081c6b": {
-        "ticker": "PHAR",
-        "signature": "3045022100a6bc0c667376cbcc5fee84861cb34b6bc9742fccd6ad3ec4b210655660ae27ef0220316db90d7a62f27ed383c4c20e715de3f6b128f9444a48078100d92af41dbe94",
-    },
-    "0x1a877b68bda77d78eea607443ccde667b31b0cdf": {
-        "ticker": "PIGGY",
-        "signature": "304402206c6169490adb527681a76311e27fb6c527f8e524e369bd43648f81e693d1703702207c9cbf18b5c76bbe60ebaf86325a71765b53e8be65a2630c9cb36fafe8a059c5",
-    },
-    "0x6121191018baf067c6dc6b18d42329447a164f05": {
-        "ticker": "PIZZA",
-        "signature": "30440220556620babed3ee75e1d756c85dffa1421b13d2ea75dfd5018f852f9e9626ba2f02207c9a47abc2cf7e953de400578bb4e9e5db7543426a8307697ab2c2c27b7c89ad",
-    },
-    "0x22d4002028f537599be9f666d1c4fa138522f9c8": {
-        "ticker": "PTP",
-        "signature": "3045022100d11557cee5a582fa56c1397fef5447e95c6b54a42ec9ea1e0b98d74d10969ead0220638412809ed5cd71b1281391c8d14a32b8f87b008a369b7aaa0ddab517e28e9d",
-    },
-    "0x490bf3abcab1fb5c88533d850f2a8d6d38298465": {
-        "ticker": "PLAYMATES",
-        "signature": "3045022100bfcd3691d3a9149d01da95984900989a58f75d40339cd241e53a3ae92cb59112022039b709b49d83058b19b9d5a7baffc759800c828c49665e573ec7ddc8d331e29a",
-    },
-    "0x15fa5d3dbd11a831b72b92c1705bc9f801e233cb": {
-        "ticker": "PXP",
-        "signature": "30440220420d93e8b2c44144bc701761702e08eebcd36c453a34c1a2c39e8cd566295a1102203090e5f24ed084766ae516a31a07bd5ed6f6afdaefc1a47ba5f46d21918c5665",
-    },
-    "0x6c1c0319d8ddcb0ffe1a68c5b3829fd361587db4": {
-        "ticker": "POLAR",
-        "signature": "304402203e2a75d17626797df9fe39acd124447ac6e87614f664d15f3f6731f9e565c47702206fd4d53829d57dafdd276e002ac6d31a2efa0576e44b4e9f87e6c2c44af12f03",
-    },
-    "0xe1463e8991c8a62e64b77b5fb6b22f190344c2a9": {
-        "ticker": "POLS",
-        "signature": "3045022100e0c5ce0191a768e08e8a145e6791e3670ee9d5695a72e87a0cb599465d467eeb0220090cd3af7302dbf0e66e2eef1b3ef0630f320ee47230b7268cff032175818cb4",
-    },
-    "0x7b2b702706d9b361dfe3f00bd138c0cfda7fb2cf": {
-        "ticker": "PLN",
-        "signature": "30440220347ac705e0bae65fff215b67c8340c1064aa42d5796b7ea99de7df9115536f7f02203c2b4432bbaf191471e768d2ea775f2b2de776a816f70a4f51b6d7e1e750dcce",
-    },
-    "0x637afeff75ca669ff92e4570b14d6399a658902f": {
-        "ticker": "COOK",
-        "signature": "3045022100ecd6bdbe030d5be6cfd47cb30f8fb6139f976501c0f71c950eaf7d273c00cdd002205aebf441f889fcecfb081ba84f8dc8fd02542c88b90ee86acd18672ee56ea422",
-    },
-    "0x240248628b7b6850352764c5dfa50d1592a033a8": {
-        "ticker": "POPS",
-        "signature": "304402205f760f0e70be13d9319a4d824195e531135c0c3798a8dc2b584372d8fccfa30e0220658cf73e7383d98ec7d9902eaa04259099abaabdfaaa19e85cf76f7949d9aa64",
-    },
-    "0xa5e2cfe48fe8c4abd682ca2b10fcaafe34b8774c": {
-        "ticker": "PSHARE",
-        "signature": "3045022100ef82b53cd6f049161c8ecbcffa9b2699c698e0ded5a0d191ce870655d4c5c19c022073df29999b3c718fa212703a77374d9c3ead8cf24a9525b8c7bd9e44a092b325",
-    },
-    "0xfac235f442ed946087c1db9f70075b51e698a487": {
-        "ticker": "PTER",
-        "signature": "3045022100eed17a4600057a8385e612fce8140d48c5120134c812abd6d9ad97268c4720e0022022e21b97111baf2c73b20d0836682bd3d7bf3941b18b08d884b21ecc32be308d",
-    },
-    "0x4a6b1f8872f08daf38d3b675937c7a59751ddbe1": {
-        "ticker": "QE",
-        "signature": "3044022012b97de5bbb659978dcd0c9c9049c427bf606cf58e34b9068cb0051f1196f9c70220496ee9a8ca5032f628d19d85eb7d68ed24d5da1a160c4a709b99dca4ee763c25",
-    },
-    "0x7086e045b78e1e72f741f25231c08d238812cf8a": {
-        "ticker": "RACEX",
-        "signature": "3045022100872eed485527d6edfb54656d270ffb35857506b25fa75f1f9e331d90f7ef70f2022004397301fe6fba8c424c823fa3213515d7d27c4862ee94fecbde51c4b811c6c5",
-    },
-    "0x02bfd11499847003de5f0f5aa081c43854d48815": {
-        "ticker": "RADIO",
-        "signature": "3044022078e10d07c4a577ff8c15c48261609bfb39add193190ea33fee6a782ac83aa1fe022002fdf96e4bfc87052f6fbf65a5df49da87f5ea9ac173581113ce77c24a70686d",
-    },
-    "0x97cd1cfe2ed5712660bb6c14053c0ecb031bff7d": {
-        "ticker": "RAI",
-        "signature": "30440220540afd3a449b03ec575dcf3b14e53b110e97006cf2525136c0c2f9e1e3737e1c022002ff1d54de509ed3dd0747cf4ac2deea43c6b6cb62be163c7edcf59a80cfba10",
-    },
-    "0x23675ba5d0a8075da5ba18756554e7633cea2c85": {
-        "ticker": "RST",
-        "signature": "3045022100c5f16361205002c23450151431500001513bf01dfb8ded5f1eda39fc6f6024c202202811dc6ed64864501eba53a80815062cf9185dcebb27bd79de181fa81aa5fddb",
-    },
-    "0x94960952876e3ed6a7760b198354fcc5319a406a": {
-        "ticker": "RBX",
-        "signature": "30440220421885a704ebef998449d4b8d6d14d9be1dda14770176859208ec06beac6fb5502206318c3ca0fe4cc03fb42a3e6afb2610d1ef5dc4ae09e253205c24310ee00b651",
-    },
-    "0xf6240f39f9f82e7cafbe6ffe0bfaf1e2e4c5bdb4": {
-        "ticker": "AGAME",
-        "signature": "3045022100c6ba71a04f7752dbd268032c086a2e607ee38248f43dc46f85a12d5143aa2bda02200cffca11586f2927a80a6215b81037eec5205698c06e60eec5686bb8d15eaad3",
-    },
-    "0xb36faf341c7817d681f23bcedbd3d85467e5ad9f": {
-        "ticker": "RPEPE",
-        "signature": "304402201d209aac5ceb762273257264e942c5c21b2c1ba632b5ad13517f232d3a4b0019022053672393695483f0f4d9ded142c8bd0a9f434941cefa3de28ca71d1414b0a249",
-    },
-    "0xf7b084572bd638d8282f4933143a8eac94482f28": {
-        "ticker": "RPG",
-        "signature": "3045022100bc36466018251045a887d2d1f21f8cbc90289ab3504fa56e87c81c8a6a4a62690220674b9744912dc1f14dd96ba769a8994ccec1fbda4349da537657652beaf0dc50",
-    },
-    "0x78c42324016cd91d1827924711563fb66e33a83a": {
-        "ticker": "RELAY",
-        "signature": "3045022100aa0518db41aa9640dd50e7f30b9525409233b98ffeb58206bcfe0613d895ced8022007e0215ce82b0a53eb9c9a22676214c231918dbffc178a53437e849937dd884c",
-    },
-    "0x7c6a937943f135283a2561938de2200994a8f7a7": {
-        "ticker": "NOTE",
-        "signature": "30440220731035e80a8fc6492abcabbd5f49f5ffaf38d6a0e5dbe445beffb4ae0d36a7370220059a3355a938e53652bcc7260665ce6d8a9fa5b9ab10abaee727ef2f8872b326",
-    },
-    "0x9ed7e4b1bff939ad473da5e7a218c771d1569456": {
-        "ticker": "REUNI",
-        "signature": "3045022100a1dcb8df291f156647e83da994d059ca9c126b907f2a165a78a08fa24ac7fec50220743a2fb35a4e74e7c496afec2888c42f464fb847a9435ce663afa4330a91f600",
-    },
-    "0x4960bc6032351ab87627b8f36b37b4938a44c7ef": {
-        "ticker": "RICH",
-        "signature": "3045022100a94a49a6b17f739e5ea9613432a77a870ff587f3985287f3ffe99d7b90857c7b02203bea806b129b22cc7e9ebe91d759a8cc2ae8b3a4d84809ed1f49312067eed6dc",
-    },
-    "0x73f2af605ea8a3d8410b83ee05b8d6fc0da1aca4": {
-        "ticker": "RIDES",
-        "signature": "3044022036a33da9f01fd44b9353b729dee654e2c7b75d3073e95961233da136ccc1a28702206b15dd0820dee1a0bd9a5f2f7dc07d859205de9246aa6fa9280f92058c189966",
-    },
-    "0x9466ab927611725b9af76b9f31b2f879ff14233d": {
-        "ticker": "PAE",
-        "signature": "3045022100e5a2c415c496cb3a5c9860632edc7b39959c48b1a9ac404a3d63ec400b5f333002202ae5d8f7c1051ef5015eec5819c34e9290c84073371196d34c72ff74ece9dec8",
-    },
-    "0xf1d76e562c726ed6ee269beedca5e67d45e05a37": {
-        "ticker": "RIZZ",
-        "signature": "3044022004ad659b660d381f19e58b8d4af9925243ab7601dddf6320093345208837caab022003f035acc7830541d855b08501a967d3712f70a9e6378389ceb6a8efbf0232c8",
-    },
-    "0xb2a85c5ecea99187a977ac34303b80acbddfa208": {
-        "ticker": "ROCO",
-        "signature": "3044022073772e5a2cc1c1b0d492c0ffeef4b84d8ff64bda65a61027d4c709d705e18cb902200a52894003170521d5f9659ee640abcf3c43a125b004b4b59a6cc4e03db44be0",
-    },
-    "0x4036f3d9c45a20f44f0b8b85dd6ca33005ff9654": {
-        "ticker": "ROOBEE",
-        "signature": "3045022100b1ed090a016db777987aa21c5ce0cba3bd215c862b4401e8bacdfda843227da602203341610f976ac389476221f010c6f68cc29f9feef8361a32e6376d3a952de013",
-    },
-    "0xf44ff799ea2bbfec96f9a50498209aac3c2b3b8b": {
-        "ticker": "ROUTE",
-        "signature": "3045022100cfc87cf4ce21da426d74ef541664448ba011dbe26c4971e969f65845dffa0cda02207598ade953427eb1126bff8cdbb655ec3604207cd0518336670b9ab0fe302be4",
-    },
-    "0x68ee0d0aad9e1984af85ca224117e4d20eaf68be": {
-        "ticker": "ROY",
-        "signature": "3045022100c46a8d5ad1378521bce6b940d077e562270cf9b6f2761149b26df05ca3e5d7a002207d57458a7f864c3a6de6596340467d7d2e51089fec0b2178ccd859d8cbb971c2",
-    },
-    "0x61ecd63e42c27415696e10864d70ecea4aa11289": {
-        "ticker": "RUGPULL",
-        "signature": "30440220231603897f32b58b47a25523020532ac01fa07d00f0e3e58b1507f04b8efb175022033a1e54a54c599e784e25c69daed30f740c9688b9b7e62aa7152c336a2d9f2ac",
-    },
-    "0xa1afcc973d44ce1c65a21d9e644cb82489d26503": {
-        "ticker": "RUX",
-        "signature": "30440220208cb3e6505099bad584a0f5f5b4f48aec7d0d6fc555637b00cd59f6199270030220306d026cd2e2cbce496063adcaaf2bdff9b247d18b09a18242b8c44130ba56cc",
-    },
-    "0xf99516bc189af00ff8effd5a1f2295b67d70a90e": {
-        "ticker": "ART",
-        "signature": "3045022100ae0d497c9368c9988622b1cb04e944152e2af201cb1fe86e266875f34b2aa98902202168bf16163bfbb06b7c831a45b060502c67f1dd300d526aa13828401cbf7a02",
-    },
-    "0x7979871595b80433183950ab6c6457752b585805": {
-        "ticker": "SECOND",
-        "signature": "304402200b181b813821831894d0dd656eb9c162f3121f6048d5b2e853e89098ecb7ce3802205978378735a5d24e0d41288e4f99a701b3ee32f37457cab563b83d5fa41f97a0",
-    },
-    "0x9ad274e20a153451775ff29d546949a254c4a1bc": {
-        "ticker": "SHACK",
-        "signature": "3045022100e9d67ceee4fd25bd1cd06a6430a2b43590c1d92ce9ffd885c15b66f3c8aad28e022038f5280821e99f4978832b6af55e62892c55c62c657f1a4cdac9e5e24528c8cf",
-    },
-    "0xc1d02e488a9ce2481bfdcd797d5373dd2e70a9c2": {
-        "ticker": "SHAKE",
-        "signature": "3044022027aec9d34f9f083b94b101afdfdecee67844e7c76db4a311f8e074eed9eb64940220454633a8abe05066bbfb99635169bd25eab21de293b89330bed2d55c91d379ef",
-    },
-    "0xb1f19e492401545c1b060c4b18688f9178325b4d": {
-        "ticker": "SHARDS",
-        "signature": "30440220572b2e5e2cacbbb51dc9c580ac7159d35daed3016f4adcfea662238dbbd819ef022016b4bc1aea91c18dc4e9dc8b524a5b7f315da3acca7865ca33e6475e1bbb1931",
-    },
-    "0xa5e59761ebd4436fa4d20e1a27cba29fb2471fc6": {
-        "ticker": "SHERPA",
-        "signature": "304402202fbf76ba68dc32f54bfbe6557d937db9ddfacf78247a8fd040f75e474eafea37022035946480d28f97f73c20d502f8bf6632402e1632bfe86c5745adb79fe40378a4",
-    },
-    "0x02d980a0d7af3fb7cf7df8cb35d9edbcf355f665": {
-        "ticker": "SHIB_E",
-        "signature": "3045022100a1d1b4adcdd0de5be54df6ddc952ccab1e250e01731ddaea6ddad592d44c230f022043dcc7a5266436a06475b53ec93853fd44ea7a591e843b6ffefca229c889d87f",
-    },
-    "0x440abbf18c54b2782a4917b80a1746d3a2c2cce1": {
-        "ticker": "SHIBX",
-        "signature": "304402202828279404855769035dc8e369002303004ee15c7541b7187cf9180f34f5179f02205e3df0c4ab835e5b6a7c2266649fe01fefddb0e1a76573491cdd998c8c7038d3",
-    },
-    "0x096d19b58cab84a2f0ff0e81c08291bffaa62848": {
-        "ticker": "SHOE",
-        "signature": "304402205e7db080a986eba4bff69a4f1c2ad1fff32c00142668b8f2976ab51cdcf96e0302204309a3a7c7e587126882720e1c7652807cc6c100e6a4b8d091ac1f59081d2af0",
-    },
-    "0xd402298a793948698b9a63311404fbbee944eafd": {
-        "ticker": "SHRAP",
-        "signature": "3045022100d6c55d3e045a4e5e720b0f56bb0e019fa889b1ca771c2268441439887971f52d02202c0a2a82607ab826cc77e1fd2bb0016160182e3b0e3ffe2cc092e250a9c0ddc2",
-    },
-    "0xf9a075c9647e91410bf6c402bdf166e1540f67f0": {
-        "ticker": "SING",
-        "signature": "304402204f10be22db90df750511feccd9b53d13908a0d542ed6684a1d8f4a01c26afb8602205d6863565759a0a789d231e2fcb39e0aa2849e10f877bb20900f52e09b3e9ca0",
-    },
-    "0x483416eb3afa601b9c6385f63cec0c82b6abf1fb": {
-        "ticker": "SKILL",
-        "signature": "304402200edb018e9c28c288376f75af8105dcab687b34d7b1fb49678ca11da56cc3f2f70220339443ddc1a1735e7b206e68f50d2b8af116bfb5867fc7345da47c607bd9d74d",
-    },
-    "0x239c1d2fb158113dc4b10133b66d7516207879c5": {
-        "ticker": "SKY",
-        "signature": "3044022000cb660ae865d22b40ec4f525274c02153b350eb8cc241d45137699afe26b9ef02203a3a24f5f27a67454f68f43d1fdc9f70a7b8ec13413be976c2a8006bb0144a97",
-    },
-    "0x6d923f688c7ff287dc3a5943caeefc994f97b290": {
-        "ticker": "SMRTR",
-        "signature": "304402207b08bba5503b0675d98feeba92f8b3fd5665b0905be83e45308a5837ed2ec28d02203f75a5359c6da3958f86b3283f5b89692c4d3bddf1aaf67a96bf158b0cbf14db",
-    },
-    "0x5a15bdcf9a3a8e799fa4381e666466a516f2d9c8": {
-        "ticker": "SLIME",
-        "signature": "3045022100d0294e9793c162c86be6d3a27e49361a090c2c06de15a3309a3caf2c9857f35102202149ef7b6f139c42a272ad04228af2a9f5d8c5ec88fb2c06c1f2f60b2c3afccc",
-    },
-    "0x2905d6d6957983d9ed73bc019ff2782c39dd7a49": {
-        "ticker": "SNCT",
-        "signature": "3045022100d805db8182dfb60c8e9f3e60ee38002b241aa7dc2234cf96a05c2627c5c4622d022027de80fe0f665ddc577b861320c47010301a1ac0ea496240607fa8a4d3b41b95",
-    },
-    "0x86f146f3c14eff9b5eb2da5d7e3cdcb1e8b9021d": {
-        "ticker": "SBOT",
-        "signature": "304402201c90b311350f5a05cf57b056e90c51d60decf5f7b9c9a17fab7b0a12d6db0d6302206a03d9efe4b660b672535da48296107716c646cdea097ec4701e8970f9931f68",
-    },
-    "0x982c2715ca041f2f1b85b5c81fc8981ba48fe62c": {
-        "ticker": "SNOW",
-        "signature": "3045022100fbc4e5fe9eca2d85a1eebf91cce87f164688008c22ce31ecbc823d83d38ef1a2022013926eca09ec1306d31fcd7e77a84d12443bda89dd996a44fa2b2b1bb5489f7d",
-    },
-    "0xc38f41a296a4493ff429f1238e030924a1542e50": {
-        "ticker": "SNOB",
-        "signature": "304402202e945cc355ac9f76c631c3532d2360e1bbe45fa8ade7133e47f575d834ee8dfa02206103b1c480e72633b925dff6473bd60b0fc0759fa0d21f641cfb4b32f9da879a",
-    },
-    "0xc09304620876777d0958ce568257e46f8445ba4f": {
-        "ticker": "SNOX",
-        "signature": "30450221008205a845f12f46be8463e787ae74a2a3f79fbe6eef37d4075e1bc88a81a2215e02206b5898a16bf012a8fdc585ff4a2ad52549d548dcef970b75253bcf13d75a8813",
-    },
-    "0x7d1232b90d3f809a54eeaeebc639c62df8a8942f": {
-        "ticker": "SB",
-        "signature": "3045022100e041961163469e7b4baf60bfbfa910598f74cd6ad5158f00c47da67dedca73ed02204d26926497aac179133556cef5317850225ede557cd3b8c513c41032dff1a22c",
-    },
-    "0x924157b5dbb387a823719916b25256410a4ad470": {
-        "ticker": "SLOT",
-        "signature": "30440220395d5796bc9cce8146f77290e478767d2a91bdf857a419e35733f2333c95203302200930076aedd5310b14b1f8bc6d947451952bf9e81fdbaec3716b4db45399dede",
-    },
-    "0x9e6832d13b29d0b1c1c3465242681039b31c7a05": {
-        "ticker": "STOMB",
-        "signature": "3045022100a74bd36f5e442281105e86ffd0a997d76f90f2f6ba022e9faa686d97f64961840220069db76a65f4f5752842348e4156ce44e692931152d013433810b78d7aa126f3",
-    },
-    "0x46d0166d33f87b4bd398e4c8a0da17508e62e756": {
-        "ticker": "SOLAR",
-        "signature": "3044022016680241030bfd47b91c218190402949ed62e43b27ade756dd1378c98f60b34b02207951d794556667ca2e41fba99076da93fb0e98362f24b4f9cb5d43dab8a7476e",
-    },
-    "0x11d6dd25c1695764e64f439e32cc7746f3945543": {
-        "ticker": "SOUL",
-        "signature": "3045022100d8d4647aa0fe02459f02c7b23f83e43ed451220d51f86aaa4048f54ad7b969e7022054459e10047c3c1550f42b37fa8581ebe5e691029a422478c2ed04f8debf797b",
-    },
-    "0x09211dc67f9fe98fb7bbb91be0ef05f4a12fa2b2": {
-        "ticker": "SPACE",
-        "signature": "3045022100e29dc8e3f8a69995ccf4341cc04a2c49dfeb886846b32f3880f00d7b4b0929c60220255c62e906594082ea1dcae4014460bc3730614c999644a8608e02ddffc196bf",
-    },
-    "0xce1bffbd5374dac86a2893119683f4911a2f7814": {
-        "ticker": "SPELL",
-        "signature": "304402201e6cecc527477ee3b6b034e0171cb0b9cbfa7912f10bbf19a55f11ab5587109002201c8a2f26c27f3980fb2eb775dd66ab35e5a9dfe4db264e02ac81e7717dc283a3",
-    },
-    "0x2fd4d793c1905d82018d75e3b09d3035856890a1": {
-        "ticker": "SPHRI",
-        "signature": "30450221008813ac942c760b64665325aa41fad5e4a9a3ac06bf9c2e4da648ab909559f079022070d134db2d4d9bd1df8f2e4565d8a7598f216919d998ff248d3a72de0ea0eb98",
-    },
-    "0xd13eb71515dc48a8a367d12f844e5737bab415df": {
-        "ticker": "SFI",
-        "signature": "304402202919a994b9b0c2e909f44081640f42f9491ce95658d8744f9d9bc214da0f156702201f42427f62573d3e146cabf5f5cb89f83197f8bc4d49ceb5c241fd848efbd890",
-    },
-    "0xf30c5083a1479865c9a8916dec6ddadd82e8907b": {
-        "ticker": "SPICE",
-        "signature": "3044022024ce7236d24ae7d1d6424823e66bc67f92f9000653fdd7cddc8c22e02aa3ae4c02201a058b1fbb73576915b81bd4fdb433a12bface034582755780fc64ad62a71321",
-    },
-    "0xab05b04743e0aeaf9d2ca81e5d3b8385e4bf961e": {
-        "ticker": "USDS",
-        "signature": "304402201aae9741edd6613ca68896173880d307d16c67c7a600fe4b8475068ebedb503a0220030e7f6d6ef766d7466f02cf00bc8967ed49fe6121b539c8da7b2c15bbc82411",
-    },
-    "0xe16253892f126d068e711c2fdde6db56969dbcf6": {
-        "ticker": "SPLASH",
-        "signature": "3045022100df935549a36b05c76d8eb598800c4dbfcb073e8661c92725850c18978a2d4ab2022030fa934c57097acc8d34a1bd983a81fe516578832d1b86a150778f0c71874bb7",
-    },
-    "0xbd83010eb60f12112908774998f65761cf9f6f9a": {
-        "ticker": "BOO",
-        "signature": "3044022006bcb9b7e38c7361d270a039b5314ad21cb6989e109d0390d7644ffdadab0ebd02206621d7e945f1cd7fc2880ed19fa3bae9829bf5565fa107fdb19173f269f976f5",
-    },
-    "0x6e7f5c0b9f4432716bdd0a77a3601291b9d9e985": {
-        "ticker": "SPORE",
-        "signature": "304402206e2f09e9ff5e5727162cdad8707343b2acecdf8a62b50e7bee186eca5c255d6c022013be358c125638b9baeb05a526670fc8bbc6b20eff9a13237208a49dca2549e8",
-    },
-    "0xc8e7fb72b53d08c4f95b93b390ed3f132d03f2d5": {
-        "ticker": "SQRCAT",
-        "signature": "30440220639b8044940f14738b9da123daa58f7cd48052a870a4c6c5a4936b7a5f3c16f4022010c10e82748086ef035c5b9a65cb38c68bfb4d96b0f37daa032791aae46d57ff",
-    },
-    "0xaafd2577fb67366d3c89db0d627c49d769ee2e5d": {
-        "ticker": "SUSD",
-        "signature": "3044022035426fecdd1f2ad79ef11347ceabf04f04b0ffbeccc08df384221341bf02abc102207ddacaad806868d3ffe556dc7e2d493ba8f940e43760ac8e6eff9e357763dd1f",
-    },
-    "0x2b2c81e08f1af8835a78bb2a90ae924ace0ea4be": {
-        "ticker": "SAVAX",
-        "signature": "304402204036f65d14c20e82c159dc4dbdf624e3a9a9873aeee9429ad33f800c65e63a9c022037573c217cc4491c5b9b4697f7981372df955ffed8d3603161cf6135b0d06f83",
-    },
-    "0x3405e88af759992937b84e58f2fe691ef0eea320": {
-        "ticker": "SFRAX",
-        "signature": "30450221009fdaf75ac1188bd0ab8c47ee0b7888b6461d945eec5120c80c2c57c8e3c2b17c0220560487a1a2facbee102d86a563ab22def54bfaa6c5d349d4d1e54bde59698853",
-    },
-    "0x63468133ed352e602beb61dd254d6060ad2fe419": {
-        "ticker": "STHO",
-        "signature": "304402202bf132c73c8409376cee799c6745dcd46fcd5591b5486c14a978935dd9d74a6302200d2f2697c1dd468a092b0c7eaff15b0fcd805bd99edf164a49cb34b3e59f534c",
-    },
-    "0x2f6f07cdcf3588944bf4c42ac74ff24bf56e7590": {
-        "ticker": "STG",
-        "signature": "3045022100b5fe5442c5051359ef0a2da9f725041094adf0c20f25c7c1bcfb22567883b85602207a84270029b1ec47d30c155f4e4adc7f8f4dbee028b9475ad06e9499f91e8b9f",
-    },
-    "0x97d367a5f900f5c9db4370d0d801fc52332244c7": {
-        "ticker": "STATIK",
-        "signature": "30450221008c48eff72d05919043a305614ea2e26d31f6fa9ac1d8edbd02e35ba940a280f0022008fd4469a253a5f3f974eee1dd74c2cf0d69627566d65ac462b4d228dfa9c892",
-    },
-    "0xb279f8dd152b99ec1d84a489d32c35bc0c7f5674": {
-        "ticker": "STEAK",
-        "signature": "3045022100da7ec0ee2181ff76b89f18690b186a7f2771360d60063677299583d19a2abb1a0220318ed40590241a0a17fa175188313b0261a0e9d12104dc59c26a63f81db6f055",
-    },
-    "0x66b071a55b7c258c2086527e35ee355771aa05b8": {
-        "ticker": "STL",
-        "signature": "3044022036a69613b0a6d72829a9c99ec993dc81f9b9900f2b029d6b1edd6f91474961e602207f989399ffa0a1c023aec15a12dc1700ebd9529108851069ea4fcfe498adeca8",
-    },
-    "0x714f020c54cc9d104b6f4f6998c63ce2a31d1888": {
-        "ticker": "FITFI",
-        "signature": "304402202c681ceec9e95d47f04485dd3e034656ff15c22d1911c03a482b354d0051218d022068b9d73ee4233a5d9fb20af76342414ad9fdb008b1c92f66e4c4d38306109700",
-    },
-    "0x6afd5a1ea4b793cc1526d6dc7e99a608b356ef7b": {
-        "ticker": "STORM",
-        "signature": "30440220176c4759f6642c84bb0223469db7f1ac085195dec291d9b231d2b2ed65b1c107022030fb39b7c0fb070502d54eeb0bd7c77583d56beed46ba25811df34866bf01ca3",
-    },
-    "0xa2cde628d7617956eaf4780e32f68df19cc13d62": {
-        "ticker": "SUBAVA",
-        "signature": "30440220081ab58438e3df1c93baac3336433b55f512294a886e79e946b3402333e894e50220603fc7e39a5d3a1e0551cd326a242fef6178aabe549361f72b90d5a254891716",
-    },
-    "0x39cf1bd5f15fb22ec3d9ff86b0727afc203427cc": {
-        "ticker": "SUSHI",
-        "signature": "304502210086a8df6be569ae6a03d207ea7af1ccb0633f08cfa11cff05e36129705c32833602201ef75582edd90d7fb265296a92bc319ab184224790467af1e0ff67e80651bbb5",
-    },
-    "0x37b608519f91f70f2eeb0e5ed9af4061722e4f76": {
-        "ticker": "SUSHI_E",
-        "signature": "3045022100d2c4eacd1e6a41366a6d6809a027a735e9c4b5f428c27dfa0663c6e0b5960f3d0220556e28fa68def06674b7482e7babddc485fee9ce09eeb8cf827acf9a1bf52c4a",
-    },
-    "0x312ee43df66d1fd1ea28e5b28f355da84dca13c2": {
-        "ticker": "SWAPXI",
-        "signature": "3045022100ce04860efd70ca0aca550a7c022443c8a04a5cc3c534d7411c75d023f727fb0e0220256bb72d9a1b9189bdf91ce7645638a64b1fbbe56d3086b8c037041389a67891",
-    },
-    "0x636e5a965c7b1917663aa4b879b294401ec90d48": {
-        "ticker": "SWIFT",
-        "signature": "304402203220920646e7b237bcf1718cb52a005eae01ee8a5a76678429b34f1fec7e8b04022003ddd8d40f96aa11c59bea538eed6c1d0403f3c886884b4022cb3b36437fe887",
-    },
-    "0x66b7cd2046c633196cfd061db21ca6a23ab9ba3a": {
-        "ticker": "SWORD",
-        "signature": "30450221008c4dcccb198bae73240c38947b93fc0e167ae52e6d40b75e61dd8071f7405214022053bb2fddf503acc0cd41c5adb69721a70e939aefa3c9eb891667401aeb14e11f",
-    },
-    "0x1f1e7c893855525b303f99bdf5c3c05be09ca251": {
-        "ticker": "SYN",
-        "signature": "3045022100af53c9cf1844df8eee94a891ae41a1ccccdfb403e42bce35a88497cc795270a102207988056a5f000f0f1a6cad3289d7fdc913ad9f774cff06462713312dd05dcadb",
-    },
-    "0x68e44c4619db40ae1a0725e77c02587bc8fbd1c9": {
-        "ticker": "SNX",
-        "signature": "3045022100893960dea650804df1397da4241e89b8417dffa415eafb6aebd87563606f194902200ef9bf3bbe6d3c88b45086f78be7fa53eff38d850fb7230cab7765263adb843b",
-    },
-    "0xbec243c995409e6520d7c41e404da5deba4b209b": {
-        "ticker": "SNX_E",
-        "signature": "3045022100a24499aaa4dacdc378f71d984ce286ce1dae679fcbe59a32d5313a6ae5c06bc2022052e6434c6b8b631a51f07107fa050b9bbbf863bf1ba73eb379ab44e153dffcf9",
-    },
-    "0x5ecfec22aa950cb5a3b4fd7249dc30b2bd160f18": {
-        "ticker": "TAROT",
-        "signature": "3045022100c3b328d174bc3049f4e1dec0957ccb506db832b58136711a8f8b4fa452aaa4c10220709ac78671916afa545028f2432f958c84468e96f3611b87e7a892710e95fae0",
-    },
-    "0x094bd7b2d99711a1486fb94d4395801c6d0fddcc": {
-        "ticker": "TEDDY",
-        "signature": "304402204cf09584ba3a4adc17c413a997e1d10ca6ab53ac58b4785f66c4ed1c1962e614022044c6a2e386f8b1ef4316aa5a22a7f1e94bc227850a07fec5db1137c522065393",
-    },
-    "0x289df5a6f491c5228b77af382a883a43fcc4c3ea": {
-        "ticker": "TEST",
-        "signature": "3045022100ddd33e111e23daa1f8d9283adbf7018ebc97ebf6c7bdc602e7eb9788e4958d20022047265361100cc2b2219833a361e0fe21c38e70f6422816ed3615f43c9d9f7448",
-    },
-    "0xc7198437980c041c805a1edcba50c1ce5db95118": {
-        "ticker": "USDT_E",
-        "signature": "3045022100dac35dd7b8fae0b6f6ef31e12d330938ece170462ef6459d1c1bd7ca2a48e5c102207211f30587a47f68395cf127e8d9e5875537d4c7b8de2bf03b0f73503c339ccf",
-    },
-    "0x9702230a8ea53601f5cd2dc00fdbc13d4df4a8c7": {
-        "ticker": "USDT",
-        "signature": "3045022100fe2305b2b32ddc4ecc66e8235a5491120a982c2a3c126b4637891658a48a09bb02205f5e561783c805354a474ee0ec43851be5fbe39748f06dc65791b1ab9c2614fc",
-    },
-    "0x8f47416cae600bccf9530e9f3aeaa06bdd1caa79": {
-        "ticker": "THOR",
-        "signature": "304402205bd6f3969bad03ab9778134ca431d4fa12199d201aba9d052db2b9def2081f4e0220118e1cbfd7cc8307610ba2155a31df597929533c63c299c87b64a078a25c4b9a",
-    },
-    "0x390ba0fb0bd3aa2a5484001606329701148074e6": {
-        "ticker": "RUNE",
-        "signature": "3045022100ab29b7f4baa0e451321878b43215a7dbccbb004e2e290d046f3ff9aacdc766700220094fedd7096171ddb3ad359df210ef2d27a8b2ce33113bbc97ec8c4f2ca60671",
-    },
-    "0xae4aa155d2987b454c29450ef4f862cf00907b61": {
-        "ticker": "THO",
-        "signature": "3045022100de4796acfb4da91a08629714f1bd6155725b37022d11b4fa2b723369b6fa10df0220793ef872fb1eccba73ff6b2352533f924f9b631971130d8ae8428a9f6acd7c82",
-    },
-    "0xb54f16fb19478766a268f172c9480f8da1a7c9c3": {
-        "ticker": "TIME",
-        "signature": "304402201ebc407207a32a98321834d292812ddb85675c169424357817b9a0d28854bccd022067eda84b9aab813725dcd23ea1d69b2b145178e36ef1088e55ae6b0597271761",
-    },
-    "0xae9d2385ff2e2951dd4fa061e74c4d3dedd24347": {
-        "ticker": "TOK",
-        "signature": "304402201b9f7768ef948143074b6373f4916b151f3a3f961413a9be6505b6f50983e9b802203ca112fb5a4ad7d91ff8619bc650b7fdb6885045c07138dee1a31c8c1eea736a",
-    },
-    "0xb84527d59b6ecb96f433029ecc890d4492c5dce1": {
-        "ticker": "TOMB",
-        "signature": "3045022100ea4992e10071113a9dffaf6983453265d5b5026921ac15055ba948060e1b6fb502202e5f6d1fed4b41a90b7aebd37efbd4c8efa648adeb75aab488a5f9a0edad413a",
-    },
-    "0xf693248f96fe03422fea95ac0afbbbc4a8fdd172": {
-        "ticker": "TUS",
-        "signature": "3045022100dec2efdab2c4a03c492bb89d613a05d95ace4d5a0bb25c796f386adfd6a74866022062105da38348fbadc5f5a47b2ce291c32386aa6ac14607415a4e351764a14cb7",
-    },
-    "0x9913ba363073ca3e9ea0cd296e36b75af9e40bef": {
-        "ticker": "TRESR",
-        "signature": "3045022100f9213c06b8089b2438d875533a99c00207511650d6f9ecd011a0f4241970677302202d1ef9cba0bc954282927499aa139cc0ea3642c22cefebccdcf6bef88d18f94a",
-    },
-    "0x1c20e891bab6b1727d14da358fae2984ed9b59eb": {
-        "ticker": "TUSD",
-        "signature": "3045022100ac70b82ab4607d816822ec1df4bd2741f977f8772b09a914b8919b1617df33d80220319aef968bda8c9a713b2f07778eed6b70a5dd1f73f7b603cd8e91c5f590f5bf",
-    },
-    "0xc7b5d72c836e718cda8888eaf03707faef675079": {
-        "ticker": "SWAP_E",
-        "signature": "304402203010b703534727632505bcd9b0bdd3d2e2bb7f908f0f9e2f489b3b94c4f006aa022029a3a0ab0e830c8aea11811bf1e704005d8d970ca0485287ece110bb9b3afaf4",
-    },
-    "0x4fbf0429599460d327bd5f55625e30e4fc066095": {
-        "ticker": "TSD",
-        "signature": "3044022018df4e26058fe1ffbac93b31aad73be1f6c403afa94d481ad6022a1a9b9600270220095ac90c9f9321c6252986843862f75a5cead7dba283e04fce4a94133e47c402",
-    },
-    "0x21c5402c3b7d40c89cc472c9df5dd7e51bbab1b1": {
-        "ticker": "TUNDRA",
-        "signature": "3045022100c2ab38cb84432e38f00b4309a952ddd64f025404d8a23b6fa622189b4e3822470220552a410c00503596ed17d32b8e3f6f57344db9b16f0b1921428bfb5fe93ca2da",
-    },
-    "0xc685e8eddc9f078666794cbfcd8d8351bac404ef": {
-        "ticker": "ULX",
-        "signature": "3045022100fb0229d1e70590d8467d2727ffdd8db67fd8a70008141bafa269dbbbac36b5b102203599a1f831d46e2129e7bc83a93ff5eb3b409f16e8df1ae7136b6f5b778525d5",
-    },
-    "0xc84d7bff2555955b44bdf6a307180810412d751b": {
-        "ticker": "UMA",
-        "signature": "30450221008a74006cf4597f4bc8eca9acc0a9bea7ac06adfacf46b125bcf63f39549acc43022065269e6be26dbb461d593ea59f2132a656e14d57bf3be6663d132ca65de6b9e8",
-    },
-    "0x3bd2b1c7ed8d396dbb98ded3aebb41350a5b2339": {
-        "ticker": "UMA_E",
-        "signature": "30450221008b88b5fc517acaecc6abdc2918106462a0e56902fd463b4d3f6b359ead7995ad02200a8c55e2ebea6b3771d12084886d440c77c01824c942ae6b239c089951637471",
-    },
-    "0xd60effed653f3f1b69047f2d2dc4e808a548767b": {
-        "ticker": "UFARM",
-        "signature": "304502210098096bcd7dffe2ddf8b2c914a70c340210221c58e7f982903309c7faa8d0ce0502205ebefc441b132d1ecdcf9f792f5642f686b7664d9d3a4fedb5d65fcbc84e0412",
-    },
-    "0xf39f9671906d8630812f9d9863bbef5d523c84ab": {
-        "ticker": "UNI",
-        "signature": "3045022100cdb62c535abf688d324d3962267402273d233dd32ac12890fd189f00a121f2940220409f465508e52ec6ad05266c9febd9ff610db6968f2f019f6cd8da91116cde2d",
-    },
-    "0x8ebaf22b6f053dffeaf46f4dd9efa95d89ba8580": {
-        "ticker": "UNI_E",
-        "signature": "3045022100876d6c5e1c63c6fcfc8281f46137bfa8bcc0f379a95cce7e0d0fa8a501fb4da8022009f4343e4036f0f64b2967f392ac7b3d279e7eae8310809e3205b16da89528b6",
-    },
-    "0xb0a8e082e5f8d2a04e74372c1be47737d85a0e73": {
-        "ticker": "USV",
-        "signature": "30440220530b47167acb707add1e4435659922de761b3f64c1f6985c68bab06a488b6b8f02207bbbc021d73b0b85371715590547cf03727289a79c7ea51566eb74301c95923b",
-    },
-    "0x6f97d3f120fbbdaacf1c9da61a8ad126b7426861": {
-        "ticker": "UNIX",
-        "signature": "304402200c6f8add48bff8110df546dc253159df68f3e3399329e8f395efec021dd27894022076a6f612401f825c1af43d5da2864096fb839e07c845f70ddd3b360273417bd6",
-    },
-    "0xbd3936ec8d83a5d4e73eca625ecfa006da8c8f52": {
-        "ticker": "URQA",
-        "signature": "3045022100cd9e393fc1e93b5d13395eb8eb99eda58fe4ea572afccb2e60f82e814acfac980220320d999b01d1ff4ba680ad3996314a645685e288c30393b336d6484ee197566c",
-    },
-    "0xb97ef9ef8734c71904d8002f8b6bc66dd9c48a6e": {
-        "ticker": "USDC",
-        "signature": "30440220157f1c12ff88e1a5610c4f415824c89d1d3feec5cb577c38b54b00f83929d7c0022003ebc031b27a03aca28a798c6d80e90df2ab6af7aa7880c42e32cfb794b4da31",
-    },
-    "0xa7d7079b0fead91f3e65f86e8915cb59c1a4c664": {
-        "ticker": "USDC_E",
-        "signature": "30440220126f50b9a551c14fae7828923ca593eaccaf9795007756847fb47244161ffaf502204c242476a86af5e9ea33c89c60c6c0930c6b3874189db3b88240cf043a15acdd",
-    },
-    "0x2f5de51823e514de04475ba8db1eeba5b244ba84": {
-        "ticker": "USDOT",
-        "signature": "3045022100dba4cbc99394f9d8313a74bd06b6c4fe16cd6abf5453a6437b775cb97e6e02aa022023b1506c4c61ef293ba9ddc41dd532be97d4342801d129aaaa7eafae2df1de05",
-    },
-    "0xb514cabd09ef5b169ed3fe0fa8dbd590741e81c2": {
-        "ticker": "USDD",
-        "signature": "3045022100aac2f3e59c3d562bb56555ceae7d6052cd67f4fd8843140338dfcac0f19c4f0802202a7cc83b6bca4d6059b8587bd63b35f3a19b04d75dde3d325fc0562c92edfd62",
-    },
-    "0x323665443cef804a3b5206103304bd4872ea4253": {
-        "ticker": "USDV",
-        "signature": "3045022100d6091c6d3aaa71e373d6503251de933564918cb33e5869b8394f12a6a4f4de8c0220787272f5fa1d218ed1f8e1cc8623721f24eb3a7477757fc257964fc10ca6b028",
-    },
-    "0xdacde03d7ab4d81feddc3a20faa89abac9072ce2": {
-        "ticker": "USP",
-        "signature": "304402201bddcec38580d2ad799acb02750364331abf38ff5c61be76dc862c5d2117ece602203b40da2fbb95aa92462b98e44de48f2092deefbae229d6bf0f2df4afb3d22711",
-    },
-    "0xb599c3590f42f8f995ecfa0f85d2980b76862fc1": {
-        "ticker": "UST_W",
-        "signature": "30440220395618c7396e0103d3334e8dec6aa1d98240111e79fd1daa77f25541dc1b41e602205da51092f6ea275a744ed5403a0aa8c7f5497845445ebde7bdece38ea277199e",
-    },
-    "0x7bddaf6dbab30224aa2116c4291521c7a60d5f55": {
-        "ticker": "VAPE",
-        "signature": "304402202849804744d794a09d7e2dfd0f6353ce73ab035fab2a291ef4a87bc4a945250a02205ddc92a243f880fb4a218d6c453f9e6c6842d8ee2a5dd5114c6f2596563c0de7",
-    },
-    "0x83a283641c6b4df383bcddf807193284c84c5342": {
-        "ticker": "VPND",
-        "signature": "30440220592c7195fbc32a92f4142a79172c5f4f3684e13e06f81e0e612bc766a3b3f486022050ad7d5c894d14456a164c3f521c9fc4b4f6f9ee0f6a3a50e8ca58490a7022e3",
-    },
-    "0x5817d4f0b62a59b17f75207da1848c2ce75e7af4": {
-        "ticker": "VTX",
-        "signature": "3045022100825784886049c4469ac655dba3deb4c5feea996648e83301f945b1866e9a8c120220717da4ed359d0d87e04eca963dfe474520dd345c0cb00f2d30e52673582ede8f",
-    },
-    "0x3709e8615e02c15b096f8a9b460ccb8ca8194e86": {
-        "ticker": "VEE",
-        "signature": "304402202c9c75506343ba0b5a1befeb4b9cc6e8799befc24cea2b5acde4c44ac702495a02203bcae1895cec8d72d85e3537c7bc9410b368ff809f5099b37f0e82f83a4e6a74",
-    },
-    "0x846d50248baf8b7ceaa9d9b53bfd12d7d7fbb25a": {
-        "ticker": "VSO",
-        "signature": "304402207c19b621c20cbd933f74676f7862c828cd2f1a2bc336d1cd6b4949773cea9beb0220761377b797d8f0b521de5a9f5abd98b73aa760a8f0632ecabee18593851ed7a8",
-    },
-    "0x7678e162f38ec9ef2bfd1d0aaf9fd93355e5fa0b": {
-        "ticker": "VEUR",
-        "signature": "3045022100e3978744a8da6a435f993a1e541ff03e8adf17e4f5f2270697d6cf907a81065302202d65a05c19f69abbd52223a83be9a7386a42faa37aa79755282631e994dbab9e",
-    },
-    "0x228a48df6819ccc2eca01e2192ebafffdad56c19": {
-        "ticker": "VCHF",
-        "signature": "3044022071aa3db0de3676b3e4ab9898a34253b857e8080a95b84289046bca5f3eddeb4202207039f406025ee051de7365df8e1aab634b6617dd925a687ee33216542bdda138",
-    },
-    "0x9b06f3c5de42d4623d7a2bd940ec735103c68a76": {
-        "ticker": "VOLTA",
-        "signature": "30440220018940296c9bdfb2f6692cd201a7f93f3a2a423a3704fa067ec6e065ee36023d02205190254c4cf90f14e3b46217f3fb1ca50624fb11e11dad745bfee128017bea42",
-    },
-    "0xa77e70d0af1ac7ff86726740db1bd065c3566937": {
-        "ticker": "W3ULL",
-        "signature": "3045022100925424b08343550bcca191d0190c0941dde9b8aa27f50b352c2dcc36eb7af1750220361350b704e5dc5dbd0042e831b01a017364657dfd0ff345a96087781c335d2a",
-    },
-    "0xaf20f5f19698f1d19351028cd7103b63d30de7d7": {
-        "ticker": "WAGMI",
-        "signature": "3045022100d95c85200d7efe209d13f3082564800409f87472ecfcaf455c52830923169b6c022018f3b6b5083a8a1ee34d2fa7add6c92f13e5134cf5b5e986406b47819e41826b",
-    },
-    "0x873801ae2ff12d816db9a7b082f5796bec64c82c": {
-        "ticker": "WTF",
-        "signature": "304402206623f9cf5b86bd6c9a6976422417c4d6b67f8fc750d3ad3186ba245088fce4ba02203aba67cd3afed8591fb6ff9e90bf3245c1e46e45de54b35d72f93998e764cc05",
-    },
-    "0xb1466d4cf0dcfc0bcddcf3500f473cdacb88b56d": {
-        "ticker": "WET",
-        "signature": "3045022100fde1327aaf45edb26262bd67c88d1b059245f82dc3cf6e9c9db06326b6d6358602207334b0f64b790714df07b8da34c0527753f01508bf9ac68553db1058d937a883",
-    },
-    "0x403b78f9f817a55b66030c7b2ddab063d28c2c0c": {
-        "ticker": "WILLY",
-        "signature": "3044022049b7c5fd27d30ca61c7e47f7a8922d532b76ce228f5c317f860210b965caf4a30220696f092f9293f5a17395ce069483b0ee1ade1f0715ff7b6abfbe10b9bd00545f",
-    },
-    "0xc55036b5348cfb45a932481744645985010d3a44": {
-        "ticker": "WINE",
-        "signature": "304402200d23c9ddb1f0f4f0163523043c8e4161ad1334d8da56ad472d73d3697578994502202fcc9bd87ac888ad96b188a36091fcb407837873c2414a072d3d065d4d974740",
-    },
-    "0xfcde4a87b8b6fa58326bb462882f1778158b02f1": {
-        "ticker": "WXT",
-        "signature": "3044022056996914409089cc4b36a17422b143476c9e7549b3e8d712a460b40df7618f8c022077c508d1a6c20db89b125781c9743284906781b9e30f185fbe39c757f6453ae0",
-    },
-    "0xabc9547b534519ff73921b1fba6e672b5f58d083": {
-        "ticker": "WOO_E",
-        "signature": "3045022100ff92a47ba2e848cfdc76051776e5f324bb8c69b182b9bc77629085ddf0373501022007579c907c7a02ba5a5ea11b8785e152145586f068dc628f92e2cdc7482112c0",
-    },
-    "0xa384bc7cdc0a93e686da9e7b8c0807cd040f4e0b": {
-        "ticker": "WOW",
-        "signature": "3045022100aafa57a0aa30376e5ed17ad1de4be8ba0ba73ae98882f73d05bc24d6ce99166402206457c049d26ff6807fad125dead8d19bf6a755576487bde3e3fd9aed4bc4310c",
-    },
-    "0x9e037de681cafa6e661e6108ed9c2bd1aa567ecd": {
-        "ticker": "WALBT",
-        "signature": "3045022100fb3cbe43be8901412ba6e3601c4bba17b8f78679f5372da910037053b961b45c02200c0a285f58b5ead842b53703676a1dd64516ae76c7d7ac52b883318e4ea9aca1",
-    },
-    "0xb31f66aa3c1e785363f0875a1b74e27b85fd66c7": {
-        "ticker": "WAVAX",
-        "signature": "304402207b7e1639d39e9f697cdbcfa8e5ad9b46b20b0f10326d9caf0b8fa46005cba40a0220682ed60107f95a420d2c66d09a78bab2f62cb5a73118b366ceb455b1806912dd",
-    },
-    "0x442f7f22b1ee2c842beaff52880d4573e9201158": {
-        "ticker": "WBNB",
-        "signature": "30440220039ca3a4f080adc05a250f9f21a8549b3e4b44f937e22f7f4f099b1568940026022074a04bd69ac9a130485c2ac6f7828e0db284135d7dec25db943cc960d3e2d8b2",
-    },
-    "0x5f880678320a9445824bb15d18ef67b5ecbaa42a": {
-        "ticker": "WBRGE",
-        "signature": "3045022100b9c3e1e29d6467dc98a8da45a60c7c37adf761dcac0773ceaf3a3c37d68bfa88022016021785940645b3cda916e59cc863a2f5cd4a2c3ebd609dcedb965abe622c74",
-    },
-    "0x408d4cd0adb7cebd1f1a1c33a0ba2098e1295bab": {
-        "ticker": "WBTC",
-        "signature": "3044022035ecdc55ae9be8a3512469efddbc8a3db67b4a632fbe7289839a72105874807702205e0c7e8e9a5247a147e3369a54cd99a9ca06bbe6746acaf0d926c22308797323",
-    },
-    "0x50b7545627a5162f82a992c33b87adc75187b218": {
-        "ticker": "WBTC_E",
-        "signature": "30450221009b2d0dd9ca6c5bf37f7e7b55d54ae9b1295b947d59415be1b3b6ac9a409cedd7022036b13c14d828884fe88280fbd55ef21f6f07081b5385547fc275f9e3ecc3053b",
-    },
-    "0x49d5c2bdffac6ce2bfdb6640f4f80f226bc10bab": {
-        "ticker": "WETH_E",
-        "signature": "304402207db80ef9807b5aa1d307ef65c7f8ec2ab2d608d813b1760857bec95723b29365022060996462ee3dff7881f2bcfdef61b9ab8e893fd332cc890b6fc915ce7017e842",
-    },
-    "0x8b82a291f83ca07af22120aba21632088fc92931": {
-        "ticker": "WETH",
-        "signature": "3044022052514b0055a0a1c8ae14bb322f4c81760af3434f5ca4287e72eec3298270c280022017278d95e09e6a4f6338883b5a5b7e7d4acade8502d14f9ea2f679480c9549bc",
-    },
-    "0xf2f13f0b7008ab2fa4a2418f4ccc3684e49d20eb": {
-        "ticker": "WMATIC",
-        "signature": "3044022040bde5699385b902c7b3e69c8497034c08dffc259b60b70cc453bc6b66b3e6f902201679be502af8853f4cb11b485437f347d0d0f96847c648b635ac4ca4dee86897",
-    },
-    "0x0da67235dd5787d67955420c84ca1cecd4e5bb3b": {
-        "ticker": "WMEMO",
-        "signature": "3045022100c1c6da3245813ec8e0a33955909e7cc0842b197021b16f7384640bb7ccb0d1320220262450c2379658f3ae6715b2396d028c967d1be98eaff34ee6755e93d3941186",
-    },
-    "0xfe6b19286885a4f7f55adad09c3cd1f906d2478f": {
-        "ticker": "SOL",
-        "signature": "3045022100873e445694151534605d506f7ac56a1cd7c02c0781c0f3c167516e747826b4eb02200446f3e43e8e6bde1d640917c68797e90f13ee8e2422159cb148863366dc92c3",
-    },
-    "0x31c994ac062c1970c086260bc61babb708643fac": {
-        "ticker": "XETA",
-        "signature": "304402206f6fa18638fcec132cae7c4e6bd8c6b7a9bd2e3f86f37e6e1760176c0adfd03902207b45add72f62800799efb076804fab21771c90204a1be7623b5e34db5447fd70",
-    },
-    "0x913c61ec3573e5e4ee6488552535fb1be84ff2ac": {
-        "ticker": "XAV",
-        "signature": "3045022100dbdeec6f92d957716d3647aa78ea384e45c4ad590139a243929f71ab2bba759e0220459a7a9908492a28c93dd4a4728a6c7770c92ce64983f86bb4fb984c102ae1e8",
-    },
-    "0x3509f19581afedeff07c53592bc0ca84e4855475": {
-        "ticker": "XUSD",
-        "signature": "304502210085f3bb85e1ed06cd92374610d8757635d051aeda68fe7daf1452abe8dcdfd8120220762a0f92cdbf99f6c20e6fb9ced1c810b9dcacd6e3aefd5ad2e097e5a337f7f8",
-    },
-    "0xc0c5aa69dbe4d6dddfbc89c0957686ec60f24389": {
-        "ticker": "AXEN",
-        "signature": "304402201d674a1a53b3f1e69bca594e6e84e9cbdcf8f3ded57b5f8384e53983ad80801502207982fbc3f2805704328b6055efb9f30d9b83ccf96e2fe3ed6476f6cfbc5d6a5a",
-    },
-    "0x2cf51e73c3516f3d86e9c0b4de0971dbf0766fd4": {
-        "ticker": "XIO",
-        "signature": "3044022044abdc0223cb776f9cd7d5a3de8e1c408ef6805819f4b63c4cf4282990932429022032cabd4408021f571290084924730d8f05e32ee0f1f6d805aac75994c9915878",
-    },
-    "0xa56953c7581f40264d50aa0e057cf74b336c3114": {
-        "ticker": "THOR",
-        "signature": "3045022100f14d95690c114f973c06c3296c65db7f485377b56307557cf720e3f6c06193dc0220470f4aae00fa0192d74d121ad2e14ed25ee401d38489881c37197078b51f3a63",
-    },
-    "0x735d8f3b6a5d2c96d0405230c50eaf96794fbb88": {
-        "ticker": "XPOW",
-        "signature": "3045022100b02b598321edfcf7b965515d8c7a4c8ee66981c0766ef94d9420549bf2eeed3002207291164dd0734572527e30ac536fadb431db76c39d3e3c6a4bb31f5d1f541918",
-    },
-    "0x060556209e507d30f2167a101bfc6d256ed2f3e1": {
-        "ticker": "XPTP",
-        "signature": "3044022030b8f0c192acd4da7a7ca421f60191735fb5d8296d7f3d69cb6005eade4093b20220017a0ce092c54690db37c032609161c5f774bc6fcf8edbeb3ccd1d5e41d86dd6",
-    },
-    "0x1e3c6c53f9f60bf8aae0d7774c21fa6b1afddc57": {
-        "ticker": "XSHRAP",
-        "signature": "304402203111be8508a2153a0875178ca66781f10e624e4f9d7d1b67b3ab469fda2750a1022074dba438fcd30c83575b89a2ab76a6748672ed7a1e14f527f1df21d8d818ef74",
-    },
-    "0x01c2086facfd7aa38f69a6bd8c91bef3bb5adfca": {
-        "ticker": "YAY",
-        "signature": "3044022014f9066926a3da9081859dca3f4836771aa72f6411026decd42555310f3d6c5c022028da45de770c265fb6d968a26f8b4a3a0bd043ee8b5c7674af783bc13bc1928e",
-    },
-    "0xf03dccaec9a28200a6708c686cf0b8bf26ddc356": {
-        "ticker": "YDR",
-        "signature": "304402200177ca544ec438f32fc8d3e59a876fd30008e2160c114add92fb492cb81fe004022025fb8dfcdba1e4a94df3b74630c4f9f472c530a5877c41f65d7b1dcce8d0d0cf",
-    },
-    "0x99519acb025a0e0d44c3875a4bbf03af65933627": {
-        "ticker": "YFI",
-        "signature": "3045022100f386fe472e993f47f18637099038b01280d867e2dda56187c5c1506a99621b1502201dfd555ee79809c23802c47d8b7c181cd13b45e1305c63fe3724e04b9e7d859c",
-    },
-    "0x9eaac1b23d935365bd7b542fe22ceee2922f52dc": {
-        "ticker": "YFI_E",
-        "signature": "3045022100c40e4c9f8af6c966309c8e7afe5a8d0cb97d15f8772b89bc3109df08771fd81902202af0a6373ef2e38c306a8e44ca629eb5d8a01662afb03903a42eccd0a98e0491",
-    },
-    "0x77777777777d4554c39223c354a05825b2e8faa3": {
-        "ticker": "YETI",
-        "signature": "304402206651f56860b4aec488bbdb06d073470d3101b90625e5d81d89cad8bf669c79c802206539561453d138b6bce616575b49977b3135c42c7129afe774ba53c68d6d16e2",
-    },
-    "0x488f73cddda1de3664775ffd91623637383d6404": {
-        "ticker": "YTS",
-        "signature": "30440220434553346e331c15c70693a42e3e8329ab672cab62320449ce59d9ec3817c7af02203c1cab2f59f1216429f7a03e7443923f40fccb9af16188db9c292749be74a910",
-    },
-    "0x59414b3089ce2af0010e7523dea7e2b35d776ec7": {
-        "ticker": "YAK",
-        "signature": "304402207598de64a300237489eacf84d3d34f3b0f6f65c1ef5413bddeece028fd2bb982022060c5723116e3ddce7ad5dfdfd4b81fb9b437d9af500b9034cc1cffe9016b71ba",
-    },
-    "0xf7d9281e8e363584973f946201b82ba72c965d27": {
-        "ticker": "YYAVAX",
-        "signature": "3045022100f73532d14552c05b09f25a13cd188ecd1a0377da8b0cf64ad4328c5e333575b302200e3c13fbf1094b07c78c774f259d43983b5e875299e693003debfd05c1464e78",
-    },
-    "0x111111111111ed1d73f860f57b2798b683f2d325": {
-        "ticker": "YUSD",
-        "signature": "304502210096c9076739fa123a4223de8bc43e04c7447f6294cf843158c6ee8a20ca2649be0220778290173782efd27302f1791996b31cdabae9922a66c3d72fe977c4fe99127a",
-    },
-    "0x008e26068b3eb40b443d3ea88c1ff99b789c10f7": {
-        "ticker": "ZERO",
-        "signature": "3045022100ebfb483bcdb49099650dd965ff81c16d82444e23cae7a8fe8e3a4068d47db80402204b85b11a1c5101b8645aad6e6c983c5cd993bea94be0cccf40b57de70f24c1e0",
-    },
-    "0x44754455564474a89358b2c2265883df993b12f0": {
-        "ticker": "ZEE",
-        "signature": "30450221009b41492b115d25616c0ea15bb5cf651af3b62f43cfd4902b1697eda39e448fdd02202a127be5b977ffde376c0bed177f68040a5afcc715f05878de95b03f0a15e11b",
-    },
-    "0x4156f18bf7c1ef04248632c66aa119de152d8f2e": {
-        "ticker": "ZEUS",
-        "signature": "3044022071bda90755fe92cf086c968cff85c77fa51de73550ecf7d94eff71c66163e15d02207908415ab43e078583985b9c2bcaa983c67e83bf2cc7f088317a30080faa7fa2",
-    },
-    "0x769bfeb9faacd6eb2746979a8dd0b7e9920ac2a4": {
-        "ticker": "ZJOE",
-        "signature": "304402207e27f3d8a2eb4655823cbd88c3771968bbd9e6deab6e60fb67d90974fc3d45be022020f6ec7f21616fafb721478c1ee4253ece12e28c81084fc6415bdbff170d36ec",
-    },
-    "0x1b88d7ad51626044ec62ef9803ea264da4442f32": {
-        "ticker": "ZOO",
-        "signature": "3045022100c7607ce6f9734cd0cec08179382800242ee1c3dc0ea77802ea4e278a542ac0c102203486dfd8f86e46904befc02ebfad86fcd8bafb9e992890ed56099aab40a4d732",
-    },
-    "0x63dc3ca01ff09e714c8108ffd6f8a3e0b8cd13e4": {
-        "ticker": "ZUM",
-        "signature": "3044022051f5e048f59a9a473d42c7ce6ba7d6e3633ee3fc6a66d37f235cdbabf708df13022071cf69f60e59acef07370ac1c39f101a5899663600b15e06bb6bc17eca44e9ba",
-    },
-}
@@ -1,1714 +0,0 @@
-# Uniblow ERC20 list for Base generated on 2024-06-01T00:56:36
-tokens_values = [
-    # Mainnet
-    {
-        "USD Coin (USDC)": "0x833589fCD6eDb6E08f4c7C32D4f71b54bdA02913",
-        "Wrapped Ether (WETH)": "0x4200000000000000000000000000000000000006",
-        "Dai Stablecoin (DAI)": "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",
-        "Rocket Pool ETH (rETH)": "0xB6fe221Fe9EeF5aBa221c348bA20A1Bf5e73624c",
-        "Pyth Network (PYTH)": "0x4c5d8A75F3762c1561D96f177694f67378705E98",
-        "Wormhole Token (W)": "0xB0fFa8000886e57F86dd5264b9582b2Ad87b2b91",
-        "Synthetix Network Token (SNX)": "0x22e6966B799c4D5B13BE962E1D117b56327FDa66",
-        "Prime (PRIME)": "0xfA980cEd6895AC314E7dE34Ef1bFAE90a5AdD21b",
-        "Coinbase Wrapped Staked ETH (cbETH)": "0x2Ae3F1Ec7F1F5012CFEab0185bfc7aa3cf0DEc22",
-        "MANTRA (OM)": "0x3992B27dA26848C2b19CeA6Fd25ad5568B68AB98",
-        "Aerodrome (AERO)": "0x940181a94A35A4569E4529A3CDfB74e38FD98631",
-        "Osaka Protocol (OSAK)": "0xbFd5206962267c7b4b4A8B3D76AC2E1b2A5c4d5e",
-        "Degen (DEGEN)": "0x4ed4E862860beD51a9570b96d89aF5E1B0Efefed",
-        "yearn.finance (YFI)": "0x9EaF8C1E34F05a589EDa6BAfdF391Cf6Ad3CB239",
-        "BTRST (BTRST)": "0xA7d68d155d17cB30e311367c2Ef1E82aB6022b67",
-        "SmarDex Token (SDEX)": "0xFd4330b0312fdEEC6d4225075b82E00493FF2e3f",
-        "LimeWire Token (LMWR)": "0xE997017e0Cb0CEB503565F181e9ea922CD979c35",
-        "Phala (PHA)": "0x336C9297AFB7798c292E9f80d8e566b947f291f0",
-        "Spectral Token (SPEC)": "0x96419929d7949D6A801A6909c145C8EEf6A40431",
-        "Kyber Network Crystal v2 (KNC)": "0x28fe69Ff6864C1C218878BDCA01482D36B9D57b1",
-        "Maverick Token (MAV)": "0x64b88c73A5DfA78D1713fE1b4c69a22d7E0faAa7",
-        "Dola USD Stablecoin (DOLA)": "0x4621b7A9c75199271F773Ebd9A499dbd165c3191",
-        "Heroes of Mavia (MAVIA)": "0x24fcFC492C1393274B6bcd568ac9e225BEc93584",
-        "Autonolas (OLAS)": "0x54330d28ca3357F294334BDC454a032e7f353416",
-        "Aavegotchi GHST Token (GHST)": "0xcD2F22236DD9Dfe2356D7C543161D4d260FD9BcB",
-        "MATH Token (MATH)": "0x9e81F6495BA29a6B4D48bDdD042C0598fA8abc9F",
-        "USD+ (USD+)": "0xB79DD08EA68A908A97220C76d19A6aA9cBDE4376",
-        "Magic Internet Money (MIM)": "0x4A3A6Dd60A34bB2Aba60D73B4C88315E9CeB6A3D",
-        "Seamless (SEAM)": "0x1C7a460413dD4e964f96D8dFC56E7223cE88CD85",
-        "Cornucopias (COPI)": "0x0A953Dd9Fc813feFaf6015b804c9dFA0624690C0",
-        "LSD (LSD)": "0xcD1B51b87a8a7137D6421bA5A976225187a26777",
-        "higher (HIGHER)": "0x0578d8A44db98B23BF096A382e016e29a5Ce0ffe",
-        "Sipher Token (SIPHER)": "0xd0D1e44FC9aDAEB732F73fFC2429CD1dB9cD4529",
-        "Extra Finance (EXTRA)": "0x2dAD3a13ef0C6366220f989157009e501e7938F8",
-        "agEUR (agEUR)": "0xA61BeB4A3d02decb01039e378237032B351125B4",
-        "SubQueryToken (SQT)": "0x858c50C3AF1913b0E849aFDB74617388a1a5340d",
-        "Ethix (ETHIX)": "0xACAd1d3107808577022387C07512E7828694B2a2",
-        "KOMPETE Token (KOMPETE)": "0x8f019931375454Fe4EE353427eB94E2E0C9e0a8C",
-        "FOAM Token (FOAM)": "0x6059d0ed9368c36941514d2864fD114a84853d5a",
-        "Rai.Finance (SOFI)": "0x703D57164CA270b0B330A87FD159CfEF1490c0a5",
-        "Presearch (PRE)": "0x3816dD4bd44c8830c2FA020A5605bAC72FA3De7A",
-        "Rigo Token (GRG)": "0x09188484e1Ab980DAeF53a9755241D759C5B7d60",
-        "MBS (MBS)": "0x8Fbd0648971d56f1f2c35Fa075Ff5Bc75fb0e39D",
-        "Media Token (MEDIA)": "0x6E51B3a19F114013E5Dc09D0477a536c7E4e0207",
-        "DEUS (DEUS)": "0xDE5ed76E7c05eC5e4572CfC88d1ACEA165109E44",
-        "Wombat Token (WOM)": "0xD9541B08B375D58ae104EC247d7443D2D7235D64",
-        "Florence Finance Medici (FFM)": "0xb4e1B230dd0476238Fc64C99fF9D6cCDFDB2258D",
-        "ECO (ECO)": "0x434769c82fB928150B87C4Ae6320Bf71F92dCCa5",
-        "BetSwirl v2 (BETS)": "0x94025780a1aB58868D9B2dBBB775f44b32e8E6e5",
-        "Alongside Crypto Market Index (AMKT)": "0x13F4196cC779275888440b3000AE533BbBbC3166",
-        "Baseswap Token (BSWAP)": "0x78a087d713Be963Bf307b18F2Ff8122EF9A63ae9",
-        "Edgeware (EDG)": "0x4E0dA40b9063dC48364C1C0fFB4AE9d091fc2270",
-        "R Stablecoin (R)": "0xaFB2820316e7Bc5Ef78d295AB9b8Bb2257534576",
-        "Synth escrowed token (xSYNTH)": "0x01CC6b33c63CeE896521D63451896C14D42D05Ea",
-        "Synth Token (SYNTH)": "0xbd2DBb8eceA9743CA5B16423b4eAa26bDcfE5eD2",
-        "Aave Base cbETH (aBascbETH)": "0xcf3D55c10DB69f28fD1A75Bd73f3D8A2d9c595ad",
-        "Aave Base WETH (aBasWETH)": "0xD4a0e0b9149BCee3C920d2E00b5dE09138fd8bb7",
-        "USD Base Coin (USDbC)": "0xd9aAEc86B65D86f6A7B5B1b0c42FFA531710b6CA",
-        "leetswap.finance (LEET)": "0x0963a1aBAF36Ca88C21032b82e479353126A1C4b",
-        "Masa Token (MASA)": "0x944824290CC12F31ae18Ef51216A223Ba4063092",
-        "BaseTools (BASE)": "0xB3CE4Ce692e035720B25880f678871CfC5a863CA",
-        "BasedSwap (BSW)": "0x314da69dE85145FDd5b7580971e9DB0388A2cDc4",
-        "Bonk (BONK)": "0x72499bdDb67F4CA150E1f522Ca82c87bc9fB18c8",
-        "Aave Base USDbC (aBasUSDbC)": "0x0a1d576f3eFeF75b330424287a95A366e8281D54",
-        "Aura (AURA)": "0x1509706a6c66CA549ff0cB464de88231DDBe213B",
-        "CheckDot (CDT)": "0x0cBD6fAdcF8096cC9A43d90B45F65826102e3eCE",
-        "DefiPulse Index (DPI)": "0xc6955B85b622369a54Cc8C6DBeCb8e03c0885BD8",
-        "GAMER (GMR)": "0xC876E9Cdd16acD38c57200084345d76a673caC9A",
-        "Grabpenny Token (GPX)": "0x19b50C63d3d7F7a22308CB0fC8D41B66fF9C318a",
-        "JARVIS (JARVIS)": "0x777b2839832982B35213063d850848369390EE16",
-        "Metaverse Index (MVI)": "0xEA8954dE7607b90F5ec81A5e2e673D0f60BB7596",
-        "RocketSwap (RCKT)": "0x6653dD4B92a0e5Bf8ae570A98906d9D6fD2eEc09",
-        "SoftDAO (SOFT)": "0x04D1963C76EB1BEc59d0eEb249Ed86F736B82993",
-        "StargateToken (STG)": "0xE3B53AF74a4BF62Ae5511055290838050bf764Df",
-    },
-    # Testnet
-    {
-        "USD Coin (USDC)": "0x036CbD53842c5426634e7929541eC2318f3dCF7e",
-    },
-]
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/8453/erc20.json
-ledger_tokens = {
-    "0x1c1ec1bb5f12f24c97231165b13f3eab9d4ec00e": {
-        "ticker": "2FAI",
-        "signature": "3045022100da8a87f6b86b1b80204da3eea2eb783edd1f8a4322a5d9d1e7e4b92da213325502206ec9bc13faf515c821f53a4633723775e39403560a117cc32af237130ead311a",
-    },
-    "0x621e87af48115122cd96209f820fe0445c2ea90e": {
-        "ticker": "CRASH",
-        "signature": "3045022100b032c2bb77bc0266288e2f75cfe51a0e1638b83b091fc5857f2d47b43e84665502206837b0d3480d2b359df5ed5424c1a448687d95cd351b7ad19ff7f311961c4a63",
-    },
-    "0xcf3d55c10db69f28fd1a75bd73f3d8a2d9c595ad": {
-        "ticker": "ABASCBETH",
-        "signature": "304402200d335aa66f15af139fb1b92380164530f58959e16fae13a2b9d488abbbec51ff0220111f6e968db391002b7822d8547e0af18c94e0925c9a5f09969c0d9b765086af",
-    },
-    "0x0a1d576f3efef75b330424287a95a366e8281d54": {
-        "ticker": "ABASUSDBC",
-        "signature": "3044022004e89e81c5d34af778ec5fec52f5f47a6f2dcb2843cd33c7b7888eb3e4f624fb0220116ff871dffcc2553f5c42949238406823badd6d3631885796834b801b39f08b",
-    },
-    "0xd4a0e0b9149bcee3c920d2e00b5de09138fd8bb7": {
-        "ticker": "ABASWETH",
-        "signature": "3045022100ffb494d0780b1a9b2d62dc084d20d83872bc46e70cad729f146e7f2815abd3640220697139a348b0b500c8c4a03bcc548386f634b5ef4aa1c7f8e3663f94b4d669cd",
-    },
-    "0xcd2f22236dd9dfe2356d7c543161d4d260fd9bcb": {
-        "ticker": "GHST",
-        "signature": "3044022078ff4a86f88e7401a724a131b891409a3caef1cb0e00ba50363cc80c7ee2765e02200b090d02ea7718f63c46e8eebef3936b21329a86e593944da7157aff6c6081d2",
-    },
-    "0x8888888888f004100c0353d657be6300587a6ccd": {
-        "ticker": "ACS",
-        "signature": "30440220633b31f8d0bae40d695ab7f821a5977e3c80841ed37a08cb72a6ac51656c5bc1022026dc70ef3352a21947f31038b4ec8be3fd7a13fca615f2947bc96d3d8a252aa0",
-    },
-    "0x940181a94a35a4569e4529a3cdfb74e38fd98631": {
-        "ticker": "AERO",
-        "signature": "3045022100d05d94ebc2ca43397ea1e9bca878c06949844364f7e160a88b3a7d873c5837c0022075036fab9e32ba6e1dc71a520dc41002b98331e41287178c9682119d39f1fc6c",
-    },
-    "0x8853f0c059c27527d33d02378e5e4f6d5afb574a": {
-        "ticker": "AIINU",
-        "signature": "3045022100ceaf36e47b2da22f6ed8760cf2551b76a201511553aed7a6b552bfe93619215e0220563dab6334835b07b0511615660c69944f85a325c84fd0e77b0811c4e9464c6e",
-    },
-    "0x1dd2d631c92b1acdfcdd51a0f7145a50130050c4": {
-        "ticker": "ALB",
-        "signature": "3045022100aebee8cafd1524f94d20ae4963f162c2661ddae779cea7f84be7e1fcdbeb022102207aafdaac0500923fd427425d29653170d8b628d67e0b082a8fe02e66ca1a7657",
-    },
-    "0x42069de48741db40aef864f8764432bbccbd0b69": {
-        "ticker": "BETS",
-        "signature": "3045022100c6a6ae28d44096054ae574daa36165208d86a0b2721f056af036611e34df8de302205b39346c8f7c38be5f89d3fbe1c4042b62401ced8d3761f3f50258e6ba81f0ff",
-    },
-    "0x7ed613ab8b2b4c6a781ddc97ea98a666c6437511": {
-        "ticker": "AYB",
-        "signature": "30450221009aba5c5e793a341cd3ca3c5f4998d1b9653edefce4a6caac14136d26a055dac9022075f4a1494b1da2da2f98d06242a995adb03d7ff8105fe3d94d01ba29a21548ec",
-    },
-    "0x13f4196cc779275888440b3000ae533bbbbc3166": {
-        "ticker": "AMKT",
-        "signature": "304402207fa3ccc9f62fe72e723763c70b9df3ccb0f1426e6f6d53a1adb4b65a41315269022053ecf6ef9a3dbc177de28b6ff25e90bc759a493728ca136e4c3a9531f8a6bd8d",
-    },
-    "0x18a8bd1fe17a1bb9ffb39ecd83e9489cfd17a022": {
-        "ticker": "ANDY",
-        "signature": "304402203df818d7ee0989979308e3d4db358d27f10bf795ce46227621de9d12f0099b560220140f2a895c25efb1bf5332c6f62ae4890a832afcd502a324f85b9889bacbe3f9",
-    },
-    "0x0e0c9756a3290cd782cf4ab73ac24d25291c9564": {
-        "ticker": "ANIME",
-        "signature": "3045022100c32fee946d05375f49a6e1ee5bb0c241a0b31196243c4b969670b688401f4fa8022001321d877287b796b24346fc632c49d505ffaceaa7c7fcca2a21f6764ae4e1a4",
-    },
-    "0xaaf7c59712fb510857ff9bbd37885fb88a82849a": {
-        "ticker": "ANTY",
-        "signature": "30450221008a7d798471b39720a26ae7d1b654e76230306c9470567d74945d3152662a1654022021b82cc337868c5afc760db04d242b77adb711a5642ead897a9e8609b71e8557",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "3045022100c8753f961bdb66280dfcac1bf9956b2d1d886d6cbd0a7a76cd81f7460d77a61e02206fbee4e2949cc2f2be8d8f1999d79e3b6d09a0a43240de81380df7dbf565d743",
-    },
-    "0x3159fb5589acd6bf9f82eb0efe8382ed55aed8fd": {
-        "ticker": "APU",
-        "signature": "3045022100b08532c0b91c4c475101b0fb1cbfaeab821c982ae12f6238c861baeeddd6faa102206ae07be2ba839955f63f84eef7eba531aa3e882ac353199ba6e33f03f47b399c",
-    },
-    "0xe8876189a80b2079d8c0a7867e46c50361d972c1": {
-        "ticker": "ARC",
-        "signature": "3045022100df8a3cc275d6988bb884f2bc173ad2be5642539bbb9bae546c245cca4861ed5502202cd3a3bf28894d22a4ea77ff3bc3a923d1cf539bb94591105c39a6676dba5e10",
-    },
-    "0x97c806e7665d3afd84a8fe1837921403d59f3dcc": {
-        "ticker": "ALI",
-        "signature": "30450221009109c0794c40ac92826b2e61d919b420b7b25785b75fa0e9deff4fa6faf0430002202ae2950a1d1565b6437080fba9d827981796d112e54fbefca78a7ecf3add6ad0",
-    },
-    "0xeb466342c4d449bc9f53a865d5cb90586f405215": {
-        "ticker": "AXLUSDC",
-        "signature": "3044022013b6c19c0606dd23ce27d0978321e398f6d5f87c22923a11031c87c18fe8a6ab022067bf0de82349384373666e9e8835204664ebeff5873c2a96bf3f3f6745edb907",
-    },
-    "0x1a35ee4640b0a3b87705b0a4b45d227ba60ca2ad": {
-        "ticker": "AXLWBTC",
-        "signature": "3045022100e80dd3b88cf25e2574fc9b3b04a39174b26a65eeba433dbebe9a3d5527b29a660220147c4a582f7bd5d61561df89c022c1c59af60f5fbd5f1945b750af6eb91edce0",
-    },
-    "0xec7acba6fedb7ebfbc0f44f8f0bc6fc39543e28a": {
-        "ticker": "AXN",
-        "signature": "30450221009c228031f794d27f2a06cd46d302e418401ac015d3fc93d1cc2b70fd9cf94d1e02200b34bd871fc0580d4da3da703655631838ce3729fac196701ea48d256cbcd48e",
-    },
-    "0x52de0096836bada37c83d6648e0615c40f2d9e51": {
-        "ticker": "BABYBRETT",
-        "signature": "3044022016d0d0539fe849a655dd067535b53da66fb446c9c80264cc1f88f37b2cbd863d02205d903f6e159435063fddbcfd8a919caa3153586b2f63e6761375b049cf0abc12",
-    },
-    "0x4158734d47fc9692176b5085e0f52ee0da5d47f1": {
-        "ticker": "BAL",
-        "signature": "304402202da9dde10f1cb1295a27f086a5bf9e08651259b291e1d59f2eb3d1f07d9b1c6602202be962151d71a8b1c30cec5b526ecda33c98bc214261951efa87da8b7fcf3e8d",
-    },
-    "0x0c659734f1eef9c63b7ebdf78a164cdd745586db": {
-        "ticker": "USDC/USDBC/AXLUSDC",
-        "signature": "3045022100f6b5e59eb4897285064063a1744eee648e31022a576c8fc6074e33eefef92b7d0220015978fc467734470d71a2a0a6a3ae3f7160269fa34c1cb30ccb5decfb603ff3",
-    },
-    "0x27d2decb4bfc9c76f0309b8e88dec3a601fe25a8": {
-        "ticker": "BALD",
-        "signature": "30440220737e9694d5666305e8fd4d5e2f6b0b4220dd8bf04b69ba7adf81d255938df47902203c428cb50d776c6684f19dab0d307d2012d2b3ab8085f1105409a0f0b9d95d90",
-    },
-    "0xd2faa0caee8421959aa13fbd20a7ed7e93702ffe": {
-        "ticker": "BALDO",
-        "signature": "3044022055fc28b48feec51d1838618351284aa17c4abd55048a3cbd1396ae5273e4d51a022057848a75d7448eeaf7e01663906ce0fdfe22ed4a38818a51689a2856f1eec66e",
-    },
-    "0xd07379a755a8f11b57610154861d694b2a0f615a": {
-        "ticker": "BASE",
-        "signature": "3044022035c3f274297f011a79a79ad89a5976c8733b99a20075d5a9b7ed79f187d8834102205e3b3272fe33c5eee87805581ea373d48ffa0b1b3c05acdfe7ccce37ef89ee69",
-    },
-    "0x4acc81dc9c03e5329a2c19763a1d10ba9308339f": {
-        "ticker": "$BOON",
-        "signature": "30450221009c49a9e90c914d22ba4b5c85aae6e999ceabb0cc09c1c56543da3c0358f336f4022078a6f698251ed324063cdcfb86f982ed71bb5c955f9d321f970248f87638caff",
-    },
-    "0x1dedb41feb0e12637a820c22c1b739ca2e75b48c": {
-        "ticker": "BBOOK",
-        "signature": "3045022100e4d20286c68bde78b7550f81eba147446c35ecdcd11208f76feb1836011b079902202577c014d737e91025867c26b50577f3d65e614eb6ca63afe51565d04489540d",
-    },
-    "0x0d97f261b1e88845184f678e2d1e7a98d9fd38de": {
-        "ticker": "TYBG",
-        "signature": "3045022100c45fc1277d5f2b65e6ce19ac1e8a5840c64ae0456026de8bf0032162d8e4cc6502202b88e573699095919ef14c86cedad6ce41d67ba574f09a9eef016fc6ac9bbcc8",
-    },
-    "0x160452f95612699d1a561a70eeeeede67c6812af": {
-        "ticker": "BORD",
-        "signature": "3045022100d810af729b6e385ad5f32681fda0688232aee65a4d77130cc61a36e97fdbeadf022028a33ad462d3b10ee28ab964421e4a3ccdd9201bb626ceb550ea424d30301b48",
-    },
-    "0xda761a290e01c69325d12d82ac402e5a73d62e81": {
-        "ticker": "BPS",
-        "signature": "304402201f50c1e714e730bb9ab7d4d163e1e493f07638bc1f70b0644c44b88a14b653e00220736ccaedb645edc0e2761c415fe4cd71163f7b1842f7bfbf5f4e3d6bb11cd65e",
-    },
-    "0xb661933d9f24ec34dc0fd6862f086079f864b26f": {
-        "ticker": "$STREET",
-        "signature": "3044022054da7fe15e4cf556b15c0bb3948f30584421e33c5276833a0230702bcc0a224e0220090ee1a8f881cc58a7dfdf253753c1fb45eccd8f5482bf320700e7bdc59e60b5",
-    },
-    "0x236aa50979d5f3de3bd1eeb40e81137f22ab794b": {
-        "ticker": "TBTC",
-        "signature": "3045022100e7f4089f932286f38fb3f389590c28b29003ec7e864ba3e1162cc68863a13b080220520c8d510f459ac74e3d38eb3e69e63c8fc18b08b4914635fe2b1ae81f65f19d",
-    },
-    "0xc5bebd5a6ae6be4fcf383eea014fb1dbd43789ca": {
-        "ticker": "BNS",
-        "signature": "3045022100a743995001608fba7501815f7c98a25ac1641920e5b1cf2723d70acf4c1b5c0b0220171865b4664776df33566f9f9f3f0730996307eff7fa3093dceeb1f52dcc8d52",
-    },
-    "0xc2464fb6edc12e4c0d3aa9b201497a27e6b7ef04": {
-        "ticker": "BASEAI",
-        "signature": "304402203988457c5eba1949e5e04e13de6c1175ddb0bdd49babfc73c7f008192dd93622022015345a09943428f4322cfca5506f4a4c5bca89273cb68e519a8adf642b616668",
-    },
-    "0x09f29e2acdb76a831668b03ce2e3ad7bb41aaa5c": {
-        "ticker": "BAPE",
-        "signature": "3045022100ab11b4f5c290aba8b0cb919e8dffe9e2dac475e3b152b46938ddffba666e53b702201e59c103fadfa6fe0b5ee73215645ffc8506e6a3604957872247f33aa40d14a3",
-    },
-    "0x9721b1ce4ffd8af047bbdfd87e4e20ddc544513a": {
-        "ticker": "BROS",
-        "signature": "3045022100fe4cb8f7e0d78949ae133543cffb15edf29a7cfc172bf661526d1dacd3f1282402203e7bcdf9742f9558c8257114ca956a314d5b88a057b3b4b155e46c189a9cc08e",
-    },
-    "0xd5b70ed3f2ba01bfaaa3beb09e31fe11f833b85f": {
-        "ticker": "BBB",
-        "signature": "30440220532db1203e80e8c3991eec3fb85fbef8ec7700370675b1d303ff1d6a840c3d9a02201fa51af1e18f3202a4c6af95b43c551d8ca8592efd24fff0a0f24dc6b02b5031",
-    },
-    "0x9a66dff46f5d0d761186936ced6fa4597753a7ad": {
-        "ticker": "BOBER",
-        "signature": "3044022066b7827535a2cea974ffe564f45085e13d06852bdc2fcf82bf227774768af88802202b951662488363824a1d31ddcca0e6b47d15cbeed4b314a45996fc63f64ab8cf",
-    },
-    "0xd473475958d4c1538418224a52e5c0a6c997835a": {
-        "ticker": "CAP",
-        "signature": "30450221008e5d44b5897f367e279ae55de268673175dc8d92050a94e7c34b4854bcfc57260220796bfc920810e7e6999fd18f627c7e019f17a3afaa9ab62beffb72edc5b74f8a",
-    },
-    "0x75570e1189ffc1d63b3417cdf0889f87cd3e9bd1": {
-        "ticker": "BUNNY",
-        "signature": "3045022100b8633cad91c31460a158d7e230ea766fafd04917602b7b061a56a54d1bbbb71702204f8b87b0292d64cfb0811d4772032d586d47bf42681a6735e2da77fdfad77140",
-    },
-    "0xecaf81eb42cd30014eb44130b89bcd6d4ad98b92": {
-        "ticker": "CHAD",
-        "signature": "304502210086e2c596060614a6b14eb4bfe33747de102843e14b9db068ed1c09266f9d2ad102202a58417e77e6622644244e29b952b29d34b2489bd378ad3218e37b178ef473d3",
-    },
-    "0xcb327b99ff831bf8223cced12b1338ff3aa322ff": {
-        "ticker": "BSDETH",
-        "signature": "3045022100e617eb5a89b146141bb0c47d60ddfdbfdb48eb05f64cd9be5284f83dc19b885102201cc27e936a337fc53ac145462871cb010fb6f2778e9c3d4bee642c2ac94a4dfc",
-    },
-    "0x9ee4ed687d1ae6fc3a7a427add25c6356876af6c": {
-        "ticker": "FINK",
-        "signature": "30440220043fcd326e85307a529f04f754e64fe8881ccca99b16ce18383360f3fd5a4f4602204ba8077ca854fc20421abbf50dd770511f932064f5df9eb24143d5cb48ed65c3",
-    },
-    "0x0058a80ee31ab94c87211ff780445c52075ddc17": {
-        "ticker": "BLOKI",
-        "signature": "304502210097fcf73bef9d0c297b5e0d717c02ffa55f98d3a63247add8fd8990dbb24e2fe8022045842151cbb79c372aab1098c5e0048362bd07cf15cee34c73380f38f85c2783",
-    },
-    "0x8319767a7b602f88e376368dca1b92d38869b9b4": {
-        "ticker": "PEACH",
-        "signature": "3045022100864e92f52200409fab0fd7f21ca4d4318d9f950a670bd5d360bff23939eef74f02207f3287e12fa9f0176ff22350e2b55ba8ca46d75aff4e8958f9f8faec61b1bad7",
-    },
-    "0x3e05d37cfbd8caaad9e3322d35cc727afaff63e3": {
-        "ticker": "BENG",
-        "signature": "304402201b2848b6ab121ba3a9e549b193ee8bcc5a883ec0574729d8a89cf6d3197107d70220360e55f08a99d543eee0fd21f298e2330e89ef6a0312c36697bf9ca8ec713658",
-    },
-    "0xba3b38581f96b04f75ca4ad51296fff3806d7626": {
-        "ticker": "POTATO",
-        "signature": "3045022100d59edea74a5ef29be769767bfcd563266e6accd34e5be6359fe99e19cd30c72f022009ffe77725e697aca31dc6b425a477cac163ea44887eb3f7b4d62bd53027e25e",
-    },
-    "0xfea9dcdc9e23a9068bf557ad5b186675c61d33ea": {
-        "ticker": "BSHIB",
-        "signature": "3045022100dd3121e7ce47cbca7b03f4fe63e9d673cde77ad8fc6aa4436e7f416d2cf135fd02203674f23797f76f48b2975f994fe16b708ce54da01ef140a557b9d3648abc1e33",
-    },
-    "0x8a24d7260cd02d3dfd8eefb66bc17ad4b17d494c": {
-        "ticker": "BSB",
-        "signature": "30440220302a3d2ddbbdb38122b2015679c1da1fccec6e691b822b92dcbe77d52a3ad69e02204d5f813cd292cdf858e8c579185ab6fec793c4736973445b82417c19ca83cf60",
-    },
-    "0x9cbd543f1b1166b2df36b68eb6bb1dce24e6abdf": {
-        "ticker": "BASED",
-        "signature": "304402200d07fea0bb4d8376cc3c36ba9eae70cc13f8b43e93ecc6a0ff94da78f44f9d3f022035fdca17f22f02a3e3d252e0a84dff8328e566f638f84a142b34bb931a973f0f",
-    },
-    "0xd1db4851bcf5b41442caa32025ce0afe6b8eabc2": {
-        "ticker": "ZOOMER",
-        "signature": "3045022100d919399049e29ade49b1372a0f79e779df090b332d797177e5386ef1c0fc9dfa02201deed20f8728352aac90c97dc9b3007774939cce305c0d25bf2a8db6084641ff",
-    },
-    "0x527bb8424126a16fddf2a86e2504b5ed95de5443": {
-        "ticker": "BET",
-        "signature": "3045022100aacfde6f5010d51f33415107328b4754245e031c6e174e7e9e010c89546f090b02207875a075eeb3006db7805d7cdd10bee5247f61d35b142c5cadf6f8638df138dc",
-    },
-    "0xd260115030b9fb6849da169a01ed80b6496d1e99": {
-        "ticker": "BRATE",
-        "signature": "3045022100ea67f020dab79a1c1ccd97e54fd2a911ce12e947602e807e98a7e4f505541a4602200c324b3f79788d973a286b1217710affa73031b450f13dc33aca360b411fbefd",
-    },
-    "0x608d5401d377228e465ba6113517dcf9bd1f95ca": {
-        "ticker": "BSHARE",
-        "signature": "304402206daaedcf50be73f84fc3c0c1cef4d85d413eda5a0ee06f6d079ccaad010f68990220757a0177e735a4f52df094e5b38efb86557cb32f7da29e8a7ad1d8783af2996f",
-    },
-    "0x314da69de85145fdd5b7580971e9db0388a2cdc4": {
-        "ticker": "BSW",
-        "signature": "304402200dc35b34dc83d2d8a41c78b89c369f0f14f9337c17f3a8d54403c70820c1b29c02200c8561ef2c9e2855e762c265fbbb1f25166827a5732e568f63b4723e2adc95e7",
-    },
-    "0xd386a121991e51eab5e3433bf5b1cf4c8884b47a": {
-        "ticker": "BVM",
-        "signature": "3045022100e986bd2a889191f7755b32d7722e37a2d6cfb9192c5c3a4aefb41cd3c092881102200c0e7f03650e15fdb6d6134a58c4a049577d9904ef7b730cc2a626bd2c5f11f6",
-    },
-    "0x63e71271719f03d7233f4fa306b6ea868d0f52ff": {
-        "ticker": "BINU",
-        "signature": "3045022100e7abc4a4e762fe46a5e91e31c82ede64b279113ca2b4935981bb43b535c699ad02201e84957d6c6aacd709ba70ca289e4e8c7f26ab9e5504e4f54a8a72878af16494",
-    },
-    "0xbc45647ea894030a4e9801ec03479739fa2485f0": {
-        "ticker": "BENJI",
-        "signature": "3045022100f341224eca98035b3fb9cbf92d9df7ffe725c7205032199258319affb16fd98b022013dfd42b89b34954ceaa373b8efcd8a8bdd5d806d040f82759c9aba5bc4edf97",
-    },
-    "0xfebfa258995ddd51c6834f2ed6d63324910f47c7": {
-        "ticker": "BASEPAL",
-        "signature": "304402206279b30a6975dd31049d21ff5764b41f55e5c57f8a0f25dfdc4cde1b59cab015022058f789488b159100d6e858927375163e1f14237cd3268fe05c89c5c77088d49d",
-    },
-    "0xbd15d0c77133d3200756dc4d7a4f577dbb2cf6a3": {
-        "ticker": "SAFE",
-        "signature": "3045022100cc768406294de9c8074a08686afd7b603a68b247da9408e05c016b2ca2c69c9d022029f22131a7e9ac556bc81e2e6d32fb2220a1e93fa7813d815409dbc41c5db6ea",
-    },
-    "0x78a087d713be963bf307b18f2ff8122ef9a63ae9": {
-        "ticker": "BSWAP",
-        "signature": "304502210085647220142ac6a39f7b72634869230a3e075603884c938b685be06800a425d002202030bda72a0123cb1d409f27bc1e0b270763506e75ea827f5432c5d962b26792",
-    },
-    "0xfa7f2e933c09cd113ef6e72b76d61fb4b27496a1": {
-        "ticker": "BTAMA",
-        "signature": "3045022100bd1824c8167db208e0274f9bb68d9e95b3d4a1980e300368e1a908a199fe62670220523f39fd32b57e83b17910406193085bb5f81e6036f993d16dd06a1beed86a06",
-    },
-    "0xd5046b976188eb40f6de40fb527f89c05b323385": {
-        "ticker": "BSX",
-        "signature": "3045022100dc74360e81459aaa6d2a9d28f7bc17d7d03e30ca971304ba2cf43ed90cee713702204090baff9d9f5b601ce02c5853985ca485641c4fd0f7475a2766c672433f34f4",
-    },
-    "0xf45116c2e5be608152ea8a6a73917dfe75b707dc": {
-        "ticker": "BAY",
-        "signature": "3044022047b3e42b7f1a198f84976447a54abad5defa356222428a40a909fae1384ba7520220102afde7fccb739f2a8a9dc39f32dfc9548a0bef9c4a750603931681a87e0d70",
-    },
-    "0x9e53e88dcff56d3062510a745952dec4cefdff9e": {
-        "ticker": "DOG",
-        "signature": "3044022070449465b5385a2faba90fa63994c4d6b5c62964004714bdc3ff5908c46e0ff602202908cd6287ab860fcb4a037a5f6e1bae35a1dc640a2aae437b46b1a7e462fc53",
-    },
-    "0x4788de271f50ea6f5d5d2a5072b8d3c61d650326": {
-        "ticker": "BASIN",
-        "signature": "3045022100c2e9419b60fa889a3a0e6e4133f40efc18204edb3d267cd8f08095ce393420c7022075f0373ad9fb69a64e635b4cb6f4cb8850e522ad56be27a058f0b3403b374a05",
-    },
-    "0x23e1a3bcdcee4c59209d8871140eb7dd2bd9d1ce": {
-        "ticker": "BASO",
-        "signature": "3044022063fabf547f7602512d20deb4338a46ebfa7806d63cd2c9e6415efcf5fecdf39f02204c80e82c6faf5c43a047f00b46c3cbd47fd1e0fa6fba3d32548d34ff63a64e5d",
-    },
-    "0x1f23b787053802108fed5b67cf703f0778aebad8": {
-        "ticker": "BASS",
-        "signature": "3045022100ca2d69ccc941eef6f175596ff23a6e2f513c38189609bb27954796cc326d480102204fdaa87ba4650706a9c6acabfd1b9c59840db32181cd8f65339f6d12e5b04ac4",
-    },
-    "0x3fbde9864362ce4abb244ebef2ef0482aba8ea39": {
-        "ticker": "BAVA",
-        "signature": "304402206d5335374b97b3d45b4bd6fba548cf686abe87bdd7d8911e73ac1143b870b6e102202eeeef75aa792a8f9df7f82c48f1252643f74f90d27791936f831b9e91552828",
-    },
-    "0xef8a84eb92afd22a115d5e81b2c3c605b866f044": {
-        "ticker": "BEBE",
-        "signature": "3045022100fa90b2339337c90c97be2b00b662d02d8bf331411dfeaa760441c8d6e9cd11780220453d59d182e748d32d89062a258264e56fdb8683323bfd7c76f947c3dc5dab6a",
-    },
-    "0x4a4200947ad71ba4eb5ffeff10cc603a17af2f95": {
-        "ticker": "BELL",
-        "signature": "3045022100c18015b178ad243b9f4a45707b6fb02673608bf6580741f431c8a5cb9f160fc702201ce3af9f217e674b1f9955014c4481916d0c599a7327ed42a2f0163062cb2bdf",
-    },
-    "0xde7a416ac821c77478340eebaa21b68297025ef3": {
-        "ticker": "BENI",
-        "signature": "304402204fc8a4c4b4f8afcb813d9a37d5c889dfe0516b4b3985c89f3f3ec204d2b018a702204efd5f3dcacd3df66de9f1d989f56e47da96ca8d7c39dcd90dafb2af237a8025",
-    },
-    "0x9de16c805a3227b9b92e39a446f9d56cf59fe640": {
-        "ticker": "BENTO",
-        "signature": "3045022100b7cffc7773a8214161cfb0c7f65e025e3b71b91a81d538204233e3fc8f25976b02207932259ffdf3a94230be239975834e889f331dde74c9fb222033e7837ef937d3",
-    },
-    "0x10f434b3d1cc13a4a79b062dcc25706f64d10d47": {
-        "ticker": "BEPE",
-        "signature": "304402200f0d29130b77a3df275fb4adfd9f85d0c27daf4f3417d808569f5cd4c3104f1502205b0e6707655c9c33dba536dbf2f3960b35baf91527b320aa885478e213bdb5f7",
-    },
-    "0xef80422317dfe797ef7cf51b043226987877d34a": {
-        "ticker": "BIC",
-        "signature": "3045022100d8ba6ddae598b281a2f9b652c8b5d10344db06025a41e3fee64e590d8755df86022015b2454cd45825408d68ee9570bfc58e36f7e79fabc10f5edf17366d1b96d942",
-    },
-    "0xece7b98bd817ee5b1f2f536daf34d0b6af8bb542": {
-        "ticker": "ROCK",
-        "signature": "3045022100abf411076fc62bd9613c2664b8b18014cd56a503475a5127e4b0bbea6fca5a7d0220159fdc081095af217735b8d6aa05242c5637ea219465b9ddf53bc8c164bdc7c4",
-    },
-    "0x0d30be9d9c2cf90aeff4fef5b2e8c3d0b02596a0": {
-        "ticker": "BLARB",
-        "signature": "304402203adb82ea0a5cbd6878da32b5490a5f38c33bf4d3fd6b03dc150615e5bed6b96002204f8ae6736307658df91c3dc48a5129b011a5350ce4125e0da698d0f01197aafb",
-    },
-    "0x37defbc399e5737d53dfb5533d9954572f5b19bf": {
-        "ticker": "BLAZE",
-        "signature": "30450221008ed869d05d876db13edd7a0ca31bbcd0b4117800bf9b9c669d9cce69161614d2022030f54bde199ab4a1d8c69fb7fa57d67dc0943a85aae26bd1560b076071061300",
-    },
-    "0x347f500323d51e9350285daf299ddb529009e6ae": {
-        "ticker": "BLERF",
-        "signature": "30450221008dfade9af157517696fdb07945da3b0dfff921608e4f59707dcb11b85957e28c0220294eb27e491aa3e5909aecfa381367890ba119e32d8b77462f04f9d216b866ea",
-    },
-    "0x7b8d415f5239ae5e0f485971529b4f798e63b0b4": {
-        "ticker": "BLUBI",
-        "signature": "3045022100bd72592f9b391de93465adf2ecd01a0fc33e38046253db72b57958851ad88aa102205b3cd893674bd4fd2b5db358a362ef8360de25013dd11e38c23811b8d92e7a25",
-    },
-    "0x4c40454659c8ec1283355d8e3911ba1745ff6fd1": {
-        "ticker": "CHIP",
-        "signature": "304502210094e2d3b02596491147297f0884c6061c35aa26b46d1d0d3e4c6ffe37fb3c35ad02202956bef545fc586ee7667942a798afce589cf5b911ea9d8c593881a9ad18ac25",
-    },
-    "0xfd9fa4f785331ce88b5af8994a047ba087c705d8": {
-        "ticker": "$BLUE",
-        "signature": "30440220366662d9826d3d530a31d69636f0baaaecac5abb02cd8e7c5a51f697d2780cea022046ec56b59cf239707834d47529f1fbff4aa76719c9d435875ab0ce638c6b89cd",
-    },
-    "0x548f93779fbc992010c07467cbaf329dd5f059b7": {
-        "ticker": "BMX",
-        "signature": "3045022100fd1d7b6bdf64d3e05ab0752fd5b9c6908de2fd609d15f423a55530435d8a2ce4022061c94e782ee13e3f340509acd31857fc4fb4492d8548a3147160a0bee9fee881",
-    },
-    "0xff62ddfa80e513114c3a0bf4d6ffff1c1d17aadf": {
-        "ticker": "BOE",
-        "signature": "304402207554b83c2f89c713a875d8e789d2b5ac2a710280fcbd66fb65231063e0cbff4302207d59f2e50bb12a7ea6ed3f75dd45bd2590a766b4f1cd6a5a3639a4df2f8cca30",
-    },
-    "0x4e496c0256fb9d4cc7ba2fdf931bc9cbb7731660": {
-        "ticker": "BOGE",
-        "signature": "304402203d4380e985539e3de7871b6dce2fc9d113f839aadb38fc35394edc82869dd456022037c7af3893797b75a23ae9ec85962fe65890f0d2fafcf979563edf1db073da42",
-    },
-    "0x72499bddb67f4ca150e1f522ca82c87bc9fb18c8": {
-        "ticker": "BONK",
-        "signature": "3045022100820971c42b689bf2dff3ad36eb701bc1441e2342456e109a2eae5d5b9b62926c02201b53848b3f4e7783265cfdeccf690f0a097f62aa0e9c15e547cd2c507753e463",
-    },
-    "0xec1df7edfcdc2e2042c63252c1cef480f64f9189": {
-        "ticker": "BOO",
-        "signature": "3045022100f6f700ce17ed1a340a3ce23f27c7fa04729be6c9b6415d68104c154524e6eab902207819f3c44b04a9e7d2f99a08530e9d3a3a6f9182cbe0a7d04a75385a2fef2693",
-    },
-    "0x5698bba26d8668d781cdcfd2d6d6881226dd0f52": {
-        "ticker": "BOOL",
-        "signature": "3045022100b1c9d503978bdef0d5c277832088faf41dc371f0dd98e17cae9f310f776e3a5302202cc3efaf8df2f8307db62b31ee99cb1da96bf972f3e896744f61490f693aa611",
-    },
-    "0xcde172dc5ffc46d228838446c57c1227e0b82049": {
-        "ticker": "BOOMER",
-        "signature": "3044022049de3f70d8688fa4b045e03d33836e05e846776ecf697025ccf7beafcbf748d2022071e02e4e9407a0be5a35e118aab62f56df31de9c65bea40ff301660a397ffd7a",
-    },
-    "0x70737489dfdf1a29b7584d40500d3561bd4fe196": {
-        "ticker": "BORED",
-        "signature": "3045022100885b72677f70386c5d23e8a86bf4a3371092cbe602eb0819aea058c7e531d81c022071c06ae336450a2792bc6dca32e70d4daeb81013b8b76af243b7a1c51b7ffa21",
-    },
-    "0x33ad778e6c76237d843c52d7cafc972bb7cf8729": {
-        "ticker": "BOSHI",
-        "signature": "304402206140854d7a3798bac648bcf34be9a38e34201d8246ff1128f41cfcb3e8063a8d0220012cbdc83be4ce59d01f330c008c5674d0fb03542869e1a35eb4b715b3849716",
-    },
-    "0x532f27101965dd16442e59d40670faf5ebb142e4": {
-        "ticker": "BRETT",
-        "signature": "3044022023c5202b0d6d18d2758906451616c92759f27e5c8afce245957ac99b8a85e6c302203d83257d1c001b3486f4911281044b0797b6bfbb71408d20ce49a2e49b8952d7",
-    },
-    "0x1a475d06d967aeb686c98de80d079d72097aeacf": {
-        "ticker": "BRETT2.0",
-        "signature": "304402204ebee871290b6aae49713226e5796b0fa5be97594fdc27d25344fde374d2234e022076c50ac5af7823ba7e1397ce690c66c64fb86b47d7df2fa541c867257a999fb9",
-    },
-    "0xff9c8aad2629d1be9833fd162a87ab7ce1d68fdc": {
-        "ticker": "KRETT",
-        "signature": "3044022019e220db6b03432639c78d47d341cae5c0da76780e40a1de016923e10f6fdada0220355063f1c181b7c0a88cce6d9438a7eb7b8c8bf7a8a41ba08e6c58f5f1bbb186",
-    },
-    "0xc36f19bccd51e3f1163eff07b5edf9d2850acec4": {
-        "ticker": "BROGG",
-        "signature": "3044022056f8f354ae043bdacd1e468f0fc7b3f88945a33dbb51d777b97fa94a89ec5d7002206b499040939666b283f469e2beb103c98b511e0a3fb5420010f4f69d1de369b3",
-    },
-    "0x4c584cbc3a221998dc003349e1c12a4179e97b25": {
-        "ticker": "BMONEY",
-        "signature": "3045022100f1e9614b80a8f3f2f6beecfd3335fe699c0d2756d2eff3d13c86413ae66f0eb7022005d266e8537fd30d9c0c6fec4f9b26f0632ff6d8797d0a6e436365feefe6f599",
-    },
-    "0x63f844a81571588536614b3fa9260bec3e897126": {
-        "ticker": "BREX",
-        "signature": "3045022100fb4fc01b4cd7686b95f802d8a77bd9cd59dfbb5caa95bd7f0e155ae49099e65a022048e07e55f882ab38c46bcb1e85d03084ad937ca027109bb809bd3ec4178635e9",
-    },
-    "0x8c81b4c816d66d36c4bf348bdec01dbcbc70e987": {
-        "ticker": "BRIUN",
-        "signature": "3045022100a3ccd7e34028da19a567b20c8c2c5e8f98fa4aab92f449e3dffda8ec75e7de950220445f98e224d40a3c4d8684de9af59ada002e036b7b5a70cb86b7445fb4e4ef3a",
-    },
-    "0xe8e55a847bb446d967ef92f4580162fb8f2d3f38": {
-        "ticker": "BROGE",
-        "signature": "3045022100b24bed333de1350909c850f700aa99ec2c0ba9f4eb6bd44d5119864b995f281802205616e1685c2ba643476848f47ae49c99a3446ab4cdcd6846147a85441be8aeab",
-    },
-    "0x7ccdba6198db389cf37b714fd6573b73f3670236": {
-        "ticker": "BSKT",
-        "signature": "3044022055a4ab9a7ebb65df65bcea257d2ef1146f5bc52b970669dbc3397f8666f71e7702204f7b142c707f9e81899cf82e66901dfdf857ede0bd9f550b09c28ed6f1d660e7",
-    },
-    "0x45096bd2871911ee82a3084d77a01efa3c9c6733": {
-        "ticker": "BUB",
-        "signature": "3044022025b53ec3e0c50e8528b45a4a36048a6e52b0e2fd80aed8a0ba35f370fd397a5f02206adc0e32126f08d1f1f507271d1d9d7b2f9c02adbddc10d84e27dd4bea84d2e2",
-    },
-    "0xd11a584de5fa50a4ee560c48ab44dbb31823d9bc": {
-        "ticker": "BUTT",
-        "signature": "3045022100a41973e06bc29d02d38e8b52b40215ecb11b0ba6daa8794806bfb7bd0350b948022039f78669a7b46df7e66f0feeed7f49bc20d402e5c3c91f097f9a98b84444d006",
-    },
-    "0x7bbab17f79b99708f8cc3be0f4c33024fb403f81": {
-        "ticker": "BWILD",
-        "signature": "30450221009ddba06f8d17ba54a9e8f5c5fc048449cf34056a34d1b2648c997cbbb91ed8f60220578f2953c0eae76eb300887189096c8b3507d012a1d1f12ad030cb38f007b2ea",
-    },
-    "0xe095780ba2a64a4efa7a74830f0b71656f0b0ad4": {
-        "ticker": "BYTE",
-        "signature": "3045022100c5d9b3c3089bdfa4446a94468a188637a9eb3aeb26afb89c6b40fb2766dd7de502207b472812f3394d638ee6a49bc96d891ddf51ce8525ac8fa1e44f8c85cfc5f964",
-    },
-    "0x33b7f6225b4cbe5d368b7bb4807d6375b18b8c2b": {
-        "ticker": "CANDY",
-        "signature": "3045022100e66ab631cd614c3753860378e0e744fe5425dc4c45431958643ffe8f5ae9049d02207db014487ccae25d441c76fde068913b479605ac21912860ca6e00c1432c96df",
-    },
-    "0x4a0a76645941d8c7ba059940b3446228f0db8972": {
-        "ticker": "CAROL",
-        "signature": "30440220080283afecb52e2cc74df2d52062261d814b57f326335ba9dd58b7a43f4593a6022054857858468bffedf80c0f6ed9e69c27d0fae9f791e44289accf68222f54057e",
-    },
-    "0xa835f70dd5f8b4f0023509f8f36c155785758db0": {
-        "ticker": "DAWG",
-        "signature": "3044022072402c232a8266b5ad7fe2b8e65c9931ac863f78a1ae763472980adc3dc620a9022059f80a20c8102f003bc394143a61e8ec2b02ec6b80462e355f592c583c0d589a",
-    },
-    "0x302ab9ae394d675676ddb41e294169224824fc9a": {
-        "ticker": "CHZ",
-        "signature": "30450221008c13e89b3ce1da70fca1e1746c74d682b667b0c943aeeb2569b364993b22e9bd022012b864e0b50f907203826b2837fc2a7589511e51e0abb21db0ce86b0218f94de",
-    },
-    "0xa7152fa3b1fa9ec858e959164758a66f1ecf33f7": {
-        "ticker": "CHICKY",
-        "signature": "304402200550948bc945d35bd36469fecc6fe4bdd4d41c223811ddb2b2e97512c58ff24c022074b00199316d968506cbc18cbeeb7bee0e1263d52608990f2759927f95992b14",
-    },
-    "0x6d6080492d0bd40f1e44cc16791cc1664357f685": {
-        "ticker": "CHOCO",
-        "signature": "3045022100898cf32776d7b3265bf458599d68cffe49d6f1b410ac76898b4905986d02c3830220291a39e3a494a96d190547d4bde8de04575779ee1d30b6b790b81134973f102e",
-    },
-    "0xebff2db643cf955247339c8c6bcd8406308ca437": {
-        "ticker": "CHOMP",
-        "signature": "30440220298151366a68b74927d093c0a9367238c5bf1fbeb9b711c57f0cfd0cf5b9bc72022068dc1858cf5848c2d552b895a47d787004febe915ab2c61b4b0ec465a144af12",
-    },
-    "0x6d22d3ed82c947be8860a86a69c4b0cb0f65589e": {
-        "ticker": "CHONK",
-        "signature": "3045022100bd570dc0c7eb3fb7cd7171663cf8ec89ad9fa8b79590dac2118db643c4d44a9b02206a8e35be70b6915d87469a993b65659b5666e7ef394419c32cc8e3c4ead2996e",
-    },
-    "0x5babfc2f240bc5de90eb7e19d789412db1dec402": {
-        "ticker": "CIRCLE",
-        "signature": "30440220376f4b8ba47765a1bc5ca2a727e01148e56aa45e6081ac2661ca118702677f9e02203784b85c1a75c0425e97e94039d6480b9255b43903250bd9b1b94bf717ba6ea9",
-    },
-    "0x7233062d88133b5402d39d62bfa23a1b6c8d0898": {
-        "ticker": "FORT",
-        "signature": "3045022100c064bcfe3c1d9e9b0e01fcc0278073a39fa3f342f589e44393c2c34acb61d9690220231de531f1e70e60d41ecaccd001071b308282d1ebd7a7758139c15426d0ba7f",
-    },
-    "0x17d8217c0f4b4742aaace053281f42eb05ab211d": {
-        "ticker": "CLOUD",
-        "signature": "3045022100c51055b91b24087909bc9435afac4dac9135da67d5f9db57da8ed68808f75eba02202a503c2327171b6736dcb3f568d1e75840e680df8d3d73bfff408f3b1f111182",
-    },
-    "0xd022723a5005f53c95b51d1822f42b1a3366ee4d": {
-        "ticker": "COIN",
-        "signature": "3045022100f7db583b851b99ce09a177b9af6fb88c18586a6a478374ead8d000bf08b6d3ce02202863c5bc4871c536b7517e5cb4e46bdffc5fc4b5b634b674161632f26b6e3c84",
-    },
-    "0x2ae3f1ec7f1f5012cfeab0185bfc7aa3cf0dec22": {
-        "ticker": "CBETH",
-        "signature": "3045022100d3699480c658cab8741594ef5df14c6c7d8b6722a9604c0b1b1b831fd45c929d02201fd42486a6c2579db3ba56a59acb17e63be9a71d44eea7e3b1c742b54e2837ec",
-    },
-    "0x0028e1e60167b48a938b785aa5292917e7eaca8b": {
-        "ticker": "COINYE",
-        "signature": "3044022053f3fae04c0adeb7d6d75766995d3283607c97b170f64ba7950023ec922724f2022059cc0c90f1ebf0b82a877cb5919b896d07bc2cd38335635ec62061c9c270f35a",
-    },
-    "0x30d19fb77c3ee5cfa97f73d72c6a1e509fa06aef": {
-        "ticker": "CONDO",
-        "signature": "3045022100c9d54c9678566d019ea81111f8f7f808eb90bc907175a94c4393d7acd6e8606502207c912415a5c17493268fa55bf9de0b3bae385dd9b7965256185c1e8322ab4199",
-    },
-    "0x614747c53cb1636b4b962e15e1d66d3214621100": {
-        "ticker": "COOKIE",
-        "signature": "304402204c18c9785deeabe30b27e577e1e8b909a941ced872b65359fdbc63486f3236810220717044c9eb92563056a11a5122267e69a6b45a662da47bc6281e6a2ff8bde9af",
-    },
-    "0x633546a298e734700bdca888a87ab954159ec93c": {
-        "ticker": "COPE",
-        "signature": "3045022100d357947b6993b6a79ae27278c275d82b830ba43479be6c0f5059cabb46bd4fce022064e769faf86b22a0dbd9e5048ffe3d5b54514119dd03b6e28fa6c829b42475c7",
-    },
-    "0x6223901ea64608c75da8497d5eff15d19a1d8fd5": {
-        "ticker": "CORGI",
-        "signature": "3045022100e1ec536c41e87af751d9b0ae68100f66f51417a106ae2b781aea055ba7f4a814022037b7b828edc0203d353fb25f0f44ec0b72a19fa6b3d54261d039b4e3b9bc6839",
-    },
-    "0x0a953dd9fc813fefaf6015b804c9dfa0624690c0": {
-        "ticker": "COPI",
-        "signature": "3045022100a1496328a1b4a70064216fbbb16a37e8e32da6c476c0727ce8ad9f913cced79d02202c3a2fb750d049dd11e809a76c3966b912c55fb313755c5c47098c1cc4cd950d",
-    },
-    "0x89eb6680c8d85d384c02059e4b07e4dd8535e549": {
-        "ticker": "FROG",
-        "signature": "3044022037b8a1a4e43d20783a06bc6484e25598541790e785eaba2feb48a69be63b21d602203d4d0db150ec51c32dff3298d6ac30a655684821327c656be5498d0f5ada0676",
-    },
-    "0xdfbea88c4842d30c26669602888d746d30f9d60d": {
-        "ticker": "CAW",
-        "signature": "30450221009c99ce82a7ed54b06d69dd6b7722885f84fa06e5a7db0bbe5cbea28a858706ab0220158333bdaab63b0214dfe3855d64c71ca161a3e0dd72f653e5a0e74becf0d4e1",
-    },
-    "0x417ac0e078398c154edfadd9ef675d30be60af93": {
-        "ticker": "CRVUSD",
-        "signature": "3044022046056320d2ef4434ad8f0a766614321ddd137443e8368039b845038d14cd337402202f0cb26445eac9269c5416cb6b2f53acc255fffe811d4fd9fd72968e8b7a4af7",
-    },
-    "0x1ccb4b14a11e0f2994a7ecbbd4cc69632f4c7c76": {
-        "ticker": "CCC",
-        "signature": "3045022100f1e77ca1a8090b80e351d12cfc7f3c6bfbad4138329c53ade547ea789959ad4202200c8ed37c70c3e8353e58eb21e58feaf4b8f75a56d23447b345de2e9e6dde561d",
-    },
-    "0xca72827a3d211cfd8f6b00ac98824872b72cab49": {
-        "ticker": "CGUSD",
-        "signature": "3045022100a95e3774b72ba0f810d7ad40be57a62e2fd448cb9989c7f95a2a31a78713787202205290591311259e9b3cb0cb8f5426a73d42f7e4fb09533ac1a5b74a8f0ca04ab5",
-    },
-    "0xc2bc7a73613b9bd5f373fe10b55c59a69f4d617b": {
-        "ticker": "DACKIE",
-        "signature": "3044022008188a92b5e1e13c70724dfec9cc803748caf7cc0c0d5eb5943a77f37e10fffd02205586536075bd4d29410e422c4d7aa6c63d39644b0a18f47f1e279086665fc3d4",
-    },
-    "0x65a2508c429a6078a7bc2f7df81ab575bd9d9275": {
-        "ticker": "DAI+",
-        "signature": "3044022067c16bbc0b091c8014e5f7ccee9f3a544bc2d11a260a995a694a9bd35599b0cd022066519366486a1c2fb93aa455460e27a2d8899e7c3188b95643e1bea9a94bad1e",
-    },
-    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": {
-        "ticker": "DAI",
-        "signature": "3045022100d3c39a87945a2871d4172bfd99ecd6933dcaed0bee9e3ef1a50cc4473c67db86022063af56b923337da1e91f11e961b27cfd41c6606d4f4c46af9fa193c588de4c96",
-    },
-    "0x356177b452dbae18b5a4b43b7b5324bfbae235be": {
-        "ticker": "DFD",
-        "signature": "30440220378ee6b7a1fc1c091b2854c15333f7fa474aa7408e4dfc5b4ea060bebcc1fff502206c7f76198d25db6c5f7c18ab090bad5d9e1ff6903f6cafad3f93de50a6abf1a2",
-    },
-    "0xd064c53f043d5aee2ac9503b13ee012bf2def1d0": {
-        "ticker": "DEFIDO",
-        "signature": "304402206bf1df3be278377fb5d560704fe6303e6721591e9c93fae984ea9e8b26f46933022005372d51c0f6cf8223d58753294e00c6a1d558d314f11ec7c3625cd28593072c",
-    },
-    "0x4ed4e862860bed51a9570b96d89af5e1b0efefed": {
-        "ticker": "DEGEN",
-        "signature": "3045022100c988deb5a2f5680ccd26c9e39b93883d69dd10219207833517e8e62afcbd7e1e02202616dd6d03c1c9b28787c7be6695b8ab87f716716bd229491003bb929e2072ee",
-    },
-    "0x4995498969f8f1053d356d05f768618472e0d9e7": {
-        "ticker": "POV",
-        "signature": "304502210099c9e9a4aa899882c1d85c359cc54963907898864ef22388e7c6ff57d54b6cdb022031280b3e823348b7b3b8ee972b804d3e625920472f8d338f0d85a52a55f0e9fb",
-    },
-    "0xebb78043e29f4af24e6266a7d142f5a08443969e": {
-        "ticker": "DERP",
-        "signature": "304402200d8161a0bffee71bce2a9a43c33e48e9654ba24ca58c0cbe979920961f87d766022001ecc56740d19801b7b4d0a0cbdf2f517f7032e5ff022fd807a584aaa3608d58",
-    },
-    "0x7bc401227777f173ff871993b198a8632741b9bb": {
-        "ticker": "DETO",
-        "signature": "30450221009156efe4ab9099f8e80c883b8db97f098a09ad3b5e973bab1b9338eac872a62e022011537b885cf250d8b2c1ac85f8c05fedafe3762b4ebe807ed0974408f0d94e0c",
-    },
-    "0xde5ed76e7c05ec5e4572cfc88d1acea165109e44": {
-        "ticker": "DEUS",
-        "signature": "3045022100e92b35c19a718d5ae8cf8096cd506a6f572b17bd5ec99340e2729284226ef32602200a5c917d85c515ded05c8c4e789cb7e4c5fd730fec8f48fe495747f44e920328",
-    },
-    "0x43e94bd32ac8e57a6009cde6790d95761120d4e9": {
-        "ticker": "DEWN",
-        "signature": "304402207d33f9b7bb3ade63f76be25c149473a037b6f7e259aac6f6753859b49aeb272b02202eac7982d98434afc94b496204dacd009a10bba7f2d8210613acf7ccbefcc468",
-    },
-    "0xe71f31be318ec604d5ce51879ff1e2d13a5c5847": {
-        "ticker": "DHT",
-        "signature": "3045022100f793eda62f2591ff7a94d405d21479d26a766d9533cd44823468ae8a79ea981602206d56d972d585feb324a8b5a8e25d4aa4007279773013a8ed8288acb5b465d805",
-    },
-    "0x0711ed8b4d1eb1a935cdcc376a205c7dca584457": {
-        "ticker": "DCR",
-        "signature": "3045022100805577c8e44942517f6db9d6b2cf19ab12292fb22c69c5736b9fa0b55d624a8702200ed92ec994c99dfd66c87cb4265b325b4c6436cb03251d2725d74c87a9cc858f",
-    },
-    "0x85e90a5430af45776548adb82ee4cd9e33b08077": {
-        "ticker": "DINO",
-        "signature": "3043021f7404b1a29a7376c849c8c5df700c36cd8ce6f821a0987cf6d302092f835f4702206b8f4656ebb72c7b7b36bb9edf57e2c1a2332033a5f385108436d1a3fb59e674",
-    },
-    "0xadba4694f5deaf3251d06dec38c86946f8952efb": {
-        "ticker": "DIP",
-        "signature": "304402201503e5797851ebee3344d7c33293b0fad91ba33b70588bc41d7e6f753739e825022012f059909c21b379d0f9b9af89c0fd04399e20624f1dab463a7ad9a0a6896cdd",
-    },
-    "0x3419875b4d3bca7f3fdda2db7a476a79fd31b4fe": {
-        "ticker": "DZHV",
-        "signature": "3044022000ebbb25837f0b9dbb40b80afd0fd3f4d246bffe53a2a3af65c7fde9cfbabd110220020035fec180b06f5df3bc5ec93bb3b9c75ba484662114d1ac008b04b292d937",
-    },
-    "0x881ed0fcef78120a135ec6cc66cef2779fe95bba": {
-        "ticker": "DOGEGF",
-        "signature": "3045022100b42bf71b2f0c023ee120cc0c5b1699d76a6bf222c81a434fb7b8156635b459f6022069dc7e0ba713ffc9c8187b8e2a02c0b8219c968868490a58a61ff77c1b08853c",
-    },
-    "0x6921b130d297cc43754afba22e5eac0fbf8db75b": {
-        "ticker": "DOGINME",
-        "signature": "304402201aa359a5e7de1896afe37d434c2b331e7ac07e37a7854910b1968d201581b4a402201fad25247ca72aa2a3a27763a11fa96de3e67168e05bebf52af0b0d3d702385b",
-    },
-    "0x4621b7a9c75199271f773ebd9a499dbd165c3191": {
-        "ticker": "DOLA",
-        "signature": "30440220240dcd5539544b2775d2c4f1a7a18e94351352397eaa7b92520f9da85e4a237d02206e68ba9e8e581e3f231dfd5b3925c1089769fffe7b50622769c2e208ac530f3e",
-    },
-    "0x9d8a9aec7adcb2b203d285b9c6f91abbcdf1d7e4": {
-        "ticker": "DOLP",
-        "signature": "3045022100b4dbe57cafb3094850eb50c48ad83a65f85d9e1e578a5f67ca633c0c8ce82ce202205eb581ca4d6885cffa9a92a8b5a22abea75ea13f1ad0291b841a60b207814a00",
-    },
-    "0x9edb1571f99ea88e0f8b8409648516a4c32d8541": {
-        "ticker": "DONCAT",
-        "signature": "30450221009af7dfa900fc57d82890e4419da24a82134e9032da0a2d9bab43443fb030586e02200e2df96de764620e97daef088b38d9ddb6b79f19a99308fa2079edde340758fe",
-    },
-    "0x15ac90165f8b45a80534228bdcb124a011f62fee": {
-        "ticker": "MOEW",
-        "signature": "3044022005d5a9030d74b99e9c91e05c21cd36e80c8db39c0e6af31113e1343faf167526022007e50d1250877dbab73b906b7a58dc13e61e5bcdbc02273c4bf590b357553a31",
-    },
-    "0x3eeec801cef575b876d253ab06d75251f67d827d": {
-        "ticker": "DCM",
-        "signature": "3045022100bf63ad6e089d386d77a60c97314b905b67336d195b7407fdd0785c826399bcbd02200cbc297b559bd8caf8899fe8b6ac30f88e3a5ecf51a8f0067013913cb120ec3b",
-    },
-    "0x3c3aa127e6ee3d2f2e432d0184dd36f2d2076b52": {
-        "ticker": "DCE",
-        "signature": "304402203fa814d9715f5c301a5c6ac59394524d48026711a25bc51eca41287d076d1cf50220634fb4cbb8b83172170409c85586f60b9e45ea71d84ff170e5a07b32bef50ed9",
-    },
-    "0xcb2861a1ec1d0392afb9e342d5aa539e4f75b633": {
-        "ticker": "DUDE",
-        "signature": "3045022100a27f82f583c643bb96530748bd6e8d508c78e4148fa8508f64dc5ec935e66387022058b6924e0f13abba94b191107a2f99252c7d2e6eff677d57352dca3d7f9e5c2e",
-    },
-    "0x8011eef8fc855df1c4f421443f306e19818e60d3": {
-        "ticker": "DUH",
-        "signature": "3044022017f208ba892286e9c7e42b15bbfb9b9d4aa9b0dd1ea4f21e1bad1660ea1c4ffd02207f4d01cf524674ff624ad55121a0610319fc3fd3a77959bd563538f56dabdcc0",
-    },
-    "0x4a506181f07da5ddfda4ca4c2fa4c67001db94b4": {
-        "ticker": "DYL",
-        "signature": "3045022100a8841150c2c4dedd65c5ac7dca45d65760bdb6049be4e44ab9b867377c75423502204126f74b99f15958aec2094f86bfe1a0dbb441c299fbaad56aac7cfa695e7c0a",
-    },
-    "0xac17ee2bee7e06d3e98f7f99818572ed9ea5774d": {
-        "ticker": "EARNFI",
-        "signature": "30450221008d1b0bde0e21c156bf1ea6ddfe865eaed76b6913de8f69cf1e8355aa24ddadb802204489d21727b184cf10d0f81d47abfe96055a5c7e4322c801794e7a4f3283f339",
-    },
-    "0x60cbb875d3c6314280dd90a4fe6cafc1d7ce5dfd": {
-        "ticker": "EBASE",
-        "signature": "30440220168edbdfabd7e7e361fdb2e9722fd8e06b243fb3d52c406de84ae0c4d3b4cf9b02205e4fcea1712a04027126427d53b5808867cd6b13f97983e5d0996f4308ccd25d",
-    },
-    "0x0a074378461fb7ed3300ea638c6cc38246db4434": {
-        "ticker": "EDE",
-        "signature": "304402200846f0ba8d6a8b8bdf0883fa76fff5fa17e5d5026e7ccfedc2ceedc1d21e8acc022065a1f404ded643608ebc63d53496b2200fb7ea05949851a48e77d16bea82b6e5",
-    },
-    "0xcfa3ef56d303ae4faaba0592388f19d7c3399fb4": {
-        "ticker": "EUSD",
-        "signature": "30450221009320656d8d3b63029230b778bfa0cae25cdd9820e4d3b4ca8e1bbaf9858759c202204d115f4c65270efeb178c7e20d0b6271cdde717f5d7e9a75e7938a0dd0d78bf0",
-    },
-    "0xbac48abfd032a30cabba33e393616576462976af": {
-        "ticker": "ELEPEPE",
-        "signature": "3044022006e325aff2b8f003d83f926b5378796e98b0fb9b002344572717bd32757e01ea02207c4e114faca12fa3e5e6d8a2b7b7e1e4806c51a5d13bad62683ca6fe5855c799",
-    },
-    "0xaa6cccdce193698d33deb9ffd4be74eaa74c4898": {
-        "ticker": "ELONRWA",
-        "signature": "304502210085d572297c49dbd9a41d6f3adf44bebe04c4a22a260cc2c912731a40a8a78a400220690e54da611165b7c99e2ede084a0f7dd5bf8fa875c58b09dcefcd57565c2ff1",
-    },
-    "0xfc60aa1ffca50ce08b3cdec9626c0bb9e9b09bec": {
-        "ticker": "VIS",
-        "signature": "30440220392668feb26f75db78d77405bdf79e2c123d9dd87af96d0f171c19c77028a8d402207c290ea9968518baeaf65909f1771a6f3170b2af34b81430d67c6e307cc56ae7",
-    },
-    "0x287f0d88e29a3d7aeb4d0c10bae5b902db69b17d": {
-        "ticker": "EPOCH",
-        "signature": "304402200183e6332d6c75fe28473be9464a40140f20a09894f7b8a2b3b404976ee9083b02200f5ba3fc025b564e361255a250db2f4d53c47c2d8dc842e595c235dffb79dcc9",
-    },
-    "0x6fd31533621452aac187c9cbdfdfb6ef50d28149": {
-        "ticker": "ESAB",
-        "signature": "304402204111df74db609fe9e5b4b164452d199b8ef3df07b5b492271125950a262df43102201a94ae3a80adcaeeea4f1689e136f474bff0a66e006e33ca202b494897f88a52",
-    },
-    "0x655325df2528d3896c6be2d8f5b98cd4020f3191": {
-        "ticker": "ORB",
-        "signature": "3045022100bf6c9c244179e3e5dbee194e9f40d771bd7e3e17b675815b703a927a5adbb51c022071da7fe2aed9b6f7364c58f6f08145f5c97eb250192298da4476ee38c603a3c8",
-    },
-    "0xa334884bf6b0a066d553d19e507315e839409e62": {
-        "ticker": "ERN",
-        "signature": "3045022100af563515deadd97a94cf96ae0c1229fde37fed8cb9aa8215d1a368cfca9f94640220491d6a0689d22c5f32fb3106a83b77fe55ff00b6c80d0a4c99c9c533cfa25608",
-    },
-    "0x717d31a60a9e811469673429c9f8ea24358990f1": {
-        "ticker": "EVERY",
-        "signature": "304502210090c2547ea373df5693d6e580099da80b2c4afc694d8ba1edc32e636bf35c97b7022037a943241d91df9617bc60b5def4b852c18aaafe278f3e28523d7065222cac38",
-    },
-    "0x2dad3a13ef0c6366220f989157009e501e7938f8": {
-        "ticker": "EXTRA",
-        "signature": "3045022100983e908b573e724148cec3f477ccab91248508faa1e174d398b50673b38a14cc022018e28d080a21f9401a7cef64372eda8aeb089e45f369ab594e5f4285bc306739",
-    },
-    "0x7e1a118070bcea660a96a1063a39e0fa93080220": {
-        "ticker": "EZ",
-        "signature": "30440220406dd6213f84ba27fb01cdae99ee9de2f6efe02e0feb7b500881fe97a2ae92b00220781b4cf23fb932b9479e01944d27e9ca3c159be39917a6e016a1e2f25edfcdf2",
-    },
-    "0x74ccbe53f77b08632ce0cb91d3a545bf6b8e0979": {
-        "ticker": "FBOMB",
-        "signature": "3045022100cf51aab21868ed362f1d1ef5bfd4a3f4ba399f22056aa7f22ee6a4800870cce602207b276480474ba32777af0c94ee111a6845e906da18a8a731bbf7346681001fd1",
-    },
-    "0x93e6407554b2f02640ab806cd57bd83e848ec65d": {
-        "ticker": "FAR",
-        "signature": "304402204977f1201588bcbc6f3386ba9e36a2938243ff395f42531cd79d985e3687a950022008e1604564aed0d0d24e684fd09fb7110a53c1be005fbd3286235da56a5e5cf2",
-    },
-    "0x12345ad24808b228f7031de863d9bc006ca8ee48": {
-        "ticker": "SEED",
-        "signature": "3044022031a1a86ff7e22bb8c6bc29bad3166ab7bf7835bda3953cd6e320fc636f97c30502207d4b951e38a50add8c605ced80a72cf6af5cb3663718893cdf7a0b86ee234a71",
-    },
-    "0x122a3f185655847980639e8edf0f0f66cd91c5fe": {
-        "ticker": "FELLA",
-        "signature": "3044022053134bac155a36749ec2633721048a87b310e836c3a596fe8d2e1a6ebfb3c8cb022061882691a79aecce83f9aebfb047b713f509f168bfed4e2288e5a2f88ea9d433",
-    },
-    "0x776aaef8d8760129a0398cf8674ee28cefc0eab9": {
-        "ticker": "FLOPPA",
-        "signature": "3045022100dd76ee8f6911007097e4dfadcbeb2364098b5ea9e971941f121037bb1ebeb9b8022075f223dd2b9102e3f6ebffb07502782e3e659ce77a69260fc334257131c7d918",
-    },
-    "0xb4e1b230dd0476238fc64c99ff9d6ccdfdb2258d": {
-        "ticker": "FFM",
-        "signature": "3044022029d8cb406d50c59d47dbf193f0902d4ac17364d508cc4eb966f519ddda72fc22022006abe8b3c9ae276756c9e9183a5528c69f6e8e3d732d111bc627c234721aef01",
-    },
-    "0x6432096f054288ee45b7f6ad8863a1f4a8e1201c": {
-        "ticker": "FOMO",
-        "signature": "3045022100da609c9f5c70295b5a8cb6e7b1856b6d6f1106f2d12029aebeaabe1d2de51de702207d947956f9e31729d9216a09dd1704f7053d9f7c1a864bba5ae004927b818111",
-    },
-    "0x5eb7edfcad75415abb54c345a4ea6ec390f77207": {
-        "ticker": "FORTUNE",
-        "signature": "3045022100e7231076b82b0109a57402b6ecbc7586ebca8b1b969b41657f806e22296f78a302200c45ea3f395d13ff4dd62bf096540217761b6021e11aef010a6d4a9319c3511d",
-    },
-    "0x91f45aa2bde7393e0af1cc674ffe75d746b93567": {
-        "ticker": "FRAME",
-        "signature": "3045022100e1a97c297d9fd2eacaba92e9b49682db0c00c62e283c50685284fc3393a9952302207dcf23e025ee4accc2fa25aa7a56844cb8a6012ef15f1afb4b2b5207139c934f",
-    },
-    "0xff0c532fdb8cd566ae169c1cb157ff2bdc83e105": {
-        "ticker": "FREN PET",
-        "signature": "3045022100ed265ae3d6798ad96265b7f27d8d063e65ca3e0c4ba0bbf6bcac061584a641da022009b37c00bcfaaadf9489d2246ad20b526e1e1c894c35e638a3c9da352945b3cc",
-    },
-    "0xdda98a036e03611aa50ff457fffbbe9163981529": {
-        "ticker": "FRENZ",
-        "signature": "304502210099c880524b626173f59ebadac182f4ba11d273092dabc556c5a2f62d940697da02200b126af560fc42c72e1a3d677241cb7a0685bdbc854166f5fa6b22763ab555a8",
-    },
-    "0x3347453ced85bd288d783d85cdec9b01ab90f9d8": {
-        "ticker": "FTW",
-        "signature": "304402204c18d1588be7185334393054e187e80bca0b79c976ff1bde9497164ca134100702201d6bd859d885cc7fcb05f04873db2df5666c8363905cea6622b4572595f53bd6",
-    },
-    "0x42069babe14fb1802c5cb0f50bb9d2ad6fef55e2": {
-        "ticker": "FROK",
-        "signature": "3044022002b2e0c9d537e9a015522278a08e13f668ce07c9273aef2067c0bc7b13d1e19e022002b9c9cab0bf8317bccaacf88f2ff6e9422140fdb3e55783ac837cd5bf5cb67c",
-    },
-    "0x7d9ce55d54ff3feddb611fc63ff63ec01f26d15f": {
-        "ticker": "FUNGI",
-        "signature": "304402202f373f6a9d8346eaa7c2eb5a819a07e4df1c2f72b07bbbf7e24c7cc1088cd39e02207854a8903ba96ae66719b22b083a876c33da5de33902c32396421eddfff140dd",
-    },
-    "0x30b593f8c3ab37615359b4e0e6df2e06d55bb55d": {
-        "ticker": "FXDX",
-        "signature": "3045022100f56f600aeaf0edea01586473ee3520aa8c14e4f20298d22287f8f869dde346c502201ed6b0ca770f3228e162921ab24c9e4d5d2682a91e31707e2f95810a9578f37a",
-    },
-    "0xa617c0c739845b2941bd8edd05c9f993ecc97c18": {
-        "ticker": "GMR",
-        "signature": "30440220082908edfcda24f2ae142378abcb726ad066b7e6d366576bd05b8e4806198fd902204d4ef50680d73ab2926e60c78f061d313456256909b4faa6a273eddbdfb6b174",
-    },
-    "0xbeb0fd48c2ba0f1aacad2814605f09e08a96b94e": {
-        "ticker": "GME",
-        "signature": "304402200df5f139b33579d5b04ad448bc9718b0416f911d807fd10af48949cbd37e1eea022007e2e8e9b1fd2b838ca70ed9c310c7f2cbaba45878313ad198b91077086822a4",
-    },
-    "0x580e933d90091b9ce380740e3a4a39c67eb85b4c": {
-        "ticker": "GSWIFT",
-        "signature": "3045022100d1365a3484496750effb98d6db01580b74904d176444f7ca0d285743414c164e02203f6df308ecc16738599e4d8a12b23ac76730cd8e5e69b73718118d10ccc353b2",
-    },
-    "0xc9e0dc5b3a89c1d55760cbee2b5973957fb9ca11": {
-        "ticker": "GEM",
-        "signature": "304402203ce792bad1e7d5b97a74a06cb9c0c88046db64b7032b78a429bb0d515c420302022033ecdd4d04bc9d7cca4420113973ac1c66b792f7737b3b941e7487fde7cb120c",
-    },
-    "0x1db0c569ebb4a8b57ac01833b9792f526305e062": {
-        "ticker": "GENOME",
-        "signature": "304502210090e56f4a4a851a1eba494b8b3c22787f79644e1677f529561ff3548a64a5a84b02201081804b870e4f76f3f86ebcddf3feaf1c70e65aada6145aaee4be3d50a19c11",
-    },
-    "0xcfb038913d2f93409019e4258244564ad4357be9": {
-        "ticker": "GHZLI",
-        "signature": "304402206432fbc29342b7dc1bd46e13dbff8465014ff31ede7a211d73f9b807bb92b4b60220309c3839849710cb1bf1298ef9b3213d404878dd33b5abc5f241116ea28a2c83",
-    },
-    "0xe4fc328ae212232efc5f5dd0e0b1537cd055d715": {
-        "ticker": "GCAT",
-        "signature": "304402205068664a73ea7a49f7f812e54eb9481a003633473643cdadb1a121772d7d937b022014f8dae9232493b4ef4c3119305f38b36a35e5088898ba20e365027379ea0465",
-    },
-    "0x655e1cb3f2c81c76856302679648df698a5f1989": {
-        "ticker": "GLI",
-        "signature": "3045022100e602fbfda82969482c87163dc70e618650ee5c61df4b764712364560f5b41fc70220530015c428f65b5f3f376ed2d887c7e009ab25dd1111dec06473bc507ef541df",
-    },
-    "0x4f604735c1cf31399c6e711d5962b2b3e0225ad3": {
-        "ticker": "USDGLO",
-        "signature": "3045022100f93af26c5abb47f6cecbb8e373fcd34ca8533d58c67f7d2ae9e249b9292e5c880220339fd1ca66b4085188300853e31811a122c4a0788e183d741760e72ffa843eb5",
-    },
-    "0xbb5d04c40fa063faf213c4e0b8086655164269ef": {
-        "ticker": "GLOOM",
-        "signature": "3045022100f671431384fd4f8554129bda3d525cc5c7f166587480925941d32cb81b683fa3022052fd0cb1a09adb6f55774748de9907d1e6f44f11f7fd328a67e5862f716b932b",
-    },
-    "0x42069d11a2cc72388a2e06210921e839cfbd3280": {
-        "ticker": "GNOME",
-        "signature": "3045022100eddad11b336ac5a4b10e2a93266a79fda0458866725e564ea873959068df539802201fdde7f7ff5bb878942432c3991b77b527313ee57a1317c203559d8801ce4570",
-    },
-    "0xbefd5c25a59ef2c1316c5a4944931171f30cd3e4": {
-        "ticker": "GOLD",
-        "signature": "3045022100f3177a7ba6e371ef1f942186b5020e7a3f28086167ffe3a064de26bb8baa3b3a022014efb6be70b05db39f49ad40849252ca8b243914bfcc34e791d1c43d53c53bca",
-    },
-    "0x73e58c6f5e7b9def4bdda8f02f59f9ef2a342cca": {
-        "ticker": "GP",
-        "signature": "30440220051c1645068d12919eb7c14a5db854fdbad99a35607d40645e199855c0ca44c002202981eeacb1cb2e48b569895fdd7a79345d965e70cc09dab229a0de8f5daf11eb",
-    },
-    "0x2af864fb54b55900cd58d19c7102d9e4fa8d84a3": {
-        "ticker": "GB",
-        "signature": "3045022100d60d3c0e83c856cff6951b0c1f5d2cbb72532447e68a13e582d10537bf44d77002206687fee576cef252bb4f590c9f009bc75aa611dc6fad6007188e2e1e1ae068d7",
-    },
-    "0x1f3ba804efb9cfe17d595e7262cea4782dbf6e4e": {
-        "ticker": "HPC",
-        "signature": "3045022100c93c4bad9b9ecf4d2ba5699584c6cb488f78cef1a30d62f82d31c3b2ae1c69b90220261cef8aefa4694b7228e191e48de809912a52737bede02df9a206fdd08f844a",
-    },
-    "0x255f1b39172f65dc6406b8bee8b08155c45fe1b6": {
-        "ticker": "HARAMBE",
-        "signature": "3045022100a465d80d5c0562dd2787dc8dd0e9f819ba40f70dba03bd6afa0f77b5d30903ae022028fb6009005b2690cda59abbf7c2068a533b97b7095f4529d85412ffef7b047d",
-    },
-    "0x24fcfc492c1393274b6bcd568ac9e225bec93584": {
-        "ticker": "MAVIA",
-        "signature": "3045022100816373ad25ff107beb411a09e698fb39a06c63d76dec655612d1034885f7534002203a178a7e224c517d20ce4fd916e77c9b71b1a8ae7b79c5b04a492e53e0fa92d0",
-    },
-    "0x4d25e94291fe8dcfbfa572cbb2aaa7b755087c91": {
-        "ticker": "HIGH",
-        "signature": "304402204c3b778e1c287f35c4f8467544fb65f510f51fa5aa5fa5f5d34edab5f834a67a022018cf01559bae1e64b383b5b3a2eed48d0656dbe7c8bbb36c31e8e080e61e7880",
-    },
-    "0xcc7ff230365bd730ee4b352cc2492cedac49383e": {
-        "ticker": "HYUSD",
-        "signature": "304402200aeeb042aabe144d9361e0227564ca7870cfe34618414a967835a95f79bfddde02205a5077ffe79f0b4280d093774c4737684cb86bf5d3ecc4239aebf737ad235f80",
-    },
-    "0x0578d8a44db98b23bf096a382e016e29a5ce0ffe": {
-        "ticker": "HIGHER",
-        "signature": "3045022100b022bff8d90a285ad77e7eed6caf509919fcf0d684fae33ad730fa34bd33db7a02205b7ac54719ec5d17162eada1ba562fdc738d41077f315ef70816165cb69c7a93",
-    },
-    "0x5399d094b5ec64bdeee130206098ef0e385dc2e9": {
-        "ticker": "HIP",
-        "signature": "3045022100dc9235eab319397781e526a00b390fba0a4a28ad5ab3337a5f888350a447ff0902206324db804d38f43fd956db3503e51f5a8cec66165c3e6e1cff4b07c85b786c89",
-    },
-    "0xd857af86a2c5b4f46fc7cb8032bd4f5625577eeb": {
-        "ticker": "HOKK",
-        "signature": "3044022053358b9cc6130c743db72aefa6cb6bff0b3721f1ef12e0573171e6c6ff8235eb022063c006043b401acd3f46c1aa270d21a4afbf54a3569a77f1816aca2bef00fa5a",
-    },
-    "0x803b629c339941e2b77d2dc499dac9e1fd9eac66": {
-        "ticker": "EARN",
-        "signature": "3045022100b55dc2b20093fdbdb7734f6200c4284312b2b9ae4601e9e34f91ae1898c451ef0220552961de69ad8280731b52c367e55edd6eece0b7efbdf584a9ba18afee227258",
-    },
-    "0xc5102fe9359fd9a28f877a67e36b0f050d81a3cc": {
-        "ticker": "HOP",
-        "signature": "304402207d5e81c4f33656a627ea011cb5c61cf9be26ef7cdcd1946996d6d5b56708b6e202206f2ccf9180eae85029dbc645f09099223c511d170aab95848add1bd19ec817c5",
-    },
-    "0x715da73449049d131da72d49fb1e59f5d0d49cf0": {
-        "ticker": "PACT",
-        "signature": "3043022046ec72bb0156f29fb9752a41738c65e9407308e23d70b9461c5954f401e383c8021f5b3fceaff3401f5462a86c583158f5100491084e7101e493a00e83ebd10e31",
-    },
-    "0x54a65b16d18527160fafc6fcfebaed47c2976dfa": {
-        "ticker": "RFKJ",
-        "signature": "3045022100fba220719833f0131d0ae51997776bfd2bf12cc97feb0bb5e9108b469545af0f022035b6395dedd22e866e5c4b4b289510184da9c9418844bd96d252a316d6293d25",
-    },
-    "0xea930c80d8eac45993d127055e718555e7155fb1": {
-        "ticker": "INF",
-        "signature": "304502210090f0b08a0b73a5cf9fb98e5ae86c1dc58faadb1501fd26ec1038cdc0b593ebcf02202c13051a8b53207931db581e986088faf0ad5514c4ff51adc41b7544320b0e87",
-    },
-    "0x71f6b11b371de742c8c65d0ef9e8a0837a61e5da": {
-        "ticker": "INK",
-        "signature": "3045022100d91050dbf1e831f36a3aec8f77ad8691c1cba1ee0572198d08e2ef42791b502d022005ec5182b5e08cdf2694d4cf994ea2d3f8edaf4d3241c1ad3964161f6e783073",
-    },
-    "0x968d6a288d7b024d5012c0b25d67a889e4e3ec19": {
-        "ticker": "INT",
-        "signature": "3045022100b2c3fce29f546079d09338df608b5c503de305224224b642210031c0d619c53302202c4197b2516cdcfba03a3973ea49a95c9801da156331b023662525102abf39bc",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "3044022054948de7538c8393aff1fc29d53d781cb9cdb2fef7f70eb8f6747b70fb9b9c25022017f3d68a3a9c31b9874d62f175644090d7e971a51f49c27d5f2750832361a6fc",
-    },
-    "0x7aef64e5997a81f695e0bc951ca874afccd4d1e1": {
-        "ticker": "OVER",
-        "signature": "304402205bce270b719b9a8f80bcf7d5dbf97ecf9f1f866f770b8f6a595670ddbc90d5a30220160e1b9bd3bd3d1586cef6e5c748fc86b236519dc4c53e07dd8d510a1dd87d8d",
-    },
-    "0xb00d803cb2367a7da82351dcb9d213230da7b92a": {
-        "ticker": "IYKYK",
-        "signature": "304402203097d9fb7b0fb2f26874065b6c6107c32b1fb985ca3d9eb2ace006757f96a065022069a14948de396b4f94d4b4635a982b731df8e292a8d06334bae7f29f692fa36e",
-    },
-    "0x60d01ec2d5e98ac51c8b4cf84dfcce98d527c747": {
-        "ticker": "IZI",
-        "signature": "30450221008c60cd05f13ce90f0f4c990f15188c6d24e756ed178469eb9c559ac166c8f77502206ebed3da887a81d4e2f0029a4f084baccdcee82095d2cb3ee5d0a44167759dc0",
-    },
-    "0x2d4349b17978c76910d865ebdb4888c7b50fe533": {
-        "ticker": "JD",
-        "signature": "3045022100d9041def28f9f8c508b45627a062f962f1b67e61bb1fde1b23d2e82c1350f43c0220357262621190412a45601adee77be0b24089225d10f7d47c6b45efa0855fc70d",
-    },
-    "0x777b2839832982b35213063d850848369390ee16": {
-        "ticker": "JARVIS",
-        "signature": "3044022056a56bac213b808e8cff1e0d211509b7623b2be90913bbed0aad132b9df2831b02201eb37b655d4352507acb9ff0d0d61b70022e9489e0021dedf051ffc4c8b975b0",
-    },
-    "0xa1b9d812926a529d8b002e69fcd070c8275ec73c": {
-        "ticker": "JELLI",
-        "signature": "3044022034981c7b3d27b0d01bd405c3e2da45ff0b387ccccdc314dd48bb97f4ff3d7be902201e849bdd43b4baececb21682a087b19a3651636e4ea6aa9592019e60ad953506",
-    },
-    "0xf4210f93bc68d63df3286c73eba08c6414f40c0d": {
-        "ticker": "KATT",
-        "signature": "3044022004170a3b6e537e68a553ae691121e50706918014119775b827c2b5f786d4e04602201e595e3eb08db4d7b736426f8c5eff36a9d71c2ca3b4dda08a3901c63819fdc0",
-    },
-    "0x9a26f5433671751c3276a065f57e5a02d2817973": {
-        "ticker": "KEYCAT",
-        "signature": "30440220781bc7c5ec1dd601978a8ce44eb0c378d42779af830bb699a21baba3aa6c93270220352f01eb02ba7bccdd29eef3c959d49cbb1bdba97c1a907155e8cbbe23a92452",
-    },
-    "0x64cc19a52f4d631ef5be07947caba14ae00c52eb": {
-        "ticker": "KIBBLE",
-        "signature": "3045022100e490ae6620f79998c8c51f0330aceeb248bce09a95ac68745d5c477ebab7370002207935d0fa6df0c8d881df3e64d3b4138505ba02cdbd88a9e7604a73f2630e47fb",
-    },
-    "0xc7dcca0a3e69bd762c8db257f868f76be36c8514": {
-        "ticker": "KIBSHI",
-        "signature": "3045022100f838617a3e3d7cfd487415a99cfde81dafc78738ce0aef506894ee7fb039f05302201e1f0bfd0cfe154ed5c5e7b3af236939e41719d7f9ed4caeb714c86a19ceb9df",
-    },
-    "0x8f019931375454fe4ee353427eb94e2e0c9e0a8c": {
-        "ticker": "KOMPETE",
-        "signature": "3044022012f3337ef6ba6437bffe83550b4a9558af851c3f789214a2c279358951d4ec9e0220221d8331e4015684dfa84a8602a1ceec466fa0ed94a5fa2f949a69347eebfab7",
-    },
-    "0xbe3111856e4aca828593274ea6872f27968c8dd6": {
-        "ticker": "KRAV",
-        "signature": "3044022059f3a9057f0f738b09bd3b1b5d15c185275e80a7783e1d25b8daccd7ceb7c7c402200312a498b6d3fe2c4f54684ef32e6135fc14d9096c6b00b92d4bcf00356a6f16",
-    },
-    "0xa19328fb05ce6fd204d16c2a2a98f7cf434c12f4": {
-        "ticker": "L2VE",
-        "signature": "30450221009c02888be4c150ff1d80dfa6e5a1962acfc3abb33e4cb6f833c85219a154c3c102200d8e43c64f2009907d3969f6f50df58569abedbf33df6f6177d6af05b3887ee3",
-    },
-    "0x236f9ebe3a40f3b24cea63a880704c712d5ec760": {
-        "ticker": "LAARI",
-        "signature": "3045022100a7d74f8984021e319f874f89689494bae4d06c9ef4959161953046c228a5a4360220464f977c546d7e990afcd1952ac97fe22185a78b8ec70f2af3b388fcb719982b",
-    },
-    "0x88faea256f789f8dd50de54f9c807eef24f71b16": {
-        "ticker": "WOLF",
-        "signature": "3045022100bd7b7a76cc67a40de2d91a1de04c5c334813706b99668f4cedb699fd687bc46a022039dce172f9ebfc1dd235004b0e1591e4a85068b0eb4dc61f6f008071e58e4597",
-    },
-    "0x0963a1abaf36ca88c21032b82e479353126a1c4b": {
-        "ticker": "LEET",
-        "signature": "3044022070394de5c93a1e8a7c91397320e1a3c716a70b65f77ef575875afbf5ec9faf4a0220498b42e3e73c68d9325439865bc72053a232706f074b78265eeab033ca532394",
-    },
-    "0x56a38e7216304108e841579041249feb236c887b": {
-        "ticker": "LBM",
-        "signature": "30440220358f47b0d19a8f8104315e4eb7012b12b1f98172ef09948623f150504b0d6abd022046c84c78882566ac19bcf57763ea75eefbc1f37c6233d5cdee475316a5a0f215",
-    },
-    "0x4e98b3917310b0e1f0d53c0619f87fe48deb804b": {
-        "ticker": "LOBO",
-        "signature": "3045022100a822f0a3ea5efd9a8886a9b08bca8d9d439cf1aaab65ac217c2294c80a9993660220197a18913b10f2e443b4d5071d4508a040a0c9d1f4ed4cd8031151833de98a77",
-    },
-    "0x2816a491dd0b7a88d84cbded842a618e59016888": {
-        "ticker": "LONG",
-        "signature": "30450221009ad1fea82eac51d16e12bfeea4690a001d521725b5c488d9ca44bccd0a15e39a02200dcc9745db59e7615b9f7934bea53fd7c72dad3573ecba8868d23cbc3d057188",
-    },
-    "0xdfb20f7297aad51e883bba1d21a46defb097c821": {
-        "ticker": "OLONG",
-        "signature": "3044022053d8a83dc75627593096270c02276fde71d2e57d121c6adfbfa962268e3b8d9902202903d4458b1cd41de889488e80ef4c8ccd8696f362abbd52032282d9ebe37015",
-    },
-    "0x67040bb0ad76236ddd5d156d23ec920a089d1eac": {
-        "ticker": "LOWER",
-        "signature": "3044022069d4a6595a56771a5197f1433ebcd65eecb4b8d6f5b88a657cdc263ff4930288022061d71be496c7294e2b4fbba9a1b28e3c6c63497e03edf785c66a4d0d79730ff4",
-    },
-    "0xf4435cc8b478d54313f04c956882be3d9acf9f6f": {
-        "ticker": "LUCHA",
-        "signature": "304402205d828235832b5bda2529ce0c7261fb78a8d40f3210a894a2ae1680eb686b449f022061e69c284db25c966e1d73949f063db1b88fbf103ada02b0c31996b919afc647",
-    },
-    "0x4a3a6dd60a34bb2aba60d73b4c88315e9ceb6a3d": {
-        "ticker": "MIM",
-        "signature": "3045022100ff97e75f7307fedca92d3050730e149ebb9cec55cf66ae1b5f88c2732b44eba602207871ce7b792db84584cbd4f616b1218e8d01a1362c459ad15f34937d7d6f3b02",
-    },
-    "0x2dc1cda9186a4993bd36de60d08787c0c382bead": {
-        "ticker": "MAG",
-        "signature": "304502210080cdda8a857d0d83604141f804e66e4f3dae81caec10b4107d9df363ed4fb61d0220439ff3d758661dcebdf3f792ef2d9fc31aab9a2194dc378b74f4e246938fbb8c",
-    },
-    "0xbf1aea8670d2528e08334083616dd9c5f3b087ae": {
-        "ticker": "MAI",
-        "signature": "3044022042e534e4207fbd353faa0379bc8898b7c2002c665f1acc5cd79ea23e59373fcb02206da0d21bd4b16bd8461f086f12ac86a2eaaf76332628c603a23f920b8933b9fe",
-    },
-    "0x435f49a87df832a582a1657421f083a0529edf7c": {
-        "ticker": "MAW",
-        "signature": "30450221009dc4930e82eec5d3986c6df9f05e715c53c6dfb775e23e0bc41856c63f8f5f3c02203b9ba61256431197f3a70b3a8adf8d7bcd78d25a226fba9abee3c6e1855c35bf",
-    },
-    "0x8fbd0648971d56f1f2c35fa075ff5bc75fb0e39d": {
-        "ticker": "MBS",
-        "signature": "3045022100b788f22244c45650f532f76bbbaab10102c596308c03cc5cf4536e8c273e075702203e2f350a3b858ffdf6689f50191b4a50ccb71f4fbf709d4877e11e83a12ba9e0",
-    },
-    "0x6e51b3a19f114013e5dc09d0477a536c7e4e0207": {
-        "ticker": "MEDIA",
-        "signature": "3044022008aba76d63e1800110cff8be67831690fd7027c7f41c064353dda5d7a1b2a29b022054fcf80b25968b61c7b39d95f8f4fd537ce4094b01b07d5b3affb784f085928e",
-    },
-    "0x7d89e05c0b93b24b5cb23a073e60d008fed1acf9": {
-        "ticker": "MEMBER",
-        "signature": "304502210081ac067e727bcc428641d77a4804ea18c44d1597b008fb498f5722663acef1d702205ee8e943809f265baa287318cc308fd3de3ca83cf52f72effc53603af530091c",
-    },
-    "0xe3086852a4b125803c815a158249ae468a3254ca": {
-        "ticker": "$MFER",
-        "signature": "304402207d764c46b7ec0700f5406c0418dbf96a6a0c1ab8143dd0a0a3791888857a2ba702202c1c4cfe448643189a8efff79877f8be4af943f5972f5c9868f3852fda5950e3",
-    },
-    "0x6f10607507aff450b8cf0a6fa2641a781889ddfa": {
-        "ticker": "MILO",
-        "signature": "3045022100e611fcdddca88a9dbeedc1f0395b2fc41a52f8e6ff9f9bc84415fa422b3f202802201ff6fab888e32c50dbd40d5b86b98b38019f250f817fb63364e52a83cd325664",
-    },
-    "0xf6e932ca12afa26665dc4dde7e27be02a7c02e50": {
-        "ticker": "MOCHI",
-        "signature": "304402206a9e9cd0f23f7de3000cb8e7ae1efac20ee9ec5e386de9cfd687325b278ac43f02206dc6eeab8815df274b6ccb8b92530603df0dc3d6130152cf25dfdfce5f129641",
-    },
-    "0x2da56acb9ea78330f947bd57c54119debda7af71": {
-        "ticker": "MOG",
-        "signature": "3045022100f3f4cf0612d08491fbe66162b7775fcf4c035a1d415ab7858789757a6b2dd47002201db0f49855da37e85ed4a9211f2844362fa07bff00e8dee335bc0bfe15649afb",
-    },
-    "0x66e535e8d2ebf13f49f3d49e5c50395a97c137b1": {
-        "ticker": "MOLTEN",
-        "signature": "3044022043ba1424b1e3d5821874f586ce6a02b793ab94d270d22dcec4e8196cae2cb7fc0220645d0aeba7069b95ae43d84b0c4b79dcf71ebe3e4348a9aec80d8822c878f969",
-    },
-    "0x9a27c6759a6de0f26ac41264f0856617dec6bc3f": {
-        "ticker": "BANANAS",
-        "signature": "3044022004719fee831e1c44252b47f735a2417dc1f7728b142b378275e4de406b932c9702201ba1109af00d13a6e950b26ffb27545ded6839a303a6f9803d28ab771005b5f3",
-    },
-    "0xef0b2ccb53a683fa48799245f376d6a60929f003": {
-        "ticker": "MOON",
-        "signature": "3045022100cc935b60939d1a2b42fe9820342798726c100a55927345d5088eedee652815d302207bcbde0158a039dacd064ff9bc779648389ff54361a31d6fcb371fbdcb1dfb16",
-    },
-    "0xc5396321805c7f1bce608cda194aa9155fb20f7d": {
-        "ticker": "MOONCATS",
-        "signature": "30440220690f3f32fb73e23e7a7674973c4194f32f455ddae594f4f10c6c1032d647e2a802204eacaefd5301add9aea40c72b91c7be270dc153f249ef5047d0fc046f94ce8ae",
-    },
-    "0x59d9356e565ab3a36dd77763fc0d87feaf85508c": {
-        "ticker": "USDM",
-        "signature": "304402203f665cb9f138e2d11129c2968ffbf846cc1b13aa9a9257eb3a34640db06a9ce102202b2383fcb180b49b55995beb954563af5be2a04447392d43167363e49111187c",
-    },
-    "0x2f3b1a07e3efb1fcc64bd09b86bd0fa885d93552": {
-        "ticker": "MST",
-        "signature": "304402200761224d7275da4369fa34a87dc8ae5da9504eda153e3f650b35c5e22aa5ecbd022066f937bf9de73de7d70f988d98dd72e4d20c10cc50df31e19c45881eb479ba08",
-    },
-    "0x8b67f2e56139ca052a7ec49cbcd1aa9c83f2752a": {
-        "ticker": "FLIES",
-        "signature": "3045022100d57a34c785967ff14652ca76f524ae4ca3c27418e47f6b5f8dba6608774171540220483c31b8a7356cdd382c13b456231f452f688299bfdeac16d3237d244a32a755",
-    },
-    "0x4229c271c19ca5f319fb67b4bc8a40761a6d6299": {
-        "ticker": "NEGED",
-        "signature": "30450221008ac57888cbcc57a1e8730477e2a2f71dc84af27c6ab291e7d54fedfb4ae3d2d202205d5210e887de1549cddd41101ccbb589e9488705deb07688e9e09d2d1604e511",
-    },
-    "0x60359a0dd148b18d5cf1ddf8aa1916221ed0cbcd": {
-        "ticker": "NFI",
-        "signature": "30440220219c1c592898cf13ba42932244a3d06af4af557c823165704e3f4af3be200de6022025842f14ffb7935fb83aa0d5ec1ed16d31f2079ea825aa2de94b3fa93ea95ce2",
-    },
-    "0xc2106ca72996e49bbadcb836eec52b765977fd20": {
-        "ticker": "NFTE",
-        "signature": "3044022050dd131f9d74e0950a4292c908c1dc053164c98de04004f29650a945df9604e10220691c0b17f94495372a684ee391fe1d57caccb1e96181239bec513dbc9d73ce65",
-    },
-    "0x13741c5df9ab03e7aa9fb3bf1f714551dd5a5f8a": {
-        "ticker": "NOGS",
-        "signature": "3044022006c39807cd057ec2c4155a6a93afce53681753a1501a8d816e4dfb62bc6bf31802203f2ef9451c9bb83cc0bd4c6564af02496f899b4e6305f86c6a0a663a65ad16be",
-    },
-    "0xa68482c74367ff7e7d8aed23553e4c7c2af231f1": {
-        "ticker": "NOJEET",
-        "signature": "3045022100eb822991a4e655de1024e6331f974ce079a2ad1a734161646c40301e96b09d33022028fc3898d91cccde173cb90b9488fba24a3156f355d84856a802714673c77ae7",
-    },
-    "0xb166e8b140d35d9d8226e40c09f757bac5a4d87d": {
-        "ticker": "NPC",
-        "signature": "30440220299270fa9f5e462c0665be5b265f0b69d190bcef6702e084c510f18c87eba2ef022035fa82b64f869c42c02e57753eed7f3b397706c28754411cc52ba451650ec4cc",
-    },
-    "0x7f12d13b34f5f4f0a9449c16bcd42f0da47af200": {
-        "ticker": "NORMIE",
-        "signature": "304502210092be03a93d81f4fb2cc7035540410fe1251ae9e709477b6be23e4286ab6a8f66022038320112ca5e782d1e8185dd291de4460e2e91833ac05fe6a272f96ca1ac8b97",
-    },
-    "0xcde90558fc317c69580deeaf3efc509428df9080": {
-        "ticker": "NORMILIO",
-        "signature": "304402202b01ced1358e0933d5d2ba7244150a6eebcace3f4f15aa7e8e917e24313d7adb022074dbec9c80e865604bda5f660c8e2ec41449cb050ebc8b045ce9614dbea0b1fe",
-    },
-    "0x420d8b44bc7e48e696b757a4d50b84857607474a": {
-        "ticker": "NYAN",
-        "signature": "304402207314a6ce83cb230c1b714a17f48faa71ec694e66dc6515ff6641b6b7f0310bc8022049788f14eedc6cba821b4a717a97285971f4a6a53d8ee710a8523c8eaeeabe90",
-    },
-    "0xc48e605c7b722a57277e087a6170b9e227e5ac0a": {
-        "ticker": "OMNI",
-        "signature": "304402206f2852c35b034e7768b4d6b2fcbebeed67c13e57376df7f187eff888398f81b60220687eb19286c439a23b921c0de5b867d87660c2f0afcb0f73cd5e8a671586fe3c",
-    },
-    "0xfef2d7b013b88fec2bfe4d2fee0aeb719af73481": {
-        "ticker": "ONCHAIN",
-        "signature": "304402202bfe65ad663459d58fd393c0093f60fc30fe3a58ec09d4d99363f7fe47768613022004cdc9f4368e8cb59b73722de4b2d602a257682ea58f33b26e077b27859ef07f",
-    },
-    "0xbfd5206962267c7b4b4a8b3d76ac2e1b2a5c4d5e": {
-        "ticker": "OSAK",
-        "signature": "3045022100e8805853e74dd4de45f8a4fdca87a35aab831829d593f2b9e18aab2b5a991648022072e7f3bbd09bed7279314d83d34238ece0814b82bf080c81c428883d822a113b",
-    },
-    "0xa3d1a8deb97b111454b294e2324efad13a9d8396": {
-        "ticker": "OVN",
-        "signature": "3045022100df479c5aaa9d10b27bce24bdd8f9aa3995a12bb60da5a84076265cc3c7943d3e022052962d03ba950416f0870e463cd5942325dc93e2f78f09e33b376ba422003c55",
-    },
-    "0x4a36c161aa762f7ecf7517440db2cb53ff1cef32": {
-        "ticker": "PACE",
-        "signature": "3045022100e6502f4e2fb5ed8178bad97f0f1e5a83a623921f05fca5c77c57cc6f0c3884e3022042bd9a21d9175200808e0f0fc7f6f1c90ba9a9a9d84036a333c4323cd37d044c",
-    },
-    "0xafe5451185513925f5e757f001425338ff93412d": {
-        "ticker": "PARTICLE",
-        "signature": "304502210095fa8b0e0c180cee62dbbd756325264c58c1c7a1dcc929540dfe04b5d817439d02206b4a624583e73fb92dae51de269fa1bb891b3e5b4573ae15a8186ef3ac4b9f2a",
-    },
-    "0xc4655eb36aa7f1e476a3059a609443ded02ab61f": {
-        "ticker": "XETH",
-        "signature": "304402201cfc4c217b257096bc1af9395fa73685d769ddcaf442e695e0a9fe91ae78cc8702204da99cba3b9b0c1553898e8c106edf153a50495f2bcd3e6813b2dfd0203f21d6",
-    },
-    "0x8300e8e6b258147972972dbcf87719da7b817a9c": {
-        "ticker": "PAT",
-        "signature": "3044022078704cfda8336ef699f69b1841a6e87b0073199ed8f17d58dc2d8585f2c5efc002203aa81267bb5640b295337c7a86c5d6795a04d2f3dae31c6c1d0924de33cd583e",
-    },
-    "0x875ee70143fca7d78e03ee6b13a2b0d68be4af0c": {
-        "ticker": "PAWTH",
-        "signature": "3044022059a820a1befab17e854fdd029dd0f8c7d20d987b30b4d90e962fec2c6a3d024e022052bb32fa8f68452c7dcd81dd0179f2ec19cc3cbde721960ec5abc24bedd87c88",
-    },
-    "0xd7d919ea0c33a97ad6e7bd4f510498e2ec98cb78": {
-        "ticker": "PEN",
-        "signature": "3044022069aa9b3a98919f0a84c51d1419f6b02234b73e4874d2dd4443eff4c480ea4dcf0220533fb8cbef85a1d7a616b63b9526d062158e681943ad297ed3fc73ffedd3d2ec",
-    },
-    "0x80f45eacf6537498ecc660e4e4a2d2f99e195cf4": {
-        "ticker": "PEPE",
-        "signature": "30450221009231871c1aafe8920e8305ab7605878357efc800c4917249af5db38e8ca5b4cb0220008115e92af15c4a6c8adeb843a57f6818a329f20deb56162932d0a46b9c3713",
-    },
-    "0x9a3b7959e998bf2b50ef1969067d623877050d92": {
-        "ticker": "PBB",
-        "signature": "3045022100f361f8b3636847f8f641b7e448cffcff1b99790e82209fd1d58d1888910dc3950220722770347b20e387542f3131516fe8bdc0be8c2ca4960b9ae20979d028893cb1",
-    },
-    "0x19706c142d33376240e418d6385f05691a5fa8e2": {
-        "ticker": "PEPI",
-        "signature": "3044022078ed77ec2bc5739921a55dc2c4a84c92c0510a7ae1f454f1742ffdb6ead0ad0f022070c4ba35d027f479b7d063b7f3f5854864741c68fb10888af8413381b122b7ab",
-    },
-    "0xea6f7e7e0f46a9e0f4e2048eb129d879f609d632": {
-        "ticker": "PERCY",
-        "signature": "3045022100e9c19d9e5a109ca2d466a90426d10442f3ee1d863be265c90dfbca8a5d1de31302205f02587b3202ac8462bcad278ea1c172773c62fef735952e6ddd2121a016172d",
-    },
-    "0x71e8f538f47397cd9a544041555cafc7a0ce9ae3": {
-        "ticker": "BOOST",
-        "signature": "3045022100a4659240655ea4f2ba818077d34c90edc91fb50c4031586be2807996d940074202200ca7518fb379fb668314cfd148218b42428ead148a3b05756d35e2130427ff13",
-    },
-    "0xbe92452bb46485af3308e6d77786bfbe3557808d": {
-        "ticker": "CASH",
-        "signature": "3045022100c33ff5157b591e1dc5b4e2dbff8af6c7848c1d33048a1e306e321a3afb93015e022034c0dd626198259099a5d2a84aa13b9407004eb14f430b7c0b41321f5b4901e8",
-    },
-    "0x76baa16ff15d61d32e6b3576c3a8c83a25c2f180": {
-        "ticker": "PLEB",
-        "signature": "3045022100a4e4cf90120d17edf6e2f33acfa9867829013ac11257150c1ee3c5d0a46b9b6702204f348a998a3db9204b19b3b68a2eac6b7a1faaf5ef7b2d8abe2eae187ee17d02",
-    },
-    "0x84f074917fb9d464c1264c47296be53424bbc93f": {
-        "ticker": "BLING",
-        "signature": "304402207b889a4256da9ede7dc1727a0c44c4dff2300bb00f79a794a3e73da80055d5730220143c065fa0d8878b315a98c79f9c5d387a9c87f2f99648db3c69f8bbff38cb63",
-    },
-    "0xbef5d404548fab05820e64f92cf043b6a06f9c72": {
-        "ticker": "POD",
-        "signature": "3044022055bf19b31dd030e139fee32bc16870f3fd81a0cde4412a47c6558641bbf30243022002574793afacc74c64593c3733ecd625a2fec80fb1cfa054fa0465baef8fdf96",
-    },
-    "0x76e7447bafa3f0acafc9692629b1d1bc937ca15d": {
-        "ticker": "POLA",
-        "signature": "3045022100b119f17e7d3f07e91898a3fd481f00df1d8bbfb493bdd7ff27cce228d0a7448c02205b0bb1d8ddc245250113f7e3209bbf54842a23281548ab599c732bef0be934cc",
-    },
-    "0xc2fe011c3885277c7f0e7ffd45ff90cadc8ecd12": {
-        "ticker": "PONCHO",
-        "signature": "304402200711971994a27981ea320633be2b88856c4ae6122a4fddb4cd485278b1dfac9d0220028d65588ab95e0a312e17c3efa09106a8f261f24e82e2393d02d407226c004e",
-    },
-    "0x686b1209b2de12818aa69dd139530448d0c792b3": {
-        "ticker": "$POOP",
-        "signature": "3045022100e7c8284a9de5d53ba5dbc98488c7690bf2a5424aa8f3ad20d2dd1af1415bd6f002202d6b4294739399a297c912784cecb0bcb96ae87da85953ad5b6ab5cad1c34555",
-    },
-    "0x1f1aa4d239002bb818536c95e9b762a1fc8484c1": {
-        "ticker": "RAIN",
-        "signature": "3045022100fe9e83b8601507f4474b2a8a920e307708a9d17ea1ca0b4419183f33a6acf1dc022054c9bf51967ca8655b1b61132daf19819adfc04e2885b713a56575adef130cdb",
-    },
-    "0xfa980ced6895ac314e7de34ef1bfae90a5add21b": {
-        "ticker": "PRIME",
-        "signature": "304402205b8fb65fb277ea7151aba93d7a494edc97e218ce711988ba89d648650ccf0dce02201dccb919430820efa70ca711762a2e98a30bacebc9999b385476f64feb3a2da7",
-    },
-    "0x18dd5b087bca9920562aff7a0199b96b9230438b": {
-        "ticker": "PRO",
-        "signature": "30440220786986b2612a129c65963654732cf9e8fbf5562ac9e1c1ef2ac497d5f686bb68022013ab430b11f45e1cd43bb968e51703499601762549dbed71ad5b366c0409cc54",
-    },
-    "0xd1f398d6b3e5e2387e413831e206cfeb5fc1dcee": {
-        "ticker": "PUBLX",
-        "signature": "304402201b248bd4ac86797fceb342753fd54c7aa032ceacf952c5ac875d955721ead0b302204718eee9861a26ac093aa945132ba4d6b674117bfb2b6931eda7036139c39cf8",
-    },
-    "0x28ed8909de1b3881400413ea970cce377a004cca": {
-        "ticker": "PUNK",
-        "signature": "3044022037451d28aac48670da8991871b0bf043802dc785c66ea8ec242f1421325115880220339051d97f3ea9adcdd15572a21acf1513cb1263cc82be65bfaaabc0c54d07db",
-    },
-    "0xd3fdcb837dafdb7c9c3ebd48fe22a53f6dd3d7d7": {
-        "ticker": "QI",
-        "signature": "3045022100fb5dadaa11f11295f182e0a2e082fad4d62201117325f79360294cf61f7b442702204e36a040e9eb4793fd0f279537df4510c06a1e5b3b1b12ca7529fff67303b1e4",
-    },
-    "0x639c0d019c257966c4907bd4e68e3f349bb58109": {
-        "ticker": "QUACK",
-        "signature": "30440220562c1524e915c002064510177d86456784e0cf3e4e3297b21a86c780859c457c02204836d34c616fcccc3aa8f6a61ac14e3291368a17382845b84786b8ac74d33904",
-    },
-    "0x9a54ed8d4343e8d89477285a5a0ca06be4051dda": {
-        "ticker": "QUAD",
-        "signature": "3045022100e428c2c023acb69295b0528d54d721faa11819808168b81cabd292878cba1bb602204eeceb36ac7da20c222945362f2f0bf90c44c29be005c23af1efb7a647649af5",
-    },
-    "0x703d57164ca270b0b330a87fd159cfef1490c0a5": {
-        "ticker": "SOFI",
-        "signature": "30440220112b8dc0dd35ff7d92a29ba9aabe67a1ea31f043b7de4cd405dbdf65a75195320220355dfd912defeac831e24e3e5dc93f9b418273e61e631d935fa1d9ee5b022127",
-    },
-    "0x06c4c7f8011fbfb6a9654ee4142532f9bb3c52b8": {
-        "ticker": "RATS",
-        "signature": "3045022100a4cfac362c6ced9bed241c7ec3703f0adc5b3af46ed371c5bb0cb6208929ce9e022022597dea1da6f01f8fb4eb0dfb4e1c69fe8387b21ea5df6c637fc9e24b86c0e5",
-    },
-    "0x3421cc14f0e3822cf3b73c3a4bec2a1023b8d9cf": {
-        "ticker": "REBASE",
-        "signature": "3044022065331d6a6e80e7d3958a1743c3ee3489c7c1b01ccd7932a8e9d8e6ea356f45830220139c84d03a1efc066abb924cbbec1c3599578239fe841aba3f1b0edb0289f2fe",
-    },
-    "0x41e99e0f73a88947c52070ff67c19b7abc171a54": {
-        "ticker": "RDMP",
-        "signature": "3045022100b32f2fac45e37acc323fde39bddf2aee31ac5b82a89f69b5256d62751759d833022079d3d2b4d7e3c6b442cb17fb54fe3caa56f1f98a3029f9532526b40aa12c3b61",
-    },
-    "0xb8e0b7d0df89673e4f6f82a66ef642a1cd46e010": {
-        "ticker": "$REFLECT",
-        "signature": "304402202d1cb3aedb31c51baa505bc704fa95cd82f719ee916e71f439745209400f20f602205f717775e8ea0a330f79ad1db3ef7831d0386dbe0bb5e555174a7dc32294c6fa",
-    },
-    "0x2416092f143378750bb29b79ed961ab195cceea5": {
-        "ticker": "EZETH",
-        "signature": "30440220747bbaaf98e927eadc4d4f74093f8398b633e54847d9448f01b909bfa86d4dee02207b49f61dd7b8483189fa5a370543f12975b79574adfabc7452e6983b09d38be2",
-    },
-    "0xfbb75a59193a3525a8825bebe7d4b56899e2f7e1": {
-        "ticker": "RSC",
-        "signature": "304402205187876bf6624c509d5c02bdad6b94edd69a83d9410edcc5621d52767bf2127f02204cbaf35e72427b17a05970d43e6e2ffeeef7708d6ecdbfa1849b32bf722fa17f",
-    },
-    "0xab36452dbac151be02b16ca17d8919826072f64a": {
-        "ticker": "RSR",
-        "signature": "3044022031d37368408504af9570a700c31b1db02c8caf45e1d0dffd8e5a1418beb7611602205639cb3b798a0ba363e15ebf2d64a5ee94f21a9c9968ab4a6b0f3c657f4080bd",
-    },
-    "0x09188484e1ab980daef53a9755241d759c5b7d60": {
-        "ticker": "GRG",
-        "signature": "3044022077fcc22034e13e52a45f6fbe736e389d17a98a58c039fc624bfc210ad7222315022073cf9b73267ad33be3c2fae191fbd8db9c635945f8de225efbd7587e3019361a",
-    },
-    "0xd1412d909f67b8db7505ddfcf26cf2303f4b1bb4": {
-        "ticker": "RIKU",
-        "signature": "304402204df6020a568fdff0565f6d5fb51258818dc61e944c3090695f7d4a150138ad0b02202a88e0d7c2b9d6e38bded08fd9330f236cf8c7210e096e207c1017bf9af83dfa",
-    },
-    "0xe6f47303032a09c8c0f8ebb713c00e6ed345e8c3": {
-        "ticker": "RISITA",
-        "signature": "3045022100bba793ba908f64fb8b4e50caf7cb2807c844dc3394b9003b9ab29d9aaf9c7c68022033ab14a87ff9ddbdfb59105a375860ddacfc292694bf95502096d5977722e42e",
-    },
-    "0x524d524b4c9366be706d3a90dcf70076ca037ae3": {
-        "ticker": "RMRK",
-        "signature": "3045022100b7bba8e87a214b1b3de5382140fbfb441e8a519213b51b51278b5d6483b07cc302205f9a75339e4c4765b0d0fec0c58c6181f081f259c0cfa2b141893748c4228a1e",
-    },
-    "0x30ed6eb751bb1f94a35256dd68b01d1d27b576a5": {
-        "ticker": "ROACH",
-        "signature": "304402202f89180b3bdbe54eccfb333936390ef86e0bf3416b6fcae02ecd1d6f6eaf0732022032c4b5b7d10e19c9579c3cf5b999bf149272c3557955e90789f76980f37f29e6",
-    },
-    "0xb6fe221fe9eef5aba221c348ba20a1bf5e73624c": {
-        "ticker": "RETH",
-        "signature": "3045022100a59d312b53a2ab16d56ac3de2530f145c9870dc4e447160931d96b42fabf7fa102206ef2f8a9efa3502c8cdf61bba8e0f559aed8fd07dfbfaeaa57e5c8dec6ee9646",
-    },
-    "0x6653dd4b92a0e5bf8ae570a98906d9d6fd2eec09": {
-        "ticker": "RCKT",
-        "signature": "3045022100f7229bd0f9daaa833e2dd53c39e5afe36c346ea42aea2cefea97f34e03a2bc3e02200f00ed2dd050553888fd9e65d9751cc13eaeb47300b3a7da513218555d5fe59b",
-    },
-    "0x8f0f56472c3e5730b1ea2f444e7829288da261e6": {
-        "ticker": "RMAV",
-        "signature": "3045022100bec522fc0dab39dd6f89e0b64e01e12d1d200c04be56185d8101f5c347f50294022013d1e33468f6d36eeaefbc765dad49201d25dee1c8185c269a6958a9f7b3c172",
-    },
-    "0xe1abd004250ac8d1f199421d647e01d094faa180": {
-        "ticker": "ROOST",
-        "signature": "304502210097c3c27924d1954f08d8e5a50a6906388e1043a2dc69de5d17e0a3dab3d3fc8702204793e28401b4289ede475415f785753e831c194b81222a4767e17c35a4a10449",
-    },
-    "0x928a6a9fc62b2c94baf2992a6fba4715f5bb0066": {
-        "ticker": "RWA",
-        "signature": "3045022100a152ede847445695f8c7b8451deb90548a1b81b8d90378970d3f8042c6cb5565022038d8653adea60dfea52cbf61ca650cfbdd69104d08017b24402401f3d75ee31d",
-    },
-    "0xed1978d01d4a8a9d6a43ac79403d5b8dfbed739b": {
-        "ticker": "SACA",
-        "signature": "304402206f0b51a43f749c86d012ee9404760d9cdf36d22cbc1c8f0233ab73ae070288190220025cdd9b5adc58ee1d67ac6ebb39db2f083de13d94688121b6e08fd319274591",
-    },
-    "0x54016a4848a38f257b6e96331f7404073fd9c32c": {
-        "ticker": "SCALE",
-        "signature": "304402204909a5709760fee7cdd3e8c0020a0cf68f5eede157929e5f60ac3bd81638adc80220509517344accdbbe3aaaa2620ccded6f0be042a4e10c764fea87bc891816c1a5",
-    },
-    "0x1c7a460413dd4e964f96d8dfc56e7223ce88cd85": {
-        "ticker": "SEAM",
-        "signature": "3044022056b304e1ce1dfbf59f1a4cc15b2b2df75d5fecac9663cdd5be8945bfdf6fa8c202202a66ffa79253ff03e3e673cf8b2d703863eba04eb9baf3916fb83d8134017558",
-    },
-    "0x3f14920c99beb920afa163031c4e47a3e03b3e4a": {
-        "ticker": "SEND",
-        "signature": "304402202adf162ff60bdf117245a6a403d7aaaa6cc5c0dada287b9e8ecf570598df2530022054bab19aec5bd31fdd4f672bc62ad22e771d4a5184f2d7c9ad7f643fe8a61f8f",
-    },
-    "0xba5b9b2d2d06a9021eb3190ea5fb0e02160839a4": {
-        "ticker": "SENDIT",
-        "signature": "304402201eb598cb769452207ef995ecc35608a4e65993f6cabe11ecd3f10540ed413cc102200411a3186dd9559b91e3a45cba18bfcfc5941dba5badb89d413717c5ff91d41c",
-    },
-    "0xd1917629b3e6a72e6772aab5dbe58eb7fa3c2f33": {
-        "ticker": "SEXY",
-        "signature": "3045022100ec4d514a004fba9fb5a69627a7c25b9da5d6a2230629115d6a1f79252aefb20b0220456a95891128ea609726853eb7be0e80d134ff11cf729f4e2f6866cb957d5e44",
-    },
-    "0x8ca99727813af2a45df365e920f59692df436ee0": {
-        "ticker": "SHDW",
-        "signature": "304402206386163bc21eb471e7580e39340160bfe1ca78f44066fd40651fcf0f407243e802204ffcf44032e99a1de6a539b8026492220558965b6d07aee87d94c4d04cffa76c",
-    },
-    "0x478e03d45716dda94f6dbc15a633b0d90c237e2f": {
-        "ticker": "$SHAKA",
-        "signature": "30440220058f3061880b6bacafbff21acd3af0e0e210983e8fa04a4545dce2b4af2db7bf022062685bd2fc09abb685c62867b7b807e655e7167177a662f420444d0a53d4b6cd",
-    },
-    "0x52c45d3068c937cb1e6b4a7f2c2a66b85056dd24": {
-        "ticker": "SHARD",
-        "signature": "304402202b8fd60074a467c0cd85cdf2906e4fdabf01d4e61ff1032a14385a2d90f8cec4022072b9000e07203ba03f9ac4951dbc062c9d7f9ef6f546bc814a1869884185b1cb",
-    },
-    "0xba71cb8ef2d59de7399745793657838829e0b147": {
-        "ticker": "SIAM",
-        "signature": "3045022100be5755f159526cf8afe7c85bde1ff9a023cd4539191ce1bb8528c8bd2c00d72d02205f7c749997901f1e8a6c8614d4b80a0caebdd95ae9b41fe7ce18e923a5b669ee",
-    },
-    "0x768be13e1680b5ebe0024c42c896e3db59ec0149": {
-        "ticker": "SKI",
-        "signature": "304402201868ea03d93964d11a9f72aef36a1c05999c537736e5338f504a512b0b33be7302202edfdf879a193844eef95c2bddd036984b115005192873d66823c22b04ce4584",
-    },
-    "0xb85340f227f4904f5e884a64fa36b39ab493943c": {
-        "ticker": "SLERFCAT",
-        "signature": "3045022100d6e48447da662266600c95595ad6bf27ea8c90077e667d80905ccdfa4943aa0902203b44c89d375f73aa1040f3cac8fe72713e5ac0d9891fa5e80b6bc8156a285ec8",
-    },
-    "0xfd4330b0312fdeec6d4225075b82e00493ff2e3f": {
-        "ticker": "SDEX",
-        "signature": "3045022100f076e105410243b3f4844799e4683f0d74adb9e885ad22e07d06dc604427158d02203cde8765a138b30c0a1b088e7dccd6e7a467faa5298eccf15c786787d9efc08c",
-    },
-    "0x22dc834c3ff3e45f484bf24b9b07b851b981900f": {
-        "ticker": "SMUDCAT",
-        "signature": "3044022009faf29d5dd6238259d6b69a4b45cc7fbf7cd68c5e15e6e6e1406829397e13dd02201ddaea526984feed8295c355546a5f2b73e8ddcf95a382ee91621386e2d32732",
-    },
-    "0x6bc40d4099f9057b23af309c08d935b890d7adc0": {
-        "ticker": "SNAIL",
-        "signature": "30440220201b800444b7e5f0d5a298820222ee790b29dcb5113243673af0a5d7651a6ff5022016ef9bb6fc0419e30d5787c810394b5cff137187fd1ea6f8bcbeed5c4511594b",
-    },
-    "0xaf07d812d1dcec20bf741075bc18660738d226dd": {
-        "ticker": "SNORT",
-        "signature": "30440220739abb27abf06ac9841f2e2018c3360b3522e8a98b1e7ea7712a53bfc914fff202204ad71ec9f370c843d0645df465593e565cc59ca6ae8c746466bdf3d142ace027",
-    },
-    "0x063d2db6d348fa5957b78b6141d144426486c68c": {
-        "ticker": "CAT",
-        "signature": "304402200a85f610a49de4a59808434b21d86e691cdbe3fae5c086bb1cb35bc3a68d009c0220168c55087a487eabcd36f557d1fa5749589108f065b341f7c347fec78da59ea5",
-    },
-    "0xf395680803b269b62702554723e05b373171b07b": {
-        "ticker": "BRATT",
-        "signature": "3045022100de65dfc2ffe8d666023341d875d98307a5c27d19ed288fec8ef909332bc935a502207d17da935aba6466b6c8d7fffd2bbd630d6046a27920460c9e81b720614c1c93",
-    },
-    "0x22a2488fe295047ba13bd8cccdbc8361dbd8cf7c": {
-        "ticker": "SONNE",
-        "signature": "304402205201965da57744f058209d9004f3d1b9e9cb3f3687f262a571f81c3db26402460220093bda51a6b143d7582daa4d25bf0dec2537305a4c48c6afac9394e78a492bab",
-    },
-    "0xdce704a0622a8437200cb6076ee69b2cf573827c": {
-        "ticker": "SPEC",
-        "signature": "3044022077717c080ac38a25cd090686491f5a0120bb519a5467e7a9c074609522d5edfb02207418669fde525d4bca81d1cec40eee06b92483dd682c2b2e116573bb6d472001",
-    },
-    "0x8f2e6758c4d6570344bd5007dec6301cd57590a0": {
-        "ticker": "SPOT",
-        "signature": "304402204d920c7a816cd2a88f0359f8978e346b557b9bd746a842653867725211e71ff5022008b893ab2f811fc84a2889d3c58067f104f2d0f270572e3d568b9d24f40181a8",
-    },
-    "0x50da645f148798f68ef2d7db7c1cb22a6819bb2c": {
-        "ticker": "SPX",
-        "signature": "3044022071541ad8358f7e0ba1a16bd0e36580cfac34fe96226665029ee4858928cd433802201affd4550cd476a22a3a59f31ce782671a18f965e9c9dc59ab43dcba877478fd",
-    },
-    "0x430c67ed118f0637ffe74c98e9b90919c93b7233": {
-        "ticker": "SQUID",
-        "signature": "3045022100effbd277ab137cd9421455096d495e4506f93afa468c0c6d281b4907ee2b96ff022049c1c98d818a38f80a1faf3fc5d71127d82a5e4f5f756a4c2cff60651343c5f0",
-    },
-    "0xf7a0dd3317535ec4f4d29adf9d620b3d8d5d5069": {
-        "ticker": "STERN",
-        "signature": "3045022100e01534c2569cffb7cc0c7e84c7e44a9899f49983378bf911e0ed5be19b12167b02206af51b5cd4e85c4d5d432c01fb046c373f9a9f52ca5be640725578095502124e",
-    },
-    "0xc19669a405067927865b40ea045a2baabbbe57f5": {
-        "ticker": "STAR",
-        "signature": "304402200e86d492578cd3718f54cf4f77d4679737084306238aba2a309035a34194196402206c27d2326e88818bfdf9f6d0d3d7c0b5c30505784d57334586b0724537b0efc0",
-    },
-    "0xfe4717f60ac5603dc6863700cd8ecf805908688d": {
-        "ticker": "STRM",
-        "signature": "30450221008da6e2cd99f9024f10e9a4a033d7f2dea9786fca2aa27c6c28714a16024e9e1d022079625a2c5a3eecf710dd26499d82c6687bf853a29477ef5e37ec1aee7dc98e5d",
-    },
-    "0xe85411c030fb32a9d8b14bbbc6cb19417391f711": {
-        "ticker": "SUBTC",
-        "signature": "30440220203ae425b237420cf4f411413ea677ce46a13089c8bb264b41247d325332721802204ec707d30e14d3f6531223dc09cfb90ba3653d27512b1ca8209d5952e3513c53",
-    },
-    "0x1c22531aa9747d76fff8f0a43b37954ca67d28e0": {
-        "ticker": "SUETH",
-        "signature": "3045022100dd14f262aa59e0238ab36a17a165d96cad8b963c044d871b222d6463ca159d7a022069e8c8f4a957cb83af9d615cdf805d968e27e699375945fb6d3a94d1362ad613",
-    },
-    "0x8bf591eae535f93a242d5a954d3cde648b48a5a8": {
-        "ticker": "SUUSD",
-        "signature": "3045022100b93c156fcebec290ee1143d83982021d3e5855e44c7f611bbadd0d7f7781146b022016ea7b1e68765de70baac29ecad7a9f89c80081f900ec3c933934f14ee552b49",
-    },
-    "0xfaa4f3bcfc87d791e9305951275e0f62a98bcb10": {
-        "ticker": "SUBF",
-        "signature": "30440220300f2562acb67f09b3cbf363596ffad627897123567f9f26575bc2ed0248803502207ca0deb85b9b58e658a6e20dab203cedd8ba5121aadb55c8bd2e075b297bccf3",
-    },
-    "0xd6bbac6486d93cb576cacf085d307c8ee69bbfe9": {
-        "ticker": "SURGE",
-        "signature": "3045022100a8e218fb4dbc8223d6e4114ff9ff72c90024925bbb0b3770bdba34a07dd6fd360220319f7e5531647f85649817ee7f51f3b0a13807e21d29be6bf465c8a1df7bdb60",
-    },
-    "0x2974dc646e375e83bd1c0342625b49f288987fa4": {
-        "ticker": "SMT",
-        "signature": "3045022100de8aac65385b0547770cbc173c53836e9ad13d2c39cffc3d652fb2c77992a3a702204c44d6a8e9dc6cfe90d1bbbf7ae80c62852ff16319509e3b6f9766363a4e095b",
-    },
-    "0xec4cb1148ec60e00a6bfcfce4482db724db6bdde": {
-        "ticker": "SWI",
-        "signature": "3045022100a810d4e81baa931117d390db04a1f3b43d557f702dd78ab3cf17ff98a74386de0220683769a59fbe766678a909704fa112f6492b01db33d899474c50425f3f2ac2ed",
-    },
-    "0xbd2dbb8ecea9743ca5b16423b4eaa26bdcfe5ed2": {
-        "ticker": "SYNTH",
-        "signature": "3044022038dacf624148e0098f917ce2f527f8d9de0f693e8ce11af76227704fc1a2288702206a8d75b2fc292e1d1d702fc455e4635cde0454318dbc9fd2a42161f909cf0452",
-    },
-    "0xf544251d25f3d243a36b07e7e7962a678f952691": {
-        "ticker": "TAROT",
-        "signature": "3045022100a1aca1b35f2b80e120761e0e7e17f77b8bf48f931ddebd75f837577f86cebf0802207bee9ab5202afe1b6a56427ae7870fb994eadba7b2d71cd86b28371bf8de4962",
-    },
-    "0xbf0c7ccb143126c1be90a426f676f5cb313956d9": {
-        "ticker": "TEM",
-        "signature": "304402205b9b3383ffc312d2857d7409f265b8997526211239dd5e60c3463e2bbfb256d2022061453f1aa6bf223b50d5e775baed728973985c9d682fc14d77c8da5b505614d2",
-    },
-    "0xf34e0cff046e154cafcae502c7541b9e5fd8c249": {
-        "ticker": "THALES",
-        "signature": "3045022100b879347e9917b1f7bb39c54f75e4df089f171295ab6f3f403e7638d71a808b1502201ba958a98df4ad84c00d92e7e39edff5cb85668ee1230f1072bc06ecf4ff9051",
-    },
-    "0x5b5dee44552546ecea05edea01dcd7be7aa6144a": {
-        "ticker": "TN100X",
-        "signature": "304502210080c45c76dea623e4f90afafb7f743984c8f3b707ab9b5451f386e353142968be0220251ad1f7fd15d78945497d80d895d803edaab9415d1f6d3d95de038ceff7c2fb",
-    },
-    "0x21eceaf3bf88ef0797e3927d855ca5bb569a47fc": {
-        "ticker": "VOID",
-        "signature": "3045022100e3fc2e22a9fa650c335df0f06c3313972d91c54a1eadd00c659963d8f4bb7d2502205c36f4c37a49c48ac4aa2fce6859b91ad510da349e498fc487f6aed0acd579a8",
-    },
-    "0x798acf1bd6e556f0c3cd72e77b3d169d26a28ab5": {
-        "ticker": "OATH",
-        "signature": "304402205781cb792f1162479a3d943bbb043ad138a418f81e7045d854c65840562228a50220240a5c480c3af6e7ce0d36297bb6154679aeaab4884a478b5cd92c3e369244e2",
-    },
-    "0x1d7116f3198421d18bffd5f3dedeebecb4a75be1": {
-        "ticker": "LORD",
-        "signature": "30450221009e856ada0c82ed969d3c2b9d03f4006da3199ef3f793d17b9c0ffc88bf7ebe3302204b95ce8ccce73d2df33e80c57087a34cf773e240766a6bcf14a59a7115dcc5cd",
-    },
-    "0xb8d98a102b0079b69ffbc760c8d857a31653e56e": {
-        "ticker": "TOBY",
-        "signature": "304402206cbeeb72a1b614c23e6465c737612d28d364ddf0db7718f3deb8b1fcbdde0b2f0220476efe551e893d604875f3a9fa01f559024289f8030f640465fb0aa65e5a00aa",
-    },
-    "0x295243647f3efe3bea315d548dcc3d25864ba265": {
-        "ticker": "TOCHI",
-        "signature": "30440220615849edfc54c16671a2f21c17dcbe97d5d8d3a3109e094cd48f88baf9d33d1102202b423a914b8e9389bcdbee1749a8ea2e62180c6f8ca0e29bc531170cca39d26f",
-    },
-    "0x9252384e10ba6beae1a52dbb2a3beca2592268d9": {
-        "ticker": "TORCH",
-        "signature": "3045022100f4892618d3b5069699734a6b3c5c780bc54fdb3ef2dc532b09736f81b274a2b802203a31a3493c77aea299b46848446b4f2ded11be9f909c6ac370117b1e07592ceb",
-    },
-    "0x00e57ec29ef2ba7df07ad10573011647b2366f6d": {
-        "ticker": "TOSHE",
-        "signature": "3044022009065be478c61e48007527324b98ae038faa1e0821d7513f6c40061ce0ddfdfc022067ad3a253380e12b50a9b28364ccb92c76e336f6e443f29ea073b61c4e1e21d3",
-    },
-    "0x8544fe9d190fd7ec52860abbf45088e81ee24a8c": {
-        "ticker": "TOSHI_",
-        "signature": "3045022100bf8525b7474352781db726b30fb488f6701764e001ce6aaa0df0d9a90d8e9ec402206d5303478add6939da5574bcf2518097aeeb3aaa16b5e531b87333dc04e9a3a4",
-    },
-    "0xac1bd2486aaf3b5c0fc3fd868558b082a531b2b4": {
-        "ticker": "TOSHI",
-        "signature": "3044022054bd9a3d529d409b7e670d5016245d20395505eff55c6e09f5462fcff25392c50220789bef43056cca6b70702bc7e11ab51ed5b3c7bc7230f7b7840a222dbbb3b8b7",
-    },
-    "0x58dd173f30ecffdfebcd242c71241fb2f179e9b9": {
-        "ticker": "WIG",
-        "signature": "304402204fec13a3e4afce9109ee8eb7bbadce26aed4ddcf10154593d33150ca25a2673f022015e304cff2175d3379b0e9322b87c7b76ab1253532b57e6d45d8587a914947fb",
-    },
-    "0xf7c1cefcf7e1dd8161e00099facd3e1db9e528ee": {
-        "ticker": "TOWER",
-        "signature": "304502210081a16b8adb934bf219ec569b8a65193fe68cb1ce44ef02e0842fc08a55ede4ce0220195e2b16a8a4a8630529c2c7ec7d27bdc38a4bff6977275ce4621555a3f2be3e",
-    },
-    "0x52c2b317eb0bb61e650683d2f287f56c413e4cf6": {
-        "ticker": "TREE",
-        "signature": "3044022032c978c0d92771f7e56668790d6e310023afc0a8fb4be11169ca1cc23ed2ff5402207bd644a374d76489832d2eb94da33a664bf4cbffed2acce61f75a22f9d0c1c11",
-    },
-    "0x80a3d4999b2836a5ac90b4742da133f5f5f6c27d": {
-        "ticker": "SAM",
-        "signature": "30440220600dbe513ed11e88b1eb880a5196ce1202366345a48347f01524d95a1e4a464402207743e9fd615f21ac4ae3dc8cbaa8cbadad3f0e0a53583d4e90c3fb66c6eae78f",
-    },
-    "0x6b4712ae9797c199edd44f897ca09bc57628a1cf": {
-        "ticker": "UNIDX",
-        "signature": "30440220357713fef58b018d39b0532148e78486d735b9eb9ea2752ac8339200d996e376022049f06c629789449fed711f3f6417ae5c865e85cedee5c70f359d0d1f9e54d228",
-    },
-    "0xb79dd08ea68a908a97220c76d19a6aa9cbde4376": {
-        "ticker": "USD+",
-        "signature": "30440220209f4949596678c07260240ef5948aa776285720171a168e54402e1c9478bd5f02204b1ad00f98b5e9034f8c08786dc222149e187ce97b35dd3092ff7d147e308e68",
-    },
-    "0xd9aaec86b65d86f6a7b5b1b0c42ffa531710b6ca": {
-        "ticker": "USDBC",
-        "signature": "3045022100b424611cf52f93ea5d0f260f94475e19d32459ecc82171883334e569c004be2d0220514e9d3bdebd1a7ce8fb7e3e1885463f8e7688c5adff2deaad34aa13843023c7",
-    },
-    "0x833589fcd6edb6e08f4c7c32d4f71b54bda02913": {
-        "ticker": "USDC",
-        "signature": "30450221008ee00330ddbe5643a79fae21e6ee7fad654e6fe62439fe3699d5e70368e2a6e50220439ae5b92438d0172339a93e32881a2cb47d1115390ab5f3af379c5f8b2ba339",
-    },
-    "0x85483696cc9970ad9edd786b2c5ef735f38d156f": {
-        "ticker": "USDC+",
-        "signature": "3044022075dd2e9c6e00c04bd12e1e0be9b4b910f73b5af44acb693043fd71bb5a80c030022042285e48ea11c7570991cce8ef476555a8954fbc0caebe8d0d29a8879930d204",
-    },
-    "0xa23dd9379f2e12d9ce76ec738b9f5e520d1d861c": {
-        "ticker": "USDEBT",
-        "signature": "3045022100f0a8aa65367e19c7b96a058bbf29063448d98e77b932569c74ffb49c39449a52022073fc54761f8f85495017dd557681d369bef61ea401b659fb93010e9553f663df",
-    },
-    "0x5a76a56ad937335168b30df3aa1327277421c6ae": {
-        "ticker": "VELA",
-        "signature": "3045022100b8db0b5191e0cd5ef1190bcb5bef7b272dcffe18faff59ec5e6c25c67e1d95d602201d429a23dba9a9ac38bc5091aaaa49c76add471bb6ae235e2c7e333fa31157f7",
-    },
-    "0x8129b94753f22ec4e62e2c4d099ffe6773969ebc": {
-        "ticker": "VEX",
-        "signature": "3045022100d7ed9a44885a885cbf616679d4c6b9bc43c2fc3243cee19dd86b91d1e1fb7269022071104a9ac085afe59d7536c10fa121b1c58694c4a074ff35b99e5b18d9f271cb",
-    },
-    "0xdcf5130274753c8050ab061b1a1dcbf583f5bfd0": {
-        "ticker": "VCNT",
-        "signature": "3045022100db656be50c84812308cf87db057a8f5d7daba6e0f171f8f4f114ba1bcee01a2102205ce85be4b323d02e4dff6e89cde31b5ddd829149b54e80b97795c5da5ce7ba95",
-    },
-    "0x72ccf64ee5e2c7629ee4eee3e6ad6990289178ae": {
-        "ticker": "VINU",
-        "signature": "3045022100b3b550f97b95c5288b35483bf9bb5c873606dbd0e1d424593f219d77a7ee5f7902206ae8e6adafa6ef03d6710bcbde2d025407b2142cd9d518db2984f0bb9816d7fc",
-    },
-    "0x0b3e328455c4059eeb9e3f84b5543f74e24e7e1b": {
-        "ticker": "VIRTUAL",
-        "signature": "304402202f8107358f62a5cd3adeac6ae93adbe9c01f3bb76bc6bf336a2901a737fb0fb6022018841af5595c103dc5b086ed6f63a37c37361490101987e4039ae9e42e19d766",
-    },
-    "0xf578ad8809f13dabf921bdd3fcfbe194d0ab5628": {
-        "ticker": "VPP",
-        "signature": "3045022100fa60f571bb15c837984fe2c1316a9bcb85282be1d8b9dd31fe74440047acf3ff0220561e0a189317f44ff038229907ce30bf06031b98be1c74e40389ab3d3daf10ce",
-    },
-    "0x10c1b6f768e13c624a4a23337f1a5ba5c9be0e4b": {
-        "ticker": "WARPIE",
-        "signature": "304402200c95efeaba452131ff49da7e7a30e61228d06b07fdc4956cb6d49d6a0d3cc7c102205ce5765d5f7a11bfef0001483ab249b5c81e3f232574283c310bc011a87e8dc8",
-    },
-    "0xa067436db77ab18b1a315095e4b816791609897c": {
-        "ticker": "WASSIE",
-        "signature": "3045022100d888332a5481eabfaff3512c559453843d2cfe112315823258aec2a1a1b3b9a702205db06fe2f1952d20d40628af47f7b7b0099b6c5fad089a7b97a2b83c2d4a0498",
-    },
-    "0x4dfbd8a695baf78ebf8f905a4527020e844b278d": {
-        "ticker": "BACK",
-        "signature": "3045022100dc33c02fdf43e0f2d3faba047b11b63f49db31345cd63cca2d793aba7cb20f7b02202c43ef466e6a48bed103a1d2fba1e8c16e83fce5bdefcee4d1356be709165e29",
-    },
-    "0xaa3ecad0cb644c0de72110a905a57667c1a1ca96": {
-        "ticker": "WEIRDO",
-        "signature": "3045022100e1d442540d291bd9df4fe888093ed547a3a1e03f0aa4813f38ec46646ebe70c1022048aa680173af4a752a93e7a7a4560e79029966c5a59818d983eb32d425854e3a",
-    },
-    "0xff8adec2221f9f4d8dfbafa6b9a297d17603493d": {
-        "ticker": "WELL",
-        "signature": "304402207cd5008ea8b49d55ff171947442667fbf8a2f149fcc646c9019ee70f594e9888022045e8950d5a55a35dfaf2c03da2de3313cdc78c99b6e2eb79a91d63a904b05852",
-    },
-    "0x298d411511a05dc1b559ed8f79c56bee06687b14": {
-        "ticker": "WTB",
-        "signature": "3045022100e85f39dfbfd6e2ec97d6edecd0ba109dca539de9ca552ccddda661b0064d12c2022079e4db39647d78a14c77e99b22af72799d0bdc59e276e8047f1ec0b312a3845b",
-    },
-    "0xda9d200a1626a991e810d4a71f60ee970fe3933c": {
-        "ticker": "WGC",
-        "signature": "3044022020648f4cea55df363fde6bd4b94134b35305e38cb7cc28e2d8fd27cecf9ef4a302202369c1a766b0bf70b24bcb2aef828f67217d78aa1e2ad45a385868499f2a3d3a",
-    },
-    "0xbcda0bd6cd83558dfb0eec9153ed9c9cfa87782e": {
-        "ticker": "WILDX",
-        "signature": "3044022004af48e1245ee146cf72ee8c3781772f410f573adb3a72a6f6d703ea2e7f801a0220244518ac4a7582e6256c6947a8b8e8b840fb53dacf7319017d83d1766617dd58",
-    },
-    "0xb0ffa8000886e57f86dd5264b9582b2ad87b2b91": {
-        "ticker": "W",
-        "signature": "3045022100f4b0a9b08d8a606452c30afa2f76b6072cf58d2d0d9a97a99c35cbdb2732b146022078ea24601d55123df608724faf71dc3373eebac8549b54b08f912a478da8be42",
-    },
-    "0x489fe42c267fe0366b16b0c39e7aeef977e841ef": {
-        "ticker": "WAMPL",
-        "signature": "3045022100eb0ae3bcb1562b69a3ff9355549466a31f888b138e7e9d4f4161efb19ed953c4022012314f8e7ad661018c9254de11a20198297d1862a713747f753e45a49ad89015",
-    },
-    "0x373504da48418c67e6fcd071f33cb0b3b47613c7": {
-        "ticker": "WBASEDOGE",
-        "signature": "304502210094c852ab0debd6fa514fc948b0ea743d83c3ce76e3a536623ee741d594299cc302206916460a66faed45d622d76a95e587ca8888b5e9b12c3e6aa3e158b6db31ffab",
-    },
-    "0x4e74d4db6c0726ccded4656d0bce448876bb4c7a": {
-        "ticker": "WBLT",
-        "signature": "3045022100b6b1b4bf32e8e87497d72e728e35bc6d0bf18b6b003eddbfcb4c40e90e411f490220103d27805f135b4b147f24eb274cf1906984fa91b9b2bcee3e5372a4f743003f",
-    },
-    "0x4200000000000000000000000000000000000006": {
-        "ticker": "WETH",
-        "signature": "3045022100c26f97bde77ba2ab0655763bcd3389bf8101028c6c722b8aaf4a971c80b9bff4022058d6e21eef786ee968c6e32336b6bc1db7d2a852ecc9d65f9c421c4f1f50f9ba",
-    },
-    "0x7f62ac1e974d65fab4a81821ca6af659a5f46298": {
-        "ticker": "WELS",
-        "signature": "3044022047938cb2d5a83f5853cea2faa0e4a98e87ec555b58ef181163961bdb21042fd50220491290f7f49b0bc1e865fe106d51c6674e45c5a5b46245e46bf7ebf466be866b",
-    },
-    "0x3d2eba645c44bbd32a34b7c017667711eb5b173c": {
-        "ticker": "WMC",
-        "signature": "3044022021c79c811da0852291cf13ee6ff45cf25302856a9993cbc5b6d0920892b231a90220243ed5780be0f258ab14a27d2c0dea5017a755b69b8214427436a59348ae84ba",
-    },
-    "0xe428c32fe2dfde4e25e9bb37c690ce22229f21ac": {
-        "ticker": "WSFTW",
-        "signature": "3045022100e3c0273db51056504d796dac7ff783cc889cda6000388ed3a08600ea8244655f02200a7c54f82b6737d0bf0b257742b1935387269048f30dd50e93bff968b1acc8e0",
-    },
-    "0x48138275f394da1e9aba82eaaa9cf4a5b82bf013": {
-        "ticker": "WF",
-        "signature": "3045022100f89ba71627a365abb327a28add273718d9f9287e38e53d8bcc4b5b7644a4131502207f46317be4637f8167c5efb5c772fd32d5d9ea91ad51f61a0e52a0be0ace5e6e",
-    },
-    "0x981d41c115a2d48cb1215d13bda8f989d407c9c5": {
-        "ticker": "XEN",
-        "signature": "3045022100f96867ce8789f580749efd555af706f0951aa5bb129c470dd0d48daf7541208102202c011b474fc93e0bd32629feb523366923e33f6d20ae1c104962bb956241216a",
-    },
-    "0x8d8d99dfa6814f694a7edecc18849684fbd3b645": {
-        "ticker": "XID",
-        "signature": "304402203297f394d896b662841cb1b22ef3e0b4e3caa21363b6ee6f9132fd4bd7557d7002201fe89af28b41f18d1f330f35fcc88c87fb65857b84bc3ebe67c06a2d9cf2187b",
-    },
-    "0x602417ee10667d0eb216b4a4092aab0bbe4d0511": {
-        "ticker": "XOLO",
-        "signature": "30440220580fdc99c3bf40475070b4d491fb5be3ce5a38e43c7d60cb7526a1bdc84c52ae022012a09df7d47f6deee9dbcfe597ed82a1c15c2c9d03449b765ffd1082fa2c7223",
-    },
-    "0x5cc5e64ab764a0f1e97f23984e20fd4528356a6a": {
-        "ticker": "XRGB",
-        "signature": "3044022052761e8e8483bb2d086ac3c50fef6595838e71d74b6ca53ceee0266d6f1158540220042c52997e7636dde7b8b0ce8a379434af64e716ad236521957cc0c0a8cd3e68",
-    },
-    "0x8fe815417913a93ea99049fc0718ee1647a2a07c": {
-        "ticker": "XSWAP",
-        "signature": "3045022100d53ff6b2857bb522892ce4661f2715b61217117abc40fadf47ee904305f7d1d7022048f0e8c9d8bc5b1a1a9e6db9bfd5e92c7726852882036e090dd86502a93ccb01",
-    },
-    "0x9eaf8c1e34f05a589eda6bafdf391cf6ad3cb239": {
-        "ticker": "YFI",
-        "signature": "3045022100f833878fb6618ba47ace8051fb038b0df8d33369e906ff03e1bb6c1849547a0202205a4cbd0e322e30dfb057ea142e397604bce8e62b14e42c9e5ca785ab850325b2",
-    },
-    "0x0fa70e156cd3b03ac4080bfe55bd8ab50f5bcb98": {
-        "ticker": "YOU",
-        "signature": "3044022004833ed1682a3209a8d2d4a7864ecb77c77c98317c38362235daad133504b4340220550344e241ce100528830f8dc72f1aa30c4445c9af51277cd3d818cb1b6a5325",
-    },
-    "0x1b6a569dd61edce3c383f6d565e2f79ec3a12980": {
-        "ticker": "PEEZY",
-        "signature": "3044022048952973ae9788b3c77cb929fe6ae8bb9a2dd974b823e34dcca972165b0c5e6702204638b4a9b7cd2dcdb1a320edca4c98cb2e852a572fad98449496bbab2469e084",
-    },
-    "0xf0ce1d83b5fc9c67f157d8b97fd09e2cf8af899e": {
-        "ticker": "ZEB",
-        "signature": "3044022061ad6c9288df0a0d6c8cbcd295b1358e1d3a8e288406f6ca06daf41ce58193b90220694a004463cf67c0818c9c06702d4a70487e3a3cb9dd1c489774b6cf407036ea",
-    },
-    "0x5f819f701d6ca4a38ceca5c23e72528580b01977": {
-        "ticker": "ZED",
-        "signature": "3045022100e18e3aa7bcfb86c7a9c1892a0cb48898c095b2a338459ffe29c08db2da3041f102205dc76f494f8a67d553bb2ed03ebca59516afcc56745c9adbf7e80326ee86c619",
-    },
-    "0x3054e8f8fba3055a42e5f5228a2a4e2ab1326933": {
-        "ticker": "ZUZALU",
-        "signature": "304402205eb6c36697de92a3df60609cc1c98ff418044a44798b58c3183dd6509cee1d8b022068ebbd55016d19a2627e4a2d0775dcfbacd2daf5106f42e3be5ab1fc0270cca4",
-    },
-}
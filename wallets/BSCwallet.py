@@ -17,7 +17,10 @@
 
 from copy import deepcopy
 from wallets.ETHwallet import ETH_wallet
-from wallets.BSCtokens import tokens_values, ledger_tokens, nfts_values
+from wallets.token_registry import TokenRegistry
+
+
+tokens_registry = TokenRegistry("BSC")
 
 
 class BSC_wallet(ETH_wallet):
@@ -40,8 +43,8 @@ class BSC_wallet(ETH_wallet):
     ]
 
     options_data = deepcopy(ETH_wallet.options_data)
-    options_data[0]["preset"] = tokens_values
-    options_data[2]["preset"] = nfts_values
+    options_data[0]["preset"] = tokens_registry.tokens_values
+    options_data[2]["preset"] = tokens_registry.nfts_values
 
     def __init__(
         self, network, wtype, device, contract_addr=None, wc_uri=None, confirm_callback=None
@@ -56,4 +59,4 @@ class BSC_wallet(ETH_wallet):
             rpc_endpoint = "https://data-seed-prebsc-2-s2.binance.org:8545/"
             self.explorer = "bsc-testnet"
         self.load_base(rpc_endpoint, device, contract_addr, wc_uri, confirm_callback, wtype != 3)
-        self.ledger_tokens = ledger_tokens
+        self.ledger_tokens = tokens_registry.ledger_tokens
@@ -17,14 +17,15 @@
 
 import json
 import urllib.parse
-import urllib.request
 import re
 
 import cryptolib.coins
 from cryptolib.bech32 import test_bech32
 from cryptolib.base58 import decode_base58
 from cryptolib.cryptography import compress_pubkey, sha2, encode_der_s
+from wallets.http_transport import request as http_request
 from wallets.name_service import resolve
+from wallets.utxo_discovery import AccountDiscovery, account_path, DEFAULT_GAP_LIMIT
 from wallets.wallets_utils import balance_string, shift_10, NotEnoughTokens
 
 
@@ -43,21 +44,16 @@ class blkhub_api:
         parameters = {key: value for key, value in params.items()}
         params_enc = urllib.parse.urlencode(parameters)
         try:
-            req = urllib.request.Request(
+            brep = http_request(
                 f"{self.url}{endpoint}?{params_enc}",
-                headers={"User-Agent": "Mozilla/5.0"},
                 data=data,
+                headers={"User-Agent": "Mozilla/5.0"},
             )
-            self.webrsc = urllib.request.urlopen(req)
-            brep = self.webrsc.read()
             if len(brep) == 64 and brep[0] != ord("{"):
                 brep = b'{"txid":"' + brep + b'"}'
             self.jsres = json.loads(brep)
-        except urllib.error.HTTPError as e:
-            strerr = e.read()
-            raise IOError(f"{e.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as e:
-            raise IOError(e)
+        except IOError:
+            raise
         except Exception:
             raise IOError(f"Error while processing request:\n{self.url}{endpoint}?{params_enc}")
 
@@ -83,6 +79,15 @@ class blkhub_api:
             )
         return selutxos
 
+    def get_txcount(self, addr):
+        self.getData("address/" + addr)
+        self.checkapiresp()
+        tx_count = self.getKey("chain_stats/tx_count")
+        mempool_count = self.getKey("mempool_stats/tx_count")
+        if not isinstance(tx_count, int) or not isinstance(mempool_count, int):
+            raise IOError("Invalid transactions count in the API response")
+        return tx_count + mempool_count
+
     def pushtx(self, txhex):
         self.getData("tx", data=txhex.encode("ascii"))
         self.checkapiresp()
@@ -155,31 +160,45 @@ class BTCwalletCore:
             self.testnet = True
         self.segwit = segwit_option
         self.pubkey = compress_pubkey(pubkey).hex() if pubk_cpr else pubkey.hex()
-        if self.segwit == 0:
-            self.address = cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtoaddr(
-                self.pubkey
-            )
-        elif self.segwit == 1:
-            self.address = cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtop2w(
-                self.pubkey
-            )
-        elif self.segwit == 2:
-            self.address = cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtosegwit(
-                self.pubkey
-            )
-        else:
-            raise Exception("Not valid segwit option")
+        self.address = self.pubkey_address(self.pubkey)
         self.api = api
+        # AccountDiscovery, when the device can provide the account node
+        self.discovery = None
 
-    def getutxos(self, nconf=0):
+    def pubkey_address(self, pubkey_hex):
+        """Address in the wallet format for a public key"""
+        if self.segwit == 0:
+            return cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtoaddr(pubkey_hex)
+        if self.segwit == 1:
+            return cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtop2w(pubkey_hex)
+        if self.segwit == 2:
+            return cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).pubtosegwit(pubkey_hex)
+        raise Exception("Not valid segwit option")
+
+    def getutxos(self, nconf=0, refresh=False):
+        if self.discovery is not None:
+            # All the account addresses, from the last scan when recent enough
+            return self.discovery.get_state(nconf, refresh).utxos
         return self.api.getutxos(self.address, nconf)
 
+    def change_address(self):
+        if self.discovery is not None:
+            return self.discovery.change_key()["address"]
+        return self.address
+
+    def input_script(self, pubkey_hex):
+        if self.segwit == 0:
+            return cryptolib.coins.mk_pubkey_script(self.pubkey_address(pubkey_hex))
+        if self.segwit == 2 or self.segwit == 1:
+            return cryptolib.coins.mk_p2wpkh_scriptcode(pubkey_hex)
+        raise Exception("Not valid segwit option")
+
     def getbalance(self):
         utxos = self.getutxos()
         return self.balance_fmutxos(utxos)
 
     def prepare(self, toaddr, paymentvalue, fee):
-        utxos = self.getutxos()
+        utxos = self.getutxos(refresh=True)
         balance = self.balance_fmutxos(utxos)
         maxspendable = balance - fee
         if paymentvalue > maxspendable or paymentvalue < 0:
@@ -193,24 +212,22 @@ class BTCwalletCore:
         if toaddr.startswith("bc1") or toaddr.startswith("tb1"):
             outs[0]["new_segwit"] = True
         if changevalue > 0:
-            outs.append({"value": changevalue, "address": self.address})
+            outs.append({"value": changevalue, "address": self.change_address()})
             if self.segwit == 1:
                 outs[-1]["segwit"] = True
             if self.segwit == 2:
                 outs[-1]["new_segwit"] = True
         self.tx = cryptolib.coins.bitcoin.Bitcoin(testnet=self.testnet).mktx(inputs, outs)
-        if self.segwit == 0:
-            script = cryptolib.coins.mk_pubkey_script(self.address)
-        elif self.segwit == 2 or self.segwit == 1:
-            script = cryptolib.coins.mk_p2wpkh_scriptcode(self.pubkey)
-        else:
-            raise Exception("Not valid segwit option")
+        # Each input can be from a different address of the account
+        self.inputs_pubkeys = [utxo.get("pubkey", self.pubkey) for utxo in inputs]
+        self.inputs_paths = [utxo.get("path") for utxo in inputs]
 
         # Finish tx
         # Sign each input
         self.leninputs = len(inputs)
         datahashes = []
         for i in range(self.leninputs):
+            script = self.input_script(self.inputs_pubkeys[i])
             signing_tx = cryptolib.coins.signature_form(
                 self.tx, i, script, cryptolib.coins.SIGHASH_ALL
             )
@@ -220,14 +237,15 @@ class BTCwalletCore:
     def send(self, signatures):
         for i in range(self.leninputs):
             signature_der_hex = signatures[i].hex() + "01"
+            input_pubkey = self.inputs_pubkeys[i]
             if self.segwit == 0:
                 self.tx["ins"][i]["script"] = cryptolib.coins.serialize_script(
-                    [signature_der_hex, self.pubkey]
+                    [signature_der_hex, input_pubkey]
                 )
             if self.segwit > 0:
                 if self.segwit == 1:
                     self.tx["ins"][i]["script"] = cryptolib.coins.mk_p2wpkh_redeemscript(
-                        self.pubkey
+                        input_pubkey
                     )
                 elif self.segwit == 2:
                     self.tx["ins"][i]["script"] = ""
@@ -237,7 +255,7 @@ class BTCwalletCore:
                     {
                         "number": 2,
                         "scriptCode": cryptolib.coins.serialize_script(
-                            [signature_der_hex, self.pubkey]
+                            [signature_der_hex, input_pubkey]
                         ),
                     }
                 )
@@ -300,11 +318,26 @@ class BTC_wallet:
         ],
     ]
 
-    def __init__(self, network, wtype, device, pk_compress=True):
+    def __init__(self, network, wtype, device, pk_compress=True, gap_limit=DEFAULT_GAP_LIMIT):
         self.current_device = device
         pubkey = self.current_device.get_public_key()
         network_name = self.networks[network]
         self.btc = BTCwalletCore(pubkey, network_name, wtype, blkhub_api(network_name), pk_compress)
+        if getattr(self.current_device, "is_HD", False):
+            # Watch all the account addresses when the device provides the account node
+            self.key_path = self.get_path(network, wtype, device.legacy_derive).format(
+                device.get_account(), device.get_address_index()
+            )
+            acc_path = account_path(self.key_path)
+            account_node = device.get_account_node(acc_path, self.get_key_type(wtype))
+            if account_node is not None:
+                self.btc.discovery = AccountDiscovery(
+                    acc_path,
+                    account_node,
+                    self.btc.pubkey_address,
+                    lambda: blkhub_api(network_name),
+                    gap_limit,
+                )
 
     @classmethod
     def get_networks(cls):
@@ -316,8 +349,8 @@ class BTC_wallet:
 
     @classmethod
     def get_path(cls, network_name, wtype, legacy):
-        # First path
-        # To be changed to the first one available, needs scanning
+        # First path of the account
+        # Other used addresses are found with AccountDiscovery, when available
         return cls.derive_paths[network_name][wtype]
 
     @classmethod
@@ -350,16 +383,21 @@ class BTC_wallet:
 
     def raw_tx(self, amount, fee, to_account):
         msgs_to_sign = self.btc.prepare(to_account, amount, fee)
+        if not self.current_device.on_device_check:
+            # Even msg before hash is a hash, to be modified
+            msgs_to_sign = [sha2(msg) for msg in msgs_to_sign]
         tx_signatures = []
-        for msg in msgs_to_sign:
-            if not self.current_device.on_device_check:
-                msg = sha2(msg)
-                # Even msg before hash is a hash, to be modified
-            asig = self.current_device.sign(msg)
-            if self.current_device.provide_parity:
-                # asig : v,r,s turn into DER
-                asig = encode_der_s(asig[1], asig[2], "K1")
-            tx_signatures.append(asig)
+        try:
+            # Inputs can be from other addresses of the account
+            for asig in self.current_device.sign_stream(msgs_to_sign, self.btc.inputs_paths):
+                if self.current_device.provide_parity:
+                    # asig : v,r,s turn into DER
+                    asig = encode_der_s(asig[1], asig[2], "K1")
+                tx_signatures.append(asig)
+        finally:
+            if any(self.btc.inputs_paths):
+                # Back to the wallet key
+                self.current_device.derive_key(self.key_path, "K1")
         return self.btc.send(tx_signatures)
 
     def assess_fee(self, fee_priority):
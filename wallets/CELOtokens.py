@@ -1,53 +0,0 @@
-# Uniblow ERC20 list for Celo generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "Celo native asset (CELO)": "0x471EcE3750Da237f93B8E339c536989b8978a438",
-        "Minereum CELO (MNEC)": "0xF9d922c055A3f1759299467dAfaFdf43BE844f7a",
-        "Celo Dollar (cUSD)": "0x765DE816845861e75A25fCA122bb6898B8B1282a",
-        "0Casino.net (0CASINO)": "0xbccEc3bfd4639440b1714a502bb3940F407b890A",
-        "0Bets.casino (0BETS)": "0xE2eeEBAf210502aA815008618C89CA9d98d97924",
-        "Celo Brazilian Real (cREAL)": "0xe8537a3d056DA446677B9E9d6c5dB704EaAb4787",
-        "Astral (AS)": "0x39eCEF094be9526ab46FeA3F0f92581A8295ED8B",
-        "softbalanced.com (USBL)": "0x774b29Bf6017Bb36e7B7595E8dFDE19De6D4c583",
-        "CeloDogeX (cDOGEx)": "0x49B8990F14C0b85f528d798Fc618B97bc3299C35",
-        "PT Stake Ticket (PUSD)": "0xA45bA19DF569d536251CE65DD3120BF7873e14ec",
-        "CELO CAT (CCAT)": "0x4510104CF2CC3Be071F171Be7C47b8d6bEabA234",
-        "Ubeswap LP Token (ULP)": "0x1E593F1FE7B61c53874B54EC0c59FD0d5eb8621e",
-        "Doge (cDOGE)": "0xEd6961928066D3238134933ee9cDD510Ff157a6e",
-        "Cell Doge (CELLDOGE)": "0xA2F26a3AF6a2C5Bc1d64e176F3BB42BF6e9c6c61",
-        "PoofCash voucher for POOF tokens (vPOOF)": "0xbA58308D1784e06615EdDEB7c7a2340d64acAAf3",
-        "Celo Euro (cEUR)": "0xD8763CBa276a3738E6DE85b4b3bF5FDed6D6cA73",
-        "Ubeswap (UBE)": "0x00Be915B9dCf56a3CBE739D9B9c202ca692409EC",
-        "USDA LIVE (USDA)": "0xA5d0C1b3cddf8faF65eFdD0E3E30695Bdd05F92D",
-        "impactMarket (PACT)": "0x46c9757C5497c5B1f2eb73aE79b6B67D119B0B58",
-        "Moola cUSD AToken (mCUSD)": "0x64dEFa3544c695db8c535D289d843a189aa26b98",
-        "HEAVENS (HEAVENS)": "0x0F2177ac29EEcCb9E2897CA0D7D1c545858e14AC",
-        "USD Coin (USDC)": "0xef4229c8c3250C675F21BCefa42f58EfbfF6002a",
-        "Mobius DAO Token (MOBI)": "0x73a210637f6F6B7005512677Ba6B3C96bb4AA44B",
-        "PT Stake EUR Ticket (pEUR)": "0xDdBdbe029F9800f7C49764F15A1A1E55755648e4",
-        "Moola (MOO)": "0x17700282592D6917F6A73D0bF8AcCf4D578c131e",
-        "StakingPactToken (SPACT)": "0xFC39D3f2cBE4D5efc21CE48047bB2511ACa5cAF3",
-        "FaucetToken (FAU)": "0xC4fc619bBa4572656606bc7Fdc0874d481EBebDE",
-        "celoLaunch (cLA)": "0x5927fd244E11dB1c7b1215619144d2aAbAc80a4F",
-        "Moola interest bearing CEUR (mCEUR)": "0xE273Ad7ee11dCfAA87383aD5977EE1504aC07568",
-        "PLASTIK Token (PLASTIK)": "0x27cd006548dF7C8c8e9fdc4A67fa05C2E3CA5CF9",
-        "Ari Swap (ARI)": "0x20677d4f3d0F08e735aB512393524A3CfCEb250C",
-        "Moola interest bearing CELO (mCELO)": "0x7D00cd74FF385c955EA3d79e47BF06bD7386387D",
-        "Source (SOURCE)": "0x74c0C58B99b68cF16A717279AC2d056A34ba2bFe",
-        "Metronotes (XMN)": "0xCf153fC756D062bc6c8F0712c4E8c348ca9Be214",
-    },
-    # Alfajores testnet
-    {
-        "Celo Dollar (cUSD)": "0x874069fa1eb16d44d622f2e0ca25eea172369bc1",
-        "Celo Euro (cEUR)": "0x10c892a6ec43a53e45d0b916b4b7d383b1b78c0f",
-        "USD Coin (USDC)": "0x2F25deB3848C207fc8E0c34035B3Ba7fC157602B",
-    },
-    # Baklava testnet
-    {
-        "Celo Dollar (cUSD)": "0x62492A644A588FD904270BeD06ad52B9abfEA1aE",
-        "Celo Euro (cEUR)": "0xf9ecE301247aD2CE21894941830A2470f4E774ca",
-    },
-]
-
-ledger_tokens = {}
@@ -18,19 +18,25 @@
 import json
 import logging
 import urllib.parse
-import urllib.request
 import re
 
 import cryptolib.coins
 from cryptolib.base58 import decode_base58
 from cryptolib.cryptography import compress_pubkey, sha2, encode_der_s
+from wallets.http_transport import request as http_request
 from wallets.name_service import resolve
+from wallets.utxo_discovery import AccountDiscovery, account_path, DEFAULT_GAP_LIMIT
 from wallets.wallets_utils import balance_string, shift_10, NotEnoughTokens
 
 
 logger = logging.getLogger(__name__)
 
 
+# blockcypher free tier is limited to 3 requests per second
+BLOCKCYPHER_WORKERS = 2
+BLOCKCYPHER_INTERVAL = 0.35
+
+
 class blockcypher_api:
     def __init__(self, network):
         self.url = "https://api.blockcypher.com/v1/doge/main/"
@@ -47,21 +53,12 @@ class blockcypher_api:
         if params_enc:
             url += f"?{params_enc}"
         try:
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                data=data,
-            )
-            self.webrsc = urllib.request.urlopen(req)
-            brep = self.webrsc.read()
+            brep = http_request(url, data=data, headers={"User-Agent": "Mozilla/5.0"})
             if len(brep) == 64 and brep[0] != ord("{"):
                 brep = b'{"txid":"' + brep + b'"}'
             self.jsres = json.loads(brep)
-        except urllib.error.HTTPError as e:
-            strerr = e.read()
-            raise IOError(f"{e.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as e:
-            raise IOError(e)
+        except IOError:
+            raise
         except Exception:
             raise IOError("Error while processing request:\n" f"{url}")
 
@@ -85,6 +82,14 @@ class blockcypher_api:
             )
         return selutxos
 
+    def get_txcount(self, addr):
+        self.getData("addrs", f"{addr}/balance")
+        self.checkapiresp()
+        tx_count = self.getKey("final_n_tx")
+        if not isinstance(tx_count, int):
+            raise IOError("Invalid transactions count in the API response")
+        return tx_count
+
     def pushtx(self, txhex):
         self.getData("txs", "push", data=f'{{"tx": "{txhex}"}}'.encode("ascii"))
         self.checkapiresp()
@@ -141,23 +146,34 @@ class DOGEwalletCore:
             self.testnet = True
         self.segwit = segwit_option
         self.pubkey = compress_pubkey(pubkey).hex()
-        if self.segwit == 0:
-            self.address = cryptolib.coins.dogecoin.Doge(testnet=self.testnet).pubtoaddr(
-                self.pubkey
-            )
-        else:
-            raise Exception("Not valid segwit option")
+        self.address = self.pubkey_address(self.pubkey)
         self.api = api
+        # AccountDiscovery, when the device can provide the account node
+        self.discovery = None
+
+    def pubkey_address(self, pubkey_hex):
+        """Address in the wallet format for a public key"""
+        if self.segwit == 0:
+            return cryptolib.coins.dogecoin.Doge(testnet=self.testnet).pubtoaddr(pubkey_hex)
+        raise Exception("Not valid segwit option")
 
-    def getutxos(self, nconf=0):
+    def getutxos(self, nconf=0, refresh=False):
+        if self.discovery is not None:
+            # All the account addresses, from the last scan when recent enough
+            return self.discovery.get_state(nconf, refresh).utxos
         return self.api.getutxos(self.address, nconf)
 
+    def change_address(self):
+        if self.discovery is not None:
+            return self.discovery.change_key()["address"]
+        return self.address
+
     def getbalance(self):
         utxos = self.getutxos()
         return self.balance_fmutxos(utxos)
 
     def prepare(self, toaddr, paymentvalue, fee):
-        utxos = self.getutxos()
+        utxos = self.getutxos(refresh=True)
         balance = self.balance_fmutxos(utxos)
         maxspendable = balance - fee
         if paymentvalue > maxspendable or paymentvalue < 0:
@@ -167,15 +183,18 @@ class DOGEwalletCore:
         changevalue = invalue - paymentvalue - fee
         outs = [{"value": paymentvalue, "address": toaddr}]
         if changevalue > 0:
-            outs.append({"value": changevalue, "address": self.address})
+            outs.append({"value": changevalue, "address": self.change_address()})
         self.tx = cryptolib.coins.dogecoin.Doge(testnet=self.testnet).mktx(inputs, outs)
-        script = cryptolib.coins.mk_pubkey_script(self.address)
+        # Each input can be from a different address of the account
+        self.inputs_pubkeys = [utxo.get("pubkey", self.pubkey) for utxo in inputs]
+        self.inputs_paths = [utxo.get("path") for utxo in inputs]
 
         # Finish tx
         # Sign each input
         self.leninputs = len(inputs)
         datahashes = []
         for i in range(self.leninputs):
+            script = cryptolib.coins.mk_pubkey_script(self.pubkey_address(self.inputs_pubkeys[i]))
             signing_tx = cryptolib.coins.signature_form(
                 self.tx, i, script, cryptolib.coins.SIGHASH_ALL
             )
@@ -186,7 +205,7 @@ class DOGEwalletCore:
         for i in range(self.leninputs):
             signature_der_hex = signatures[i].hex() + "01"
             self.tx["ins"][i]["script"] = cryptolib.coins.serialize_script(
-                [signature_der_hex, self.pubkey]
+                [signature_der_hex, self.inputs_pubkeys[i]]
             )
         txhex = cryptolib.coins.serialize(self.tx)
         return "\nDONE, txID : " + self.api.pushtx(txhex)
@@ -236,11 +255,28 @@ class DOGE_wallet:
         ],
     ]
 
-    def __init__(self, network, wtype, device):
+    def __init__(self, network, wtype, device, gap_limit=DEFAULT_GAP_LIMIT):
         self.current_device = device
         pubkey = self.current_device.get_public_key()
         network_name = self.networks[network]
         self.doge = DOGEwalletCore(pubkey, network_name, wtype, blockcypher_api(network_name))
+        if getattr(self.current_device, "is_HD", False):
+            # Watch all the account addresses when the device provides the account node
+            self.key_path = self.get_path(network, wtype, device.legacy_derive).format(
+                device.get_account(), device.get_address_index()
+            )
+            acc_path = account_path(self.key_path)
+            account_node = device.get_account_node(acc_path, self.get_key_type(wtype))
+            if account_node is not None:
+                self.doge.discovery = AccountDiscovery(
+                    acc_path,
+                    account_node,
+                    self.doge.pubkey_address,
+                    lambda: blockcypher_api(network_name),
+                    gap_limit,
+                    BLOCKCYPHER_WORKERS,
+                    BLOCKCYPHER_INTERVAL,
+                )
 
     @classmethod
     def get_networks(cls):
@@ -252,8 +288,8 @@ class DOGE_wallet:
 
     @classmethod
     def get_path(cls, network_name, wtype, legacy):
-        # First path
-        # To be changed to the first one available, needs scanning
+        # First path of the account
+        # Other used addresses are found with AccountDiscovery, when available
         return cls.derive_paths[network_name][wtype]
 
     @classmethod
@@ -282,21 +318,25 @@ class DOGE_wallet:
 
     def raw_tx(self, amount, fee, to_account):
         msgs_to_sign = self.doge.prepare(to_account, amount, fee)
+        # DOGE is a non-EVM chain enabled for Satochip.
+        # This requires a special case handling.
+        if (
+            self.current_device.__class__.__name__ == "Satochip"
+            or not self.current_device.on_device_check
+        ):
+            msgs_to_sign = [sha2(msg) for msg in msgs_to_sign]
         tx_signatures = []
-        for msg in msgs_to_sign:
-            # DOGE is a non-EVM chain enabled for Satochip.
-            # This requires a special case handling.
-            if (
-                self.current_device.__class__.__name__ == "Satochip"
-                or not self.current_device.on_device_check
-            ):
-                msg = sha2(msg)
-            asig = self.current_device.sign(msg)
-            if self.current_device.provide_parity:
-                # asig : v,r,s turn into DER
-                asig = encode_der_s(asig[1], asig[2], "K1")
-                # Even msg before hash is a hash, to be modified
-            tx_signatures.append(asig)
+        try:
+            # Inputs can be from other addresses of the account
+            for asig in self.current_device.sign_stream(msgs_to_sign, self.doge.inputs_paths):
+                if self.current_device.provide_parity:
+                    # asig : v,r,s turn into DER
+                    asig = encode_der_s(asig[1], asig[2], "K1")
+                tx_signatures.append(asig)
+        finally:
+            if any(self.doge.inputs_paths):
+                # Back to the wallet key
+                self.current_device.derive_key(self.key_path, "K1")
         return self.doge.send(tx_signatures)
 
     def assess_fee(self, fee_priority):
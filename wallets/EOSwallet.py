@@ -18,12 +18,12 @@
 import json
 import re
 import time
-import urllib.request
 
 from cryptolib.base58 import bin_to_base58_eos
 from cryptolib.uintEncode import uint8, uint16, uint32, encode_varuint
 from cryptolib.coins.eos import string_to_binname, expiration_string_epoch_int, near_future_iso_str
 from cryptolib.cryptography import public_key_recover, compress_pubkey, sha2
+from wallets.http_transport import request as http_request
 from wallets.wallets_utils import NotEnoughTokens
 
 
@@ -82,18 +82,15 @@ class eos_api:
         if data is not None and isinstance(data, dict):
             data = json.dumps(data).encode("utf8")
         try:
-            req = urllib.request.Request(
-                f"{self.url}/v1/chain/{endpoint}",
-                headers={"User-Agent": "Mozilla/5.0"},
-                data=data,
+            return json.loads(
+                http_request(
+                    f"{self.url}/v1/chain/{endpoint}",
+                    data=data,
+                    headers={"User-Agent": "Mozilla/5.0"},
+                )
             )
-            webrsc = urllib.request.urlopen(req)
-            return json.load(webrsc)
-        except urllib.error.HTTPError as exc:
-            strerr = exc.read()
-            raise IOError(f"{exc.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as exc:
-            raise IOError(exc)
+        except IOError:
+            raise
         except Exception:
             raise IOError(f"Error while processing request:\n{self.url}/v1/chain/{endpoint}")
 
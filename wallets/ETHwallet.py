@@ -19,12 +19,19 @@ import json
 from logging import getLogger
 from textwrap import fill
 
-from pyweb3 import Web3Client
 from pywalletconnect import WCClient, WCClientInvalidOption, WCClientException
+from pyweb3.json_rpc import JSONRPCexception
 
 from cryptolib.cryptography import public_key_recover, sha2, sha3
 from cryptolib.coins.ethereum import rlp_encode, int2bytearray, uint256, read_string
+from wallets.fee_oracle import get_fee_oracle
+from wallets.gas_estimator import get_gas_estimator, gas_limit
+from wallets.http_transport import ConnectError
 from wallets.name_service import resolve
+from wallets.nonce_manager import get_nonce_manager
+from wallets.rpc_pool import get_endpoint_pool, PooledEVMclient
+from wallets.token_metadata import token_metadata
+from wallets.token_scanner import TokenScanner
 from wallets.wallets_utils import (
     shift_10,
     balance_string,
@@ -32,8 +39,12 @@ from wallets.wallets_utils import (
     InvalidOption,
     NotEnoughTokens,
 )
-from wallets.ETHtokens import tokens_values, nfts_values, ledger_tokens
+from wallets.token_registry import TokenRegistry
 from wallets.typed_data_hash import typed_sign_hash, print_text_query
+from wallets.wc_sessions import WCSessions, WCSessionError
+
+
+tokens_registry = TokenRegistry("ETH")
 
 
 ETH_DECIMALS = 18
@@ -112,16 +123,24 @@ def testaddr(eth_addr):
 
 
 class ETHwalletCore:
-    def __init__(self, pubkey, network, api, chainID, contract=None, is_fungible=True):
+    def __init__(
+        self, pubkey, network, api, chainID, contract=None, is_fungible=True, metadata=None
+    ):
         self.pubkey = pubkey
         self.is_fungible = is_fungible
         key_hash = sha3(self.pubkey[1:])
         self.address = format_checksum_address(key_hash.hex()[-40:])
         self.contract = contract
         self.api = api
-        self.decimals = self.get_decimals()
-        self.token_symbol = self.get_symbol()
         self.chainID = chainID
+        # TokenMetadataCache for the ERC20 decimals and symbol
+        self.metadata = metadata
+        # NonceManager of the address, else the nonce is read for each tx
+        self.nonces = None
+        # GasEstimator of the chain, else the gas limits are fixed
+        self.gas_estimator = None
+        self.nonce_pending = None
+        self.decimals, self.token_symbol = self.read_token_info()
 
     def call(self, method, data=""):
         """eth_call to the current contract"""
@@ -132,20 +151,55 @@ class ETHwalletCore:
             # ETH native balance
             return self.api.get_balance(f"0x{self.address}")
         # Token balance
-        balraw = self.call(BALANCEOF_FUNCTION, f"000000000000000000000000{self.address}")
+        return self.read_int(
+            self.call(BALANCEOF_FUNCTION, f"000000000000000000000000{self.address}")
+        )
+
+    @staticmethod
+    def read_int(balraw):
         if balraw == [] or balraw == "0x":
             return 0
-        balance = int(balraw[2:], 16)
-        return balance
+        return int(balraw[2:], 16)
+
+    @staticmethod
+    def read_symbol(balraw):
+        if balraw == [] or balraw == "0x":
+            return "---"
+        return read_string(balraw)
+
+    def read_token_info(self):
+        """Decimals and symbol, from the metadata cache or read in one batch"""
+        if not self.contract:
+            return ETH_DECIMALS, None
+        use_cache = self.metadata is not None and self.is_fungible
+        symbol = None
+        if use_cache:
+            cached = self.metadata.get(self.chainID, self.contract)
+            if cached is not None:
+                return cached["decimals"], cached["symbol"]
+            symbol = self.metadata.get_preset_symbol(self.chainID, self.contract)
+        batch = self.api.batch()
+        if self.is_fungible:
+            # ERC20
+            batch.call(self.contract, DECIMALS_FUNCTION)
+        if symbol is None:
+            batch.call(self.contract, SYMBOL_FUNCTION)
+        results = batch.execute()
+        if symbol is None:
+            symbol = self.read_symbol(results[-1])
+        if not self.is_fungible:
+            # NFT
+            return 0, symbol
+        decimals = self.read_int(results[0])
+        if use_cache and results[0] not in ([], "0x"):
+            self.metadata.set(self.chainID, self.contract, decimals, symbol)
+        return decimals, symbol
 
     def get_decimals(self):
         if self.contract:
             if self.is_fungible:
                 # ERC20
-                balraw = self.call(DECIMALS_FUNCTION)
-                if balraw == [] or balraw == "0x":
-                    return 0
-                return int(balraw[2:], 16)
+                return self.read_int(self.call(DECIMALS_FUNCTION))
             else:
                 # NFT
                 return 0
@@ -153,28 +207,148 @@ class ETHwalletCore:
 
     def get_symbol(self):
         if self.contract:
-            balraw = self.call(SYMBOL_FUNCTION)
-            if balraw == [] or balraw == "0x":
-                return "---"
-            return read_string(balraw)
+            return self.read_symbol(self.call(SYMBOL_FUNCTION))
 
     def getnonce(self):
         numtx = self.api.get_tx_num(self.address, "pending")
         return numtx
 
-    def prepare(self, toaddr, paymentvalue, gprice, glimit, data=bytearray(b"")):
+    def read_tx_state(self, with_gasprice=False, gas_for=None):
+        """Read in one batch what a tx needs : balances, nonce and the gas price if required.
+        gas_for : (toaddr, paymentvalue, data) as prepare, to estimate the gas limit.
+        Returns a dict, token_balance is only present for a contract,
+        gas_limit only when estimated.
+        """
+        if gas_for is not None and self.gas_estimator is not None:
+            try:
+                return self.read_tx_state_gas(with_gasprice, *gas_for)
+            except JSONRPCexception as exc:
+                # The estimation failed, as a reverted call
+                logger.debug("Gas estimation failed : %s", str(exc))
+        batch, fields = self.tx_state_batch(with_gasprice)
+        return self.read_tx_results(batch, fields)
+
+    def tx_state_batch(self, with_gasprice):
+        """Batch reading the balances, the nonce and the gas price, with the results names"""
+        batch = self.api.batch()
+        fields = ["balance"]
+        batch.get_balance(f"0x{self.address}")
+        if self.nonces is None or self.nonces.needs_chain_nonce():
+            fields.append("nonce")
+            batch.get_tx_num(self.address, "pending")
+        if self.contract:
+            fields.append("token_balance")
+            batch.call(self.contract, BALANCEOF_FUNCTION, f"000000000000000000000000{self.address}")
+        if with_gasprice:
+            fields.append("gasprice")
+            batch.get_gasprice()
+        return batch, fields
+
+    def read_tx_results(self, batch, fields):
+        tx_state = dict(zip(fields, batch.execute()))
+        if self.contract:
+            tx_state["token_balance"] = self.read_int(tx_state["token_balance"])
+        return tx_state
+
+    def read_tx_state_gas(self, with_gasprice, toaddr, paymentvalue, data):
+        """read_tx_state with the gas limit estimated, in the same batch.
+        The recipient code and the estimation are read when not in the estimator cache.
+        """
+        estimator = self.gas_estimator
+        to_addr, value, call_data = self.tx_call(toaddr, paymentvalue, data)
+        tx_call = {
+            "from": f"0x{self.address}",
+            "to": f"0x{to_addr.hex()}",
+            "value": hex(value),
+            "data": f"0x{call_data.hex()}",
+        }
+        recipient = f"0x{toaddr}"
+        recipient_is_contract = estimator.is_contract(recipient)
+        # Unknown recipient : most are accounts
+        shape = estimator.shape(tx_call["to"], call_data, bool(recipient_is_contract))
+        gas_estimate = estimator.get(shape)
+        batch, fields = self.tx_state_batch(with_gasprice)
+        if recipient_is_contract is None:
+            fields.append("recipient_code")
+            batch.get_code(recipient)
+        if gas_estimate is None:
+            fields.append("gas_estimate")
+            batch.estimate_gas(tx_call)
+        tx_state = self.read_tx_results(batch, fields)
+        if "recipient_code" in tx_state:
+            estimator.set_code(recipient, tx_state.pop("recipient_code"))
+            if estimator.is_contract(recipient):
+                shape = estimator.shape(tx_call["to"], call_data, True)
+                if "gas_estimate" not in tx_state:
+                    gas_estimate = estimator.get(shape)
+        if "gas_estimate" in tx_state:
+            gas_estimate = tx_state.pop("gas_estimate")
+            estimator.update(shape, gas_estimate)
+        if gas_estimate is None:
+            # The recipient is a contract, not estimated yet
+            batch = self.api.batch()
+            batch.estimate_gas(tx_call)
+            gas_estimate = batch.execute()[0]
+            estimator.update(shape, gas_estimate)
+        tx_state["gas_limit"] = gas_limit(gas_estimate, len(call_data) > 0)
+        return tx_state
+
+    def reserve_nonce(self, tx_state):
+        if self.nonces is None:
+            nonce = tx_state["nonce"]
+        else:
+            nonce = self.nonces.reserve(tx_state.get("nonce"))
+        self.nonce_pending = nonce
+        return nonce
+
+    def release_nonce(self):
+        """The prepared transaction won't be sent"""
+        if self.nonces is not None and self.nonce_pending is not None:
+            self.nonces.release(self.nonce_pending)
+        self.nonce_pending = None
+
+    def nonce_sent(self):
+        """The prepared transaction was sent"""
+        if self.nonces is not None and self.nonce_pending is not None:
+            self.nonces.mark_sent(self.nonce_pending)
+        self.nonce_pending = None
+
+    def tx_call(self, toaddr, paymentvalue, data=bytearray(b"")):
+        """Destination, value and data of a tx to toaddr (hex without 0x).
+        If NFT : paymentvalue is id
+        """
+        if self.contract:
+            if self.is_fungible:
+                # ERC20
+                call_data = bytearray.fromhex(TRANSFER_FUNCTION + "00" * 12 + toaddr) + uint256(
+                    paymentvalue
+                )
+            else:
+                # NFT
+                call_data = (
+                    bytearray.fromhex(SAFETRANSFER_FUNCTION + "00" * 12 + self.address)
+                    + bytearray.fromhex("00" * 12 + toaddr)
+                    + uint256(paymentvalue)
+                )
+            return bytearray.fromhex(self.contract[2:]), 0, call_data
+        return bytearray.fromhex(toaddr), int(paymentvalue), data
+
+    def prepare(self, toaddr, paymentvalue, gprice, glimit, data=bytearray(b""), tx_state=None):
         """Build a transaction to be signed.
         toaddr in hex without 0x
         value in wei, gprice in Wei
         If NFT : paymentvalue is id
+        tx_state from read_tx_state, read now if not provided
         """
+        if tx_state is None:
+            tx_state = self.read_tx_state()
         if self.contract:
-            maxspendable = self.getbalance(False)
-            balance_eth = self.getbalance()
+            maxspendable = tx_state["token_balance"]
+            balance_eth = tx_state["balance"]
             if balance_eth < (gprice * glimit):
                 raise NotEnoughTokens("Not enough native gas for the tx fee.")
         else:
-            maxspendable = self.getbalance() - (gprice * glimit)
+            maxspendable = tx_state["balance"] - (gprice * glimit)
         if self.is_fungible:
             if paymentvalue > maxspendable or paymentvalue < 0:
                 if self.contract:
@@ -187,28 +361,12 @@ class ETHwalletCore:
             # For now, dont test whether the exact id is owned
             if maxspendable < 1:
                 raise NotEnoughTokens("You have no NFT for the tx.")
-        self.nonce = int2bytearray(self.getnonce())
+        self.release_nonce()
+        self.nonce = int2bytearray(self.reserve_nonce(tx_state))
         self.gasprice = int2bytearray(gprice)
         self.startgas = int2bytearray(glimit)
-        if self.contract:
-            self.to = bytearray.fromhex(self.contract[2:])
-            self.value = int2bytearray(int(0))
-            if self.is_fungible:
-                # ERC20
-                self.data = bytearray.fromhex(TRANSFER_FUNCTION + "00" * 12 + toaddr) + uint256(
-                    paymentvalue
-                )
-            else:
-                # NFT
-                self.data = (
-                    bytearray.fromhex(SAFETRANSFER_FUNCTION + "00" * 12 + self.address)
-                    + bytearray.fromhex("00" * 12 + toaddr)
-                    + uint256(paymentvalue)
-                )
-        else:
-            self.to = bytearray.fromhex(toaddr)
-            self.value = int2bytearray(int(paymentvalue))
-            self.data = data
+        self.to, value, self.data = self.tx_call(toaddr, paymentvalue, data)
+        self.value = int2bytearray(value)
         v = int2bytearray(self.chainID)
         r = int2bytearray(0)
         s = int2bytearray(0)
@@ -301,7 +459,19 @@ class ETHwalletCore:
 
     def send(self, tx_hex):
         """Upload the tx"""
-        return self.api.pushtx(tx_hex)
+        try:
+            tx_hash = self.api.pushtx(tx_hex)
+        except (JSONRPCexception, ConnectError):
+            # Rejected by the node or not sent, the nonce is free
+            self.release_nonce()
+            raise
+        except Exception:
+            # Outcome unknown, the tx may be in the mempool : its nonce is not reused.
+            # If the tx never reaches the chain, the reconciliation gives it back.
+            self.nonce_sent()
+            raise
+        self.nonce_sent()
+        return tx_hash
 
 
 class ETH_wallet:
@@ -332,17 +502,16 @@ class ETH_wallet:
         {
             "option_name": "contract_addr",
             "prompt": "ERC20 contract address",
-            "preset": tokens_values,
+            "preset": tokens_registry.tokens_values,
         },
         {
             "option_name": "wc_uri",
             "prompt": "WalletConnect URI link",
-            "use_get_messages": True,
         },
         {
             "option_name": "contract_addr",
             "prompt": "ERC721 contract address",
-            "preset": nfts_values,
+            "preset": tokens_registry.nfts_values,
         },
     ]
 
@@ -364,7 +533,7 @@ class ETH_wallet:
         else:
             raise InvalidOption("Invalid network name.")
         self.load_base(rpc_endpoint, device, contract_addr, wc_uri, confirm_callback, wtype != 3)
-        self.ledger_tokens = ledger_tokens
+        self.ledger_tokens = tokens_registry.ledger_tokens
 
     def load_base(self, chain_domain, device, contract_addr, wc_uri, confirm_callback, fungible):
         """Finish initialization, second part common for all chains"""
@@ -382,54 +551,77 @@ class ETH_wallet:
                 contract_addr_str = "0x" + contract_addr_str
         else:
             contract_addr_str = None
-        if not chain_domain.startswith("https:"):
+        if "://" not in chain_domain:
             chain_domain = f"https://{chain_domain}-rpc.publicnode.com"
+        # The chain domain first, then the fallback endpoints of the chain
+        self.rpc_pool = get_endpoint_pool(self.chainID, chain_domain)
+        rpc_client = PooledEVMclient(self.rpc_pool)
+        if contract_addr_str is not None and fungible:
+            token_metadata.seed_presets(self.chainID, self.get_preset_tokens())
         self.eth = ETHwalletCore(
             pubkey,
             self.network,
-            Web3Client(chain_domain, "Uniblow/2"),
+            rpc_client,
             self.chainID,
             contract_addr_str,
             fungible,
+            token_metadata,
+        )
+        address = self.eth.address
+        # The pooled client is thread safe, also used from the background threads
+        self.eth.nonces = get_nonce_manager(
+            self.chainID,
+            address,
+            lambda: rpc_client.get_tx_num(address, "pending"),
         )
+        self.fee_oracle = get_fee_oracle(self.chainID, lambda: rpc_client)
+        self.eth.gas_estimator = get_gas_estimator(self.chainID)
         if contract_addr_str is not None:
             self.coin = self.eth.token_symbol
         if wc_uri is not None:
-            WCClient.set_wallet_metadata(WALLET_DESCR)
-            WCClient.set_project_id(WALLETCONNECT_PROJID)
-            WCClient.set_origin("https://uniblow.org")
-            try:
-                self.wc_client = WCClient.from_wc_uri(wc_uri)
-                req_id, wc_chain_ids, request_info = self.wc_client.open_session()
-            except (WCClientInvalidOption, WCClientException) as exc:
-                if hasattr(self, "wc_client"):
-                    self.wc_client.close()
-                raise InvalidOption(exc)
-            if wc_chain_ids:
-                if str(self.chainID) not in wc_chain_ids:
-                    self.wc_client.reject_session_request(req_id)
-                    self.wc_client.close()
-                    raise InvalidOption("The dapp chain ID is not this current chain/network.")
-            relay = self.wc_client.get_relay_url()
-            request_message = (
-                "WalletConnect request from :\n\n"
-                f"{request_info['name']}\n\n"
-                f"website  :  {request_info['url']}\n"
-            )
-            if relay:
-                request_message += f"Relay URL : {relay}\n"
-            approve = self.confirm_callback(request_message)
-            if approve:
-                self.wc_client.reply_session_request(req_id, self.chainID, self.get_account())
-            else:
-                self.wc_client.reject_session_request(req_id)
-                self.wc_client.close()
-                raise InvalidOption("You just declined the WalletConnect request.")
+            self.wc_sessions = WCSessions()
+            self.wc_processing = False
+            self.connect_dapp(wc_uri)
+
+    def connect_dapp(self, wc_uri):
+        """Pair a dapp with a WalletConnect URI, as a new session of this wallet"""
+        WCClient.set_wallet_metadata(WALLET_DESCR)
+        WCClient.set_project_id(WALLETCONNECT_PROJID)
+        WCClient.set_origin("https://uniblow.org")
+        wc_client = None
+        try:
+            wc_client = WCClient.from_wc_uri(wc_uri)
+            req_id, wc_chain_ids, request_info = wc_client.open_session()
+        except (WCClientInvalidOption, WCClientException) as exc:
+            if wc_client is not None:
+                wc_client.close()
+            raise InvalidOption(exc)
+        if wc_chain_ids:
+            if str(self.chainID) not in wc_chain_ids:
+                wc_client.reject_session_request(req_id)
+                wc_client.close()
+                raise InvalidOption("The dapp chain ID is not this current chain/network.")
+        relay = wc_client.get_relay_url()
+        request_message = (
+            "WalletConnect request from :\n\n"
+            f"{request_info['name']}\n\n"
+            f"website  :  {request_info['url']}\n"
+        )
+        if relay:
+            request_message += f"Relay URL : {relay}\n"
+        approve = self.confirm_callback(request_message)
+        if approve:
+            wc_client.reply_session_request(req_id, self.chainID, self.get_account())
+        else:
+            wc_client.reject_session_request(req_id)
+            wc_client.close()
+            raise InvalidOption("You just declined the WalletConnect request.")
+        return self.wc_sessions.add(wc_client, request_info["name"])
 
     def __del__(self):
-        """Close the WebSocket connection when deleting the object."""
-        if hasattr(self, "wc_client"):
-            del self.wc_client
+        """Close the WebSocket connections when deleting the object."""
+        if hasattr(self, "wc_sessions"):
+            self.wc_sessions.close()
 
     @classmethod
     def get_networks(cls):
@@ -457,91 +649,129 @@ class ETH_wallet:
         return f"0x{self.eth.address}"
 
     # Process messages for WalletConnect
-    # Get messages more often than balance
+    # Called when a session reader notifies messages were received
     def get_messages(self):
-        # wc_message : (id, method, params) or (None, "", [])
-        wc_message = self.wc_client.get_message()
-        while wc_message[0] is not None:
-            id_request = wc_message[0]
-            method = wc_message[1]
-            parameters = wc_message[2]
-            logger.debug(
-                "WC request id: %s, method: %s, params: %s", id_request, method, parameters
-            )
-            if method == "wc_sessionRequest" or method == "wc_sessionPayload":
-                # Read if WCv2 and extract to v1 format
-                logger.debug("WCv2 request")
-                if parameters.get("request"):
-                    logger.debug("request decoding")
-                    method = parameters["request"].get("method")
-                    parameters = parameters["request"].get("params")
-                    logger.debug("Actual method: %s, params: %s", method, parameters)
-            if method == "wc_sessionUpdate":
-                if parameters[0].get("approved") is False:
-                    raise Exception("Disconnected by the web app service.")
-            if method == "wc_sessionDelete":
-                if parameters.get("reason"):
-                    raise Exception(
-                        "Disconnected by the web app service.\n"
-                        f"Reason : {parameters['reason']['message']}"
-                    )
-                if parameters.get("message"):
-                    raise Exception(
-                        "Disconnected by the web app service.\n" f"Reason : {parameters['message']}"
-                    )
-            elif method == "personal_sign" and len(parameters) > 1:
-                if compare_eth_addresses(parameters[1], self.get_account()):
-                    signature = self.process_sign_message(parameters[0])
-                    if signature is not None:
-                        self.wc_client.reply(id_request, f"0x{signature.hex()}")
-                    else:
-                        self.wc_client.reject(id_request)
-            elif method == "eth_sign" and len(parameters) > 1:
-                if compare_eth_addresses(parameters[0], self.get_account()):
-                    signature = self.process_sign_message(parameters[1])
-                    if signature is not None:
-                        self.wc_client.reply(id_request, f"0x{signature.hex()}")
-                    else:
-                        self.wc_client.reject(id_request)
-            elif (method == "eth_signTypedData" or method == "eth_signTypedData_v4") and len(
-                parameters
-            ) > 1:
-                if compare_eth_addresses(parameters[0], self.get_account()):
-                    signature = self.process_sign_typeddata(parameters[1])
-                    if signature is not None:
-                        self.wc_client.reply(id_request, f"0x{signature.hex()}")
-                    else:
-                        self.wc_client.reject(id_request)
-            elif method == "eth_sendTransaction" and len(parameters) > 0:
-                # sign and sendRaw
-                tx_obj_tosign = parameters[0]
-                if compare_eth_addresses(tx_obj_tosign["from"], self.get_account()):
-                    tx_signed = self.process_signtransaction(tx_obj_tosign)
-                    if tx_signed is not None:
-                        tx_hash = self.broadcast_tx(tx_signed)
-                        self.wc_client.reply(id_request, tx_hash)
-                    else:
-                        self.wc_client.reject(id_request)
-            elif method == "eth_signTransaction" and len(parameters) > 0:
-                tx_obj_tosign = parameters[0]
-                if compare_eth_addresses(tx_obj_tosign["from"], self.get_account()):
-                    tx_signed = self.process_signtransaction(tx_obj_tosign)
-                    if tx_signed is not None:
-                        self.wc_client.reply(id_request, f"0x{tx_signed}")
-                    else:
-                        self.wc_client.reject(id_request)
-            elif method == "eth_sendRawTransaction" and len(parameters) > 0:
-                tx_data = parameters[0]
-                tx_hash = self.broadcast_tx(tx_data)
-                self.wc_client.reply(id_request, tx_hash)
-            elif method == "wallet_switchEthereumChain" and len(parameters) > 0:
-                if hex(self.chainID) == parameters[0].get("chainId"):
-                    self.wc_client.reply(id_request, None)
+        if self.wc_processing:
+            # Already processing, when a dialog waits for the user
+            return
+        self.wc_processing = True
+        try:
+            # wc_message : (id, method, params) or (None, "", [])
+            session, wc_message = self.wc_sessions.get_message()
+            while session is not None:
+                with session.reader.client_lock:
+                    self.process_message(session, *wc_message)
+                logger.debug("WC command processing finished, now reading next message.")
+                session, wc_message = self.wc_sessions.get_message()
+        except WCSessionError as exc:
+            # The dapp is disconnected, the other sessions continue
+            self.wc_sessions.remove(exc.session)
+            raise
+        finally:
+            self.wc_processing = False
+
+    def process_message(self, session, id_request, method, parameters):
+        """Process a WalletConnect request of a session"""
+        logger.debug(
+            "WC %s request id: %s, method: %s, params: %s",
+            session.dapp_name,
+            id_request,
+            method,
+            parameters,
+        )
+        wc_client = session.wc_client
+        if method == "wc_sessionRequest" or method == "wc_sessionPayload":
+            # Read if WCv2 and extract to v1 format
+            logger.debug("WCv2 request")
+            if parameters.get("request"):
+                logger.debug("request decoding")
+                method = parameters["request"].get("method")
+                parameters = parameters["request"].get("params")
+                logger.debug("Actual method: %s, params: %s", method, parameters)
+        if method == "wc_sessionUpdate":
+            if parameters[0].get("approved") is False:
+                raise WCSessionError(session, "Disconnected by the web app service.")
+        if method == "wc_sessionDelete":
+            if parameters.get("reason"):
+                raise WCSessionError(
+                    session,
+                    "Disconnected by the web app service.\n"
+                    f"Reason : {parameters['reason']['message']}",
+                )
+            if parameters.get("message"):
+                raise WCSessionError(
+                    session,
+                    "Disconnected by the web app service.\n" f"Reason : {parameters['message']}",
+                )
+        elif method == "personal_sign" and len(parameters) > 1:
+            if compare_eth_addresses(parameters[1], self.get_account()):
+                signature = self.process_sign_message(parameters[0])
+                if signature is not None:
+                    wc_client.reply(id_request, f"0x{signature.hex()}")
+                else:
+                    wc_client.reject(id_request)
+        elif method == "eth_sign" and len(parameters) > 1:
+            if compare_eth_addresses(parameters[0], self.get_account()):
+                signature = self.process_sign_message(parameters[1])
+                if signature is not None:
+                    wc_client.reply(id_request, f"0x{signature.hex()}")
+                else:
+                    wc_client.reject(id_request)
+        elif (method == "eth_signTypedData" or method == "eth_signTypedData_v4") and len(
+            parameters
+        ) > 1:
+            if compare_eth_addresses(parameters[0], self.get_account()):
+                signature = self.process_sign_typeddata(parameters[1])
+                if signature is not None:
+                    wc_client.reply(id_request, f"0x{signature.hex()}")
                 else:
-                    # Chain change not supported
-                    self.wc_client.reject(id_request)
-            logger.debug("WC command processing finished, now reading next available message.")
-            wc_message = self.wc_client.get_message()
+                    wc_client.reject(id_request)
+        elif method == "eth_sendTransaction" and len(parameters) > 0:
+            # sign and sendRaw
+            tx_obj_tosign = parameters[0]
+            if compare_eth_addresses(tx_obj_tosign["from"], self.get_account()):
+                tx_signed = self.process_signtransaction(tx_obj_tosign)
+                if tx_signed is not None:
+                    tx_hash = self.broadcast_tx(tx_signed)
+                    wc_client.reply(id_request, tx_hash)
+                else:
+                    wc_client.reject(id_request)
+        elif method == "eth_signTransaction" and len(parameters) > 0:
+            tx_obj_tosign = parameters[0]
+            if compare_eth_addresses(tx_obj_tosign["from"], self.get_account()):
+                tx_signed = self.process_signtransaction(tx_obj_tosign)
+                if tx_signed is not None:
+                    # The dapp broadcasts it
+                    self.eth.nonce_sent()
+                    wc_client.reply(id_request, f"0x{tx_signed}")
+                else:
+                    wc_client.reject(id_request)
+        elif method == "eth_sendRawTransaction" and len(parameters) > 0:
+            tx_data = parameters[0]
+            tx_hash = self.broadcast_tx(tx_data)
+            wc_client.reply(id_request, tx_hash)
+        elif method == "wallet_switchEthereumChain" and len(parameters) > 0:
+            if hex(self.chainID) == parameters[0].get("chainId"):
+                wc_client.reply(id_request, None)
+            else:
+                # Chain change not supported
+                wc_client.reject(id_request)
+
+    def get_preset_tokens(self):
+        """Preset tokens of the current network {name: contract}"""
+        network_idx = [net.lower() for net in self.networks].index(self.network.lower())
+        presets = self.options_data[0]["preset"]
+        if network_idx >= len(presets):
+            return {}
+        return presets[network_idx]
+
+    def scan_tokens(self):
+        """Non zero balances of all the preset tokens of this chain, see TokenScanner.scan"""
+        scanner = TokenScanner(lambda: self.eth.api)
+        owned_tokens = scanner.scan(self.eth.address, self.get_preset_tokens())
+        for token in owned_tokens:
+            token_metadata.set(self.chainID, token["contract"], token["decimals"], token["symbol"])
+        return owned_tokens
 
     def get_balance(self):
         # Get balance in base integer unit and return string with unit
@@ -567,22 +797,32 @@ class ETH_wallet:
             explorer_url += "#tokentxns"
         return explorer_url
 
-    def build_tx(self, amount, gazprice, ethgazlimit, account, data=None):
+    def build_tx(self, amount, gazprice, ethgazlimit, account, data=None, tx_state=None):
         """Build and sign a transaction.
         Used to transfer tokens with the given parameters.
         amount is id when NFT.
         """
         if data is None:
             data = bytearray(b"")
-        tx_bin, hash_to_sign = self.eth.prepare(account, amount, gazprice, ethgazlimit, data)
+        tx_bin, hash_to_sign = self.eth.prepare(
+            account, amount, gazprice, ethgazlimit, data, tx_state
+        )
+        try:
+            return self.sign_tx(tx_bin, hash_to_sign)
+        except Exception:
+            # The reserved nonce is not used
+            self.eth.release_nonce()
+            raise
+
+    def sign_tx(self, tx_bin, hash_to_sign):
+        """Sign the prepared transaction"""
         if self.current_device.on_device_check:
             if self.eth.contract and self.current_device.ledger_tokens_compat:
                 # Token known by Ledger ?
                 ledger_info = self.ledger_tokens.get(self.eth.contract.lower())
                 if ledger_info:
                     # Known token : provide the trusted info to the device
-                    name = ledger_info["ticker"]
-                    data_sig = ledger_info["signature"]
+                    name, data_sig = ledger_info
                     self.current_device.register_token(
                         name, self.eth.contract[2:], self.eth.decimals, self.chainID, data_sig
                     )
@@ -684,10 +924,16 @@ class ETH_wallet:
         if gas_price != 0:
             gas_price = int(gas_price, 16)
         else:
-            gas_price = self.eth.api.get_gasprice()
-        gas_limit = txdata.get("gas", ETH_wallet.GAZ_LIMIT_ERC_20_TX)
-        if gas_limit != ETH_wallet.GAZ_LIMIT_ERC_20_TX:
-            gas_limit = int(gas_limit, 16)
+            gas_price = self.fee_oracle.get_gasprice(1)
+        data_hex = txdata.get("data", "0x")
+        data = bytearray.fromhex(data_hex[2:])
+        if "gas" in txdata:
+            tx_state = self.eth.read_tx_state()
+            gas_limit = int(txdata["gas"], 16)
+        else:
+            # Estimated by the wallet
+            tx_state = self.eth.read_tx_state(gas_for=(to_addr, value, data))
+            gas_limit = tx_state.get("gas_limit", ETH_wallet.GAZ_LIMIT_ERC_20_TX)
         request_message = (
             "WalletConnect transaction request :\n\n"
             f" To    :  0x{to_addr}\n"
@@ -701,76 +947,60 @@ class ETH_wallet:
         elif self.current_device.has_hardware_button:
             request_message += USER_BUTTON
         if self.confirm_callback(request_message):
-            data_hex = txdata.get("data", "0x")
-            data = bytearray.fromhex(data_hex[2:])
-            return self.build_tx(value, gas_price, gas_limit, to_addr, data)
+            return self.build_tx(value, gas_price, gas_limit, to_addr, data, tx_state)
 
-    def transfer(self, amount, to_account, fee_priority):
-        # Transfer x unit to an account, pay
+    def default_gas_limit(self, layer2):
+        """Fixed gas limit, when the gas can't be estimated"""
         if self.eth.contract:
             gazlimit = ETH_wallet.GAZ_LIMIT_ERC_20_TX
-            if getattr(self, "sendall_notallowed", False):
+            if layer2:
                 # Arb/OP, layer 2 : provide 4x more gas
                 gazlimit *= 4
         else:
             gazlimit = ETH_wallet.GAZ_LIMIT_SIMPLE_TX
-            if getattr(self, "sendall_notallowed", False):
+            if layer2:
                 # Arb/OP, layer 2 : provide 25x more gas
                 gazlimit *= 25
+        return gazlimit
+
+    def transfer(self, amount, to_account, fee_priority):
+        # Transfer x unit to an account, pay
         if to_account.startswith("0x"):
             to_account = to_account[2:]
-        gaz_price = self.eth.api.get_gasprice()  # wei per gaz unit
-        if fee_priority == 0:
-            gaz_price = int(gaz_price * 0.9)
-        elif fee_priority == 1:
-            gaz_price = int(gaz_price * 1.1)
-        elif fee_priority == 2:
-            gaz_price = int(gaz_price * 1.6)
-        else:
-            raise Exception("fee_priority must be 0, 1 or 2 (slow, normal, fast)")
-        tx_data = self.build_tx(
-            shift_10(amount, self.eth.decimals), gaz_price, gazlimit, to_account
-        )
+        amount = shift_10(amount, self.eth.decimals)
+        gaz_price = self.fee_oracle.get_gasprice(fee_priority)  # wei per gaz unit
+        tx_state = self.eth.read_tx_state(gas_for=(to_account, amount, bytearray(b"")))
+        gazlimit = tx_state.get("gas_limit")
+        if gazlimit is None:
+            gazlimit = self.default_gas_limit(getattr(self, "sendall_notallowed", False))
+        tx_data = self.build_tx(amount, gaz_price, gazlimit, to_account, None, tx_state)
         return "\nDONE, txID : " + self.broadcast_tx(tx_data)
 
     def transfer_nft(self, id, to_account):
         # SafeTransfer NFT id to an account
-        gazlimit = ETH_wallet.GAZ_LIMIT_ERC_20_TX * 2
         if to_account.startswith("0x"):
             to_account = to_account[2:]
-        gaz_price = self.eth.api.get_gasprice()  # wei per gaz unit
-        gaz_price = int(gaz_price * 1.2)
-        tx_data = self.build_tx(id, gaz_price, gazlimit, to_account)
+        gaz_price = self.fee_oracle.get_gasprice(1)  # wei per gaz unit
+        tx_state = self.eth.read_tx_state(gas_for=(to_account, id, bytearray(b"")))
+        gazlimit = tx_state.get("gas_limit", ETH_wallet.GAZ_LIMIT_ERC_20_TX * 2)
+        tx_data = self.build_tx(id, gaz_price, gazlimit, to_account, None, tx_state)
         return self.broadcast_tx(tx_data)
 
     def transfer_inclfee(self, amount, to_account, fee_priority):
         # Transfer the amount in base unit minus fee, like the receiver paying the fee
-        if self.eth.contract:
-            gazlimit = ETH_wallet.GAZ_LIMIT_ERC_20_TX
-            if self.chainID == 42161:
-                # Arbitrum : provide 4x more gas
-                gazlimit *= 4
-        else:
-            gazlimit = ETH_wallet.GAZ_LIMIT_SIMPLE_TX
-            if self.chainID == 42161:
-                # Arbitrum : provide 25x more gas
-                gazlimit *= 25
         if to_account.startswith("0x"):
             to_account = to_account[2:]
-        gaz_price = self.eth.api.get_gasprice()
-        if fee_priority == 0:
-            gaz_price = int(gaz_price * 0.9)
-        elif fee_priority == 1:
-            gaz_price = int(gaz_price * 1.1)
-        elif fee_priority == 2:
-            gaz_price = int(gaz_price * 1.6)
-        else:
-            raise Exception("fee_priority must be 0, 1 or 2 (slow, normal, fast)")
+        gaz_price = self.fee_oracle.get_gasprice(fee_priority)  # wei per gaz unit
+        tx_state = self.eth.read_tx_state(gas_for=(to_account, amount, bytearray(b"")))
+        gazlimit = tx_state.get("gas_limit")
+        if gazlimit is None:
+            # Arbitrum : provide more gas
+            gazlimit = self.default_gas_limit(self.chainID == 42161)
         if self.eth.contract:
             fee = 0
         else:
             fee = int(gazlimit * gaz_price)
-        tx_data = self.build_tx(amount - fee, gaz_price, gazlimit, to_account)
+        tx_data = self.build_tx(amount - fee, gaz_price, gazlimit, to_account, None, tx_state)
         return "\nDONE, txID : " + self.broadcast_tx(tx_data)
 
     def transfer_all(self, to_account, fee_priority):
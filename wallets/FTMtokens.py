@@ -1,1350 +0,0 @@
-# Uniblow ERC20 list for Fantom generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "fBTC (FBTC)": "0xe1146b9AC456fCbB60644c36Fd3F868A9072fc6E",
-        "fETH (FETH)": "0x658b0c7613e890EE50B8C4BC6A3f41ef411208aD",
-        "USD Coin (USDC)": "0x04068DA6C83AFCFA0e13ba15A6696662335D5B75",
-        "Avalanche (AVAX)": "0x511D35c52a3C244E7b8bd92c0C297755FbD89212",
-        "Dai Stablecoin (DAI)": "0x8D11eC38a3EB5E956B052f67Da8Bdc9bef8Abf3E",
-        "ChainLink (LINK)": "0xb3654dc3D10Ea7645f8319668E8F54d2574FBdC8",
-        "Bitcoin (BTC)": "0x321162Cd933E2Be498Cd2267a90534A804051b11",
-        "Staked FTM (SFTM)": "0x69c744D3444202d35a2783929a0F930f2FBB05ad",
-        "Wrapped Fantom (WFTM)": "0x21be370D5312f44cB42ce377BC9b8a0cEF1A4C83",
-        "TrueUSD (TUSD)": "0x9879aBDea01a879644185341F7aF7d8343556B7a",
-        "Aave (AAVE)": "0x6a07A792ab2965C72a5B8088d3a069A7aC3a993B",
-        "Frax (FRAX)": "0xdc301622e621166BD8E82f2cA0A26c13Ad0BE355",
-        "Synthetix Network (SNX)": "0x56ee926bD8c72B2d5fa1aF4d9E4Cbb515a1E3Adc",
-        "Frax Share (FXS)": "0x7d016eec9c25232b01F23EF992D98ca97fc2AF5a",
-        "Curve DAO (CRV)": "0x1E4F97b9f9F913c46F1632781732927B9019C68b",
-        "Decentralized USD (USDD)": "0xcf799767d366d789e8B446981C2D578E241fa25c",
-        "yearn.finance (YFI)": "0x29b0Da86e484E1C0029B56e817912d778aC0EC69",
-        "Sushi (SUSHI)": "0xae75A438b2E0cB8Bb01Ec1E1e376De11D44477CC",
-        "Band (BAND)": "0x46E7628E8b4350b2716ab470eE0bA1fa9e76c6C5",
-        "fBAND (FBAND)": "0x078EEF5A2fb533e1a4d487ef64b27DF113d12C32",
-        "Synapse (SYN)": "0xE55e19Fb4F2D85af758950957714292DAC1e25B2",
-        "Celsius (CEL)": "0x2C78f1b70Ccf63CDEe49F9233e9fAa99D43AA07e",
-        "Frax Ether (frxETH)": "0x9E73F99EE061C8807F69f9c6CCc44ea3d8c373ee",
-        "StargateToken (STG)": "0x2F6F07CDcf3588944Bf4C42aC74ff24bF56e7590",
-        "Magic Internet Money (MIM)": "0x82f0B8B456c1A451378467398982d4834b6829c1",
-        "AlphaToken (ALPHA)": "0x11eb3aA66FE1f2B75cB353D3e874E96968182BdA",
-        "Orbs (ORBS)": "0x3E01B7E242D5AF8064cB9A8F9468aC0f8683617c",
-        "Spell Token (SPELL)": "0x468003B688943977e6130F4F68F23aad939a1040",
-        "BOBA Token (BOBA)": "0x4389b230D15119c347B9E8BEA6d930A21aaDF6BA",
-        "Dola USD Stablecoin (DOLA)": "0x3129662808bEC728a27Ab6a6b9AFd3cBacA8A43c",
-        "AlpacaToken (ALPACA)": "0xaD996A45fd2373ed0B10Efa4A8eCB9de445A4302",
-        "Keep3r (KP3R)": "0x2A5062D22adCFaAfbd5C541d4dA82E4B450d4212",
-        "Orion Protocol (ORN)": "0xD2cDcB6BdEE6f78DE7988a6A60d13F6eF0b576D9",
-        "Hegic (HEGIC)": "0x44B26E839eB3572c5E959F994804A5De66600349",
-        "Gelato Network Token (GEL)": "0x15b7c0c907e4C6b9AdaAaabC300C08991D6CEA05",
-        "TETU Reward Token (TETU)": "0x65c9d9d080714cDa7b5d58989Dc27f897F165179",
-        "TOR (TOR)": "0x74E23dF9110Aa9eA0b6ff2fAEE01e740CA1c642e",
-        "SpookyToken (BOO)": "0x841FAD6EAe12c286d1Fd18d1d525DFfA75C7EFFE",
-        "Treeb (TREEB)": "0xc60D7067dfBc6f2caf30523a064f416A5Af52963",
-        "hoge.finance (HOGE)": "0xF31778D591c558140398F46feCA42A6a2dbFFe90",
-        "EverRise (RISE)": "0xC17c30e98541188614dF99239cABD40280810cA3",
-        "BeethovenxToken (BEETS)": "0xF24Bcf4d1e507740041C9cFd2DddB29585aDCe1e",
-        "WigoSwap Token (WIGO)": "0xE992bEAb6659BFF447893641A378FbbF031C5bD6",
-        "MUMMY (MMY)": "0x01e77288b38b416F972428d562454fb329350bAc",
-        "Hector (HEC)": "0x5C4FDfc5233f935f20D2aDbA572F770c2E377Ab0",
-        "Staked Hector (sHEC)": "0x75bdeF24285013387A47775828bEC90b91Ca9a5F",
-        "Geist.Finance Protocol Token (GEIST)": "0xd8321AA83Fb0a4ECd6348D4577431310A6E0814d",
-        "LIF3 (LIF3)": "0xbf60e7414EF09026733c1E7de72E7393888C64DA",
-        "Wrapped Banano (wBAN)": "0xe20B9e246db5a0d21BF9209E4858Bc9A3ff7A034",
-        "XEN Crypto (fmXEN)": "0xeF4B763385838FfFc708000f884026B8c0434275",
-        "Rai Reflex Index (RAI)": "0xa71353Bb71DdA105D383B02fc2dD172C4D39eF8B",
-        "Liquid Driver (LQDR)": "0x10b620b2dbAC4Faa7D7FFD71Da486f5D44cd86f9",
-        "PaintSwap Token (BRUSH)": "0x85dec8c4B2680793661bCA91a8F129607571863d",
-        "TOMB (TOMB)": "0x6c021Ae822BEa943b2E66552bDe1D2696a53fbB7",
-        "Tarot (TAROT)": "0xC5e2B037D30a390e62180970B3aa4E91868764cD",
-        "Cerby Token (CERBY)": "0xdef1fac7Bf08f173D286BbBDcBeeADe695129840",
-        "TSHARE (TSHARE)": "0x4cdF39285D7Ca8eB3f090fDA0C069ba5F4145B37",
-        "Spice (SFI)": "0x924828a9Fb17d47D0eb64b57271D10706699Ff11",
-        "Tempus (TEMP)": "0x1c174f6AB0753162befbB916c69dEF2cc1bfdEc1",
-        "LSHARE (LSHARE)": "0xCbE0CA46399Af916784cADF5bCC3aED2052D6C45",
-        "O3 Swap Token (O3)": "0xEe9801669C6138E84bD50dEB500827b776777d28",
-        "ArtWallet (1ART)": "0xD3c325848D7c6E29b574Cb0789998b2ff901f17E",
-        "ChainPort Token [via ChainPort.io] (PORTX)": "0x504eC4f9AF7bBf8cAD73ccC2121A3A7FB4c81Bcf",
-        "SpiritSwap Token (SPIRIT)": "0x5Cc61A78F164885776AA610fb0FE1257df78E59B",
-        "BetSwirl Token (BETS)": "0x323D0dba53ee9A6F0fAA464FB099ec562b591fC7",
-        "Elk (ELK)": "0xeEeEEb57642040bE42185f49C52F7E9B38f8eeeE",
-        "Cover Protocol Governance (COVER)": "0xB01E8419d842beebf1b70A7b5f7142abbaf7159D",
-        "Fantohm (FHM)": "0xfa1FBb8Ef55A4855E5688C0eE13aC3f202486286",
-        "Staked Fantohm (sFHM)": "0x5E983ff70DE345de15DbDCf0529640F14446cDfa",
-        "Scream (SCREAM)": "0xe0654C8e6fd4D733349ac7E09f6f23DA256bF475",
-        "Hundred Finance (HND)": "0x10010078a54396F62c96dF8532dc2B4847d47ED3",
-        "YEL Token (YEL)": "0xD3b71117E6C1558c1553305b44988cd944e97300",
-        "Plasma (PPAY)": "0x3B42fd538597fd049648C9f017208BF712195b73",
-        "Graviton (GTON)": "0xC1Be9a4D5D45BeeACAE296a7BD5fADBfc14602C4",
-        "Onino (ONI)": "0x667c856f1A624BAeFE89fC4909C8701296C86c98",
-        "Metavault (MVD)": "0x27746007e821aeec6F9C65CBFda04870c236346c",
-        "IronBank (IB)": "0x00a35FD824c717879BF370E70AC6868b95870Dfb",
-        "SoulPower (SOUL)": "0xe2fb177009FF39F52C0134E8007FA0e4BaAcBd07",
-        "Kanpeki (KAE)": "0x65Def5029A0e7591e46B38742bFEdd1Fb7b24436",
-        "WolfSafePoorPeople (WSPP)": "0x685A211c9D96D0C8c9d22b7aE309538d4C69c15C",
-        "Vox.Finance (VOX)": "0x74b4db963738A2A95bFCb1833B123495Ccc220e2",
-        "Geist WBTC (gWBTC)": "0x38aCa5484B8603373Acc6961Ecd57a6a594510A3",
-        "Governance OHM (gOHM)": "0x91fa20244Fb509e8289CA630E5db3E9166233FDc",
-        "Geist ETH (gETH)": "0x25c130B2624CF12A4Ea30143eF50c5D68cEFA22f",
-        "Ethereum (ETH)": "0x74b23882a30290451A17c44f4F05243b6b58C76d",
-        "Mine Empire (GEM)": "0x68EFc4716507709691d5e7AD9906a44FaBCdb1CA",
-        "Wrapped sHEC (wsHEC)": "0x94CcF60f700146BeA8eF7832820800E2dFa92EdA",
-        "BSHARE (BSHARE)": "0x49C290Ff692149A4E16611c694fdED42C954ab7a",
-        "pDollar Share (sPDO)": "0x1D3918043d22de2D799a4d80f72Efd50Db90B5Af",
-        "2SHARE Token (2SHARES)": "0xc54A1684fD1bef1f077a336E6be4Bd9a3096a6Ca",
-        "Partial Share (PSHARE)": "0x8C64D18E9d4A7b8e8c10C5c5a4b8D6D83cb15002",
-        "Geist fUSDT (gfUSDT)": "0x940F41F0ec9ba1A34CF001cc03347ac092F5F6B5",
-        "Geist USDC (gUSDC)": "0xe578C856933D8e1082740bf7661e379Aa2A30b26",
-        "Geist DAI (gDAI)": "0x07E6332dD090D287d3489245038daF987955DCFB",
-        "L3USD (L3USD)": "0x5f0456F728E2D59028b4f5B8Ad8C604100724C6A",
-        "Smart Token (SMART)": "0x34D33dc8Ac6f1650D94A7E9A972B47044217600b",
-        "Secure (SCR)": "0x8183C18887aC4386CE09Dbdf5dF7c398DAcB2B5a",
-        "Geist FTM (gFTM)": "0x39B3bd37208CBaDE74D0fcBDBb12D606295b430a",
-        "pDollar (PDO)": "0xb9D62c829fbF7eAff1EbA4E50F3D0480b66c1748",
-        "Partial Token (PARTIAL)": "0x9486fDA4C1192db69a08CA7235E2E6bAf31B467B",
-    },
-    # Testnet
-    {},
-]
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/250/erc20.json
-ledger_tokens = {
-    "0xc165d941481e68696f43ee6e99bfb2b23e0e3114": {
-        "ticker": "OXD",
-        "signature": "30440220760b9873b5662abd434c0877af05623011c5be70d56348bad149a25fe76c591802207c080ad12c48950a014d94ba210222827dd70f4402a6c479c2d16ec1dcf1faac",
-    },
-    "0xab41861399eb56896b24fbaabaa8bce45e4a626b": {
-        "ticker": "0XMR",
-        "signature": "304402203a2e47a58775e0999b02f086188e7e0a2fe4bd0efbcfb0e04d8b6966fb8ceb7a02204517f6bae641f2aba0d3e28dd63adb832b516fe8af9994eb32279422fcc1cc01",
-    },
-    "0x7a6e4e3cc2ac9924605dca4ba31d1831c84b44ae": {
-        "ticker": "2OMB",
-        "signature": "30440220483523d2ef36e05673dfb913fb0aefbc1f351a8feb7b0d3cf9285a60a1552f930220044989146d988d33f4e9ae86b1c600f5b95ca8f7c5a3d709f7bc3ae5f5e5cfaa",
-    },
-    "0xc54a1684fd1bef1f077a336e6be4bd9a3096a6ca": {
-        "ticker": "2SHARES",
-        "signature": "30440220333cdee9b380f022dfc0b2ab5f4a357dec9ed93e30eee704b92dfb40a8c7943e0220056c5059052ad507395b3f4137776f022b729842d8abec6a00c1c1ba91042e31",
-    },
-    "0x9767203e89dcd34851240b3919d4900d3e5069f1": {
-        "ticker": "A4",
-        "signature": "304402207b36341fca316db5827332013e57e03dfde82f4c34e7071b65a5f4e6e161c3a802204478f5aeb612184bbf092fd2fc13a2f391f07a27d7e0d3204acfffdc9a6d4ec4",
-    },
-    "0x6a07a792ab2965c72a5b8088d3a069a7ac3a993b": {
-        "ticker": "AAVE",
-        "signature": "3045022100c255fc969ae944b2c62365d872778141e17bf9d0085ebc785f5432c55bf631440220598951a1e0b0ef4c129975864ccbec0322fcec6184b9642e4c44506840dfebb0",
-    },
-    "0x513c7e3a9c69ca3e22550ef58ac1c0088e918fff": {
-        "ticker": "AFANCRV",
-        "signature": "304402205bbaf7e5b5e0748d35c1e4b20371dc3e3164e0d4ab951dbaae2c22db28effe7e0220594c225638e2cbda1dc14c6ef48bac1f75d9d7b2a57f6b47abb5b4b73dc6c185",
-    },
-    "0x82e64f49ed5ec1bc6e43dad4fc8af9bb3a2312ee": {
-        "ticker": "AFANDAI",
-        "signature": "3045022100ba93a55d723e530c5756e0cafa554dd2689dbd1b92585f1f11f7e3e36e50390502204f20858ea6869e3440b18c0075981b7cf8e519b386c683b657373bc9a56031cb",
-    },
-    "0x191c10aa4af7c30e871e70c95db0e4eb77237530": {
-        "ticker": "AFANLINK",
-        "signature": "3044022048a3161a91a817df7f2609cace6b37c7f5626c966ad704d08ca62890236ea92502207f2669bddbe2328850ac855423d523b7898901542e48ee007c068b4ba0f6b81b",
-    },
-    "0x6ab707aca953edaefbc4fd23ba73294241490620": {
-        "ticker": "AFANUSDT",
-        "signature": "304402203e8eab1decaf41f710dc7c5522c1888ff037d0b2d856992168fb07e03881d67e0220567b6cc0143e22a0a1fd615263e039dfe6bf0d00d486169cf25ab96bcfe58f46",
-    },
-    "0x078f358208685046a11c85e8ad32895ded33a249": {
-        "ticker": "AFANWBTC",
-        "signature": "304402200370821df1772af314cf5ab1f974abc0e926cfef2c137098c3966a9bc5fc910e02206a410cdb0b8db39e9d1933471d8b38fa2441ef23dfca807164b7128d24c52b0d",
-    },
-    "0xe50fa9b3c56ffb159cb0fca61f5c9d750e8128c8": {
-        "ticker": "AFANWETH",
-        "signature": "3045022100911763cd84c7b2c8c0053e346cbae834f3bb8e47c19905c49b7e0be8f543412d02203656aa280c01591404283bd79b9b7138888999d22955a83a208f77e39c91ea5b",
-    },
-    "0xb67fa6defce4042070eb1ae1511dcd6dcc6a532e": {
-        "ticker": "ALUSD",
-        "signature": "3045022100b9006d35f126f74888f301c63ea7ec82387793a70dbe21e8044f2b171707cd8a0220224c746e05b8a19c4563e4fefa11c5ffdfc1ade1235fed6a3ac45f3cab2f4d67",
-    },
-    "0x38540b4613d2e57ecf190d3486ae6f74591eb8a9": {
-        "ticker": "ALM",
-        "signature": "3045022100ae46181fe1b144f68040b65203880b9a6b16f955a6c3d6541516e8fb36c9d9e4022045426095a350e29aa58a24dfce2a6da46a40307f5d6c5bb51f0f6ee105b01abe",
-    },
-    "0x543acd673960041eee1305500893260f1887b679": {
-        "ticker": "ABR",
-        "signature": "304402207b1a3331382a782461f413c0ac65409c55ad103b6c5407d9812e5ce30cb7e2e70220787e36c3812907b7b853dd7198811721e9b51869d3c23ca5cab52e945b1777f8",
-    },
-    "0xad996a45fd2373ed0b10efa4a8ecb9de445a4302": {
-        "ticker": "ALPACA",
-        "signature": "3045022100ea22e472680d8feaaaee22202b83fa873d53a6a7e225e2e8e6bde443de4ac5bb02207b8957dddfa715c9c536054cc68dfa8d812c0d3c0a0dc719f2daa4d3332a292d",
-    },
-    "0x11eb3aa66fe1f2b75cb353d3e874e96968182bda": {
-        "ticker": "ALPHA",
-        "signature": "30450221008fb925e33a5587e0b9bd6f6fd11e9ee6e3a2383039c53a37869cbe58a41026fd022018f23ff8d1bfbc69bde720b785101e3fdeb3462a544153aebde75a811df1d2c5",
-    },
-    "0xdf474b7109b73b7d57926d43598d5934131136b2": {
-        "ticker": "ANKR",
-        "signature": "30450221008ccd00049251e37dde21b625cf558cb111cf64d94256c0a7ce9eaed18d7a199202203cfa82bd3fc69782b56ab7dcac19c5743ddd45afc958168870d3c1175a99edf2",
-    },
-    "0x12d8ce035c5de3ce39b1fdd4c1d5a745eaba3b8c": {
-        "ticker": "ANKRETH",
-        "signature": "3045022100ecd33b9617b6cf8b6b7ba9e6b3f69e359f68944c0b6d76661839c09ea339613f02207b485555d5ffe7a9bcbabb89cefc168e8350d2e5f3929c4495062e9031527af6",
-    },
-    "0xcfc785741dc0e98ad4c9f6394bb9d43cd1ef5179": {
-        "ticker": "ANKRFTM",
-        "signature": "3044022054673c7be73972f629f7810d599271651fe01e1c205396b577910212a8893a920220600408ddf53bb5d49f77a64cde20a94131a1a37f2090f19acbfe09f1f0b87b8c",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "304402207c66293df64cd77744e0d0a563f14cce28bae20d4a910252d38876e92aad8e6f02204ddddc47e8bbce08e9148d0e1663d2a5794179ef1614536562dc736a49b148f3",
-    },
-    "0xddcb3ffd12750b45d32e084887fdf1aabab34239": {
-        "ticker": "ANY",
-        "signature": "304402201a77bca95de04042c1c37549b36d31606812a097b43292e25afae60475f2bd7002203ec61f75995f6f31f3accc880b837b8ad4618a4ff1ace182c182ad1a150bdd2a",
-    },
-    "0x5e2e2d3ee4944d0e6c0b663625859cf8cc45ca88": {
-        "ticker": "ARCHA",
-        "signature": "30450221009fa8dadcabe5e05fc6ceedb425c91de34d5796865dc39a8191769d3bdd06c7a70220679f61aa15f3d3812a89248140fca3ead6d8aadcb1df039c45c97d471e148437",
-    },
-    "0xd3c325848d7c6e29b574cb0789998b2ff901f17e": {
-        "ticker": "1ART",
-        "signature": "3045022100e1c1e02dd832fde5cc2657c498936fdc62d2ead0b438eb4573bf71bde8798c3802204ddebd59adf49e47aad225cf03478585dd6cc5cca4de839658c9eb29d836bcde",
-    },
-    "0x5b3c1f260e09e653290f24f75abc5e466fd42310": {
-        "ticker": "ASNT",
-        "signature": "304402202baed8b40868f77f3097a721f52c76be54a86e4d548bf0eab412b2cc8d710ca40220141cb9bfed4bad90a59b1b35a989a27aefb558d650c3ccc0d430365fc41ad3cd",
-    },
-    "0x818ec0a7fe18ff94269904fced6ae3dae6d6dc0b": {
-        "ticker": "ATRI",
-        "signature": "3045022100f19b00efaaf52d848d183cf8be82d1906d31bbf0092979018f011963be7cd8230220572b7e288f9b357b16544832289def313e3978d278be597e99ab31e5dd6fb558",
-    },
-    "0x511d35c52a3c244e7b8bd92c0c297755fbd89212": {
-        "ticker": "AVAX",
-        "signature": "3045022100c6bf8d6d5b853b50f8093b2dee23e2b7c298d5fd69837dad951d2e9027d8664a022026c71e4493e12b17ac6bedcd1cce95eca3595901256fbb5879dd490994ceabe0",
-    },
-    "0xfe7eda5f2c56160d406869a8aa4b2f365d544c7b": {
-        "ticker": "AXLETH",
-        "signature": "30440220068e9b8ecd5341f0da53e81e487da973036f415b2aa29bc0c97d0eab2ecb41120220425063ccf66107812ba6471c3359c5bf20d8ac407661aabf1bac6245e563274a",
-    },
-    "0x4b6b3d425f82248996d77ecc3f3df1e500aac1db": {
-        "ticker": "AXLLQDR",
-        "signature": "3045022100d3d9bfa11172048b80b3b321bb21bd0092cb386b5bc32e18a29df069f6c2e11e022051dd3cf49fea97b33da3d0901e6a4a97996e7db72b024cd9f6a0bccdc5ffe5aa",
-    },
-    "0x1b6382dbdea11d97f24495c9a90b7c88469134a4": {
-        "ticker": "AXLUSDC",
-        "signature": "30450221009ff5329274fc6e68cab9b2e31140b7b02ccce7cac561087e254ef5fd51db7d8902202a1a9c7e4cbfd8a19155a5f331a3822c60015cc04417add10b4d01c445e77fce",
-    },
-    "0xd226392c23fb3476274ed6759d4a478db3197d82": {
-        "ticker": "AXLUSDT",
-        "signature": "30440220245a5838e9ab8d8d49c9fc3150a07af7b1f9cc0f4f0371d6d5513fad4a21c6a9022071373a78ab1f989edb1bb8c6020c178ab1aee317ca5e85b65435aa7957c9ef30",
-    },
-    "0x471762a7017a5b1a3e931f1a97aa03ef1e7f4a73": {
-        "ticker": "BABYBOO",
-        "signature": "3045022100f75409d2f185965641a90db37cdc9590d0e13310854db8ed4f2d5dd6fd5ef3f702204db5390fcb93677a0a948c2e87886b6e2aefe6531ba4fe4adf987d58afbb8d8b",
-    },
-    "0x753fbc5800a8c8e3fb6dc6415810d627a387dfc9": {
-        "ticker": "BADGER",
-        "signature": "3045022100d6a0e6119256e97991e6ac3d2dc6b2acda028d8b654d7ec17c08ac5a212acb9202203d4d392a16ed690c56be92d19b61dc9ec433bcf067848931f2cd1a453cd0806b",
-    },
-    "0x1f7216fdb338247512ec99715587bb97bbf96eae": {
-        "ticker": "BBADGER",
-        "signature": "304402201006950b31a93e861350f5e967d550f1537660f1994f1fc696c6dffb6bd842da022067c21f4e72b2dc09268f0567e595362e6d1c462e3d98a82207432cd98f30eefc",
-    },
-    "0x46e7628e8b4350b2716ab470ee0ba1fa9e76c6c5": {
-        "ticker": "BAND",
-        "signature": "3044022000e482cddfeee7ceb73b15778a844faa2add39ba4432fcde37d3c1a762745c6e0220669efbf37f5e80f0c57d2b7b0a30b3005b2db696bb3d7a058f510fdb4c4f3cb9",
-    },
-    "0x8d7d3409881b51466b483b11ea1b8a03cded89ae": {
-        "ticker": "BASED",
-        "signature": "3045022100fbeee46fd4d073eb8ce741465bd9c8762b5b10a05202445e16ce35939c5a677302205eb127170344af990222e359c8eb4837e52fa1ee8f755a6c87da351b498c7e83",
-    },
-    "0x7381ed41f6de418dde5e84b55590422a57917886": {
-        "ticker": "BEFTM",
-        "signature": "304402206d2f35dba4a1ccb578c7e792e42b1630b579f94cad48428c9bd270da3a71742302206f7da54206e9090234257b3547520727003102e1b4db2479fa8a194d1e912633",
-    },
-    "0xf24bcf4d1e507740041c9cfd2dddb29585adce1e": {
-        "ticker": "BEETS",
-        "signature": "3045022100ddf7bf0b6fffde5e1d9352023281d44ffd2b81606fadb8ea5ace2c5738f11fda02201384960da1dfe1dbd04f3ec6c27da3dcf897f5be583201277777faa10116d4b7",
-    },
-    "0x4a13a2cf881f5378def61e430139ed26d843df9a": {
-        "ticker": "BELUGA",
-        "signature": "3045022100dd2012798fac15ed2a614b03a7be2308b8c43f594f9f3836bc69b56fbe551f1c02203ea7d0d29a737356fd50d480d3261e01ece6d7dcaeec344732523bbf5c280a66",
-    },
-    "0xce22c3e95b5e118ea61c4fb9357fe45cbb34cb56": {
-        "ticker": "BSGG",
-        "signature": "30450221008790cf4717866a50a9eb81442d949763968658c3e3a8e47911fa3efbddb30f95022009b5651797a47ab6326243d24cf6d549f81ff5763fff0026fe15ec5d75ccacce",
-    },
-    "0xad260f380c9a30b1d60e4548a75010ede630b665": {
-        "ticker": "BIFI",
-        "signature": "3044022050653e898e1d7de440246f55734ffa6455624f8c33c297bb93b3cbb41be9aa3c02203cc6bb7dc6e198a96d02fdef11a33983738c1b8aa086afaab8e3d3c69f19426d",
-    },
-    "0x84c882a4d8eb448ce086ea19418ca0f32f106117": {
-        "ticker": "BFC",
-        "signature": "3045022100abd136d10646ec7f470b63fcf2713f74ad0367710a7ba88086bf5329a30bf1550220612e30fbdd1604ba752c43c7fd678a05c53a95f9c5ea54764d71c996bfe2794a",
-    },
-    "0xd67de0e0a0fd7b15dc8348bb9be742f3c5850454": {
-        "ticker": "BNB",
-        "signature": "304402207c996f99637699bc8f3fa16c6890e2bb53995c0416e3795cca20cf217bbb1499022035d265616021ac191f52c67a10e9bc3c07da4ed39b3e89a97b00df02430226a3",
-    },
-    "0x75e0eb8e6d92ab832bb11e46c041d06a89ac5f0d": {
-        "ticker": "BIOS",
-        "signature": "3045022100f800c35115a8531dd7c5d44c13aa45f3c7f05f511fb4558ad17115aaf7f424a8022047836923b4fe506b8de61174989fcc6fb76c3b6265719b9184626eb14d84ae38",
-    },
-    "0x321162cd933e2be498cd2267a90534a804051b11": {
-        "ticker": "BTC",
-        "signature": "304402204751cc3f69073607ab71730167faea956e90af0e2c62285bbf023eabc43e1e17022058a1ed280846f384993052eacf2880aa09018134292c2a7688fee04f7a0b0a8c",
-    },
-    "0xb355f4f4cc84a9429a59d5c2b98d77016f7ec482": {
-        "ticker": "BTCBR",
-        "signature": "3044022018bbfd52ed71b27b33e930f4b0c6d6685af05bb1922d34e4da2eb6d06b8ac818022074ad6c13dc63c8e98ea7da1bc78f874eab50218286fb1062eaf842c5b51fe08a",
-    },
-    "0xb5fd949436772e07cbbf35fb6524e79924c54cb3": {
-        "ticker": "BLACKY",
-        "signature": "3045022100edeb03f843e0c7178b4ab7f43c55aa5957da0862a74429d1ef8973474ead5c950220533593010ae7afb19a0645220c71382de4654c48b5666d594861523e00c31d18",
-    },
-    "0x97bdafe3830734acf12da25359674277fcc33729": {
-        "ticker": "KIRBY",
-        "signature": "3045022100a7a2e338187f6d1716415818e64f82a0b0e80d11a85de82bb0b1533b10aafe97022061bb101873748ea624303721b7fe516a169fef3d56019f82cdfb7bd404bebc4c",
-    },
-    "0x4389b230d15119c347b9e8bea6d930a21aadf6ba": {
-        "ticker": "BOBA",
-        "signature": "3044022068a8d67bdee676f99733e0ccc9725f5b494a10d5d9bfd3ad2d3e03d43243539502206ac4fe69852a3e8b2f72f45d7d94982f266ff8d6cd1e2094c486e7cf9e03fc2f",
-    },
-    "0xa48d959ae2e88f1daa7d5f611e01908106de7598": {
-        "ticker": "XBOO",
-        "signature": "3045022100f6b853711211f8ba7c80949a3df5dc522219cb715e23b6125f6f6b5e3010d35202206e44d455617b8508e1e06d2e72fad3b4aecc1964235ee0ed72dc8a7228dca0b0",
-    },
-    "0x49c290ff692149a4e16611c694fded42c954ab7a": {
-        "ticker": "BSHARE",
-        "signature": "30440220603ae1069d2cfbefc2324e6fc146162805b1c60c66a96c0e6bb519005e0c6db10220138493a51ac80e0823f1244453ea19cfe55043407d2eaae1b7ef83ab8426188e",
-    },
-    "0x646481dbd76264f817d6588e289bf08da38a571e": {
-        "ticker": "BSKT",
-        "signature": "3044022041b0a3b0254f1d4ce95ad057e9e669733c2e72df70699ed0923b365c9a94925e022060b8092c73968b67e57b9dc5ad9e3ca8a6403298dd7010252f477e30be7def79",
-    },
-    "0xa6097a4dbef3eb44c50bad6286a5ed2bc4418aa2": {
-        "ticker": "BUILD",
-        "signature": "3045022100e7a77e33f6d23624646a339c8ab78c18d05df9164835e798e45511c7ff5bbd58022065409027f4aa124108c7f6d0075938c74ca843ae3775d6642c50031b25613e7e",
-    },
-    "0x3bc34d8ace32d768a3f76e17aaef2b1d8f261e1d": {
-        "ticker": "CEKKE",
-        "signature": "3045022100bf393ef715aed09c1305968e986af4c0a596306686d9b9c72e652e524d4f85d3022004b03639ccc8cabe2f94cb5309fe58d1ee99f8614fa499d318677f809be1e79d",
-    },
-    "0x2c78f1b70ccf63cdee49f9233e9faa99d43aa07e": {
-        "ticker": "CEL",
-        "signature": "304502210095217c324fdc62e99aae31260c9b9e6aadf2f1a1d7c051a3cda477e969ebeb84022032d641e7412f05a3a127b82c784c7d97580e7518ca20903f69cf11f7c33a7a91",
-    },
-    "0xdef1fac7bf08f173d286bbbdcbeeade695129840": {
-        "ticker": "CERBY",
-        "signature": "30440220103d1496b033edfc8a529474467c326b1ddcd743d942f93f42020057d5f7ce6b022044dbf617ca5fc6d8a5b1ffac8f4e4a523919727bdeffbab318688c4f9141230a",
-    },
-    "0xb3654dc3d10ea7645f8319668e8f54d2574fbdc8": {
-        "ticker": "LINK",
-        "signature": "3044022026b71757fa6efc359d3795fc15912d3052b49c6196d16762cc21cb52c1a358400220390a7e11ff245680e5049d7ec08c515382e7273095601108b5c9b99c3340275d",
-    },
-    "0x248cb87dda803028dfead98101c9465a2fbda0d4": {
-        "ticker": "CHARM",
-        "signature": "304502210090fb8009f8da9e3c17c3e8cd9d11cd1f8f0488c75b68026a9a55dd5eb877a5a6022076cddf98a00d2946b46b6a185cec4c42acc07085233179954bc8527b5a957b88",
-    },
-    "0xe47d957f83f8887063150aaf7187411351643392": {
-        "ticker": "CHILL",
-        "signature": "3045022100f0b2994675c223c622405697ad20a49cd1f05d14d1d9c7bae15891033b47700e022000e3b3439c68b5528c618f9c598d433b8c772260f3f77374f1547fa5604e5c52",
-    },
-    "0x8b8407c6184f1f0fd1082e83d6a3b8349caced12": {
-        "ticker": "COVAL",
-        "signature": "3045022100c95aabb8e24780d0a3af2c9e9b27605dd0f829a38dfea1d23b120ebbe27d8fea02203a08923ead6bcdea42c95ec505b0502f415de9f333ade0f24b6e3db66a4447bc",
-    },
-    "0xae45a827625116d6c0c40b5d7359ecf68f8e9afd": {
-        "ticker": "COMB",
-        "signature": "3045022100fba1dd836688547e80efc91af1f1a07b13043673e8b8e97af926480224c99613022058a87b61e782cd2d489401ac5d5e1a725711edcaa7ea4ee7829f735665606285",
-    },
-    "0xb01e8419d842beebf1b70a7b5f7142abbaf7159d": {
-        "ticker": "COVER",
-        "signature": "304502210099996925679db38a6a96332b8fe07c67de4cc22583fbd9413fa431c5326d562602204938f14fac29fea60b6d9d4cc2f8172b4db789ac9ef437a29aeda9aa436dcf0c",
-    },
-    "0x2ad402655243203fcfa7dcb62f8a08cc2ba88ae0": {
-        "ticker": "CRE8R",
-        "signature": "304402205974d6e92f54e4a79e78fccfd2738ed18e75945e935952a3d6cfd197e8be3b920220780049a8ddede0a3fff7a1e6991c8ed81ecea9388f4940a05d20af6db40ff77f",
-    },
-    "0x657a1861c15a3ded9af0b6799a195a249ebdcbc6": {
-        "ticker": "CREAM",
-        "signature": "304402207c62485acf2b63515f866d356d394329d9d9586a56ca0ae809d791cb380c7ff20220370cfc4da1add43c183d58a83e91422f1346060a288337191d84a6c26592e558",
-    },
-    "0x92868a5255c628da08f550a858a802f5351c5223": {
-        "ticker": "BRIDGE",
-        "signature": "3045022100f6ebc0583da59607d7a5b581841db83dac1790a97fa42d1d291cde8ca35655ff02205551e3d4618022884829f531f0efbf0396fa09afc8edbdf0fe74427a1706697d",
-    },
-    "0x1e4f97b9f9f913c46f1632781732927b9019c68b": {
-        "ticker": "CRV",
-        "signature": "30440220241ba43970c6e4b65f6c1d12b1240a1583887e065e47ba6c06fec5e9c29a96e002204f44f3f0ccede27ab967be63df075c88e7346494a5f0d78fd4b1018e84875726",
-    },
-    "0xaa798bf5ec09b6e3bc059ea4d36d4ca53e063ef7": {
-        "ticker": "CRVUSD",
-        "signature": "304402201c65ceb4bfb006f115e63f186cccc1c3d1d94d517ea357e76998fd47ec602a3e0220207c250e617b0a384a4e6a32a729a4f0a63374be84a605d0d0a6e49762e5dd49",
-    },
-    "0x6a545f9c64d8f7b957d8d2e6410b52095a9e6c29": {
-        "ticker": "CFI",
-        "signature": "3045022100e965fbade9aefda27ecf62a3cc2bf328fa697ff329fa225685524e5188157d340220431c278e0d66249c5c66b4d6989fd61a13d563a9572748a58503319261074264",
-    },
-    "0x8d11ec38a3eb5e956b052f67da8bdc9bef8abf3e": {
-        "ticker": "DAI",
-        "signature": "304402204aa90e76e28f486cd7d1e42a8bd658f9aefab39cbd753a01b5f4bb9afadd8def0220798b1feaf8f71c8f9b7e50ad9349fe06f7188e95b23b4d36ace609468d1c3c39",
-    },
-    "0x6cc0e0aedbbd3c35283e38668d959f6eb3034856": {
-        "ticker": "DKNIGHT",
-        "signature": "30440220496782dd6989b463779dbe780ca711feffe69bda14857f1e4616a67e372f7448022074ec91f16b6d817d8d9cedaa61d17b9e23f3dc9f496888d21ed31696fa1acd96",
-    },
-    "0x90e892fed501ae00596448aecf998c88816e5c0f": {
-        "ticker": "DMD",
-        "signature": "3045022100adbc79dbdac022966b28819dd43c39e192b7b284056cd4cfa2d630c0d3ca308202200f50bbc3d0cef0ac2fc6595a88fa2c5798c8a73d84d5d22bb3eb5b21585093b0",
-    },
-    "0xeaf45b62d9d0bdc1d763baf306af5edd7c0d7e55": {
-        "ticker": "DEATH",
-        "signature": "3044022077ebf8157a33b0546224e87060603728e8cfb7a43a5558b77e77bdadf9f11399022012bcdcfc3dee261de27df6cf26ce93a89bd6b108ba0039fd0ab31fbe73f4f156",
-    },
-    "0xcf799767d366d789e8b446981c2d578e241fa25c": {
-        "ticker": "USDD",
-        "signature": "3044022001b77045f1e3f344108d9a7c8073c2454efe99e9e4dc7a7f154b5a358ef93df302201f131b76b996297bc34f98a9225a299eb92accb13dfec5eb74c831332c1c562a",
-    },
-    "0xde5ed76e7c05ec5e4572cfc88d1acea165109e44": {
-        "ticker": "DEUS",
-        "signature": "304402204cc254bb54ed9ec044a36a31c25475a271c7ac5868bbf8291b766dc4e972a1f402203ef0e42912fad4f30b2d794223a2fdde48b25ab68f6f6b77e3a7c53b008815dd",
-    },
-    "0x174c7106aeecdc11389f7dd21342f05f46ccb40f": {
-        "ticker": "DEVIL",
-        "signature": "3045022100a3c721fb2a9450705acb3f58754fbc93a03ffa5ff09e34328f0b46a3e59fb9b702204651f2a276dc1f6eab69a45f1e8adf5ebcb7c0ce5df2e128122730c2892e3e67",
-    },
-    "0x230576a0455d7ae33c6defe64182c0bb68bafaf3": {
-        "ticker": "BRO",
-        "signature": "304402204c2fdfa6b874ac4a97626317d8040a18510c976fb0ce9bf3ea06aed3669bba7e022020db8c52c0fe6ab667d3665232d3b0f1d94d13cd594d4080662d70b38cd0e3b3",
-    },
-    "0xdda0f0e1081b8d64ab1d64621eb2679f93086705": {
-        "ticker": "DIAMOND",
-        "signature": "3044022035582cd1d5089145b516714f4adc055a71b078469269c81015fe2881fe7fb8ec02204a308c9b279cf440d0407d433afd9fcece9c8bed6698e70b5329fb98367fb999",
-    },
-    "0x3129662808bec728a27ab6a6b9afd3cbaca8a43c": {
-        "ticker": "DOLA",
-        "signature": "3044022038df5f187a9545ebd1f5e3c08d8c6b74eacf7ff0bcfc522e40f7989745f945e3022065bf6cb7097451c069a7f20c6ae435fbb8017b69b75a3974460c631cfd93e348",
-    },
-    "0x6e209329a33a63c463dbb65ae2d6655fe5c98411": {
-        "ticker": "DSHARE",
-        "signature": "304402204de224c078dbe22c651906f854e79d2ef268a55047c0a2102c21c259ef0f34580220462c11b935889e8271ba8aaa6746426ff8531a69c677a0f16176d2a219418dca",
-    },
-    "0x25a528af62e56512a19ce8c3cab427807c28cc19": {
-        "ticker": "DSLA",
-        "signature": "3044022010944932c88f2a994763ba22bc989a133fa063d79a58cede0811a83288acfadd02201f20ffe53b2196f08467e59ea6861fb5db650fed51778a84f73cf31d5bb7278f",
-    },
-    "0xeeeeeb57642040be42185f49c52f7e9b38f8eeee": {
-        "ticker": "ELK",
-        "signature": "3045022100bed7e1677b471b23155f9548bd82431c695aa6d8d5c9d32d33283c37787a33d702207f532c980b238592d47a44f6ebb69a2886c20b8d7a761125e138cfdf33b3fbe3",
-    },
-    "0x3fd3a0c85b70754efc07ac9ac0cbbdce664865a6": {
-        "ticker": "EQUAL",
-        "signature": "3044022023b52df38d823faf11fa8318e46e7e67e609da7f86f15d9e1a39c4a8d8310a3b022025ca70db2c7ba72cee8dcd60044c46dd684163ba4b4c7e4d8d00f7317f082832",
-    },
-    "0x74b23882a30290451a17c44f4f05243b6b58c76d": {
-        "ticker": "ETH",
-        "signature": "30450221009c7b3390dde18a136a49bcd325aef6e651eea558089b0834d363a6cbc0d8a3070220207bbf8110a84e05b837ff7d0dc1363371ebbf2d519546692ca7bf45ae67d361",
-    },
-    "0xce1e3cc1950d2aaeb47de04de2dec2dc86380e0a": {
-        "ticker": "ERN",
-        "signature": "3045022100ff5e1da467756e1c2ea253b2f51f60ea518f71730b97c92bf6e679aaff694ab702203c6111dd4ffc17009c8633f71fa3c1715a47c4d86e64a5eee2c9fd927751c2c3",
-    },
-    "0xc17c30e98541188614df99239cabd40280810ca3": {
-        "ticker": "RISE",
-        "signature": "304402202310e3c7ceb86ac8757a2edd2cbe1ef2c9b65423c3d12e89587f4e4a923bf4d602200a7e03f10ef07d4b0410e871e87a6c9827a95ad67197325e197de36880843e19",
-    },
-    "0x6e99e0676a90b2a5a722c44109db22220382cc9f": {
-        "ticker": "EXC",
-        "signature": "30450221008b22fcc23669625cb5e26d0d51d1504a9f90376e20539dbeed3a3ce7fa6b4181022055fbc759b52d9722b35ecef59ce68ed036a34ec051ecc9e82613b270bee9975a",
-    },
-    "0x904f51a2e7eeaf76aaf0418cbaf0b71149686f4a": {
-        "ticker": "FAME",
-        "signature": "3045022100da44c786269f5a220b4e0ddb40c5aa30a20db603894c9dd14d7b131bdded1fdb0220417c8079b5c00e25db59c053b2c340fe7fc9a8ce98574175b3f50c77cfb9f985",
-    },
-    "0x49894fcc07233957c35462cfc3418ef0cc26129f": {
-        "ticker": "FANG",
-        "signature": "3045022100f7270ed6adab0e2ba1cd3a14e3fcbebe64f1326e1a27d1e43be6a6a8584b281e0220374ee917fdf9d323ba2222833fe1435f9632e1510293750b07999b2d2f9c5497",
-    },
-    "0xfa1fbb8ef55a4855e5688c0ee13ac3f202486286": {
-        "ticker": "FHM",
-        "signature": "3045022100afab8ec0b681f359c8504ab79d175500f0f542f1c90e6ceb0df4c1ab292086cb0220559a1642791a8a66ac289fab64cf2faa97251351f5ccd1a4145d425f6f1a27de",
-    },
-    "0xe83ce6bfb580583bd6a62b4be7b34fc25f02910d": {
-        "ticker": "FABBC",
-        "signature": "304402205a8960f39b380f636e4db862a4df5b6ad80dad1be1370b9ce1644462f294bcdb0220097120772a734506b189022dea9ae655a559aac0fd389cca78a35cbee8a8f3c1",
-    },
-    "0x74ccbe53f77b08632ce0cb91d3a545bf6b8e0979": {
-        "ticker": "FBOMB",
-        "signature": "3045022100c15aa099ef8e58f8856e6f2dd44b7970bb058f30801ddd73ae6ab4c5b016c48702206c2091af54e441a0a9effd5a933e1c90e8b0a72e66db5923793e57faaebb9ef5",
-    },
-    "0x1d43697d67cb5d0436cc38d583ca473a1bfebc7a": {
-        "ticker": "RIP",
-        "signature": "3044022024fdf2fd5d9b2d18d4b2eb2f025bd998dcbb589f03e43dc92a656e0734f2f525022055fb77c6630211d62799cabd5a99f991450fa1110d98c4baef0af271a1bf92e4",
-    },
-    "0xc3f069d7439baf6d4d6e9478d9cc77778e62d147": {
-        "ticker": "FLIBERO",
-        "signature": "3045022100e504ab7c4c8ff246eb5d65062ab92d40bcbc118c9b46d28c4200c8d4335475da02201131a969c4ed598bdf799298e033d635af7e31993a1244e9f8d9dfed69574005",
-    },
-    "0x1e2ea3f3209d66647f959cf00627107e079b870d": {
-        "ticker": "FBUX",
-        "signature": "3045022100ee12df0cf19c17ad667c8758815ad3f5fb064c311d36660fc037729700300677022075d2d7dee9b4e776615589cbc38ef81fe7b141f8aabc4eb9a3e1b1684c997ec1",
-    },
-    "0x9bd0611610a0f5133e4dd1bfdd71c5479ee77f37": {
-        "ticker": "FTMO",
-        "signature": "3045022100fb7a00f0af0817aaeaf9a69d7efc4506fa5d3ede894a30fc306451707fcdfcd402204e93d34370ce1451943ded7eb9c3c45cf56132834ccfad68090b4d24613023ee",
-    },
-    "0xad84341756bf337f5a0164515b1f6f993d194e1f": {
-        "ticker": "FUSD",
-        "signature": "3044022007a6bad1b0f329e37224bd19ba3a0a42b81a0f2a0f099c95dcd0389ed98aa9de02206fc0390b16a7cbd74df5e3e5bea39c9eaa1979256de29d0a94ebec1bafb8bd26",
-    },
-    "0x05e31a691405d06708a355c029599c12d5da8b28": {
-        "ticker": "FSONIC",
-        "signature": "30440220261ec1d616dd474a39636135498b4d90f273bb1c3f18e3133130aea0e99016f702205e84a5aee84d71b8de17629dc8e757b32c295388c66188795e5058353116d724",
-    },
-    "0xc758295cd1a564cdb020a78a681a838cf8e0627d": {
-        "ticker": "FS",
-        "signature": "3045022100a086a5a32d0078ecbd247b41e5cb6e0890607838c86a423a81c1ba6d44960e4d022044b5f479f2c33643880720b63c8e9d27543c18e6be5f764f467982f548e019c1",
-    },
-    "0x07bb65faac502d4996532f834a1b7ba5dc32ff96": {
-        "ticker": "FVM",
-        "signature": "3045022100e1b182e8769f831dd2dc5f9cf48a6cc93fcb8481dd3186cbedd2b2acc25923070220044435b022c556c4964e45979a029e535a720228bd0ba220ac3bb13a9192aabb",
-    },
-    "0x078eef5a2fb533e1a4d487ef64b27df113d12c32": {
-        "ticker": "FBAND",
-        "signature": "3045022100ef795aab0706c8785a1b0525f68f282184c0448c48cbb910525f0d9cf0c3188702201889c116160110d6e1b48fb861697269921660b61dfe4600dbe410e2bdde38ea",
-    },
-    "0xe1146b9ac456fcbb60644c36fd3f868a9072fc6e": {
-        "ticker": "FBTC",
-        "signature": "3044022027157e97c1190fb6058356c4ef9f2585686b25de36aaf5be20d9c31b1829b9eb022063bb23bd6df939b2730f971c5b881c382bcdf1bd65e88a57e60a233434f95efb",
-    },
-    "0x14418c22165553251b002b289f8abe4d1ed41d76": {
-        "ticker": "FEAR",
-        "signature": "304402202ba1ca0cb44d1ec5077716d17c523330b41d182bb3154eb985ccbf5deb22913c02202fe8d2e1cc32cc5c8ccb6d70366ba1f882847e0515bb1501a41ca28fdb4234d4",
-    },
-    "0x5d5530eb3147152fe78d5c4bfeede054c8d1442a": {
-        "ticker": "FEED",
-        "signature": "304402203c6d31c93b44830d8bef7f260b782612b4887a9e4c2c3b6aeff24d02c469b667022068d7e9959ce4ad225542051599398c30d85b03d79496a09b2e8472843ebb1303",
-    },
-    "0x658b0c7613e890ee50b8c4bc6a3f41ef411208ad": {
-        "ticker": "FETH",
-        "signature": "30450221009c85dcac74b979a43ead2bcc946cc846a7879ea295f64926ae166b6a2a222a39022068286503790f458ab70360a749317a36708322563da064b680245c72e4264328",
-    },
-    "0x8b7007e1d02d8387b7b4bc8c6172598780ae59b2": {
-        "ticker": "FGHST",
-        "signature": "3045022100f796446c3ba4b266107ff5f936d768853d8a38c60300179592ed1eb5632bd4e402203978448e8245a132ba8b24e96df9660626c42f2b8c9a19c9ebe3a6ba3bb3e439",
-    },
-    "0x049d68029688eabf473097a2fc38ef61633a3c7a": {
-        "ticker": "FUSDT",
-        "signature": "3045022100a907f35805f1b9f2a43714865a2f1fe742f1fac30dfb0c7245b0022c9c9cd2ff02206b879f3a549f2d7c604e73c17dc8e48952e42600b3e06def7edcd0f74d80c906",
-    },
-    "0xdc301622e621166bd8e82f2ca0a26c13ad0be355": {
-        "ticker": "FRAX",
-        "signature": "304402204d596e207be4efa182fca81b6b9ee06f6231d183160f29488d5b3b4c4285c1140220446b94e4b527182a223b2a8ab49f5bfb0c60638c4d24ad1be4d928cd6e5a8a05",
-    },
-    "0x9e73f99ee061c8807f69f9c6ccc44ea3d8c373ee": {
-        "ticker": "FRXETH",
-        "signature": "304402200db3073c52313dbffaaf8528dcde3745e0f8fd65a0171080d654fda567d8385c0220118c1538215de6ee392246b7ce70ad4b69aafa78a59b85156dd271c2ba88448e",
-    },
-    "0x7d016eec9c25232b01f23ef992d98ca97fc2af5a": {
-        "ticker": "FXS",
-        "signature": "3045022100f55cfbb28f72ad805c500b97a49c6aa8f9bed6e0545d6f4d364eb574a8f7c56f02202cde16c6cbb0c4dc3a6ae4374eb9021a90825ac05bb9d8c07fda8572c5b51d69",
-    },
-    "0x5cf90b977c86415a53ce3b7be13b26f6abddfee2": {
-        "ticker": "FTAILS",
-        "signature": "304402207694852de2a3238dad3ba18519aaa427b108c976e151896cf06691494b4da1e50220100b62eeae79cb1f805857f64f17f59f46d66e3b9227d591c50804b19cf44af9",
-    },
-    "0x4d9361a86d038c8ada3db2457608e2275b3e08d4": {
-        "ticker": "MESO",
-        "signature": "304402207666ef401df69605994bd868ed812d85f020f29c2be8d314a913e028ba6584b202207365d5fda769321b4c0ddace68dcccb8c4d33236235754e59e90d3d21e5b7a32",
-    },
-    "0x50eb82cc284e3d35936827023b048106aaecfc5f": {
-        "ticker": "ANYFSN",
-        "signature": "304402201b08ea82cfd681d19510456a4ba3328afccf5f00972e6702ece6abdb4978a2aa02207d381f9c5ca5b3cdea10182f0ddb37743e272d9a1e1027766821ddf0a96c3621",
-    },
-    "0xd8321aa83fb0a4ecd6348d4577431310a6e0814d": {
-        "ticker": "GEIST",
-        "signature": "304402204fc7b3afb95030a7f0fa8c9a135134d7ee1a2ccc7790e84a74bbbc156df1689c02203fd1de5aa6eefa656f8c1d19054b019c8f71c41055af1fb0ee734002555c64d8",
-    },
-    "0x07e6332dd090d287d3489245038daf987955dcfb": {
-        "ticker": "GDAI",
-        "signature": "30450221009d64e12dcd171d103472c3878317ecc567f001fdc843bf0ff5c514596fae9383022025fd2ee2be462330b8ec74e2b8e8f7846c906767e55c873f3044772e35e37e02",
-    },
-    "0x25c130b2624cf12a4ea30143ef50c5d68cefa22f": {
-        "ticker": "GETH",
-        "signature": "304402201ff00892328745c7345b7bf88353b1035bee430d015e7438c38deb782a712cfc02203544e672d684ab4db89fe932033e320589c098391bf1491c344c493b9a813633",
-    },
-    "0x39b3bd37208cbade74d0fcbdbb12d606295b430a": {
-        "ticker": "GFTM",
-        "signature": "3045022100be8bbddb6b3dec87868d0e52790da8be134fa2bd7b96e6e3261e2427b5a531fa022031e82c5ed33d195548e341b8b873427e00f572a165ea47de5517d1c2ebb5a562",
-    },
-    "0x940f41f0ec9ba1a34cf001cc03347ac092f5f6b5": {
-        "ticker": "GFUSDT",
-        "signature": "3045022100a761c550b42428688d516ac6c28bec830bedd5174dc5aafeb12cca430ff514930220696afb0f979d797759642bc757e7e973b2a2567f18a0c4c33f13505b11517162",
-    },
-    "0xe578c856933d8e1082740bf7661e379aa2a30b26": {
-        "ticker": "GUSDC",
-        "signature": "30440220295aa55bdf6a982695026570ab31f2516a6bae65dca233a3b78d6fa5f9a26ccc022016bbd11cd764e380a671eece36a5953ddd84e1d4f80383d280c79ef9824dc7ca",
-    },
-    "0x38aca5484b8603373acc6961ecd57a6a594510a3": {
-        "ticker": "GWBTC",
-        "signature": "3044022002949acd92fefc970dc170362c5ceefb8de1d0e4bc2f659552f7f4a7f8e299600220590b7286d5b6c40079b2be24307c1c69c5cbefbe1a3948af611a031925454afd",
-    },
-    "0x15b7c0c907e4c6b9adaaaabc300c08991d6cea05": {
-        "ticker": "GEL",
-        "signature": "3045022100ba5c75cf3ad9e62f857b5c9d388f9abd6342f61a731ab94ed877cbfb0300d71602206a6c81815c1d850a1c10ff9321a2825b955a34fe8445a66646d52447f392455f",
-    },
-    "0xd121c2d34ae2a5a415dc5fc4f898b084643dba78": {
-        "ticker": "GEN",
-        "signature": "304402207ce5d30a35eeb114b6ab9ee92008a4eb269ae51a81c35f1d0ab78a60dd4f30c0022039200ba193d88d5ea89dad8701b03d72a13df02939c197e7a0fa1fd7b17cd3a2",
-    },
-    "0x91fa20244fb509e8289ca630e5db3e9166233fdc": {
-        "ticker": "GOHM",
-        "signature": "304402202ebdf7f5928cd91c3212b3e3228e74413a6826d3008137e1a9721826cc22497e02202134e3d62bf441c271237960f38124eda98726d76cb1ee77cc242717d3bf41e1",
-    },
-    "0x02838746d9e1413e07ee064fcbada57055417f21": {
-        "ticker": "GRAIN",
-        "signature": "3044022052912ed145a9f8e2bf2e7f7bb8ab232718fff3f84b2ba3e2de3b0df66880fff202202d58bb778eabcc44590fc9b1a35d5833168250705ca9340cfd1f23d248063ac0",
-    },
-    "0x7dd7eaf5872e260f35dc60a54e0f25193128c765": {
-        "ticker": "GRAPE",
-        "signature": "304402202bcf90851eb9e38a7026ab8e16d58c6cef31454f3973ab3581e694efeafb5b100220323a5205d7ed141d520fed9fc13a33b9318d8f6c8774364ce3c25028d07f4e89",
-    },
-    "0xc1be9a4d5d45beeacae296a7bd5fadbfc14602c4": {
-        "ticker": "GTON",
-        "signature": "3045022100b96d781e1339a82e8c7288521c4b7c5bacea4442dcaca4a9973ae4d21d061d9f02206327b4841dcee264b23c31ac3cd13b153a3f20dda78965a61e0b252ef0c26ec1",
-    },
-    "0x0a77866c01429941bfc7854c0c0675db1015218b": {
-        "ticker": "GRIM EVO",
-        "signature": "3045022100b5fa47c4f229202459318906eeca73e243171e238fe2972ecda6e54f5fd256a50220046f58731856e5d8d8172c0cca1b5c2b7f22197be858825c0f8ed89e41a5e3c8",
-    },
-    "0xda599495d48846e5ce3c82b56842d9a277973688": {
-        "ticker": "GRIM",
-        "signature": "3045022100c5c073557ecbd7fe8d125b6f67c40f6cbc0757ea3a6b3042cd7ae316e7e92ab80220698f0a6f9cf1e01d811a651ef493169434be6b0c70b4e373672c6d2d767a6243",
-    },
-    "0x6ab5660f0b1f174cfa84e9977c15645e4848f5d6": {
-        "ticker": "GSCARAB",
-        "signature": "3045022100f89bf977dfdd01e3f57494d02b824de70117a4a215d4a4952875c1b6aed46fe102205a6262888209121644065d71d94766709ee05743abf7051624ee573386603b3d",
-    },
-    "0x5c4fdfc5233f935f20d2adba572f770c2e377ab0": {
-        "ticker": "HEC",
-        "signature": "30440220012c7c6b8d623f9a1daf8f3eceb1370fb8bcbd754b69792a87dcbfbb9faf3711022006fc61d6bcdee46d64f5f7994b967543927e389326e910139420ab1e54dd1d79",
-    },
-    "0x44b26e839eb3572c5e959f994804a5de66600349": {
-        "ticker": "HEGIC",
-        "signature": "304402202f4c98cb89dfe8d21e860a1270231414bc70e3dbdf51ca100653dc78ca5bfd7d022024787376e7aec2512bf317a27597009b5d2f2344a8b414fdf8c2dcd26e085f39",
-    },
-    "0xf31778d591c558140398f46feca42a6a2dbffe90": {
-        "ticker": "HOGE",
-        "signature": "3044022053392df81b9ac4f390de7c7b6d6a91b633357a5617ab2229f21515f197cc04cc02207c287527792bb88db9ce0072bf70f8e8ae94b988e409ac698c80b4913d503a1d",
-    },
-    "0xf43cc235e686d7bc513f53fbffb61f760c3a1882": {
-        "ticker": "ELITE",
-        "signature": "304402203969555095e4f9c54f910e4352f331037728c6dea1e847a898dbbcdbb09dfccb02203832186daa1f5733dc1d5dabd397619de60f2fe6e947d288d554d406ba0b0285",
-    },
-    "0x10010078a54396f62c96df8532dc2b4847d47ed3": {
-        "ticker": "HND",
-        "signature": "3045022100a4ccf586d20ff42787728277ca677b852aeb7a4e706515485bce77a3515bd86002202bcf5f1a0f9d806b38bcf2a39a28432b32bc46547e84e4047f64c77b6993952c",
-    },
-    "0x90b89e881961e1053aeaddba13217d56f747349a": {
-        "ticker": "HYVE",
-        "signature": "304402200525e5444e135d82945abc10c3e025596872fd8b966dfef515505d05624847d202204fd126a2c782b3d4bad0c7ff2530e36fecefca835d1385b0e5c9d317f9bbbd4b",
-    },
-    "0xf16e81dce15b08f326220742020379b855b87df9": {
-        "ticker": "ICE",
-        "signature": "3044022001e0afa3886220e5311758e962f44c1176804b10b1885e2e8f6157bc0087f8f402202d48f5d2d9b33f65f93745221ec3beabdf11aaf6d72951de659102a458f4188c",
-    },
-    "0xffabb85adb5c25d57343547a8b32b62f03814b12": {
-        "ticker": "INK",
-        "signature": "304402201e6cc04d5beb54f486f31cbd8bf8cc6917ef0932441b5727056a24817af94f1802206c2a83d62ad932ff8d778e8fac672f9cd2e49294aaed46756c8c2e5869e73992",
-    },
-    "0x8bb93979901cd159bf6763b223fbb315c31ccf7b": {
-        "ticker": "INTD",
-        "signature": "304402200dec3c4a45d28bbcbbd66e7ba4299115752b3ac60e2cb2f3d03850c77decd842022049c9c95c769b26b19e98508d5db35ee82a4124a24b832ace07617f229b293d6f",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "3045022100a339c8373f80dc347694b790503e608656e0b7cf7b3473b23a75de651d39cd1d02204974447b194ad9913c9d8e1c109094e9cde726255f2fb18033b0e681074bcdbf",
-    },
-    "0x260b3e40c714ce8196465ec824cd8bb915081812": {
-        "ticker": "IRONICE",
-        "signature": "3045022100816386541b0f517bd165b5710be983b72f15e6e6e9fc39ad684cc9912eef46b9022067281f7f0c992e854cb582aebb38984f2624877cfd6c25d12791fb714327436a",
-    },
-    "0x00a35fd824c717879bf370e70ac6868b95870dfb": {
-        "ticker": "IB",
-        "signature": "30440220525b7e58758f0955628fb1ec5b9a9295a23f6d70d166b8dd3ed005474816f8de022058fe412fb68705c8bdff04b4e7e8879bc49e4def84b95f63ca7d9754a7af0a32",
-    },
-    "0x5b2af7fd27e2ea14945c82dd254c79d3ed34685e": {
-        "ticker": "JEFE",
-        "signature": "3044022002d4fa902962a1d7f0ce94b629fe6b99a2bd55d2146ad108d17edc7f1e75f2e402205d2b5d64c7140d371f84a7aa21cdef55a2cd6e9a7081677573557859841c08a8",
-    },
-    "0x4f851750a3e6f80f1e1f89c67b56960bfc29a934": {
-        "ticker": "KALM",
-        "signature": "3044022000f573ff5ea7d090a498d1eb8dac3f2bab255ca0b95468489c02aded992902a702204304744fdbf4ed46f419c7207e626e7949e3d707ca534600937102276de6d498",
-    },
-    "0x65def5029a0e7591e46b38742bfedd1fb7b24436": {
-        "ticker": "KAE",
-        "signature": "3045022100a3576e8090748a18c8cef0cce64f029dccf49dd2ad96ea7bc3675c3d8f33547c02207f69edac3614b73351dd2c6447df77343ed9684dcaad3cd154f5dfc00a1668e4",
-    },
-    "0x2a5062d22adcfaafbd5c541d4da82e4b450d4212": {
-        "ticker": "KP3R",
-        "signature": "3045022100c349484869a954e137f642c2f6ae63dafeea6ff8d8fcff5e5fbed626e92983e5022025d1d51d8b12dd351cb4d16cd68daf334d93951dea5087f2192f51faf769a4eb",
-    },
-    "0x1e1085efaa63edfe74aad7c05a28eae4ef917c3f": {
-        "ticker": "KNC",
-        "signature": "3045022100ee11cc62bc0e5ff8e5d5dc53c03a859fc49ca81aa31f5eed65a1a98e79b5cf1702201d91e7c64bd4d764bde912e27ac3ab08e2feee6e58687afdd182af91edf9d701",
-    },
-    "0x5f0456f728e2d59028b4f5b8ad8c604100724c6a": {
-        "ticker": "L3USD",
-        "signature": "3045022100ed4a1d89db3627bf97cef69e438443d02c55d066f814480560a45b5addeb002302205131e8ba8c8ebac1053ef3af90ee2605d6728191a44a16c09fcb1ccf61de8258",
-    },
-    "0xf8a363cf116b6b633faedf66848ed52895ce703b": {
-        "ticker": "LEVL",
-        "signature": "304402203e513cb908f062fbb58b611c9a99ae024a1fd474a086d3d8ddcb1f408d003b9102203fa05c36334ab35103405ade61dc8f9f7ad1272ce48becc7054ef0f31e9a0253",
-    },
-    "0xbf60e7414ef09026733c1e7de72e7393888c64da": {
-        "ticker": "LIF3",
-        "signature": "3044022068b918748efb73dd53c97ec7ab8e3661506cb1e8c721faea9acf245c01613e79022004d4e593363338e7e541c8e3566d585ab7af444540797a45c746ee1e785fbc57",
-    },
-    "0x33333ee26a7d02e41c33828b42fb1e0889143477": {
-        "ticker": "LIQR",
-        "signature": "3044022070f4b1d9d5a3baad9333800462fef17bbff0f662cf4743c0fb66944df55970ec02204f9d3009d4085c7db30eca52a4e0a88ed293c910a2282c035a69e9b65ed869b8",
-    },
-    "0x10b620b2dbac4faa7d7ffd71da486f5d44cd86f9": {
-        "ticker": "LQDR",
-        "signature": "304402201d64cc0951c639628776181b8aefc3349273667421882aac30a04ba16ba413f6022079b68bae75a570868b71f3c46cfd1fe6d58a533f33693116886e2baef4a3f2d9",
-    },
-    "0xcbe0ca46399af916784cadf5bcc3aed2052d6c45": {
-        "ticker": "LSHARE",
-        "signature": "3045022100ad50b275d1e756b3158855fbddc40e84190a777a06254f717830219f78918a5e02200c9e90976f66b49094c67db562f5f0f0a5dc58d701601cfc4b1f9af86ed939ec",
-    },
-    "0x82f0b8b456c1a451378467398982d4834b6829c1": {
-        "ticker": "MIM",
-        "signature": "3045022100f7a0dc844bbb86b576c341b78031fa080b95380f697da92a432e602bdec527400220056f0ae88df36b907d681d7ba64e6776d0e05e2330e09d17b1d862e80abff835",
-    },
-    "0xe705af5f63fcabdcdf5016aa838eaaac35d12890": {
-        "ticker": "MCRT",
-        "signature": "3044022069e8fe20bf3d867440184dceff0a9e9b2a0e158b7ec19584b65dc587281830bb02205714dc33c9c057eb61ee4e966f3128f14dccae20b50d898ded4a155bac15b941",
-    },
-    "0x87a5c9b60a3aaf1064006fe64285018e50e0d020": {
-        "ticker": "MAGIK",
-        "signature": "3045022100b89ffda1395124995a0cf78ad379e5fb41d211f8b5067935e72d1b80340867d3022019735c550c0454129ca08593885fc5cdaa96877024f22f1517f9c65f2f8bdd54",
-    },
-    "0xedf5e2ac09002094cc51b597cebe58c70182adc5": {
-        "ticker": "MAKI",
-        "signature": "3044022036b36dea2265b1c1f0cbd4cb9e10253a48e3acf8f49e7c4ca9681686fa41ea5d0220716ce2f9ac505241956980cfa47036054ae81d95acb06dd0339f703681020ea2",
-    },
-    "0x8a88b501a68cea5844b9d95f41892b05c4cd1d73": {
-        "ticker": "MAN",
-        "signature": "304502210083fa45b53deb2933edbf5cc694e83fa38b46af80753dbfc2a8c2a0d930ccdc0502202bca37085f1d222a6a5558de46fdf9307204d3379b7bca2afa534bcae1fb67fb",
-    },
-    "0x40df1ae6074c35047bff66675488aa2f9f6384f3": {
-        "ticker": "MATIC",
-        "signature": "3045022100c431acee8b51306aa0ab2e383b38121ee9ce1054fd7f2626223d22daec64d3cc022067208b313ffa7aa9b9596af935ae22b82532c93c9b37b23bed7d0423cfbe966b",
-    },
-    "0x5deb27e51dbeef691ba1175a2e563870499c2acb": {
-        "ticker": "MCLB",
-        "signature": "304402207e66685180f4501e52b580d5cf7130ca7ea31e42cdd50dcaf046ed001ce94fcb022049e9c177346af4af6f0705c9e88d77a200a7e847e66743ab328ecbd7a0c1f24a",
-    },
-    "0xfda8355e8ce22ac44f2d175f4acfec8fac7472d7": {
-        "ticker": "MGG",
-        "signature": "30440220394af3c7aa81c8cf8be317b25ab29789014cd21830a80b6a041028e41d178c1b0220437b3ca4b7018ecf18df1f74421131dad3646b973ca59456aeb86a80a621556e",
-    },
-    "0x27746007e821aeec6f9c65cbfda04870c236346c": {
-        "ticker": "MVD",
-        "signature": "3045022100fcedfe73d777bc67e6d4b0d8a03bf7ddd67295287abe06aee21af17e4bb93f20022072a720b9b9a532d501e4695e86257742985b7aade68da8581de68c149ce30f1a",
-    },
-    "0x42ae8468a1fddb965d420bd71368a87ec3a2b4b8": {
-        "ticker": "METTI",
-        "signature": "3045022100f9510c2a34a6b3a0506dbc75ad3c091aefb5716e41281e699782c303908cc554022035b274c8abe20f359d5485fe79ed24d3ab1843f662fcc018d81fc8a4df17ab88",
-    },
-    "0xfb98b335551a418cd0737375a2ea0ded62ea213b": {
-        "ticker": "MIMATIC",
-        "signature": "3045022100de88e4ac7b044944a68bcb18c07fee6ae7d8481cbf3e11a0c40e2cc44329aaa2022075c85b306f06ceeda7d11f8626fc9aa3b96211f0ebbd687639b3741625339b9c",
-    },
-    "0x1d1764f04de29da6b90ffbef372d1a45596c4855": {
-        "ticker": "MIMO",
-        "signature": "3044022038cf2cc97e6baeb1b8c34b0c28d983b7b4c64ed0062218157379a8f20ec91a350220120efe550e9712a714183ae8c4774c7c47fd13d0724dd6e4e5795ef1101f7a48",
-    },
-    "0x68efc4716507709691d5e7ad9906a44fabcdb1ca": {
-        "ticker": "GEM",
-        "signature": "3044022100b7b3ad264f2be74c05c86405233ac423a773f008e600acaaf2d7c680ebe9fa20021f46092765fd511fcde659178adec9e6e6f2167f48bd55aba9b3e96dcde196fe",
-    },
-    "0xb011ec534d9175cd7a69afbfc1bcc9990862c462": {
-        "ticker": "MSHARE",
-        "signature": "304402201055e0a8678a23376af9bbfc8db6d4793dd846e33e4fdd5bd736ddeb800e374b022005bfe026b621a7851ae33588f183390e6e4277e4c86e6c7bcdf46019309f8a7f",
-    },
-    "0x6496994241804d7fe2b032901931e03bcd82301f": {
-        "ticker": "MODA",
-        "signature": "3044022075eebeb7d32cecec9fa48d4533f0b82a97d0007a90db7f5bb823d6395e95ccd3022057901e23dfb804442e1014fa93b43b7d275c25b31ec638830094c216c58eac22",
-    },
-    "0xe64b9fd040d1f9d4715c645e0d567ef69958d3d9": {
-        "ticker": "MOD",
-        "signature": "3044022063638695ff6195b2c94347dee0cf30589167afa1959ec29d168ba1b645561ed202204564875b9ec2ff1ce894d9c1bd2298bcf8cf991fc7b1ed727c7955095f2a07f2",
-    },
-    "0x66e535e8d2ebf13f49f3d49e5c50395a97c137b1": {
-        "ticker": "MOLTEN",
-        "signature": "3045022100edcab31ca3fa1ba74b266b84e8eb1ae49925dfa6ef3fdc4c454cadce2d7babc702202799f6aa5b4a323b7d8db5ad7167b1777b388351ba0bfd3fc0ffc7046d5fc153",
-    },
-    "0x152888854378201e173490956085c711f1ded565": {
-        "ticker": "MST",
-        "signature": "304402207ac23b92286b535acca41c2f9763456526f165818ba61f47b30e8cf910c04c9e022020a21010df3f90a946533e4ad536ba5762c6e612d9476df0a2534d268b832c81",
-    },
-    "0xd361474bb19c8b98870bb67f5759cdf277dee7f9": {
-        "ticker": "BAY",
-        "signature": "30440220680b7697d8c8c8d99e946c6d982c0c58c85197ee6a2b0c4a946de38959d8786502205f03be1bfd335caf517099e842ede6510386af2a9659188c75844545532f5cad",
-    },
-    "0xae4846b148a65782865a4849e940575f77359b2b": {
-        "ticker": "WMLPV2",
-        "signature": "304402207cfd875d46518c7566329b4aabac9f53a84ee9f6eec30912a2a6a2a32f1e948702207f9430b6dc0c5e86c86c2ae29f8b6bb53668d5fc2620c62d89191a5e5a346c71",
-    },
-    "0x66eed5ff1701e6ed8470dc391f05e27b1d0657eb": {
-        "ticker": "MPX",
-        "signature": "304402203981661c0f51a44b343a4af6866245ce241c5baacc188d5b8717e1843971024c02201ad426828e1295ae864faf37d3025cd3f7b16f358102726978580d9249ef06df",
-    },
-    "0x9fb9a33956351cf4fa040f65a13b835a3c8764e3": {
-        "ticker": "MULTI",
-        "signature": "3045022100971884ca25b6302aeccdb9f38fc290bc7b0708f4830f7022f00e30c90854b4dc02200785bb942b08f1c15ea7b3661742a97173831a1ab399fe5a9a39cd6734780e41",
-    },
-    "0x01e77288b38b416f972428d562454fb329350bac": {
-        "ticker": "MMY",
-        "signature": "3044022056d180a1423f090e051eea8c9b6adf545e635bdbb15375cf0bffd753a166103f0220655f5d873e7d107fe590339f0b956f8b53c6d00ac762a16264c5610828ad495f",
-    },
-    "0xa80058bdf71f4044942107e33a802752b3bfb4d0": {
-        "ticker": "MUTTSKI",
-        "signature": "3045022100eb4501986e34ea6819c7dc59965ca22e1db3bd50ec97097cde428d40603ee27902201b10e2e2aae27772c8843663c7c0db221def912d63904a7988406abe6c859c5f",
-    },
-    "0x7c598c96d02398d89fbcb9d41eab3df0c16f227d": {
-        "ticker": "NEXO",
-        "signature": "3045022100a59a9c26e6b6916b46df4473c1b0fce5fb6ec1f93385c4e567a8e39cb091993a02202e83cb2fda1d8b9baf3ff0cdf738f1b217a42f4e17dfb854470ceae698de6454",
-    },
-    "0xeaf26191ac1d35ae30baa19a5ad5558dd8156aef": {
-        "ticker": "NORD",
-        "signature": "3045022100bd2d0cd9dc5a9ae7db6a1785438bb796d11dc5a255928663096f21866c56d0950220735b025f5e91f0784a996748178f48a4e3072c3859fbf9b886d452b587a6ed86",
-    },
-    "0xee9801669c6138e84bd50deb500827b776777d28": {
-        "ticker": "O3",
-        "signature": "3045022100f3bc669ca8e057248fb8e31916673c984efca51a000810309a4875b0a07bf3cc022043b27b4efcc1d3bc9397150f451a18dc751a183d9e4b05fc49a6c19833fff73a",
-    },
-    "0x21ada0d2ac28c3a5fa3cd2ee30882da8812279b6": {
-        "ticker": "OATH",
-        "signature": "3045022100d844af249444646ecee33b45a379529dfcf8096514804bb9e0a2b0725776c3eb02204cc16420af5b54349c89594c08ce26cb410b7c3dd506bebc5ac34acb46885da4",
-    },
-    "0xd3ac016b1b8c80eeadde4d186a9138c9324e4189": {
-        "ticker": "OK",
-        "signature": "3045022100e274421c72f1e79f34ddf2b7bbcd04910acf37d7e35874c7e29083ffeff2467202206b2d94e0a118f094d4095e0883eddaeb701a22c268d4db58d447fa3525eabc37",
-    },
-    "0xa9937092c4e2b0277c16802cc8778d252854688a": {
-        "ticker": "FOLIVE",
-        "signature": "3045022100977e509195a4be08f8d84827d9fd11b972d44aeedec1c772c1b057c6bd1b4cd702202fe92640b168d818e25ce4cc645f813d822e7a6395fb937b960b0b474fe8fa42",
-    },
-    "0x582423c10c9e83387a96d00a69ba3d11ee47b7b5": {
-        "ticker": "RING",
-        "signature": "3045022100f617517b57acfaa73a1cf438cb2f4dd484c8379af39b9e9161e460baaac0d0f602202847a7c6db91818b72a2b0d1ff6f6a4198da8a3b0a39c6aa9dade133b94616e7",
-    },
-    "0x667c856f1a624baefe89fc4909c8701296c86c98": {
-        "ticker": "ONI",
-        "signature": "30440220048e1e3773b9112bf3c2d6f887256d90018de39f537f3ecedd0218cdf50c901c02203a0c1aac09fb926040e030d2c969b3a4beccfec162ecab3668552f1bb1651387",
-    },
-    "0x27749e79ad796c4251e0a0564aef45235493a0b6": {
-        "ticker": "ONX",
-        "signature": "3045022100cab4f1bbd97c912430087181eea2ac32f8fe08311f1dc7e259130599fc1966d7022036b1bc325f56de77a79a29e9cddccb3ae49435d3d255eb52e7f3f0dc9faeb314",
-    },
-    "0x3e01b7e242d5af8064cb9a8f9468ac0f8683617c": {
-        "ticker": "ORBS",
-        "signature": "3044022045ce205bb106c9f5fb0a508cb54348ae74189ec70faf68a9d6cf5ff23ada76ff02202c5775a104faade7c38a44594d1d69e4725f9e3f1eed46eed8512e1fe46ec6b8",
-    },
-    "0xd2cdcb6bdee6f78de7988a6a60d13f6ef0b576d9": {
-        "ticker": "ORN",
-        "signature": "30440220093a138425e2f9a0fd799d997e7f573f61289f15575c95f7e9c510a9b4a789c0022036f2ab76e7020a81d5ac78b2c05d414687abf6e53bf518f2619837fd692d4541",
-    },
-    "0xfb66e49e303a186a4c57414ceeed651a7a78161a": {
-        "ticker": "ORKAN",
-        "signature": "30440220174826cd28faf7b49c32b61e9a7019ddac5771aace4ed4cd3196b3f8c52e7c8302205cf6143b4b5ff6210c3acff85629e26a467750e277904c49c3ff5154a66564bc",
-    },
-    "0x85dec8c4b2680793661bca91a8f129607571863d": {
-        "ticker": "BRUSH",
-        "signature": "304402202a25dd150abe6b1b6a4d8e81d63602d7d48c16e837644e59e8a9b812b28eab860220462be4365c2f32dd86ebfde6bfa755538cf62ed706fdef6236e1437df91f9cb7",
-    },
-    "0xa882ceac81b22fc2bef8e1a82e823e3e9603310b": {
-        "ticker": "PANIC",
-        "signature": "3045022100c98a7130c018677bfb742403db106c0c760533fb0e00ab183fa6e5608269519e0220379f0fdc86533236cbec646e9dc776ca2af265d569dba568cec3474b375d86ce",
-    },
-    "0xea97c7c1c89d4084e0bfb88284fa90243779da9f": {
-        "ticker": "PAPER",
-        "signature": "304402203cf927da770aee508820c64d5e5a7907aa0da73b14a55ea412324290d696be4f02201ea80f0d9c33ba9518dce14f37041d451f220ad73b163a61712a58f21a708c6e",
-    },
-    "0x13082681e8ce9bd0af505912d306403592490fc7": {
-        "ticker": "PAR",
-        "signature": "3045022100ee242153b1ad27981326a3f7053ed2195720e5ebebd772ea819bdcb2d7fa563c0220114e36c0046971c22990c2b1f3017f288638c622d153caf8b962f40121631863",
-    },
-    "0x8c64d18e9d4a7b8e8c10c5c5a4b8d6d83cb15002": {
-        "ticker": "PSHARE",
-        "signature": "304402203ce3781a46f90639f4a6050c9ffa00d4bc49a22e2b69edc0aef1c727e9cc071e022045991baa326ed9001e66005fbc290d4b9709c07e7a700c4f6b0a48770f6dfd20",
-    },
-    "0x9486fda4c1192db69a08ca7235e2e6baf31b467b": {
-        "ticker": "PARTIAL",
-        "signature": "3044022031cce44d050c040aef97983924bc7aea592db576cd631fae849fcde5d99030450220409a8fb670ef8f3e753692726cf1a1ee05c37cb037cf12222a2060628a067ccf",
-    },
-    "0xb9d62c829fbf7eaff1eba4e50f3d0480b66c1748": {
-        "ticker": "PDO",
-        "signature": "3045022100ac8f468d610685f841df13be3ee035e92c4e0bdff55aab58bf3222e6b448a965022046cac43a7e52b444ae303fc396b59bd4784b37201684215d6766df5e7c2e4db9",
-    },
-    "0x1d3918043d22de2d799a4d80f72efd50db90b5af": {
-        "ticker": "SPDO",
-        "signature": "3044022049100dedf0d0da8cb221546227f541753295c122f7afed2a5cf5e0198ede156c0220549ab5b209ed086daea71583d98fdb0b0285cbb95e8ac728797b03958c81f8d5",
-    },
-    "0x188a168280589bc3e483d77aae6b4a1d26bd22dc": {
-        "ticker": "PGK",
-        "signature": "30440220290b9d3dc713a1b0e0fd4e3b1a5f218f62574b965a851005ce412acaee8fdb2202200eaa2a03319ef561ddc0751a98f8bbd85641f49ed4c820e067b0dec77017c618",
-    },
-    "0x4272dd51961a5181ace0dc7eb6f9807311345559": {
-        "ticker": "PPDEX",
-        "signature": "304402200aacb6d4d97f13b15a0948fa846f0af2d7cd7c71bf54807c18235b87a4e88bf1022006e32578ac076822fd60b2ed3922f852e85c2b073b5d9d919e849416d6a34ec5",
-    },
-    "0x8063115941e612021692f28748ab1ff56c23e4c6": {
-        "ticker": "PPBLZ",
-        "signature": "3045022100d65c804b3eea087a10664f5346f0827d571f5e2c6e251736fb30c47ede2fa0690220380dd0df32c04fee239133ac72d32dfd864eaac698f4d5eb6ac81f9350237db9",
-    },
-    "0x112df7e3b4b7ab424f07319d4e92f41e6608c48b": {
-        "ticker": "PFTM",
-        "signature": "3045022100bf9d64cb8acf75a3f7011e4e250f645fd7a4dbd0c3ba07854bc61b0698a67a5e022009968d0eca5abd9fad870f71897f0da1deeef97bf2d8c521909bae6c5957a374",
-    },
-    "0xb66b5d38e183de42f21e92abcaf3c712dd5d6286": {
-        "ticker": "PILLS",
-        "signature": "304502210091344398e75ddd5bb4d74f4a95f7647378a0a9816ccd78e417b3008542d3b4c902206730b805a4bac27ec7d75b034df19b3de953202040a60eda695eacdc6bb1a428",
-    },
-    "0x3b42fd538597fd049648c9f017208bf712195b73": {
-        "ticker": "PPAY",
-        "signature": "3045022100c56a927620acedc674b340a1e7dc4e249943ba71618e3a6dcb2327e5a8a45d4602202ca6ce5aa026d70e6730572f7dff93b1d62a9615e6bd86b71663ac802ceb5fa0",
-    },
-    "0x31a47b49b4dbdc54d403b8c4880ac9bb1a9ebae8": {
-        "ticker": "POOCH",
-        "signature": "3045022100ae4d7325f54f40c70b0b54c640c882f8cb48b120948bd70d081a2dc5e5e83f7002200cf19fe23889c5a1e02cb51a6b93b51a66d3df026332d326b81567b1966d7f85",
-    },
-    "0x070eb1a48725622de867a7e3d1dd4f0108966ed1": {
-        "ticker": "POOP",
-        "signature": "3045022100f93cf9b38f32019bd1337bfbb73125d3961e9bde3a612b13134dc0e0d9feeaba0220655db10697d2dad1dc044fcd71c4d935e937f3aaf19afe3c8b58b02595a7886a",
-    },
-    "0x131c7afb4e5f5c94a27611f7210dfec2215e85ae": {
-        "ticker": "POWER",
-        "signature": "3045022100c435278370b068e2377ab8f06f5abe6ceb53e1dc3507148942e3a8d266b4746b02200e698e290200fda1de7e0cdd442559b3e46fdc6ef5c7d04a0cb9bffeef01f4a8",
-    },
-    "0x1f797fdebd1c9bf015643d0cc8bd00ece9e709d7": {
-        "ticker": "PWFL",
-        "signature": "3045022100fcd8378a46c22c17c9e9799515a3752936c7fd671345a080afcc5d955c2ce7ba0220291997b1dceb6cfad30094642def95151d911b314255bae06df7ada383171c00",
-    },
-    "0x3028b4395f98777123c7da327010c40f3c7cc4ef": {
-        "ticker": "PREMIA",
-        "signature": "304402200d3b88bee5507f426bc2098ed77a459c34d8bce3d052e16d60dfe8ec36ced779022069057ff0d002876bf314f97f71bee1b0a3c69a2f71372a8265f72a854e4adc75",
-    },
-    "0xa23c4e69e5eaf4500f2f9301717f12b578b948fb": {
-        "ticker": "PROTO",
-        "signature": "30440220685591318e728ce3b310f742d3a310ab443e3feb883c2f244af02e6bb74c5ab102206001e15cc2ae08bf0ce9a7b76c30fa36f4488189a322c005ddaf7625ad2421c2",
-    },
-    "0x18ee5e886750cc1afdc728c5608da33305837da8": {
-        "ticker": "PUNCH",
-        "signature": "3045022100ad5c31d5175c5228fd4b1f4e442a702b6cd0c54ff21ce1c3cf19283fa652a7b70220349d12406d995af7ac9277e3a6ac4ee88ee45164a4126aac50494085657b7d7d",
-    },
-    "0x4edc4337518b964d52e18af5381db2b018d3ba4e": {
-        "ticker": "PYRO",
-        "signature": "3045022100bfb0877b592bf2d9010098f2b27c12e0afadce4e65396ed18e138258bb42177a022077b897301995fb1def7d30154dbe415d55e288fa67952f3f417a57f7a1612037",
-    },
-    "0x79360af49edd44f3000303ae212671ac94bb8ba7": {
-        "ticker": "RDL",
-        "signature": "3045022100c3dab622ba2d7f839902a82a1427308b346e515e7849b1d063ff77dfe1b85b02022011f7fcddeb8c459aa6aeef3546a05f3eab2ae98039d007e9fb4e2e895d7b0776",
-    },
-    "0xf899e3909b4492859d44260e1de41a9e663e70f5": {
-        "ticker": "RADIO",
-        "signature": "3045022100bf5a8b05b3ad83c36a5b5f32d4940da8b111b866d965a1d9042dd2be74cac38602201ff9c98068064bc85723d0428dbf5ca56f4898b2b66eff27d03cbc898290863c",
-    },
-    "0xa71353bb71dda105d383b02fc2dd172c4d39ef8b": {
-        "ticker": "RAI",
-        "signature": "3045022100a00aa2db423c0ca190637276ef9d6a64568d9af0045563e95bd01357c7cdeda7022012c92f82fe311b013ba2c31261d1880328b116d35c27bfe0f064a54db0ade6f7",
-    },
-    "0xe83dfaaafd3310474d917583ae9633b4f68fb036": {
-        "ticker": "RAINI",
-        "signature": "304402200e46385c05adf77f3eadc4cba922660c2b2e74213d4c5e564fd0cefed2266d1f022013bb8a6f959ad1084542b0dfef683ec02c09232e0915d36d81db2e019cc8df5a",
-    },
-    "0x87d57f92852d7357cf32ac4f6952204f2b0c1a27": {
-        "ticker": "RNDM",
-        "signature": "3045022100c355c76454678d2cc2460e43a3946ca1cb690124fdf928e015085e463d7ab1ea02204db4eca97c8378194885ea1257058d399f824e978ad52f38ecc51ddf82cb0c48",
-    },
-    "0xcf726a06f3dcec8ef2b033336d138caa0eae5af2": {
-        "ticker": "RGT",
-        "signature": "3044022034764276e995ee3701c925f6af41d63bd5826c621300aec35825eb8d5a100aa502205e00176ceb32f06ed1f481e474fdd29bf54afaf5af5e10f90bb70fae825103e3",
-    },
-    "0x117db78176c8ede4f12fcd29d85cd96b91a4cbbb": {
-        "ticker": "REAPER",
-        "signature": "3045022100902e626eb96adb2c058cae10cdcb44ae4acb6bd1667648df00f8be9fcf515dc902201989e3f09705c2d206f507d9c49b40bd7c0d22f3e921659b81dc131d38e94a45",
-    },
-    "0x8a41f13a4fae75ca88b1ee726ee9d52b148b0498": {
-        "ticker": "PAE",
-        "signature": "3045022100e8f80d0ca46987aab0043c47930b7eb2a3fcb459649b00a08de8a64326a55c9c022031ccea87275c04cbc6fecb29d8492c299d74863a60cefe97660ce4af4ac71f2d",
-    },
-    "0x11bbf12363dc8375b78d2719395d505f52a02f68": {
-        "ticker": "ROUTE",
-        "signature": "304502210089c8ca8826fa889490864388147e25958114d5152f59ec71ff39bb03679040a10220698af2228891bc296afd44a9893fcdc71de7003cf70407a014e66c2d23707bad",
-    },
-    "0x2e79205648b85485731cfe3025d66cf2d3b059c4": {
-        "ticker": "SCARAB",
-        "signature": "3045022100c519bf39c994c50b4043c776139544cafad98e461b8158c9af4e4a01d7a6d18b02203b6abf4fc231215580f63b453a4cc4fbf6b21165a8054215fb8b3439407619a9",
-    },
-    "0x46e1ee17f51c52661d04238f1700c547de3b84a1": {
-        "ticker": "SCARE",
-        "signature": "3045022100b7d123f2cb04be4a647cabe76e29b0392d062a384ee88e3945f123d32d34cefd022008c8f22d15b4589d2a2994f8ce387a543dafaff2788a0625000e3d9458a0b830",
-    },
-    "0xe0654c8e6fd4d733349ac7e09f6f23da256bf475": {
-        "ticker": "SCREAM",
-        "signature": "304402206336d9b0b3f910e7c97b085a9206b85d22b2323631a5439375d85eebddcde54602206e4a851001c9079a26cb6107001dec5dfb7153b7f25796dcb828a31f498a537d",
-    },
-    "0x8183c18887ac4386ce09dbdf5df7c398dacb2b5a": {
-        "ticker": "SCR",
-        "signature": "3044022004587e894cf638ca9b3af8d388feb231840ef427749971a61d8c4e72938c9b2b02205715efb3d799452e8264720b544f552b3e2cd3c19594550faeef40521f86e7fc",
-    },
-    "0xd7028092c830b5c8fce061af2e593413ebbc1fc1": {
-        "ticker": "SFTMX",
-        "signature": "304502210082fe24c582184199828cfbf15be2ed29744214ad44870441fa9e584ab7101d7102207ffc8c3eab37e4a616b409e4722d3df71544e932adb863267b293885d92dfe5e",
-    },
-    "0x462fa81050f0ff732d59df121bfd9b8bab072018": {
-        "ticker": "SHACK",
-        "signature": "304402206aae72772752d4cc2182683a85613fd956ff9eb2f1a70693e01a01b35856743c02207e5b50861167f377b90bb10a4ebf1b9210c3cdb4a701d449663ae2b08d77ea06",
-    },
-    "0x3a3841f5fa9f2c283ea567d5aeea3af022dd2262": {
-        "ticker": "SHADE",
-        "signature": "304402200d5f9509d7eae179e18d3f95d28a785f34c8a680f5e5c28a49a00853ad2ad3ee022053c3ee84f6564448a0fc5265763300a5d2694650d0809b4483e764ad630989d9",
-    },
-    "0x9ba3e4f84a34df4e08c112e1a0ff148b81655615": {
-        "ticker": "SHIBA",
-        "signature": "304502210098c3d5d950e8f7c416ff6cbedbdf18405031cd82a9a70fd5c8db786f1e3f1a8202205532b7d87ff38dff7642b026ed05d147d3cc1826bd56e3e63d9af46d9d8d39b0",
-    },
-    "0xb715f8dce2f0e9b894c753711bd55ee3c04dca4e": {
-        "ticker": "CONK",
-        "signature": "3045022100e8de83bb8d0c9acacc8ad013f033bfea91fa97add42d3f076e629f8bd7e07b5902204c52c4b3ac749c3ad262d7a61e26c39b99100951f114dac4b21ffb4f7d199bd0",
-    },
-    "0x53d831e1db0947c74e8a52618f662209ec5de0ce": {
-        "ticker": "SING",
-        "signature": "30450221009e8f9ac8a2067d3288fa2de75fcf7ce9c7a6fe22be4fd2fb2ca594a0da4ac19f0220401994e3d1ffe57a64b3da977cada7809b41e397183ecf43f2da0d96dbb8a36a",
-    },
-    "0xfa5992a8a47af7029e04ec6a95203ad3f301460b": {
-        "ticker": "SKULL",
-        "signature": "3044022038335a451bdd6dcc58d7de248c9b926b9d80b4816123a5b2e7c8efc717bdfb2d02205902f20e75d83223d9e9fd0b16591c3aa096f70c40439ed6eff9ccb52c086b08",
-    },
-    "0x34d33dc8ac6f1650d94a7e9a972b47044217600b": {
-        "ticker": "SMART",
-        "signature": "304402207e5012452e8e988350dfa565bd3b6b436ce188066290a592204ae9136f5da2d9022071edbfce1caa2d1087703e98be5982b9066f3d777aeca69c9e05a63bf5e39b59",
-    },
-    "0x44f7237df00e386af8e79b817d05ed9f6fe0f296": {
-        "ticker": "SOL",
-        "signature": "304402203a56be320a4c8afb9db72757a843174a44c50a94224fdcb2829c1991b43432ce0220315a232655bcb07ce51074bc332a79c62070c390e62e5a46a0ec2f07c7abcacd",
-    },
-    "0xd31fcd1f7ba190dbc75354046f6024a9b86014d7": {
-        "ticker": "SEX",
-        "signature": "3045022100f101683152d5006c55ea7db4586feedf6fd68cce1702590dc36a26607424b8fd02200c7dbaba1ba5cc581ec753a3acca0c7fe4d60e5d4449b68e444d3ae9eec27234",
-    },
-    "0x777cf5ba9c291a1a8f57ff14836f6f9dc5c0f9dd": {
-        "ticker": "SOLID",
-        "signature": "304402202e57e1e366a67c5436a479f6deadbe920851126c0b71850a4b6a18c012da05aa02207224e32f79c023d98243b63878fcbb7b4c61dcaaa1e2f3d50e35d3e235bec276",
-    },
-    "0x39263a476aadf768be43a99b24c4e461098524a4": {
-        "ticker": "SLM",
-        "signature": "3044022042fd7fe0c579ef1460bbcf0fee658ed8dac2f6fcebb6bd1af7dbef0737d4098e02204b12c47e2073bf32241abd1b329bdc502ac7594255c9d6b4d68b63e1d7fce827",
-    },
-    "0xe2fb177009ff39f52c0134e8007fa0e4baacbd07": {
-        "ticker": "SOUL",
-        "signature": "30450221009069285031ab7e6c0722f11afbb0c52df76c37b013a096205ac6c43f203182a102204dd9ab2d6e81f16b3516ae992a860590156145c0ac06fd27977c7f996beb0058",
-    },
-    "0x5f7f94a1dd7b15594d17543beb8b30b111dd464c": {
-        "ticker": "SPACE",
-        "signature": "304402203902cb5d1bdb69370b8a902e3dae29b68b938932e345144f877d2df603f153ac02202568c1862e29e0909d962271d3e44d3d05eac926e508f40c10f8dc2a05a8a8c8",
-    },
-    "0x5602df4a94eb6c680190accfa2a475621e0ddbdc": {
-        "ticker": "SPA",
-        "signature": "3045022100c187890186505704102a848973f12f6b3010df02cb0305bb1f77b09a53dfd26b02202d1052435b752e8c945cd793b0969833d52be1e750320bef8696241b2b7e31e6",
-    },
-    "0x0ce12ae7c899ebf2bcda7aa570c5af98b6688c95": {
-        "ticker": "SPEEDY",
-        "signature": "3045022100b073fe1dd2bc64ea2dac3f0a45e8e3a40c09977db4855fb7a04ef162aa4f2c0902200cee4f12f6b175a0f57373552a75d0a9c47ca48b7342a539b7145bdf20b004d6",
-    },
-    "0x468003b688943977e6130f4f68f23aad939a1040": {
-        "ticker": "SPELL",
-        "signature": "30440220412fdcf7222535d1a171f2a3a4bd7be36c8e48846cfc8580dd960af075785d2702202c3b91cb4ff0c518b119e2230ad70bf8ccb0660bdecc4df0d8791426b72edbb2",
-    },
-    "0x924828a9fb17d47d0eb64b57271d10706699ff11": {
-        "ticker": "SFI",
-        "signature": "304502210097aa309e54af20ac5144244765f575c0f886ad3e92d2c099a9c2f987d00f3f9702206785d345dccc4ae65408b5577f0e5180abd91508730b90eac2718d5d88d4330c",
-    },
-    "0x5cc61a78f164885776aa610fb0fe1257df78e59b": {
-        "ticker": "SPIRIT",
-        "signature": "3044022052f25f7d6119937de5a294f64fe107f6059c48f6d790f7e909f86c784534f7830220404c6dff2c8540a22029f3d1aadc59a32b89c345d2566f5ad4d2f03c33f7e867",
-    },
-    "0x841fad6eae12c286d1fd18d1d525dffa75c7effe": {
-        "ticker": "BOO",
-        "signature": "304402206f05ff2aa152cb98a58ab7aea2193f2ed9d0d183df5ee72b199f62916dd271bc02200c5f8e8e216dd8436fc5832c662ff5220195c587709e0c86e50703402e349ce9",
-    },
-    "0x412a13c109ac30f0db80ad3bd1defd5d0a6c0ac6": {
-        "ticker": "SD",
-        "signature": "304502210097fcd2c8a6f8d7b6c0bce3769e7791808eceec77666322a864e44cda282d42fa022049e0cab6cf88778f517b60e9b736e5ebd4b707d78005d6b4d8bc9b167c18bdeb",
-    },
-    "0x5e983ff70de345de15dbdcf0529640f14446cdfa": {
-        "ticker": "SFHM",
-        "signature": "30440220014fb48c29902bc64438858f03b6d5c4551ff25c3691d912a8b49395422942f60220323d2e248239436e2f45d91b453cb44f0377b4c221aa8606655269e1594396f1",
-    },
-    "0xb90ccd563918ff900928dc529aa01046795ccb4a": {
-        "ticker": "SFRXETH",
-        "signature": "304402203f83e90eeb3dbeaab7e10d822bf0d04032438a38af8996cfe4dae1b725f504ed022060aab8ef216ea2cd6966e79f24f02653fce98520f0628bf93254027daf99b01e",
-    },
-    "0x69c744d3444202d35a2783929a0f930f2fbb05ad": {
-        "ticker": "SFTM",
-        "signature": "3045022100f784d071501a89cec8cc8dc16cc8979da88a2b30820d4b5f9a0f9e3141328de902205aff3c8ad798cc38f0b1bd60a624517426085fb3d20f98afa9c995bee518acfc",
-    },
-    "0x75bdef24285013387a47775828bec90b91ca9a5f": {
-        "ticker": "SHEC",
-        "signature": "3045022100c6fb1e1636b05db252738c003d11f937d5a110cd727cbe7775b3673a0d54b9af02204121b64fd78ceb6fb17e911339da3bde651875aadaaf5b3267525ce534e821b1",
-    },
-    "0x74d1d2a851e339b8cb953716445be7e8abdf92f4": {
-        "ticker": "XTAROT",
-        "signature": "3045022100d617bb88789f06ab38c723c54208ab4956e9fac367acca462c7e8ddc2311cb7b0220741177f909fbff11a166983f6160bb1062dcd0b91c0cafbc09e78151b2c5eee7",
-    },
-    "0x2f6f07cdcf3588944bf4c42ac74ff24bf56e7590": {
-        "ticker": "STG",
-        "signature": "3045022100f6166eaf899da2e93998cfca31837507099e2d327ad7f24aeeb4a257f94d3fe00220104fe25c70c3caf824f2db92327674e56267e90aa8a53fb6fd417ce4984bb6a4",
-    },
-    "0x89d5e71e275b4be094df9551627bcf4e3b24ce22": {
-        "ticker": "STA",
-        "signature": "30440220122d151c9ae6618eca6d1e858a3142e8597ec8b756e2967e08fb348b985b331302207ae4521a9bcca45a2a0abe6f9e233589d72d790d3339882f77984c9ed4c278cf",
-    },
-    "0x5d9eafc54567f34164a269ba6c099068df6ef651": {
-        "ticker": "SURV",
-        "signature": "3045022100c9a48e1b71513ea0dcff4efdad57dc4b8edde4fc78b00f89076c826f0630d1060220079b2ff407afcab427fdba04dea66ade260f7f694606f01aecf12665e44e205d",
-    },
-    "0xae75a438b2e0cb8bb01ec1e1e376de11d44477cc": {
-        "ticker": "SUSHI",
-        "signature": "304402204ff198a04c787bc2814787ad1fb3b8381e2890a9bea7a80f4e7c26a9e32171910220769d0118d0345391a29b1e7bdea3786ce5b1d35a5eab99a6690912c4cd09bd5d",
-    },
-    "0xe55e19fb4f2d85af758950957714292dac1e25b2": {
-        "ticker": "SYN",
-        "signature": "3044022057a508de0a635816a0e3c4d0bf7e8ee3605ae98b91c0929c976a71df67912f000220493f30e5bdcaa941aedddd5def7306477da1a59b4bc323d5b263fea0d4f5c46d",
-    },
-    "0x0e1694483ebb3b74d3054e383840c6cf011e518e": {
-        "ticker": "SUSD",
-        "signature": "30440220553b3ae4185a1107e9e35ffbba965a06c60d9de2e7962c9411fb1431266e8b4402206ffc232f4d58898f61c1b22cb47bc414b7616b0450670e981bf4d238473f812a",
-    },
-    "0x56ee926bd8c72b2d5fa1af4d9e4cbb515a1e3adc": {
-        "ticker": "SNX",
-        "signature": "30440220197736f9f04552e9892660b0eb8ac766e852cd841200b3f81991fae8df6b1b54022053b70e2b03ae17db0b4cf591b9180c22d27c3d6a799aecd6ee64756a669439d5",
-    },
-    "0xe9e5a97acc59bb68813bf368487fbffd0a39713b": {
-        "ticker": "TAKE",
-        "signature": "3045022100fe6db28b609d1b784484f2926245d3a1e1bf09a4484e910881b0f027bf7f82d5022039d95a4f95eb929b0dd9bbdb1241274d6326166d4c618236c95150a2f074c281",
-    },
-    "0xa74bb2c6e5fe2805a0086d05e37c256274935690": {
-        "ticker": "TGOLD",
-        "signature": "304402202e3a3b8bd9b7613281d110414fa19af229a4702e074d9ff060e10f82b6b593ce022051815cc6d05013a611dd8e1addbdb41cd9edf354e5fdda4c0616a9210f2ca867",
-    },
-    "0xc5e2b037d30a390e62180970b3aa4e91868764cd": {
-        "ticker": "TAROT",
-        "signature": "3045022100a1909991e03775bdf8f11cdd78a950f9431172b0a6d7e78a9d134b971af4aa1202206167ed5532e07afc59e418fd77f47b1bed66b676d1a553ad5e04d4bbdb93e0d8",
-    },
-    "0x1c174f6ab0753162befbb916c69def2cc1bfdec1": {
-        "ticker": "TEMP",
-        "signature": "3045022100b95bdcdcbd55fdeb4148e9573de4eacdd815f24b14bf19e56c16be6d1c1e7ef0022028b38fcd9e341a27e1c27703962f8493403e7cfc6d2ff8080b42acfc4ffe5581",
-    },
-    "0xcc1b99ddac1a33c201a742a1851662e87bc7f22c": {
-        "ticker": "USDT",
-        "signature": "30450221009ecc6cfb1a764f3bfa0bd83b8f029945fa0fc39d30d73314e99b52c35a78c98802202c06f4d0d9fe7b4d7a9eebafac3d3cc2ae0836d297fcf9a84fc333e05950ff6f",
-    },
-    "0x65c9d9d080714cda7b5d58989dc27f897f165179": {
-        "ticker": "TETU",
-        "signature": "3044022010dc6cdfdafec5532f8575064a7eeabedaa9e04c38ee97d17b7f81c631c3bc600220577f52a0d15e04ef23b6445427e4e5e2d855a855f3abd9f2fa1c91153f4bb278",
-    },
-    "0xe1e6b01ae86ad82b1f1b4eb413b219ac32e17bf6": {
-        "ticker": "XRUNE",
-        "signature": "3045022100befc5bff500ffca83b20fce91d3429e150e544235b783e57017f82e2aa893d1c02200553f80c7d3f0eb11b576c2e7d611b268cae1c3cd8e7ba1bd1fa5850dcc59ccc",
-    },
-    "0xfbfae0dd49882e503982f8eb4b8b1e464eca0b91": {
-        "ticker": "TCS",
-        "signature": "3044022002a2a2d83240e734adc1ee761361f94ad0e2af6d5d94711dff395ae0eccf6e4902204a22f5844e416af1a265462c0f01981e05fe59f8353f709116dc2a2010d76747",
-    },
-    "0x479673391b3818f5e3ed2fa69a58e13d685becf6": {
-        "ticker": "THC",
-        "signature": "3045022100999175289e0928784ca1f9fcc40caf44777e46430244a0756384870d07d78ba402205e4ddb865a528e5df12ca395ced67381631b974152f7c353fbed95115741a95b",
-    },
-    "0x6c021ae822bea943b2e66552bde1d2696a53fbb7": {
-        "ticker": "TOMB",
-        "signature": "30440220286c3231dd7e886cca7d6685f8b5ce9709ea734b10bebbd4e069b9cd6e4c79f8022040a3aef3f66ae0f9fcbc7e23cdce3fdfaad407879bac015ecf8d498f23f029e9",
-    },
-    "0xe53afa646d48e9ef68fcd559f2a598880a3f1370": {
-        "ticker": "TOMB+",
-        "signature": "3045022100f90eb58c1b486953b607ec49c7db5165b2a8cae5af0350ad4f368a043f8ee583022041ebc1bbc8aa038f4583b317fceed76f7e4a95884057cd2ff67c3c2b70372f4b",
-    },
-    "0x74e23df9110aa9ea0b6ff2faee01e740ca1c642e": {
-        "ticker": "TOR",
-        "signature": "3045022100b9a4ab304df013d524f905b544089806ccff8404f689e5537fa3e6ce93e4508b022077cad509e55f213491d3f26f6fd2adefac57f4efc78e2c32ed10677a3a4d21f9",
-    },
-    "0x0e121961dd741c9d49c9a04379da944a9d2fac7a": {
-        "ticker": "DIS",
-        "signature": "304402200e85afe4fa211a0eae75b021388ccd80b31ac4a3e5e911aa299b0f13b39d93770220187a4576afd8312ef06092e25a7d0a2eb98ca85ff9d32ea256704619141d21d0",
-    },
-    "0x477a9d5df9beda06f6b021136a2efe7be242fcc9": {
-        "ticker": "TRAVA",
-        "signature": "304402205af9b46dff89511b523d25f85c7e16474eea8661405b468699ddd8c5fda51dc5022021765e60fdb145f5dd7eedc5cd44f69014c3f53451995371d9beb69564ec9043",
-    },
-    "0x484f2ff94a7790759d56fb1efbace8075aba5e06": {
-        "ticker": "TREAT",
-        "signature": "3045022100c420449aeaee0ec8ccaf625a63b05af07b75b6eae8b65fe0a7c56f942954579602203e85b94f59b24755972bb8a0f3566b82f35a081cccf8a8a51b04a6ffb9d061e9",
-    },
-    "0xc60d7067dfbc6f2caf30523a064f416a5af52963": {
-        "ticker": "TREEB",
-        "signature": "3045022100fffa158366611edeef796acc12198f5ce7d10616a4988527e5e2de72cd201a5302200baa6b03a5f461c33d097bcc27f40853b1fa73ddc371e2f1151490144da77932",
-    },
-    "0x9879abdea01a879644185341f7af7d8343556b7a": {
-        "ticker": "TUSD",
-        "signature": "3044022003e5ae94fd53aaee042a4395fedb1ced1b7cf1788c29bdba495cc3ee85b9d86002207c6bc234cce52f2b5224ab2cc088c1077c5e4ae7154162127b77e1efead92916",
-    },
-    "0x4cdf39285d7ca8eb3f090fda0c069ba5f4145b37": {
-        "ticker": "TSHARE",
-        "signature": "304402206a6aa1236b0b65dc0d41d475c2e7ad95fc3e5f03af7d3087902133218db1aa690220033d7891592fbeb97cd387e6b2ef46da889098c06e14b2c3aaaa8159fd9e7d39",
-    },
-    "0xf45b1146416f1ec2125de920324722912fe8807f": {
-        "ticker": "TSHARE+",
-        "signature": "3044022069f411a5060cd3492020fcefc9228bdb4b85cb5d7ce0c47e257b6a606c46c94502204e51becb2383369a6daeb6ba7f0b19a179fb07fa74536944ff6717fe5a34246a",
-    },
-    "0x8867f422cd9cf0c66ba71d22bc8edc641e91949d": {
-        "ticker": "ULX",
-        "signature": "3045022100f688c3437fa77570be1fab839cdefad6602f11eb1e3893abcec070bed922d1ec02207527f3104cda462c3b9684f02a6573a2417435d06491b12d01a0f039dae4088a",
-    },
-    "0x0483a76d80d0afec6bd2afd12c1ad865b9df1471": {
-        "ticker": "UNIDX",
-        "signature": "3045022100de81ae59298a3c2f639d6fa1b1bee4ba9145a63d37111d4dedb60596589e467e0220529efc4b6ad195f103ff67416eec1100e1f8e8a958b242f77d1b2fd6e74c974a",
-    },
-    "0x602a3ad311e66b6f5e567a13016b712aba0625c6": {
-        "ticker": "DUCK",
-        "signature": "304402200b21ef1da4eb0a2d43e008907888f605a05450ad4836a0b3ecdfcb72fbfa21f6022072907eb94d09fff9259419b3afc038fd053f5030e8542e56860c09e0f3a9a1c0",
-    },
-    "0x6fc9383486c163fa48becdec79d6058f984f62ca": {
-        "ticker": "USDB",
-        "signature": "3045022100855ad49668cce29a6fb48cecf76f4fe3987e685dcaf121204566954a2b249ed102202e929dad2bd5be8b561fb05e5efe2e9571048e2a177834a56115a98b0a68c12a",
-    },
-    "0x04068da6c83afcfa0e13ba15a6696662335d5b75": {
-        "ticker": "USDC",
-        "signature": "304402201e1429d9fb00b0b93180b9f28fa2ebf909e45e34f6ea08d5359531903dc82aa102200e32f7484de544cdf62bd7813a758d354a13cf1d741277e004c57f8e4a97a270",
-    },
-    "0x953e94caf91a1e32337d0548b9274f337920edfa": {
-        "ticker": "USDV",
-        "signature": "3045022100f94719be1969960ed9854cf70c679469e354da5b31ef674cb8c991d2b6466ac5022060f7c914d3a4d12329eb3b24a4b90dfe73d8f0424e4f1dcf047c98144e7a9b24",
-    },
-    "0x846e4d51d7e2043c1a87e0ab7490b93fb940357b": {
-        "ticker": "UST",
-        "signature": "3045022100e1164e0603ce5bfc36ed93125fa935c036d3e557507aac7c5b80cc1701334b6402207f1ee20f654745f9c394b2dede5ab97bd62699eaac48746d6462893cd9e14dda",
-    },
-    "0x911da02c1232a3c3e1418b834a311921143b04d7": {
-        "ticker": "WEVE",
-        "signature": "304402204b6dc1b88e530f003360247bd6de5a8eb0c81f6ad0ac1f7c60348f016adb877602205bf6d53c05081e0a4789531268b62e8e1dedeb74c79d29d5e1da2ff4895a93f6",
-    },
-    "0x526f1dc408cfe7fc5330ab9f1e78474ceff2a5dd": {
-        "ticker": "VEMP",
-        "signature": "304402205580d692babaf81f7a26d657861419ba27d5946875ca3a380f8ef318d8a048e80220763cfa089eeb092263566ae4887b500801a226d962860a96b20a44a29a81f6ad",
-    },
-    "0x461d52769884ca6235b685ef2040f47d30c94eb5": {
-        "ticker": "VSP",
-        "signature": "304402204d51bdafe39b59973c3a985aa8720029d7c237085f8b9c1eadddc4ddc1e5541502202783716d0b49a21edd4a5ff8132618c9d75e6014f5eb61ff90055484dfb37245",
-    },
-    "0x0a16aeab4418cb8dcdef9717e801a1c4fceb2b03": {
-        "ticker": "V",
-        "signature": "304402203998899c93c845bf1f98d1a3983c68ee57965f3de47c62d29ba42974ff9e8cb802207f18e7ea0a2d335bb3389a344736f5c8b44956b601968014bf96ededf55acca1",
-    },
-    "0x74b4db963738a2a95bfcb1833b123495ccc220e2": {
-        "ticker": "VOX",
-        "signature": "3044022011bcb88c91ec952196f7f6c10cb9951db41d54809a46df56f4620fc2f16eacfe02203912f732b40ec52b02cf7f05fcbe6bced48c0c280510263de9b31e8c198dfcad",
-    },
-    "0xb1f795776cb9ddac6e7e162f31c7419dd3d48297": {
-        "ticker": "WAGMI",
-        "signature": "304502210084e044022a371b9b83329e7c99ec9a99c76570c0c0c7ad8bd89f79d2417b46ad0220307e4ac49afe3fd6d85381a8589937889795e19a9f2a010e6d973a21beae56b1",
-    },
-    "0xa9cad0165c155f3998b0001b3ef30bca0aa6b591": {
-        "ticker": "WNOW",
-        "signature": "3045022100cdaf78492f8c9a95630f3564a8c7ed83b2c10eaf79e2463e267ffbc59b54cf4c022032848e03a8f9b8a9e3c3e32c4d99fcfd012d8da06b22160663f7bee1166a49d6",
-    },
-    "0x59c6606ed2af925f270733e378d6af7829b5b3cf": {
-        "ticker": "WBOND",
-        "signature": "30440220562b3c50f323d58403f3f9f4adac51284b83f8bbae892ee3b133266de12827bd022001abe816e85dce6b5c2387cb38a78602802b1c0e24e0052614a10c7eddb53afc",
-    },
-    "0x6b2a7b82d3f7a6e1f5a5831ab40666ec717645d5": {
-        "ticker": "WATERFALL",
-        "signature": "3045022100aa9f961945d1696148e14c809d4a41d1efefe6ef8aee77afa25d7c6b73a63aca0220587c9b417a241e764262c395b4598dd665a2c317d37b38cabb7d5fa382247922",
-    },
-    "0xe992beab6659bff447893641a378fbbf031c5bd6": {
-        "ticker": "WIGO",
-        "signature": "3045022100b9f46ab28fc74289c1e04a905eee0a2d4023e20ce855f04db11e888936b89f9b022032392cd413fa60bfee4f93674731643c28c6f6b902518056ad82a439849ec1a0",
-    },
-    "0xf24be6c063bee7c7844dd90a21fdf7d783d41a94": {
-        "ticker": "WIS",
-        "signature": "30440220048ccffab9cfaab00f1272d5b4e442148f1f0c117c5170eadbabafffa6db398d02207af982e045f95ae582b9fa0a1246f1bd098b7462863b03363dfe9acc22a74354",
-    },
-    "0x911d1feae99e112b5014cfa60038325d863352f1": {
-        "ticker": "WV",
-        "signature": "304402207a763c9759dabffb1b476d50e0d080f715bc5163f121065d02b89efa14390e680220569c58978aae2f8b49c279d9ca1d2f3eaee154e78d2ead0507c15342d9436487",
-    },
-    "0x685a211c9d96d0c8c9d22b7ae309538d4c69c15c": {
-        "ticker": "WSPP",
-        "signature": "30440220156225c3d35263754c65729f3b1406a22302bae1e025b36cbb17cb12a6caee9c0220234aeb646ca449fc82c3acac55f7d36cb56733247818cc449171ec83ec097ca8",
-    },
-    "0x6626c47c00f1d87902fc13eecfac3ed06d5e8d8a": {
-        "ticker": "WOO",
-        "signature": "3045022100be16ae768a4fbbc8dfdf170f2607a5bc46e0bcdb54a3401fcda33eb9a2422ad102201e171921880abb11e69c0fd1c7b5d15bd9943466234f2dad021682351bb3d137",
-    },
-    "0xe20b9e246db5a0d21bf9209e4858bc9a3ff7a034": {
-        "ticker": "WBAN",
-        "signature": "30440220494baaae551596a8f26a68e494e551d4a735a11b986bc79f9c7da011dcc71e8902205c21ae422f8bb3caf30a5d07d4cc9048ab9a4030869340192f3d8961156a26b8",
-    },
-    "0xf1648c50d2863f780c57849d812b4b7686031a3d": {
-        "ticker": "WBTC",
-        "signature": "3045022100c8591fa89a02fdb624dc718469096cea0f25ccdba33f93253cfb520ff341ca6802202ebbd8135af446c5bd9a1935540711143bdeb11b9854873a38dbf0a4ad5a765c",
-    },
-    "0x695921034f0387eac4e11620ee91b1b15a6a09fe": {
-        "ticker": "WETH",
-        "signature": "3045022100ed501e9691953cec839a12a48b4ad64d7b5fe4c22109e183f883b31c6d64bbe0022017a50290599cf26fd67376a381407167f665cebd870689f4ed865cf6cc14a727",
-    },
-    "0x21be370d5312f44cb42ce377bc9b8a0cef1a4c83": {
-        "ticker": "WFTM",
-        "signature": "304402201093b434741da7b34e66ad5bab949adc1cac2e36266de8a75825035e478b7df80220768e893f61b7bde6cdc34d94257d8094a8276e2b3a2c329de45ec74d6b448e97",
-    },
-    "0xddc0385169797937066bbd8ef409b5b3c0dfeb52": {
-        "ticker": "WMEMO",
-        "signature": "3045022100c6e6d599d9534c92332c9b632fcfc5911ab4826082cd3d1e3c865f47a1b5237102203d6a61ff49326b2b88f305d7edc3f7c66212d64223d50d389077440f31ae25ca",
-    },
-    "0x94ccf60f700146bea8ef7832820800e2dfa92eda": {
-        "ticker": "WSHEC",
-        "signature": "304402201836599460248c92166eef8832ee5d2b5e961b2c54a989448201f37baeb0289202207a1a38501c2a2fce3365a32d05aa2ae10221aeff0987ea91efe192899b95e410",
-    },
-    "0xceebde49ec95e21f7ee63c5c6f98cab3519570de": {
-        "ticker": "WSTA",
-        "signature": "3044022051923b786bf2531657325954ab52b582df9b4e2cb590403e188aa1aecaa2185702202fe98f3c6d81c0485af963b45e4796856e1baad41bc1d92a002a2cdfd23ff309",
-    },
-    "0x6a31aca4d2f7398f04d9b6ffae2d898d9a8e7938": {
-        "ticker": "WTRTL",
-        "signature": "3044022035b479cdb019a2e63167642d35854bd9da3153426c61be1cde0888374876e95802205ce1208e11ba99db3f7ab232feabb653343558fdaa54e0a02c60e72db2dbad15",
-    },
-    "0xef4b763385838fffc708000f884026b8c0434275": {
-        "ticker": "FMXEN",
-        "signature": "30450221009a49639b8529aa0744e6ff8da1e9a8c955c13223a9c2c4bec8bf1e0f662f6a7a022067f07886bff6755f3f16c9b883b5d100ebabe53215036dafbb9f464d38ca392a",
-    },
-    "0x444444443b0fcb2733b93f23c910580fba52fffa": {
-        "ticker": "XY",
-        "signature": "30440220242387d4e1ccfe082220f5ae0460cf673977595c025fbfb57ec5de675c9cd5b90220653e1c83f4c167d46a92bc1c2cf77fcde036bf110d66d65a3a518c44376e2c73",
-    },
-    "0x29b0da86e484e1c0029b56e817912d778ac0ec69": {
-        "ticker": "YFI",
-        "signature": "3045022100b4c030dd9275f2a312c238cadcfcd903e8ead31101c96450e621d97299fefb1e02207e979c3929a34c18bd2879fa0579a5e9402ddec76e33c354a8d20195298641ca",
-    },
-    "0xd3b71117e6c1558c1553305b44988cd944e97300": {
-        "ticker": "YEL",
-        "signature": "304502210095c6d5b476cf1b44f2c87108326ab9b1b203172c99546c5ec0aeb286257bac4002201a74884ed7d7a871255b48ff3cc4030cd43a86d7dc982e3f03c2e573d64ed880",
-    },
-    "0x3dc57b391262e3aae37a08d91241f9ba9d58b570": {
-        "ticker": "YOSHI",
-        "signature": "3045022100df8740acff36dc3672deb13358a7bb413582078a3a1831a5450072b19b6492300220353888b5ff01532f23621338315fb1e8d2a059c02272b61bdcb6136ff1752aaf",
-    },
-    "0x90152f061f6697ab623e258aa6e8fbb177041371": {
-        "ticker": "ZOO",
-        "signature": "3045022100f1cec1c9fb527b070e9ed40a31b26edadce7789c9be18a4142a3d35c2a91d33302207faf1f436513f81de296c1b621159d41a042ade25a0e5e48069091b5978682cc",
-    },
-}
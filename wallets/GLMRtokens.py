@@ -1,294 +0,0 @@
-# Uniblow ERC20 list for Moonbeam generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Moonriver
-    {
-        "Tether USD (USDT)": "0xeFAeeE334F0Fd1712f9a8cc375f427D9Cdd40d73",
-        "USD Coin (USDC)": "0x931715FEE2d06333043d11F658C8CE934aC61D0c",
-        "Matic (MATIC)": "0x3405A1bd46B85c5C029483FbECf2F3E611026e45",
-        "Binance-Peg BUSD Token (BUSD)": "0xA649325Aa7C5093d12D6F98EB4378deAe68CE23F",
-        "Avalanche (AVAX)": "0x4792C1EcB969B036eb51330c63bD27899A13D84e",
-        "Dai Stablecoin (DAI)": "0x765277EebeCA2e31912C9946eAe1021199B39C61",
-        "Wrapped BTC (WBTC)": "0xE57eBd2d67B462E9926e04a8e33f01cD0D64346D",
-        "Fantom (FTM)": "0xC19281F22A075E0F10351cd5D6Ea9f0AC63d4327",
-        "Frax (FRAX)": "0x322E86852e492a7Ee17f28a78c663da38FB33bfb",
-        "Frax Share (FXS)": "0x2CC0A9D8047A5011dEfe85328a6f26968C8aaA1C",
-        "Wrapped GLMR (WGLMR)": "0xAcc15dC74880C9944775448304B263D191c6077F",
-        "BOBA Token (BOBA)": "0x18D17A9fD652D7d6a59903E23792ab97F832Ed6C",
-        "BEPRO Network (BEPRO)": "0x4EdF8E0778967012D46968ceadb75436d0426f88",
-        "XEN Crypto (mbXEN)": "0xb564A5767A00Ee9075cAC561c427643286F8F4E1",
-        "StellaSwap (STELLA)": "0x0E358838ce72d5e61E0018a2ffaC4bEC5F4c88d2",
-        "Convergence (CONV)": "0x8006320739fC281da67Ee62eB9b4Ef8ADD5C903a",
-        "Beamswap Token (GLINT)": "0xcd3B51D98478D53F4515A306bE565c6EebeF1D58",
-        "Energyfi Token (EFT)": "0xA423E7eEB60547d9C7b65005477b63ae7CE67E62",
-        "Wrapped Ether (WETH)": "0xab3f0245B83feB11d15AAffeFD7AD465a59817eD",
-        "Axelar Wrapped USDC (axlUSDC)": "0xCa01a1D0993565291051daFF390892518ACfAD3A",
-        "MoonBeans (BEANS)": "0x65b09ef8c5A096C5Fd3A80f1F7369E56eB932412",
-        "ZooDAO (ZOO)": "0x3907e6ff436e2b2B05D6B929fb05F14c0ee18d90",
-        "Cougar Token (CGS)": "0x2Dfc76901bB2ac2A5fA5fc479590A490BBB10a5F",
-        "Axelar Wrapped ATOM (axlATOM)": "0x27292cf0016E5dF1d8b37306B2A98588aCbD6fCA",
-        "Axelar Wrapped DAI (axlDAI)": "0x14dF360966a1c4582d2b18EDbdae432EA0A27575",
-        "Axelar Wrapped FRAX (axlFRAX)": "0x61C82805453a989E99B544DFB7031902e9bac448",
-        "Axelar Wrapped LUNA (LUNA)": "0x31DAB3430f3081dfF3Ccd80F17AD98583437B213",
-        "Axelar Wrapped USDT (axlUSDT)": "0xDFd74aF792bC6D45D1803F425CE62Dd16f8Ae038",
-        "Axelar Wrapped UST (UST)": "0x085416975fe14C2A731a97eC38B9bF8135231F62",
-        "Beamshare Token (SHARE)": "0x4204cAd97732282d261FbB7088e07557810A6408",
-        "Binance (BNB)": "0xc9BAA8cfdDe8E328787E29b4B078abf2DaDc2055",
-        "e-Money EUR stablecoin (EEUR)": "0xDd26a5c8Ae5b60Bb14aEcED892A052CA48A2e915",
-        "e-Money NGM staking token (NGM)": "0x08fe7A0db575c2a08d76EEcA71763E48C6e60F45",
-        "Ethereum (ETH)": "0xfA9343C3897324496A05fC75abeD6bAC29f8A40f",
-        "Frax Ether (frxETH)": "0x82bbd1b6f6De2B7bb63D3e1546e6b1553508BE99",
-        "StellaSwap Dual ETH (stellaDualETH)": "0xa3eE3a0a36Dc915fDc93062e4B386DF37d00217E",
-        "XStella (xStella)": "0x06A3b410b681c82417A906993aCeFb91bAB6A080",
-    },
-    # Moonbeam
-    {},
-    # Moonbase Alpha
-    {},
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/1284/erc20.json
-ledger_tokens = {
-    "0xffffffff52c56a9257bb97f4b2b6f7b2d624ecda": {
-        "ticker": "XCAUSD",
-        "signature": "304402207cec94e60836a6077fae808345e724452314cd063a1b4457346c70dcd67c122802207973cdb568de464a90399b39008f139ea0c82f5f262ab6176e61b47c01e1f92d",
-    },
-    "0x1581929770be3275a82068c1135b6dd59c5334ed": {
-        "ticker": "ALM",
-        "signature": "304402205ff8ad7bd7a1e51cfd1efe2fa132b4241f0c12615184dc499eacd919c2d43f4702206c8c028f66354739c8a9427b9b3179b59119878741619370b8be60cdbc929384",
-    },
-    "0xcbabee0658725b5b21e1512244734a5d5c6b51d6": {
-        "ticker": "ATH",
-        "signature": "3044022074aaf2f2d8f4a28f1e91bde933f4d45ab363a3e95571ec2b8e351aac57c6a0a302205bd74966830979374a37fcfa6e92c2513536a647b24aa609b8d37f0dafd0f108",
-    },
-    "0x9d5d41d8c03e38194a577347206f8829b9cf7c9a": {
-        "ticker": "ATHUSD",
-        "signature": "30450221009e695dbcb075a5c105e009d97299e1ea1c8ffd7ecd5320534a398c493b87f897022061f5aaef8d544a7bfff9ad33691ec1a09aaa33f76c58ead85c47cd30685de581",
-    },
-    "0x4792c1ecb969b036eb51330c63bd27899a13d84e": {
-        "ticker": "AVAX",
-        "signature": "3045022100d5f66b11c4364b11b09c04d8c5cd310cd2b453a4826c3437f07a9cf9b9608c0302202cd3f63a36da8795fa889f971db2c9f43415b4118410aaee8fcc469bdf0a4f27",
-    },
-    "0x27292cf0016e5df1d8b37306b2a98588acbd6fca": {
-        "ticker": "AXLATOM",
-        "signature": "3044022027dced919ca0ad813a4e5c7a9c06c0ba738f5c47b5a30f170660cd2c3429f3e40220379aad7470044165a17069bedbd27fb7b4ad036af614d502a69d2b8efa963c77",
-    },
-    "0x14df360966a1c4582d2b18edbdae432ea0a27575": {
-        "ticker": "AXLDAI",
-        "signature": "304402204f47b4ccd41e16ecaba6cb8e3adf42e0cd837d327019cbb8d6334b87f5e81f9602205112e08e5b43710043ad19e7b1482675b021bd116ed409d73dc0f3f64c95c33e",
-    },
-    "0x61c82805453a989e99b544dfb7031902e9bac448": {
-        "ticker": "AXLFRAX",
-        "signature": "3045022100fe36930784707556bb85503908cb7546026a0b84d476f07dcfe4cf7fdf1c92ea02205809ce396e55dcc4662cb39ae715665b1294dba3a4881bddef6d2b5c24c832dc",
-    },
-    "0x31dab3430f3081dff3ccd80f17ad98583437b213": {
-        "ticker": "LUNA",
-        "signature": "3045022100d22575827536c2d1ce20fbd2c2e2f9a2c62d318a835e2591a5ef4dafee337282022050ad850bcb5b3fc6dc85d6107c4d29d1e02c947f479571d419d83dc6282d2135",
-    },
-    "0xca01a1d0993565291051daff390892518acfad3a": {
-        "ticker": "AXLUSDC",
-        "signature": "30450221008f40aace27f9f243d71360cdb898928eda13548ac3a82854930cd572053952220220632d02d50ca270ce33788002d44be8cf5ce3cf5777c70d6394074045f5255f6b",
-    },
-    "0xdfd74af792bc6d45d1803f425ce62dd16f8ae038": {
-        "ticker": "AXLUSDT",
-        "signature": "304502210087355c9ff6018dcf32a6be979e8c21338f9b872f022a818a8402f57b073acdf002202830e2fb201fb8e95f209309fb3640067144f49b71eff4a8c419292b5ef751d9",
-    },
-    "0x085416975fe14c2a731a97ec38b9bf8135231f62": {
-        "ticker": "UST",
-        "signature": "30440220340b22914f4a8782df447bd692e6e4df722ee0d2e366ea6f5bc7beccc00e8610022047f3a2ad0ba1a18374fc7035aa125d8c7c436afc24d37f93cb74761213366f51",
-    },
-    "0x4204cad97732282d261fbb7088e07557810a6408": {
-        "ticker": "SHARE",
-        "signature": "3045022100830561a3b711ccce338d5acab31169dfa878e2b2d69bf504f89c6bdaef2503cf02202ce33d76d72c7b201c0bd9c68ab9a61ab422294f967cb6911076dad4d5bfeaf2",
-    },
-    "0xcd3b51d98478d53f4515a306be565c6eebef1d58": {
-        "ticker": "GLINT",
-        "signature": "3045022100e206b65cf4d74ef2bc4f7fac87e8340dd3b31cd6837b153acdfeab09841cb7290220119d3cee6f0e3287df60ac030ebcaaca83bfec03554c0dbabdd395993b090f4b",
-    },
-    "0x4edf8e0778967012d46968ceadb75436d0426f88": {
-        "ticker": "BEPRO",
-        "signature": "304402201c9d5a97a033a70d3284e8fbabf2b6d9e4133316c9bbc9d56f33d6a8cd96c11202205995928828e94ccf7b01f86d6402ee9206a85ae9ed4b95a642fddd4d63dd04bc",
-    },
-    "0xc9baa8cfdde8e328787e29b4b078abf2dadc2055": {
-        "ticker": "BNB",
-        "signature": "3045022100927eb8ed4ebd3a3d60fc90ffc03cad2d39f09c168ee7e5a1daf54f1f39517961022000ffe4720841cdabd6fd5309c5dc9d7f20b827e011848ba3bf52cf50de58fc76",
-    },
-    "0xa649325aa7c5093d12d6f98eb4378deae68ce23f": {
-        "ticker": "BUSD",
-        "signature": "3044022073baec1cbd51e18b4728b71c96aae0946c2553b3f62ae666155f115a27a99d5d022071b523c28e2258aeb9b8ef3f883bc02509fefc572a0e974853d790721a2037d0",
-    },
-    "0x18d17a9fd652d7d6a59903e23792ab97f832ed6c": {
-        "ticker": "BOBA",
-        "signature": "3044022011d940aae6180d7917af55e0f8e4756f4d5d66518ba302e9b3ee672299333d74022065a9344f77a836de8a883dbae45c292e0807ebe449f5b6ffef37e5c63d2afd22",
-    },
-    "0x8006320739fc281da67ee62eb9b4ef8add5c903a": {
-        "ticker": "CONV",
-        "signature": "30440220566617fb254683585be9bf84ef6243e1cab7e31a2420d5982076bc80aaeb418402201406dd54c4bc0abae41e50fea017c11f9f1e34cc639ee6f3e33ac2672ae56f37",
-    },
-    "0x2dfc76901bb2ac2a5fa5fc479590a490bbb10a5f": {
-        "ticker": "CGS",
-        "signature": "304402205b7d2eb42e95fc401b95f8d8503af36c531ef3aecef1848df3d5123ad6bfd05202202980b9c5db64cfaa5ba2be4ef6fdbe6cd93c98ca0f208d0d684b8215de2896d7",
-    },
-    "0x765277eebeca2e31912c9946eae1021199b39c61": {
-        "ticker": "DAI",
-        "signature": "3045022100dcff3d7c044ae02dd1a492d1ce014de26443a1b4ef28236f8641bc3fd93bbfe8022008a8c6b445dd55848570d84ed854d1d44fc11879375fad67d822a7cc94350031",
-    },
-    "0x5b08c27c10927ecd8b75edd8e16cfc448d4bf1e4": {
-        "ticker": "RUM",
-        "signature": "3045022100fbec4177a2646abd8daede1b2d115bcde7d888d6df4d29b049e9fd119343254c022022c47bdb76fd904211bf13497100d375b37793c8a50720a685cf2dfe854a35ad",
-    },
-    "0x2758b57e3c052ae2b66be2e175c8f1980723d7af": {
-        "ticker": "DOUBLOON",
-        "signature": "3044022078bf0c6a58dcc18b6f49f59f34e346de362d5c4595f4007264be75a60ce99a4202206aef2852dd1fb68a6fc3267524de03d73f917fea10e64595e179b68a53aa9e85",
-    },
-    "0xdd26a5c8ae5b60bb14aeced892a052ca48a2e915": {
-        "ticker": "EEUR",
-        "signature": "3045022100fda4a863fe819622e02e85a96d0d0309e9710c89206975ac9b60c1c41ae13da0022041f509cecb02bce355e4e83980d111e7592c212c8877e195cc80f9c9e77d4653",
-    },
-    "0x08fe7a0db575c2a08d76eeca71763e48c6e60f45": {
-        "ticker": "NGM",
-        "signature": "3045022100f3b0477cb4f091bfb9269b1792a4dce5b0c30af63d1bfcc0a3a7e022690c61d7022029237f9854c73cde1a26ec117621126a41b23977a81d3eb3f13ec686aaaf5209",
-    },
-    "0xa423e7eeb60547d9c7b65005477b63ae7ce67e62": {
-        "ticker": "EFT",
-        "signature": "304402203fad3334b1b22aed4906b0402e51389dd8e8b8ad626d6d09f8585686fcd5695002205ab93f94e14c752b2dd582e1bac9df9d9108b5cc5336c46517ecbc8104d8c4e7",
-    },
-    "0xfa9343c3897324496a05fc75abed6bac29f8a40f": {
-        "ticker": "ETH",
-        "signature": "3045022100db20de2599fb1a5ceab4d2a29c1e5fa1e2512fb5249e57225ba0a487569382d60220588c3c08c5729369b0f5f175523271e3719c9a7773f2144c178e0ef09431610a",
-    },
-    "0xc19281f22a075e0f10351cd5d6ea9f0ac63d4327": {
-        "ticker": "FTM",
-        "signature": "3045022100f118016bd34d9facb6b7f937092f9e8cd4ddb61df313925fdee82a338aee10ba02206ee395afcb4b0f5d62fd519c8351f218a062d03dd9d73fd38a7a3191cb6d5c99",
-    },
-    "0xe3e43888fa7803cdc7bea478ab327cf1a0dc11a7": {
-        "ticker": "FLARE",
-        "signature": "304402201e85824454003992a4c82cf833802906a14d0d1b2ff37373ab6f27c627bbd3db02204b525300c8ef1209b3563298a840aa051fd656c54a03cc7ffba0da27f12b15b2",
-    },
-    "0x322e86852e492a7ee17f28a78c663da38fb33bfb": {
-        "ticker": "FRAX",
-        "signature": "3045022100f0d0a7f18e04f0407e979b0708d4453e747004578b80ff4124b124de2ec8334702200cd09e807e85381ee95855fef6bcd1727bbec83f2aefc757b7d7a71922ef466a",
-    },
-    "0x82bbd1b6f6de2b7bb63d3e1546e6b1553508be99": {
-        "ticker": "FRXETH",
-        "signature": "3044022065ef1dc33fc8692de1782d0e9e6862155ff4802a6ada8d30a9767e78934d53c1022042b13ed77da3de0de1937956ca7ff4fc7bdc34efdcc6743bf982eda62821aca8",
-    },
-    "0x2cc0a9d8047a5011defe85328a6f26968c8aaa1c": {
-        "ticker": "FXS",
-        "signature": "30440221008c17f21a0f0616714e3e2b6fcad529de35ee66326cab74d4631de5ea4b470374021f7daafc3992392189d9d1c3bd6aff44be9c48060efc2e6a52d83b47f5afc288",
-    },
-    "0x637e92c6d172e9e36dae90ebe496241817d05b7d": {
-        "ticker": "WHEX",
-        "signature": "3045022100d0207fa53c97bbf115d3ee94df5cf2547f35d437fe8a4e8e365b4bb58297ee6c0220348c627c0e3aecf6b49a9d6b31322310e001bae10550d7a8f82eac404c80a398",
-    },
-    "0x823d826d3ab6956ba934893f325e7c323faaf6ca": {
-        "ticker": "HPO",
-        "signature": "304402207e8fb5e0f082714f7fa7eb2525dbdd5db29395461b3e14233c324f48ecd36ffc02207236ed560870b53bc97cfd6a932db54083decfa870f363ca3404f81cf395c03d",
-    },
-    "0xdfa46478f9e5ea86d57387849598dbfb2e964b02": {
-        "ticker": "MAI",
-        "signature": "304402207d0d097a6ab6ed885154af75d36af31364a084dd732e8827c881b14f4da8170002201e178117e4152189fb580da271f0fcd2a25f1210393cde95c37680c90b058516",
-    },
-    "0x0d2faa2064129ecbfaccd45be33dea3bcd3f8863": {
-        "ticker": "MARA",
-        "signature": "3045022100c9481f2d57575f4497ddd8b5486fe4af6b6a299c9ec04c9b624380aec056132f022035c32b37f01cfbc739d5cb0b37a7d07f84676f76dda81a4c931e06aa4978da59",
-    },
-    "0x3405a1bd46b85c5c029483fbecf2f3e611026e45": {
-        "ticker": "MATIC",
-        "signature": "3045022100b6c3595f1d4bf3cbfffc42fed6a44ff4a09b5a51568ebcab0ba2fa4651b2de4e02201c3f0d31161ba79a8b7df5d6d2624d58b60c487658d25b112ef1d36182a2cba6",
-    },
-    "0x65b09ef8c5a096c5fd3a80f1f7369e56eb932412": {
-        "ticker": "BEANS",
-        "signature": "304402207acb61b3cee9aac9e558e8eae39f312a3c8f147a47816dfd1072e1bccdd5e8e802206eaa074ab893cd54b20ff463b157369bd7991700bcbbaca09beb73c86a17442b",
-    },
-    "0xffffffff63d24ecc8eb8a7b5d0803e900f7b6ced": {
-        "ticker": "XCPHA",
-        "signature": "3045022100fd4d403d811b4cde327641e619062373f7b6c5d9c9bacc8e109b35b847285c3602201d7fb4ec2dfb0ba07d95a2c2d4803b97c6029a8c221a6f505e73f35ccac3bb91",
-    },
-    "0x524d524b4c9366be706d3a90dcf70076ca037ae3": {
-        "ticker": "RMRK",
-        "signature": "304502210096714af3b7ae3d3f4c3feb7f39378b0e762cf2c202cf11771c659d8c5192e9d40220496f676538cfa1ca4b7d838436fe27df3a1f19fb37b8cc9c6d64784ae19a6e6c",
-    },
-    "0x2933cd38d7c45b88c27b3e6aed6b3f4f60b98044": {
-        "ticker": "USBL",
-        "signature": "3044022060ea08edbf106a17661cc376a27040acc1e66c8e4a204b1025e9aecff905dcd002206cd0318f0b32530ddf8f3bf9c310d8813b2d339f0c2048bdc69ed1fc95f31c3a",
-    },
-    "0x6bd193ee6d2104f14f94e2ca6efefae561a4334b": {
-        "ticker": "SOLAR",
-        "signature": "3045022100b05d671dbf9ef3791c56b6e84c4f8af665db96495d78437e8dbda524f94c7ff20220099d243d2335f8407896d59a185e37fa40266ce0db6eb0e2ceb96b5aff54b094",
-    },
-    "0xecf91116348af1cffe335e9807f0051332be128d": {
-        "ticker": "SFRXETH",
-        "signature": "3045022100a4ab8ac3c13c6f2c25324696e609fad0950cdcdbd9ced4bd97cc851ccf2888e102201500098de3e5234f8f8943f82856a6195dce1a278b4c52b27c8539981de7ad17",
-    },
-    "0x89f52002e544585b42f8c7cf557609ca4c8ce12a": {
-        "ticker": "SROME",
-        "signature": "3045022100d1a5c9d9c1b699487baacb7bd9d5efda854d3fdd00953af0086b18224296fffe022014eeff1afabf7fd5623ae9c1825f8571ea9b17cc3728dbd48924d647c7c4a486",
-    },
-    "0x97513e975a7fa9072c72c92d8000b0db90b163c5": {
-        "ticker": "STATIK",
-        "signature": "304502210088b2d2f9a0714cb0f019ae41451ffd597fa32da16f9edb857f9ad0a51d5c252102206846aef40dc3ff19b85657668235bcf99be8d460600ae694be82e1b73395325a",
-    },
-    "0x0e358838ce72d5e61e0018a2ffac4bec5f4c88d2": {
-        "ticker": "STELLA",
-        "signature": "30440220059dd67a36c013f0b7fd53bee0fff4c3a95afed887911938e1c4b994c13b67b702206431842aed7bb84e53886f6f38eee65b125448a2e12edceb6b03ed7444b1607b",
-    },
-    "0xffffffff43b4560bc0c451a3386e082bff50ac90": {
-        "ticker": "XCSUB",
-        "signature": "304402204e44c14c2fda4437a4fa849a0d09852fbbb6b324e2e9ce1e9c1456c11ec99d4f02200c989c297fd5384500f3106f9402f627dcd2d4b2ce76f16e0b5b35a7555d1c45",
-    },
-    "0xefaeee334f0fd1712f9a8cc375f427d9cdd40d73": {
-        "ticker": "USDT",
-        "signature": "3045022100d8ec2246e1ac69364a50376f85f5e45149462559181eca3e047aefce91e8b39602204cc0e9617d98e292d19a52bc7ff0cb45b5179835e5e51656ac2c1d2ace6f28ff",
-    },
-    "0x735abe48e8782948a37c7765ecb76b98cde97b0f": {
-        "ticker": "THO",
-        "signature": "3045022100ffafe00c0d7b09d775e86f65b683c748dd2813d9b15f1e77860d36f41c586f6e022067c26dddbf418f08ae735a7bcc113012eab226d59261c3d6ceda153a7dacd686",
-    },
-    "0x0e67601818237834ff8a280312a6f4f4934e6283": {
-        "ticker": "TMAP",
-        "signature": "304402205e8d190f10cda5350562cce0d8fa13676359d5bc9df4277c9ea2e1fde81aa8f002202c9715158a5001bfd3252302276663fba14fc4e3bb515d2908253b47231ee571",
-    },
-    "0x818ec0a7fe18ff94269904fced6ae3dae6d6dc0b": {
-        "ticker": "USDC",
-        "signature": "304402203069ee485bada7b9b95c5d711d61bfa7676bf59ff190df758e7e05068ed2b87402200a21a05ccc2f12e6afe5294f61193d6e4fa0dd15aa69a7d4e8f71b38f3d79bb1",
-    },
-    "0x511ab53f793683763e5a8829738301368a2411e3": {
-        "ticker": "WELL",
-        "signature": "30450221008f6cd50a91048ab2c45eeede1ef9c6260872c42d0193a2fbb0478e90d0c658bf022074bb72f001d806de54ddc680accae3711d6d8051cba040ddc54a2e094fe03d70",
-    },
-    "0x8389cf5be8f1e56211d226668a8b8f6cade61ee4": {
-        "ticker": "WELLE",
-        "signature": "304402207c0b8c6138bf5f9a3e5da27de884976014c41a6d1257840fa091c30b2f207e08022072ef6ada0aa2f188d3bbbec0e96833f947cac7574f661ce7583c55ac8dece950",
-    },
-    "0xe57ebd2d67b462e9926e04a8e33f01cd0d64346d": {
-        "ticker": "WBTC",
-        "signature": "3044022002d1d13d30a9a49f7f1eb57ff68992f3d9141021280567ba583232f96a62ac51022069e10294b1e1652eae54365f0dc55c7eef50db94011f1dee27a72a4054d90913",
-    },
-    "0xab3f0245b83feb11d15aaffefd7ad465a59817ed": {
-        "ticker": "WETH",
-        "signature": "3045022100bcd6bdb50a890b7c10c3f66be24c6bdc456d5ff6c7eb04496c71c7c4be4bc8a10220609bb3ae2a2f992e60100c4877fdf36ff75977f165cc3a16ed9d3b76fb72f77f",
-    },
-    "0xacc15dc74880c9944775448304b263d191c6077f": {
-        "ticker": "WGLMR",
-        "signature": "3045022100887e24a7a4f04ed8b1b6670650a15f9811e1f81d0aac55639fa93c148dc3785d0220510ff1d1d90c1fd9d9352b8ea2ed1cc526449a5a6886b1e868e589ad8efa8642",
-    },
-    "0xffffffff1fcacbd218edc0eba20fc2308c778080": {
-        "ticker": "XCDOT",
-        "signature": "304402203247a704ac50ab3301e944c6da8bdc837b9d88ea159b8a02d7eb59b75d909a220220309f2a8dce45d022bfc62be5918df650f17b04b2fbf0b00bc86c35c8b7ab0ed4",
-    },
-    "0xb564a5767a00ee9075cac561c427643286f8f4e1": {
-        "ticker": "MBXEN",
-        "signature": "304402202179630119f465508d455f8a66898ece1324b9e91925d052f1bfc2670a5f1c97022050e49709718f0bf685022d7de028103be0b3d0f3cf8960759d7063d8ba784992",
-    },
-    "0x06a3b410b681c82417a906993acefb91bab6a080": {
-        "ticker": "XSTELLA",
-        "signature": "3044022042cb254f86a64b38a53a0df55333ab6277dcc7224805a7aadeba7d8a51659ec0022030db8768a75bc4ddd3d500a35957268e8989952a1f991fa523e2bde2f3ad143d",
-    },
-    "0x8bd5180ccdd7ae4af832c8c03e21ce8484a128d4": {
-        "ticker": "ZOOM",
-        "signature": "304402207c45608087042a987f4ddba6251c41481cc1dca98084965c22ad0229b7f33c01022074aaf6d0a81382a92ef5e64e551e46e09283719e35fa62f565987650840c2dc5",
-    },
-}
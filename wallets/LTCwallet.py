@@ -17,7 +17,6 @@
 
 import json
 import urllib.parse
-import urllib.request
 import re
 import logging
 
@@ -25,13 +24,20 @@ import cryptolib.coins
 from cryptolib.base58 import decode_base58
 from cryptolib.bech32 import test_bech32
 from cryptolib.cryptography import compress_pubkey, sha2, encode_der_s
+from wallets.http_transport import request as http_request
 from wallets.name_service import resolve
+from wallets.utxo_discovery import AccountDiscovery, account_path, DEFAULT_GAP_LIMIT
 from wallets.wallets_utils import balance_string, shift_10, NotEnoughTokens
 
 
 logger = logging.getLogger(__name__)
 
 
+# blockcypher free tier is limited to 3 requests per second
+BLOCKCYPHER_WORKERS = 2
+BLOCKCYPHER_INTERVAL = 0.35
+
+
 class blockcypher_api:
     def __init__(self, network):
         self.url = "https://api.blockcypher.com/v1/ltc/main/"
@@ -48,21 +54,12 @@ class blockcypher_api:
         if params_enc:
             url += f"?{params_enc}"
         try:
-            req = urllib.request.Request(
-                url,
-                headers={"User-Agent": "Mozilla/5.0"},
-                data=data,
-            )
-            self.webrsc = urllib.request.urlopen(req)
-            brep = self.webrsc.read()
+            brep = http_request(url, data=data, headers={"User-Agent": "Mozilla/5.0"})
             if len(brep) == 64 and brep[0] != ord("{"):
                 brep = b'{"txid":"' + brep + b'"}'
             self.jsres = json.loads(brep)
-        except urllib.error.HTTPError as e:
-            strerr = e.read()
-            raise IOError(f"{e.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as e:
-            raise IOError(e)
+        except IOError:
+            raise
         except Exception:
             raise IOError("Error while processing request:\n" f"{url}")
 
@@ -86,6 +83,14 @@ class blockcypher_api:
             )
         return selutxos
 
+    def get_txcount(self, addr):
+        self.getData("addrs", f"{addr}/balance")
+        self.checkapiresp()
+        tx_count = self.getKey("final_n_tx")
+        if not isinstance(tx_count, int):
+            raise IOError("Invalid transactions count in the API response")
+        return tx_count
+
     def pushtx(self, txhex):
         self.getData("txs", "push", data=f'{{"tx": "{txhex}"}}'.encode("ascii"))
         self.checkapiresp()
@@ -148,31 +153,45 @@ class LTCwalletCore:
             self.testnet = True
         self.segwit = segwit_option
         self.pubkey = compress_pubkey(pubkey).hex()
-        if self.segwit == 0:
-            self.address = cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtoaddr(
-                self.pubkey
-            )
-        elif self.segwit == 1:
-            self.address = cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtop2w(
-                self.pubkey
-            )
-        elif self.segwit == 2:
-            self.address = cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtosegwit(
-                self.pubkey
-            )
-        else:
-            raise Exception("Not valid segwit option")
+        self.address = self.pubkey_address(self.pubkey)
         self.api = api
+        # AccountDiscovery, when the device can provide the account node
+        self.discovery = None
 
-    def getutxos(self, nconf=0):
+    def pubkey_address(self, pubkey_hex):
+        """Address in the wallet format for a public key"""
+        if self.segwit == 0:
+            return cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtoaddr(pubkey_hex)
+        if self.segwit == 1:
+            return cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtop2w(pubkey_hex)
+        if self.segwit == 2:
+            return cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).pubtosegwit(pubkey_hex)
+        raise Exception("Not valid segwit option")
+
+    def getutxos(self, nconf=0, refresh=False):
+        if self.discovery is not None:
+            # All the account addresses, from the last scan when recent enough
+            return self.discovery.get_state(nconf, refresh).utxos
         return self.api.getutxos(self.address, nconf)
 
+    def change_address(self):
+        if self.discovery is not None:
+            return self.discovery.change_key()["address"]
+        return self.address
+
+    def input_script(self, pubkey_hex):
+        if self.segwit == 0:
+            return cryptolib.coins.mk_pubkey_script(self.pubkey_address(pubkey_hex))
+        if self.segwit == 2 or self.segwit == 1:
+            return cryptolib.coins.mk_p2wpkh_scriptcode(pubkey_hex)
+        raise Exception("Not valid segwit option")
+
     def getbalance(self):
         utxos = self.getutxos()
         return self.balance_fmutxos(utxos)
 
     def prepare(self, toaddr, paymentvalue, fee):
-        utxos = self.getutxos()
+        utxos = self.getutxos(refresh=True)
         balance = self.balance_fmutxos(utxos)
         maxspendable = balance - fee
         if paymentvalue > maxspendable or paymentvalue < 0:
@@ -186,24 +205,22 @@ class LTCwalletCore:
         if toaddr.startswith("ltc1") or toaddr.startswith("tltc1"):
             outs[0]["new_segwit"] = True
         if changevalue > 0:
-            outs.append({"value": changevalue, "address": self.address})
+            outs.append({"value": changevalue, "address": self.change_address()})
             if self.segwit == 1:
                 outs[-1]["segwit"] = True
             if self.segwit == 2:
                 outs[-1]["new_segwit"] = True
         self.tx = cryptolib.coins.litecoin.Litecoin(testnet=self.testnet).mktx(inputs, outs)
-        if self.segwit == 0:
-            script = cryptolib.coins.mk_pubkey_script(self.address)
-        elif self.segwit == 2 or self.segwit == 1:
-            script = cryptolib.coins.mk_p2wpkh_scriptcode(self.pubkey)
-        else:
-            raise Exception("Not valid segwit option")
+        # Each input can be from a different address of the account
+        self.inputs_pubkeys = [utxo.get("pubkey", self.pubkey) for utxo in inputs]
+        self.inputs_paths = [utxo.get("path") for utxo in inputs]
 
         # Finish tx
         # Sign each input
         self.leninputs = len(inputs)
         datahashes = []
         for i in range(self.leninputs):
+            script = self.input_script(self.inputs_pubkeys[i])
             signing_tx = cryptolib.coins.signature_form(
                 self.tx, i, script, cryptolib.coins.SIGHASH_ALL
             )
@@ -213,14 +230,15 @@ class LTCwalletCore:
     def send(self, signatures):
         for i in range(self.leninputs):
             signature_der_hex = signatures[i].hex() + "01"
+            input_pubkey = self.inputs_pubkeys[i]
             if self.segwit == 0:
                 self.tx["ins"][i]["script"] = cryptolib.coins.serialize_script(
-                    [signature_der_hex, self.pubkey]
+                    [signature_der_hex, input_pubkey]
                 )
             if self.segwit > 0:
                 if self.segwit == 1:
                     self.tx["ins"][i]["script"] = cryptolib.coins.mk_p2wpkh_redeemscript(
-                        self.pubkey
+                        input_pubkey
                     )
                 elif self.segwit == 2:
                     self.tx["ins"][i]["script"] = ""
@@ -230,7 +248,7 @@ class LTCwalletCore:
                     {
                         "number": 2,
                         "scriptCode": cryptolib.coins.serialize_script(
-                            [signature_der_hex, self.pubkey]
+                            [signature_der_hex, input_pubkey]
                         ),
                     }
                 )
@@ -290,11 +308,28 @@ class LTC_wallet:
         ],
     ]
 
-    def __init__(self, network, wtype, device):
+    def __init__(self, network, wtype, device, gap_limit=DEFAULT_GAP_LIMIT):
         self.current_device = device
         pubkey = self.current_device.get_public_key()
         network_name = self.networks[network]
         self.ltc = LTCwalletCore(pubkey, network_name, wtype, blockcypher_api(network_name))
+        if getattr(self.current_device, "is_HD", False):
+            # Watch all the account addresses when the device provides the account node
+            self.key_path = self.get_path(network, wtype, device.legacy_derive).format(
+                device.get_account(), device.get_address_index()
+            )
+            acc_path = account_path(self.key_path)
+            account_node = device.get_account_node(acc_path, self.get_key_type(wtype))
+            if account_node is not None:
+                self.ltc.discovery = AccountDiscovery(
+                    acc_path,
+                    account_node,
+                    self.ltc.pubkey_address,
+                    lambda: blockcypher_api(network_name),
+                    gap_limit,
+                    BLOCKCYPHER_WORKERS,
+                    BLOCKCYPHER_INTERVAL,
+                )
 
     @classmethod
     def get_networks(cls):
@@ -306,8 +341,8 @@ class LTC_wallet:
 
     @classmethod
     def get_path(cls, network_name, wtype, legacy):
-        # First path
-        # To be changed to the first one available, needs scanning
+        # First path of the account
+        # Other used addresses are found with AccountDiscovery, when available
         return cls.derive_paths[network_name][wtype]
 
     @classmethod
@@ -336,16 +371,20 @@ class LTC_wallet:
 
     def raw_tx(self, amount, fee, to_account):
         msgs_to_sign = self.ltc.prepare(to_account, amount, fee)
+        if not self.current_device.on_device_check:
+            msgs_to_sign = [sha2(msg) for msg in msgs_to_sign]
         tx_signatures = []
-        for msg in msgs_to_sign:
-            if not self.current_device.on_device_check:
-                msg = sha2(msg)
-            asig = self.current_device.sign(msg)
-            if self.current_device.provide_parity:
-                # asig : v,r,s turn into DER
-                asig = encode_der_s(asig[1], asig[2], "K1")
-                # Even msg before hash is a hash, to be modified
-            tx_signatures.append(asig)
+        try:
+            # Inputs can be from other addresses of the account
+            for asig in self.current_device.sign_stream(msgs_to_sign, self.ltc.inputs_paths):
+                if self.current_device.provide_parity:
+                    # asig : v,r,s turn into DER
+                    asig = encode_der_s(asig[1], asig[2], "K1")
+                tx_signatures.append(asig)
+        finally:
+            if any(self.ltc.inputs_paths):
+                # Back to the wallet key
+                self.current_device.derive_key(self.key_path, "K1")
         return self.ltc.send(tx_signatures)
 
     def assess_fee(self, fee_priority):
@@ -1,6208 +0,0 @@
-# Uniblow ERC20 list for Polygon generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "Wrapped MATIC (WMATIC)": "0x0d500b1d8e8ef31e21c99d1db9a6444d3adf1270",
-        "Wrapped Ether (WETH)": "0x7ceb23fd6bc0add59e62ac25578270cff1b9f619",
-        "Wrapped BTC (WBTC)": "0x1bfd67037b42cf73acf2047067bd4f2c47d9bfd6",
-        "Tether USD (USDT)": "0xc2132D05D31c914a87C6611C10748AEb04B58e8F",
-        "USD Coin (USDC)": "0x2791Bca1f2de4661ED88A30C99A7a9449Aa84174",
-        "Binance Dollar (BUSD)": "0xdab529f40e671a1d4bf91361c21bf9f0c9712ab7",
-        "Dai Stablecoin (DAI)": "0x8f3cf7ad23cd3cadbd9735aff958023239c6a063",
-        "BNB (BNB)": "0x3BA4c387f786bFEE076A58914F5Bd38d668B42c3",
-        "Jarvis EUR (jEUR)": "0x4e3decbb3645551b8a19f0ea1678079fcb33fb4c",
-        "Jarvis GBP (jGBP)": "0x767058F11800FBA6A682E73A6e79ec5eB74Fac8c",
-        "Jarvis CHF (jCHF)": "0xbD1463F02f61676d53fd183C2B19282BFF93D099",
-        "Jarvis SGD (jSGD)": "0xa926db7a4cc0cb1736d5ac60495ca8eb7214b503",
-        "Jarvis PHP (jPHP)": "0x486880FB16408b47f928F472f57beC55AC6089d1",
-        "Jarvis CAD (jCAD)": "0x8ca194A3b22077359b5732DE53373D4afC11DeE3",
-        "Jarvis CAD (jAUD)": "0xCB7F1Ef7246D1497b985f7FC45A1A31F04346133",
-        "Jarvis JPY (jJPY)": "0x8343091F2499FD4b6174A46D067A920a3b851FF9",
-        "Jarvis BGN (jBGN)": "0x60e91fc3a60362ca44aea0263dbc4b96302f6ade",
-        "Jarvis XAF (jXAF)": "0x98fab5d1366de24f152ea683a1f23338351c47ea",
-        "Jarvis XOF (jXOF)": "0x4A1E068BC23fAeC08a5817A2A58258e3378d36f0",
-        "SAND (SAND)": "0xBbba073C31bF03b8ACf7c28EF0738DeCF3695683",
-        "SHIBA INU (SHIB)": "0x6f8a06447Ff6FcF75d803135a7de15CE88C1d4ec",
-        "Avalanche Token (AVAX)": "0x2C89bbc92BD86F8075d1DEcc58C7F4E0107f286b",
-        "Uniswap (UNI)": "0xb33EaAd8d922B1083446DC23f610c2567fB5180f",
-        "ChainLink Token (LINK)": "0x53E0bca35eC356BD5ddDFebbD1Fc0fD03FaBad39",
-        "Bitfinex LEO Token (LEO)": "0x06D02e9D62A13fC76BB229373FB3BBBD1101D2fC",
-        "Lido DAO Token (LDO)": "0xC3C7d422809852031b44ab29EEC9F1EfF2A58756",
-        "Cronos Coin (CRO)": "0xAdA58DF0F643D959C2A47c9D4d4c1a4deFe3F11C",
-        "ApeCoin (APE)": "0xB7b31a6BC18e48888545CE79e83E06003bE70930",
-        "Graph Token (GRT)": "0x5fe2B58c013d7601147DcdD68C143A77499f5531",
-        "Fantom Token (FTM)": "0xC9c1c1c20B3658F8787CC2FD702267791f224Ce1",
-        "Decentraland (MANA)": "0xA1c57f48F0Deb89f569dFbE6E2B7f46D33606fD4",
-        "Theta Token (THETA)": "0xB46E0ae620EFd98516f49bb00263317096C114b2",
-        "TrueUSD (TUSD)": "0x2e1AD108fF1D8C782fcBbB89AAd783aC49586756",
-        "Aave (AAVE)": "0xD6DF932A45C0f255f85145f286eA0b292B21C90B",
-        "Frax (FRAX)": "0x45c32fA6DF82ead1e2EF74d17b76547EDdFaFF89",
-        "Synthetix Network Token (SNX)": "0x50B728D8D964fd00C2d0AAD81718b71311feF68a",
-        "Frax Share (FXS)": "0x1a3acf6D19267E2d3e7f898f42803e90C9219062",
-        "Rocket Pool (RPL)": "0x7205705771547cF79201111B4bd8aaF29467b9eC",
-        "HuobiToken (HT)": "0xFAD65Eb62a97fF5Ed91B23aFD039956aaCa6e93b",
-        "Maker (MKR)": "0x6f7C932e7684666C9fd1d44527765433e01fF61d",
-        "Paxos Standard (PAX)": "0x6F3B3286fd86d8b47EC737CEB3D0D354cc657B3e",
-        "CRV (CRV)": "0x172370d5Cd63279eFa6d502DAB29171933a610AF",
-        "chiliZ (CHZ)": "0xf1938Ce12400f9a761084E7A80d37e732a4dA056",
-        "Decentralized USD (USDD)": "0xFFA4D863C96e743A2e1513824EA006B8D0353C57",
-        "SingularityNET Token (AGIX)": "0x190Eb8a183D22a4bdf278c6791b152228857c033",
-        "Gemini dollar (GUSD)": "0xC8A94a3d3D2dabC3C1CaffFFDcA6A7543c3e3e65",
-        "Fetch (FET)": "0x7583FEDDbceFA813dc18259940F76a02710A8905",
-        "EnjinCoin (ENJ)": "0x7eC26842F195c852Fa843bB9f6D8B583a274a157",
-        "1INCH Token (1INCH)": "0x9c2C5fd7b07E95EE044DDeba0E97a665F142394f",
-        "Paxos Gold (PAXG)": "0x553d3D295e0f695B9228246232eDF400ed3560B5",
-        "Render Token (RNDR)": "0x61299774020dA444Af134c82fa83E3810b309991",
-        "LoopringCoin V2 (LRC)": "0x84e1670F61347CDaeD56dcc736FB990fBB47ddC1",
-        "BAT (BAT)": "0x3Cef98bb43d732E2F285eE605a8158cDE967D219",
-        "Wootrade Network (WOO)": "0x1B815d120B3eF02039Ee11dC2d33DE7aA4a8C603",
-        "Nexo (NEXO)": "0x41b3966B4FF7b427969ddf5da3627d6AEAE9a48E",
-        "HoloToken (HOT)": "0x0C51f415cF478f8D08c246a6C6Ee180C5dC3A012",
-        "Compound (COMP)": "0x8505b9d2254A7Ae468c0E9dd10Ccea3A837aef5c",
-        "yearn.finance (YFI)": "0xDA537104D6A5edd53c6fBba9A898708E465260b6",
-        "Ankr (ANKR)": "0x101A023270368c0D50BFfb62780F4aFd4ea79C35",
-        "Amp (AMP)": "0x0621d647cecbFb64b79E44302c1933cB4f27054d",
-        "Injective Token (INJ)": "0x4E8dc2149EaC3f3dEf36b1c281EA466338249371",
-        "Balancer (BAL)": "0x9a71012B13CA4d3D0Cdc72A177DF3ef03b0E76A3",
-        "Gnosis (GNO)": "0x5FFD62D3C3eE2E81C00A7b9079FB248e7dF024A8",
-        "Golem Network Token (GLM)": "0x0B220b82F3eA3B7F6d9A1D8ab58930C064A2b5Bf",
-        "Polymath (POLY)": "0xcB059C5573646047D6d88dDdb87B745C18161d3b",
-        "Mask Network (MASK)": "0x2B9E7ccDF0F4e5B24757c1E1a80e311E34Cb10c7",
-        "IoTeX Network (IOTX)": "0xf6372cDb9c1d3674E83842e3800F2A62aC9F3C66",
-        "SushiToken (SUSHI)": "0x0b3F868E0BE5597D5DB7fEB59E1CADBb0fdDa50a",
-        "Swipe (SXP)": "0x6aBB753C1893194DE4a83c6e8B4EadFc105Fd5f5",
-        "BandToken (BAND)": "0xA8b1E0764f85f53dfe21760e8AfE5446D82606ac",
-        "Ocean Token (OCEAN)": "0x282d8efCe846A88B159800bd4130ad77443Fa1A1",
-        "Synapse (SYN)": "0xf8F9efC0db77d8881500bb06FF5D6ABc3070E695",
-        "ZRX (ZRX)": "0x5559Edb74751A0edE9DeA4DC23aeE72cCA6bE3D5",
-        "OMG Network (OMG)": "0x62414D03084EeB269E18C970a21f45D2967F0170",
-        "Gains Network (GNS)": "0xE5417Af564e4bFDA1c483642db72007871397896",
-        "Dogelon (ELON)": "0xE0339c80fFDE91F3e20494Df88d4206D86024cdF",
-        "SwissBorg (CHSB)": "0x67Ce67ec4fCd4aCa0Fcb738dD080b2a21ff69D75",
-        "Celsius (CEL)": "0xD85d1e945766Fea5Eda9103F918Bd915FbCa63E6",
-        "Energy Web Token Bridged (EWTB)": "0x43E4B063F96c33F0433863A927F5bad34bb4B03d",
-        "Livepeer Token (LPT)": "0x3962F4A0A0051DccE0be73A7e09cEf5756736712",
-        "Telcoin (TEL)": "0xdF7837DE1F2Fa4631D716CF2502f8b230F1dcc32",
-        "StargateToken (STG)": "0x2F6F07CDcf3588944Bf4C42aC74ff24bF56e7590",
-        "UMA Voting Token v1 (UMA)": "0x3066818837c5e6eD6601bd5a91B0762877A6B731",
-        "RLC (RLC)": "0xbe662058e00849C3Eef2AC9664f37fEfdF2cdbFE",
-        "Kyber Network Crystal v2 (KNC)": "0x1C954E8fe737F99f68Fa1CCda3e51ebDB291948C",
-        "STASIS EURS Token (EURS)": "0xE111178A87A3BFf0c8d18DECBa5798827539Ae99",
-        "Gitcoin (GTC)": "0xdb95f9188479575F3F718a245EcA1B3BF74567EC",
-        "KEEP Token (KEEP)": "0x42f37A1296b2981F7C3cAcEd84c5096b2Eb0C72C",
-        "Voyager (VGX)": "0x054c42b6414747F5263b4A86f21B1aFAD00326Bf",
-        "Serum (SRM)": "0x6Bf2eb299E51Fc5DF30Dec81D9445dDe70e3F185",
-        "Shardus (ULT)": "0xf0059CC2b3E980065A906940fbce5f9Db7ae40A7",
-        "Everipedia IQ (IQ)": "0xB9638272aD6998708de56BBC0A290a1dE534a578",
-        "Orbs (ORBS)": "0x614389EaAE0A6821DC49062D56BDA3d9d45Fa2ff",
-        "PowerLedger (POWR)": "0x0AaB8DC887D34f00D50E19aee48371a941390d14",
-        "Ankr Eth2 Reward Bearing Certificate (aETHc)": "0xC4e82BA0Fe6763cbE5E9CbCA0ba7cbD6F91C6018",
-        "Marlin POND (POND)": "0x73580A2416A57f1C4b6391DBA688A9e4f7DBECE0",
-        "PYR Token (PYR)": "0x430EF9263E76DAE63c84292C3409D61c598E9682",
-        "Request (REQ)": "0xB25e20De2F2eBb4CfFD4D16a55C7B395e8a94762",
-        "Boba Token (BOBA)": "0xa4B2B20b2C73c7046ED19AC6bfF5E5285c58F20a",
-        "Aavegotchi GHST Token (GHST)": "0x385Eeac5cB85A38A9a07A70c73e0a3271CfB54A7",
-        "LCX (LCX)": "0xE8A51D0dD1b4525189ddA2187F90ddF0932b5482",
-        "Bancor (BNT)": "0xc26D47d5c33aC71AC5CF9F776D63Ba292a4F7842",
-        "XY Oracle (XYO)": "0xd2507e7b5794179380673870d88B22F94da6abe0",
-        "BetProtocolToken (BEPRO)": "0x07CC1cC3628Cc1615120DF781eF9fc8EC2feAE09",
-        "OriginToken (OGN)": "0xa63Beffd33AB3a2EfD92a39A7D2361CEE14cEbA8",
-        "Automata (ATA)": "0x0df0f72EE0e5c9B7ca761ECec42754992B2Da5BF",
-        "XSGD (XSGD)": "0xDC3326e71D45186F113a2F448984CA0e8D201995",
-        "Orchid (OXT)": "0x9880e3dDA13c8e7D4804691A45160102d31F6060",
-        "SportX (SX)": "0x840195888Db4D6A99ED9F73FcD3B225Bb3cB1A79",
-        "Battle World (BWO)": "0xC1543024DC71247888a7e139c644F44E75E96d38",
-        "Synth sUSD (sUSD)": "0xF81b4Bec6Ca8f9fe7bE01CA734F55B2b6e03A7a0",
-    },
-    # Testnet
-    {
-        "USD Coin (USDC)": "0x41e94eb019c0762f9bfcf9fb1e58725bfb0e7582",
-    },
-]
-
-
-nfts_values = [
-    # Mainnet
-    {},
-    # Testnet
-    {},
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/137/erc20.json
-ledger_tokens = {
-    "0xec6432b90e7fd4d9f872cc5c781f05b617db861e": {
-        "ticker": "DEL",
-        "signature": "3044022054dda4cba0d696d3f0b4e76200ac4682f396721036a6feb806fa8d623317760e02207a5ebde40cdd28d947dc49371bdde1beb915d776ac0b6e4ed8077d4bb7d0af21",
-    },
-    "0x8505b9d2254a7ae468c0e9dd10ccea3a837aef5c": {
-        "ticker": "COMP",
-        "signature": "3045022100bc6c39d0831aabe4207836ccfef88f0331dfc8b764bc4980f6bfe0fd2546c5cf02201636c8b88bb165998f86ff398a3da68e9557b3ad6f6d7f33e99b162ba7a7b201",
-    },
-    "0x8f3cf7ad23cd3cadbd9735aff958023239c6a063": {
-        "ticker": "DAI",
-        "signature": "3045022100b74ee418eb7eef1cde0876e9589a6ba217a3318ad840bb797c68adb4ecc57bd4022014fc46f93500576aca05034e243d12f4a28e56b81a3606d4c99d617ebebadaf5",
-    },
-    "0xc2132d05d31c914a87c6611c10748aeb04b58e8f": {
-        "ticker": "USDT",
-        "signature": "3045022100a9588096900e77f2989386c862582b225e587ba063401e53e953b94d55a04698022033fa8853df43d6ca84b10561aff0d9d804a2d0a49684cdf084a86732e03209b7",
-    },
-    "0x1bfd67037b42cf73acf2047067bd4f2c47d9bfd6": {
-        "ticker": "WBTC",
-        "signature": "3045022100839e22224fc6ece318210c2cd6508d4e4e428c718e36a44b1c3590796dd4fdbb02202e86a2e423132e2fd0e2aabb580b1e06112c7de74f540e17e4042849877abcce",
-    },
-    "0xda537104d6a5edd53c6fbba9a898708e465260b6": {
-        "ticker": "YFI",
-        "signature": "304402206d3c20aa3d59d2e41123c6a4d9f497b7af19b7d2a40a8149669debc6b3adbea0022043d30baa1b9ec44cf11d7b6b4f820bed89518032aa40a8137c6b2ca8643f794f",
-    },
-    "0x8bb30e0e67b11b978a5040144c410e1ccddcba30": {
-        "ticker": "ZCN",
-        "signature": "304402201d8b5019896b577b18a982eb7c2ad1ce47e8039f554b776a646ceded514f6ea502206829047dfa242968649508b39d4c6aecfe671dd41163670650b7ccee6d865a2a",
-    },
-    "0x71b821aa52a49f32eed535fca6eb5aa130085978": {
-        "ticker": "0XBTC",
-        "signature": "3045022100acea17a49b701f45bf61999c920f223ebc1a65334ae4b109cef9e38a01bfa0e302207c8703d468b66e523b6c568aa0a57de437362dfd54e0d282b7029fead9fd5e7b",
-    },
-    "0x52ede6bba83b7b4ba1d738df0df713d6a2036b71": {
-        "ticker": "0XMR",
-        "signature": "304402205b1e17102d625485b52e40b14dfe518e691f6c0fe077c7f3fb059247d783f27e02202b6d09895b2f406cceaa71eaa9751d40b3826706beb7a44e79abeea146aa4fe2",
-    },
-    "0x4a5599a249fdc53bd4746e7d9078edb7543bd0a9": {
-        "ticker": "16DAO",
-        "signature": "3045022100d0f292e402080c47c307be650d1b3f2c9958e086ca8fcb1f3264324cea93927f02202adaec0539c4676579a00e699994fca1cdce78f2b30b30be806e55294fd9b782",
-    },
-    "0x9c2c5fd7b07e95ee044ddeba0e97a665f142394f": {
-        "ticker": "1INCH",
-        "signature": "3045022100e379fb6706bb16d8f39ed26a4f0c7e105a3fa1b50e01176d2702b6aba2209fa502205c347dd1fe3a1447a10ced5de9b58a01661d2381e4f18ef36dc51a03dcbb02e1",
-    },
-    "0x3d468ab2329f296e1b9d8476bb54dd77d8c2320f": {
-        "ticker": "20WETH-80BAL",
-        "signature": "3044022011e1cecaf59f2b5fe59abc4ddda5f3fd4a17bbea4ab26e3fae04481ede5f3822022069c95e0684f516bb4757c73152bce9c25eecf03de1212cfa03c7282446d8ec76",
-    },
-    "0xf3312968c7d768c19107731100ece7d4780b47b2": {
-        "ticker": "20WMATIC_80SPHERE",
-        "signature": "3044022028e54188b96faa87d48cfdcd8fe020b9b881374d6a5ac2ac4c59271eba945287022061de2e8e2d22b4a7b04d5fdd7a86de7d0287c370bc7ef0e475629c5f3c3fb57f",
-    },
-    "0xe22483774bd8611be2ad2f4194078dac9159f4ba": {
-        "ticker": "2BRL_BRZ",
-        "signature": "3045022100bb7c9ae33d357f04180979695ba23f9804a9b91e9b355a6576ab361f127fc038022019af047a8a993e355460798ea0caae96aa708619f148b20b07e8b7b7e74c342b",
-    },
-    "0x4a0b73f0d13ff6d43e304a174697e3d5cfd310a4": {
-        "ticker": "2BRLUSD_BOOSTED",
-        "signature": "3045022100b2449878c93d59d3129a226b512300bf2b6083f347473e994798da7d707e8b770220092d3b733546b284cfa853eea397780f1c2e67e56c95b134d33f2dba74fbbcc4",
-    },
-    "0xa48d164f6eb0edc68bd03b56fa59e12f24499ad1": {
-        "ticker": "2EUR_AGEUR",
-        "signature": "304402204a2119e99a6f4cfa48d8efd88d527aa2cd65fd068125d3efd8828eafa3b4b377022001391911f68f9f203e3e2bd5f1c11ec7b9c12ee46e543b4b5044c38cb3f9bdeb",
-    },
-    "0x7d60a4cb5ca92e2da965637025122296ea6854f9": {
-        "ticker": "2EUR_PAR",
-        "signature": "3045022100c39cb4c5fa2fa9c87ae5eed37dfc8263a294fa88658ff291c42554999b9892730220450d16e49a2c90fe3c0a7b1fdca063fbe59d40822bde3f00bc7468ca03f59d02",
-    },
-    "0x58c7b2828e7f2b2caa0cc7feef242fa3196d03df": {
-        "ticker": "FXA3A",
-        "signature": "30440220515507f0356d261c1e3fca1de185dad2da526f8451bb78d007316564ba9848a80220224f71b380e9b0d290d06bfea6b2ec763f844a751bfa467173af63d4a112ba76",
-    },
-    "0x5ceebb0947d58fabde2fc026ffe4b33ccfe1ba8b": {
-        "ticker": "4INT",
-        "signature": "30440220378bd842cdb5456295f0084fbbaa0b743a0014560e8751548ab55ea42fe103ca022031236d67b242206961e0c2416f9b124ead83df95a70f72cd98f327ee3d116b1e",
-    },
-    "0x0102bbfddffbd8d28d3a1b9c47017f62f42768f2": {
-        "ticker": "50C",
-        "signature": "3045022100ef0cd085204e76867834491a5466f1e31a15a1fb79634041a49755e497b2eeea02201f3fdddf408ece7f1f75a7d53264bb870b46e6af9abb3c6a98644886b1470beb",
-    },
-    "0xa1fd25f9d59768dfaa376b25a46df2ab2729fb83": {
-        "ticker": "5MC",
-        "signature": "3044022025938b0cfa4eba8ef4a9bc3272adfba991e9ca4e2b6292f8811ad29183a5b49902200d6789860af4d2d589d3b6804e55559d8550473894c1b128032413fbd6bbb0d5",
-    },
-    "0x06ddb3a8bc0abc14f85e974cf1a93a6f8d4909d9": {
-        "ticker": "8PAY V2",
-        "signature": "3044022075ed6baafe6d41e7aa02eae54ec5d7219e412248f86f831aadd11509572172e0022066b6ccf20cf17b0b989f326d1610a14ae722ddb70ff4b843bde660886284e26a",
-    },
-    "0x2c92a8a41f4b806a6f6f1f7c9d9dec78dcd8c18e": {
-        "ticker": "STZ",
-        "signature": "3045022100f5f00c980847863203063370bb804b017dd716d0fb5a77cd66eadf2379e2cf1f02203756f1f44ee8b312b8a242845eab32e65722df3e15c43b7115e699a46baec787",
-    },
-    "0x9767203e89dcd34851240b3919d4900d3e5069f1": {
-        "ticker": "A4",
-        "signature": "304402205a3d43d01de023b6a1d8fd72f46ffac45b7ecd5864bc56ee733df544a068424f022078ee830c643999fa6e5a9b2bdf088fc2a0c1b86c5f8704f321722d0bad5af595",
-    },
-    "0xe9e7c09e82328c3107d367f6c617cf9977e63ed0": {
-        "ticker": "A51",
-        "signature": "3045022100c98884dc23c35db2e7d3011fc0cc071a8436072f84ca7509cd9d9bb73776612b0220013ea656944d8933ac40bb64c984ccdffc75214ff02ca270660f9100f1357007",
-    },
-    "0xd6df932a45c0f255f85145f286ea0b292b21c90b": {
-        "ticker": "AAVE",
-        "signature": "30440220456a4411c8ca81b689f3f80ee2b198a754f8795194966b596469abef607cb34b02207a1543fcf5ceadd67a2fd87b57a71cddd74c3fba0a5973a765ac5b25eb7691d6",
-    },
-    "0x1d2a0e5ec8e5bbdca5cb219e649b565d8e5c3360": {
-        "ticker": "AMAAVE",
-        "signature": "304402203b79fc40f823123941b2e22262f7ca5492f93c24c634bcfab3381f07b8190e230220367863887615b626da04e149c1ffc4db11dcb72792d0776588d3bbbcd3c0c656",
-    },
-    "0x27f8d03b3a2196956ed754badc28d73be8830a6e": {
-        "ticker": "AMDAI",
-        "signature": "3045022100ddb49a516633e80020dd6f0c7657e9034ac973e41b0b85ac10c23e530362182a02205354bfd224ed2e7e02d88ad6119a640735b760e089f591684929657ec398090b",
-    },
-    "0x1a13f4ca1d028320a707d99520abfefca3998b7f": {
-        "ticker": "AMUSDC",
-        "signature": "3044022007f7b18fba725f141716377f7e44ee6ca8695dd7d0b36a6282521cd0677f25a2022033e28b25305f736c5c62ed798b22da0d9d3a6a1c9f115c32f923da5c0891fe86",
-    },
-    "0x60d55f02a771d515e077c9c2403a1ef324885cec": {
-        "ticker": "AMUSDT",
-        "signature": "304402201c2a034690a7d69c8fb844856b1d6a891beeebfc6ebc978b02ca62b80b02f11e02206e3b98e8b3f62722553134571b3ff1abc4331ecd05164ad577ccabe9b7183376",
-    },
-    "0x5c2ed810328349100a66b82b78a1791b101c9d61": {
-        "ticker": "AMWBTC",
-        "signature": "3045022100a8d864178f5f332844e5b8945461efca72f4f4e8f2d82073cd53ae5e65460a490220205ddf05d10acbba4e663eb4dc191b67b06829340c903c4449b6935c2c6cf017",
-    },
-    "0x28424507fefb6f7f8e9d3860f56504e4e5f5f390": {
-        "ticker": "AMWETH",
-        "signature": "3044022061b6b779525e3df37e6d8e40da163b3edca2f90cf5dbc1e4b6e52f0c956bbcbe022035e3069875ab5c79b7d65efa57e46973d00252cdc40a5deff3460f5e02e597b3",
-    },
-    "0x8df3aad3a84da6b69a4da8aec3ea40d9091b2ac4": {
-        "ticker": "AMWMATIC",
-        "signature": "304402205a27811f2e1837d46fa0179ed90ec344bbf5c6af49c8dca044a9b4ae754742c502200e2bc57d5260bdc4171b4443c598b6e524915fb7c3021170086664763721c0fd",
-    },
-    "0xf329e36c7bf6e5e86ce2150875a84ce77f477375": {
-        "ticker": "APOLAAVE",
-        "signature": "3045022100e072a26b51eba6970362f738c3e6971ddc35bbc6381991ea9caa9287dfcf24c20220637c89d7dc65031085819fcfb6d7ffaf12eab70f3a22381e51ded36c4818fbfc",
-    },
-    "0x8437d7c167dfb82ed4cb79cd44b7a32a1dd95c77": {
-        "ticker": "APOLAGEUR",
-        "signature": "3044022050bc903583d99cb1f92570241c491a1bafa1f1e2a54fcb4c62f1cf722f116871022046927dd83640ce11fd030e3d94fee790ea6f72516a2331600809a292d5cb1062",
-    },
-    "0x8ffdf2de812095b1d19cb146e4c004587c0a0692": {
-        "ticker": "APOLBAL",
-        "signature": "3045022100d3a4ce7243be24e1d1a8043ea298dcf34b59338345ce038f38ac0d8827b232d30220610eeb3dfc761ba167cc75b220ffcbff95713cd469e497eec605b9ed05646d59",
-    },
-    "0x513c7e3a9c69ca3e22550ef58ac1c0088e918fff": {
-        "ticker": "APOLCRV",
-        "signature": "3045022100b0ce9037d20eb154b9e1f67650495a71be90d8d42390498a660979d0e38f5fa3022066931ae48ea3d7ac554cb06e8c82212f9d8351a258c55b2f01e9446eff5b161e",
-    },
-    "0x82e64f49ed5ec1bc6e43dad4fc8af9bb3a2312ee": {
-        "ticker": "APOLDAI",
-        "signature": "30450221009d2ab0fdd1b934f148a2550ef15a79353376ddec83fb52c2516d467091e1f2ea0220383727a3a3ce97fbe88c6263c01d0476e809fea534572f37f9745b00bf818042",
-    },
-    "0x724dc807b04555b71ed48a6896b6f41593b8c637": {
-        "ticker": "APOLDPI",
-        "signature": "304402204829d782369f81b883a766aeeb05f7686a75b7608c31efa86a14f52572b76151022070a4f396fcc6964fc3161dbc700aeb0b6a700f383a22851880dea40d8380069f",
-    },
-    "0x8eb270e296023e9d92081fdf967ddd7878724424": {
-        "ticker": "APOLGHST",
-        "signature": "3045022100c54014aaa84ee46309c3187c1f5a69fe21cdaa490f8b3ae04a6220b2848ae4f002201c649d751e9b7ee7f18ca79af1f4cbf488950b5db7e1bcd34639ca381254afc4",
-    },
-    "0x191c10aa4af7c30e871e70c95db0e4eb77237530": {
-        "ticker": "APOLLINK",
-        "signature": "304502210090dba649b93534049426938d5a4084694d899ee384280efe6c08af0614013f1a022077e5e3f80e059b09de2803f52c36ca3fe06353d8a0d763f8956514d9d40195f1",
-    },
-    "0x80ca0d8c38d2e2bcbab66aa1648bd1c7160500fe": {
-        "ticker": "APOLMATICX",
-        "signature": "3045022100f277643ae78a4c5661d163f65733084a0d3179ba46cb54b5b1d620c96fb37e5902203686294b37bba6531a1c4125f53b3a3f960fb02536fb3b96afa3cdc685c2f690",
-    },
-    "0xea1132120ddcdda2f119e99fa7a27a0d036f7ac9": {
-        "ticker": "APOLSTMATIC",
-        "signature": "30450221008b895ce0adc360fc869db6405f3f72d3eddfa08e96d00b2fa99d47b0e947e7f6022003d65897257d8eb552389b6fb0584c4aa3dae3b90b804a2cf77024045478f6b7",
-    },
-    "0xc45a479877e1e9dfe9fcd4056c699575a1045daa": {
-        "ticker": "APOLSUSHI",
-        "signature": "304502210086e46de1074709999e3111c49ccc88d5770190b7c9b542067999f2391f8bcb3002202d6e785b9c43ad92293d23a47e36540b8d46c8933a0cc384fda6d5ebf96ed196",
-    },
-    "0x625e7708f30ca75bfd92586e17077590c60eb4cd": {
-        "ticker": "APOLUSDC",
-        "signature": "3044022062eeeeb167ead968849828385d3e59bc7e8ddd418b08616748ccacb4c9a9bc43022007dc730edab5daf465376672899b267219a55bafddb6a94a89dff698e63bb573",
-    },
-    "0x6ab707aca953edaefbc4fd23ba73294241490620": {
-        "ticker": "APOLUSDT",
-        "signature": "304402200565e2f475a265ce04770caf8c74951ccff97841faa3281716ee89545bf11df102202c1c69ef61efda2ba908029f99601889e190e29c577c4f03e4ce4dc62413c19b",
-    },
-    "0x078f358208685046a11c85e8ad32895ded33a249": {
-        "ticker": "APOLWBTC",
-        "signature": "304402203df4a008aeab3625bda34d2d8d5d89e9fd3d26e972b97080603c5188dd11cbc00220778dfedd55adc0d7f8ef99abfadd6096b7e08735d15b520b1245fb54013ee9c6",
-    },
-    "0xe50fa9b3c56ffb159cb0fca61f5c9d750e8128c8": {
-        "ticker": "APOLWETH",
-        "signature": "3044022064f8592cfa28968a9465df8a3de05a6558bf00d17f7d55fa17f0ac10149f3a9202205efdf415b7d280922899d020f48b834741f4894247edb4cfec8ae6e1cdeb50db",
-    },
-    "0x6d80113e533a2c0fe82eabd35f1875dcea89ea97": {
-        "ticker": "APWMATIC",
-        "signature": "304402204acb57c748e04647771b9765c5ba5f87b3d46135c7830dbbd57f38441eac6b470220407fd98cc400512c917b04f63e6732aaa33979c572e3e24fca3f61b19e2adb05",
-    },
-    "0xf59036caebea7dc4b86638dfa2e3c97da9fccd40": {
-        "ticker": "APOLWSTETH",
-        "signature": "304402201be1282339011928377168c03a63fff4ae7c3cb20ab13a7f7af0b27e8cc46f89022072c6e53656be70d9ead1f54e75825f4426023fe72236434fbe6358929176d3a2",
-    },
-    "0x6a3e7c3c6ef65ee26975b12293ca1aad7e1daed2": {
-        "ticker": "ALPHA",
-        "signature": "304402203f26d86fdacd609b2252d965e41f5b3fa406809009da0cabdedc8d4dcd74d4be02207687fbabfcc16aa3538a41444a35077d00ea36ddd9e92f9ac019cd70ca9b7dfe",
-    },
-    "0x44a6e0be76e1d9620a7f76588e4509fe4fa8e8c8": {
-        "ticker": "FOMO",
-        "signature": "304402202a007875cdc13c8a7fc668be80b310621c31fd248d58feba5b8e34c1d5cbbd3b022067ee532e1ba7d66ed58f7d5c36c390567415f409151155c5db9337c29c3b5251",
-    },
-    "0x403e967b044d4be25170310157cb1a4bf10bdd0f": {
-        "ticker": "FUD",
-        "signature": "3045022100de9d6533882cd19bc7c13dd0cd82bbd46252994bea11efd5b5cf6355b30087df02200b56af20a1cb9e833cf7399eaab8564dd3a88ba345640492eda0c241d747c059",
-    },
-    "0x385eeac5cb85a38a9a07a70c73e0a3271cfb54a7": {
-        "ticker": "GHST",
-        "signature": "304402203a1933f215bfeff1068a22f11d5355e62a920fa50108c0b1fd26e2f51cfa35c90220275a8e7f0950b491bdb46e03a4dd89b7574b70d0e1e1a7f47b29f315feb1d385",
-    },
-    "0x42e5e06ef5b90fe15f853f59299fc96259209c5c": {
-        "ticker": "KEK",
-        "signature": "3045022100877714d226c1a736ba10a1186d4e947e206a3a57f0b615f74c8a4c1b166f8abe02204632ab430b94515d7e50512b038e656cf72f360849ece97eb10302882ee92c78",
-    },
-    "0x6d5f5317308c6fe7d6ce16930353a8dfd92ba4d7": {
-        "ticker": "ABI",
-        "signature": "3045022100afe972f846b77c429242b2162920b6dcd2a55147707c47b55b3cd5f4f4a74fd80220087a2d578581b0b26f0c2256bc54cacb3d3c70f8820c765c10e78525f3574012",
-    },
-    "0xedcfb6984a3c70501baa8b7f5421ae795ecc1496": {
-        "ticker": "META",
-        "signature": "3045022100889c5c6da1e3444142b3862005a9565668700676d1ce52c77088a7512b6a03f4022061c1bb80f0545b1dcb31943867d0e05509c95767bbc5353b164cac6aca04f054",
-    },
-    "0x1bd9abf284e893705104e64b564b414620b722f1": {
-        "ticker": "ACM",
-        "signature": "30440220578f4cdcfc39a01f9226d5d5140f8da0617fc41887ae8730132b2bebc2f21b1902206fa6fc32e479c269311ba20664b16b315a041756d25badd47fc378193cc5c7f0",
-    },
-    "0xf328b73b6c685831f238c30a23fc19140cb4d8fc": {
-        "ticker": "ACX",
-        "signature": "3045022100a891f20bb001576b5f1e729435b7ee107a36c208c5fe57f1c6e9b81953c2314402204a1129c2d0a6b19b4bee277f2130c03d0cf69647508a8931c4830518596d4fcb",
-    },
-    "0xc3fdbadc7c795ef1d6ba111e06ff8f16a20ea539": {
-        "ticker": "ADDY",
-        "signature": "3044022058ba00c91c27c8a7073ffeb67cf705f3d7727d34452c5304ac0f0cab3ce428c302206ee94a0e832239d7c4fe771f7fe25acf688881889a64b132f55d6b1a2f2718f5",
-    },
-    "0x1f02ec2dd0ff3e31ca893aec6c3585fe88243df3": {
-        "ticker": "ACDC",
-        "signature": "30440220762e327972912294c93ec582c5b90a6f10af4d8da396b5f970c3606d8310e9a002206249837b13a6583aea8316adb068ad5a93dbdd3b94c1eef0889be090906363b1",
-    },
-    "0xdda7b23d2d72746663e7939743f929a3d85fc975": {
-        "ticker": "ADX",
-        "signature": "3045022100a222e62a17184258881b2a8c9c2b69ea8aa391507074d521769e8aefb002c5d9022033657cb249a2fcecc86ff43c76df361f86d0a5856dfb4a8267ab86bec8882ff6",
-    },
-    "0x598e49f01befeb1753737934a5b11fea9119c796": {
-        "ticker": "ADS",
-        "signature": "30440220010bea8ca872c3053aaec6b0e54af3da898d5136d69913b82afb055ca6b07d2e02202e8360a783b8e70ba50431697852da15fa8b2067f77ae48a71ccda0b6686c776",
-    },
-    "0xe3f2b1b2229c0333ad17d03f179b87500e7c5e01": {
-        "ticker": "AEG",
-        "signature": "30450221008641464a6568be094fcb93cba191fad9d183ddb293fc2d8409c8b9253030ac8802200b0f87a0232d6b3469d57fad2c359cb4ca7cb907e7cf9374a33148a6c696cb82",
-    },
-    "0x1c15926ea330c394d891fd88f62d37ea6af953c3": {
-        "ticker": "AFFI",
-        "signature": "3045022100bbb17b5e0a79ef254a66b15b15189cc3d593fb10cbf44b8d5805b82a9df367370220739732549773d9654e65fdd5164b1f8696fb7c86517a497dd1b1c31092fc6f41",
-    },
-    "0x3b56a704c01d650147ade2b8cee594066b3f9421": {
-        "ticker": "FYN",
-        "signature": "3044022020aad2b561485c002848f87567440b85c09a72fc6922de66fb5f849d0e817b1a022034418cd446e987dc1925c6a1b69f79d43f5d67990d17982acf876266e1544fb8",
-    },
-    "0x669ddc70273084ea30e6cd4f28ca6e2c70735065": {
-        "ticker": "AGAC",
-        "signature": "304402200acc867b43132f53d1d015bf820b6cb164e542ee7b2cbeb05ff939b72a0b350a022004e8a804f24225f02bb5c69d4a089f1082e6799bbc81a9b6eca7ca2e43ed750b",
-    },
-    "0xcbce9f77921c2e90522d438df4c5582f4c617768": {
-        "ticker": "AGACR",
-        "signature": "3045022100911d65fc16f8f62ffd7e184e9f794dcde6a690a879b29f1d3fe9b83b676efcab02202455de2534f84f89f4f13f26228cff3d3fc9716f047a622d3533d2ea317ed9d4",
-    },
-    "0x033d942a6b495c4071083f4cde1f17e986fe856c": {
-        "ticker": "AGA",
-        "signature": "304402201fe2b65cc7905e3fc86d4b2e4cf7e1363366884b942908bbb95652e1fa35f47302206409620f7c9256f30c7e9cc138c72b86931f9201b2c345176f63088d8510cc5f",
-    },
-    "0xe0b52e49357fd4daf2c15e02058dce6bc0057db4": {
-        "ticker": "AGEUR",
-        "signature": "3045022100dc85017957d56d637e467b40e68d07d97813460da41e71add3394d2b972fd25d0220140468bd6e729a054ee3ff3f8572b9168a68669d1f20d96147f446ed3a4db6d5",
-    },
-    "0xa3d315e8e0a62e9abd4a910d07b4768a1b3ff525": {
-        "ticker": "AGOS",
-        "signature": "30440220022f675c233a0b23f041d25350a1f4c710860a8d3da9e42c19424f3cc88c85c7022039d63343c05e3b993e248812589dbf976036429796d6c1fc222e49c275e96fc6",
-    },
-    "0x33b6d77c607ea499ab5db7e2201c5a516a78a5db": {
-        "ticker": "AIMX",
-        "signature": "3044022008892353c21b5328e0f2301907c0644632adb0b09f2367817358dfe7106131e70220627d0a2371e88de956a88f0b67b59eec241b273729a15b5568d68a5ce970dadb",
-    },
-    "0xe2341718c6c0cbfa8e6686102dd8fbf4047a9e9b": {
-        "ticker": "AIOZ",
-        "signature": "3045022100d7327187553ba84adc1bc9284238ac7c0068e5d4c17233a1e512eaa4033aee700220631bda671092d9a8996cd44ae39347ba0f3fb0c5d0df655d1dca6b914b4026b1",
-    },
-    "0x1a7e49125a6595588c9556f07a4c006461b24545": {
-        "ticker": "AKI",
-        "signature": "304402204ec08e84f1b9c151d2f8e85c94243c0d22e1d4f33cc1ba613327fc5e0734307c0220512b13e6c77163538cc7e29936dd1b9846b20df045576b3f6dba74d4170d093a",
-    },
-    "0x0169ec1f8f639b32eec6d923e24c2a2ff45b9dd6": {
-        "ticker": "ALGB",
-        "signature": "3045022100ffc9b269048fe1268ea09a1eeda0a21f7a9b70c1013ad9e61d47f21950a73773022027caef903f25f2fc8fbe655b764566a988226a6a31db39b6fba999b3636ce7ed",
-    },
-    "0x1581929770be3275a82068c1135b6dd59c5334ed": {
-        "ticker": "ALM",
-        "signature": "3045022100f5767e9731c54d6d8ccbdb37934d5ac9e7e86683311c32edeb2491cff84ca1f90220204ec3f135f37a4dcb6ba4891eced361f4d866e7076739186b29e6d68a3e810b",
-    },
-    "0x04429fbb948bbd09327763214b45e505a5293346": {
-        "ticker": "ABR",
-        "signature": "3045022100b8dbc2480f8483801736a854338e134a76799ba03b3548cd3118bf82e46c782102202c7900f2c641245bc7adb9a8eda8dc089ddd075efbf3bb2634843812f321cbde",
-    },
-    "0x644192291cc835a93d6330b24ea5f5fedd0eef9e": {
-        "ticker": "NXRA",
-        "signature": "304402203237dd7e8a8f22d0e6a588e8defba139f60af44398fd0a4075061f6a47919d21022042cc05445bf39f1ce6ebc8ef8fb599cbd5067d1ad1aed9dcb11eec5dca0270f5",
-    },
-    "0xb87904db461005fc716a6bf9f2d451c33b10b80b": {
-        "ticker": "AMKT",
-        "signature": "3044022026839b731b2772261e87fbad2d8856500177bb34326bfb43cab0fd7c3f4bf7b00220400fb59ccdb8890272498dd6b883d368427aaa126bee8a0b3444e9d5bb45ccd0",
-    },
-    "0x35b72ca980ae863bc9c47c4b571eec37fcb2d1ee": {
-        "ticker": "APKA",
-        "signature": "3045022100b0b76cd225b909c62821339ce3f50178ed723a25eab1a1637e925906ce44927802203087e3fce388318a52ff6fb704d772357f9eaaa946bdd0e930c0b2f2f9726ae3",
-    },
-    "0xe0cca86b254005889ac3a81e737f56a14f4a38f5": {
-        "ticker": "ALTA",
-        "signature": "304402204a4c5d68121b99ef76e9b14e16ce8f4240336400930a8af1d87b370b6c7ac4ee02200805a46e52ee3051f63afc81ce9b345fc6eea2ac1eba56b83efb694b936349f7",
-    },
-    "0x8929e9dbd2785e3ba16175e596cdd61520fee0d1": {
-        "ticker": "ALTD",
-        "signature": "30450221008ad7230d8a906ac344f5b8172f94d162052d2f3bee85e64786efaab90521830f0220764b7b570cb8d64695da3c4a7c7c7522dd58cd05ee478c605257ded92a99f0de",
-    },
-    "0x041b4394f2a1a2eaf7e21460ef59370789cb1f42": {
-        "ticker": "AL",
-        "signature": "304402203346039acd195beb383da456b3773b83b4b1ccd8b36ec3dd012834cd520c9483022016a138085c387c1dc01768821cf6b856ce524773f0a54686f3c002b967037b7a",
-    },
-    "0xa8fcee762642f156b5d757b6fabc36e06b6d4a1a": {
-        "ticker": "ALN",
-        "signature": "3045022100ea8ba091c2a7cb77a4154ee6295cef650f31e3efffbb25617239f5a8d4c6d3d902207c1f5cb6d78051a01103f276e4d3d5016ed307eb604e27a6eb9c9fb27fed2e67",
-    },
-    "0x372246175d50db4fd42c2aba4e3292a0fe41ce2e": {
-        "ticker": "AMA",
-        "signature": "304402202d5a02ab2b0f534484f396ca8ab2af762177b12be43d99d5a0f932c3cec41acd02204f922c1d785ccb35b93a15d542abfabc0f2579391246d3f522fe9cda1227ddd2",
-    },
-    "0x8865bc57c58be23137ace9ed1ae1a05fe5c8b209": {
-        "ticker": "AMBER",
-        "signature": "3045022100ed9a2d9087703398caf4df315f8849323c07c827ba58fd12aebcdc19b1578a2702203389e148f8d3900121b85ee97c8176bf3f3bac598acd875a13005efc0eac0517",
-    },
-    "0x564906ec1df8399f00e4ad32c0ecac0404a27a1c": {
-        "ticker": "WALLET",
-        "signature": "3045022100a0ad5bbdcef40059cfa7628c29f179b031fc8c78e31acfc7baca11bc9d7091ef022055a07f148118ae1b06e7963dd7804c18ee78b4a2a938afcebc280bc9439b7a6d",
-    },
-    "0x9b8b6a1298d34b3c4bbddce8a7ff0149121592c1": {
-        "ticker": "AMBO",
-        "signature": "3045022100cf1780e9362a55dcabb627b69aaad76473fa268306ac6d8405b8cf28c476dd170220217551655b52498e172b2997dcc8e418d7278dcee4793178935b152d86d87480",
-    },
-    "0x0621d647cecbfb64b79e44302c1933cb4f27054d": {
-        "ticker": "AMP",
-        "signature": "3045022100de0b2a62ac2b686b590e16f5ad304a55fbbb942cd8f1fdf143163a7bfa77cea0022029c0819b4bcd42965b7b44c3e4fa459ef52cdb6933facdae09e3c5244af068f3",
-    },
-    "0x5ecba59dacc1adc5bdea35f38a732823fc3de977": {
-        "ticker": "FORTH",
-        "signature": "3045022100c5645d780a9d15b5ff91593ac851a778f0d639fa140b63a53a7ddb4146a2739202206ccce793ea9cc19c944fb55974788b13a494a95803ad736ee24fd3bb01f6ceb9",
-    },
-    "0x0b6afe834dab840335f87d99b45c2a4bd81a93c7": {
-        "ticker": "ANGEL",
-        "signature": "304402207e4fdd8c3a7a2a58fe65e78eb72b0179df353209e8202b18951a296d8b9af2e30220042d131bccb72c292a650029f0e485e56d58a7915bdcadf92e47d6882ca82705",
-    },
-    "0x0000206329b97db379d5e1bf586bbdb969c63274": {
-        "ticker": "AGUSD",
-        "signature": "304402200d2be686e9d88a7bc642edfc863ed17772c5fa4b7872011fba7f921dd7777f1b02201c3ac80a26cb32171e7880043dbfc8282e41fc0ccc8f5bec949c9a99725ae198",
-    },
-    "0xd6a33f67b733d422c821c36f0f79ca145b930d01": {
-        "ticker": "AGLA",
-        "signature": "304402204eb1fa3ad1625b8399994e53e304157c278c9513898d8242609706cea499b97802204a1b213fd5feb0ffeb022fe5ddaaf7231d99bf1bf33f1b6f01df4aff549a6b6e",
-    },
-    "0xecc4176b90613ed78185f01bd1e42c5640c4f09d": {
-        "ticker": "ANML",
-        "signature": "3044022047202fdc560d2a7c2b8fd2577e57771ee68f5bc4cd3ac09a34f06305e9a3773f02204135ca62cba7ddb280eb0e8403cc3c33fa3fad7e7ec002ca440b03017d6c3537",
-    },
-    "0x04cc80c7665e4d57f57e16a1212a57c0c11927ce": {
-        "ticker": "ANIV",
-        "signature": "30440220124fd5a861b2f15b1e6008927b56b92cb15bae031623826df5ca3c59dcea6ebe022044cdaaf8fc703b1cdf35a747100e6a0941af2801e474e84965f45ecc204245a3",
-    },
-    "0xc4e82ba0fe6763cbe5e9cbca0ba7cbd6f91c6018": {
-        "ticker": "AETHC",
-        "signature": "304402205626e4fc42d2da26e30d6df185804db141f95ba0bc9554a693b694d85c82539a02204a1833c7c05590c71326c02f90c57aa39db4d4221f0e1e5e9f4fcfecbd3d980b",
-    },
-    "0x101a023270368c0d50bffb62780f4afd4ea79c35": {
-        "ticker": "ANKR",
-        "signature": "3044022078a506294c7fe50740b13322b089fca1934f9e1008ecb46394b8986f069384a20220313354ff5746b22ecd4a0f76208bd87e4cf13fdaf52e528915e7978993e0aa99",
-    },
-    "0x0e9b89007eee9c958c0eda24ef70723c2c93dd58": {
-        "ticker": "ANKRMATIC",
-        "signature": "304402202b1efb3ad4f5c62bea3edd13102fb4c3746df1744f6cc08c3f49a627f5039fa20220394d7601063ba8ac22479609826b8ce6ee89d11afc405b038c4f0ed978514c6a",
-    },
-    "0x554f074d9ccda8f483d1812d4874cbebd682644e": {
-        "ticker": "$ANRX",
-        "signature": "304402201ba3ecdb207cf1451d4e3ed5492cfa2977b3c4f9688ad6cad76a9a25b9d9ff1c022002c64cd2ac825c392b31a09e9ad28cf10e75240418956c73e6d916c1181d2580",
-    },
-    "0x24236e003e31b9dbd4fa84bdf2bfb47efadcac3e": {
-        "ticker": "ANX",
-        "signature": "3045022100b10facacc7c3dd54b62b5ffbb1e404ae80126619fa4c71e036737250aed5781202204b0a0ac24813c2c74187b0c87206acfe5bb0212a93db0ba3c5d41a930f12ca46",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "304402204a26cb18aca3092aa0389a99152ac154818a5b3e434a3b858fc904829acafede02202075fc87e3c7240562c2140fb48df7eca3e6085d37362a877efc4f2e97648acb",
-    },
-    "0x6ab6d61428fde76768d7b45d8bfeec19c6ef91a8": {
-        "ticker": "ANY",
-        "signature": "3045022100f01f59efe88d2170110b340ad6279eef4acf8fbb19f98d8e5289cd20b690a4a20220598c3743f53d40fe3b44f20c12fe6e12355def19a9ad80c7b3cc74bb2eac527a",
-    },
-    "0xe6828d65bf5023ae1851d90d8783cc821ba7eee1": {
-        "ticker": "ABOND",
-        "signature": "304402202c760c6c685e5895b5423f3b269b42c7309789aa47c8c86dab6f6933ff66340302204f45a5b27931c920e66485d88d13b7349a86ab317beec66eb5969c7d3e9a471c",
-    },
-    "0xb7b31a6bc18e48888545ce79e83e06003be70930": {
-        "ticker": "APE",
-        "signature": "3045022100b7745d7dc10dd8c919a24d5d73aaa73ebcc850467a62660a7ab33a68abf3330b022044583229de6a56a99a85126a29e93b057bea6ef2fd12b469fd915f9aa7479264",
-    },
-    "0x5d47baba0d66083c52009271faf3f50dcc01023c": {
-        "ticker": "BANANA",
-        "signature": "3045022100ddb77aeb2850995a89c1193d8b168be61f4dd32f0b5cc4ad9a16370e146e0eae02202a6badeabf198f4a0e552d00fd702aab0c95bde6e575fe72301664375b8de150",
-    },
-    "0x034293f21f1cce5908bc605ce5850df2b1059ac0": {
-        "ticker": "APE_LP",
-        "signature": "304402203aade15ef6beee5090572a6ad45e88a41b7c32d8000868bd83ed4e5aa6e98644022032ad46631066693c063696d006fb9772b0984abd88ceb3b20942c9926d6b5845",
-    },
-    "0x0359001070cf696d5993e0697335157a6f7db289": {
-        "ticker": "APE_LP",
-        "signature": "30440220069df52884e184fe49f65146f2d488606220badd761efc2ac0da03376c22899a02202f4acc246aadd6058b49b8c7199f044d9e5a8c11d293fbc3274a9c4fe2be94c9",
-    },
-    "0x5b13b583d4317ab15186ed660a1e4c65c10da659": {
-        "ticker": "APE_LP",
-        "signature": "304402204d521ab0adc02a7f2419f9607624397560b66c9bd6cb6014b1a96ad377309611022030f6ba62eaf57a97781d90fc04f56f99932c8d65ce576c50a097580d553918b1",
-    },
-    "0x65d43b64e3b31965cd5ea367d4c2b94c03084797": {
-        "ticker": "APE_LP",
-        "signature": "3044022053928bf19877dc0b73e5b86a69f0091ad5cdaf412e2bbeb44fea5ada1a08a61d022052a8e92f9b9a80b2f6b178d82b565c5f4b179f0af5169506d8939a0a6a5b1d42",
-    },
-    "0x6cf8654e85ab489ca7e70189046d507eba233613": {
-        "ticker": "APE_LP",
-        "signature": "304402204480d1697c9e72dd92386fc3a26c101d375dc213ad8e0c7880f77d7007689cd40220670889e6a9188199a11f28206d8ad08b9ee23f8c75e326513d0993b4d74ae627",
-    },
-    "0xd32f3139a214034a0f9777c87ee0a064c1ff6ae2": {
-        "ticker": "APE_LP",
-        "signature": "3043021f34371c71b8123bc083681689f02f5905013233f9a5145a432f5e93755151b8022019bd86e793f48e1d1756c2516bdff4bba55fcc570743d327561d214c5376d7ab",
-    },
-    "0xe82635a105c520fd58e597181cbf754961d51e3e": {
-        "ticker": "APE_LP",
-        "signature": "3045022100edbf46bc587838fe0d08395f5e3936c286dbc10c82e4e3acfc250f7f43e6a57502207d2b295e4cd092f1e010655566584a36c7d230255c036e50483b2fde32fde7aa",
-    },
-    "0xc155504787e9430180f33f35edd7c5ec06cd5761": {
-        "ticker": "APU",
-        "signature": "3044022022f19f6a5a41ee8f6bcb397cb87cb2b1a552e9c89aaca48fdbbff8f1894c77a5022023832d7dfbafa7d3994554eacc43034c580aaaf74c88fc8fac95ed82f8156bfb",
-    },
-    "0x6c0ab120dbd11ba701aff6748568311668f63fe0": {
-        "ticker": "APW",
-        "signature": "304402205c568ecb05a8c311870a7829984738e8960a078fcf36b62c2a6919b232120d160220289baa2a9a7a77f2902355862530665b37913ba90269ca4403375a07010f6016",
-    },
-    "0x011734f6ed20e8d011d85cf7894814b897420acf": {
-        "ticker": "ACRE",
-        "signature": "3045022100d10aedc97348062e5bb924c337436a8822d70a94d47afd2ecef0cd59625de45f02207809b5704b6d28d780923b0b6f22793f3072ca0e689500a7fa5d028de4fc82f8",
-    },
-    "0x3f374ed3c8e61a0d250f275609be2219005c021e": {
-        "ticker": "ARCADIUM",
-        "signature": "30450221009a8e98bf33baf073d17be5dd8428219a963428467963391db218047fbd85e9a2022037ee04af455ec5c977273e86325c81f4901e59c7cc1b219f1f5e353db0e4a3e3",
-    },
-    "0xafb6e8331355fae99c8e8953bb4c6dc5d11e9f3c": {
-        "ticker": "AAGG",
-        "signature": "3045022100ffa6dbd9cd5b3590702cc2cca283d65650e30c99e09052dcfccbe5cf24d327e30220724f5d790a34c3cacb5431805161b269b6135e0bcc4cf54f9e7d657b86e73ce6",
-    },
-    "0xf401e2c1ce8f252947b60bfb92578f84217a1545": {
-        "ticker": "ABAL",
-        "signature": "3045022100d77ca3b03734634bb2180fcf29ecd1e090d694ffa33a6c7f663a005905af5582022011c53e7622deb4a6926ecfed98d7639bfc7bafc6af79e1449cf9717d6d68da59",
-    },
-    "0x9a41e03fef7f16f552c6fba37ffa7590fb1ec0c4": {
-        "ticker": "CHAIN",
-        "signature": "3045022100cbb9e4e27ebc051161e59708e4ef00dd1bf98dac35b0fcb56b4160653ffe941d022029b45a9fbe58d8cfe883ec97660faae57846edfbec6605ab59e43fef51ac30a8",
-    },
-    "0x027af1e12a5869ed329be4c05617ad528e997d5a": {
-        "ticker": "FXAEDY",
-        "signature": "304402207a8953a92d2dc4324c287e3e56c73a36ccdf50abded0ad9af901dda40e4081d20220142d1cf4e005f9b80d934ee41992e23cfbd3b170190b6d542c0f7b3f09f32495",
-    },
-    "0xbcd2c5c78000504efbc1ce6489dfcac71835406a": {
-        "ticker": "WEB3",
-        "signature": "3044022023c3eed66caff1165b202ff5b65fb105f396ce5fc6f9ccdc97807ad0b70bdc4502204dd7dd903c99ff908ff661ff0d4205832e7bbd3414156fac4dc42a039ea3f93a",
-    },
-    "0xab1b1680f6037006e337764547fb82d17606c187": {
-        "ticker": "FXADDY",
-        "signature": "304502210086c25be0ccea00d54b6beb6bf3592f1a051bf4fab782cdb9b932b925e842e37102200733e3f111a60e97ddf38aeb8a9969caa1180d210af89ff94c94dd156562398b",
-    },
-    "0x2a07461a493b994c2a32f549fd185524f306ab38": {
-        "ticker": "AES",
-        "signature": "3043021f0c1ee0361b6b2b252aff355891fa5e8c1503481b5307932728b182bdababb002204e58a5f514b6e0762eb19828f3db609e79299062c866dc593fc430824d40ee30",
-    },
-    "0x181feaecca4a69a793272ea06df40edf2dd0804c": {
-        "ticker": "ARES",
-        "signature": "3045022100d80712476b6cb6e5c92b50bb93ca4573db0df3e451c01a522cd0db653cd1adda0220794a583bedb65f6e2be21103e942502dbd6425561baeefa1ba37182b5d1c2ff1",
-    },
-    "0x2ad2934d5bfb7912304754479dd1f096d5c807da": {
-        "ticker": "AGC",
-        "signature": "304502210086696863f123b89c638131f185b13df02c8887e89ccc5333dbdc11db227a94fa02207c268d9d92a177d368b63e786a44e0a3c10fb634ebbd072aec5caa050cce79b0",
-    },
-    "0x46f48fbdedaa6f5500993bede9539ef85f4bee8e": {
-        "ticker": "ARIA20",
-        "signature": "304402204a9c186f96c25e8d121ab17b0d35fbbe475204a8770b51f380c06fdae0e0b72d02200ff75abc2e1ce9de4e3c1cb028bbc02eeb5ddd190513620d345763d22c7b27d7",
-    },
-    "0xe9c21de62c5c5d0ceacce2762bf655afdceb7ab3": {
-        "ticker": "AKRE",
-        "signature": "30440220398a561860e6ced7237c89cb064c6e6822800b88e3e21dfd004ded838e05794302207adeb67d1967f9552309a0090497f99b4dd86525c309a7e310ef52a0fce3938a",
-    },
-    "0x5de4005155933c0e1612ce808f12b4cd8daabc82": {
-        "ticker": "ARMOR",
-        "signature": "3045022100af076c9ab6176715c9361059a33de9d83d7bb33a7c44487e638968fe2d3a099402206c7e70ba8d1bb5e8c0e52dfae1ca44d4c39b8af04c60fca94828d98396076805",
-    },
-    "0xee800b277a96b0f490a1a732e1d6395fad960a26": {
-        "ticker": "ARPA",
-        "signature": "304402203d0aa3e417546c7ed14ee0894d92f22a06159b773c88dc78c15efef6ed223b8002206caa046163fec72e281e50f653cfb676a1e050d5ba70c96d460bd1396a46f956",
-    },
-    "0x6bd10299f4f1d31b3489dc369ea958712d27c81b": {
-        "ticker": "ADF",
-        "signature": "3045022100875e120a5ab8e6533d0ce55c5b24b2cc0c21f5d8dce79a581c6b6e5b11a624b2022033fb996835f0d552ca4789380c69439255fb0e2efa760e1aba744f92be0183b2",
-    },
-    "0xbfc70507384047aa74c29cdc8c5cb88d0f7213ac": {
-        "ticker": "ALI",
-        "signature": "3044022031a263c49ad3eaa14c858bd8eb5f202f3bfcfbbcbb3c91d7e375466f51be393b02201e724195531801d568ec28e82d9a01ba7acfc426a1cdd56f895f4b75c75882bb",
-    },
-    "0x735fa792e731a2e8f83f32eb539841b7b72e6d8f": {
-        "ticker": "EEUR",
-        "signature": "30440220762733d0056135eb97afe23bcd8d2e797745791498ba8e9f1499741ba4223d57022048b534ad4f47ab0412e3c40044d6b03acc0f980fab1c2fc692769f148adb84dd",
-    },
-    "0xd711d7d893de57dc13ff465763218770bd42db1d": {
-        "ticker": "EGBP",
-        "signature": "3045022100d42d2a7d1fd9c569e102600eb6bd315d170961f142057bdf03aac6633f9d4f1602206801725411438c0d54a8b2f802b717f47d789fe4882cf27c26a74681ffe1eb32",
-    },
-    "0xa4335da338ec4c07c391fc1a9bf75f306adadc08": {
-        "ticker": "EUSD",
-        "signature": "304402206f23c0b98331a1e9872bbf57ef69e396142ff4a3dc3ee7720e645907a9f8f4b902204fe00c2698fcf73b4326935855070dd5239cf675cd8f5d4d6015c36739eeac40",
-    },
-    "0x50bcbc40306230713239ae1bddd5eefeeaa273dc": {
-        "ticker": "ASIA",
-        "signature": "30440220627dc265ffcceaa2e56e1564f1916a4ab496062a585b9fa20316225d818db2cc022009e632f6d85c8f51528bc79f6213d5008ae7220fec8a27d78002ca9ee085e750",
-    },
-    "0x38a536a31ba4d8c1bcca016abbf786ecd25877e8": {
-        "ticker": "MNTL",
-        "signature": "3044022012e3a79c5c6cee65d03ed75569adb31c55060c673fd330ee1382b10737ed0fde022033ba12eb844e0b42089b3dbafd95b764416746fd0101103f10f295458ac9e8e1",
-    },
-    "0xdfce1e99a31c4597a3f8a8945cbfa9037655e335": {
-        "ticker": "ASTRAFER",
-        "signature": "304402206d0fa144db6f8ebee54ad1c917d5701e65f82d3aee1298fce46abc53d1672e57022062148b457c92307ffd842fd2f706c5e56bff26e6fed05025acf9b8debd9968df",
-    },
-    "0xb140665dde25c644c6b418e417c930de8a8a6ac9": {
-        "ticker": "ATRI",
-        "signature": "3044022050b7d39daa4846444e9546a9a19fd50d7a004be84c3cd1a492d76388fe6a75cc022011737e73bc831d0d9bb3254e93741075e74351870999b0d1912baf86a938bd8f",
-    },
-    "0x29b4ccd16d630df19f768f68f43a0229eae26250": {
-        "ticker": "ATRNO",
-        "signature": "3044022043b4bbfbcc4c1d1e8948791f4ae20fbeaeafe618e8b22fcb572a9cd93c758ca9022075ec22f692d2d1ffbfde68d6a50bec3c11a179f3c63e0cd9d19001e2d4c29bab",
-    },
-    "0xf868939ee81f04f463010bc52eab91c0839ef08c": {
-        "ticker": "ATK",
-        "signature": "3045022100f4eb11351aca840d92c95b81379257200cb27973c0df8ffd88b3df517dbc4581022034213b5f2347448148584bb1a5cd60f86b0513e1c412ce21747a0c4a62e14204",
-    },
-    "0x91c5a5488c0decde1eacd8a4f10e0942fb925067": {
-        "ticker": "AUDT",
-        "signature": "304402201819efe6a8f2a8d2b7d9aeba49f669194115e57c5887c1ae54237c6e0246c021022059cea5228e531ad8dc207447896dd1bc89e9799967af9e4cf2a51b73bd2f998e",
-    },
-    "0x76e63a3e7ba1e2e61d3da86a87479f983de89a7e": {
-        "ticker": "OMEN",
-        "signature": "3045022100d21d6e7fd83bc5940537b858bc6c6acecae970e8b13501bf25e2b12acb022f1e02201965c2d4f24945dead8914dc2b34f2483f3b9040799f3d17b40dcad3339243aa",
-    },
-    "0x0c8c8ae8bc3a69dc8482c01ceacfb588bb516b01": {
-        "ticker": "AURORA",
-        "signature": "30450221008768a9d04b72055b842af7e7e4505ffbd9a1d765cddf92301a9f520c29fcd68b02202a8a53c24aa3d4f30f11a8f158192e34ba109fc1a258224615d57c89513b3827",
-    },
-    "0x56a0efefc9f1fbb54fbd25629ac2aa764f1b56f7": {
-        "ticker": "AWX",
-        "signature": "304402205a98adbbe64abcaf092116db34e86f1396ad60f1d1f39036d77bebabe25f315b02200be64934136d7e4f4ef95d05295a88c43aad76c3a5c031901443e7c3ad349fa8",
-    },
-    "0xaee0ffb690b37449b7f1c49b199e1e3ec6084490": {
-        "ticker": "AWG",
-        "signature": "30450221009ad5aa83db25bc1477fdf25f38af01d421322e747931bb5233d3945b59f002d902203c0870405f19e1638ad40f58aaf8347e2773174bd20f2508a1363549ac01cf2b",
-    },
-    "0xa96d47c621a8316d4f9539e3b38180c7067e84ca": {
-        "ticker": "AWS",
-        "signature": "3045022100fa8a5474feef4b2e4b562fe396521834790563cec172121b3c31c05356cdf4670220465becfc9efc01ab7c689a58c259f68594597fe26aa0a121d26242024b9f122d",
-    },
-    "0x1a763170b96f23f15576d0fa0b2619d1254c437d": {
-        "ticker": "AX",
-        "signature": "304402205f84daac7dc01ab1e14533dcd2e3a759ef4c86f9c7b91db9a1fd05691b5febcc022018cdef24decd08bfa287fbbeeb4a7ec35339293798a64b2ed010692c1065cd26",
-    },
-    "0xa48ad8b964bbf2c420e964b648146567ceb6d5e1": {
-        "ticker": "AUSDC",
-        "signature": "3045022100ddf39ace8d3fa0be712c15aa004bba16371f26651d1c9ed0cb0b3ba964196da30220598c3191a7654cfd80e38c3e444cc56e556ec945cfe5eb8b8b0778f367faeef3",
-    },
-    "0x3cc20a6795c4b57d9817399f68e83e71c8626580": {
-        "ticker": "AUSDC_WETH",
-        "signature": "3044022051901826c3534359f62a40f97ab820143f33c93b974438b81ab0215a05b5355a022070606149999f9b1c263abe3ce61017a9104a4b0605f43ec9b9ca52bab7d7d88b",
-    },
-    "0x0df0f72ee0e5c9b7ca761ecec42754992b2da5bf": {
-        "ticker": "ATA",
-        "signature": "3045022100b32b7b633b76843ff1cf0c743cf0718aa7fbbda66f525b8048a3a72976469f300220247efce8551d01a3de172fc030d844295e6632d6731fe3bccf2b99c6aa39ec4a",
-    },
-    "0xad684e79ce4b6d464f2ff7c3fd51646892e24b96": {
-        "ticker": "NIOX",
-        "signature": "304402201c8754e0bc981505bdd5885108711dded1d47b6604a70ae68aa50ffe220397b2022073d19f3a4adf3cb9bcb713ade154e871feae0cf5400f5bb60a6c67fc4b5c6647",
-    },
-    "0xfef5d947472e72efbb2e388c730b7428406f2f95": {
-        "ticker": "OLAS",
-        "signature": "3045022100e7248e7e1dd108fc097329ef9bff3c6b23ab903b35fcd3ee546f3fd4a4fad81d02201d56fd7589925ed22e4865e2546f3fb052b65ab675d695d82d36e78534803788",
-    },
-    "0x925fadb35b73720238cc78777d02ed4dd3100816": {
-        "ticker": "AUTOS",
-        "signature": "3045022100b8ebb05cb657688d3846f47e8baa64e37a0d614fb2fa8148f42bd1c53bd18a9f02206e8afaafd504b49b77097c7e97ca9bc6c924064a2533f5cf4b02ade927d8f05c",
-    },
-    "0x2c89bbc92bd86f8075d1decc58c7f4e0107f286b": {
-        "ticker": "AVAX",
-        "signature": "304402201e6bdd54a75f2f973842efeeaaec2be0b312789429e0e2d3139582502d272fab0220427abb8a25b7ac659224ff5f3f8253a806b0ea52b8cc0fad227674c9ce1027e6",
-    },
-    "0x4e67b4598bce5f0b2706407407da0d4d8e1d7433": {
-        "ticker": "AVTM",
-        "signature": "3045022100cb1030a8bda6b50871b26054db242059b752890aa3eba5fdb736a0715572185d02201dc5ef264c5275b2d9d15ba863bc51446d0c35990a5c9a154871580ba2ce2258",
-    },
-    "0x04d521e2c414e6d898c6f2599fdd863edf49e247": {
-        "ticker": "AWMATIC_USDC",
-        "signature": "3045022100c9881139661d0f939bb1dcf72402a38b1f35c3d2a3bacf4093a18cd9d787a41b022075db12f11e7b2cb71d4bdebe7673a0fa61ead784e717063af60f13535f468b4c",
-    },
-    "0x02203f2351e7ac6ab5051205172d3f772db7d814": {
-        "ticker": "AWMATIC_WETH",
-        "signature": "3045022100a81bf8605460e789b93d955b1b94674c67bdaa3609b10975a7f5bdd1f9ba117802204d3dd3bcfabca11b1f5830f31cf80f2db57837c1e52565e8e0a35c60c985bb95",
-    },
-    "0x0c705862f56cd8ec70337f5f5184fea4158a3c00": {
-        "ticker": "AWT",
-        "signature": "304402200becea58b56665d01dd3672d6454c222d356bb49d809e76d20047a5abb0fb22302204657e34a98a6d330f395fea39cc07b80a56c5e2051cb1a5c102ef00f1fde0cb1",
-    },
-    "0x1280830f690d0e65195b3c61b028244c3a49f26d": {
-        "ticker": "AXLETH",
-        "signature": "3045022100a5839b7c404d1d38f5afa95fbac36d75aa8e2b33811ab6e93080c82c2297ccc9022056d05acc51b193cf490f5296a5244c4ca018b530abb702179ba47b6790ec806f",
-    },
-    "0x0294d8eb7857d43feb1210db72456d41481f9ede": {
-        "ticker": "AXLLQDR",
-        "signature": "3044022055dbe1cb7b2ad279186950896974a1f20581f676b7c4909a18d9c349eb00096002204b4c6e642cf35c2f0ab4e9bcf048b6ff35b0c4459ef65e18f1ad84e5c6b1a15e",
-    },
-    "0x750e4c4984a9e0f12978ea6742bc1c5d248f40ed": {
-        "ticker": "AXLUSDC",
-        "signature": "304502210096a32a15bc87698bf3f7ea5e16971c2ed4961cbe5cd538eb2a102b45abf601a802205113f3cca4b8b4b891f960423183b04b5a591e6dde9acc6ccd54d3442ad57cc6",
-    },
-    "0xceed2671d8634e3ee65000edbbee66139b132fbf": {
-        "ticker": "AXLUSDT",
-        "signature": "3045022100f861f673b2e566301ba25cff8a046a01a963583e379084d62a2dff350318696202207d6d8c2c6923fd3f09a3f5be54e09faf234bc43aefc37a4dd6d1bf4cf7177d5c",
-    },
-    "0xd7bb095a60d7666d4a6f236423b47ddd6ae6cfa7": {
-        "ticker": "AXL-WSTETH",
-        "signature": "3044022029cd82cc57d435f2a3f0c3ec36de111b34ee031d1099760661bd8a0ca7119b220220607099a78aed84ab91da9b3c0696ee23f8faddb5320206771967bbd07ec4e3bd",
-    },
-    "0x49690541e3f6e933a9aa3cffee6010a7bb5b72d7": {
-        "ticker": "AXIA",
-        "signature": "304402204cbd86b6e7cf2c61114a06798c303dc9a75d186cb8b85e6ca00d2cb260fbe6b2022034ed1e8bd519cdd8bd168ceb1577345ab4d0c352299038651ccba304399db422",
-    },
-    "0x839f1a22a59eaaf26c85958712ab32f80fea23d9": {
-        "ticker": "AXN",
-        "signature": "304402205e54995cb77f8a3f9fd34922a8b7fac2112a65b4f584435bb0c85e280632822702204e048fae45b4d86cb072a6b1423170f500e35b277c8eb070d910faa239bc1cbc",
-    },
-    "0xf36f79feb5d97e18c69078d8d13d941cae447a04": {
-        "ticker": "B01",
-        "signature": "30450221009526183d8bd2817dd44c469f5d59b948e80bb61931a37bdd5ac8041cb841d05502202002f074ae415c9e8b60120b0df2852b7e896678645c2200ecdcb33899885b0a",
-    },
-    "0xcde5e3d90631cacb842fa86f62dd0fc08a3ce43d": {
-        "ticker": "BAC",
-        "signature": "30440220530fab88d00262cce862e93dfa18f0390b70451d73b2ee8ad204b35403fbd985022009075a365756e0e12a8b189d02b7c136459afe05f7d8ecc6afc8654a0a2ccd33",
-    },
-    "0xbbcb0356bb9e6b3faa5cbf9e5f36185d53403ac9": {
-        "ticker": "BCOIN",
-        "signature": "3045022100ea1e502b8727e439ec968a238db35a0c9f47c88397d94bcf53d8caa4182b9889022062075f0d8ecb6c60d5c85bc9b3e19fb1bac8c89e7a8e14726f3ae82a4115aec5",
-    },
-    "0x1e2c4fb7ede391d116e6b41cd0608260e8801d59": {
-        "ticker": "BCSPX",
-        "signature": "3045022100db3f76f27255b0ba5819e9cedb6ee8beb43e2f819d0ca54f9e7e6ecffe34b3d602200d68c0df98f4f3926f00e998724c092bcd249a84e94cc1f88b660261b63404dc",
-    },
-    "0x2f123cf3f37ce3328cc9b5b8415f9ec5109b45e7": {
-        "ticker": "BC3M",
-        "signature": "304402202691fa353613ded20de06962462c5a382c3c448c0c1a03af60f8a611eadda056022030b646f53ac3ee3a0ed8c76524d65b0ced755b2b74a7be15df84ca572121b19c",
-    },
-    "0x52d134c6db5889fad3542a09eaf7aa90c0fdf9e4": {
-        "ticker": "BIBTA",
-        "signature": "3045022100b6acb45b7eb0f95d4bf2d39c4275d02a90f91ec877cf202cb6977af880db05080220569069cc52c3b0eaacff4c0541dbf5324e7e10c31ddf4279876b3f4a1a456656",
-    },
-    "0x2d66953fc2eb650f0fd992dbe1e71d743a4e9fee": {
-        "ticker": "NOTES",
-        "signature": "3044022052294aebfcff559649a4d6faa24c42d265c375b99ee541c107b0e21f7141adcb0220160d41e3934e14368a32dc7f2d997364c574300f3e4d0d0e9706a5c1cbac8d79",
-    },
-    "0x73b29199a8e4c146e893eb95f18dac41738a88c6": {
-        "ticker": "BAG",
-        "signature": "3045022100cc4dd390b3bd8d58dad9eaae85676c562321b3535f6f0c280a183708c004d6bb022002256c3e0c30b3489adf72077a12f9e530af74f025473815d8847dfd65b543cc",
-    },
-    "0x32515ffdc3a84cfbf9ad4db14ef8f0a535c7afd6": {
-        "ticker": "BAKED",
-        "signature": "3045022100f5c81331f3013b5993a4cb1e8fd44ccdc225601864cc5875f8c7f1f6a835d21b022039652de5c3f6a1419797b8a2c01f28588429c62a228c55495b3cdc5171370d17",
-    },
-    "0x9a71012b13ca4d3d0cdc72a177df3ef03b0e76a3": {
-        "ticker": "BAL",
-        "signature": "3044022065dd446f0899eaf96b76e325fcdbb44011aa2cc74c97c8efeaefcba268c8ef88022004b20ead8b2627dfdb27295fd1549390205ffdfb101259c5e52049012e1b5516",
-    },
-    "0xcf354603a9aebd2ff9f33e1b04246d8ea204ae95": {
-        "ticker": "B_50WBTC_50WETH",
-        "signature": "3045022100923c34a9acb0b20afdfe9df6ba0b9ed062c4c6e40f1e2b4ee121cc3b67a0713a022010cc8f23484b0154f1279c9111ebdc96a94b47fba916e3ae28185cc7d90882e0",
-    },
-    "0x10f21c9bd8128a29aa785ab2de0d044dcdd79436": {
-        "ticker": "B_50WETH_50USDC",
-        "signature": "30450221008e46042b7fd6ea5287dc7c901c1c976bcf7d0076fccab6e42f81add4e32d4e5602207edc2a4dd9f04c2abe6d385ae855f8b97890c2b6f60d01f762390a3befc1048c",
-    },
-    "0x48e6b98ef6329f8f0a30ebb8c7c960330d648085": {
-        "ticker": "BB_AM_USD",
-        "signature": "3045022100915f26d82b2a84852b894d911956f252f4f961703b3dce53e544f261dc9d80eb02201372de609af61afab6efb45291aa119301992a45a1cc65034f567b73d388864d",
-    },
-    "0xb20fc01d21a50d2c734c4a1262b4404d41fa7bf0": {
-        "ticker": "B_MATICX_STABLE",
-        "signature": "30450221009f18b97166a1247b2e43bea65a00e3b99bdddb269b17022de51ba7d797fad5a102207d336c6b676ca1e492cb03e88bd0cd3b9cbcaa72241b11512d626fe2e07c99cb",
-    },
-    "0x0297e37f1873d2dab4487aa67cd56b58e2f27875": {
-        "ticker": "B_POLYBASE",
-        "signature": "304502210095a167cb5d5cbe979b1c42b954983a2486d8e529b2ede2f29a5a749cb5909fa7022076bce2495ce7123a58936d541e293cd2de579eb808193aaa3cf182cd2331d818",
-    },
-    "0x06df3b2bbb68adc8b0e302443692037ed9f91b42": {
-        "ticker": "BPSP",
-        "signature": "304402204b6d62023dcb0d0ff583258fc2014ad09bc06b28dc71a5eb66e75af7d3858fdf022015f0b7b3da5de7d432c82bb8b4b67ed09a7208de85995090c40f87444fc363ba",
-    },
-    "0x03cd191f589d12b0582a99808cf19851e468e6b5": {
-        "ticker": "BPTC",
-        "signature": "30440220787667c61f457daa0cc3ca885056c916f66f072de877ab7c532eba639990267902205f2809d3d77d92ba93e5018c9e400edceb198a71299d7346a42fe9c7302339e0",
-    },
-    "0xfeadd389a5c427952d8fdb8057d6c8ba1156cc56": {
-        "ticker": "BP_BTC_SP",
-        "signature": "30450221008eb5282a52bb5815eb8ae646551ae0db0ce2702ed42dfc06ec15e2239112687e02207297618b013f88d9d1314a1ef817d787b92570d677895f5f8ae407131c6e3ab5",
-    },
-    "0x8159462d255c1d24915cb51ec361f700174cd994": {
-        "ticker": "B_STMATIC_STABLE",
-        "signature": "304402207c7ac4df08238737b3a342575159edc07081ccd90c40bbc4e37c9a506cdcb9a302201208a012d07baa717c6674e437d35b5ccd84d34aa52bcb2eda6ece88966bbcf6",
-    },
-    "0x0d34e5dd4d8f043557145598e4e2dc286b35fd4f": {
-        "ticker": "BPSP_TUSD",
-        "signature": "304402204a469c7c1a29aaf449319be599728b6653292ee6e887366fb9c9a057ac4fd85e02204b133bcc15995da12fe585d196e5fccde7d3ae2207fa45fc5c6e643bf4facbf8",
-    },
-    "0x65fe9314be50890fb01457be076fafd05ff32b9a": {
-        "ticker": "B_STETH_BPT",
-        "signature": "30440220386003496021d41d60b667c3832f7a70f50024b6826c85a26bbbd83717b0fab80220212ef6f9be058774b73dea8af9fe7d2940ccde42c5b76cbe5683054b6d0a258e",
-    },
-    "0x34a81e8956bf20b7448b31990a2c06f96830a6e4": {
-        "ticker": "B_WUSDR_STABLE",
-        "signature": "304502210097e8cbd920a458ce198b026a8acc901b31293c5cf80dc8dd12b1680b67bc771002201156d4c0ebd012f31a87b40bbbaf427311a3c9024fdc04f4337b0250d9b1b3eb",
-    },
-    "0x883abe4168705d2e5da925d28538b7a6aa9d8419": {
-        "ticker": "BALL",
-        "signature": "30440220236cd5dbe92008e99007e341f2ca533c141fe122718a6c9a83957aa51c9fec3f02202129d98877af5f3f65713fd6b042b057e9d21fcc24d119a690302813ad0b9af3",
-    },
-    "0xc26d47d5c33ac71ac5cf9f776d63ba292a4f7842": {
-        "ticker": "BNT",
-        "signature": "304402204b1b00e8d2b713b42b1cac76c4977ba8b327da2e7edaeacdb208061dd28b214202204d3e78d072bfb6bb11a342f4764444bdee2cd5b1cb4e748f0425571dd7021fc9",
-    },
-    "0xa8b1e0764f85f53dfe21760e8afe5446d82606ac": {
-        "ticker": "BAND",
-        "signature": "3044022075f96cea4bb8035072670571807593f8ef1ea06ab86aef4ad07ca3bee21ad1df022076c94c82bee2509c4fe0a7c9db819188ba3805567a9ecca3c98caac8740291e4",
-    },
-    "0xeeda694439c6fb56cbaa011cc849650b7273285b": {
-        "ticker": "BED",
-        "signature": "3045022100ba1d0670c60d90c5e2e2d38f77abf813a7ec19228b66b12bd44e0e7c7c26d68102207fdb1423e214491a0dce15700210323eb553ce0f6ebcde31d6862fb8ad30050f",
-    },
-    "0x7fb27ee135db455de5ab1ccec66a24cbc82e712d": {
-        "ticker": "GMI",
-        "signature": "304402205efce28d158faf0e725c1d9737bf576d8dadfb1a9bc94263cf52631bbd1858d202202167d371ca4e308d9c95aec7e1465a018b0d6eb1cc46f045c2393398121ed431",
-    },
-    "0xdb7cb471dd0b49b29cab4a1c14d070f27216a0ab": {
-        "ticker": "BANK",
-        "signature": "304402200f1337948606d0532ebb80a76fd82478620bde22c94d6a724ae087d55456386f02203655d2dcb8037ae2e43ce66ec24ac39f2c11bb539d854b66775b7d9eb9b459f0",
-    },
-    "0x83a6da342099835bcaa9c219dd76a5033c837de5": {
-        "ticker": "BASV2",
-        "signature": "3045022100ed7c4be73183a24f1ea0ff2478e96311efc84345919f48234cf66fe416873a820220656ef893d7b06d494dd228077a6eecf71cfb8c941f0e32f58a5357811b577b0b",
-    },
-    "0x3cef98bb43d732e2f285ee605a8158cde967d219": {
-        "ticker": "BAT",
-        "signature": "3045022100cf93e17a4073c83ddab8b64e01c0c64d6c2cb96a87c3a84a537bc1905933762902205bf6f9e94ee53d75e7c3ee7381703eff8131befbedfd72ec6cbc60d2ff942009",
-    },
-    "0xc1543024dc71247888a7e139c644f44e75e96d38": {
-        "ticker": "BWO",
-        "signature": "304402200ef961e6e44e6396b79863f6819307420bc0b2881238ef6b6ccfee336ce4f2d802203814e181f8718e95fee975ba004876a64677fe7bdfaa2aa390c7ab8242392473",
-    },
-    "0x3afe98235d680e8d7a52e1458a59d60f45f935c0": {
-        "ticker": "BBG",
-        "signature": "3045022100af5cf21fffbb1e361097ef063e5a9cf88e91681bb9d83ad33b27bbe9ca6f0c8402204d236a04ac4451a37729261b14669b95b7ad9ad693200b681f8f0b1eba1c76d9",
-    },
-    "0xfbdd194376de19a88118e84e279b977f165d01b8": {
-        "ticker": "BIFI",
-        "signature": "3045022100be4c0e7ec00fa9fd985b145dea6b86f89ea3284a17912b8de1c1238910f69ad402207b62b18577fc9d8acf3927f6fc3c109ca76eb66366e389e4a86d93d826211db7",
-    },
-    "0x47536f17f4ff30e64a96a7555826b8f9e66ec468": {
-        "ticker": "BELUGA",
-        "signature": "304402202a7660cd8630aac250d8d570b6eacbd9ca2d76f620ec102ccacd530fb299e98102201d514d88299c65b7ba23c16d18e0f2849421d6a1c010615c85412a57b94ca5f8",
-    },
-    "0x07cc1cc3628cc1615120df781ef9fc8ec2feae09": {
-        "ticker": "BEPRO",
-        "signature": "3045022100db4b16fb793cdfdd83067cbdff8cf6cc0552cb159ee8e0187174bef6fa2224f4022011ca25280fa0eff139fec6e0c76628258d319ff0b37abe24147c623751ea26a4",
-    },
-    "0x94025780a1ab58868d9b2dbbb775f44b32e8e6e5": {
-        "ticker": "BETS",
-        "signature": "30440220312b0e25184e9484b3d4560fe7ed0fccddf1fc1372fc6ccd07a63fb55e12d2d9022046362b3f5ce79dc4a576afedec150a86c62f9a27a9593d979d50dff8f886f625",
-    },
-    "0x11602a402281974a70c2b4824d58ebede967e2be": {
-        "ticker": "BYN",
-        "signature": "3045022100bb372fc86476b535bff470a09ade2a6941396926e17d76563b71d1d5acc0fce502203e44c49727921ce58512d802ae60473ea6fbb5ee43247ee4d8422075fa6cd140",
-    },
-    "0x4fb71290ac171e1d144f7221d882becac7196eb5": {
-        "ticker": "TRYB",
-        "signature": "3044022002365e725c400ebb56292842a17c819cbc896fe22f0ebc1e0d6347dd70a79cdd022022324a6c69cdb06829df173ece67a2862cce3861ef94fff676c0133f55b3eca6",
-    },
-    "0xe78649874bcdb7a9d1666e665f340723a0187482": {
-        "ticker": "BIM",
-        "signature": "3045022100e3c49a69a0023fb956aac21589bcb5c04e06e413b7ba819a5ffabdfc2fbba27a02202acfc56f21bae438340db9bc49d38a477d4255d733d65c6c7cf8dc0f637b86b2",
-    },
-    "0xdab529f40e671a1d4bf91361c21bf9f0c9712ab7": {
-        "ticker": "BUSD",
-        "signature": "30440220306d65bd1bf54b51405a55dcea267903367f453aae13e7216f6cebb23dcbb6e602203c279f533074b262ca907f0c1c7444ba9cd244154f3d655e03b7383dd346d07c",
-    },
-    "0xe20d2df5041f8ed06976846470f727295cdd4d23": {
-        "ticker": "BIOS",
-        "signature": "3045022100b4d689592800555d0bcfa5e560b83857bbd6723dc74bc53904187bb457df6750022068403509ed3b60e24b4bb244095b2d2079491151e57161d3497b83261e8b1bfc",
-    },
-    "0xe613a914bbb433855378183c3ab13003285da40a": {
-        "ticker": "B2M",
-        "signature": "3044022009f57d54d5f992c035ad5592dac587217fe7d6f7ac14a0fcf99f96c31663632d022003f9e1b826087b30d4df841d32318fd96e009dc92d98411ccc54341d2e0f833e",
-    },
-    "0xb355f4f4cc84a9429a59d5c2b98d77016f7ec482": {
-        "ticker": "BTCBR",
-        "signature": "3045022100dcb35783335cb1e18041f5ab6aad2b666909104a0d48f5a4fcc4c83acf360584022058f7a1b2f7c294eae4c76a3397df93856f8ca99844340087c0ea59371b53ca59",
-    },
-    "0x05f52cc483c50c2a7e25a13dac17d736fa50f259": {
-        "ticker": "BXC",
-        "signature": "3044022075e54dead5349417612097cbd1637c7a4cb657ba22aefdb65c7cc46a25fae8dd02206a03158c505db28d33468c7f412220d809dfea22cd63639478c32a241a70f7bc",
-    },
-    "0xba777ae3a3c91fcd83ef85bfe65410592bdd0f7c": {
-        "ticker": "CONE",
-        "signature": "3045022100848c778a837ad9b768f6e1a372b4f6af1b14b6e260f56f31b1d04f8c1a194965022076b6e17d325338468eef129c9aff3d1fd9ebbeeba2301b34b5e9ff8ecd2223e9",
-    },
-    "0x06d02e9d62a13fc76bb229373fb3bbbd1101d2fc": {
-        "ticker": "LEO",
-        "signature": "3044022054e6d7c9f16d4a6128edd523e016180098c29c0585bbe48ea410254e681952a502207c5a3860f2f295f2b07171b2e0724a3e806d654a378e08baedc422f5c7bd865d",
-    },
-    "0x0fced30234c3ea94a7b47cc88006ecb7a39dc30e": {
-        "ticker": "BTMT",
-        "signature": "30450221009432dca566370773c77543deb21f22205653a19a38c9aea7355d1e9ade43269a022004bf5c218c11206bfee9000754b82f5c3a6fc3e0f1305091dba55d88e5079712",
-    },
-    "0x3fb83a9a2c4408909c058b0bfe5b4823f54fafe2": {
-        "ticker": "BCUT",
-        "signature": "3045022100b403ca029b4d8cfbbe070574238495bb016eee4db6a3056bedff8fbb1507a630022029961ab88b01cd3457f6226f267f62cdb5101e51678846075c745e13a00d9d0a",
-    },
-    "0x5f5f7ca63a9d2c5200bc03ca3335a975d8f771d9": {
-        "ticker": "BITS",
-        "signature": "3044022035f98b0c7a00f428609475a1a952ae5d011bb57bc4e0887542f182807275e3c5022023510dc47bb6da08d2b1ec58c8f5356ddb062a4dffb8ec42e38db56fa9a9baeb",
-    },
-    "0xfd0cbddec28a93bb86b9db4a62258f5ef25fefde": {
-        "ticker": "BITT",
-        "signature": "3044022038711bbf0dc0da3bd4ebe7fcfb797a05b28c334dcdb6a236619a347f1f6ccbf502201093bd8506b66ad2afc7225a7d9e6132e5258d9cb213053031250cde1257d028",
-    },
-    "0xa288e965e86ac4e5c03352f199cc7a66022e15a8": {
-        "ticker": "XXX",
-        "signature": "3045022100bab043d00cc416be4544dea9b5f4c1d475d68a088ed725ae270a491f894cdc32022072e4d8669afd47c4709126f10928be4edfdbac12b4180912751819c15cf91c54",
-    },
-    "0x8626264b6a1b4e920905efd381002aba52ea0eea": {
-        "ticker": "BLKC",
-        "signature": "3045022100ebc0bb94e39990143aa99e9202f94c8599a72b681adb8bdc504f748ad56bd40f022030f2f92498b8a747032d7b6c1d02b02a06902c025faec9d2293374528da4b8a8",
-    },
-    "0x6863bd30c9e313b264657b107352ba246f8af8e0": {
-        "ticker": "BPT",
-        "signature": "304402207f74e8cc4b32aafa132655f8da80366dce0d7ec60ba53eb595d9ada6388609d502200d12abff69a31fa70ea9afa896cc3b0065673b6be884ca2d87d226417f115076",
-    },
-    "0x0c47298beee5203358e7bc30b9954b584361eab5": {
-        "ticker": "BS",
-        "signature": "30440220244abbea8b5abf705fdef0e01ecd05fe4cccf35cd4e0aaaa59af4ca5e5c7fcec022041d0122187f570209aa7f8011a2dc4a9d3ba6839384a6aeae71dffe7580bb968",
-    },
-    "0x1b599beb7b1f50807dd58fd7e8ffcf073b435e71": {
-        "ticker": "BLES",
-        "signature": "3044022055045ac2b8a9fc2e08905563c87bbeb1985e56b118d46d3a1ee7d234fa16755902203831509d2524b9bc2e628f93dd1d9d1a92cee141f20482edd9ff2e6b469258a5",
-    },
-    "0xc10358f062663448a3489fc258139944534592ac": {
-        "ticker": "BCMC",
-        "signature": "3044022065635da1f4f2c85ee21e4cba64155769988e743e22c90ebd481b6b37734426c902204bbbaddcddfe00e61e92adae2593ac2defd3cd90c66efa4e9731c91d2dfec87a",
-    },
-    "0x2075828cdedc356b5358d79cfd314548842e4a2e": {
-        "ticker": "XCCX",
-        "signature": "30450221009f746b29c8059e8aa0ce1df2e8fe3eb89523ff9e2c822f886508a607971bd84f02203b0ae375f67ca25d4419426e92fc9881e92c126059bff6968433b0ee4705cd4c",
-    },
-    "0xaff41da975501e5b71848c975834341777d1a473": {
-        "ticker": "GUILD",
-        "signature": "304402202a69f969d83831e16cce7167c1e4007cc23837dde0eb9a69338ee535020c88d8022040bf1c6ac489bc84fb60427bf552662fbd03621db7a924b356b78205518bd442",
-    },
-    "0xf1c1a3c2481a3a8a3f173a9ab5ade275292a6fa3": {
-        "ticker": "VEE",
-        "signature": "3045022100d773ab7c886b3a27979a1bbbb8e9f74d4859c533304092ea8ce81de559be0c96022002fefc041758c7b9ffbf6870c876af5ba66f8ebc86af37552fa5562186c8c474",
-    },
-    "0x229b1b6c23ff8953d663c4cbb519717e323a0a84": {
-        "ticker": "BLOK",
-        "signature": "3045022100c163912ceda6b2f5ae6c7adf21f46dc85d282a914e08fba485fd24cef0af5274022072824adf7a17b1f200710c1f052bf3dce11a0eeed1c59faca05acf3c9e55574a",
-    },
-    "0xfe049f59963545bf5469f968e04c9646d6e2c2c5": {
-        "ticker": "BC",
-        "signature": "3045022100cd2cbaf3ecc3dc67c1a95fcf6417257800f4950aff575b38d63bc93598bf05de02206a8b6549cdc41aefc7860b6802372e42687be1b897556548ee4779eafb5b4fe2",
-    },
-    "0xadbd83bfc4ff8a4f0bbf1d1b8d4780717a4e8fb5": {
-        "ticker": "BLUES",
-        "signature": "30440220362126cad38c637a753bb0f402862d0e6ede3073853bcf2f83d9c0ce94334b7e02206447b28b6cb344edf0b7548197b9fd3b37f9354eeca23bf3ea5c8b8b0ed50e6e",
-    },
-    "0x438b28c5aa5f00a817b7def7ce2fb3d5d1970974": {
-        "ticker": "BLZ",
-        "signature": "304402203b0e1be78acac09c1f4d661dd3dad5c291c2b0c107531be52687d1834ff9afd50220443f3ab75a8337c7d3cdaf857ef35cce24f0bbc82d83cea08713ca64c8346df8",
-    },
-    "0x3ba4c387f786bfee076a58914f5bd38d668b42c3": {
-        "ticker": "BNB",
-        "signature": "3044022076d39107a36eaccd897219063fa00eed78903b739ff83bad07990d3f2122b81902203916c2533447e0b7bbfabb45e1dfce2440c664ec29500a6f4e571bf0f0b617a2",
-    },
-    "0xfe457497a2a71bce1eb93ea9e6a685057dd93dee": {
-        "ticker": "BNSD",
-        "signature": "30450221009d85b5e2bc939b76a987a86d5fc34bb7743996fb46d37475633aecaa27dd844b02200ead120734bcb4b19f8589e0f647b900194e3e0d26139c750dc532092a23f736",
-    },
-    "0xb0b195aefa3650a6908f15cdac7d92f8a5791b0b": {
-        "ticker": "BOB",
-        "signature": "304402205a86390cb139ea4ca0c63e01885905ec06cac8ce3caf20ef66626e82f57dc6d4022056a98d8d4d2efe15903e81b0d2d00bd2972d2ccc5182f1ef7c4ea13c83c4c48d",
-    },
-    "0x590eb2920486486c2d9bb3eb651f73b81df87bcf": {
-        "ticker": "BOBC",
-        "signature": "3045022100bd49539f04729820fcd535e96ffa1674917d7b7938114a672dbd2cbfd2f617fb02205741dcf25912967653a29a451a1a29b119618e9477cf63c65ac2d61f08664703",
-    },
-    "0x4b27cd6e6a5e83d236ead376d256fe2f9e9f0d2e": {
-        "ticker": "BLID",
-        "signature": "3045022100ece52df0960bf5da0df86d3bcb3559dd15e02ce7194e2a746b058e299c96182802206cc4bb371362c1f3b1fdae3343230a556b7f687fde16109c6228884fd03c6012",
-    },
-    "0x7dc47cfb674beb5827283f6140f635680a5ce992": {
-        "ticker": "BOLLY",
-        "signature": "3044022010d5a4dd33bdc4964be5f9b7a8e50e7d6c9f5d09c6936af799f23d09bfff90ad0220597b7c15f926aaa5b49f3d45774374da893b1f1ae27b796d5a9af1f8953df187",
-    },
-    "0xb2c63830d4478cb331142fac075a39671a5541dc": {
-        "ticker": "BOMB",
-        "signature": "3044022002c593cce248ac1b9aef802fff279c1f2cecdec50c1dc030cea21b3b004ab549022057cde050a539d78f6e752b324f5201aec8a7b914a259c5e96a8de01ae0ab45d0",
-    },
-    "0x64ca1571d1476b7a21c5aaf9f1a750a193a103c0": {
-        "ticker": "BONDLY",
-        "signature": "304402202e6b25b3b70819af75522a8a6631a1b405b2d374a2858b4e72a9e4bb795aa393022037f3a4665c2d07bb4b2bea02ee3daf930b5d46392ceea12664d8cb46572aa54b",
-    },
-    "0x80244c2441779361f35803b8c711c6c8fc6054a3": {
-        "ticker": "BONE",
-        "signature": "304402203a15aaeced1965f8a9d19a1ee716108e1c73f1f5705d766bdbd3490e7471d18402205cc59469cdf7e431eab6a0ab7f0ba4518f487d5a8216e7130b5ae496bac6c304",
-    },
-    "0xe5b49820e5a1063f6f4ddf851327b5e8b2301048": {
-        "ticker": "BONK",
-        "signature": "3045022100c470e15bf8ef7a99f4bb4acf770d4ea25ba1f3aaa9e425c68a65b49dedcd2fb2022049bdec33ca58aaa4db93372128538ca60660a99e06c9b95dba196f473c584948",
-    },
-    "0xc59132fbdf8de8fbe510f568a5d831c991b4fc38": {
-        "ticker": "BOM",
-        "signature": "3044022072416a6217dca78fe98212c525fc98b87d47f61e51b88f80d0a7904233bae8b4022029d3f8f0b8cfef5964016fb26c084f3bc3431a8052936886373201233175182a",
-    },
-    "0xff88434e29d1e2333ad6baa08d358b436196da6b": {
-        "ticker": "BORING",
-        "signature": "30450221009c9cac09e7e27fd6b64bd3627851b4e4d320aee8cb53b811b8574320cd0c885102207d239b7d1bc3d685fcb3bceb1ae8e6eae208f07ad5e315509043620a3e4ed75d",
-    },
-    "0x9b3b0703d392321ad24338ff1f846650437a43c9": {
-        "ticker": "BOSON",
-        "signature": "3044022058b04f883555c335919d904ef85f37118d537c153c21f2b7c604e8518003733b022014ccd32dd67a015b4482639ecfbf340485775fe4b47ef8244bb5f1cb0801cf24",
-    },
-    "0x0f40d69ff494a9e74b1f20a89eff299b2a05918f": {
-        "ticker": "BNTY",
-        "signature": "304402206bb140450d162c3bf97a049dd4af1e09b9f245e88b79ec80896ddbbc321d707202200868a516eb569065c5158fc6214b56e70fb0aba000f42ff6e5c15f0e6bae7e6f",
-    },
-    "0x6949804b60dd9dcea43fd8d10ccdc640b55f9f7f": {
-        "ticker": "FXBREED",
-        "signature": "3044022029492f6b29976315756aabfb87a6ce4faf859fd094038fd5c0703bf08b4eb7c9022026ed315f2d3bd97d65b5ecb493955aaf269ebf8b2af621009af52cf1d2d87358",
-    },
-    "0x4ed141110f6eeeaba9a1df36d8c26f684d2475dc": {
-        "ticker": "BRZ",
-        "signature": "3045022100848f676c42801997ba785eeb11ccc88b624402e338b3e743aa1cb376a9b5aef7022046ef14e53d78d4760b811033ea1e33ba302ebe8a09802aaf1f4b2cb944643bf4",
-    },
-    "0x6ccf12b480a99c54b23647c995f4525d544a7e72": {
-        "ticker": "START",
-        "signature": "304402205e49be33378af228fe6521f8643d1b448679fc676e7fe28646b4f9fcd3888954022019588a304951a4a3ccacd77e90e835f40a0149d0c1ef236494d0b066ea00d097",
-    },
-    "0x9a6a40cdf21a0af417f1b815223fd92c85636c58": {
-        "ticker": "BSKT",
-        "signature": "3044022042618905dece3d97044cd217c0c959383185d69db25ed80c3be835fee74c00cb022007790a61b1afbf6d95e6bbce476bfc814c5c4f5659e653040c8cec1eb67c653c",
-    },
-    "0x4b54bc363f5f9c6e0fcd82eac6919ae213464cc6": {
-        "ticker": "BTC2X-FLI",
-        "signature": "30440220260fe077037f2ea7283410a03b93ec0880fa4ea14e55ee5c36e0c017caa72fe4022059ecd804021753fb1fbe928c16f825b44654454c7d1d5d775dba8de0eea7491d",
-    },
-    "0x9c32185b81766a051e08de671207b34466dd1021": {
-        "ticker": "BTCPX",
-        "signature": "3045022100b8d4e68e439633e415ba6bafb4ece97ac55e32f1188dc2e612aa6d73d381d2110220573e151e0684307a0fef9681acc4833992d1cc5b0b0c8fb940f1398c6f1c67b7",
-    },
-    "0xfdc26cda2d2440d0e83cd1dee8e8be48405806dc": {
-        "ticker": "BTU",
-        "signature": "304402200e7b49c9063a554ae4ce257e36df3da4afc6ce7ffc99d8c2c02419381475fe61022027aae3d6973f9cfd77ceebfd77e3fdcbb51f2d148a6801724d51b626f1cd7e3f",
-    },
-    "0xe94845ac6782a2e71c407abe4d5201445c26a62b": {
-        "ticker": "BUILD",
-        "signature": "304402200c0c1c23c698b85692d253239c6a77c5d0e55906831ace45a7ee15a38b0a3eca02207ecd7401a6a70e20cd8952d95fad4b4c6faaa692fa9f33489e61dd9389e28dcd",
-    },
-    "0x9f95e17b2668afe01f8fbd157068b0a4405cc08d": {
-        "ticker": "BULL",
-        "signature": "30440220626cb9e03e72d10b6706c4424589c40f5bf8d37032e3a93cd2f621eae1de9b6302200e2176f986c49a50068e3c41dcc751efaabc6791540e4c3f159cc43b70a16738",
-    },
-    "0x47dae46d31f31f84336ac120b15efda261d484fb": {
-        "ticker": "BUND",
-        "signature": "304502210089fc5e63f17332505ec16e3df33255ae1ea02ecc2cff0544ce949592e2c4ef1302206957792ad9ed84103247b7ab249bd055b4798432d43f6c9251441344ebd8f774",
-    },
-    "0x538d47d142f6993038a667e9d6210d3735749b36": {
-        "ticker": "BURP",
-        "signature": "304502210093eadf05abe01733e3f3a2a7a72527159105d944b647ce8d012a5ce5dfd5d4630220398b1b8dbcd99967bfae142fa63e839f0401a6cf5f707d0a45e0281a569f256d",
-    },
-    "0x9c9e5fd8bbc25984b178fdce6117defa39d2db39": {
-        "ticker": "BUSD",
-        "signature": "304402204ebeb9cc4f576f9d9bdc09cd6a62db00c7e78e16f009cde3a592ccbead6a2dce022013c279d79dd9d7fcce0bb65924bed1244500b4b072b5b16a8881a613bbcba015",
-    },
-    "0x54cfe73f2c7d0c4b62ab869b473f5512dc0944d2": {
-        "ticker": "BZRX",
-        "signature": "304402206fa371d32fe05821a0bb28306c3f3e2f0cf2f1a6efec349bcef67894575459c8022025e11ef31b7be14dd464c05237267105df54691f27ed50a6d49c64f1d798f0b4",
-    },
-    "0x9de41aff9f55219d5bf4359f167d1d0c772a396d": {
-        "ticker": "CADC",
-        "signature": "3045022100c501eb9158a6f6e82b5b9622524fca0ec574ccd556171f2adf49810458ba1f3602204e5f747baef54d1b690d073a07f7fd494d4a7919ba6d3594e051d3939d8da696",
-    },
-    "0x5d146d8b1dacb1ebba5cb005ae1059da8a1fbf57": {
-        "ticker": "CADC_",
-        "signature": "304502210096e6b8f9f4ab9a76aa2f2e1b2495f90c98ce2f28c7cbbd44220b7e5d99712882022069a7a0011ae48b4b4de77c969bb81407f3ea618d7ef5cf6827021e7198a96d86",
-    },
-    "0xf9cea445c2ac1668f50caa2c2924f93606a4a37d": {
-        "ticker": "RIA",
-        "signature": "3045022100b043d9c6422f7ce732f7dbece99023065ad14551924d4acd943c1e0f5e29d2e3022021116a678175955b5f70cf633fc63078ed417820bb7604fd033256afb32250b0",
-    },
-    "0xd1a2192d57bb0e7bf3251dc9b7b582270c7b85da": {
-        "ticker": "CML",
-        "signature": "304502210083573d28a22ca50bc1e7ce3d8882b7d2d4959bd963ebba64ab2bf74a7c9c830e02202d96d0c21dbff960db7775f91d4a982d09fafca0506282381e688984926ed8ea",
-    },
-    "0x67f285feb30a21dc53c7ace22ec5526d18375985": {
-        "ticker": "CPY",
-        "signature": "304502210099bb6f314bb1d69598365e02e07f5733830d6b529a60dd8b1b87ef5c52ef1ed302204d4a843b02cafeb921dd56f731cf83597a3b610e27675c922ccd9a1f6ba21b65",
-    },
-    "0xb6a5ae40e79891e4deadad06c8a7ca47396df21c": {
-        "ticker": "CBY",
-        "signature": "304402202356b49c918a0928020b850640f0bfec28f9f7833491456f79d84959ef9ba1c6022027b5fb1e9939a9db4b5f75a845cdb779faf1bc280a7725c4b3d1dc80613e9dd7",
-    },
-    "0x3a4bed49ab592a227bae8f41efd0d38e6e06d96c": {
-        "ticker": "CARD",
-        "signature": "30440220692705b2b40824a4e54ea19f3c25d012bf770fbfceddb6dbad50b7d18c31193b02207df69bfea34b27d87a075503dcbc3fe5dc1c1274d80a95ab487dc5e406414aac",
-    },
-    "0xf2ae0038696774d65e67892c9d301c5f2cbbda58": {
-        "ticker": "CXO",
-        "signature": "30440220306051149039bf55bf4c3f68194216508b514becc225db631b1140470399a59c022046dd1317f9ccd33c076fcc3d9222373b548a3754bf9339b8f64a45e62fce541d",
-    },
-    "0x9b765735c82bb00085e9dbf194f20e3fa754258e": {
-        "ticker": "CARR",
-        "signature": "3045022100db8e5319500586b73042dac16297346fff221e06574e38021f823387a7a4808502202e6a2ff511b348c69108092e5ecb74e17bb2585f4682131c752b1e214e36b5b7",
-    },
-    "0x40f97ec376ac1c503e755433bf57f21e3a49f440": {
-        "ticker": "CVTX",
-        "signature": "3045022100c8b5c941328263655779bc9046ab2e8a262493a76c3faa23259aa01425f0ab490220664ed16af46d573478db1c8e502c0a1b01efe0baf13cfe45421c45af0307b7db",
-    },
-    "0x2727ab1c2d22170abc9b595177b2d5c6e1ab7b7b": {
-        "ticker": "CTSI",
-        "signature": "3044022054686793ff24f95f598775b460d19b47b668403f6446a8be2e0811ec22449aae02202a3f43510fcdf81b3fc1c76eb4e1319090b99889327741abca749029ea339202",
-    },
-    "0x5d066d022ede10efa2717ed3d79f22f949f8c175": {
-        "ticker": "CASH",
-        "signature": "3045022100fb83603a29c99efc6c1a9435c405faaf9d591ef1adc8cbd9220054055a981d26022062e36464b498f7034c15d5cdc309d9189357fb8f20e11c6ff59b8d5dcbdaf7cd",
-    },
-    "0x7e7737c40878e720b32e7bc9cd096259f876d69f": {
-        "ticker": "CATHEON",
-        "signature": "30440220591ee71993756d8fea66c93f081648cbbda26ef502e2bad0fab332e83df9a0db022024d806391bae495176e1ac26dfcea20899f259cb4ef055972fb209112248bb1a",
-    },
-    "0x38b501279f1b78f2aa8f2117bf26f64252fe3f2f": {
-        "ticker": "CATS",
-        "signature": "304402200fa6cb2e4939547d94c25faa370d5810ef231bcff5314d46ffd9ab1c9fb0daa802201c8034fb44ba3324988c1e5cfa2d7fc3025a3e898e16519b19b1636c0682c80c",
-    },
-    "0x6ae96cc93331c19148541d4d2f31363684917092": {
-        "ticker": "CVR",
-        "signature": "3044022029d8ab02028a2362424a4fe6c834e2c124fb3f156adc4bedc47ae66d30dd1a5802203a06fbe3335ad2a0b5aea9cc1a83b582b3e980ffd2bffe101d502300775c64c1",
-    },
-    "0xcf74ae52ae2c848387e6cd0048e1ec5a93ee2c66": {
-        "ticker": "CBOMBER",
-        "signature": "304402200966e09f8d585eae42c2d201c289ad6d3c6610ca2b4aad2464601529e00ba8a802203a4fe22460d6512b7e1e3f2124bd20ae546396ce95fdf5212b56e687a0e42c10",
-    },
-    "0xf5eb811ccc9e394b3bca461837383dc71a610442": {
-        "ticker": "CCC",
-        "signature": "3045022100f0e07126cefe5de28e3b2ef4619d80d639f17e8a247486b373107083a608ffb302202ae92874a9d8284bbcc901ac61a5808a3717e2a893f776d2ec88897eeabadb34",
-    },
-    "0x527856315a4bcd2f428ea7fa05ea251f7e96a50a": {
-        "ticker": "CDFI",
-        "signature": "3044022035a9f457024b6ed8a171adf3040a6eef9601d726c76a0ec01293c084f95e3ff80220413b66d3c6cf9238b3ac0ac4c04de11c0c0221691fdb5330617dd58fc68b9e39",
-    },
-    "0xd85d1e945766fea5eda9103f918bd915fbca63e6": {
-        "ticker": "CEL",
-        "signature": "3044022073bf3843575fd64633ca39a68160cad26a12c1a6714e5c0ef3464ccf564c7e9802202f40c3359d904bd7623e41f374ec0e1aa34451239cf5468ff1f75a2eb25a22f4",
-    },
-    "0xfe4546fefe124f30788c4cc1bb9aa6907a7987f9": {
-        "ticker": "CXETH",
-        "signature": "3044022007a75f4a7bc72765862f4742a8dc9d187db55a0b0668a58e5e17b4f0b6be641202202365125a2af7768b8da23be4b5700f3f654a66a27aacceee02a658aad1847c6f",
-    },
-    "0xdae89da41a96956e9e70320ac9c0dd077070d3a5": {
-        "ticker": "CNTR",
-        "signature": "3045022100cc262c60fbca8d0f0628e5c702cbef784d7297e622d417fbee1efe1897d3f5250220028059143af956bf4b969318bd4eb00ff7f083a14f5df6c5a535d0120d979252",
-    },
-    "0xdef1fac7bf08f173d286bbbdcbeeade695129840": {
-        "ticker": "CERBY",
-        "signature": "304402200f2ea2ed631fff9298f1293cc976c4c27ad2af9f1de804d54ee700379d3e2ebb02201f6bbb1f7765f7aa60592e1c390449014a86eadc53ba9b03577bde85a6cc150b",
-    },
-    "0xd55fce7cdab84d84f2ef3f99816d765a2a94a509": {
-        "ticker": "CHAIN",
-        "signature": "304402203b32ffc97319ce2a18a25a0d31d97f75ddc1dd8bd8fd4d513be4d6b6e750326c02203136b47f8d78c103483eab1f548a260e79ada593c11bed4ecbc04e2a7c05fc2c",
-    },
-    "0x2ab4f9ac80f33071211729e45cfc346c1f8446d5": {
-        "ticker": "CGG",
-        "signature": "3045022100fa3547def3252866d9ab85e8e388416042d97e0d32030ec01190f3cefdd9d40002201433ec5dc3ed480a5ad0211dc9a62aaeaa8147a302e0a4d250c3fdcd94a12a8f",
-    },
-    "0x53e0bca35ec356bd5dddfebbd1fc0fd03fabad39": {
-        "ticker": "LINK",
-        "signature": "304402207253a5dc3dd9edd9a3fbae8779c20bfff5e3853a6ee46d76903c4c27f7cc521502204f3355c7ff2ce78fd5ba38b13037cafd481a5c058635e649588c8e42eb5e36f7",
-    },
-    "0x189586b5f6317538ae50c20a976597da38984a24": {
-        "ticker": "PORTX",
-        "signature": "30440220258dc07bd0df2753e90f94a668dd3d06a7f24197da6ad93cc08ee23f63d268ac0220749dc3d9c3190aa6b8638ed914c1a3577aea184a33042f33923dbdfe2ccbd80b",
-    },
-    "0x26c80854c36ff62bba7414a358c8c23bbb8dec39": {
-        "ticker": "CDT",
-        "signature": "304402205d1ea1384ec71e5833e091ba6b8729ae3b0d3be81d7c44dc3d4174db4e762c16022005872383219cbe97fa8916434a682dddb6b89898badb4835e6e25a7707f9aa02",
-    },
-    "0xbc2597d3f1f9565100582cde02e3712d03b8b0f6": {
-        "ticker": "CCAKE",
-        "signature": "30440220630e686a8ceb32570d5e44a88a2fb061525cb74cfa743f35d5403f47df179b41022041e5845985d7039989de761fad26f9df1ffbca4979bf390ced8fa42c1ca9d56c",
-    },
-    "0x8f36cc333f55b09bb71091409a3d7ade399e3b1c": {
-        "ticker": "CHER",
-        "signature": "30450221009c0a8e2ac0f008a3d03b3f60a13c5ae42ff6a679e5f37effa970799fc9bfe99b0220411744a7af43e9cb275db6a2630f067bd5b47dc9c031faed130ddb48a15ffe17",
-    },
-    "0xf1938ce12400f9a761084e7a80d37e732a4da056": {
-        "ticker": "CHZ",
-        "signature": "3045022100e2b143261ef36b6118d1d1ed78dd4c7b93bf7b781a7dcbf4775533c1dd5b3af30220187790828d395732ab555173bfd676c9a6044bc8f48221a0338d5f3209f47e93",
-    },
-    "0x24878dfb65693f975d825e157a0685aec2300ad8": {
-        "ticker": "CHU",
-        "signature": "304402206f53365bb9422727d58cc801ce8f578e17b4ee1d8901e2f611d8431d48dfed1d022011061b12babfb018c561b60488e0b5c4355297e76c2cbb519992920cdccc718b",
-    },
-    "0xaa404804ba583c025fa64c9a276a6127ceb355c6": {
-        "ticker": "CPR",
-        "signature": "304402201f897ce32d858e38c3fd6f4d8df97d0a6ca625ea57d64b8f25563d4e20511a030220153696915e781fa265b4314f362a0d79b49ac156f0d183ac8601ce5a0d9058d6",
-    },
-    "0x4597c8a59ab28b36840b82b3a674994a279593d0": {
-        "ticker": "COVAL",
-        "signature": "3044022052e301837d562f10d771fd1959d9249c41ac0357d7cb832aed75144828ac579e022025fe89ab2a9feaeed4fa33bac085c14588407b9a2418c330c8c611ce1ffdf3a6",
-    },
-    "0x9f3c31838312fcb6f3a59e81aa052d5aaa40d6ef": {
-        "ticker": "COB",
-        "signature": "30450221008c2269ba51aba96c6f0676b2a863d93ff27507f3259f79c7bb0e61ffc32f9a8b02204b4d9496208283f47d33ac69f8b911e13cca99bb62c1811f1577dbbde11f9ded",
-    },
-    "0x66dc5a08091d1968e08c16aa5b27bac8398b02be": {
-        "ticker": "CVC",
-        "signature": "304402207401e74344749b5ecddc19767a603170a69fce311053943ec805c4a24f98a1910220031e4a037182c0792091e0969ac785013bec35b0820c9cdae886cf1c5a378e8a",
-    },
-    "0x42f6bdcfd82547e89f1069bf375aa60e6c6c063d": {
-        "ticker": "CIV",
-        "signature": "304402202294d22097eeb69218e05a68f420a743ceeb12dce2ec042b30a8fed5d4f4a6b5022010b72a44b892a54ed75697c70a073c0b74b05d89776722652c99d1f0ea906d82",
-    },
-    "0xfcbb00df1d663eee58123946a30ab2138bf9eb2a": {
-        "ticker": "CSMATIC",
-        "signature": "304402204933dc8a8d0a0406aad56dab8b99f7e5f1ea7b91990a11b6bc30e228a05a938302200286b20c71ccd7438156ae842310bd18ba462943d64a4f8c73e4c00c9298267a",
-    },
-    "0xb08b3603c5f2629ef83510e6049edeefdc3a2d91": {
-        "ticker": "CPOOL",
-        "signature": "3045022100c4880ed98c75baf6940785771b6f00ab2f5b107783741a9581528ed45537644d022020224aa771da141d640deb88a5728f88b1eae271d15c8753c19027cfd739704f",
-    },
-    "0x23e7288164da25cbeba222837b004bce6fa96e67": {
-        "ticker": "CPOOL_",
-        "signature": "3045022100d41cc6b0e26ab69b0600d0e5ed7065ea1d8cbd4a09628c377519c15ba7d06406022063fdaa51aca9d787fb203b05863d8989b0a574ff0a0f3806784645c19ddeac24",
-    },
-    "0xfc2d761544c335df930ef9863c671cfe953e4ea4": {
-        "ticker": "CLEO",
-        "signature": "30440220670aca83daed9309fd5f7c5f8aee8cf34d5ae699e3f6a53b399a7628a5b22d840220343d5655f587ee1cb22bdd5af30df6f6982e0699b1cd3763c1931cf0bf03f7b7",
-    },
-    "0x08715f5c743f747de0005ad6c45336c163711137": {
-        "ticker": "CLFI",
-        "signature": "30450221009d08565c664ab5c5272e8b98a6a33ac701ec8b5a8faaa7a9f308436d104652af02206a0d207a058d70a8d39e3149e2c698f28340fd290d6c486e082020cdd72e579d",
-    },
-    "0x8ba941b64901e306667a287a370f145d98811096": {
-        "ticker": "CTI",
-        "signature": "3044022004499c41cb7abd51c9aa9f92f1e9284c16f6cd717cc05db775b0425a535517e90220723894c31d8c429c2a4244b698d6cc9adc3b255329e9895aa217282b96e519e1",
-    },
-    "0x44f777a333c08bd844f51157ceef49222beb7c8d": {
-        "ticker": "CLK",
-        "signature": "3045022100e120c70f106d34b4cbe30308778dc7e04ddf4eea7ce7fd1ec083294ad547e060022023f5f86d37e44fe2ccbdebb4c7cb01a60fcb6a96dfc4c066d0e91d9655bf58d0",
-    },
-    "0x4ec203dd0699fac6adaf483cdd2519bc05d2c573": {
-        "ticker": "CBK",
-        "signature": "30440220750cf83d6aa716bbe242db26f76af8b1862ddfb01917b5bed44420438ed90b60022050780356d87f319a9d0d335749f7d32b63fcacd8e36e34bdcfc910fe42d969fc",
-    },
-    "0x54e38ca1aaafd4ca90637c8c3e50758eeadaf67d": {
-        "ticker": "COG",
-        "signature": "30440220319e2d52eaf1b5226c40bedcc0dbabcc9d02aa9980af0263b3eb0c6763595e43022076f5b8b58c2008cbb72b37ab8c9c039be1f952bfcee333f72150f6906124ceab",
-    },
-    "0x77f56cf9365955486b12c4816992388ee8606f0e": {
-        "ticker": "C98",
-        "signature": "304502210087108a46c988e0404f9258b5371a8fb07523defa2bad52cb31dfe27324d97d6b0220019d750ca583f2694977adc7576d2f2bb34fae7d42d086d4dae995d9e6e41e0a",
-    },
-    "0x4b4327db1600b8b1440163f667e199cef35385f5": {
-        "ticker": "FXCBETH",
-        "signature": "3045022100f82c0d3286af68853fbab0f23ebb3cce897543420b547092464ec50cbdffbb06022076bd1b048f578e2bdad41c1fd49102c232e7938714e8a75601b3fbeb7c59480c",
-    },
-    "0xc71a7e46266a9a78212a5d87b030f8d1ce942efd": {
-        "ticker": "CFI",
-        "signature": "3045022100aa6cf7a0aae0d8697270dfa3cf204f29fdfc0e31cfec58a35e3ebfb33a418e2502205fcbb920b4338cb46a4e9efc094f92dafb211fde54db2eec08235a62ab09c3a0",
-    },
-    "0x56633733fc8baf9f730ad2b6b9956ae22c6d4148": {
-        "ticker": "COLLECT",
-        "signature": "30440220691d5cd14f09150b097bdc42413cffdbdc1b7c857cdd18a21e2ca492fc11bfcc0220041c0386e2da0932e73a661deeeb8e91e8ff5d365948af57cd50bf9bbcd240f6",
-    },
-    "0x59b5654a17ac44f3068b3882f298881433bb07ef": {
-        "ticker": "CHP",
-        "signature": "3044022064417cf68ddd53f70a0bb0d090c57d05b25b02463dd691444844a0153576a01102205664235f0b4d0afb0f6a4f14a5156008d0632a6717d5d75673bc70e59d94717a",
-    },
-    "0x1ce4a2c355f0dcc24e32a9af19f1836d6f4f98ae": {
-        "ticker": "CPD",
-        "signature": "3044022023ff71b8e245a704afe66a2d0c1fadaa1f52e5096c6918c7728f5a90b8073ed00220208eea36771a50bcff21da421ef7d9179599eefe2d11fafb812733488dae689d",
-    },
-    "0x0a307bd521701f9d70fb29bfa9e2e36dc998dadb": {
-        "ticker": "CNW",
-        "signature": "3044022049bfd09bb5b7b55b808afd13d083c9d9e6e894490b3b1d15d6e2ba12dab2a27c0220334ab1a2501f9ff59f0893165a5f0efa1f51e8a2533a2fcf78e403894efe8c2c",
-    },
-    "0x7cc9e49e10c9924f74f90c09f8f30f1f055acdd1": {
-        "ticker": "CONCH",
-        "signature": "30440220039a1d07936fea859ae07e77f123a15748d58f2f05cad2596df012feeab678b002206ee54bc8c5253393d35731019e3896ea78b4a1d4ba156bf6898904133b201904",
-    },
-    "0x58b9cb810a68a7f3e1e4f8cb45d1b9b3c79705e8": {
-        "ticker": "NEXT",
-        "signature": "3045022100dbe819628930b12888ef658308e3715665fdf64277b7310fd5114a4d847eca7102205e84e3836119ed1db21e4cd40d934542a32827ba86c7147788c4ea8d9fadcd1d",
-    },
-    "0x3b1a0c9252ee7403093ff55b4a5886d49a3d837a": {
-        "ticker": "UM",
-        "signature": "30440220428fee2067fa26e0bfd8fde334c66952433eab2519cb3ccc66d8727d15facb2002205cc139caeace5a15f91d9c6c6e69a9eabaa02c84b93c0f75b199d686d88a5873",
-    },
-    "0xf9d3d8b25b95bcda979025b74fdfa7ac3f380f9f": {
-        "ticker": "CP",
-        "signature": "3045022100965779644a731c62c6218ddeb9a8b599f052eecf48d147a1f9a7c4ab63d27aa5022029f942a166e1480074d2347250d5e96ba7b8644ec205f0499502e58bc1675118",
-    },
-    "0x91f0484f9b65dc5187e414dae5ed37ea7a4b8af4": {
-        "ticker": "CRST",
-        "signature": "30440220164ab6fdc531a8f4cfdb82ea48515bb475f4804e661ce049776cd29b9d8d3988022072e8404c0a64773b2da5fdaffd59258333a3d3c5a269edfedaa75c7bc04374e8",
-    },
-    "0xf6351c1163314e95d025575c5cea314b055b7ed3": {
-        "ticker": "CU",
-        "signature": "3045022100a20b40f67787cf182e0d0b2c6e7305d8ede42c9f96f16b3011df1ec4e32e78b302206223177c540d048ebfca48ec9cb65299f8be8e66fdbeea8986568158a900d556",
-    },
-    "0x4fdce518fe527439fe76883e6b51a1c522b61b7c": {
-        "ticker": "COR",
-        "signature": "304402206acb743c458f0195b0f5628b1e084594fd144127976c83aae00ecf2a1847911b02206e86a22f2e0a18c3ef8d4c79fdad513768e202c406caf212cfa15c95f9e6e5ef",
-    },
-    "0xc65b1b55a287b4e8bf5c04faad21d43a21a1ce46": {
-        "ticker": "CMT",
-        "signature": "3045022100832d595755464619f2f37a29dcca1bbec050e653f9111519458aed34c7956efc022015ced0df1e609262730954f9a3dd59eb6198137734f970e513587862538909c8",
-    },
-    "0xa5eb60ca85898f8b26e18ff7c7e43623ccba772c": {
-        "ticker": "COSMIC",
-        "signature": "30450221009474400a6ad933fe4127d7bceb97c8efbf0b5da73f8cea1c7572be6bd160e41802205f3412f282de56f7ba5a57e1954649b505ca60f3a852b8bf2d412231ecafe5b2",
-    },
-    "0x8d520c8e66091cfd6743fe37fbe3a09505616c4b": {
-        "ticker": "COT",
-        "signature": "304502210083c711937d9d2b2b9dc35448447e658970beb9edf57c653697a7aa53c4c0369202205aec2b49059c3ea6221ffe38575130c9ce9940ce7fbc34f484fdb787348ac6ea",
-    },
-    "0x00f22a2b5c40ce03fa4c96ba97605e5a40cc97d4": {
-        "ticker": "XCRE8R",
-        "signature": "3045022100c1528bb6b097e406a1620ba69c9d32e0fd949e46d6fde821d53232c29340e59402203dc56845430255790c186b1901c473fd408da3a101116580b3fbe4a0fea2b359",
-    },
-    "0x079202ad852ccc46d8e73815f10ff055049d3916": {
-        "ticker": "CRE8R",
-        "signature": "3045022100d2c3ace9dc7e7469836d04c9861bcaa99781641c8fe53bde9fd0f54a90624823022070f23427fcb6f954879976744b0872e052a40c64daa66be8255ecc360f918c18",
-    },
-    "0xfa3c05c2023918a4324fde7163591fe6bebd1692": {
-        "ticker": "XCRE",
-        "signature": "30450221009d09ae90abde22b61ab29b2e4d2e5942af655b59af035c37b73a60c1e68da28202207b70156fbdc3f85f0d1a87c855cfab5f7e51888b21aeda77b78d68e0c9169869",
-    },
-    "0x202655af326de310491cb54f120e02ee0da92b55": {
-        "ticker": "CRETA",
-        "signature": "3044022010556f0575933e9816364676345f406f40cdc92dddb687e2da12039bf317e05d02202438c7130a1aa4a8a7a4f20853a0190ef5715ca0135f8cc00e140276ef09cf77",
-    },
-    "0x304243a820d4a3718becc89a3f33513586162cf0": {
-        "ticker": "CRI3X",
-        "signature": "3044022070aa6ac11f9390d7ec02bba80e7effd26209d985ccafc78f639ed66ab125109c02201e39338adead409bad66344f086ad63226f452178d5cf88d68f4c6767d5a73b9",
-    },
-    "0x672688c6ee3e750dfaa4874743ef693a6f2538ed": {
-        "ticker": "CRISP-C",
-        "signature": "3044022013f2285db663ab6f368bd72836d6b7fd19604028118e89b63a23769c97de651602206173a37854f76748b1a8124d08b7918be497eb247f605ff8f173be6312d43dc4",
-    },
-    "0xef6ab48ef8dfe984fab0d5c4cd6aff2e54dfda14": {
-        "ticker": "CRISP-M",
-        "signature": "30450221008bbca9e8580023da0b521ffaf493a4f3487cc67784cf6859b4a616011f20d06f022006400dac802bd293cd21014b56a645e5265b2644abbe6f6e2a747b56891bb421",
-    },
-    "0xc3211f7eb806e916d54a2a166fc36188cffde25b": {
-        "ticker": "CROB",
-        "signature": "3045022100996af289d6aa59ed1433c9effb34b1aad8528499e68b30f026ea6476c701fea602203f1367766b1b0234f51d987ad6a28540746c5118140863f196f9bb53ef093465",
-    },
-    "0x0735fa49eb7d9ddf3e4d9a9f01229627f67632a1": {
-        "ticker": "CROC",
-        "signature": "3045022100b26387ee230b22be8456b2ea08043f610b114ffec62d772d9b11e9c34e8b92700220719e71cbe8556edb1c1c3351f50acc92ded57204af1e7d14a9c5e868e05ef392",
-    },
-    "0xa9c992952c2090a51506c4f3636c1320f8fa93fa": {
-        "ticker": "CROF",
-        "signature": "3045022100d3ca1ae349496af11b18a4e2874c80abe710dc2592c6fbe8c748a14c962a93fc02202e41834456f62ef0ed2d3ee05be0fcdc4cd01f3bc38afcdc68008be8b6c4449c",
-    },
-    "0x0da0bd2f57a27a70665d53db4ea71e1f26f77a46": {
-        "ticker": "CROW",
-        "signature": "3045022100912c675de4c85cf5654191d405f1fa5069f40458edbf3eb44bd7001a4ef4c3ff022040f2098da9d6facb8db6adf4b40327d42f5c6739d4b9cbcb06d5b4cfac8d1236",
-    },
-    "0x92868a5255c628da08f550a858a802f5351c5223": {
-        "ticker": "BRIDGE",
-        "signature": "3045022100dd06917b2971b687235122808b46bfafbefceb1d3218dfba1adb85479ee2ddd602201d869f9ed64b935b8fdbfef5e76036bfc63a040a4e72ca6903d3af6c25d4bf8c",
-    },
-    "0x300211def2a644b036a9bdd3e58159bb2074d388": {
-        "ticker": "CIOTX",
-        "signature": "304402207eeb6ac6bbe7a8ca2236a429182be27de80da16152fcfafb1a79891b379886d802200ce59c54bbc8a2adc7fb7b32f350bbdd365d9f168aa5501b10a98c1fce7c7b6d",
-    },
-    "0xbbbbbbbbb7949dcc7d1539c91b81a5bf09e37bdb": {
-        "ticker": "CAW",
-        "signature": "304402206da82b6f892000829a8cf92e6687d1b9c27700d3b5e43eb4b9674e1acfdbee6c0220158675315f50075c94c7f2740dde5be839189e192807c796ce9f19b6c7a8d3a8",
-    },
-    "0x483dd3425278c1f79f377f1034d9d2cae55648b6": {
-        "ticker": "CROWD",
-        "signature": "304402201cbbc0133a3c3dee0a276bec3085df5d755b715f925de43a21b740fcaba72e42022078087ac47fff6ce0e33f677a05c135f59c4ed27954b263b1eb98db5ac91d925b",
-    },
-    "0x172370d5cd63279efa6d502dab29171933a610af": {
-        "ticker": "CRV",
-        "signature": "3045022100f379c74676f646ea2c59b1ad896ebb81ddee85db0f1a7cd9163251a49f31367c0220466c4cbe449cc63e5a94b262aa7bcd6c8f6cfd99ef1fcc356f9f597ee4148b56",
-    },
-    "0xd1e6354fb05bf72a8909266203dab80947dceccf": {
-        "ticker": "CNT",
-        "signature": "304402201e1bf3b5cff585b6d0ac0a92f55ee0c01130a08c5c07caa4969310c1fa300a1a02203347f607a4e38df75289ceffa07470356e079930fa2c54371c31954a8b0d4dd2",
-    },
-    "0xada58df0f643d959c2a47c9d4d4c1a4defe3f11c": {
-        "ticker": "CRO",
-        "signature": "3044022016fb0d88052730549a29a2164ae51a5ae21b750f9906e0a5210510d66f4aba550220700aa5c692177bb2bd88f47c6c392e401edba868cc7d44de9a31c4b1d96fc5f2",
-    },
-    "0x23f07a1c03e7c6d0c88e0e05e79b6e3511073fd5": {
-        "ticker": "CDS",
-        "signature": "304402207418870351d4a4cca44b1441db2b321f034a52b2c2434aa90e3183995daa2489022050747189f082a03629f4e7450a92cdf62ed74f5155356732868d8552dd4303f5",
-    },
-    "0x709d140925272ee606825781b1bef7be6b1412cd": {
-        "ticker": "CGU",
-        "signature": "304402206cfb34e80583245bf3e17eb19c30002359e0fd66124e834f2fd3955e6d7577a302203648d04fa2e3653a54ed0a9885f98244c98ea6343a16e94c48733be677ceb200",
-    },
-    "0x2627c26b33f5193da4adfb26df60202479ccd2d3": {
-        "ticker": "CGL",
-        "signature": "3045022100e868130fff493f43a70686bb856b8946f1849b61da58de01342682a02402723202200584329acbeabefb6332c6cd9a020b43420823a2b29fa2e3a2556537e86d7b84",
-    },
-    "0x70048335a8bcd746a2f45bd4bb15f99da5e0eb05": {
-        "ticker": "PUFFS",
-        "signature": "304402206d7a1d71aef1034c395f8372454ec001b87435d182a45beb64638c871ec0f33102203d518420be7c2e76e3596bac6c197f8b0269fb88a8997070b3f0009bbf51a348",
-    },
-    "0x9a0b381394fbe689b344d1ebd2d4dccff31adf87": {
-        "ticker": "CSPN",
-        "signature": "304402204801371b4098de65cffd268e7c860125b53a70b87cc67e3824774cacd2a32dad022000c29871f244fdfd5574d756e3c02015114213b46c98e355e95a3ae78a5d091d",
-    },
-    "0x7b3bd12675c6b9d6993eb81283cb68e6eb9260b5": {
-        "ticker": "CTF",
-        "signature": "304402200abb9bf9b97fe763a19b707d64f7370ed3286823ba8077dd050435f6cd3bc2e9022049bdf5c887514338c0958e48a96f9ad9aa19ac653f69a5052af5c8b87f54f68b",
-    },
-    "0x9cd552551ec130b50c1421649c8d11e76ac821e1": {
-        "ticker": "CVOL",
-        "signature": "30440220273d029a49144109f249938871f6d956e5c66c81a41b1839bfb1e35f201faa3e02200ea68e1634683a1e65c8ce34869e39eb7c2996f5f566503ff0fb124b395f0b5c",
-    },
-    "0x6286a9e6f7e745a6d884561d88f94542d6715698": {
-        "ticker": "TECH",
-        "signature": "3044022067e0f6b9734978252cf66bd3e972d6012a4eb946db0ccfa4754798fe9942901102207fcb6b5d507b489cf777e40bff7144f72df06a0ded109634a0b04b60f2a3aab7",
-    },
-    "0x4ee438be38f8682abb089f2bfea48851c5e71eaf": {
-        "ticker": "YAE",
-        "signature": "304502210082daa864282eab8ca30aaaa312896370db98034173a12b1cc4fadce05dd9b98b02203497286f902338b785a490e6d235ec6caf5d58469595dc7c2db6bcbb07a0ca7b",
-    },
-    "0x7348565f0a5077252d310392c3cecd8db87a7704": {
-        "ticker": "CRT",
-        "signature": "304402205a2d1e8768e8045fd53c739dc040f2156cb278917feb5dc0c683c1c73cdb883602205e09dcf6d0fab9ee94494c0da4b2e943665e6809207482ee88ecf27b7913dff9",
-    },
-    "0x76bf0c28e604cc3fe9967c83b3c3f31c213cfe64": {
-        "ticker": "CRYSTL",
-        "signature": "3045022100d831aa2f8ef1b5a339f406aaa94bd751398d8a93f869de0d212671e91c958e5c0220058bc61978815c14d2c2abd16fd94aa33da39a726e219c7e546d2f44688a7a14",
-    },
-    "0x74dd45dd579cad749f9381d6227e7e02277c944b": {
-        "ticker": "$CULO",
-        "signature": "304402204e846a842f7d695d8d04c71147b834477f547dbf1e168d350c2cd184fa2e00e502206ee014396639ef03196f6b1d468f04242fdf2f9d2978cad6d7a11035b5dee108",
-    },
-    "0xa73edcf18421b56d9af1ce08a34e102e23b2c4b6": {
-        "ticker": "CRVTRI_F",
-        "signature": "3045022100dc67475e94e77e0b5ca0a16f31d158fe5c2726f2d2591906a93b5bc8197576da022022d8a06eec9537c7b9ae6f65485eacafcece97d637cf9b4ed73bd071e3e4194c",
-    },
-    "0xb0658482b405496c4ee9453cd0a463b134aef9d0": {
-        "ticker": "WMATICTRI_F",
-        "signature": "3045022100ac4979875723eeea17343ff96bed12b9464e2dabc1878a25adb46d48a4223120022057515cf754cd56f03b92669965e9ac64ac8a77eab337726b897cdf3e9ac4aa75",
-    },
-    "0xa69b0d5c0c401bba2d5162138613b5e38584f63f": {
-        "ticker": "JCAD_CADC_F",
-        "signature": "304402205b207c9956a0d53e2ccac9d115f0c95e8b610e4b33e4c6a5ffff5c3c5580ba9d022073a62ef405c169b267fd07fcf4c2a1057bb835fbf08b138a8e00ea1fbdcd61d5",
-    },
-    "0x2f3e9ca3bff85b91d9fe6a9f3e8f9b1a6a4c3cf4": {
-        "ticker": "2EUR_EURE_F",
-        "signature": "304402207a8a7ce6532fe0816fdcb2921d08fc30ea3eb3e8cce5432d2461f764bff1b6b60220610a4f3d73aef90663afe6c37fc738dc649ae90ef48d204493e3b11365b700b9",
-    },
-    "0x2c3cc8e698890271c8141be9f6fd6243d56b39f1": {
-        "ticker": "2EUR_EURT_F",
-        "signature": "3044022007f3a620bb96b3637bfb3563d3f72c660a0391537fc62d530614be7ca3a5e313022009edcd07f9b44ed570e4c16b2f545cd81f82f0a1b5f68bb3a7870489e34614d6",
-    },
-    "0xaa91cdd7abb47f821cf07a2d38cc8668deaf1bdc": {
-        "ticker": "2JPY_2_F",
-        "signature": "3045022100ff5d67ecc0887407b98e833005f126870810fe05f39ca9e2b7167cef8ce1395d02201ea6d4ed7ab164b1ce7bdcaabc48f9e15fea66ea89359422754d60343d2fa483",
-    },
-    "0x976a750168801f58e8aedbcff9328138d544cc09": {
-        "ticker": "2NZD_F",
-        "signature": "3045022100880078328ddd0bb592d7683cb73e2033df12c221d75e550ee14d630b295bb2cf022047d05f79e2a568e92e12f47af71b3b7d2d506c5bfa4115644044846621ce21c2",
-    },
-    "0xef75e9c7097842acc5d0869e1db4e5fddf4bfdda": {
-        "ticker": "JSGD_XSGD_F",
-        "signature": "3045022100e96ea4da59ff2ef3d18bb3b2378d8303d0a2e723f256f03801482b63e06c4ebe0220704acd4f5109f43af2e06d0c43cd8cdc829d79821f42493158b934b38260b0f5",
-    },
-    "0xe7a24ef0c5e95ffb0f6684b813a78f2a3ad7d171": {
-        "ticker": "AM3CRV",
-        "signature": "3045022100f0e787415ba714c3516296cbf16f264e012d21bc042c3f6db2f07052ddf8921e0220730df4ec413e195cd70954c4de752818c66255eb9084a8eecd74327bf2c6062b",
-    },
-    "0x600743b1d8a96438bd46836fd34977a00293f6aa": {
-        "ticker": "CRVEURTUSD",
-        "signature": "304402206ccb02ba950e09f955ba8b6105bd35f0df468a626a118aa947461535ecb1d04102206b6e5cf8d9aa2a85d2b63479d3f23ab3f0c830e96f1f5430ee6d4a9f60b69a3e",
-    },
-    "0xe8dcea7fb2baf7a9f4d9af608f06d78a687f8d9a": {
-        "ticker": "2JPYF",
-        "signature": "3045022100989aaaeccab1380f8a4ff008402c21f1a06158256082f8a691067adfcdce304502205f1d273d4a0b05cf853a2004c2da7799818a1e4d4007b2d5b937dfd74b034c0b",
-    },
-    "0xad326c253a84e9805559b73a08724e11e49ca651": {
-        "ticker": "4EURF",
-        "signature": "304402206d6641aa15d5fb52a1d4fa1767404de226883ba50e09a86b23efec3d62b40e5e022019f693874859fb49dfaeae7a9a83ea58e979639653e45e9d056a1cbda7674ee4",
-    },
-    "0xc4ce1d6f5d98d65ee25cf85e9f2e9dcfee6cb5d6": {
-        "ticker": "CRVUSD",
-        "signature": "30450221009bb614d3c4b993db8991df803d4921936ee235d01759a1bd9346d780350d63cc02205e9fb20baf45879e3b09c6437fd895f7626a18342d69175b76fd73543b48a424",
-    },
-    "0xdad97f7713ae9437fa9249920ec8507e5fbb23d3": {
-        "ticker": "CRVUSDBTCETH",
-        "signature": "3045022100e410426a2dfd13033cc22bd2de69248db94262fd38d3860f67636da13c279cf70220282f1674d5822ad15ff389b08f4072f014f9c6fa9407d815eb094a487ed27473",
-    },
-    "0xda5949544aaf6124d06f398bfde4c86cc33b0ee7": {
-        "ticker": "CYFM",
-        "signature": "3044022001902acc9de35af73007e345a81940d9ca95ad41499a47658f6b6acf9a571dd502201e100d1cda44663100a542ae2fe521bac30488d9852753cd1395dd3de0647be8",
-    },
-    "0xcfb54a6d2da14abecd231174fc5735b4436965d8": {
-        "ticker": "CYC",
-        "signature": "304402204a1ee9b3acefd1c46d5b55b2aa855b353dd1318e75824f487ffa02f489d4fa4c02206b71932626244377fab0dc2ff08ff03e2592ff7729d313a7c2dc9f7526141ef0",
-    },
-    "0xc553a5a789f1bb56a72847b3fda1de3e16e6763f": {
-        "ticker": "CYG",
-        "signature": "304402202487734447754a269b7a458a3bd07b5def17f9784f8080c3ccdf239a4c493d7602202c2f0cb13d23564a334d0b96718bafad41cf53b992bfb1416e71c20425fac9df",
-    },
-    "0x638df98ad8069a15569da5a6b01181804c47e34c": {
-        "ticker": "DAFI",
-        "signature": "304402201d828a4263dbf6a5a84cc5f0b0399f8fb48d66497048d7734289e266507ab97202205c9f577a6cf0697e2ccf3148befad13c08be2e2c9643fe43603567cbffae29fd",
-    },
-    "0x867d46fd484358a6f25655a705aa6ad804e6c6eb": {
-        "ticker": "DUS",
-        "signature": "30440220703a20267ca961d36ecc4e5f2b2f3cc434b2c4a386c8d7ae5d82102ed1abd0090220240efc097810ebc98d41a199da705c2c27842c7383bbb2fa9561249058f5a9bb",
-    },
-    "0x1963e341ff5a75c41ca5ac400c828e636b70546e": {
-        "ticker": "DUSX",
-        "signature": "304402201bbb431df2dc40b2655b5be0b75fd88230c99771b89de78adba76aa3e67014c30220219764a6ed63eb79511fe145275c5d2d59f9a22f53772d000c441ddd1a22d71b",
-    },
-    "0x381caf412b45dac0f62fbeec89de306d3eabe384": {
-        "ticker": "VEST",
-        "signature": "3045022100f7bceb185e7a21144198da2f4e4a0071c039e444b051e8421431e4c30277614602203ebc30d01d311270151d0c1d229f58fcf50eddb42452a46eae3807a5676e5b82",
-    },
-    "0x5e30d25675b6541950b967eb216cefda92c408be": {
-        "ticker": "RADAR",
-        "signature": "30440220278f2aafd7cd6563318a7cf249703a92d765d7243753364307c9cec6beea411b02201ed05f0d6270a2eb4f6e3aad3f37d07ce6d0e1ebf14b2ff6f5fd92ea52a47450",
-    },
-    "0x61daecab65ee2a1d5b6032df030f3faa3d116aa7": {
-        "ticker": "DMAGIC",
-        "signature": "3045022100d520ccd5e9c4ddbd3e9ec1e1b61581c50890b4452135160d7406c1b07a3b4866022028f69962e73645e66b4d646df0fedfcb9bd7dd05987d15b7cf5a8667f1f4b8c7",
-    },
-    "0xd28449bb9bb659725accad52947677cce3719fd7": {
-        "ticker": "DMT",
-        "signature": "3045022100814a1647e5ef33619ef5d3408a9b5e853dd515ea574b3a5eeeab1120f8e23f7e0220095a10ff20c65a612dc773428379f9b9081fea0be26c07ed16e728fc78bd4590",
-    },
-    "0x9c1c23e60b72bc88a043bf64afdb16a02540ae8f": {
-        "ticker": "RING",
-        "signature": "3045022100cf166cfb30a3b7b5bba141685eaad218f586a51a154fa99b82d6f237f70dbdba02203f60ecaf1625bdca88d8113ebc6a1b06a7187ee86d53713387bd43d3d1b9879d",
-    },
-    "0x1d607faa0a51518a7728580c238d912747e71f7a": {
-        "ticker": "DATA",
-        "signature": "3045022100b9fd462a812a5686883f307b95982d7fb077456e989f4c813a6ac6cf959d6318022070b8112e42177dc22a54131691ac6b24a83909ba0c27b80c21714cf07b0a2a94",
-    },
-    "0xb75bbd79985a8092b05224f62d7fed25924b075d": {
-        "ticker": "DAM",
-        "signature": "304402204803a82c9a26eb8365f5827e4671ee0d77ade8f6167955443b5cdab3e60e61180220118117eed078fe479f09ecc004dbbc61405a86d4993a2100738842d96d434919",
-    },
-    "0xec38621e72d86775a89c7422746de1f52bba5320": {
-        "ticker": "DUSD",
-        "signature": "304402206a8fe79e6f5e303c39b3d4baf757dd47ce2c81101d191dbd110dad073dcf57e70220034854b2cfd3182532e181e5907bd60b06b8839566e24b311108a70dc56253b9",
-    },
-    "0x72b9f88e822cf08b031c2206612b025a82fb303c": {
-        "ticker": "DBD",
-        "signature": "304402202df56ba1ee43d1b151d7c6decd00b9eeef6b2121585d4e8528be12cee1147b46022066f9d9cccefa2f1af74f79cb7618b65e35fe32cec8e1ec7f0cbb1434bdbee966",
-    },
-    "0x92e918ea7aa872f91bf7ec9bcd248a5920c9f3cb": {
-        "ticker": "DBEAT",
-        "signature": "30440220258e486a0ad382e9834f539db298eda5d9f2f7d0f7f9916c2a98aa6a5a35c2ac02201de15e1d7275c97238dd464cc38adf89603f6c6da97d56bd968e2397d236da84",
-    },
-    "0x103965213122805c9aa63d8036ed0ef692c19650": {
-        "ticker": "DOP",
-        "signature": "30440220409ff316b45cf53692e0c46e1454ae5b30d5f7c1783e1bb5ec850b8bb9e9277202201279fee0f088ffcb808f9a7cdea444650a9e6951ced24aab76625713a5377c79",
-    },
-    "0x198f1d316aad1c0bfd36a79bd1a8e9dba92daa18": {
-        "ticker": "DECATS",
-        "signature": "3045022100e2dac2ccd735d7c1e2396984528db03d84f2b8a6a29201d95ac574c430d4e7fc0220766ae50d9bbc2873185380d9bc2c88e589c1463ac8b375b8353f901407443bff",
-    },
-    "0x314338767151e6ed23db8a41c6f6943c1958ee56": {
-        "ticker": "DEC",
-        "signature": "3043022011d7b66a4a5ff05f0fb26a4757a203386d4391989b394635c6e9555d60050434021f09cf35aa21e77fd650c78054ca528f663804b005b8cec5806f72c5f92b1a2a",
-    },
-    "0x2a93172c8dccbfbc60a39d56183b7279a2f647b4": {
-        "ticker": "$DG",
-        "signature": "3044022055528abd7fd74f4689271456bfdeed4fdbddf93c40b726d95fbcb3952173e8a9022007a30afdaeabb781232958bb8846000703b6f470c907366a8cea510796225c67",
-    },
-    "0xc3f6434df5ef44798610c921942e49822c6f5108": {
-        "ticker": "ART",
-        "signature": "3045022100e31c325ca69961a9d2f592323dd8db3f1ff600bba83d48e0e809e7cffd68682402205fac15401a7b5c9188a44223c3e375faef51df06ef32b093b3c7b0b009e31afc",
-    },
-    "0xef938b6da8576a896f6e0321ef80996f4890f9c4": {
-        "ticker": "DG",
-        "signature": "30440220668297dd6eebca1f1e0ca2b606991c41c144cf5dd34ba7cb27cbe2321b51993d022014c0bd1b3c70d5d7683ebce108c01626d755350a92c97bae86bc01f6cb05f4d3",
-    },
-    "0xc6480da81151b2277761024599e8db2ad4c388c8": {
-        "ticker": "XDG",
-        "signature": "3045022100a727a73ef994ab66871157580b79a2d7e3ca060246ce732c33bd8b8ff53271e80220476dba9038f225520b9e9257ff73159b28ace0d39593a13e797b171695cdba3e",
-    },
-    "0xa1c57f48f0deb89f569dfbe6e2b7f46d33606fd4": {
-        "ticker": "MANA",
-        "signature": "30440220436699eef62d0e27cde881617e2bcc77e99fee8ddf20f7fd716bdfb49a2d5699022073b43e4d889526c69e07a87d377fc401986c2f620287c98396ee7e449e82062d",
-    },
-    "0x950e1561b7a7deb1a32a6419fd435410daf851b0": {
-        "ticker": "DUBI",
-        "signature": "3044022042350c3b00fb3158ad2670d4a7819f7183ea4bbf4acfcce3a3be196b4c67d94d022042eea42c766c53322ef10267a73df74bacd002c3689be8508537aa402395ad3a",
-    },
-    "0x8839e639f210b80ffea73aedf51baed8dac04499": {
-        "ticker": "DWEB",
-        "signature": "3045022100aa78ae8f90062c29c50ddac7034a63a1e2f25b56e5a9426231c5e3346a888851022048e8a40469e29a9ef30f7e49c79d4300bd4749d8ba75a6412a56e6cef6625394",
-    },
-    "0xe77abb1e75d2913b2076dd16049992ffeaca5235": {
-        "ticker": "DEOD",
-        "signature": "30440220634b70f5585ddbd0d7ea1471a463b9dcef2edf57fade97a76e51645f6c950a8402202813dd2e9a99fcc67d3443e53eff6e037591e2a9b2e3e9abfbd6c6c76d0f799f",
-    },
-    "0xe0bceef36f3a6efdd5eebfacd591423f8549b9d5": {
-        "ticker": "FACTR",
-        "signature": "30440220382a19840ba39eb6d08d430d7761d88c996d30aeb067079520f328571649dab102207a50b5b442407f449a3bcdee41d62f68b6d5830cf630a328a4597616495dbd80",
-    },
-    "0x90f3edc7d5298918f7bb51694134b07356f7d0c7": {
-        "ticker": "DDAO",
-        "signature": "30450221009da334fa827f089028604c3767385f336e62513cdf92a211ca3b67cdd95de571022060c0ae4e3b878fab3d6915172e50b6730b5c1bb61d35a130617820bfe141b79f",
-    },
-    "0x96f0a7167ab7ba6e59ffb68707c9d1b049524b0f": {
-        "ticker": "DWC",
-        "signature": "304402204c84cdf71ae2ebc6b1e7a34129807182e69bfb43c03f83cd15d04df5ab5e8474022032bf2ace609140670ea34522bd3027fce5e1e7ada9f2d2926890135814c6377c",
-    },
-    "0x85955046df4668e1dd369d2de9f3aeb98dd2a369": {
-        "ticker": "DPI",
-        "signature": "3045022100c3404c5ddbb4da1fcecb7820eda85ae85c8d980b54876597ad8f93c190f071080220622e8d816ff2d053cfc8bc59a329858d19b3b4290706dde80602fcea7f2d744f",
-    },
-    "0xbf9f916bbda29a7f990f5f55c7607d94d7c3a60b": {
-        "ticker": "DEFY",
-        "signature": "304402203eb877a41c457ac30f4d675b28189f73aae55b8e63fa649482931461360b4ead022069aba08c9f81048afc4b6910ef29a474f13b657e4e9cf76a20a30f23523573db",
-    },
-    "0xdbb5da27ffcfebea8799a5832d4607714fc6aba8": {
-        "ticker": "DGEN",
-        "signature": "3044022044416e4b3f9b0176dc23b81a58e31af529b08d1d2efbedef9a44daef17273efd02201d9aa2587e9aadd74d7af75421bbdd91e8f97710333f5a47c5928d46f1104912",
-    },
-    "0x5fcb9de282af6122ce3518cde28b7089c9f97b26": {
-        "ticker": "DHV",
-        "signature": "30450221009ae73cf696696753b74fbb7edcc6ce887cf808ecef0afa7c529397c90e799ea102201624295232d9b38fe52af32b39e1d287f522a6586a3574cbec2646c8bec522bb",
-    },
-    "0x86a298581388bc199e61bfecdca8ea22cf6c0da3": {
-        "ticker": "DELOT",
-        "signature": "3044022032a763d6c9663454d352b444e74177b3389f776ee8f19d6fed08bce670b4f7a3022022e38480777d6239c46baced6d0a172c49dd8c29027f031740949152d7a7f7b0",
-    },
-    "0xf9c1f70f9bf57fad5f63c6e1e25c2e895f04c0a6": {
-        "ticker": "DHC",
-        "signature": "3044022064704b2ab1c6fd88c4227d73b9ad72486f749438f6df29bfe822cc0a1bb1c56602205cc44102798ef445172d5cd7d4082a7d44ff793b0a86e88ebe565a0ff653d42d",
-    },
-    "0x081ec4c0e30159c8259bad8f4887f83010a681dc": {
-        "ticker": "DE",
-        "signature": "3045022100a46669192fb2cb3649f4b99ef1078eb2228bc0e126ba83bb7fff3013040c4c1802203ca39224b1d61c6d81b9c96851e42540202e1f97e2058ed308a3504dad92d8f6",
-    },
-    "0xb35fcbcf1fd489fce02ee146599e893fdcdc60e6": {
-        "ticker": "DERC",
-        "signature": "3045022100f7b8da95f5ef57071eaebe38cca8dec6e843547de0c595f80235b6c28b681a2d0220088b5f2ca301ef392049d312723dad859abbbfaf783a8dcf71372674642f479e",
-    },
-    "0xff76c0b48363a7c7307868a81548d340049b0023": {
-        "ticker": "DSRUN",
-        "signature": "3044022050676fa690ac67c5dbfa81e5426ec2460c0cb794d821e1b74071c2bb88a3446302207f00a1685bb6cef2c05d5c5508573c0bcdb45327d5e86ba5f4947c57aaa6d89d",
-    },
-    "0x3d1d2afd191b165d140e3e8329e634665ffb0e5e": {
-        "ticker": "DERI",
-        "signature": "3044022051e056f54d588094f90a33f8407931b7a93c6c2f36edd9ae1bfe8995339fe69f022061993acf220da2c692f13eaa075e8e77e6195d495704c45df7c0c075571f3cdb",
-    },
-    "0xde5ed76e7c05ec5e4572cfc88d1acea165109e44": {
-        "ticker": "DEUS",
-        "signature": "3045022100d7908e152e7416bf5e31981e15bd108c77387bf592f2f8c56be4b681798a99bc022067729913b3d6e419519faa9a95f6e6ddc79969e8d44da712b30ef2867a1a3b8d",
-    },
-    "0x4d0def42cf57d6f27cd4983042a55dce1c9f853c": {
-        "ticker": "KIT",
-        "signature": "304402202a8ada1720ecbd34cfd522befdc4d1bcf4d960b47de4518cca2250ffd8cd4c8702205fd41a1290b6b8deb0415e8efe25c4ca6a65c6c5d428292f996fcb431d05c72e",
-    },
-    "0xcf66eb3d546f0415b368d98a95eaf56ded7aa752": {
-        "ticker": "USX",
-        "signature": "3045022100c9650e063ce0f73e0fafe06e678f0b22a260c52d10e496e095249239fdc186ac02203352c4e6ef3a6e9184d4a1fa1edb1dd3797580e586e5834b012bbb5fa62d026d",
-    },
-    "0xe7804d91dfcde7f776c90043e03eaa6df87e6395": {
-        "ticker": "DFX",
-        "signature": "3045022100f4a521690a92991e537c140c01e8e55a975b4e2ef6e66b4c31b4ba7897874df7022030dec285f9009065db7f294953aa1f4ae615331387024f2fc2092162e669f04f",
-    },
-    "0x27f485b62c4a7e635f561a87560adf5090239e93": {
-        "ticker": "DFX",
-        "signature": "304402201b66d60768e037004fbd6515cf882ae064563e292f39b3fb3c90d74cf429e1e0022069ceaa28712868aa7b4a938a659483ff60781e4b613d777a14e9781202b465bf",
-    },
-    "0xc168e40227e4ebd8c1cae80f7a55a4f0e6d66c97": {
-        "ticker": "DFYN",
-        "signature": "304402204903b3c6afa507aef4cd88fb080d92a0b55a5b230c987b1add3493736db56e2302202e4b03fc70c0c026096556ef44fdfcbb48a43b9bc6ceef324dfe1122e868db57",
-    },
-    "0x8c92e38eca8210f4fcbf17f0951b198dd7668292": {
-        "ticker": "DHT",
-        "signature": "304402206da3cefa573162edfe52a66dd7418c6f5014647cc970879a94ff83200def0bbf022043a610d9a386092babadd87b3aafb82c919d3631c19a89310cc10d16c3e11051",
-    },
-    "0x9b79fe702e2508dc61d6db44574462128e626222": {
-        "ticker": "DGBN",
-        "signature": "3044022019dabcc41f5ca75ec21b8885a1f0212a5d8c355b08a233fa9324fee9560b39a50220554e417fea021f695839b804b0c8b2fbecebeed1c25f2e44edd1a37d5d9d2d9a",
-    },
-    "0x428360b02c1269bc1c79fbc399ad31d58c1e8fda": {
-        "ticker": "DEFIT",
-        "signature": "3044022058fa3c0ee25c79c3ff5b045848b711d33aff09fa8d50592e1c138ad745d737e602202b7445d82189a3a8adc829a121ed04f3e190027488f24c1695320efab386d44d",
-    },
-    "0xfed16c746cb5bfed009730f9e3e6a673006105c7": {
-        "ticker": "DRC",
-        "signature": "3044022003d5a4e0e27cdc2d575d1c13d5f9450d3694880b51cb62ad38694c13995aae3c0220759eb7da4748ef4aa5306eb29f41d8cfddeb0fbc2133d050132849c117ae6133",
-    },
-    "0xe749ea14a2d18e361ed092ebefba64d77a8b4eac": {
-        "ticker": "DGTX",
-        "signature": "304402205f7c38ab564177771d098a47890ddbe309c2456edb630a2c2e6720b08124d79f022009a0d111b944f39eb6bf2ce618ba1db718eda24bcbb0b81ecf196c1eb45dbd29",
-    },
-    "0xe261d618a959afffd53168cd07d12e37b26761db": {
-        "ticker": "DIMO",
-        "signature": "30440220353b64b354ca78d30e7c4a334f63cc367c0e5438cee101fd3adf595e17817e89022020d85b97488d8dd1bcb77dc200bd58cb9adf4c1bb2cc30447774cfe77f58fa33",
-    },
-    "0xaa9654becca45b5bdfa5ac646c939c62b527d394": {
-        "ticker": "DINO",
-        "signature": "3045022100c56b0c3aed81606be753f692227f3a9e27722cde388c8f1cbfb3b3f1780cf81802202b2c842e066ecd7f366bcea0b22272ed3f48eaed55dd4dbd83ec39e98ee147ca",
-    },
-    "0xcaf5191fc480f43e4df80106c7695eca56e48b18": {
-        "ticker": "DNXC",
-        "signature": "304402203523416881d07a1dfad60d69354be4d803b14774813bc1cabc23af5abc2c333002205a21f1a6672b55d4a4b460392f047df8cbeff386c3e349fef5216433bb8ea810",
-    },
-    "0xe4bf2864ebec7b7fdf6eeca9bacae7cdfdaffe78": {
-        "ticker": "DODO",
-        "signature": "304402202a0ed61c90c54e5779891c6d4e890d1e1e045da42223788fef9da9308190ff8d022048ead3c7af67d77c6ee8fe319799d58bc50117e4677166926d6015218acdeba9",
-    },
-    "0xd5fa77a860fea9cff31da91bbf9e0faea9538290": {
-        "ticker": "COLLAR",
-        "signature": "304402204c773ed58460d353afd1ad622667b9b6e5347eb27aef5961c64ce89838b3b02b02202315510b9552131d072b889614a447ca9774c73371e7961928aeb9a59abcaa88",
-    },
-    "0x8a6f1738b2ff63c7c29f7e2b0073d96c839b0b23": {
-        "ticker": "TAG",
-        "signature": "3044022008512879cf81bcd50d637b142eadcba331ad5349af406eeff5b8b2f4a54ddb3b022057a428c6e58ff3113c6e3e0071cdc2ba2cee41b77f7882d61ed96c37c01d52c2",
-    },
-    "0x2f3e306d9f02ee8e8850f9040404918d0b345207": {
-        "ticker": "DOGA",
-        "signature": "3045022100e5b64901b9ba199296eaaa9632fe71656f7fc87758768afe5b91c7d9d1787de7022063d5dbc3010c01a6f70612835c0f7136134603f5d2e8e0faf408a2425749e5dd",
-    },
-    "0x0e7252706393470ffb0629da2caa39fc9340f2d4": {
-        "ticker": "DOGEGF",
-        "signature": "3045022100a6a0996254e02d0a9eef7acccb17a634e284b5766db54f47dec65b29586cb34702204b13ecc2ac39c739547c5c9f804f824412d31fe066067bba2fbf4e5506caeddf",
-    },
-    "0xe0339c80ffde91f3e20494df88d4206d86024cdf": {
-        "ticker": "ELON",
-        "signature": "304402204b0eb245902417b53d92071ea313cf7fbf4423bcc554c8a317676e35c12b964b0220078a990d4cbf28bd53a0a7a64252f8f074f678e6d6af10e8740faa577ebeeac7",
-    },
-    "0xdda40cdfe4a0090f42ff49f264a831402adb801a": {
-        "ticker": "DOGIRA",
-        "signature": "3044022014c66a31fddd47b7968a87df6ba2eb08f6d3cef966c5011394504105883d51d3022047a02b8979057e1826d8965a791c9d5d9dfce87a4a2d5f250be23bf124a7cf15",
-    },
-    "0x7cdc0421469398e0f3aa8890693d86c840ac8931": {
-        "ticker": "AZUKI",
-        "signature": "3045022100a651b28f09e502ff1c964e105ecf8f419817a0b7e43a777837f7d76fc3bb07f302203fdf6ae7b15f3a09bda7631e263db737a6a87f20d7de0d4bc4a73fd191036cbe",
-    },
-    "0x5c7f7fe4766fe8f0fa9b41e2e4194d939488ff1c": {
-        "ticker": "DOKI",
-        "signature": "3045022100eac09b13c90339970235a4fc154c0871bc17a60f66f058688a055a8c47ca32e702207a0ed5147397ebe8493f726f2c00cdc3b77b410887695ca4a5fbc093ef6b9961",
-    },
-    "0x6ab4e20f36ca48b61ecd66c0450fdf665fa130be": {
-        "ticker": "DOLZ",
-        "signature": "304402201815da572278f458f1b2455fb56ab4bfa80d4c0fbd5ba6b55e6584a7d176b4290220471822184bec17e3d2c9c945bed4f9b0ee90daf77cfc3eb53dc8fda3d53afba7",
-    },
-    "0x0e2c818fea38e7df50410f772b7d59af20589a62": {
-        "ticker": "DOM",
-        "signature": "3045022100a135bd39775baeeb83f0a4b214110e15c32f9104c482a696b05a57b89b73740202202a7bd659de0db54d72053534fd167bd047bf21fbb6a31606c89d3c6845f25571",
-    },
-    "0x81382e9693de2afc33f69b70a6c12ca9b3a73f47": {
-        "ticker": "DOSE",
-        "signature": "3045022100cdab744bc0212b762d530507ee7e52b2b443c8856651f1fe61e32e960d34906502207694884b4dd66136c84ea699912efbf6a4df45da2ae7e3b4c6364a58eba71873",
-    },
-    "0xe46f5128b933e5a6f907fe73ece80059c222db0a": {
-        "ticker": "MOOV",
-        "signature": "3045022100eec9d607e3c619c419e60366910e265c1f12c98b5a741f4ccfdec88f69bf097e02200c892c9277be50675a1129117dfaf1554320b602421a18cb5644063dc2188236",
-    },
-    "0x0e0ffc562d72316b783e887bbaae1fd794adb530": {
-        "ticker": "DOV",
-        "signature": "3045022100f367c43817b181ca597d3eb32297cab50f90973ce3dda7857d6f663a74a514f40220055e8d0606c5d36b5c25c62c7d70cf8bb009bf8a8ab101612424d0ca3859574d",
-    },
-    "0x3ed4c2d63def617f436eb031bacae16f478f3b00": {
-        "ticker": "DPEX",
-        "signature": "3045022100e32efd6191446fe10a1dfa949bf09624c304ea3a94104ad4a0836602bb45f567022045baf26eb6e479b4f7edd8743d34d19035429bb268835d2428a57684bee038b5",
-    },
-    "0xbe7702dc9c3fb80b96b7ad894cc012f6405e54ce": {
-        "ticker": "DPLAT",
-        "signature": "30440220740d6eccd6eee4281a716bac5d9cbc55583928cf124d595a299e24e58b0156a40220566e58fed8c0bd8c70f33953700c339bc9454d4528a2b1c5c2eca81d36b4d8c7",
-    },
-    "0x16dfb898cf7029303c2376031392cb9bac450f94": {
-        "ticker": "DMA",
-        "signature": "304402202ce978bdfce5faa95e76f347732673b3faba36784cce5e12a36e44c1cef5de0802203244765dbff1c3aa38a181667e5939749942fd7a1ecb2897e851684bd46a1125",
-    },
-    "0x958d208cdf087843e9ad98d23823d32e17d723a1": {
-        "ticker": "DQUICK",
-        "signature": "3045022100c1a50668fd80f74c27925cfcd7be128266cd39e6884a06e0961be3f15a7c4cc402202353c83d25005b6dbfb594b21d8113ad7642484f680f2e7088db631a313ad1a8",
-    },
-    "0xf28164a485b0b2c90639e47b0f377b4a438a16b1": {
-        "ticker": "DQUICK_",
-        "signature": "304402205937589d9160d086e0db32bf9542bacef83961c01d12973ea881d7a10f564ef8022005b2514ceea742a6b07d52a695e9bf783e457fa01f1cf14b0406218ff3090532",
-    },
-    "0x3b7e1ce09afe2bb3a23919afb65a38e627cfbe97": {
-        "ticker": "DST",
-        "signature": "3045022100b09408ef5a33b48a0dc943e8eab57d9f9457a5da180a6ed0680546d3a34867260220701c1646bfd11661476f98cbb89fdfcb6047a3fa5838515a1510d45d030e53c5",
-    },
-    "0xa9806851eb87ad27e8d75660cec2fe6297f92a59": {
-        "ticker": "DTE",
-        "signature": "3045022100e36361477f01c77257abdc5aada6216c510f246cc7502a621f2cd2b8e3ceacd3022000ce441c5e62aaf0d5e1a71a3ac29041fb14bd182127ab4bbcfbad5855335fd2",
-    },
-    "0xa0e390e9cea0d0e8cd40048ced9fa9ea10d71639": {
-        "ticker": "DSLA",
-        "signature": "3044022029ae2e5d5f851834c388141564c60a9d26c53bc81e9c6bf887f1206a86371b8f022075b60ffdf098243d8feab6ec0f55eca8c1722c1d7bf9a4c27cfcd44c439b557a",
-    },
-    "0xd87af7b418d64ff2cde48d890285ba64fc6e115f": {
-        "ticker": "DTEC",
-        "signature": "30440220550ac85d74f8307fe65dc162242f1203e1a724631f23393d29218eb7ccc9a5b40220376474b4297f5ac0d43ff9dba58732ad4c7cfe04d96b4e5b5cce9e2defcaa134",
-    },
-    "0x38029c62dfa30d9fd3cadf4c64e9b2ab21dbda17": {
-        "ticker": "DUBBZ",
-        "signature": "3045022100f469e0eb20307f2b03f14728e3506a6e149ca8ac1e18aac191f15a40feecfd6c022052e17ca4a32df2d276c747506974fe96dd71e433cc6754a1e8a73c5b4bceaad9",
-    },
-    "0xb6169e71144b4debd9caa2dbb851fc8ffde6119f": {
-        "ticker": "DUDE",
-        "signature": "304402204c3ea55ee47dc9b5e0504fe80f423c5f4f2a4e1c4a211de893bc5381b8062aec022048b7f022acfe48730e126ab97d95c7fb631896f30d470bfcd2091ff3189730a8",
-    },
-    "0xffc4b25557bb4327d437c3b3ead6b2b15fab391a": {
-        "ticker": "DUEL",
-        "signature": "3045022100ead8594fbce43f2d879869a9901fbf45e7b2041ffc933ef017133ecb52165b5602205d6f5672abd50911ca33ed2482649085b3015954914486b6a7fcbe90705ca3a4",
-    },
-    "0x4987a49c253c38b3259092e9aac10ec0c7ef7542": {
-        "ticker": "DUST",
-        "signature": "30450221008610ad24934c1dec91ac81a6b98b628632ed863b2c7af39765c7c95f7c00e0b90220336e9cc9e199710e618119065736f7b0ba7e25674da95eea95ac1e52a908ec85",
-    },
-    "0x623ebda5fc6b271dd597e20ae99927ea9ef8515e": {
-        "ticker": "DUX",
-        "signature": "30450221009af44b1ef653d1a20d2b90db5bede0f04f25808af2097c41b7f418c75bc9d132022066ad74f11342442196357f4ece324b02c66616b4274df91b141e088a38770675",
-    },
-    "0x8f6196901a4a153d8ee8f3fa779a042f6092d908": {
-        "ticker": "SALE",
-        "signature": "3045022100a4b63c2cbecc0eac5fa8d3a4a46704f1bee8026ea3dc168abbcf2dfd90e684d502207af1f58ca2e3079a9ee4d93c42e4759e0ce13ce5bf354f0db1faebda9e02751d",
-    },
-    "0x727cd3b1fcaee2ee44218119ef3b1f5fc370e67e": {
-        "ticker": "DKN",
-        "signature": "304402206f27bc7801d4f5944ed52cb0ec382e73a2d11a73181ab1c923e2506098f5f4d302203013c51cd9e88d5bd7c0646277e741e78b05d0bdaa337801e69c8e9de0ebe1c8",
-    },
-    "0x4a506181f07da5ddfda4ca4c2fa4c67001db94b4": {
-        "ticker": "DYL",
-        "signature": "304402203c013a8afbd65b434dcc448c6d4423d2b388732846cf706370711c5b28f7f03902203300fd723f3a8d264ffe4cf78fe7a903a84159c2982c3441f754165a52597ce2",
-    },
-    "0x39ab6574c289c3ae4d88500eec792ab5b947a5eb": {
-        "ticker": "DYST",
-        "signature": "3044022051f27c26d9b62b39a690ec8eb8943464b27fbf6183fe5f724b749816df59c6690220721d745a2147bf92ab82a8c7a60870e929e19fcc5f6b6e7d2e0c156268e8fe34",
-    },
-    "0xc77aea972f862df1f6a520be673df63a01255ff9": {
-        "ticker": "ETV",
-        "signature": "30440220363c203bddf54f71be4599abec0ad02f6dbafb8aedca994102211e02e510573702205ab551f95c22ed610e83c36683511ac200e4de0eb59bc83b2158772dec20d17c",
-    },
-    "0x34c1b299a74588d6abdc1b85a53345a48428a521": {
-        "ticker": "EZ",
-        "signature": "3045022100f61ee255c40c136bc0da45c452eff71466eda92be403ba34234d6c32925dfc14022048a0c3f31d06540d974d35fee8479aa07eee6524175db8a6da2e5fc43a010205",
-    },
-    "0x21fdb8e43d84420afbd6351d645f50c9138daae0": {
-        "ticker": "ECO",
-        "signature": "30450221009eda46451013db5b30df1f945e500a79fe3989fb696aa8aa7723cd56dd00fbda0220760ec7dc703752d9b330804eda3ddcb33e28acc1c33ed5f8f899ffac992fec68",
-    },
-    "0xd9e838dd60c8ea1e7dd4e670913323bb87db112c": {
-        "ticker": "EWT",
-        "signature": "304502210090dd86bd0463a48c3b947b1e3bc08ebf3631202c676a857c5fc10525c8b7a65e02207b80b742250dcab35088fa81fc150ff998e3c070cb0bb455c11425e56ddcca52",
-    },
-    "0x3050731a7ab18d05eaa5e01d66df33e04444e72c": {
-        "ticker": "ECG",
-        "signature": "30440220656afa5f586b6adc0d5b7664877700f0a5b5e89f7504097fe482ebf1c4717102022016635a442f1d5cabb4bde6dcc8c2e32a3fbf904b81e409cec36dba6070d8b6eb",
-    },
-    "0x14ee88cd0e3c1534bff13d6d716b8575532c7138": {
-        "ticker": "EDNS",
-        "signature": "3044022076b739b4441d517e60dbc9259441e1a45cd4ffb358e85c2d996b0ba4f861bf6802201842ad7e4272421f9d1bff70717ca7e1dac4f8e59c8567dc4e046754965f4eed",
-    },
-    "0xb03e3b00baf9954bf1604d09a4dbd5cf88e1f695": {
-        "ticker": "EDU",
-        "signature": "3045022100cf3eac938ce7192ee8ad4843f872a968d02938ddc90f98522ba35233e8b70c1402204523f6ef42a8f4bccf6ef8c74a2cb56110a4194b708820d0d1f6f022ca55cac9",
-    },
-    "0xc4a206a306f0db88f98a3591419bc14832536862": {
-        "ticker": "ELE",
-        "signature": "304502210094fa272c2d5fe5079bb1ef986bf4d8ddec6de0e5f9ecf20bb76c03e8c9903b82022001fb5cf37dd3f49439d02b366358895545474850a5e62d00350d7049c5e19769",
-    },
-    "0xeeeeeb57642040be42185f49c52f7e9b38f8eeee": {
-        "ticker": "ELK",
-        "signature": "3045022100e5ae480e14c0da556cedb4fb0c0aa85f9e8be8520dc0ae02976100e6d3169c1b02205968bdb9f012a5d3c14ffa23b44c4bf2e9217ebc9b6faf1f3502d81da55aff27",
-    },
-    "0xa0af9f13e067562aae8e52a5fb6a74febfcf7d41": {
-        "ticker": "EMGS",
-        "signature": "304402207cfff0d11cea48f0800d546b7a9d28c1b335714cef4ffd46f30432424d4e68d8022025b5fa300382f236a8f163ec775af3a8f5af68f11b4f24bd92a03d6bc34e0903",
-    },
-    "0xf124ed9ec309907808b1fbc6bedb2a76927b3665": {
-        "ticker": "EMPIRE",
-        "signature": "3045022100e03371844de298fa950fd5397718b07c0845d67f7a70f38a2b6b65813256b16102201de199fd66b82c51ee0db1a205f8deb05a7b1572f39a079012654d17c0f71234",
-    },
-    "0x0c087f8d6a1f14f71bb7cc7e1b061ca297af7555": {
-        "ticker": "END",
-        "signature": "3044022017dea5b8d908e0efe7eefcc3fb02f8ac8e1b7014a4a8604cf76cbd128429bd8b02200ccd15156540e14f1c050ba5e66f3c9eca0190629d74f8f243d9a28161d597aa",
-    },
-    "0x1ac417f1dd23504aac2076d854581f03196403fd": {
-        "ticker": "EDR",
-        "signature": "3044022007b3f74047928a24b8bffc08998b542d2631e354788be568e669bbe402eb474902201660b60dedbded95b83607adbad5f20a6e6f83a5c3070ef7c932b8b49b417249",
-    },
-    "0x8db0a6d1b06950b4e81c4f67d1289fc7b9359c7f": {
-        "ticker": "EGX",
-        "signature": "3045022100b73ac11f133509df3949f98c4027f3774392c194d708ec630ab2c5894f76b91a02201bf28e564e5c4962a97b4c9902af5120a4b59aee176f258bc32543f929f5210b",
-    },
-    "0x08e175a1eac9744a0f1ccaeb8f669af6a2bda3ce": {
-        "ticker": "E8",
-        "signature": "3044022078dd8ec4a8389f2f23b315bab2a92dfa6edb1c7d6acd1b92ff122011f842e8e9022046a4ee1c993473464664c4401bfa6bd599cee51b3e59bbcfcc15b550185ffd0b",
-    },
-    "0x43e4b063f96c33f0433863a927f5bad34bb4b03d": {
-        "ticker": "EWTB",
-        "signature": "30440220765fbb44728292f2fbc4c486ad1e12cd657d9772328bda64a1f64d8258a3bea302202042c8bc7cca6c63f55b4e596ccd3ac0279901a0fd8f7a0d0173fea7f2e8d5f3",
-    },
-    "0x7ec26842f195c852fa843bb9f6d8b583a274a157": {
-        "ticker": "ENJ",
-        "signature": "304402205eb28eb20df347c98e9d337feadd95b1cf96a6eeec81d65e607b2edc84e0a96c022011a4215ea48f0675496059434cc2f78bc1cfaf99049476081434a180e05700c6",
-    },
-    "0xdd9ba3b2571bea0854beb0508ce10fed0eca7e3e": {
-        "ticker": "EDAT",
-        "signature": "30440220575e71cb5b34e12e96db496bd40755fafe1831fdd881799b6374ade8640dc87402201641f25092580dcbfd1e39b4cc275b1400767c926924a72e9a35780bbb270c93",
-    },
-    "0x7a6168e5a0ecc9841ad8fad20dcfcc4458fef0fb": {
-        "ticker": "EPILLO",
-        "signature": "3045022100a34497ecb6bfd874c831ca0ef0bc7064b6da2cb081da01ff8e1f5c810e580a8402207a0b365388437715d0b4023c9eec401892ac6207ca1cf08f8bc2dc97ce0e8b00",
-    },
-    "0x3963a400b42377376d6c3d92ddf2d6288d8ee0d6": {
-        "ticker": "EQ9",
-        "signature": "30440220618b23930907259b55f3cdaa895e362e030e49a0e14e752d9ff2238be73599b40220117886eb97e38f7a78af8ead529ccf62b856be4ad31317704256361d0331a7c9",
-    },
-    "0xeaf631ac57f3cdddd261770dd47f85066131a156": {
-        "ticker": "EQZ",
-        "signature": "304402203427f45161bae73a7ca9493a11fb6ec21dcb8bb123b74572c4e4b1decd7f714f0220063cf9c36d11cde3df1c679be2a1814e76919f9c0cd4f39faf66251fce0055db",
-    },
-    "0x2e2992688ee4b2b7229118f2f4cfd9b8ab13c520": {
-        "ticker": "EAPE",
-        "signature": "3045022100953a6423f04305326b2117f11018e3570d2c0174180793e7bb758fbbd59c6774022051f62f90d5f9b521ca74288a6628008bb10cca78bfaf55b7e1c77e4e4c182bb9",
-    },
-    "0x8226ac9edb26ff16da19151042a8ba3bb2cc237f": {
-        "ticker": "ELG",
-        "signature": "3045022100a32894a2b0da6173c483769f87aee7c9efd15904276079c03e44844952b5c742022016de97df60478d5f9f7f599b1dd12f320e4479184bfbe3fa5d15148e839f2c61",
-    },
-    "0x1c2e7118591ec1b6122e4fe3d645706a9747b10e": {
-        "ticker": "ESPRO",
-        "signature": "304402202550e39f296b76350430f11c48efadb27437deb5ee143095d6125c6ed3a27990022006401b0d6aa715fd6572d72b8ffc7d2e41610616555c6498bbf7e07f0a46205e",
-    },
-    "0x66d7fdcc7403f18cae9b0e2e8385649d2acbc12a": {
-        "ticker": "ETH2X-FLI",
-        "signature": "3044022017c1a8e6222874f80536e4ac34a1355de892dd5ce3dae95e7de66e9831fc90d30220323bf6e8165a353c3c2f2e708109c60bfda10b0a79930a219e94982fbdcfdb41",
-    },
-    "0x3ad707da309f3845cd602059901e39c4dcd66473": {
-        "ticker": "ETH2X-FLI-P",
-        "signature": "3045022100f15b2cc143ddb633c64e04058aa660e4becd00e19441ea669f65587b0114b1e70220377d405edfc99c5861e4b10e36d6c5946585ffc8f71aa8b0ec9562cdf306b712",
-    },
-    "0xb41c43fabd22a6c6ea135e975769e9051f9ee8ad": {
-        "ticker": "EBOX",
-        "signature": "3045022100f87709d75b851e0135e655807290fc228e79fe14a29367a7b54fe22517381ea302204e1176b426826741f1ab2855194cd74166221ab99d6b505fbed8661bc957444a",
-    },
-    "0xe7f960685aba7327ada3b161ea252703c87be0bf": {
-        "ticker": "BLUE",
-        "signature": "3045022100ad25b148a6136b4e931687ca0985728c855b59edbbb667856f0fd2a25d8f6047022025783a6bc2c6d17e055788d5a9655edc48bce0013fc9137ac6549ce794452754",
-    },
-    "0x55b1a124c04a54eefdefe5fa2ef5f852fb5f2f26": {
-        "ticker": "ETHM",
-        "signature": "3045022100e7a2f84521faabbbe9eb10563e521e938c74459bd2660fa76441ea85e358fa110220625d3b00bef52531ac4f294651906757d1ac5b30548ae893b768372c3ecf109f",
-    },
-    "0x58001cc1a9e17a20935079ab40b1b8f4fc19efd1": {
-        "ticker": "PUSH",
-        "signature": "3045022100c3e4ec041ea3bc3713458179e016532c2b536772e4fa25de36e76fe0eef2634202203c3ece66078e2ecd5101dff0283fbab183469d3577d65d706a41b68b7f9ef156",
-    },
-    "0xb0f61c597bbcc29f3f38396b01f9c0f0c2e8bff0": {
-        "ticker": "ELAND",
-        "signature": "3045022100b3e3c61039953608b9996a23740d23325ce0421d800c063b85c4dea8f3c8069502206ff79067017c1949541544edb670d459ebfa0c9da32bb685d7bd70f471de24cc",
-    },
-    "0xd6a5ab46ead26f49b03bbb1f9eb1ad5c1767974a": {
-        "ticker": "EMON",
-        "signature": "3044022059c22f354a0e18a98798e7b3e924cedae2ac0ca9317aa311386b6d5744248afd02200a391ead7e74393423f1e6bd07b6d8464372de55adcf8013bd22db60315211c0",
-    },
-    "0x313d009888329c9d1cf4f75ca3f32566335bd604": {
-        "ticker": "LEND",
-        "signature": "304502210080a16f1f74224b502aa6cca21ece946463fb6d3363037e7e15c09dd10c3515ec022002342a8eb6cd1c876874818336ffa04f796bfa511ddd19d573fc2d0eff048d18",
-    },
-    "0xc3a9a54c043f348027fffaac0f2f996123a19bf4": {
-        "ticker": "ERN",
-        "signature": "304402207dc3de0194597f80c2f536a987fd8251d003f619d034ebd4a979641574f66225022055c8702a7ab35995b635633b55bf4702657bf52031c2484c97a721bf55edf828",
-    },
-    "0xa0e4c84693266a9d3bbef2f394b33712c76599ab": {
-        "ticker": "EURO3",
-        "signature": "3045022100a09de06da686f3ac77f36c3e94f1cce7240f599d1e2f2d7d40769cf1a9759bb50220566c0b654e52fd258c4cd36aa6711aa62f8ba2f4255ca9ce0b42d2b1a7617503",
-    },
-    "0x14eb40fb7900185c01adc6a5b8ac506d8a600e3c": {
-        "ticker": "EUROT",
-        "signature": "3045022100bd8a4913532c1d01a07119963cefeaed3e665bca3368c882ba447ba21670c019022062ce27b71d42a3f0a49e7d14123d9a7b0d8b2021ec7dee1c765638afc3a43ecf",
-    },
-    "0x820802fa8a99901f52e39acd21177b0be6ee2974": {
-        "ticker": "EUROE",
-        "signature": "304402202d26f8107f8c6170b36b5bf8aebde71a25e29135003507b72863e73951af79c00220314bee45318a33deec7b44b30973b747d61662e06ecefce76332b612a2da9101",
-    },
-    "0xae29ac47a9e3b0a52840e547adf74b912999f7fc": {
-        "ticker": "EVE",
-        "signature": "3045022100e68c03f8cc03271cabc3b17ce967e27145f682ca23e68128d1c6c3eb04ed8d0502201938247ef2893850e628d4c146b79647d5fd31a33637b1b7dc58c48cf99e79a8",
-    },
-    "0xb9638272ad6998708de56bbc0a290a1de534a578": {
-        "ticker": "IQ",
-        "signature": "3045022100e1427ef7323b3f37d465fb9689fb018dec757aa8366b8e343dae3ba2c83410d6022013c549d42ad32760d28babf415b5b7fb7d212fbc4c6565c197960bf807e85ae3",
-    },
-    "0xc17c30e98541188614df99239cabd40280810ca3": {
-        "ticker": "RISE",
-        "signature": "3044022077ad3e87f6d10887312b98ca00fda2422c522309ca355d49e41c0c3096c7dcdd022036c3313cd9a119c263ca515f77621417a959c815a67f706984f73c9457c166b7",
-    },
-    "0x02649c1ff4296038de4b9ba8f491b42b940a8252": {
-        "ticker": "XGEM",
-        "signature": "30440220431996966f6d80d1460b9ea1258a47b2fbaf2b1c8d0eca8163b4d08e3080e2b202200f06d43bddb51de4ce60c1e8873a550f7773670953409181057a5da9fa69d062",
-    },
-    "0x2fe8733dcb25bfbba79292294347415417510067": {
-        "ticker": "XED",
-        "signature": "304402201a4a7a0ab4ebc755bd376c4e87d9c39fab9938997cae5a807cfe5d84040fb9f60220610b4fe800dfe0d9ee9f43450c6c6130dfea5f9f737f91403fdef77f03593771",
-    },
-    "0xbd8005612124dc30601e22d8b5d188a89767c640": {
-        "ticker": "EXO",
-        "signature": "3045022100b8bafe174d231e409e785cb65ad21ca783c43934f4855aba926bfb306cdae07802200b92f4abe7f0381c7224cf447340047976c93135b07825feb8fa7aafaadda10f",
-    },
-    "0x23e8b6a3f6891254988b84da3738d2bfe5e703b9": {
-        "ticker": "WELT",
-        "signature": "304502210093728439f97331b11d046b6e060e6b4410a3601d5a343e0cd369187c793b4ed5022021ee308b884cbe372e2a25888c4c1af912d9b046d2e9159d74db6d6a1de8e8f4",
-    },
-    "0xc3f56d567e7663e8932e65d85ae4be7eb5575ca7": {
-        "ticker": "FTRB",
-        "signature": "3045022100bdd19dfabd31bb0199b143fcf52414299230fe65bd190af85be39e4ef98ec897022045b6bf758320f85d26274d270d818ffc020e4b54854176651779fccbf2ca3028",
-    },
-    "0xad5dc12e88c6534eea8cfe2265851d9d4a1472ad": {
-        "ticker": "FSW",
-        "signature": "3045022100fe83bef7e3b7066161e1bcebffcae545108a8fa255add6f7654f0ddbc65e426802204470fae3c83d96e48979b0c33f162dd88096ccbbbb74eccacb909a55d5b67aa3",
-    },
-    "0x3b9e9100db1389c518d47c635d80a90ad4c4f41b": {
-        "ticker": "FAN",
-        "signature": "304402203810703e6732cf9f5f90c8e03e6beedce2b958d3b05fa0385d8273008cf2fdae02203abf75cfb4103228c829bd9046ee40bc02f066f6aba4cf41804bb58cdd310600",
-    },
-    "0x7f280dac515121dcda3eac69eb4c13a52392cace": {
-        "ticker": "FNC",
-        "signature": "3045022100bfe2634a3069ce61359bc3443750c26fbe9b526c3e03c40e54e27d982af93c8a02206ae88677a9f124913ccd4706c4ff74fa1a2efb9fabf62d45db30ea8860e6c888",
-    },
-    "0xc9c1c1c20b3658f8787cc2fd702267791f224ce1": {
-        "ticker": "FTM",
-        "signature": "3045022100e53adaa3478dafe8a78e80d3ac0f1368a22e3b57457b006f341fee784b95255e02200e06fa79671d4a54f3eb4185e79032422d75612dba1433f709971f252c13b302",
-    },
-    "0x5f32abeebd3c2fac1e7459a27e1ae9f1c16cccca": {
-        "ticker": "FAR",
-        "signature": "3045022100f05624351f37dde02b323f333f227fc9d152b31a587a958400c293584c42dd36022059d8faefeb6f9aaa0aeb5b5d9e66ae119422360127496d51a9a584e80c391ed9",
-    },
-    "0xf2da37643c25ca14291c2a69f51423ed9b7ff4b0": {
-        "ticker": "FARMS",
-        "signature": "304402201560a260656fa71f05f1eab40500a43bb062adb69925f59ba6cafc2e2dfb6823022032779b1251f7ff8c4359592a65138965ca0d00a53a5da7b13698f83169ac8634",
-    },
-    "0x05a79b208bed516fef370e196d27b1d8207ec458": {
-        "ticker": "FAR",
-        "signature": "3045022100c85cefbbcb6f6ac8915a964b2cd9de067bcc96baf944f454aeb3cb6bd28ab37f022073c1a1f50429168b5ad898cca9038d4da47534b0c13dccb801b35c8e2bc26d8f",
-    },
-    "0xa2ca40dbe72028d3ac78b5250a8cb8c404e7fb8c": {
-        "ticker": "FEAR",
-        "signature": "304402202b51e9f22957e62e3161f4b797fb7aeade70f73a525bfdb2e4fd4671f3fc6e990220715ea877eb6f81f228614f336691e1d87199644ef6475a85d6c3a399b19b9aca",
-    },
-    "0xf391f574c63d9b8764b7a1f56d6383762e07b75b": {
-        "ticker": "FEG",
-        "signature": "30440220723ec9773b3cc9e6c3ce465c2b06acdb0b3382c445ff3ad263000e370219936c02204453a1c7ba6b266535f8651af12ad969a7744170f1ecd942a4263afec69b51cc",
-    },
-    "0xd99bafe5031cc8b345cb2e8c80135991f12d7130": {
-        "ticker": "FRM",
-        "signature": "30450221008394e0053306acd3ae3c9e291a88f9569558a7209731e9572681c1dda77216f102206c7b9ec7bd65065353ddac4ef62314fc5d9209550ff459993b99ff5d8f9918b7",
-    },
-    "0x7583feddbcefa813dc18259940f76a02710a8905": {
-        "ticker": "FET",
-        "signature": "3045022100f462e081f273bb1ae69168d64d538ec202cffb609c7bfd306d12297e84825f1902207e82b440a4deeddf67292873c416ea065ef9663961a3ebfda099538f75d3c1d9",
-    },
-    "0xe6b9d092223f39013656702a40dbe6b7decc5746": {
-        "ticker": "FEVR",
-        "signature": "3045022100b2d2c4ef5efa3830bf0a4ef59a681fe0eb2b031ad794f9b736608c8b76022efa02203fd3f58deebdec4a2194de12d6503040ced7bfcd262251739e6dd3b0665b2ca5",
-    },
-    "0x2b3b16826719bf0b494c8ddebaa5e882093ee37e": {
-        "ticker": "FIBO",
-        "signature": "304402201d4e9a7e6b2bdcb3144150aa45e1abdfde2b7f0c0de172d232dcdfe7eb3cc0e1022054b17759fbe06b7deff9df320735c4d006bc0d11297a0c7c061e4390dafb225b",
-    },
-    "0x9a4eb698e5de3d3df0a68f681789072de1e50222": {
-        "ticker": "FID",
-        "signature": "30440220756157e1afdf7d091c86d38bfd9244efdcdf492d7d0ae2b29107e154af1beea202205528fa3343224d3c30560b59a9614c203796eeba7c73121324e40caf0660161d",
-    },
-    "0x72a5a58f79ffc2102227b92faeba93b169a3a3f1": {
-        "ticker": "FVT",
-        "signature": "304402204795f382632997d01e7f2881b5113cb06801b7538cc4442d33546fbe23be078d022052841d9bbf2317c0fde2782b5549e2b6d4df50facc93644f6de695567adc8c70",
-    },
-    "0x13590c53df63b52e159328c5b4ffb5f6dc5163c0": {
-        "ticker": "FNCT",
-        "signature": "3045022100ba3c0378d66dc94c543acd8ffe72b5f993b2c29a111965f0702c0a09e52aacf60220779ff7a299fd9287f06fcc36eb3106d043627f5e82c929c1a52274c6898fbba9",
-    },
-    "0xe118e8b6dc166cd83695825eb1d30e792435bb00": {
-        "ticker": "FIRE",
-        "signature": "3045022100d3a65df52bf7e369057f2cb62e9f060a2d32c6e0368cde942a714634d31fa5af02204cc886341b59a1ce895dad24a1af760544897db7defb35c9f8d794cf6ed16746",
-    },
-    "0xd125443f38a69d776177c2b9c041f462936f8218": {
-        "ticker": "FBX",
-        "signature": "30440220325eae328495fa7c47a1373b4979651084108cd6906cbee3c51762f1be4dd610022041f797b45b3c34afd43c70a9fce077c7c9c7366e9806e9541a60eaa06df12bde",
-    },
-    "0x22e3f02f86bc8ea0d73718a2ae8851854e62adc5": {
-        "ticker": "FLAME",
-        "signature": "304402202a25f6862e00ffd797dac87d16fbab2380839959b6034a4b0a759cb249535c8002203acbe875573963e16c4a744b01f6de8270ba2bd8e1d1879a7a60219b59199058",
-    },
-    "0x3a3df212b7aa91aa0402b9035b098891d276572b": {
-        "ticker": "FISH",
-        "signature": "3045022100b5c3f2cc9c6292ef20bac4d17e9e2cb4047a478cf75354817dd1fb6ac3fc7edd02202eba60971eb6987b3ee658c637cf905ec995600b3104beb7d97e03cb71010c90",
-    },
-    "0x656bf6767fa8863ac0dd0b7d2a26602b838a2e70": {
-        "ticker": "FITT",
-        "signature": "304402206378f90ec63e2c18bcb0243f779fef300d56c8b9409620e2adaf930f49893ccf02206e71869c0a6d64fa35ce47b4f832b2429da7a20e36ce6c6c9229d88662a9572b",
-    },
-    "0xaa1e97614eaf8d85dbf58f7f0b3080b2affcfefc": {
-        "ticker": "FEVO",
-        "signature": "3045022100c4d4a3e07daecc877795175bad82a531a5dbb4d2d988089b449dc10729d694a00220561285ddb3dbcad13e835d3a31e457d98728543427214ce6b071602433b33cec",
-    },
-    "0x5f0197ba06860dac7e31258bdf749f92b6a636d4": {
-        "ticker": "1FLR",
-        "signature": "304402200a1e2ddbfbc9d4e948fa507ed54bc72d38d64c1ab9885527734a8c8836dc016b022062afbe992e01cf401a3c914e958983c55fb357db3228bde2c17771793ed3f3cf",
-    },
-    "0xf0ae1efde60bab0a830673747138f12367858e8d": {
-        "ticker": "FLOAT",
-        "signature": "3044022051c346bcfb9f2a596de0b7fb33ad56942d4fa67894cbbc27970202082b58d54602201909532ee1b7c1615e3539b9f8b6ea4226ea722ab2b4dbf7212d0a68bfcbfddc",
-    },
-    "0x4ec465d5db20a01bc8404dc84f33bb7a398b8335": {
-        "ticker": "FXY",
-        "signature": "3045022100d7e56e3b71c144b4acf86a73553b21fed2fe92587865f0ce33e342f1c64bdf0602206dc854a0b207966950a8e60c6057793cbd6e198086b12bb6c425a4ca00456250",
-    },
-    "0x7067bebfa1720132dfb9373d65b522afbe3a201e": {
-        "ticker": "FLOYX",
-        "signature": "3045022100a23d3a652d0d9e42809c35590f99fe523212a8eefb39e2281e81f7c911c5655f02206fc31fd48e70cecc74518a7057a7d3f0fa6a51d418153427ec1cac09bbe803d0",
-    },
-    "0x486ffaf06a681bf22b5209e9ffce722662a60e8c": {
-        "ticker": "FLY",
-        "signature": "3045022100f84fd5ca5a82aa2c8e42c09d4bdcf4c0406213b371a9617dc7b9a16a5ad57b11022021383ead78fe357c9e9507f37752904510a04fab0ff000075c5f88f51f517247",
-    },
-    "0x66e16d50c07a01bb473ec794349d45aa1a0e5dc2": {
-        "ticker": "FOAM",
-        "signature": "3045022100b66fe2c72a4073cad992f5c1f345fb1d4f057b79a4097fb913238e1e3f433785022006f6059384a3fd45623b8bdbd2514f3cebed6343d2548f3f34a2b5a2be39ebf9",
-    },
-    "0x5314ba045a459f63906aa7c76d9f337dcb7d6995": {
-        "ticker": "FODL",
-        "signature": "3045022100cf42edbc1820d56a483965009c638602ee7b096d8c2b8afcf41a713ffe7cf3b80220144ad5e076677ec024c4c6ffae2a21101fae3d2ae9c4d976d57ee24c1e84262d",
-    },
-    "0x6f06e6bed64cf4c4187c06ee2a4732f6a171bc4e": {
-        "ticker": "FOOD",
-        "signature": "304502210099952f227937eed64554cec8897c0d930c116952f6f86bd15996a8a6886a4f50022010ac31aa563a6b05834737ceb6aef9fe0b5f3389482f97ee8f6f974d8645e6ed",
-    },
-    "0x081c280cd5c1c934dbafc97a2ab2e596ffe7dfc4": {
-        "ticker": "FORA",
-        "signature": "3045022100bcbb92f9b0ad6c0c53acc44aeffaabb7665459d439c45a60c735869f0a22012202207c97bd915ae95ee92401c8a7957fb5e242163d17f91f1b19f4a5ccf10b67616e",
-    },
-    "0x4455ef8b4b4a007a93daa12de63a47eeac700d9d": {
-        "ticker": "KNIGHT",
-        "signature": "30440220081f601774c4f86ff28ec5dc51c748babe1b0119504a246fd59130274d3e31e0022005eca7a74e22124c7bd7d49197dfb862bde2044f97e51ae218af02254431c2c6",
-    },
-    "0x9111d6446ac5b88a84cf06425c6286658368542f": {
-        "ticker": "FLAG - POS",
-        "signature": "3044022064620e0edfa6ef4f7f1490f22d7190dc212b9e8960a12af3e0c85b44a9e547420220687f212642a8dee9df02d1a7200a9550fe6ecf88dcda1e1efd4bb9e60a98304b",
-    },
-    "0x9ff62d1fc52a907b6dcba8077c2ddca6e6a9d3e1": {
-        "ticker": "FORT",
-        "signature": "3045022100dffb349c02d84532a6471b0aa651569a6b89f20e2b97ccba8d610f7d1bb3d2d102206d94fdfbc39f1917702f6fc0a17eed23595adf9d4ba13018df8650737f473642",
-    },
-    "0x28f732962ebcacdcd94f419d301e6be21cc3025a": {
-        "ticker": "AUDF",
-        "signature": "3045022100c3b0b06b606761799eb39ef326e85004f04998652cbe5e314ee90e687f168828022055903728e665a8b8b16634a148ee9d02bd2ab4613e51003f89ea65b79f11d8e0",
-    },
-    "0xcdb4574adb7c6643153a65ee1a953afd5a189cef": {
-        "ticker": "FJLT-F24",
-        "signature": "3045022100c31db586fffc1a2bc725526a1b3b3568562849f4b536d817e6c86f253098894a02201bd59f86da0fb728857a6901ec93b039e9e86174ef6e7038304035b7f04b3231",
-    },
-    "0x65a05db8322701724c197af82c9cae41195b0aa8": {
-        "ticker": "FOX",
-        "signature": "30440220344a0fcdbff02568d465b09e2cffc047eb9169f9f89243cad21d20f78ab5749602206cee295f9945b6f10f984541b6975df9397edf35a3c9a0feba5d93fed87b04e0",
-    },
-    "0x2cb7285733a30bb08303b917a7a519c88146c6eb": {
-        "ticker": "FRK",
-        "signature": "3045022100ec44c16296ca53b899de63c56ff7bfd7736725f3a57722ae27165bfb91c28b13022067369c3c1cc718a55bc8ae07090238d7db0a6166e8afe4e0bf54e159b7c9d088",
-    },
-    "0x6f934b45fc6043527d73c7c99313dd838e723db7": {
-        "ticker": "FCL",
-        "signature": "3045022100eb5ba2c5be243b68d60ae5c7295b79c491fe8b358d91186a81be9049136bc463022034399e2223bd6718aa718c5e29abee9f7c8035fb369ab50eb05f1856d852cc68",
-    },
-    "0x99083d1b9c6744c71d0cf70b8965faca37684527": {
-        "ticker": "FRF",
-        "signature": "3044022037c5ef55d73c99868a554b76d0ff0e1ffa5f8c748916c4f7031197aeb5d69b00022025b5d330ac0c7db06d3e0645601459fd04473ff8d62372bc687c30216b812428",
-    },
-    "0x45c32fa6df82ead1e2ef74d17b76547eddfaff89": {
-        "ticker": "FRAX",
-        "signature": "3044022008cc676c8cbdd5aeaef7b6063b2dc4627ddfdfe833b9914d561aad7d3044f27d02206ea37a4acd19f614ffe782125f2efc6015dc9fc94424eb9a43aa789b40fa9294",
-    },
-    "0xee327f889d5947c1dc1934bb208a1e792f953e96": {
-        "ticker": "FRXETH",
-        "signature": "3045022100883e38467f8d840bd6e51ecbc904cff14845b316f4e08ed32b32673f2806845e022032d5585d202418709df26988a09df453cf71092ad930bf22f63e6ead9ad4d667",
-    },
-    "0x1a3acf6d19267e2d3e7f898f42803e90c9219062": {
-        "ticker": "FXS",
-        "signature": "3045022100a1574be05a44035908709c966fcc8756a13d60c43af8a1b57086ed83d889f5b102200aaf6578af553e7c1c22785842228c46342d86c654e44e87b3ccb67bec53a8aa",
-    },
-    "0x7cef6ed1e07079e174601d39066ad0856cb47988": {
-        "ticker": "FREE",
-        "signature": "304402201b40be30f6cd23cee9a6aa7330cfd204e7ee5147bb54fbd62654ddddb7c66a160220250ffc02afb80d706ddb5be1ada48bd924df48adb4e43a4ef1ccad6c8706d5f9",
-    },
-    "0xb58458c52b6511dc723d7d6f3be8c36d7383b4a8": {
-        "ticker": "FANX",
-        "signature": "3045022100a4a8c3c705ae59680560a8e86b81c434b7780598d02ad4cf4486933805aa30c402206d12ba43b67e8b443b976c1e08823b2f37cd6add8ff1c9133edb6a6e35ecae1b",
-    },
-    "0xa3ed22eee92a3872709823a6970069e12a4540eb": {
-        "ticker": "FRONT",
-        "signature": "3044022031e7a7961b55db287bcc987825a632348a952dc9352abae8db1b0f3fe3b7353c0220404f9ea73f5dd8a9498fd6db2a69d5a4eb4dcc4847d0f3344567b6548676edbe",
-    },
-    "0x5dee84ffa2dc27419ba7b3419d7146e53e4f7ded": {
-        "ticker": "FRXETH_WETH",
-        "signature": "3045022100b7f9117008ae4dff34f3dfb6acc1fed8e222383481805eb0e8b1de355d87d656022022cd7081eeae5d2538576d19495c128668674d65c9fa9b6b4a8b6345aeaa1010",
-    },
-    "0x6ddb31002abc64e1479fc439692f7ea061e78165": {
-        "ticker": "COMBO",
-        "signature": "30440220126d341ad85e5d34cd11de5a0bd47e4e8ea494cd73af13b8b898aafd5bcd426b0220102a177dc04dd8db0200a5bf5f9607d898dc0dc39f74c23e163dfb685e897195",
-    },
-    "0x6b021b3f68491974be6d4009fee61a4e3c708fd6": {
-        "ticker": "FUSE",
-        "signature": "3045022100c3b32dcfabe0cc3f9a533c9a3fe7ed0ee8ef03933f0fbd2350580e6a78a45ea30220262725f0846bdaa2de96a00bddb70bdd9587afac7d6bbe6166595ab5166b8ae2",
-    },
-    "0xfa1171334cb3a0f0a91e8ca6765f10e9638d1cbf": {
-        "ticker": "FSN",
-        "signature": "30440220777ef5482278d859c93f673444999f875168b22330e8a17323361f918217e64e0220351d14a816fb7a1d50839653927ed8d50d9d3084b496040a79085b6a2cb06808",
-    },
-    "0x723b17718289a91af252d616de2c77944962d122": {
-        "ticker": "GAIA",
-        "signature": "3045022100869677313473109120d95012a92e19a5df3492631f75c562b8f92b01dc21b24902206e8f6b564152c00564b68a4874039066babd1fc477f535db70f377f5ddb81001",
-    },
-    "0xe5417af564e4bfda1c483642db72007871397896": {
-        "ticker": "GNS",
-        "signature": "3044022100eece560275b0df892c526a4248e43a00bc82eedfa958f5211f737e2572077ff7021f35ce82649c501c384f6af2d3372456d93991497021371ab34afbdc3230e45c",
-    },
-    "0xcf32822ff397ef82425153a9dcb726e5ff61dca7": {
-        "ticker": "GMEE",
-        "signature": "3045022100d201b1b652f3b66a7a7f106953d02d9fc9eb4bbca188cec78f1ac88604f9167e022019527d5441425c7b0ec546f3abcdad7484889f6a2f7ba1226e9bb09bbf8efdbf",
-    },
-    "0x3f6b3595ecf70735d3f48d69b09c4e4506db3f47": {
-        "ticker": "GAMER",
-        "signature": "3045022100ac2f2bf9a18bac1e7d3b66f1417e5a52c81126c07d7c2f79443033428221bc230220639abd5de6b5f24320a45af3643ba88a6fb680cd21894b656fdb93cfa9e1e575",
-    },
-    "0x580e933d90091b9ce380740e3a4a39c67eb85b4c": {
-        "ticker": "GSWIFT",
-        "signature": "304402202d9b43cae04bf405adaf4ab625b1e186d47140f33f5cde9e112ad3202df540a202204e040821b31b9c84830f57b56e95da8613f803f0450bd1ffd1eeeef7ffafbc7e",
-    },
-    "0x65ad6a2288b2dd23e466226397c8f5d1794e58fc": {
-        "ticker": "GFX",
-        "signature": "3045022100b6e07da5a5df0795a819eb7e780c04dda7f9e4d10f4c0395a343219e1e22a2a20220623f06ed69bfbce9645e92085b2b0192d241a8ad8779b20b7c13629834d8a029",
-    },
-    "0xb1cb9d9c85aa10c332083bcd03d2fcf871556e52": {
-        "ticker": "GCN",
-        "signature": "3045022100cf91e2abe05c0af66da8dc8345eb818acc880fc5ed4e5e1379d6e222228a8ef802205d977bacce3828413cfcdd319009285201cbbf24b88c7bd19e4b8072274530d3",
-    },
-    "0x3801c3b3b5c98f88a9c9005966aa96aa440b9afc": {
-        "ticker": "GLTR",
-        "signature": "304402202411789f61b2d1a0d57cc8653d6a6211edef8dcb97c88d1eb818d43824ee30ba022024956acdeae396be17f63c16f9391e8dc560a880a256b287529c94624fbe952a",
-    },
-    "0x071ac29d569a47ebffb9e57517f855cb577dcc4c": {
-        "ticker": "GFC",
-        "signature": "30450221009fcef5e5ea68ac9b9843c9de158e634330060c4c2732babf0da104f535ff996e022068af0b4389b1a0ec8fb2ffd1fc4e963a777b1accddb6c562b4c86a90d22f9e23",
-    },
-    "0x15b7c0c907e4c6b9adaaaabc300c08991d6cea05": {
-        "ticker": "GEL",
-        "signature": "304402207b58810b27a754350d1557f45742fb2a42b094360340f3f5ea019514eb512b3b022017ec32dc19d925673da6aa7f714482a6990d4c2b45a97f8d786a32f087b41999",
-    },
-    "0xc8a94a3d3d2dabc3c1caffffdca6a7543c3e3e65": {
-        "ticker": "GUSD",
-        "signature": "3045022100a5715074876b0c47c69ebaa15cdc95cd449ddbf41378f2325b78587bb48b233002200c7192a6d3fb6f5e6aeeea99788a38ad951110fa9fa5d0bf44225612660168b5",
-    },
-    "0x51869836681bce74a514625c856afb697a013797": {
-        "ticker": "GENESIS",
-        "signature": "3044022073ad7f41e90da4e8879c9b0ed93ef7c2adbdffa7147f25e6b4a2eed9a8402a2902202399c695fb1b76258b33d915fc8a44d759d8b5a7aac3064d02d1c40bd2938a72",
-    },
-    "0x444444444444c1a66f394025ac839a535246fcc8": {
-        "ticker": "GENI",
-        "signature": "30450221009a899dd9bae53689598c61df838652408b8c1231ff2b3aaa53dac03ef041304902204d91330347167bf172fbebe8fbc8aae8281253c8ca8f2f662addfe660cc4cd2e",
-    },
-    "0x127e47aba094a9a87d084a3a93732909ff031419": {
-        "ticker": "GNUS",
-        "signature": "30440220251e8e253fbbb88977d93861390b02a98612c3103ff11d25b3bbb48339ef2400022014a0a4e09ddded7aaf0c94e567f06d90fc2c236e42ce5bd7fdb43f32cc7a7333",
-    },
-    "0x346404079b3792a6c548b072b9c4dddfb92948d5": {
-        "ticker": "IUX",
-        "signature": "3045022100f1f6d08416c6e22e874de7296eaffcab5ef7cc1ddea473ee385ea6028c1c28d70220587ff482cf0645401cfca6e88b9d14171310aeea5a0fc01e0aa2d94256acfe9f",
-    },
-    "0x6e8a8726639d12935b3219892155520bdc57366b": {
-        "ticker": "GNOME",
-        "signature": "3045022100983b520a52d811be759b0e97ea0c74feaf25f5e145fe1688ae44242949ebf2d402205292f02a97642a32cc1d8a25c5a1ec4e40a9184a27c00c4607ef2380d318e3d0",
-    },
-    "0x34667ed7c36cbbbf2d5d5c5c8d6eb76a094edb9f": {
-        "ticker": "GENE",
-        "signature": "304402206e3cdba24b6231bf5b1a467f82aebacfad19a301d0103902a2896505b8d9aa5c02203d5b34a2f3dc2f325c20d76316f7deab5c1b68ecfc90ac9279516645d165fbe4",
-    },
-    "0xac0f66379a6d7801d7726d5a943356a172549adb": {
-        "ticker": "GEOD",
-        "signature": "3044022023d9466ba2c5a6e9ba321eec1c7f68c6135415dcb7cfcc2dd34b715d60959d2602205fd54b34b27fd5cdcea699c436995525b0ec2d1aa148b52089212c17d4367173",
-    },
-    "0xf1428850f92b87e629c6f3a3b75bffbc496f7ba6": {
-        "ticker": "GEO",
-        "signature": "3045022100efd786d8b94695d1458aeeba453a1c7bb211eb4528d76beb25232a101c452e8802207e13f34d1488a44cadb865095ed944a09bcec95cb55a84e8356708805109045f",
-    },
-    "0xc48f61a288a08f1b80c2edd74652e1276b6a168c": {
-        "ticker": "GYSR",
-        "signature": "3045022100adb25920d6152c189ef0274e169cdc304fae837ecafb7f05c92be182ebb396530220795fb5d46dc8c45eb6c2cbb9b2f4af44fed94afc176dba4657d98aa83a02bd04",
-    },
-    "0x49b1be61a8ca3f9a9f178d6550e41e00d9162159": {
-        "ticker": "GGTK",
-        "signature": "3045022100af3d765af3feed9be5b9209819b34a81c5f25552af3687a785a55405a0c2ed5e0220232211bb249d57fca651a067af8cfe33cadd536d92cd2d4d926bdb9e77e42348",
-    },
-    "0xffcd553464a00d7b30a48960611e5032f544700a": {
-        "ticker": "GM",
-        "signature": "3045022100835eca798187e166d0b255fae63cf6b8f7ec85c9d4b76dd07607f17a9b43047f02205df75b00b292da4e6bd2d1974aea9112886aca0681ec178bbb97ef9f8e75ee75",
-    },
-    "0x3efcd659b7a45d14dda8a102836ce4b765c42324": {
-        "ticker": "GIB",
-        "signature": "30450221009833ba8834296733f34a8de676cb1df1d8fce3dc86959783cefafb2c6101299a02204d1f43d8c83f2a093850fa912ec72cf9cfd7eb03800dcfa200bae7d577c0276e",
-    },
-    "0x67eb41a14c0fe5cd701fc9d5a3d6597a72f641a6": {
-        "ticker": "GDDY",
-        "signature": "3044022048249917fe41ab18392c2fb9387bb25efb5b385087b0b05ece9996f405692db502204173021c93e6720ed2b74ec0d7ea4cbabbdf45202ccb1b96b6de78cec851ee3a",
-    },
-    "0xdb95f9188479575f3f718a245eca1b3bf74567ec": {
-        "ticker": "GTC",
-        "signature": "304402202c3d09cc0981d58ca9ec2ae33a571534f97b76e4cc6e012ab640e51d474df5b9022006c0b957028109d2c0b0130e11300b6653bbf169b08564bd162790d1b0adfff5",
-    },
-    "0xbe5cf150e1ff59ca7f2499eaa13bfc40aae70e78": {
-        "ticker": "GLCH",
-        "signature": "3045022100c9149ed333b806e25168778773be7a9738ca4cd3f5276be5acbdd590257a286502204e842808167c3bd4f2921debfc53b224767684f3b4463623e1ef4713c342ac29",
-    },
-    "0x4f604735c1cf31399c6e711d5962b2b3e0225ad3": {
-        "ticker": "USDGLO",
-        "signature": "3045022100a7798a33984873351196ad153f19452f9851555021ee50c649310307e84b58dd022038e433239b3ea473c91e18aabba9ccf9978337be88de1292884733f85dbe6e4b",
-    },
-    "0xa69d14d6369e414a32a5c7e729b7afbafd285965": {
-        "ticker": "GCR",
-        "signature": "30450221009a3d88624dcf442eaca8e83a4f89286390328fbdcdac6e394eefbc0f433362b502200ce76c4d0555d51a24e81514f43f4fbbc3694725ca0ef52748303d99f55d6170",
-    },
-    "0xc14a7747cfec02cfea62e72bb93538de6b2078e6": {
-        "ticker": "GBL",
-        "signature": "304502210088d8b4c20aee474b08782c2ac1729d19eaaf4bb293b9bdb63a32c5b91f04a4dc022009b10734a0b6a685c9dacd34fa942faeaed9d7b4c5165bcb7d0241c8d053b49d",
-    },
-    "0xe58e8391ba17731c5671f9c6e00e420608dca10e": {
-        "ticker": "GNFT",
-        "signature": "3045022100a2162bfe57f7b89a9f18817b39d10d6933bbc2ee0a7f05efd21db1bedb7b21d002206af4f8ddb076bf87dab100449db12badd773965c3bd8be3555ea96e1575d3049",
-    },
-    "0x5ffd62d3c3ee2e81c00a7b9079fb248e7df024a8": {
-        "ticker": "GNO",
-        "signature": "30440220676c4fa426085479f0502e7c3d9bbeac273e356254ae3ba78bdf61efd225d8540220649a944cc30eb5ce55cb2d2899be899981716db2807514619d00adfd9fb8f3a0",
-    },
-    "0x468ac716493c51184162681130035b61baff040b": {
-        "ticker": "GOAL",
-        "signature": "3045022100fd776fbc54719e054636df1bb07831d922a02bbe2b96c691aec6f7299fea448b02207f5022bf9ccf669710e79f17a752eff79b29b95efcf3a199ef4736f31f58b6d0",
-    },
-    "0xf4c83080e80ae530d6f8180572cbbf1ac9d5d435": {
-        "ticker": "BLANK",
-        "signature": "304402203bf51e0aeffc5c1887e1ea06043f5d015a6ef7cc0e0824aed1161f2f28b23f6f02200c5a55fd9887aebf11e77b889f245b53a715d07123ff1a60014e9c4fc536fd1b",
-    },
-    "0x4b85a666dec7c959e88b97814e46113601b07e57": {
-        "ticker": "GOC",
-        "signature": "30440220271b090abf267acdad4b93bfca9aaa05836fa0eacc840949718545f1aab40fec0220191b6fd65997d813c25cb921ce9769a5c7e3ef174e9ce7cd6d9a71e9584be068",
-    },
-    "0xdd2af2e723547088d3846841fbdcc6a8093313d6": {
-        "ticker": "GOGO",
-        "signature": "30450221009c84720203df979ac76ecc25315734c905ee1324f9ab34219a5adb7084a7837202207e3aa1d37c809c8afab2cf081253812e395da1492c9a9bca0ce4141e962ff99d",
-    },
-    "0x3fb5807292c98bffd773e89b774016b0fe5650d1": {
-        "ticker": "GP",
-        "signature": "3044022045d89eb9005349f54634ca02ed3a818d611de3635fadec06dccc17eafe9f75ca022018f1304bee47fb9cb624a4df11de4b4c9d38fb899357475433a18fbc254ecd94",
-    },
-    "0x0308a3a9c433256ad7ef24dbef9c49c8cb01300a": {
-        "ticker": "GPO",
-        "signature": "3045022100ccd4b0e4824a7685e2fd8b8eba7cb4c46874fff486d646e49e46880d72cfc35102200e106994ff2a1e45a9c1110d474e44aaa9c8ec1c21d8dddccb4bfe6bb3e215cc",
-    },
-    "0x0b220b82f3ea3b7f6d9a1d8ab58930c064a2b5bf": {
-        "ticker": "GLM",
-        "signature": "3045022100effedc8a8cdfbe49bbdd207000529e9e56e35b5f29b677515c1dca0f715ec68e02203cb1c92a1704b6f6b64f75a161599e48183dc16e83de2b25ed12c1e32a53a992",
-    },
-    "0x162539172b53e9a93b7d98fb6c41682de558a320": {
-        "ticker": "GONE",
-        "signature": "304402201fb9312c8606351effc65e1db959a117a176b974f8569876c96f3ffeb292c849022010b9be7fd8cf226c960928b23584e83320850940c787c024b8dc6a0c869c4f11",
-    },
-    "0x6f3cc27e17a0f2e52d8e7693ff0d892cea1854bf": {
-        "ticker": "GOO",
-        "signature": "3044022052ba1a9e3eca18a41ff2dfd33fd751c1a03bfadb21e236841cf8676fd9b5e9f802207428401fa48419d6392503384ec02df3a35e64890be927da0fb14c84450f46ef",
-    },
-    "0xed6aab1615aac7bc4c108dfd4fdc9ad0c8304d47": {
-        "ticker": "GABI",
-        "signature": "3045022100b6ba564715ca0a21f0c5e8c82f4d2aed7c76950ebee20b2e274983983a33692b022071d9edaa85cdce5e4dab4f9c572fa61c5f8a028f273206c554ff8d15000989bf",
-    },
-    "0xd8ca34fd379d9ca3c6ee3b3905678320f5b45195": {
-        "ticker": "GOHM",
-        "signature": "3045022100cc36ca43a02c002719f60fc8c8091f688f014df10448b2d3fdc15bb4f7e0cc8e022029c69aca74d1068828e862436af3296c05bd6cf46784940512ba44c857257adf",
-    },
-    "0x43df9c0a1156c96cea98737b511ac89d0e2a1f46": {
-        "ticker": "GOVI",
-        "signature": "30450221008fbe790f8459aec94b22f192efa562991bc743c4246368f8dca2e17e5947f2a10220544d402d3e1240af6b0559d70e8512c46422b7abd926e23d70d34c2fcb98fb85",
-    },
-    "0xbd9c89536e406478d8a42c51b35bcfb6bf8a1384": {
-        "ticker": "GC",
-        "signature": "304402205aaee921e4c5cca84b810b69dc1273240cc5783ff112237c8226a323910755b902207a8fa286e1c400a75ee5f9c407041c2e237c6824c1dfb5adbc47eb6e852b3afb",
-    },
-    "0xae55ab6a966863cb4c774ba8e6c0a37cfbea01f9": {
-        "ticker": "GRAMG",
-        "signature": "304402205afddb0ba8ba59dbdab927b27c7619f590b2768db48cddbec75dc3d24636ea7c022066535dbae4df57f0adba5ebfaa1fe453ae2a4afd4c057fae04910e2af6a8d3b3",
-    },
-    "0xe229b734251dd48dda27bb908d90329f229c3531": {
-        "ticker": "GRAMP",
-        "signature": "304402207dbcedb1ca6b58336381c0ede6d328bc86fde1a5ad3b1703a0491c6c9752c2d802207bbd34a771ab7b8e096d2e44959c3bb44a55bc3d9f4c3119d9e5f30c79fb07ac",
-    },
-    "0xf40d9de56b1fbaff388f4d1b97dc8dfc184d34ce": {
-        "ticker": "GRAMZ",
-        "signature": "3045022100d2094de425e02ba8bf62a79236bd4e1453d93ce6a5d8b2b2c5142258c58cd51002207ac23f3c34b60e42815485ec174066e51d3d05a9904c1cdb0c2889bc8b6ea677",
-    },
-    "0xc41214fc9f2bd9705e7a271409471161aa0e8808": {
-        "ticker": "GRAND",
-        "signature": "3044022010c2db47cf633772ae5114bb05d9822ccdec281ed4dc54afb39490a3dded492602200f56bfc33a09f68a56cf0547afc37c7e6929cb6a042f20910d083b3f0637f899",
-    },
-    "0x5fe2b58c013d7601147dcdd68c143a77499f5531": {
-        "ticker": "GRT",
-        "signature": "304402206e352ac6947f2d2089339e567429a4de41f8c0ef4d0a7d4c0fb0a706a56e45af022011a85b67e644478abee9ed8e3f8e9db3973d54a85a9ab43d10f970be76a0d59b",
-    },
-    "0x874e178a2f3f3f9d34db862453cd756e7eab0381": {
-        "ticker": "GFI",
-        "signature": "3045022100bae69c4008de6e60a5a10a93639d003596660d587fc53da23050e71beebaac94022046ce5c5a776410d2ca615dc7914c86c903f2c39a23a5f0baf0da4972f28cf9aa",
-    },
-    "0x00d0e26e0053f2b3be0664827df439d1418e494f": {
-        "ticker": "GGT",
-        "signature": "30450221008e2eff6bd2eebb76fa011fe57442a0737f26b6f6bc90403f8f87fa2e083bae3602207f1a8a7ac71f72662f70da9ef41a52bd8e02a75fef49824177ee73afbba8cdc6",
-    },
-    "0x36ec6622b5227e3a7e4d085f1dfc1dc8f5192289": {
-        "ticker": "GNC",
-        "signature": "3044022002933640f7c979db1e2905db88a98e2205daa8f696834ea0c652b0bde62ad466022019f73385f6fa4ce7517e3c2daebe7021f69dc6f4b5e1f7dcb2d437489ec525e3",
-    },
-    "0x21a00838e6b2d4aa3ac4bbc11111be011e1ca111": {
-        "ticker": "GREENGOLD",
-        "signature": "3045022100fca92308e79d951b84d2ec379ebda950599fe0875f1e6cbf8d22cef5e14b7f6b022044cead1a80bf82491b26722d78cd4a00e0b5476064b551b184f040830600dd52",
-    },
-    "0x714db550b574b3e927af3d93e26127d15721d4c2": {
-        "ticker": "GMT",
-        "signature": "304402202520e1c40176b3a395e4b2e31764eedb78f4cf2b52569a0d81851810b2a00dc602205ad07521d3ace2378f1cbee74d3dc9832e6a7f376d2c5fc923a54c2995c6f852",
-    },
-    "0x1b8cf8045262663d3e1d7e5cc59cc861fd034bb4": {
-        "ticker": "G",
-        "signature": "3044022049d11ab3fc168c87eb9cca4f6ecf679ff65384884df0fc86aa3d82e4dd1d745e02204d6325e9bbadf1327427a64fca14523406d335f52ebb17afc813beeb9ee0a0d9",
-    },
-    "0x9ad4e87618591162196b3d34300a734a0035395f": {
-        "ticker": "GND",
-        "signature": "3044022043048ddeab48906808532c4008b125f7d4bedb073662f596f8958e3b39d9ffaf0220639204ea9629b6ee93b8b024b01251317cd43f4ac57c02269624da98fa1b3351",
-    },
-    "0x733726968ae55dc58c26dbdc193fea256a704ba4": {
-        "ticker": "GRUMPY",
-        "signature": "30450221008a6a2a7ad22cef65134d40fdc80ea5166e249f96cf2a2d09aa47ef0cb5989cd202207786ae41332e7970ca184ffb012a3fafe37f16cf6b1123b481f8da17188a09fa",
-    },
-    "0xdb725f82818de83e99f1dac22a9b5b51d3d04dd4": {
-        "ticker": "GET",
-        "signature": "304402201ed891d84a0085b7b0ced4e014a74fd3ffaa6943a936163e842a72c658c564f7022028460e745c62e1ea20bbf3909070aca3a327e84bd0e5b9e10bc3af7abf606766",
-    },
-    "0xb0b2ef34d412d73b0ff90a709d1779a20655165a": {
-        "ticker": "GUARD",
-        "signature": "3045022100b65ff79487fa014602c41b71ef196ed869fea1b15bbb426692e7b8f1b3566a350220570c0b52c07d759d98ec824611be7e846a32615efb6f5240206862676f898f69",
-    },
-    "0xb5cb47a8f85628dea29ac7153544867e87ae6937": {
-        "ticker": "GTT",
-        "signature": "30450221009eaaa430e2b74dbee843b3fa66ae81633d79ebd857061fc38a9707d524cde1f20220328dcf774b5e26bd8485688a8281cf8bfdf05facf9106a46c5efe7b90b9e42f5",
-    },
-    "0x480fd103973357266813ecfce9faababf3c4ca3a": {
-        "ticker": "H3RO3S",
-        "signature": "3045022100e50205548dcbb72ae7178fe75206f0fef18e0f36c943296a0460167ccde7ccc702204277be7de21a60fb45ab984f89f7ad4af8f7f480c5824ebb4e8d2aafb416b25a",
-    },
-    "0xdb298285fe4c5410b05390ca80e8fbe9de1f259b": {
-        "ticker": "FOREX",
-        "signature": "3045022100d82c312c11113a2cea73f25aedd8b5d8a366eb45283e62bbe82ef995b403b75002201451d37a3b40710f85656ccba34f0a9eaa984af1cd43e99314c7a4e321e2ca4d",
-    },
-    "0x709a4b6217584188ddb93c82f5d716d969acce1c": {
-        "ticker": "HANU",
-        "signature": "30440220205401dc47587f0a8b378ec916e209968ca658aaa9397d628b8733e9c911174102205e22b026fd13d57af7b335d21f4b91567d8d8b24abd69e249e35695c81be3072",
-    },
-    "0xab0b2ddb9c7e440fac8e140a89c0dbcbf2d7bbff": {
-        "ticker": "MIFARM",
-        "signature": "30450221008dc2656b6571857353af359acaf96b8393ba3fcf7868bea033d3b141789e96e202205dee0ffedcbc97ba5ab4a6031e43d99972ae696bb50d1f5c3875440414ba0d31",
-    },
-    "0xf89250e83fa2f33058385c98c7c44e723b040359": {
-        "ticker": "GARD",
-        "signature": "3045022100a0ea67897d8ec63a4b9e64eb7c1823b424cb37f87e44d22204416aadea405bc002202e4c70b23a7d5edfc3342df5743a0607e808324d0d774893915b80ca00d564a3",
-    },
-    "0x23d29d30e35c5e8d321e1dc9a8a61bfd846d4c5c": {
-        "ticker": "HEX",
-        "signature": "30440220479d463edf8fccb9cbed23a60d5b105114acd488386ce4012c6b2f7724e2eda002200332471b125a1422cbbf2a987abb80e46dff07b3cc8b0646d64ff30f0c39e95f",
-    },
-    "0x3e15cd00b456b0fb33827e3c9b49952bb0ec126c": {
-        "ticker": "HUT",
-        "signature": "3045022100e9a483436a9b7ad3e7fbb12c121e07a018a38e9bdbd814870702a7c6865546ea022049a91e47302b9144fd9fe299342365aa9ed28a8e608702d57265cbf27383cd42",
-    },
-    "0x0c51f415cf478f8d08c246a6c6ee180c5dc3a012": {
-        "ticker": "HOT",
-        "signature": "3045022100f85cac4adb490920b248eb17b8d8616b4b2eefd1539b3e7fda92fb143d0ea3eb02200ae938327dc0121b1027a4adb4949c0c3cb64af16b7d75c724c7b39a43a6f2a0",
-    },
-    "0x12a4cebf81f8671faf1ab0acea4e3429e42869e7": {
-        "ticker": "HOM",
-        "signature": "30440220158f51083ad66eb5573502c4d37c2c1d0be808fdff3720b1e062846cfa4628b602205604442748bcc5a39505b48947a9b94ac9fa63da32be9be459488011e1360e49",
-    },
-    "0x1fa2f83ba2df61c3d370071d61b17be01e224f3a": {
-        "ticker": "HNY",
-        "signature": "304402201d760dc43184be509a45f9f34c8d09c29f5c0a643e142b9457309a3cb06dbc8f02200fd64e83415cacc3b4c893fde7cb13b4dfd25dd62d5a255709f05106442c48e0",
-    },
-    "0xb82a20b4522680951f11c94c54b8800c1c237693": {
-        "ticker": "HONOR",
-        "signature": "304402200e2e5a3658b3f5aadac860c834af9089896085f68c42e39441d84066db51729602207906e4da95931f6def2b18260d753c19461e69e189d3c6bc90523a0b2b9717aa",
-    },
-    "0xc5102fe9359fd9a28f877a67e36b0f050d81a3cc": {
-        "ticker": "HOP",
-        "signature": "304402204ec416ab93eabdb7cac8dc0b365bfaad9a25706603b33618207040c750020677022053bbd97ae5ee261c1f74e92bbadc5d50af78bafba15c0ae76928330ee2ca5157",
-    },
-    "0x6ccbf3627b2c83afef05bf2f035e7f7b210fe30d": {
-        "ticker": "HOPR",
-        "signature": "3045022100ec6ee1c4afcf263626e01dabdd68d0c27a2830e8bc844f19dc7d5c8d01c5e846022031b10b45f3ea9c93074dcde99adf86f2042d298bddf0107f9ba473d11adea49c",
-    },
-    "0x71544ebf5d68d8d397059f79408162f155367d74": {
-        "ticker": "HOTOK",
-        "signature": "3045022100cd5ae59d7c8a18a0c8e3e7a846356e64eadc0f787eeaa7e8695080de3b0b68bb0220456fe688bf2e67bd05a6a9b57e4cd5ef760696df7c45d34fbd6ab26f2f228f73",
-    },
-    "0xc748b2a084f8efc47e086ccddd9b7e67aeb571bf": {
-        "ticker": "HMT",
-        "signature": "3044022043bf61abb513ca700bab1147f744fc97ddcccb620c0870f063f047e29aabe7f6022072f67459049bb98753538d1eba5c515bec8eda1988b80d16be0037a03d17f279",
-    },
-    "0x72928d5436ff65e57f72d5566dcd3baedc649a88": {
-        "ticker": "HDAO",
-        "signature": "304402202c2e8c01f2ad12da77508577d6c27593b879bc41b1f9cef0f4bed23a6e8702ca0220050d1ff98600dacfccdcd3579e53dd497b952cd7f8341dba899378150c4ed853",
-    },
-    "0xd4cce747e623ce2d72322892e5db238e2a5eb4f3": {
-        "ticker": "HCFW",
-        "signature": "304402201275db51f7e32f9bec2beff319d21220b60bda79186224415d22cc898634e7ef02206da10f8724b7443e9f83d47b8308a76b3f598c7b0fcc244bb680843590f95d58",
-    },
-    "0xfad65eb62a97ff5ed91b23afd039956aaca6e93b": {
-        "ticker": "HT",
-        "signature": "304402202cc3a20b918bc1fb944b573207f4e8025b44b10bbef93c66c27cfcf22f526261022057132c7905fec1d6450034867a53f4c57ea4db958ff70755eb080f840caf6aaf",
-    },
-    "0xc7d73cb22add1f2019d68ec4fa033f3e3d622c0e": {
-        "ticker": "LYA",
-        "signature": "30440220333630f79629725d58fe8b69d9b2baf9847f7ddd815d8eab87933e5ce7d4b28802205e836cd9bc23d98d1afa02701146dd99f249a076ecb418cbd9f336dc605970c2",
-    },
-    "0x2088c47fc0c78356c622f79dba4cbe1ccfa84a91": {
-        "ticker": "HUSD",
-        "signature": "3045022100df67ae2679473df7d0a7c7f4a77fdec16418988169d636f68c6c4355ddb0d66902203b6d8724bcb64fe4fb8513d46ae518abdd3ec88a6037d082a435e3a4d899e5b8",
-    },
-    "0x7b6838c155f2800a0fb99b0382002dbfeee8ce22": {
-        "ticker": "HBD",
-        "signature": "30450221009aef147b3f9d6492abfdcb833b7a97298018ba86c7c962bfce4ae330f85dffa5022039089c2917effef1f946c7f355962de2552a1a360d0d342e8e7bed11798342b9",
-    },
-    "0x87847703d4bb4fcd42db887ffdcb94496e77e3ab": {
-        "ticker": "HID",
-        "signature": "304402201fc177b502ee85279c8b088d7318deeaa07dd0020da809f1b8e5593c3786e95c02206ca1f56d00605d22fe3f11290a94a5ebdd858d32ec402ad0b66259b3351e4683",
-    },
-    "0x3b6bc2b494fa008f71f7371de93847f456e630ca": {
-        "ticker": "HYPEX",
-        "signature": "304302206e2338edad60815e9019c99688664be4cc3d07528551c2721130162b7550fe91021f28ab2f0c846c6036ce3bbdd96ca1ca5f8cf6f8b30aba1f8040e283c11c447e",
-    },
-    "0x61aee582896064ecd5d85d66a32ddeb5574a699d": {
-        "ticker": "HYVE",
-        "signature": "304402204c60b393c787906651045df9d0d4c2cd89ac80d3084bf84098dd7327f822be370220746b343f27ae8689ba90436c9ba97e6007ad287c51bb047b82721a790ad56f30",
-    },
-    "0x0f93119bdac9e80ca845e9a56ae027507cb24c6a": {
-        "ticker": "ICBT",
-        "signature": "304502210091901cf8e8338faf599772afe5b113e3112106ff88276acc1b425bb058d2cb38022065c0ef7fa56272874ccb01040f655228f92d38bab37b796310f7a0f6c7f3c6f6",
-    },
-    "0x111111517e4929d3dcbdfa7cce55d30d4b6bc4d6": {
-        "ticker": "ICHI",
-        "signature": "30450221009450ad7c1ef1f093edba2fcff0d93903d7a672625d600a2b93bc61c805fc598d0220522d0ce6e02821b68c5044956e55e7dbf02dba8433a1e7879475266a819f56d1",
-    },
-    "0x91f3b9366801c1fca6184c3bd99d5ab0c43a9033": {
-        "ticker": "ICNX",
-        "signature": "304402202d8b00bc6f51d82a80c935607db702a75ff5b1428710e4dd5dbdfaa8011e4a160220403cc6542de262e942d66ebd81ec050fd9841a9415c3822db6db7c4d8ebb29b9",
-    },
-    "0x9cb74c8032b007466865f060ad2c46145d45553d": {
-        "ticker": "IDEX",
-        "signature": "304402204f4308639c52dfdb4efdebe5d5d5cea6fe28a59276d183cd43728498fd8b757002206c6f583d4ebd2f3ebce91dc7f098259d0a6545711e36cc19a55c7c722e32e455",
-    },
-    "0xc25351811983818c9fe6d8c580531819c8ade90f": {
-        "ticker": "IDLE",
-        "signature": "3045022100b09996d32cb187361b155513dd08d9d841c9031c8abdc2874a8debd9cb4f56d80220479bdc8b2f81977a16e30b38532a2477f098d0638e8cf037fd6acb559495167b",
-    },
-    "0xfda25d931258df948ffecb66b5518299df6527c4": {
-        "ticker": "IDLEWETHY",
-        "signature": "3045022100e3fdaac28de217d4d8b3856847aac4d7d9f219b963fb0b7afada1e5bb8f60d840220222f2455af918b7422629da81e28922a96d00cbf1aa75d3a6020344bdfe18c04",
-    },
-    "0x649a2da7b28e0d54c13d5eff95d3a660652742cc": {
-        "ticker": "IDRX",
-        "signature": "3045022100aac5fc32b6c2223580bfe89e76fb4fbf6bc8a4f3acaa47fd7d8be9019232d0510220097818d671c5062e8dce54d74b5f0ec38a997ee75f5413dc489757accd943702",
-    },
-    "0xe6fc6c7cb6d2c31b359a49a33ef08ab87f4de7ce": {
-        "ticker": "IGG",
-        "signature": "3045022100dbbe3018e2a4f3ccf05bd069f252f6a567fc32ebb60940a194d67c1de817f437022014a67ea4bf5a3945467d2b2924d46023bd742ae68ba07decc1c2f786d0dc0dc0",
-    },
-    "0x5a2fdf906ada9353ebe496fa5d351b39f8908d19": {
-        "ticker": "ORB",
-        "signature": "30450221008e358ee32b2f0334afcc39be9baf2963c39585dc754fa65fce3d01be5e70727d022025190280019a303181b42fa678e7a0514d35c5e175a888a5592b0d7021ec7c41",
-    },
-    "0x7f67639ffc8c93dd558d452b8920b28815638c44": {
-        "ticker": "LIME",
-        "signature": "304402206c72439bcccd237d08ee714901d06bb4d0fb422de96b82dd8469c3142d01388b02202f35ad29ee2993f75ef574b23d7360ffe6e48c582525244462d8b2bc11158e3f",
-    },
-    "0x2df54842cd85c60f21b4871e09bcc6047b2dcc4d": {
-        "ticker": "IMRTL",
-        "signature": "304402203eba4f7a77a2b9cdf4961114caf063f32c91ccd598b34d2d10a9907f3cf41e1c0220140061b3f41c2c3c98569f2041df55a7fd09c88a99bc74d20473a32033ea3344",
-    },
-    "0xf549db6b1e0b79c8f2730e7b7c6f2edca2cebaa6": {
-        "ticker": "PACT",
-        "signature": "304402207f2e7cb9c7a4fd0b2bc41113f8539953e047864b19bd27676d1a8a141e7076bc022030b86b25cb4a800c7e462a0dbbb2591706d97df084c4ce58837ce29bdf454e08",
-    },
-    "0x60bb3d364b765c497c8ce50ae0ae3f0882c5bd05": {
-        "ticker": "IMX",
-        "signature": "3044022057045fbdcb5de6009d1a0b0a982363e38d2f1bdb48a383da30f52da897f544d002207fdd46c2b42b4b1447fb1b831e9f75bafd1ad21c09e0c584e5e55f58ea125609",
-    },
-    "0x6d24195060e20c2d717408b8decca487b945c78b": {
-        "ticker": "IMXB",
-        "signature": "304402204b52cacbce56ddfc68c1a2549535512bf9bd27f4b9c816a782a6515fce5d92f1022039484a3ff1da5e9203b39dd1e8f08f0b8afaf9b0ddae526cacc160815b2c6caa",
-    },
-    "0xf972daced7c6b03223710c11413036d17eb298f6": {
-        "ticker": "IBEX",
-        "signature": "304402203e129193ad3070598f3d265f7773a6ff60b5944727fb757b0a687e3aee89815b0220394838f0a52563217551a6410eaead691a9a1cab19571a1d5776dd8d253f92ae",
-    },
-    "0xab5f7a0e20b0d056aed4aa4528c78da45be7308b": {
-        "ticker": "GBYTE",
-        "signature": "30440220589ddf595b03ee94a3a0c713a7960aec89336f8d98612d0990d0f18683b829ea022020ee0610c602eb83b186f8bb6dee0521c4970b180f085aacb2d7a06069196bf7",
-    },
-    "0xfbd8a3b908e764dbcd51e27992464b4432a1132b": {
-        "ticker": "INDEX",
-        "signature": "304402202f0a37a718552e0a208f2d9f2fac90b405130ef0705a8058dca45685daa14a020220084283e239b96a0f556a5ccfbd0e451e3c9823b0d29adc7ba3cc9c33d2650559",
-    },
-    "0xb988bd378a0754957d5d9471c96e0f8051645a26": {
-        "ticker": "INS",
-        "signature": "3045022100c0caf46c3d90eb09938783c710ef899aaa66dece87b146d7324036b19796649002201301e3c033224a49d30602263382b84ec4b30cc52b3a13c4ddda9be35c99c2dd",
-    },
-    "0x4e8dc2149eac3f3def36b1c281ea466338249371": {
-        "ticker": "INJ",
-        "signature": "3045022100901789cfe2edb9719c1b3297f10c15dc3b33e7778118f2c731027795bf386c7702202db85f2c221e575fd3eeebc3a55273de7d820c2f14011bfb1ec2bdea2d372ec2",
-    },
-    "0x0731d0c0d123382c163aae78a09390cad2ffc941": {
-        "ticker": "INK",
-        "signature": "304402206983aacb40522a36f072f13b807c787288b54e888630228bbfa79ef36a41763c0220654770232e2fc4b85818b6feaca846d8796472b2e4faa856c4cfe5e800233160",
-    },
-    "0xf50d05a1402d0adafa880d36050736f9f6ee7dee": {
-        "ticker": "INST",
-        "signature": "3044022046aa1646ff99298984627f196832310a2b1ab17409e4efd6a37b76fb69a520ba0220714ae7ea148e42d1796c260ac0d0d5ca882e4d8d00ce503fae0a76d422d9ee19",
-    },
-    "0x8a0e8b4b0903929f47c3ea30973940d4a9702067": {
-        "ticker": "INSUR",
-        "signature": "3045022100f924137b35434fb1acde892339b776529f5ce402acd3123dae4af507b03bb5e4022004a9bb0cf5efa1056f22245fe75c82408611ae47aff00f181483e32a8923871d",
-    },
-    "0xf88332547c680f755481bf489d890426248bb275": {
-        "ticker": "SURE",
-        "signature": "3045022100e119a9cd9064000922d03b1325707c163f25bc73b084459d93be54278ac7ac9202201bff8abc3544d581726af5cf1ecb72abe8193daf0ec63c34edbc9c12da045fad",
-    },
-    "0x8bb93979901cd159bf6763b223fbb315c31ccf7b": {
-        "ticker": "INTD",
-        "signature": "304502210085d73a0726da1dbf6d5dd8a54752672b7c89b54e99246db91232407d799980e502204b042275757bc97f95f1f738c6d26b6c53879266eab53efe012a44df416d6a10",
-    },
-    "0xd0e9c8f5fae381459cf07ec506c1d2896e8b5df6": {
-        "ticker": "IOEN",
-        "signature": "3045022100ec08da1ceaf26b27972afe8057fabb123bdc770ccb7c95b62df5f1ab0281fdb202200d922169d29e2068f89a1c2cbfaa55b879d544c5becf9e13d39a14e5e9fdf6ea",
-    },
-    "0xe64106154816a252da7728e35a0060f15d66cb34": {
-        "ticker": "INXT",
-        "signature": "3044022017c8702e4eb6de4412fe11ef9bb79b465a3a652ca9a19e8a8b9e176a5ad432a002206413dc14ad5b40e55c9dfd407e16ae768b040f15a272ce4cfb916b5d08bda2ef",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "30440220205932b1c266fc702486395d59c7336b1ad409f0fcb3a3944f6187f60cebb1e10220366649baf6144d762b45d82465b17bebb15e652c9825bccd2b975d0140fce1e5",
-    },
-    "0xde799636af0d8d65a17aaa83b66cbbe9b185eb01": {
-        "ticker": "XIV",
-        "signature": "304402202c2ed3446f1a9d10e6691bf6ab73fd2172335642b4d358fda5253229ee70d18c0220399d76cf157f660673f2abaac5daaad0953d14b2ad681ef84a79c18e883ee270",
-    },
-    "0xa610854def3988165c905a46890892a895f33fb6": {
-        "ticker": "IBA",
-        "signature": "3045022100ea8027d63a3b89467427e36f0702980d7f45af44caab3843a84f5f2dd3507df502206e389f7db5a1341eeb68a5521f8c2e7bb886123081eaeb9852ad5d3c5ff8d251",
-    },
-    "0x7619e393b0ae60f1780acd9c9baf326eea15a3f0": {
-        "ticker": "C10",
-        "signature": "3045022100ca183f573536e92593d4a4b3b5924aea362975b69abc23bb73e6c18317fce6de022056194457b28f6d879d822514243b5e89f215a35408a30fe463e06d2f06c0ad45",
-    },
-    "0xf9faaafa1b57b742d718fdbdf6bc1d5ca4d6841e": {
-        "ticker": "C20",
-        "signature": "304502210089f34e28a7a04cf029f17dece49ae418cbe37e73576779b1dfbe97fe4ffa5a5d02200cfafc70d350c0f20a82b7152ac73d2015e4c6a6c514896bf7f150328674e37a",
-    },
-    "0x0088cdeb8e93cdc56975c4527705ec5b19d195d0": {
-        "ticker": "ISG",
-        "signature": "3044022072698e40d12afd9862b6791f30f795cb7a17b192a83d66858c62861073a4b1a4022045b4f2cbd849613e499cb482f9c3b17d6ab483a4ac811ee456ab2d29b2c32eef",
-    },
-    "0xaf24765f631c8830b5528b57002241ee7eef1c14": {
-        "ticker": "IOI",
-        "signature": "3045022100b4b56281d2793b72eb9f487359252310eb41b210d99044ea28021c85328a225502207e6a63e7983f1994f64a6b0d6ae4c49a43868bf517cf66ad89357c9e36c90467",
-    },
-    "0xf6372cdb9c1d3674e83842e3800f2a62ac9f3c66": {
-        "ticker": "IOTX",
-        "signature": "30440220110a3388decbf42ab2fa309d56abeef2181140533adff9e72f9f89b27c1e7ad402202423fd328566079e9a9f78a0a040189daa275b5feb6c935032ff931428aebce7",
-    },
-    "0xff22c94ffb6bb5d1df18beb5fd1dfe7583d3b214": {
-        "ticker": "IPMB",
-        "signature": "3045022100b6f51e3d6586b6d5a4a48ebc14936ceb29650e9a93d50a78255be6bb807a1b61022007a400268b6c9f8ec2eaa2ee72a46f4e989e79ef0d87bfe0e883a811b7ab4a19",
-    },
-    "0x41084fdc569099d9e527ccf126e12d9c7c688ec3": {
-        "ticker": "IQT",
-        "signature": "3045022100d09c97eb5b7f344ad54564746b025eac32e9eb95a24eb008b185ad0b93f524fa02207060a1b1cb64159e6a6d8859eab11d5c396fa33e7e497bdba15c2a7e46777d02",
-    },
-    "0xdab35042e63e93cc8556c9bae482e5415b5ac4b1": {
-        "ticker": "IRIS",
-        "signature": "3045022100dd516829d2c59c8b375219c9b1c94d27c70f298952b6517a3446c6c44973dbfa022064b69fc0b41bfb380213689d56bc95e37ea3b42f93873fdc5ad5121c8643683c",
-    },
-    "0x4a81f8796e0c6ad4877a51c86693b0de8093f2ef": {
-        "ticker": "ICE",
-        "signature": "304402205ba575a2e5ec8428b5833ef20673f1a5b72ca974fb8d672ba24d592ca160b24602206eab86bbdb0aae8bfcbfc9d9c298e63a6e1e7831f82ffbf19575a1f8aacc6609",
-    },
-    "0xd86b5923f3ad7b585ed81b448170ae026c65ae9a": {
-        "ticker": "IRON",
-        "signature": "3045022100cdf97a354a7a3d78bd1e9f4fad24b7f795004ed8f8542d310a04ce9c511899bc022044f68b145028da1ce6f3ef32f3c89e0c1e943b24e403e410b43d134f3e2b7c06",
-    },
-    "0xaaa5b9e6c589642f98a1cda99b9d024b8407285a": {
-        "ticker": "TITAN",
-        "signature": "304502210086601ee708d443615e629b377537bb649b3c327b49faa654daccf232e2ab22cd0220357ac0f5cd3866211d0f90cf590f838cbb881929e8138fa67ed6ba68e9576b41",
-    },
-    "0x9c891326fd8b1a713974f73bb604677e1e63396d": {
-        "ticker": "ISLAMI",
-        "signature": "304402205447eb185a8df573b56cf629c8717536750270a7c00ddcb153d9bc0ce50244c902205f5d4ecedccb0d3e8bdec18e63b15aa26d5efe41044abf94ff21c2a63ff113ed",
-    },
-    "0x998013798440d44c1dd4c767bdd9580e16e46e28": {
-        "ticker": "ITSB",
-        "signature": "304402207eae8a48ae053e07ce0ac301b8147a77972af89460effdafbcfb4e70bc67e60e02201a8521daa2fc2025918ac2a9177ba21a62cb1c043511aee91eafe3b28dffd08e",
-    },
-    "0x0a3bb08b3a15a19b4de82f8acfc862606fb69a2d": {
-        "ticker": "IUSD",
-        "signature": "30450221008bb1820239fba737dae9428aa81c2b96260bbd56089f68cb58c63aadffba6b2f0220663cb22d73fc8ca053ed849d14149502bfdb758291e2c7d5232e785fda3f7b5c",
-    },
-    "0x60d01ec2d5e98ac51c8b4cf84dfcce98d527c747": {
-        "ticker": "IZI",
-        "signature": "304402204482ab4461bde7b966e2d526cf7ffff1cf2fe14d8fe66f2194036ecd2d4f43700220152b2874f2ac261c9c390bdc8a83f68b18ddd270f843cec0040b3c2c60b900b2",
-    },
-    "0x2594c5b25edab3ebe937e27650c02922d9a62bf2": {
-        "ticker": "JAMON",
-        "signature": "30450221009011b6d63f6a6d09a50aa581fe3f25589f84b7cef0163d89f302adcc714ff86f02202752c4a6a1889d734ef28f167e5bed8f5417f3722282b0f73f8fd4baedea0351",
-    },
-    "0xe292178333fc7424211795895865adac05baf3be": {
-        "ticker": "JARVIS",
-        "signature": "3045022100c43c43af14ed72e3145ba27cfd6178cecddfd410f920363053b32989934eedff02206b9430160ccb3fbb553cafc928736d5bcad4f34b1eeb6a4c891e64ea40d56d31",
-    },
-    "0x596ebe76e2db4470966ea395b0d063ac6197a8c5": {
-        "ticker": "JRT",
-        "signature": "3044022064f387e73f3549e57f3d3e491d891050bb22f3fbba60b50bccb05dd269a9dfae02200e7c59234ce6ae72b1c5495f14ae289b07eca39e28e168bf83cc2672e4559e31",
-    },
-    "0xf2f77fe7b8e66571e0fca7104c4d670bf1c8d722": {
-        "ticker": "JBRL",
-        "signature": "3045022100ddb383437aca4afe1819056e3a3859b79855d44b3a7fc4e275e487f58e3050180220474c5f3ac818eca39fdc9b1fa283335c8bbe872bb516e29a998d3e7e04a8cb14",
-    },
-    "0x767058f11800fba6a682e73a6e79ec5eb74fac8c": {
-        "ticker": "JGBP",
-        "signature": "304402205b1295f44dce2193168680525a73f45b0f7b80579d9fc659e9116aac18d5d56402206eb20e69629fd6fad947e05e440da8ce81a1814831445832149341b61e75c6a6",
-    },
-    "0x8ca194a3b22077359b5732de53373d4afc11dee3": {
-        "ticker": "JCAD",
-        "signature": "3044022013bcad79311c2f66aab3fc4f760269f8d9b3d73b505acaaa6d6330e5ff83aadb02207a746067202ccb8bfece4a97973cb53cdca0becec02200ed7bd0bc5a2060cda7",
-    },
-    "0x4e3decbb3645551b8a19f0ea1678079fcb33fb4c": {
-        "ticker": "JEUR",
-        "signature": "3044022011607ee079738049f3a5c3213ce9282960420bcf139d249ef5d34fe46a54970f02203967a87e580e152c01ab5a4145a61a33cedac08a6d97fcb3c6df3516ec5388e0",
-    },
-    "0x8343091f2499fd4b6174a46d067a920a3b851ff9": {
-        "ticker": "JJPY",
-        "signature": "30440220717e617779f18c56af408f5c56b89f2acfc3ae8d7cf5566ff025ca2996626b4902203034c099a9702992afb4dacaa9067874c6b3e7b9b78d7a7bf8e40bb3fe1986f2",
-    },
-    "0xbd1463f02f61676d53fd183c2b19282bff93d099": {
-        "ticker": "JCHF",
-        "signature": "304402204b9ecc6f90345d4476e4709992d8e35f0e19fd6e5e28f42e15597c578a0e7034022051f49901b86ab00e507b5a211edbcaff7fb460c03799e7d0840497c948c8003b",
-    },
-    "0xf6d0762c645e873e5884e69bbcb2f074e6067a70": {
-        "ticker": "JED",
-        "signature": "3044022010c2a5f4a3947dae7f9a29aa176619463f5cc74ac1ab306488b8564f65b52a74022012f48766299bc5ab3840b83bab55111524e2930298f27ba9e55b4d58c45ae1c0",
-    },
-    "0x8105f88e77a5d102099bf73db4469d3f1e3b0cd6": {
-        "ticker": "JCO",
-        "signature": "3045022100c23150c07da7ed63e2710de5340dfd91e742b1eec8875aaf533bd7f782f3e7e9022013f668a6bfed8519f672f90adbe48ddb3858f757eb088891e851cd999e76857b",
-    },
-    "0xd03f53882a6b48cd16a04feb8ac5d0d955e763c2": {
-        "ticker": "JCO_",
-        "signature": "30450221009d04133bcbd6340933d86f863e47215a6f0cb4b114eacc8f5fe11f35ed6ad20402204f741442f094d99fc89ea6c12e4cc6944f08f0536cba8f15fbf2a5afa20e3c32",
-    },
-    "0x218645f85ff27fc456ef46c3cdacbf5c40b2f9e8": {
-        "ticker": "JOY",
-        "signature": "30450221008e57e64674c67e8ac76aa1dddfbf73cfafdbbfe104f7d5afbf468a6d461a1cbd02204112df6b4006c048a83232ab4b089d5825f2ed797f29009bee6d086129ac25be",
-    },
-    "0x431d5dff03120afa4bdf332c61a6e1766ef37bdb": {
-        "ticker": "JPYC",
-        "signature": "304402203401f72b0374c0ebcce813d0bae3de19bfc648d0d42f4aa4d613c0a81235a493022074756e15b8e837879b605b2a1a0979fd5593556c8733fcc78d88fa905b1eb681",
-    },
-    "0x6ae7dfc73e0dde2aa99ac063dcf7e8a63265108c": {
-        "ticker": "JPYC",
-        "signature": "3045022100b12aba338671b281904fecb15cea061d04c216d4d1658f76efb3962472d0b668022061b9ef3ec82fe821b252556d3beb8b32c18f745080f0408305e2f7420cd25d2c",
-    },
-    "0xe313bcb77dba15f39ff0b9ceabe140cedd0953cb": {
-        "ticker": "JUGNI",
-        "signature": "304402204545d709a4910d6fc731e445256136fe376b7d729c2954fbdab3723e0930e2660220132811da8932baf0f30f51a7364154fcbaf0a98e1b39b7152eccc8bf90b23c56",
-    },
-    "0x28e96ffe75cdcc97044585b866bd02bd79c12dc0": {
-        "ticker": "JUICE",
-        "signature": "3045022100c61856d040ce042a7ac97f1fbda6bf288be54346dcfd33b61f558ee85b50a85c02201325da49c51cb24fb9d92dbb82d9be2399ee1082c0ef104b2eb90fde4de388f2",
-    },
-    "0x03cf5d93ca7c70ce0a21a09f4d70779d2c66b25a": {
-        "ticker": "JMPT",
-        "signature": "304502210093b446fc48e2a68832100741090dd222304acf3c552722adcde57abd343178080220365102602f359b90bf29824ace6816e5ddca8a60d49fe01b0858c212743d636f",
-    },
-    "0x0ba8a6ce46d369d779299dedade864318097b703": {
-        "ticker": "JUSD",
-        "signature": "30440220197b7fda1027a82e61d79a152e33049ad4c204fd21f65df7e89856fb50c25b3402203fbe08ae2ed738372c7ae3fda928cc34d85b31f2958cecfae51b29b9c3a4b0b1",
-    },
-    "0x388d819724dd6d71760a38f00dc01d310d879771": {
-        "ticker": "JM",
-        "signature": "3045022100f1d0996c18234f7f063f2d6317d36a8498ea0d6b1ebcfd0b5937f41d6c9f178f022033bf45b088d942bf66ad3530d60a9d8c3dbfb042c4171afcadaeebc5dbc4bf9f",
-    },
-    "0x5198e7cc1640049de37d1bd10b03fa5a3afda120": {
-        "ticker": "KABY",
-        "signature": "3045022100e6aa291706792210f2ef0f60829d03abae53c941c9a1721cd3b410aede21233c0220237ea58a99ec46f27bfd28e3706f37df036420303a68ae21352a943fea31c7d5",
-    },
-    "0x4550003152f12014558e5ce025707e4dd841100f": {
-        "ticker": "KZEN",
-        "signature": "3045022100d5e0f2451398050f6e3726ba1f00b0f1ecc2eba9ae4dc233a9ddf2d6d440c1ec02202ddfb423b562ec418772fd2926b2be7abfc3475bff286814bf750f6c60ff91e7",
-    },
-    "0xcfb4c7f9b5f363ae162015479345cb2f0c76f3a9": {
-        "ticker": "KLX",
-        "signature": "3044022041ae89e4bd7692ab792d475ea8da3aa0824ae5df213ce1fa0bff9d5df9c072a702207a55fb603d3ead4b4ab7a86434561d1558b01749907c571e6488e122b116a98b",
-    },
-    "0x39fc9e94caeacb435842fadedecb783589f50f5f": {
-        "ticker": "KAMPAY",
-        "signature": "3045022100a839254c4becc3b4ec40d8af51aba233cacf6ffc2cc062e5ad8e45b1af3db5180220149a99257fea0d597c9118e845f44aded72c908a128f8a80ec654b5d7b1c499a",
-    },
-    "0x17d342b29f054030a455b4191f977c3b0aa62fd9": {
-        "ticker": "KNG",
-        "signature": "304502210087f121f570c3e77fbc0a50752bbe22d24c39a1304c2ef32cc0d223b2d07d32de0220510898c30deeab90f58dd4080bdd063354d4bd2160f276038a37c4b7836773a0",
-    },
-    "0x34f380a4e3389e99c0369264453523bbe5af7fab": {
-        "ticker": "KANGAL",
-        "signature": "304402201b77cafb948e065306d06d86f935cfaa872d099644271e92e5675a0990a2a003022075daf7d92bde3c8b27ad3852f64d09eb6426d4afc9ca8a29e6341b2e944cf279",
-    },
-    "0xc27158bb8e08899d38765752f91d7d778e16ab8e": {
-        "ticker": "FXKAP",
-        "signature": "3044022001568ea3aedb1d360a5d85cedef1835abdc70dea1ebfd8a9f575530497e184f302204503f4d5a220e81904a1df5a22911a595c946fa82b0cce86850e70730d0e7ebe",
-    },
-    "0xb763f1177e9b2fb66fbe0d50372e3e2575c043e5": {
-        "ticker": "KNOT",
-        "signature": "3045022100a27ca1e0de05d62f8fdf2f72c6659308c050fa51bb1b617aec3e8ac766f8b4e7022008b2c742313009ba6f2030057ddd57dd5ec649b727ba80ebfe8e2dc4d5d727ad",
-    },
-    "0x623a1350f6b749575f92ea54d0f745f9f07d3665": {
-        "ticker": "SERUM",
-        "signature": "304402202c78f9f564553f310c828380c8181692ad4acb0ea5a8693bcb69f7508576e261022045f2c2d3e57d826d6e9f4413cbfb6b742a7e550fde46276a6b9141f7d19e8092",
-    },
-    "0xc17b109e146934d36c33e55fade9cbda791b0366": {
-        "ticker": "KRL",
-        "signature": "3044022007d27359e5a392b47f7ebd60a9741d19c9d0272f607b6cb7f6cff00a816810950220205025d3e774c634540c65cbcb4acea2ca8b24bf0bc41c900e51bf9c74490a32",
-    },
-    "0x3562ddf1f5ce2c02ef109e9d5a72e2fdb702711d": {
-        "ticker": "KAS",
-        "signature": "3044022004fadf896decd394ad1378a93e70908ddac7df653f787f100ad81b9d3429b924022044bd7b874b60579788f95d2dc3461f8c6111ee0e746a964466b32a039ad6ee51",
-    },
-    "0x235737dbb56e8517391473f7c964db31fa6ef280": {
-        "ticker": "KASTA",
-        "signature": "3045022100de98dbd09128c748cf82459c1bebdd57e86387bdf88a50f14745195bff26747c022002036319474361dbeb6af529a51e8885d95c0e95612aaedf5731a8836b2e1b48",
-    },
-    "0x42f37a1296b2981f7c3caced84c5096b2eb0c72c": {
-        "ticker": "KEEP",
-        "signature": "30440220421592d52f76c4a708667d808924c882743f4e158529f11ba66acccf012cb84a02207c34642ab8380c5c3ddaa0ccb112b35483c41c06678589e09c1e79dc54636a16",
-    },
-    "0xd1a5f2a049343fc4d5f8d478f734eba51b22375e": {
-        "ticker": "KEYFI",
-        "signature": "3045022100ec1eba662e468a029ffb04951a5ee7fc482437d62ab3b6ed41a80dc7e3600d0f02204c87a228e74b12784ee892639a81f113090b8184648a75533a01028e7d64c180",
-    },
-    "0xb7f1219db39ea0cb029e4dcc3daffdcfd233defd": {
-        "ticker": "KEYSATIN",
-        "signature": "3045022100c56b47b777622b68b7c9d0b739f2c4a85447c93a93d226ebd25e85ef7e7ea9b5022055e58d5172fa16eead9583e5046803e8c75a06430e594f988647a1e76964096e",
-    },
-    "0xb382c1cfa622795a534e5bd56fac93d59bac8b0d": {
-        "ticker": "KIRO",
-        "signature": "3045022100eec8a960de9b78a5e11467c982a6dd087aaab3296d4c7e44e5af590c822366ce02206e693d312a392ef2072ec1e7615da2aaab4f40412adf52fff866537bbcb4de59",
-    },
-    "0x700a6ebf972dc6b2dc47d3b7654526aea1462435": {
-        "ticker": "KLMN",
-        "signature": "3045022100f72e921a0055944ab9fce533380a0f1a92dd5bff1e47e91461c1ff9b6b01276f02205ac1f66bf09ad67cf5e1f93173c243f278a82f29ac46b8f205eec24968c3b479",
-    },
-    "0x4e78011ce80ee02d2c3e649fb657e45898257815": {
-        "ticker": "KLIMA",
-        "signature": "304502210087a54559eeb46b56383ffe9eb31e5cc335509b20b5c4073953fcc6997c1f138802206231cff344df06951a6a84c301b511ccc87b6270ec3f5a379e58b5d47c45da38",
-    },
-    "0x44d09156c7b4acf0c64459fbcced7613f5519918": {
-        "ticker": "KMC",
-        "signature": "304402207c705221bc7939a211fbf12c6eb1414bad1dea2500883d2c9a49d278f4a9f78802206b8246c8c4a1848baa582004c9dc0bc41ca73ce9b5c8a211106c22d3c92ae5ba",
-    },
-    "0x13748d548d95d78a3c83fe3f32604b4796cffa23": {
-        "ticker": "KOGECOIN",
-        "signature": "30440220693d5550b1f9354c4cdccf10b0230f0fd22634f2c3dcaebc6c5b319dd0184d8c022004210ada04b955b15396df6017d5dbc776b166d374d621c43a67b7cfc930dccb",
-    },
-    "0x0835cdd017ea7bc4cc187c6e0f8ea2dbe0fea0dd": {
-        "ticker": "KEN",
-        "signature": "3045022100b7b42e8c1bbd344062eb9d0e2f8a9c55988d55edfcaccdb97fca0cb9abf66874022049fffb18ebb966a349984ce0596824b42bc99661abc6451569946fb9f3abe34b",
-    },
-    "0xfd195a17e2a60d248a7148a919c5166ae907479a": {
-        "ticker": "KOLNET",
-        "signature": "3045022100ed76772e15c40c9264ed0fdfc340da78152a52b19b0aa3af03a13ae2547d97050220439a29a5f6328394a86e4af0d25fd12ff9b67e0dc2acde33866f9af7c298b3dd",
-    },
-    "0xe1240e13fda129845d17b73eae548cd690e8dec8": {
-        "ticker": "KOLO",
-        "signature": "3045022100c3454c68856ff8691331e278ab5bbfe87a263e556052924ffaf1ef54183cfb9e02207ab2ee2188f08584ee419efd758c508d1d99b5c3a458a53218fbcbf0f5b6bc05",
-    },
-    "0xc004e2318722ea2b15499d6375905d75ee5390b8": {
-        "ticker": "KOM",
-        "signature": "3045022100b24917d3aa3d7d34599ed683335c1b75e7cb7ec88994e41cb41f91be2fad9e960220334bba59f53368d880ba2cef7119cfa3b77f75371abe6dfe3060e466d3139039",
-    },
-    "0x8328e6fcec9477c28298c9f02d740dd87a1683e5": {
-        "ticker": "KPN",
-        "signature": "304402206a3682e007c841cee9c5335eedc94f17dedd339f0629bbd088ff3e45bc28162c02205f35294e89a98679fbf6a560237f26393890e434fa3a3290614e1bbc103334eb",
-    },
-    "0x7614bd00e0560ec9214e4fcb36d5ae23b3ecd3c5": {
-        "ticker": "KOOP",
-        "signature": "3045022100faf4e43dc64ecf09bf55fdabe671ea9ba102ffd7c770ddf34bf29f6a36fd97c2022016cfcc5116a53e7b5369410ef3c1d0ee33f09488f345f4c4add86d38dc478edd",
-    },
-    "0x5e6602b762f76d8bfdc7321aa0b787b1e67b187f": {
-        "ticker": "KRED",
-        "signature": "30450221008cdc3d4763b165406d655f69988ace64cf23d0864840a592d19bf816c944aea2022079cc36eff112a4d52c81417b1661aeadaa7ad06f1594e9ff415a52e3c62f7e77",
-    },
-    "0x3c5a5885f6ee4acc2597069fe3c19f49c6efba96": {
-        "ticker": "KRIDA",
-        "signature": "3045022100e9b2cdd74f570984251dc495d5997afb404c6dbc1c23d58466635d2716f0d21102206db494b442392192d24f231201fa9659b0104bd026b2a243820ba2c24efafbef",
-    },
-    "0x05089c9ebffa4f0aca269e32056b1b36b37ed71b": {
-        "ticker": "KRILL",
-        "signature": "30450221009145d9d117de32047ffd5acc07f236b67dd59529b9fe9c3adb9e3ac0233ba0300220514c59fcc843eb3d4820d374dd17d3a415c33b4f40ff192e4c6b686ad615f932",
-    },
-    "0x14af1f2f02dccb1e43402339099a05a5e363b83c": {
-        "ticker": "KROM",
-        "signature": "3045022100dbe04419174872aef67e896fa4e47fa6897fa5cc4a3d20287fed60b1880d787902206101b9320eb2abf480813ad77f8e13f3bac4fcc170ba7971eeda459712c0857f",
-    },
-    "0x6c3b2f402cd7d22ae2c319b9d2f16f57927a4a17": {
-        "ticker": "KRW",
-        "signature": "3044022034eb69199d7c2213b477f09962454f8571931789ee742d8df990a51faea9888f022064a7394a1e4cd390f01f02be32ea2b15a54ce7e2ae29b005279142a4d3054cde",
-    },
-    "0x1c954e8fe737f99f68fa1ccda3e51ebdb291948c": {
-        "ticker": "KNC",
-        "signature": "3045022100ac428da56dd621eaaaafc550ec9970ac2c8c5297af8bc7bcff068f35890121010220779cdf971ea6b145fcca46cdf8a926acbaa9ff97dd309ed5770cf769e7cdaa3d",
-    },
-    "0x946be3ecaebaa3fe2ebb73864ab555a8cfdf49fd": {
-        "ticker": "DMM_LP_2EUR_PAR_F_JRT_MIMO_NOV22",
-        "signature": "3045022100868f1e07fea4053d2cb17a1b401a8f1ab784b5923097fdd26b865c51ff687728022032097a3ccb36551e7c4c84fce11c339df96c05b38fad777a04346b183b26d423",
-    },
-    "0x181650dde0a3a457f9e82b00052184ac3feaadf3": {
-        "ticker": "DMM_LP_2EUR_PAR_F_JRT_MIMO_SEP22",
-        "signature": "30440220460bfecdb8d9d0358844fbdece6d115ba1dd4fe336c67d752ae1eb8483c53d4c022039b24683028bfe3b4f88152dab669287561f4359284cc3ac457fd5eee96016bd",
-    },
-    "0x4924b6e1207efb244433294619a5add08acb3dff": {
-        "ticker": "DMM_LP_4EUR_F_DEN_0121",
-        "signature": "3044022053e95f3a5a15e68bf87ace6017b969b96a7f2a36d419bc916e53c71bd70ce0ce02201fbc5c2f1c227705dc342100879f28ebfbb9eec9aad258ca2ea70aec50759acf",
-    },
-    "0x7d85ccf1b7cbaab68c580e14fa8c92e32704404f": {
-        "ticker": "DMM_LP_AGEURJEUR_F_AGDEN_JUL22",
-        "signature": "3044022078de3d10fb2ee5904463b7da9714280e4279439517197341d99c80875e94be0202204e3c052c1511aaeaabe1212e0a91b741bd40038c72e992a4e513548b631e30f5",
-    },
-    "0x4d44f653b885fbddf486a71508afd63071ca1a6e": {
-        "ticker": "DMM_LP_AGEURJEUR_F_JRT_ANGLE_NOV22",
-        "signature": "3045022100e739ae1eb2a531276ae9471b4635a0865a64a87b9a46134e7c176a36bd9d9bbe02203ee969165a9eb56a4b2069bc57587ae3f413e4dc231795c6bc9730bb8173b0dd",
-    },
-    "0x8c2fe36e51657385d3091e92fbacb79263867f16": {
-        "ticker": "DMM_LP_AGEURJEUR_F_JRT_ANGLE_SEP22",
-        "signature": "3045022100935b6b7f883febad2706503acb86dc06fdcc75b7074f99db90c1bad4a7b59b3e02207b315161bb8bf651ca159d7ee54a8075f6717c4bb07157239a2d0d3faf7481fb",
-    },
-    "0xf84fa79a94afb742a98edf2c7a10ef7134b684bc": {
-        "ticker": "DMM_LP_DEN_JUL22_4EUR_F",
-        "signature": "30440220353fe2c5b44971ba353bab3a7bd76f956f90a71a7b48194f5e9f6d27481a3eb802204b38048a08f0953dd5683926c4ceaa95d3d946293636cd2910f58f1ae4de237f",
-    },
-    "0xeb6f426963140471a7c1e4337877e6dbf834d2a8": {
-        "ticker": "DMM_LP_DEN_MAR22_4EUR_F",
-        "signature": "3045022100a7bd80c212d6114c5c90aaec30e260ffe2e0712a587f69317f1343bdefc6a97802202ef3cc6f5d3fe1b8544c1b067eb535dac3ab077a4ed3d802d80e4c8d5e6f194e",
-    },
-    "0x6e56300267a6dd07da0908557e02756747e1c90e": {
-        "ticker": "DMM_LP_DEN_MAY22_4EUR_F",
-        "signature": "3045022100c953a4f1c5c24bbc6a69171dd2c3eaf502c1337a953d1f283f14b860c907a08e022007f4e1089b59e7b5b054b1993a60d086c22baa7148deed8adbae840d481505be",
-    },
-    "0x32d8513edda5aef930080f15270984a043933a95": {
-        "ticker": "DMM_LP_JCAD_CADC_F_QUI_MAR22",
-        "signature": "30450221008df669c1f123bba20421de34680d4e3adbfa941b96b9b54dd972ce10d579aa02022040deda4ff725dc77c1155282e588ae29907469b2cebaae5e5ec78641f19bd83d",
-    },
-    "0x3b76f90a8ab3ea7f0ea717f34ec65d194e5e9737": {
-        "ticker": "DMM_LP_SES_FEB22_2JPY_F",
-        "signature": "3045022100a2bb23fecaf2b6d472e405f1a84e144fe415135edb8e02be9260fc251dffbca802205902b75b107e12883cae70f74feadfc95611fbad6ea16270844fd8389ed738b8",
-    },
-    "0xa0fb4487c0935f01cbf9f0274fe3cdb21a965340": {
-        "ticker": "DMM_LP_USDC_AUR_0112",
-        "signature": "3045022100b8438646a8255b310b71c9478b6f109a371ec72cb82a0d3fe7fcb5b24f89669d022045f81e796b720aba2e64422ffae83a906f911a9813a013889eaa9ff0c5e9835a",
-    },
-    "0xf40e249737c510cce832286e54cb30e60d4e4656": {
-        "ticker": "DMM_LP_USDC_AUR_APR22",
-        "signature": "30440220551903f497e08d8662ae702022f2179ac01aab86126f446c7d83a4801e5f081b02204c8887a263c30be2ab8a7a0d068a5a82e0e264129d8c39b7084195d53315dacb",
-    },
-    "0xa623aacf9eb4fc0a29515f08bdabb0d8ce385cf7": {
-        "ticker": "DMM_LP_USDC_AUR_FEB22",
-        "signature": "3045022100f4182d8012d79a317bdaee1f2ee25e2737b304fdb0fcb759c25537310b5bb68c0220737535ab32a52bc2296fa7644f228085ed13bdcf68bf973a14be5b048aabbf91",
-    },
-    "0x439e6a13a5ce7fdca2cc03bf31fb631b3f5ef157": {
-        "ticker": "DMM_LP_USDC_JCHF",
-        "signature": "3045022100d54f056b85f29c9e127ae6f1aa2e222a2c7dbb1f4cd6e9a2217bb6c6aca6da7802203b5f64859fc6b41775ef3f874d522f3f395cfb6b9d79995dbb1667175f46564f",
-    },
-    "0xa1219dbe76eecbf7571fed6b020dd9154396b70e": {
-        "ticker": "DMM_LP_USDC_JEUR",
-        "signature": "3045022100fa7e69e8182a59c17d677d94e0f9153f1ca80405d471a167d3d2433df473fb4802200546dcf77098ccc58b604220dc0ba4f41947c087ff1a4d9f12f8b7f08ef41861",
-    },
-    "0xbb2d00675b775e0f8acd590e08da081b2a36d3a6": {
-        "ticker": "DMM_LP_USDC_JGBP",
-        "signature": "3045022100d35dfd6f846b6abed65336665dafdb42a7f2144ff995026d34e0c258af6d7f41022051a9ad56832a5fccec172a3ca254826c5e1b8ac2a78477bb299de4a5d9b55cba",
-    },
-    "0x707c7f22d5e3c0234bcc53aee51420d6cdd988f9": {
-        "ticker": "DMM_LP_USDC_JRT_JUL22",
-        "signature": "3045022100d5b7197835a0b333206462702de4a60c34f8441421df16c9895b8ea91a38adf10220656726040bffe9ec0491eead46d2c54bd6083539703fe9aab7a73a55bf43a3d2",
-    },
-    "0xdaa2c66b06b62bad2e192be0a93f895c855484ee": {
-        "ticker": "DMM_LP_USDC_JRT_MAY22",
-        "signature": "304502210099425262eb55bc39388fb782401833653778838f1ea7023a91d54a31babb692502206aa2482513a30a922896fc19b3faee738d93282dbeae72c80bc3676d33bdb1f7",
-    },
-    "0x68fd822a2bda3db31fffa68089696ea4e55a9d36": {
-        "ticker": "DMM_LP_USDC_JRT_NOV22",
-        "signature": "304402207c586a79c643e1f44894e86d50fce568a8679b788822f09e3f9d960e4c850b8c022050c2045f78d1a5085b30ff7d8ec1383693a67d84226933562d97d8722aff5a61",
-    },
-    "0x2623d9a6cceb732f9e86125e107a18e7832b27e5": {
-        "ticker": "DMM_LP_USDC_JRT_SEP22",
-        "signature": "3045022100b9c717460781d316acb7d830c1ce4ca6863ff1168096f62dc520ad96f2e2bfed02207f3f666116aa40c46aab62de8c966cb16cd1bb697f77f990abc10b41b6c94291",
-    },
-    "0xf9ce68a9e41f1e7cee5fdcbef99669653aa61390": {
-        "ticker": "DMM_LP_WETH_AUR_JUL22",
-        "signature": "3045022100a24f01a1097eb0493ae44daff54b8bc3ebe1cf901860da543d049acc538238a10220283c6a52ba3f7d89017104c6ca8b1c1a69452b5bca6e81f167c7a163bbc10698",
-    },
-    "0x2c2d8a078b33bf7782a16acce2c5ba6653a90d5f": {
-        "ticker": "L3USD",
-        "signature": "30440220048e213bfee051f4b1a895a56cadc02b390a7a5fd1bc1110923360c18db4f51d022025f88b7e89733cfb10d2bde75e0f99a96fbbe44fc7e77ffa9d8acd4d8342fcc0",
-    },
-    "0x6483de4a2c76a38f288c4922fe2f507b2322ef80": {
-        "ticker": "LRS",
-        "signature": "3045022100e1e426aa2077d70afe8c534f7e11f94e29a3a6c8ee5e0a11c3a0a82c5eba4b600220668092d39b749dc31ff38ddefdc77c114d45a9a90b464b0094f119e7fa928743",
-    },
-    "0x9e7deba360c77949bb75d16dc81b2393c15005eb": {
-        "ticker": "LPOOL",
-        "signature": "30440220215b5326f5901a6105e12af79906312949c5f8b004386edb10f4cbc903ba720a02205182105c2768f6ea61e18d3731cc50daf40e1eab935f3d94cfd135fb95146eb8",
-    },
-    "0xe8a51d0dd1b4525189dda2187f90ddf0932b5482": {
-        "ticker": "LCX",
-        "signature": "3045022100b49173776bd434db9fd5be2e72f12164cf77935adf7550077fc39950124e4ab102207bfa25c2ae8022695cb92931afd61caf793693ed318750a4f6a1255bbc4130e3",
-    },
-    "0xa47150f5c615dcf4f2e47aad1862a0f2b54c3973": {
-        "ticker": "LEAP",
-        "signature": "3045022100894f09c7daf2f06b9b4648e315b46a5e27740545294c7f7f4b4dbb8cb3606af502206c74d64703a250adcedfaa3e847fd776c5bec6d577de406a2408d646e3c815c0",
-    },
-    "0x8b78927048de67b9e8c8f834359f15c3822ed871": {
-        "ticker": "LOE",
-        "signature": "304402204895c21931743d038fc623f4869cc74244a720cbeed2ef9ad04289064a956fd5022065f11941c0ecc7a13494d257150782b48432859fe4a18a61b567156b27047167",
-    },
-    "0x045a982104854b7f2caa109ac4c047cbe9ce5c3c": {
-        "ticker": "LMA1",
-        "signature": "304402202ff36ecb96d10b5529d030301dfb1df5352362f2b99074045f62d782dc293a2c02200d22ec85dc48c54a3a60c9898aa0bf61291f127c7fd1b27bd53d102b80b031d4",
-    },
-    "0x411be1e071675df40fe1c08ca760bb7aa707cedf": {
-        "ticker": "LFG",
-        "signature": "3045022100e61586c199bbca4d2e6067185520dce4677f52b707a68b9c06af15d9f1cc83d70220740877702284873ecf664f9829fab894d97e2332265e90b608cd38dae6999475",
-    },
-    "0x9b760d11f63cb80bffbcf69421cd46511e429f83": {
-        "ticker": "LFI",
-        "signature": "3043021f2da1411953fa3265d3b2f54837de87e95c05b8e1ebed3c94a8dd3e4b456a6402200f18b7a55a7791226cdeebfeaa277387507efeadbe2e85787d1dd1d5f654a3d8",
-    },
-    "0xf0f14634971c43d872d1cf1785195c0ce1000a9d": {
-        "ticker": "LIBERA",
-        "signature": "304502210097d7bf276407ece296f8c352678ffdc9af12cb540e944ba15c3be84c13390b9302205deba82e5443b2b7452994cb30afd63aeb1747e46b9078d5e6a252500e62b279",
-    },
-    "0xc3c7d422809852031b44ab29eec9f1eff2a58756": {
-        "ticker": "LDO",
-        "signature": "3045022100e4e6074edaf35a5f5ddbdcb3551ed3ac69448b197ff3024887db347fe5fd5f4e022000c9b0ad2ff8c5fbbe0c5fa1d7667a8429cefb953d9e988224aaf84e372650e3",
-    },
-    "0x110b25d2b21ee73eb401f3ae7833f7072912a0bf": {
-        "ticker": "LIF3",
-        "signature": "304402206a3cae198f34f5087f9ae7c3e5b203d1865bacd81625ed09b4e171ebb1a3bb19022046132e5e648d81eb630c3b9bf0a308378b9a0bc346400c8bd34405bc7f42a2e6",
-    },
-    "0x7fb09e55d55ccd89929e31ba77f64931087c09cb": {
-        "ticker": "LFT",
-        "signature": "3044022023f8ee1f19994d073b37bc69a19790f716e6430336db05125165cd729be3858d02202e513c4fc7d3ac824f907cace598f2161f9ae4f5624cf170043dda05d7a65cdc",
-    },
-    "0x83e7ec5550af266a83807ac508e578388fb75d96": {
-        "ticker": "LIWMATIC",
-        "signature": "304402207a5526ca5c512a54f734b1add87bf07dc94fc68d90d5ed93c3f19eefa0cf7c51022050a47ac6583433818b67f36f870b4d29d2ff50b5f6c17def81a0ef49acaec3fa",
-    },
-    "0x3bc678d6b42957cab8ba99d99d5e433cb195746e": {
-        "ticker": "LIWMATIC",
-        "signature": "30440220675e591bf956e10852e897287b18780516d0066be1c5bf6f2a5048aed946015002204053c6dda389f803cb96cde2389f2900b70e436e91c30014374cb8bc745aec43",
-    },
-    "0x3263ce926b1dc2ad55a809f70d8f4edf3fc587be": {
-        "ticker": "LIWBTC",
-        "signature": "3045022100895f9dbc42bd156478462038667405f8215075bf20b6093e9f169ab080b4cddd022054b96eeeb60a7f9f83cc222e52d53313241702120be826896b81b537308ed92e",
-    },
-    "0x15f1c3e483f35cc7c28fcdea61d968600028849e": {
-        "ticker": "LIWBTC",
-        "signature": "3045022100faacdbb9da4fbeac40a43d48d19fc088973be18894dcbc0244c1b874d7efa11802202b1bb01c12c8e001d478b88019325a89865ce61ed246afd6bcc66d82cf3e5ddc",
-    },
-    "0xb4d97bdddaec9d094b2431bba66b17f6d08d7865": {
-        "ticker": "LIAAVE",
-        "signature": "3045022100faadbd980af29aadb0990a197dfb402636b911748b2b05839166d30fc609e31f02201cdca616e16d1032173a8c7dd4e92fe9f4a6ea58212b1667e2cfe1fdf87a3ab9",
-    },
-    "0xfc0b77657fac27a0c9f2ef50c5f56615bde020c0": {
-        "ticker": "LILDO",
-        "signature": "3045022100d7d207e7c5be600d906acc8388df93578dd83c9abe65f5b452ccd93ff73f03690220555a0a995295cb61db11b0e5dd227bdf71c04dcb38d7c0ae4d20cd41afb75868",
-    },
-    "0x4ce9a5e98de01bd9b14dc9a3604159b6ecd4d94b": {
-        "ticker": "LILINK",
-        "signature": "304502210086f046a769806a73f19e2cfde5c4730cadade3c4172793d456fc06ef0b5f39e4022026def128ab55a6d5838a328735d0fafd56c9aa2215e86b7abf0944d2cb2f4981",
-    },
-    "0x593f9758ae36ed00341f2977bb7c1dc97962e209": {
-        "ticker": "LIMANA",
-        "signature": "3044022079e10116f83aba4fead42e3d222f7e9b490de276b395998586b30c604b153860022019563dd1b00601fd564af369561b2e3e57367ac9ff4ed19549e5b28732bbcd10",
-    },
-    "0xb6649b524441ae5e7d8a64ae06eafc2dde18721e": {
-        "ticker": "LIMATIC",
-        "signature": "30440220110e4b3657780763241318822d301908b656e5c372fad833960c83af010e1519022018fb602cc39bc566549412cf0c6cd0a49e20575a70900e7d0f2c5160b31bb87f",
-    },
-    "0xa35a9f45d80098db53b23dc193f841bc9b5aeebd": {
-        "ticker": "LISAND",
-        "signature": "3045022100a873dea4abdb9d969f8d42064118d19cb17c5d4aa7f3cd6081d304af6d3cd72c022035a767875e8d5beec88ab0633870db5a08345c51ffb2018bfd6598b6458dfdfb",
-    },
-    "0x6c5ad96a89b518801ecd97c30e9d79697cd9ecea": {
-        "ticker": "LIUNI",
-        "signature": "304402202071d322ed6cecd19e6264ce1b74dcf3867a6448d7352f4a371cf6656f6c7ec40220256ad21f3f9ad8bf2198ef7d454dff8d52ac293b4fdc8a17d3b63216608d8f6c",
-    },
-    "0x5ba815cd4f13138aaa8c8ee77e535d01344958f9": {
-        "ticker": "LIWBTC",
-        "signature": "3045022100d8b53dc9f12ed1d25f8311827cb21aa22ca9a565a6c8e401313592281509cd9b02207b3d7d9ac23334544cced7f165c861e9481e343354992a5bad19d51104429013",
-    },
-    "0xb450dab50c15efc6b011ec8febcf8f0af8b5bff4": {
-        "ticker": "LIWETH",
-        "signature": "3045022100b8dfc5435e1e49b379c3beb0fea7dad8567bd5da6cae99adf6ef789a1a0a56ce0220637ada112faeb470fc3e0a6d5c335e1281f53a83bdf5a9ed44e4937a79d411c2",
-    },
-    "0xe32bb5c98addc8a47cf146196d356b9a78060069": {
-        "ticker": "LIWMATIC",
-        "signature": "3045022100f5c2088257215420b021cefe4c7a08f02ab16d66a5b8645e39ae0eb50503fe9702206db339efff3fda999151c35b3113b323d0e4579d36e72ab5c329f21c07a9a98e",
-    },
-    "0x5f90da089d90389323aefafdd4ce5b5d2f6cce7e": {
-        "ticker": "LCN",
-        "signature": "3045022100b12263cb20f10c880262d57d12e0ade1098af2094ba39ebc7f7871e68c375c77022062127a305b08f35d02ea1842c0fa7b05af209fe4c0d847e6e56d897e0e89ec60",
-    },
-    "0x039d2e8f097331278bd6c1415d839310e0d5ece4": {
-        "ticker": "LINDA",
-        "signature": "30440220137124a9eee2ad51256d1ee82cacc3da05d5c83fbb22207fea57664e8e8203390220101bbc0946a9b41b43672c57b7fd1e87e0e60c7d5a09134be0d3ffb3758d8e17",
-    },
-    "0xfa68fb4628dff1028cfec22b4162fccd0d45efb6": {
-        "ticker": "MATICX",
-        "signature": "3044022035523f9be3d4bf623daa0c6d43c88af5a8f19ac0732b6d05b51649fc6ca48665022063627829489de17eb7c2d170fbd874cf2c24dfba640ec53f2f5c09647cbd8a59",
-    },
-    "0x95e376390f472fcaa21995169e11d523954b3bbb": {
-        "ticker": "TRYT",
-        "signature": "304402200de652953c5da8222197a2fe2df9d960d70f7dfc37476e3f8cdd13ca8db709e40220492d16b80158e25db0744cbdddae50da7a91c211f4eca0eb158541f78e8a7b48",
-    },
-    "0xe6e320b7bb22018d6ca1f4d8cea1365ef5d25ced": {
-        "ticker": "LIT",
-        "signature": "3045022100a4d37029bb8562a35730ce18e8f2f9acff6c52d3fb2f67dd41bfc72b97390074022053a10ad4cfba695e88596bdca5d3ce6dfed8a596546c6f3e90a531e9ca237301",
-    },
-    "0xd6d3b4254b4526c3095d8ab00b75f186c56dd72c": {
-        "ticker": "IONS",
-        "signature": "30440220435c0e4318ed303e7b678976db42a1a85c16cc59ee83c31932356855105d472f02201cf1f8ccdecc8c8a2449bf7cdbbdb7a0b8b9eba96bb7e2017ed2407e0ebbb17e",
-    },
-    "0x3962f4a0a0051dcce0be73a7e09cef5756736712": {
-        "ticker": "LPT",
-        "signature": "3045022100998fd2d3d64f163248ac84d8751d447edd362dda82ce83efd6ca7cbee8ef4e4f02205a78aff434d95ee987acb6823dd2281603141af99b287482ca8f2b04e337449d",
-    },
-    "0xcaaf554900e33ae5dbc66ae9f8adc3049b7d31db": {
-        "ticker": "LIVERETRO",
-        "signature": "304402201bb81ffa0056c2b4742544a759a6a6adf2e64b685330166f2a291c702a61225b02202d20bfa8453bc3696c5e0260e488f407a89510b2bc1d35fd5989472ada368ddf",
-    },
-    "0xd32dfefd9d00f772db460a3b542f0a736d80662f": {
-        "ticker": "LPI",
-        "signature": "3044022070996df928d7653dc10e6feca686738539f2fe444322701107402aea5753f2b702200b681c62062a81552642e3eca5419133c7dd9a318d7a9b29bbfa4d9d46995176",
-    },
-    "0xe2c1efc7322bc478285e39820aec9b79275e521c": {
-        "ticker": "LOI",
-        "signature": "304402202cefc4155e13134800b602b031e96be42425f2930c4e04422994b566fbc42aad02207cc644f3abdef9ed6ee7b73d1fe7101aca3cbd7c3a46afdcfa32bd07644c2a7c",
-    },
-    "0xeb51d9a39ad5eef215dc0bf39a8821ff804a0f01": {
-        "ticker": "LGNS",
-        "signature": "304402203c2dafa2ce26a0e9eeca06ea5cbcb1fd9f9fcc2b19a9354946c81582ff80c3d702207ac0211da0b9d95d8304891aa96dbb4d666a245f481be03c4c20455ab5e975f0",
-    },
-    "0x84e1670f61347cdaed56dcc736fb990fbb47ddc1": {
-        "ticker": "LRC",
-        "signature": "304402200d9794985a79f6bcdfbd8284811d80249ca32467f9ef66a27c0fcdff43225c88022008e2692ad59eaf726882c8505fa2cec99451060181707abd41abb30565826881",
-    },
-    "0xcebdc775e9f18156ec2e04fb4150f1bc54de690f": {
-        "ticker": "LOPES",
-        "signature": "3045022100d9c9f2f2626a1ad59fcac555c542bb1dbd5fdcc1520d84d691cd64777601e6c002201290cf86067c3e66f90a9157857a26bdacd2609ffc2b49e5a0c83e87ca438ada",
-    },
-    "0x1c0a798b5a5273a9e54028eb1524fd337b24145f": {
-        "ticker": "LOWB",
-        "signature": "30440220786f79cc391f237d8eddd70cbc9f7552504579b31a696f1993e769f3e668353502200a89c565d62f35961c999a50b58d857762644382077776fff240cd1acf06dc8d",
-    },
-    "0x245e5ddb65efea6522fa913229df1f4957fb2e21": {
-        "ticker": "EGG",
-        "signature": "304402203644629836200eb868c9cc9414c261413521718531f5e53233cbf9caeca211ee022013a87c10dba90aa251fe3c6449b052d7f2c28fec7ed00b681b1818e66961a886",
-    },
-    "0x5eab32fe1d104ce0c5436fedc3433b646096e47c": {
-        "ticker": "LSHARE",
-        "signature": "30440220544f5ceee782782ee59066f17109e593bdd694441d557957fc7f4df893c7e05602202b2b0ba87456d55c8175d51bdddddace0bf13c3a9e7dcde2511b781157e074e2",
-    },
-    "0x6749441fdc8650b5b5a854ed255c82ef361f1596": {
-        "ticker": "LUCHA",
-        "signature": "3045022100d13f3f42966231e2c3df299276152ff53508aa071a4233542ec61d9446b79c7f02202bbeb897189496d31cad222e5d55ae42f3ab33e0a05a5597c6eb717bdf60956e",
-    },
-    "0xc2a45fe7d40bcac8369371b08419ddafd3131b4a": {
-        "ticker": "LCD",
-        "signature": "30450221009891e14a21572f87168907a7ac178040698d7efcb0cbc9b95dbe8570e914860c02204e34dc51c785389dda18e942d53eff37920d25380b7b0c3a7b48507691ec65f6",
-    },
-    "0xa95b410743e8c2f7b64f1373d3ca2b3454864a94": {
-        "ticker": "SLIVER",
-        "signature": "304402205764d60f07714fb0c49ac04013453164a90074c60239403a09a421d70f5bf56902206c5a83cdcad134a95b1959c7fc98850fddee0b0eccade2568e1d65154f489d83",
-    },
-    "0x7df5638222bbe24cce39f726c3b61cc03610622a": {
-        "ticker": "LDN",
-        "signature": "3045022100cfa1d8d49fb287827c00359e2ea6894d18e42555c6a665ea8e032bbf6db503e702204297aa1ca7f718c9051dfa90f164d99ed573fec69f19130b5fd2ccd2203e9d72",
-    },
-    "0xed88227296943857409a8e0f15ad7134e70d0f73": {
-        "ticker": "LUMIII",
-        "signature": "304402202aa1d5501223db19471aaba128c68037e576b16c76b9becf59223400b027a24f02201651479e059f9f4cff2a487afe380be7baa6b08cd59a8652f7c073b48901f11f",
-    },
-    "0x9cd6746665d9557e1b9a775819625711d0693439": {
-        "ticker": "LUNA",
-        "signature": "3045022100e2fcfe144cf3cbf458d00da417c11bac74171f4cbdc50b7a9cc7166c983d201a02204968c2916cdec439e1a0aafec38119290db1ab5ff9a7a3216b8c605e3c9ab86c",
-    },
-    "0xc4bb7277a74678f053259cb1f96140347efbfd46": {
-        "ticker": "LUCHOW",
-        "signature": "3044022036f41a0642d0316314cc34bb0de479cc7aafe50f2b17dcc04e4a5268db33d2a50220329ed736ce5966b73fe7a6e54a1df471dff2116b7f270f18c34de70f926dbbeb",
-    },
-    "0x2b867a0f2c67d13f19178e2fe37a8f3769e1bea7": {
-        "ticker": "LUST",
-        "signature": "30450221008707784a2f1a8091ee9ad0db534944e918ee4fa5cd1afdc27b183b2385b0570b02206e9091ac19f12b4538aee432831c53a407b6325ae164ec159ec46940b69c72a4",
-    },
-    "0xbbfe0b60de96a189bf09079de86a2db7bf0c7883": {
-        "ticker": "LUNR",
-        "signature": "3045022100b3257abba5543880b5d182c0ae2af04f52876b119c3f861e7dff3b977fb8e44a022067a334278bf3d95849c585794bb43794d39da7568c6d28564c0baa6d03a4cedf",
-    },
-    "0x23001f892c0c82b79303edc9b9033cd190bb21c7": {
-        "ticker": "LUSD",
-        "signature": "3045022100f3a9ab8db9c2e65bc5123274c3553d4e2304b24d217d7beda0b83414ed9d0f8f022002e33d417b830b0fec66b36d4f8937eef35714cac27cb570be86a28023c45b80",
-    },
-    "0xd4945a3d0de9923035521687d4bf18cc9b0c7c2a": {
-        "ticker": "LUXY",
-        "signature": "30450221009cb97172c2878290431b168a1bae5e3f33eaa2fcba1bf263cf0f975aca497f3d02202c04942a553dc5eae44889363c61b6615bfe750591f27281854737ba68c27ef9",
-    },
-    "0x6d0c966c8a09e354df9c48b446a474ce3343d912": {
-        "ticker": "XVMC",
-        "signature": "3045022100eddbabb393f94fede1c3f0dd764f4921b089ae8fcfb3bc753d1be46da59507f0022058b822bbe5bdb52b18bcc883a75752c3f9d94148483043bfc5110776ee3afa4a",
-    },
-    "0xba25b552c8a098afdf276324c32c71fe28e0ad40": {
-        "ticker": "MCRN",
-        "signature": "30450221009fb8c581e6a0c285e2dfdc33cfcc72eb7facdca27b1d4e329a45f528b1fc293402203c557542ae2591765b9cee1ad2033b7cd7d1d1fe896fbc88cede7e0bc9ecad9d",
-    },
-    "0x859a50979fdb2a2fd8ba1adcc66977c6f6b1cd5b": {
-        "ticker": "MMO",
-        "signature": "3045022100e2c376e9dbefcd452ba78fefc230c32e9bbbc8d8c61630a4a99bd140211aa2a402203fc99fae6eb2406954aa0772cb3c955d97318bfb94d45b8e934828315513019d",
-    },
-    "0x49a0400587a7f65072c87c4910449fdcc5c47242": {
-        "ticker": "MIM",
-        "signature": "30450221009885e850d9e17eec2c7890007ecb30ede1f6fe74670d623428abd0560f0acfe702201dd07528008b40c550528686dfe1da584b16282f0684b98c688b6588b8e4312b",
-    },
-    "0x13efaa3d5e2c86e7aba168f925fef9827648cff4": {
-        "ticker": "MCT",
-        "signature": "3045022100a34f5cecc808696f23df702822216612af118e05aad7a83f34e6e92317c4f6a40220390878dcf63b861f433b5eb62d9eea18a55a7724c6680ae6f72d3ea14c084190",
-    },
-    "0xa353deb6fb81df3844d8bd614d33d040fdbb8188": {
-        "ticker": "MST",
-        "signature": "304402200530a9ae82b7124e48f766bc53a4a5b7e1618b137206f7d320e9e1f2a318c8650220054be0aee9698591b3b89224ab63f7422b9db1f17ce69707916b940dc45bfd63",
-    },
-    "0x2b70b0ddb96e2581a311deb25a1424c7167e4a53": {
-        "ticker": "MG",
-        "signature": "3045022100ed3a13c8598cff566442041547132329edc91c4d622ab026415464755e70f71902202d78b3f7f9fd19c23266b03300e32d44052e65c9c4d0e5b7fffe4309b742d28f",
-    },
-    "0x992446b88a7e62c7235bd88108f44543c1887c1f": {
-        "ticker": "MAIX",
-        "signature": "3045022100981b0b3ae56668a7e40dc6bb87da63955b6b716e50baae52cb4a72ffb7adc7d7022052e9a942ecbfe27435db6e6f632e4bd76076498e011af6a37db060e6b71babc2",
-    },
-    "0x91ca694d2b293f70fe722fba7d8a5259188959c3": {
-        "ticker": "MFT",
-        "signature": "3044022050a25d9d1399fdda062949b6c8eec25b2144e39db8aa0e8103e69da78c68b7da02202459fe33547637f812422f7f397e19fe3b363107ad64b2cd8ef9c0b540ecda90",
-    },
-    "0xc46a37fbbe433ef24bc7b9388c8728ddcf3ca87c": {
-        "ticker": "MFTU",
-        "signature": "3045022100f3587a233f7636e1d74154c279d18c29e535a0bc7bbf424deb51859a2afe2b99022022ea61b2088bc2724cf30aca4d0598ca0542842da7c8a202dfcb157535c10958",
-    },
-    "0x6f7c932e7684666c9fd1d44527765433e01ff61d": {
-        "ticker": "MKR",
-        "signature": "3044022028163f6351dc91fb1b53d02e407b7d41e7d43eebe30e9b51ba26c227ab1447f302202257ef7960134df342c1a74c06698e5f0cb2180032dad663ad17ff6b850f4588",
-    },
-    "0x1ed02954d60ba14e26c230eec40cbac55fa3aeea": {
-        "ticker": "MAKERX",
-        "signature": "3045022100d88eb834ad06ef6958e5de7d95151a2d19d05822516b7efda335760dd982832402202a1afe0933a0d38a1954ca1298b9ad32c4cbfb824b9da4771b9977f39c49fb27",
-    },
-    "0x6d830a664e6aa9aab976ab66258eecd0b5fb1dc7": {
-        "ticker": "WOOLY",
-        "signature": "30440220755dfca0eb13b20ecbf65533a5a20570d928484ca334d2f7d680c49b4ccc9ee60220428beb704c0f272a2c4309b8a701136eb09dc0846ab84ef8f87da638042fce53",
-    },
-    "0x59a32d4b86ffcce0a7f388d6d858c6a0371915ab": {
-        "ticker": "MAMAI",
-        "signature": "3045022100f460da00efaf4c30284816fd81e2231e6a1b116bfce4358ec8a562ef229477a9022068227b4184fbc8ae55065f3d0bcb9d2f92a61b9fd00dbbe00d77990cfea13055",
-    },
-    "0xc3ec80343d2bae2f8e680fdadde7c17e71e114ea": {
-        "ticker": "OM",
-        "signature": "30440220610533443b38a8a6567b13823a5e34275edf5532e0ccb28678b4571aa485428e02202f41793d82e11b5736dd936611854e6352eb08ddd5017e9b3f036e7cc66d8333",
-    },
-    "0x22f991e509102ed4c2babd82424c46bd3d203bd3": {
-        "ticker": "MNI",
-        "signature": "30450221009a9d171c5cda201bab221729a771b40c2b8be030dd8ab6e685e37d4c833bd3760220646a6330d304c0db17ee262ba6338bc26be9f8e0d18f8a2f5fdc8830bea298fb",
-    },
-    "0x34ad6a664b4112a9c6bac7b54b4094a05e3ff775": {
-        "ticker": "MCOIN",
-        "signature": "304402205f53561a9ac9882cef57a372be636e96781042a6d619e13918db8f5243b1249302200dc8e66d19af5799c50d94ee19f70f642b47de670e75de4fc1af366947add546",
-    },
-    "0x73580a2416a57f1c4b6391dba688a9e4f7dbece0": {
-        "ticker": "POND",
-        "signature": "30450221009f09ff2b458405be622481bc389a31906218473270a91c855103294b705e855d02204eebc0115274f969e0890fb3f6ea239a04af5e9a5ab4cb4545cb514c0910ee2a",
-    },
-    "0x411bc96881a62572ff33c9d8ce60df99e3d96cd8": {
-        "ticker": "MRST",
-        "signature": "304502210090052ba5c2d905d9b61937247d867f57cc36f6c3c417691b1abc33e7fbcfc1fe022030b4803ca8ec25a753e928250d96943b84ac6aee4a5adf3c490c1bb0e1e24926",
-    },
-    "0xd281af594cbb99e8469f3591d57a0c72eb725bdb": {
-        "ticker": "MNFT",
-        "signature": "304402204ffd7eaff719bce9d3f937e5267c1a89fb6775fc82dc30a9161b50f2ccd3b77b02202f09e5343b2ba92ba290e6033024275814f43fffd18d376af85c390ee58ca93c",
-    },
-    "0x2b9e7ccdf0f4e5b24757c1e1a80e311e34cb10c7": {
-        "ticker": "MASK",
-        "signature": "304402201610449bb6144e5fa5a0dff8a3937546c63f5425c3183040bc3af91d241fb10d022050f2e11ab90ba3355081db37e2e1391eb670458095a5f960a498746239bc887e",
-    },
-    "0xee9a352f6aac4af1a5b9f467f6a93e0ffbe9dd35": {
-        "ticker": "MASQ",
-        "signature": "3045022100cd3cf2e7ba4045be8fc0a6556e2f3b5faffa923f6bc06a7ff04de40c350d0972022012be922f40802227e82b9c5883789bd68a440b7f3faa117951b083b21c03b617",
-    },
-    "0xf287d97b6345bad3d88856b26fb7c0ab3f2c7976": {
-        "ticker": "MATIC2X-FLI-P",
-        "signature": "30450221008a0cacc203469e07ae7644f18624eb66f28e3aa4cef7c56bc7eae0894a8a1023022060b80a67c0ae88b963ff333402cf722ce2bea7d66c6116d54cc4b823126f79bf",
-    },
-    "0x823cd4264c1b951c9209ad0deaea9988fe8429bf": {
-        "ticker": "MAAAVE",
-        "signature": "3045022100ddb9b3abfa0454a5af320587eb0ff2b5aac33342256f2adc2121e5f73bc7e45002206667673b59a392f11a1824726f317a6bc345c9b1d26372fa5d7ccb572e7e065e",
-    },
-    "0x9719d867a500ef117cc201206b8ab51e794d3f82": {
-        "ticker": "MAUSDC",
-        "signature": "30450221009485660477820f0c20fe0152f8697419d74b86ae006571da3a82b92df08a771502201d43918816b858ca2afd797634b4061c5fea30d7689cec8aa37df8701ce782d5",
-    },
-    "0x0000000000000000000000000000000000001010": {
-        "ticker": "MATIC",
-        "signature": "304402204809d6569de46f25f6b7804cd5758e04bae97c4f3e296b58fa5b313fc8d7c5e6022060bcffefd8c6353be414945c11db390750e5e43b1f8ba5f2dfcc50764d1a7efe",
-    },
-    "0x211f4e76fcb811ed2b310a232a24b3445d95e3bc": {
-        "ticker": "MATRIX",
-        "signature": "3045022100e81d3cd730d857f4ac066c9e973670630ca6eb25913ca867118fb0e92293fa45022015cc5aa8abd84e0182781705edae90b632cc23e058744846ee7edcda8cb64d4d",
-    },
-    "0x6d9c0b104e5af90a6d11a13eb77288e533333301": {
-        "ticker": "MAXX",
-        "signature": "304402203711dd17cffa7e290a9a796bf800df8a559515484f99914847aa05422fffbbed022056afc23c523ade05351e2f6b5c5761459ae3c069abbf48f1cfbeacdb0cb2d8dc",
-    },
-    "0xee7666aacaefaa6efeef62ea40176d3eb21953b9": {
-        "ticker": "MCHC",
-        "signature": "304402201de664988c7cbab352a84653a8b54618be5e7ec98dc0e0712144a98572164897022021040354b42b1d7b99b8fe407e908cbb85c0fbca2c0e5a7211d2af01fbca09bf",
-    },
-    "0x4867b60ad7c6adc98653f661f1aea31740986ba5": {
-        "ticker": "MEAN",
-        "signature": "30450221009f0495190fdb1ead50f835df598561dc2cb1516be00a83b74a69d65bc02ad8f502200310b9687c81247dd11affa1a82de4f311354e410545314c1045ff9feed76f9c",
-    },
-    "0xacd4e2d936be9b16c01848a3742a34b3d5a5bdfa": {
-        "ticker": "$MECHA",
-        "signature": "30440220780460c78db5437c1389a7876eb840c8cd19dc2fb96f106bac800015748d552002205b0232e5d47140fa4beea2d4fcd73e484d8baa41864c4c281393ef986ae088c8",
-    },
-    "0xab9cb20a28f97e189ca0b666b8087803ad636b3c": {
-        "ticker": "MDUS",
-        "signature": "304402202a400b5ed71d16cef03da7239801d1efe23c4518d6e0f44d51435be0253dd93f022053e633db5f3cd429fbb7bf85553322b505f1a295df1c1d025baae87dbea43865",
-    },
-    "0xcb64cdeb45def1c513fd890e7e76a865bae46060": {
-        "ticker": "FAKT",
-        "signature": "3044022025453da30f03653f77cfdff264ec2b59effba171d5760daed6b919fc19993004022023ef0d49eebc8fe1c3db844a9c37d643931669a778ef4b15c4fddcb538f44397",
-    },
-    "0xeb7eab87837f4dad1bb80856db9e4506fc441f3d": {
-        "ticker": "MEE",
-        "signature": "304402207951e1030938075b8521ee9e100314b2db7dc4af3f8c4e2be5df91ba74290c91022044cfdd4f26b640552c2a0b7c8b7df850e60f69cf5053004d1d8d5d0130d4244b",
-    },
-    "0x64afdf9e28946419e325d801fb3053d8b8ffdc23": {
-        "ticker": "MEEB",
-        "signature": "3044022042f6e64de639de5f8aac0c7bbf01bb96adecb63606afe5cc8c492f0d1ac3b97702205e9978680b5fd00682dee802f3b005f30c9dd4dd9a82f2edcb6a60e1f6deecf5",
-    },
-    "0x6aca77cf3bab0c4e8210a09b57b07854a995289a": {
-        "ticker": "MEED",
-        "signature": "30450221009d947c8847aa2d5974c4922b5f36224099481c01038436e5b46bebd71bbe6dac02205807027184482e5ead68ee5403aded7c19fc3688b5014dae9dc6676a6c677f2d",
-    },
-    "0xa9f37d84c856fda3812ad0519dad44fa0a3fe207": {
-        "ticker": "MLN",
-        "signature": "3045022100dc5d4dfc60e10e012542f3e02f59b770e70ac6a72fc0975fc064b66b7d603e720220237ca63699ebdff3923bdfcce94a4126d2d09525b5113bb288c26baa5e9bd38d",
-    },
-    "0x42dbbd5ae373fea2fc320f62d44c058522bb3758": {
-        "ticker": "MEM",
-        "signature": "30450221009a46bead53f75aa63fc200329dcf86c45299c90fb0db57600838748ba27a0f74022056107563afd68515b1fa5e7692dde992a035a8f3e6cd391605b6dde4812b3713",
-    },
-    "0x4df071fb2d145be595b767f997c91818694a6ce1": {
-        "ticker": "MRCH",
-        "signature": "304402204dcec4e4b0d9eafb96ed74557444ddd7c2fae67143c242101f1375fc8479c3d002201f5e8fb30e808ff874c3a80a94dd9a15e0352893e8189445a4b08bd3648b5f54",
-    },
-    "0x5b1e475933c802117212ce2a4240a4e7999a52a2": {
-        "ticker": "MSLP",
-        "signature": "3045022100fb1922c59fb0b5c477973c6323bdfb78395dbbf3ee9e18b3e838fcdc0fc029370220153371b7a750ca3f38a571d9296c125fbece3f0674b295a1d6b4f93e0dda0282",
-    },
-    "0x6fc01d72960af0de3dd97d544fe785b751d752e2": {
-        "ticker": "MSLP",
-        "signature": "304402200e91505917237857785d6849655f27f5da160e52e3b743ca03b25c13b66119da022014b6729149c4c9816439589f775a1ab412efc7d09fef0c5dd213e77abcd062b1",
-    },
-    "0x111d7a73b40aa5ee52bf651e8f07aa26f8e9efe8": {
-        "ticker": "MSLP",
-        "signature": "3045022100a0b50aaf1a5ad933550ced0337c2b682fad229a2879ed0c15a09cf6eb6ca913602204a6e46896288f5f230d4563fe5c20cd9ab228b37210c5d99cb058c619c35110c",
-    },
-    "0x58a7aac84560f994d191e78aeb690855eb2d5b88": {
-        "ticker": "MSLP",
-        "signature": "3045022100c5ab69f07c1eeba59d0ffd74863caedb45cfa9e59eda7deaaf412c208324e4560220718b85df63b8bbafb5c2d1bbd00bbc7238222cc810340870e941729d754010e6",
-    },
-    "0x07a7ab21b582058b71d2aee1b1719926e3451adf": {
-        "ticker": "MSLP",
-        "signature": "3045022100d376e7f7b64f5673a440c2d0b90001caa87b2982c43e660bbcdff2e231f39a0402205d3af558da288277c202748f7d3dd5215ebc3e95d084cb349cc600b25a9d195e",
-    },
-    "0x6ffe747579ed4e807dec9b40dba18d15226c32dc": {
-        "ticker": "MSLP",
-        "signature": "3045022100f6bb28144ea2f0ca05d18797ada554758f624ec0c34ce851801b4ebaa16ae5f2022040c0184ac44aee9391f26904c4809b43ec32990e73a01a57ab4db5e911995871",
-    },
-    "0x24af68ff6e3501eaf8b52a9f7935225e524fe617": {
-        "ticker": "MSLP",
-        "signature": "3045022100d6814162d8e5154b50f3c56dc461923c8f34b4a0b8c92d9f970ec29e30e48f1f02204b6dd80d249af77363c24881e4dbe583b444bf184db25bd9f25adc3a56b08c1d",
-    },
-    "0x82362ec182db3cf7829014bc61e9be8a2e82868a": {
-        "ticker": "MESH",
-        "signature": "304402207cbebf659ec798f30e3bbff05d497db2515d23b1ec919bd30c7eea377309b0b702207ca6b069d78da4b277bc2613b7a07c673ab3ef82a4c325e9d201b4e448b4fb31",
-    },
-    "0xf501dd45a1198c2e1b5aef5314a68b9006d842e0": {
-        "ticker": "MTA",
-        "signature": "304402200deefaa443552d4634507754bf388eab461a5be5489fcaac40795ada4bfc366702203b2fbb7076432cbdaff88002e616f80de97841426b9a3cf824fe2bf57035c7db",
-    },
-    "0x58d70ef99a1d22e1a8f8f0e8f27c1babcf8464f3": {
-        "ticker": "MTS",
-        "signature": "3045022100ea4393c5967fd41da5ce33a8ebfeb61f3f688200ca66725672a71c15f529c75602205c1d2ca86419d1f67807a34b5de6443b91a20cfc6c4b65339f4c70b8e071f22e",
-    },
-    "0x65ad509db5924ef0001d977590985f965ef1aaaa": {
-        "ticker": "FXMETOD",
-        "signature": "3045022100c448844c6cb428942b2509e04277f0602d0c7adec86a4e0e33196b126695615602201ed12274f49a150372477249755e991913d1dcfe98c20724666cea66800f7ff2",
-    },
-    "0x0c1eb50007974c4e017a6eccf751110bac287ebb": {
-        "ticker": "MTBL",
-        "signature": "3045022100a65f6310c0826da4f3c77176f3ec511513ca91dc8f24eb3acd01c1e2ba6b9ef5022057aae5b7efdcdaa3ae88d510f7e48f3e559675986970bbebd1090acd9ea84906",
-    },
-    "0x94b959c93761835f634b8d6e655070c58e2caa12": {
-        "ticker": "MEN",
-        "signature": "304402202b72753992aadf3dee58258ce98935bbde0dd54a58f7dd797d8b39a00f21c96c022007e0121714b29efd5270b759c399b7cc62144c65e35176b53c9a3f86b14db7fa",
-    },
-    "0x200c234721b5e549c3693ccc93cf191f90dc2af9": {
-        "ticker": "METAL",
-        "signature": "304402200c876e0c2bbf4bed089c3bd0e095181a7ad4a05e676cfc2164bfc8229cfed45802207faf44f3619d4bf03310e17e30698315fdbb018d938c3572d4081af8aa2a43ba",
-    },
-    "0xfd290dab8ec58fb7e9c7ce6e36b9a5a1a90ec164": {
-        "ticker": "PVP",
-        "signature": "304402207add3d615144e07f1d1c883b6df2ddcdae11b75b6169ba525ecb8babb7a909f102203faafe5f6c7f0a898bb3a309391ce86c8a2ac08de846feba9a509cec58657ac6",
-    },
-    "0xadbe0eac80f955363f4ff47b0f70189093908c04": {
-        "ticker": "XMT",
-        "signature": "304402205db4a3e9bece2ef3e694204f2b2aff5e3a1acc71ff1b576c2f40245861ff0c6202205f74b8cb70ff77801385f701c6f4ddaeb1712aae4b7fdee223d673599f9653a9",
-    },
-    "0x61f95bd637e3034133335c1baa0148e518d438ad": {
-        "ticker": "MHUNT",
-        "signature": "3045022100ebacaf5977f00a82f52e1e29c8f0edc98639023cf477710d9efdd4071473bca902202e8bb4d667e23ac5eb97b3c06d9380de858400f03136fa71d7dd7b6f0ee562d9",
-    },
-    "0xe8377a076adabb3f9838afb77bee96eac101ffb1": {
-        "ticker": "MSU",
-        "signature": "3045022100990d51c1e5b1388416a853c160256964f6dc387407b8fdfa8cab9d5c4cd3c7dd02201746229c5a6607e5f03e1b11188d4a79612197bfa842cc614081b54905c9a9d9",
-    },
-    "0x05059b925e1396a78f7375a74bc81085b0694436": {
-        "ticker": "MTFI",
-        "signature": "304502210088fe8a28c1c057a4c287fc02e823b1356f814543d0d78033ee2a0743533776b6022032cc9a5cc910ba54841151d12ff8d1ffbed6de9db6084b06adab2f633b239c2b",
-    },
-    "0x40d9fc77027a281d85de1fa660c887e645ae26c3": {
-        "ticker": "TRC",
-        "signature": "3045022100fb0bdbafb9956dfcb3ca0bd73e47bb0cbc84a3f73daed9c94543296992eb279a0220342feebb1246635ff651e854ed446c55e7c41d699db64e04672c0df037928cc5",
-    },
-    "0x9627a3d6872be48410fcece9b1ddd344bf08c53e": {
-        "ticker": "ACE",
-        "signature": "304402200639dd2d8e4bbec56f1be8543871706be7c828f41c3ca8fe5e4f9a65629c339602202c941ee84ec141a50658e5c9d396a8ff454e9638c8cdcd6d2706a3da78547539",
-    },
-    "0x2760e46d9bb43dafcbecaad1f64b93207f9f0ed7": {
-        "ticker": "MVX",
-        "signature": "304402204b125c302f288332c20209f698aeb4faf28534d15a1b359b6fb396fae29d932c02205af568e4c9f1426a95c683625fbb00b0da4201fda4300bcbc8ee986a900450c3",
-    },
-    "0xfe712251173a2cd5f5be2b46bb528328ea3565e1": {
-        "ticker": "MVI",
-        "signature": "30440220542c66ae5d89e71f53d7bf85b47651947dca243f56153804cee0d3a06eab7398022040b0bca5debb473b88a0019724e10a259d18c66246eaa86d83d02747419ac03b",
-    },
-    "0xa3c322ad15218fbfaed26ba7f616249f7705d945": {
-        "ticker": "MV",
-        "signature": "30440220783a7039e18ee82a7da13aa8e61f97c282d2bfa96ef437ebb9c5eff44d6931bd022059d4b05834ebaed54af1eec9be95a4985e547ce51639852811fd533c98b119e0",
-    },
-    "0x1599fe55cda767b1f631ee7d414b41f5d6de393d": {
-        "ticker": "MILK",
-        "signature": "30450221009c142bc4275461d6fce5a110aec89d446c53253e9f4b7a1431f7b1ac33e66c450220358333f0bf13b021035e721fc422973a2ac86559e4708d0d1d6bea918a3c6d43",
-    },
-    "0xd0ac5be680bfbc0f1958413f4201f91934f61bea": {
-        "ticker": "MILO",
-        "signature": "3045022100c37a4a3d73a1d115be417243d9669b38fa346cf4120b5e1a991dd28902d10d800220177058886931712d1a98c0afaa60b61ac1b6e4cf83135e1c9a6b8152135b939a",
-    },
-    "0xa3fa99a148fa48d14ed51d610c367c61876997f1": {
-        "ticker": "MIMATIC",
-        "signature": "3045022100e90762884ff53d623b79c5bafc7b6ef9b15dbce9a0b2a6cb9606ef41d8c9f967022030aad9cd5db83ed7ab378fcfae58b462c52c147b0cc432304fb822e4edf0cef2",
-    },
-    "0xd1790c5435b9fb7c9444c749cefe53d40d751eac": {
-        "ticker": "MIMIR",
-        "signature": "3045022100c1c6686770026eefacbc9da183caed61c4ebaee4d7604273bc8f68ac35c618d0022010f460f6f7865a37b08f080060543eec32e0c358d8cd4e9e7e5fec10b965e1ff",
-    },
-    "0xadac33f543267c4d59a8c299cf804c303bc3e4ac": {
-        "ticker": "MIMO",
-        "signature": "304402201b8c078e15a01bc7116c1853d0a16dc21c6a765a29069d78a4ea7ecc3cc5a78402205e68645b2b0a75f248be184fd319f04050125498eca6f3b22c2b2a9994dea319",
-    },
-    "0x4c9f66b2806538cf00ef596e09fb05bcb0d17dc8": {
-        "ticker": "MNTO",
-        "signature": "304402202d8dd39cc0ef07a19999d400bc71d464cd4500158ccc414f78cc6af022a92b54022073514bf2ad7027cfcd6856afd6c0ac98be5610a42b7f1b4c160beee52773f3de",
-    },
-    "0x291aa47c58558adfc2bcd6f060578fdae1f6570c": {
-        "ticker": "MBASE2.0",
-        "signature": "3044022013a335d39e51a567fa463f9025a6dd591da837b76997d7dba81276b02adc78f602207bd292de0088c81000fcddad5b87513147e6c77da788a78f078160060fc88f4e",
-    },
-    "0xc0b2983a17573660053beeed6fdb1053107cf387": {
-        "ticker": "MIVA",
-        "signature": "3044022071b0583dd5d9fdbcc8e1fb0d360ac1e17b0107d0085a2da92de15df593b69ef502203b4bcaca643a1b1195920f724e66e8b323b0210393ccaa5b80dc906c709da8fd",
-    },
-    "0xfbe59ebf7a188045c87c4a65093ed1e50520408b": {
-        "ticker": "MINNA",
-        "signature": "30450221009165667f92e26c63ddc25ec8d526025c755e8ee24dfbacdf26c6588eaefb4dda02200dec2372251969f1a65ce1b6e7cb599b67d8331a232ff84ff5aaa9b28a8a07fa",
-    },
-    "0x87d6f8edeccbcca766d2880d19b2c3777d322c22": {
-        "ticker": "MPT",
-        "signature": "3045022100c3a3c24be10b662b5aca644b0ac3f5bd6ed41fde7cb6477051e3f08e5a0cfabc02205105122e8d0b5c8e27bd4c78cfc09ae352cba2ea17f19612fffe84ab83a0da05",
-    },
-    "0xf689e85988d3a7921e852867ce49f53388985e6d": {
-        "ticker": "MOFI",
-        "signature": "304502210090dcefa618af809e5bee4d342d57d500b3d9c5d9eaca50a7c9751bf1eb1fd4590220600cccf5057a34e9aee357a1c9ce2c270b04c265a595fc78af40b8f2d5aa3e3b",
-    },
-    "0x2db0db271a10661e7090b6758350e18f6798a49d": {
-        "ticker": "MOT",
-        "signature": "3044022041760ebdf018e13ef6ac618bbd1ab7613b882ab868053e1156832a8c463dcae002203880eb30b8628ddd1f96bfa79f4cd8ba35bfd36f154a1ba735eb7109f889165f",
-    },
-    "0xe3ab61371ecc88534c522922a026f2296116c109": {
-        "ticker": "MOMA",
-        "signature": "304402204465517e72e94156e68ea4f29b0469f59a039d0909663b1a8b03cec26bf16b9d02207047977ffbb643615cf4244fe5dabc1d1ee09d2ae7316ce81a5105bacc2d6946",
-    },
-    "0x5e430f88d1be82eb3ef92b6ff06125168fd5dcf2": {
-        "ticker": "MODA",
-        "signature": "304402200793304b8cece15b799d57467d5b373727cbfe57420402d0086b8153e0f71840022073b5970ec782c9e3091a4e751cb8f0d2511c25a038273743f8d19e9064cfb638",
-    },
-    "0x8346ab8d5ea7a9db0209aed2d1806afa0e2c4c21": {
-        "ticker": "MOD",
-        "signature": "3044022070ad0b39743c18ef57e8ab39d13e736157eb61486bc698ade8c5b8349c1d8b1302204c956b737796cf5cab03a6040b36251608cf5d8bc688731f1d272472270db356",
-    },
-    "0x6968105460f67c3bf751be7c15f92f5286fd0ce5": {
-        "ticker": "MONA",
-        "signature": "3045022100b2b6db53cfaa3442a9dd3398c87cfea9ef4716460bc032b4185cd3eb795551aa022022e8e422313cd165bfbed4b9228ad46142c64a70629d82deb85ae07b40087e68",
-    },
-    "0x18ec0a6e18e5bc3784fdd3a3634b31245ab704f6": {
-        "ticker": "EURE",
-        "signature": "3045022100e38e0e85bef4210ff14ee5d6f8de2dc7bd090448ef06064b65f3234706fa53a402206c7774d495bc8243c9a6d5ce9468622210f0b786554fd1da07e8c9331e719aec",
-    },
-    "0x5d089336f95e649e491c054279d64a86565e8b25": {
-        "ticker": "MLD",
-        "signature": "3045022100f8386b118c2505fa11d06e29fee82b7a9a8d2ac9c8fe6b40bcc2067e16bd9edf02204a6b7557a6acce1e885643d4d811969f01ee50d538fc63490546c73eac08bb49",
-    },
-    "0xa25610a77077390a75ad9072a084c5fbc7d43a0d": {
-        "ticker": "MCASH",
-        "signature": "304402203fdbfec08cb7c9268d3f8b2390128756c7c07df49f168284b2a101c545293890022077102672f26a8ff20940d08610c36573bc7d98c5148e32b19074140ded4f4689",
-    },
-    "0x5a0801bad20b6c62d86c566ca90688a6b9ea1d3f": {
-        "ticker": "MOOCATC3",
-        "signature": "3045022100ae2f3f7c9dfc8aee7d0eaf26c4580a2f1188ebe2fb75baa6b861fdcfdaac293702205a05afd4dbb215c320eda804ffd970d6f2a9c79396e0146b44a00650933e86ca",
-    },
-    "0xe0570ddfca69e5e90d83ea04bb33824d3bbe6a85": {
-        "ticker": "MCSTM-M",
-        "signature": "3045022100deac1b66ad25a31c49de0ca1c7280d4c4151cd8d3fb9866d970699b0762316dc02204b111513d50623bc8d855d4729485d26a0b495dccd28071e13fc9be031ee7725",
-    },
-    "0xebe0c8d842aa5a57d7bef8e524deaba676f91cd1": {
-        "ticker": "MOOMUCMIM",
-        "signature": "304402206d26c619af09933e14dd9179701ec32b4d8b55e5f007838234ce47cad3a7ae14022067f9206859d50230746147649ef4d0f9db7d682fcea27e283f88fac1f0de4f40",
-    },
-    "0x7e4c577ca35913af564ee2a24d882a4946ec492b": {
-        "ticker": "MOONED",
-        "signature": "3045022100f56a942816b3389190a7911aaa1b4d84703cf01e958e880312145b219fab0bef022004acdb19dc2a8fe3e7c9e0cc5d13251b853cd18802a33faf2bdb6f647ec04c06",
-    },
-    "0x2ebd50ae084e71eed419cb6c620b3bbd3927bf7e": {
-        "ticker": "AAA",
-        "signature": "304402203ec67e804d2c7eeb96a2db33c2826ff422e5ecd45ff92e00dcf4749c279d521a022058e89d2123bf14ac1ecf925c27f3c3495aedab24667105173d0f44e46b9a05b5",
-    },
-    "0x8f18dc399594b451eda8c5da02d0563c0b2d0f16": {
-        "ticker": "WOLF",
-        "signature": "304402207219cde47ae2f296ba82fa38d0170c7a28002339e39e362138c4acd5d8c53c46022016ceebddc7101938b8ac86f21b16cc2366f95c5a50b2b79e98f896a75e30b2fe",
-    },
-    "0xdb6dae4b87be1289715c08385a6fc1a3d970b09d": {
-        "ticker": "MOOVE",
-        "signature": "304402205adc0f08f5512e8101cd962509c598631912c38717dfdb4cb4ae140e555ac7f602202cb82918b306042917a68c712c01d0ff6555e9e8d2f368fb781d755456a19ff6",
-    },
-    "0x280053c54006a624c26989cb8354fa4cb86f14d1": {
-        "ticker": "MIND",
-        "signature": "3044022054a07ad49629abdd303c2ddd48bd62b1b014ae87aab29902782396288996db9a022048e3a54291132b14c1e5ecee42d1e38ce6029d6efc2c658421d388502a37da26",
-    },
-    "0x31042a4e66eda0d12143ffc8cc1552d611da4cba": {
-        "ticker": "MITX",
-        "signature": "3044022075905edf265304ea13c968767a069907b896c73de929f3a3b467d5a65ff33f8202205ec5e4f9562b1fe508493b5c33715d70a9617d7e9c10fef1bd27abb11c9df092",
-    },
-    "0x3c59798620e5fec0ae6df1a19c6454094572ab92": {
-        "ticker": "MNW",
-        "signature": "3044022034ce65b9942ca48a54cee1531669961c1d5c61ef4108129d78b53f1b35a3a44402206848ce51bcd639f7c47d4865147554125a15aed7bec4cf964f69a0afae5601f1",
-    },
-    "0x476718ea98525f6eeba3689b321e709522ae0930": {
-        "ticker": "MS",
-        "signature": "304402206e1afd0ca8fc7c599cb700542d51c8edb7701ac9a8922b0c83b136ae86f55819022072bc3303f131db38f69c3fee2300ed769c1cfc513facac81f88a6490e16bc37a",
-    },
-    "0x59d9356e565ab3a36dd77763fc0d87feaf85508c": {
-        "ticker": "USDM",
-        "signature": "3044022040706d43d4d29f4b2b586a078273de984d0b652e3ef3ac3144abf6d9db33fb9f0220518d9ca93cee5d77c096df9f994194c1646641bb152f474c9cfbadbb0d70edc1",
-    },
-    "0x521cddc0cba84f14c69c1e99249f781aa73ee0bc": {
-        "ticker": "MOVE",
-        "signature": "3045022100c481954a8735c5670354f4355213d85f4145739fdb5084ee33ec448bbedfc634022012023de7dcfe7f37fcad39506ec865738bae14a12c15d31b0241250c42ceec3e",
-    },
-    "0x6a8ec2d9bfbdd20a7f5a4e89d640f7e7ceba4499": {
-        "ticker": "MSQ",
-        "signature": "304402210086e0525526f2b420dd2350b5d54145049eceacf7a5c0dea941a8701f646bd5d9021f356796006d00943f6f99a0f96e48cd95db7376a706fe0ffbc7e4af577be6ba",
-    },
-    "0xd3d63fc4800d5ea7c609589b44d3953313570a0b": {
-        "ticker": "MSQX",
-        "signature": "3045022100cbe6a6ecd45b535cd490c6e9a10b1ca0a9af3b2647245a267be0261b80d58d65022074fd28af1c5853ca153db453f2d14c3a4ca147f1c92c6d60ca9f5e6d55fcd51d",
-    },
-    "0x0da6a7a0a2e7525950204bb2c511e47a52235b17": {
-        "ticker": "MT",
-        "signature": "3045022100c510d5f9cf33c4a6289673b0ad5fa158fb8879d42690e4acdf939de5cbe9c206022004692e829929717074da6f17e95efb199aa5d560af0d762ceff368aa597399fe",
-    },
-    "0xb1a91036e4a3c144efed953e0b6cc5f6b98ad256": {
-        "ticker": "MUBI",
-        "signature": "30440220592ad0c756d4ad9a81760b9ca7de46b235f55176cec01747620ebb1fa22e95d202206547dba3009a1e047c178728a95054dd5f1557dcc28ca322e3a0bdde4049b14a",
-    },
-    "0x9fb9a33956351cf4fa040f65a13b835a3c8764e3": {
-        "ticker": "MULTI",
-        "signature": "3045022100fc6a7d644ee40738daa01c8a396ae684f1dfa85c17024eea231ce35fe08259530220063fa4adc8eebdd16fef583b6311e68db4ab3ab2647d1f451608ec14be3078ce",
-    },
-    "0xf5b9b4a0534cf508ab9953c64c5310dfa0b303a1": {
-        "ticker": "MULTIBTC",
-        "signature": "3045022100a07f51665bde91e9e30d8a84970849538a5093067fffe8a3aeaa8418da51d18f02205efd2afa8c5a95ad150d9fc8b1c2d3cc8b41577cbbdee99bed4f18204fa85d66",
-    },
-    "0xe840b73e5287865eec17d250bfb1536704b43b21": {
-        "ticker": "MSUSD",
-        "signature": "3045022100f095a9526e3e6258d3f61f8b66e154ed38d48fefb969e30d49968ee55850deff02201718a4a55d0eb04fb1ae92e82771ff8ad2f381a18576c03690517b89c183dcf5",
-    },
-    "0xce899f26928a2b21c6a2fddd393ef37c61dba918": {
-        "ticker": "MOCA",
-        "signature": "30450221008a8cfa453fa8393c6b59bc481250561edc82b40b610587f266b496e087dbbdd4022042f86504cefd402469364088a8026f8ced40d8131e9013923e9fede6e72c7934",
-    },
-    "0x9c78ee466d6cb57a4d01fd887d2b5dfb2d46288f": {
-        "ticker": "MUST",
-        "signature": "3045022100ac9c06f26defad4d40a394ef6d40bb04246470f97cb02e069e69e0578e8fc65c022035a364b95a03399ac31777075e90419058addb3a09eb0d592833ccf2ebf0fbd0",
-    },
-    "0x1379e8886a944d2d9d440b3d88df536aea08d9f3": {
-        "ticker": "MYST",
-        "signature": "3045022100b3c724140250803ab3294d03eef28097363b46446913a382990608994b7f6df40220255f5f5b4c23cbe16f8d32a28f5cae94c2f4e81eb0372e87bf884b02221c1271",
-    },
-    "0xcd86152047e800d67bdf00a4c635a8b6c0e5c4c2": {
-        "ticker": "NACHO",
-        "signature": "3044022041e03a13199b619d541af1d67e5c7797c668b77e1960b25d1ef05c8fad61c168022038fdf669b6fa1d6d8e8849c89c19d9a4850ffb79b3e71aac499ae615ac23c996",
-    },
-    "0x311434160d7537be358930def317afb606c0d737": {
-        "ticker": "NAKA",
-        "signature": "3045022100e638f9de7f2e67fad5e0f19233935bae921c551ae4529c8f22ba8d8d44104b32022011147c5459d6f815bee6a31ca29c8e4a63cb5485b9b4820ebaa24ce663d04787",
-    },
-    "0x106035dedca635d75d6ff05f98f25916829edb77": {
-        "ticker": "NPX",
-        "signature": "3045022100948dd459eb87f596ee1555f6be889bba96ff1764a2648e43c24720f0e3fd7d8f02205b3100d2b087d3555954788b1991cb4543535f84954bdccfa3a87a5fc700c35a",
-    },
-    "0xe8d17b127ba8b9899a160d9a07b69bca8e08bfc6": {
-        "ticker": "NSDX",
-        "signature": "3045022100b3907fe28ab8a3da50bfd09f1c32d1cf294a0f07058fd5ea5a5da0f280752abc02200d9ca07ef00e06a7b2c995c41f91e8c8a80e256bca53b403abfd903f76a12250",
-    },
-    "0xa486c6bc102f409180ccb8a94ba045d39f8fc7cb": {
-        "ticker": "NEX",
-        "signature": "3045022100b8328ad3da43e8da0bdd7ad844eb15872bf42ac84c358d9b2d442597ae9853260220047c25a4503a28c71d67c86ee94d1c239750912ce6d3002772705d297f73712e",
-    },
-    "0xa64a329876a27192c7f8bde4430bdec70ea4b2f9": {
-        "ticker": "NGOLD",
-        "signature": "3045022100e6ee4ee81626df11817e232e30400f0db94f252b3667e2826d09f55a316e143d02207ec62109268c3089152a8cadc5175aef1934a087a571a37a7b6ed3f8ccf93ee3",
-    },
-    "0x4985e0b13554fb521840e893574d3848c10fcc6f": {
-        "ticker": "NCT",
-        "signature": "304502210090b3d16501de5d93eeac8935799d704ddf9d444c63e519737df16458a9b6efbb02204dba1bb763fa0e4f87eeba29c5393a742cccf499664ec5813db3da2a36946bf0",
-    },
-    "0x84342e932797fc62814189f01f0fb05f52519708": {
-        "ticker": "NHT",
-        "signature": "3045022100fe6ee0005f410db9901de157784de9e58469bb2d957c8c219bea4f41eb57a495022044fbb21830ba0ef9ff2aaa0c991702f802cb6b95248e6c297e21b15d9ca77705",
-    },
-    "0x306ee01a6ba3b4a8e993fa2c1adc7ea24462000c": {
-        "ticker": "NPT",
-        "signature": "304402205af2ff199647b561f8786b186096697c4eefe4d2c48e707972b0a90bf63140ba02204d80609868445c41ca0fbf30eeaa891fc7ebd8c493c08efe30d5c8cb27ef205a",
-    },
-    "0xda6f726e2088f129d3ecb2257206adf7d8537ba5": {
-        "ticker": "NCR",
-        "signature": "3045022100bdd5489d4dd7cf302678e96fc09c757a7abf7f8480f08bfe39fe2032982a8f9202205d9f97b690d49f46444dd434bb95064702d91b65f5a234516c062dbd7e46263c",
-    },
-    "0x57f12fe6a4e5fe819eec699fadf9db2d06606bb4": {
-        "ticker": "NPM",
-        "signature": "304402200f1186ac0f5b7eaf699dca3fea81991d784bd3e9bcdf99166e1b53254bc6432502203d0894904aa3eebd2ffa1f622ee98f6bae1fac07232ff52fc72e7f0b61541ee8",
-    },
-    "0x3558887f15b5b0074dc4167761de14a6dfcb676e": {
-        "ticker": "NETVR",
-        "signature": "3045022100a37fcbb9309e130d42f4bad7dc801e68cf3f615868418189871fe512d2cba45902204db94e065763b6ea53f1904e3593ee3806e350b572f1b4f204b99b80d243340c",
-    },
-    "0x73a4dc4215dc3eb6aae3c7aafd2514cb34e5d983": {
-        "ticker": "NTVRK",
-        "signature": "3045022100be228751b46db707c41aaf1d7bccd90c25d7c98d7965108eed6071ab8e3ac49702206792b61c8b28e7326c0398e14b455e8318b263a70fecbaf61b9849fc8fa7d926",
-    },
-    "0x013f9c3fac3e2759d7e90aca4f9540f75194a0d7": {
-        "ticker": "USDN",
-        "signature": "3045022100972769d08fb86e7c8746563a473f2d543de03814264b49ad082f038dbed5726e0220411416e320741e389c3fe864401bdb96b821050876d4da614712f1eb2304f958",
-    },
-    "0x62a872d9977db171d9e213a5dc2b782e72ca0033": {
-        "ticker": "NEUY",
-        "signature": "3044022020a8bbd8a626c9f8da641ff785214d5a361769818a544aa17d2e59ddd7a78a1302207b4b188a7455600ef93c6661728b8994cc5ee49ff94e51b768a11c1252f0940e",
-    },
-    "0x41b3966b4ff7b427969ddf5da3627d6aeae9a48e": {
-        "ticker": "NEXO",
-        "signature": "3045022100e55f2f5e587f95f627932523c95ea0d1d748dbecc9921d0def3f0acccb70efee02207c3b2fee173e99d90c28eb324832db0d14b4a477c1ec5f2468442b6404d41d8c",
-    },
-    "0x0d0b8488222f7f83b23e365320a4021b12ead608": {
-        "ticker": "NXTT",
-        "signature": "3045022100e58ea45d8190eda21e1283f7690a367f8b70cd1864e086cbd24236fd448149a9022049a3ee879b9bd229602ff2b0f59736be95abd53ef6921c2aba60b25facadf894",
-    },
-    "0xc88640b734fea3b35c132fe757aeb5ca6c8cdc66": {
-        "ticker": "NEXM",
-        "signature": "30450221009dab7cea3cfe0285fa849e51b317b792406131d97831bb9832dc5aa353ecdee60220192ea3b30a031bf45002621175bbc4c426dac9d8bc6d357a1fc51c0c80907975",
-    },
-    "0x228b5c21ac00155cf62c57bcc704c0da8187950b": {
-        "ticker": "NXD",
-        "signature": "304502210092580a42c0c8d2bdc33bf5a09e6dd889f3d873471b95cb91cfa9bb24598958a502200150ee8feb81abc40b46d39832cf5f6a4a0994213ba3ca192ed99cca337c8279",
-    },
-    "0x8f9e8e833a69aa467e42c46cca640da84dd4585f": {
-        "ticker": "CHAMP",
-        "signature": "3045022100b850df2f915e98ad5380efa24d06b4bee71e636ad48d5bc33f1c57ec1bbf5cd602201566a782484be00bde6ee829561546066bef92b1f9ce5c6725fc42630428f90b",
-    },
-    "0xd5d86fc8d5c0ea1ac1ac5dfab6e529c9967a45e9": {
-        "ticker": "WRLD",
-        "signature": "30440220382709f0ae7c544e3873aa80c6051d0b897334334298a3163610d11cc93c4c9202200e6b503776a39bfbfca334e8e3848daadeaef7ee7dd1ccd3c07f37cbf6683b58",
-    },
-    "0x6396252377f54ad33cff9131708da075b21d9b88": {
-        "ticker": "NFTBS",
-        "signature": "3045022100eed772a9ae29c34eb185a23c63b3290d0f67886175b64b50622c7c2536ab925802202ea8ddf5cc5bc9b387faf81f733945f44ce6d37917c6b648c8fb366c5eb40c27",
-    },
-    "0x492fa53b88614923937b7197c87e0f7f8eeb7b20": {
-        "ticker": "NFTE",
-        "signature": "304502210099025580fe98024335c98b9c78b505b15309f9cc362a7c98c0998679a90058d902203214a1137c88f58eb0b6cbbb183c43324c0e2253ca45441ffb7b958a63fff11d",
-    },
-    "0x4a7b9a4589a88a06ca29f99556db08234078d727": {
-        "ticker": "GEM",
-        "signature": "3044022008525d0631c14cf982d1aea1515430df3ec68fb721daa3759b16691b92dd2af8022017fd732d0305f5fd6541c6431b5e691843b181ad5c5561e8a2ed6cb0bf52bc79",
-    },
-    "0xcc081220542a60a8ea7963c4f53d522b503272c1": {
-        "ticker": "NFTY",
-        "signature": "304402206ad59fe9ffd3b6c8d90d5b544fe58f8240f1292f629327d7340281e79e847f0a02204505640cf47412d2f4c6f57c80e0f05e08c66f67daa909f7cb76163d74219a89",
-    },
-    "0xca3c652e994d88740b8ab3b33b4935592ab1dfba": {
-        "ticker": "NKO",
-        "signature": "3044022017a7dbf6e08530db6243b5c6cb4e98ade551f6350c2e8e9b2b9f6cdef299fb2a0220524c416c1b37ec18a3a16cce9fca2fb889b35e0a98d3cfd33f8a8ce36bcb801f",
-    },
-    "0xd6e274f6899ed9d1ea49fdd1beaae9dcdf3081a6": {
-        "ticker": "NWT",
-        "signature": "3045022100884351bba92c957c8c3813c5c81d0ffe58d7030e733b72bcd5bddef54872b07b022016dcdceaf782910cbd5627f73f48ffae15d662a07638203bdd60870fc55de0f7",
-    },
-    "0x695fc8b80f344411f34bdbcb4e621aa69ada384b": {
-        "ticker": "NITRO",
-        "signature": "304402206d6639136064f7813ef6cc948284815168f980c205c3cbff438145633d1254c302206fae2a0f776e890f53d1ae53dd547b3b31d6a7d2d8fce689fa48347441a13980",
-    },
-    "0x57c453e7a4d73ac1db8ae07da5dda3b398d17577": {
-        "ticker": "NWS",
-        "signature": "304402201718228088099da9a453944f0851026f2367cfcbfb81bc10114f38829c4f27a302201ae7c5e8aee2bf8049f0bd611021cd935c9815a543bed9b6d82a9eac20b4f1d5",
-    },
-    "0x0f09e11501b01b3e9dc77d96db752d1a2ac84b20": {
-        "ticker": "FXNOGS",
-        "signature": "3045022100e17e11cc1cda232c2968bd48f61d408248af68d0a3fb09951d6ba5f81d3c589a02205a807824590e19fceec1252fe7c48cb4170fa5c6aa5913df4c71e679c56d8755",
-    },
-    "0xf6f85b3f9fd581c2ee717c404f7684486f057f95": {
-        "ticker": "NORD",
-        "signature": "3044022050936c178a77fc206ea07071e81ab25f26c02440ad9b2fd23dba7b475b839df6022031992f7144e2118ff5ca66dff7fe5a4792893dfdda4173b76cab1f4521326da6",
-    },
-    "0x948d0a28b600bdbd77af4ea30e6f338167034181": {
-        "ticker": "NSHARE",
-        "signature": "3044022038f31780aabfd6504fb9773c59bf58a72f0eaab6e5f9971f64ec6a7eb815c8af0220766f07ff320ad2d83d2a10356eb0830cc8ce67abf8c213c2cf7807f49573446d",
-    },
-    "0xd735b487b9018eeada2cc0464db02aa4b90ca711": {
-        "ticker": "NTDL",
-        "signature": "3045022100eec243df4a672cfdc52c3c04343c09c2505a4a597fab251d4de8d056c5790db8022001c943d1e943ca6611c70c6bf890b9368cc9b62f624f9c544fe8b5dd6a75d8a7",
-    },
-    "0x65517425ac3ce259a34400bb67ceb39ff3ddc0bd": {
-        "ticker": "NARS",
-        "signature": "3045022100f6d98c22c0bc65729926559749cf6b5f169c81a88b8b49caca160691e6e4c2f90220383de8b3bc9c45fae4beb76420ffeb7173e556891feaede6d87744f7e98281ea",
-    },
-    "0x97d45ec651d25b90701ec49c959e75efe4e1f36c": {
-        "ticker": "NX7",
-        "signature": "304402202825365cc7f687737c81908c091a7445aec3437888a227a725db9a7c360b379e022070b09768e3f72c85f0ae76694ab87dc729b179baab2f974ff8fac4973cb2e5e2",
-    },
-    "0xee9801669c6138e84bd50deb500827b776777d28": {
-        "ticker": "O3",
-        "signature": "3045022100d7bb3c56a6a99f1da04fd352806a95aa907c99eab702e57a8996501063f21e1202207bf70b8f29308faa485c5b3a174c96aeb3dc49ce611fe7b6500dff3b3ec4dc73",
-    },
-    "0x6b90f248d10a93072ece74ed03d281269d017dc9": {
-        "ticker": "OAT",
-        "signature": "3045022100b731601e374b75b96aef2ac8b3bff2e923d82d8050883a56315b9634f3497fca02200b6963cbbee07785be5db24e7856784608861fe3376c732d0337091b67ba13be",
-    },
-    "0x7c603c3c0c97a565cf202c94ab5298bf8510f7dc": {
-        "ticker": "OATH",
-        "signature": "3045022100ac84507e1d57ae162a6c9faac382a40078054abcebb66824eb5aab3a4f020d4102200a1eda6aa53b940a2aea6d96e627bcaffa43e69636ebfdae42d12eda4104293c",
-    },
-    "0x221743dc9e954be4f86844649bf19b43d6f8366d": {
-        "ticker": "OBOT",
-        "signature": "3045022100a562b49f9ecbd36bc824bc6555a6ff4dc55e939bbb8826e3c4a4f2ceaeb278ee02200ff2e60578722ab9b6787ec14348d5c0b6d10f7eb8812177000340ecba002f7f",
-    },
-    "0x9c17d36bccecafb7d284e8b3d985576d21cf2350": {
-        "ticker": "OBSW",
-        "signature": "3045022100fa57cca3ec4da2502f1ae8aa0437cad8f84f56f74a334e84616e81dc145c650e02201b5fa2c126b354721d3dc6a8df082cf450bbf758025529b8ef7df3af9ae2b3bf",
-    },
-    "0xf796969fa47fb0748c80b8b153cbb895e88cbd54": {
-        "ticker": "OCAVU",
-        "signature": "3044022031b9162d518eb0c9bfb94d60fbfa6ae943d21dc128ed27e21e23a9075aa3633502204ef6da09d4b25f7ea56ed7c20c440f1a07a3733eaba09a5e498d89582d9b582c",
-    },
-    "0xf30355ba14b2d3b31597ec71a4542f57e902cb80": {
-        "ticker": "OCC",
-        "signature": "3045022100ae2ad9e38419d203873ef47a3450a0ff1cefcc02db4820ba2d78eb366af1b828022018e0d61c5904170cc32090826efbaccfa813988a2043588fd70badaa8bb1b975",
-    },
-    "0x282d8efce846a88b159800bd4130ad77443fa1a1": {
-        "ticker": "OCEAN",
-        "signature": "3044022042dbec9c2f3a5270e89008659bcd0d3103922f210f9e4d574e189690690ece5c02207a959c67010943e050dd27a9a01f1362bb82a4aae92ed011edc748215edc115e",
-    },
-    "0x4e830f67ec499e69930867f9017aeb5b3f629c73": {
-        "ticker": "ODDZ",
-        "signature": "3045022100a2ce9e4115465b899686ce1928f06c5e29a929bdb0d971ace66e996873a3779b02207697e6f49a6d81b92c5202d01a74cd97988db6d3ee866b93b975a85624585b57",
-    },
-    "0x65dfa90171e1bd9060209405026c4e1f4a8e58df": {
-        "ticker": "OIL",
-        "signature": "3045022100d677ed4bffea3fb7bbbd7ff8e0c5b7e5a0a4da19492b5467cc08998446454e9002206da6c0c70ad320c4e03f132d6a65a24887d757f2e6cb6c92387fb5760bdfb818",
-    },
-    "0x26373ec913876c9e6d38494dde458cb8649cb30c": {
-        "ticker": "OJA",
-        "signature": "3045022100d49d8c10fe41c35dd7980d79a48e224f38bc966e71299e1ef81d5d9da6243e9702203def27d2bba61bb5907a77bac3ed86be2850c5450d9e26a0806963ab09ae5ed3",
-    },
-    "0xd3ac016b1b8c80eeadde4d186a9138c9324e4189": {
-        "ticker": "OK",
-        "signature": "30440220130ae38b5431e30647f6ae166379cd8b58185b4e47b2009587683b6d02cd06e202203b5fc070bf7453da0c6bd3fbfdfda0e6e8169f5cfa0361794cdb3c08e6fdd42b",
-    },
-    "0x5d48a5e5a3e737322ae27e25897f1c9e19ecc941": {
-        "ticker": "OKLP",
-        "signature": "30450221009fc4902ed0490128844360e494e23b89e21020f1c51bb62455c2f0819a201af402205765dc3e4538c18206b9d75a28dc5d2ca0c4d72a4b1b0648e5208c81f7a07a90",
-    },
-    "0x62414d03084eeb269e18c970a21f45d2967f0170": {
-        "ticker": "OMG",
-        "signature": "3045022100cbcd714a57cab92d9e29b9dccf24d2cea2e37316e178fbc20fd2b4058b437e6d0220494f8fe2f94df6a1cac8db3b6a2d8e9093e275c6456a82f80c9c1aead272ce2f",
-    },
-    "0xbc2659ead8d2d13a157a75bfc5acc156e1ea06df": {
-        "ticker": "OMMI",
-        "signature": "304402202ccb75f1df7efd70cb827c4fdcef22239955c7853a8c01483c6fde57ca96002e022070895df9d403e64077ed56f53e6a6dd13f8e6540a1233e148baec6992361bde0",
-    },
-    "0x9e20461bc2c4c980f62f1b279d71734207a6a356": {
-        "ticker": "OMNI",
-        "signature": "3044022079ea6940df6712b514c6278d02b1a39f792b58c47555eaa6a95ba221ba5ca4cb02203a54aa7f5f53e3dc28d58ef99245bf1a2ccdd6c5f2f54c84a5fcfd7a13df3c9d",
-    },
-    "0xd57f8b6f3e5d1e0ab85118f5e0dd893a08c43346": {
-        "ticker": "OSEA",
-        "signature": "3045022100b26048f9e77c926f42202165eb3a1f24d5fd66621fa5513a6cc57134a6dcc1be02205bd600bf7d0d6ea9d2940b24f5ed186f4ed64520ed03f43b986ee8d574bf3d87",
-    },
-    "0xba11c5effa33c4d6f8f593cfa394241cfe925811": {
-        "ticker": "OUSG",
-        "signature": "3045022100f6736d8075634db63cd4385c3963d4d2292d67d044511155fcbc37680f87d29a022041ddae6cc0ed2c48a727b16b0b1f8ae1c75448ddaffe03381dccc3d1ceba34fa",
-    },
-    "0xff2382bd52efacef02cc895bcbfc4618608aa56f": {
-        "ticker": "ORARE",
-        "signature": "30440220281121c263f69762b5a150ee9f55299811790b8fdb9901c1cee5b097694aeea902200bfb9bc5a1005b23d278c21d1d4d4fc630548bad9c53266443fa7b6cc6b7babc",
-    },
-    "0xb6f10be9201fb110b3aa275267a234e84ade8e95": {
-        "ticker": "ONG",
-        "signature": "3045022100d88317ad84d674f7e3514f762f55ca36684bc64dbc1167db15e4d148dfdfaf7a022070562a7c3723bd7e06125eea7826ab1bd22ee3e3e1c994ef5172f5b5038acbea",
-    },
-    "0x54cd329fc055ed57d657c3128e16091881a1bcdf": {
-        "ticker": "OMP",
-        "signature": "30440220133d5407eafce9333f06229831aa7fdfd2367a08d50233cb9c09cc5e83c982c702204e5eefd375465de02562aaa31e453532fd0239548be369a18b4bdd7c931375fa",
-    },
-    "0xa4ce4a467e51aefec683a649c3f14427f104667f": {
-        "ticker": "ONSTON",
-        "signature": "3044022079976c0ed43d1042ab7f9e34ff43751a2c3ba26e22ae72687071a8fdfe043afc02201ba814ffa995635a20e3bf39b28a2a787a3cc4c2ef75ff881ab50ab874ba5f8e",
-    },
-    "0xc0a1adce1c62daedf1b5f07b31266090bc5cc6d2": {
-        "ticker": "ONUS",
-        "signature": "3045022100a02f23b24c2a08ceef4ba3563c45986fcc387fc8ff103f4127bd0171d2426854022049a659f307b169f899f6f6075ac51e7745348730e6bf6af80664d58316fdeff7",
-    },
-    "0xeb94a5e2c643403e29fa1d7197e7e0708b09ad84": {
-        "ticker": "ONX",
-        "signature": "3045022100afc4a542a0fe2b177aaaff0584edf2c4350b13f4e0a3fa24cec37591b9f3f45602203de87374e3680dddfec30a801dc02946200acb9c8f1631c47a233d0c6ae37a5d",
-    },
-    "0xcce87c5b269c94b31ec437b1d7d85bf1413b7804": {
-        "ticker": "OORT",
-        "signature": "3044022021a598110961066407e23b9aac6adb0a31edce597c57f2ab295dd592bf01e6f902202a65ddc0a6289c0a7beee6a824516c3927cfa1d16b285b2e82ccced3db5d22ce",
-    },
-    "0xce6bf09e5c7a3e65b84f88dcc6475c88d38ba5ef": {
-        "ticker": "OPCT",
-        "signature": "30440220441553ec050fea7b73754e555ffc573d73c205abacebf7aad2d226c4262f2f9f022008b8809df6ea875b53e6691a5e7269e8993f393772f0b60bece185a412fae1c6",
-    },
-    "0x7844f79fc841e4f92d974c417031c76f8578c2d5": {
-        "ticker": "OPN",
-        "signature": "3044022030ce5fb0778d5ed96e98725790de5b8b5f8460e327b31da4292d2b513da32bd102202db9a6f684912a0cbe1ddb57cc8b6616db0f47dee07c5520a3bf9172ba29bb58",
-    },
-    "0x78a0a62fba6fb21a83fe8a3433d44c73a4017a6f": {
-        "ticker": "OX",
-        "signature": "304402200952aea9f4d412fb2544b30457d4184fcbe55d88f588192da3502d03dc619167022021c5b31f06f983007278d924b9f0513d2561bcc251bb2182d5beaac5e04d9156",
-    },
-    "0xe8f157e041df3b28151b667364e9c90789da7923": {
-        "ticker": "OPIUM",
-        "signature": "30440220511a85c6ac9375670d6f527694c8a437f5bcad9ae3f059b2d2d9d8830b66833c022031bcfa7f44f6b69eab2c50773cc00c069824a3c42c3d4468b10eb4eaa124d8b8",
-    },
-    "0x9e25126ebcd57c8eb6eb6c2ffc67810d365cfc3e": {
-        "ticker": "OPT2",
-        "signature": "3044022011fba90b78b9c612ccc2d5c98de3e10240b0899fce900aa25a1627fa79cd3a5e02207b4f17252c040d43cad9afca30d5c59a58981667e77afee61cbd07fe50098573",
-    },
-    "0xcf630283e8ff2e30c29093bc8aa58cadd8613039": {
-        "ticker": "OPT3",
-        "signature": "3045022100831640c77d1c5ba8b3aca41963106fcbea844de0ab45e6903a51719c7001e47e02201d799e71980415424a36cef0193803ee5b2952d4f928887e84468083b81639a3",
-    },
-    "0x3a29cab2e124919d14a6f735b6033a3aad2b260f": {
-        "ticker": "ORETRO",
-        "signature": "304402207ab9b5a71c690977bf46990b7c478612fcd23aa9a32a34e6a3d9fa38616ae3f7022038b018468b0e65bb451c8ad1778152f08095f68f8db761b99a53f7c2c430bcc2",
-    },
-    "0xf4310adb83694bc4808e0c5ca8f7027c6127921d": {
-        "ticker": "ORAI",
-        "signature": "3045022100c095ca88734051e34e2264f62de8135067c0bcc097f22442a804ccc5894a117b0220398f6352b3284da54ca95a8cfa2121db96ec84efc96dcfaba83e55e124c32c82",
-    },
-    "0x7f426f6dc648e50464a0392e60e1bb465a67e9cf": {
-        "ticker": "PAUTO",
-        "signature": "30440220137538dfe28c7b4341d49b19ef1f6a8775a34a41eca0d6ffaaac7972e06e86aa022048642a3fd80e3e8c3c8e5593b0363da1b22fc9a73b56fddf1e966aa23dc88727",
-    },
-    "0x47c52f93a359db9f4509005cf982dfc440790561": {
-        "ticker": "OMPWR",
-        "signature": "304402200bb79a034670f468478420e7b03e26319916c60606e417df9f851a7a5d3efa4002203a7e41c8c12ef941d3d31582f723cc423b1ef6688a1b6fe640ea7050439553cf",
-    },
-    "0x1236ea13c7339287cd00ab196aaa8217006b04dc": {
-        "ticker": "OEPL",
-        "signature": "30440220595903e0e562da3a6a4f7244fe8f332b14ef1f5426cc2d6831b54b10c854eddf02202e461cacf2e4b392ea12f002cda453f70983df8867f3c282b485409b23ff76f3",
-    },
-    "0x614389eaae0a6821dc49062d56bda3d9d45fa2ff": {
-        "ticker": "ORBS",
-        "signature": "3045022100acc9116af0f76a425b4c455e6e9d6b1b59f09c8e0df801d28d0bc2741366d0fb02205b2e79fbb2e0057a7ba49dc952998b914c25130a82f8d2e1f3dd2bcb3d5012dd",
-    },
-    "0x9880e3dda13c8e7d4804691a45160102d31f6060": {
-        "ticker": "OXT",
-        "signature": "3045022100b1a01a1074550b0afa035da72fef4b5d8f26bcb00cd9dfca25c4e183fd89da32022022ad8f4396b1c3f2f0c59094b3cca92fdf0813528028474515bb4be335b912cb",
-    },
-    "0xa63beffd33ab3a2efd92a39a7d2361cee14ceba8": {
-        "ticker": "OGN",
-        "signature": "30440220690953d2d100ddca74287806ed55aecf0f33c833fb414c6a918e17c56aa6a35a022001f5be1f70b997835f8ca49a3251b1dda16b3336b48f9a987069cb6fac2e21c4",
-    },
-    "0x5e0294af1732498c77f8db015a2d52a76298542b": {
-        "ticker": "ORION",
-        "signature": "30440220666f3c23959e0ba6985d146fc5df167ef704e926ccf47471ee8da66ee33f0d1f022023e6c7dbabd291f92f785f6e2f635b9b9db127dcb7bfabcc86895c10776e2163",
-    },
-    "0x11cd72f7a4b699c67f225ca8abb20bc9f8db90c7": {
-        "ticker": "OSAK",
-        "signature": "3044022060e232512662737df203bdcd339152aedde528ebaf31a6f2a1ce0dcf9bb8f87b0220644b13ba6282131b2f4000ccd77aa4fdeeb4d94d49d5df5e8e336c60713da4f7",
-    },
-    "0x09cad96bc28f55e9253cfb9a84a3a1ab79061e54": {
-        "ticker": "OSHI",
-        "signature": "304402204c6e3b0da56fe2cfd8aef75bd15aa5ffdaa9e191efe0534ffb5a1e827ba81f7a0220095cc4fba69ac96689a27cf1d9217badc4db4f794365d67f0ef4dd61f3239498",
-    },
-    "0xf67bf182655c29c4202a9654bd509a8c703ff217": {
-        "ticker": "SWOOP",
-        "signature": "3045022100c0cb5646f8e2d04e200f65df6816be942f4793035df36c5d5138c5d1d9fcd28b0220270ef0f24d6496b368b20378a03f06c7e646fc27878c5ba16df7974c334b67a1",
-    },
-    "0x655304e9cc103b47f0afa0825767d6cce426717c": {
-        "ticker": "OSS",
-        "signature": "304402205374ebf5638ed922f6032289d709bda2805703a0f21f91be0d4840af88dfd240022051e4ea3490212a3715b798510a99fd5e3d6fa745d63896df3b727e4c9a1cfe67",
-    },
-    "0x7c6c69bafbe40b2c76a25dcdf9854c77f086e2c6": {
-        "ticker": "OVL3",
-        "signature": "304402206ed49d10db0ad4a4e6bb3dc77b365f572d9785b075cb7f7f21c0deff5e334a23022003459704ff635552c08ea39ff7952ac107c0ce7effdee671f89d64917646663c",
-    },
-    "0x1631244689ec1fecbdd22fb5916e920dfc9b8d30": {
-        "ticker": "OVR",
-        "signature": "304402207b0b6c2a15167323c450f6f97c3db3f4781216a898d8e8b0f9d9807c4787435e022050dff7a08925fc5d4e63a46fe61ea18a521bd1be1719ef0cd15871fa272beef5",
-    },
-    "0xbd80cfa9d93a87d1bb895f810ea348e496611cd4": {
-        "ticker": "FRACTION",
-        "signature": "304402203dc4dc446647a63803848a78bc00e81c4736b28285c08680bb78e70eb8cd048102204560ec081818356f43dbefc10658f42632632c2b2a378f274670983348d3edef",
-    },
-    "0xeaef6caf6d5894edb2d4ea7ec11ec4ab655f1cbf": {
-        "ticker": "PAID",
-        "signature": "304402207110f2460a44236388ef4fc64d24e185a0b08ef5ae0d8b0e2775e71fa1afc12602205da639c5a7ad3a87b5ba721a3565792b3cdb4525279c26dd21db896d365884de",
-    },
-    "0x7c28f627ea3aec8b882b51eb1935f66e5b875714": {
-        "ticker": "PAINT",
-        "signature": "3044022077790dcecc5e83f8e37598af3d5afd354c141b832e854030fc5d1f5b6759cf7d0220610887c064ae0cb5cde3b354277d49282c71a2f8f6802d9bff2080fc542a1dc5",
-    },
-    "0x9a06db14d639796b25a6cec6a1bf614fd98815ec": {
-        "ticker": "ZKP",
-        "signature": "304502210085c8813012511ddef7e61e1d07c517ae6003f48679983cae527683262f362cd102201dcdaf2cb6c7533244f4b8b046330e49017d014a2220763c02de1822bd7bf073",
-    },
-    "0x11a1779ae6b02bb8e7ff847919bca3e55bcbb3d5": {
-        "ticker": "PAPER",
-        "signature": "3044022039f603f572c62a57c406b58e8f4ee81ddd4d4f66446b23fa48824151d14e652d022079ac222377435929c2cea7b7221078e74425fbb8066e3d59cc3899c958528bdb",
-    },
-    "0x7b367a058f370c0057762280547d0b974cf3ac10": {
-        "ticker": "PAR",
-        "signature": "3045022100f918b620d0dd82c5e59ea97b41e3dd05a7a449b1686c1a7373e48b81cae9c314022021bc9a3a8240143cd92d453ee5dc7a2fbc649ea4a67a833e0b242bcdf98fec74",
-    },
-    "0x42d61d766b85431666b39b89c43011f24451bff6": {
-        "ticker": "PSP",
-        "signature": "304402203cfbec20a2d250f300e6762cf72a1ec4f50c0673ad0989db22b6d7f20128d4a502206de571dd646da7b307e76c26ad02f368e22b07aee79b4b13d5481cfd349afa0c",
-    },
-    "0x60eec374a1ba3907e9bdd8a74ce368d041d89c79": {
-        "ticker": "PBIRB",
-        "signature": "3045022100f5affc14fdd158718c0790cdf73a90cff638f8e72efd40cc22e2fca44fbd10cb02200255895ac5006179bba3a14bd30f3aed89a3e8e1d1b6ac4de99def056fd93a66",
-    },
-    "0x9377eeb7419486fd4d485671d50baa4bf77c2222": {
-        "ticker": "PRQ",
-        "signature": "30450221008443ea75db0a8bbfecaa35a7867697ef097e9a09ccafd7e23742804e5bd5a92102207feeac4b67416298ec7a4b6288a111e8e60cbdbe0413832ddb5dd992ccfd77f4",
-    },
-    "0xfd55e4a6767ff7ffc0b8105262a8cdaabe7fbf3f": {
-        "ticker": "PPY",
-        "signature": "3044022042c2e3be458d0fb22164a56cb1a38338634971e77c2e61fd1709f7e3784040c5022056b36e0041770fb5093b79c860ba3596c98bcb13b053458f729b3f7258d58e40",
-    },
-    "0xbc5b59ea1b6f8da8258615ee38d40e999ec5d74f": {
-        "ticker": "PAW",
-        "signature": "3045022100b65b58c234242771656859269b9d09c8041661efe393c11f5c6a1988efca58d202201ebd63c9f9e9b83b24f6ded29bf90cd5daf433feaaf94c0fa9d17218aa6602c6",
-    },
-    "0xc79ae93d9c215eaa8c8da5c77e465bac7de28891": {
-        "ticker": "PAXW",
-        "signature": "304502210080b441f010378aad0917e69b5ee52e8c743dcc6a7830d3104e8c11437be58fa3022013b14ed5f32d471f04176e264ba69908bea3b5fe113423751828edbf53a46b33",
-    },
-    "0x553d3d295e0f695b9228246232edf400ed3560b5": {
-        "ticker": "PAXG",
-        "signature": "30440220366777a5244a25b29267cf4d4df4d285d3f288205aa25e453c9746315c04681c02206df03e2f914dd3561716e4fe1f8a9a5b2e4a59a4291dd777feaddcb3d660959e",
-    },
-    "0x6f3b3286fd86d8b47ec737ceb3d0d354cc657b3e": {
-        "ticker": "PAX",
-        "signature": "3045022100a0fd20a02a801d127eb9e6ad59856909ab580c6ba2ee7d8757705e4335f16e2802204949c6795e2e23b11d07f78a045b42900195f1b3d3599357aa9058a84e8058ba",
-    },
-    "0xa2c638b78783e9afe26a16ec8b11de54eb169360": {
-        "ticker": "PIN",
-        "signature": "3045022100c6c7a3b28f4d9ddab7d140588f85fad530011155ea980d3226c8b643900dda870220139a34a60e8a1a3ba33a89377c46437a9a4d0bd718ea6cf6960e6d8f4d42b510",
-    },
-    "0xe580074a10360404af3abfe2d524d5806d993ea3": {
-        "ticker": "PAY",
-        "signature": "3045022100feae84faf7fb2052366b72a1f14d5c65ee6c9fb4ad5174fdd0655281d159faf5022015b8bf9ab57132f8aae1944ba3d51dd56a20370186272c5ff72dc47c4339531d",
-    },
-    "0x55bb4d4b4545a886df159354e5fa5791c2d13496": {
-        "ticker": "PKTK",
-        "signature": "30440220588ad56e0715ea9cd90607f9abdb4b179c9fe35d6773e966c61642087cd8d55602203a6d2afd1c5513dcf6d63389b3265abc9e917c677a52a044bb215bc06062aca0",
-    },
-    "0x7238390d5f6f64e67c3211c343a410e2a3dec142": {
-        "ticker": "PEARL",
-        "signature": "304402203da454314a527efd263bb6d5302649bbc9a3f113071c24e9eb0ba419517e12c6022031188f6b0c5da30e0536a4cb67e26269ba9d05234e090946e5187ed72a8a5df8",
-    },
-    "0xc1c93d475dc82fe72dbc7074d55f5a734f8ceeae": {
-        "ticker": "PGX",
-        "signature": "30440220431b2054344c423673cdd3ded15c3a5ae82dcd1e2683b8ced95fcef042a4660f02205d1ba3b5e9fa516a49abea1477639b62c09a3380fadf3d4964abb87327761c73",
-    },
-    "0x9008d70a5282a936552593f410abcbce2f891a97": {
-        "ticker": "PEN",
-        "signature": "3045022100b3836ae6648381ace881d406787d90f6953c14fa855242c6de48d0bbc2aeaad9022016c3cfdfb574608492a9590cc6c1f7ea80c986b9a868ea3d8352d59f8713b6c4",
-    },
-    "0x5b0522391d0a5a37fd117fe4c43e8876fb4e91e6": {
-        "ticker": "PENDYST",
-        "signature": "30450221008b430d44f7217d02003e38204c5fc4551a1779205ad81d0e4b7aa4a350e8ea3f0220086b533eaa3f98dba72a35e1d7f0b97775ec8b092cd141bbf9ad0c3738310822",
-    },
-    "0x8c069b6cef3453babb15fa97784affeb95d398fa": {
-        "ticker": "PMXX",
-        "signature": "3045022100a75eee3e279347d898dae3a0d32b0cdb2539be09986cfbb78cf998e4503d37d0022073324b8ed1934e9e5c9e4b330a36f84b5fb208c927e33e7b6755f962374404a1",
-    },
-    "0x127984b5e6d5c59f81dacc9f1c8b3bdc8494572e": {
-        "ticker": "PPDEX",
-        "signature": "304402200b590012ea3cb13b39348b11863fc7073f54ec13b94b5345d2d021695ea7056402207c7990ae61a9e4cbac791896d57da4609180f5738c1d806c27ffeb09ea251e7e",
-    },
-    "0xdc0e17eae3b9651875030244b971fa0223a1764f": {
-        "ticker": "PERI",
-        "signature": "304402202cb79b203ee9260cfa4bc38a0b13599548e82aa650e604eed62780658bb7e2d8022066abc208a713efc9d61b5a77ee5a9fb037d64b79a3bf045f9cce57317fc4045d",
-    },
-    "0xb121fcd122daaa153bb8a102754127b2682645cb": {
-        "ticker": "PERL",
-        "signature": "304402205ef607867975e060dfbff549fc5f60d4afab9bd3e33e3470110585e26eb3a874022013d394316f06270d001547e071e784443f3cef50d4455acc2b232031bfd6c0aa",
-    },
-    "0xaa3717090cddc9b227e49d0d84a28ac0a996e6ff": {
-        "ticker": "ASK",
-        "signature": "3045022100eda6a74d8cc0aa5ac7a72f09eec7398d3fdbf4eefb0b1028338a2b7a496ab59102203fe89e857ca8b9d446071e3a378c6a9dc8af8df2b2e960ba18889f66d0e9db3f",
-    },
-    "0xcda6c923458ca9fac8e3354999e866feaa80b72f": {
-        "ticker": "$PGEM",
-        "signature": "304402202c3daebdad3db2bc956bad5d0a7af77af945b525f30dafa718dbdea32ce2e5cf022035704fe538720f9170d2c661d064175a2b720f85acf45f5f4841e32f76835d71",
-    },
-    "0x421b9b487d5a9b76e4b81809c0f1b9bb8cb24cb9": {
-        "ticker": "PBOS",
-        "signature": "304402204724af1d10b05227099f8defdd8b263b295835cb257ea558a1b13b9bd89b11f00220143e1ae66b73b9fde95929d4570c23f1eb741801883b8ca18d89fa2c220685fe",
-    },
-    "0x086e6f3b29f5ec0ba6539a6fbd5fde5d4b3f530b": {
-        "ticker": "PXAI",
-        "signature": "3045022100f5ad6f2e23bc21480a72a38a3d9123f998785da8136874ebfd00dd44733859fc02205f18e8a9c7c311f89258faf84cd32889ffbd59698e19b57b79d34e0f473bc966",
-    },
-    "0x9c6bfedc14b5c23e3900889436edca7805170f01": {
-        "ticker": "PHX",
-        "signature": "30440220350262adc82392833a9962269cf1a97cf21758d7f033bed8b2e3a6b194e98ce5022071520a6c7116c974b394a221a7df22df57c4daebc5028caf690d9872c4c83036",
-    },
-    "0x92c59f1cc9a322670cca29594e4d994d48bdfd36": {
-        "ticker": "PHNX",
-        "signature": "3045022100afd6859f68b808d528280599311de3d6f4e72761b802d39aaf8049cd3739d77502203188dc468c642e229a3e6e70cc0c932df14d500f9bd102d7e86991581aba27a7",
-    },
-    "0x2b88ad57897a8b496595925f43048301c37615da": {
-        "ticker": "PICKLE",
-        "signature": "304402204df24cbb5d161252642dcb494a7b3b835989a39b38b74af699c3086d7298599c022036965a45f2baf94286a7b38add751944b8a52cd4653cf1ea15bd8a78cdc68a8e",
-    },
-    "0x990f860968714c2d16e91ec0cd9709a94264cf64": {
-        "ticker": "DOUGH",
-        "signature": "3045022100f08450a344629b75ff4f4ac08a21cea60603a46c0c2795e2782b770180838de602205a50961be1e93f6b71b91a3444e70c13c22ed37315c0767e45bca8835c874554",
-    },
-    "0xe9bc9ad74cca887aff32ba09a121b1256fc9f052": {
-        "ticker": "PIG",
-        "signature": "304402202dc3566af28e96434c1e97efa18717c479271b7ead73097dfee3429fa3b4345e022032a9dc5f868fc794b2e764385023645222c26eb75bc9c8a2c406ccf8ba2a93ff",
-    },
-    "0xffb89d7637cf4860884ed48b57ae5562bf64e10f": {
-        "ticker": "PIKA",
-        "signature": "3044022059fc3565a6ce2c2c43267fa6526b42da6423a761b9054906b20b0fe0c70aa9cc02207b0937d071f04445fe248e8c38ec1f1148f9d6fc01249bb901bd1f2040c29ed8",
-    },
-    "0xa6b37fc85d870711c56fbcb8afe2f8db049ae774": {
-        "ticker": "PLR",
-        "signature": "3045022100a9ada36196b6f0d3fd51e45df1d6a441a58cd8fb0a5312018dc33d060c17d7f202207ec011beea28775a390d04102e185d4111c2f5e2430055485bde4fe0572f2d96",
-    },
-    "0xad93e067e149f0a5ecd12d8ea83b05581dd6374c": {
-        "ticker": "PNK",
-        "signature": "304402204c37665d5ae80c17bb4710b7db4e924a8479675c8255637566b8ebb56d052dc902204091c0317a8497f4267eb1c70d3e953cc9332785f59a912ddf80cb6e91af8fd3",
-    },
-    "0x612d833c0c7a54cdfbe9a4328b6d658020563ec0": {
-        "ticker": "FXPINE",
-        "signature": "304402205e57b9ceb7c50b6eb99ea6ca2f6fc07aca5170bd641f2c53427862ca587d54fb022071e270fbc440b6533e3ac0ecb6c62715d9daed10e4cce40a9b105c4a53436381",
-    },
-    "0x4e92f6f10496f3fcb790cc6969cc15b87c8f9199": {
-        "ticker": "PNODE",
-        "signature": "30440220351b833f6ba2a58c10d9bf92a04dd0e507bb0ec1bf0cc228da153e98a648324e022070025b9a70ebf6a9e8367dcda3ee5d9f1325f585516d51627a60e9875cb48bf4",
-    },
-    "0x38a232cabb8a7f745c7d6e0a5bf300e3499aa8a6": {
-        "ticker": "PIVN",
-        "signature": "304402206d907cfcc7af2b81e35cfe32620b16b4911b4f157ece0e94cb172b7b44f9e3fe022038f6019fdfd6e1324f887f182087f1226de3bc5b11b14ea9cf5d5040a221ea40",
-    },
-    "0xed2d13a70acbd61074fc56bd0d0845e35f793e5e": {
-        "ticker": "MOJO",
-        "signature": "304402206b43c6f9bfdafdaecb96a0409aaa57830c9192e4dbc4f26c72b13bad72455f5202204576c930a1e2b032779af236738794f3d6e8bd3b8594d2e847d7f1fcb938d0a5",
-    },
-    "0xe06bd4f5aac8d0aa337d13ec88db6defc6eaeefe": {
-        "ticker": "IXT",
-        "signature": "30450221009ae47f607b8c4421b69c43f110221019912ed13b891ffb5f50fc31fa7862683702203544f5f577a02f5143285325c00b54f9f507a7fb1cf7604f69c8647369eaaf2d",
-    },
-    "0x08158a6b5d4018340387d1a302f882e98a8bc5b4": {
-        "ticker": "PPAY",
-        "signature": "304402201ae8960c05a33cfed9d2b1de32b851d45a121ee1c2b029914410c21f6b8e79d00220648efc7398af7cb23be388a0ae9124a35fd2ab2e5411ec220aed9e20184e88bb",
-    },
-    "0x8765f05adce126d70bcdf1b0a48db573316662eb": {
-        "ticker": "PLA",
-        "signature": "304402201adabd0883178a1e291a7751f7d51083c3a88a0f7b268a46d6433fbbf5ced2bd022022ca307aa595f451343f1eed547d36020855086c3c5266d051bae55127409aac",
-    },
-    "0x0bd49815ea8e2682220bcb41524c0dd10ba71d41": {
-        "ticker": "PYM",
-        "signature": "3045022100e9ae502812883cb8bce68153548f5302e6ea41483bbfed576f8435802198b2f402205c1c7727151f5f5b6c4e7290bef11aa3dca95f8496aa04873dd5ec17b2c0ef55",
-    },
-    "0x8f006d1e1d9dc6c98996f50a4c810f17a47fbf19": {
-        "ticker": "NSFW",
-        "signature": "3045022100fb39de011a9958446a6a39f2ad1048564166226588e7e8a53ad99c8f84d425c9022015d707b6838878c5cfed50398c105729745487bd94647ff7179664975de7b898",
-    },
-    "0x1be9425ab42897f0c14759ee36493fd7db895c22": {
-        "ticker": "PLEX",
-        "signature": "30450221009e06c4572d204e3e3e1d03fd8a32194708fa8fe8184458e2b1851d2b0f01ed66022078282d20b90ebefff9ca2a026c142afddf23076f8ff038e9205aadc63ea66fa9",
-    },
-    "0xe82808eaa78339b06a691fd92e1be79671cad8d3": {
-        "ticker": "PLOT",
-        "signature": "3044022058e03a178e2cb0a50baf7721fce7019600576bb108f1020c855f93d7c87f76ed0220376760febfd81216ff632ca286972f439d55e22cc1839ba77e2bd7a7879bff2a",
-    },
-    "0x7dc0cb65ec6019330a6841e9c274f2ee57a6ca6c": {
-        "ticker": "PLU",
-        "signature": "304402207f4935970038b11ffc3bee1567913d40f1ae3f30471d752a8531ba795a89cd51022035938e84b0edf51bb21d820eb561d08567dbe8918b396136e5afdc9102b7ef14",
-    },
-    "0xa0df47432d9d88bcc040e9ee66ddc7e17a882715": {
-        "ticker": "PMATIC",
-        "signature": "3045022100829d42128ac53f06c98fdc812d1c2ac93f24f462d0cc1747de2e622f3ffdb68602204b294514dd713df8668b44ca06edf12525bdd2d82e35ccc68f5594632d03a946",
-    },
-    "0x31c91d8fb96bff40955dd2dbc909b36e8b104dde": {
-        "ticker": "POI$ON",
-        "signature": "3045022100ba98f932efbf659753d42c6190a546cd91df3db9ab7ae48c44c74f1edc81230d022079adc3fa67e470d386626ed06461d66e56bacd6388cc06b584ec255f10092cc5",
-    },
-    "0x2a75a19a162ef79ed97012e31d8f9c06d3bb4f92": {
-        "ticker": "POLDO",
-        "signature": "3045022100c0937ae72eec47552e3ba65022e4fc50a09a4019b3629a13e879aec0cbd3a541022054afef5498d94d526ce65861385bbec369fb819dd26c7fb3af97f1053fc2638d",
-    },
-    "0x6fb54ffe60386ac33b722be13d2549dd87bf63af": {
-        "ticker": "POLI",
-        "signature": "3044022057a3eab341fc6879ea0195484bd24602d6ad94594d8dd0b6cf3473765d3a6d6b02200506c845bc789dd3bb9b6ffa86846fb588746b9de821de98d4e76d5a304ac7ed",
-    },
-    "0x0d6ae2a429df13e44a07cd2969e085e4833f64a0": {
-        "ticker": "PBR",
-        "signature": "3045022100e1bd1a993ecd346567a0074ca4b1188bb4b7f437f7376e4d5c6915b1f74945c4022040c1d72ee7e60452fcc483d777b457153bf62df606cfb5727968d3a5ffeed49c",
-    },
-    "0x180cfbe9843d79bcafcbcdf23590247793dfc95b": {
-        "ticker": "XP",
-        "signature": "304402204e7f5cfa65cee3b395d52dc084c12f3c5bb1ca1491cd07a3529fe5f2279ed4ac02206f4bf4a245e9e3b1904cc47b9482725b28e4f8caeeaeacd8e75b1ea66fade0c4",
-    },
-    "0xa5ff48e326958e0ce6fdf9518de561f2b5f57da3": {
-        "ticker": "LKR",
-        "signature": "304402205e1c8bf119284e08aead5202a21d18970385233528f2f42a8b2df4f1c51e6a3a02206fc5835626e57f00a2a844472be5bca23d9d9a55f4456df79b0e0a6c516907e6",
-    },
-    "0x140a4e80dd8184536acc45f1c452d7540472e6e1": {
-        "ticker": "PKR",
-        "signature": "30440220555f09d12ff92a2faa587beb2f3a7c4c4c0bd177e79ab24360a4fecb2e273b6d0220633aa4640c12fe18026e9d9052ff7ada2b63cb307711e38e6272357434528e9d",
-    },
-    "0x4c392822d4be8494b798cea17b43d48b2308109c": {
-        "ticker": "POLLY",
-        "signature": "304402205f1954a5d13c1f5850662b6d36d585ac5638ee6535da79869030e879277efcb3022013dbc909048d19f6b5216b7752b1137dc9ce3a7786ae98a78e787e72cba41d8b",
-    },
-    "0xd3f07ea86ddf7baebefd49731d7bbd207fedc53b": {
-        "ticker": "NDEFI",
-        "signature": "3045022100acf325b836a4d4dd0528920fa94395ba161df551c319ba37d1257c5b4c8d14260220415b0ea57e8613d00c8fbef1bab28d89642a0f7d68c3c77dc88967286d9110fc",
-    },
-    "0x1796ae0b0fa4862485106a0de9b654efe301d0b2": {
-        "ticker": "PMON",
-        "signature": "3045022100db9830cdd68f2337221427b4e453262035cbb22ce25fdfa6c32d942cdf895cc102203e9ea473ac00f4e90d8829af7dea9771f2e669b2cd5739a16795a34dc005e333",
-    },
-    "0x7cc15fef543f205bf21018f038f591c6bada941c": {
-        "ticker": "POLYCUB",
-        "signature": "3044022066aa4e3532da731511a8826afbf31609ee92d1cfc9b892a32e6638637cf9e75d02206172bc31f83948dd9d8a2d1fd167a1aad4f109bc8baebc031ff49e2c0513bea4",
-    },
-    "0x8a953cfe442c5e8855cc6c61b1293fa648bae472": {
-        "ticker": "POLYDOGE",
-        "signature": "3045022100932c4b2dd1a5e77023209930d92f84cf27d9629b75f8368434760cd2bde68924022013d2b965abc44f75bb5c7d91609a123d5dd050d4ed0ff6fac4ae9cf8a00aeb29",
-    },
-    "0xf4b0903774532aee5ee567c02aab681a81539e92": {
-        "ticker": "GAJ",
-        "signature": "30450221009f4e2e496ba2ec107711f8299f17cff60df06aac4f746ac5d8b2af63411db53202202b1bc6868e97589d9881575e323553e3b6f0392f374bf57d6444e6ebffb605f8",
-    },
-    "0x329f5e8aff351327e63acdb264389c798a46c2d3": {
-        "ticker": "GAMMA",
-        "signature": "3044022065d1527657f0b0017096022bd71b3fa19ec057bec0d8a9eaca74b0f1dbf251e702206f0255ac69c805008ce5b4ed924f3038b28e2d96d36a66a9a5d62cbe322c3757",
-    },
-    "0x01d35cbc2070a3b76693ce2b6364eae24eb88591": {
-        "ticker": "PGEN",
-        "signature": "30450221008ab6c46ca7fa6e3ed7acff267ed4d388f18f4d6f3c843d191b13d33042238f26022017d5238b519fce0cbdf53efe2efe0ead6043fd97daf27610db639c098bcbda88",
-    },
-    "0x0184316f58b9a44acdd3e683257259dc0cf2202a": {
-        "ticker": "POLYGOLD",
-        "signature": "3045022100a5b892d968ec6163d54711bb3a0b262982c8d57fa65ff4ca7fd4801b271d0e2f0220116aeebc21e0678098f91b493f9a6ff222e8e22de21663f3e07e8136128ccb4d",
-    },
-    "0x4c16f69302ccb511c5fac682c7626b9ef0dc126a": {
-        "ticker": "POLYBUNNY",
-        "signature": "3045022100869cbabf75d726a396640260dff557a3ec9013beb83a31b5a7298f2f24ecdb31022015dc5e73d6e454a611a9f6f5683646c1d070d6e9836bbd24393d03e43b2a3043",
-    },
-    "0x6d969cea201e427d2875724fd4e8044833fbc7f4": {
-        "ticker": "PHBD",
-        "signature": "304402200ffabe3a60dabadd3a3e7f25371605e483d1fbb5d84ffb02d39e3a1355b3267a02202782a201263cf92e9742d6eb7e17acc2dd2c2aed5fa4fac7c0f834d81c2251d3",
-    },
-    "0x236aa50979d5f3de3bd1eeb40e81137f22ab794b": {
-        "ticker": "TBTC",
-        "signature": "3045022100e9419a618f758eeedb92160ea4fdf63c3094df06947c09a2c580b72166755f9602206ce8ee0be764a76c1676f76b68110fe8023fa2c351b74f76c2eed6ebd8d1c115",
-    },
-    "0xf5ea626334037a2cf0155d49ea6462fddc6eff19": {
-        "ticker": "SPADE",
-        "signature": "3045022100bc21528be29ce9f9454c3860af24a978ba0d111c72b03c32785f09b95538035b02200458a8ff52f6ae211e84a623feaa2fe03a7b9bf35f4c1eb1399a1e3d4681c9c9",
-    },
-    "0x187ae45f2d361cbce37c6a8622119c91148f261b": {
-        "ticker": "POLX",
-        "signature": "3045022100c573ddcdac05c2c46f2a357ed3516542e13fb5f309db37a09d6382c1e994994202206acfbd63f57e0e55a25b217c6a7dda9d990c3cd262e8890b29de33f5c39eae67",
-    },
-    "0xcb059c5573646047d6d88dddb87b745c18161d3b": {
-        "ticker": "POLY",
-        "signature": "3045022100d8c158f7cd8b12a3931e4e9ccdeca52b5e70a8ac95a1ecafc12755a7609e1f3a0220762baedaffad7867ad7bc3ab7c267e42f93dc428fa4062a8d3f92f626be95585",
-    },
-    "0x30ea765d4dda26e0f89e1b23a7c7b2526b7d29ec": {
-        "ticker": "POLYPAD",
-        "signature": "3045022100d3160c458723c263ed6d32bbeab1b0d551a497fe6b9336d456c16fcd003e142802204daacaad8483e4ad3b4f5e933613b6b19edc9d78a369322929066b1856d8390f",
-    },
-    "0xc68e83a305b0fad69e264a1769a0a070f190d2d6": {
-        "ticker": "ROLL",
-        "signature": "304402204eb664cfb3381398d621333893bb0348191f8feaeecaffd6a7018be0614f455c02200374feeedd2efadfcf538f80cdd1ccac63d18363b7d48bddd85202cba52cedd3",
-    },
-    "0xd201b8511aab3e9b094b35abcd5d7863c78d6d0e": {
-        "ticker": "SHARK",
-        "signature": "3044022038493c447f8f0737315bdf589fe3327102626472f7e145568ef4c397ad3eedcd022033c0d0b7f783e15582a90648bc39c5fbe475f1030b89fb1628339a680595552e",
-    },
-    "0xf239e69ce434c7fb408b05a0da416b14917d934e": {
-        "ticker": "SHI3LD",
-        "signature": "3045022100e3bd93e7af85d1af6c9f59cf9dc575b24e7cc6ed1ef75d6bb79bd20609e5c55c022053b78bc532c9400affecf73d17a6affaa3dabc5df469ee24f59b5ae42b203f79",
-    },
-    "0x860ca4c7a60dcdc045ba1012c27788860cfa565f": {
-        "ticker": "PLS",
-        "signature": "3045022100a86c4f3cf80f9e695be09beb69813808d83a6bed256edc8f5303507a97c778b302201b5a7abf156d53d7b3cfd53e786cb52d2bd7f91d1892ffce856e1a05711cdd19",
-    },
-    "0x32cd1bcb75473845b5d1db6ece60aec6e41d8518": {
-        "ticker": "PS1",
-        "signature": "30440220504e1c2c375b34bfe18938c6b3ec4664a83290c70caa7ab127010b300d7fc24f02201c436fbfab7fed8b37ae6fba57f55aacf0b4a1376bc78a092ecf56e94772b7db",
-    },
-    "0x692ac1e363ae34b6b489148152b12e2785a3d8d6": {
-        "ticker": "TRADE",
-        "signature": "3045022100e12a5baa667ad1ed3da756a42856fc1c049f79360a04d536a7b09104a51bdd48022004f033da4ab123809e7c9329bd7e2e7793111d19dd089a0393966e052706a9fe",
-    },
-    "0xc56d17dd519e5eb43a19c9759b5d5372115220bd": {
-        "ticker": "MOON",
-        "signature": "3045022100804d18682dc5993c71ebd91a8b6fd2226b2359e114848f838488cbaa1ea412360220232804817181ca82b42ae0f76dbf668407185eab9bb1a01d76471f333343c9bc",
-    },
-    "0xd0f3121a190d85de0ab6131f2bcecdbfcfb38891": {
-        "ticker": "YELD",
-        "signature": "3044022065de87aef41deb4b0c77747e9a6e23f4acafe7680ab3a3d57d3b9bc31b71a8e502205057cd1023774cd5773ffedb71a693c63822e1e666a960795229d172c1630546",
-    },
-    "0x1fd6cf265fd3428f655378a803658942095b4c4e": {
-        "ticker": "YELD V2",
-        "signature": "3045022100c1726c845bba3fa5ae3c13e556758429b806d69879fd536d8b9111e9d95de1c602203cdecac1b9b8ba72b99b4a262815ae566ee59f1819be5203511d7f44c921dce1",
-    },
-    "0xce4e6da9c509cb33c23d748713c681c959f68658": {
-        "ticker": "YIELD",
-        "signature": "304402204efbe159920c6d75f6106fbbcb4f767d403377751292ae7a87072aa108269f1f0220723d730f4ce3999c5ee6a0a979119031b820ba3c6e2f0cb7f8d3938484732ca6",
-    },
-    "0xeb2778f74e5ee038e67aa6c77f0f0451abd748fd": {
-        "ticker": "PZAP",
-        "signature": "3044022075cabb44ae268b4878870a4a3054fc68555b59186f635731358d980d824b92830220460d2819ebe826004959525110b0ac3a6d72cfed3161d963e19fc0e22e63aed3",
-    },
-    "0xb7486718ea21c79bbd894126f79f504fd3625f68": {
-        "ticker": "PET",
-        "signature": "3044022023aa514f9670ea655ed66c161a744b188c5ea65a2f516174b775f8c1ff91df2b0220311bdaf43a2be0019fb8eb7966b615261808e5703352e929a96991ee8435fbb4",
-    },
-    "0x25788a1a171ec66da6502f9975a15b609ff54cf6": {
-        "ticker": "POOL",
-        "signature": "3045022100c847f7dc9b69206c02c8bae2374dfb365ca9131cb2b919b9e6659cd6f9af3c4102201639148e169f38ce66414d51ad8575ff60daa9d6e43782db9eb0dbbe7184c2ac",
-    },
-    "0xc5b57e9a1e7914fda753a88f24e5703e617ee50c": {
-        "ticker": "POP",
-        "signature": "3045022100845ab7d48c8eff55a4f01c6e93c11db23d485e65b36a04d9b7c13130eaa8a95502206f93e6f92599d87ee9154b3b6343c887cbf595594a0bf65d26bfa754832df03e",
-    },
-    "0xb4357054c3da8d46ed642383f03139ac7f090343": {
-        "ticker": "PORT3",
-        "signature": "3044022066e285f79cf93b2d40b2304fbb467467c8fb5ea0c781aa7f11bbe2fe8e7e405102203b2e34243a32949cbeb52246a7af59d86c5e5e63ca5f0f4cba7396558a142811",
-    },
-    "0xf86df9b91f002cfeb2aed0e6d05c4c4eaef7cf02": {
-        "ticker": "PORY",
-        "signature": "304402207a2490c87efcf77d0d3c8c2973264653c393428e3396ab8095673202c182415d02200e0b58a680dacfad870078667f47d1f94b1ef8856a46ed6712b989234748af4d",
-    },
-    "0xd7c8469c7ec40f853da5f651de81b45aed47e5ab": {
-        "ticker": "POT",
-        "signature": "30440220205ba2e21fbbc670cee26b918f32fd0eca0fce8f5e730f128eed60fc491c2e4702204f3a0a976c818688a01b6ccb41618e98b6402d4da4f37368949dbc744d719495",
-    },
-    "0x52468c88e8b4f5bcca20a6a7813355637dc5e3ad": {
-        "ticker": "PODO",
-        "signature": "3045022100d5f8337d5c7df4ab2103963862a6bd99f153d4c8b7eab61d78d1682f2e3e30420220618e0310008e5665cfd8819dd994ad46ae4b931654e4b92d49f7e029df046084",
-    },
-    "0x0aab8dc887d34f00d50e19aee48371a941390d14": {
-        "ticker": "POWR",
-        "signature": "304402203c6468e0d9c6b1727eaf7ecb9caba9c26a99bc5fa5564f8b75ddda5ea20594bb0220448956a4ba2f5dc4831e7ab79b645ed01e2151aeeadeff42493196b0fbaab3c4",
-    },
-    "0xe0ce60af0850bf54072635e66e79df17082a1109": {
-        "ticker": "PROPEL",
-        "signature": "3044022038c4fd3e7f50f5b404e9c59ad93e014feef5af770c6c091553d716d049b35c190220424e6ef1caad93c63f2b6a745f2821cfd6854b4c819add12fd00634d22e829c1",
-    },
-    "0x6109cb051c5c64093830121ed76272ab04bbdd7c": {
-        "ticker": "PROS",
-        "signature": "3044022066864418a5ecfc21a77c0b3504f89f46d6531c8201836c447699fc93241f1fe202207a27e03eaea97990af908acb1c67351eadf1e9f7fa851d441fbf8b54dc24325b",
-    },
-    "0x37b8e1152fb90a867f3dcca6e8d537681b04705e": {
-        "ticker": "P-GYD",
-        "signature": "3045022100ce740b41790ccb0741232f023d6d9fc21608093fa0a4f03d7641ae61f284ec5d0220521d0fae65e2df96f00dfd112348df08626e848faf21d21376b68e3ae59fc5ed",
-    },
-    "0xef274c75cc3d32c989ffbf9476e0212a1caf1836": {
-        "ticker": "PRO",
-        "signature": "30450221008a66b4392fee33e644c9f7eaa4819a0db3b5a64ddbc88632baa016860fdc9c000220078421c124875b20b9764bbea500d13bcad8890d002ab6de87985f45b728cf8e",
-    },
-    "0xab3d689c22a2bb821f50a4ff0f21a7980dcb8591": {
-        "ticker": "PRXY",
-        "signature": "3045022100915a7b7d2fbd6911f7c85a01e2fff07ce072688d8e1139818ee8bf00380b713d022023be8ecead96c1ace16f8e60f01d686304bd1ddd3a14fe8c96ebd3fa1647f172",
-    },
-    "0x121ef177a0489271b4339bc29ee64609b47d43c4": {
-        "ticker": "PBTC",
-        "signature": "3044022068140d5c2ddf3a44fca2f26a6501ad1403292cd35ec6d1a84592eb1d11bc2170022046361f0075c1a0f7d3c9304fdecc050babc1edf9b5ab030bd233f168933330bf",
-    },
-    "0xd52f6ca48882be8fbaa98ce390db18e1dbe1062d": {
-        "ticker": "ORE",
-        "signature": "30450221009fb391d73ea0fb9daa86bc06ac6937682d79000d0890ccca9de70a2f2d3480fa02206cd4108e11a25616834f85666cf39951a5227481a4666df7a1fa4ceb5c74a6e3",
-    },
-    "0x324165db0a8d41f2eebb38d68e75edd5f8f48963": {
-        "ticker": "PTRN",
-        "signature": "3045022100b1f125ae24c2e414ef52c5b368d52315e9bf9a18e264c564fa29ad9ca799b50702201fa25f3bfba44233c248bd72f56e72bc957f458188ff9512a2be2303a004f093",
-    },
-    "0x35c2b6826b5c94fd2dfede51e7cfd4b94410840a": {
-        "ticker": "PGC",
-        "signature": "304402207ffdc9d8f699cee2c1a512dfe468c67064cfe1007b3d8cb4dce5b76c431160580220440ae689b374d46315cf4eade5d792eaa8b9987c5990b4121e603878a7a9dcfd",
-    },
-    "0x06873c7e7020a7845db8eced6cd1041afcbc9822": {
-        "ticker": "PUNKD",
-        "signature": "304402201bd97bceb25031e078c6b03d1757b91f06f154a14005cd1efcd9a8558e79dbef022019f7418f37a81895799f104ff1d6edbce47ca6d6330c391c0ba758def340751c",
-    },
-    "0xcfe2cf35d2bdde84967e67d00ad74237e234ce59": {
-        "ticker": "PUP",
-        "signature": "304402206a285914d15826aae6434475ae938c43063a4d92aa1784609ce54de24f9cea6b02207881f884d2220550021c997a0df85e83c38c1e04add8ba2de9e994d5129e3b6a",
-    },
-    "0x3c205c8b3e02421da82064646788c82f7bd753b9": {
-        "ticker": "UFI",
-        "signature": "304502210098f601af783b98949d9f91fc8279f265ebd94db84e1e65790027c07fb1988562022044f42ac618741b331db6a0962171527d8b0f3e8e2e588b56352776ced290a319",
-    },
-    "0x972999c58bbce63a2e398d4ed3bde414b8349eb3": {
-        "ticker": "PRPS",
-        "signature": "3044022070a914f626101f070b55a63b34fe2ced303104feb12cfdb3a24c74494eccb612022073bc6fec939194edeb774fd5df5ca880abac54d24cfbce67629dd4ab2b722a10",
-    },
-    "0x9af3b7dc29d3c4b1a5731408b6a9656fa7ac3b72": {
-        "ticker": "PUSD",
-        "signature": "3045022100bfa2a989bbe0efcf2c8da49b356da55c00b4b434afcfe4eedef863ccff92df4f02205d6ff069bcc8c60d2c891528498667057223ed65ca26867b8aaceb991d113d19",
-    },
-    "0x5a3064cbdccf428ae907796cf6ad5a664cd7f3d8": {
-        "ticker": "PYQ",
-        "signature": "3045022100fd7084feafd0b7aa463ec98d8e3df78c2aa0c661d56b6d0e1b247dd9fb0cffdb022040b00978f591d18e2d2f197c1d511709302ae970a2d20eadbec36fdfdb254eb8",
-    },
-    "0x430ef9263e76dae63c84292c3409d61c598e9682": {
-        "ticker": "PYR",
-        "signature": "304402201f9a2c5b19732e43d8e09701aa2969e5ee1b0394665cecb558dd1d0afa962bc4022057cceedec8dd7fad2299463f50f91b1e098b4d6f3f864bd1ae5fec5ea63ef36a",
-    },
-    "0x4fafad147c8cd0e52f83830484d164e960bdc6c3": {
-        "ticker": "QWLA",
-        "signature": "304402206836dc89cf4314a146ea70b33a77846f01fee597ee579459f8da62b08f55c268022000a0114874657db63099358e0e0794093769e622e13102c4b9d9b2b6b85722b6",
-    },
-    "0x580a84c73811e1839f75d86d75d88cca0c241ff4": {
-        "ticker": "QI",
-        "signature": "304402206efdc615e0a058701d70bd924a858d8cf38214d1136a170e19a680ae31395f23022049c98bf1df2c5d7d2d1739060c0554f8631e278919b3a1e739246bd848c2bdb7",
-    },
-    "0x63c54c41794e14d283123cd38895f7abdf33c379": {
-        "ticker": "QDO",
-        "signature": "3044022011cbe29a6664b84f2f2f3ea57050b5a47c458423ccebb1d26871cff018de12fb02207b9711a95238fb1687615a5023f34fed11737d66fcc4665af81f3e3d64ed4259",
-    },
-    "0xadeb98a12b2cdfbdb45cdd2274a369e79a7002e0": {
-        "ticker": "QTK",
-        "signature": "3045022100954c40edff1e4247f414700178de96541c0febed12cc896ddb36d67029db14ff0220217cbbd0247c87d5bfe4d794734c5664d00849a92edabf5c562ccb19ccad64a9",
-    },
-    "0x87e28bd5499e6846141a85659bc7f0cf815db11d": {
-        "ticker": "QUA",
-        "signature": "3045022100b9116cd141c4776f86aabb3428230160c2c36994480140bd0c14b9abfa7f8eef0220563d5f3af00dcc930b89db91e0636db84f0abb3ac468ebaae4e2e7b0ada9389a",
-    },
-    "0xb5c064f955d8e7f38fe0460c556a72987494ee17": {
-        "ticker": "QUICK",
-        "signature": "3044022056602cda616e541b712305f3a9532476c39f66f2e95fc05e6f01c590cb30cf3e02204acb3ad119714f52778df02b153647ea1de60265273532d988064b8db68b0721",
-    },
-    "0x831753dd7087cac61ab5644b308642cc1c33dc13": {
-        "ticker": "QUICK_",
-        "signature": "3045022100d41b9bd54ca50fc882fee121f0b783934c89a2b7b8ab1ff459377b2e28c4140e02204dc53577c8ad9e37ab1820925e86f3511185adfaab83bcb5fcfe9dfd740771cc",
-    },
-    "0x123706cdd8e60324e610e9a2cc7012d0f45a5b8e": {
-        "ticker": "QUIDD",
-        "signature": "3044022057e04f04f6dd523f3f79d2bcd0f1f8521df3aa6d17851da99c6808a93a384dff02207c5a3d9c4481ed00df6d64beb74c07009fb76961d0a4838f060b0b7a7b7ead4e",
-    },
-    "0x28767e286113ab01ee819b9398a22d6f27badb6e": {
-        "ticker": "RABBIT",
-        "signature": "3044022014cd49f5372311990cfe0afcc5f152ace5bfeff501d012b63686514e57ae9cba02201d46a0c79c23fb9acacaa4b1c4296cf1c2d996c14ee140125024ebc0957d9c3b",
-    },
-    "0x613a489785c95afeb3b404cc41565ccff107b6e0": {
-        "ticker": "RADIO",
-        "signature": "304402202f1b174b2c03a8dc16289b5252dc0d5c91bf9bfe1722898f1df61297a2cd1bc20220037b6200f89056264f04d315008c443499fb5b88ccc3902559530972436426bf",
-    },
-    "0x00e5646f60ac6fb446f621d146b6e1886f002905": {
-        "ticker": "RAI",
-        "signature": "304502210081c4c30653fc56bdb9742160bae95b4b42e534f12b12e3da95f5f7480fba929a022062e7f97a49c5070b6989f4952a83e61e5b9b256fcfff3d5c13350b5baa3c2216",
-    },
-    "0x34d4ab47bee066f361fa52d792e69ac7bd05ee23": {
-        "ticker": "AURUM",
-        "signature": "3044022024f75ff5e8250e24335c945794a40919b96c77ad418745b22f3f7c443c7cecdd022019833e1e6d395c5adc2c1584e0070e6c453b5d9d33aecb50eb8c9fc66566d750",
-    },
-    "0xcd7361ac3307d1c5a46b63086a90742ff44c63b3": {
-        "ticker": "RAIDER",
-        "signature": "3045022100b4306da5314fa83313fd080fe9d92e2fffd5492b9929e9ede6daa8e516c1898402202fd296a3cf8c43113dab3f6515ed596842a4fba417801481c79e190266bbab20",
-    },
-    "0x8e677ca17065ed74675bc27bcabadb7eef10a292": {
-        "ticker": "RAIN",
-        "signature": "3045022100e6015f71e3953ef3c1df243d15eb93a713e201680a7e14920f3be58b5f8f74dd022031584caa8ef7541ac84e8f1a9f35b533c57912109a9d3c60547e89535af34faa",
-    },
-    "0x431cd3c9ac9fc73644bf68bf5691f4b83f9e104f": {
-        "ticker": "RBW",
-        "signature": "30440220110d18df08814a6985eeefcc2c5bffc4d642df7b6490907cc8fa42ad92b5d13b022030fe0b2a47f7d9486ae30848ec318b7966fa7be1fdb871fef73985856ad83a8e",
-    },
-    "0xaecebfcf604ad245eaf0d5bd68459c3a7a6399c2": {
-        "ticker": "RAMP",
-        "signature": "304402203b9dab41d430c662ff37b74e59c0724b133ebae197db240e02c41e722e2b0e69022048de562d170c16c2412e3451668b407d7497eee9771cb999c12ae33935ea5815",
-    },
-    "0x780053837ce2ceead2a90d9151aa21fc89ed49c2": {
-        "ticker": "RARI",
-        "signature": "304402201d63d1eca3dcc61f0c155bd0cdb34c5cd7c2ac446a64d8a25c2fce5dfc0ff11a022012243245f3ce383d22c2bf8a164f23f9b59c1ea9ce8a9abaf681df4dcc3e30d6",
-    },
-    "0x2d027e55b85429e9f205930a8aff6d8e6c8c3021": {
-        "ticker": "RAYS",
-        "signature": "3045022100cdccdb856b56aeef0e27a87202a703b24d45e8be78e506a6b5a64b4b380bac6702202b6c4d25ee71d01e6ed229a8780c78379fc03dcd73e09fe894abb64d41156736",
-    },
-    "0xc91c06db0f7bffba61e2a5645cc15686f0a8c828": {
-        "ticker": "RAZOR",
-        "signature": "3045022100803463662aa740350a320f75f05b7d088636b7d0eb9faf167b39b7be975f739c0220652772f9710c59ea790c0d80ed0fe879d887437c600d4f31544c115a8f6c2f2f",
-    },
-    "0x40379a439d4f6795b6fc9aa5687db461677a2dba": {
-        "ticker": "USDR",
-        "signature": "3045022100946f86de7c550c7cb1c8b465b3a9ce1627ae663d45bd5c20a2538e7d2b3e473002206308cd90b9014d47ceffafe5f7a8b4afc8c16d312d4ff45733e9fc985e54f50a",
-    },
-    "0xf695f9499d18584363aeed0eba4c381d350f81c3": {
-        "ticker": "RVR",
-        "signature": "3045022100d5ac8bc79fc19d60cf75a2becd6a4d4f99c3f13b230e43a6f0b681517309fc4602205c80fb402285ed622f6b04b6aa01c4596e2798c2f09cf5c0f1f78b7626f0ffed",
-    },
-    "0xf0949dd87d2531d665010d6274f06a357669457a": {
-        "ticker": "RMV",
-        "signature": "304402205cdf2c44938dc235619bd8b261c11b3025540c1a85bd9ee600faedbca338cc9d022039ba851389fb6309258c8342e950cb49fe5d3c1d1721169951fd7127e899c802",
-    },
-    "0x1b396cf90504686b7ede2760eebb053d30d1f389": {
-        "ticker": "RLTM",
-        "signature": "30440220176d619b1ea7b50d66dc231bd0b18d8a0fc6d1830f21df7c8621ddeb8e76e04f02203871f37dd327053e59b3dc253bbd5b9943f0a58b548b696536da8dc6d539e6dd",
-    },
-    "0xa7aac53f7c860b1f9d610147341c57579c51403e": {
-        "ticker": "XOIL",
-        "signature": "304502210086e690d0366e7eb1ea7737ce407693abf236ff9d84411722a9bd9db1bd07281602200ad3d78eee9ac4ee056095578d212124b5e50f8bf8ded1ee23d5580daf82d862",
-    },
-    "0xe26cda27c13f4f87cffc2f437c5900b27ebb5bbb": {
-        "ticker": "RBLS",
-        "signature": "304402202e87fd489b2ac2c3e434de78b7ba2afee7fc41cf83adc6bb6cfcb2e5dd7528ef02205cac20cea37f560f00ea71b06b53ed1c4843f5cafb8aebb7d3a714e9445f32b0",
-    },
-    "0x1e553688199d99d063c0300a12395f7cfedb03e1": {
-        "ticker": "REDAN",
-        "signature": "3045022100ce8e7ea4deca26940d0baf5abf24f2fe5ed2464b70eddc772637ffb4a0eb5afa02201486e2b281e710db55e84d271d836d2cc6b7c61fdb45e5a08bffb706e5f4bc11",
-    },
-    "0x19ccfe396006ffe7a92ab667b0ef90ce61b66f9f": {
-        "ticker": "REELT",
-        "signature": "304402200d9dc0b4b6e0046957fc89b589b0fc01c09d0c6457d792ecd5e8b68356b8df020220373828dc42786b41ce18f029e2d8a3d5b75b3ebf3a9b29a6adc300eb24310bbb",
-    },
-    "0x27ab6e82f3458edbc0703db2756391b899ce6324": {
-        "ticker": "RNT",
-        "signature": "3045022100af1a398d182ce8af8ad68cde8271b71796ea7b17d245ee5ec29b8555a6b5234e02203065edee41bb08d429b79f4bca53d24031ec199b539c6ab9d5c00f8555e5bdf9",
-    },
-    "0x904371845bc56dcbbcf0225ef84a669b2fd6bd0d": {
-        "ticker": "RELAY",
-        "signature": "3045022100a30ae08a360cfa4bb812092aa9c6722665b63e75aa456f746c791e254f3f157c02207217d9a34d336657bb246c87446b123d168be4b7935cde6498833274a35cc50c",
-    },
-    "0xd6c23852b94fede6ab571e4b4cfdb745b49dc9eb": {
-        "ticker": "RENBTC",
-        "signature": "3045022100c05722046d1029e5be43e39344b8bbf08ceb191e1cb308bd56d531769dc4268a022017b53fff3c2aa453070696d94037f583fbda8f68d5758afa701eb3b141f4bc0a",
-    },
-    "0x61299774020da444af134c82fa83e3810b309991": {
-        "ticker": "RNDR",
-        "signature": "3044022042d62a1be583b33bf641857e3519ef7422a350e21258f030b8c25fdd4c7e8260022052f4e10c82849f947f4a5acb87db379c56c84576bd083073c16a6a59869096cf",
-    },
-    "0xce829a89d4a55a63418bcc43f00145adef0edb8e": {
-        "ticker": "RENDOGE",
-        "signature": "30450221009459770c7f112f22fe117f69f315d68f97fe0e4627415732e4ff57e9f768052602206a26ff549a74a8c5c40e114bb19e3f2cf30c0f7dec91d5745148ff218b5236ff",
-    },
-    "0xc4ace9278e7e01755b670c0838c3106367639962": {
-        "ticker": "RENFIL",
-        "signature": "3045022100bb66e93c3aa7aead7ef944c20614e837aa963d064330d0b98ead27c915101c1702204fee135f515103754423dd144d822efadceb848489508c2477150969a88242e1",
-    },
-    "0xb25e20de2f2ebb4cffd4d16a55c7b395e8a94762": {
-        "ticker": "REQ",
-        "signature": "304402207d4a4d64ba7d7e41fd03eb5dd20703119108efaf6de3671149e69fd305e98673022062d55ac8e8cba6b42de22bc687669ab4a9864c92ab99092d1d0d8a5b199e9a8b",
-    },
-    "0xbfa35599c7aebb0dace9b5aa3ca5f2a79624d8eb": {
-        "ticker": "RETRO",
-        "signature": "30440220644356882c0f7fa30ec455274621484569d3326c9f698c6bda54851e55aa648b02205934c9da89bcba6be428db7b2c996d9ddbfcd784285ec777b4530c493eec48d4",
-    },
-    "0xf0f9d895aca5c8678f706fb8216fa22957685a13": {
-        "ticker": "RVLT",
-        "signature": "304402205332db04c46fba362200b84d66828d3591d273048f53a8326b91ce882dddaab6022018d268e7667147584fbdbd0a361094bdc7721a392d340f6894dc563e20fc0be9",
-    },
-    "0x70c006878a5a50ed185ac4c87d837633923de296": {
-        "ticker": "REVV",
-        "signature": "304402203d883d329adb570698e893c5ad8f83b3716e89f5e8749bac4a742c83f741e5ca02203884a0cf71fdedbb30d41ec293722cc39e89b2b31fd9d0ac4363020c39bbcaf1",
-    },
-    "0x3af2dd7b91d8faceccc26d21a065267817213d37": {
-        "ticker": "RIB",
-        "signature": "3045022100e5e26eddb562a51467f2b2070b3880b2f21607510029dfc42c74da5b7916c7f1022069fa4a5cb7fc15d212592981f3adb449ed66997b98473cbd035c3e2c99fb2ef4",
-    },
-    "0x9fdc23fe295104ac55fef09363c56451d0e37cfa": {
-        "ticker": "RKL",
-        "signature": "30440220437c5013e582eba707e7e8336e38a336686538cc6ed5689d05e69c6943b2cf3f02203202fb9bbf5c1f5952b0250e0f9e404fcb67b7794dc8a45b9ec506f73b760871",
-    },
-    "0x263026e7e53dbfdce5ae55ade22493f828922965": {
-        "ticker": "RIC",
-        "signature": "3045022100b63ad7d3dacb0dbd2f006372598474a0aec29345b843b99889c3da5ce4e6c07802201f49dcb4bf0b3d1a02fa2bd823e703d4bd23ea4f18436004afecf4dbdfd1afce",
-    },
-    "0x4af5ff1a60a6ef6c7c8f9c4e304cd9051fca3ec0": {
-        "ticker": "RGP",
-        "signature": "304402204f8b990d5bef8703b2aa9f0d15ab2c7ea32ecf8b90ee83b5e362b82f116deb43022008a9e7740382408304eb0a8020f3f53598af97978ec464bb0edc7023c821de11",
-    },
-    "0xbc0bea8e634ec838a2a45f8a43e7e16cd2a8ba99": {
-        "ticker": "GRG",
-        "signature": "3045022100d8c8f47a3c48089b486378cd5b2d747f73c89e0616cde9825b437653d1ea9ec6022011e275861fe1ada6d069a23cb50515af426d8b950bdbd233bc63517341bfddeb",
-    },
-    "0x4ff0b68abc2b9e4e1401e9b691dba7d66b264ac8": {
-        "ticker": "RIOT",
-        "signature": "3045022100af7654cca08733352dee67ade55420e1db11a7da72234a966ad3ade48a10f31d022020f7647eec590b0e3e037ec7e55d4b6524a9f0526a1e2fc0623e5e084229c263",
-    },
-    "0x89c296be2f904f3e99a6125815b4b78f5388d2dd": {
-        "ticker": "RCN",
-        "signature": "3045022100b5b8c036b1906e9f286ac8ef6ccf20bdbd944c22476b1a4fc7a8cff541cbfd85022060c5a569ca87042188efaeb352fac5cd41a9f0416aa304e713684232cb009ed1",
-    },
-    "0xbe662058e00849c3eef2ac9664f37fefdf2cdbfe": {
-        "ticker": "RLC",
-        "signature": "30440220763bbbb5486d36f9d455764c8632008b1c5b67d45c099e3ad492b8ecbbd290f5022007ff2d836f1668768f9abde172de2a7e5d11299f12a91b1172e17b0f4263c610",
-    },
-    "0x524d524b4c9366be706d3a90dcf70076ca037ae3": {
-        "ticker": "RMRK",
-        "signature": "3045022100d2d9d2d23a3bdc60831c10e578acb57463c9a5751dd7b168f2d5ea26c72b57280220438eec068c2e06a20d3d7df98b860637751fccb472cdf979e8a4f2237a946791",
-    },
-    "0xb3bc8dae5a49ed956b5d2207d9040c816c56398f": {
-        "ticker": "RBN",
-        "signature": "3044022014b22977c9a53164aa179f04a9c20195025947039188e8109cfad9c99000c44f02200b6adddc5fbc18f37a9802b16843a2b03efa8d9fcec61d550e51f1c93aaba1ca",
-    },
-    "0x7205705771547cf79201111b4bd8aaf29467b9ec": {
-        "ticker": "RPL",
-        "signature": "304502210088e2753ca251b934fb95645f451b30f0d69b72228f76e671c71f4784d80523df0220695ecb3258a48d7fc434e73910e1718b20a6359e4501c796d541337a2c820a79",
-    },
-    "0x0266f4f08d82372cf0fcbccc0ff74309089c74d1": {
-        "ticker": "RETH",
-        "signature": "30440220304e312655d54140710f300c0cb1e422ce4990ded6458e79b8f8b58a9dc1de4902200fadac938538585de47e38ad9f9b7598cdc504a86a78a7e6036d87e9550e5402",
-    },
-    "0x2ce13e4199443fdfff531abb30c9b6594446bbc7": {
-        "ticker": "RVF",
-        "signature": "30450221009174bc43f12d3cc4550b8335e495ebd7b9ba01e7ef1305c7ef474e4e55f3c95e02207fea7bd3e98b624bcae524047d60e8edd6481d6ef1cf94ea89b94326d73cc730",
-    },
-    "0x204820b6e6feae805e376d2c6837446186e57981": {
-        "ticker": "ROND",
-        "signature": "304402202f3cae018d1b62b34fe7ea27106069bf4ae955fa75ed37baf110827b075b6df7022042d0fb893ff9738426efb5632db9c20e37547f33e3495e91aba752bb813c6166",
-    },
-    "0xfafa220145dfa5c3ec85b6fa8a75aee2451cde5e": {
-        "ticker": "ROOBEE",
-        "signature": "3044022014dd66d04b09ad030220a772e7370c51b7f8929de1d4c49e3ced34480ddf9b3f02207e6939cf57ef8a3f8f8f6e31e3026236ce333ebddc059021e66e3692c1ae4ca0",
-    },
-    "0x16eccfdbb4ee1a85a33f3a9b21175cd7ae753db4": {
-        "ticker": "ROUTE",
-        "signature": "304502210089f5b01d29803b7a94d038092c05f2378ed2fb73a4bccb8a08fec6e75f43836302206851dfb9b543f033484550b1041bdc9bed00d43a03b70bc3d312c8edd94c8314",
-    },
-    "0x68ee0d0aad9e1984af85ca224117e4d20eaf68be": {
-        "ticker": "ROY",
-        "signature": "3045022100bb29c79e764e850aa7062ec35a4821241d3d4f3bbf355278d256283e77007f380220664379de00f2e2ffd0d8853dd826bd668884b5c4c4493cdc6f4e1fb4f93f3fad",
-    },
-    "0x0bd820ad2d7ab7305b5c9538ba824c9b9beb0561": {
-        "ticker": "ROYA",
-        "signature": "304402201224755fb53aba8a273125d57cdbeaeb481522015b64e6baacce7e3217e44a65022013c2b57d2b492a32953f4a4e45038e0ab7dae41b01fe55c53778fc573d597db7",
-    },
-    "0xfddba7ca7af59ac1b3cc144c08db9bdde7378dd5": {
-        "ticker": "RUBBER",
-        "signature": "3045022100a4c95a48968cfa3d6801a2060ee5de29a32008d39d47c36e263363dc07c4f8b602203980a1dbca5b537426addb4165f46f26532da703e2d8ab30ffd9cf59a6f54795",
-    },
-    "0xc3cffdaf8f3fdf07da6d5e3a89b8723d5e385ff8": {
-        "ticker": "RBC",
-        "signature": "3045022100f849984f462557a6b74b48337387eaff6439cba4e90242e958d91d5e3c88e5a30220740585ce2bec064bbc8c9a4a77b1bd7c923ffabf97b0f1ee6535237d759985c4",
-    },
-    "0x578fee9def9a270c20865242cfd4ff86f31d0e5b": {
-        "ticker": "RUNY",
-        "signature": "3044022075f74f9b7e592b0b439a3e922b2400434f09e29ca96bfa508859560d0db9b1c9022030419ad1055615f0f4b3b64be123802ceb6d13bdd5c3eeb20c494acd5aa01c21",
-    },
-    "0x554cd6bdd03214b10aafa3e0d4d42de0c5d2937b": {
-        "ticker": "IDRT",
-        "signature": "3045022100c7d2178197753053d68e9891076969e31728bf240994ca84c647ace6a98e2dc30220355112c7cff7b09cf8891d9c39d9641511da9faa92eca77cb8fa8de94bec739e",
-    },
-    "0xfc40a4f89b410a1b855b5e205064a38fc29f5eb5": {
-        "ticker": "RUSD",
-        "signature": "3045022100ea5840aebbae725c167dbb50e5321e5b7c4c9aa422841b0d0c810a1e719bf2a402203c60344df5e444136a256b7c1513d33afa14649dc890d9877e6cc1c3cdfd4f0b",
-    },
-    "0x182f1d39df9460d7aef29afbc80bbd68ed0a41d5": {
-        "ticker": "RUUF",
-        "signature": "3045022100aab83e02f9f6f2d9b67a8ccb95589a18d739a64356471fd7c694024df3ef35140220264eb3aaf1c22efcdd10169462113f3ad77fcf4c53cc89c9a8c97941f592035c",
-    },
-    "0x534f39c5f4df9cb13e16b24ca07c7c8c0e2eadb7": {
-        "ticker": "SHA",
-        "signature": "304502210091fcb4abdcef040568cfa13f074ac7d3eee78b9059b308d59178964268bc135202202ff4cabe53468d3440d073b496e4aae3d131c409891c794bef7edf565fcb28bc",
-    },
-    "0x66c59dded4ef01a3412a8b019b6e41d4a8c49a35": {
-        "ticker": "SDO",
-        "signature": "3045022100b9cd7e36d080fa92721d5ea291caa453784a3b84070fe0387ad5018792a0648a022028b80062c9598c4977b9c2e5e908371599801732ee8341f55c0758d51f692d3d",
-    },
-    "0xab72ee159ff70b64beecbbb0fbbe58b372391c54": {
-        "ticker": "SDS",
-        "signature": "304502210084d9c869d4bc12ca8a6653a736c52284fbf9503bba4659acc52161f7db97213f022056fcad1644a1cac28d21a905c0376550cb430105dea74112b841e5a20b2564bf",
-    },
-    "0xd0cfd20e8bbdb7621b705a4fd61de2e80c2cd02f": {
-        "ticker": "SSGTX",
-        "signature": "30440220471e84c5fc013f0d1904baa8d2ed05112f264456ab3fec83510ff89d7ac01f9702205b3cac3eb897827a3a59ea0f6070b9a0e3b8f7801c22042709a9dbe211159a1e",
-    },
-    "0x04b33078ea1aef29bf3fb29c6ab7b200c58ea126": {
-        "ticker": "SAFLE",
-        "signature": "30450221009f55fe0c97e57154540fa0cdfd962de7199e97467e62a82c78f301e5ff9f155402207b140c00d24a1068bcb13d9fcc68265f963568f0b193deb3e37d81f58bfef325",
-    },
-    "0x1c356b463ce3e46cf494f5fdd2172bdffe5c688d": {
-        "ticker": "SWT",
-        "signature": "3045022100db49c93a6914204b12fb29118d05c40e8b4816f669182da432645ccf37ab5934022006f8f5a7d09cf6abdcb97b51842a8fac755c2b1c16e0d75f732bf68d8349da23",
-    },
-    "0xfca466f2fa8e667a517c9c6cfa99cf985be5d9b1": {
-        "ticker": "SPEPE",
-        "signature": "30440220401c62b1501150b2b717ec10dfef46ef202034eb74b67138d7854b8a1ea766530220151fe32e8c993c3235f1caf2d399e7a54584460b41c5e551b8b6e3d85ec074b2",
-    },
-    "0xbbba073c31bf03b8acf7c28ef0738decf3695683": {
-        "ticker": "SAND",
-        "signature": "3045022100c21119cb079c76295c8524b3091064854b02ff371416a1a5e48e9095edb3bfe502206f785716e63e80a99eade8d3fb273031614393e086883d866b5f9db2809b9ebc",
-    },
-    "0xc6d54d2f624bc83815b49d9c2203b1330b841ca0": {
-        "ticker": "SAND_",
-        "signature": "3045022100e49d3eb141bdd203f2c1b85d351540ab0632be7a398a39498182387c4adc3875022027f9a9c5f5927727682d71e7224828dbc79926991cee0521501c840f8cb2e57d",
-    },
-    "0xa91fe5a535967f52d3abebdffb3b306d964ace13": {
-        "ticker": "QUARTZ",
-        "signature": "3044022061ccfdf8cf0ac2176d69cee97832698c5388f28f15bde89a89672a30a66d0bf7022072a4942fc8f162dc4eb4fdc9df4a1e31b4c8408ec85a006800e2d1bc126323c1",
-    },
-    "0xeab9cfb094db203e6035c2e7268a86debed5bd14": {
-        "ticker": "SPN",
-        "signature": "3044022077e4b88efdb063bfaea7f1cd49b1e3698c7eec3f700889a34f2df8c5e6dc5f44022036ccfac493a01ef8268aff6b295633b36ec5df127c74daf35d8c3ea2eae91f01",
-    },
-    "0x981aecc6eb4d382b96a02b75e931900705e95a31": {
-        "ticker": "SAVG",
-        "signature": "304402205f0cec58a40bc91eb6cc18402c76918c72c1698d09978d971b9cff9144904616022076dfa403a7285d25123f77cb4b335a887567e3c4f99b729ff27333078a772768",
-    },
-    "0x11a819beb0aa3327e39f52f90d65cc9bca499f33": {
-        "ticker": "SCA",
-        "signature": "304402200f68db6aa9c8e21078cf0470b14a13da6b36ae4a1277e4720d3f98f784384fbc0220541c2e31f605621175e541cbac43b4ea9509f57f618b15a8c8aa077965510e6e",
-    },
-    "0xc79fc2885e207e1c4cc69cf94402dd1a5642452e": {
-        "ticker": "SEAT",
-        "signature": "3045022100a34d5fc7ab34190c3cd9c5bdd0e917f85e75ca33d8a36990cab43c76f3e6a796022013c70de6379e7c694df1420657991a839a49e83542fce14d2578289442189c2a",
-    },
-    "0xeaecc18198a475c921b24b8a6c1c1f0f5f3f7ea0": {
-        "ticker": "SEED",
-        "signature": "304402202c5c4099cc08d5afa31e8b253dd72bdab7c6c8f7ca7bf09a1bf6561b7d71d6c602206dbd9ff3d06d67527fc8e58e4f772c2f5f0d9b867cc8c53794a2e298004c9294",
-    },
-    "0xb72a9796db06d52cc2f8797765561b612d6db45a": {
-        "ticker": "SGCN",
-        "signature": "3045022100f1d0f9a6bcfe53d25c0fd8dcd9f7fa16bc2bc11c4e837e7f5e38a1c4df509d5f02205e5ffa843d694617f9e87b500c04cf98fa5a3b844f134b97f52cc138be108ddd",
-    },
-    "0xe51e88dd08499762b8e4eb3a9f3da9b8e79608c3": {
-        "ticker": "SKRT",
-        "signature": "30450221009a5f69aac654cdd8cd3893ee4871d7c3afaaea0818e368199fcec15da8e15bb60220266deb07c25b56fd036501e0b95a992c93d137874d391a9805854b77e5c6897d",
-    },
-    "0x6c526368e1185e4cd8a50468eb3429c5aeb674f3": {
-        "ticker": "SBAR",
-        "signature": "30440220416f3bf8ce9f758dc93e291d490fbacbd30711d7535ebed02aa53d74318510c3022039449b6dd55c2a7d63136a944050e9b447f1fa52b58e6fee30b1e271495f962f",
-    },
-    "0x32dc2dd3c2be453a369625e6fe0e438aed814919": {
-        "ticker": "FXKEY",
-        "signature": "3044022076076ca9bedfb2889eb0a340c128bdec6fbbd4d9ea35837a60fc88c31ffa51f6022010295b38269b7e12021ecd4c7001e1b4c8e76b150669ecc385cf33fd5545c98f",
-    },
-    "0x688b4231472fde70c1d30f48638aa1661725d3ce": {
-        "ticker": "SENDC",
-        "signature": "304402207a00260e6d48bcba86e9b25ec496fa1a353360fecc24670a389503d4a3bf3be702204231b58664d47751a91965e07834d7af3bd5d7ee2ac89b6eed9e03c225457f46",
-    },
-    "0x48e3883233461c2ef4cb3fcf419d6db07fb86cea": {
-        "ticker": "SENT",
-        "signature": "304402201f023fd294b88242f14e4061fe352aee3aeceaf28d47c3989f1ea7aa97f2aa0302206856a4013b36c60d7a0fdcba49e43f007d252cddc25cecad7bcaf71e59eab064",
-    },
-    "0x6bf2eb299e51fc5df30dec81d9445dde70e3f185": {
-        "ticker": "SRM",
-        "signature": "3045022100c649349ccb7fa669ae7fcb0397f145d7ac72f1fb472842b28d838b250595c9ef02200b67a2fb4e51dee5b542d74d62dbea0892e0fc59e9a0c02772670cf83f327056",
-    },
-    "0x6e65ae5572df196fae40be2545ebc2a9a24eace9": {
-        "ticker": "SHACK",
-        "signature": "3044022019fadb2095a21e3c35effaec569b168560c0268a94ae840b08ec9412ef86ec7e022050d94ff21795731bf5ad336313566d3940a5710f90ab908d329ce031ab84e01a",
-    },
-    "0xe156987a81a9b841c1def6f111ea69bf817fb272": {
-        "ticker": "SHARDS",
-        "signature": "3045022100b32ca8c73e2d81fa7c0e91e4804d6071651dd395cb9d831ce88c68588b0caa5802205e979c788dcd2b936735854aa4a61763da55026b71e5b5a8cb893a8302ff0473",
-    },
-    "0xf0059cc2b3e980065a906940fbce5f9db7ae40a7": {
-        "ticker": "ULT",
-        "signature": "3045022100868d7c77036de1619d4a95c8d57e83251e818ea59c1a46df2efafc758de5bffd0220380a111481edb6e59513f347a9962057931d68c6495a9af2a1d286c43d8d6df6",
-    },
-    "0x88c949b4eb85a90071f2c0bef861bddee1a7479d": {
-        "ticker": "MSHEESHA",
-        "signature": "3045022100ec681b71c4168e44785551a842ea2d47c221cff0422cf02db782c73d95f12c8702205ea4caae86946072a4a8f3daf507cae7e3239efd9188542cf7bb41817a51b559",
-    },
-    "0x6f8a06447ff6fcf75d803135a7de15ce88c1d4ec": {
-        "ticker": "SHIB",
-        "signature": "304402200e72cffd84b0d023de4d8f7e22e79f32046c593e279d625282c02dd048d9edeb02203ee10afe9b3c70e92fc77fe2704c8b5271971f062f86f133f100946ce6572a1b",
-    },
-    "0xa0cb0ce7c6d93a7ebd72952feb4407dddee8a194": {
-        "ticker": "SHIBAKEN",
-        "signature": "3045022100fc231dba0aa863c551d4821eb30419c78c084e03c291267ff46a21dfac9d3d3002204f27fd3ea97a9a4e3338e0f827c3c8748208d03838cbcc0a5abc565e0982f91c",
-    },
-    "0xa1388e73c51b37383b1ab9dce8317ef5a0349cc5": {
-        "ticker": "VERSE",
-        "signature": "304402201c0d9e2240f8145c89fabfaf3a2561b6ce11cf9e633fd7281762eb0fcc6a07a90220370010d68de739a5f6cf3e39d1347f94b9035487b1471c09c6eb3784e1234378",
-    },
-    "0x23d2b1788d17b70ca6cc638ed75247836302b8c7": {
-        "ticker": "SP",
-        "signature": "3045022100ecd6dabefb944193f9534157b1773be5840779a0d6fbeaff46ebded21db4427f02203aec46c0fb500cde73fcdae05f6342f9ca7db450b3fab4fa2574c9103f20317c",
-    },
-    "0x2b72e322a29964a1172812021a0fd8d84dc26a5a": {
-        "ticker": "SHIBPLUS_",
-        "signature": "3045022100ba0640138fb11c720ef7cdcac957c18a948d2905c4164ea1722ee25b6d75e14f02202b9244b431e3ee58f0c4c63ff0927077f765ab26582800b4d73d60926473f84c",
-    },
-    "0x068180071617528606371c31892ecbf2b70ac1d2": {
-        "ticker": "SPI",
-        "signature": "3045022100a62733824ef978d69bf87b0b58cf62781c4dec1986e88c79a9ce90252e1a48c902202ce77ea5f7759fe688619f0a8bec2528b459c715e47c3d43636e3d94f2c9c39c",
-    },
-    "0xd14d1e501b2b52d6134db1ad0857aa91f9bfe2dd": {
-        "ticker": "SWAVE",
-        "signature": "3044022006d501a25e4ce0901881ac8d1ea09523c6822b4ca465d8c1ae9042f6886a7f4602202f1ba4d6994f3e3317b85b7fcef34f276b5ef7e1f5b01b57a4f5dca97deae2e8",
-    },
-    "0xa7051c5a22d963b81d71c2ba64d46a877fbc1821": {
-        "ticker": "EROWAN",
-        "signature": "3045022100b54665023e6cb06a159d9a865363a43320f6a14d955e918d9591ad6f63bb4a0f02201f8c554208ba749f0108b1b63ff2bbc21900f2c939858dc2049526c53017a6f9",
-    },
-    "0xacbdc2b7a577299718309ed5c4b703fb5ed7af90": {
-        "ticker": "SIGN",
-        "signature": "304402207267bbfa041576b2bd13ee827383ac50b7663ce4d856ecba3873a7d0c48913c802201ff9f156066f9eb17a0ed31b40039502763c13f1ad5077cc98d20a4b1d8e0518",
-    },
-    "0xcb898b0efb084df14dd8e018da37b4d0f06ab26d": {
-        "ticker": "SING",
-        "signature": "30450221008eca13c9ea5cac62e3ce056397f9fd29c358df7aa88b65342fdcff8ce4bd526b02204cc329a918a5b26ca5d866bea581898bf2a68ba9527fb11b44625e70ed1c5845",
-    },
-    "0x190eb8a183d22a4bdf278c6791b152228857c033": {
-        "ticker": "AGIX",
-        "signature": "3045022100c8522f1c1ab31af32f71740b443c3cc1039c74764c59d4ea15cad27c4097410802202a2dacb662495b79a7573dad329ae177d40bc37976d94a9d4ec9c1eedd21c7e7",
-    },
-    "0xb044e4d2b145a8e7832889fc4609f654446c22f9": {
-        "ticker": "SITY",
-        "signature": "304502210092806cf110f77f9d371586dc4bf6806e73660373d6c225aa42b5cebf9e204f2d022055518913c4523822693ee48ff5ce9342bb163d00aaf9269141b859e2d1633d09",
-    },
-    "0x863d6074afaf02d9d41a5f8ea83278df7089aa86": {
-        "ticker": "SKILL",
-        "signature": "3045022100bfda30262b1f3d6780ed1efcec9272952451d72422611ae501df16a2279e57c0022055b5481409857c16b68b27acb16bad2a805d0713fb2fed5804788095d37bd612",
-    },
-    "0x4c665bbafd28ec9e5d792345f470ebfca21e3d15": {
-        "ticker": "SKP",
-        "signature": "3045022100c4149870ea44410b7f8f27414e3c5007bdc3a9ad3c48c41f87cc672a6f4443d4022045ad28cf674dbb4876dbfbd1b656146a6dfdf680239e8ca044187cc632074aad",
-    },
-    "0x5dfd5edfde4d8ec9e632dca9d09fc7e833f74210": {
-        "ticker": "ISKY",
-        "signature": "3045022100d6498047ec18c426a5eb3b39f70fff235aa44766294f7588a5954638d849f66802202d10338e34c234d1c7e9051554a69f515ea28461d7afaa96606a3d94addca9e6",
-    },
-    "0xfc9fa9771145fbb98d15c8c2cc94b837a56d554c": {
-        "ticker": "SLING",
-        "signature": "3044022058bae09a421a6477676e1a68bccc9503e2b375b0165a4f0edcf8b3f338cca902022051695e1b1bc25266eeb616274e84268d90032a76aa56ad7d6d1d39bf1f2dc218",
-    },
-    "0x6899face15c14348e1759371049ab64a3a06bfa6": {
-        "ticker": "SDEX",
-        "signature": "3045022100e038f32112bc8b41db5171f7d48ebb12a57e00e8954700df2d39f692d3ba661102202fad915109aac4fa75d42f78582513acb0f1bbb3d8472ca2a3fb5469eed6c2f7",
-    },
-    "0xfcb54da3f4193435184f3f647467e12b50754575": {
-        "ticker": "SML",
-        "signature": "3045022100cc569ed35eb0ea9edb9d15ce1a58f65dbd26aec0d613d16668f3af0c8da35f8102204766cfa954c8049b7106ca826cd0d122f65a2b8ee8caee2ffaebbdf07bfa9b24",
-    },
-    "0x689f8e5913c158ffb5ac5aeb83b3c875f5d20309": {
-        "ticker": "SNK",
-        "signature": "3045022100f578a22e7375727ad66608cb613cce40696ad356a0d4121f218bd38d523c20b802202e2b9eac1fdc91412c0d2456dffe34aac3a8025c61b6a87827e62f350c7c9990",
-    },
-    "0x79375c41d88f839f551457145066096c5c8944bc": {
-        "ticker": "SG",
-        "signature": "304402204a51855ea4ab669ee76493edc4d4e405cf6d0e0e2997580e256df63f01f01f7102205c4c2593d60334a50ec62987778810f9ff24bd7da819afc3222df5c9cf64166d",
-    },
-    "0x43c73b90e0c2a355784dcf0da12f477729b31e77": {
-        "ticker": "SOIL",
-        "signature": "304402202afd373088b83292a36c6948cd27e2900cd326eeccf5c187f161518110ff4a2d022044e4aa6a5e79059f4e80a94f035d2405e640bb7affce882ad561dbd92512e218",
-    },
-    "0x6d295da283c4c0658eafe608e4145e8a86777b88": {
-        "ticker": "SOLX",
-        "signature": "3045022100a56d9d08e32dba1f8046553e0453b6ab756a786904c8914da692bf6e507dfaba02204978c188a8311d47435af07b46894fecb089b9f11716efbb443cd1e0b245d57c",
-    },
-    "0x276c9cbaa4bdf57d7109a41e67bd09699536fa3d": {
-        "ticker": "CUBE",
-        "signature": "3044022001ccfbc6f93a0c490d945fd03b18adec9014f4bb97ec2eb2f77335a80569b3c00220523a878071639450255d795e7682216077499ade6a4f76dce7c0a463a556ae59",
-    },
-    "0xb53ec4ace420a62cfb75afdeba600d284777cd65": {
-        "ticker": "SPACE",
-        "signature": "3045022100ab84a0543dd829799c51c3eb0edb8fe7db72bd014816158e880f4a110eebcc2702201468551d0ea0f672978f9bd08f6e349dabfafdea5ac05e03b49fa95dc15f8361",
-    },
-    "0x1132f58810ee9ff13e97aeccd8dda688cc5eb8f4": {
-        "ticker": "SRAT",
-        "signature": "304402201ed3b017ce531c52a7f9df50ec38610d8463b7729e44511f1bf0f58d07bab49402201af4319aecd3c33a0209e355e195b2cc20fff1292b39f0aef67a10d0d2be35cf",
-    },
-    "0xeab490c06e17c1f652825dab7e9c237ef272839e": {
-        "ticker": "SKOR",
-        "signature": "30450221009c6ae549c11eea5ec886e14e3b0d59c35851d51b4fcdeea099998f32ee49a734022040370ccae8d4a03ff832f03b835cdfb62634b00fa49c1ca508f65b04be4c0fd6",
-    },
-    "0x62f594339830b90ae4c084ae7d223ffafd9658a7": {
-        "ticker": "SPHERE",
-        "signature": "3045022100d25b3cc1645ffe388b48ba7f64d07c241a77d4f1d9f5a64fdf52676d7b5e2eb40220623f1a59de52048f8d24751095ea0459dfe884c00ebfc059e695914af5973715",
-    },
-    "0x17e9c5b37283ac5fbe527011cec257b832f03eb3": {
-        "ticker": "SPHERE",
-        "signature": "30450221009d977c149bf7e8db755cf3edaab3965a023eddddc0a3c09d35db5824942aed1a022035d3d97f200c450a67636d2c95ecfcf9a89d9fa648af36a88062e87f9479f821",
-    },
-    "0x8d546026012bf75073d8a586f24a5d5ff75b9716": {
-        "ticker": "SPHERE_",
-        "signature": "3045022100dbbad95bb39b66d7949de8caf071a90ca17db658928b983b82c198027673cad50220055c168939fa61d4e13a10b166803d0f802ddf4b839ca06beb127fcea4296666",
-    },
-    "0x2fd4d793c1905d82018d75e3b09d3035856890a1": {
-        "ticker": "SPHRI",
-        "signature": "30450221009e6573efd3b40b74347e145ade4074ba00a44f480b8ce4e03c2b9a7db71d243b022042d6a7e6e10ce8cbc8f4055796bcceba395b2f75b08ff7fc648ef4fd6fce5bd7",
-    },
-    "0x66e8617d1df7ab523a316a6c01d16aa5bed93681": {
-        "ticker": "SPICE",
-        "signature": "304402200cbe70d782e20695a177493bc477c014972fa425e3e070bf8ce2596609e4398502206cee0486c6450561b5b3a34b19f6bd0e4f7d8cef6e3d0d8bbd3f6f3d722c9eba",
-    },
-    "0x2f1b1662a895c6ba01a99dcaf56778e7d77e5609": {
-        "ticker": "USDS",
-        "signature": "3045022100def5ef9ab5ec13a23a48d97e7ae15614a81824d4f306d5629ce2764db065aa6d02207ab34069cfc55e3c0570ebc3bd2e97d404dc7c1d18087f4af36f8bc22787bbb5",
-    },
-    "0x53df32548214f51821cf1fe4368109ac5ddea1ff": {
-        "ticker": "SPONGE",
-        "signature": "304402203150a0c38e630403373f091ea033ad89c3c16bf251fe8b1ff737efa397238495022006825312daed88f7f4be0ac1ea94968ae400e539254e6058db06962edc764494",
-    },
-    "0x503836c8c3a453c57f58cc99b070f2e78ec14fc0": {
-        "ticker": "SPORT",
-        "signature": "3045022100bea53ef4ba1c298d8e89581ab4a2564f87a99289e06c87c4e7a4ea843a591cf9022064929bf917ae06b7a32fbf0e46c4a83e1bd77d296493b838f1148ca4cb5ec70f",
-    },
-    "0x840195888db4d6a99ed9f73fcd3b225bb3cb1a79": {
-        "ticker": "SX",
-        "signature": "304402203b98cd2dc62d90d5d04b7c6b52404206968c6653581b2b1cc90fc2bd9286f7100220715ca2a4c99f6e84538c6c81740e20c90eb5654070c5bac784addcc1b9be71d4",
-    },
-    "0x94788309d420ad9f9f16d79fc13ab74de83f85f7": {
-        "ticker": "SROCKET",
-        "signature": "3045022100ec727b8ee762ce57b3ab252fb8abadab07fd8f5800bfe31abc9e5d7273e2db390220205fe0f44e3317a55800300677481c2990d2fdb0ba9de927115245e1193c46cb",
-    },
-    "0xd94a8f9caed25e63ecc90edfefaf3635ea1e182a": {
-        "ticker": "SCOMP",
-        "signature": "30440220518bfa8d1750b0622040bf6a3945f3c6b1e26f6037f40044da037b1fc4d68c7f02200e4b78cc01d0fea1950b34c8ccc43c9a35cac055f79f7e03b2ce65332a26b222",
-    },
-    "0x93fee753b548b4cf93c41ada062f80de12710db8": {
-        "ticker": "SFUSD",
-        "signature": "30440220376b447de1d589339bfdcc8d49649b43b591a077aa38b757e4cae855fdf3300b02202f68f8957e76dfe0becb51f6d8a131110352c41249e04fd165a621a76d5d2abb",
-    },
-    "0xcae73e9eee8a01b8b7f94b59133e3821f21470ab": {
-        "ticker": "STACKX",
-        "signature": "3045022100e195e85ff238799847a5af5c875f31c75e96b0bdcf55373e366bade150aaca2e02201a3fea5a53e21c1413bce6aa6cddd09a9822e1689777c22679c65c0899aeafb1",
-    },
-    "0xccbe9b810d6574701d324fd6dbe0a1b68f9d5bf7": {
-        "ticker": "STACK",
-        "signature": "3044022011c1caac8801e8a3209b04f8516f2618339ac18f9ccf2438f9793545772caaed02207956082348e52ab602bd61bc732c93d18a7b288d9b5c20a4bb9309876be72a6a",
-    },
-    "0x980111ae1b84e50222c8843e3a7a038f36fecd2b": {
-        "ticker": "STOS",
-        "signature": "304402206addcc7967322c1123edc8c40c15612734bc224b98c3cfd73c29a53aa8971fb4022031fc00cb726d7f6274213e26c04cb3a4f931df3814dc8350f6dd37bb559a0768",
-    },
-    "0xfc77cc32e570baec16f69dded556a35811b5a6ce": {
-        "ticker": "STSW",
-        "signature": "3045022100e937790d045c02760c4c8afc9fd65ff5ad6084a1dfd8b48cf3866c3b27a5092c02206ffc62f0f5b687588a58513a49ae82727b570d5d95ca2f88f6ac15f7d73fb7c1",
-    },
-    "0x1d734a02ef1e1f5886e66b0673b71af5b53ffa94": {
-        "ticker": "SD",
-        "signature": "3045022100bea99943e8a90ec8bd177bc2b1d156a2ad39e74b2fe57e6af3e2ef7c6d5834910220575f1b08094cd5ebbbbbb7bedb6b80f0349ab30e251215a59a0a73066f522fe6",
-    },
-    "0x9f28e2455f9ffcfac9ebd6084853417362bc5dbb": {
-        "ticker": "RMATIC",
-        "signature": "30450221008ce13dc233b0503a2cb810170980df7fe1ff798d161d86ce1bdf0d8bec4b156c022042af3c130f2b1a944d13859fe46019eca5fe23c7a1e228f5ca93edc107974c27",
-    },
-    "0xeb5c9e515629b725d3588a55e2a43964dcfde8ca": {
-        "ticker": "STAKE",
-        "signature": "304402205f7a4020031482ade4568896f97a0575a3dc1919646e7d8b4b414739d0847c4a02200d254c84b384ec61376d83d53a7b2d14bd246acbce7a8d3234636108fb3c1322",
-    },
-    "0x7d60f21072b585351dfd5e8b17109458d97ec120": {
-        "ticker": "SDAM3CRV",
-        "signature": "3045022100adfd757d0adef92ecd6ca8337519b7dd5163c9c5d88f172fa84fd1a4bc90d4a5022033c67f1651228a34bdce8e75d435a86fdc594bcf4dd9d2342ef5206fedc27ebf",
-    },
-    "0x361a5a4993493ce00f61c32d4ecca5512b82ce90": {
-        "ticker": "SDT",
-        "signature": "3045022100ea9c0fc1b28d945dab1cb9653ab90bf03df989a197d52c11a760b2ecf4de3e15022042f061996c60f2598437c8c1648f3d8c29d37b2de440a3c43fe2d2211e80464f",
-    },
-    "0x925a785a347f4a03529b06c50fa1b9a10808cab5": {
-        "ticker": "SABI",
-        "signature": "3045022100a9918d3d13f424bffcaeb646051b4f7ff3dc48b103ead0bf39d3de0e84ce29c302202bac77bb63eb94b2b946fe9ddaf63c36dcd277be86974ebdeed551b9430f9ae0",
-    },
-    "0xb521bf96ad3800208d0958c8a3af5561a66f57ec": {
-        "ticker": "SDOM",
-        "signature": "3045022100de34c3c05f39b65f018b1fda9702dd58721232a6e26ef8e3fbad1c5f6bdcddfe02206c8e805f38e2c4ea22ee1bd379118d91eef6a51e37d93c6635ff1e959d1abb3e",
-    },
-    "0x281c4746c902a322b9a951f07893ac51a7221acc": {
-        "ticker": "STERN",
-        "signature": "3044022006ea0d2261d21a733ad0455a19e0c248c662170033acc90d13c2013d7dd79474022050504e1af9fa25fb2891947b14f1210d648dab9d4bc01da0515dd9bc5633b0bc",
-    },
-    "0x6d1fdbb266fcc09a16a22016369210a15bb95761": {
-        "ticker": "SFRXETH",
-        "signature": "304502210082936b1ff1c025be0a20f65d9670644359348badcbdc8f34be1e2642df3775f002204254098d1caa277a7a84f6096e9bdc5865b4f8d285b0c3d9e3e04da868d817bc",
-    },
-    "0x3a58a54c066fdc0f2d55fc9c89f0415c92ebf3c4": {
-        "ticker": "STMATIC",
-        "signature": "30450221008657add60231f635dd9307d08995e184d007759c9a0f8b787c88b06bbe53097102205cf980ced4f6342534ca9a7c3019da331576c0cec05e09eb623594e339fa2b7a",
-    },
-    "0x9e2d266d6c90f6c0d80a88159b15958f7135b8af": {
-        "ticker": "SSX",
-        "signature": "3045022100bc6a6b01d812191c0c9fd8d5936ada0a2230ce6d0b7cdc1d31271f5340f9f4fc02201694ec8737dc0f7d320fc811a6d6d5f077f84490f8aab578e1551af360fca37d",
-    },
-    "0xbbbe128568222623d21299f019a978c8587b33dc": {
-        "ticker": "SWISE",
-        "signature": "3045022100cbb1f417533c99ff0635b3b5d79de8af2f58c81dce21c45889f5d558cce33bf4022049ea64d7339b8f65c1fdc22dce407a2bf3e39f90c08713019eacb3a42d58e2ee",
-    },
-    "0xc19669a405067927865b40ea045a2baabbbe57f5": {
-        "ticker": "STAR",
-        "signature": "3045022100dc12434318dbb4e3b2db67ad4ba74bb958348965db8df372fc83c34233ac01ee022034eb28aef0b6f97caac50f575c94b63bb14224071cdca585c746e6b9f08c618f",
-    },
-    "0x2f6f07cdcf3588944bf4c42ac74ff24bf56e7590": {
-        "ticker": "STG",
-        "signature": "3045022100d170a9a9cebe10b039a3d250e43a39ce86a11d735e7da5d79fe44957033f9a0002205a1d95e8a3f6a8a868039fb6fc88b87f935fe4c34e626f1cb31cf7f6756065f5",
-    },
-    "0x21a77520d0a25eede18a34ad4bc7a769d785c6ff": {
-        "ticker": "SRX",
-        "signature": "3044022025185d00978939e6c53a973ec54fa44c0e89f1daf07d642bb43729bee1db2081022006419da01406abe2b78e1db231cf98fba0b4951c3c66712cced0196f51122014",
-    },
-    "0xfc3559771aa5a0666420f2365cf66139fbf4b37f": {
-        "ticker": "STS",
-        "signature": "3045022100e7e6296baae26d92a0e82c8b0241099f3f86b21730a556e6b991b9315eff5c5f02201ec2278ff9f3761a9560a31f2e9b830d963c7af25887db0df88542cfec51049a",
-    },
-    "0xe111178a87a3bff0c8d18decba5798827539ae99": {
-        "ticker": "EURS",
-        "signature": "3045022100cd91f0b64f1981b6c541efa3d28c1eefd0df08cde9c385b6eebc5a1d76725f2e022047f17ddc307ed6941857f5cab5acbd5f1bebc3551a987d8614342c7379825672",
-    },
-    "0xcf403036bc139d30080d2cf0f5b48066f98191bb": {
-        "ticker": "STBU",
-        "signature": "3045022100ece806b01a8aa7b04f866bf7849adfa4d239c0957dffecf014efe804ad34f2f902204ef7036619e13f51189e8a520c8fe6ecaecf059d57412c4b0abc98312d26d8cc",
-    },
-    "0xcfa0bfa4972423eaf8d3b7af7e2ace41c56515f7": {
-        "ticker": "WSTOR",
-        "signature": "3045022100a50d61ba0477df61ec7eabfc39c05963b289d558e79a42d68e2c83ef15453b7002203612145bdeeeeef90ad7789f84140ad13694660770457ebeb0525260c6191ee7",
-    },
-    "0x9e64282cc9921cd64556aa1a58cc3872729e4f40": {
-        "ticker": "EARTH",
-        "signature": "304402207107f39bad032792076074a87126933800e3bf8a2b1f7a0400956217d9df7be3022040b9a4fd9c0343c4a402db118f0ff5b20e047a6bf6e7b7cf98d34dc0cb338465",
-    },
-    "0x3a9a81d576d83ff21f26f325066054540720fc34": {
-        "ticker": "STREA",
-        "signature": "304402201d7ab4d608b973717f1fd75e3f728ada6d9afeea8f76765c61ee233a7368e3b40220734224fecc9aeb414c4b396175ec54bcb124b6437448f84f6a1c9f5499a8a202",
-    },
-    "0x1a70807f022cbd3ac5380a6a2af3524e56a6184d": {
-        "ticker": "STRIX",
-        "signature": "304502210087647ae1337d9e1ac9714bad101fbef78e465ad60471fb3454ccbed30577faea02206963dca25673d78d79200b15a9a3df20443a06603af940ff47fb8b87c323ae62",
-    },
-    "0x9e6b19874e97fe8e8cad77f2c0ab5e7a693e5dbf": {
-        "ticker": "ISHND",
-        "signature": "3044022028df4b050f0d2c6a180e538d021e031401d9c3eccdbb4c63dc8ed4005322cc7102200a3c54606037d6df387bcefa9e282a7f11e9c80ccabf947a5c734b6446a7db77",
-    },
-    "0x32934cb16da43fd661116468c1b225fc26cf9a8c": {
-        "ticker": "SNE",
-        "signature": "3044022045e4d42a04104e7a1f08b071f2838d3d92198bcc75fe1e7c6efff1b7f764aa8a0220203fb1b7c0ca0e0822ecfccb93617d2826fff9dd186dbdaaef93521cb6904f43",
-    },
-    "0x779b299ea455d35a44fe9bac48648be22c08dea2": {
-        "ticker": "STC",
-        "signature": "30450221008682480e8ac8a19f23dc4d21ef7a6701d663e0b047e9315bb214695515b076fb0220295e4854bb0862e5aed648cb7fd4967d0998e2631ceb23897e5c2983048513e3",
-    },
-    "0xd1f9c58e33933a993a3891f8acfe05a68e1afc05": {
-        "ticker": "SFL",
-        "signature": "30440220226e9323d98b645384b06e3a9c2cbe978ebcd6905a051a7ba198fbb29c6c76b702207ce1d31e4aa68d885f35adf285db94a00a224f0d0ac7466a43e2e404b3fc726e",
-    },
-    "0x133b0cb0f460406601ff060be281e01e81b1b54c": {
-        "ticker": "AMDAIX",
-        "signature": "3045022100fb8127664958ba114f88a3ba2544e4b805af249afe18280def6b93ff4201063902205a15e8eadf43ec1b336440548614d2848504179bec6caab1608ec5d14eddb743",
-    },
-    "0xc49c15350f001efee91e154f03bddf38cfd0d96e": {
-        "ticker": "ACDCX",
-        "signature": "3045022100a15dd88b05f76c28d17162cd460701765109d0ba0147640df3e28cce6d394dc70220102c07502869c9bdeab4872a1fbcf3f77de8f4d72fd5a01b5927075977607990",
-    },
-    "0x3038b359240dff5ccd42dffd21f12b428034be38": {
-        "ticker": "AGEURX",
-        "signature": "3044022042889c6c78fe827c4c89bac23794a66b233a909dcb9194cd582108f48967db65022006f1b903cda324cf5853c1c814ab032537e589b0cb3e9e246e3d8774be336dbd",
-    },
-    "0x229c5d13452dc302499b5c113768a0db0c9d5c05": {
-        "ticker": "BPTX",
-        "signature": "3045022100d9b71b43d5f48aeb95d4dc848fff9e92737e81005c3ed6c575f29271851afc6602201d4ad61a6fa8b6cca9453556a6c81193f42edb748eb524ebe04867dc64ceaf6f",
-    },
-    "0x1305f6b6df9dc47159d12eb7ac2804d4a33173c2": {
-        "ticker": "DAIX",
-        "signature": "3044022030b1ea70fe43318f8c3aed674a9308551d77f8225d7e2dc80e74db3698e4f1a3022016de22c03ca19406db18f6417a2c189691c0ca4080dd94a64a6d2586675341ff",
-    },
-    "0x2e12d38c6aa87cb68ce96c044b9a68dd98233ceb": {
-        "ticker": "DBEATX",
-        "signature": "304402204ade108b8e6749abb22d818916e33580f8eb2f643323a04f21fe3e622c4a4ac802202b131ae9ffe46ce44d6ce3809e78c4e265a31530a6db586cb66c2d776a6c0159",
-    },
-    "0xaff1ce7832a1c7655803533dab391920cafe467f": {
-        "ticker": "FLOATX",
-        "signature": "3045022100a0ffe3c72b0f7c4f7f62103f6bc2ed20b43acd5c72b1c07885b27ad2cbc9225b022006350d27874fdea182d03077b5aae8a832b28b6374876c2c2216ce2522aed6c1",
-    },
-    "0xb63e38d21b31719e6df314d3d2c351df0d4a9162": {
-        "ticker": "IDLEX",
-        "signature": "3045022100a5e7390b9600384cbc208c8dc53990efd8a93db173098a7419098a076b698c050220590eb94c972e2e65f11e7319f4afb9fff02b0d0d68133035fed387d004769bf8",
-    },
-    "0xeb5748f9798b11af79f892f344f585e3a88aa784": {
-        "ticker": "IDLEWETHX",
-        "signature": "3045022100d3d89f73f1de94d902c3aa421bd98d4c33f786b2be50667f7518dec7fee0f0e2022039846e0271aa5e37e18342170f32fb14902a09fc2d87e716bd242c84f4430420",
-    },
-    "0xcb5676568febb4e4f0dca9407318836e7a973183": {
-        "ticker": "INSTX",
-        "signature": "30450221008c3de21a0c9048b5641781e7e36eba18d2db3605ee141eedce7d707ad918e4bf02203a1191231cfb075140dcfe7027ddb652b22bb4d8edf3e01f5c8fea603515ed34",
-    },
-    "0xe2d04ab74eed9627c828b3fc10e5fc96fae70348": {
-        "ticker": "JCHFX",
-        "signature": "30440220037ce9bfb38f78a245c64818e7985c2c07b66756115a4a21f76980e31cf6aec702207f8681671bc72ba8294b958995e9c563cf13707483117214f729ad005aec63b9",
-    },
-    "0x4bde23854e7c81218463f6c8f331b46144e98eac": {
-        "ticker": "JEURX",
-        "signature": "304402206a298e1f03ad4a5ad789e2013471085ccc5f6b58b14a2464e5a4c6f3a9fc76ce02200248bd3ae9fbd3fe9f38ee851f228e7957de8d8e8a57392b0e235a119c5a482b",
-    },
-    "0xfbb291570de4b87353b1e0f586df97a1ed856470": {
-        "ticker": "JPYCX",
-        "signature": "304402203854ff44b7f7e48ee5fe1c8402cc7e521a99144957729f4af2a379222defdbcf022012654a1deb74331b97fe886a438868ae7bafed41451b7825b3a599fe02aac366",
-    },
-    "0x3ad736904e9e65189c3000c7dd2c8ac8bb7cd4e3": {
-        "ticker": "MATICX",
-        "signature": "3044022064a8658191c15ebac0068741fa6bbd2cd9d4a0c40882780a160d913f510fb05302200c63e6c7f74ca9299810796981ac891e1a2539d61bcb1d45438619ae58cc87a2",
-    },
-    "0x3d9cc088bd9357e5941b68d26d6d09254a69949d": {
-        "ticker": "MTAX",
-        "signature": "3044022025b3e390d7af0ce100db08d973ca5c0a969bcff9f7607492a5b7b37c7ab25e57022077228372755168484b882af0fe140f23d12727e93f34b2257a46216d4cdaf0ee",
-    },
-    "0xab0b048e8b60eb9e8c7a2d46634326143393f2ea": {
-        "ticker": "MUSDX",
-        "signature": "3045022100deceb02a49d476267c5c7e8883af04d273f5fed13549bfa07ae657eb94fa5f8e0220399ebdb3ca09ce27251b0dd64601a60de73548afcdac45d7d3b41f8341eb7d9a",
-    },
-    "0x32cefdf2b3df73bdebaa7cd3b0135b3a79d28dcc": {
-        "ticker": "REQX",
-        "signature": "3044022057a8c82f389368c5c2e62655b89ea84c61c2f25900f4e602ed15956b77f012e9022061f6790dd4e83ccf1f0e473183a20d34063ad09617743d356f5ee3e5be44d5f0",
-    },
-    "0x8ef4f0c0753048a39b4bc4eb3f545fdae00618b7": {
-        "ticker": "SDAM3CRVX",
-        "signature": "304402200a625bd1960cb154f79146e674fcaebe663f3eea5351a6d75e73a38ba1a6fdbe022065c822da17ebc0f004ac7644b80f700558c964614b7e988ae931ef9e730d042f",
-    },
-    "0x12c294107772b10815307c05989dabd71c21670e": {
-        "ticker": "SDTX",
-        "signature": "3045022100d50109c0d45808e7db8649f53ac12194cd5aa5a271d28c4f2119a1e2aaae702e02206d884b433564ddf8b5a6cc76af0416636e33ba3e88db0f155051c45e76f54a89",
-    },
-    "0xcaa7349cea390f89641fe306d93591f87595dc1f": {
-        "ticker": "USDCX",
-        "signature": "3045022100cf1fc8c3f507ff2906bf129f4b921155bc32eee8c635c193c103ec0dc8c4a8b302203782d779ff61cf42952d726dc81d1cef91229bb3f9d86428abecca090c491ed0",
-    },
-    "0x4086ebf75233e8492f1bcda41c7f2a8288c2fb92": {
-        "ticker": "WBTCX",
-        "signature": "304402201dccdc68bd35f00c003779d71337a789b4fe8bd437fe1647ffda82d899ecbdc202203504f3f3aa5f8b25a74de3cb0e3401d265e69976b612ae47f73a78ff079ec2c6",
-    },
-    "0x27e1e4e6bc79d93032abef01025811b7e4727e85": {
-        "ticker": "ETHX",
-        "signature": "304402203d028ef1e0728c6c869b9f431ef8e945ae6e1598a79b8191eaf60a3127ba11cd022034e64eba1b60e74539053fe4f7ac3528b46c35a8169c7236940c17803a647741",
-    },
-    "0xa1428174f516f527fafdd146b883bb4428682737": {
-        "ticker": "SUPER",
-        "signature": "3045022100b34b5b5981c20518320baf7c6f695fda645162a870dccfc292a32ef12c163b5d022065681bcaf2a7018a3638dfd880526b84418b22e323d590d564198e501f730000",
-    },
-    "0x1adca32b906883e474aebcba5708b41f3645f941": {
-        "ticker": "MOCAX",
-        "signature": "3044022079e4fb64d7ba26f1fbf3021b0e17dcf2c4d9c91e71269c6d7658f55a6b097d3002201255ac97ab67096e4e8b5286f2dd6f250216a00f88a587a2e04e10f2bce5dbe5",
-    },
-    "0xe1ca10e6a10c0f72b74df6b7339912babfb1f8b5": {
-        "ticker": "QIX",
-        "signature": "3045022100f11bd7bb4c19d5531ace9b3b78ee6036b83443466c7aae8e78c796002111580f02205f2af97ce268db890297fdeee5d50c53995c042a5a29e02d6bea7d4e7de9364f",
-    },
-    "0x61a7b6f0a7737d9bd38fdeaf1d4160e16bf23043": {
-        "ticker": "WORKX",
-        "signature": "30450221008297d6cfcc5b09c91e35eafddb21e7be660693057378d29cb851e527105392b9022070b60bcd89d3cd18eb3b3c5be0b9fa3193c9d3c6655d78a8e130a5ce006fc6a2",
-    },
-    "0xd8513c22dd61161ba3872859a6d10eb1612df742": {
-        "ticker": "BOARD",
-        "signature": "3045022100a6c7f8076fcadfefaf85afa6efd76b77af23334d25be3c94f43e7357a57ab4400220254b9754617c9ad980a30c8b9cb901f18d286e62271f4411dc65ecdc16c4f88e",
-    },
-    "0x34965ba0ac2451a34a0471f04cca3f990b8dea27": {
-        "ticker": "SLP",
-        "signature": "3045022100c5126765bd6ffdb50c0800841afdef7954df877246200ce4a34a0929919e597302205c19f162e9f3ddcb7b968f92bec5b86e949e77e2b6b0c72955d5d2408ed36da5",
-    },
-    "0x0b3f868e0be5597d5db7feb59e1cadbb0fdda50a": {
-        "ticker": "SUSHI",
-        "signature": "30450221008884a0addca753dc4393d8e5541819547c6d6e5ead02a5e1a7235fcddbb0c64902204c5c0f309402efa8767c9114ccf2b866d2c0a2aa05cb7d14aa18e00bf841a508",
-    },
-    "0xaee24d5296444c007a532696aada9de5ce6cafd0": {
-        "ticker": "SWD",
-        "signature": "3045022100f2e6f1b84057facb4daaaf81cba03e06b18dca11500022e9d0204dd9063afe6c022025a71a890d846736d44cf076b50174e18aaea00e98ead409da00eda6db78f5f6",
-    },
-    "0xe631dabef60c37a37d70d3b4f812871df663226f": {
-        "ticker": "SMT",
-        "signature": "3045022100a38165204b5ca82c42f94345e0c48c9fc9daaefa3fa361f2bfcce9f1c93c5fef02203820c779a66dd1147b224c09fcb1f6cc0274b79b0970310e721f7be04c04fc5d",
-    },
-    "0xba3cb8329d442e6f9eb70fafe1e214251df3d275": {
-        "ticker": "SWASH",
-        "signature": "3045022100fc8a19bd882f2aef4d31ba68650a44fb793b09b1bfe204ee75f7808cccea780402206d66aa8f503334fd5db9afb60b458ebaa547af2daafa12350ac6bcc4714e97b3",
-    },
-    "0x262b8aa7542004f023b0eb02bc6b96350a02b728": {
-        "ticker": "SWAY",
-        "signature": "3045022100a1ea09577f41ec128903a1929e32d96e0dc68abeae30317996d08c8447c3931a02203a394a63bc99ef137fe15d49200b2964feb5b067a0c7097b201052ab8a2f3993",
-    },
-    "0x6abb753c1893194de4a83c6e8b4eadfc105fd5f5": {
-        "ticker": "SXP",
-        "signature": "304502210091117e42be90ced27fecb5c5061e7924163c8fa2aa5f97ff015591825ff034bb022036fb7411de65f0cf2c3f657b40b8426447b5d3ac5f2d7f17e1f02d7a705834b5",
-    },
-    "0x67ce67ec4fcd4aca0fcb738dd080b2a21ff69d75": {
-        "ticker": "CHSB",
-        "signature": "3045022100b336701b18926b318036944930d9bc8961785d5b8bff98108909e99ca63a54410220687e186ba97314ef15a15d3b753d4162240505a2a6730b65a30d96b5645a4c79",
-    },
-    "0x3ce1327867077b551ae9a6987bf10c9fd08edce1": {
-        "ticker": "SWCH",
-        "signature": "304402201da615ded55cf4f8bde245e14ea9a66954dfad4c90fa710c837b90ceef0ed81602201b5d0607fe00eb4a9a81367125c87e993998f067c00f8dbd81e9add0ea3fe249",
-    },
-    "0x968b493a2b27d03dad92b9ea1e2e8232a72c9c2c": {
-        "ticker": "SWDTKN",
-        "signature": "304402205ec2e99234934ab963812c76dc72605c0eb75f4fad49e7ebff24ea8d554ca87b022025ce9b502e840fe520b15fdef9886de7a8f0da15afe70eeb41478aa369140c06",
-    },
-    "0xf8f9efc0db77d8881500bb06ff5d6abc3070e695": {
-        "ticker": "SYN",
-        "signature": "3045022100b8170de42845f84dd5557114a7b5e4f23003e07bb16ef08b20fd10d577dd487202202f974e30922c92ae7ba146e5de0d19b7b5d7e8f7b00e4d70524d8bde24179839",
-    },
-    "0x6911f552842236bd9e8ea8ddbb3fb414e2c5fa9d": {
-        "ticker": "SNP",
-        "signature": "304502210086d90fce188049d382d375635f1d4f374cf1547755ae90c72e02bd858b20d02f0220586f19ad36f51af76c2b4f9e408fdd3d69ab7490415d87c79310836b801bd797",
-    },
-    "0xad9f61563b104281b14322fec8b42eb67711bf68": {
-        "ticker": "SNG",
-        "signature": "3045022100882184284582003ab3859390801e57aa7389c4a78aee92db6080cdd84a6a0e1e022048438d3fb274953827b24e41ac6edadb5b9c610886fde40e0f710190cfa71ca5",
-    },
-    "0xf81b4bec6ca8f9fe7be01ca734f55b2b6e03a7a0": {
-        "ticker": "SUSD",
-        "signature": "30450221009977e9457dbc4e54cbeac056370046e91aba5cce6b2f4ed218c520404a352f4502203b23604adeab58c71558dcb261054b3bdbe16aa29f58c767807765ee1b3b3673",
-    },
-    "0x50b728d8d964fd00c2d0aad81718b71311fef68a": {
-        "ticker": "SNX",
-        "signature": "304402201f2c8892ac4f7edda2054cc124893abebf1b1341609c310b010c24f3eb5d53ab02205622033d1f4ded85a0de1061b3e65fc707718029f02b75d56bfe470e6061661b",
-    },
-    "0x8829d36f6680be993f5444198e8cbfa8f02ede96": {
-        "ticker": "FXTKAI",
-        "signature": "304402205f216c0d71a47461c16538089f7a26915015cf25f81f263463f51b2734baecca02203f4624ad4427c73a2edf1b3f4e582774f39f895983b35e1b12e39b1b89d858eb",
-    },
-    "0xe78aee6ccb05471a69677fb74da80f5d251c042b": {
-        "ticker": "TAKI",
-        "signature": "304502210080a98c08c1e2b4feb9504d9d78721aeb9c9418c88f2e45278ca188b66183d81102206e09bb3e258b36fa8f57807824d99d6c18e93c2e0340332c07bf80f62499ba31",
-    },
-    "0xc61f39418cd27820b5d4e9ba4a7197eefaeb8b05": {
-        "ticker": "TAMA",
-        "signature": "3045022100afc4e23e37a3904abd1bd2e03676c2ce777ade15f763ca947fa0b67442a1960902204e9d978d54637f5013b71efae8df5d07fc6570524b535209045fe2f18803d4c0",
-    },
-    "0x1e37b3855ca1ef46106baa162bfaf8a1e7666a5d": {
-        "ticker": "TSLT",
-        "signature": "3045022100ce9f19a0d7a768722891717f6cd4a14943f8eeaa9f6e8556c9403689e7bcd93f0220091db6468512099fd4a393c7d4a2f3c078fb45f92f036900fc096487e0845937",
-    },
-    "0x49e6a20f1bbdfeec2a8222e052000bbb14ee6007": {
-        "ticker": "TNGBL",
-        "signature": "30440220014dce51d2b7d1e7afa24b3448ae161e9c2091e85f21963a8c0ebe0271273fee02206fce7be3c1c526623ec441922b24784172a759f97505b2f4ee6a8e354ae66267",
-    },
-    "0xd9d77b113e6ef2696267e20c35f3abd87cdaca2c": {
-        "ticker": "TANPIN",
-        "signature": "304402200fd37eee1bf3327e3124c0167e0e0ad3cc474e1ba1d3f4adfcafb7609d0ca15a02202a4792a9424b99397b9405004b18d23329c0b6fe15ae0276b72fb933f6bbac57",
-    },
-    "0x10635bf5c17f5e4c0ed9012aef7c12f96a57a4dd": {
-        "ticker": "TAP",
-        "signature": "3045022100f0507c1386c9af0892dfc5a7fd72b880126ebaa601b0c528655dbe2f434cabbf022018de2cb1bbb5d67d633e25429573ed9210ae5b8466acdf64a858d23a9511fd38",
-    },
-    "0xb092e1bf50f518b3ebf7ed26a40015183ae36ac2": {
-        "ticker": "TAROT",
-        "signature": "304402203f9b03d523d96662fe87ddaa2f7d13d738056d1748d808de931c2e882d10b1f802205910afafd277da84dd48fc99db8bff9d835fd747d72f043df068454d341d8706",
-    },
-    "0x2596a8b90d39eb89d5668ca5b6dee54e9ae3d4c0": {
-        "ticker": "TAT2",
-        "signature": "30440220618d64e47a74b6b398341005a1ea578c72789f45f74351655c9b2fd435a53452022078ab85fec2bd2f10513770e1bee7f36c6c9503f4b8865e5d0f9d774596a15586",
-    },
-    "0x44acd96620b708162af4a90524f29a6839675533": {
-        "ticker": "TCGC",
-        "signature": "304402203b8914619a5e1e7328dde8d1c3e0b573d38ef03fc55292cfcd568060969972e40220522bbafdff973051c12b48697b311f137b2716f4e60225ba91bac887e4365be8",
-    },
-    "0x17a011150e9feb7bec4cfada055c8df436eb730b": {
-        "ticker": "TT",
-        "signature": "30440220054f2aca328b66dc0c43799c1ba9ff8b7c29803e2fbda978f438d50b3ebc40dc0220131e8b0f2074b91084a5e30b921c9d13f92f8dd4dc37e0aaa79d112f5f70af4b",
-    },
-    "0xcd1f2f1a1d1ba631a06b957db77bb9d7b13bf861": {
-        "ticker": "TDL",
-        "signature": "304502210095f25008fb79d533d7308956270b9043a31c9463cb336d27950505af25e12c4002205a736a26560f57c1fcf8e84c41a6750d0c1be5becb5acb8bc7d2f719453aac26",
-    },
-    "0xa794221d92d77490ff319e95da1461bdf2bd3953": {
-        "ticker": "TDLX",
-        "signature": "3044022071181cb13a5d632196a095e8d583b20900e58508bc72f198df41b32d0b55e24f02206ece208bf9b01392de0647f7e5b93b46a207117b2d09bd4e4da500e56aa00ca3",
-    },
-    "0x7961ade0a767c0e5b67dd1a1f78ba44f727642ed": {
-        "ticker": "TGR",
-        "signature": "3045022100f8f3d9ed369ec1b9e5574008a6d6b537611e0c92113b2750f90b1df0767c2959022044530e5b5bf603f83c997545bf0e786ab87dce63865c7c038454035213d6abd4",
-    },
-    "0xdf7837de1f2fa4631d716cf2502f8b230f1dcc32": {
-        "ticker": "TEL",
-        "signature": "3045022100df6734e8dc79763f3a2e3ccbbe547f9380f24a5d25ec0e7ef5e3357aa23e105b0220484abf1214cdc1bda02a17900fc9f3ae73ffbddbebb101f51ad5674c860d4aa2",
-    },
-    "0xe3322702bedaaed36cddab233360b939775ae5f1": {
-        "ticker": "TRB",
-        "signature": "304402207d9872134e96a0deebacd719b1a3d684a8a3282449d721ae0bcdfdf1a864f6e402200c07a0aa5e0d897fdc795ccc9794e5e288b8e22e30594b25f8afbacb053b4370",
-    },
-    "0x255707b70bf90aa112006e1b07b9aea6de021424": {
-        "ticker": "TETU",
-        "signature": "304402203771951ba9a11bd4af6b54d3df5babc09019a8f7c3719162ff0e18c07bc18202022065011e60e63e56b2982cccb5631be8f65c0780d5b3b7111277349c27c348de20",
-    },
-    "0x7fc9e0aa043787bfad28e29632ada302c790ce33": {
-        "ticker": "TETUBAL",
-        "signature": "304402203720f2d7ddcb528f41e63d3360ade37afba815e7bc1655b59318a4ab0d792a4202207f19c4e4bc08346066f4b153254cb34c14aebf9cedfa95d9412054c9e9ca2fb8",
-    },
-    "0x4cd44ced63d9a6fef595f6ad3f7ced13fceac768": {
-        "ticker": "TETUQI",
-        "signature": "30440220013ac0b0bc908f42c73be7b28c8b4c12adbc53ba34c1c02b1c41576fc79635630220555be3d3d0dc40627e3c5ce129aad67283a988b987e79331127e25be922d7a8b",
-    },
-    "0xb797adfb7b268faeaa90cadbfed464c76ee599cd": {
-        "ticker": "TETUBAL_BALWETH",
-        "signature": "30440220084934678331c3149f27f49afa9e773355f9736203a99d56208719657fb779530220166c7b700cbe36bfe57ce60415c1a84b8fa59d7d4a58d967c332a35c006a2cc2",
-    },
-    "0xa6da8c8999c094432c77e7d318951d34019af24b": {
-        "ticker": "TXAU",
-        "signature": "3045022100b35f587246286b46429004953b7650572a91187a9f488cb1a4751ae10cafbead02203344a21aea9b14f4444dfb992635fcb8d589323505af5810656dfa2f91f0b96f",
-    },
-    "0x692c44990e4f408ba0917f5c78a83160c1557237": {
-        "ticker": "THALES",
-        "signature": "30450221009d94e5b75abd0c550853bdd778f6ffacfdbec44c8a090c1a712e457cc710d55802207ea81103d83a0f43ba259a5c8a26ebac43c636f79f616b8c63a512691e14e12d",
-    },
-    "0x48cbc913de09317df2365e6827df50da083701d5": {
-        "ticker": "FOUR",
-        "signature": "304402204674320fcca7dfd3922af6dfed764a5b05186fb0c5d51a1c94f47d23cd88eb7b0220226a8ca98c463b06a69be5ab22e14262ba4887d97d02f55ffb1a5b8e9bae6d20",
-    },
-    "0xeee3371b89fc43ea970e908536fcddd975135d8a": {
-        "ticker": "DOG",
-        "signature": "30440220706ef6101760367e5887b8d32ea5d73e8edc1c1e4aef6155ea235dc0571871c9022072a102ed96053f89fe8b33b790af28449ab6ce9d1515daf84bc5ffc5a7d1d012",
-    },
-    "0x6002410dda2fb88b4d0dc3c1d562f7761191ea80": {
-        "ticker": "WORK",
-        "signature": "304402201557dd8f05ebb201ef1f2b3284679ccb03f075ed5719a99b02e986e10972765d022004747b6c09a0985568a1e1ea2e762f7bd588154b20e189f1208e776cf1e85eaf",
-    },
-    "0xc3c604f1943b8c619c5d65cd11a876e9c8edcf10": {
-        "ticker": "MGH",
-        "signature": "30440220051091c8b86a32e98a78ca1979ecd9a5ac75c578230850bad353f54abb8c47ad02203778a2f1d87273fc34c7244c9865619191c815233d1d5e55efd2069f19307202",
-    },
-    "0x9ca6a77c8b38159fd2da9bd25bc3e259c33f5e39": {
-        "ticker": "SPORK",
-        "signature": "30450221008162e77c316e1bbb074154e7be8fe8878c5824dbb4620211d5a276beeb0cac9e022025bf307ef801f15ccaf6b970f36c7cc9fb8841635606930b05993101751f3c50",
-    },
-    "0xefcfece12a99d1dbbf6f3264ee97f8c045e97f1f": {
-        "ticker": "SOULS",
-        "signature": "304502210083e12a9c710efcea458784d34bd60c85beef8bacfb7baa162f8a407c8d7de9b4022014e0c3a047f13a0e995535db9911523508771ec513f390e95b5037ff240c41af",
-    },
-    "0xb46e0ae620efd98516f49bb00263317096c114b2": {
-        "ticker": "THETA",
-        "signature": "3043021f4639b4633adfc6abe3be6f10dbabd381bc2ca6855eacf7ca6e407889575f4f02203d9608c0beefb31108259088234f6c55d3933b0813d784cb583af7351a748c64",
-    },
-    "0xd1179e3117edfdcb0f826d4287cc8444c5c8fb4d": {
-        "ticker": "THIX",
-        "signature": "3044022034300a5b51752d4cecc9d6365ccc94942f375cf1b65fb01e49e1c60fd3c4ee4d02205a197e06e5be9dad14ad1d0728d3c20e050e63934fb976f62bb20feec8799f03",
-    },
-    "0x29e3e6ad4eeadf767919099ee23c907946435a70": {
-        "ticker": "TNDR",
-        "signature": "3044022010037a4e39980892bc2fdc4e24601c0f120936b1f0e0a9ccec0f103248135353022031b0336791811e9ab9658745d23991b783a6c6ad02506118a526b3f42173e4d7",
-    },
-    "0x2934b36ca9a4b31e633c5be670c8c8b28b6aa015": {
-        "ticker": "THX",
-        "signature": "3045022100de42adce30b1164e5bdee7383b2770f066fa7087b7ec4c38b04acd79514e654b0220361a066c5740b2f04f3607da7631b7bef2d84394d0abddbdea798b11aa77d80b",
-    },
-    "0xac311fa85e8645bb1db53ecc04fa8d41997facf8": {
-        "ticker": "TIDAL",
-        "signature": "30440220347494aaf6a8f7b0bb0d7fc44955c6d9be79f3b969a5032a1a94eaadedf4fefe022052ffbf3c709f8ea5840f68e014edb071b234563d901965ee69a4db5a4f5b4b42",
-    },
-    "0x5c59d7cb794471a9633391c4927ade06b8787a90": {
-        "ticker": "TIME",
-        "signature": "3045022100ce5faade1a3875ad879e2343c8ac8451c92701dab8e5b36393b32c017fa580190220159a2143d8521bf8e60102babbe8b4d4f61caa5de94236bc35dd20cf2df73f56",
-    },
-    "0xd0ecd879dc1403697d341c9db1db51075d2adc69": {
-        "ticker": "TI",
-        "signature": "30450221009930b3f8cc47458cd1718a429ea3ee530a079eb866888305678e14017a26e83c0220058d96f50e2edf44756e2f487dec707d1a6135e45ab409dd864ee54b7d8e0221",
-    },
-    "0x8eef5a82e6aa222a60f009ac18c24ee12dbf4b41": {
-        "ticker": "TXL",
-        "signature": "3045022100a7b168f902060e0de074e6f738c6589e158c14f4c4dd7ec50cf481fd6213f7d2022030f48b4068aa27d6beb6f860c81f710094e7902a78026d3a2c7c5b8db3b36af8",
-    },
-    "0xe57594f829b3d514ee12c41e81df3861b19c26e3": {
-        "ticker": "TMNG",
-        "signature": "3045022100c3d63dcab898805ae52ec908e7d8b5a77052f8621c54e0fbf2d00e65a8e6cb4302202ae25cda52a47c9f2d15c5a9e94d3fa305e34826dcf7fc86260c89099b522bc4",
-    },
-    "0x00a0d4f2fe50e023aec0648271ce1a6616c702e2": {
-        "ticker": "HITT",
-        "signature": "3045022100aea404299ac0b6deb9044ad31dd31988911742071fefa9a7fb9af6a205175075022074b53cb79626e8e021e29eb0e61ede5b7b2cc0c65c472d2bbdff52361fe3d128",
-    },
-    "0x0e98c977b943f06075b2d795794238fbfb9b9a34": {
-        "ticker": "TOMB",
-        "signature": "304302202a101ce61d14c43c025ae40b7a7912de8bdb3d3042fac635e5fe5542c6240dd0021f09d230e09de9bfa9edd69193d5562d5a36345b5e0f9373f7787578083e40c2",
-    },
-    "0xf18724502bdb0e6b7154f841f9c3120912b02a5e": {
-        "ticker": "TM20",
-        "signature": "3045022100b53f91f374c0ae4d7fdc13c9bf2cf7cb57f680228eab30cf8ff47e8a2560c31802205780f868ca878f2e20a34808bcfa1b04e5ec907cc75aa576267d0282796b02a1",
-    },
-    "0xe9993763e0b7f7d915a62a5f22a6e151f91d98a8": {
-        "ticker": "TORG",
-        "signature": "3044022078d97db1e8ba921223e14707dce41e233c7ebe823b45e7e44dccfc06af02bb2702200528bd070de23962707a0b5744396d7d0554e4bc78cd7b3852c9384c7fe38bca",
-    },
-    "0x23fe1ee2f536427b7e8ac02fb037a7f867037fe8": {
-        "ticker": "TORN",
-        "signature": "30440220707fcc4100917670748fd1d0268837866914590842aae8ccda38a1c4f06f996c02206d66134328fecd3d9a19c560e102f5eb870030c87a2c65ae55a9b9a79665ee1e",
-    },
-    "0x1adcef5c780d8895ac77e6ee9239b4b3ecb76da2": {
-        "ticker": "TOTEM",
-        "signature": "3044022049febab5018bf5a4f5ae2d8f91a61c63a930fa443cfb77de5a21862ed16f4c7802202d0a9de422409773d3418a3dca14772b5770e0aea34a27406cf159c47df67445",
-    },
-    "0x2f800db0fdb5223b3c3f354886d907a671414a7f": {
-        "ticker": "BCT",
-        "signature": "3045022100ec70364ff7d2c09ba3fd454e914321de48fba7994ca97865697ac2fc4c9ce19a0220657cc50a92a8be735637b4af121d81d71120b90a28f7599d0ced184edbf3dea3",
-    },
-    "0x2bc07124d8dac638e290f401046ad584546bc47b": {
-        "ticker": "TOWER",
-        "signature": "304402203d6a93ae6c78d0f66012568cc1ee079476e05e0a6c427ed5ab579be7742453cf022060263b335da5e20093202a3b4c981e7e348ee480f8e15e9d9abde7e6b40902fd",
-    },
-    "0x2e6978ceea865948f4c5685e35aec72652e3cb88": {
-        "ticker": "TXPT",
-        "signature": "3045022100af327b1711ed58ae96c2fd453e712d44a3181da037d24dbe4539830fe1b83f5a0220367ef5eba76299918a354a621a1eb39fb37fde08bec510d2753f87402bd03d51",
-    },
-    "0xd24157aa1097486dc9d7cf094a7e15026e566b5d": {
-        "ticker": "TPRO",
-        "signature": "3045022100aecf974e85958e4677e8456f12c2f1206a11b6576e4e76d131a19df40365ecd4022011ba5db5be78e130ceabcb6c20f46af7fedf1337c54103611ba7b155d8c8a7f6",
-    },
-    "0x4287f07cbe6954f9f0decd91d0705c926d8d03a4": {
-        "ticker": "TRACE",
-        "signature": "3045022100decda812d1e02cccbc6574b8fd0692bf35e5c8617a1cb881d9098cd363dd8ff302206303cf85419010a965ebebb0a0cb49abf7cdb42c291b9419f2c3f507aefd5418",
-    },
-    "0x13f76eab3ec634c5479cbb0fb705e867b3e469de": {
-        "ticker": "TRDM",
-        "signature": "30450221009a37ad657ee203bacc05d06460f7c629802998fb85ab8f4456fab01eb94d53b8022077c417d97677559838a0b713b5af645f6afd4bb4b8afaf5d21167b1d68099c79",
-    },
-    "0x0f8db146ec1288fc35c05e3b78c2f27d3fa7c4a5": {
-        "ticker": "TLF",
-        "signature": "3043022058425b862a92768efc78dd902fb6a943361adf4e8bb42bfba1f7e9edecc11a7b021f78ce0129c8d48639376b6d9bb489ac137a1b807012bc5636bd9b30134ee001",
-    },
-    "0x25c498781ca536547b147e2199f572e5393d36f0": {
-        "ticker": "TNT",
-        "signature": "3045022100ee9b26b4598cceb9e82bb0bb3039a8813c41dc8d5e3208434e728fbb04f7cf5c022021fb841c893c6dd260e312618015e68eb83096cd3277907734c25664a1164325",
-    },
-    "0xa0ead927e6c31646cf1d4cc721705c415e515bd4": {
-        "ticker": "TRIM",
-        "signature": "304402203eb9572d80475bc2d7e386fb7e41439b633fb1305ba8fa9562f70e973a415a8f02204fac08165e3070c06b373c0636ac269f3210135bce71a55ce2285f6b0c1fa042",
-    },
-    "0x2e1ad108ff1d8c782fcbbb89aad783ac49586756": {
-        "ticker": "TUSD",
-        "signature": "3045022100eef61cb3c069df526c50ffd331b25fdccff35a1e6485047b00617ad316e305cc0220235b4b5259c38256e11d6cf9710b4ec6ab02aad6509754a5e8cd63c7bab9a56f",
-    },
-    "0xc1381c17d29a22df5c3015c3d83ebd90abd0e6b3": {
-        "ticker": "FXTRUMATIC",
-        "signature": "304502210087303457c92ed43001ee59e89ca39bdaf087638aec0141116a257a83ed265a4e022071b12b63ed76861e1a8b7fac05514c523401f1d7324fe655c002a6e9f96ccca5",
-    },
-    "0xf33687811f3ad0cd6b48dd4b39f9f977bd7165a2": {
-        "ticker": "TRUMATIC",
-        "signature": "3044022012dc6b78a9ee65aa179e854156300f92129912a59942ef999d23d1cb6c670e31022058e7cf621a69c3797dde016348ec26f94e79b37e2debea2bfdeafe5fa4a680d2",
-    },
-    "0x3809dcdd5dde24b37abe64a5a339784c3323c44f": {
-        "ticker": "SWAP",
-        "signature": "3045022100ffcb8d92fb56fa48dc531d1156bc93156cba9ea8beba59ba1147205f2a22ce6802200551230d815c3eeee839bbee10af054f0d07634fa82844f61f1c92574c068887",
-    },
-    "0xefee2de82343be622dcb4e545f75a3b9f50c272d": {
-        "ticker": "TRY",
-        "signature": "304402207b48270eed8c9e0d10728b78abc41ede7bb4dfd2bc5b31f133f55ab0a888f8ce02207c963893ad7f3032eb9bc564bdd3ec02fe4438861fdadbd35520656316532088",
-    },
-    "0x57fcbd6503c8be3b1abad191bc7799ef414a5b31": {
-        "ticker": "TXAG",
-        "signature": "304402207b79e27e6656a5acb7610fc7708397c7c2d49cf0278a5d183c169539f18a5752022077be9cffd2eae5a5eabae76425dae931ebd6829d972765c3f6b07e37f3f7e57e",
-    },
-    "0x70e29b7e036b14d496431b77e0b6eb0008be6165": {
-        "ticker": "TSUGT",
-        "signature": "3045022100c9177eb733422f77c9f90b75f545850f994c6551c755574476910d332049891302206e5cfadd60107b841548b41b56020f2415e61d7fe5ff3edbf10b243b0c1780f2",
-    },
-    "0x5a7bb7b8eff493625a2bb855445911e63a490e42": {
-        "ticker": "TSUBASAUT",
-        "signature": "304402201edfdc912d8b8406da0b1f33fc0f3a59d727b0507d810738c72d70d73de19af70220648d32d0c1313bf23b67439f6b4e303faffa5fbed33edd6e8530bf60dc5dca49",
-    },
-    "0x52fc543bd23d1948f11eb265eabdefbbb0131572": {
-        "ticker": "W",
-        "signature": "30440220507f561c4a92337e6011f8f19d3aa09e8c0549f3d563cb7d00b69aa1193b9b65022078ed4c7620543989318402b81ae0e86bd95f58b2d2a6c0d5fc8317921a25fe9c",
-    },
-    "0x12a34a6759c871c4c1e8a0a42cfc97e4d7aaf68d": {
-        "ticker": "TUT",
-        "signature": "304402202da0c1489b1afc891de883d083858ad8ce9c22f77cd2de0ab6d59bcf59b314be02204ced6b3cca6b2861adf03de0593ed48ddc25d155b70884e27c6df5b1afae2919",
-    },
-    "0x78445485a8d5b3be765e3027bc336e3c272a23c9": {
-        "ticker": "UBU",
-        "signature": "304402205617839b6d9a2e0dd9761c39bbb0f0d0784e33e3fa52389b900e8fc6ed374525022059ea2e89d510e78523ab7e1f9fde604b65bec5faa10a8ee4e0b0a1e04e04cf72",
-    },
-    "0x315b16bfc91bd6c5d9054f961938b924c7da4964": {
-        "ticker": "UCF",
-        "signature": "30440220270058adde85c1f0fad56b8bdd6f8ee20ac59b2b1657cf162f528b44169cfd6002206a88f5c9546c127e743907c05486b1c2c9bdcb35ae3446c376ef77c99a2af38c",
-    },
-    "0xd566c529b33ecf15170f600d4b1ab12468c8efc6": {
-        "ticker": "UERII",
-        "signature": "3045022100c20415b35cf19c1f31ee939ddd062de93c1a3547def6300458dbdbb94d2b71460220060e1b3ae46e65454d6a675e046f87cb36d68336984d18f57605ea381abf2b6a",
-    },
-    "0xfa5d5dd2517ee9c1419534a16b132adde2e3d948": {
-        "ticker": "ULX",
-        "signature": "3045022100ac951f3301e96bae8cd6dafbbdd09eb54390252c73506386ad220318fc7a8dd7022011dd8b6fa2f721ab7ad5638bde34262a6bbd91028f308b8b42c26922671f485e",
-    },
-    "0x3066818837c5e6ed6601bd5a91b0762877a6b731": {
-        "ticker": "UMA",
-        "signature": "304402204c7d36dceec2aec4512964e8ec79a69c64dc3b306f6bab57f7a8e4bff48e464a02200ab10dc46282b49981110c5c30e192dab11542e2a4987e3e40055058b176ff61",
-    },
-    "0x36596a1dc57c695bed1a063470a7802797dca133": {
-        "ticker": "UMMA",
-        "signature": "3045022100ad62ebcbe0af4ba3311196e612b9795c71f66168faadbd1150818f7e9607e4bc02206b610dccdb9b015a863dde48d658db23de5e54ab3680409a6e9aa0b63b7bfafa",
-    },
-    "0x0b6f3ea2814f3fff804ba5d5c237aebbc364fba9": {
-        "ticker": "UNA",
-        "signature": "3044022051fbf851f6f6cb2a526c7c6350e9a8e8aadd7691fabb2750f98c994b4616c64502200b19725ba07b18f3a7fd6762a8c0c5f41b01eb0fefd57d12f9666fbbfd6a2dad",
-    },
-    "0x754e15f1243f4b8bd319eb760774388a22b049e5": {
-        "ticker": "UN",
-        "signature": "304502210080959cb8ff9e8a37fd0178ab1d544b799675e52ac7c23164648b96fa5bb2bf19022068727044730e95644428c12f2b57d23ee659fb8f99d97498207a9f00882d12a9",
-    },
-    "0x5095cc6511b70e287bc525aa57afbc60eb73ac47": {
-        "ticker": "ERSDL",
-        "signature": "3044022049b075aa93c410fbcc94ea0019774ed7cc28d4579653cb8a77529b30de2899ab0220535ce5daa886df77daef8638a29764de550515896a873de93a41198f13093370",
-    },
-    "0x7fbc10850cae055b27039af31bd258430e714c62": {
-        "ticker": "UBT",
-        "signature": "3045022100ea250710f1e7f25a56fd4abac52ee893c8c09099ec56e7918c1146bb381b511d02205243299925580b29209f9de2d85dcb7a3d0b35358330cf55cf75434b8d5d8d3a",
-    },
-    "0x21ce5251d47aa72d2d1dc849b1bcce14d2467d1b": {
-        "ticker": "UNIC",
-        "signature": "3045022100c46b57f1cc2fbfd6b61f216887f8e7f06e0623a767a6a0f62f1ce5ef12d0d16d022006a3cfdd844bc3815fc8bdfe2f10cf7406c006cada4eb4299b3000eb39880a6b",
-    },
-    "0x64060ab139feaae7f06ca4e63189d86adeb51691": {
-        "ticker": "UNIM",
-        "signature": "3045022100ceb2a584d3b0398c8f580bdd06bd24cbb2502a74891b67ff182f8498f321e06102203423402f16a69d9b3b544d4bfece4398220d2822c7cac1cc95802525cb38e8d5",
-    },
-    "0xa7305ae84519ff8be02484cda45834c4e7d13dd6": {
-        "ticker": "UFARM",
-        "signature": "3044022027d43bfe5d4417776cd03cc274d7f69d0c0efe2ee5c3df4fbf325a9c33fac4a50220348bec995c5302c79551348799d43c2f9de171551cbffc9143c8a65ff9c8a0bb",
-    },
-    "0x4ba47b10ea8f544f8969ba61df3e5be67692a122": {
-        "ticker": "IFUND",
-        "signature": "30450221009b57ca04ac3d25d14d1bae394ba30c0fa459154f7dfe702953db535d78c4287a0220440a23085a1004f725bac0d9e20d279ef854b14c27379bb71df1c02e47d7de64",
-    },
-    "0x5b4cf2c120a9702225814e18543ee658c5f8631e": {
-        "ticker": "UFT",
-        "signature": "304502210082eae57ce279abe24c003711016c084e4bf65ee73fc6457d79e76ed61f6ce3c5022020c2c2b9cb1522f19115905a5352002ee14d811a04fe6f2a900e38bf0c198070",
-    },
-    "0x5df1a47e05b4caba0ed3df13662642f05314764d": {
-        "ticker": "UMX",
-        "signature": "30450221009a031e72a2716c560623d166433722ea1ddc68739be51dfabc80d9b18dc604fc022076849337d463345ddabe847a931aa220ca6677e1d4170fd7491a90e960980282",
-    },
-    "0x00d5149cdf7cec8725bf50073c51c4fa58ecca12": {
-        "ticker": "POWER",
-        "signature": "30440220745f8047d5c3c760a734ef939f85dfd008e27e58cefc52c7c20790280f129a550220129ba1e6b9c6a4160339b3df8459834c3d44fa70666c9dc5c20509f4b34e7181",
-    },
-    "0x3c720206bfacb2d16fa3ac0ed87d2048dbc401fc": {
-        "ticker": "UCO",
-        "signature": "3045022100ac7931fe9057e3f8189962b11e4c05e195bc1565c4f9e702c5942f92179b5590022022b063abf2426f010f6d9d395260a389aae4da0b2856a241c1e071ffd7f246d8",
-    },
-    "0xb33eaad8d922b1083446dc23f610c2567fb5180f": {
-        "ticker": "UNI",
-        "signature": "304402206fd1ec530e75eadcd8adca249ec060cec1ee532d2a63c6617de8ec73cc62456502207d2e780bb93cca35ea810596b764cbe8fa72a593379ff4f48512687cc4611fd3",
-    },
-    "0xadbf1854e5883eb8aa7baf50705338739e558e5b": {
-        "ticker": "UNIWEWM",
-        "signature": "3045022100ea8aadc21ac89ff39521db07d8e1d438f3085e7455ae2aff9565b5faf2cf573e022072493a0d257545f3cda3fe6d4922a01fef131a1ffd2eb1c5a760c5bb1b05b9ef",
-    },
-    "0x853ee4b2a13f8a742d64c8f088be7ba2131f670d": {
-        "ticker": "UNIWEUSDC",
-        "signature": "30450221008340415d778cff8a08d547eed2ff628523e59759d5ed14e19768f15f5bdad1fc02203283dad240ae0da57df3a62869af97b31833db7741f235a2ee2838e86192a4b1",
-    },
-    "0x6e7a5fafcec6bb1e78bae2a1f0b612012bf14827": {
-        "ticker": "UNIWMUSDC",
-        "signature": "3045022100ead796edd11d1451ca745a495b92b00e193b5798d038e274c31c04de90059f0e02201bc8be5b7b1151ee55e1f0061d44285e075a2c408c1063e09c5f0935fae22829",
-    },
-    "0x604229c960e5cacf2aaeac8be68ac07ba9df81c3": {
-        "ticker": "UNIWMUSDT",
-        "signature": "304402205c8d7db793ff7e0208eb885646b28bf4a0a8d94036dfcfc60749d03fe183492302200fe71aafae326ade9464ccaa6691a221177e06ecce1dfaa817888718b79b502b",
-    },
-    "0xac63686230f64bdeaf086fe6764085453ab3023f": {
-        "ticker": "USV",
-        "signature": "3045022100ffadbd6095c7eede9a3e03af6f010c9704785627bc3259caf39e8729ded1cb3f02203851e96ec348bbca14ea58ff450d311e63de9e0edbd4980e4a90ad0f8b5b6a10",
-    },
-    "0x8c4476dfec8e7eedf2de3e9e9461b7c14c828d46": {
-        "ticker": "UNIX",
-        "signature": "3044022054c50f44fd186afc5c3546ee6bda4b6450e4bc21b580ea0cd1aadd4e6714369602206bbd4fd85ec5986f688f31cae4d732b3fcbcbbf2895c400789c3c59b3b85ec0a",
-    },
-    "0x930a7dc10ae084fbbddc6537d7df7d4c65a40944": {
-        "ticker": "UNLOCK",
-        "signature": "3045022100d88df9ee8f6c6abae8ccfdcb7d115dda2c45f78811dc998de750baebce508678022027220a0a66867fa9e2f9ca766173ddc922cad6f3f8b556249730a33a1a8c8673",
-    },
-    "0x64ee4f41a15d6c431ab6607d4e95462169d50f6c": {
-        "ticker": "UNV",
-        "signature": "3044022042ff9547bdbe2acad417b0554bcdfbdde183f92a641493e87c80aa4a410c650f02206dbbaed7565b85540de33c3989f8a6a6e6a315de24e033b8775c4fd6fa335aef",
-    },
-    "0x9dbfc1cbf7a1e711503a29b4b5f9130ebeccac96": {
-        "ticker": "UPO",
-        "signature": "3045022100f3124889ac01f390cc36ac6175467d9e49d3b6bf816566f5c382dd8bee378a2f022037f2e42d9cb55f8151addd4ae8677ec412015da75f9479181f8dfbb860014479",
-    },
-    "0x3c499c542cef5e3811e1192ce70d8cc03d5c3359": {
-        "ticker": "USDC",
-        "signature": "3044022052bd0c97a82233dfebc592a07e9c77acf53110a251291103d5494cf279a4b9030220517b5e68d636521816be338e2a6d05cd05c4b1e61b76b19efbd0935ac2e18c4e",
-    },
-    "0x2791bca1f2de4661ed88a30c99a7a9449aa84174": {
-        "ticker": "USDC",
-        "signature": "304402200ef170e3f0a71b03ad7758e201d9861102f78cabcbbc5dbfecc5a946236438c7022043c591264f57cf3026f12f98e9b5112d2dd2e7b2d6c04206ace2475ed21e80f4",
-    },
-    "0x236eec6359fb44cce8f97e99387aa7f8cd5cde1f": {
-        "ticker": "USDPL",
-        "signature": "3045022100dd03c274dc8eb3e9b66345ec00d6b7bb13dfaaf0c1c480810372b5a5b652187f0220396974879e8805834c1f061b4d59c164ef37828ede3ff36ac7000548748fa007",
-    },
-    "0x72c96c73207936e94066b4c8566c6987c9a1f1de": {
-        "ticker": "SCB",
-        "signature": "3045022100b031260e85c03314b1f1114e4ff33bd389b4766bec4447cb978497144f367aaa02204d697b62968433d20825f487f9f09e29e65c7e45622af956eb72df79b43c1ef9",
-    },
-    "0x2f5de51823e514de04475ba8db1eeba5b244ba84": {
-        "ticker": "USDOT",
-        "signature": "304402201ebaec000a12be20f73003775925d42be599d1c552f140bae9e197f4b75520fd022065f8d09a165b49b07c989100fb27d129d37cbe5f5c78ea5c6e1101a9aca82722",
-    },
-    "0xd07a7fac2857901e4bec0d89bbdae764723aab86": {
-        "ticker": "USDK",
-        "signature": "304402205613ac257b797ef31c6890956a12d192b89d03a7a2078898dafb0b79b0cb1b5c02202dfe6eff014166937d540742538335257dd9f5f9dce2491b7c05dbbbe92f4080",
-    },
-    "0x323665443cef804a3b5206103304bd4872ea4253": {
-        "ticker": "USDV",
-        "signature": "304402207fe8afec61b5660bafc28f7840c6650b4e2492eaebd682d2a14336271b40096f02202a83015897500a790171e7d1cb586de7cf3b1ec9e602e0c4b3ad29ead7a4745e",
-    },
-    "0xb3bec36e9fb41c88b0f0433a3e5f16cf0dd7e0a3": {
-        "ticker": "UZX",
-        "signature": "304402201a4b1bae7a9c0ef88efb7ceaf517c24d7110ebe762a8f024f04d5aada22ca9c9022000afffa314d67f7b3ab9b2fd2cec7e790cc7fee231f15a8eef3ec38badff28a6",
-    },
-    "0xed28b1890fbb4aa9ded528c1034fed278ff68f5d": {
-        "ticker": "VAB",
-        "signature": "3045022100a06a5227f518916fb1ad5a6180276946ca2d67dbb6ec2425575d195c5ab93ce502201a8df11aacc4c4d9a59df92744e5547944644aa9b0b0e9d3df8e1c7fdd451bad",
-    },
-    "0x8de5b80a0c1b02fe4976851d030b36122dbb8624": {
-        "ticker": "VANRY",
-        "signature": "3044022052ad61194ebbbc113b65eb887942dca4c628cc7ba4537e09951fd182e8b7b33f02207d250b003b610fdd3898dada8d6073cb5acffe0464ba25143326aeb8af91517c",
-    },
-    "0xd60deba014459f07bbcc077a5b817f31dafd5229": {
-        "ticker": "VATRENI",
-        "signature": "304402206704ed8161ed957687780f235adf76ade152aef0e8ad1fb3618fed04c99e997502200ea1d3f8a4f00fd8b4e12f82f58bc6d4e9185b0e7ba23d2618abb168d9741270",
-    },
-    "0x51b5619f5180e333d18b6310c8d540aea43a0371": {
-        "ticker": "VHC",
-        "signature": "3045022100f2c25d3b33db0721a0743d46f7abca6bf9774aafbb55177624263407ae168d1f022076af2f766cddb40c668b8eaa09242befe3fd92eb1812fac27e969138ad4d84f8",
-    },
-    "0x27842334c55c01ddfe81bf687425f906816c5141": {
-        "ticker": "VEXT",
-        "signature": "3045022100b17f3e8a711f9fb9b02a845a8da4458c59bb2add8727c184a60aeb238b00a4cc022044ec3a8b666e0ec8b7e7d085f1c3295ac9598f275c1c8cfecfad523c98c16b92",
-    },
-    "0x765af38a6e8fdcb1efef8a3dd2213efd3090b00f": {
-        "ticker": "VDT",
-        "signature": "3044022044a33c3fd7bb2dd0e6b691ea0b718d9216cc60b37ee3c40119bf706f5590624f022023e28a087dd3a825cd6b35664b49a631fa221d809a3fd159c9ddcc468a00e3d8",
-    },
-    "0xf21441f9ec4c1fe69cb7cf186eceab31af2b658d": {
-        "ticker": "VENT",
-        "signature": "3045022100e008b2d47957e4c648ac276c3330dbd21a482424c10a62255e581cff638909b10220181e75b7165e6cb27b6d7ad3ccf64d1e9a224326195900d782751872042c30c6",
-    },
-    "0x8497842420cfdbc97896c2353d75d89fc8d5be5d": {
-        "ticker": "VERSA",
-        "signature": "3044022046dbf7d3754796fed447f2464b9f6d2ec77f6ae18731bf2551c36a1e5deb45670220335e906f800ffbab686932cc1933cdbc9e67b11465776eb8f05781884a4494bb",
-    },
-    "0xc708d6f2153933daa50b2d0758955be0a93a8fec": {
-        "ticker": "FXVERSE",
-        "signature": "3045022100bd1ab3ff45001323d9f52d2a35076d542f20884db6b90069a83dd16793239d460220549a6a2310ec5d40fe3955c65f11b0f19224817fb0adfd9f3ae7bc2cd35991a0",
-    },
-    "0xd192bac61522e0bc13543528173e69c44472c93a": {
-        "ticker": "VVT",
-        "signature": "30450221008229b7fb6fe7ccd7a5f53fa086b31fe3c4f4f228ae4e57e38b35c07d54e6134a02206d2e6c7cef7db5192221dd7358fd5876e262f052ad0e664ce932b226f0ca36c1",
-    },
-    "0x09c5a4bca808bd1ba2b8e6b3aaf7442046b4ca5b": {
-        "ticker": "VSP",
-        "signature": "3044022046419ec25dab4fc07fe8a0936cea029dfc04ce9cc9955a7d1b16c5f6361a3b940220336259779ffbec502fe8a318101def15008d5077e8ed88a0af1ea8db15bee2a0",
-    },
-    "0x8a16d4bf8a0a716017e8d2262c4ac32927797a2f": {
-        "ticker": "VCNT",
-        "signature": "304402204c4f19a159452273d663df80899775e784c2d27784d3c029a20c81c9503c48ee0220368b2c6424bcf078e1473a7ee52eed1c00cbe8df678d6ac98d58f7cf7f57a121",
-    },
-    "0xcc1b9517460d8ae86fe576f614d091fca65a28fc": {
-        "ticker": "VIS",
-        "signature": "304402200ca0d53d4f7d8c01fcd949130b112eac9070a2eb19641a2f1a6d81c49574d6420220647a7b7e9680002069fa2827951458493f3b3cdc22bdd50f228c85e937694700",
-    },
-    "0x0a16aeab4418cb8dcdef9717e801a1c4fceb2b03": {
-        "ticker": "V",
-        "signature": "304402203a56ac04730f3b154b03e3fb2bc9a4d7eab6f64c61bab5d15d857a0488efe8fc022026ee26818309ad9f0a959918cd902af370ac7c8c82c0d5c49b5bd00c3c19dbdb",
-    },
-    "0x57999936fc9a9ec0751a8d146cce11901be8bed0": {
-        "ticker": "FXVRSW",
-        "signature": "304402203458ac5f10c365e7dd2176fc8622d38c7ad30a36786c4c37662cbfded28909c0022043a5ed58d8c52cb302854b92883db9cba6ce891ce1181e50e8ec9a4bfe4fafb6",
-    },
-    "0x034b2090b579228482520c589dbd397c53fc51cc": {
-        "ticker": "VISION",
-        "signature": "3045022100af38e6acea7f96948665cc33fcce5f312e1bff5997dac229f550a6aca2ed01c10220103ee10419bd8a4325715d58aa825e9dc00ce6140ce894902bedf171ad3e2383",
-    },
-    "0xafcdd4f666c84fed1d8bd825aa762e3714f652c9": {
-        "ticker": "VINU",
-        "signature": "304302201f30c9d1119f3c0537f34386ae7c3c75859ad04120e972440314e1f78285d0d4021f5818e8573982b64b24a5641a4db1bdb36687c239394373961e32f7c3c7e229",
-    },
-    "0x7d24903b4c4c81456cf9bf66b73ce95dc6914950": {
-        "ticker": "VTC",
-        "signature": "3045022100d0332a80865a7dac56a97f6a4bb51bc0b0cecee0f84a11fe48ce0a573db2530a022052ad8f91e70be7177c5053c6c54ef6b7bbd77c10ae2d6ea0f4b1458fbdf0efc8",
-    },
-    "0xe4095d9372e68d108225c306a4491cacfb33b097": {
-        "ticker": "VEUR",
-        "signature": "304402204d7f3a42cdf9f017d54f9c752d483f250b5a0e504a4d701b2a5ad5811928a32502207c12cd5d14328efb47441fa43b594fc52f97bea0e500af640cfbf4b242dad256",
-    },
-    "0xcdb3867935247049e87c38ea270edd305d84c9ae": {
-        "ticker": "VCHF",
-        "signature": "3045022100d3e82953d1e57cb98f611ee272e779c2aff8f6d8e247427d6ea983cda9c2a24102204e6b1f280aa490cd145c15744111d35d0068f5068d28c4be8c7688312a83ae43",
-    },
-    "0xc8bb8eda94931ca2f20ef43ea7dbd58e68400400": {
-        "ticker": "VNXAU",
-        "signature": "304402204541a1131e40c8d2bb8a75fbc74876386a7bc93ccffeabd00c156d528ea4617a0220470f419cdaf4f6e26fadf241e7ca4c6172fc440ded8056124e4d50e2120f2f37",
-    },
-    "0xf16ec50ec49abc95fa793c7871682833b6bc47e7": {
-        "ticker": "VOLT",
-        "signature": "30440220320f499a488f8a7cdacc8f5c928440f43a3dd3970355e6123db83a7d71123d2402207ae2caaa257eb0d2d7073348f82fbcfea444b5b642eab5f12aaadf07af4e6301",
-    },
-    "0xf46cb10e8c5fb9368bbf497a3176b80c0af66d44": {
-        "ticker": "VP",
-        "signature": "3045022100d92b45997e0ada85eb1b30ac95dd195b161ac6b899828231ccb6f0b5df439a4402202fd49ddf8f363d586e432a25ce09241edf3233a08d1d46acb530edc6bb584034",
-    },
-    "0x55ca76e0341ccd35c2e3f34cbf767c6102aea70f": {
-        "ticker": "VLPEN",
-        "signature": "30450221009e77b7e478732536c9ff12c2b08decefb61c799c22db91f35e2ce6e5ba6750d90220643b7451a229c41fc1e297ea148635fb76c7a7f37cd00c3a1df71125366a6084",
-    },
-    "0xd0258a3fd00f38aa8090dfee343f10a9d4d30d3f": {
-        "ticker": "VOXEL",
-        "signature": "3045022100e9df989b25b7dab962f5fdfbce74cb79fd51a566fb656b82cdae730b2dac2a3602204854f994fb4dbd20dfe8346f047d971dc5ef19d8648e53b8f27cd908e6943d46",
-    },
-    "0x823bbb870b0eb86bd7ec0bcc98c84b46a0f99ac7": {
-        "ticker": "VOY",
-        "signature": "3045022100ecc63aa90c7b1075225d1e802250551970f5b728af1c5465dd1d52a16b28c26302201e71245aa96cf1c769f566de926e42bfa3b50fa204e4cca9e504728477a88496",
-    },
-    "0x054c42b6414747f5263b4a86f21b1afad00326bf": {
-        "ticker": "VGX",
-        "signature": "304402207adb14a4402bd7f0e74ed94c4e0212785b145e671f2ae9b888ef6fa1e85cddd7022070f8f3ea98dd86ae7434cece3acf132dc6f0a34b4e51c439c03807e4abefc580",
-    },
-    "0xcdf937995a55a9ab551d81b463ac0f7f02795368": {
-        "ticker": "VSC",
-        "signature": "3045022100fc2059489683ff5dce8c0c20d51fb3fa7ee57106ee283bd31cf2c40417ab502c02207d4fe3757942d54d7d5a9c05d51588ab49cf8dd73f0d09b7658b88f50bca3187",
-    },
-    "0x25cbe406aa02053fedc955095415fd8f497f072d": {
-        "ticker": "W3G",
-        "signature": "304402204f6d7ae19194b6553f9da3340d08167bbc5346f20cbfd134788cf74ff5e08bef02201baff54637dd3ad9beacfaf316467a11137de62c874170aeb8eaf6fe96e83f2f",
-    },
-    "0x07ed33a242bd9c08ca3c198e01189e35265024da": {
-        "ticker": "WAGMI",
-        "signature": "304402204ec16f44ba057a52c3af6c85fccbd32e8d971e7e9ffab392dfd71fe8b701949d02203e8a75bfacf8c7b0e2ec885a12a8f9d4b6fbfc6f05e0fc165023ff898da7aa61",
-    },
-    "0x69166f825ecac553d5cdd85e936191d6191dfd57": {
-        "ticker": "WUT",
-        "signature": "3045022100d9aa8284bd2afad4ebabef645e05978f6ba324966dddda56a4afa93f5d4c7b9102200c6b9018b75f7831441177e4428cbb69825189a29e5329ab5937b7ba1030f2d0",
-    },
-    "0x3c1bb39bb696b443a1d80bb2b3a3d950ba9dee87": {
-        "ticker": "WSG",
-        "signature": "3045022100f0ebbcda6bf15e75e3a681e1ff585dabcbaf37d622fc455d22014fde0382e6c602207b43ed1a8402da33ea48864eb899483004f9f34ca121ed7bcd8b276225176ae4",
-    },
-    "0x5d5530eb3147152fe78d5c4bfeede054c8d1442a": {
-        "ticker": "WNOW",
-        "signature": "30450221008998750f1e666f741acbbb658286033045f4b095169253224a4ff95065a3c466022049ae0729ae673b4af5656231ac5d1cc1f7bbf7cc507732106c518d7306ce7789",
-    },
-    "0x95093f8348c6678df4812c008248d88cad344069": {
-        "ticker": "WAR",
-        "signature": "3045022100a5a6d23ae3cc44231ac498e0a1070ba1161d063046d5508fdbfa6179586c42fa0220267ae1156ffc413e1a2f73ca2b0090c7393e0bc3cb2cdb236b4c3c97452074e3",
-    },
-    "0x5d705f967e40300fd54eb1a7a278b761039da993": {
-        "ticker": "WARPBEAM",
-        "signature": "3045022100f11ffc9f8340a15edc234b31c149e4d1e7e407b71fc57da27b48a592ae4829fc022029a5c1b767fcd7b4cbf544bb7c93d553b2ae3a5489d087eb6ef74abfb2bd6cba",
-    },
-    "0x4c4bf319237d98a30a929a96112effa8da3510eb": {
-        "ticker": "WEXPOLY",
-        "signature": "3045022100bc695093f7bc1f4a5eca39fb0ad45bb7d3421fb24c0b582456e7a3e6556cfeff02207aa4ef9f0b705bbc5ee20fc26a27d8292a21ddf5c3b1f679bbe224d54246397c",
-    },
-    "0x72d6066f486bd0052eefb9114b66ae40e0a6031a": {
-        "ticker": "WRX",
-        "signature": "3045022100ab4f4b77c7836c3313f90cc9a3e5998dea75c0f26205b94faece1b4c1732ce4502203387a29d1a6401e651876b1e918236c581aef03c6c1bcc6ed3ed7f24c7c7833a",
-    },
-    "0x8f15330737184643473348004ef70c1c57c2966d": {
-        "ticker": "WGT",
-        "signature": "30440220035eccabfef82dbd5e6dea1db417620acdbd0c97415d19413b76b2b391de3e3902207fce8138ee2fe4d589fd6c5da7f4ad90887766a11380f9ca64f220d895482fd3",
-    },
-    "0x632b8c4e95b2f8a9309417f8d990ab9c04c77369": {
-        "ticker": "WET",
-        "signature": "3044022076859941ee8542b410e154e28700fe42a7a99905aca3baa51dadc4fd8c0615d502206e2d3f92e9934588e2d9ebdfb749a4fab285a1f41e7bd29044a9774716f86192",
-    },
-    "0x00147f54f9a32608d0e0548a99fc8c7e594bcbfc": {
-        "ticker": "WBS",
-        "signature": "3044022023465038d9ed95b1553f51c9c820af5c764cbe3211fbe25e409da759e0bce9120220337f8c250e45b4d72b823c329369309ee77a92bc44928c6ee1480bccc51cddbb",
-    },
-    "0xffa188493c15dfaf2c206c97d8633377847b6a52": {
-        "ticker": "WEFI",
-        "signature": "30450221008f50659600506bc894a18c38efcee9daf04d4d624b50adad30a2b9d8231571fa022060caaf36be232cdd2e7b630ed0fe939bf28a633eb9da7647ef22d23295225b3b",
-    },
-    "0xbc95d3bb681a4dfc0c60a9d08ca67301b5764225": {
-        "ticker": "WELT",
-        "signature": "30450221008ecf07e0ef0289321f3aa565a5bf0259d62f27f9f78a41dc0205a6c8bf49ff87022020c2d72d532fb7214c788bd3dc3aaafcd7d424f06070f2cc3c560e4d234aeaef",
-    },
-    "0x11a88f949c0592238959142653bb6847c6523d81": {
-        "ticker": "FXWEN",
-        "signature": "3045022100e23f89ce1d58c25ec4fb74bdfc64dc09c4ee8b2ca3d1357230d25d1c3a9e3514022037c033c3a321bd2458f9cf4ac1d23b1322a569f496e363a434dfdd131843e930",
-    },
-    "0xcbab27b2d5b468eea509bd430100922341bc3f1a": {
-        "ticker": "WPR",
-        "signature": "3045022100b2022385b9fb931b51eb9dc58b6acfd9329dc01fd876143fca05dd13f1a00072022033c14a9f00ce8b5ca8618f64bde930921e09af636208776f3a0520a247747508",
-    },
-    "0x9b2cfe1608250bea375c6199b474b402bad920da": {
-        "ticker": "WERX",
-        "signature": "3045022100cccdd280be0071b2d97b35bf61143d9870f3d2d323500678e6cbcab897ecf9d0022002ff205bf04ac0f7faf71d554d657a99c543aad220684f372ea346207ac9588a",
-    },
-    "0xb541a306dd240ef04fb5e7e0db9a3c6cb7ddbb07": {
-        "ticker": "WFDP",
-        "signature": "3045022100df017512982d9399d552885e072dce20bc8a13085c37225a31d2d8cd3b29132b0220495cdf142c4e54ea4f80c85586a53c543914cba76082d59492bced4e9f2c7eb8",
-    },
-    "0xb9585ec9d4c97ad9ded7250bb9a199fe8eed0eca": {
-        "ticker": "WHALE",
-        "signature": "30440220166dc4cf3ef9084d4069726efac2150cf25b15f7eb209cc2429ccf2f386ae67102201702b17c0c6ee01f2532218a98988b031c3d360752587ff37d99b75d9a34578d",
-    },
-    "0x82a0e6c02b91ec9f6ff943c0a933c03dbaa19689": {
-        "ticker": "WNT",
-        "signature": "304502210081cf28d7cd91cbfb199bde0765325c4c15ba0f8cebd5746de328be72765193cc0220113cdceda9b939f02c8289ccc69257addc31f061e2360ae706a2c684dcae0d1c",
-    },
-    "0xe238ecb42c424e877652ad82d8a939183a04c35f": {
-        "ticker": "WIFI",
-        "signature": "304402205fc5fe5df1ceb6b255cc90f0f46dcffb2b6cd70c461982ff5b91bf77318402f702203a4de8a6a69c20987a2be87d2516eb4e96573ea416003657b1a80f37515d5df3",
-    },
-    "0x382586651f043cbdec7bb586e367d77b26d7d149": {
-        "ticker": "WGC",
-        "signature": "304402207d143c5bd83f65a6ba3893b1703ad8479dd22983734ffc7f613459db655c61e6022023325833d7a6f4cc54c9ed00c0e126470e05101badec574527e335a1e1a33a06",
-    },
-    "0x1a49e59ab7101d6a66d6b2fa6d09932079cc80ec": {
-        "ticker": "WINS",
-        "signature": "3044022037c21875f4f8ca976c5c787b9afba57611c145e8dba581ee6ff17d90ac391ee3022025dcdc80f342178cf4a94c4425cec7ee3f29f57cf283d42bd22403c1f5de786f",
-    },
-    "0xb7042c40de76cfc607ac05e68f9c28a778f0c8a6": {
-        "ticker": "WISTA",
-        "signature": "304402203521df86aaecd8f10a99831e1b907bf6ab566cd710dfe7fbbf858de54c00b37b02205a2e576d1ad30e6d4f162de00f886e3a5e7a11de8966d13b18f89f20c042328e",
-    },
-    "0xa936e1f747d14fc30d08272d065c8aef4ab7f810": {
-        "ticker": "WLD_",
-        "signature": "3045022100b0e6625c025954019ecbbf1122f6dad36f3435c53566a370ea4ef2631211c26402203144688deb3460c5a9c096288206fc022801e1bc2a8bc011fead54459e95de1a",
-    },
-    "0xd3144ff5f388d36c0a445686c08540296d8b209b": {
-        "ticker": "WWD",
-        "signature": "304502210092b72427b399c15a42f406080ce9af8c73eb55f2c53755c636c689736f98559302205570922845bf7c50f15595c5fc042af6132c4c7a5cf9ca04e35120df5e7cd867",
-    },
-    "0x46d502fac9aea7c5bc7b13c8ec9d02378c33d36f": {
-        "ticker": "WSPP",
-        "signature": "30450221008c705188353a5068007259db56f2d47505fee9a1a9faf323c315d6f2f094d66302207029e09e26e3d3c556d8635ada6d9ef32b6767e1349dcc5ad64421986eca597f",
-    },
-    "0x0c9c7712c83b3c70e7c5e11100d33d9401bdf9dd": {
-        "ticker": "WOMBAT",
-        "signature": "304402202cf53019db2c9200abb896740e22e399496db5cabe6c3c556e80fb74493b1e1e022060f249b525b27d455723bd3b4bdcab3e3db4d1226d557c86e195c4271990fbf2",
-    },
-    "0xfce22ad802bbc9fe74534575b166d06198bd66ea": {
-        "ticker": "WOOFY",
-        "signature": "3045022100a708d0d98a979ed4407844ee000dc827f2812baf88abb3b547f644c610a467ae022064c0c24a928ef14c212a73ebffb566150861a026ebb503a2886e331766fb1fa8",
-    },
-    "0x1b815d120b3ef02039ee11dc2d33de7aa4a8c603": {
-        "ticker": "WOO",
-        "signature": "304402206fa91ec7507c0b90e8072900b0ec42a60496deefa710cb0a942178610021100f022040c899804634ebce099a9c8ffb3bd1e34a229e73a4190c0f320662fda1ee0994",
-    },
-    "0x77a6f2e9a9e44fd5d5c3f9be9e52831fc1c3c0a0": {
-        "ticker": "W$C",
-        "signature": "3044022073d4ce2994f701f616b64fdd5348925de68f45e0de3e1de96f7dc4fcf36fd08502203fbe27fc96d3aca312d50d564f403c623f1b5cd10168d5e3275c434aae2b8d3c",
-    },
-    "0x63062d0f51fc65d4493c85df0863f631fe2a26b6": {
-        "ticker": "WORLD",
-        "signature": "3044022040a937e868361c87bd4314f81abe668a6a45c64deac247c4f3e5459982081178022054f9ae6855930b0b690ebd4184990c671af9c41f7f6e74f88f20c217aff52268",
-    },
-    "0x855d4248672a1fce482165e8dbe1207b94b1968a": {
-        "ticker": "WOW",
-        "signature": "304402202968b375a00a0c1f98bc75527e4189aaa1d07a5320f936ad8fa49b3bc48f0d8a02207d8c44fdbda3f1b7b7fd6c953cd6f25de204d65f61018cb736c64c5947f565ef",
-    },
-    "0x7bb11e7f8b10e9e571e5d8eace04735fdfb2358a": {
-        "ticker": "WAVAX",
-        "signature": "30440220246d7983fd2f9b1ad38d04ffcdcbee3357606bbca9e5b8371bc4cb0bc96e6584022045acd3d18919e7050b874d10101f317fcdca1804994f9752f9442d23db638948",
-    },
-    "0xe20b9e246db5a0d21bf9209e4858bc9a3ff7a034": {
-        "ticker": "WBAN",
-        "signature": "304402207ac98c1d4e909ada15c1d9a1e826131bf14ea63ef175da96acf59e4d6d8ca82d0220238dd41ec083d831ceda29b64201e46d80415186179757a4a47d86078c5e3c73",
-    },
-    "0xecdcb5b88f8e3c15f95c720c51c71c9e2080525d": {
-        "ticker": "WBNB",
-        "signature": "3045022100df3220541416abe34d2b719677f81721d927f5c762d57fa7ce7f197300d4975c02203d6bdf4d62fadf16b325890f087391b9627ee906ade739007b922bdba6771798",
-    },
-    "0xc30dd0cce2e683aa68c87c280e73beb3dec9b3ba": {
-        "ticker": "WCELO",
-        "signature": "304402204533f1d264f27aaf2bded35c70e342f9e093d3563e21a69581099694b76296630220224c28490a748c183cda281bada3a27958f561fdc33f71e998d62001a21f4e1f",
-    },
-    "0xe79feaaa457ad7899357e8e2065a3267ac9ee601": {
-        "ticker": "WCHI",
-        "signature": "30450221008715961fcd0249516c3f655ef8f57a0be585cd187a168a040b203eb8aef0ed6502206cd429414baa535dea51fb9e63796e0695f4367209e79664dec20b8697098870",
-    },
-    "0x7ceb23fd6bc0add59e62ac25578270cff1b9f619": {
-        "ticker": "WETH",
-        "signature": "304402207b674dc939fc9958aef413f7e1b3d755ffbcc8240933d7b6d888e4adeae5c8a802206dd9b1c0c8291e28977497ac8139902446fbb770cd82f6aad7eb7c7b72d69b50",
-    },
-    "0x11cd37bb86f65419713f30673a480ea33c826872": {
-        "ticker": "WETH",
-        "signature": "30440220689315fd53e8a3273303bfb497b4e7c58d77fb351db7e7d9a56e875a3aa06a4c02204ca90fcabfbc030dbd5bb0043d0a85b2b8587183c868c527b8f407fb5ab3319c",
-    },
-    "0xede1b77c0ccc45bfa949636757cd2ca7ef30137f": {
-        "ticker": "WFIL",
-        "signature": "3044022078b0af0f86bc7b62ca450d4868649cf8df6973d3331a7ea244abec015abbbf5c02204a80853c3be77db55d88d647b8a1522defa0a0ea6a30482ca815453d180451d4",
-    },
-    "0x01d1a890d40d890d59795afcce22f5adbb511a3a": {
-        "ticker": "WFRK",
-        "signature": "3045022100bb704b53fb648909bc0806371f756efaebf868035438b0102129b14325588fc0022068b0cffa4f690eab1005f56a450515935ce2dc3027ed9a60dc4ecb9b64847829",
-    },
-    "0xb5e0cfe1b4db501ac003b740665bf43192cc7853": {
-        "ticker": "WGHOST",
-        "signature": "3045022100b5b37b948d3ab44463a206150af18948efa1ec0f630f0ab74c23039a8aaf99400220187d19595b899c8c70df1efe7e056b653930972bfac5f43fb4c20f45882cfb66",
-    },
-    "0x1ba17c639bdaecd8dc4aac37df062d17ee43a1b8": {
-        "ticker": "WIXS",
-        "signature": "3044022010c5a4c283d33754c01d52b1efb06e45844dd575d1bb20ad164af0eb915d0f3a022060075f9a9a4c8c19339931a68114ff2dc85ee8057cbac439eb2e7803463a4c67",
-    },
-    "0x03b54a6e9a984069379fae1a4fc4dbae93b3bccd": {
-        "ticker": "WSTETH",
-        "signature": "30440220025201a6cc15d15e2735f3b549c024cc4d9782ebc891dfbc086a3ed31a803c9902204a6a98011acbcd8ba47c5ce61602f9d91f5882d553aa3eef78016d6b257874ee",
-    },
-    "0x0d500b1d8e8ef31e21c99d1db9a6444d3adf1270": {
-        "ticker": "WMATIC",
-        "signature": "304502210083ae7e7508bbe06a1b6c59543e62a3dcb2e825a6c39c1adc9ccd439253ac7f4d02201f60dcd93ad430b79b4b0b39571f5f15988233c04e5d2e45a4ecce1639fabf07",
-    },
-    "0x57f5e098cad7a3d1eed53991d4d66c45c9af7812": {
-        "ticker": "WUSDM",
-        "signature": "30450221008839ede91341fb64e13f181e95a44fea843f89d02d5a5a877db7d9373833fd7302205b6a95080d0fad1727fcd876a572a0e50e11cf27c69032e7c6bf7825dec33cd4",
-    },
-    "0xdfc3829b127761a3218bfcee7fc92e1232c9d116": {
-        "ticker": "PPRCY",
-        "signature": "3045022100a263df8573bc61ee9bb417b96518d959398e60724c4360948fabf6fb50962971022015dc0d38d8916bad565147e738a0fa4047af4f1e333ea1048c1606c7d66c2d32",
-    },
-    "0xd93f7e271cb87c23aaa73edc008a79646d1f9912": {
-        "ticker": "SOL",
-        "signature": "3045022100e8b1a3d11196e0e77cb7955bfa73a820fdd7dcfc24137bb7a2eff34d2774f75a022058f54c4718e59f9f8166985df060bc0779fc029818a560c643ba685ca434e137",
-    },
-    "0xf629712180bef6f4c569b704e03d0acbe276eb6d": {
-        "ticker": "WSTA",
-        "signature": "3044022076d46e758341c25c34d6ca8c9ea6ee5c783931a93baf64808668d84a8d730be502203f1a7b3c30704a239e275ad162b63000e60213455f7a9003c36cec6c6a345403",
-    },
-    "0x301595f6fd5f69fad7a488dacb8971e7c0c2f559": {
-        "ticker": "WTPOKT",
-        "signature": "3045022100cc7834567f50737d35a2d2567384c3f8707e835c1fc3034659dfc87c797ce9df02207a9dd668290a410bbd40dc32cc4d8f4094e1b63f48d94d7fb9b07b8dcca88f8e",
-    },
-    "0x00e8c0e92eb3ad88189e7125ec8825edc03ab265": {
-        "ticker": "WUSDR",
-        "signature": "3045022100fc8b5dd00ee8908bdb4918f74aa3f7a7178d8fd4b9ba15a01dfaaafee9a773bf022001c5b01d931d09a0d66bf334b4cee6030c76b3ea571a4451a69b8cce6203ebb2",
-    },
-    "0x692597b009d13c4049a947cab2239b7d6517875f": {
-        "ticker": "UST",
-        "signature": "304402204ad3702836823f826e934b945997b15c3238887767be33ef21f1aa5c9337c95d02206ed2ae004976c4d4ef8d6d62a785602f620490ad36b447d08de0aed9e46a4a02",
-    },
-    "0x0395e3178305e64ff9e8d942eb3a470b5d88fae8": {
-        "ticker": "XBBC",
-        "signature": "3045022100fa2ae059486b3693a5b92e1c8dc1310c47b51016c4c68153811103e41b6ef66e02200556d35bd84ecc52f168ac767f57e86c0c0fb2038f84ac59dbe0d9d1493fe79d",
-    },
-    "0xa55870278d6389ec5b524553d03c04f5677c061e": {
-        "ticker": "XCAD",
-        "signature": "3044022024aab1f79651c3776d393b6cc4ba60d72e3dfce8233d44e82766cb4b76948188022052c91ce3b8405845b407230d03df817a8f908507667902504f3ffea85dcd83c1",
-    },
-    "0x71eeba415a523f5c952cc2f06361d5443545ad28": {
-        "ticker": "XDAO",
-        "signature": "304402205c86a54498c10d590d54165e5a4c7c371c2dcaf60365116a018c5976bcbd7c0002201fa2d8b607428d4939938a49437e402552b6eeee0d15e6b2d3ba45edb63597e2",
-    },
-    "0x2ab0e9e4ee70fff1fb9d67031e44f6410170d00e": {
-        "ticker": "MXEN",
-        "signature": "304402201663b7a1d7581b270b482f902b548600557cf9637f0fb0dda4ca59340054431a022048ae2ea7a17f9836b3f590d9e5ba219bc48767f93e61aa7f21c868e127e043c2",
-    },
-    "0x86775d0b80b3df266af5377db34ba8f318d715ec": {
-        "ticker": "XEND",
-        "signature": "304402200a07da8ed12860315a60305b34251f5b5de64535e6943d68062db0e9ddb67ece02204c5c0d53a41d29413551113b3c1ff4894b78833973c79c82b6663788e4669fd2",
-    },
-    "0x36fe11b6d5c9421f68d235694fe192b35e803903": {
-        "ticker": "RWA",
-        "signature": "3045022100b9ba4a778bfc1f9584727dd230104d8950a6d87a850d8e2639608d11f9c6368d022063387f7a93e8b6ef0c171b24c88021143e79940e03111d5a52cd44051430e278",
-    },
-    "0x2c826035c1c36986117a0e949bd6ad4bab54afe2": {
-        "ticker": "XIDR",
-        "signature": "3044022075a6fb2a7096e7f1a3d9cf0b2e65845f315747f6b58b4ecbaf4fe8029c7bafe90220665dac7845f04cbf2d4b0593238102aca38593f9c79408cc99b800977fa415ff",
-    },
-    "0x9eb8a789ed1bd38d281962b523349d5d17a37d47": {
-        "ticker": "XGTV3",
-        "signature": "3045022100f85ed3484c17063ed1533d470a74ac93f3f261313a2d366fed78b9101259c1ad02200dda6818beb9ed48155a83afa693249faadec328ceeb972266b4f81ccd3ea575",
-    },
-    "0xf6d5d14c5684fa5853a3be6d217cad19c6ab2164": {
-        "ticker": "XMATIC",
-        "signature": "3044022049344de4cad0c215c1cfebeb31dce96cafd7a69062a47e3e38c924f41dddf0af02200a98f996cc00d5215d10f90cf8cf8b3b073f2bf3498a0750b8ac0e3940c9d744",
-    },
-    "0xbc5eb84c052fd012bb902c258c9fd241b17c0005": {
-        "ticker": "XNET",
-        "signature": "30450221008d2eb8ba29c44b44fd4632f4d6196cb29106f87b112750f94ff82f7a3c0eb10302206aa07c1a2f7926b94cf37d56dce640c234c731dc777b3a59c2bba65dea851735",
-    },
-    "0x62395ec568c92973a38230de209abba9de18b9b7": {
-        "ticker": "T3XP",
-        "signature": "3044022038b3945ffa6b7429f7fa69fe489cee3c1d4ec684ecd9c2ef2f94d8817d04b549022011a24f954bad68a37948644acb53872dbfe72685b91a304e198008bcdc754298",
-    },
-    "0x03f61137bfb86be07394f0fd07a33984020f96d8": {
-        "ticker": "XPND",
-        "signature": "304402206f9e2ac67daab794f470055d9e9579dafb29c482cfd41f9ef8402b6174b3376902201748bd4af860b9c48dc4dbafc8ce9faf689a19898aacaab1a219d6c2e679aba1",
-    },
-    "0xdc3326e71d45186f113a2f448984ca0e8d201995": {
-        "ticker": "XSGD",
-        "signature": "304402202c9b047b7e733042c3e39d2d049eb2c392dfb74b4ac02e7f30e6b2367b1db9c8022021721c13514919f886ccb49f11071bc6189d4102334d84985fbfbf41840f1a44",
-    },
-    "0x1e3c6c53f9f60bf8aae0d7774c21fa6b1afddc57": {
-        "ticker": "XSHRAP",
-        "signature": "3045022100db5de8876ca5b6fc4ab51dbfab5ef6bd64be8f1442599297b7a3dd62d008576002203dca02de7846674b678a32e810a62c463c5ab99e044336aee198c5ad4507f5a8",
-    },
-    "0x22308317a4aa9e8196065e0b3647e582d44c4d7b": {
-        "ticker": "XTK",
-        "signature": "3045022100eb4c86fd40f2cb862f560b6f2c39a7e20cd7756ccee500e5a71105d7ebecfec002203f445753745434711b27ad0470b5f407933742a90a1abfc0a63d332606e91361",
-    },
-    "0x81ee105457c4eafc061b8c8fedc7bb45d22286d2": {
-        "ticker": "XUSD",
-        "signature": "3045022100ebc78039400a127914a1c5a202b6ee18821101b44a89f54119c3cc253a611d6f022018d89526c56ee5e1599dfc3c2fb8f7ee49dd7acb1e0d0b83aa423a335a95c35f",
-    },
-    "0x6cd6cb131764c704ba9167c29930fbdc38901ab7": {
-        "ticker": "XWIN",
-        "signature": "304402202f776a7cfcde4093d0cc66ce51cab994107da364db284561a3f107a54ad149d102200a9fd8be49341364a8619707ebd1a6abe2be3c04ae55ea0218a44d4bf0df17ca",
-    },
-    "0xd2507e7b5794179380673870d88b22f94da6abe0": {
-        "ticker": "XYO",
-        "signature": "30450221009c6c9847cbb09c138ed3b5af562c43d8a7e749cce38bfe69db795a409c74afc202202931be6a66a39f91e7e2854753e98cca122aac46995fa708778b10e2d5249dbf",
-    },
-    "0x55555555a687343c6ce28c8e1f6641dc71659fad": {
-        "ticker": "XY",
-        "signature": "304402204054ab565566a57d15f2fe13ca20255ee9cdeaf36bcf2b614dd4d2879814a92b02206f6854d115deaf59bc5bdf1829fefb569ed902190237e39aa06df44ac7b3d1d7",
-    },
-    "0xb962150760f9a3bb00e3e9cf48297ee20ada4a33": {
-        "ticker": "XZOOMER",
-        "signature": "3045022100ed5cb63bd238a9cbd6ccaecfd2ab0b4630782b24a5a2ca3401b19cc24a1ca3a602203e80557319282e892feff2a9a97e33a5c344ffc02278c2cda0d43731494edfea",
-    },
-    "0x87f654c4b347230c60cad8d7ea9cf0d7238bcc79": {
-        "ticker": "YAMP",
-        "signature": "3045022100a8ade8d9c47f14a2a06016ee961eedc1047ca68c2e3c3dddd533d73799403d0d02202c2ecc3bbbc11c8e57721811b76a05fa0398cc8fc33aba80f7ec38bfda1f62ec",
-    },
-    "0xd3b71117e6c1558c1553305b44988cd944e97300": {
-        "ticker": "YEL",
-        "signature": "30440220099d916c3f629c853ee6dfd75286cd0e941015fc82fd6a7492f2ad4cdff5265e022050bceacd7b3899910e132d2e71487f0e9e3892f0b0e959ab63bf86e4863766f9",
-    },
-    "0x18e73a5333984549484348a94f4d219f4fab7b81": {
-        "ticker": "DUCKIES",
-        "signature": "3045022100fef7a3b8f2e23cd4390b3801e71e02313c882226e9320f62616c9e8deddf568e022001f577c95ec6e468a38affbe51e0d83c59e521df236bcd9a28e5f3d9e0e8a30e",
-    },
-    "0x7e7ff932fab08a0af569f93ce65e7b8b23698ad8": {
-        "ticker": "YF-DAI",
-        "signature": "30440220304f49565d740603d7afe1f690c7fa2f9b1d2334ec8b5a3afda04c921d28f2280220797ac25a9bd61700d1c1e2a4ee1dd395d797e6c2ee4320039198c58a979ec372",
-    },
-    "0x82617aa52dddf5ed9bb7b370ed777b3182a30fd1": {
-        "ticker": "YGG",
-        "signature": "3045022100e0d30ae31d4f50c86ff493d58d7a3287acaf613982df5a34d0b8a1c2eed3fb6f02205d3f82d35a9e6e799447dedd259564a99526fd5ef3c04174b3b570e6091c0c41",
-    },
-    "0x4cebdbcb286101a17d3ea1f7fe7bbded2b2053dd": {
-        "ticker": "YLD",
-        "signature": "3045022100c7d140cb2efbe9d3d2e42b177296a3f686f79feaa1d9270b6d92169f9d617f1d02205274a2379fb7de8011cb1c5834c342d87c0eb477377968bb085408e9fb98e67c",
-    },
-    "0x09211dc67f9fe98fb7bbb91be0ef05f4a12fa2b2": {
-        "ticker": "WATCH",
-        "signature": "3045022100cd2fc30bce7796b74a803203ec98fe36cd58484ea4945b038b25fd0d6c7ca18402203e7cc0da11f18c2c7fb52d53126a15352b15c27e39050ab0b1656dc2d261e66d",
-    },
-    "0x103308793661879166464cd0d0370ac3b8a2a1cb": {
-        "ticker": "YOP",
-        "signature": "3045022100e0eb845c5687d6ff81a15dbd88b1e7389f98ba31bddd3e649714bffcf8c50d5e022079c623c5aa3f0ce51dceffef85c4cd38fed5425e528d320c3b75904f5c52294a",
-    },
-    "0xa02f99e9fc820bc7942ddeb40abe10ef420e0da8": {
-        "ticker": "YOUNIVERSE",
-        "signature": "3045022100d61bd46f3602ec4b3ad0bf3300011c924381e3d44db3d5c4a96a645d111abffc0220281634a854db4dedafefe13d50a9c540fe49d57c46fcecc9f1d3a50dae0a98d2",
-    },
-    "0xdfaf2680239d678d9551669727b93b62ad0d18cc": {
-        "ticker": "YPRED",
-        "signature": "3044022024643897861cfc72e2f783dd4bcdfc3def8521929e0af822f7045ca864dc4bb30220030fb4679de79897b8cccfd9eb456a57bdce0ec1c9c64ada5a0e69cae1d9f482",
-    },
-    "0x086373fad3447f7f86252fb59d56107e9e0faafa": {
-        "ticker": "YUP",
-        "signature": "3044022049a771f7b547350315fdd8371154047f3a369b9d4ae018f45c69627d9a0428a6022015653fea22af7c6f508d0d6859ee906808dbaa44dfe3ad3551581a16b2e27335",
-    },
-    "0xb565cf70613ca464d68427106af80c67a8e4b801": {
-        "ticker": "YVS",
-        "signature": "3045022100b5c6e5ee30c046f860419834bc1549d5735fd7b3c1c966f2a1a7ee514a9b38cd022073b725298fc1b665bf376abe98b7ec7d7c2fa20b0e7f936908ecba9920cb0b03",
-    },
-    "0x5ec03c1f7fa7ff05ec476d19e34a22eddb48acdc": {
-        "ticker": "ZED",
-        "signature": "3045022100fbeaf15c6cff2bb262d456548836d096205c329ebc77f18e0d6d8e640e6a524e02200cc38ddd1b0ff8962cc1dbf13c1615195369a7c68d0ba2338360876e51635ea1",
-    },
-    "0x4ca7bf91e4384d7c7a48ed4c04b555f350eb6719": {
-        "ticker": "ZEEM",
-        "signature": "3045022100a6cb2b73c88a8719418318c101095a75811d216782814912d7c71afa450de35702204835bfdf7a6d99bc474b86e66b5f0b19196913cc88bf6bdc4231b3b76ecada20",
-    },
-    "0xb5b8381b67248f832c7961bd265f021cd8d291a4": {
-        "ticker": "ZLW",
-        "signature": "3044022020696fbed356d9be870f2c1fa518c74712f97e47fbd28bf394f1516e6491574e022050c087ae87f3d26195783f3cdd947c20ff70b87ece3f6d257a37dc68fded994d",
-    },
-    "0xdd75542611d57c4b6e68168b14c3591c539022ed": {
-        "ticker": "PZCX",
-        "signature": "3045022100dc428e3ad660a176a8f01010d252679e4bf6e6a0788cbcc2b2413b646a23dde402201678139ba93e85f4cd1646a8a3fb7cdba020417f2346b8ed8c4c4d779f1eade3",
-    },
-    "0x3a79241a92a4f06952107308057da1991792d372": {
-        "ticker": "FXZENF",
-        "signature": "3045022100980dc05fd0ae087f5f490f38fa1089323821a52f610b1dece14986877805ed8e02201d74a11378d7d34b28e25d7a6383324b752f7743f84ac63d2001cfdc7367d01e",
-    },
-    "0xfd4959c06fbcc02250952daebf8e0fb38cf9fd8c": {
-        "ticker": "ZEE",
-        "signature": "3045022100df7d7f2d31185af135d3a4e82bebfb9a63697d3b1bea89aa79351905e4bdc71d02200138d56a9eed0cc5f78d556ce4907d80ea02e46ad12d4db0c4d8d2137f346e2d",
-    },
-    "0x0c93709c4389b6eebdb0a4d3d60092bb61446382": {
-        "ticker": "ZEXI",
-        "signature": "3045022100913c75245ade73be56ef88347701bdfba27b0927637efe0101089d956bda123b02200fa515eddd6e94ed794b463f77c815681fd0862dcad30e0c18645bd4fc61d073",
-    },
-    "0xc145718228438a045d76d11248fb779e4d23f942": {
-        "ticker": "ZI",
-        "signature": "30440220062a02e961495a7907542b0e41b88085ffccc83fbbe8797266000ad8e84036ef02201718ff0410df119e6d928c7cb651af7eb1ac824cc8ca7c93a50818241fa52329",
-    },
-    "0x7bebd226154e865954a87650faefa8f485d36081": {
-        "ticker": "ZIG",
-        "signature": "304402200bc8db825abdcfb8edf839c42d20ae48801baf497da9988299ec64c917c0b7130220045c3a0bdd3f5e1e64325c5f7da47274596534943bd826f435d061dc86627b1f",
-    },
-    "0xe003632d97edd30f87c45b2820fc741af55b2fcd": {
-        "ticker": "ZIV4",
-        "signature": "30440220765e066a62531d609aba629bae3c950733c73ca01e5fee04916057fb2003f75d02200b561d3afa227888c02f4c986d5d85aa0b9a38e15b4e00e20781965468c4caaf",
-    },
-    "0xaf3cbaeba9fe7a7d4e7531f1b2553972fd1c4e9c": {
-        "ticker": "ZIZY",
-        "signature": "3044022040658b16bcea0f0331273a44f23552df41d2fa405231d9bf570534b8dc5bd561022012b91729a853d641bad87976285934ede3c6f9482c297d1220d20a70377395c9",
-    },
-    "0xd6a5c5adc3905b354b8d945d9d73142f54254989": {
-        "ticker": "ZOLT",
-        "signature": "304402200eab337d6f344b53ef975d8b132365e3a66c03d5927a32310d464fedcfac664402202c19137f395f38d8845aa5a16454d1cd8c4e72b8ee04d5df2a10469ce81e6344",
-    },
-    "0x21f9b5b2626603e3f40bfc13d01afb8c431d382f": {
-        "ticker": "ZINU",
-        "signature": "3044022051405c6caaa098f0b005c6610d7edd5c44a429a11f6e30e8abc71fc2b13c516b0220621398bab8d97ddc2cd2d0a250c491ac9b74477623cd2242bee86731cd179543",
-    },
-    "0xe09473ed3c1d317d3601290ae7bc511d7e16e62f": {
-        "ticker": "ZPT",
-        "signature": "3045022100fb226dae5e809a04b26dae4b9ab631943353352ca1cc3133597b00b95e9b147202205319feec784fae175f0e7682b8e1036e96226c7a0f4267170071c2d364960cfc",
-    },
-    "0x6acda5e7eb1117733dc7cb6158fc67f226b32022": {
-        "ticker": "ZRO",
-        "signature": "3044022061e784fb6979d9acbfb1a21158b41805aceb16cfe1f64db515bbc21492d19b090220610ff2150e0f2b756657c4e50670c4cc24f7470c4e5e5bd8891fe7bc17bd3554",
-    },
-    "0x5559edb74751a0ede9dea4dc23aee72cca6be3d5": {
-        "ticker": "ZRX",
-        "signature": "30440220214308fee0366583ad1a0b7d187d3ef60487cf052fab2961d58863aefe56f52c02206fdc734b775ed5197a1f97010370e05eee2c6486f1df04beba0adef0a2d64c39",
-    },
-    "0x232804231de32551f13a57aa3984900428adf990": {
-        "ticker": "ZRF",
-        "signature": "304402205e225146a64325cf929fc568db52e46ca6136cd923f5968aa2d937f01d70a4d202205740356f14a93560aed407f64fe76baa7043984f1ae144923190dd80e0ab9de4",
-    },
-    "0x8906365c65589e87870040d681e51a69e9c6f91e": {
-        "ticker": "ZURF",
-        "signature": "30450221008ec73ae09a392fceec0b13a029ad26a54c33c1e6cfe7a641fe61ca3761a020860220545bb7cb5832227ca7e77dab10b4f5bacdb962ee6c4e11349a4284b5bfbdb8e3",
-    },
-}
@@ -1,68 +0,0 @@
-# Uniblow ERC20 list for Metis generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "USDC Token (m.USDC)": "0xEA32A96608495e54156Ae48931A7c20f0dcc1a21",
-        "Hermes (HERMES)": "0xb27BbeaACA2C00d6258C3118BAB6b5B6975161c8",
-        "Ether (WETH)": "0x420000000000000000000000000000000000000A",
-        "USDT Token (m.USDT)": "0xbB06DCA3AE6887fAbF931640f67cab3e3a16F4dC",
-        "Tethys (TETHYS)": "0x69fdb77064ec5c84FA2F21072973eB28441F43F3",
-        "Maia (MAIA)": "0x72c232D56542Ba082592DEE7C77b1C6CFA758BCD",
-        "Netswap Token (NETT)": "0x90fE084F877C65e1b577c7b2eA64B8D8dd1AB278",
-        "Hera Token (HERA)": "0x6F05709bc91Bad933346F9E159f0D3FdBc2c9DCE",
-        "Hummus (HUM)": "0x4aAC94985cD83be30164DfE7e9AF7C054D7d2121",
-        "Monkex (Monkex)": "0x186573b175aDF5801cF95Fb06b232ccAB123c6F4",
-        "Aerarium Fi (AERA)": "0xFE540D6dbAD8C68928778AaF2Be828efA4b44Fa2",
-        "Revenant (GAMEFI)": "0xcB16D5D6E0aC38627EB7809a953cdfa444e26CB9",
-        "xAGORA DEFI (xAGORA)": "0xaCde0D6721fe16193Ba3cC25E547410f057Af175",
-        "AGORA DEFI (AGORA)": "0x0Ed0Ca6872073E02cd3aE005BaF04bA43BE947fA",
-        "Starstream (STARS)": "0xb26F58f0b301a077cFA779c0B0f8281C7f936Ac0",
-        "Dexpools Token (DXP)": "0xA31848AA61F784CDBb6F74260d224A4356295799",
-        "veHERMES (veHERMES)": "0xa4C546c8F3ca15aa537D2ac3f62EE808d915B65b",
-        "Staked Maia (sMAIA)": "0xD7a586CE5250bEfaB2cc2239F7226B9602536E6A",
-        "GAMEFI_DividendTracker (GAMEFI_DividendTracker)": "0xD2D6e4f913fbe9105d611DFCF5113c7CC41c5589",
-        "WholeFood NETT (wNETT)": "0x8738E9E9a8263065b07aD460beB66815Dd7B81a5",
-        "STARHERMES: Tokenized veHERMES (STARHERMES)": "0xaFF73f55968Ab4b276a26E574c96e09A615b13d6",
-        "kMetis Token (kMetis)": "0xcFd482DcE13cA1d27834D381AF1b570E9E6C6810",
-        "Staked + Bonus + Fee TETHYS (sbfTETHYS)": "0xE7cC1FeE584a51e71E2f9D5547c8912318429A39",
-        "DeadToken (Dead)": "0x605C79b5c60A9d4675C87146d57D275624335381",
-        "Poly-Peg BUSD (BUSD)": "0x12D84f1CFe870cA9C9dF9785f8954341d7fbb249",
-        "Apollo Protocol (APOLLO)": "0xaaaaEdC8d708583F18C53D47C030359e2083aaaa",
-        "Relay Token (RELAY)": "0xfe282Af5f9eB59C30A3f78789EEfFA704188bdD4",
-        "Drachma USDC USDT LP (Drachma LP)": "0xF3f03c110e01dE844fE8a608063bDC9b6c6cdC9f",
-        "TMarket Collateral (cTMarket)": "0xD8559096F6F47B56737898F44b6f098579D787e4",
-        "TMarket Borrowable (bTMarket)": "0xd2ab8cc3656947b0305B7B516e107D25e84ac9d4",
-        "Poly-Peg BNB (BNB)": "0x2692BE44A6E38B698731fDDf417d060f0d20A0cB",
-        "MetisKart (MetisKart)": "0xfF3438795380D158b9768866c0823e9c3abBc423",
-        "VAST Token (VAST)": "0xf14F6Dc3B18D0D82C2b563B92022bCb6bCC82e94",
-        "Metauce (MINES)": "0xE9Aa15a067b010a4078909baDE54F0C6aBcBB852",
-        "BinaryDAO Token (BYTE)": "0x721532bC0dA5ffaeB0a6A45fB24271E8098629A7",
-    },
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/1088/erc20.json
-ledger_tokens = {
-    "0xb27bbeaaca2c00d6258c3118bab6b5b6975161c8": {
-        "ticker": "HERMES",
-        "signature": "3045022100f4c1a1e467eacba9c889c6fc974be35a288dccc0f819f94d628442af37af09bd0220320b3fd4dfdfcc993f18eac812003cfc1cf8c4b1aabc1896594c4be4a2dfcbb3",
-    },
-    "0x72c232d56542ba082592dee7c77b1c6cfa758bcd": {
-        "ticker": "MAIA",
-        "signature": "3044022041ec95fc72c5fc6ede2a338d4528249b37de4941bb3358beecf4b2d2c2a1dddb02202230d34e6445992f70de45ace7a8bbebc12c25aad8218d077fdab54b16eda893",
-    },
-    "0x90fe084f877c65e1b577c7b2ea64b8d8dd1ab278": {
-        "ticker": "NETT",
-        "signature": "3045022100d0d636b47dfd6063a8e88e3b0db015d318fb43f10db935b0e2771e26341a088b02202e1560d6053fb04da67919782a82104deda89cb0abdbca5caebaee32238bb36b",
-    },
-    "0xbb06dca3ae6887fabf931640f67cab3e3a16f4dc": {
-        "ticker": "MUSDT",
-        "signature": "3045022100f1d40eb50c21af570b5ce8b15a66e3a70f2daffbe2c8dd2b213c9d235706033a022055427e40b0c1281ca6f4875f8e7a93a571ddc5a4601635c51a4c1c99a3180e24",
-    },
-    "0xea32a96608495e54156ae48931a7c20f0dcc1a21": {
-        "ticker": "MUSDC",
-        "signature": "3045022100c6f5098034f7e4fc5dd2f980f356c28143ba95cb9c7fb52f91ade794d82636f30220044b7b621df995787eb86804487a4c148573fa71fdc9afeef884c1d2c2e25ef6",
-    },
-}
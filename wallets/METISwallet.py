@@ -17,7 +17,10 @@
 
 from copy import deepcopy
 from wallets.ETHwallet import ETH_wallet
-from wallets.METIStokens import tokens_values, ledger_tokens
+from wallets.token_registry import TokenRegistry
+
+
+tokens_registry = TokenRegistry("METIS")
 
 
 class METIS_wallet(ETH_wallet):
@@ -35,7 +38,7 @@ class METIS_wallet(ETH_wallet):
     ]
 
     options_data = deepcopy(ETH_wallet.options_data)
-    options_data[0]["preset"] = tokens_values
+    options_data[0]["preset"] = tokens_registry.tokens_values
 
     def __init__(
         self, network, wtype, device, contract_addr=None, wc_uri=None, confirm_callback=None
@@ -46,4 +49,4 @@ class METIS_wallet(ETH_wallet):
             rpc_endpoint = "https://andromeda.metis.io/"
             self.explorer = "https://andromeda-explorer.metis.io/address/0x"
         self.load_base(rpc_endpoint, device, contract_addr, wc_uri, confirm_callback, wtype != 3)
-        self.ledger_tokens = ledger_tokens
+        self.ledger_tokens = tokens_registry.ledger_tokens
@@ -18,14 +18,16 @@ from io import BytesIO
 from logging import getLogger
 import urllib.request
 from json import load
-from time import sleep
 
-from cryptolib.coins.ethereum import read_int_array, read_string, uint256
+from cryptolib.coins.ethereum import read_int_array, read_string, read_uint256, uint256
+from wallets.content_cache import ipfs_path
+from wallets.http_transport import request as http_request
+from wallets.ipfs_gateways import USER_AGENT, read_ipfs
+from wallets.token_scanner import TokenScanner
 
 
-IPFS_GATEWAY = "https://gateway.ipfs.io/ipfs/"
-REPLACED_IPFS_GATEWAY = "https://ipfs.io/ipfs/"
-USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.84 Safari/537.36"
+# Retries of a failed read, out of IPFS
+NFT_RETRIES = 4
 
 
 # walletOfOwner(address)
@@ -41,25 +43,31 @@ TOKENID_FUNCTION = "773c02d4"
 logger = getLogger(__name__)
 
 
-def get_data(url, retry=0):
-    if retry == 0:
-        if url.startswith(REPLACED_IPFS_GATEWAY):
-            url = url.replace(REPLACED_IPFS_GATEWAY, IPFS_GATEWAY)
-        url = url.replace("ipfs://", IPFS_GATEWAY)
+def get_data(url):
+    """Read an URL, returns a file-like object.
+    The IPFS content is read through the gateways pool, and cached.
+    """
+    if url.startswith("data:"):
+        # Inline data, as a base64 JSON metadata
+        return urllib.request.urlopen(url)
+    cid_path = ipfs_path(url)
+    if cid_path is not None:
+        try:
+            return BytesIO(read_ipfs(cid_path))
+        except IOError as exc:
+            if not url.startswith("http"):
+                raise
+            # Read from the gateway of the URL
+            logger.debug("IPFS gateways failed, reading %s : %s", url, str(exc))
     logger.debug("Reading %s", url)
-    try:
-        req = urllib.request.Request(url, headers={"User-Agent": USER_AGENT})
-        rfile = urllib.request.urlopen(req, None, 18)
-        return rfile
-    except Exception as exc:
-        # Retry
-        if retry <= 3:
-            logger.error("Error %s", str(exc))
-            retry += 1
-            sleep(0.5)
-            logger.debug("Retry #%i", retry)
-            return get_data(url, retry)
-        raise exc
+    return BytesIO(
+        http_request(url, headers={"User-Agent": USER_AGENT}, timeout=18, retries=NFT_RETRIES)
+    )
+
+
+def read_metadata(metadata_url):
+    """Metadata dict of a NFT, from its tokenURI"""
+    return load(get_data(metadata_url))
 
 
 def get_image_file(url):
@@ -74,6 +82,8 @@ class NFTWallet:
 
     def __init__(self, wallet):
         self.wallet = wallet
+        # Aggregated reads through Multicall3
+        self.scanner = TokenScanner(lambda: self.wallet.eth.api)
 
     def get_balance(self):
         """Call balanceOf( address )"""
@@ -105,6 +115,41 @@ class NFTWallet:
         )
         return int(idxraw[2:], 16)
 
+    def get_ids_by_index(self, balance):
+        """tokenOfOwnerByIndex(address,uint256) for all the indexes, aggregated.
+        Return the id list.
+        """
+        owner_data = f"{TOKENSOWNER_FUNCTION}000000000000000000000000{self.wallet.eth.address}"
+        contract = self.wallet.eth.contract
+        results = self.scanner.aggregate(
+            [(contract, bytes.fromhex(owner_data) + uint256(oidx)) for oidx in range(balance)]
+        )
+        ids = []
+        for oidx, (success, data_bin) in enumerate(results):
+            if not success or len(data_bin) < 32:
+                raise Exception(f"Can't read the NFT #{oidx} id.")
+            ids.append(read_uint256(data_bin, 0))
+        return ids
+
+    def get_tokens_uri(self, ids):
+        """tokenURI(uint256) for a list of ids, aggregated.
+        Return the list of URI, None when the call failed.
+        """
+        contract = self.wallet.eth.contract
+        results = self.scanner.aggregate(
+            [(contract, bytes.fromhex(TOKENURI_FUNCTION) + uint256(nft_id)) for nft_id in ids]
+        )
+        uris = []
+        for success, data_bin in results:
+            uri = None
+            if success:
+                try:
+                    uri = read_string(data_bin)
+                except (UnicodeDecodeError, IndexError):
+                    pass
+            uris.append(uri)
+        return uris
+
     def get_tokens_list(self, balance):
         arr_idxs = []
 
@@ -122,7 +167,14 @@ class NFTWallet:
                 pass
 
         if balance > 0 and len(arr_idxs) == 0:
-            # Enumerate wallet tokens index
+            try:
+                # Enumerate wallet tokens index, in a few calls
+                arr_idxs = self.get_ids_by_index(balance)
+            except Exception as exc:
+                logger.debug("Aggregated NFT enumeration failed : %s", str(exc))
+
+        if balance > 0 and len(arr_idxs) == 0:
+            # Enumerate wallet tokens index, one call each
             for oidx in range(balance):
                 idx = self.get_id_by_index(oidx)
                 logger.debug("NFT #%i has id = %i", oidx, idx)
@@ -138,6 +190,5 @@ class NFTWallet:
         metadata_url = read_string(balraw)
         metadata = {}
         if metadata_url is not None:
-            metadata_stream = get_data(metadata_url)
-            metadata = load(metadata_stream)
+            metadata = read_metadata(metadata_url)
         return metadata
@@ -1,866 +0,0 @@
-# Uniblow ERC20 list for Optimism generated on 2023-03-02T12:46:39
-tokens_values = [
-    # Mainnet
-    {
-        "Tether USD (USDT)": "0x94b008aA00579c1307B0EF2c499aD98a8ce58e58",
-        "USD Coin (USDC)": "0x7F5c764cBc14f9669B88837ca1490cCa17c31607",
-        "Dai Stablecoin (DAI)": "0xDA10009cBd5D07dd0CeCc66161FC93D7c9000da1",
-        "Wrapped BTC (WBTC)": "0x68f180fcCe6836688e9084f035309E29Bf0A2095",
-        "ChainLink Token (LINK)": "0x350a791Bfc2C21F9Ed5d10980Dad2e2638ffa7f6",
-        "Synth sUSD (sUSD)": "0x8c6f28f2F1A3C87F0f938b96d27520d9751ec8d9",
-        "Lyra Token (LYRA)": "0x50c5725949A6F0c72E6C4a641F24049A917DB0Cb",
-        "Synth sETH (sETH)": "0xE405de8F52ba7559f9df3C368500B6E6ae6Cee49",
-        "Synth sETH (sETH)": "0xE405de8F52ba7559f9df3C368500B6E6ae6Cee49",
-        "Synth sBTC (sBTC)": "0x298B9B95708152ff6968aafd889c6586e9169f1D",
-        "Synth sLINK (sLINK)": "0xc5Db22719A06418028A40A9B5E9A7c02959D0d08",
-        "beefy.finance (BIFI)": "0x4E720DD3Ac5CFe1e1fbDE4935f386Bb1C66F4642",
-        "Thales DAO Token (THALES)": "0x217D47011b23BB961eB6D93cA9945B7501a5BB11",
-    },
-    # Testnet
-    {
-        "USD Coin (USDC)": "0x5fd84259d66Cd46123540766Be93DFE6D43130D7",
-    },
-]
-
-
-nfts_values = [
-    # Mainnet
-    {},
-    # Testnet
-    {},
-]
-
-
-# From Ledger trusted tokens data
-# extracted on 2024-06-02T15:49
-# from https://raw.githubusercontent.com/LedgerHQ/ledger-live/develop/libs/ledgerjs/packages/cryptoassets/src/data/evm/10/erc20.json
-ledger_tokens = {
-    "0xe0bb0d3de8c10976511e5030ca403dbf4c25165b": {
-        "ticker": "0XBTC",
-        "signature": "3045022100daa58bc4f048d8c2920820e358fafaf4ab5b429e64af45141531b090805793cd022060af9e7a3ad4773701b589397fa62be974c259438a7b466a08aeab054e82f52c",
-    },
-    "0xf329e36c7bf6e5e86ce2150875a84ce77f477375": {
-        "ticker": "AOPTAAVE",
-        "signature": "3045022100bda6de355e49a23160a1bc9e50a0778a531ef9d776a31f86c8fd7061b3871b3b0220398105878a4024732db04eeb76a3c0a8682120f518452dad01f09b21625b229b",
-    },
-    "0x82e64f49ed5ec1bc6e43dad4fc8af9bb3a2312ee": {
-        "ticker": "AOPTDAI",
-        "signature": "30440220196a060792734fc2bffa3f49b24fdeb8e5de7ad0c9095017f81937ac3eee7ed0022041eaed25f94222507d970d08cae1d0df5b9d373dc98f1a73ac0a97ad57a2946c",
-    },
-    "0x191c10aa4af7c30e871e70c95db0e4eb77237530": {
-        "ticker": "AOPTLINK",
-        "signature": "304402207448697936babaff0063c31395f9d38da5b2e7dfa0e166887200f52ae61739d90220216c2dce7650bcbb078237d13c9a6e01b080ae5dafe920ec236cb3e3cb1c5e3d",
-    },
-    "0x8eb270e296023e9d92081fdf967ddd7878724424": {
-        "ticker": "AOPTLUSD",
-        "signature": "3044022068760c7aba2d5bebc212cac56275f8379a3c908cc10bd6f6101e02346b8772c6022045674776e555c56c60ae57fcc7f40da0b31bbc071825f77c30e11dcf53c96e61",
-    },
-    "0x513c7e3a9c69ca3e22550ef58ac1c0088e918fff": {
-        "ticker": "AOPTOP",
-        "signature": "3045022100e4176dae99990966a7a03339e6dbc78316aa2967665d8bd5dc61fe57ced0f42b02201f3315c26b379da2c4ea2f8c9b7af08079ddd185969c91e3d6f3226906cc795f",
-    },
-    "0x724dc807b04555b71ed48a6896b6f41593b8c637": {
-        "ticker": "AOPTRETH",
-        "signature": "304402207466929faef6b8fd188155e7158a840f3c3afc62799ce5252d2cb1beeaa5039f022076bd83796813f2e3dc160a40abf4ee4b1cb9ef01d3fca893a12cd64dcf85b4d0",
-    },
-    "0x6d80113e533a2c0fe82eabd35f1875dcea89ea97": {
-        "ticker": "AOPTSUSD",
-        "signature": "304402207569742e7d4393480114e2d5807daa5f90a1ac31973a87c4c947b2ebb0d936760220090a27df1062a7585a525dc735ae4f4008e35350b90e780c3afc634d6a2b06af",
-    },
-    "0x625e7708f30ca75bfd92586e17077590c60eb4cd": {
-        "ticker": "AOPTUSDC",
-        "signature": "3045022100b742e38f9c74190356dcdb9b409b31897db7f615b626c21f0396a9608150a07f0220393024553db662595980c649cfa29546b6708d4fb326b58fec762a35c1c3e4a9",
-    },
-    "0x6ab707aca953edaefbc4fd23ba73294241490620": {
-        "ticker": "AOPTUSDT",
-        "signature": "3044022009d4d364c6cf0244f369712576b5641000485f9e7dfec7dc4edb4cb3e0fee71902205e7a249704ae013f31e49979221710396f8eca9c10f101351851dcf1e18566b1",
-    },
-    "0x078f358208685046a11c85e8ad32895ded33a249": {
-        "ticker": "AOPTWBTC",
-        "signature": "3044022046afe819b21483e5ea17db8d789840750e294ae62300b2fbfd868986f749fc6502207c3d4163bbb3cb099cf4e95787de2a0c9bff9afb81f681321eda8a9528ef50ab",
-    },
-    "0xe50fa9b3c56ffb159cb0fca61f5c9d750e8128c8": {
-        "ticker": "AOPTWETH",
-        "signature": "304402203beba4c2621f440793c8811f6ae1f24e4e25f3706155dbfb98faa463920c53d2022001365a1a637e2e1768c7a1fccb83a7b8e43b8137afda006f3a470795273d7b3c",
-    },
-    "0xc45a479877e1e9dfe9fcd4056c699575a1045daa": {
-        "ticker": "AOPTWSTETH",
-        "signature": "3045022100b9c4934704a22a7a93dedaaec36976d56c0fad15aa892408d4a526b7910cb255022009500df1e5718c023ed9b82e450710d444c7276f2b4aa914f5fe73b8e9d494dc",
-    },
-    "0x76fb31fb4af56892a25e32cfc43de717950c9278": {
-        "ticker": "AAVE",
-        "signature": "30440220418f7ca0dc087b2551a606c1a23d0a40b0353476b9421af1d42aa497034cb36302203a9fea2ad0160b21dd4631189072d894aa1ef1b30938b77d4fc511ce63a4909c",
-    },
-    "0xff733b2a3557a7ed6697007ab5d11b79fdd1b76b": {
-        "ticker": "ACX",
-        "signature": "3044022044d9fe9f69192eca2300e873dc8ad76537e1fef3c51f46dca798c63a9bf1c2a902206e9c13cc1b91347fa2421b292c459b001ad86f05250d159d352ac590bd81fd1a",
-    },
-    "0x61baadcf22d2565b0f471b291c475db5555e0b76": {
-        "ticker": "AELIN",
-        "signature": "30440220312bf72716e79f976aed82a008bb2a9af7975cb686f2d132f0dd7a85c333cfb102202240aa790811ebe70fe2c7f5c97c3f4fba2d943f4e8a459ab8fe11ef628a385b",
-    },
-    "0x3e29d3a9316dab217754d13b28646b76607c5f04": {
-        "ticker": "ALETH",
-        "signature": "30440220707a4697084cac388555cff1a6b575992e7e619d342ec54d7e5dc677a6d774480220092deb62208d649f817f8475325514cc4a4a9db8b51509f3fc0bb83eb0257ca9",
-    },
-    "0xcb8fa9a76b8e203d8c3797bf438d8fb81ea3326a": {
-        "ticker": "ALUSD",
-        "signature": "30440220362fee78236184d2ac8e8297d5d8fc45e5c64d02d7da229ae3d35d2d42ec2a450220308d8b76cc7a32a516e9e26c2e01bcb4909f9ad0cad22208de1a9074290783f4",
-    },
-    "0x5c0ea461fe5e6f3b4f90a071e72243c14c6abfd7": {
-        "ticker": "AMU",
-        "signature": "3044022074bfccbb5f25d18a5154efd1d0666393bf37be304aae9f780b645fdc8456101502202a424edc5354236626ed03e65bf42f12a01c7f97a7134ab092d9fa859f96ea9b",
-    },
-    "0x0000206329b97db379d5e1bf586bbdb969c63274": {
-        "ticker": "AGUSD",
-        "signature": "3045022100feeaf946b3ee719ef3907ce3553a4edecc0e2ae71648b03f1c738d7610195b6902205781bf41566d38f281540e91eb1bb2068e409f8cb20df54781d8d2afff05361f",
-    },
-    "0xaeaeed23478c3a4b798e4ed40d8b7f41366ae861": {
-        "ticker": "ANKR",
-        "signature": "304402204a98a3c65d7a8bce4ca9b1c2d36217c57ee69e1020f47f572687b2c0b4279ae802206edaccf9831e9f06bd7b8ad70c7026beb9fcefeb5c7e33881853296259f22411",
-    },
-    "0xe05a08226c49b636acf99c40da8dc6af83ce5bb3": {
-        "ticker": "ANKRETH",
-        "signature": "3045022100da198d52417c7c4d49a3d5e7d6aec5b7e29ed17ec76b805d579ad6c8bb7909e3022058cb2cabd6f9f3bbf75510d10ccf7e7b665288afb13142e6735e23e3fac209ba",
-    },
-    "0x2598c30330d5771ae9f983979209486ae26de875": {
-        "ticker": "AI",
-        "signature": "304402206417b6fe79788a93e80a3f80d51420590371377d56cfa8eeee5eb332d717f58502201f1131534a90a5bfe6f7717e5a629b79b93004348d2c383047ca66e1c48d83cf",
-    },
-    "0xb532178708814f0c174b29b991d2b355106afbc3": {
-        "ticker": "AST",
-        "signature": "30440220250c1b34b5e825e6f3e21d8dfde7e55e1e9a0849fbfefbf980c890d135dcca3b02201c1657bb8433eaa3dad8162e30807254537e6547f223308d42b2e212dd3a8509",
-    },
-    "0xb829b68f57cc546da7e5806a929e53be32a4625d": {
-        "ticker": "AXLETH",
-        "signature": "3045022100f9768937a1a274b2688f816f07acec48d74335dc2b99b34e2e450980aeaf8a66022051300e3138f98d24220a8f9d599eda0812312673900ff6f0039b74f87ddd6a0e",
-    },
-    "0xeb466342c4d449bc9f53a865d5cb90586f405215": {
-        "ticker": "AXLUSDC",
-        "signature": "304402203248d0afa2ec2a66e5e8deb99f62ae0a67d15c309536253feb4985d08eb5d8260220695377decbf34af6a53945a4562df1fdd28b2ee8e3911b2240aeed992bf97358",
-    },
-    "0x7f5373ae26c3e8ffc4c77b7255df7ec1a9af52a6": {
-        "ticker": "AXLUSDT",
-        "signature": "30440220545496f16e22d2c65e80b8ea4020bffc6ec5a1ef81297ee5776563e7e973659b0220669699ae043ff3e6558c1f12046788afaa13daddecef07668085968acfc8c873",
-    },
-    "0x9cfb13e6c11054ac9fcb92ba89644f30775436e4": {
-        "ticker": "AXL-WSTETH",
-        "signature": "3045022100f7c03432676c3fe839cafb9e3af9e08d72e656d6e251c02f71a38d454771875802201dd1a448fcffe27309317a7950609eeba8414308c57374d738e171580e07bc86",
-    },
-    "0xc02b55bb2fe3643e1955b13515396ce23b110f80": {
-        "ticker": "AXRAS",
-        "signature": "30440220689ea56959f038230854e075b4583fd7d2bb510ad3481b5eef76fd63e776431202202d4026ec91835146714152e2280f32bb79530e8a56b2feb12d35754f491be524",
-    },
-    "0xfe8b128ba8c78aabc59d4c64cee7ff28e9379921": {
-        "ticker": "BAL",
-        "signature": "304402207be1f26132752386635272e72d6e8c556bf39c73ebbb49c6d614a269b36ae426022040dbf8671fa6d5aa319b7ee000d55df7c964519688200cbd518f47ce0cefca2b",
-    },
-    "0x29faf5905bff9cfcc7cf56a5ed91e0f091f8664b": {
-        "ticker": "BANK",
-        "signature": "3045022100ad140bcb733e7254085a1d508c718b7fd14a3c303779246e425c32fb02816b7b02207d0a4fcd8ab1e3247e54cc709209fe469b7ee05d7d85a710f236c5a3ce7c3a28",
-    },
-    "0x3e7ef8f50246f725885102e8238cbba33f276747": {
-        "ticker": "BOND",
-        "signature": "30450221008248c07e98c512f117c3450e8f76430bb2d80aa0071c054186a2ee9b88a3520a022053abc7b3c50caaab3cbcb277c55571b98b3b88abe035ca6ca0676b0c043d5935",
-    },
-    "0xe64b4eb5eec6343887c4683da31f0ca62ea39ce3": {
-        "ticker": "BEES",
-        "signature": "3045022100ff9f104a7a2734d9a86b29fe1fa2b117cec9bd770046e7241bb8f1e8df027f4202201434cd0d3cb676ce6702dae1c7ff6f19682a939f534ea537436b5bf8a602c9ee",
-    },
-    "0x4e720dd3ac5cfe1e1fbde4935f386bb1c66f4642": {
-        "ticker": "BIFI",
-        "signature": "30440220329095af63c6302ed1d0292098831696318873bc5f40704228ff5bdac3afbd30022067a10e3da653bce0c9e9c862c0457a65941bf1460acd90ceba5b7559abd59142",
-    },
-    "0xb4bc46bc6cb217b59ea8f4530bae26bf69f677f0": {
-        "ticker": "BEETS",
-        "signature": "3045022100b3a3e18771dcf886bc2e9e883e5f21c540b79bc40ce7f37f019768534cd749090220721b1f5bf6a540ce7098aea456f9c62d5616aa5dc7b662dc532f4595cc85af2f",
-    },
-    "0x9c9e5fd8bbc25984b178fdce6117defa39d2db39": {
-        "ticker": "BUSD",
-        "signature": "3045022100a296c68a3cb9d579c83e4a6b8d3caa7f777abfcbc841f67a832ebfcff80aeb9a02200584a0fd2436c79f7d43fa6e78832b9a3bff4de709e362878aa7607808116b7c",
-    },
-    "0xe3c332a5dce0e1d9bc2cc72a68437790570c28a4": {
-        "ticker": "VEE",
-        "signature": "3045022100b38030ade6f6b040c7563bae700c6e8b9ffddc125bd5975c59593c0f8678efff0220784afd4b2f48620a9ca38c6f540edcc6ed652ba8814daa8ef62c4279772b4ad5",
-    },
-    "0xb0b195aefa3650a6908f15cdac7d92f8a5791b0b": {
-        "ticker": "BOB",
-        "signature": "3045022100fbbd4db017e6655172b5b11ab6de7bff40e4a1451a2dffb93b843993bcf1b3a902201e167c549e02595e4e0106f1118457a1aa323028783ff14cb76d6499de9b5c5a",
-    },
-    "0x135c78d7f52aab6e9f17bcf4a9e8627aa233d050": {
-        "ticker": "BOO",
-        "signature": "30450221009e02cee11e441365a4a772a1220535510cac6e219319c153b01db0de9b54fc1c02201a68f73c019ea07e0aca60985fd3e5bd876d9fa32156c6193a4a1e239348c924",
-    },
-    "0xe4de4b87345815c71aa843ea4841bcdc682637bb": {
-        "ticker": "BUILD",
-        "signature": "3045022100d503768ce1e1c1c094af9e4f77f61c81e34af222ceb0d6c1e395cce1c5892b8102203d0aab75a3a7d7d2de42b2c5faddac44027ef5a2816911dd98a36ea8644f2664",
-    },
-    "0xa72f7df6c1454096387dbb74f70b3dac4f0a61f5": {
-        "ticker": "CAS",
-        "signature": "304402202cfbb958d0ab449cf9baa3e4fb6b38c9544d5bf881eeb5edfc7a08da1978e28e0220710fa3a912e9079b6add1120f96e59c43de4a5f32552befeed1432f18f17befa",
-    },
-    "0xec6adef5e1006bb305bb1975333e8fc4071295bf": {
-        "ticker": "CTSI",
-        "signature": "3044022042e5f48b6f77addf41a9364fd49aa9550ba2416a2358b6f513336d8acbf1e65002205ffd94c900b9ea4e56e15c61e995f7f77a919750e1b266d116404fd7f34a795e",
-    },
-    "0x9b88d293b7a791e40d36a39765ffd5a1b9b5c349": {
-        "ticker": "CELO",
-        "signature": "3044022076ec03cbd42b74c830746f1b1d6878b71bd153636f605c35b05f0632bcae4481022041bd2a0b3d30798c369107cd74b9e65c6132b366ddc55bf2fe1e8a780ef91ffa",
-    },
-    "0x350a791bfc2c21f9ed5d10980dad2e2638ffa7f6": {
-        "ticker": "LINK",
-        "signature": "304402200fa13f44802c6337be3666068808ba446ccff97a3d252aee7cf6570b0b2d0cf4022026fd7031e02f0f471c59f471bde5c1f0d4534c05b12a113b39db9e4a4eed100d",
-    },
-    "0x10b3667304130ecc9c972008459249e8141ced97": {
-        "ticker": "CFES",
-        "signature": "3044022051b58bf640112ced9875b2868562772872074529033fad23d4e814d98b9fbe340220396798457ceae777846107e65ad6f4a5ace24b135852a4d372e9ef4ab9878eef",
-    },
-    "0xaddb6a0412de1ba0f936dcaeb8aaa24578dcf3b2": {
-        "ticker": "CBETH",
-        "signature": "3045022100b1ead2cd4a835a15367c98bcdde1737b1c4b7ec0237276d0609912c10e8f71fb022064d2949eaa8d601748b3b8627901400a3490916455dfb7922a266b4a9e943b3e",
-    },
-    "0x8b21e9b7daf2c4325bf3d18c1beb79a347fe902a": {
-        "ticker": "COLLAB",
-        "signature": "304402203591826c11c2aa9b73fc0e5e9548d5a18ba6468cdb6a926e3eb30075d0d01fb30220080d537733f792c9fb5dc5673ab8ff2420c7f32c386c4426c3a9705518f12b7e",
-    },
-    "0x58b9cb810a68a7f3e1e4f8cb45d1b9b3c79705e8": {
-        "ticker": "NEXT",
-        "signature": "304402203e8ac3a0e6933c2c4d731f5acce52ad657bbf91b7daf48f02946ad721232915e02207a81fd2559fb3ca00af4ac6d402d00d847404cbc9df8c68768fab39c13ef31aa",
-    },
-    "0xf8e943f646816e4b51279b8934753821ed832dca": {
-        "ticker": "CTH",
-        "signature": "304402200bf9d3f49cfbefad8155082ff9bc9697f8ac8d7d01718008a98fdf0aecca169c02207a35b918330f544e0554e4c7a7b5f5ef41ffa179f0bc36d74d241d63e3233257",
-    },
-    "0x0994206dfe8de6ec6920ff4d779b0d950605fb53": {
-        "ticker": "CRV",
-        "signature": "30450221008827154262e6837e2bdedc791cd3b86817e5e34209b25c47069e4fb8c2fd5dd402205921c433e0b81bf5ebc3cb41bd3e44739c0efde4e036ecd6f86dcba77d26c92e",
-    },
-    "0xc52d7f23a2e460248db6ee192cb23dd12bddcbf6": {
-        "ticker": "CRVUSD",
-        "signature": "304402207e35c65fd7f700d5acfb50ad1f7a8747e3451a3e89034de9e763ae8a8a85639802200dc93b0004e863bfd653389994711d9350eb8f804e6d0103af5bdb731738d44c",
-    },
-    "0x14778860e937f509e651192a90589de711fb88a9": {
-        "ticker": "CYBER",
-        "signature": "304402206266b83a634e3c7a2cfcae597f85a0b2bc3f98b16c31f36920902f0250991a650220255514c25aeca8d3d0c30519c1529cbd7972ad54559a86b8a9a2b59ae70c938a",
-    },
-    "0x47c337bd5b9344a6f3d6f58c474d9d8cd419d8ca": {
-        "ticker": "DACKIE",
-        "signature": "30440220503d1386a328a43a1211f2c50da77e9cf7dd51a646a0585d4f8838812aff811f02202286b8124abdc36472abce4047bc9f1bf858d114b6029947969f744de2959b6e",
-    },
-    "0x970d50d09f3a656b43e11b0d45241a84e3a6e011": {
-        "ticker": "DAI+",
-        "signature": "3044022019f03747d11bb904971cfd7ccbf06f0dcbc75e805c93c3142e1836db6693c70f022055c98be14b8cfe7491fa28c76c6bc64a20a70c8e9a661435d438c3aced130e91",
-    },
-    "0xda10009cbd5d07dd0cecc66161fc93d7c9000da1": {
-        "ticker": "DAI",
-        "signature": "304402207125b8d3845d2cebcf2c25b040ff9e8bfb17cf739ed2ad853992abacbc5974d402201f1bc8bd9fc3afc51b5500b58136d1c78f01abfdba6e32e960ce2b6a612874e7",
-    },
-    "0xb396b31599333739a97951b74652c117be86ee1d": {
-        "ticker": "DUSD",
-        "signature": "304402201d4e3d9e3637e8e255f126a432ceb8ba55738f6a7acc6a9b8c37736c29be134602207e6223cc7c87e886f23c277c0346e1ab9f99627eb8a223c484bee3b93db135f3",
-    },
-    "0xd6c67ff71a82f1d994d94fa01295467d273d7324": {
-        "ticker": "DDCS",
-        "signature": "3045022100d2b99939b273edfa53505dbcac789580cba483aa3ac4f3562397ae85913531ea02201a6ed1eb49eb6b804c69c53a96b5bdc93f1a2e27a42d83ebf835487caff9f8f2",
-    },
-    "0xc22885e06cd8507c5c74a948c59af853aed1ea5c": {
-        "ticker": "USDD",
-        "signature": "3045022100c61d0a0cf1ee5a6f3cdb2267248f992f2463e6e60d84466cf25c03e75b23957b0220589cc6662e348b860455bd9ab3effe29bde14ed0e5ac6c82c5e2baf8eb8e6d7a",
-    },
-    "0x1da650c3b2daa8aa9ff6f661d4156ce24d08a062": {
-        "ticker": "DCN",
-        "signature": "304502210083784345d8fc7a6928932d61050a0c4d58c7480de58cea30887839156ef3d4ec02200d48e39de4ce8835b72acf3b75269cb5a6112c2e2fe87be9423e5f77c2463517",
-    },
-    "0x1cef2d62af4cd26673c7416957cc4ec619a696a7": {
-        "ticker": "DTORO",
-        "signature": "3045022100f47cb204d73578daab7bb5a166113d36e012caa9363889bbf666c52e9fb6ca64022034db7ede1ce15b528f1e39d44d3be7cc479f8a00e00ac735e46c43348ba79a2b",
-    },
-    "0xbfd291da8a403daaf7e5e9dc1ec0aceacd4848b9": {
-        "ticker": "USX",
-        "signature": "3045022100ecd550db9a89da1eb9930a343686a88d1233b308c51a287977fe21d5a7ff6a010220437d6142b3a1d26e78fcfbdbd92546324d728fc48ec8e2067c3a589573b91c36",
-    },
-    "0xaf9fe3b5ccdae78188b1f8b9a49da7ae9510f151": {
-        "ticker": "DHT",
-        "signature": "304402201f8d746772289318de39a20925b1c97e61b9acdbbaaa879c1551ab020c30a40d022026f7423e6e12b2a669629783575361572f59a1efc48242a83a89da186a5f4a1d",
-    },
-    "0x8ae125e8653821e851f12a49f7765db9a9ce7384": {
-        "ticker": "DOLA",
-        "signature": "304402200deeb434ee9287049dbb1f5c0bc12c3a33e24ac36b24371371460384ee9b86d30220010f3128cd2eee30cea3ffa498f2369c38d366fd112d7dd114edc607dfbe4b20",
-    },
-    "0x81ab7e0d570b01411fcc4afd3d50ec8c241cb74b": {
-        "ticker": "EQZ",
-        "signature": "3044022017acb0885643fc4d907a8b889c6f3bdcb2f8a2a200b10f24a7d665d3512ac22e02204fb52e38ba7cab227c15c99ee6aa6f2d535cb489cf07fecc503694bf151f23c9",
-    },
-    "0x6af3cb766d6cd37449bfd321d961a61b0515c1bc": {
-        "ticker": "OS",
-        "signature": "3045022100a5e58a9b572166d04f3b8130c8031190806a057c26230bc68c771e201a92245202205a093d487c5aecc57a05933798dafcc27ab950258cda09b4a6d4eec8dbeabaeb",
-    },
-    "0xc5b001dc33727f8f26880b184090d3e252470d45": {
-        "ticker": "ERN",
-        "signature": "304402201bc0f3236924aa1cef204001c25ae59184ea2c87be5f71223fca763df959db6e02203417cc9a55a680d83381792d01e98417f9124cbef12f59b59af7e32b3b47a0b8",
-    },
-    "0x820802fa8a99901f52e39acd21177b0be6ee2974": {
-        "ticker": "EUROE",
-        "signature": "30440220189560a5bcd7d7e74f5d0f85a7ae6a58f85c2b6aa677d1c6df718e14bda1f17502202861cf5c1b0101c9e992a25fc14fda44a03671c29d3c55a5d074f9db2dd1282e",
-    },
-    "0x1e925de1c68ef83bd98ee3e130ef14a50309c01b": {
-        "ticker": "EXA",
-        "signature": "3045022100f60f546e44d96aa98145472a50b7bb4d5bc49a6baa0c1c07478898db348730aa02200a9825d6bed042d56f77d6ce5a2cd825993248019c31bbc1aa57fdb8b1250e19",
-    },
-    "0xa430a427bd00210506589906a71b54d6c256cedb": {
-        "ticker": "EXAOP",
-        "signature": "304402206b84a6dbd90cf27e032f60079c81b60a4c18b3acf172d0a316631f8ef3f751180220288296840ccfeefe94bc10445ddf0a1d142169da049e7dd7fb45c4d088631706",
-    },
-    "0x81c9a7b55a4df39a9b7b5f781ec0e53539694873": {
-        "ticker": "EXAUSDC",
-        "signature": "3044022010ad11d2294193567786ef97eee73724d09242ad61fe0e5eb9884bbf921edf64022057c3b5aa67613b54aa0811772ac3ed1761062b5fd77799229094218b71518ac2",
-    },
-    "0x6f748fd65d7c71949ba6641b3248c4c191f3b322": {
-        "ticker": "EXAWBTC",
-        "signature": "304402207a74a2663e15e71069016f523fb1daf55d7eadadbe0683d045ac935bf112b16e0220120c04ae07236de4d0b79069a3126d149ced4a884404c3117c3a40a699ab13f2",
-    },
-    "0xc4d4500326981eacd020e20a81b1c479c161c7ef": {
-        "ticker": "EXAWETH",
-        "signature": "3044022074edef97bae46c72f2b17bdeddfa4c8f544dc229d9a2e5d0845238e5a78f73230220408e013d0dada52612bac74763c242c3f9be3eed262570abc6bf7d3006ad4b91",
-    },
-    "0x22ab31cd55130435b5efbf9224b6a9d5ec36533f": {
-        "ticker": "EXAWSTETH",
-        "signature": "304402201f3b0d0b651d8ca6b70a7d85aa9f2141a05939ff6a530994fc0725a8c252976e0220073efa30fce958808383c3f9852a2ab31712d7f91c57027467bc4ebf76337595",
-    },
-    "0x2dad3a13ef0c6366220f989157009e501e7938f8": {
-        "ticker": "EXTRA",
-        "signature": "30440220300eb1e2afb1edf5eec28e67581225ad0525ea842de81ad7aa629c097ddac3a0022040dfc25daaf74c2a8783c7260f9c05155288eae108d8b5be6d456d4efb135e7d",
-    },
-    "0x74ccbe53f77b08632ce0cb91d3a545bf6b8e0979": {
-        "ticker": "FBOMB",
-        "signature": "3045022100d26c939298f2d1e4139a257b882dc916dfcda8a3b0b7e5f56fc6f023520e83ea022058fedf47420f2da93fd65565fc3bb50e066f3bdc7a814112a96056f8b630aea4",
-    },
-    "0xed9b52e6d2df4ad9fc258254e1e5ef5ad0b3ca3c": {
-        "ticker": "FDOS",
-        "signature": "304402207cec9f03e8c31b927bfd17fd72e038dd15900370990c7a99de516f4d95504aea02202171fd91fa1a94193329ab298e772614c6b3c5f34203bd8c0c33968e2c4d8786",
-    },
-    "0x065399a1e5522af1c9044c18ce60ec70d64d74a1": {
-        "ticker": "FNLS",
-        "signature": "3044022064bcfb5aa31282d0f7d495c112c05ad44c1773c5308b3f7b5c8cd3452bb55391022028630a24e472984817b164d9d2310eb565281e665c08a56acec132ee51775a66",
-    },
-    "0x2e3d870790dc77a83dd1d18184acc7439a53f475": {
-        "ticker": "FRAX",
-        "signature": "3045022100ebbdb9e4c48cde940e0607fd864793b0c96c166c31a5d5a0161d1f2e81a0e0ba0220698920c290bad8e3d2a27e035acaa2584644a19ed5051b67f91632f5b27a102c",
-    },
-    "0x6806411765af15bddd26f8f544a34cc40cb9838b": {
-        "ticker": "FRXETH",
-        "signature": "3044022035539cfa90412434497cfc11bfd005c422fd6395650b879e6f7d3fa5bbbfec8a02206af051d695571e9de9eb588883c8477678ecc450c5be69bea19d437db38a8075",
-    },
-    "0x67ccea5bb16181e7b4109c9c2143c24a1c2205be": {
-        "ticker": "FXS",
-        "signature": "3044022028f81a27d487135a5830142365810e79e98f97631717d86085af339da55e9f70022038e4ee8564f75f6506b7861e1ff3e122d04b364743264b83405f36dd63fcfacf",
-    },
-    "0xe453d6649643f1f460c371dc3d1da98f7922fe51": {
-        "ticker": "FUSE",
-        "signature": "3045022100fc4b3193635d7cb46c54388a2089f51d3a1299a96b49ca588543970c6dd4ae5402205f69ad11c6e3b78bbf07c7a1a7237e6f0b5b68e5329a6ff82309e741ebc6ba22",
-    },
-    "0x4f604735c1cf31399c6e711d5962b2b3e0225ad3": {
-        "ticker": "USDGLO",
-        "signature": "304402203fdcf28cf5aaddf4042e1935dd1f2dfde3183f679b52234e2c4e8e8e6543505e02200df74a60df23c89b7363fa5cc40d1cabb17599e3b4bf6564088556c48b74e17d",
-    },
-    "0x181d739a0c016bd0b32bd6e47cbca70d3a0e69d7": {
-        "ticker": "GBL",
-        "signature": "3045022100aa78f8bab75da1fc0e8bc7c1cc781abe9bba19691c22287c66dc4002995722fe022041c2e45e316dc5275d96e8842e81308b9c98e1609779ef3dbaffc3cc8086e0ed",
-    },
-    "0x42069d11a2cc72388a2e06210921e839cfbd3280": {
-        "ticker": "GNOME",
-        "signature": "30450221008a5b29fd55154f63f53cb9c2e2f76b4d46e2177e6f39e042c7a86d576467481a022059a17c180a383f6bb4fcce07a034e7e1cda352ba972e517b6e3ebfc3a6f8955a",
-    },
-    "0xfd389dc9533717239856190f42475d3f263a270d": {
-        "ticker": "GRAIN",
-        "signature": "3045022100f7fde547f18d1e01fdb7e4a0ff598bec5e221ee9ebc47c08c921fe6ba5ee48b70220763b9e5be73820cf4056479ee8517d24de6263a603972d15eeddc626add1edf9",
-    },
-    "0x10398abc267496e49106b07dd6be13364d10dc71": {
-        "ticker": "HAI",
-        "signature": "3044022047461a548ae685b12035b65f191f526ad713e451b846fd9dd644cf1a9075ae0f02202a4779c38c6e7d6758e85d4bc57bbf1a3824ea2ab58cc33fcfcbb7accbdf4d19",
-    },
-    "0x50bce64397c75488465253c0a034b8097fea6578": {
-        "ticker": "HAN",
-        "signature": "304402201f1353dfdb6d3f88f385b4059f06aabfc28e38e81d80119f05cb5c1588ba7cae0220255c656ee14affbec1afae3fec3fafb8a1a6418604b821acc71ec665c4a4431e",
-    },
-    "0xc3248a1bd9d72fa3da6e6ba701e58cbf818354eb": {
-        "ticker": "HANEP",
-        "signature": "3044022060c3890d055cc12f0904f659325372e37632bd46c889c191009f5fef2b1657d702206cbd919fa2d1d5fe5478e9fbcadea6228f3ccb58d98aaa5dde81e80127cac5df",
-    },
-    "0xc5102fe9359fd9a28f877a67e36b0f050d81a3cc": {
-        "ticker": "HOP",
-        "signature": "30450221009a3597b3096a4b164537b8c0718bf813c183ed1c79dcab9a32abe35ecb8179f90220119905c8df49644077e86e7f643707ca763730173007f5bc46c271f6c9eae816",
-    },
-    "0x10010078a54396f62c96df8532dc2b4847d47ed3": {
-        "ticker": "HND",
-        "signature": "3045022100efab1206088b0f60a9bc8e6c8a24bfda680ec9fa88fadeaa7f372de6dfdbdc93022031d7a0f1fd8ead3e4c5f3eeda0b5c6bd0c50ae03f708a0a52d72a50f9defd69d",
-    },
-    "0xbc1735d65290a25b4bc964378828a2a57e33d03d": {
-        "ticker": "PACT",
-        "signature": "304402203351fc165a0f4865e205a748c3ef07b540c356059d95a4c90aa5e94e83078608022002a76d1457baccdb3f84c915e161627fccc30a4930012ee85230b169f5969ad5",
-    },
-    "0x2b1d36f5b61addaf7da7ebbd11b35fd8cfb0de31": {
-        "ticker": "ITP",
-        "signature": "3044022014a385a7fb470b94c02f7bf9e8aef2e073bfb61a9e027ec9534227440c8d8cc402204b5da0ff3e83b542583e85c7e9ca5793bc7596020e81eb4cac31e5b4de404ce4",
-    },
-    "0x00a35fd824c717879bf370e70ac6868b95870dfb": {
-        "ticker": "IB",
-        "signature": "3045022100f2d74bccb47638b91411e4fe1b90831047511593658df56154c2e79a173655cb0220663e4e83172d03f55ee7d9092ad7d523a9f9430ec63babd47627c6242215b71b",
-    },
-    "0x1574564fcfd15bccb3fe04e9818f61131ea74066": {
-        "ticker": "JARVIS",
-        "signature": "3045022100aff1d9272acdd851124f62d9687970992e4bfbb396e161db5d6f770ab341366c022036092bb9e8c295123e4bbd23ffc0bd4d1d75241b794e2622bd2998d5d6a211fd",
-    },
-    "0x15e770b95edd73fd96b02ece0266247d50895e76": {
-        "ticker": "JRT",
-        "signature": "3044022003ced50af95f34b56382b998abdad25459c7d0e63c2474296cb21c8b2b288d4502205b43ea7a3a0e9e2026e93c7629260dfeac5adbac843b378956d8bed733b55bec",
-    },
-    "0x9fd22a17b4a96da3f83797d122172c450381fb88": {
-        "ticker": "JEFE",
-        "signature": "304502210096ca340b25a0e7c1edb765ee3db8190017b2995077f360ffe35d0df566a12bf102200e5860a8006abfb985d75df6dc2d2061727ccaef7977b25b38b938a0d7c8792d",
-    },
-    "0xf98dcd95217e15e05d8638da4c91125e59590b07": {
-        "ticker": "KROM",
-        "signature": "304402200d9f6451797f301919c4dc2ddc97bf8bb84e8633efed1a0f0dbe2509ad6f17d2022060205e53f18679b19f7d4d2a8c9639ea383183d0a3bb63854c3e3e983546311f",
-    },
-    "0x3a18dcc9745edcd1ef33ecb93b0b6eba5671e7ca": {
-        "ticker": "KUJI",
-        "signature": "304402201e98131efc6c674fc21dff67ae804808547f78844a8f49ad96ce09504795f65a02200770f08fa5b95d4610bce102f254ce6ce7ce44abf2eefa5c61ca1fb0bccbba88",
-    },
-    "0x920cf626a271321c151d027030d5d08af699456b": {
-        "ticker": "KWENTA",
-        "signature": "3045022100d8dc79bda2ba273335b19be679deb2cb9be7216952ac47c61d5b813ea22d24100220493497bb5e003f0f2f08240f7a97570d79ba77bdbb1a7a792bb41344a5f9b59c",
-    },
-    "0xa00e3a3511aac35ca78530c85007afcd31753819": {
-        "ticker": "KNC",
-        "signature": "30450221008d76ff4214064282c1cba9e6ce78f866b4aa87c3456d377aed47a28455517f5602202e50bd5913c89242f8016e23bb138bba6e86b6bced9f8c8211e2fbd4eed97d68",
-    },
-    "0xd52f94df742a6f4b4c8b033369fe13a41782bf44": {
-        "ticker": "L2DAO",
-        "signature": "3045022100d447cea8f40e6741cd1336d42bc1f62dcdea0f4b2625906dfa58541690242195022005e2df289941fbb3b272483a0ac9882ba9b1cbbc9251ac3569e98f5348d24788",
-    },
-    "0x3ed9acaac7bd974eb83a8ea6432a239e3c829d5d": {
-        "ticker": "2192",
-        "signature": "3045022100903cbb789aeae89d1795d0193b79e19cedf50a58f79457f05058fa5536aa98ed022034ec4217538175ea7f33b6edf1e4a916017b3d47dd5734f322a577a807759ee5",
-    },
-    "0xfdb794692724153d1488ccdbe0c56c252596735f": {
-        "ticker": "LDO",
-        "signature": "3045022100b9d8e3db88a81c251e5a9cca1bb8f97b5eb3f2b7048e97bbc419df47a83badec02204dc1eff4d55a606f77de7e1becb33fe4eaf8e46bb11e8039fe51baa036593534",
-    },
-    "0xc40f949f8a4e094d1b49a23ea9241d289b7b2819": {
-        "ticker": "LUSD",
-        "signature": "30450221008996a5a37b6acae1183a4b8984d615e36ce22aa643ee5d1214aae1c91804868202206f9ef14dc1366e44de3b48ab8291aea7aaf188caa2812047c2222790b4ba27db",
-    },
-    "0x50c5725949a6f0c72e6c4a641f24049a917db0cb": {
-        "ticker": "LYRA",
-        "signature": "304402203d9ab49ebf744823c1dd174edb284e60a652ae9dd29dfdf7b38896ddab2cdf4702200b4ec99299ab9782a5207cd08606b69d0d47a931a7676057994733ae8dd98443",
-    },
-    "0xb153fb3d196a8eb25522705560ac152eeec57901": {
-        "ticker": "MIM",
-        "signature": "30440220276ca398b29ea9bfcc2a4218dc6cb7e5110477a4b843b397adddc77dfc3579ce0220503084267504f7e46517246a5b80ee60eae003046cbce0e1b2de3e5eed9a4050",
-    },
-    "0x17aabf6838a6303fc6e9c5a227dc1eb6d95c829a": {
-        "ticker": "TUX",
-        "signature": "30450221008d4309a26fa1471d312fd8cf568fdc8d11612601680ffec8768abd9863d0da4f02203d5e7a2088c27b1a602c1d9caa4cbb3f17c6e19f591c6a21228b3667ad51d570",
-    },
-    "0xdfa46478f9e5ea86d57387849598dbfb2e964b02": {
-        "ticker": "MAI",
-        "signature": "304402206ea60925810f8d32f0b36785d78a490a08a23cbebffbd0a40e9494611bbd10cc022018e3076be9f49a129a1a718f88a7f7d60c056e62d31d3ec5529609afc5fea65d",
-    },
-    "0x929b939f8524c3be977af57a4a0ad3fb1e374b50": {
-        "ticker": "MTA",
-        "signature": "3044022003d995564a09fef0b03dd27578821721d60629adb12181194eef3ffd9d93d2dd02203617d8e55c3dbc48c9169646c1df119b49f7d6bcad5e56e0c20c6d5f97fefe84",
-    },
-    "0x3e5d9d8a63cc8a88748f229999cf59487e90721e": {
-        "ticker": "XMT",
-        "signature": "3045022100b9549d480daf4d2eb7dbd6330028f12f87da56f4d30bd3f503c80b76345f8bf102203b549cd2ccccd5e9d4c55b35f69cbc4f0a1c873b39bf2da9ff9c4c6623594ff8",
-    },
-    "0xc04fb38f10ad352c5f16bd4546f7456e7f1a2d9e": {
-        "ticker": "MNTO",
-        "signature": "304402203b5064abc709663d4a86450f1d4b0fb7724804c642b32e1ed68088914c6ffe09022000cd4c18a583aa8acbdca0206abf1b0391fb23a6d4cb7eca04ea0d8d4998b9de",
-    },
-    "0xe4d8701c69b3b94a620ff048e4226c895b67b2c0": {
-        "ticker": "MINE",
-        "signature": "30450221009f81cbd7be0d4a0ed125a583115e1a33f116a04ec59a84b70ca46076e3c56b8d02205fcb8703875b271c9807a10107d00480a3ac9d1d9b46e66da9ac795b6922c3f2",
-    },
-    "0x66e535e8d2ebf13f49f3d49e5c50395a97c137b1": {
-        "ticker": "MOLTEN",
-        "signature": "304402205378e752b60c33f4617de13bb79e8e13fafcfc6e496da3eb6c2aa5b57ea320af022002a62f778f0c08f0fdf82ff42286455e26e81e7f380491708d67931f31f87ca8",
-    },
-    "0xc55e93c62874d8100dbd2dfe307edc1036ad5434": {
-        "ticker": "MOOBIFI",
-        "signature": "304402201ccda0bd851e5529226f0563dfcc3a628581676d7678265737ed316159ae0cd102207a669ccd4723bc5b4260178319f93c5f9df1f8e5ea132502c5c607825532aec8",
-    },
-    "0x59d9356e565ab3a36dd77763fc0d87feaf85508c": {
-        "ticker": "USDM",
-        "signature": "3045022100f7a543785c0d51695593b17514e4700725feefde16ef30aa919e11fc4fd1f3c4022041ddbf18af256a209489d97b13cabdd95d0dd299209422a2961f9acc8d443dc5",
-    },
-    "0xa3b615667cbd33cfc69843bf11fbb2a1d926bd46": {
-        "ticker": "MPENDLE",
-        "signature": "3045022100ab7b33c174b430904973a92aa1c02cfe9fc9a502ffe7b50ce36e70b31419ea6602201d101507a0f987f93fad516c4bcecd815cd9d9b95a422b17e44fe560308fc737",
-    },
-    "0x47536f17f4ff30e64a96a7555826b8f9e66ec468": {
-        "ticker": "MMY",
-        "signature": "304402206219a53300c700bd8d102fd59dab1d5eee04a5428098c1152a98466216f49ba602200316ea75dbf590f3756bc7abcf67f56cf0e54ef32ebc761dcc648078f6196d44",
-    },
-    "0x4b03afc91295ed778320c2824bad5eb5a1d852dd": {
-        "ticker": "NBL",
-        "signature": "30450221009cef4f141fac519284db50bd06d281205ca1261d0169c7602ce06b8ea67a006102200abbb8bc29cb49f00859d8b436278cc6981d2b406384147a9a26e062f9340aa4",
-    },
-    "0x8637725ada78db0674a679cea2a5e0a0869ef4a1": {
-        "ticker": "NFTE",
-        "signature": "3045022100e708e157d601fdc41cfa766784220aacf3e9e077f34fda96c8a022f5d744609702204106ba26b8a58b15d3c1c9a35ad27dfb14593d813c8abe26d0e0e006b7ca21b9",
-    },
-    "0xee9801669c6138e84bd50deb500827b776777d28": {
-        "ticker": "O3",
-        "signature": "3045022100c721c0def773f1b915977c8ae72d7f79d84fbd93a8b6dfe13cc276e70fbdd2e302202db70c8be519738afbfb53dcae5e92b13ae992ded6c6a02cfd7d22c99bda7958",
-    },
-    "0x00e1724885473b63bce08a9f0a52f35b0979e35a": {
-        "ticker": "OATH",
-        "signature": "304402205a13f4fe7f58f719068a5959a18545b157afacd6c41ef6f7a8ad8d6ae02d6efe022064bed57b5d4b2298b3e3803933e9a2bd23d69413a34877d881a9040ac00f2f81",
-    },
-    "0x2561aa2bb1d2eb6629edd7b0938d7679b8b49f9e": {
-        "ticker": "OCEAN",
-        "signature": "3045022100828a43f329175f4034e417b87dc2e3d361de278c4ef7919ca4360aa6739bdc48022040f2e45930ad2df047a0cb93dfd5b06b5ec82bfd2d9f7094f74c4938c045996b",
-    },
-    "0xd3ac016b1b8c80eeadde4d186a9138c9324e4189": {
-        "ticker": "OK",
-        "signature": "3045022100be62e441b646a54c48945b5ae44357be0575fe930f992144c2aa6351b01808ee0220372f4174ba3d85690a9d0876028233031e066eb1c6cff525447b66c4a43f12d6",
-    },
-    "0xb0ae108669ceb86e9e98e8fe9e40d98b867855fd": {
-        "ticker": "RING",
-        "signature": "3045022100c2a487b472776e47e97a5046b7bdb9b18151d81553d2896d23046c500e69f2d302205ea281a9f9e242d344768d19af34b6de289f52c167e2ddd0fecfd72d6d8df338",
-    },
-    "0x48a9f8b4b65a55cc46ea557a610acf227454ab09": {
-        "ticker": "OPC",
-        "signature": "304502210095ebd0fd1747312c02602cde08509de81e3b55f49ecaa687538cbe58159cd4b6022050e5da1ead66da05ee69b309cb8be8c70ebadb7bd65a54c2e67f3e134e16321e",
-    },
-    "0xc3864f98f2a61a7caeb95b039d031b4e2f55e0e9": {
-        "ticker": "OPENX",
-        "signature": "304402207f475dd59a9e402235e3fdc4dbadd9d5f8164866ec8938b4fdb1a03ac92cfc5002203b0726b9ec497a69e68764572c0170f93b1443130646719326c1c83d4a2d53a8",
-    },
-    "0x2513486f18eee1498d7b6281f668b955181dd0d9": {
-        "ticker": "XOPENX",
-        "signature": "3045022100aff80669853a8fc217b59d68b867b26bff08317dd1a34d2c0d5b9ce838258b3502200d64070b42dbdbba215e7219e4a2352d06683bec6755cea5e20ef008664b07b9",
-    },
-    "0x4200000000000000000000000000000000000042": {
-        "ticker": "OP",
-        "signature": "3045022100e465d5b7725838059aa5bbd292cc1693fc8bc0eef773473b3cc62365c605151702200e9376c426c530ad91543de26db7089500337e5468a460b422775b04197b2249",
-    },
-    "0x6c84a8f1c29108f47a79964b5fe888d4f4d0de40": {
-        "ticker": "TBTC",
-        "signature": "30450221008629a5bd48207e4433797074524cc94df5a65ea3e04ff54a316b31a49beaad33022013b825db72c231e0def00362d240ecda82b3eb34246c4f7cfb7ab88d5a1cbaff",
-    },
-    "0xcdb4bb51801a1f399d4402c61bc098a72c382e65": {
-        "ticker": "OPX",
-        "signature": "3045022100fff1ecd2f7f98c7fae891bd57b620db036d787c824a1f4420f33ce985a1c65a70220106de8f561410239ec707f1275307a49895410dabf22edd0ef143100337a4e9a",
-    },
-    "0xbfd5206962267c7b4b4a8b3d76ac2e1b2a5c4d5e": {
-        "ticker": "OSAK",
-        "signature": "3044022043006663c40b0d5d81aeadde085285e269605be14af2717f3a65f12d02b2891f0220564633b309cca0ca662786c204f1206bf3281f5bf59ef3f1d44396deaa0eff8b",
-    },
-    "0x3b08fcd15280e7b5a6e404c4abb87f7c774d1b2e": {
-        "ticker": "OVN",
-        "signature": "30430220409574456d42c2b9de906547c622cc94c211d7421d1872883bb7a4afc03149fc021f418fa058c0227844d696d3f76632fc8d4e2646bb624c21bd16fd5b0e4cf521",
-    },
-    "0x00f932f0fe257456b32deda4758922e56a4f4b42": {
-        "ticker": "PAPER",
-        "signature": "304402205bf1bd00e45eb4fe6e31913a8cf5fdf76036f624a0d79087dbf47185a4520a50022044d8e08efea235f4ae01da8ffa2bc09727bfde2ab3fd711587850ee35a0f6017",
-    },
-    "0xd3594e879b358f430e20f82bea61e83562d49d48": {
-        "ticker": "PSP",
-        "signature": "3045022100f8e88990e420df246280fa394d9f56b23aa0d68b72c638c456a3ddfefb82e34102205177bb03995b26b10efece9d934696d8a0ab2d8a4f73cae01b76a71191df6805",
-    },
-    "0xbc7b1ff1c6989f006a1185318ed4e7b5796e66e1": {
-        "ticker": "PENDLE",
-        "signature": "3045022100b968b32a1b4650b1a4cb7d30d1381c5eb0351d362fb17cc4108b6b212cdfd0c1022057cc12a184207008b87ebdf33e52cdf637b1630ba4bada5f582c9810daf0cda1",
-    },
-    "0x9e1028f5f1d5ede59748ffcee5532509976840e0": {
-        "ticker": "PERP",
-        "signature": "3044022056ed6b81178d51b231ebb0761aac78747335ad507400e4d32fef5abf647250d402206c0308e8aa00acab5c235d826dc691ff1be941ee13a209101bfc17952c6749ec",
-    },
-    "0x35b5a3bf31b67f832230da9424824edc9f7ad98c": {
-        "ticker": "PT",
-        "signature": "30450221009ec1285c823e80b754c8a91d876797415ae265ab4b241ce9f3ad90a1b0c93e680220237f8ec6e10f6b8964dbe32762e42859e37c3b0c8310a5128cfd436b56f40b79",
-    },
-    "0x0c5b4c92c948691eebf185c17eeb9c230dc019e9": {
-        "ticker": "PICKLE",
-        "signature": "30450221008f1e2eca4b9e6aa9864355c9f77b2a406a3baf1b57d8f52b5d39e59f270a080402202f4db688ee8c6e29de64e3e7c7fa6b721d5c872dd77b8905b9d6f4685ad35c6a",
-    },
-    "0x9a601c5bb360811d96a23689066af316a30c3027": {
-        "ticker": "PIKA",
-        "signature": "30450221008132bd2f1e1ed6c66571de08127b1c32b9e400cc1ef793fddd9381afb9c6b48e02202e41b2605e78c7a43b510949993665724bd72de1d3e4ccfa23cd19a01d6b58b0",
-    },
-    "0x395ae52bb17aef68c2888d941736a71dc6d4e125": {
-        "ticker": "POOL",
-        "signature": "3045022100e5b680265998ef114e0ca6361d14aa6bcbee6c03409711a8b5a74ab208b02ef70220317a48fed3a0f3f5d88c80be55dd39eec7d6368097e618177c8066eef510ca20",
-    },
-    "0x6f0fecbc276de8fc69257065fe47c5a03d986394": {
-        "ticker": "POP",
-        "signature": "3044022065fb894de27b8b0a9ab7461e978d2de808210e773521d4b556683e958b828673022030e12fb9f7d3533ccd321c006ff2fbc76072babd9ccd6cf7da322a97e4ee740b",
-    },
-    "0xb4357054c3da8d46ed642383f03139ac7f090343": {
-        "ticker": "PORT3",
-        "signature": "304402207ff8471c45fb4598102421e5f93d0ab59c1cfb1c76ecaf31577d87de7837a828022066d7f0be2af8a4491b13c0bdb35f8f4cc81f56d2d829771c2f775dd1ae597769",
-    },
-    "0x374ad0f47f4ca39c78e5cc54f1c9e426ff8f231a": {
-        "ticker": "PREMIA",
-        "signature": "3045022100cdb5ab057c6b07b68d5fe203a21f6182f31a5ab410c576198b67ae29d38410dd0220255ce2daa89d1110c392d08582c18a7f886984c26e2980ecd16019d93e82f9cd",
-    },
-    "0xe3b3a464ee575e8e25d2508918383b89c832f275": {
-        "ticker": "PUSDC.E",
-        "signature": "3045022100ac0abd6341fa7976aecc8bdeb69f5d19673792211fa4bfe11115bf5c1ce7c1da0220501fcd491e89542d3c7a2848fd880e667313d55c5151d8cf775965b686fa9c9e",
-    },
-    "0x29cb69d4780b53c1e5cd4d2b817142d2e9890715": {
-        "ticker": "PWETH",
-        "signature": "3044022023cc1b4cca03d93fb671492c2cc25d1a5dd929ea2dd64b9e0755b87e923909e20220449400bd4918160dfee01febefac825d6f32ac287acae70105cc95a82ee435bf",
-    },
-    "0xb25ea095997f5bbaa6cea962c4fbf3bfc3c09776": {
-        "ticker": "FIRE",
-        "signature": "3044022041457d724a6786bce77101fb34fa4ff638c93913e3147f09a0405031b91e56e9022063d2f3547ef57d86b31844859c06a84bd2b8dcbcd4b7dcddcc449cce198f335e",
-    },
-    "0xf467c7d5a4a9c4687ffc7986ac6ad5a4c81e1404": {
-        "ticker": "KITE",
-        "signature": "3045022100cf35348f8e1ff30bc410ab7a308fef3eece16a4e3e09d6bad28e7f363f666de002201c7c7927893a817ec916e16578629496b3162820fc58231298a3ab3637092084",
-    },
-    "0x59debed8d46a0cb823d8be8b957add987ead39aa": {
-        "ticker": "QUACK",
-        "signature": "3045022100df784691e6520f0b58307f24bdb7b87e8f5b432fd0ca9e4f554e4a0a8261c25a022049250e9356879c0931bad2d9b1ce342abab1fa0911f80883661eacdf60696cd7",
-    },
-    "0xf899e3909b4492859d44260e1de41a9e663e70f5": {
-        "ticker": "RADIO",
-        "signature": "3045022100e1e9f614bb3b84d3a7e8c9ca43abf8cbb4f34c6aadbac3273f0fdccba3215b1502205722f5afc78bb618489accefca4573b531656bbaceb27a9eb769928c72c5a82c",
-    },
-    "0x7fb688ccf682d58f86d7e38e03f9d22e7705448b": {
-        "ticker": "RAI",
-        "signature": "3044022040462ce0454c3c8e1e5c674132d0060836565f9e786b10c8652dedd388495cf8022079d42d8931d13bcfd4fc11916ca91e67f20aa111012342f4dcefa7d81442d231",
-    },
-    "0xb548f63d4405466b36c0c0ac3318a22fdcec711a": {
-        "ticker": "RGT",
-        "signature": "3045022100fa07c34328c9d82b31c4f16fae0e4a0a9bed7172eec254880977b8dcc9023cc202201fcc921a8ffb997454eca9ad2ad6754a0982f0bc7c6ada2082d32b1bdee3d60e",
-    },
-    "0x9ed7e4b1bff939ad473da5e7a218c771d1569456": {
-        "ticker": "REUNI",
-        "signature": "3045022100f9e9f1066f3d549a37ca3586416d74519407732fb2684180b9f58b912623e1df022027fe6f7a10eaec79b50bba487bc82960f5734108c9d036149c71a8184dcf5261",
-    },
-    "0xecf46257ed31c329f204eb43e254c609dee143b3": {
-        "ticker": "GRG",
-        "signature": "3044022076cc1b52f7cb8b7c99242dbeefd620b2804f34f3e1c1e02efe5110d6705dcdc402204c6688d33b03b9d7e17289267db2c21b04a053da90b7c86abdf72268f8430b5e",
-    },
-    "0x96d17e1301b31556e5e263389583a9331e6749e9": {
-        "ticker": "RILLA",
-        "signature": "304402200691959a230cfc02edcee13c03ac6b7891af1139746629717ab10ddde9daab5d022033ae71ac63ff92800f234df3c11cc26d0b5ff81916836dc46c207b578d4423bf",
-    },
-    "0x9bcef72be871e61ed4fbbc7630889bee758eb81d": {
-        "ticker": "RETH",
-        "signature": "304402203e20ec8351ccf8af3389d4d26697afaa0cd7d761b031f7241f085bf27327e42a02201b6a69faad43874b1bac4088979b90a83532a87bf209558f13563a764b5ee2c1",
-    },
-    "0xb12c13e66ade1f72f71834f2fc5082db8c091358": {
-        "ticker": "ROOBEE",
-        "signature": "304402206e99cb25f0f86c396b500726391fb9eea2ed629ae1b862853f617267bc10911b02204fe64b9eccaf4fb955f78b4753c014d28bb10e460742caddc882ec806cac6fa0",
-    },
-    "0x8413041a7702603d9d991f2c4add29e4e8a241f8": {
-        "ticker": "ROUTE",
-        "signature": "3045022100f7506ac4b1ee290f765c33afce4e3fad2f83e5acbefd8ffcbcfbfb387078516a0220417cbd50d25f534033f4cded70c06e619f6797a75fcb1da0a82b2bae00cea3dd",
-    },
-    "0x66e8617d1df7ab523a316a6c01d16aa5bed93681": {
-        "ticker": "SHACK",
-        "signature": "304402204aa645f5367b0ca3d9ed476a8ab640e3a49fc52b8507ba46b2ff87c0f009b00202207bb22adecd10c72c5be4f2c2f5a282fba84790a4a0790dfd5a1d04141523b793",
-    },
-    "0xf1a0da3367bc7aa04f8d94ba57b862ff37ced174": {
-        "ticker": "FOX",
-        "signature": "3044022028a48ff3532b0da9ec6edb21cf04f13c55439d998ba0affb3fd1ffba21911a2d02205b8358e4971ffd8395e98f930f103809be414c1b57b2717f0bfd2ed572e78c8d",
-    },
-    "0x5ad323d764301e057614edb0449f470d68ea9485": {
-        "ticker": "SIAS",
-        "signature": "30440220696946f4be7ec09655d99c8704c00dbcc1cc6a4f3d7a076bb8d0022ec4132ddb0220792961309e7748448bfa838dc346d522c2fcb3a05e5ee1257d14542eaa29ee66",
-    },
-    "0xdc8840a0a1ebf8be5ace62a7d9360dfcb26adffc": {
-        "ticker": "SMILE",
-        "signature": "304402204fd18602fd365d171e2b1a94f0a5bd07b6c91d6fd83c57b2b7b6344d17533b770220424d3f99e510d03ed9e2113fe27b07c5a83a49fd8a7b9b29d4b7f4055289d321",
-    },
-    "0xd652776de7ad802be5ec7bebfafda37600222b48": {
-        "ticker": "SLM",
-        "signature": "304302205684f2264fce846ecbb42ceb08c1c949d9e217a2e5c9c4a9f5781bd5c4ab576b021f56e484fb6ac13c9a7f3214b1b6f40d1ee896cdaf7ce6076bd5492a09bc7a4c",
-    },
-    "0x1db2466d9f5e10d7090e7152b68d62703a2245f0": {
-        "ticker": "SONNE",
-        "signature": "3045022100fefab7524b32a790de474c5e5c70f97d234d81e0a7d9307d02940d61b67c066f02200e0fa5071ce32b2b7b58940bbcec4b1a86cbe5bc331be72e923e272fccff7f66",
-    },
-    "0x0d82b5d3a8420c285c6d353a6bdc30d164bb50f0": {
-        "ticker": "SPOS",
-        "signature": "304402205039417e1ab2d62524d735b258a7334b69bd51cff84bc82cba227be4e0d6d0570220234e79d6373aa300b123d70a9c4d896ae35251f2eaffdaba424b7ad29abc821b",
-    },
-    "0x3ee6107d9c93955acbb3f39871d32b02f82b78ab": {
-        "ticker": "STERN",
-        "signature": "3045022100a5746063f11a6cbfa39319ff22b59cbbf60ba4aa763421d0a04462a39e1168fa022075191630152bc05b5309b53aad67ce78bde8107c1abec1f3ada3c7176d92ab9b",
-    },
-    "0x2dd1b4d4548accea497050619965f91f78b3b532": {
-        "ticker": "SFRAX",
-        "signature": "304402200c5084327e186052a55f7b3a81326938d6d6bca165cf72ad5444bad68ed12ed2022052d95cc5dd994592b6e6ffe34a44cdcd830b827b54f68bf366a9205afb242fe9",
-    },
-    "0x484c2d6e3cdd945a8b2df735e079178c1036578c": {
-        "ticker": "SFRXETH",
-        "signature": "304402206092ea821a4f2fa0d2db88325a8cfe17d606f57d1e508e6fbccacd81cd3ba333022054cc111c21e5beb117aa825bb23a1f93f857e2447c275e5b55348613905338b2",
-    },
-    "0x296f55f8fb28e498b858d0bcda06d955b2cb3f97": {
-        "ticker": "STG",
-        "signature": "30440220048584a5d62b4f9597589186564b31f0f5ab77cbe38719391d748d53d66eb72002206e333c01d5c6afb1c32e789afafbad6ae0dd58d458d071857265c1f1f03637ab",
-    },
-    "0x5a5fff6f753d7c11a56a52fe47a177a87e431655": {
-        "ticker": "SYN",
-        "signature": "304402205dc6a1c1f62303a49b42bd0569df3f284ea19c472fa5701439fc0ed2882831ed02201a7d97e3e7b179a7025f75017a9b1e4d0d07202b9b01f13586a8ed13edfd57cf",
-    },
-    "0x298b9b95708152ff6968aafd889c6586e9169f1d": {
-        "ticker": "SBTC",
-        "signature": "3045022100dd4ecd099147302f60d7a68215da37219e9ece22b782d1d111330459f2d2db32022007e06c7f8b5cb49067306518e9601eec513d2099b50c2b81ca3fc9bc407c23b4",
-    },
-    "0xe405de8f52ba7559f9df3c368500b6e6ae6cee49": {
-        "ticker": "SETH",
-        "signature": "3045022100bc48fba9bedf2d5af4ffd580a2ef8799d623793b8984df1d959ca98e7b30057802202dc2698eca42191e832cbd0eb4148f421e17f5a04b62f34693328525292efa60",
-    },
-    "0xc5db22719a06418028a40a9b5e9a7c02959d0d08": {
-        "ticker": "SLINK",
-        "signature": "3045022100bf1d1faefd0b5fc3cd6040d021ee3722d6eebfd0d0ec774e79e37d877067f302022066dd6f95fa50e57a45e7abfb423777a49751209689b5a33c6bf2d1f1feecce18",
-    },
-    "0x8c6f28f2f1a3c87f0f938b96d27520d9751ec8d9": {
-        "ticker": "SUSD",
-        "signature": "3045022100aec1237635db13ba9b3732ed54b7553ab18f9d361d95a5fb3cd4d7e6907b0d4e02203698033fe7f52a031c4898c6f1d6756c989ca1553fc114ac8ecef586652cb15e",
-    },
-    "0x8700daec35af8ff88c16bdf0418774cb3d7599b4": {
-        "ticker": "SNX",
-        "signature": "3045022100f9694daae21eae34fbb99229ca60193a95127d0223fef4b101265fef2da09ed0022061aa3106a76692dee9981aedcb35e75b5228718906f570377500149e08ab7dfb",
-    },
-    "0x1f514a61bcde34f94bc39731235690ab9da737f7": {
-        "ticker": "TAROT",
-        "signature": "3043021f79d1836d77da342c67a1c9c8d2ac5421f0f6872da0784f2e166d9fccd99f8f022040c1c0b64fd31121e65d2f572375fd32ab009fd138e14d6f36d081e5b18dd00c",
-    },
-    "0xaf8ca653fa2772d58f4368b0a71980e9e3ceb888": {
-        "ticker": "TRB",
-        "signature": "3045022100d72a421d7aaa21485445a73692882469c248f2967ef55b3ac25a5e9fea23bf35022064450e68a0c8b79068bcd1ff45b95a258f18c892f5ac67af4ad3d390f6ad4824",
-    },
-    "0xbf0c7ccb143126c1be90a426f676f5cb313956d9": {
-        "ticker": "TEM",
-        "signature": "3044022029bf956aefeee210026bd8ccc9361399b5e4dac4fa821edca428148bcfb7864402207ea0ccd2b43b809666c4666efdf1056495ac9876faab8ce0e5327217e60c0736",
-    },
-    "0xfb21b70922b9f6e3c6274bcd6cb1aa8a0fe20b80": {
-        "ticker": "UST",
-        "signature": "3044022072ca7f6eaffac83db50f3524f076f882bb79c0eaa645c7b6a910f36374694cfc0220355dd4c1c068ad39c8e370e697e5346e183724488b1afb8e2bb949ab55b0601c",
-    },
-    "0x94b008aa00579c1307b0ef2c499ad98a8ce58e58": {
-        "ticker": "USDT",
-        "signature": "304402202a3067d53cf1352cb7d6998549566f85027061076f1777bae4ffb5bc7105c5cc0220040a655bc5d1fbe020792536c809b1fc9aa26deb7dd8e8b4f66dfdb02e9c665f",
-    },
-    "0x217d47011b23bb961eb6d93ca9945b7501a5bb11": {
-        "ticker": "THALES",
-        "signature": "3044022046d119d67b3f0e49b1805e113b6048e697e0467ec08008ff912d7009098f2739022015adc956d690d796a4623935fe8b9d9858b2c377c2c2913f70a6cecf8560d20f",
-    },
-    "0x8f69ee043d52161fd29137aedf63f5e70cd504d5": {
-        "ticker": "DOG",
-        "signature": "3045022100ccc98ace8478efaec6e344221f30808fb5a10c1bed75f682066e6663b1fb1bb40220744383d92d31e6594c3e3dac10d4732aac472d2d10e33b8f172a978641ce9151",
-    },
-    "0x8fc7c1109c08904160d6ae36482b79814d45eb78": {
-        "ticker": "TEC",
-        "signature": "3044022072f44a8077592d73548e3d8335161a7e35ff270e74f2888bd2a34451b639e5bb022011f8fbdab533f5df671791e736a806b7c627af6bf6c917417901ef458275986d",
-    },
-    "0xcb59a0a753fdb7491d5f3d794316f1ade197b21e": {
-        "ticker": "TUSD",
-        "signature": "30440220016f06e37f7d5c903d60148f47099b624ba1ac4e82aa33e93a6e389a3cc61c3f022028a4e9741cafecb98c08ba04e7470462f8b663f81e2cb14e564be1242dfec810",
-    },
-    "0x8fb94e08bc984497aaaf1a545ed455be89f8c675": {
-        "ticker": "TVPLS",
-        "signature": "3045022100bf52e1d66a30e99f6866cf10f4f95dc41b5adef0b4d1a1fc6bdcfcfa43fc52d402200a8d8184fab724365cefab50ab8b800aeec6b1768431118a32946266237cd26c",
-    },
-    "0x28b42698caf46b4b012cf38b6c75867e0762186d": {
-        "ticker": "UNIDX",
-        "signature": "3044022036bb9164a561039414704445beedf687f1cacc17fe7abb0bd70445383fdbe1db0220610e4e034f957d69f10f955d603b89dc6459e3d826cfac409f2b4ebe3dced32e",
-    },
-    "0x6fd9d7ad17242c41f7131d257212c54a0e816691": {
-        "ticker": "UNI",
-        "signature": "304402204269dc3220bfcf3e8f49bc1d347e3aa4e571a17868fc024ccd492a7b18469fb60220158497b335cb74f77dd5dcf5879ea3f19131167a21a2560b58c7dbafa7bdc2ee",
-    },
-    "0x3b6564b5da73a41d3a66e6558a98fd0e9e1e77ad": {
-        "ticker": "UTS",
-        "signature": "304402204b85fa75c2c57ce7f8400462fa60d911a040b14d5fb3d9a3819e12c7f050c52a022006befbeb9ad7bd08dfbd8d3c80e9337f09e55d7b8692b9ea2147bcbd766d3c71",
-    },
-    "0x73cb180bf0521828d8849bc8cf2b920918e23032": {
-        "ticker": "USD+",
-        "signature": "3044022046ce148bb3aef03ddebba7c5e2d0e4e2b9c3baff82087eb8e969b804cba4c222022053b16d7ecd4352d3dcc4af476f40c2dbf1ec0944d45842920e26a817fcbcead5",
-    },
-    "0x0b2c639c533813f4aa9d7837caf62653d097ff85": {
-        "ticker": "USDC",
-        "signature": "30440220597e4a9911df217d680aa240ca96f7e8fca24c24e7c673c43820c94b08ef69e402206e975e27e82b3370eca40041fca772bd6c4ca7dd087d2bfcc8aa146cb8e1de53",
-    },
-    "0x7f5c764cbc14f9669b88837ca1490cca17c31607": {
-        "ticker": "USDC.E",
-        "signature": "30440220739893ad392eb372d576dc396543084e9c13a6bfb2caf1f272e823fe448ebf90022031b8ea111078a1b660154f0df0ee2d6f6a1aabe70057e5b03e5294396700f799",
-    },
-    "0x323665443cef804a3b5206103304bd4872ea4253": {
-        "ticker": "USDV",
-        "signature": "3045022100af9b6c6419346fbe9b3a1ce51a7023b7ae12c0d5239976c1225ab72f3e9cc4ef02204947d0aa677cdd580a213a5b10e2b1967f79154534583e18d79667c06f9f61fd",
-    },
-    "0x9560e827af36c94d2ac33a39bce1fe78631088db": {
-        "ticker": "VELO",
-        "signature": "3044022011964ac54293e8239ad07ee39e5cf5d0bce0a3a34ef810456b7e1234598da7a5022061c6949ee157f247b176b30b34110164d2af0b93e466ec672d08b9f8dcb6b290",
-    },
-    "0x071682832d213638f8eda67a873262e581a4006d": {
-        "ticker": "VRGNS",
-        "signature": "3044022033c580c1065b3aff85e8896c443bea918968435c10f769ee5044faef695cb186022003c93293b496aa17c86568749e15d9cc63bf406495f5656be52eff46fab90f64",
-    },
-    "0x6d2e5b8841a6aa5f0f973436357f75d3eeb93312": {
-        "ticker": "VMEX",
-        "signature": "3045022100aed2959b0d1f97afcab9da0afce33cbb105801ece383505ddd332db84530a60a0220229b8d9176bdeb03d93fdc407aa7b26ea6b4dc3d998552c984a105a3b92022f3",
-    },
-    "0xaf20f5f19698f1d19351028cd7103b63d30de7d7": {
-        "ticker": "WAGMI",
-        "signature": "3045022100a9a6c41e9eda5f6017c8959119c4d32a5c3fa0d0156e61550f185a83a6145ddb02205c4a784979636867f4f94c50ee7f582fe97f6123b7af267a0d610af6f3e71cd0",
-    },
-    "0x6f620ec89b8479e97a6985792d0c64f237566746": {
-        "ticker": "WPC",
-        "signature": "3045022100eab607e545a926b113bc853ee2189a60ebae5f8ecd6bd6f5fe0599ce07394d1a02203f50fc0e16eac23e263c638a42a20284d8f635aad3af05fdd0e82c0805ad1b3b",
-    },
-    "0xdc6ff44d5d932cbd77b52e5612ba0529dc6226f1": {
-        "ticker": "WLD",
-        "signature": "3045022100c8326b3a574e1d31ccd63f6404173b2a10bc31b63ed1ea730592f8f6aa64f7a2022037bba988b621491a71f34d78cb4d106eabddf280317636cce9c1e5745bbed4d1",
-    },
-    "0x68f180fcce6836688e9084f035309e29bf0a2095": {
-        "ticker": "WBTC",
-        "signature": "304402204f3e3a20910d0477597770998077d11761b00f6b04ddde49b6f5b3821d1080a0022061f797d863b270d4dc0cfa9d59393f46444aa4b9630c7d703fc9f8bc89ef5b40",
-    },
-    "0x4200000000000000000000000000000000000006": {
-        "ticker": "WETH",
-        "signature": "3045022100eee7b29d02da60a3f7d48181c13d9ba07b07161ede9ef43f96ffed19c88cc8f902202e4cdce9fa3292c80ad563f89d14d82e8e8f8fd100a61e7949ff4beb14b82e4d",
-    },
-    "0x1f32b1c2345538c0c6f582fcb022739c4a194ebb": {
-        "ticker": "WSTETH",
-        "signature": "30450221008b63229da6b96c812faf0db36f2b3050b7ee1111b9d0e229bbc3d76adb6d83a60220540ed88f736bc50c1dc0897618b6eec50c06d7b140629c9d4dec0188b586bbe3",
-    },
-    "0xc26921b5b9ee80773774d36c84328ccb22c3a819": {
-        "ticker": "WOPTIDOGE",
-        "signature": "3044022044b9f4c2d58e13fedcd7f7097553f6bb6ed21aa95bc283e8422e3b94351f120b02201c6c26bb480d1b3820fc4f44e28ac6c37b1d1c2ebb20e14106f6f22ca30e8fff",
-    },
-    "0xc03b43d492d904406db2d7d57e67c7e8234ba752": {
-        "ticker": "WUSDR",
-        "signature": "304402203b14e7df6e511ba912ee3246c88330b486b991fb8817207db7381cfe4f7764de02207d43a6800e4e4c2fd3ee413afeb00b005a109f94c753484cfe6cfa6ac73681a2",
-    },
-    "0xdb4ea87ff83eb1c80b8976fc47731da6a31d35e5": {
-        "ticker": "WTBT",
-        "signature": "3045022100f0f242d841b57e5993d51c4a3e548675b594c744413bf7e1a0dfd027c5e6ce66022061fc2e0d1fdceb638a89f7b3d303866c03f5bfcaaa58dfce93af21622895cd53",
-    },
-    "0x1e3c6c53f9f60bf8aae0d7774c21fa6b1afddc57": {
-        "ticker": "XSHRAP",
-        "signature": "304402201b82f898359ba022bd0f07d102b7b18c0616e509f538e10dff8d896a22552654022012d870b0e060736091a02a6df94947c7e6a5168462ac3eedcfb4d7ecccea2677",
-    },
-    "0xb962150760f9a3bb00e3e9cf48297ee20ada4a33": {
-        "ticker": "XZOOMER",
-        "signature": "304402205cd50942b4ace0482d02139d19cb1ab2ac44badaace1119044e19fcfb92498a6022036115d2c2264c340a52cd2b9493f55c1067a6d15417ad0bd1e5a9e492afaba5c",
-    },
-    "0x9046d36440290ffde54fe0dd84db8b1cfee9107b": {
-        "ticker": "YFI",
-        "signature": "3044022027ccd8b9e1f0877c9cd88d812649749048e8c2b5bf4584c603dbe1b8dcc99faf02204b9c7c4387ae5ce4a79404a54cd5f7fbcc3d80932f56aa3232d5d24081e72f87",
-    },
-    "0xfa436399d0458dbe8ab890c3441256e3e09022a8": {
-        "ticker": "ZIP",
-        "signature": "3045022100ab8cc2bbd3f0e2f28dac565225f1e3f22de49677c5bb208afcd916490d5f5bee022058376b7aa37cae7c9ae2f255727dc4966d2362e379ffa55367af817c61816d84",
-    },
-}
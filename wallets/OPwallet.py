@@ -17,7 +17,10 @@
 
 from copy import deepcopy
 from wallets.ETHwallet import ETH_wallet
-from wallets.OPtokens import tokens_values, nfts_values, ledger_tokens
+from wallets.token_registry import TokenRegistry
+
+
+tokens_registry = TokenRegistry("OP")
 
 
 class OP_wallet(ETH_wallet):
@@ -42,8 +45,8 @@ class OP_wallet(ETH_wallet):
     ]
 
     options_data = deepcopy(ETH_wallet.options_data)
-    options_data[0]["preset"] = tokens_values
-    options_data[2]["preset"] = nfts_values
+    options_data[0]["preset"] = tokens_registry.tokens_values
+    options_data[2]["preset"] = tokens_registry.nfts_values
 
     def __init__(
         self, network, wtype, device, contract_addr=None, wc_uri=None, confirm_callback=None
@@ -60,4 +63,4 @@ class OP_wallet(ETH_wallet):
         else:
             raise ValueError("Wrong OP network.")
         self.load_base(rpc_endpoint, device, contract_addr, wc_uri, confirm_callback, wtype != 3)
-        self.ledger_tokens = ledger_tokens
+        self.ledger_tokens = tokens_registry.ledger_tokens
@@ -17,8 +17,8 @@
 
 import json
 import urllib.parse
-import urllib.request
 
+from wallets.http_transport import request as http_request
 from wallets.name_service import resolve
 from wallets.wallets_utils import balance_string, shift_10, NotEnoughTokens
 from cryptolib.base58 import base58_to_bin, bin_to_base58
@@ -98,18 +98,15 @@ class sol_api:
             params = [params]
         data = {"jsonrpc": "2.0", "method": method, "params": params, "id": 1}
         try:
-            req = urllib.request.Request(
-                self.url,
-                headers={"User-Agent": "Uniblow/2", "Content-Type": "application/json"},
-                data=json.dumps(data).encode("utf-8"),
+            self.jsres = json.loads(
+                http_request(
+                    self.url,
+                    data=json.dumps(data).encode("utf-8"),
+                    headers={"Content-Type": "application/json"},
+                )
             )
-            self.webrsc = urllib.request.urlopen(req)
-            self.jsres = json.load(self.webrsc)
-        except urllib.error.HTTPError as exc:
-            strerr = exc.read()
-            raise IOError(f"{exc.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as exc:
-            raise IOError(exc)
+        except IOError:
+            raise
         except Exception:
             raise IOError(f"Error while processing request:\n {self.url}  :  {method} ,  {params}")
 
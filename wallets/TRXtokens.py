@@ -1,34 +0,0 @@
-# Uniblow ERC20 list for Tron generated on 2023-06-27T10:11:53
-tokens_values = [
-    # Mainnet
-    {
-        "Tether USD (USDT)": "TR7NHqjeKQxGTCi8q8ZY4pL8otSzgjLj6t",
-        "Bitcoin (BTC)": "TN3W4H6rK2ce4vX9YnFQHwKENnHjoxb3m9",
-        "Wrapped BTC (WBTC)": "TXpw8XeWYeTUd4quDskoUqeQPowRh4jY65",
-        "Wrapped TRX (WTRX)": "TNUC9Qb1rRpS5CbWLmNMxXBjyFoydXjWFR",
-        "Wrapped BTT (WBTT)": "TKfjV9RNKJJCqPvBtK8L7Knykh7DNWvnYt",
-        "Ethereum (ETH)": "TRFe3hT5oYhjSZ6f3ji5FJ7YCfrkWnHRvh",
-        "EthereumOLD (ETHOLD)": "THb4CqiFdwNHsWsQCs4JhzwjMWys4aqCbF",
-        "Decentralized USD (USDD)": "TPYmHEhy5n8TCEfYGqW2rPxsghSfzghPDn",
-        "USD Coin (USDC)": "TEkxiTehnzSmSe2XqrBj4w32RUN966rdz8",
-        "JUST Stablecoin (USDJ)": "TMwFHYXLJaRUPeW6421aqXL4ZEzPRFGkGT",
-        "TrueUSD (TUSD)": "TUpMhErZL2fhh4sVNULAbNKLokS4GjC1F4",
-        "JUST (JST)": "TCFLL5dx5ZJdKnWuesXxi1VPwjLVmWZZy9",
-        "WINkLink (WIN)": "TLa2f6VPqDgRE67v1736s7bJ8Ray5wYjU7",
-        "SUN (SUN)": "TSSMHYeV2uE9qYH95DqyoCuNCzEL1NvU3S",
-        "SUNOLD (SUNOLD)": "TKkeiboTkxXKJpbmVFbv4a8ov5rAfRDMf9",
-        "APENFT (NFT)": "TFczxzPhnThNSqr5by8tvxsdCFRRz6cPNq",
-        "HuobiToken (HT)": "TDyvndWuvX5xTBwHPYJi7J3Yq8pq8yh62h",
-        "Dogecoin (DOGE)": "THbVQp8kMjStKNnf2iCY6NEzThKMK5aBHg",
-        "BitTorrent (BTT)": "TAFjULxiVgT4qWk6UZwjqwZXTSaGaqnVp4",
-        "BUSD Token (BUSD)": "TMz2SWatiAtZVVcH2ebpsbVtYwUPT9EdjH",
-    },
-    # Testnets
-    # Shasta
-    {
-        "Test USDT": "TG3XXyExBkPp9nzdajDZsozEu4BkaSJozs",
-        "Test USDC": "TSdZwNqpHofzP6BsBKGQUWdBeJphLmF6id",
-    },
-    # Nile
-    {},
-]
@@ -17,15 +17,20 @@
 
 import json
 import urllib.parse
-import urllib.request
 import re
 from logging import getLogger
 
 from cryptolib.base58 import encode_base58, decode_base58
 from cryptolib.cryptography import sha2, sha3, public_key_recover
+from wallets.http_transport import request as http_request
 from wallets.wallets_utils import InvalidOption, balance_string, shift_10, NotEnoughTokens
 from cryptolib.coins.ethereum import uint256, read_string
-from wallets.TRXtokens import tokens_values
+from wallets.token_registry import TokenRegistry
+from wallets.token_metadata import token_metadata
+
+
+tokens_registry = TokenRegistry("TRX")
+
 
 logger = getLogger(__name__)
 
@@ -108,18 +113,13 @@ class TronApi:
         if data is not None and isinstance(data, dict):
             data = json.dumps(data).encode("utf8")
         try:
-            req = urllib.request.Request(
-                f"{self.api_domain}{endpoint}",
-                headers={"User-Agent": "Mozilla/5.0"},
-                data=data,
+            return json.loads(
+                http_request(
+                    f"{self.api_domain}{endpoint}", data=data, headers={"User-Agent": "Mozilla/5.0"}
+                )
             )
-            webrsc = urllib.request.urlopen(req)
-            return json.load(webrsc)
-        except urllib.error.HTTPError as exc:
-            strerr = exc.read()
-            raise IOError(f"{exc.code}  :  {strerr.decode('utf8')}")
-        except urllib.error.URLError as exc:
-            raise IOError(exc)
+        except IOError:
+            raise
         except Exception:
             raise IOError(f"Error while processing request:\n{self.api_domain}{endpoint}")
 
@@ -191,6 +191,13 @@ class TronApi:
 
 TRX_DECIMALS = 6
 
+# Tron chain ids, keys of the tokens metadata cache
+TRX_CHAIN_IDS = {
+    "mainnet": 728126428,
+    "shasta": 2494104990,
+    "nile": 3448148188,
+}
+
 
 class TRX_wallet:
     coin = "TRX"
@@ -224,7 +231,7 @@ class TRX_wallet:
         {
             "option_name": "contract_addr",
             "prompt": "TRC20 contract address",
-            "preset": tokens_values,
+            "preset": tokens_registry.tokens_values,
         },
     ]
 
@@ -259,8 +266,10 @@ class TRX_wallet:
         self.evm_addr = compute_evm_addr(self.address)
         self.api = TronApi(self.network)
         self.contract = contract_addr
-        self.coin = self.get_symbol()
-        self.decimals = self.get_decimals()
+        self.chain_id = TRX_CHAIN_IDS[self.network]
+        if self.contract:
+            token_metadata.seed_presets(self.chain_id, tokens_registry.tokens_values[network])
+        self.coin, self.decimals = self.read_token_info()
 
     @classmethod
     def get_networks(cls):
@@ -283,6 +292,23 @@ class TRX_wallet:
         # No list, it's all k1
         return "K1"
 
+    def read_token_info(self):
+        """Symbol and decimals, from the metadata cache or read from the chain"""
+        if not self.contract:
+            return TRX_wallet.coin, TRX_DECIMALS
+        cached = token_metadata.get(self.chain_id, self.contract)
+        if cached is not None:
+            return cached["symbol"], cached["decimals"]
+        symbol = token_metadata.get_preset_symbol(self.chain_id, self.contract)
+        if symbol is None:
+            symbol = self.get_symbol()
+        dec_raw = self.api.call(self.address, self.contract, "decimals()")
+        if dec_raw == "":
+            return symbol, 0
+        decimals = int(dec_raw, 16)
+        token_metadata.set(self.chain_id, self.contract, decimals, symbol)
+        return symbol, decimals
+
     def get_decimals(self):
         if self.contract:
             # ERC20
@@ -379,7 +405,7 @@ class TRX_wallet:
         return tx
 
     def transfer(self, amount, to_account, fee_priority):
-        amnt_int = shift_10(amount, self.get_decimals())
+        amnt_int = shift_10(amount, self.decimals)
         tx_data = self.build_tx(amnt_int, to_account)
         return "\nDONE, txID : " + self.api.broadcast(tx_data)
 
@@ -17,8 +17,8 @@
 
 import json
 import urllib.parse
-import urllib.request
 
+from wallets.http_transport import HTTPError, request as http_request
 from wallets.name_service import resolve
 from cryptolib.base58 import encode_base58, decode_base58
 from cryptolib.cryptography import compress_pubkey
@@ -56,16 +56,12 @@ class RPC_api:
                 data = None
             else:
                 data = json.dumps(params).encode("utf-8")
-            req = urllib.request.Request(
-                full_url,
-                headers={"User-Agent": "Uniblow/2", "Content-Type": "application/json"},
-                data=data,
+            resp = http_request(
+                full_url, data=data, headers={"Content-Type": "application/json"}, timeout=6
             )
-            webrsp = urllib.request.urlopen(req, timeout=6)
-            resp = json.load(webrsp)
-            return resp
-        except urllib.error.HTTPError as e:
-            err = e.read().decode("utf8")
+            return json.loads(resp)
+        except HTTPError as e:
+            err = e.body.decode("utf8")
             try:
                 err = json.loads(err)
             except ValueError:
@@ -80,8 +76,8 @@ class RPC_api:
                 else:
                     raise IOError(f"Error code {e.code}\n{err}")
                 raise IOError(f"Error in the node processing :\n{err[0][key]}")
-        except urllib.error.URLError as e:
-            raise IOError(e)
+        except IOError:
+            raise
         except Exception:
             raise IOError(f"Error while processing request :\n{full_url}:{str(data)}")
 
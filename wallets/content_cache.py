@@ -0,0 +1,220 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Content disk cache
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Data read from the network kept on disk, in the user data directory, in files
+named by the digest of their key. The key of an IPFS URL is its CID path,
+whatever the gateway.
+"""
+
+
+from base64 import b32decode
+from hashlib import sha256
+from logging import getLogger
+import os
+from threading import Lock
+
+from cryptolib.base58 import base58_to_bin
+from devices.file_path import APP_NAME, AUTHOR, user_data_dir
+
+
+# Multicodec codes of the CID content
+DAG_PB_CODEC = 0x70
+RAW_CODEC = 0x55
+# Multihash code of sha2-256, the only one of the CIDv0
+SHA2_256 = 0x12
+
+
+logger = getLogger(__name__)
+
+
+def read_varint(data, pos):
+    """Unsigned varint at pos in data, returns (value, position after it)"""
+    value = 0
+    shift = 0
+    while True:
+        if pos >= len(data) or shift > 56:
+            raise ValueError("Invalid varint")
+        byte = data[pos]
+        value |= (byte & 0x7F) << shift
+        pos += 1
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def multibase_decode(text):
+    """Binary data of a multibase string, in the bases used by the CIDv1"""
+    base, encoded = text[:1], text[1:]
+    if base in ("b", "B"):
+        return b32decode(encoded.upper() + "=" * (-len(encoded) % 8))
+    if base == "z":
+        return base58_to_bin(encoded)
+    if base in ("f", "F"):
+        return bytes.fromhex(encoded)
+    if base in ("k", "K"):
+        int_data = int(encoded, 36)
+        return int_data.to_bytes((int_data.bit_length() + 7) // 8, "big")
+    raise ValueError("Unsupported multibase")
+
+
+def decode_cid(cid):
+    """(content codec, hash code, digest) of a CIDv0 or CIDv1.
+    Raises ValueError when it is not a valid CID.
+    """
+    if len(cid) == 46 and cid.startswith("Qm"):
+        codec = DAG_PB_CODEC
+        multihash = base58_to_bin(cid)
+    else:
+        cid_bin = multibase_decode(cid)
+        version, pos = read_varint(cid_bin, 0)
+        if version != 1:
+            raise ValueError("Invalid CID version")
+        codec, pos = read_varint(cid_bin, pos)
+        multihash = cid_bin[pos:]
+    hash_code, pos = read_varint(multihash, 0)
+    size, pos = read_varint(multihash, pos)
+    if size == 0 or len(multihash) - pos != size:
+        raise ValueError("Invalid CID multihash")
+    if cid.startswith("Qm") and (hash_code != SHA2_256 or size != 32):
+        raise ValueError("Invalid CIDv0")
+    return codec, hash_code, multihash[pos:]
+
+
+def is_cid(text):
+    try:
+        decode_cid(text)
+    except ValueError:
+        return False
+    return True
+
+
+def ipfs_path(url):
+    """CID and path of an IPFS URL, ipfs:// or through a gateway, else None.
+    The path has to start with a valid CID.
+    """
+    if url.startswith("ipfs://"):
+        path = url[len("ipfs://") :]
+        if path.startswith("ipfs/"):
+            path = path[len("ipfs/") :]
+    elif url.startswith("http") and "/ipfs/" in url:
+        path = url.split("/ipfs/", 1)[1]
+    else:
+        return None
+    cid = path.split("/", 1)[0].split("?", 1)[0].split("#", 1)[0]
+    if not is_cid(cid):
+        return None
+    return path
+
+
+def cache_key(url):
+    path = ipfs_path(url)
+    if path is not None:
+        return f"ipfs/{path}"
+    return url
+
+
+def user_cache_path(dir_name):
+    return os.path.join(user_data_dir(APP_NAME, AUTHOR), dir_name)
+
+
+class ContentCache:
+    """Data on disk, in files named by the digest of their key.
+    Above max_size bytes, the least recently used files are removed.
+    Without max_size, the data is kept for good, as the immutable IPFS content.
+    """
+
+    def __init__(self, dir_path, max_size=None):
+        self.dir_path = dir_path
+        self.max_size = max_size
+        self.lock = Lock()
+        # Total size of the files, read at the first write
+        self.size = None
+
+    def file_path(self, key):
+        return os.path.join(self.dir_path, sha256(key.encode("utf8")).hexdigest())
+
+    def get(self, key):
+        """Data stored for the key, or None"""
+        file_path = self.file_path(key)
+        try:
+            with open(file_path, "rb") as cache_file:
+                data = cache_file.read()
+            if self.max_size is not None:
+                # Recently used
+                os.utime(file_path)
+        except OSError:
+            return None
+        return data
+
+    def put(self, key, data):
+        file_path = self.file_path(key)
+        try:
+            os.makedirs(self.dir_path, exist_ok=True)
+            # Written aside then moved, a file read is always complete
+            tmp_path = f"{file_path}.{os.getpid()}.{id(data)}.tmp"
+            with open(tmp_path, "wb") as cache_file:
+                cache_file.write(data)
+            os.replace(tmp_path, file_path)
+        except OSError as exc:
+            logger.warning("Can't write in the cache %s : %s", self.dir_path, str(exc))
+            return
+        if self.max_size is None:
+            return
+        with self.lock:
+            if self.size is None:
+                self.size = sum(size for _, _, size in self.files())
+            else:
+                self.size += len(data)
+            if self.size > self.max_size:
+                self.prune()
+
+    def clear(self):
+        """Remove all the data"""
+        with self.lock:
+            try:
+                files = self.files()
+            except OSError:
+                return
+            for _, file_path, _ in files:
+                try:
+                    os.remove(file_path)
+                except OSError:
+                    pass
+            self.size = None
+
+    def files(self):
+        """List of (last use time, path, size) of the cached files"""
+        files = []
+        for entry in os.scandir(self.dir_path):
+            if entry.is_file() and not entry.name.endswith(".tmp"):
+                stat = entry.stat()
+                files.append((stat.st_mtime, entry.path, stat.st_size))
+        return files
+
+    def prune(self):
+        """Remove the least recently used files, down to 3/4 of the max size"""
+        files = sorted(self.files())
+        self.size = sum(size for _, _, size in files)
+        for _, file_path, size in files:
+            if self.size <= self.max_size * 3 // 4:
+                break
+            try:
+                os.remove(file_path)
+                self.size -= size
+            except OSError:
+                pass
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM RPC client with JSON-RPC batches
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+from pyweb3 import Web3Client
+from pyweb3.json_rpc import JSONRPCexception
+
+
+def read_quantity(raw_value):
+    """Integer from a JSON-RPC hex quantity"""
+    if raw_value and len(raw_value) >= 2 and raw_value[:2] == "0x":
+        return int(raw_value[2:], 16)
+    raise Exception("Bad quantity data in the RPC response")
+
+
+def read_balance(raw_value):
+    """Integer from eth_getBalance, 0 when no data"""
+    if raw_value and len(raw_value) >= 2 and raw_value[:2] == "0x":
+        return int(raw_value[2:], 16)
+    return 0
+
+
+def rpc_result(response):
+    """Result of a JSON-RPC response object"""
+    if not isinstance(response, dict):
+        raise Exception("Bad JSON RPC response")
+    if "error" in response:
+        raise JSONRPCexception(response["error"])
+    return response.get("result")
+
+
+def batch_results(requests, responses):
+    """Results of a JSON-RPC batch in the requests order, the responses can come in any order.
+    Raises JSONRPCexception when a request has an error.
+    """
+    results = {}
+    for response in responses:
+        if not isinstance(response, dict):
+            raise Exception("Bad JSON RPC response")
+        if "error" in response:
+            raise JSONRPCexception(response["error"])
+        results[response.get("id")] = response.get("result")
+    if any(request["id"] not in results for request in requests):
+        raise Exception("JSON RPC batch response id mismatch")
+    return [results[request["id"]] for request in requests]
+
+
+class RPCBatch:
+    """Collect independent RPC requests, all sent in one JSON-RPC batch with execute.
+    The methods have the Web3Client arguments, and return the index of the result.
+    """
+
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+        self.decoders = []
+
+    def add(self, method, params=None, decoder=None):
+        if params is None:
+            params = []
+        self.calls.append((method, params))
+        self.decoders.append(decoder)
+        return len(self.calls) - 1
+
+    def get_balance(self, address, state="latest"):
+        return self.add("eth_getBalance", [address, state], read_balance)
+
+    def call(self, contract, command_code, data="", state="latest"):
+        return self.add("eth_call", [{"to": contract, "data": f"0x{command_code}{data}"}, state])
+
+    def get_tx_num(self, addr, state="latest"):
+        return self.add("eth_getTransactionCount", [f"0x{addr}", state], read_quantity)
+
+    def get_gasprice(self):
+        return self.add("eth_gasPrice", [], read_quantity)
+
+    def get_code(self, address, state="latest"):
+        return self.add("eth_getCode", [address, state])
+
+    def estimate_gas(self, tx_call):
+        """tx_call : {"from", "to", "value", "data"} of the tx"""
+        return self.add("eth_estimateGas", [tx_call], read_quantity)
+
+    def execute(self):
+        """Send the batch, returns the results list in the requests order."""
+        results = self.client.request_batch(self.calls)
+        return [
+            decoder(result) if decoder is not None else result
+            for decoder, result in zip(self.decoders, results)
+        ]
+
+
+class EVMclient(Web3Client):
+    """Web3Client able to send several requests with RPCBatch.
+    The pyweb3 connection has no JSON-RPC batch, so the requests are sent one at a time.
+    PooledEVMclient sends them in one batch.
+    """
+
+    def batch(self):
+        return RPCBatch(self)
+
+    def request_batch(self, calls):
+        """Send a list of (method, params), returns the list of results.
+        Raises JSONRPCexception when one of the requests has an error.
+        """
+        return [self.jsonrpc.request(method, params) for method, params in calls]
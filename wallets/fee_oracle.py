@@ -0,0 +1,190 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM fee oracle
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Gas prices of an EVM chain for the slow, normal and fast priorities.
+Computed from the next block base fee and the priority fees percentiles paid in
+the last blocks (eth_feeHistory), cached a few seconds and refreshed ahead in
+the background. One oracle per chain, shared by all the wallets.
+"""
+
+
+from logging import getLogger
+from threading import Lock, Thread
+from time import monotonic
+
+from pyweb3.json_rpc import JSONRPCexception
+
+from wallets.evm_rpc import read_quantity
+
+
+# Seconds a fees reading is used
+DEFAULT_TTL = 15
+# Part of the TTL after which the fees are refreshed in the background
+REFRESH_AHEAD = 0.5
+# Blocks read in the fee history
+FEE_HISTORY_BLOCKS = 20
+# Priority fees percentiles for slow, normal and fast
+FEE_PERCENTILES = [10, 50, 90]
+# The base fee can rise by 12.5% each block
+BASE_FEE_MARGINS = [1.0, 1.125, 1.25]
+# eth_gasPrice factors, when the chain has no fee history
+GASPRICE_FACTORS = [0.9, 1.1, 1.6]
+# Seconds before asking again the fee history to a chain without it
+FEE_HISTORY_RECHECK = 3600
+# JSON-RPC error code of an unknown method
+METHOD_NOT_FOUND = -32601
+
+
+logger = getLogger(__name__)
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def is_unsupported_method(exc):
+    """The JSON-RPC error tells the node doesn't provide the method,
+    not a temporary error as a rate limit.
+    """
+    error = exc.args[0] if exc.args else None
+    if not isinstance(error, dict):
+        return False
+    if error.get("code") == METHOD_NOT_FOUND:
+        return True
+    message = str(error.get("message", "")).lower()
+    return any(
+        words in message
+        for words in ("not found", "not supported", "does not exist", "not available")
+    )
+
+
+def compute_fees(gasprice, fee_history=None):
+    """Gas prices [slow, normal, fast] in wei.
+    gasprice : eth_gasPrice in wei, fee_history : eth_feeHistory result or None.
+    """
+    if fee_history:
+        base_fees = fee_history.get("baseFeePerGas") or []
+        rewards = [reward for reward in fee_history.get("reward") or [] if reward]
+    else:
+        base_fees = []
+        rewards = []
+    next_base_fee = read_quantity(base_fees[-1]) if base_fees else 0
+    if next_base_fee == 0 or not rewards:
+        # No EIP-1559 on this chain
+        return [int(gasprice * factor) for factor in GASPRICE_FACTORS]
+    fees = []
+    for idx, margin in enumerate(BASE_FEE_MARGINS):
+        tip = median(read_quantity(block_rewards[idx]) for block_rewards in rewards)
+        fee = int(next_base_fee * margin) + tip
+        if fees:
+            fee = max(fee, fees[-1])
+        fees.append(fee)
+    return fees
+
+
+class FeeOracle:
+    """Gas prices of a chain, thread safe.
+    client_maker() provides a new EVMclient, as the refresh can run in its own thread.
+    """
+
+    def __init__(self, client_maker, ttl=DEFAULT_TTL):
+        self.client_maker = client_maker
+        self.ttl = ttl
+        self.lock = Lock()
+        self.fees = None
+        self.read_time = 0
+        self.refreshing = False
+        # Time the node told it has no fee history, None if it has
+        self.no_fee_history_time = None
+
+    def has_fee_history(self):
+        return (
+            self.no_fee_history_time is None
+            or monotonic() - self.no_fee_history_time > FEE_HISTORY_RECHECK
+        )
+
+    def read_fees(self):
+        client = self.client_maker()
+        if self.has_fee_history():
+            batch = client.batch()
+            batch.get_gasprice()
+            batch.add("eth_feeHistory", [hex(FEE_HISTORY_BLOCKS), "latest", FEE_PERCENTILES])
+            try:
+                gasprice, fee_history = batch.execute()
+                self.no_fee_history_time = None
+                return compute_fees(gasprice, fee_history)
+            except JSONRPCexception as exc:
+                logger.debug("No fee history, gas price only : %s", str(exc))
+                if is_unsupported_method(exc):
+                    # Checked again later, the chain or the endpoint may change
+                    self.no_fee_history_time = monotonic()
+        return compute_fees(client.get_gasprice())
+
+    def refresh(self):
+        """Read the fees now"""
+        fees = self.read_fees()
+        with self.lock:
+            self.fees = fees
+            self.read_time = monotonic()
+        return fees
+
+    def run_refresh(self):
+        try:
+            self.refresh()
+        except Exception as exc:
+            logger.debug("Fees refresh error : %s", str(exc))
+        finally:
+            self.refreshing = False
+
+    def refresh_background(self):
+        """Start a refresh thread, if none running"""
+        with self.lock:
+            if self.refreshing:
+                return
+            self.refreshing = True
+        Thread(target=self.run_refresh, daemon=True).start()
+
+    def get_fees(self):
+        """Gas prices [slow, normal, fast] in wei"""
+        with self.lock:
+            fees = self.fees
+            age = monotonic() - self.read_time
+        if fees is None or age > self.ttl:
+            return self.refresh()
+        if age > self.ttl * REFRESH_AHEAD:
+            self.refresh_background()
+        return fees
+
+    def get_gasprice(self, fee_priority):
+        """Gas price in wei for the priority 0, 1 or 2"""
+        if fee_priority not in (0, 1, 2):
+            raise Exception("fee_priority must be 0, 1 or 2 (slow, normal, fast)")
+        return self.get_fees()[fee_priority]
+
+
+fee_oracles = {}
+fee_oracles_lock = Lock()
+
+
+def get_fee_oracle(chain_id, client_maker):
+    """The FeeOracle shared for a chain"""
+    with fee_oracles_lock:
+        if chain_id not in fee_oracles:
+            fee_oracles[chain_id] = FeeOracle(client_maker)
+        return fee_oracles[chain_id]
@@ -0,0 +1,113 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM gas estimator
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Gas limits of the transactions from eth_estimateGas, with a safety margin.
+The estimations are cached per call shape : the contract called, the function
+selector and whether the recipient is a contract. So the same kind of
+transfer is estimated once, and not for each recipient.
+One estimator per chain, shared by all the wallets.
+"""
+
+
+from threading import Lock
+from time import monotonic
+
+
+# Seconds an estimation is used, the L2 estimations include the L1 data cost
+DEFAULT_TTL = 600
+# Margin on the estimation
+GAS_MARGIN = 1.25
+# A native transfer to an account, its gas is exact
+SIMPLE_TX_GAS = 21000
+# A contract call can write a new storage slot, as a token balance of a new holder
+STORAGE_GAS = 20000
+
+
+def gas_limit(estimate, is_call):
+    """Gas limit of a tx from its estimation"""
+    if estimate <= SIMPLE_TX_GAS:
+        return SIMPLE_TX_GAS
+    limit = int(estimate * GAS_MARGIN)
+    if is_call:
+        limit += STORAGE_GAS
+    return limit
+
+
+class GasEstimator:
+    """Gas estimations of a chain, cached per call shape"""
+
+    def __init__(self, ttl=DEFAULT_TTL):
+        self.ttl = ttl
+        # shape : (max gas estimated, time of the first estimation)
+        self.estimates = {}
+        # address : is a contract
+        self.recipients = {}
+        self.lock = Lock()
+
+    def is_contract(self, address):
+        """True/False when the address code was read, else None"""
+        with self.lock:
+            return self.recipients.get(address.lower())
+
+    def set_code(self, address, code):
+        """Record if an address is a contract from its eth_getCode"""
+        with self.lock:
+            self.recipients[address.lower()] = code not in (None, "", "0x")
+
+    @staticmethod
+    def shape(to_addr, data, recipient_is_contract):
+        """Key of the estimations of a call.
+        to_addr is in the key when the tx calls a contract, not for a native transfer.
+        """
+        if data or recipient_is_contract:
+            to_addr = to_addr.lower()
+        else:
+            to_addr = ""
+        return (to_addr, bytes(data[:4]).hex(), recipient_is_contract)
+
+    def get(self, shape):
+        """Gas estimated for a shape, None if not estimated or expired"""
+        with self.lock:
+            estimate = self.estimates.get(shape)
+            if estimate is None:
+                return None
+            if monotonic() - estimate[1] > self.ttl:
+                del self.estimates[shape]
+                return None
+            return estimate[0]
+
+    def update(self, shape, estimate):
+        """Record an estimation, the shape keeps the max estimated"""
+        with self.lock:
+            current = self.estimates.get(shape)
+            if current is None or monotonic() - current[1] > self.ttl:
+                self.estimates[shape] = (estimate, monotonic())
+            elif estimate > current[0]:
+                self.estimates[shape] = (estimate, current[1])
+
+
+gas_estimators = {}
+gas_estimators_lock = Lock()
+
+
+def get_gas_estimator(chain_id):
+    """The GasEstimator shared for a chain"""
+    with gas_estimators_lock:
+        if chain_id not in gas_estimators:
+            gas_estimators[chain_id] = GasEstimator()
+        return gas_estimators[chain_id]
@@ -0,0 +1,217 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  HTTP record and replay
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Record and replay the HTTP requests of the wallets, as a http_transport hook.
+A cassette file holds the requests with their response, one JSON line each, gzip
+compressed. It is recorded during a real use, then replayed offline : identical
+requests get their responses in the recorded order, then the last one again.
+The JSON-RPC ids are not matched, they are set back in the replayed responses.
+A request not recorded identically, as a tx with a new signature, gets the response
+of the same JSON-RPC methods, or of the same URL.
+The replay can add a latency : fixed, and a factor of the recorded durations.
+"""
+
+from base64 import b64decode, b64encode
+import gzip
+from json import dumps, loads
+from logging import getLogger
+from threading import Lock
+from time import monotonic, sleep
+
+from wallets.http_transport import HTTPError
+
+RECORD = "record"
+REPLAY = "replay"
+
+
+logger = getLogger(__name__)
+
+
+class CassetteMiss(IOError):
+    """No response recorded for a replayed request"""
+
+
+def compact_json(obj):
+    return dumps(obj, separators=(",", ":"), sort_keys=True)
+
+
+def json_rpc(data):
+    """The JSON-RPC request or batch in data, else None"""
+    try:
+        rpc_obj = loads(data)
+    except ValueError:
+        return None
+    requests = rpc_obj if isinstance(rpc_obj, list) else [rpc_obj]
+    if requests and all(isinstance(req, dict) and "jsonrpc" in req for req in requests):
+        return rpc_obj
+    return None
+
+
+def without_ids(rpc_obj):
+    if isinstance(rpc_obj, list):
+        return [without_ids(req) for req in rpc_obj]
+    return {field: value for field, value in rpc_obj.items() if field != "id"}
+
+
+def loose_key(method, url, data):
+    """Key of the requests with the same JSON-RPC methods, or the same URL"""
+    rpc_obj = json_rpc(data) if data else None
+    if rpc_obj is not None:
+        requests = rpc_obj if isinstance(rpc_obj, list) else [rpc_obj]
+        return f"{method} {url} {','.join(str(req.get('method')) for req in requests)}"
+    return f"{method} {url}"
+
+
+def request_key(method, url, data):
+    """Key matching a request, without its JSON-RPC ids as they change from run to run"""
+    if not data:
+        return f"{method} {url}"
+    rpc_obj = json_rpc(data)
+    if rpc_obj is not None:
+        return f"{method} {url} {compact_json(without_ids(rpc_obj))}"
+    return f"{method} {url} {data.decode('utf8', errors='replace')}"
+
+
+def map_ids(data, body, to_index):
+    """Replace the ids of a JSON-RPC response : to their request position when to_index,
+    else from the position to the ids of the request in data.
+    Other responses are returned as is.
+    """
+    rpc_obj = json_rpc(data) if data else None
+    if rpc_obj is None:
+        return body
+    try:
+        response = loads(body)
+    except ValueError:
+        return body
+    requests = rpc_obj if isinstance(rpc_obj, list) else [rpc_obj]
+    responses = response if isinstance(response, list) else [response]
+    ids = [req.get("id") for req in requests]
+    for resp in responses:
+        if not isinstance(resp, dict):
+            return body
+        if to_index:
+            resp["id"] = ids.index(resp.get("id")) if resp.get("id") in ids else None
+        elif isinstance(resp.get("id"), int) and resp["id"] < len(ids):
+            resp["id"] = ids[resp["id"]]
+    return dumps(response, separators=(",", ":")).encode("utf8")
+
+
+class Cassette:
+    """Recorder or player of the HTTP requests, thread safe.
+    latency : seconds added to each replayed response
+    latency_factor : part of the recorded duration added to each replayed response
+    overwrite : a recording replaces an existing file, else raises FileExistsError
+    """
+
+    def __init__(self, path, mode=REPLAY, latency=0, latency_factor=0, overwrite=False):
+        if mode not in (RECORD, REPLAY):
+            raise ValueError(f"Cassette mode must be {RECORD} or {REPLAY}")
+        self.path = path
+        self.mode = mode
+        self.latency = latency
+        self.latency_factor = latency_factor
+        self.lock = Lock()
+        # key or loose key : recorded responses list
+        self.interactions = {}
+        self.loose_interactions = {}
+        # key : index of the next response
+        self.played = {}
+        self.file = None
+        if mode == REPLAY:
+            self.load()
+        else:
+            # A new recording, not mixed with a previous session
+            self.file = gzip.open(path, "wt" if overwrite else "xt", encoding="utf8")
+
+    def load(self):
+        with gzip.open(self.path, "rt", encoding="utf8") as cassette_file:
+            try:
+                for line in cassette_file:
+                    record = loads(line)
+                    self.interactions.setdefault(record["key"], []).append(record)
+                    self.loose_interactions.setdefault(record["loose"], []).append(record)
+            except EOFError:
+                # Recording not closed : its last lines are flushed
+                logger.debug("Cassette %s was not closed", self.path)
+
+    def close(self):
+        with self.lock:
+            if self.file is not None:
+                self.file.close()
+                self.file = None
+
+    def request(self, method, url, data, send):
+        """Hook of http_transport.request"""
+        if self.mode == RECORD:
+            return self.record(method, url, data, send)
+        return self.replay(method, url, data)
+
+    def record(self, method, url, data, send):
+        error = None
+        start = monotonic()
+        try:
+            body = send()
+            status = 200
+        except HTTPError as exc:
+            error = exc
+            body = exc.body
+            status = exc.code
+        record = {
+            "key": request_key(method, url, data),
+            "loose": loose_key(method, url, data),
+            "status": status,
+            "ms": round(1000 * (monotonic() - start), 1),
+        }
+        stored_body = map_ids(data, body, True)
+        try:
+            record["body"] = stored_body.decode("utf8")
+        except UnicodeDecodeError:
+            record["body64"] = b64encode(stored_body).decode("ascii")
+        with self.lock:
+            if self.file is not None:
+                self.file.write(compact_json(record) + "\n")
+                # Readable even if not closed
+                self.file.flush()
+        if error is not None:
+            raise error
+        return body
+
+    def replay(self, method, url, data):
+        key = request_key(method, url, data)
+        with self.lock:
+            records = self.interactions.get(key)
+            if not records:
+                key = loose_key(method, url, data)
+                records = self.loose_interactions.get(key)
+            if not records:
+                raise CassetteMiss(f"No response recorded for {method} {url}")
+            played = self.played.get(key, 0)
+            self.played[key] = played + 1
+        record = records[min(played, len(records) - 1)]
+        delay = self.latency + self.latency_factor * record["ms"] / 1000
+        if delay > 0:
+            sleep(delay)
+        if "body" in record:
+            body = record["body"].encode("utf8")
+        else:
+            body = b64decode(record["body64"])
+        body = map_ids(data, body, False)
+        if record["status"] >= 400:
+            raise HTTPError(record["status"], body)
+        return body
@@ -0,0 +1,272 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  HTTP transport
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+HTTP requests of the chains API clients, on keep-alive connections.
+The connections are pooled per host and reused, so most requests don't
+open a new TCP and TLS session. Responses can be gzip compressed, failed
+requests are retried with a jittered exponential backoff.
+"""
+
+
+from functools import partial
+import gzip
+import http.client
+from logging import getLogger
+from random import random
+import ssl
+from threading import Lock
+from time import monotonic, sleep
+from urllib.parse import urljoin, urlsplit
+from urllib.request import getproxies, proxy_bypass
+
+
+DEFAULT_TIMEOUT = 20
+# Retries after the first attempt
+DEFAULT_RETRIES = 2
+# Seconds of the first retry delay, doubled at each retry, with a jitter
+RETRY_DELAY = 0.4
+# Idle connections kept per host
+POOL_SIZE = 4
+# Seconds an idle connection is kept, servers close them after about a minute
+IDLE_TIMEOUT = 45
+MAX_REDIRECTS = 4
+# Status retried for the idempotent requests
+RETRY_STATUS = [429, 500, 502, 503, 504]
+# Errors when a reused connection was closed by the server
+STALE_CONNECTION_ERRORS = (http.client.RemoteDisconnected, BrokenPipeError, ConnectionResetError)
+
+DEFAULT_USER_AGENT = "Uniblow/2"
+
+
+logger = getLogger(__name__)
+
+
+class HTTPError(IOError):
+    """Error status received, with the response body"""
+
+    def __init__(self, code, body):
+        self.code = code
+        self.body = body
+        super().__init__(f"{code}  :  {body.decode('utf8', errors='replace')}")
+
+
+class ConnectError(IOError):
+    """The host couldn't be reached, the request was not sent"""
+
+
+def retry_delay(attempt):
+    """Jittered exponential backoff, in seconds"""
+    return RETRY_DELAY * (2**attempt) * (0.5 + random())
+
+
+class ConnectionPool:
+    """Keep-alive connections to a host, thread-safe"""
+
+    def __init__(self, scheme, host, port, size=POOL_SIZE):
+        self.scheme = scheme
+        self.host = host
+        self.port = port
+        self.size = size
+        # (connection, idle since)
+        self.idle = []
+        self.lock = Lock()
+        self.ssl_context = ssl.create_default_context() if scheme == "https" else None
+        self.proxy = None
+        proxy_url = getproxies().get(scheme)
+        if proxy_url and not proxy_bypass(host):
+            self.proxy = urlsplit(proxy_url)
+
+    def new_connection(self, timeout):
+        if self.proxy is not None:
+            conn = self.connection_class()(
+                self.proxy.hostname, self.proxy.port, **self.connection_args(timeout)
+            )
+            conn.set_tunnel(self.host, self.port)
+            return conn
+        return self.connection_class()(self.host, self.port, **self.connection_args(timeout))
+
+    def connection_class(self):
+        if self.scheme == "https":
+            return http.client.HTTPSConnection
+        return http.client.HTTPConnection
+
+    def connection_args(self, timeout):
+        if self.scheme == "https":
+            return {"timeout": timeout, "context": self.ssl_context}
+        return {"timeout": timeout}
+
+    def get(self, timeout):
+        """An idle connection, or a new one. Returns (connection, is reused)"""
+        with self.lock:
+            while self.idle:
+                conn, idle_since = self.idle.pop()
+                if monotonic() - idle_since < IDLE_TIMEOUT:
+                    conn.timeout = timeout
+                    if conn.sock is not None:
+                        conn.sock.settimeout(timeout)
+                    return conn, True
+                conn.close()
+        return self.new_connection(timeout), False
+
+    def put(self, conn):
+        """Give back a connection after its response was fully read"""
+        with self.lock:
+            if len(self.idle) < self.size:
+                self.idle.append((conn, monotonic()))
+                return
+        conn.close()
+
+    def close(self):
+        with self.lock:
+            for conn, _ in self.idle:
+                conn.close()
+            self.idle = []
+
+
+pools = {}
+pools_lock = Lock()
+
+
+def get_pool(scheme, netloc):
+    """The connections pool of a host"""
+    with pools_lock:
+        if (scheme, netloc) not in pools:
+            parsed = urlsplit(f"{scheme}://{netloc}")
+            pools[(scheme, netloc)] = ConnectionPool(scheme, parsed.hostname, parsed.port)
+        return pools[(scheme, netloc)]
+
+
+def send(pool, method, path, data, headers, timeout):
+    """Send a request and read its response, on a pooled connection.
+    Returns (response, body), the connection goes back to the pool.
+    """
+    conn, reused = pool.get(timeout)
+    if conn.sock is None:
+        try:
+            conn.connect()
+        except OSError as exc:
+            conn.close()
+            raise ConnectError(str(exc)) from exc
+    try:
+        conn.request(method, path, body=data, headers=headers)
+        resp = conn.getresponse()
+        body = resp.read()
+    except (http.client.HTTPException, OSError) as exc:
+        conn.close()
+        if reused and isinstance(exc, STALE_CONNECTION_ERRORS):
+            # The server closed the idle connection, nothing was processed
+            logger.debug("Reused connection to %s failed : %s", pool.host, str(exc))
+            return send(pool, method, path, data, headers, timeout)
+        raise
+    if resp.will_close:
+        conn.close()
+    else:
+        pool.put(conn)
+    return resp, body
+
+
+# Receives all the requests when set, as a Cassette recording or replaying them
+transport_hook = None
+
+
+def set_transport_hook(hook):
+    """Route the requests to hook.request(method, url, data, send), None to remove it.
+    send() makes the request on the network, and returns as request.
+    """
+    global transport_hook
+    transport_hook = hook
+
+
+def request(
+    url,
+    data=None,
+    headers=None,
+    method=None,
+    timeout=DEFAULT_TIMEOUT,
+    retries=DEFAULT_RETRIES,
+):
+    """HTTP request on a keep-alive connection, returns the response body.
+    POST when data is provided. Only the GET requests are retried on an error status,
+    as a POST can have been processed.
+    Raises HTTPError on an error status, ConnectError when the host can't be reached,
+    IOError when the request failed after it was sent.
+    """
+    if method is None:
+        method = "POST" if data is not None else "GET"
+    req_headers = {"User-Agent": DEFAULT_USER_AGENT, "Accept-Encoding": "gzip"}
+    if headers:
+        req_headers.update(headers)
+    hook = transport_hook
+    if hook is not None:
+        return hook.request(
+            method,
+            url,
+            data,
+            partial(network_request, url, data, req_headers, method, timeout, retries),
+        )
+    return network_request(url, data, req_headers, method, timeout, retries)
+
+
+def network_request(url, data, req_headers, method, timeout, retries):
+    can_retry = method == "GET"
+    redirects = 0
+    attempt = 0
+    while True:
+        url_parts = urlsplit(url)
+        if url_parts.scheme not in ("http", "https"):
+            raise IOError(f"Invalid URL {url}")
+        path = url_parts.path or "/"
+        if url_parts.query:
+            path += f"?{url_parts.query}"
+        pool = get_pool(url_parts.scheme, url_parts.netloc)
+        try:
+            resp, body = send(pool, method, path, data, req_headers, timeout)
+        except (http.client.HTTPException, OSError) as exc:
+            if can_retry and attempt < retries:
+                sleep(retry_delay(attempt))
+                attempt += 1
+                continue
+            error_class = ConnectError if isinstance(exc, ConnectError) else IOError
+            raise error_class(f"Error while connecting to {url_parts.netloc} : {exc}") from exc
+        status = resp.status
+        if status in (301, 302, 303, 307, 308) and resp.getheader("Location"):
+            redirects += 1
+            if redirects > MAX_REDIRECTS:
+                raise IOError(f"Too many redirections from {url}")
+            url = urljoin(url, resp.getheader("Location"))
+            if status == 303:
+                method = "GET"
+                data = None
+            continue
+        if resp.getheader("Content-Encoding", "").lower() == "gzip":
+            body = gzip.decompress(body)
+        if status >= 400:
+            if can_retry and status in RETRY_STATUS and attempt < retries:
+                sleep(retry_delay(attempt))
+                attempt += 1
+                continue
+            raise HTTPError(status, body)
+        return body
+
+
+def close_all():
+    """Close the idle connections"""
+    with pools_lock:
+        for pool in pools.values():
+            pool.close()
+        pools.clear()
@@ -0,0 +1,234 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  IPFS gateways
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+IPFS content read through several public gateways. A read goes to the fastest
+gateway, and also to the next one when it is slow to answer or fails : the first
+good response is used. The gateways failing are set aside for a while.
+The content of a raw CID is read as its raw block and checked with the CID digest.
+Else, an HTML page is rejected unless an HTML file is read : the NFT content is
+JSON or images, and a gateway error or rate limit page can come with a 200 status.
+The IPFS content is immutable, it is kept on disk for good by its CID path, so it
+is read from the network only once.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from hashlib import sha256
+from logging import getLogger
+from queue import Empty, Queue
+from threading import Lock
+from time import monotonic
+
+from wallets.content_cache import RAW_CODEC, SHA2_256, ContentCache, decode_cid, user_cache_path
+from wallets.http_transport import HTTPError, request as http_request
+
+
+IPFS_GATEWAYS = [
+    "https://ipfs.io/ipfs/",
+    "https://dweb.link/ipfs/",
+    "https://gateway.pinata.cloud/ipfs/",
+    "https://w3s.link/ipfs/",
+]
+IPFS_DIR_NAME = "ipfs"
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/99.0.4844.84 Safari/537.36"
+
+# Seconds for a gateway to answer
+GATEWAY_TIMEOUT = 18
+# Seconds a failed gateway is set aside
+FAILURE_BACKOFF = 60
+# Weight of a new measure in the gateway average latency
+LATENCY_WEIGHT = 0.3
+# A read is hedged after this factor of the gateway latency, with a minimum delay
+HEDGE_LATENCY_FACTOR = 2
+HEDGE_MIN_DELAY = 1
+# Seconds before hedging a read on a gateway not measured yet
+HEDGE_DEFAULT_DELAY = 2.5
+# Gateways requested at the same time for a read
+MAX_HEDGED = 2
+
+
+logger = getLogger(__name__)
+
+ipfs_workers = ThreadPoolExecutor(8)
+
+
+def is_raw_cid(path):
+    """The path is a raw CID alone, its content is the block with the CID digest"""
+    if "/" in path or "?" in path:
+        return False
+    codec, hash_code, _ = decode_cid(path)
+    return codec == RAW_CODEC and hash_code == SHA2_256
+
+
+def gateway_path(path):
+    """Path requested to the gateways"""
+    if is_raw_cid(path):
+        return f"{path}?format=raw"
+    return path
+
+
+def is_html(data):
+    return data[:256].lstrip().lower().startswith((b"<!doctype html", b"<html"))
+
+
+def check_content(path, data):
+    """Raises IOError when the data read is not the content of the IPFS path"""
+    if is_raw_cid(path):
+        if sha256(data).digest() != decode_cid(path)[2]:
+            raise IOError("IPFS data not matching its CID")
+        return
+    if is_html(data) and not path.split("?", 1)[0].lower().endswith((".html", ".htm")):
+        raise IOError("HTML page instead of the IPFS content")
+
+
+class Gateway:
+    def __init__(self, url):
+        self.url = url
+        # Average seconds to read, None until measured
+        self.latency = None
+        self.failure_time = None
+
+    def is_down(self):
+        return self.failure_time is not None and monotonic() - self.failure_time < FAILURE_BACKOFF
+
+    def read(self, path):
+        return http_request(
+            f"{self.url}{gateway_path(path)}",
+            headers={"User-Agent": USER_AGENT},
+            timeout=GATEWAY_TIMEOUT,
+            retries=0,
+        )
+
+
+class GatewayPool:
+    """IPFS gateways, ranked by latency"""
+
+    def __init__(self, urls):
+        self.gateways = [Gateway(url) for url in urls]
+        self.lock = Lock()
+
+    def record_success(self, gateway, duration):
+        with self.lock:
+            gateway.failure_time = None
+            if gateway.latency is None:
+                gateway.latency = duration
+            else:
+                gateway.latency += LATENCY_WEIGHT * (duration - gateway.latency)
+
+    def record_failure(self, gateway):
+        with self.lock:
+            gateway.failure_time = monotonic()
+
+    def ranked(self):
+        """The gateways to use in order : up ones by latency, then the down ones"""
+        with self.lock:
+            up_gateways = [gateway for gateway in self.gateways if not gateway.is_down()]
+            down_gateways = [gateway for gateway in self.gateways if gateway.is_down()]
+        # Not measured yet after the measured ones, in the list order
+        up_gateways.sort(key=lambda gateway: (gateway.latency is None, gateway.latency or 0))
+        return up_gateways + down_gateways
+
+    @staticmethod
+    def hedge_delay(gateway):
+        """Seconds to wait for a gateway answer before asking the next one"""
+        if gateway.latency is None:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, HEDGE_LATENCY_FACTOR * gateway.latency)
+
+    def read_answer(self, gateway, path, answers):
+        """Read from a gateway and measure it, the answer goes in the queue"""
+        start = monotonic()
+        try:
+            data = gateway.read(path)
+        except HTTPError as exc:
+            # The gateway answered, it doesn't have or can't get the content
+            self.record_success(gateway, monotonic() - start)
+            answers.put((None, exc))
+            return
+        except Exception as exc:
+            logger.debug("IPFS gateway %s failed : %s", gateway.url, str(exc))
+            self.record_failure(gateway)
+            answers.put((None, exc))
+            return
+        duration = monotonic() - start
+        if not data:
+            self.record_success(gateway, duration)
+            answers.put((None, IOError(f"Empty response from {gateway.url}")))
+            return
+        try:
+            check_content(path, data)
+        except IOError as exc:
+            logger.debug("IPFS gateway %s bad content : %s", gateway.url, str(exc))
+            self.record_failure(gateway)
+            answers.put((None, exc))
+            return
+        self.record_success(gateway, duration)
+        answers.put((data, None))
+
+    def read(self, path):
+        """Read an IPFS CID path from the first gateway, and also from the next one when
+        it is slow or fails. Returns the first good response.
+        """
+        gateways = self.ranked()
+        answers = Queue()
+        sent = 0
+        running = 0
+        error = None
+
+        def launch():
+            nonlocal sent, running
+            ipfs_workers.submit(self.read_answer, gateways[sent], path, answers)
+            sent += 1
+            running += 1
+
+        launch()
+        while running:
+            can_hedge = sent < len(gateways) and running < MAX_HEDGED
+            try:
+                data, exc = answers.get(
+                    timeout=self.hedge_delay(gateways[sent - 1]) if can_hedge else None
+                )
+            except Empty:
+                logger.debug("Hedging the IPFS read to %s", gateways[sent].url)
+                launch()
+                continue
+            running -= 1
+            if exc is None:
+                return data
+            error = exc
+            if sent < len(gateways):
+                launch()
+        raise IOError(f"IPFS content not available : {error}")
+
+
+def read_ipfs(path):
+    """Data of an IPFS CID path, from the cache or the gateways"""
+    key = f"ipfs/{path}"
+    data = ipfs_cache.get(key)
+    if data is not None:
+        logger.debug("IPFS %s from the cache", path)
+        return data
+    logger.debug("Reading IPFS %s", path)
+    data = gateway_pool.read(path)
+    ipfs_cache.put(key, data)
+    return data
+
+
+# Shared by all the NFT reads
+gateway_pool = GatewayPool(IPFS_GATEWAYS)
+ipfs_cache = ContentCache(user_cache_path(IPFS_DIR_NAME))
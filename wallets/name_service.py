@@ -1,3 +1,7 @@
+from concurrent.futures import ThreadPoolExecutor
+from threading import Lock
+from time import monotonic
+
 from cryptolib.cryptography import sha2, sha3
 from cryptolib.coins.ethereum import read_string
 from pyweb3 import Web3Client
@@ -27,6 +31,65 @@ UD_TLDS = [
 ]
 ZIL_TLDS = ["zil"]
 
+# Seconds a resolution is kept, and a name not found
+RESOLVE_TTL = 300
+NEGATIVE_TTL = 60
+
+
+class ResolutionCache:
+    """Resolutions kept for a TTL, the names not found are kept a shorter time"""
+
+    def __init__(self, ttl=RESOLVE_TTL, negative_ttl=NEGATIVE_TTL):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        # key : (value, expiry time)
+        self.entries = {}
+        self.lock = Lock()
+
+    def lookup(self, key):
+        """Returns (True, value) when in the cache, else (False, None)"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return False, None
+            if monotonic() > entry[1]:
+                del self.entries[key]
+                return False, None
+            return True, entry[0]
+
+    def set(self, key, value):
+        ttl = self.ttl if value is not None else self.negative_ttl
+        with self.lock:
+            self.entries[key] = (value, monotonic() + ttl)
+
+
+# Shared by all the wallets
+resolutions = ResolutionCache()
+# ENS resolver contract of the nodes
+ens_resolvers = ResolutionCache()
+# The resolvers of a name are queried in parallel
+resolvers_pool = ThreadPoolExecutor(max_workers=6, thread_name_prefix="resolver")
+
+
+def race(*resolvers):
+    """Call the resolvers in parallel, they are given by priority.
+    Returns the answer of the first resolver having one, without waiting the
+    lower priority resolvers. Raises the first error when no resolver answered.
+    """
+    futures = [resolvers_pool.submit(resolver) for resolver in resolvers]
+    error = None
+    for future in futures:
+        try:
+            result = future.result()
+        except Exception as exc:
+            error = error or exc
+            continue
+        if result:
+            return result
+    if error is not None:
+        raise error
+    return None
+
 
 def name_hash(name, hash_alg=sha3):
     """EIP137 namehash computation, returns hex chain w/o 0x"""
@@ -98,14 +161,18 @@ def resolveENS(name):
     """Ethereum Domain Name Service on-chain resolution"""
     api = Web3Client("https://ethereum-rpc.publicnode.com", "Uniblow/2")
     nodeid = name_hash(name)
-    # Call the registry to get the resolver for this node id
-    # resolver(bytes32)
-    result = api.call(ENSResolver, "0178b8bf", nodeid)
-    if not check_res(result):
+    found, resolver = ens_resolvers.lookup(nodeid)
+    if not found:
+        # Call the registry to get the resolver for this node id
+        # resolver(bytes32)
+        result = api.call(ENSResolver, "0178b8bf", nodeid)
+        resolver = get_addr(result) if check_res(result) else None
+        ens_resolvers.set(nodeid, resolver)
+    if resolver is None:
         return None
     # Resolve at the ENS resolver
     # addr(bytes32)
-    result = api.call(get_addr(result), "3b3b57de", nodeid)
+    result = api.call(resolver, "3b3b57de", nodeid)
     if not check_res(result):
         return None
     return get_addr(result)
@@ -113,19 +180,40 @@ def resolveENS(name):
 
 def resolveUD(name, crypto):
     """UnstoppableDomains service EVM chain resolution"""
-    # Try on the Polygon blockchain
-    api = Web3Client("https://polygon-bor-rpc.publicnode.com", "Uniblow/2")
     name_id = name_hash(name)
-    res = get_domain(api, resolver_polygon, name_id, crypto)
-    if res:
-        return res
-    # Retry on the Ethereum blockchain
-    api = Web3Client("https://ethereum-rpc.publicnode.com", "Uniblow/2")
-    return get_domain(api, resolver_eth, name_id, crypto)
+    # On the Polygon blockchain first, else on the Ethereum blockchain
+    return race(
+        lambda: get_domain(
+            Web3Client("https://polygon-bor-rpc.publicnode.com", "Uniblow/2"),
+            resolver_polygon,
+            name_id,
+            crypto,
+        ),
+        lambda: get_domain(
+            Web3Client("https://ethereum-rpc.publicnode.com", "Uniblow/2"),
+            resolver_eth,
+            name_id,
+            crypto,
+        ),
+    )
 
 
 def resolveZIL(name, crypto):
     """UnstoppableDomains service ZIL chain resolution"""
+    # On the Zilliqa blockchain first, else on the Polygon blockchain
+    return race(
+        lambda: resolve_zilliqa(name, crypto),
+        lambda: get_domain(
+            Web3Client("https://polygon-bor-rpc.publicnode.com", "Uniblow/2"),
+            resolver_polygon,
+            name_hash(name),
+            crypto,
+        ),
+    )
+
+
+def resolve_zilliqa(name, crypto):
+    """UnstoppableDomains resolution on the Zilliqa blockchain"""
     api = Web3Client("https://api.zilliqa.com/", "Uniblow/2")
     name_id = f"0x{name_hash(name, sha2)}"
     # Call the registry to get the resolver for this node id
@@ -146,17 +234,27 @@ def resolveZIL(name, crypto):
                     res = res.get(f"crypto.{crypto}.address")
                     if res:
                         return res
-    # Try on the Polygon blockchain
-    api = Web3Client("https://polygon-bor-rpc.publicnode.com", "Uniblow/2")
-    name_id = name_hash(name)
-    return get_domain(api, resolver_polygon, name_id, crypto)
+    return None
 
 
 def resolve(domain, crypto, is_token=False, chain="XXX"):
-    """Generic name resolution for the wallets."""
+    """Generic name resolution for the wallets, cached."""
     dom_split = domain.split(".")
     if not dom_split or len(dom_split) < 2:
         return None
+    if dom_split[-1] not in ENS_TLDS + UD_TLDS + ZIL_TLDS:
+        return None
+    key = (domain, crypto, is_token, chain)
+    found, resolved = resolutions.lookup(key)
+    if not found:
+        resolved = resolve_name(domain, crypto, is_token, chain)
+        resolutions.set(key, resolved)
+    return resolved
+
+
+def resolve_name(domain, crypto, is_token=False, chain="XXX"):
+    """Name resolution with the service of its TLD"""
+    dom_split = domain.split(".")
     tld = dom_split[-1]
     if crypto == "ETH" and tld in ENS_TLDS:
         return resolveENS(domain)
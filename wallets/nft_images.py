@@ -0,0 +1,173 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  NFT images pipeline
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Images of the NFT gallery. A bounded pool of workers reads the tokenURI of the
+NFT by batches, aggregated in a few eth_call. Behind each batch, the workers read
+the metadata then the image of each NFT, make its thumbnail, and give the
+thumbnails as they arrive.
+The thumbnails and the images read over HTTP are kept in a disk cache, bounded in
+size. The IPFS images are kept by get_data in the IPFS cache. So a collection
+opens again without reading the network.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+
+from wallets import ipfs_gateways
+from wallets.content_cache import ContentCache, cache_key, ipfs_path, user_cache_path
+from wallets.NFTwallet import get_data, read_metadata
+
+
+IMAGES_DIR_NAME = "nft_images"
+# Disk cache size, the least recently used images are removed above
+MAX_CACHE_SIZE = 256 * 1024 * 1024
+DEFAULT_WORKERS = 8
+# NFT per aggregated tokenURI read
+URI_BATCH_SIZE = 100
+
+
+logger = getLogger(__name__)
+
+
+def clear_caches():
+    """Remove the NFT images, the thumbnails and the IPFS content kept on disk"""
+    image_cache.clear()
+    ipfs_gateways.ipfs_cache.clear()
+
+
+def thumbnail_key(url, size):
+    return f"thumbnail/{size}/{cache_key(url)}"
+
+
+def read_image(url, cache):
+    """Image data of an URL, from the cache or read and cached. None when empty."""
+    if url.startswith("data:") or ipfs_path(url) is not None:
+        # Inline image, or kept in the IPFS cache
+        data = get_data(url).read()
+        return data if data else None
+    key = cache_key(url)
+    data = cache.get(key)
+    if data is not None:
+        logger.debug("NFT image %s from the cache", url)
+        return data
+    data = get_data(url).read()
+    if not data:
+        return None
+    cache.put(key, data)
+    return data
+
+
+def read_thumbnail(url, cache, make_thumbnail, size):
+    """Thumbnail of the image of an URL, from the cache or made and cached.
+    None when the image can't be decoded.
+    """
+    key = thumbnail_key(url, size)
+    thumbnail = cache.get(key)
+    if thumbnail is not None:
+        return thumbnail
+    image_data = read_image(url, cache)
+    if image_data is None:
+        return None
+    thumbnail = make_thumbnail(image_data, size)
+    if thumbnail is not None:
+        cache.put(key, thumbnail)
+    return thumbnail
+
+
+class NFTImagesLoader:
+    """Read the thumbnails of a NFT list with a pool of workers.
+
+    make_thumbnail(image_data, size) decodes an image and returns its thumbnail
+    fitting in size x size, as PNG data, or None when the image can't be decoded.
+    It runs in the workers, so only the small thumbnails reach the GUI.
+    on_image(nft_info) is called from a worker thread for each NFT, in the order
+    they are read. nft_info has the id, the image url, and the thumbnail PNG data,
+    or None when the image can't be read.
+    """
+
+    def __init__(
+        self,
+        nft_wallet,
+        on_image,
+        make_thumbnail,
+        thumbnail_size,
+        cache=None,
+        max_workers=DEFAULT_WORKERS,
+    ):
+        self.nft_wallet = nft_wallet
+        self.on_image = on_image
+        self.make_thumbnail = make_thumbnail
+        self.thumbnail_size = thumbnail_size
+        self.cache = image_cache if cache is None else cache
+        self.workers = ThreadPoolExecutor(max_workers=max_workers)
+        self.stopped = False
+
+    def load(self, id_list):
+        id_list = list(id_list)
+        for batch_start in range(0, len(id_list), URI_BATCH_SIZE):
+            self.workers.submit(
+                self.load_batch, id_list[batch_start : batch_start + URI_BATCH_SIZE]
+            )
+
+    def stop(self):
+        """Drop the NFT not read yet, as when the gallery is closed"""
+        self.stopped = True
+        self.workers.shutdown(wait=False, cancel_futures=True)
+
+    def load_batch(self, ids):
+        """Read the tokenURI of the ids, then queue the NFT reads"""
+        if self.stopped:
+            return
+        try:
+            uris = self.nft_wallet.get_tokens_uri(ids)
+        except Exception as exc:
+            # As without Multicall3 on the chain : one tokenURI call per NFT
+            logger.debug("Aggregated tokenURI read failed : %s", str(exc))
+            uris = [None] * len(ids)
+        for nft_id, uri in zip(ids, uris):
+            try:
+                self.workers.submit(self.load_nft, nft_id, uri)
+            except RuntimeError:
+                # Stopped
+                return
+
+    def load_nft(self, nft_id, metadata_url=None):
+        """Read the NFT metadata, from its tokenURI when known, then its thumbnail"""
+        if self.stopped:
+            return
+        nft_info = {"id": nft_id, "url": None, "thumbnail": None}
+        try:
+            if metadata_url is None:
+                metadata = self.nft_wallet.get_metadata(nft_id)
+            else:
+                metadata = read_metadata(metadata_url)
+            if metadata is not None:
+                nft_info["url"] = metadata.get("image")
+            if nft_info["url"]:
+                nft_info["thumbnail"] = read_thumbnail(
+                    nft_info["url"], self.cache, self.make_thumbnail, self.thumbnail_size
+                )
+        except Exception as exc:
+            logger.debug("Can't read the NFT #%s image : %s", nft_id, str(exc))
+        if not self.stopped:
+            self.on_image(nft_info)
+
+
+# Shared by all the galleries
+image_cache = ContentCache(user_cache_path(IMAGES_DIR_NAME), MAX_CACHE_SIZE)
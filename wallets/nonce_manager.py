@@ -0,0 +1,160 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM nonces manager
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Nonces of an address reserved locally, so several transactions can be sent in
+a row without waiting for the nodes pending state. The chain pending count is
+read once, then only to reconcile in the background.
+"""
+
+
+from logging import getLogger
+from threading import Lock, Thread
+from time import monotonic
+
+
+# Seconds between two reconciliations with the chain
+DEFAULT_RECONCILE_PERIOD = 30
+# Seconds after which sent transactions not seen on chain are considered dropped
+DEFAULT_STALE_DELAY = 600
+
+
+logger = getLogger(__name__)
+
+
+class NonceManager:
+    """Reserve the nonces of an address, thread safe.
+    read_chain_nonce() reads the pending transactions count from the chain,
+    it is also called from the reconciliation thread.
+    """
+
+    def __init__(
+        self,
+        read_chain_nonce,
+        reconcile_period=DEFAULT_RECONCILE_PERIOD,
+        stale_delay=DEFAULT_STALE_DELAY,
+    ):
+        self.read_chain_nonce = read_chain_nonce
+        self.reconcile_period = reconcile_period
+        self.stale_delay = stale_delay
+        self.lock = Lock()
+        self.next_nonce = None
+        # Given back after a failure, reserved again first
+        self.released = set()
+        self.reserved = set()
+        # Broadcast, not yet seen on chain {nonce: time}
+        self.sent = {}
+        self.last_reconcile = 0
+        self.reconciling = False
+
+    def needs_chain_nonce(self):
+        """True until the chain nonce is known"""
+        with self.lock:
+            return self.next_nonce is None
+
+    def update(self, chain_nonce):
+        """Apply a chain nonce reading, lock must be held"""
+        if self.next_nonce is None:
+            self.next_nonce = chain_nonce
+            return
+        self.released = {nonce for nonce in self.released if nonce >= chain_nonce}
+        self.sent = {nonce: stime for nonce, stime in self.sent.items() if nonce >= chain_nonce}
+        if chain_nonce > self.next_nonce:
+            # Transactions sent from elsewhere
+            self.next_nonce = chain_nonce
+        elif (
+            self.sent
+            and not self.reserved
+            and monotonic() - min(self.sent.values()) > self.stale_delay
+        ):
+            # Sent transactions never reached the chain
+            logger.debug("Dropped transactions, nonce back to %i", chain_nonce)
+            self.next_nonce = chain_nonce
+            self.released.clear()
+            self.sent.clear()
+
+    def reserve(self, chain_nonce=None):
+        """Get a nonce for a new transaction.
+        chain_nonce : optional pending count just read, else read when required.
+        """
+        with self.lock:
+            if chain_nonce is None and self.next_nonce is None:
+                chain_nonce = self.read_chain_nonce()
+            if chain_nonce is not None:
+                self.update(chain_nonce)
+                self.last_reconcile = monotonic()
+            if self.released:
+                nonce = min(self.released)
+                self.released.remove(nonce)
+            else:
+                nonce = self.next_nonce
+                self.next_nonce += 1
+            self.reserved.add(nonce)
+        self.reconcile_background()
+        return nonce
+
+    def release(self, nonce):
+        """The transaction with this nonce was not sent"""
+        with self.lock:
+            self.reserved.discard(nonce)
+            self.released.add(nonce)
+            # Give back the highest nonces
+            while self.next_nonce - 1 in self.released:
+                self.next_nonce -= 1
+                self.released.remove(self.next_nonce)
+
+    def mark_sent(self, nonce):
+        """The transaction with this nonce was broadcast"""
+        with self.lock:
+            self.reserved.discard(nonce)
+            self.sent[nonce] = monotonic()
+
+    def reconcile(self):
+        """Read the chain nonce and apply it"""
+        chain_nonce = self.read_chain_nonce()
+        with self.lock:
+            self.update(chain_nonce)
+            self.last_reconcile = monotonic()
+
+    def run_reconcile(self):
+        try:
+            self.reconcile()
+        except Exception as exc:
+            logger.debug("Nonce reconciliation error : %s", str(exc))
+        finally:
+            self.reconciling = False
+
+    def reconcile_background(self):
+        """Start a reconciliation thread, when the last one is old enough"""
+        with self.lock:
+            if self.reconciling or monotonic() - self.last_reconcile < self.reconcile_period:
+                return
+            self.reconciling = True
+        Thread(target=self.run_reconcile, daemon=True).start()
+
+
+nonce_managers = {}
+nonce_managers_lock = Lock()
+
+
+def get_nonce_manager(chain_id, address, read_chain_nonce):
+    """The NonceManager shared for an address on a chain"""
+    key = (chain_id, address.lower())
+    with nonce_managers_lock:
+        if key not in nonce_managers:
+            nonce_managers[key] = NonceManager(read_chain_nonce)
+        return nonce_managers[key]
@@ -0,0 +1,85 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Wallets registry
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Coins supported, a coin wallet module wallets.COINwallet is imported only when
+its class is required, so at the first selection of the coin.
+"""
+
+
+from importlib import import_module
+
+
+SUPPORTED_COINS = [
+    "BTC",
+    "ETH",
+    "BSC",
+    "MATIC",
+    "TRX",
+    "FTM",
+    "OP",
+    "BASE",
+    "METIS",
+    "CELO",
+    "GLMR",
+    "ARB",
+    "AVAX",
+    "LTC",
+    "DOGE",
+    "EOS",
+    "XTZ",
+    "SOL",
+]
+
+LEDGER_EVM_LIST = [
+    "ETH",
+    "BSC",
+    "MATIC",
+    "FTM",
+    "OP",
+    "BASE",
+    "METIS",
+    "CELO",
+    "GLMR",
+    "ARB",
+    "AVAX",
+]
+
+NFT_LIST = [
+    "ETH",
+    "MATIC",
+    "BSC",
+    "OP",
+    "BASE",
+    "ARB",
+    "AVAX",
+]
+
+# Coin displayed by the wallet : coin of its module
+COINS_ALIASES = {
+    "ARB/ETH": "ARB",
+    "OP/ETH": "OP",
+    "BASE/ETH": "BASE",
+}
+
+
+def get_coin_class(coin_name):
+    """Wallet class of a coin, its module is imported at the first call"""
+    cname = COINS_ALIASES.get(coin_name, coin_name)
+    if cname not in SUPPORTED_COINS:
+        raise ValueError(f"Unknown coin {coin_name}")
+    return getattr(import_module(f"wallets.{cname}wallet"), f"{cname}_wallet")
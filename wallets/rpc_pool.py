@@ -0,0 +1,393 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM RPC endpoints pool
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Several JSON-RPC endpoints per EVM chain, with failover.
+The endpoints are probed in the background with eth_blockNumber and ranked by
+latency. A request goes to the fastest healthy endpoint, then to the next ones
+if it fails. A tx goes to the next endpoint only when it could not be sent,
+as a node may have received it. The read requests are hedged : when the endpoint is slow to answer,
+the request is also sent to the next endpoint, and the first answer is used.
+The endpoints whose head block lags behind the others are set aside, so they
+don't serve old balances and nonces.
+One pool per chain, shared by all the wallets.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from itertools import count
+from json import loads
+from logging import getLogger
+from queue import Empty, Queue
+from threading import Lock, Thread
+from time import monotonic
+
+from pyweb3.json_rpc import JSONRPCexception, json_encode
+
+from wallets.evm_rpc import EVMclient, batch_results, read_quantity, rpc_result
+from wallets.http_transport import ConnectError, HTTPError, request as http_request
+
+
+# Seconds between the endpoints probes
+PROBE_INTERVAL = 30
+# Seconds to answer a probe
+PROBE_TIMEOUT = 6
+# Seconds to answer a request
+REQUEST_TIMEOUT = 20
+# Seconds a failed endpoint is set aside
+FAILURE_BACKOFF = 30
+# Blocks an endpoint head can be behind the highest head
+MAX_HEAD_LAG = 3
+# Weight of a new measure in the endpoint average latency
+LATENCY_WEIGHT = 0.3
+# A read is hedged after this factor of the endpoint latency, with a minimum delay
+HEDGE_LATENCY_FACTOR = 3
+HEDGE_MIN_DELAY = 0.5
+# Seconds before hedging a read on an endpoint not measured yet
+HEDGE_DEFAULT_DELAY = 2
+# Endpoints requested at the same time for a read
+MAX_HEDGED = 2
+# Requests changing the chain state, sent to one endpoint at a time
+WRITE_METHODS = ["eth_sendRawTransaction"]
+
+# Public endpoints used after the wallet default one, per chain ID
+FALLBACK_ENDPOINTS = {
+    1: ["https://eth.drpc.org", "https://eth.llamarpc.com"],
+    10: ["https://mainnet.optimism.io", "https://optimism.drpc.org"],
+    56: ["https://bsc-dataseed.bnbchain.org", "https://bsc.drpc.org"],
+    97: ["https://data-seed-prebsc-1-s1.bnbchain.org:8545"],
+    137: ["https://polygon-rpc.com", "https://polygon.drpc.org"],
+    250: ["https://rpcapi.fantom.network"],
+    1088: ["https://metis-rpc.publicnode.com"],
+    1284: ["https://rpc.api.moonbeam.network"],
+    1285: ["https://rpc.api.moonriver.moonbeam.network"],
+    4002: ["https://rpc.testnet.fantom.network"],
+    8453: ["https://mainnet.base.org", "https://base.drpc.org"],
+    42161: ["https://arb1.arbitrum.io/rpc", "https://arbitrum.drpc.org"],
+    42220: ["https://forno.celo.org"],
+    43113: ["https://api.avax-test.network/ext/bc/C/rpc"],
+    43114: ["https://api.avax.network/ext/bc/C/rpc"],
+    80002: ["https://rpc-amoy.polygon.technology"],
+    84532: ["https://sepolia.base.org"],
+    11155111: ["https://sepolia.drpc.org"],
+    11155420: ["https://sepolia.optimism.io"],
+}
+
+
+logger = getLogger(__name__)
+
+
+rpc_workers = ThreadPoolExecutor(8, thread_name_prefix="rpc")
+
+
+class BroadcastUnknown(IOError):
+    """A write request was sent, but the node answer was lost :
+    the node may have processed it.
+    """
+
+
+class RPCEndpoint:
+    """A JSON-RPC node, with its measured latency and head block"""
+
+    def __init__(self, url):
+        self.url = url
+        # Average seconds to answer, None until measured
+        self.latency = None
+        self.head = None
+        self.failure_time = None
+        self.req_ids = count(1)
+
+    def is_down(self, now):
+        return self.failure_time is not None and now - self.failure_time < FAILURE_BACKOFF
+
+    def post(self, payload, timeout):
+        return loads(
+            http_request(
+                self.url,
+                json_encode(payload).encode("utf8"),
+                {"Content-Type": "application/json"},
+                timeout=timeout,
+                retries=0,
+            )
+        )
+
+    def send(self, calls, timeout=None):
+        """Send a list of (method, params), in a batch when several.
+        Returns the list of results, raises JSONRPCexception when a request has an error.
+        """
+        if timeout is None:
+            timeout = REQUEST_TIMEOUT
+        requests = [
+            {"jsonrpc": "2.0", "id": next(self.req_ids), "method": method, "params": params}
+            for method, params in calls
+        ]
+        if len(requests) == 1:
+            return [rpc_result(self.post(requests[0], timeout))]
+        responses = self.post(requests, timeout)
+        if not isinstance(responses, list):
+            # Node without batch support : one request at a time
+            logger.debug("RPC batch not supported by %s", self.url)
+            return [rpc_result(self.post(request, timeout)) for request in requests]
+        return batch_results(requests, responses)
+
+
+class EndpointPool:
+    """The RPC endpoints of a chain, thread safe"""
+
+    def __init__(self, urls, probe_interval=PROBE_INTERVAL):
+        self.endpoints = [RPCEndpoint(url) for url in dict.fromkeys(urls)]
+        self.probe_interval = probe_interval
+        self.lock = Lock()
+        self.probe_time = None
+        self.probing = False
+
+    def set_urls(self, urls):
+        """Use these endpoints, in the preference order. The measures of the kept ones remain."""
+        with self.lock:
+            current = {endpoint.url: endpoint for endpoint in self.endpoints}
+            self.endpoints = [current.get(url) or RPCEndpoint(url) for url in dict.fromkeys(urls)]
+            self.probe_time = None
+
+    def record_success(self, endpoint, duration):
+        with self.lock:
+            endpoint.failure_time = None
+            if endpoint.latency is None:
+                endpoint.latency = duration
+            else:
+                endpoint.latency += LATENCY_WEIGHT * (duration - endpoint.latency)
+
+    def record_failure(self, endpoint):
+        with self.lock:
+            endpoint.failure_time = monotonic()
+
+    def probe_endpoint(self, endpoint):
+        start = monotonic()
+        try:
+            head = read_quantity(endpoint.send([("eth_blockNumber", [])], PROBE_TIMEOUT)[0])
+        except Exception as exc:
+            logger.debug("RPC endpoint %s probe failed : %s", endpoint.url, str(exc))
+            self.record_failure(endpoint)
+            return
+        self.record_success(endpoint, monotonic() - start)
+        with self.lock:
+            endpoint.head = head
+
+    def probe(self):
+        """Measure the latency and the head block of the endpoints now"""
+        with self.lock:
+            endpoints = list(self.endpoints)
+        list(rpc_workers.map(self.probe_endpoint, endpoints))
+        with self.lock:
+            self.probe_time = monotonic()
+
+    def run_probe(self):
+        try:
+            self.probe()
+        finally:
+            self.probing = False
+
+    def probe_background(self):
+        """Start a probe thread, if none running"""
+        with self.lock:
+            if self.probing:
+                return
+            self.probing = True
+        Thread(target=self.run_probe, daemon=True).start()
+
+    def ranked(self):
+        """The endpoints in the order to use them : the healthy ones by latency,
+        then the failed and the lagging ones, as a last resort.
+        """
+        with self.lock:
+            now = monotonic()
+            probe_due = self.probe_time is None or now - self.probe_time > self.probe_interval
+            top_head = max(
+                (ep.head for ep in self.endpoints if ep.head is not None and not ep.is_down(now)),
+                default=None,
+            )
+            healthy = []
+            others = []
+            for endpoint in self.endpoints:
+                lagging = top_head is not None and (
+                    endpoint.head is None or endpoint.head < top_head - MAX_HEAD_LAG
+                )
+                if endpoint.is_down(now) or lagging:
+                    others.append(endpoint)
+                else:
+                    healthy.append(endpoint)
+            # Not measured yet : after the measured ones, in the configuration order
+            healthy.sort(key=lambda ep: ep.latency if ep.latency is not None else float("inf"))
+        if probe_due:
+            self.probe_background()
+        return healthy + others
+
+    @staticmethod
+    def hedge_delay(endpoint):
+        """Seconds to wait for an endpoint answer before asking the next one"""
+        if endpoint.latency is None:
+            return HEDGE_DEFAULT_DELAY
+        return max(HEDGE_MIN_DELAY, HEDGE_LATENCY_FACTOR * endpoint.latency)
+
+    def send(self, endpoint, calls):
+        """Send to an endpoint and measure it"""
+        start = monotonic()
+        try:
+            results = endpoint.send(calls)
+        except JSONRPCexception:
+            # The node answered
+            self.record_success(endpoint, monotonic() - start)
+            raise
+        except Exception as exc:
+            logger.debug("RPC endpoint %s failed : %s", endpoint.url, str(exc))
+            self.record_failure(endpoint)
+            raise
+        self.record_success(endpoint, monotonic() - start)
+        return results
+
+    def send_answer(self, endpoint, calls, answers):
+        try:
+            answers.put((self.send(endpoint, calls), None))
+        except Exception as exc:
+            answers.put((None, exc))
+
+    def request_failover(self, calls):
+        """Send to the endpoints one after the other, until one can be reached.
+        Once a node received the request, it is not sent to another one : a timeout or
+        an error status then raises BroadcastUnknown.
+        """
+        error = None
+        for endpoint in self.ranked():
+            try:
+                return self.send(endpoint, calls)
+            except JSONRPCexception:
+                raise
+            except ConnectError as exc:
+                error = exc
+            except HTTPError as exc:
+                if exc.code >= 500:
+                    raise BroadcastUnknown(
+                        f"Broadcast status unknown, error from the node : {exc}"
+                    ) from exc
+                # Refused by the node, as a rate limit
+                error = exc
+            except Exception as exc:
+                raise BroadcastUnknown(
+                    f"Broadcast status unknown, no answer from the node : {exc}"
+                ) from exc
+        raise ConnectError(f"No RPC endpoint available : {error}")
+
+    def request_hedged(self, calls):
+        """Send to the first endpoint, and also to the next one when it is slow or fails.
+        Returns the first answer.
+        """
+        endpoints = self.ranked()
+        answers = Queue()
+        sent = 0
+        running = 0
+        error = None
+
+        def launch():
+            nonlocal sent, running
+            rpc_workers.submit(self.send_answer, endpoints[sent], calls, answers)
+            sent += 1
+            running += 1
+
+        launch()
+        while running:
+            can_hedge = sent < len(endpoints) and running < MAX_HEDGED
+            try:
+                results, exc = answers.get(
+                    timeout=self.hedge_delay(endpoints[sent - 1]) if can_hedge else None
+                )
+            except Empty:
+                logger.debug("Hedging the RPC request to %s", endpoints[sent].url)
+                launch()
+                continue
+            running -= 1
+            if exc is None:
+                return results
+            if isinstance(exc, JSONRPCexception):
+                raise exc
+            error = exc
+            if sent < len(endpoints):
+                launch()
+        raise IOError(f"No RPC endpoint available : {error}")
+
+    def request_batch(self, calls):
+        """Send a list of (method, params), returns the list of results.
+        The writes are not hedged, so a tx is sent to one node at a time.
+        """
+        if any(method in WRITE_METHODS for method, _ in calls):
+            return self.request_failover(calls)
+        return self.request_hedged(calls)
+
+
+class PoolJSONRPC:
+    """The jsonrpc of a Web3Client, sending to an EndpointPool"""
+
+    def __init__(self, pool):
+        self.pool = pool
+
+    def request(self, method_name, params=None):
+        if params is None:
+            params = []
+        return self.pool.request_batch([(method_name, params)])[0]
+
+
+class PooledEVMclient(EVMclient):
+    """EVMclient sending its requests to the endpoints of a pool, thread safe"""
+
+    def __init__(self, pool):
+        # Web3Client.__init__ is not called : it opens a pyweb3 connection to one URL,
+        # whereas the requests go to the pool endpoints, through PoolJSONRPC.
+        self.pool = pool
+        self.jsonrpc = PoolJSONRPC(pool)
+
+    def request_batch(self, calls):
+        if len(calls) == 0:
+            return []
+        return self.pool.request_batch(calls)
+
+
+# Endpoints set for a chain, instead of the wallet default and the fallbacks
+chain_endpoints = {}
+endpoint_pools = {}
+endpoint_pools_lock = Lock()
+
+
+def chain_urls(chain_id, default_url):
+    if chain_id in chain_endpoints:
+        return chain_endpoints[chain_id]
+    return [default_url] + FALLBACK_ENDPOINTS.get(chain_id, [])
+
+
+def set_chain_endpoints(chain_id, urls):
+    """Use these RPC endpoints for a chain, in the preference order"""
+    if not urls:
+        raise ValueError("At least one RPC endpoint is required")
+    with endpoint_pools_lock:
+        chain_endpoints[chain_id] = list(urls)
+        if chain_id in endpoint_pools:
+            endpoint_pools[chain_id].set_urls(urls)
+
+
+def get_endpoint_pool(chain_id, default_url):
+    """The EndpointPool shared for a chain"""
+    with endpoint_pools_lock:
+        if chain_id not in endpoint_pools:
+            endpoint_pools[chain_id] = EndpointPool(chain_urls(chain_id, default_url))
+        return endpoint_pools[chain_id]
@@ -0,0 +1,122 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Tokens metadata cache
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Tokens decimals and symbol, keyed by (chain ID, contract).
+Recent tokens are in a LRU in memory, all the tokens read are in a file in the
+user data directory. So a token metadata is read from the chain only once.
+"""
+
+
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+
+from devices.file_path import WalletFile
+from wallets.token_scanner import preset_symbol
+
+
+METADATA_FILE_NAME = "tokens_metadata.json"
+DEFAULT_LRU_SIZE = 256
+
+
+logger = getLogger(__name__)
+
+
+def metadata_key(chain_id, contract):
+    # EVM hex addresses are case insensitive, not the Tron base58 addresses
+    if contract.startswith("0x"):
+        contract = contract.lower()
+    return f"{chain_id}:{contract}"
+
+
+class TokenMetadataCache:
+    """Tokens metadata {"decimals": int, "symbol": str}, in memory and on disk.
+    data_file has read_data and save_data, as WalletFile.
+    """
+
+    def __init__(self, data_file=None, lru_size=DEFAULT_LRU_SIZE):
+        if data_file is None:
+            data_file = WalletFile(METADATA_FILE_NAME)
+        self.data_file = data_file
+        self.lru_size = lru_size
+        self.lru = OrderedDict()
+        self.preset_symbols = {}
+        self.seeded_chains = set()
+        self.lock = Lock()
+
+    def read_file(self):
+        try:
+            return self.data_file.read_data()
+        except FileNotFoundError:
+            return {}
+        except Exception as exc:
+            logger.warning("Can't read the tokens metadata file : %s", str(exc))
+            return {}
+
+    def remember(self, key, metadata):
+        self.lru[key] = metadata
+        self.lru.move_to_end(key)
+        while len(self.lru) > self.lru_size:
+            self.lru.popitem(last=False)
+
+    def get(self, chain_id, contract):
+        """Token metadata dict, or None when never stored"""
+        key = metadata_key(chain_id, contract)
+        with self.lock:
+            metadata = self.lru.get(key)
+            if metadata is not None:
+                self.lru.move_to_end(key)
+                return metadata
+            metadata = self.read_file().get(key)
+            if metadata is not None:
+                self.remember(key, metadata)
+            return metadata
+
+    def set(self, chain_id, contract, decimals, symbol):
+        """Store the token metadata, in memory and in the file"""
+        key = metadata_key(chain_id, contract)
+        metadata = {"decimals": decimals, "symbol": symbol}
+        with self.lock:
+            self.remember(key, metadata)
+            stored = self.read_file()
+            if stored.get(key) == metadata:
+                return
+            stored[key] = metadata
+            try:
+                self.data_file.save_data(stored)
+            except Exception as exc:
+                logger.warning("Can't save the tokens metadata file : %s", str(exc))
+
+    def seed_presets(self, chain_id, tokens):
+        """Symbols of the preset tokens {"Name (SYMBOL)": contract}, kept in memory only"""
+        with self.lock:
+            if chain_id in self.seeded_chains:
+                return
+            for token_name, contract in tokens.items():
+                symbol = preset_symbol(token_name)
+                if symbol != "---":
+                    self.preset_symbols[metadata_key(chain_id, contract)] = symbol
+            self.seeded_chains.add(chain_id)
+
+    def get_preset_symbol(self, chain_id, contract):
+        """Symbol from the presets, or None"""
+        return self.preset_symbols.get(metadata_key(chain_id, contract))
+
+
+# Shared by all the wallets
+token_metadata = TokenMetadataCache()
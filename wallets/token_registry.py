@@ -0,0 +1,243 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  Tokens registry files
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Tokens lists of a chain : the presets displayed, and the Ledger trusted tokens.
+Stored in wallets/tokens/CHAIN.dat, memory mapped at the first use.
+The files are built from the lists sources wallets/tokens_lists/CHAIN.json with
+  python -m wallets.token_registry build [CHAIN ...]
+
+File format, integers big endian :
+ header      : "UBTR", version u8, presets size u32, Ledger tokens count u32, ticker width u8
+ presets     : JSON {"info": [str], "tokens": [{name: addr}], "nfts": [{name: addr}]}
+               with one dict per network
+ records     : Ledger tokens, fixed width, sorted by address :
+               address 20 bytes, ticker size u8, ticker padded to the ticker width,
+               signature size u8, DER signature padded to 72 bytes
+"""
+
+
+import argparse
+import json
+import mmap
+import os.path
+from bisect import bisect_left
+from struct import Struct
+from threading import Lock
+
+
+REGISTRY_MAGIC = b"UBTR"
+REGISTRY_VERSION = 2
+REGISTRY_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "tokens")
+SOURCES_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "tokens_lists")
+
+HEADER = Struct(">4sBIIB")
+ADDRESS_SIZE = 20
+SIGNATURE_WIDTH = 72
+
+
+def registry_path(chain):
+    return os.path.join(REGISTRY_DIR, f"{chain}.dat")
+
+
+def source_path(chain):
+    return os.path.join(SOURCES_DIR, f"{chain}.json")
+
+
+def record_struct(ticker_width):
+    return Struct(f">{ADDRESS_SIZE}sB{ticker_width}sB{SIGNATURE_WIDTH}s")
+
+
+def write_registry(file_path, tokens_values, nfts_values=None, ledger_tokens=None, info=None):
+    """Write a registry file from the tokens lists.
+    ledger_tokens : {"0xaddress": {"ticker": str, "signature": hex str}}
+    """
+    presets = {
+        "info": info or [],
+        "tokens": tokens_values,
+        "nfts": nfts_values or [],
+    }
+    presets_bin = json.dumps(presets, separators=(",", ":")).encode("utf8")
+    ledger_tokens = ledger_tokens or {}
+    tokens = []
+    for address, token in ledger_tokens.items():
+        ticker = token["ticker"].encode("utf8")
+        signature = bytes.fromhex(token["signature"])
+        if len(ticker) > 255:
+            raise ValueError(f"Ledger token ticker too long for {address}")
+        if len(signature) > SIGNATURE_WIDTH:
+            raise ValueError(f"Ledger token signature too long for {address}")
+        tokens.append((bytes.fromhex(address[2:]), ticker, signature))
+    tokens.sort()
+    ticker_width = max((len(ticker) for _, ticker, _ in tokens), default=0)
+    record = record_struct(ticker_width)
+    with open(file_path, "wb") as registry_file:
+        registry_file.write(
+            HEADER.pack(
+                REGISTRY_MAGIC, REGISTRY_VERSION, len(presets_bin), len(tokens), ticker_width
+            )
+        )
+        registry_file.write(presets_bin)
+        for address, ticker, signature in tokens:
+            registry_file.write(
+                record.pack(address, len(ticker), ticker, len(signature), signature)
+            )
+
+
+def build_registry(chain, file_path=None):
+    """Write the registry file of a chain from its lists source :
+    {"info": [str], "tokens": [{name: addr}], "nfts": [{name: addr}],
+     "ledger_tokens": {"0xaddress": {"ticker": str, "signature": hex str}}}
+    """
+    with open(source_path(chain), "r", encoding="utf8") as source_file:
+        lists = json.load(source_file)
+    write_registry(
+        file_path or registry_path(chain),
+        lists["tokens"],
+        lists.get("nfts"),
+        lists.get("ledger_tokens"),
+        lists.get("info"),
+    )
+
+
+def source_chains():
+    """Chains having a lists source"""
+    return sorted(
+        file_name[:-5] for file_name in os.listdir(SOURCES_DIR) if file_name.endswith(".json")
+    )
+
+
+class RecordsKeys:
+    """Addresses of the records, as a sequence for bisect"""
+
+    def __init__(self, data, start, count, record_size):
+        self.data = data
+        self.start = start
+        self.count = count
+        self.record_size = record_size
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, idx):
+        record_start = self.start + idx * self.record_size
+        return self.data[record_start : record_start + ADDRESS_SIZE]
+
+
+class TokenRegistry:
+    """Tokens data of a chain, read from its file at the first use"""
+
+    def __init__(self, chain, file_path=None):
+        self.chain = chain
+        self.file_path = file_path or registry_path(chain)
+        self.lock = Lock()
+        self.data = None
+        self.presets = None
+        self.keys = None
+        self.record = None
+        self.tokens_values = PresetsList(self, "tokens")
+        self.nfts_values = PresetsList(self, "nfts")
+        self.ledger_tokens = LedgerTokens(self)
+
+    def open(self):
+        with self.lock:
+            if self.data is not None:
+                return
+            with open(self.file_path, "rb") as registry_file:
+                data = mmap.mmap(registry_file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, presets_size, ledger_count, ticker_width = HEADER.unpack_from(data)
+            if magic != REGISTRY_MAGIC or version != REGISTRY_VERSION:
+                raise ValueError(f"Invalid tokens registry file for {self.chain}")
+            self.record = record_struct(ticker_width)
+            self.presets_size = presets_size
+            records_start = HEADER.size + presets_size
+            if records_start + ledger_count * self.record.size > len(data):
+                raise ValueError(f"Truncated tokens registry file for {self.chain}")
+            self.keys = RecordsKeys(data, records_start, ledger_count, self.record.size)
+            self.data = data
+
+    def get_presets(self, kind):
+        """Presets list of dict per network, kind is "tokens" or "nfts" """
+        if self.data is None:
+            self.open()
+        if self.presets is None:
+            presets_bin = self.data[HEADER.size : HEADER.size + self.presets_size]
+            self.presets = json.loads(presets_bin.decode("utf8"))
+        return self.presets[kind]
+
+    def get_ledger_token(self, contract):
+        """Ledger token (ticker, DER signature bytes) from "0xaddress", or None"""
+        if self.data is None:
+            self.open()
+        try:
+            address = bytes.fromhex(contract[2:])
+        except ValueError:
+            return None
+        idx = bisect_left(self.keys, address)
+        if idx == len(self.keys) or self.keys[idx] != address:
+            return None
+        _, ticker_size, ticker, signature_size, signature = self.record.unpack_from(
+            self.data, self.keys.start + idx * self.record.size
+        )
+        return ticker[:ticker_size].decode("utf8"), signature[:signature_size]
+
+
+class PresetsList:
+    """Presets per network of a registry, as a list read on demand"""
+
+    def __init__(self, registry, kind):
+        self.registry = registry
+        self.kind = kind
+
+    def __len__(self):
+        return len(self.registry.get_presets(self.kind))
+
+    def __getitem__(self, network_idx):
+        return self.registry.get_presets(self.kind)[network_idx]
+
+    def __iter__(self):
+        return iter(self.registry.get_presets(self.kind))
+
+    def __deepcopy__(self, memo):
+        # Read only, shared by the wallets classes copying the options
+        return self
+
+
+class LedgerTokens:
+    """Ledger trusted tokens of a registry, read on demand"""
+
+    def __init__(self, registry):
+        self.registry = registry
+
+    def get(self, contract, default=None):
+        """(ticker, DER signature bytes) of the token "0xaddress" """
+        token = self.registry.get_ledger_token(contract)
+        return default if token is None else token
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Uniblow tokens registry files")
+    parser.add_argument("command", choices=["build"])
+    parser.add_argument("chains", nargs="*", help="chains to build, all when none")
+    args = parser.parse_args()
+    for chain in args.chains or source_chains():
+        build_registry(chain)
+        print(f"{registry_path(chain)} built")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  EVM tokens balances scanner with Multicall3
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Read the balances of many ERC20 in a few eth_call, aggregated by the Multicall3
+contract, deployed at the same address on all the supported EVM chains.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from threading import local
+
+from cryptolib.coins.ethereum import read_string, read_uint256, uint256
+
+
+# Multicall3 contract, see github.com/mds1/multicall
+MULTICALL3_ADDRESS = "0xcA11bde05977b3631167028862bE2a173976CA11"
+#   aggregate3((address,bool,bytes)[])
+AGGREGATE3_FUNCTION = "82ad56cb"
+
+#   balanceOf(address)
+BALANCEOF_FUNCTION = "70a08231"
+#   decimals()
+DECIMALS_FUNCTION = "313ce567"
+#   symbol()
+SYMBOL_FUNCTION = "95d89b41"
+
+# Max size of the calldata of one eth_call, about 100 balanceOf
+DEFAULT_MAX_CALLDATA = 24576
+DEFAULT_WORKERS = 4
+
+
+logger = getLogger(__name__)
+
+
+def padded_size(length):
+    return (length + 31) // 32 * 32
+
+
+def call_size(calldata):
+    """Size of a Call3 in the aggregate3 data : offset, target, flag, bytes offset and length"""
+    return 5 * 32 + padded_size(len(calldata))
+
+
+def encode_aggregate3(calls):
+    """aggregate3 calldata hex for a list of (target address hex, calldata bytes).
+    Each call is allowed to fail.
+    """
+    tuples_data = []
+    offsets = []
+    offset = 32 * len(calls)
+    for target, calldata in calls:
+        offsets.append(uint256(offset))
+        tuple_data = (
+            bytes.fromhex(f"{target[2:]:0>64}")
+            + uint256(1)
+            + uint256(3 * 32)
+            + uint256(len(calldata))
+            + calldata.ljust(padded_size(len(calldata)), b"\x00")
+        )
+        tuples_data.append(tuple_data)
+        offset += len(tuple_data)
+    encoded = uint256(32) + uint256(len(calls)) + b"".join(offsets) + b"".join(tuples_data)
+    return encoded.hex()
+
+
+def decode_aggregate3(data_hex):
+    """Decode the aggregate3 results : list of (success, return data bytes)"""
+    data_bin = bytes.fromhex(data_hex[2:])
+    array_offset = read_uint256(data_bin, 0)
+    n_results = read_uint256(data_bin, array_offset)
+    content_offset = array_offset + 32
+    if len(data_bin) < content_offset + 32 * n_results:
+        raise ValueError("Bad aggregate3 ABI data.")
+    results = []
+    for idx in range(n_results):
+        tuple_offset = content_offset + read_uint256(data_bin, content_offset + 32 * idx)
+        success = read_uint256(data_bin, tuple_offset) != 0
+        bytes_offset = tuple_offset + read_uint256(data_bin, tuple_offset + 32)
+        bytes_len = read_uint256(data_bin, bytes_offset)
+        if len(data_bin) < bytes_offset + 32 + bytes_len:
+            raise ValueError("Bad aggregate3 ABI data.")
+        results.append((success, data_bin[bytes_offset + 32 : bytes_offset + 32 + bytes_len]))
+    return results
+
+
+def chunk_calls(calls, max_calldata):
+    """Split the calls list into lists with an aggregate3 calldata up to max_calldata"""
+    chunks = []
+    chunk = []
+    chunk_size = 4 + 2 * 32
+    for call in calls:
+        size = call_size(call[1])
+        if chunk and chunk_size + size > max_calldata:
+            chunks.append(chunk)
+            chunk = []
+            chunk_size = 4 + 2 * 32
+        chunk.append(call)
+        chunk_size += size
+    if chunk:
+        chunks.append(chunk)
+    return chunks
+
+
+def read_symbol_data(data_bin):
+    """Symbol from the raw symbol() returned data, string or bytes32, None if invalid"""
+    if len(data_bin) >= 64:
+        str_offset = read_uint256(data_bin, 0)
+        if str_offset + 32 <= len(data_bin):
+            if str_offset + 32 + read_uint256(data_bin, str_offset) <= len(data_bin):
+                try:
+                    return read_string(data_bin)
+                except UnicodeDecodeError:
+                    return None
+    if len(data_bin) == 32:
+        try:
+            return data_bin.rstrip(b"\x00").decode("utf8")
+        except UnicodeDecodeError:
+            pass
+    return None
+
+
+def preset_symbol(token_name):
+    """Symbol from the preset name "Name (SYMBOL)" """
+    token_name = token_name.strip()
+    if token_name.endswith(")") and "(" in token_name:
+        return token_name[token_name.rindex("(") + 1 : -1]
+    return "---"
+
+
+class TokenScanner:
+    """Read the balances of a list of tokens for an address, with Multicall3.
+
+    client_maker() builds an EVMclient, one per worker thread.
+    """
+
+    def __init__(
+        self,
+        client_maker,
+        multicall_address=MULTICALL3_ADDRESS,
+        max_calldata=DEFAULT_MAX_CALLDATA,
+        max_workers=DEFAULT_WORKERS,
+    ):
+        self.client_maker = client_maker
+        self.multicall_address = multicall_address
+        self.max_calldata = max_calldata
+        self.max_workers = max_workers
+        self.thread_data = local()
+
+    def thread_client(self):
+        if not hasattr(self.thread_data, "client"):
+            self.thread_data.client = self.client_maker()
+        return self.thread_data.client
+
+    def aggregate_chunk(self, calls):
+        result_hex = self.thread_client().call(
+            self.multicall_address, AGGREGATE3_FUNCTION, encode_aggregate3(calls)
+        )
+        results = decode_aggregate3(result_hex)
+        if len(results) != len(calls):
+            raise ValueError("Unmatched aggregate3 results count.")
+        return results
+
+    def aggregate(self, calls):
+        """Run the calls (target, calldata bytes), chunks are sent concurrently.
+        Returns the list of (success, return data bytes).
+        """
+        chunks = chunk_calls(calls, self.max_calldata)
+        logger.debug("Aggregating %i calls in %i eth_call", len(calls), len(chunks))
+        results = []
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            for chunk_results in pool.map(self.aggregate_chunk, chunks):
+                results.extend(chunk_results)
+        return results
+
+    def scan(self, address, tokens):
+        """Non zero balances of the tokens for the address (hex without 0x).
+        tokens is a dict {name: contract}, as in the tokens preset.
+        Returns a list of dict : name, contract, balance, decimals and symbol.
+        """
+        contracts = list(tokens.items())
+        balance_data = bytes.fromhex(BALANCEOF_FUNCTION + address.lower().rjust(64, "0"))
+        balances = self.aggregate([(contract, balance_data) for _, contract in contracts])
+        owned = []
+        for (name, contract), (success, data_bin) in zip(contracts, balances):
+            if success and len(data_bin) >= 32:
+                balance = int.from_bytes(data_bin[:32], "big")
+                if balance > 0:
+                    owned.append({"name": name, "contract": contract, "balance": balance})
+        if not owned:
+            return owned
+        info_calls = []
+        for token in owned:
+            info_calls.append((token["contract"], bytes.fromhex(DECIMALS_FUNCTION)))
+            info_calls.append((token["contract"], bytes.fromhex(SYMBOL_FUNCTION)))
+        infos = self.aggregate(info_calls)
+        for idx, token in enumerate(owned):
+            success, data_bin = infos[2 * idx]
+            token["decimals"] = int.from_bytes(data_bin[:32], "big") if success and data_bin else 0
+            success, data_bin = infos[2 * idx + 1]
+            symbol = read_symbol_data(data_bin) if success else None
+            token["symbol"] = symbol if symbol else preset_symbol(token["name"])
+        return owned
@@ -20,6 +20,7 @@ An EIP-712 wallet implementation for Ethereum typed structured data hashing.
 """
 
 
+from functools import partial
 from pprint import pformat
 from sys import version_info
 
@@ -27,10 +28,10 @@ from cryptolib.cryptography import sha3
 from cryptolib.coins.ethereum import uint256
 
 
-uint_types = [f"uint{type_len}" for type_len in range(8, 257)]
-int_types = [f"int{type_len}" for type_len in range(8, 257)]
-bytes_types = [f"bytes{type_len}" for type_len in range(1, 33)]
-std_types = ["bool", *uint_types, *int_types, "address", *bytes_types, "bytes", "string"]
+uint_types = {f"uint{type_len}" for type_len in range(8, 257)}
+int_types = {f"int{type_len}" for type_len in range(8, 257)}
+bytes_types = {f"bytes{type_len}" for type_len in range(1, 33)}
+std_types = {"bool", *uint_types, *int_types, "address", *bytes_types, "bytes", "string"}
 
 
 def collect_sub_types(name, types_obj, list_types=None):
@@ -72,98 +73,187 @@ def encode_types(types_list, types_dict):
     return types_enc
 
 
-def type_hash(name, types_obj):
-    """Compute typeHash (hash of the encodeType type string)."""
-    subtypes_list = collect_sub_types(name, types_obj)
-    subtypes_list.sort()
-    types_list = [name, *subtypes_list]
-    return sha3(encode_types(types_list, types_obj).encode("utf8"))
+def encode_bool(value):
+    if not isinstance(value, bool):
+        raise ValueError("bool type is not a bool value.")
+    return uint256(1) if value else uint256(0)
 
 
-def encode_value(vtype, value, go):
-    """Encode a given value in Python bytes."""
-    if vtype == "bool":
-        if not isinstance(value, bool):
-            raise ValueError("bool type is not a bool value.")
-        return uint256(1) if value else uint256(0)
-    if vtype == "address":
-        if not isinstance(value, str):
-            raise ValueError("address type is not a str value.")
-        if len(value) != 42 or value[:2] != "0x":
-            raise ValueError("address is not a 0x hex value.")
-        try:
-            int_value = int(value[2:], 16)
-        except ValueError:
-            raise ValueError("address is not a 0x hex value.")
-        return uint256(int_value)
-    if vtype in int_types or vtype in uint_types:
-        if isinstance(value, str):
-            # Fallback for dapp encoding uint as string
-            try:
-                value = int(value, 10)
-            except ValueError:
-                raise ValueError(vtype + " is not a valid string.")
-        if not isinstance(value, int):
-            raise ValueError(vtype + " type is not a int nor str value.")
-        if value >= 0:
-            intval_bin = uint256(value)
-        else:
-            intval_bin = uint256(2**256 + value)
-        return intval_bin
-    if vtype in bytes_types:
-        if not isinstance(value, str):
-            raise ValueError("bytes type is not a str value.")
-        if value[:2] != "0x":
-            raise ValueError("bytes is not a 0x hex value.")
-        try:
-            out = bytes.fromhex(value[2:])
-        except ValueError:
-            raise ValueError("bytes is not a 0x hex value.")
-        while len(out) < 32:
-            out += b"\0"
-        return out
-    if vtype == "bytes":
-        if not isinstance(value, str):
-            raise ValueError("bytes type is not a str value.")
-        if value[:2] != "0x":
-            raise ValueError("bytes is not a 0x hex value.")
+def encode_address(value):
+    if not isinstance(value, str):
+        raise ValueError("address type is not a str value.")
+    if len(value) != 42 or value[:2] != "0x":
+        raise ValueError("address is not a 0x hex value.")
+    try:
+        int_value = int(value[2:], 16)
+    except ValueError:
+        raise ValueError("address is not a 0x hex value.")
+    return uint256(int_value)
+
+
+def encode_int(vtype, value):
+    if isinstance(value, str):
+        # Fallback for dapp encoding uint as string
         try:
-            out = bytes.fromhex(value[2:])
+            value = int(value, 10)
         except ValueError:
-            raise ValueError("bytes is not a 0x hex value.")
-        return sha3(out)
-    if vtype == "string":
-        if not isinstance(value, str):
-            raise ValueError("string type is not a str value.")
-        return sha3(value.encode("utf8"))
-    if vtype.endswith("[]"):
+            raise ValueError(vtype + " is not a valid string.")
+    if not isinstance(value, int):
+        raise ValueError(vtype + " type is not a int nor str value.")
+    if value >= 0:
+        intval_bin = uint256(value)
+    else:
+        intval_bin = uint256(2**256 + value)
+    return intval_bin
+
+
+def read_hex_bytes(value):
+    if not isinstance(value, str):
+        raise ValueError("bytes type is not a str value.")
+    if value[:2] != "0x":
+        raise ValueError("bytes is not a 0x hex value.")
+    try:
+        return bytes.fromhex(value[2:])
+    except ValueError:
+        raise ValueError("bytes is not a 0x hex value.")
+
+
+def encode_fixed_bytes(value):
+    out = read_hex_bytes(value)
+    if len(out) < 32:
+        out += bytes(32 - len(out))
+    return out
+
+
+def encode_bytes(value):
+    return sha3(read_hex_bytes(value))
+
+
+def encode_string(value):
+    if not isinstance(value, str):
+        raise ValueError("string type is not a str value.")
+    return sha3(value.encode("utf8"))
+
+
+# Standard type : value encoder
+std_encoders = {
+    "bool": encode_bool,
+    "address": encode_address,
+    "bytes": encode_bytes,
+    "string": encode_string,
+}
+for int_type in uint_types | int_types:
+    std_encoders[int_type] = partial(encode_int, int_type)
+for bytes_type in bytes_types:
+    std_encoders[bytes_type] = encode_fixed_bytes
+
+
+class TypedDataSchema:
+    """Types of a typed data query, compiled once for all its structs.
+    The type hashes and the values encoders are computed at the first use of a type.
+    """
+
+    def __init__(self, types_obj):
+        self.types = types_obj
+        self.type_hashes = {}
+        self.encoders = {}
+        self.members = {}
+
+    def struct_members(self, name):
+        """[(member name, member type)] of a struct"""
+        if name not in self.members:
+            if name not in self.types:
+                raise ValueError(f"Missing type {name} in typedhash.types.")
+            self.members[name] = [
+                (member["name"], member["type"]) for member in self.types[name] if "name" in member
+            ]
+        return self.members[name]
+
+    def dependencies(self, name):
+        """Structs types used by a struct, excluding itself"""
+        found = {name}
+        to_visit = [name]
+        while to_visit:
+            for member in self.types[to_visit.pop()]:
+                member_type = member["type"]
+                if member_type.endswith("[]"):
+                    member_type = member_type[:-2]
+                if member_type in self.types and member_type not in found:
+                    found.add(member_type)
+                    to_visit.append(member_type)
+        found.remove(name)
+        return found
+
+    def type_hash(self, name):
+        """typeHash of a struct"""
+        if name not in self.type_hashes:
+            if name not in self.types:
+                raise ValueError(f"Missing type {name} in typedhash.types.")
+            types_list = [name, *sorted(self.dependencies(name))]
+            self.type_hashes[name] = sha3(encode_types(types_list, self.types).encode("utf8"))
+        return self.type_hashes[name]
+
+    def encoder(self, vtype):
+        """Function encoding a value of the type"""
+        if vtype not in self.encoders:
+            if vtype in std_encoders:
+                self.encoders[vtype] = std_encoders[vtype]
+            elif vtype.endswith("[]"):
+                self.encoders[vtype] = partial(self.encode_array, vtype[:-2])
+            else:
+                # Should be a struct finally
+                self.encoders[vtype] = partial(self.encode_struct, vtype)
+        return self.encoders[vtype]
+
+    def encode_array(self, element_type, value):
         if not isinstance(value, list):
             raise ValueError("array type is not a list value.")
-        elements = [encode_value(vtype[:-2], val, go) for val in value]
-        return sha3(b"".join(elements))
-    # Should be a struct finally
-    if not isinstance(value, dict):
-        raise ValueError("struct type is not a dict value.")
-    return hash_struct(vtype, go, value)
+        element_encoder = self.encoder(element_type)
+        return sha3(b"".join(element_encoder(val) for val in value))
 
+    def encode_struct(self, name, value):
+        if not isinstance(value, dict):
+            raise ValueError("struct type is not a dict value.")
+        return self.hash_struct(name, value)
 
-def encode_data(name, types_obj, data_obj):
-    """encodeData : Encode all the data of the members values."""
-    out = b""
-    for member in types_obj[name]:
-        if "name" in member:
-            mvalue = data_obj[member["name"]]
-            mtype = member["type"]
+    def encode_value(self, vtype, value):
+        """Encode a given value in Python bytes."""
+        return self.encoder(vtype)(value)
+
+    def encode_data(self, name, data_obj):
+        """encodeData : Encode all the data of the members values."""
+        out = []
+        for member_name, member_type in self.struct_members(name):
+            mvalue = data_obj[member_name]
             if isinstance(mvalue, dict):
-                out += hash_struct(mtype, types_obj, mvalue)
+                out.append(self.hash_struct(member_type, mvalue))
             else:
-                out += encode_value(mtype, mvalue, types_obj)
-    return out
+                out.append(self.encoder(member_type)(mvalue))
+        return b"".join(out)
+
+    def hash_struct(self, name, data_obj):
+        """Compute the hashStruct = keccak256(typeHash ‖ encodeData(s))."""
+        return sha3(self.type_hash(name) + self.encode_data(name, data_obj))
+
+
+def type_hash(name, types_obj):
+    """Compute typeHash (hash of the encodeType type string)."""
+    return TypedDataSchema(types_obj).type_hash(name)
+
+
+def encode_value(vtype, value, go):
+    """Encode a given value in Python bytes."""
+    return TypedDataSchema(go).encode_value(vtype, value)
+
+
+def encode_data(name, types_obj, data_obj):
+    """encodeData : Encode all the data of the members values."""
+    return TypedDataSchema(types_obj).encode_data(name, data_obj)
 
 
 def hash_struct(name, types_obj, data_obj):
     """Compute the hashStruct = keccak256(typeHash ‖ encodeData(s))."""
-    return sha3(type_hash(name, types_obj) + encode_data(name, types_obj, data_obj))
+    return TypedDataSchema(types_obj).hash_struct(name, data_obj)
 
 
 def typed_sign_hash(query_obj, chain_id=None):
@@ -188,8 +278,9 @@ def typed_sign_hash(query_obj, chain_id=None):
             raise ValueError("ChainID is not matching the current active chain.")
 
     # Compute the hashes to sign
-    domain_separator = hash_struct("EIP712Domain", query_obj["types"], query_obj["domain"])
-    hash_msg = hash_struct(query_obj["primaryType"], query_obj["types"], query_obj["message"])
+    schema = TypedDataSchema(query_obj["types"])
+    domain_separator = schema.hash_struct("EIP712Domain", query_obj["domain"])
+    hash_msg = schema.hash_struct(query_obj["primaryType"], query_obj["message"])
 
     return domain_separator, hash_msg
 
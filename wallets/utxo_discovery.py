@@ -0,0 +1,218 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  HD account discovery for UTXO coins
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+BIP44 account discovery : walk the external and change chains of an account
+until "gap limit" consecutive addresses have no history.
+The first scan starts from index 0, the next ones only read again the UTXOs of
+the used addresses and resume the walk after the last used index.
+"""
+
+
+from concurrent.futures import ThreadPoolExecutor
+from logging import getLogger
+from threading import local, Lock
+from time import monotonic, sleep
+
+
+DEFAULT_GAP_LIMIT = 20
+DEFAULT_WORKERS = 8
+# Max age in seconds of the account state read for the balance
+DEFAULT_REFRESH_PERIOD = 180
+
+EXTERNAL_CHAIN = 0
+CHANGE_CHAIN = 1
+
+
+logger = getLogger(__name__)
+
+
+def account_path(key_path):
+    """Account level part of a BIP44 key path : m/purpose'/coin'/account'"""
+    path_levels = key_path.split("/")
+    if len(path_levels) != 6:
+        raise ValueError("Key path must be a full BIP44 path m/p'/c'/a'/chain/index")
+    return "/".join(path_levels[:4])
+
+
+class AccountState:
+    """Result of an account scan : used addresses and their aggregated UTXOs."""
+
+    def __init__(self, nconf=0):
+        self.nconf = nconf
+        self.used = []
+        self.utxos = []
+        self.next_index = {EXTERNAL_CHAIN: 0, CHANGE_CHAIN: 0}
+        self.time = monotonic()
+
+    @property
+    def balance(self):
+        return sum(utxo["value"] for utxo in self.utxos)
+
+
+class AccountDiscovery:
+    """Gap limit scanner of a BIP44 account, from the account level node.
+
+    address_fn(pubkey_hex) provides the address in the wallet format.
+    api_maker() builds an API object with get_txcount(addr) and getutxos(addr, nconf),
+    one per worker thread as the API objects are stateful.
+    request_interval spaces the API requests of all the workers, in seconds.
+    """
+
+    def __init__(
+        self,
+        acc_path,
+        account_node,
+        address_fn,
+        api_maker,
+        gap_limit=DEFAULT_GAP_LIMIT,
+        max_workers=DEFAULT_WORKERS,
+        request_interval=0,
+        refresh_period=DEFAULT_REFRESH_PERIOD,
+    ):
+        if gap_limit < 1:
+            raise ValueError("gap_limit must be at least 1")
+        self.account_path = acc_path
+        self.account_node = account_node
+        self.address_fn = address_fn
+        self.api_maker = api_maker
+        self.gap_limit = gap_limit
+        self.max_workers = max_workers
+        self.request_interval = request_interval
+        self.refresh_period = refresh_period
+        self.chain_nodes = {}
+        self.keys_cache = {}
+        self.thread_data = local()
+        self.throttle_lock = Lock()
+        self.next_request = 0
+        # Last AccountState
+        self.state = None
+
+    def get_key(self, chain, index):
+        """Public key and address info at chain/index, derived once."""
+        key_info = self.keys_cache.get((chain, index))
+        if key_info is None:
+            if chain not in self.chain_nodes:
+                self.chain_nodes[chain] = self.account_node.derive_private(chain)
+            child_node = self.chain_nodes[chain].derive_private(index)
+            pubkey_hex = child_node.pv_key.get_public_key(True).hex()
+            key_info = {
+                "chain": chain,
+                "index": index,
+                "path": f"{self.account_path}/{chain}/{index}",
+                "pubkey": pubkey_hex,
+                "address": self.address_fn(pubkey_hex),
+            }
+            self.keys_cache[(chain, index)] = key_info
+        return key_info
+
+    def derive_batch(self, chain, start, count):
+        return [self.get_key(chain, idx) for idx in range(start, start + count)]
+
+    def thread_api(self):
+        if not hasattr(self.thread_data, "api"):
+            self.thread_data.api = self.api_maker()
+        return self.thread_data.api
+
+    def throttle(self):
+        """Wait for the next request slot, when request_interval is set."""
+        if self.request_interval <= 0:
+            return
+        with self.throttle_lock:
+            now = monotonic()
+            wait_time = self.next_request - now
+            self.next_request = max(now, self.next_request) + self.request_interval
+        if wait_time > 0:
+            sleep(wait_time)
+
+    def query_address(self, key_info, nconf=0, known_used=False):
+        """Read the address history, returns None when never used, else its UTXOs."""
+        api = self.thread_api()
+        if not known_used:
+            self.throttle()
+            if api.get_txcount(key_info["address"]) == 0:
+                return None
+        self.throttle()
+        return api.getutxos(key_info["address"], nconf)
+
+    def get_state(self, nconf=0, refresh=False):
+        """Last AccountState, scanned again when refresh is True or when outdated."""
+        if (
+            refresh
+            or self.state is None
+            or self.state.nconf != nconf
+            or monotonic() - self.state.time > self.refresh_period
+        ):
+            self.scan(nconf)
+        return self.state
+
+    def scan(self, nconf=0):
+        """Walk both chains up to the gap limit, store and return the AccountState.
+        Resumes after the last used addresses found by the previous scan.
+        """
+        state = AccountState(nconf)
+        last_used = {EXTERNAL_CHAIN: -1, CHANGE_CHAIN: -1}
+        scanned = {EXTERNAL_CHAIN: 0, CHANGE_CHAIN: 0}
+        known_used = []
+        if self.state is not None:
+            known_used = self.state.used
+            for chain in (EXTERNAL_CHAIN, CHANGE_CHAIN):
+                last_used[chain] = self.state.next_index[chain] - 1
+                scanned[chain] = self.state.next_index[chain]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+            # Used addresses only need their UTXOs
+            batch = list(known_used)
+            queries = [pool.submit(self.query_address, kinfo, nconf, True) for kinfo in batch]
+            while True:
+                for chain in (EXTERNAL_CHAIN, CHANGE_CHAIN):
+                    # Extend the window to keep gap_limit unused addresses after the last used
+                    count = last_used[chain] + self.gap_limit + 1 - scanned[chain]
+                    if count > 0:
+                        new_keys = self.derive_batch(chain, scanned[chain], count)
+                        queries.extend(
+                            pool.submit(self.query_address, kinfo, nconf) for kinfo in new_keys
+                        )
+                        batch.extend(new_keys)
+                        scanned[chain] += count
+                if not batch:
+                    break
+                logger.debug("Scanning %i addresses", len(batch))
+                for key_info, query in zip(batch, queries):
+                    addr_utxos = query.result()
+                    if addr_utxos is None:
+                        continue
+                    chain = key_info["chain"]
+                    last_used[chain] = max(last_used[chain], key_info["index"])
+                    state.used.append(key_info)
+                    for utxo in addr_utxos:
+                        utxo["path"] = key_info["path"]
+                        utxo["pubkey"] = key_info["pubkey"]
+                        utxo["address"] = key_info["address"]
+                        state.utxos.append(utxo)
+                batch = []
+                queries = []
+        state.used.sort(key=lambda kinfo: (kinfo["chain"], kinfo["index"]))
+        for chain in (EXTERNAL_CHAIN, CHANGE_CHAIN):
+            state.next_index[chain] = last_used[chain] + 1
+        self.state = state
+        return state
+
+    def change_key(self, state=None):
+        """First unused change address info."""
+        if state is None:
+            state = self.state
+        return self.get_key(CHANGE_CHAIN, state.next_index[CHANGE_CHAIN])
@@ -0,0 +1,119 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  WalletConnect messages reader
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Read the WalletConnect messages in a background thread.
+The thread waits on the transport received queue, decodes the requests and
+notifies the wallet which processes them right away in its own thread.
+"""
+
+
+from logging import getLogger
+from queue import Queue, Empty
+from threading import Event, RLock, Thread
+
+
+# Max waiting time of the transport queue, to check for a stop or a reconnection
+WAIT_TIMEOUT = 1.0
+
+
+logger = getLogger(__name__)
+
+
+class WCReader:
+    """Background reader of a WalletConnect client messages.
+    client_lock must be held when using the client outside of the reader,
+    so the reader doesn't pop the responses the client is waiting for.
+    """
+
+    def __init__(self, wc_client, wait_timeout=WAIT_TIMEOUT):
+        self.wc_client = wc_client
+        self.wait_timeout = wait_timeout
+        self.client_lock = RLock()
+        # (id, method, params) messages read, or an Exception from the reader
+        self.messages = Queue()
+        self.stop_event = Event()
+        self.thread = None
+        self.notify = None
+
+    def start(self, notify):
+        """Start reading, notify() is called from the reader thread after messages are read"""
+        self.notify = notify
+        self.thread = Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+
+    def close(self):
+        """Stop the reader and close the WalletConnect client"""
+        self.stop()
+        with self.client_lock:
+            self.wc_client.close()
+
+    def wait_data(self):
+        """Block until the transport received data, or the timeout"""
+        data_queue = getattr(self.wc_client, "data_queue", None)
+        if data_queue is None:
+            self.stop_event.wait(self.wait_timeout)
+            return
+        # The queue mutex is held, its deque is read directly
+        with data_queue.not_empty:
+            if not data_queue.queue:
+                data_queue.not_empty.wait(self.wait_timeout)
+
+    def read_messages(self):
+        """Read all the messages available from the client, return how many were read"""
+        messages_count = 0
+        with self.client_lock:
+            # wc_message : (id, method, params) or (None, "", [])
+            wc_message = self.wc_client.get_message()
+            while wc_message[0] is not None:
+                # Pings are replied by the client, with an empty method
+                if wc_message[1]:
+                    self.messages.put(wc_message)
+                    messages_count += 1
+                wc_message = self.wc_client.get_message()
+        return messages_count
+
+    def run(self):
+        while not self.stop_event.is_set():
+            self.wait_data()
+            if self.stop_event.is_set():
+                break
+            try:
+                messages_count = self.read_messages()
+            except Exception as exc:
+                logger.error("Error when reading WalletConnect : %s", str(exc), exc_info=exc)
+                self.messages.put(exc)
+                self.notify()
+                break
+            if messages_count:
+                logger.debug("%i WalletConnect messages read", messages_count)
+                self.notify()
+
+    def get_message(self):
+        """Pop a message read, as the client : (id, method, params) or (None, "", []).
+        Raise the reader error when it failed.
+        """
+        try:
+            wc_message = self.messages.get_nowait()
+        except Empty:
+            return (None, "", [])
+        if isinstance(wc_message, Exception):
+            raise wc_message
+        return wc_message
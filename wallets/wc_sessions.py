@@ -0,0 +1,112 @@
+#!/usr/bin/python3
+# -*- coding: utf8 -*-
+
+# UNIBLOW  -  WalletConnect sessions
+# Copyright (C) 2021-2024 BitLogiK
+
+# This program is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, version 3 of the License.
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+# You should have received a copy of the GNU General Public License
+# along with this program.  If not, see <http://www.gnu.org/licenses/>
+
+
+"""
+Several WalletConnect sessions connected to one wallet.
+Each session has its reader and its requests queue, all the readers notify
+the same dispatcher, which pops the requests of the sessions in turn.
+"""
+
+
+from threading import Lock
+
+from wallets.wc_reader import WCReader
+
+
+class WCSession:
+    """A dapp connected, with the reader of its WalletConnect client"""
+
+    def __init__(self, session_id, wc_client, dapp_name):
+        self.session_id = session_id
+        self.dapp_name = dapp_name
+        self.reader = WCReader(wc_client)
+
+    @property
+    def wc_client(self):
+        return self.reader.wc_client
+
+
+class WCSessions:
+    """WalletConnect sessions of a wallet"""
+
+    def __init__(self):
+        self.sessions = {}
+        self.last_id = 0
+        # Dispatching order of the sessions
+        self.turn = 0
+        self.notify = None
+        self.lock = Lock()
+
+    def __len__(self):
+        return len(self.sessions)
+
+    def add(self, wc_client, dapp_name):
+        """Add a paired client, its reading starts if the sessions were started"""
+        with self.lock:
+            self.last_id += 1
+            session = WCSession(self.last_id, wc_client, dapp_name)
+            self.sessions[session.session_id] = session
+        if self.notify is not None:
+            session.reader.start(self.notify)
+        return session
+
+    def start(self, notify):
+        """Start reading all the sessions, notify() is called when any session has messages"""
+        self.notify = notify
+        for session in self.list_sessions():
+            if session.reader.thread is None:
+                session.reader.start(notify)
+
+    def remove(self, session):
+        """Close a session"""
+        with self.lock:
+            if self.sessions.pop(session.session_id, None) is None:
+                return
+        session.reader.close()
+
+    def close(self):
+        for session in self.list_sessions():
+            self.remove(session)
+
+    def list_sessions(self):
+        with self.lock:
+            return list(self.sessions.values())
+
+    def get_message(self):
+        """Pop a message from the sessions in turn.
+        Return (session, (id, method, params)) or (None, (None, "", [])) when no message left.
+        When the reader of a session failed, its error is raised with the session.
+        """
+        sessions = self.list_sessions()
+        for idx in range(len(sessions)):
+            session = sessions[(self.turn + idx) % len(sessions)]
+            try:
+                wc_message = session.reader.get_message()
+            except Exception as exc:
+                raise WCSessionError(session, exc) from exc
+            if wc_message[0] is not None:
+                self.turn = (self.turn + idx + 1) % len(sessions)
+                return session, wc_message
+        return None, (None, "", [])
+
+
+class WCSessionError(Exception):
+    """Error in a session, while reading or processing its messages"""
+
+    def __init__(self, session, exc):
+        super().__init__(str(exc))
+        self.session = session